@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Benchmark the i18n build stages on synthetic catalogs.
+
+Catalogs are generated from the shape of the real parcel-scams ``en`` table
+(string and list values, placeholders) at every requested locale x key count,
+written as per-locale source files, and pushed through the generator's own
+stages:
+
+- load: parse every source file through LocaleSource
+- fallback: resolve_fallbacks over a graph with regional parents and variants
+- validate: validate_locales
+- serialize: per-locale compact payloads + hashes and the pretty bundle
+
+Each stage is timed (best of ``--repeat``) and then run once more under
+tracemalloc for its peak allocation. Results can be saved as JSON and compared
+against an earlier run with ``--compare``.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from generate_parcel_scams_i18n import CATALOGS, render_bundle, serialize_locales
+from i18n_build.artifacts import atomic_write
+from i18n_build.parallel import Fanout
+from i18n_build.sources import ROOT_LOCALE, LocaleSource, resolve_fallbacks
+from i18n_build.validate import validate_locales
+
+RESULTS_VERSION = 1
+STAGES = ('load', 'fallback', 'validate', 'serialize')
+# Share of keys a synthetic locale leaves untranslated (filled by fallback).
+MISSING_RATE = 0.1
+# Every VARIANT_EVERY-th locale is a sparse variant of the locale before it, and
+# every REGION_EVERY-th falls back to the locale before it instead of the root.
+VARIANT_EVERY = 10
+REGION_EVERY = 7
+# Above this ratio to the baseline a stage is flagged by --compare.
+REGRESSION_RATIO = 1.2
+
+
+def make_catalog(template, locale_count, key_count, directory, seed=0):
+    """Write ``locale_count`` synthetic locales of ``key_count`` keys to ``directory``.
+
+    Returns the fallback parents of the synthetic locales.
+    """
+    rng = random.Random(seed)
+    base_keys = list(template)
+    keys = [f'{base_keys[i % len(base_keys)]}.{i // len(base_keys)}' for i in range(key_count)]
+    root = {key: template[key.rsplit('.', 1)[0]] for key in keys}
+    atomic_write(directory / f'{ROOT_LOCALE}.json', json.dumps(root, ensure_ascii=False).encode('utf-8'))
+
+    def localize(value, lang):
+        if isinstance(value, list):
+            return [f'{item} ({lang})' for item in value]
+        # Some strings (brands, loanwords) are identical across locales.
+        return value if rng.random() < 0.05 else f'{value} ({lang})'
+
+    parents = {}
+    previous = None
+    for i in range(1, locale_count):
+        lang = f'x{i:03d}'
+        if previous and i % VARIANT_EVERY == 0:
+            parents[lang] = previous
+            table = {key: localize(root[key], lang) for key in keys if rng.random() < MISSING_RATE}
+        else:
+            if previous and i % REGION_EVERY == 0:
+                parents[lang] = previous
+            table = {key: localize(root[key], lang) for key in keys if rng.random() >= MISSING_RATE}
+        atomic_write(directory / f'{lang}.json', json.dumps(table, ensure_ascii=False).encode('utf-8'))
+        previous = lang
+    return parents
+
+
+def run_stages(directory, parents, fanout):
+    """Return the stages as ``{stage: callable}``; they share state and run in order."""
+    state = {}
+
+    def load():
+        sources = LocaleSource(directory)
+        for lang in sources:
+            sources[lang]
+        state['sources'] = sources
+
+    def fallback():
+        state['resolved'], _ = resolve_fallbacks(state['sources'], parents)
+
+    def validate():
+        validate_locales(state['sources'], list(state['sources']), parents, map_units=fanout.map)
+
+    def serialize():
+        resolved = state['resolved']
+        serialize_locales(resolved, fanout.map)
+        render_bundle(resolved, 'pretty')
+
+    return {'load': load, 'fallback': fallback, 'validate': validate, 'serialize': serialize}
+
+
+def measure(directory, parents, repeat, fanout):
+    timings = {stage: float('inf') for stage in STAGES}
+    for _ in range(repeat):
+        for stage, run in run_stages(directory, parents, fanout).items():
+            start = time.perf_counter()
+            run()
+            timings[stage] = min(timings[stage], time.perf_counter() - start)
+
+    peaks = {}
+    tracemalloc.start()
+    try:
+        for stage, run in run_stages(directory, parents, fanout).items():
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            run()
+            peaks[stage] = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return {stage: {'seconds': round(timings[stage], 6), 'peak_bytes': peaks[stage]} for stage in STAGES}
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=Path(__file__).resolve().parent, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_run(run):
+    stages = '  '.join(
+        f'{stage} {run["stages"][stage]["seconds"] * 1000:8.1f} ms '
+        f'{run["stages"][stage]["peak_bytes"] / 2**20:7.1f} MiB'
+        for stage in STAGES
+    )
+    print(f'{run["locales"]:>4} x {run["keys"]:>6}  {stages}')
+
+
+def compare(results, baseline):
+    previous = {(run['locales'], run['keys']): run for run in baseline['runs']}
+    print(f'Compared with {baseline.get("revision") or "baseline"}:')
+    regressions = 0
+    for run in results['runs']:
+        old = previous.get((run['locales'], run['keys']))
+        if old is None:
+            continue
+        parts = []
+        for stage in STAGES:
+            ratio = run['stages'][stage]['seconds'] / max(old['stages'][stage]['seconds'], 1e-9)
+            flag = ' !' if ratio > REGRESSION_RATIO else ''
+            regressions += bool(flag)
+            parts.append(f'{stage} x{ratio:.2f}{flag}')
+        print(f'{run["locales"]:>4} x {run["keys"]:>6}  {"  ".join(parts)}')
+    return regressions
+
+
+def int_list(value):
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the i18n build stages on synthetic catalogs.')
+    parser.add_argument('--locales', type=int_list, default=[10, 50, 200], help='Locale counts (default: 10,50,200).')
+    parser.add_argument('--keys', type=int_list, default=[100, 1000, 10000],
+                        help='Key counts (default: 100,1000,10000).')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per size; the best is kept (default: 3).')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes, as in the generator (default: 1).')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic catalogs.')
+    parser.add_argument('--output', metavar='PATH', type=Path, help='Write the results as JSON.')
+    parser.add_argument('--compare', metavar='PATH', type=Path, help='Compare with results saved by --output.')
+    args = parser.parse_args()
+
+    template = CATALOGS['parcel-scams'].sources()[ROOT_LOCALE]
+    results = {
+        'version': RESULTS_VERSION,
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'jobs': args.jobs,
+        'runs': [],
+    }
+    print('locales x keys, then best time and peak allocation per stage:')
+    with Fanout(args.jobs) as fanout:
+        for locale_count in args.locales:
+            for key_count in args.keys:
+                with tempfile.TemporaryDirectory(prefix='i18n-bench-') as tmp:
+                    directory = Path(tmp)
+                    parents = make_catalog(template, locale_count, key_count, directory, args.seed)
+                    source_bytes = sum(path.stat().st_size for path in directory.glob('*.json'))
+                    run = {
+                        'locales': locale_count,
+                        'keys': key_count,
+                        'source_bytes': source_bytes,
+                        'stages': measure(directory, parents, args.repeat, fanout),
+                    }
+                results['runs'].append(run)
+                print_run(run)
+
+    if args.output:
+        atomic_write(args.output, (json.dumps(results, indent=2) + '\n').encode('utf-8'))
+        print(f'Wrote {args.output}.')
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        if compare(results, baseline):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+import { register } from 'node:module';
+
+// src/ is written for the Next.js bundler: extensionless relative imports
+// (files and directory index.js), ES modules in .js files and JSON imports
+// without attributes. These loader hooks
+// let the node check scripts import it as is.
+const hooks = `
+export async function resolve(specifier, context, next) {
+  try {
+    return await next(specifier, context);
+  } catch (error) {
+    if (!specifier.startsWith('.')) throw error;
+    try {
+      return await next(specifier + '.js', context);
+    } catch {
+      return next(specifier + '/index.js', context);
+    }
+  }
+}
+export async function load(url, context, next) {
+  if (url.endsWith('.json')) return next(url, { ...context, importAttributes: { type: 'json' } });
+  if (url.startsWith('file:') && url.endsWith('.js')) return next(url, { ...context, format: 'module' });
+  return next(url, context);
+}
+`;
+
+export function registerBundlerHooks() {
+  register(`data:text/javascript,${encodeURIComponent(hooks)}`, import.meta.url);
+}
@@ -0,0 +1,30 @@
+import fs from 'node:fs';
+import path from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+import { registerBundlerHooks } from './bundler-hooks.mjs';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+const root = path.resolve(__dirname, '..');
+
+registerBundlerHooks();
+
+const { checkLookalike } = await import(pathToFileURL(path.join(root, 'src/lib/typosquat.js')).href);
+const data = JSON.parse(fs.readFileSync(path.join(root, 'scripts/data/parcel-scams-domains.json'), 'utf8'));
+
+let failures = 0;
+for (const { input, official, technique } of data.lookalikeCases) {
+  const hit = checkLookalike(input);
+  const got = hit ? `${hit.official} (${hit.technique})` : 'no match';
+  const want = official ? `${official} (${technique})` : 'no match';
+  if (got !== want) {
+    failures += 1;
+    console.error(`❌ ${input}: expected ${want}, got ${got}`);
+  }
+}
+
+if (failures) {
+  process.exitCode = 1;
+} else {
+  console.log(`✅ ${data.lookalikeCases.length} look-alike cases match scripts/i18n_build/typosquat.py.`);
+}
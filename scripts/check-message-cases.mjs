@@ -0,0 +1,35 @@
+import fs from 'node:fs';
+import path from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+import { registerBundlerHooks } from './bundler-hooks.mjs';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+const root = path.resolve(__dirname, '..');
+
+registerBundlerHooks();
+
+// Every locale's compiled parcel-scams messages must render exactly the
+// strings in scripts/data/message-cases.json (the literals they replaced).
+const { args, expected } = JSON.parse(fs.readFileSync(path.join(root, 'scripts/data/message-cases.json'), 'utf8'));
+const messagesDir = path.join(root, 'src/app/blog/parcel-scams/messages');
+
+let failures = 0;
+let checked = 0;
+for (const [lang, strings] of Object.entries(expected)) {
+  const { default: messages } = await import(pathToFileURL(path.join(messagesDir, `${lang}.js`)).href);
+  for (const [key, want] of Object.entries(strings)) {
+    checked += 1;
+    const got = messages[key] ? messages[key](args[key]) : `(no ${key} message)`;
+    if (got !== want) {
+      failures += 1;
+      console.error(`❌ ${lang}.${key}: expected ${JSON.stringify(want)}, got ${JSON.stringify(got)}`);
+    }
+  }
+}
+
+if (failures) {
+  process.exitCode = 1;
+} else {
+  console.log(`✅ ${checked} compiled messages across ${Object.keys(expected).length} locales match.`);
+}
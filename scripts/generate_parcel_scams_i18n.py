@@ -1,780 +1,973 @@
 #!/usr/bin/env python3
+"""Compile the app's translation catalogs (and the parcel-scams page data).
+
+Sources live in scripts/locales/<catalog>/<lang>.json. The parcel-scams catalog
+compiles to JSON shards for its blog page; the ui, rates, policy and spam
+catalogs compile to one ES module per locale (plus a loader index), and ui also
+to an aggregate module for the pages that still need every locale at once.
+Every catalog also goes into one indexed binary pack for server-side lookups
+(i18n_build/pack.py).
+"""
+import argparse
+import contextlib
+import cProfile
 import json
+import sys
+import time
 from pathlib import Path
 
-OUT_PATH = Path('/mnt/bigdrive/Documents/parcel-tracking-nextjs/src/app/blog/parcel-scams/i18n.generated.json')
-
-I18N = {
-  'en': {
-    'title': 'Beware of Scams: Fake Websites & Parcel Tracking Fraud',
-    'intro': 'Scammers create fake websites that look official. Always verify the domain before entering personal information, card details, or parcel data.',
-    'sectionOur': '1) Rhythm Nexus Official Website',
-    'sectionHow': '2) How parcel tracking scams work',
-    'sectionSingpost': '3) SingPost scam comparison',
-    'sectionUsps': '4) USPS scam comparison',
-    'sectionDhl': '5) DHL scam comparison',
-    'sectionOthers': '6) Other carrier destinations',
-    'sectionTips': '7) Safety checklist',
-    'officialOnly': 'Our only official website is rhythmnexus.org (no .com, .net, .shop, or variants).',
-    'checkTypos': 'Watch for typos: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, extra letters, numbers replacing letters, or added words.',
-    'howText': 'Phishing messages usually claim a delivery failure and ask for a small payment. Do not click unknown links. Open the official website directly in your browser.',
-    'officialLabel': 'Official websites',
-    'fakeLabel': 'Common fake domains',
-    'patternLabel': 'Pattern',
-    'warningLabel': 'Warning signs',
-    'tips': [
-      'Type carrier URLs directly instead of tapping message links.',
-      'Check the full domain carefully (look for misspellings and wrong TLDs).',
-      'Do not pay “redelivery fees” through untrusted links.',
-      'HTTPS alone is not proof of legitimacy; the domain name is what matters.'
-    ],
-    'disclaimerTitle': 'Disclaimer',
-    'disclaimer': 'Examples are for awareness and based on common phishing patterns. Report suspicious messages or websites to your local cybercrime authority.',
-    'lastUpdated': 'Last updated: March 2026'
-  },
-  'cs': {
-    'title': 'Pozor na podvody: falešné weby a podvodné sledování zásilek',
-    'intro': 'Podvodníci vytvářejí falešné weby, které vypadají oficiálně. Před zadáním osobních údajů vždy ověřte doménu.',
-    'sectionOur': '1) Oficiální web Rhythm Nexus',
-    'sectionHow': '2) Jak fungují podvody se sledováním zásilek',
-    'sectionSingpost': '3) Srovnání podvodů SingPost',
-    'sectionUsps': '4) Srovnání podvodů USPS',
-    'sectionDhl': '5) Srovnání podvodů DHL',
-    'sectionOthers': '6) Další dopravci a destinace',
-    'sectionTips': '7) Bezpečnostní kontrolní seznam',
-    'officialOnly': 'Náš jediný oficiální web je rhythmnexus.org (žádné .com, .net, .shop ani varianty).',
-    'checkTypos': 'Pozor na překlepy: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, extra písmena, čísla místo písmen nebo přidaná slova.',
-    'howText': 'Phishingové zprávy často tvrdí, že doručení selhalo, a chtějí malý poplatek. Na neznámé odkazy neklikejte.',
-    'officialLabel': 'Oficiální weby',
-    'fakeLabel': 'Běžné falešné domény',
-    'patternLabel': 'Vzor',
-    'warningLabel': 'Varovné signály',
-    'tips': [
-      'Adresy dopravců zadávejte ručně místo klikání na odkazy ve zprávách.',
-      'Pečlivě zkontrolujte celou doménu (překlepy a špatnou koncovku).',
-      'Neplaťte „poplatky za opětovné doručení“ přes nedůvěryhodné odkazy.',
-      'HTTPS samo o sobě nezaručuje legitimitu; rozhodující je doména.'
-    ],
-    'disclaimerTitle': 'Upozornění',
-    'disclaimer': 'Příklady slouží pro prevenci a vycházejí z běžných phishingových vzorů. Podezřelé weby nahlaste příslušným úřadům.',
-    'lastUpdated': 'Aktualizováno: březen 2026'
-  },
-  'nl': {
-    'title': 'Pas op voor oplichting: valse websites en pakkettrackingfraude',
-    'intro': 'Oplichters maken nepwebsites die officieel lijken. Controleer altijd de domeinnaam voordat u gegevens invoert.',
-    'sectionOur': '1) Officiële website van Rhythm Nexus',
-    'sectionHow': '2) Hoe pakkettracking-oplichting werkt',
-    'sectionSingpost': '3) SingPost-oplichtingsvergelijking',
-    'sectionUsps': '4) USPS-oplichtingsvergelijking',
-    'sectionDhl': '5) DHL-oplichtingsvergelijking',
-    'sectionOthers': '6) Andere vervoerders en bestemmingen',
-    'sectionTips': '7) Veiligheidschecklist',
-    'officialOnly': 'Onze enige officiële website is rhythmnexus.org (geen .com, .net, .shop of varianten).',
-    'checkTypos': 'Let op typefouten: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, extra letters, cijfers i.p.v. letters of extra woorden.',
-    'howText': 'Phishingberichten melden vaak een bezorgingsprobleem en vragen een kleine betaling. Klik niet op onbekende links.',
-    'officialLabel': 'Officiële websites',
-    'fakeLabel': 'Veelvoorkomende valse domeinen',
-    'patternLabel': 'Patroon',
-    'warningLabel': 'Waarschuwingssignalen',
-    'tips': [
-      'Typ de URL van de vervoerder zelf in.',
-      'Controleer de volledige domeinnaam zorgvuldig.',
-      'Betaal geen “herbezorgkosten” via onbetrouwbare links.',
-      'HTTPS alleen bewijst geen echtheid; de domeinnaam is doorslaggevend.'
-    ],
-    'disclaimerTitle': 'Disclaimer',
-    'disclaimer': 'Voorbeelden zijn bedoeld voor bewustwording en gebaseerd op bekende phishingpatronen.',
-    'lastUpdated': 'Laatst bijgewerkt: maart 2026'
-  },
-  'fi': {
-    'title': 'Varo huijauksia: väärennetyt sivustot ja pakettiseurantahuijaukset',
-    'intro': 'Huijarit tekevät virallisen näköisiä vale-sivustoja. Tarkista aina verkkotunnus ennen tietojen syöttämistä.',
-    'sectionOur': '1) Rhythm Nexusin virallinen sivusto',
-    'sectionHow': '2) Miten pakettiseurantahuijaukset toimivat',
-    'sectionSingpost': '3) SingPost-huijausvertailu',
-    'sectionUsps': '4) USPS-huijausvertailu',
-    'sectionDhl': '5) DHL-huijausvertailu',
-    'sectionOthers': '6) Muut kuljetusyhtiöt ja kohteet',
-    'sectionTips': '7) Turvallisuuslista',
-    'officialOnly': 'Ainoa virallinen sivustomme on rhythmnexus.org (ei .com/.net/.shop-versioita).',
-    'checkTypos': 'Varo kirjoitusvirheitä: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, lisäkirjaimet tai numerot kirjainten tilalla.',
-    'howText': 'Tietojenkalasteluviestit väittävät usein toimitusongelmaa ja pyytävät pientä maksua. Älä klikkaa tuntemattomia linkkejä.',
-    'officialLabel': 'Viralliset sivustot',
-    'fakeLabel': 'Yleiset vale-domainit',
-    'patternLabel': 'Malli',
-    'warningLabel': 'Varoitusmerkit',
-    'tips': [
-      'Kirjoita kuljetusyhtiön osoite itse selaimeen.',
-      'Tarkista koko domain huolellisesti.',
-      'Älä maksa “uudelleentoimitusmaksuja” epäluotettavien linkkien kautta.',
-      'HTTPS ei yksin takaa aitoutta; domain ratkaisee.'
-    ],
-    'disclaimerTitle': 'Vastuuvapaus',
-    'disclaimer': 'Esimerkit ovat tiedotustarkoitukseen ja perustuvat yleisiin phishing-malleihin.',
-    'lastUpdated': 'Päivitetty: maaliskuu 2026'
-  },
-  'fr': {
-    'title': 'Attention aux arnaques : faux sites et fraude au suivi de colis',
-    'intro': 'Les escrocs créent des sites frauduleux qui semblent officiels. Vérifiez toujours le domaine avant de saisir vos informations.',
-    'sectionOur': '1) Site officiel Rhythm Nexus',
-    'sectionHow': '2) Comment fonctionnent les arnaques au suivi',
-    'sectionSingpost': '3) Comparatif arnaques SingPost',
-    'sectionUsps': '4) Comparatif arnaques USPS',
-    'sectionDhl': '5) Comparatif arnaques DHL',
-    'sectionOthers': '6) Autres transporteurs et destinations',
-    'sectionTips': '7) Liste de sécurité',
-    'officialOnly': 'Notre seul site officiel est rhythmnexus.org (pas de .com, .net, .shop, ni variantes).',
-    'checkTypos': 'Surveillez les fautes : RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, lettres en trop, chiffres à la place des lettres.',
-    'howText': 'Les messages de phishing annoncent souvent un échec de livraison et demandent un petit paiement. N’ouvrez pas les liens inconnus.',
-    'officialLabel': 'Sites officiels',
-    'fakeLabel': 'Domaines frauduleux courants',
-    'patternLabel': 'Modèle',
-    'warningLabel': 'Signes d’alerte',
-    'tips': [
-      'Saisissez vous-même les URL des transporteurs.',
-      'Vérifiez le domaine complet avec attention.',
-      'Ne payez pas de “frais de re-livraison” via des liens non fiables.',
-      'HTTPS ne suffit pas : seul le nom de domaine fait foi.'
-    ],
-    'disclaimerTitle': 'Avertissement',
-    'disclaimer': 'Exemples fournis à titre de sensibilisation, selon des schémas courants de phishing.',
-    'lastUpdated': 'Dernière mise à jour : mars 2026'
-  },
-  'de': {
-    'title': 'Vorsicht vor Betrug: Gefälschte Websites und Paket-Tracking-Betrug',
-    'intro': 'Betrüger erstellen gefälschte Websites, die offiziell wirken. Prüfen Sie immer die Domain.',
-    'sectionOur': '1) Offizielle Rhythm Nexus Website',
-    'sectionHow': '2) So funktionieren Tracking-Betrügereien',
-    'sectionSingpost': '3) SingPost-Betrugsvergleich',
-    'sectionUsps': '4) USPS-Betrugsvergleich',
-    'sectionDhl': '5) DHL-Betrugsvergleich',
-    'sectionOthers': '6) Weitere Zusteller und Ziele',
-    'sectionTips': '7) Sicherheits-Checkliste',
-    'officialOnly': 'Unsere einzige offizielle Website ist rhythmnexus.org (kein .com, .net, .shop oder Varianten).',
-    'checkTypos': 'Achten Sie auf Tippfehler: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, zusätzliche Buchstaben, Zahlen statt Buchstaben.',
-    'howText': 'Phishing-Nachrichten behaupten oft ein Zustellproblem und verlangen eine kleine Zahlung. Keine unbekannten Links anklicken.',
-    'officialLabel': 'Offizielle Websites',
-    'fakeLabel': 'Häufige Fake-Domains',
-    'patternLabel': 'Muster',
-    'warningLabel': 'Warnzeichen',
-    'tips': [
-      'Carrier-URLs direkt eingeben, nicht aus Nachrichten öffnen.',
-      'Vollständige Domain sorgfältig prüfen.',
-      'Keine „erneute Zustellgebühr“ über unzuverlässige Links zahlen.',
-      'HTTPS allein bedeutet nicht echt; entscheidend ist die Domain.'
-    ],
-    'disclaimerTitle': 'Hinweis',
-    'disclaimer': 'Beispiele dienen der Aufklärung und basieren auf typischen Phishing-Mustern.',
-    'lastUpdated': 'Zuletzt aktualisiert: März 2026'
-  },
-  'he': {
-    'title': 'היזהרו מהונאות: אתרים מזויפים והונאות מעקב משלוחים',
-    'intro': 'נוכלים יוצרים אתרים מזויפים שנראים רשמיים. תמיד בדקו את הדומיין לפני הזנת מידע אישי.',
-    'sectionOur': '1) האתר הרשמי של Rhythm Nexus',
-    'sectionHow': '2) איך הונאות מעקב חבילות עובדות',
-    'sectionSingpost': '3) השוואת הונאות SingPost',
-    'sectionUsps': '4) השוואת הונאות USPS',
-    'sectionDhl': '5) השוואת הונאות DHL',
-    'sectionOthers': '6) חברות שילוח נוספות ויעדים',
-    'sectionTips': '7) רשימת בטיחות',
-    'officialOnly': 'האתר הרשמי היחיד שלנו הוא rhythmnexus.org (ללא .com, .net, .shop או וריאציות).',
-    'checkTypos': 'שימו לב לשגיאות כתיב: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org ועוד.',
-    'howText': 'הודעות פישינג טוענות לרוב לכשל במסירה ומבקשות תשלום קטן. אל תלחצו על קישורים לא מוכרים.',
-    'officialLabel': 'אתרים רשמיים',
-    'fakeLabel': 'דומיינים מזויפים נפוצים',
-    'patternLabel': 'דפוס',
-    'warningLabel': 'סימני אזהרה',
-    'tips': [
-      'הקלידו ידנית את כתובת אתר המוביל.',
-      'בדקו היטב את הדומיין המלא.',
-      'אל תשלמו "עמלות מסירה מחדש" דרך קישורים לא אמינים.',
-      'HTTPS לבדו לא מוכיח אמינות; הדומיין הוא הקובע.'
-    ],
-    'disclaimerTitle': 'הבהרה',
-    'disclaimer': 'הדוגמאות מיועדות למודעות ומבוססות על דפוסי פישינג נפוצים.',
-    'lastUpdated': 'עודכן לאחרונה: מרץ 2026'
-  },
-  'hi': {
-    'title': 'सावधान: नकली वेबसाइट और पार्सल ट्रैकिंग धोखाधड़ी',
-    'intro': 'ठग आधिकारिक जैसी दिखने वाली नकली वेबसाइट बनाते हैं। कोई भी जानकारी भरने से पहले डोमेन जांचें।',
-    'sectionOur': '1) Rhythm Nexus की आधिकारिक वेबसाइट',
-    'sectionHow': '2) पार्सल ट्रैकिंग स्कैम कैसे काम करता है',
-    'sectionSingpost': '3) SingPost स्कैम तुलना',
-    'sectionUsps': '4) USPS स्कैम तुलना',
-    'sectionDhl': '5) DHL स्कैम तुलना',
-    'sectionOthers': '6) अन्य कैरियर और गंतव्य',
-    'sectionTips': '7) सुरक्षा चेकलिस्ट',
-    'officialOnly': 'हमारी एकमात्र आधिकारिक वेबसाइट rhythmnexus.org है (.com, .net, .shop या अन्य नहीं)।',
-    'checkTypos': 'टाइपो से सावधान रहें: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org आदि।',
-    'howText': 'फिशिंग संदेश अक्सर डिलीवरी फेल होने का दावा करते हैं और छोटा भुगतान मांगते हैं। अनजान लिंक पर क्लिक न करें।',
-    'officialLabel': 'आधिकारिक वेबसाइटें',
-    'fakeLabel': 'सामान्य नकली डोमेन',
-    'patternLabel': 'पैटर्न',
-    'warningLabel': 'चेतावनी संकेत',
-    'tips': [
-      'मैसेज लिंक खोलने के बजाय URL खुद टाइप करें।',
-      'पूरा डोमेन ध्यान से जांचें।',
-      'अविश्वसनीय लिंक से “रीडिलीवरी फीस” न दें।',
-      'सिर्फ HTTPS होना असली होने का प्रमाण नहीं है।'
-    ],
-    'disclaimerTitle': 'अस्वीकरण',
-    'disclaimer': 'ये उदाहरण जागरूकता के लिए हैं और सामान्य फिशिंग पैटर्न पर आधारित हैं।',
-    'lastUpdated': 'अंतिम अपडेट: मार्च 2026'
-  },
-  'id': {
-    'title': 'Waspada penipuan: situs palsu dan penipuan pelacakan paket',
-    'intro': 'Penipu membuat situs palsu yang terlihat resmi. Selalu periksa domain sebelum mengisi data.',
-    'sectionOur': '1) Situs resmi Rhythm Nexus',
-    'sectionHow': '2) Cara kerja penipuan pelacakan paket',
-    'sectionSingpost': '3) Perbandingan penipuan SingPost',
-    'sectionUsps': '4) Perbandingan penipuan USPS',
-    'sectionDhl': '5) Perbandingan penipuan DHL',
-    'sectionOthers': '6) Kurir dan destinasi lain',
-    'sectionTips': '7) Daftar cek keamanan',
-    'officialOnly': 'Satu-satunya situs resmi kami adalah rhythmnexus.org (bukan .com/.net/.shop atau varian).',
-    'checkTypos': 'Waspadai typo: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, huruf tambahan, atau angka menggantikan huruf.',
-    'howText': 'Pesan phishing biasanya mengklaim pengiriman gagal dan meminta pembayaran kecil. Jangan klik tautan asing.',
-    'officialLabel': 'Situs resmi',
-    'fakeLabel': 'Domain palsu umum',
-    'patternLabel': 'Pola',
-    'warningLabel': 'Tanda peringatan',
-    'tips': [
-      'Ketik URL kurir secara langsung.',
-      'Periksa domain lengkap dengan teliti.',
-      'Jangan bayar “biaya kirim ulang” lewat tautan tidak tepercaya.',
-      'HTTPS saja tidak membuktikan situs asli; nama domain yang menentukan.'
-    ],
-    'disclaimerTitle': 'Penafian',
-    'disclaimer': 'Contoh ini untuk edukasi dan berdasarkan pola phishing umum.',
-    'lastUpdated': 'Pembaruan terakhir: Maret 2026'
-  },
-  'ga': {
-    'title': 'Bí ar an airdeall faoi chalaois: suíomhanna bréige agus calaois rianaithe beartán',
-    'intro': 'Cruthaíonn calaoisigh suíomhanna bréige a fhéachann oifigiúil. Deimhnigh an fearann i gcónaí.',
-    'sectionOur': '1) Suíomh oifigiúil Rhythm Nexus',
-    'sectionHow': '2) Conas a oibríonn camscéimeanna rianaithe beartán',
-    'sectionSingpost': '3) Comparáid calaoise SingPost',
-    'sectionUsps': '4) Comparáid calaoise USPS',
-    'sectionDhl': '5) Comparáid calaoise DHL',
-    'sectionOthers': '6) Iompróirí agus cinn scríbe eile',
-    'sectionTips': '7) Seicliosta sábháilteachta',
-    'officialOnly': 'Is é rhythmnexus.org ár n-aon suíomh oifigiúil (gan .com/.net/.shop ná leaganacha eile).',
-    'checkTypos': 'Bí aireach ar mhílitriú: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, srl.',
-    'howText': 'De ghnáth deir teachtaireachtaí fioscaireachta gur theip ar sheachadadh agus iarrann siad táille bheag.',
-    'officialLabel': 'Suíomhanna oifigiúla',
-    'fakeLabel': 'Fearainn bhréige choitianta',
-    'patternLabel': 'Patrún',
-    'warningLabel': 'Comharthaí rabhaidh',
-    'tips': [
-      'Clóscríobh URL an iompróra de láimh.',
-      'Seiceáil an fearann iomlán go cúramach.',
-      'Ná híoc “táillí athsheachadta” trí nascanna neamhiontaofa.',
-      'Ní chruthúnas dlisteanachta é HTTPS amháin.'
-    ],
-    'disclaimerTitle': 'Séanadh',
-    'disclaimer': 'Tá na samplaí seo le haghaidh feasachta agus bunaithe ar phatrúin choitianta fioscaireachta.',
-    'lastUpdated': 'Nuashonraithe deireanach: Márta 2026'
-  },
-  'it': {
-    'title': 'Attenzione alle truffe: siti falsi e frodi nel tracking pacchi',
-    'intro': 'I truffatori creano siti falsi che sembrano ufficiali. Verifica sempre il dominio prima di inserire dati.',
-    'sectionOur': '1) Sito ufficiale Rhythm Nexus',
-    'sectionHow': '2) Come funzionano le truffe di tracciamento',
-    'sectionSingpost': '3) Confronto truffe SingPost',
-    'sectionUsps': '4) Confronto truffe USPS',
-    'sectionDhl': '5) Confronto truffe DHL',
-    'sectionOthers': '6) Altri corrieri e destinazioni',
-    'sectionTips': '7) Checklist di sicurezza',
-    'officialOnly': 'Il nostro unico sito ufficiale è rhythmnexus.org (nessun .com, .net, .shop o varianti).',
-    'checkTypos': 'Attenzione ai refusi: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, lettere extra o numeri al posto delle lettere.',
-    'howText': 'I messaggi di phishing spesso parlano di consegna fallita e chiedono un piccolo pagamento. Non cliccare link sconosciuti.',
-    'officialLabel': 'Siti ufficiali',
-    'fakeLabel': 'Domini falsi comuni',
-    'patternLabel': 'Schema',
-    'warningLabel': 'Segnali di allarme',
-    'tips': [
-      'Digita tu direttamente gli URL dei corrieri.',
-      'Controlla con attenzione il dominio completo.',
-      'Non pagare “costi di riconsegna” tramite link non affidabili.',
-      'HTTPS da solo non garantisce autenticità; conta il dominio.'
-    ],
-    'disclaimerTitle': 'Disclaimer',
-    'disclaimer': 'Gli esempi sono a scopo informativo e basati su pattern phishing comuni.',
-    'lastUpdated': 'Ultimo aggiornamento: marzo 2026'
-  },
-  'ja': {
-    'title': '詐欺に注意：偽サイトと荷物追跡詐欺',
-    'intro': '詐欺師は公式に見える偽サイトを作成します。個人情報を入力する前に必ずドメインを確認してください。',
-    'sectionOur': '1) Rhythm Nexus 公式サイト',
-    'sectionHow': '2) 荷物追跡詐欺の手口',
-    'sectionSingpost': '3) SingPost 詐欺比較',
-    'sectionUsps': '4) USPS 詐欺比較',
-    'sectionDhl': '5) DHL 詐欺比較',
-    'sectionOthers': '6) その他の配送業者と配送先',
-    'sectionTips': '7) 安全チェックリスト',
-    'officialOnly': '当社の唯一の公式サイトは rhythmnexus.org です（.com/.net/.shop などはありません）。',
-    'checkTypos': 'タイプミスに注意：RhythmN3xus.org、rhythmnexus.com、rhythm-nexus.org など。',
-    'howText': 'フィッシングメッセージは「配送失敗」を装い、少額決済を要求します。不明なリンクは開かないでください。',
-    'officialLabel': '公式サイト',
-    'fakeLabel': 'よくある偽ドメイン',
-    'patternLabel': 'パターン',
-    'warningLabel': '警告サイン',
-    'tips': [
-      'メッセージ内リンクではなく、URLを直接入力する。',
-      'ドメイン全体を注意深く確認する。',
-      '不審なリンクで「再配達料」を支払わない。',
-      'HTTPSだけでは正規性の証明になりません。'
-    ],
-    'disclaimerTitle': '免責事項',
-    'disclaimer': '掲載例は注意喚起目的で、一般的なフィッシング手口に基づきます。',
-    'lastUpdated': '最終更新：2026年3月'
-  },
-  'ko': {
-    'title': '사기 주의: 가짜 웹사이트 및 택배 추적 사기',
-    'intro': '사기범은 공식처럼 보이는 가짜 사이트를 만듭니다. 정보를 입력하기 전에 도메인을 확인하세요.',
-    'sectionOur': '1) Rhythm Nexus 공식 웹사이트',
-    'sectionHow': '2) 택배 추적 사기 수법',
-    'sectionSingpost': '3) SingPost 사기 비교',
-    'sectionUsps': '4) USPS 사기 비교',
-    'sectionDhl': '5) DHL 사기 비교',
-    'sectionOthers': '6) 기타 운송사 및 목적지',
-    'sectionTips': '7) 안전 체크리스트',
-    'officialOnly': '공식 웹사이트는 rhythmnexus.org 하나뿐입니다(.com/.net/.shop 변형 없음).',
-    'checkTypos': '오타 주의: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org 등.',
-    'howText': '피싱 메시지는 배송 실패를 주장하며 소액 결제를 유도합니다. 낯선 링크를 클릭하지 마세요.',
-    'officialLabel': '공식 웹사이트',
-    'fakeLabel': '일반적인 가짜 도메인',
-    'patternLabel': '패턴',
-    'warningLabel': '경고 신호',
-    'tips': [
-      '문자 링크 대신 주소를 직접 입력하세요.',
-      '전체 도메인을 꼼꼼히 확인하세요.',
-      '신뢰할 수 없는 링크로 “재배송 요금”을 결제하지 마세요.',
-      'HTTPS만으로는 진짜 사이트임을 보장하지 않습니다.'
-    ],
-    'disclaimerTitle': '면책 고지',
-    'disclaimer': '예시는 인식 제고 목적이며 일반적인 피싱 패턴을 기반으로 합니다.',
-    'lastUpdated': '최종 업데이트: 2026년 3월'
-  },
-  'ms': {
-    'title': 'Waspada penipuan: laman web palsu & penipuan penjejakan bungkusan',
-    'intro': 'Penipu membina laman web palsu yang kelihatan rasmi. Sentiasa semak domain sebelum mengisi maklumat.',
-    'sectionOur': '1) Laman web rasmi Rhythm Nexus',
-    'sectionHow': '2) Cara penipuan penjejakan bungkusan berfungsi',
-    'sectionSingpost': '3) Perbandingan penipuan SingPost',
-    'sectionUsps': '4) Perbandingan penipuan USPS',
-    'sectionDhl': '5) Perbandingan penipuan DHL',
-    'sectionOthers': '6) Pembawa dan destinasi lain',
-    'sectionTips': '7) Senarai semak keselamatan',
-    'officialOnly': 'Satu-satunya laman web rasmi kami ialah rhythmnexus.org (tiada .com, .net, .shop atau variasi).',
-    'checkTypos': 'Perhatikan salah ejaan: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, huruf tambahan atau angka mengganti huruf.',
-    'howText': 'Mesej phishing biasanya mendakwa penghantaran gagal dan meminta bayaran kecil. Jangan klik pautan tidak dikenali.',
-    'officialLabel': 'Laman web rasmi',
-    'fakeLabel': 'Domain palsu biasa',
-    'patternLabel': 'Corak',
-    'warningLabel': 'Tanda amaran',
-    'tips': [
-      'Taip URL pembawa secara terus.',
-      'Semak domain penuh dengan teliti.',
-      'Jangan bayar “yuran penghantaran semula” melalui pautan meragukan.',
-      'HTTPS sahaja tidak membuktikan kesahihan; domainlah yang penting.'
-    ],
-    'disclaimerTitle': 'Penafian',
-    'disclaimer': 'Contoh adalah untuk kesedaran dan berdasarkan corak phishing biasa.',
-    'lastUpdated': 'Kemaskini terakhir: Mac 2026'
-  },
-  'no': {
-    'title': 'Vær oppmerksom på svindel: falske nettsteder og pakkesporingssvindel',
-    'intro': 'Svindlere lager falske nettsteder som ser offisielle ut. Sjekk alltid domenet før du oppgir informasjon.',
-    'sectionOur': '1) Rhythm Nexus offisielle nettsted',
-    'sectionHow': '2) Hvordan pakkesporingssvindel fungerer',
-    'sectionSingpost': '3) SingPost-svindelsammenligning',
-    'sectionUsps': '4) USPS-svindelsammenligning',
-    'sectionDhl': '5) DHL-svindelsammenligning',
-    'sectionOthers': '6) Andre transportører og destinasjoner',
-    'sectionTips': '7) Sikkerhetssjekkliste',
-    'officialOnly': 'Vår eneste offisielle nettside er rhythmnexus.org (ingen .com/.net/.shop eller varianter).',
-    'checkTypos': 'Se etter skrivefeil: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org osv.',
-    'howText': 'Phishingmeldinger påstår ofte leveringsfeil og ber om en liten betaling. Ikke klikk ukjente lenker.',
-    'officialLabel': 'Offisielle nettsteder',
-    'fakeLabel': 'Vanlige falske domener',
-    'patternLabel': 'Mønster',
-    'warningLabel': 'Varseltegn',
-    'tips': [
-      'Skriv inn URL-er direkte i nettleseren.',
-      'Kontroller hele domenet nøye.',
-      'Ikke betal “omleveringsgebyr” via upålitelige lenker.',
-      'HTTPS alene beviser ikke at siden er ekte.'
-    ],
-    'disclaimerTitle': 'Ansvarsfraskrivelse',
-    'disclaimer': 'Eksemplene er kun for bevisstgjøring og bygger på vanlige phishingmønstre.',
-    'lastUpdated': 'Sist oppdatert: mars 2026'
-  },
-  'pl': {
-    'title': 'Uwaga na oszustwa: fałszywe strony i oszustwa śledzenia paczek',
-    'intro': 'Oszuści tworzą fałszywe strony wyglądające oficjalnie. Zawsze sprawdzaj domenę przed podaniem danych.',
-    'sectionOur': '1) Oficjalna strona Rhythm Nexus',
-    'sectionHow': '2) Jak działają oszustwa śledzenia paczek',
-    'sectionSingpost': '3) Porównanie oszustw SingPost',
-    'sectionUsps': '4) Porównanie oszustw USPS',
-    'sectionDhl': '5) Porównanie oszustw DHL',
-    'sectionOthers': '6) Inni przewoźnicy i kierunki',
-    'sectionTips': '7) Lista bezpieczeństwa',
-    'officialOnly': 'Nasza jedyna oficjalna strona to rhythmnexus.org (brak .com, .net, .shop i wariantów).',
-    'checkTypos': 'Uważaj na literówki: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org itd.',
-    'howText': 'Wiadomości phishingowe często informują o nieudanej dostawie i proszą o małą opłatę. Nie klikaj nieznanych linków.',
-    'officialLabel': 'Oficjalne strony',
-    'fakeLabel': 'Typowe fałszywe domeny',
-    'patternLabel': 'Wzorzec',
-    'warningLabel': 'Sygnały ostrzegawcze',
-    'tips': [
-      'Wpisuj adresy przewoźników ręcznie.',
-      'Dokładnie sprawdzaj pełną domenę.',
-      'Nie płać „opłat za ponowne doręczenie” przez podejrzane linki.',
-      'Samo HTTPS nie gwarantuje autentyczności.'
-    ],
-    'disclaimerTitle': 'Zastrzeżenie',
-    'disclaimer': 'Przykłady mają charakter edukacyjny i opierają się na typowych wzorcach phishingu.',
-    'lastUpdated': 'Ostatnia aktualizacja: marzec 2026'
-  },
-  'pt': {
-    'title': 'Cuidado com golpes: sites falsos e fraude de rastreamento de encomendas',
-    'intro': 'Golpistas criam sites falsos com aparência oficial. Sempre verifique o domínio antes de inserir dados.',
-    'sectionOur': '1) Site oficial da Rhythm Nexus',
-    'sectionHow': '2) Como funcionam os golpes de rastreamento',
-    'sectionSingpost': '3) Comparação de golpes SingPost',
-    'sectionUsps': '4) Comparação de golpes USPS',
-    'sectionDhl': '5) Comparação de golpes DHL',
-    'sectionOthers': '6) Outras transportadoras e destinos',
-    'sectionTips': '7) Checklist de segurança',
-    'officialOnly': 'Nosso único site oficial é rhythmnexus.org (sem .com, .net, .shop ou variações).',
-    'checkTypos': 'Atenção a erros: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, letras extras ou números no lugar de letras.',
-    'howText': 'Mensagens de phishing costumam alegar falha na entrega e pedir pequeno pagamento. Não clique em links desconhecidos.',
-    'officialLabel': 'Sites oficiais',
-    'fakeLabel': 'Domínios falsos comuns',
-    'patternLabel': 'Padrão',
-    'warningLabel': 'Sinais de alerta',
-    'tips': [
-      'Digite os URLs das transportadoras manualmente.',
-      'Verifique o domínio completo com cuidado.',
-      'Não pague “taxa de redespacho” por links não confiáveis.',
-      'HTTPS sozinho não comprova legitimidade.'
-    ],
-    'disclaimerTitle': 'Aviso',
-    'disclaimer': 'Exemplos para conscientização, baseados em padrões comuns de phishing.',
-    'lastUpdated': 'Última atualização: março de 2026'
-  },
-  'ru': {
-    'title': 'Остерегайтесь мошенничества: поддельные сайты и мошеннический трекинг',
-    'intro': 'Мошенники создают фальшивые сайты, похожие на официальные. Всегда проверяйте домен.',
-    'sectionOur': '1) Официальный сайт Rhythm Nexus',
-    'sectionHow': '2) Как работают мошенничества с отслеживанием',
-    'sectionSingpost': '3) Сравнение мошенничества SingPost',
-    'sectionUsps': '4) Сравнение мошенничества USPS',
-    'sectionDhl': '5) Сравнение мошенничества DHL',
-    'sectionOthers': '6) Другие перевозчики и направления',
-    'sectionTips': '7) Чек-лист безопасности',
-    'officialOnly': 'Наш единственный официальный сайт — rhythmnexus.org (без .com, .net, .shop и вариантов).',
-    'checkTypos': 'Проверяйте опечатки: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org и т.д.',
-    'howText': 'Фишинговые сообщения часто заявляют о проблеме доставки и просят небольшой платеж. Не переходите по неизвестным ссылкам.',
-    'officialLabel': 'Официальные сайты',
-    'fakeLabel': 'Распространенные фейковые домены',
-    'patternLabel': 'Шаблон',
-    'warningLabel': 'Признаки мошенничества',
-    'tips': [
-      'Вводите адрес перевозчика вручную.',
-      'Внимательно проверяйте полный домен.',
-      'Не платите “за повторную доставку” через сомнительные ссылки.',
-      'HTTPS сам по себе не доказывает подлинность сайта.'
-    ],
-    'disclaimerTitle': 'Отказ от ответственности',
-    'disclaimer': 'Примеры даны для информирования и основаны на типичных схемах фишинга.',
-    'lastUpdated': 'Обновлено: март 2026'
-  },
-  'zh': {
-    'title': '警惕诈骗：假冒网站与包裹追踪欺诈',
-    'intro': '诈骗者会建立看起来很“官方”的假网站。输入个人信息前，请先核对域名。',
-    'sectionOur': '1）Rhythm Nexus 官方网站',
-    'sectionHow': '2）包裹追踪诈骗如何运作',
-    'sectionSingpost': '3）SingPost 诈骗对比',
-    'sectionUsps': '4）USPS 诈骗对比',
-    'sectionDhl': '5）DHL 诈骗对比',
-    'sectionOthers': '6）其他承运商与目的地',
-    'sectionTips': '7）安全检查清单',
-    'officialOnly': '我们唯一官方网站是 rhythmnexus.org（没有 .com/.net/.shop 或其他变体）。',
-    'checkTypos': '留意拼写陷阱：RhythmN3xus.org、rhythmnexus.com、rhythm-nexus.org 等。',
-    'howText': '钓鱼信息通常声称“投递失败”，并要求小额付款。不要点击陌生链接。',
-    'officialLabel': '官方网站',
-    'fakeLabel': '常见假域名',
-    'patternLabel': '伪装方式',
-    'warningLabel': '警示信号',
-    'tips': [
-      '不要点短信链接，直接输入承运商网址。',
-      '仔细核对完整域名。',
-      '不要通过不明链接支付“再次投递费”。',
-      '仅有 HTTPS 不代表网站真实，域名才是关键。'
-    ],
-    'disclaimerTitle': '免责声明',
-    'disclaimer': '示例用于安全提醒，基于常见钓鱼模式。请向当地网络安全机构举报可疑网站。',
-    'lastUpdated': '最后更新：2026年3月'
-  },
-  'es': {
-    'title': 'Cuidado con las estafas: sitios falsos y fraude de seguimiento de paquetes',
-    'intro': 'Los estafadores crean sitios falsos que parecen oficiales. Verifica siempre el dominio antes de ingresar datos.',
-    'sectionOur': '1) Sitio oficial de Rhythm Nexus',
-    'sectionHow': '2) Cómo funcionan las estafas de seguimiento',
-    'sectionSingpost': '3) Comparación de estafas de SingPost',
-    'sectionUsps': '4) Comparación de estafas de USPS',
-    'sectionDhl': '5) Comparación de estafas de DHL',
-    'sectionOthers': '6) Otros transportistas y destinos',
-    'sectionTips': '7) Lista de seguridad',
-    'officialOnly': 'Nuestro único sitio oficial es rhythmnexus.org (sin .com, .net, .shop ni variantes).',
-    'checkTypos': 'Atención a errores: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, letras extra o números en lugar de letras.',
-    'howText': 'Los mensajes de phishing suelen alegar fallo de entrega y piden un pago pequeño. No abras enlaces desconocidos.',
-    'officialLabel': 'Sitios oficiales',
-    'fakeLabel': 'Dominios falsos comunes',
-    'patternLabel': 'Patrón',
-    'warningLabel': 'Señales de alerta',
-    'tips': [
-      'Escribe tú mismo la URL del transportista.',
-      'Revisa cuidadosamente el dominio completo.',
-      'No pagues “tarifas de reentrega” desde enlaces no confiables.',
-      'HTTPS por sí solo no garantiza legitimidad.'
-    ],
-    'disclaimerTitle': 'Aviso legal',
-    'disclaimer': 'Los ejemplos son informativos y se basan en patrones comunes de phishing.',
-    'lastUpdated': 'Última actualización: marzo de 2026'
-  },
-  'sv': {
-    'title': 'Akta dig för bedrägerier: falska webbplatser och paketspårningsbedrägerier',
-    'intro': 'Bedragare skapar falska webbplatser som ser officiella ut. Kontrollera alltid domänen innan du anger uppgifter.',
-    'sectionOur': '1) Rhythm Nexus officiella webbplats',
-    'sectionHow': '2) Hur paketspårningsbedrägerier fungerar',
-    'sectionSingpost': '3) SingPost-bedrägerijämförelse',
-    'sectionUsps': '4) USPS-bedrägerijämförelse',
-    'sectionDhl': '5) DHL-bedrägerijämförelse',
-    'sectionOthers': '6) Andra transportörer och destinationer',
-    'sectionTips': '7) Säkerhetschecklista',
-    'officialOnly': 'Vår enda officiella webbplats är rhythmnexus.org (inga .com/.net/.shop-varianter).',
-    'checkTypos': 'Se upp för stavfel: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org osv.',
-    'howText': 'Phishingmeddelanden påstår ofta leveransfel och begär en liten betalning. Klicka inte på okända länkar.',
-    'officialLabel': 'Officiella webbplatser',
-    'fakeLabel': 'Vanliga falska domäner',
-    'patternLabel': 'Mönster',
-    'warningLabel': 'Varningssignaler',
-    'tips': [
-      'Skriv in transportörens URL direkt.',
-      'Kontrollera hela domänen noggrant.',
-      'Betala inte “omleveransavgifter” via opålitliga länkar.',
-      'HTTPS ensam är inget bevis på legitimitet.'
-    ],
-    'disclaimerTitle': 'Ansvarsfriskrivning',
-    'disclaimer': 'Exemplen är för medvetandegörande och baseras på vanliga phishingmönster.',
-    'lastUpdated': 'Senast uppdaterad: mars 2026'
-  },
-  'ta': {
-    'title': 'மோசடிகளை எச்சரிக்கையாக இருங்கள்: போலி தளங்கள் மற்றும் பார்சல் டிராக்கிங் மோசடி',
-    'intro': 'மோசடிக்காரர்கள் அதிகாரப்பூர்வமாக தோன்றும் போலி தளங்களை உருவாக்குகிறார்கள். தகவல் தருவதற்கு முன் டொமைனை சரிபார்க்கவும்.',
-    'sectionOur': '1) Rhythm Nexus அதிகாரப்பூர்வ இணையதளம்',
-    'sectionHow': '2) பார்சல் டிராக்கிங் மோசடி எப்படி நடக்கிறது',
-    'sectionSingpost': '3) SingPost மோசடி ஒப்பீடு',
-    'sectionUsps': '4) USPS மோசடி ஒப்பீடு',
-    'sectionDhl': '5) DHL மோசடி ஒப்பீடு',
-    'sectionOthers': '6) பிற கேரியர்கள் மற்றும் இலக்குகள்',
-    'sectionTips': '7) பாதுகாப்பு சரிபார்ப்பு பட்டியல்',
-    'officialOnly': 'எங்கள் ஒரே அதிகாரப்பூர்வ தளம் rhythmnexus.org (.com/.net/.shop மற்றும் வேறு மாற்றங்கள் இல்லை).',
-    'checkTypos': 'எழுத்துப்பிழைகள் கவனிக்கவும்: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org போன்றவை.',
-    'howText': 'Phishing செய்திகள் பொதுவாக டெலிவரி தோல்வி என கூறி சிறு கட்டணம் கேட்கும். தெரியாத இணைப்புகளை திறக்க வேண்டாம்.',
-    'officialLabel': 'அதிகாரப்பூர்வ தளங்கள்',
-    'fakeLabel': 'பொதுவான போலி டொமைன்கள்',
-    'patternLabel': 'முறை',
-    'warningLabel': 'எச்சரிக்கை அறிகுறிகள்',
-    'tips': [
-      'SMS இணைப்பை திறக்காமல் URL ஐ நேரடியாக தட்டச்சு செய்யவும்.',
-      'முழு டொமைனை கவனமாக சரிபார்க்கவும்.',
-      'நம்பகமற்ற இணைப்புகள் மூலம் “மீண்டும் டெலிவரி கட்டணம்” செலுத்த வேண்டாம்.',
-      'HTTPS மட்டும் போதாது; டொமைன் பெயரே முக்கியம்.'
-    ],
-    'disclaimerTitle': 'பொறுப்புத்துறப்பு',
-    'disclaimer': 'இந்த உதாரணங்கள் விழிப்புணர்வுக்காகவும் பொதுவான phishing முறைகளின் அடிப்படையிலும் வழங்கப்பட்டவை.',
-    'lastUpdated': 'கடைசியாக புதுப்பிப்பு: மார்ச் 2026'
-  },
-  'tl': {
-    'title': 'Mag-ingat sa scam: pekeng website at parcel tracking fraud',
-    'intro': 'Gumagawa ang scammers ng pekeng website na mukhang opisyal. Laging i-check ang domain bago maglagay ng impormasyon.',
-    'sectionOur': '1) Opisyal na website ng Rhythm Nexus',
-    'sectionHow': '2) Paano gumagana ang parcel tracking scam',
-    'sectionSingpost': '3) SingPost scam comparison',
-    'sectionUsps': '4) USPS scam comparison',
-    'sectionDhl': '5) DHL scam comparison',
-    'sectionOthers': '6) Iba pang carrier at destinasyon',
-    'sectionTips': '7) Safety checklist',
-    'officialOnly': 'Ang tanging opisyal naming website ay rhythmnexus.org (walang .com, .net, .shop o variants).',
-    'checkTypos': 'Mag-ingat sa typo: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org at iba pa.',
-    'howText': 'Ang phishing messages ay karaniwang nagsasabing failed delivery at humihingi ng maliit na bayad. Huwag mag-click ng unknown links.',
-    'officialLabel': 'Opisyal na websites',
-    'fakeLabel': 'Karaniwang pekeng domain',
-    'patternLabel': 'Pattern',
-    'warningLabel': 'Babala',
-    'tips': [
-      'I-type nang direkta ang URL ng carrier.',
-      'Suriin nang mabuti ang buong domain.',
-      'Huwag magbayad ng “redelivery fee” sa hindi mapagkakatiwalaang link.',
-      'Hindi sapat ang HTTPS lang para masabing lehitimo.'
-    ],
-    'disclaimerTitle': 'Disclaimer',
-    'disclaimer': 'Ang mga halimbawa ay para sa awareness at batay sa karaniwang phishing patterns.',
-    'lastUpdated': 'Huling update: Marso 2026'
-  },
-  'th': {
-    'title': 'ระวังการหลอกลวง: เว็บไซต์ปลอมและการฉ้อโกงติดตามพัสดุ',
-    'intro': 'มิจฉาชีพสร้างเว็บไซต์ปลอมที่ดูเหมือนเป็นทางการ ควรตรวจสอบโดเมนทุกครั้งก่อนกรอกข้อมูล',
-    'sectionOur': '1) เว็บไซต์ทางการของ Rhythm Nexus',
-    'sectionHow': '2) กลโกงติดตามพัสดุทำงานอย่างไร',
-    'sectionSingpost': '3) เปรียบเทียบกลโกง SingPost',
-    'sectionUsps': '4) เปรียบเทียบกลโกง USPS',
-    'sectionDhl': '5) เปรียบเทียบกลโกง DHL',
-    'sectionOthers': '6) ผู้ให้บริการอื่นและปลายทาง',
-    'sectionTips': '7) เช็กลิสต์ความปลอดภัย',
-    'officialOnly': 'เว็บไซต์ทางการเพียงแห่งเดียวของเราคือ rhythmnexus.org (ไม่มี .com, .net, .shop หรือโดเมนแฝง)',
-    'checkTypos': 'ระวังการสะกดผิด เช่น RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org เป็นต้น',
-    'howText': 'ข้อความฟิชชิงมักอ้างว่าจัดส่งไม่สำเร็จและขอให้ชำระเงินเล็กน้อย อย่าคลิกลิงก์ที่ไม่รู้จัก',
-    'officialLabel': 'เว็บไซต์ทางการ',
-    'fakeLabel': 'โดเมนปลอมที่พบบ่อย',
-    'patternLabel': 'รูปแบบ',
-    'warningLabel': 'สัญญาณเตือน',
-    'tips': [
-      'พิมพ์ URL ของผู้ให้บริการด้วยตนเองแทนการกดลิงก์จากข้อความ',
-      'ตรวจสอบโดเมนเต็มอย่างละเอียด',
-      'อย่าจ่าย “ค่าจัดส่งซ้ำ” ผ่านลิงก์ที่ไม่น่าเชื่อถือ',
-      'มี HTTPS อย่างเดียวไม่ได้แปลว่าเว็บไซต์จริง'
-    ],
-    'disclaimerTitle': 'ข้อสงวนสิทธิ์',
-    'disclaimer': 'ตัวอย่างมีไว้เพื่อการรับรู้และอิงจากรูปแบบฟิชชิงที่พบได้บ่อย',
-    'lastUpdated': 'อัปเดตล่าสุด: มีนาคม 2026'
-  },
-  'mi': {
-    'title': 'Kia mataara ki ngā tinihanga: pae rūpahu me te tinihanga aroturuki paraka',
-    'intro': 'Ka hangaia e ngā kaitinihanga he pae rūpahu e rite ana ki te pae mana. Tirohia te ingoa rohe i mua i te whakauru kōrero.',
-    'sectionOur': '1) Pae mana o Rhythm Nexus',
-    'sectionHow': '2) Me pēhea te mahi o ngā tinihanga aroturuki paraka',
-    'sectionSingpost': '3) Whakataurite tinihanga SingPost',
-    'sectionUsps': '4) Whakataurite tinihanga USPS',
-    'sectionDhl': '5) Whakataurite tinihanga DHL',
-    'sectionOthers': '6) Ētahi atu kaikawe me ngā ūnga',
-    'sectionTips': '7) Rārangi haumaru',
-    'officialOnly': 'Ko tō mātou pae mana kotahi ko rhythmnexus.org (kāore he .com/.net/.shop, he momo kē rānei).',
-    'checkTypos': 'Kia tūpato ki ngā hē takikupu: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org.',
-    'howText': 'He maha ngā karere phishing e kī ana kua hē te tuku, ā, ka tono utu iti. Kaua e pāwhiri hononga kāore i te mōhiotia.',
-    'officialLabel': 'Ngā pae mana',
-    'fakeLabel': 'Ngā ingoa rohe rūpahu noa',
-    'patternLabel': 'Tauira',
-    'warningLabel': 'Tohu whakatūpato',
-    'tips': [
-      'Patohia ā-ringa te URL o te kaikawe.',
-      'Arotakengia te ingoa rohe katoa.',
-      'Kaua e utu “utu tuku anō” mā ngā hononga hē.',
-      'Ehara te HTTPS anake i te tohu pono.'
-    ],
-    'disclaimerTitle': 'Whakakāhoretanga',
-    'disclaimer': 'Hei whakamōhio noa ngā tauira, ā, e hāngai ana ki ngā tauira phishing noa.',
-    'lastUpdated': 'Whakahōu whakamutunga: Māehe 2026'
-  },
-  'zh-hant': {
-    'title': '警惕詐騙：假冒網站與包裹追蹤欺詐',
-    'intro': '詐騙者會建立看似官方的假網站。輸入個人資料前，請先核對網域。',
-    'sectionOur': '1）Rhythm Nexus 官方網站',
-    'sectionHow': '2）包裹追蹤詐騙如何運作',
-    'sectionSingpost': '3）SingPost 詐騙對比',
-    'sectionUsps': '4）USPS 詐騙對比',
-    'sectionDhl': '5）DHL 詐騙對比',
-    'sectionOthers': '6）其他承運商與目的地',
-    'sectionTips': '7）安全檢查清單',
-    'officialOnly': '我們唯一官方網站是 rhythmnexus.org（沒有 .com/.net/.shop 或其他變體）。',
-    'checkTypos': '留意拼寫陷阱：RhythmN3xus.org、rhythmnexus.com、rhythm-nexus.org 等。',
-    'howText': '釣魚訊息常聲稱投遞失敗，並要求小額付款。請勿點擊陌生連結。',
-    'officialLabel': '官方網站',
-    'fakeLabel': '常見假網域',
-    'patternLabel': '偽裝方式',
-    'warningLabel': '警示訊號',
-    'tips': [
-      '不要點擊簡訊連結，請直接輸入承運商網址。',
-      '仔細核對完整網域。',
-      '不要透過不明連結支付「再次投遞費」。',
-      '只有 HTTPS 不代表網站真實，網域才是關鍵。'
-    ],
-    'disclaimerTitle': '免責聲明',
-    'disclaimer': '本頁示例僅作安全提醒，基於常見釣魚模式。',
-    'lastUpdated': '最後更新：2026年3月'
-  },
-  'vi': {
-    'title': 'Cảnh giác lừa đảo: trang web giả mạo và gian lận theo dõi bưu kiện',
-    'intro': 'Kẻ lừa đảo tạo các trang web giả trông như chính thức. Luôn kiểm tra tên miền trước khi nhập thông tin.',
-    'sectionOur': '1) Trang web chính thức của Rhythm Nexus',
-    'sectionHow': '2) Cách lừa đảo theo dõi bưu kiện hoạt động',
-    'sectionSingpost': '3) So sánh lừa đảo SingPost',
-    'sectionUsps': '4) So sánh lừa đảo USPS',
-    'sectionDhl': '5) So sánh lừa đảo DHL',
-    'sectionOthers': '6) Hãng vận chuyển và điểm đến khác',
-    'sectionTips': '7) Danh sách kiểm tra an toàn',
-    'officialOnly': 'Trang chính thức duy nhất của chúng tôi là rhythmnexus.org (không có .com/.net/.shop hay biến thể).',
-    'checkTypos': 'Cảnh giác lỗi chính tả: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org, v.v.',
-    'howText': 'Tin nhắn phishing thường báo giao hàng thất bại và yêu cầu trả phí nhỏ. Không nhấp vào liên kết lạ.',
-    'officialLabel': 'Trang web chính thức',
-    'fakeLabel': 'Tên miền giả phổ biến',
-    'patternLabel': 'Mẫu',
-    'warningLabel': 'Dấu hiệu cảnh báo',
-    'tips': [
-      'Tự nhập URL hãng vận chuyển.',
-      'Kiểm tra kỹ toàn bộ tên miền.',
-      'Không trả “phí giao lại” qua liên kết không tin cậy.',
-      'HTTPS không đủ để chứng minh hợp lệ; tên miền mới là quan trọng.'
-    ],
-    'disclaimerTitle': 'Tuyên bố miễn trừ',
-    'disclaimer': 'Các ví dụ nhằm mục đích nâng cao nhận thức và dựa trên mẫu phishing phổ biến.',
-    'lastUpdated': 'Cập nhật lần cuối: tháng 3 năm 2026'
-  },
-  'cy': {
-    'title': 'Byddwch yn wyliadwrus: gwefannau ffug a thwyll olrhain pecynnau',
-    'intro': 'Mae twyllwyr yn creu gwefannau ffug sy’n edrych yn swyddogol. Gwiriwch y parth bob amser cyn rhoi manylion.',
-    'sectionOur': '1) Gwefan swyddogol Rhythm Nexus',
-    'sectionHow': '2) Sut mae twyll olrhain pecynnau yn gweithio',
-    'sectionSingpost': '3) Cymhariaeth twyll SingPost',
-    'sectionUsps': '4) Cymhariaeth twyll USPS',
-    'sectionDhl': '5) Cymhariaeth twyll DHL',
-    'sectionOthers': '6) Cludwyr a chyrchfannau eraill',
-    'sectionTips': '7) Rhestr wirio diogelwch',
-    'officialOnly': 'Ein hunig wefan swyddogol yw rhythmnexus.org (dim .com/.net/.shop na fersiynau eraill).',
-    'checkTypos': 'Gwyliwch am gam-sillafu: RhythmN3xus.org, rhythmnexus.com, rhythm-nexus.org ac ati.',
-    'howText': 'Mae negeseuon phishing yn aml yn honni methiant dosbarthu ac yn gofyn am daliad bach. Peidiwch â chlicio dolenni anhysbys.',
-    'officialLabel': 'Gwefannau swyddogol',
-    'fakeLabel': 'Parthau ffug cyffredin',
-    'patternLabel': 'Patrwm',
-    'warningLabel': 'Arwyddion rhybudd',
-    'tips': [
-      'Teipiwch URL y cludwr yn uniongyrchol.',
-      'Gwiriwch y parth llawn yn ofalus.',
-      'Peidiwch â thalu “ffioedd ail-ddosbarthu” trwy ddolenni annibynadwy.',
-      'Nid yw HTTPS ar ei ben ei hun yn profi dilysrwydd.'
-    ],
-    'disclaimerTitle': 'Ymwadiad',
-    'disclaimer': 'Mae’r enghreifftiau at ddiben ymwybyddiaeth ac yn seiliedig ar batrymau phishing cyffredin.',
-    'lastUpdated': 'Diweddarwyd ddiwethaf: Mawrth 2026'
-  }
+from i18n_build.artifacts import (
+    OUTPUT_FORMATS,
+    ArtifactWriter,
+    BuildCache,
+    atomic_write,
+    content_hash,
+    dump_compact,
+    format_size_report,
+    intern_tables,
+)
+from i18n_build.catalogs import Catalog, render_aggregate_module, render_locale_index, render_locale_module
+from i18n_build.domains import compile_domain_artifacts, known_carrier_domains, official_domains
+from i18n_build.glyphs import (
+    SHARED_SUBSET,
+    code_points,
+    font_coverage,
+    font_subset,
+    in_latin_font,
+    manifest_catalog_points,
+    render_subset_css,
+    shared_code_points,
+    subset_font,
+    subset_manifest,
+    unicode_range,
+)
+from i18n_build.instrument import BuildMetrics
+from i18n_build.keywords import KeywordAutomaton
+from i18n_build.messageformat import message_keys, render_message_module
+from i18n_build.negotiate import negotiation_tables, render_negotiation_module
+from i18n_build.pack import PACK_VERSION, render_pack
+from i18n_build.parallel import Fanout
+from i18n_build.patches import (
+    apply_patch,
+    history_entry,
+    published_tables,
+    read_history,
+    render_history,
+    table_patch,
+)
+from i18n_build.prerender import render_html_lang, render_prerender_index
+from i18n_build.sources import ROOT_LOCALE, dependents, fallback_order, resolve_fallbacks, variant_overlay
+from i18n_build.translate import BACKENDS, TranslationMemory, load_backend, print_translation_summary, translate_missing
+from i18n_build.typosquat import TyposquatIndex
+from i18n_build.validate import print_validation_summary, validate_locales
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+LOCALES_ROOT = SCRIPTS_DIR / 'locales'
+DATA_DIR = SCRIPTS_DIR / 'data'
+MANIFEST_NAME = 'manifest.json'
+# Carrier official/fake domain datasets. They are compiled into a domain index
+# (lowercased domain -> carrier, kind, pattern) shared by the page and the
+# suspicious-domain lookup in src/lib/scam-domains.js.
+DOMAINS_SOURCE = DATA_DIR / 'parcel-scams-domains.json'
+# Language-tag aliases (iw, fil, zh-TW, ...) compiled into per-catalog locale
+# negotiation tables consumed through src/lib/negotiateLocale.js.
+LOCALE_ALIASES = DATA_DIR / 'locale-aliases.json'
+# Path of the client-rendered page; the prerendered locales live under <route>/<lang>.
+PARCEL_SCAMS_ROUTE = '/blog/parcel-scams'
+# Public URL of the subset fonts cut with --font-source (under public/).
+FONT_SUBSET_URL = '/fonts/subsets'
+# Spam and phishing phrases per category and locale, compiled into the keyword
+# automaton used by detectSpam() in src/lib/spam-detection.js.
+SPAM_KEYWORDS_SOURCE = DATA_DIR / 'spam-keywords.json'
+# Published shard versions per locale (--publish) that get a delta patch to the current one.
+PATCH_DEPTH = 3
+# Public URL of those patches (under public/); the page fetches them for a shard
+# it has cached under an older hash (see src/app/blog/parcel-scams/shardCache.js).
+SHARD_PATCH_URL = '/i18n/parcel-scams/patches'
+# Poll interval of --watch; stat()-ing every source file takes well under a millisecond.
+WATCH_INTERVAL = 0.1
+# Machine translations from --translate, keyed by backend, locale and source-text hash.
+TRANSLATION_MEMORY_PATH = DATA_DIR / 'translation-memory.json'
+
+CATALOGS = {
+    # Blog page strings. Missing keys are resolved at build time through the
+    # fallback graph; yue is a variant authored as overrides of zh-hant.
+    'parcel-scams': Catalog(
+        'parcel-scams',
+        LOCALES_ROOT / 'parcel-scams',
+        parents={'zh-hant': 'zh'},
+        variants={'yue': 'zh-hant'},
+    ),
+    # Main UI table used through LanguageContext's t()/tStrict().
+    'ui': Catalog(
+        'ui',
+        LOCALES_ROOT / 'ui',
+        fallback='runtime',
+        module_dir=Path('i18n/ui'),
+        aggregate_path=Path('translations.js'),
+        aggregate_export='translations',
+        aggregate_header='// Language translations for Rhythm Nexus - Complete with all languages',
+        extras_path=DATA_DIR / 'ui-language-meta.json',
+    ),
+    # Rate-table labels and notes behind rt() in src/lib/ratesI18n.js.
+    'rates': Catalog(
+        'rates',
+        LOCALES_ROOT / 'rates',
+        fallback='runtime',
+        module_dir=Path('i18n/rates'),
+    ),
+    # Terms/privacy texts behind policyText() in src/lib/policyI18n.js.
+    'policy': Catalog(
+        'policy',
+        LOCALES_ROOT / 'policy',
+        fallback='runtime',
+        module_dir=Path('i18n/policy'),
+    ),
+    # Contact-form rejection and warning messages of src/lib/spam-detection.js.
+    'spam': Catalog(
+        'spam',
+        LOCALES_ROOT / 'spam',
+        fallback='runtime',
+        module_dir=Path('i18n/spam'),
+    ),
 }
+JSON_CATALOG = 'parcel-scams'
+
+
+class OutputLayout:
+    """Artifact paths under an app root (the directory that holds ``src/``)."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.src = self.root / 'src'
+        page_dir = self.src / 'app' / 'blog' / 'parcel-scams'
+        self.bundle = page_dir / 'i18n.generated.json'
+        # Sharded output: one compact JSON file per locale plus a manifest, so the page
+        # can lazy-load only the active language instead of bundling all of them.
+        self.shard_dir = page_dir / 'i18n'
+        # Published shard versions as reverse deltas from the current shards, which the delta
+        # patches are computed from (see i18n_build/patches.py). Kept in version control.
+        self.shard_history = page_dir / 'i18n-history.json'
+        self.patch_dir = self.root / 'public' / SHARD_PATCH_URL.strip('/')
+        # Inputs of the statically generated /blog/parcel-scams/<lang> pages.
+        self.prerender_dir = page_dir / 'prerender'
+        # ICU-style strings compiled to per-locale formatter functions (see i18n_build/messageformat.py).
+        self.messages_dir = page_dir / 'messages'
+        # Build cache: content hash of every artifact from the previous run. Artifacts whose
+        # hash is unchanged are not rewritten, so their mtime (and the Next.js cache) survive.
+        self.cache = page_dir / '.i18n-build-cache.json'
+        self.domains = self.src / 'lib' / 'scam-domains.generated.json'
+        # Look-alike candidates derived from every official domain (see i18n_build/typosquat.py).
+        self.typosquat = self.src / 'lib' / 'typosquat-index.generated.json'
+        self.negotiation = self.src / 'lib' / 'localeNegotiation.generated.js'
+        self.spam_keywords = self.src / 'lib' / 'spam-keywords.generated.json'
+        # Per-locale code-point sets and unicode-range subsets (see i18n_build/glyphs.py).
+        self.font_manifest = self.src / 'lib' / 'font-subsets.generated.json'
+        self.font_css = self.src / 'app' / 'font-subsets.generated.css'
+        self.font_dir = self.root / 'public' / FONT_SUBSET_URL.strip('/')
+        # Every catalog in one indexed binary file for server-side reads (see i18n_build/pack.py).
+        self.pack = self.src / 'i18n' / 'catalogs.pack'
+
+    def module_dir(self, catalog):
+        return self.src / catalog.module_dir
+
+    def aggregate_path(self, catalog):
+        return self.src / catalog.aggregate_path
+
+
+def print_fallback_report(inherited, locales, parents, label='Fallback'):
+    filled = {lang: inherited[lang] for lang in locales if inherited[lang]}
+    if not filled:
+        print(f'{label}: every locale is complete.')
+        return
+    details = ', '.join(
+        f'{lang} +{count} from {parents.get(lang, ROOT_LOCALE)}' for lang, count in sorted(filled.items())
+    )
+    print(f'{label}: {details}.')
+
+
+def load_domain_data():
+    return json.loads(DOMAINS_SOURCE.read_text(encoding='utf-8'))
+
+
+def write_domains(compiled, writer, layout):
+    dataset, typosquat, stats = compiled
+    if writer.write('domains', layout.domains, content_hash(dataset), lambda: dataset):
+        print(f'{writer.verb} {layout.domains} ({len(dataset)} bytes).')
+    if writer.write('typosquat', layout.typosquat, content_hash(typosquat), lambda: typosquat):
+        print(f'{writer.verb} {layout.typosquat} ({len(typosquat)} bytes).')
+    print(f'Typosquat: {stats["candidates"]} candidates for {stats["officials"]} official domains; '
+          f'{stats["caught"]}/{stats["curated"]} curated fake domains detected.')
+
+
+def write_negotiation(writer, layout):
+    """Locale negotiation tables of every catalog (only needs the locale lists)."""
+    data = json.loads(LOCALE_ALIASES.read_text(encoding='utf-8'))
+    catalog_locales = {name: list(catalog.sources()) for name, catalog in CATALOGS.items()}
+    tables = negotiation_tables(catalog_locales, data['aliases'], data['fallbacks'])
+    source = f'{LOCALE_ALIASES.relative_to(REPO_ROOT).as_posix()} and the catalog locales'
+    payload = render_negotiation_module(tables, source)
+    if writer.write('negotiation', layout.negotiation, content_hash(payload), lambda: payload):
+        print(f'{writer.verb} {layout.negotiation} ({sum(map(len, tables.values()))} tags).')
+
+
+def write_spam_keywords(scam_sources, writer, layout):
+    """Keyword automaton of the spam keyword data plus the phrases each parcel-scams locale quotes."""
+    data = json.loads(SPAM_KEYWORDS_SOURCE.read_text(encoding='utf-8'))
+    automaton = KeywordAutomaton.from_data(data, {lang: scam_sources[lang] for lang in scam_sources})
+    payload = dump_compact(automaton.to_artifact())
+    if writer.write('spam-keywords', layout.spam_keywords, content_hash(payload), lambda: payload):
+        print(f'{writer.verb} {layout.spam_keywords} ({len(payload)} bytes).')
+    print(f'Spam keywords: {len(automaton.keywords)} keywords in {len(automaton.categories)} categories, '
+          f'{len(automaton.next)} automaton states.')
+
+
+def catalog_sources(plans):
+    """Sources of every catalog, reusing the (already loaded) ones in ``plans``."""
+    planned = {catalog.name: sources for catalog, sources, *_ in plans}
+    return {name: planned.get(name) or catalog.sources() for name, catalog in CATALOGS.items()}
+
+
+def read_font_manifest(path):
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_font_subsets(all_sources, writer, layout, font_source=None):
+    """Code-point manifest of every locale, plus subset fonts when ``font_source`` is set.
+
+    Only the locale files whose source digest differs from the one recorded in
+    the previous manifest are parsed; the other code points are reused from it.
+    """
+    previous = manifest_catalog_points(read_font_manifest(layout.font_manifest))
+    catalog_points = {}
+    scanned = 0
+    for name, sources in all_sources.items():
+        for lang in sources:
+            digest = sources.digest([lang])
+            recorded = previous.get(lang, {}).get(name)
+            if recorded is None or recorded[0] != digest:
+                recorded = (digest, code_points([sources[lang]]))
+                scanned += 1
+            catalog_points.setdefault(lang, {})[name] = recorded
+    points = {lang: set().union(*(used for _, used in by_catalog.values()))
+              for lang, by_catalog in catalog_points.items()}
+    picker = code_points([CATALOGS['ui'].extras().get('languageMap', {})])
+    shared = shared_code_points(points, picker)
+    shared_set = set(shared)
+
+    written = 0
+    font_files = {}
+    if font_source is not None:
+        font_digest = content_hash(font_source.read_bytes())
+        coverage = font_coverage(font_source)
+        subsets = {SHARED_SUBSET: shared}
+        subsets.update((lang, sorted(used - shared_set)) for lang, used in points.items())
+        for lang, used in subsets.items():
+            # Only glyphs the font has: the browser then never fetches a subset
+            # for characters it cannot render anyway.
+            covered = [point for point in used if not in_latin_font(point) and point in coverage]
+            if not covered:
+                continue
+            name = f'{lang}.woff2'
+            digest = content_hash(f'{font_digest}|{unicode_range(covered)}'.encode('utf-8'))
+            written += writer.write(f'font:{lang}', layout.font_dir / name, digest,
+                                    lambda: subset_font(font_source, covered))
+            font_files[lang] = (f'{FONT_SUBSET_URL}/{name}', covered)
+    if layout.font_dir.exists():
+        for stale in layout.font_dir.glob('*.woff2'):
+            if stale.stem not in font_files:
+                written += writer.remove(stale)
+
+    manifest = subset_manifest(catalog_points, shared, font_files)
+    payload = (json.dumps(manifest, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+    written += writer.write('font-manifest', layout.font_manifest, content_hash(payload), lambda: payload)
+    css = render_subset_css(manifest, 'scripts/locales/<catalog>/<lang>.json')
+    written += writer.write('font-css', layout.font_css, content_hash(css), lambda: css)
+    largest = max(manifest['locales'].items(), key=lambda item: item[1]['subsetCodePoints'])
+    needing = sum(1 for entry in manifest['locales'].values() if entry['subsetCodePoints'])
+    print(f'Font subsets: {written} file(s) written or removed, {scanned} locale file(s) scanned; '
+          f'{len(shared)} shared code points; {needing}/{len(points)} locales need their own non-Latin '
+          f'glyphs (largest {largest[0]}: {largest[1]["subsetCodePoints"]} code points), '
+          f'{len(font_files)} subset font(s).')
+
+
+def write_pack(all_sources, writer, layout):
+    """Binary pack of every catalog: resolved tables, or the authored ones for runtime fallback.
+
+    The pack is keyed on the source files, so the catalogs are only loaded and
+    packed again when one of them changed.
+    """
+    digest = content_hash('|'.join(
+        [f'pack{PACK_VERSION}'] + [f'{name}:{CATALOGS[name].fallback}:{json.dumps(CATALOGS[name].parents)}:'
+                                   f'{sources.digest()}' for name, sources in all_sources.items()]
+    ).encode('utf-8'))
+    stats = {}
+
+    def render():
+        catalog_tables = {}
+        for name, sources in all_sources.items():
+            if CATALOGS[name].fallback == 'build':
+                catalog_tables[name] = resolve_fallbacks(sources, CATALOGS[name].parents)[0]
+            else:
+                catalog_tables[name] = {lang: sources[lang] for lang in sources}
+        payload = render_pack(catalog_tables)
+        stats['entries'] = sum(len(table) for tables in catalog_tables.values() for table in tables.values())
+        stats['bytes'] = len(payload)
+        return payload
+
+    if writer.write('pack', layout.pack, digest, render):
+        print(f'{writer.verb} {layout.pack} ({stats["bytes"]} bytes).')
+    if stats:
+        print(f'Pack: {stats["entries"]} strings from {len(all_sources)} catalogs in {stats["bytes"]} bytes.')
+    else:
+        print(f'Unchanged {layout.pack} (catalog sources unchanged).')
+
+
+def serialize_locales(i18n, map_units=map):
+    langs = sorted(i18n)
+    payloads = map_units(dump_compact, [i18n[lang] for lang in langs])
+    return {lang: (payload, content_hash(payload)) for lang, payload in zip(langs, payloads)}
+
+
+def render_bundle(i18n, fmt):
+    if fmt == 'interned':
+        return dump_compact(intern_tables(i18n))
+    return json.dumps(i18n, ensure_ascii=False, **OUTPUT_FORMATS[fmt]).encode('utf-8')
+
+
+def write_bundle(i18n, payloads, writer, layout, fmt):
+    locale_digests = ''.join(f'{lang}:{payloads[lang][1]};' for lang in i18n)
+    digest = content_hash(f'{fmt}|{locale_digests}'.encode('utf-8'))
+
+    path = layout.bundle
+    if writer.write('bundle', path, digest, lambda: render_bundle(i18n, fmt)):
+        print(f'{writer.verb} {path} with {len(i18n)} language entries ({fmt}).')
+    else:
+        print(f'Unchanged {path} ({len(i18n)} language entries).')
+    before = len(render_bundle(i18n, 'pretty'))
+    print(format_size_report('Bundle size', before, writer.size(path)))
+
+
+def read_manifest(shard_dir):
+    try:
+        return json.loads((shard_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {'default': ROOT_LOCALE, 'locales': {}}
+
+
+def write_patches(shards, writer, layout, known_locales, depth, publish=False):
+    """Patch the published versions of the shards to the current ones.
+
+    With ``publish`` the current shards are recorded as published first,
+    keeping the newest ``depth`` versions per locale. Must run before the
+    shards are rewritten: the history is anchored on the shards on disk.
+    Returns ``{lang: {old hash: patch URL}}`` for the manifest. Patches that
+    would not be smaller than the shard itself are not written. Locales with
+    no published version are left out of the history.
+    """
+    history = {lang: entry for lang, entry in read_history(layout.shard_history).items() if lang in known_locales}
+    patch_dir = layout.patch_dir
+    written = 0
+    files = {}
+    for lang, (payload, digest, _, table) in shards.items():
+        published = []
+        entry = history.get(lang)
+        if entry is not None:
+            anchor = table if entry['current'] == digest else read_shard(layout.shard_dir, lang, entry['current'])
+            if anchor is None:
+                print(f'Patches: {lang}.json no longer matches its history; dropping {len(entry["versions"])} '
+                      f'published version(s).')
+            else:
+                published = published_tables(entry, anchor)
+        if publish:
+            published = [(digest, table), *(version for version in published if version[0] != digest)]
+        published = published[:depth]
+        if not published:
+            history.pop(lang, None)
+            continue
+        history[lang] = history_entry(digest, table, published)
+        for version_hash, version_table in published:
+            if version_hash == digest:
+                continue
+            delta = table_patch(version_table, table)
+            if apply_patch(version_table, delta) != table:
+                raise ValueError(f'patch {lang}.{version_hash} does not reproduce the {lang} shard')
+            patch = dump_compact({'from': version_hash, 'to': digest, **delta})
+            if len(patch) >= len(payload):
+                continue
+            name = f'{lang}.{version_hash}.json'
+            written += writer.write(f'patch:{name}', patch_dir / name, content_hash(patch), lambda: patch)
+            files.setdefault(lang, {})[version_hash] = f'{SHARD_PATCH_URL}/{name}'
+    history = {lang: history[lang] for lang in known_locales if lang in history}
+    payload = render_history(history)
+    written += writer.write('shard-history', layout.shard_history, content_hash(payload), lambda: payload)
+    return files, written
+
+
+def read_shard(shard_dir, lang, digest):
+    """Table of the shard of ``lang`` on disk if its content hash is ``digest``, else None."""
+    try:
+        payload = (shard_dir / f'{lang}.json').read_bytes()
+    except OSError:
+        return None
+    return json.loads(payload) if content_hash(payload) == digest else None
+
+
+def write_shards(resolved, payloads, writer, layout, variants, known_locales, metrics, fanout,
+                 patch_depth=PATCH_DEPTH, publish=False):
+    """Write a shard for every locale in ``payloads`` plus the manifest.
+
+    Locales in ``variants`` (variant -> base) are written as sparse overlays and
+    their manifest entry names the base shard to merge them over. When only a
+    subset of ``known_locales`` is being built, the manifest keeps the existing
+    entries of the others. Each entry lists the delta patches from up to
+    ``patch_depth`` published versions of the shard, keyed by their hash;
+    ``publish`` records the shards written now as published.
+    """
+    shard_dir = layout.shard_dir
+    partial = len(payloads) < len(known_locales)
+    previous = read_manifest(shard_dir)['locales'] if partial else {}
+    manifest = {'default': ROOT_LOCALE, 'locales': {}}
+    shards = {}
+    for lang in known_locales:
+        if lang not in payloads:
+            continue
+        payload, digest = payloads[lang]
+        base = variants.get(lang)
+        table = resolved[lang]
+        if base:
+            table = variant_overlay(resolved, lang, base)
+            payload = dump_compact(table)
+            digest = content_hash(payload)
+        metrics.locale(JSON_CATALOG, 'shard', lang, len(table), len(payload))
+        shards[lang] = (payload, digest, base, table)
+
+    patches, written = write_patches(shards, writer, layout, known_locales, patch_depth, publish)
+    for lang in known_locales:
+        if lang not in shards:
+            if lang in previous:
+                manifest['locales'][lang] = previous[lang]
+            continue
+        payload, digest, base, _ = shards[lang]
+        file_name = f'{lang}.json'
+        written += writer.write(f'shard:{lang}', shard_dir / file_name, digest, lambda: payload)
+        manifest['locales'][lang] = {
+            'file': file_name,
+            'hash': digest,
+            'bytes': len(payload),
+        }
+        if base:
+            manifest['locales'][lang]['base'] = base
+        if lang in patches:
+            manifest['locales'][lang]['patches'] = patches[lang]
+
+    # Drop shards for locales that no longer exist so the page cannot load stale data.
+    if shard_dir.exists():
+        for stale in shard_dir.glob('*.json'):
+            if stale.name != MANIFEST_NAME and stale.name.split('.json')[0] not in known_locales:
+                written += writer.remove(stale)
+    # Patches from versions that dropped out of the history are no longer advertised.
+    listed = {url for entry in manifest['locales'].values() for url in entry.get('patches', {}).values()}
+    if layout.patch_dir.exists():
+        for stale in layout.patch_dir.glob('*.json'):
+            if f'{SHARD_PATCH_URL}/{stale.name}' not in listed:
+                written += writer.remove(stale)
+
+    manifest_payload = (json.dumps(manifest, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+    manifest_path = shard_dir / MANIFEST_NAME
+    written += writer.write('manifest', manifest_path, content_hash(manifest_payload), lambda: manifest_payload)
+
+    print(f'Shards: {written} file(s) written or removed, {len(payloads)} locales in {shard_dir}.')
+    before = sum(len(json.dumps(resolved[lang], ensure_ascii=False, indent=2).encode('utf-8')) for lang in payloads)
+    after = sum(manifest['locales'][lang]['bytes'] for lang in payloads)
+    print(format_size_report('Shard sizes', before, after))
+
+
+def write_prerender(writer, layout, variants, known_locales):
+    """Route index of the prerendered pages (loading the shards) and their ``<html lang>`` map."""
+    prerender_dir = layout.prerender_dir
+    written = 0
+    # The pages read the shards: no per-locale payload belongs here.
+    if prerender_dir.exists():
+        for stale in prerender_dir.glob('*.json'):
+            written += writer.remove(stale)
+    hreflang = json.loads(LOCALE_ALIASES.read_text(encoding='utf-8')).get('hreflang', {})
+    source = CATALOGS[JSON_CATALOG].source_label(REPO_ROOT)
+    index = render_prerender_index(known_locales, variants, PARCEL_SCAMS_ROUTE, hreflang, ROOT_LOCALE, source)
+    written += writer.write('prerender:index', prerender_dir / 'index.js', content_hash(index), lambda: index)
+    html_lang = render_html_lang(known_locales, hreflang, source)
+    written += writer.write('prerender:htmlLang', prerender_dir / 'htmlLang.js', content_hash(html_lang),
+                            lambda: html_lang)
+    print(f'Prerender: {written} file(s) written or removed, {len(known_locales)} locales in {prerender_dir}.')
+
+
+def write_messages(i18n, root_table, writer, layout, known_locales):
+    """Compiled message functions of every locale in ``i18n`` plus their loader index.
+
+    The messages are the keys whose ``root_table`` string has ICU-style arguments.
+    """
+    messages_dir = layout.messages_dir
+    source = CATALOGS[JSON_CATALOG].source_label(REPO_ROOT)
+    keys = message_keys(root_table)
+    written = 0
+    for lang, table in i18n.items():
+        payload = render_message_module(lang, table, keys, source)
+        written += writer.write(f'messages:{lang}', messages_dir / f'{lang}.js', content_hash(payload),
+                                lambda: payload)
+    if messages_dir.exists():
+        for stale in messages_dir.glob('*.js'):
+            if stale.name != 'index.js' and stale.stem not in known_locales:
+                written += writer.remove(stale)
+    index = render_locale_index(known_locales, {}, source)
+    written += writer.write('messages:index', messages_dir / 'index.js', content_hash(index), lambda: index)
+    print(f'Messages: {written} file(s) written or removed, {len(keys)} message(s) x {len(i18n)} locales '
+          f'in {messages_dir}.')
+
+
+def write_modules(catalog, tables, known_locales, writer, layout, metrics, fanout, aggregate=None):
+    """Write one ES module per locale in ``tables`` plus the loader index.
+
+    The aggregate module needs every locale: it is written from ``aggregate``
+    (all tables) when given, or from ``tables`` when they cover ``known_locales``.
+    """
+    label = f'[{catalog.name}]'
+    source = catalog.source_label(REPO_ROOT)
+    extras = catalog.extras()
+    module_dir = layout.module_dir(catalog)
+    written = 0
+    largest = 0
+    rendered = fanout.map(render_locale_module, tables.values(), [source] * len(tables))
+    for (lang, table), payload in zip(tables.items(), rendered):
+        metrics.locale(catalog.name, 'module', lang, len(table), len(payload))
+        largest = max(largest, len(payload))
+        path = module_dir / f'{lang}.js'
+        written += writer.write(f'{catalog.name}:module:{lang}', path, content_hash(payload), lambda: payload)
+
+    index = render_locale_index(known_locales, extras, source)
+    written += writer.write(f'{catalog.name}:index', module_dir / 'index.js', content_hash(index), lambda: index)
+
+    if len(tables) == len(known_locales):
+        aggregate = tables
+        for stale in module_dir.glob('*.js'):
+            if stale.name != 'index.js' and stale.stem not in known_locales:
+                written += writer.remove(stale)
+    if catalog.aggregate_path is not None:
+        if aggregate is None:
+            print(f'{label} Skipping {catalog.aggregate_path.name}: it needs every locale.')
+        else:
+            payload = render_aggregate_module(catalog.aggregate_export, aggregate, extras, source,
+                                              catalog.aggregate_header)
+            written += writer.write(f'{catalog.name}:aggregate', layout.aggregate_path(catalog),
+                                    content_hash(payload), lambda: payload)
+
+    print(f'{label} Modules: {written} file(s) written or removed, {len(tables)} locales in {module_dir} '
+          f'(largest {largest} bytes).')
+
+
+def build_json_catalog(catalog, sources, selected, writer, layout, args, metrics, fanout,
+                       refresh_aggregates=False):
+    """Bundle, shards and domain datasets of the parcel-scams blog page."""
+    partial = len(set(selected)) < len(sources)
+    # The domain datasets only need the root labels; compile them alongside the locales.
+    domains = None
+    if not partial or ROOT_LOCALE in selected:
+        domains = fanout.submit(compile_domain_artifacts, load_domain_data(), sources[ROOT_LOCALE])
+    with metrics.stage(catalog.name, 'fallback'):
+        resolved, inherited = resolve_fallbacks(sources, catalog.parents, selected)
+    print_fallback_report(inherited, selected, catalog.parents, f'[{catalog.name}] Fallback')
+    i18n = {lang: resolved[lang] for lang in sources if lang in selected}
+    with metrics.stage(catalog.name, 'serialize'):
+        payloads = serialize_locales(i18n, fanout.map)
+    if args.mode in ('bundle', 'both'):
+        if not partial:
+            with metrics.stage(catalog.name, 'bundle'):
+                write_bundle(i18n, payloads, writer, layout, args.format)
+        elif refresh_aggregates:
+            with metrics.stage(catalog.name, 'bundle'):
+                everything, _ = resolve_fallbacks(sources, catalog.parents)
+                write_bundle(everything, serialize_locales(everything, fanout.map), writer, layout, args.format)
+        else:
+            print(f'Skipping {layout.bundle.name}: it needs every locale (drop --locales to rebuild it).')
+    if args.mode in ('sharded', 'both'):
+        variants = catalog.variants if args.variants == 'overlay' else {}
+        with metrics.stage(catalog.name, 'shards'):
+            write_shards(resolved, payloads, writer, layout, variants, list(sources), metrics, fanout,
+                         args.patch_depth, args.publish)
+        with metrics.stage(catalog.name, 'prerender'):
+            write_prerender(writer, layout, variants, list(sources))
+    else:
+        print(f'Skipping {layout.prerender_dir.name}: the prerendered pages read the shards (--mode sharded or both).')
+    with metrics.stage(catalog.name, 'messages'):
+        write_messages(i18n, sources[ROOT_LOCALE], writer, layout, list(sources))
+    if domains is not None:
+        with metrics.stage(catalog.name, 'domains'):
+            write_domains(domains.result(), writer, layout)
+
+
+def write_catalog(catalog, sources, selected, writer, layout, args, metrics, fanout,
+                  refresh_aggregates=False):
+    """Write the artifacts of ``selected`` locales of one catalog.
+
+    Whole-catalog artifacts (bundle, aggregate module) are skipped on partial
+    builds unless ``refresh_aggregates``, which rebuilds them from every table
+    in ``sources`` (used by --watch, where all sources are already loaded).
+    """
+    if catalog.name == JSON_CATALOG:
+        build_json_catalog(catalog, sources, selected, writer, layout, args, metrics, fanout,
+                           refresh_aggregates)
+        return
+    if catalog.fallback == 'build':
+        with metrics.stage(catalog.name, 'fallback'):
+            resolved, inherited = resolve_fallbacks(sources, catalog.parents, selected)
+        print_fallback_report(inherited, selected, catalog.parents, f'[{catalog.name}] Fallback')
+        tables = {lang: resolved[lang] for lang in selected}
+    else:
+        tables = {lang: sources[lang] for lang in sources if lang in selected}
+    aggregate = None
+    if refresh_aggregates and len(tables) < len(sources):
+        if catalog.fallback == 'build':
+            aggregate, _ = resolve_fallbacks(sources, catalog.parents)
+        else:
+            aggregate = {lang: sources[lang] for lang in sources}
+    with metrics.stage(catalog.name, 'modules'):
+        write_modules(catalog, tables, list(sources), writer, layout, metrics, fanout, aggregate)
+
+
+def watched_files(catalogs):
+    paths = {DOMAINS_SOURCE, LOCALE_ALIASES, SPAM_KEYWORDS_SOURCE}
+    for catalog in catalogs:
+        paths.update(catalog.locales_dir.glob('*.json'))
+        if catalog.extras_path is not None:
+            paths.add(catalog.extras_path)
+    return paths
+
+
+def snapshot(paths):
+    state = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def rebuild_changed(changed, plans, all_sources, writer, layout, args, metrics, fanout):
+    """Re-read the changed sources and rewrite only what depends on them."""
+    domains_done = False
+    catalogs_changed = False
+    for catalog, sources in plans:
+        langs = {path.stem for path in changed if path.parent == catalog.locales_dir}
+        extras_changed = catalog.extras_path in changed
+        if not langs and not extras_changed:
+            continue
+        if sources.reload(langs) or extras_changed:
+            selected = list(sources)
+        else:
+            selected = dependents(sources, catalog.parents, langs)
+        print(f'[{catalog.name}] Changed: {", ".join(sorted(langs)) or catalog.extras_path.name}; '
+              f'rebuilding {len(selected)} locale(s).')
+        report = validate_locales(sources, selected, catalog.parents, map_units=fanout.map)
+        print_validation_summary(report, f'[{catalog.name}] Validation')
+        if args.strict and not report['ok']:
+            print(f'[{catalog.name}] Validation failed (--strict); not written.')
+            continue
+        write_catalog(catalog, sources, selected, writer, layout, args, metrics, fanout,
+                      refresh_aggregates=True)
+        catalogs_changed = True
+        domains_done |= catalog.name == JSON_CATALOG and ROOT_LOCALE in selected
+
+    json_sources = dict(plans).get(CATALOGS[JSON_CATALOG])
+    if DOMAINS_SOURCE in changed and json_sources is not None and not domains_done:
+        compiled = compile_domain_artifacts(load_domain_data(), json_sources[ROOT_LOCALE])
+        write_domains(compiled, writer, layout)
+    if SPAM_KEYWORDS_SOURCE in changed or any(path.parent == CATALOGS[JSON_CATALOG].locales_dir for path in changed):
+        write_spam_keywords(all_sources[JSON_CATALOG], writer, layout)
+    write_negotiation(writer, layout)
+    if catalogs_changed:
+        write_font_subsets(all_sources, writer, layout, args.font_source)
+        write_pack(all_sources, writer, layout)
+
+
+def watch(plans, cache, layout, args, metrics, fanout):
+    """Poll the sources of ``plans`` and rebuild incrementally until interrupted."""
+    all_sources = catalog_sources(plans)
+    plans = [(catalog, sources) for catalog, sources, _ in plans]
+    catalogs = [catalog for catalog, _ in plans]
+    state = snapshot(watched_files(catalogs))
+    print(f'Watching {len(state)} source file(s) for changes (Ctrl+C to stop).')
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            current = snapshot(watched_files(catalogs))
+            changed = {path for path in state.keys() | current.keys() if state.get(path) != current.get(path)}
+            if not changed:
+                continue
+            started = time.perf_counter()
+            writer = ArtifactWriter(cache, dry_run=args.dry_run or args.diff, diff=args.diff)
+            try:
+                rebuild_changed(changed, plans, all_sources, writer, layout, args, metrics, fanout)
+            except (ValueError, OSError) as exc:
+                # Typically a file caught mid-save; the next save triggers another rebuild.
+                print(f'Rebuild failed: {exc}')
+            state = current
+            writer.save()
+            print(f'Rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms; '
+                  f'{len(writer.changed)} file(s) updated.')
+    except KeyboardInterrupt:
+        print('Stopped watching.')
+
+
+def build(parser, args, metrics, fanout, machine_out=None):
+    """Validate every selected catalog, then write their artifacts."""
+    names = list(CATALOGS) if args.catalogs is None else args.catalogs
+    unknown = [name for name in names if name not in CATALOGS]
+    if unknown:
+        parser.error(f'unknown catalog(s): {", ".join(unknown)} (choose from {", ".join(CATALOGS)})')
+
+    if args.patch_depth < 0:
+        parser.error('--patch-depth must be 0 or more')
+    if args.publish and args.watch:
+        parser.error('--publish cannot be combined with --watch')
+
+    if args.font_source is not None:
+        if font_subset is None:
+            parser.error('--font-source needs fontTools and brotli (pip install fonttools brotli)')
+        if not args.font_source.is_file():
+            parser.error(f'--font-source: {args.font_source} is not a file')
+
+    backend = None
+    if args.translate and args.watch:
+        parser.error('--watch cannot be combined with --translate')
+    if args.translate:
+        try:
+            backend = load_backend(args.translate)
+        except (ValueError, ImportError, AttributeError) as exc:
+            parser.error(f'--translate: {exc}')
+        memory = TranslationMemory(args.translation_memory)
+
+    # Load and validate every selected catalog before anything is written, so
+    # --strict can stop the build as a whole.
+    plans = []
+    reports = {}
+    requested = set()
+    for name in dict.fromkeys(names):
+        catalog = CATALOGS[name]
+        sources = catalog.sources()
+        selected = list(sources) if args.locales is None else [lang for lang in args.locales if lang in sources]
+        requested.update(selected)
+        if not selected:
+            continue
+        with metrics.stage(name, 'load'):
+            for lang in fallback_order(sources, catalog.parents, selected):
+                sources[lang]
+        if backend is not None:
+            with metrics.stage(name, 'translate'):
+                sources, stats = translate_missing(sources, selected, catalog.parents, backend, memory,
+                                                   concurrency=args.translate_concurrency, rate=args.translate_rate)
+            print_translation_summary(stats, f'[{name}] Translate')
+        with metrics.stage(name, 'validate'):
+            report = validate_locales(sources, selected, catalog.parents, map_units=fanout.map)
+        print_validation_summary(report, f'[{name}] Validation')
+        reports[name] = report
+        plans.append((catalog, sources, selected))
+    if backend is not None and not (args.dry_run or args.diff):
+        memory.save()
+    unknown = [lang for lang in args.locales or () if lang not in requested]
+    if unknown:
+        parser.error(f'unknown locale(s): {", ".join(unknown)} (sources in {LOCALES_ROOT})')
+
+    ok = all(report['ok'] for report in reports.values())
+    if args.report:
+        report_json = json.dumps({'ok': ok, 'catalogs': reports}, ensure_ascii=False, indent=2) + '\n'
+        if args.report == '-':
+            (machine_out or sys.stdout).write(report_json)
+        else:
+            atomic_write(Path(args.report), report_json.encode('utf-8'))
+    if args.strict and not ok:
+        print('Validation failed (--strict); no files written.')
+        sys.exit(1)
+
+    layout = OutputLayout(args.out_dir)
+    cache = BuildCache(layout.cache)
+    if args.force:
+        cache.entries = {}
+    writer = ArtifactWriter(cache, dry_run=args.dry_run or args.diff, diff=args.diff)
+    for catalog, sources, selected in plans:
+        write_catalog(catalog, sources, selected, writer, layout, args, metrics, fanout)
+    all_sources = catalog_sources(plans)
+    write_spam_keywords(all_sources[JSON_CATALOG], writer, layout)
+    write_negotiation(writer, layout)
+    with metrics.stage('fonts', 'subsets'):
+        write_font_subsets(all_sources, writer, layout, args.font_source)
+    with metrics.stage('pack', 'write'):
+        write_pack(all_sources, writer, layout)
+    writer.save()
+    if writer.dry_run:
+        print(f'Dry run: {len(writer.changed)} file(s) would change.')
+        for path in writer.changed:
+            print(f'  {path}')
+    if args.watch:
+        watch(plans, cache, layout, args, metrics, fanout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile the translation catalogs in scripts/locales/.')
+    parser.add_argument(
+        '--out-dir',
+        metavar='DIR',
+        type=Path,
+        default=REPO_ROOT,
+        help='App root to write into; artifacts go under DIR/src/ (default: this repository).',
+    )
+    parser.add_argument(
+        '--catalogs',
+        type=lambda value: [name.strip() for name in value.split(',') if name.strip()],
+        help=f'Comma-separated catalogs to build (default: all of {", ".join(CATALOGS)}).',
+    )
+    parser.add_argument(
+        '--mode',
+        choices=('bundle', 'sharded', 'both'),
+        default='both',
+        help='parcel-scams output. bundle: single i18n.generated.json; sharded: per-locale files + manifest; '
+        'both (default).',
+    )
+    parser.add_argument(
+        '--format',
+        choices=sorted([*OUTPUT_FORMATS, 'interned']),
+        default='pretty',
+        help='Serialization of i18n.generated.json (shards are always minified). interned: shared string pool '
+        'plus per-locale index arrays, read with src/lib/internedI18n.js.',
+    )
+    parser.add_argument(
+        '--font-source',
+        metavar='FONT',
+        type=Path,
+        help='TTF/OTF covering the non-Latin scripts; cut one WOFF2 subset per locale from it into '
+        f'public{FONT_SUBSET_URL}/ (needs fontTools).',
+    )
+    parser.add_argument(
+        '--variants',
+        choices=('overlay', 'expand'),
+        default='overlay',
+        help='parcel-scams shards. overlay (default): variant shards hold only their overrides; expand: full tables.',
+    )
+    parser.add_argument(
+        '--patch-depth',
+        type=int,
+        default=PATCH_DEPTH,
+        metavar='N',
+        help=f'Write delta patches to each parcel-scams shard from its last N published versions into '
+             f'public{SHARD_PATCH_URL}/ (default: {PATCH_DEPTH}; 0 disables them).',
+    )
+    parser.add_argument(
+        '--publish',
+        action='store_true',
+        help='Record the parcel-scams shards of this build as a published version that later builds '
+             'write delta patches from (for release builds; not with --watch).',
+    )
+    parser.add_argument(
+        '--locales',
+        type=lambda value: [lang.strip() for lang in value.split(',') if lang.strip()],
+        help='Comma-separated locales to build (e.g. yue,ja) in every selected catalog that has them. '
+        'Only these and their fallback ancestors are parsed.',
+    )
+    parser.add_argument('--report', metavar='PATH', help="Write the validation report as JSON ('-' for stdout).")
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Fail (exit 1, nothing written) when validation finds errors or untranslated keys.',
+    )
+    parser.add_argument(
+        '--check-domain',
+        metavar='DOMAIN',
+        action='append',
+        help='Check a domain against the typo-squat index and exit (repeatable).',
+    )
+    parser.add_argument(
+        '--translate',
+        metavar='BACKEND',
+        help='Machine-translate keys that would fall back to en before validating: '
+        f'{", ".join(BACKENDS)} or package.module:Factory.',
+    )
+    parser.add_argument(
+        '--translation-memory',
+        metavar='PATH',
+        type=Path,
+        default=TRANSLATION_MEMORY_PATH,
+        help='Translation memory reused across runs (default: %(default)s).',
+    )
+    parser.add_argument('--translate-concurrency', type=int, default=4, help='Batches in flight at once (default: 4).')
+    parser.add_argument('--translate-rate', type=float, default=5.0,
+                        help='Maximum batch requests per second, 0 for no limit (default: 5).')
+    parser.add_argument(
+        '--metrics',
+        metavar='PATH',
+        help="Write per-stage time/peak memory and per-locale counts as JSON lines ('-' for stdout).",
+    )
+    parser.add_argument('--profile', metavar='PATH', help='Dump cProfile stats of the build to PATH.')
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for the per-locale validate/serialize units; 0 uses every core '
+        '(default: 1, in-process). Output is identical for any value.',
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='After the build, keep watching the sources and rebuild only the locales that change '
+        '(and the locales falling back to them).',
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Build everything but only list the files that would change.',
+    )
+    parser.add_argument(
+        '--diff',
+        action='store_true',
+        help='Like --dry-run, and print a unified diff per changed file.',
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Ignore the build cache and re-check every artifact on disk.',
+    )
+    args = parser.parse_args()
 
-# Fill missing languages from English where needed, then map yue -> zh-hant as requested set is 28 languages.
-base_keys = set(I18N['en'].keys())
-for lang, data in list(I18N.items()):
-    for key in base_keys:
-        if key not in data:
-            data[key] = I18N['en'][key]
+    if args.check_domain:
+        data = load_domain_data()
+        typosquat = TyposquatIndex(official_domains(data), known=known_carrier_domains(data))
+        for domain in args.check_domain:
+            print(json.dumps({'query': domain, 'match': typosquat.check(domain)}, ensure_ascii=False))
+        return
 
-I18N['yue'] = dict(I18N['zh-hant'])
-I18N['yue']['title'] = '警惕詐騙：假冒網站同包裹追蹤欺詐'
+    if args.metrics == '-' and args.report == '-':
+        parser.error("--metrics and --report cannot both write to stdout ('-')")
+    # JSON on stdout ('-') must stay parseable: the human summaries go to stderr then.
+    machine_out = sys.stdout
+    human_out = sys.stderr if '-' in (args.metrics, args.report) else sys.stdout
+    metrics = BuildMetrics(args.metrics)
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    with contextlib.redirect_stdout(human_out):
+        try:
+            with Fanout(args.jobs) as fanout:
+                build(parser, args, metrics, fanout, machine_out)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(args.profile)
+                print(f'Wrote cProfile stats to {args.profile} (inspect with python -m pstats).')
+            metrics.close()
 
-OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-with OUT_PATH.open('w', encoding='utf-8') as f:
-    json.dump(I18N, f, ensure_ascii=False, indent=2)
 
-print(f'Wrote {OUT_PATH} with {len(I18N)} language entries.')
+if __name__ == '__main__':
+    main()
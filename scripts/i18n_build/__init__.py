@@ -0,0 +1 @@
+"""Build pipeline modules for scripts/generate_parcel_scams_i18n.py."""
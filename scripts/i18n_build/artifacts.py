@@ -0,0 +1,195 @@
+"""Artifact serialization and incremental, atomic writes."""
+import difflib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+CACHE_VERSION = 2
+# Artifacts that --diff prints.
+TEXT_SUFFIXES = {'.json', '.js', '.css'}
+
+OUTPUT_FORMATS = {
+    'pretty': {'indent': 2},
+    'minified': {'separators': (',', ':')},
+}
+def dump_compact(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def intern_tables(tables):
+    """Encode ``lang -> table`` as one string pool plus per-locale index arrays.
+
+    ``keys`` is the union of all keys (first-seen order); each locale maps to a
+    list aligned with it holding a pool index, a list of indices for list
+    values, or ``None`` when the locale lacks the key. The pool is ordered by
+    use count so the most shared strings get the shortest indices. Decoded by
+    src/lib/internedI18n.js.
+    """
+    keys = list(dict.fromkeys(key for table in tables.values() for key in table))
+    counts = {}
+    for table in tables.values():
+        for value in table.values():
+            for text in value if isinstance(value, list) else [value]:
+                counts[text] = counts.get(text, 0) + 1
+    strings = sorted(counts, key=lambda text: -counts[text])
+    index = {text: i for i, text in enumerate(strings)}
+
+    def ref(value):
+        if isinstance(value, list):
+            return [index[text] for text in value]
+        return index[value]
+
+    locales = {lang: [ref(table[key]) if key in table else None for key in keys] for lang, table in tables.items()}
+    return {'format': 'interned', 'keys': keys, 'strings': strings, 'locales': locales}
+
+
+def content_hash(payload):
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def atomic_write(path, payload):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+class BuildCache:
+    """Digest each artifact was last written for, plus the hash of the bytes written.
+
+    An entry only counts as fresh while the file on disk still has those bytes,
+    so hand edits and checkouts of other versions are rewritten.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('version') == CACHE_VERSION:
+            self.entries = data.get('entries', {})
+
+    def is_fresh(self, key, digest, path):
+        entry = self.entries.get(key)
+        if not entry or entry[0] != digest:
+            return False
+        try:
+            return content_hash(path.read_bytes()) == entry[1]
+        except OSError:
+            return False
+
+    def record(self, key, digest, payload):
+        entry = [digest, content_hash(payload)]
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        payload = json.dumps({'version': CACHE_VERSION, 'entries': self.entries}, indent=2, sort_keys=True)
+        atomic_write(self.path, (payload + '\n').encode('utf-8'))
+        self.dirty = False
+
+
+class ArtifactWriter:
+    """Writes artifacts through the build cache.
+
+    With ``dry_run`` nothing is written or removed and the cache is not
+    updated; ``changed`` still lists every path that would change. ``diff``
+    prints a unified diff for each changed text artifact (JSON is compared
+    pretty-printed so minified files diff line by line).
+    """
+
+    def __init__(self, cache, dry_run=False, diff=False):
+        self.cache = cache
+        self.dry_run = dry_run
+        self.diff = diff
+        self.changed = []
+        self.sizes = {}
+
+    def write(self, key, path, digest, render):
+        """Write ``render()`` to ``path`` unless the cache says it is unchanged.
+
+        Returns the number of files written (0 or 1).
+        """
+        if self.cache.is_fresh(key, digest, path):
+            return 0
+        data = render()
+        self.sizes[path] = len(data)
+        written = 0
+        # A missing or stale cache (e.g. a fresh checkout) still avoids touching
+        # files whose bytes already match.
+        previous = path.read_bytes() if path.exists() else None
+        if previous != data:
+            if self.diff and path.suffix in TEXT_SUFFIXES:
+                print_diff(path, previous, data)
+            if not self.dry_run:
+                atomic_write(path, data)
+            self.changed.append(path)
+            written = 1
+        if not self.dry_run:
+            self.cache.record(key, digest, data)
+        return written
+
+    def remove(self, path, key=None):
+        if self.diff:
+            print(f'--- {path}\n+++ /dev/null')
+        if not self.dry_run:
+            path.unlink()
+            if key is not None and self.cache.entries.pop(key, None) is not None:
+                self.cache.dirty = True
+        self.changed.append(path)
+        return 1
+
+    @property
+    def verb(self):
+        return 'Would write' if self.dry_run else 'Wrote'
+
+    def size(self, path):
+        """Size of ``path`` as written (or as it would be, in a dry run)."""
+        if path in self.sizes:
+            return self.sizes[path]
+        return path.stat().st_size if path.exists() else 0
+
+    def save(self):
+        if not self.dry_run:
+            self.cache.save()
+
+
+def diff_lines(path, data):
+    if data is None:
+        return []
+    text = data.decode('utf-8')
+    if path.suffix == '.json':
+        try:
+            text = json.dumps(json.loads(text), ensure_ascii=False, indent=2)
+        except ValueError:
+            pass
+    return text.splitlines(keepends=True)
+
+
+def print_diff(path, previous, data):
+    lines = difflib.unified_diff(
+        diff_lines(path, previous), diff_lines(path, data),
+        fromfile=str(path) if previous is not None else '/dev/null', tofile=str(path),
+    )
+    for line in lines:
+        sys.stdout.write(line if line.endswith('\n') else line + '\n')
+
+
+def format_size_report(label, before, after):
+    change = (after - before) * 100 / before if before else 0
+    return f'{label}: {before} -> {after} bytes ({change:+.1f}%)'
@@ -0,0 +1,86 @@
+"""Catalog definitions and ES-module output for the multi-catalog compiler.
+
+A catalog is one translation table split into per-locale source files under
+``scripts/locales/<name>/``. Besides the parcel-scams JSON shards, catalogs can
+be emitted as one ES module per locale plus an ``index.js`` of dynamic-import
+loaders (so bundlers only ship the active locale), and as a single aggregate
+module kept for consumers that still need every locale synchronously.
+"""
+import json
+
+from .sources import ROOT_LOCALE, LocaleSource
+
+GENERATED_BANNER = '// Generated by scripts/generate_parcel_scams_i18n.py from {source}. Do not edit by hand.\n'
+
+
+class Catalog:
+    """One translation catalog and the artifacts it compiles to.
+
+    ``fallback='build'`` resolves missing keys through ``parents`` at build
+    time; ``'runtime'`` emits the authored tables unchanged because the
+    consumer falls back itself (and may need to know what is really
+    translated, e.g. ``tStrict`` in LanguageContext). ``module_dir`` and
+    ``aggregate_path`` are relative to the app's ``src/`` directory.
+    """
+
+    def __init__(self, name, locales_dir, *, parents=None, variants=None, fallback='build',
+                 module_dir=None, aggregate_path=None, aggregate_export=None, aggregate_header=None,
+                 extras_path=None):
+        self.name = name
+        self.locales_dir = locales_dir
+        self.variants = variants or {}
+        self.parents = {**(parents or {}), **self.variants}
+        self.fallback = fallback
+        self.module_dir = module_dir
+        self.aggregate_path = aggregate_path
+        self.aggregate_export = aggregate_export
+        self.aggregate_header = aggregate_header
+        self.extras_path = extras_path
+
+    def sources(self):
+        return LocaleSource(self.locales_dir, ROOT_LOCALE)
+
+    def extras(self):
+        """Additional named exports (e.g. languageMap) from ``extras_path``."""
+        if self.extras_path is None:
+            return {}
+        return json.loads(self.extras_path.read_text(encoding='utf-8'))
+
+    def source_label(self, repo_root):
+        return self.locales_dir.relative_to(repo_root).as_posix() + '/*.json'
+
+
+def js_literal(value, indent=None):
+    separators = None if indent else (',', ':')
+    return json.dumps(value, ensure_ascii=False, indent=indent, separators=separators)
+
+
+def render_locale_module(table, source):
+    return (GENERATED_BANNER.format(source=source) + f'export default {js_literal(table)};\n').encode('utf-8')
+
+
+def render_locale_index(locales, extras, source):
+    lines = [
+        GENERATED_BANNER.format(source=source).rstrip('\n'),
+        f'export const locales = {js_literal(list(locales))};',
+        '',
+        '// One chunk per locale: only the language that is actually requested is downloaded.',
+        'export const loaders = {',
+    ]
+    lines += [f'  {js_literal(lang)}: () => import({js_literal(f"./{lang}.js")}),' for lang in locales]
+    lines.append('};')
+    for name, value in extras.items():
+        lines += ['', f'export const {name} = {js_literal(value, 2)};']
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def render_aggregate_module(export_name, tables, extras, source, header=None):
+    parts = []
+    if header:
+        parts.append(header.rstrip('\n'))
+    parts.append(GENERATED_BANNER.format(source=source).rstrip('\n'))
+    parts.append(f'export const {export_name} = {js_literal(tables, 2)};')
+    text = '\n'.join(parts)
+    for name, value in extras.items():
+        text += f'\n\nexport const {name} = {js_literal(value, 2)};'
+    return (text + '\n').encode('utf-8')
@@ -0,0 +1,84 @@
+"""Carrier official/fake domain datasets for the parcel-scams page."""
+from .artifacts import dump_compact
+from .sources import ROOT_LOCALE
+from .typosquat import TyposquatIndex
+
+
+def build_domain_dataset(data, labels, root=ROOT_LOCALE):
+    """Compile the carrier domain source into section lists plus a domain index.
+
+    Sections keep their domains in display order; everything else about a
+    domain lives in ``index`` so rendering and lookups are one dict access.
+    Pattern and warning keys must have a ``pattern.*``/``warning.*`` label in
+    ``labels`` (the ``root`` locale table).
+    """
+    index = {}
+
+    def add(domain, entry):
+        key = domain.lower()
+        if key in index:
+            raise ValueError(f'Domain {domain!r} listed twice ({index[key]["carrier"]}, {entry["carrier"]})')
+        index[key] = entry
+
+    sections = {}
+    for section_id, section in data['sections'].items():
+        for warning in section.get('warnings', []):
+            if f'warning.{warning}' not in labels:
+                raise ValueError(f'{section_id}: no warning.{warning} label in {root}')
+        for domain in section['official']:
+            add(domain, {'carrier': section['carrier'], 'section': section_id, 'kind': 'official'})
+        for fake in section['fake']:
+            if f'pattern.{fake["pattern"]}' not in labels:
+                raise ValueError(f'{fake["domain"]}: no pattern.{fake["pattern"]} label in {root}')
+            add(fake['domain'], {
+                'carrier': section['carrier'],
+                'section': section_id,
+                'kind': 'fake',
+                'pattern': fake['pattern'],
+            })
+        sections[section_id] = {
+            'carrier': section['carrier'],
+            'official': section['official'],
+            'fake': [fake['domain'] for fake in section['fake']],
+            'warnings': section.get('warnings', []),
+        }
+
+    for row in data['others']:
+        add(row['official'], {'carrier': row['carrier'], 'section': 'others', 'kind': 'official'})
+        add(row['fake'], {'carrier': row['carrier'], 'section': 'others', 'kind': 'fake'})
+
+    return {'sections': sections, 'others': data['others'], 'index': index}
+
+
+def official_domains(data):
+    domains = [domain for section in data['sections'].values() for domain in section['official']]
+    return domains + [row['official'] for row in data['others']]
+
+
+def known_carrier_domains(data):
+    """Genuine carrier domains the page does not list; never reported as look-alikes."""
+    return data.get('knownCarrierDomains', [])
+
+
+def curated_fake_domains(data):
+    domains = [fake['domain'] for section in data['sections'].values() for fake in section['fake']]
+    return domains + [row['fake'] for row in data['others']]
+
+
+def compile_domain_artifacts(data, labels):
+    """Domain dataset and typo-squat index payloads plus detection stats.
+
+    Self-contained so it can run in a worker process next to the locale units.
+    Raises ``ValueError`` when the index disagrees with ``lookalikeCases``.
+    """
+    dataset = dump_compact(build_domain_dataset(data, labels))
+    typosquat = TyposquatIndex(official_domains(data), known=known_carrier_domains(data))
+    typosquat.check_cases(data.get('lookalikeCases', []))
+    curated = curated_fake_domains(data)
+    stats = {
+        'candidates': len(typosquat.candidates),
+        'officials': len(typosquat.officials),
+        'caught': sum(1 for domain in curated if typosquat.check(domain)),
+        'curated': len(curated),
+    }
+    return dataset, dump_compact(typosquat.to_artifact()), stats
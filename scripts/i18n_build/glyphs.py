@@ -0,0 +1,193 @@
+"""Per-locale code-point sets and ``unicode-range`` subset manifests.
+
+A locale's code points come from its own strings in each catalog (not the
+strings it falls back to). Code points the Latin web fonts already serve are
+left out of the subset ranges: only Devanagari, Tamil, Thai, Hebrew, Hangul,
+Kana, Han and the like need locale subsets. Characters most locales use
+alike, such as the flag and holiday emoji, the native-script greetings of the
+holiday messages and the language picker's native names, go into one shared
+subset instead of being repeated in every locale's. With a font source and
+fontTools installed, one WOFF2 subset per locale (and the shared one) is cut
+from it.
+
+The manifest records each locale's code points per catalog together with the
+digest of the source they were read from, so the next build only parses the
+locale files that changed.
+"""
+import io
+
+try:
+    import brotli  # noqa: F401 (fontTools writes WOFF2 with it)
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+except ImportError:  # optional: subset font files are skipped when they are not installed
+    font_subset = None
+
+from .catalogs import GENERATED_BANNER
+
+# Code points of next/font's "latin" subset, which Nunito and Geist are loaded with.
+LATIN_FONT_RANGES = (
+    (0x0000, 0x00FF), (0x0131, 0x0131), (0x0152, 0x0153), (0x02BB, 0x02BC), (0x02C6, 0x02C6),
+    (0x02DA, 0x02DA), (0x02DC, 0x02DC), (0x0304, 0x0304), (0x0308, 0x0308), (0x0329, 0x0329),
+    (0x2000, 0x206F), (0x20AC, 0x20AC), (0x2122, 0x2122), (0x2191, 0x2191), (0x2193, 0x2193),
+    (0x2212, 0x2212), (0x2215, 0x2215), (0xFEFF, 0xFEFF), (0xFFFD, 0xFFFD),
+)
+SUBSET_FAMILY = 'Locale Subset {lang}'
+SHARED_SUBSET = 'shared'
+# A non-Latin code point used by at least this share of the locales goes into the shared subset.
+SHARED_THRESHOLD = 0.5
+
+
+def strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from strings(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from strings(item)
+
+
+def code_points(tables):
+    """Sorted code points used by the string values of ``tables``."""
+    points = set()
+    for table in tables:
+        for text in strings(table):
+            points.update(map(ord, text))
+    return sorted(points)
+
+
+def in_latin_font(point):
+    return any(low <= point <= high for low, high in LATIN_FONT_RANGES)
+
+
+def format_ranges(runs):
+    return ','.join(f'U+{low:X}' if low == high else f'U+{low:X}-{high:X}' for low, high in runs)
+
+
+def unicode_range(points):
+    """CSS ``unicode-range`` value for sorted ``points`` (consecutive runs collapsed)."""
+    runs = []
+    for point in points:
+        if runs and point == runs[-1][1] + 1:
+            runs[-1][1] = point
+        else:
+            runs.append([point, point])
+    return format_ranges(runs)
+
+
+def parse_range(text):
+    """Sorted code points of a ``unicode-range`` value written by :func:`unicode_range`."""
+    points = []
+    for run in filter(None, text.split(',')):
+        low, _, high = run[2:].partition('-')
+        points.extend(range(int(low, 16), int(high or low, 16) + 1))
+    return points
+
+
+def shared_code_points(points_by_locale, always=()):
+    """Non-Latin code points used by most locales, plus ``always`` (e.g. the language picker's names)."""
+    counts = {}
+    for points in points_by_locale.values():
+        for point in points:
+            counts[point] = counts.get(point, 0) + 1
+    threshold = SHARED_THRESHOLD * len(points_by_locale)
+    shared = {point for point, count in counts.items() if count >= threshold}
+    return sorted(point for point in shared.union(always) if not in_latin_font(point))
+
+
+def subset_entry(points, font_file=None):
+    extra = [point for point in points if not in_latin_font(point)]
+    entry = {'subsetCodePoints': len(extra), 'subsetRange': unicode_range(extra)}
+    if font_file is not None:
+        entry['file'], covered = font_file
+        entry['fontRange'] = unicode_range(covered)
+    return entry
+
+
+def subset_manifest(catalog_points, shared, font_files=None):
+    """JSON-ready manifest: the shared subset, and full and subset ranges per locale.
+
+    ``catalog_points`` maps a locale to ``{catalog: (source digest, sorted code
+    points)}``; ``shared`` is left out of the locale subset ranges. ``font_files``
+    maps a locale (or ``SHARED_SUBSET``) to ``(url, code points in the font)``;
+    the latter becomes ``fontRange``, the unicode-range its @font-face declares.
+    """
+    font_files = font_files or {}
+    shared_set = set(shared)
+    locales = {}
+    for lang, by_catalog in catalog_points.items():
+        points = sorted(set().union(*(used for _, used in by_catalog.values())))
+        own = [point for point in points if point not in shared_set]
+        locales[lang] = {
+            'codePoints': len(points),
+            'unicodeRange': unicode_range(points),
+            **subset_entry(own, font_files.get(lang)),
+            'catalogs': {
+                name: {'source': digest, 'range': unicode_range(used)}
+                for name, (digest, used) in by_catalog.items()
+            },
+        }
+    return {
+        'latinRange': format_ranges(LATIN_FONT_RANGES),
+        SHARED_SUBSET: subset_entry(shared, font_files.get(SHARED_SUBSET)),
+        'locales': locales,
+    }
+
+
+def manifest_catalog_points(manifest):
+    """``{lang: {catalog: (source digest, sorted code points)}}`` recorded in ``manifest``."""
+    return {
+        lang: {name: (item['source'], parse_range(item['range'])) for name, item in entry.get('catalogs', {}).items()}
+        for lang, entry in manifest.get('locales', {}).items()
+    }
+
+
+def font_coverage(source):
+    """Code points that ``source`` has glyphs for."""
+    return set(TTFont(source, lazy=True).getBestCmap())
+
+
+def subset_font(source, points):
+    """WOFF2 bytes of ``source`` cut down to ``points`` (needs fontTools and brotli)."""
+    options = font_subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    font = TTFont(source)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=points)
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    font.flavor = 'woff2'
+    font.save(buffer)
+    return buffer.getvalue()
+
+
+def font_face(family, entry):
+    return [
+        '',
+        '@font-face {',
+        f'  font-family: "{family}";',
+        f'  src: url("{entry["file"]}") format("woff2");',
+        '  font-display: swap;',
+        f'  unicode-range: {entry["fontRange"]};',
+        '}',
+    ]
+
+
+def render_subset_css(manifest, source):
+    """@font-face rules for the shared subset and the locales with a subset file, scoped with :lang()."""
+    lines = [GENERATED_BANNER.format(source=source).replace('//', '/*', 1).rstrip('\n') + ' */']
+    if 'file' in manifest[SHARED_SUBSET]:
+        lines += font_face(SUBSET_FAMILY.format(lang=SHARED_SUBSET), manifest[SHARED_SUBSET])
+    for lang, entry in manifest['locales'].items():
+        if 'file' not in entry:
+            continue
+        family = SUBSET_FAMILY.format(lang=lang)
+        lines += font_face(family, entry) + [
+            f':lang({lang}) {{',
+            f'  --font-locale-subset: "{family}";',
+            '}',
+        ]
+    return ('\n'.join(lines) + '\n').encode('utf-8')
@@ -0,0 +1,64 @@
+"""Structured build metrics emitted as JSON lines.
+
+Each record is one JSON object per line with an ``event`` field:
+
+- ``stage``: wall time and tracemalloc peak of one build step
+  (``catalog``/``stage``/``seconds``/``peak_bytes``)
+- ``locale``: keys and emitted bytes of one locale artifact
+- ``build``: totals for the whole run
+
+Memory tracing slows the build down, so it only runs when metrics are
+requested; without a stream every call is a cheap no-op apart from timing.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class BuildMetrics:
+    def __init__(self, path=None):
+        self.stream = None
+        self.started = time.perf_counter()
+        self.peak_bytes = 0
+        if path is None:
+            return
+        self.stream = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8')
+        tracemalloc.start()
+
+    def emit(self, event, **fields):
+        if self.stream is None:
+            return
+        self.stream.write(json.dumps({'event': event, **fields}, ensure_ascii=False) + '\n')
+
+    @contextmanager
+    def stage(self, catalog, name):
+        """Time the enclosed block (stages must not be nested)."""
+        if self.stream is not None:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            if self.stream is not None:
+                peak_total = tracemalloc.get_traced_memory()[1]
+                self.peak_bytes = max(self.peak_bytes, peak_total)
+                peak = peak_total - before
+                self.emit('stage', catalog=catalog, stage=name, seconds=round(seconds, 6), peak_bytes=peak)
+
+    def locale(self, catalog, artifact, lang, keys, size):
+        self.emit('locale', catalog=catalog, artifact=artifact, locale=lang, keys=keys, bytes=size)
+
+    def close(self):
+        if self.stream is None:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        self.emit('build', seconds=round(time.perf_counter() - self.started, 6), traced_bytes=current,
+                  peak_bytes=max(self.peak_bytes, peak))
+        tracemalloc.stop()
+        if self.stream is not sys.stdout:
+            self.stream.close()
+        self.stream = None
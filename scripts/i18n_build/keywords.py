@@ -0,0 +1,149 @@
+"""Spam and phishing keyword sets compiled into an Aho-Corasick automaton.
+
+Keywords are matched on the "compact" form of a message: NFKC-normalized, case
+folded, Latin accents stripped, obfuscation characters folded (``s3o`` ->
+``seo``) and everything but Unicode letters, marks and digits removed, as
+``normalizeForSpamMatching`` does in src/lib/spam-detection.js. The automaton
+is built once here; src/lib/spam-keywords.js walks it in a single pass over the
+message instead of scanning it once per keyword. Every locale's keyword set
+goes into the same automaton, since a message is matched regardless of the
+language it claims to be in.
+
+The phishing set is extended per locale with the scam wording the parcel-scams
+article quotes (``„erneute Zustellgebühr“``, ``「配送失敗」``), so customers
+quoting a scam message in their own language are recognized too.
+"""
+import re
+import unicodedata
+from collections import deque
+
+# Characters spammers use in place of letters. Shipped in the artifact so the
+# runtime normalizer folds text exactly like the keywords were folded here.
+OBFUSCATION_CHARS = {
+    '0': 'o', '1': 'i', '2': 'z', '3': 'e', '4': 'a', '5': 's', '6': 'g', '7': 't', '8': 'b', '9': 'g',
+    '@': 'a', '$': 's', '!': 'i', '|': 'l', '+': 't', '€': 'e', '£': 'l', '¥': 'y',
+}
+# Case folding beyond lowercasing (ß -> ss, ς -> σ). JS only has toLowerCase,
+# so the characters that differ are shipped too; none lie beyond the first two planes.
+CASEFOLD_CHARS = {
+    chr(point): chr(point).casefold() for point in range(0x20000) if chr(point).casefold() != chr(point).lower()
+}
+# Parcel-scams keys whose quoted phrases are scam-message wording.
+PHISHING_SOURCE_KEYS = ('howText', 'tips')
+_COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+_QUOTED = re.compile(
+    r'[“„«「『"‘‚‹]\s*'
+    r'([^”“„»「」『』"’‘›]{2,60}?)'
+    r'\s*[”“»」』"’‘›]'
+)
+
+
+def compact_text(text):
+    folded = unicodedata.normalize('NFKD', unicodedata.normalize('NFKC', text).casefold())
+    folded = unicodedata.normalize('NFC', _COMBINING_MARKS.sub('', folded))
+    deobfuscated = (OBFUSCATION_CHARS.get(char, char) for char in folded)
+    return ''.join(char for char in deobfuscated if unicodedata.category(char)[0] in 'LMN')
+
+
+def quoted_phrases(table, keys=PHISHING_SOURCE_KEYS):
+    """Phrases quoted in the ``keys`` strings of a locale table, in order."""
+    phrases = []
+    for key in keys:
+        value = table.get(key, [])
+        for text in [value] if isinstance(value, str) else value:
+            phrases.extend(match for match in _QUOTED.findall(text) if match not in phrases)
+    return phrases
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over the compact form of ``(phrase, category)`` keywords.
+
+    Each state's output already includes the outputs of its failure chain, so
+    a match only has to read the state it lands on. A keyword that folds to the
+    same compact form as an earlier one is skipped; one that folds to nothing
+    (e.g. only punctuation) raises ``ValueError``.
+    """
+
+    def __init__(self, keywords, categories):
+        self.categories = list(categories)
+        self.keywords = []
+        self.next = [{}]
+        self.out = [[]]
+        seen = set()
+        for phrase, category in keywords:
+            pattern = compact_text(phrase)
+            if not pattern:
+                raise ValueError(f'{category} keyword {phrase!r} has no letters or digits to match')
+            if pattern in seen:
+                continue
+            seen.add(pattern)
+            state = 0
+            for char in pattern:
+                child = self.next[state].get(char)
+                if child is None:
+                    child = len(self.next)
+                    self.next[state][char] = child
+                    self.next.append({})
+                    self.out.append([])
+                state = child
+            self.out[state].append(len(self.keywords))
+            self.keywords.append((phrase, self.categories.index(category)))
+
+        self.fail = [0] * len(self.next)
+        queue = deque(self.next[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.next[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.next[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.next[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.out[child] = sorted({*self.out[child], *self.out[self.fail[child]]})
+                queue.append(child)
+
+    @classmethod
+    def from_data(cls, data, scam_tables=None):
+        """Build from ``{category: {locale: [phrase, ...]}}`` (scripts/data/spam-keywords.json).
+
+        ``scam_tables`` maps a locale to its parcel-scams table; the phrases it
+        quotes are added to that locale's phishing keywords.
+        """
+        data = {category: dict(locales) for category, locales in data.items()}
+        for lang, table in (scam_tables or {}).items():
+            phishing = data.setdefault('phishing', {})
+            phishing[lang] = [*phishing.get(lang, []), *quoted_phrases(table)]
+        keywords = [
+            (phrase, category)
+            for category, locales in data.items()
+            for phrases in locales.values()
+            for phrase in phrases
+        ]
+        return cls(keywords, data)
+
+    def find(self, text):
+        """Indices of the keywords occurring in ``text``, in keyword order."""
+        state = 0
+        hits = set()
+        for char in compact_text(text):
+            while state and char not in self.next[state]:
+                state = self.fail[state]
+            state = self.next[state].get(char, 0)
+            hits.update(self.out[state])
+        return sorted(hits)
+
+    def to_artifact(self):
+        """Compact JSON-ready automaton for src/lib/spam-keywords.js.
+
+        ``next`` holds one ``{char: state}`` object per state; ``out`` only lists
+        the states that complete a keyword.
+        """
+        return {
+            'obfuscation': OBFUSCATION_CHARS,
+            'casefold': CASEFOLD_CHARS,
+            'categories': self.categories,
+            'keywords': [[phrase, category] for phrase, category in self.keywords],
+            'next': self.next,
+            'fail': self.fail,
+            'out': {str(state): ids for state, ids in enumerate(self.out) if ids},
+        }
@@ -0,0 +1,313 @@
+"""ICU MessageFormat-style strings compiled ahead of time into JS functions.
+
+A catalog string becomes a message as soon as it has an argument. The
+supported subset of the syntax:
+
+- ``{name}``
+- ``{name, number}`` (optionally ``integer`` or ``percent``)
+- ``{name, date, short|medium|long|full}``, or a ``::skeleton`` of y/M/d/E
+  fields such as ``{when, date, ::yyyyMMMM}``
+- ``{name, time, short|medium|long|full}``
+- ``{name, plural, [offset:N] =0 {...} one {...} other {...}}``, with ``#``
+  standing for the (offset) number
+- ``{name, select, key {...} other {...}}``
+- ICU apostrophe quoting (``'{'`` is a literal brace and ``''`` an apostrophe)
+
+Each message compiles to an arrow function over an argument object. The
+number, date and plural formatters it needs are resolved here and created
+once per locale module as built-in ``Intl`` objects, so the page neither
+parses messages nor ships a message-format library. Dates are formatted in
+UTC, so the prerendered HTML and the client agree on the day and month, and in
+the Gregorian calendar, so th shows 2026 rather than the Buddhist-era 2569 its
+strings were translated with.
+"""
+import re
+
+from .catalogs import GENERATED_BANNER, js_literal
+
+PLURAL_CATEGORIES = ('zero', 'one', 'two', 'few', 'many', 'other')
+NUMBER_STYLES = {
+    None: {},
+    'integer': {'maximumFractionDigits': 0},
+    'percent': {'style': 'percent'},
+}
+DATE_STYLES = ('short', 'medium', 'long', 'full')
+# Skeleton field -> (Intl.DateTimeFormat option, {field length: option value}).
+SKELETON_FIELDS = {
+    'y': ('year', {1: 'numeric', 2: '2-digit', 4: 'numeric'}),
+    'M': ('month', {1: 'numeric', 2: '2-digit', 3: 'short', 4: 'long', 5: 'narrow'}),
+    'd': ('day', {1: 'numeric', 2: '2-digit'}),
+    'E': ('weekday', {1: 'short', 2: 'short', 3: 'short', 4: 'long', 5: 'narrow'}),
+}
+_NAME = re.compile(r'\s*([A-Za-z_]\w*)\s*')
+_KEYWORD = re.compile(r'\s*(=\d+|[A-Za-z_]\w*)\s*')
+_OFFSET = re.compile(r'\s*offset:\s*(\d+)\s*')
+
+
+class MessageSyntaxError(ValueError):
+    pass
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message):
+        return MessageSyntaxError(f'{message} at offset {self.pos} of {self.text!r}')
+
+    def match(self, pattern):
+        found = pattern.match(self.text, self.pos)
+        if not found:
+            return None
+        self.pos = found.end()
+        return found.group(1)
+
+    def expect(self, char):
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+        if not self.text.startswith(char, self.pos):
+            raise self.error(f'expected {char!r}')
+        self.pos += 1
+
+    def parts(self, in_plural=False, nested=False):
+        """Literal strings and argument tuples up to the closing brace (or the end)."""
+        parts = []
+        literal = []
+        text = self.text
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == "'":
+                following = text[self.pos + 1:self.pos + 2]
+                if following == "'":
+                    literal.append("'")
+                    self.pos += 2
+                    continue
+                if following in ('{', '}') or (in_plural and following == '#'):
+                    end = text.find("'", self.pos + 1)
+                    # An unterminated quote runs to the end of the message.
+                    end = len(text) if end < 0 else end
+                    literal.append(text[self.pos + 1:end])
+                    self.pos = end + 1
+                    continue
+                literal.append(char)
+            elif char == '{':
+                if literal:
+                    parts.append(''.join(literal))
+                    literal = []
+                self.pos += 1
+                parts.append(self.argument(in_plural))
+                continue
+            elif char == '}':
+                if not nested:
+                    raise self.error("unbalanced '}'")
+                break
+            elif char == '#' and in_plural:
+                if literal:
+                    parts.append(''.join(literal))
+                    literal = []
+                parts.append(('pound',))
+            else:
+                literal.append(char)
+            self.pos += 1
+        if literal:
+            parts.append(''.join(literal))
+        return parts
+
+    def argument(self, in_plural=False):
+        name = self.match(_NAME)
+        if name is None:
+            raise self.error('expected an argument name')
+        if self.text.startswith('}', self.pos):
+            self.pos += 1
+            return ('arg', name)
+        self.expect(',')
+        kind = self.match(_NAME)
+        if kind in ('number', 'date', 'time'):
+            style = None
+            if self.text.startswith(',', self.pos):
+                self.pos += 1
+                end = self.text.find('}', self.pos)
+                if end < 0:
+                    raise self.error("expected '}'")
+                style = self.text[self.pos:end].strip()
+                self.pos = end
+            self.expect('}')
+            try:
+                options = format_options(kind, style)
+            except MessageSyntaxError as exc:
+                raise self.error(str(exc)) from None
+            return (kind, name, options)
+        if kind in ('plural', 'select'):
+            self.expect(',')
+            offset = 0
+            if kind == 'plural':
+                offset = int(self.match(_OFFSET) or 0)
+            cases = {}
+            while True:
+                key = self.match(_KEYWORD)
+                if key is None:
+                    break
+                if kind == 'plural' and not key.startswith('=') and key not in PLURAL_CATEGORIES:
+                    raise self.error(f'unknown plural category {key!r}')
+                self.expect('{')
+                cases[key] = self.parts(in_plural=kind == 'plural' or in_plural, nested=True)
+                self.expect('}')
+            if 'other' not in cases:
+                raise self.error(f"{kind} argument {name!r} needs an 'other' case")
+            self.expect('}')
+            return (kind, name, offset, cases) if kind == 'plural' else (kind, name, cases)
+        raise self.error(f'unknown argument type {kind!r}')
+
+
+def skeleton_options(skeleton):
+    """``Intl.DateTimeFormat`` options of a date skeleton such as ``yyyyMMMM``."""
+    options = {}
+    for run in re.finditer(r'(.)\1*', skeleton):
+        field = SKELETON_FIELDS.get(run.group(1))
+        value = field and field[1].get(len(run.group()))
+        if value is None:
+            raise MessageSyntaxError(f'unsupported date skeleton field {run.group()!r}')
+        options[field[0]] = value
+    return options
+
+
+def format_options(kind, style):
+    """Build-time ``Intl`` options of a number, date or time argument."""
+    if kind == 'number':
+        if style not in NUMBER_STYLES:
+            raise MessageSyntaxError(f'unknown number style {style!r}')
+        return NUMBER_STYLES[style]
+    if style and style.startswith('::') and kind == 'date':
+        options = skeleton_options(style[2:].strip())
+    elif style is None or style in DATE_STYLES:
+        options = {f'{kind}Style': style or 'medium'}
+    else:
+        raise MessageSyntaxError(f'unknown {kind} style {style!r}')
+    return {**options, 'timeZone': 'UTC', 'calendar': 'gregory'}
+
+
+def parse_message(text):
+    """Literal strings and ``(kind, name, ...)`` argument tuples of ``text``."""
+    return _Parser(text).parts()
+
+
+def argument_names(parts):
+    names = set()
+    for part in parts:
+        if isinstance(part, str) or part[0] == 'pound':
+            continue
+        names.add(part[1])
+        if part[0] in ('plural', 'select'):
+            for case in part[-1].values():
+                names.update(argument_names(case))
+    return sorted(names)
+
+
+def is_message(value):
+    """Whether ``value`` is a string with at least one argument.
+
+    Strings without a brace are plain text and are never parsed, so their
+    apostrophes stay as written.
+    """
+    return isinstance(value, str) and '{' in value and bool(argument_names(parse_message(value)))
+
+
+def message_keys(root_table):
+    """Keys of ``root_table`` whose root string is a message."""
+    return [key for key, value in root_table.items() if is_message(value)]
+
+
+def _template(text):
+    return text.replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
+
+
+class MessageModule:
+    """Compiled messages of one locale and the ``Intl`` formatters they share."""
+
+    def __init__(self, lang):
+        self.lang = lang
+        self.formatters = {}
+        self.uses_plural = False
+        self.depth = 0
+
+    def formatter(self, kind, options):
+        key = (kind, js_literal(options))
+        if key not in self.formatters:
+            self.formatters[key] = f'{kind}{len(self.formatters)}'
+        return self.formatters[key]
+
+    def expression(self, parts, number=None):
+        """Template literal of ``parts``; ``number`` is the JS variable ``#`` stands for."""
+        chunks = []
+        for part in parts:
+            if isinstance(part, str):
+                chunks.append(_template(part))
+                continue
+            kind = part[0]
+            if kind == 'pound':
+                if number is None:
+                    raise MessageSyntaxError("'#' outside a plural argument")
+                code = f'{self.formatter("number", {})}.format({number})'
+            elif kind == 'arg':
+                code = f'a.{part[1]}'
+            elif kind == 'number':
+                code = f'{self.formatter("number", part[2])}.format(a.{part[1]})'
+            elif kind in ('date', 'time'):
+                code = f'{self.formatter("date", part[2])}.format(new Date(a.{part[1]}))'
+            elif kind == 'plural':
+                code = self.plural(part, number)
+            else:
+                code = self.select(part, number)
+            chunks.append('${' + code + '}')
+        return '`' + ''.join(chunks) + '`'
+
+    def plural(self, part, number):
+        _, name, offset, cases = part
+        self.depth += 1
+        value, count, category = (f'{var}{self.depth}' for var in ('v', 'n', 'c'))
+        params = [value, f'{count} = {value} - {offset}'] if offset else [count]
+        exact = count if not offset else value
+        branches = [(f'{exact} === {key[1:]}', case) for key, case in cases.items() if key.startswith('=')]
+        named = [(key, case) for key, case in cases.items() if key in PLURAL_CATEGORIES and key != 'other']
+        if named:
+            self.uses_plural = True
+            params.append(f'{category} = plural.select({count})')
+            branches += [(f'{category} === {js_literal(key)}', case) for key, case in named]
+        body = self.expression(cases['other'], count)
+        for test, case in reversed(branches):
+            body = f'{test} ? {self.expression(case, count)} : {body}'
+        self.depth -= 1
+        return f'(({", ".join(params)}) => {body})(a.{name})'
+
+    def select(self, part, number):
+        _, name, cases = part
+        body = self.expression(cases['other'], number)
+        for key, case in reversed([item for item in cases.items() if item[0] != 'other']):
+            body = f'a.{name} === {js_literal(key)} ? {self.expression(case, number)} : {body}'
+        return f'({body})'
+
+    def compile(self, text):
+        return f'(a) => {self.expression(parse_message(text))}'
+
+    def declarations(self):
+        lines = [f'const LOCALE = {js_literal(self.lang)};']
+        if self.uses_plural:
+            lines.append('const plural = new Intl.PluralRules(LOCALE);')
+        for (kind, options), name in self.formatters.items():
+            constructor = 'NumberFormat' if kind == 'number' else 'DateTimeFormat'
+            arguments = 'LOCALE' if options == '{}' else f'LOCALE, {options}'
+            lines.append(f'const {name} = new Intl.{constructor}({arguments});')
+        return lines
+
+
+def render_message_module(lang, table, keys, source):
+    """ES module exporting the compiled ``keys`` of ``table`` as ``{key: (args) => string}``."""
+    module = MessageModule(lang)
+    compiled = [(key, module.compile(table[key])) for key in keys if key in table]
+    lines = [GENERATED_BANNER.format(source=source).rstrip('\n')]
+    lines += module.declarations()
+    lines += ['', 'export default {']
+    lines += [f'  {js_literal(key)}: {code},' for key, code in compiled]
+    lines.append('};')
+    return ('\n'.join(lines) + '\n').encode('utf-8')
@@ -0,0 +1,55 @@
+"""Locale negotiation tables: every known tag or alias -> a compiled locale.
+
+Consumers used to normalize language tags with hand-written, slightly
+different rules. Instead the generator emits one table per catalog, derived
+from the locales that catalog actually has: the catalog's own locales, every
+alias in ``scripts/data/locale-aliases.json`` and every locale another catalog
+has, each resolved through the alias fallbacks to the nearest locale present.
+Tags are lowercase; the runtime lookup (src/lib/negotiateLocale.js) only
+truncates subtags for tags the table does not list (e.g. ``de-ch`` -> ``de``).
+"""
+from .catalogs import GENERATED_BANNER, js_literal
+from .sources import ROOT_LOCALE
+
+
+def nearest_locale(tag, locales, aliases, fallbacks):
+    """The locale of ``locales`` that ``tag`` resolves to, or None."""
+    tag = aliases.get(tag, tag)
+    seen = set()
+    while tag not in locales:
+        if tag in seen or tag not in fallbacks:
+            return None
+        seen.add(tag)
+        tag = fallbacks[tag]
+    return tag
+
+
+def negotiation_table(locales, known, aliases, fallbacks):
+    """``{tag: locale}`` for the catalog locales, every alias and every ``known`` locale."""
+    locales = set(locales)
+    table = {}
+    for tag in [*sorted(locales), *sorted(set(known) - locales), *sorted(aliases)]:
+        resolved = nearest_locale(tag, locales, aliases, fallbacks)
+        if resolved is not None:
+            table.setdefault(tag, resolved)
+    return table
+
+
+def negotiation_tables(catalog_locales, aliases, fallbacks):
+    """One table per catalog from ``{catalog: [locale, ...]}``."""
+    known = {lang for locales in catalog_locales.values() for lang in locales}
+    return {
+        name: negotiation_table(locales, known, aliases, fallbacks)
+        for name, locales in catalog_locales.items()
+    }
+
+
+def render_negotiation_module(tables, source, default=ROOT_LOCALE):
+    lines = [
+        GENERATED_BANNER.format(source=source).rstrip('\n'),
+        f'export const DEFAULT_LOCALE = {js_literal(default)};',
+        '',
+        '// Lowercase BCP-47 tag or alias -> compiled locale, per catalog.',
+        f'export const LOCALE_TABLES = {js_literal(tables, 2)};',
+    ]
+    return ('\n'.join(lines) + '\n').encode('utf-8')
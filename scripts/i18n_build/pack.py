@@ -0,0 +1,111 @@
+"""Single-file binary locale pack and its memory-mapped reader.
+
+Layout (little-endian):
+
+- header: magic ``I18P``, format version (u16), reserved (u16), entry count
+  (u32) and the offset of the string blob (u32)
+- index: one record per entry, sorted by lookup key: lookup key offset and
+  length, then value offset and length (u32 each, offsets into the file).
+  The top bit of the value length marks a list value, stored as JSON.
+- blob: UTF-8 lookup keys (``catalog NUL locale NUL key``) and values;
+  identical values are stored once.
+
+A lookup binary-searches the index in place and decodes only the value it
+lands on, so opening the pack costs one ``mmap`` however many catalogs and
+locales it holds.
+"""
+import json
+import mmap
+import struct
+
+PACK_MAGIC = b'I18P'
+PACK_VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+RECORD = struct.Struct('<IIII')
+LIST_FLAG = 1 << 31
+
+
+def lookup_key(catalog, locale, key):
+    return f'{catalog}\0{locale}\0{key}'.encode('utf-8')
+
+
+def render_pack(catalog_tables):
+    """Pack bytes of ``{catalog: {locale: {key: str | [str, ...]}}}``."""
+    entries = []
+    for catalog, tables in catalog_tables.items():
+        for locale, table in tables.items():
+            for key, value in table.items():
+                if isinstance(value, list):
+                    data, flag = json.dumps(value, ensure_ascii=False, separators=(',', ':')), LIST_FLAG
+                else:
+                    data, flag = value, 0
+                entries.append((lookup_key(catalog, locale, key), data.encode('utf-8'), flag))
+    entries.sort()
+
+    blob_offset = HEADER.size + RECORD.size * len(entries)
+    blob = bytearray()
+    values = {}
+    index = bytearray()
+    for ident, data, flag in entries:
+        key_offset = blob_offset + len(blob)
+        blob += ident
+        value_offset = values.get(data)
+        if value_offset is None:
+            value_offset = values[data] = blob_offset + len(blob)
+            blob += data
+        index += RECORD.pack(key_offset, len(ident), value_offset, len(data) | flag)
+    return HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(entries), blob_offset) + bytes(index) + bytes(blob)
+
+
+class LocalePack:
+    """Read-only view of a pack written by :func:`render_pack`.
+
+    >>> with LocalePack('src/i18n/catalogs.pack') as pack:
+    ...     pack.get('ui', 'de', 'backButton')
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._count, _ = HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self._map.close()
+            raise ValueError(f'{path}: not a version {PACK_VERSION} locale pack')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        self._map.close()
+
+    def _record(self, ident):
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            record = RECORD.unpack_from(self._map, HEADER.size + middle * RECORD.size)
+            found = self._map[record[0]:record[0] + record[1]]
+            if found == ident:
+                return record
+            if found < ident:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def get(self, catalog, locale, key, default=None):
+        """The string (or list of strings) stored for ``key``, or ``default``."""
+        record = self._record(lookup_key(catalog, locale, key))
+        if record is None:
+            return default
+        offset, length = record[2], record[3] & ~LIST_FLAG
+        text = self._map[offset:offset + length].decode('utf-8')
+        return json.loads(text) if record[3] & LIST_FLAG else text
+
+    def __contains__(self, ident):
+        return self._record(lookup_key(*ident)) is not None
@@ -0,0 +1,48 @@
+"""Fan-out of independent (catalog, locale) units to a process pool."""
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+
+
+class Fanout:
+    """``map``/``submit`` over a process pool when ``jobs > 1``, inline otherwise.
+
+    ``map`` returns results in input order, so everything merged from them
+    (reports, manifests, aggregates) is byte-identical whatever ``jobs`` is.
+    Unit functions must be module-level so they can be pickled.
+    """
+
+    def __init__(self, jobs=1):
+        self.jobs = jobs if jobs > 0 else os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.jobs) if self.jobs > 1 else None
+
+    def map(self, function, *iterables):
+        if self.pool is None:
+            return list(map(function, *iterables))
+        units = list(zip(*iterables))
+        if not units:
+            return []
+        # A few chunks per worker: large enough to amortize pickling shared
+        # arguments (e.g. the root table), small enough to balance the load.
+        chunksize = max(1, len(units) // (self.jobs * 4))
+        return list(self.pool.map(function, *zip(*units), chunksize=chunksize))
+
+    def submit(self, function, *args):
+        if self.pool is not None:
+            return self.pool.submit(function, *args)
+        future = Future()
+        try:
+            future.set_result(function(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
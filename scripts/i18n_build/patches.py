@@ -0,0 +1,66 @@
+"""Delta patches between published versions of the locale shards.
+
+For every locale the generator remembers the last few shard versions that
+were published (``--publish``), newest first, keyed by the shard's content
+hash (the hash the manifest advertises). Each build patches those versions
+to the current shard: ``set`` holds the keys whose value changed or appeared
+and ``delete`` the keys that are gone, so a client holding a cached shard with
+that hash only fetches the changed keys (src/app/blog/parcel-scams/shardCache.js
+applies them like :func:`apply_patch`).
+
+The history stores no tables: each version is a reverse delta from the
+version after it, the newest from the shard currently on disk (``current``
+is that shard's hash). Unpublished rebuilds, such as --watch saves, only
+re-anchor the deltas on the new shard.
+"""
+import json
+
+HISTORY_VERSION = 2
+
+
+def table_patch(old, new):
+    return {
+        'set': {key: value for key, value in new.items() if old.get(key) != value},
+        'delete': sorted(old.keys() - new.keys()),
+    }
+
+
+def apply_patch(table, patch):
+    """``table`` with ``patch`` applied (what a client does with its cached shard)."""
+    patched = {key: value for key, value in table.items() if key not in patch['delete']}
+    patched.update(patch['set'])
+    return patched
+
+
+def published_tables(entry, anchor):
+    """``[(hash, table)]`` of the published versions in ``entry``, rebuilt from the ``anchor`` table."""
+    tables = []
+    table = anchor
+    for version in entry['versions']:
+        table = apply_patch(table, version['revert'])
+        tables.append((version['hash'], table))
+    return tables
+
+
+def history_entry(digest, table, published):
+    """History entry of the shard ``digest`` and the ``[(hash, table)]`` published before it."""
+    versions = []
+    newer = table
+    for version_hash, version_table in published:
+        versions.append({'hash': version_hash, 'revert': table_patch(newer, version_table)})
+        newer = version_table
+    return {'current': digest, 'versions': versions}
+
+
+def read_history(path):
+    """``{lang: entry}`` from ``path``; empty when it is missing, unreadable or outdated."""
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return data.get('locales', {}) if data.get('version') == HISTORY_VERSION else {}
+
+
+def render_history(history):
+    data = {'version': HISTORY_VERSION, 'locales': history}
+    return (json.dumps(data, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
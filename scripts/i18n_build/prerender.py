@@ -0,0 +1,67 @@
+"""Build-time inputs for the statically generated per-locale parcel-scams pages.
+
+The ``[lang]`` route under src/app/blog/parcel-scams imports ``prerender/index.js``
+for its ``generateStaticParams`` (one parameter set per locale), the loaders of
+the locale tables (read from the client shards in ``i18n/``, a variant merged
+over its base shard) and the ``hreflang`` alternates that the route metadata and
+src/app/sitemap.js advertise. The root layout is a client component, so the
+``htmlLang`` map it uses to declare each page's language on ``<html>`` lives in
+its own ``prerender/htmlLang.js`` and the loaders stay out of the client bundle.
+"""
+from .catalogs import GENERATED_BANNER, js_literal
+
+
+def hreflang_tag(lang, overrides):
+    """BCP-47 casing of a locale id (``zh-hant`` -> ``zh-Hant``) unless overridden."""
+    if lang in overrides:
+        return overrides[lang]
+    parts = lang.split('-')
+    for i, part in enumerate(parts[1:], 1):
+        if len(part) == 4:
+            parts[i] = part.title()
+        elif len(part) == 2:
+            parts[i] = part.upper()
+    return '-'.join(parts)
+
+
+def shard_loader(lang, variants, shard_path):
+    """Arrow function resolving to the full table of ``lang`` from its shard."""
+    own = f'import({js_literal(shard_path.format(lang=lang))})'
+    base = variants.get(lang)
+    if not base:
+        return f'() => {own}.then((shard) => shard.default)'
+    return (f'() => Promise.all([import({js_literal(shard_path.format(lang=base))}), {own}])'
+            '.then(([base, own]) => ({ ...base.default, ...own.default }))')
+
+
+def render_prerender_index(locales, variants, route, hreflang_overrides, default, source,
+                           shard_path='../i18n/{lang}.json'):
+    alternates = {'x-default': route}
+    alternates.update({hreflang_tag(lang, hreflang_overrides): f'{route}/{lang}' for lang in locales})
+    lines = [
+        GENERATED_BANNER.format(source=source).rstrip('\n'),
+        f'export const locales = {js_literal(list(locales))};',
+        f'export const defaultLocale = {js_literal(default)};',
+        '',
+        '// generateStaticParams() of the [lang] route.',
+        f'export const params = {js_literal([{"lang": lang} for lang in locales])};',
+        '',
+        '// hreflang -> path; x-default is the client-rendered page that follows the selected language.',
+        f'export const alternates = {js_literal(alternates, 2)};',
+        '',
+        '// Full table of each locale, read from the client shards (variants merged over their base).',
+        'export const loaders = {',
+    ]
+    lines += [f'  {js_literal(lang)}: {shard_loader(lang, variants, shard_path)},' for lang in locales]
+    lines.append('};')
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def render_html_lang(locales, hreflang_overrides, source):
+    """``prerender/htmlLang.js``: only the ``<html lang>`` map, for the client root layout."""
+    lines = [
+        GENERATED_BANNER.format(source=source).rstrip('\n'),
+        '// <html lang> of each prerendered page (see src/app/LocaleHtml.js).',
+        f'export const htmlLang = {js_literal({lang: hreflang_tag(lang, hreflang_overrides) for lang in locales})};',
+    ]
+    return ('\n'.join(lines) + '\n').encode('utf-8')
@@ -0,0 +1,124 @@
+"""Per-locale source tables and build-time fallback resolution."""
+import json
+from collections.abc import Mapping
+
+from .artifacts import content_hash
+
+ROOT_LOCALE = 'en'
+
+
+class LocaleSource(Mapping):
+    """Read-only ``lang -> table`` mapping backed by per-locale JSON files.
+
+    Listing locales only globs file names; a file is parsed the first time its
+    table is accessed.
+    """
+
+    def __init__(self, locales_dir, root=ROOT_LOCALE):
+        self.locales_dir = locales_dir
+        self.root = root
+        self.paths = self.scan()
+        self.loaded = {}
+
+    def scan(self):
+        paths = {path.stem: path for path in self.locales_dir.glob('*.json')}
+        order = sorted(paths, key=lambda lang: (lang != self.root, lang))
+        return {lang: paths[lang] for lang in order}
+
+    def reload(self, langs=()):
+        """Forget the parsed tables of ``langs`` and pick up added or removed files.
+
+        Returns True when the set of locales changed.
+        """
+        before = set(self.paths)
+        self.paths = self.scan()
+        for lang in set(langs) | (before - set(self.paths)):
+            self.loaded.pop(lang, None)
+        return before != set(self.paths)
+
+    def digest(self, langs=None):
+        """Content hash of the source files of ``langs`` (default: all), read as bytes without parsing them."""
+        langs = self.paths if langs is None else [lang for lang in langs if lang in self.paths]
+        return content_hash(b''.join(lang.encode('utf-8') + b'\0' + self.paths[lang].read_bytes() + b'\0'
+                                     for lang in langs))
+
+    def __getitem__(self, lang):
+        if lang not in self.loaded:
+            path = self.paths[lang]
+            self.loaded[lang] = json.loads(path.read_text(encoding='utf-8'))
+        return self.loaded[lang]
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+
+def fallback_order(sources, parents, locales=None, root=ROOT_LOCALE):
+    """Return ``locales`` (default: all) plus their ancestors, parents first."""
+    order = []
+    state = {}
+
+    def visit(lang, path):
+        if state.get(lang) == 'done':
+            return
+        if state.get(lang) == 'visiting':
+            raise ValueError(f'Locale fallback cycle: {" -> ".join(path + [lang])}')
+        state[lang] = 'visiting'
+        if lang != root:
+            parent = parents.get(lang, root)
+            if parent not in sources:
+                raise ValueError(f'Locale {lang!r} falls back to unknown locale {parent!r}')
+            visit(parent, path + [lang])
+        state[lang] = 'done'
+        order.append(lang)
+
+    for lang in sources if locales is None else locales:
+        visit(lang, [])
+    return order
+
+
+def dependents(sources, parents, changed, root=ROOT_LOCALE):
+    """Locales of ``sources`` whose fallback chain includes one of ``changed``."""
+    affected = []
+    for lang in sources:
+        ancestor = lang
+        while ancestor not in changed and ancestor != root:
+            ancestor = parents.get(ancestor, root)
+        if ancestor in changed:
+            affected.append(lang)
+    return affected
+
+
+def resolve_fallbacks(sources, parents, locales=None, root=ROOT_LOCALE):
+    """Build each locale's effective table without mutating ``sources``.
+
+    Missing keys are found with a set difference against the already-resolved
+    parent table, so only those keys are copied. Only ``locales`` (default: all)
+    and their ancestors are read from ``sources``. Returns the resolved tables
+    of those locales and ancestors (in ``sources`` order) and the number of
+    keys each inherited.
+    """
+    resolved = {}
+    inherited = {}
+    for lang in fallback_order(sources, parents, locales, root):
+        own = sources[lang]
+        table = dict(own)
+        if lang != root:
+            parent_table = resolved[parents.get(lang, root)]
+            missing = parent_table.keys() - own.keys()
+            if missing:
+                table.update((key, parent_table[key]) for key in parent_table if key in missing)
+            inherited[lang] = len(missing)
+        else:
+            inherited[lang] = 0
+        resolved[lang] = table
+    tables = {lang: resolved[lang] for lang in sources if lang in resolved}
+    return tables, {lang: inherited[lang] for lang in tables}
+
+
+def variant_overlay(i18n, lang, base):
+    """Keys of ``lang`` whose resolved value differs from ``base``."""
+    base_table = i18n[base]
+    return {key: value for key, value in i18n[lang].items() if base_table.get(key) != value}
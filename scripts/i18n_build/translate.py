@@ -0,0 +1,234 @@
+"""Optional machine-translation fill for keys that would fall back to the root.
+
+Every missing ``(locale, key)`` pair of a catalog is collected up front, the
+distinct source strings are grouped into batches per target locale, and the
+batches are sent concurrently (bounded by ``concurrency`` and a requests per
+second limit) to a pluggable backend. Results are kept in an on-disk
+translation memory keyed by backend, target locale and source-text hash, so a
+string is only ever requested once.
+
+A backend is any object with a ``name`` and an async
+``translate(texts, source, target)`` returning one translation per text.
+"""
+import asyncio
+import importlib
+import json
+from collections.abc import Mapping
+
+from .artifacts import atomic_write, content_hash
+from .sources import ROOT_LOCALE
+from .validate import untranslated_keys
+
+MEMORY_VERSION = 1
+# A batch is closed at whichever limit is reached first.
+BATCH_SIZE = 50
+BATCH_CHARS = 5000
+
+
+class MockBackend:
+    """Local stand-in that tags each string with its target locale."""
+
+    name = 'mock'
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+
+    async def translate(self, texts, source, target):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [f'[{target}] {text}' for text in texts]
+
+
+BACKENDS = {'mock': MockBackend}
+
+
+def load_backend(spec):
+    """Instantiate a registered backend or a ``package.module:Factory`` spec."""
+    if spec in BACKENDS:
+        return BACKENDS[spec]()
+    module_name, sep, attr = spec.partition(':')
+    if not sep:
+        raise ValueError(f'unknown backend {spec!r} (choose from {", ".join(BACKENDS)} or use module:Factory)')
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+class TranslationMemory:
+    """Persistent ``(backend, target, source text) -> translation`` store."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('version') == MEMORY_VERSION:
+            self.entries = data.get('entries', {})
+
+    @staticmethod
+    def key(backend, target, text):
+        return f'{backend}:{target}:{content_hash(text.encode("utf-8"))}'
+
+    def get(self, backend, target, text):
+        entry = self.entries.get(self.key(backend, target, text))
+        return entry['text'] if entry else None
+
+    def put(self, backend, target, text, translation):
+        self.entries[self.key(backend, target, text)] = {'source': text, 'text': translation}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        data = {'version': MEMORY_VERSION, 'entries': dict(sorted(self.entries.items()))}
+        atomic_write(self.path, (json.dumps(data, ensure_ascii=False, indent=2) + '\n').encode('utf-8'))
+        self.dirty = False
+
+
+class FilledSource(Mapping):
+    """``sources`` with machine-translated ``fills`` added under authored keys."""
+
+    def __init__(self, sources, fills):
+        self.sources = sources
+        self.fills = fills
+
+    def __getitem__(self, lang):
+        own = self.sources[lang]
+        fills = self.fills.get(lang)
+        if not fills:
+            return own
+        return {**own, **{key: value for key, value in fills.items() if key not in own}}
+
+    def digest(self, langs=None):
+        fills = self.fills if langs is None else {lang: self.fills[lang] for lang in langs if lang in self.fills}
+        fills = json.dumps(fills, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        return content_hash(f'{self.sources.digest(langs)}|{content_hash(fills)}'.encode('utf-8'))
+
+    def __iter__(self):
+        return iter(self.sources)
+
+    def __len__(self):
+        return len(self.sources)
+
+
+class RateLimiter:
+    """Spaces out acquisitions to at most ``rate`` per second (falsy: unlimited)."""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self.lock:
+            now = asyncio.get_running_loop().time()
+            delay = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def source_texts(value):
+    return [item for item in (value if isinstance(value, list) else [value]) if isinstance(item, str) and item.strip()]
+
+
+def make_batches(pending):
+    """Split ``{target: [text, ...]}`` into ``(target, texts)`` batches."""
+    batches = []
+    for target, texts in pending.items():
+        batch, chars = [], 0
+        for text in texts:
+            if batch and (len(batch) == BATCH_SIZE or chars + len(text) > BATCH_CHARS):
+                batches.append((target, batch))
+                batch, chars = [], 0
+            batch.append(text)
+            chars += len(text)
+        if batch:
+            batches.append((target, batch))
+    return batches
+
+
+async def run_batches(backend, batches, root, concurrency, rate):
+    """Send ``batches`` concurrently; returns results and the failed batches."""
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate)
+
+    async def send(target, texts):
+        async with semaphore:
+            await limiter.wait()
+            translated = await backend.translate(texts, root, target)
+        if len(translated) != len(texts):
+            raise ValueError(f'{backend.name} returned {len(translated)} strings for {len(texts)}')
+        return target, dict(zip(texts, translated))
+
+    outcomes = await asyncio.gather(*(send(target, texts) for target, texts in batches), return_exceptions=True)
+    results, failed = [], []
+    for batch, outcome in zip(batches, outcomes):
+        if isinstance(outcome, Exception):
+            failed.append((batch[0], len(batch[1]), outcome))
+        else:
+            results.append(outcome)
+    return results, failed
+
+
+def translate_missing(sources, locales, parents, backend, memory, *, root=ROOT_LOCALE, concurrency=4, rate=None):
+    """Fill the untranslated keys of ``locales`` through ``backend``.
+
+    Returns a :class:`FilledSource` over ``sources`` and a stats dict. Keys
+    whose batch failed keep falling back to the root.
+    """
+    root_table = sources[root]
+    missing = {}
+    pending = {}
+    from_memory = 0
+    for lang in locales:
+        keys = untranslated_keys(sources, lang, parents, root)
+        if not keys:
+            continue
+        missing[lang] = keys
+        wanted = dict.fromkeys(text for key in keys for text in source_texts(root_table[key]))
+        for text in wanted:
+            if memory.get(backend.name, lang, text) is None:
+                pending.setdefault(lang, []).append(text)
+            else:
+                from_memory += 1
+
+    batches = make_batches(pending)
+    results, failed = asyncio.run(run_batches(backend, batches, root, concurrency, rate)) if batches else ([], [])
+    for target, translated in results:
+        for text, translation in translated.items():
+            memory.put(backend.name, target, text, translation)
+
+    fills = {}
+    for lang, keys in missing.items():
+        for key in keys:
+            value = root_table[key]
+            if not source_texts(value):
+                continue
+            items = value if isinstance(value, list) else [value]
+            translated = [memory.get(backend.name, lang, item) if source_texts(item) else item for item in items]
+            if any(item is None for item in translated):
+                continue
+            fills.setdefault(lang, {})[key] = translated if isinstance(value, list) else translated[0]
+
+    stats = {
+        'missing': sum(len(keys) for keys in missing.values()),
+        'filled': sum(len(keys) for keys in fills.values()),
+        'from_memory': from_memory,
+        'requested': sum(len(texts) for texts in pending.values()),
+        'batches': len(batches),
+        'failed': [f'{target}: {count} string(s): {error}' for target, count, error in failed],
+    }
+    return FilledSource(sources, fills), stats
+
+
+def print_translation_summary(stats, label='Translate'):
+    print(f'{label}: {stats["filled"]}/{stats["missing"]} missing key(s) filled; {stats["from_memory"]} string(s) '
+          f'from memory, {stats["requested"]} requested in {stats["batches"]} batch(es).')
+    for failure in stats['failed']:
+        print(f'  - failed {failure}')
@@ -0,0 +1,355 @@
+"""Look-alike (typo-squat) domain candidates for the official carrier domains.
+
+``generate_candidates`` derives the variants scammers typically register from
+an official domain: homoglyphs, digit substitution, hyphenation, TLD swaps and
+single-character insertions, deletions and transpositions. ``TyposquatIndex``
+stores every candidate in a hash map for exact hits, and indexes the official
+"skeletons" (look-alike characters folded, hyphens removed) in a dict and a
+BK-tree, so variants that were not enumerated are still caught without a
+linear edit-distance scan over every carrier. A skeleton keeps its public
+suffix: only the official one and the ``SWAP_TLDS`` scammers register are
+indexed, so a carrier's own country domains (dhl.de, post.at) never fold onto
+another official domain. Labels that add a word to a carrier name
+(usps-tracking.com, mysingpost.com) and hosts that start with an official
+domain (usps.com-tracking.info) are caught by rule.
+
+Genuine carrier domains that the page does not list (ups.com, laposte.net)
+are passed as ``known``: they and their subdomains are never reported, and
+they are removed from every candidate set.
+
+src/lib/typosquat.js runs the same lookups over :meth:`TyposquatIndex.to_artifact`;
+``lookalikeCases`` in the domain data pin the results both sides must give.
+"""
+import re
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz0123456789'
+
+# Numbers that are used in place of letters (rhythmn3xus, singp0st).
+DIGIT_SUBSTITUTIONS = {
+    'o': '0', 'i': '1', 'l': '1', 'e': '3', 'a': '4', 's': '5', 't': '7', 'b': '8', 'g': '9',
+}
+# Letter sequences that read as other letters in most fonts (dhI.com, rnyusps).
+HOMOGLYPHS = {
+    'l': ('i',), 'i': ('l',), 'm': ('rn',), 'w': ('vv',), 'd': ('cl',), 'rn': ('m',), 'vv': ('w',),
+    'cl': ('d',), 'o': ('q',), 'q': ('o',), 'u': ('v',), 'v': ('u',), 'n': ('m',),
+}
+SWAP_TLDS = ('com', 'net', 'org', 'info', 'shop', 'online', 'site', 'top', 'xyz', 'co', 'app', 'live', 'cc')
+# Multi-label public suffixes used by the carrier domains; everything else is
+# treated as a single-label TLD.
+MULTI_LABEL_SUFFIXES = {'com.au', 'com.sg', 'com.my', 'co.nz', 'co.uk', 'gov.in', 'co.jp'}
+
+TECHNIQUES = (
+    'homoglyph',
+    'digitSubstitution',
+    'hyphenInserted',
+    'wrongTld',
+    'extraLetter',
+    'missingLetter',
+    'transposedLetters',
+    'lookalike',
+    'extraWord',
+    'domainAppendTrick',
+)
+
+# Skeleton folding: map every look-alike back to one canonical form.
+SKELETON_SEQUENCES = (('rn', 'm'), ('vv', 'w'), ('cl', 'd'))
+SKELETON_CHARS = {'0': 'o', '1': 'l', 'i': 'l', '3': 'e', '4': 'a', '5': 's', '7': 't',
+                  '8': 'b', '9': 'g', 'q': 'o', 'v': 'u', '-': ''}
+_SKELETON_TABLE = str.maketrans({char: folded or None for char, folded in SKELETON_CHARS.items()})
+# Fuzzy (edit-distance) matches are only trusted for skeletons at least this
+# long; short labels such as "dhl" or "pos" are one edit away from too much.
+MIN_FUZZY_LENGTH = 6
+
+
+def normalize_host(text):
+    """Host of a domain or URL as typed, like ``normalizeHost`` in src/lib/normalizeHost.js.
+
+    The scheme, path, query, user info, port, a trailing dot and ``www.`` are
+    dropped.
+    """
+    host = re.sub(r'^[a-z][a-z0-9+.-]*://', '', str(text or '').strip().lower())
+    host = re.split(r'[/?#]', host, maxsplit=1)[0].split('@')[-1].split(':')[0]
+    return host.removesuffix('.').removeprefix('www.')
+
+
+def split_domain(domain):
+    """Return ``(prefix, label, suffix)``: subdomains, registrable label, public suffix."""
+    labels = domain.lower().rstrip('.').split('.')
+    suffix_len = 2 if len(labels) > 2 and '.'.join(labels[-2:]) in MULTI_LABEL_SUFFIXES else 1
+    suffix = '.'.join(labels[-suffix_len:])
+    label = labels[-suffix_len - 1] if len(labels) > suffix_len else ''
+    prefix = '.'.join(labels[:-suffix_len - 1])
+    return prefix, label, suffix
+
+
+def join_domain(prefix, label, suffix):
+    return '.'.join(part for part in (prefix, label, suffix) if part)
+
+
+def _label_variants(label):
+    for i, char in enumerate(label):
+        for seq, replacements in HOMOGLYPHS.items():
+            if label.startswith(seq, i):
+                for replacement in replacements:
+                    yield 'homoglyph', label[:i] + replacement + label[i + len(seq):]
+        if char in DIGIT_SUBSTITUTIONS:
+            yield 'digitSubstitution', label[:i] + DIGIT_SUBSTITUTIONS[char] + label[i + 1:]
+    for i in range(1, len(label)):
+        if label[i - 1] != '-' and label[i] != '-':
+            yield 'hyphenInserted', label[:i] + '-' + label[i:]
+    for i in range(len(label) + 1):
+        for char in ALPHABET:
+            yield 'extraLetter', label[:i] + char + label[i:]
+    for i in range(len(label)):
+        yield 'missingLetter', label[:i] + label[i + 1:]
+    for i in range(len(label) - 1):
+        if label[i] != label[i + 1]:
+            yield 'transposedLetters', label[:i] + label[i + 1] + label[i] + label[i + 2:]
+
+
+def generate_candidates(domain):
+    """Return ``{candidate_domain: technique}`` for one official domain.
+
+    The first technique (in generation order) that produces a candidate wins.
+    """
+    prefix, label, suffix = split_domain(domain)
+    official = join_domain(prefix, label, suffix)
+    candidates = {}
+    for technique, variant in _label_variants(label):
+        if len(variant) > 1 and not variant.startswith('-') and not variant.endswith('-'):
+            candidates.setdefault(join_domain(prefix, variant, suffix), technique)
+    for tld in SWAP_TLDS:
+        if tld != suffix:
+            candidates.setdefault(join_domain(prefix, label, tld), 'wrongTld')
+    candidates.pop(official, None)
+    return candidates
+
+
+def fold(text):
+    for seq, replacement in SKELETON_SEQUENCES:
+        text = text.replace(seq, replacement)
+    return text.translate(_SKELETON_TABLE)
+
+
+def folded_name(domain):
+    """Folded subdomains and registrable label of ``domain``, without the public suffix."""
+    prefix, label, _ = split_domain(domain)
+    return fold(f'{prefix}.{label}' if prefix else label)
+
+
+def skeleton(domain):
+    """Fold look-alike characters so that visually similar domains compare equal.
+
+    The public suffix is kept as is: dhl.de and dhl.com have different skeletons.
+    """
+    return f'{folded_name(domain)}.{split_domain(domain)[2]}'
+
+
+def edit_distance(a, b):
+    """Optimal-string-alignment distance: Levenshtein plus adjacent transpositions."""
+    if a == b:
+        return 0
+    before, previous = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if before is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        before, previous = previous, current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree over strings with ``edit_distance``."""
+
+    def __init__(self):
+        self.root = None
+
+    def add(self, word, value):
+        if self.root is None:
+            self.root = (word, [value], {})
+            return
+        node = self.root
+        while True:
+            distance = edit_distance(word, node[0])
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = (word, [value], {})
+                return
+            node = child
+
+    def search(self, word, max_distance):
+        """Return ``[(distance, value), ...]`` for entries within ``max_distance``."""
+        if self.root is None:
+            return []
+        results = []
+        stack = [self.root]
+        while stack:
+            node_word, values, children = stack.pop()
+            distance = edit_distance(word, node_word)
+            if distance <= max_distance:
+                results.extend((distance, value) for value in values)
+            for edge in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        return sorted(results)
+
+
+class TyposquatIndex:
+    """Candidate hash map plus skeleton lookups over a set of official domains.
+
+    ``known`` are further genuine carrier domains: never reported and never a
+    candidate, but not impersonation targets of their own.
+    """
+
+    def __init__(self, officials, max_distance=1, known=()):
+        self.officials = sorted({domain.lower() for domain in officials})
+        self.known = sorted({domain.lower() for domain in known} - set(self.officials))
+        self.official_set = set(self.officials) | set(self.known)
+        self.max_distance = max_distance
+        self.candidates = {}
+        for official in self.officials:
+            for candidate, technique in generate_candidates(official).items():
+                if not self.is_official(candidate):
+                    self.candidates.setdefault(candidate, (official, technique))
+        # Skeletons under the official suffix first, so they win over another
+        # carrier's TLD swap; only long names go into the BK-tree.
+        self.skeletons = {}
+        self.tree = BKTree()
+        swapped = []
+        for official in self.officials:
+            prefix, label, suffix = split_domain(official)
+            swapped.extend((join_domain(prefix, label, tld), official) for tld in SWAP_TLDS if tld != suffix)
+        for domain, official in [(official, official) for official in self.officials] + swapped:
+            folded = skeleton(domain)
+            if folded in self.skeletons or self.is_official(domain):
+                continue
+            self.skeletons[folded] = official
+            if len(folded_name(domain)) >= MIN_FUZZY_LENGTH:
+                self.tree.add(folded, official)
+        # Folded carrier names (the registrable label and its hyphenated parts),
+        # shortest official domain first: usps.com rather than tools.usps.com.
+        self.brands = {}
+        for official in sorted(self.officials, key=lambda domain: (len(domain), domain)):
+            label = split_domain(official)[1]
+            for name in (label, *label.split('-')):
+                self.brands.setdefault(fold(name), official)
+
+    def is_official(self, domain):
+        """True for an official domain or any subdomain of one."""
+        while domain:
+            if domain in self.official_set:
+                return True
+            domain = domain.partition('.')[2]
+        return False
+
+    def brand_in_label(self, label, suffix):
+        """Return ``(official, technique)`` for the carrier name ``label`` contains, or ``None``.
+
+        A name matches a whole hyphen-separated word of the label, or any part
+        of it once it is at least ``MIN_FUZZY_LENGTH`` characters long; the
+        longest name wins (``extraWord``). A label that is just the name is a
+        ``wrongTld`` hit under one of the ``SWAP_TLDS`` and no hit elsewhere:
+        carriers own their name under many country TLDs.
+        """
+        words = {fold(word) for word in label.split('-')}
+        joined = fold(label)
+        found = [(-len(name), official) for name, official in self.brands.items()
+                 if name != joined and (name in words or (len(name) >= MIN_FUZZY_LENGTH and name in joined))]
+        if found:
+            return min(found)[1], 'extraWord'
+        if joined in self.brands and suffix in SWAP_TLDS:
+            return self.brands[joined], 'wrongTld'
+        return None
+
+    def check(self, domain):
+        """Return ``None`` for official or known domains and unrelated ones, otherwise a
+        dict with the impersonated ``official`` domain and the ``technique``.
+
+        ``domain`` may be a URL. Lookups are an exact candidate hit, then an
+        exact skeleton hit, then a BK-tree search over the official skeletons,
+        then the official-domain-prefix and carrier-name rules.
+        """
+        domain = normalize_host(domain)
+        if not domain or self.is_official(domain):
+            return None
+        hit = self.candidates.get(domain)
+        if hit:
+            return {'domain': domain, 'official': hit[0], 'technique': hit[1]}
+        folded = skeleton(domain)
+        official = self.skeletons.get(folded)
+        if official:
+            return {'domain': domain, 'official': official, 'technique': 'lookalike', 'distance': 0}
+        nearest = self.tree.search(folded, self.max_distance) if len(folded_name(domain)) >= MIN_FUZZY_LENGTH else []
+        if nearest:
+            distance, official = nearest[0]
+            return {'domain': domain, 'official': official, 'technique': 'lookalike', 'distance': distance}
+        for official in self.officials:
+            if domain.startswith((f'{official}.', f'{official}-')):
+                return {'domain': domain, 'official': official, 'technique': 'domainAppendTrick'}
+        _, label, suffix = split_domain(domain)
+        hit = self.brand_in_label(label, suffix)
+        if hit:
+            return {'domain': domain, 'official': hit[0], 'technique': hit[1]}
+        return None
+
+    def check_cases(self, cases):
+        """Raise ``ValueError`` unless ``check`` gives every case its expected result.
+
+        A case is ``{"input", "official", "technique"}``; ``official`` is null
+        for inputs that must not match.
+        """
+        failures = []
+        for case in cases:
+            match = self.check(case['input'])
+            got = match and {'official': match['official'], 'technique': match['technique']}
+            want = case['official'] and {'official': case['official'], 'technique': case['technique']}
+            if got != want:
+                failures.append(f'{case["input"]!r}: expected {want}, got {got}')
+        if failures:
+            raise ValueError('Look-alike cases failed:\n  ' + '\n  '.join(failures))
+
+    def to_artifact(self):
+        """Compact JSON-ready index for src/lib/typosquat.js.
+
+        Candidates map to ``[official index, technique index]``. Single-letter
+        insertions (the bulk of the candidates) are left out: the JS side finds
+        them by deleting each character of the queried label instead. The
+        BK-tree ships as nested ``[skeleton, [official index, ...], {distance:
+        child}]`` nodes.
+        """
+        official_ids = {domain: i for i, domain in enumerate(self.officials)}
+        technique_ids = {technique: i for i, technique in enumerate(TECHNIQUES)}
+
+        def tree_node(node):
+            word, values, children = node
+            return [word, [official_ids[official] for official in values],
+                    {str(distance): tree_node(child) for distance, child in sorted(children.items())}]
+
+        return {
+            'officials': self.officials,
+            'known': self.known,
+            'techniques': list(TECHNIQUES),
+            'suffixes': sorted(MULTI_LABEL_SUFFIXES),
+            'swapTlds': list(SWAP_TLDS),
+            'skeletonSequences': [list(pair) for pair in SKELETON_SEQUENCES],
+            'skeletonChars': SKELETON_CHARS,
+            'skeletons': {folded: official_ids[official] for folded, official in self.skeletons.items()},
+            'fuzzy': {
+                'minLength': MIN_FUZZY_LENGTH,
+                'maxDistance': self.max_distance,
+                'tree': tree_node(self.tree.root) if self.tree.root else None,
+            },
+            'brands': {name: official_ids[official] for name, official in sorted(self.brands.items())},
+            'candidates': {
+                candidate: [official_ids[official], technique_ids[technique]]
+                for candidate, (official, technique) in sorted(self.candidates.items())
+                if technique != 'extraLetter'
+            },
+        }
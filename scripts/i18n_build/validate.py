@@ -0,0 +1,123 @@
+"""Schema and completeness checks for authored locale tables."""
+import re
+
+from .messageformat import MessageSyntaxError, argument_names, parse_message
+from .sources import ROOT_LOCALE
+
+PLACEHOLDER_RE = re.compile(r'\{\{?\s*([A-Za-z_]\w*)')
+# Errors printed per locale in the console summary; the JSON report has all.
+SUMMARY_ERROR_LIMIT = 5
+# Above this many problem locales a catalog is summarized on a single line.
+SUMMARY_LOCALE_LIMIT = 8
+
+
+def placeholders(value):
+    """Sorted placeholder names of a string or list; a translation may repeat one."""
+    items = value if isinstance(value, list) else [value]
+    return sorted({name for item in items for name in PLACEHOLDER_RE.findall(item)})
+
+
+def message_arguments(value):
+    """Argument names of an ICU-style message (``[]`` for plain text), or the syntax error."""
+    if not isinstance(value, str) or '{' not in value:
+        return []
+    try:
+        return argument_names(parse_message(value))
+    except MessageSyntaxError as exc:
+        return exc
+
+
+def untranslated_keys(sources, lang, parents, root=ROOT_LOCALE):
+    """Root keys that ``lang`` only gets by falling back to the root, sorted."""
+    if lang == root:
+        return []
+    covered = set()
+    ancestor = lang
+    while ancestor != root:
+        covered |= sources[ancestor].keys()
+        ancestor = parents.get(ancestor, root)
+    return sorted(sources[root].keys() - covered)
+
+
+def check_locale(own, root_table, untranslated, root=ROOT_LOCALE):
+    """Report entry for one authored table (a self-contained unit for worker processes)."""
+    errors = []
+    for key, value in own.items():
+        if key not in root_table:
+            errors.append(f'{key}: not present in {root}')
+            continue
+        expected = root_table[key]
+        if type(value) is not type(expected):
+            errors.append(f'{key}: expected {type(expected).__name__}, got {type(value).__name__}')
+            continue
+        if isinstance(value, list) and len(value) != len(expected):
+            errors.append(f'{key}: expected {len(expected)} items, got {len(value)}')
+        items = value if isinstance(value, list) else [value]
+        if any(not isinstance(item, str) or not item.strip() for item in items):
+            errors.append(f'{key}: empty string')
+            continue
+        arguments, expected_arguments = message_arguments(value), message_arguments(expected)
+        if isinstance(arguments, MessageSyntaxError):
+            errors.append(f'{key}: {arguments}')
+        elif placeholders(value) != placeholders(expected):
+            errors.append(f'{key}: placeholders {placeholders(value)} != {placeholders(expected)}')
+        elif isinstance(expected_arguments, list) and arguments != expected_arguments:
+            errors.append(f'{key}: message arguments {arguments} != {expected_arguments}')
+
+    root_keys = root_table.keys()
+    return {
+        'authored': len(own),
+        'inherited': len(root_keys - own.keys()),
+        'untranslated': untranslated,
+        'coverage': round(1 - len(untranslated) / len(root_keys), 4) if root_keys else 1.0,
+        'errors': errors,
+    }
+
+
+def validate_locales(sources, locales, parents, root=ROOT_LOCALE, map_units=map):
+    """Check authored tables against ``root`` in a single pass per locale.
+
+    Reports, per locale: keys unknown to the root, values whose type (or list
+    length) differs from the root, placeholder mismatches, message syntax
+    errors and argument mismatches, empty strings, and
+    keys that are only filled by falling back to the root (untranslated).
+    Variants inheriting from a translated base are not counted as untranslated.
+    Locales are checked through ``map_units`` (e.g. a process pool's map).
+    """
+    locales = list(locales)
+    root_table = sources[root]
+    untranslated = [untranslated_keys(sources, lang, parents, root) for lang in locales]
+    entries = map_units(check_locale, [sources[lang] for lang in locales], [root_table] * len(locales),
+                        untranslated, [root] * len(locales))
+    report = {'root': root, 'keys': len(root_table), 'locales': dict(zip(locales, entries))}
+    report['ok'] = not any(entry['errors'] or entry['untranslated'] for entry in report['locales'].values())
+    return report
+
+
+def print_validation_summary(report, label='Validation'):
+    problems = {
+        lang: entry for lang, entry in report['locales'].items() if entry['errors'] or entry['untranslated']
+    }
+    if not problems:
+        print(f'{label}: {len(report["locales"])} locale(s) complete and consistent with {report["root"]}.')
+        return
+    if len(problems) > SUMMARY_LOCALE_LIMIT:
+        errors = sum(len(entry['errors']) for entry in problems.values())
+        untranslated = sum(len(entry['untranslated']) for entry in problems.values())
+        worst = sorted(problems, key=lambda lang: (problems[lang]['coverage'], lang))[:3]
+        lowest = ', '.join(f'{lang} {problems[lang]["coverage"]:.0%}' for lang in worst)
+        print(f'{label}: {len(problems)} of {len(report["locales"])} locale(s) with problems '
+              f'({errors} error(s), {untranslated} untranslated); lowest coverage: '
+              f'{lowest} (see --report).')
+        return
+    for lang, entry in problems.items():
+        print(f'{label}: {lang} coverage {entry["coverage"]:.0%}, '
+              f'{len(entry["untranslated"])} untranslated, {len(entry["errors"])} error(s)')
+        for error in entry['errors'][:SUMMARY_ERROR_LIMIT]:
+            print(f'  - {error}')
+        if len(entry['errors']) > SUMMARY_ERROR_LIMIT:
+            print(f'  - ... {len(entry["errors"]) - SUMMARY_ERROR_LIMIT} more (see --report)')
+        if entry['untranslated']:
+            shown = entry['untranslated'][:SUMMARY_ERROR_LIMIT * 4]
+            more = len(entry['untranslated']) - len(shown)
+            print(f'  - untranslated: {", ".join(shown)}{f" ... +{more}" if more else ""}')
@@ -1,13 +1,19 @@
 'use client';
 
 import React, { createContext, useState, useEffect } from 'react';
-import { translations } from './translations';
+import en from './i18n/ui/en';
+import { loaders } from './i18n/ui';
+import { negotiateLocale } from './lib/negotiateLocale';
 import { detectLanguageFromIPWithRestrictions, detectLanguageFromBrowser } from './ipGeolocation';
 import LanguageModal from './LanguageModal';
 
 const PHONE_POPUP_LANGUAGE_TRIGGER_KEY = 'rnx_language_selection_event';
 const LANGUAGE_SELECTED_SESSION_KEY = 'rnx_language_selected';
 
+// Tags the ui catalog cannot place are kept (lowercased) rather than turned
+// into English: their empty pack makes tStrict report "not translated".
+const normalizeLang = (code) => negotiateLocale('ui', code, null) || (code || 'en').toLowerCase();
+
 const emitLanguageSelectionEvent = () => {
   if (typeof window === 'undefined') return;
   try {
@@ -70,6 +76,10 @@ const getCountryFlag = (code) => {
 
 export const LanguageContext = createContext();
 
+// Locale packs are code-split (see scripts/locales/ui/); English is bundled because
+// it is the first paint and the fallback for missing keys.
+const loadedPacks = { en };
+
 const normalizeTranslatedText = (value) => {
   if (typeof value !== 'string') return value;
   return value
@@ -83,6 +93,10 @@ export const LanguageProvider = ({ children }) => {
   const [detectedCountry, setDetectedCountry] = useState(null);
   const [languageOptions, setLanguageOptions] = useState([]);
   const [isMounted, setIsMounted] = useState(false);
+  // The pack shown and the language it belongs to: while another language's
+  // pack loads, `messages` still holds the previous one.
+  const [pack, setPack] = useState({ lang: 'en', messages: en });
+  const { messages } = pack;
 
   // Ensure we only run on client side after mount
   useEffect(() => {
@@ -105,13 +119,6 @@ export const LanguageProvider = ({ children }) => {
       if (ipResult) {
         if (ipResult.blocked) {
           console.log('🚫 Access blocked geolocation detected, skipping language modal');
-          const normalizeLang = (code) => {
-            const c = (code || 'en').toLowerCase();
-            if (c === 'zh-cn' || c === 'zh-hans') return 'zh';
-            if (c === 'zh-tw' || c === 'zh-hant') return 'zh-hant';
-            if (c === 'zh-hk' || c === 'yue') return 'yue';
-            return c;
-          };
           const blockedDefaultLang = ipResult.countryCode === 'SG'
             ? 'en'
             : normalizeLang(ipResult.languageCode || 'en');
@@ -127,13 +134,6 @@ export const LanguageProvider = ({ children }) => {
         console.log('✓ Language Options:', ipResult.languageOptions);
         
         setDetectedCountry(ipResult.countryCode);
-        const normalizeLang = (code) => {
-          const c = (code || 'en').toLowerCase();
-          if (c === 'zh-cn' || c === 'zh-hans') return 'zh';
-          if (c === 'zh-tw' || c === 'zh-hant') return 'zh-hant';
-          if (c === 'zh-hk' || c === 'yue') return 'yue';
-          return c;
-        };
         const detectedDefaultLang = ipResult.countryCode === 'SG'
           ? 'en'
           : normalizeLang(ipResult.languageCode || 'en');
@@ -162,13 +162,6 @@ export const LanguageProvider = ({ children }) => {
       } else {
         console.warn('❌ IP detection failed, falling back to browser language');
         const browserLang = detectLanguageFromBrowser();
-        const normalizeLang = (code) => {
-          const c = (code || 'en').toLowerCase();
-          if (c === 'zh-cn' || c === 'zh-hans') return 'zh';
-          if (c === 'zh-tw' || c === 'zh-hant') return 'zh-hant';
-          if (c === 'zh-hk' || c === 'yue') return 'yue';
-          return c;
-        };
         setLanguage(normalizeLang(browserLang));
         setShowLanguageModal(false);
       }
@@ -190,14 +183,30 @@ export const LanguageProvider = ({ children }) => {
     }
   }, [language, isMounted]);
 
-  const handleLanguageSelect = (langCode) => {
-    const normalizeLang = (code) => {
-      const c = (code || 'en').toLowerCase();
-      if (c === 'zh-cn' || c === 'zh-hans') return 'zh';
-      if (c === 'zh-tw' || c === 'zh-hant') return 'zh-hant';
-      if (c === 'zh-hk' || c === 'yue') return 'yue';
-      return c;
+  useEffect(() => {
+    let cancelled = false;
+    if (loadedPacks[language]) {
+      setPack({ lang: language, messages: loadedPacks[language] });
+      return undefined;
+    }
+    if (!loaders[language]) {
+      setPack({ lang: language, messages: {} });
+      return undefined;
+    }
+    loaders[language]()
+      .then((module) => {
+        loadedPacks[language] = module.default;
+        if (!cancelled) setPack({ lang: language, messages: module.default });
+      })
+      .catch(() => {
+        if (!cancelled) setPack({ lang: language, messages: {} });
+      });
+    return () => {
+      cancelled = true;
     };
+  }, [language]);
+
+  const handleLanguageSelect = (langCode) => {
     setLanguage(normalizeLang(langCode));
     if (typeof window !== 'undefined') {
       try {
@@ -214,14 +223,7 @@ export const LanguageProvider = ({ children }) => {
 
   // Simple language change without any storage
   const changeLanguage = (langCode) => {
-    const normalizeLang2 = (code) => {
-      const c = (code || 'en').toLowerCase();
-      if (c === 'zh-cn' || c === 'zh-hans') return 'zh';
-      if (c === 'zh-tw' || c === 'zh-hant') return 'zh-hant';
-      if (c === 'zh-hk' || c === 'yue') return 'yue';
-      return c;
-    };
-    setLanguage(normalizeLang2(langCode));
+    setLanguage(normalizeLang(langCode));
     if (typeof window !== 'undefined') {
       try {
         sessionStorage.setItem(PHONE_POPUP_LANGUAGE_TRIGGER_KEY, String(Date.now()));
@@ -233,18 +235,19 @@ export const LanguageProvider = ({ children }) => {
     emitLanguageSelectionEvent();
   };
 
+  // Only true for the current language's own pack, not for one still loading.
   const hasTranslation = (key) => {
-    const langPack = translations[language] || {};
-    return Object.prototype.hasOwnProperty.call(langPack, key);
+    return pack.lang === language && Object.prototype.hasOwnProperty.call(messages, key);
   };
 
   // Strict translator: returns only current-language value, no English fallback
+  // (undefined until the current language's pack has loaded)
   const tStrict = (key) => {
-    return hasTranslation(key) ? normalizeTranslatedText(translations[language][key]) : undefined;
+    return hasTranslation(key) ? normalizeTranslatedText(messages[key]) : undefined;
   };
 
   const t = (key) => {
-    return normalizeTranslatedText(translations[language]?.[key] || translations['en']?.[key] || key);
+    return normalizeTranslatedText(messages[key] || en[key] || key);
   };
 
   return (
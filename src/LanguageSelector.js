@@ -2,7 +2,7 @@
 
 import React from 'react';
 import { useLanguage } from './LanguageContext';
-import { languageMap } from './translations';
+import { languageMap } from './i18n/ui';
 
 // English names for alphabetical sorting
 const languageEnglishNames = {
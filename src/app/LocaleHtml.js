@@ -0,0 +1,18 @@
+'use client';
+
+import { useSelectedLayoutSegments } from "next/navigation";
+import { htmlLang } from "./blog/parcel-scams/prerender/htmlLang";
+
+// The root <html>, declaring the language of the prerendered per-locale pages
+// (/blog/parcel-scams/<lang>) in their static HTML instead of "en". The
+// segments are known while prerendering, so no client round trip is needed;
+// LanguageContext still updates the attribute once a language is picked.
+export function LocaleHtml({ children, ...props }) {
+  const [first, second, lang] = useSelectedLayoutSegments();
+  const tag = first === 'blog' && second === 'parcel-scams' && htmlLang[lang];
+  return (
+    <html lang={tag || 'en'} {...props}>
+      {children}
+    </html>
+  );
+}
@@ -1,6 +1,6 @@
 import { NextResponse } from 'next/server';
 import { sendParcelEnquiryEmail } from '../../../lib/email';
-import { validateEmail } from '../../../lib/spam-detection';
+import { loadSpamMessages, validateEmail } from '../../../lib/spam-detection';
 import { verifyCaptchaToken } from '../captcha/verify-token';
 
 export async function POST(request) {
@@ -42,6 +42,7 @@ export async function POST(request) {
     }
 
     // Validate email
+    await loadSpamMessages(language);
     const emailValidation = validateEmail(email, language);
     if (!emailValidation.valid) {
       return NextResponse.json(
@@ -0,0 +1,31 @@
+'use client';
+
+import React from "react";
+import { useRouter } from "next/navigation";
+import "../../../App.css";
+import { useLanguage } from "../../../LanguageContext";
+import { Navigation } from "../../../components/Navigation";
+
+function BackButton() {
+  const { t } = useLanguage();
+  const router = useRouter();
+  return (
+    <button onClick={() => router.back()} className="back-button">
+      <span>&larr;</span> {t('backButton')}
+    </button>
+  );
+}
+
+export const BlogPageLayout = ({ children }) => {
+  const { t } = useLanguage();
+  return (
+    <>
+      <Navigation />
+      <div className="container mt-5">
+        <BackButton />
+        <div className="blog-content-card">{children}</div>
+        <p className="text-muted">© {new Date().getFullYear()} Rhythm Nexus. {t('copyrightText')}</p>
+      </div>
+    </>
+  );
+};
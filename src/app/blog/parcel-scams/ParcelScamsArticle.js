@@ -0,0 +1,167 @@
+import React from "react";
+import { sections, others, domainIndex } from "../../../lib/scam-domains";
+
+const sectionCardStyle = {
+  backgroundColor: '#ffffff',
+  border: '1px solid #e5e7eb',
+  borderRadius: '8px',
+  padding: '1rem 1.1rem',
+  marginBottom: '1rem',
+};
+
+const infoBannerStyle = {
+  backgroundColor: '#fff8e1',
+  border: '1px solid #ffe08a',
+  borderRadius: '8px',
+  padding: '0.7rem 0.9rem',
+  marginBottom: '0.8rem',
+};
+
+const dangerBannerStyle = {
+  backgroundColor: '#fdebec',
+  border: '1px solid #f8c7cc',
+  borderRadius: '8px',
+  padding: '0.7rem 0.9rem',
+  marginBottom: '0.8rem',
+};
+
+const domainChipStyle = {
+  display: 'inline-block',
+  fontFamily: 'monospace',
+  backgroundColor: '#ecfdf3',
+  border: '1px solid #b7efce',
+  borderRadius: '6px',
+  padding: '0.2rem 0.45rem',
+  marginRight: '0.35rem',
+  marginBottom: '0.35rem',
+};
+
+const borderedTableStyle = {
+  backgroundColor: '#fff',
+  border: '1px solid #cbd5e1',
+};
+
+const borderedCellStyle = {
+  border: '1px solid #cbd5e1',
+};
+
+function ComparisonTable({ s, section }) {
+  return (
+    <>
+      <div style={{ marginBottom: '0.5rem' }}>
+        <strong>✅ {s.officialLabel}: </strong>
+        {section.official.map((d) => (
+          <span key={d} style={domainChipStyle}>{d}</span>
+        ))}
+      </div>
+      <table className="table table-sm table-bordered table-striped table-hover" style={borderedTableStyle}>
+      <thead className="table-light">
+        <tr>
+          <th style={borderedCellStyle}>🚫 {s.fakeLabel}</th>
+          <th style={borderedCellStyle}>🧩 {s.patternLabel}</th>
+        </tr>
+      </thead>
+      <tbody>
+        {section.fake.map((domain) => {
+          const { pattern } = domainIndex[domain.toLowerCase()];
+          return (
+            <tr key={domain}>
+              <td style={borderedCellStyle}><code>{domain}</code></td>
+              <td style={borderedCellStyle}>{s[`pattern.${pattern}`] || pattern}</td>
+            </tr>
+          );
+        })}
+      </tbody>
+    </table>
+    </>
+  );
+}
+
+// Section headings are numbered from their position here, so reordering the
+// sections does not mean editing every locale's strings.
+const SECTION_ORDER = [
+  'sectionOur', 'sectionHow', 'sectionSingpost', 'sectionUsps', 'sectionDhl', 'sectionOthers', 'sectionTips',
+];
+const LAST_UPDATED = '2026-03-01';
+
+function heading(m, key) {
+  return m[key]({ n: SECTION_ORDER.indexOf(key) + 1 });
+}
+
+// Article body shared by the client-rendered page and the prerendered
+// /blog/parcel-scams/<lang> pages; it only renders the strings (s) and the
+// compiled messages (m, see ./messages) it is given.
+export function ParcelScamsArticle({ s, m }) {
+  return (
+    <>
+      <h2>⚠️ {s.title}</h2>
+      <p>{s.intro}</p>
+      <p style={{ fontSize: '0.85rem', color: '#666' }}>{m.lastUpdated({ date: LAST_UPDATED })}</p>
+
+      <div style={sectionCardStyle}>
+        <h3>🌐 {heading(m, 'sectionOur')}</h3>
+        <p><strong>{s.officialOnly}</strong></p>
+        <div style={infoBannerStyle}>🔍 {s.checkTypos}</div>
+        <ComparisonTable s={s} section={sections.ours} />
+      </div>
+
+      <div style={sectionCardStyle}>
+        <h3>🛑 {heading(m, 'sectionHow')}</h3>
+        <p>{s.howText}</p>
+      </div>
+
+      <div style={sectionCardStyle}>
+        <h3>🇸🇬 {heading(m, 'sectionSingpost')}</h3>
+        <ComparisonTable s={s} section={sections.singpost} />
+        <p><strong>⚠️ {s.warningLabel}:</strong></p>
+        <ul>{sections.singpost.warnings.map((w) => <li key={w}>{s[`warning.${w}`] || w}</li>)}</ul>
+      </div>
+
+      <div style={sectionCardStyle}>
+        <h3>🇺🇸 {heading(m, 'sectionUsps')}</h3>
+        <ComparisonTable s={s} section={sections.usps} />
+        <p><strong>⚠️ {s.warningLabel}:</strong></p>
+        <ul>{sections.usps.warnings.map((w) => <li key={w}>{s[`warning.${w}`] || w}</li>)}</ul>
+      </div>
+
+      <div style={sectionCardStyle}>
+        <h3>📦 {heading(m, 'sectionDhl')}</h3>
+        <ComparisonTable s={s} section={sections.dhl} />
+        <p><strong>⚠️ {s.warningLabel}:</strong></p>
+        <ul>{sections.dhl.warnings.map((w) => <li key={w}>{s[`warning.${w}`] || w}</li>)}</ul>
+      </div>
+
+      <div style={sectionCardStyle}>
+      <h3>🗺️ {heading(m, 'sectionOthers')}</h3>
+      <p>{s.howText}</p>
+      <table className="table table-sm table-bordered table-striped table-hover" style={borderedTableStyle}>
+        <thead>
+          <tr>
+            <th style={borderedCellStyle}>📮 Carrier</th>
+            <th style={borderedCellStyle}>✅ {s.officialLabel}</th>
+            <th style={borderedCellStyle}>🚫 {s.fakeLabel}</th>
+          </tr>
+        </thead>
+        <tbody>
+          {others.map((row) => (
+            <tr key={row.carrier}>
+              <td style={borderedCellStyle}>{row.carrier}</td>
+              <td style={borderedCellStyle}><code>{row.official}</code></td>
+              <td style={borderedCellStyle}><code>{row.fake}</code></td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+      </div>
+
+      <div style={sectionCardStyle}>
+        <h3>✅ {heading(m, 'sectionTips')}</h3>
+        <ul>{s.tips.map((tip) => <li key={tip}>{tip}</li>)}</ul>
+      </div>
+
+      <p style={{ ...dangerBannerStyle, fontSize: '0.9rem', color: '#666' }}>
+        <strong>{s.disclaimerTitle}:</strong> {s.disclaimer}
+      </p>
+    </>
+  );
+}
@@ -0,0 +1,45 @@
+import { notFound } from "next/navigation";
+import { alternates, loaders, params } from "../prerender";
+import { loaders as messageLoaders } from "../messages";
+import { BlogPageLayout } from "../BlogPageLayout";
+import { ParcelScamsArticle } from "../ParcelScamsArticle";
+
+// One static page per generated locale (scripts/generate_parcel_scams_i18n.py
+// writes ../prerender): crawlers and first paint get the translated HTML
+// without waiting for the client to pick a language.
+export const dynamicParams = false;
+
+export function generateStaticParams() {
+  return params;
+}
+
+async function loadStrings(lang) {
+  if (!loaders[lang]) notFound();
+  return loaders[lang]();
+}
+
+export async function generateMetadata({ params: routeParams }) {
+  const { lang } = await routeParams;
+  const s = await loadStrings(lang);
+  return {
+    title: s.title,
+    description: s.intro,
+    alternates: {
+      canonical: `/blog/parcel-scams/${lang}`,
+      languages: alternates,
+    },
+  };
+}
+
+export default async function ParcelScamsLocalePage({ params: routeParams }) {
+  const { lang } = await routeParams;
+  const s = await loadStrings(lang);
+  const m = (await messageLoaders[lang]()).default;
+  return (
+    <BlogPageLayout>
+      <div lang={lang}>
+        <ParcelScamsArticle s={s} m={m} />
+      </div>
+    </BlogPageLayout>
+  );
+}
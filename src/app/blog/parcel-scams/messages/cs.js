@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "cs";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Oficiální web Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Jak fungují podvody se sledováním zásilek`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Srovnání podvodů SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Srovnání podvodů USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Srovnání podvodů DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Další dopravci a destinace`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Bezpečnostní kontrolní seznam`,
+  "lastUpdated": (a) => `Aktualizováno: ${date1.format(new Date(a.date))}`,
+};
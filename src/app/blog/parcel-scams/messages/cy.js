@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "cy";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Gwefan swyddogol Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Sut mae twyll olrhain pecynnau yn gweithio`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Cymhariaeth twyll SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Cymhariaeth twyll USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Cymhariaeth twyll DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Cludwyr a chyrchfannau eraill`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Rhestr wirio diogelwch`,
+  "lastUpdated": (a) => `Diweddarwyd ddiwethaf: ${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "de";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Offizielle Rhythm Nexus Website`,
+  "sectionHow": (a) => `${number0.format(a.n)}) So funktionieren Tracking-Betrügereien`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost-Betrugsvergleich`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS-Betrugsvergleich`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL-Betrugsvergleich`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Weitere Zusteller und Ziele`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Sicherheits-Checkliste`,
+  "lastUpdated": (a) => `Zuletzt aktualisiert: ${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "es";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Sitio oficial de Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Cómo funcionan las estafas de seguimiento`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Comparación de estafas de SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Comparación de estafas de USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Comparación de estafas de DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Otros transportistas y destinos`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Lista de seguridad`,
+  "lastUpdated": (a) => `Última actualización: ${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "fi";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Rhythm Nexusin virallinen sivusto`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Miten pakettiseurantahuijaukset toimivat`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost-huijausvertailu`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS-huijausvertailu`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL-huijausvertailu`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Muut kuljetusyhtiöt ja kohteet`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Turvallisuuslista`,
+  "lastUpdated": (a) => `Päivitetty: ${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "fr";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Site officiel Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Comment fonctionnent les arnaques au suivi`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Comparatif arnaques SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Comparatif arnaques USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Comparatif arnaques DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Autres transporteurs et destinations`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Liste de sécurité`,
+  "lastUpdated": (a) => `Dernière mise à jour : ${date1.format(new Date(a.date))}`,
+};
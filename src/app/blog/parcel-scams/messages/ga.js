@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "ga";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Suíomh oifigiúil Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Conas a oibríonn camscéimeanna rianaithe beartán`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Comparáid calaoise SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Comparáid calaoise USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Comparáid calaoise DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Iompróirí agus cinn scríbe eile`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Seicliosta sábháilteachta`,
+  "lastUpdated": (a) => `Nuashonraithe deireanach: ${date1.format(new Date(a.date))}`,
+};
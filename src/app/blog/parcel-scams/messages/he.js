@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "he";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) האתר הרשמי של Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) איך הונאות מעקב חבילות עובדות`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) השוואת הונאות SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) השוואת הונאות USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) השוואת הונאות DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) חברות שילוח נוספות ויעדים`,
+  "sectionTips": (a) => `${number0.format(a.n)}) רשימת בטיחות`,
+  "lastUpdated": (a) => `עודכן לאחרונה: ${date1.format(new Date(a.date))}`,
+};
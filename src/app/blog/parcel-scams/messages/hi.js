@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "hi";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Rhythm Nexus की आधिकारिक वेबसाइट`,
+  "sectionHow": (a) => `${number0.format(a.n)}) पार्सल ट्रैकिंग स्कैम कैसे काम करता है`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost स्कैम तुलना`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS स्कैम तुलना`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL स्कैम तुलना`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) अन्य कैरियर और गंतव्य`,
+  "sectionTips": (a) => `${number0.format(a.n)}) सुरक्षा चेकलिस्ट`,
+  "lastUpdated": (a) => `अंतिम अपडेट: ${date1.format(new Date(a.date))}`,
+};
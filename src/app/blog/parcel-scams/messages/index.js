@@ -0,0 +1,35 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+export const locales = ["en","cs","cy","de","es","fi","fr","ga","he","hi","id","it","ja","ko","mi","ms","nl","no","pl","pt","ru","sv","ta","th","tl","vi","yue","zh","zh-hant"];
+
+// One chunk per locale: only the language that is actually requested is downloaded.
+export const loaders = {
+  "en": () => import("./en.js"),
+  "cs": () => import("./cs.js"),
+  "cy": () => import("./cy.js"),
+  "de": () => import("./de.js"),
+  "es": () => import("./es.js"),
+  "fi": () => import("./fi.js"),
+  "fr": () => import("./fr.js"),
+  "ga": () => import("./ga.js"),
+  "he": () => import("./he.js"),
+  "hi": () => import("./hi.js"),
+  "id": () => import("./id.js"),
+  "it": () => import("./it.js"),
+  "ja": () => import("./ja.js"),
+  "ko": () => import("./ko.js"),
+  "mi": () => import("./mi.js"),
+  "ms": () => import("./ms.js"),
+  "nl": () => import("./nl.js"),
+  "no": () => import("./no.js"),
+  "pl": () => import("./pl.js"),
+  "pt": () => import("./pt.js"),
+  "ru": () => import("./ru.js"),
+  "sv": () => import("./sv.js"),
+  "ta": () => import("./ta.js"),
+  "th": () => import("./th.js"),
+  "tl": () => import("./tl.js"),
+  "vi": () => import("./vi.js"),
+  "yue": () => import("./yue.js"),
+  "zh": () => import("./zh.js"),
+  "zh-hant": () => import("./zh-hant.js"),
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "it";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Sito ufficiale Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Come funzionano le truffe di tracciamento`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Confronto truffe SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Confronto truffe USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Confronto truffe DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Altri corrieri e destinazioni`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Checklist di sicurezza`,
+  "lastUpdated": (a) => `Ultimo aggiornamento: ${date1.format(new Date(a.date))}`,
+};
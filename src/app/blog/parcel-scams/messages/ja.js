@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "ja";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Rhythm Nexus 公式サイト`,
+  "sectionHow": (a) => `${number0.format(a.n)}) 荷物追跡詐欺の手口`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost 詐欺比較`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS 詐欺比較`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL 詐欺比較`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) その他の配送業者と配送先`,
+  "sectionTips": (a) => `${number0.format(a.n)}) 安全チェックリスト`,
+  "lastUpdated": (a) => `最終更新：${date1.format(new Date(a.date))}`,
+};
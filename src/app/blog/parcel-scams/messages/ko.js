@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "ko";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Rhythm Nexus 공식 웹사이트`,
+  "sectionHow": (a) => `${number0.format(a.n)}) 택배 추적 사기 수법`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost 사기 비교`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS 사기 비교`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL 사기 비교`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) 기타 운송사 및 목적지`,
+  "sectionTips": (a) => `${number0.format(a.n)}) 안전 체크리스트`,
+  "lastUpdated": (a) => `최종 업데이트: ${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "mi";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Pae mana o Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Me pēhea te mahi o ngā tinihanga aroturuki paraka`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Whakataurite tinihanga SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Whakataurite tinihanga USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Whakataurite tinihanga DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Ētahi atu kaikawe me ngā ūnga`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Rārangi haumaru`,
+  "lastUpdated": (a) => `Whakahōu whakamutunga: ${date1.format(new Date(a.date))}`,
+};
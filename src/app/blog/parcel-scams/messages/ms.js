@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "ms";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Laman web rasmi Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Cara penipuan penjejakan bungkusan berfungsi`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Perbandingan penipuan SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Perbandingan penipuan USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Perbandingan penipuan DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Pembawa dan destinasi lain`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Senarai semak keselamatan`,
+  "lastUpdated": (a) => `Kemaskini terakhir: ${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "nl";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Officiële website van Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Hoe pakkettracking-oplichting werkt`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost-oplichtingsvergelijking`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS-oplichtingsvergelijking`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL-oplichtingsvergelijking`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Andere vervoerders en bestemmingen`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Veiligheidschecklist`,
+  "lastUpdated": (a) => `Laatst bijgewerkt: ${date1.format(new Date(a.date))}`,
+};
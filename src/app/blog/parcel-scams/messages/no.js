@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "no";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Rhythm Nexus offisielle nettsted`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Hvordan pakkesporingssvindel fungerer`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost-svindelsammenligning`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS-svindelsammenligning`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL-svindelsammenligning`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Andre transportører og destinasjoner`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Sikkerhetssjekkliste`,
+  "lastUpdated": (a) => `Sist oppdatert: ${date1.format(new Date(a.date))}`,
+};
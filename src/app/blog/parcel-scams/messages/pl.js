@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "pl";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Oficjalna strona Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Jak działają oszustwa śledzenia paczek`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Porównanie oszustw SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Porównanie oszustw USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Porównanie oszustw DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Inni przewoźnicy i kierunki`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Lista bezpieczeństwa`,
+  "lastUpdated": (a) => `Ostatnia aktualizacja: ${date1.format(new Date(a.date))}`,
+};
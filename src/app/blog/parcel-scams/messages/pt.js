@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "pt";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Site oficial da Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Como funcionam os golpes de rastreamento`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Comparação de golpes SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Comparação de golpes USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Comparação de golpes DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Outras transportadoras e destinos`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Checklist de segurança`,
+  "lastUpdated": (a) => `Última atualização: ${date1.format(new Date(a.date))}`,
+};
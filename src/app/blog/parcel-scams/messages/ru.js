@@ -0,0 +1,16 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "ru";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"month":"long","timeZone":"UTC","calendar":"gregory"});
+const date2 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Официальный сайт Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Как работают мошенничества с отслеживанием`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) Сравнение мошенничества SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) Сравнение мошенничества USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) Сравнение мошенничества DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Другие перевозчики и направления`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Чек-лист безопасности`,
+  "lastUpdated": (a) => `Обновлено: ${date1.format(new Date(a.date))} ${date2.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "sv";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Rhythm Nexus officiella webbplats`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Hur paketspårningsbedrägerier fungerar`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost-bedrägerijämförelse`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS-bedrägerijämförelse`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL-bedrägerijämförelse`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Andra transportörer och destinationer`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Säkerhetschecklista`,
+  "lastUpdated": (a) => `Senast uppdaterad: ${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "ta";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Rhythm Nexus அதிகாரப்பூர்வ இணையதளம்`,
+  "sectionHow": (a) => `${number0.format(a.n)}) பார்சல் டிராக்கிங் மோசடி எப்படி நடக்கிறது`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost மோசடி ஒப்பீடு`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS மோசடி ஒப்பீடு`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL மோசடி ஒப்பீடு`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) பிற கேரியர்கள் மற்றும் இலக்குகள்`,
+  "sectionTips": (a) => `${number0.format(a.n)}) பாதுகாப்பு சரிபார்ப்பு பட்டியல்`,
+  "lastUpdated": (a) => `கடைசியாக புதுப்பிப்பு: ${date1.format(new Date(a.date))}`,
+};
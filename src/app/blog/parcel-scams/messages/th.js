@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "th";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) เว็บไซต์ทางการของ Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) กลโกงติดตามพัสดุทำงานอย่างไร`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) เปรียบเทียบกลโกง SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) เปรียบเทียบกลโกง USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) เปรียบเทียบกลโกง DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) ผู้ให้บริการอื่นและปลายทาง`,
+  "sectionTips": (a) => `${number0.format(a.n)}) เช็กลิสต์ความปลอดภัย`,
+  "lastUpdated": (a) => `อัปเดตล่าสุด: ${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "tl";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Opisyal na website ng Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Paano gumagana ang parcel tracking scam`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) SingPost scam comparison`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) USPS scam comparison`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) DHL scam comparison`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Iba pang carrier at destinasyon`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Safety checklist`,
+  "lastUpdated": (a) => `Huling update: ${date1.format(new Date(a.date))}`,
+};
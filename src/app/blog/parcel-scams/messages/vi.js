@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "vi";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}) Trang web chính thức của Rhythm Nexus`,
+  "sectionHow": (a) => `${number0.format(a.n)}) Cách lừa đảo theo dõi bưu kiện hoạt động`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}) So sánh lừa đảo SingPost`,
+  "sectionUsps": (a) => `${number0.format(a.n)}) So sánh lừa đảo USPS`,
+  "sectionDhl": (a) => `${number0.format(a.n)}) So sánh lừa đảo DHL`,
+  "sectionOthers": (a) => `${number0.format(a.n)}) Hãng vận chuyển và điểm đến khác`,
+  "sectionTips": (a) => `${number0.format(a.n)}) Danh sách kiểm tra an toàn`,
+  "lastUpdated": (a) => `Cập nhật lần cuối: ${date1.format(new Date(a.date))}`,
+};
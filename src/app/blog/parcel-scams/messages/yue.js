@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "yue";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}）Rhythm Nexus 官方網站`,
+  "sectionHow": (a) => `${number0.format(a.n)}）包裹追蹤詐騙如何運作`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}）SingPost 詐騙對比`,
+  "sectionUsps": (a) => `${number0.format(a.n)}）USPS 詐騙對比`,
+  "sectionDhl": (a) => `${number0.format(a.n)}）DHL 詐騙對比`,
+  "sectionOthers": (a) => `${number0.format(a.n)}）其他承運商與目的地`,
+  "sectionTips": (a) => `${number0.format(a.n)}）安全檢查清單`,
+  "lastUpdated": (a) => `最後更新：${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,15 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+const LOCALE = "zh";
+const number0 = new Intl.NumberFormat(LOCALE);
+const date1 = new Intl.DateTimeFormat(LOCALE, {"year":"numeric","month":"long","timeZone":"UTC","calendar":"gregory"});
+
+export default {
+  "sectionOur": (a) => `${number0.format(a.n)}）Rhythm Nexus 官方网站`,
+  "sectionHow": (a) => `${number0.format(a.n)}）包裹追踪诈骗如何运作`,
+  "sectionSingpost": (a) => `${number0.format(a.n)}）SingPost 诈骗对比`,
+  "sectionUsps": (a) => `${number0.format(a.n)}）USPS 诈骗对比`,
+  "sectionDhl": (a) => `${number0.format(a.n)}）DHL 诈骗对比`,
+  "sectionOthers": (a) => `${number0.format(a.n)}）其他承运商与目的地`,
+  "sectionTips": (a) => `${number0.format(a.n)}）安全检查清单`,
+  "lastUpdated": (a) => `最后更新：${date1.format(new Date(a.date))}`,
+};
@@ -0,0 +1,3 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+// <html lang> of each prerendered page (see src/app/LocaleHtml.js).
+export const htmlLang = {"en":"en","cs":"cs","cy":"cy","de":"de","es":"es","fi":"fi","fr":"fr","ga":"ga","he":"he","hi":"hi","id":"id","it":"it","ja":"ja","ko":"ko","mi":"mi","ms":"ms","nl":"nl","no":"no","pl":"pl","pt":"pt","ru":"ru","sv":"sv","ta":"ta","th":"th","tl":"tl","vi":"vi","yue":"yue","zh":"zh-Hans","zh-hant":"zh-Hant"};
@@ -0,0 +1,73 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/parcel-scams/*.json. Do not edit by hand.
+export const locales = ["en","cs","cy","de","es","fi","fr","ga","he","hi","id","it","ja","ko","mi","ms","nl","no","pl","pt","ru","sv","ta","th","tl","vi","yue","zh","zh-hant"];
+export const defaultLocale = "en";
+
+// generateStaticParams() of the [lang] route.
+export const params = [{"lang":"en"},{"lang":"cs"},{"lang":"cy"},{"lang":"de"},{"lang":"es"},{"lang":"fi"},{"lang":"fr"},{"lang":"ga"},{"lang":"he"},{"lang":"hi"},{"lang":"id"},{"lang":"it"},{"lang":"ja"},{"lang":"ko"},{"lang":"mi"},{"lang":"ms"},{"lang":"nl"},{"lang":"no"},{"lang":"pl"},{"lang":"pt"},{"lang":"ru"},{"lang":"sv"},{"lang":"ta"},{"lang":"th"},{"lang":"tl"},{"lang":"vi"},{"lang":"yue"},{"lang":"zh"},{"lang":"zh-hant"}];
+
+// hreflang -> path; x-default is the client-rendered page that follows the selected language.
+export const alternates = {
+  "x-default": "/blog/parcel-scams",
+  "en": "/blog/parcel-scams/en",
+  "cs": "/blog/parcel-scams/cs",
+  "cy": "/blog/parcel-scams/cy",
+  "de": "/blog/parcel-scams/de",
+  "es": "/blog/parcel-scams/es",
+  "fi": "/blog/parcel-scams/fi",
+  "fr": "/blog/parcel-scams/fr",
+  "ga": "/blog/parcel-scams/ga",
+  "he": "/blog/parcel-scams/he",
+  "hi": "/blog/parcel-scams/hi",
+  "id": "/blog/parcel-scams/id",
+  "it": "/blog/parcel-scams/it",
+  "ja": "/blog/parcel-scams/ja",
+  "ko": "/blog/parcel-scams/ko",
+  "mi": "/blog/parcel-scams/mi",
+  "ms": "/blog/parcel-scams/ms",
+  "nl": "/blog/parcel-scams/nl",
+  "no": "/blog/parcel-scams/no",
+  "pl": "/blog/parcel-scams/pl",
+  "pt": "/blog/parcel-scams/pt",
+  "ru": "/blog/parcel-scams/ru",
+  "sv": "/blog/parcel-scams/sv",
+  "ta": "/blog/parcel-scams/ta",
+  "th": "/blog/parcel-scams/th",
+  "tl": "/blog/parcel-scams/tl",
+  "vi": "/blog/parcel-scams/vi",
+  "yue": "/blog/parcel-scams/yue",
+  "zh-Hans": "/blog/parcel-scams/zh",
+  "zh-Hant": "/blog/parcel-scams/zh-hant"
+};
+
+// Full table of each locale, read from the client shards (variants merged over their base).
+export const loaders = {
+  "en": () => import("../i18n/en.json").then((shard) => shard.default),
+  "cs": () => import("../i18n/cs.json").then((shard) => shard.default),
+  "cy": () => import("../i18n/cy.json").then((shard) => shard.default),
+  "de": () => import("../i18n/de.json").then((shard) => shard.default),
+  "es": () => import("../i18n/es.json").then((shard) => shard.default),
+  "fi": () => import("../i18n/fi.json").then((shard) => shard.default),
+  "fr": () => import("../i18n/fr.json").then((shard) => shard.default),
+  "ga": () => import("../i18n/ga.json").then((shard) => shard.default),
+  "he": () => import("../i18n/he.json").then((shard) => shard.default),
+  "hi": () => import("../i18n/hi.json").then((shard) => shard.default),
+  "id": () => import("../i18n/id.json").then((shard) => shard.default),
+  "it": () => import("../i18n/it.json").then((shard) => shard.default),
+  "ja": () => import("../i18n/ja.json").then((shard) => shard.default),
+  "ko": () => import("../i18n/ko.json").then((shard) => shard.default),
+  "mi": () => import("../i18n/mi.json").then((shard) => shard.default),
+  "ms": () => import("../i18n/ms.json").then((shard) => shard.default),
+  "nl": () => import("../i18n/nl.json").then((shard) => shard.default),
+  "no": () => import("../i18n/no.json").then((shard) => shard.default),
+  "pl": () => import("../i18n/pl.json").then((shard) => shard.default),
+  "pt": () => import("../i18n/pt.json").then((shard) => shard.default),
+  "ru": () => import("../i18n/ru.json").then((shard) => shard.default),
+  "sv": () => import("../i18n/sv.json").then((shard) => shard.default),
+  "ta": () => import("../i18n/ta.json").then((shard) => shard.default),
+  "th": () => import("../i18n/th.json").then((shard) => shard.default),
+  "tl": () => import("../i18n/tl.json").then((shard) => shard.default),
+  "vi": () => import("../i18n/vi.json").then((shard) => shard.default),
+  "yue": () => Promise.all([import("../i18n/zh-hant.json"), import("../i18n/yue.json")]).then(([base, own]) => ({ ...base.default, ...own.default })),
+  "zh": () => import("../i18n/zh.json").then((shard) => shard.default),
+  "zh-hant": () => import("../i18n/zh-hant.json").then((shard) => shard.default),
+};
@@ -0,0 +1,56 @@
+// Locale shards are kept in localStorage under their content hash. When the
+// manifest lists a delta patch from the cached hash (written to
+// public/i18n/parcel-scams/patches/ by scripts/generate_parcel_scams_i18n.py),
+// a returning visitor only fetches the changed keys; otherwise, or when
+// anything fails, the shard chunk itself is loaded.
+
+const STORAGE_PREFIX = "rnx:parcel-scams:shard:";
+
+function readCached(lang) {
+  try {
+    const cached = JSON.parse(window.localStorage.getItem(STORAGE_PREFIX + lang));
+    return cached && typeof cached.hash === "string" && cached.table ? cached : null;
+  } catch (_) {
+    return null;
+  }
+}
+
+function writeCached(lang, hash, table) {
+  try {
+    window.localStorage.setItem(STORAGE_PREFIX + lang, JSON.stringify({ hash, table }));
+  } catch (_) {
+    // Storage full or disabled: the next visit loads the shard again.
+  }
+}
+
+// Same as apply_patch in scripts/i18n_build/patches.py.
+function applyPatch(table, patch) {
+  const patched = { ...table };
+  patch.delete.forEach((key) => { delete patched[key]; });
+  return Object.assign(patched, patch.set);
+}
+
+function fetchPatched(url, cached, hash) {
+  return fetch(url)
+    .then((response) => {
+      if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+      return response.json();
+    })
+    .then((patch) => {
+      if (patch.from !== cached.hash || patch.to !== hash) throw new Error(`${url}: unexpected versions`);
+      return applyPatch(cached.table, patch);
+    });
+}
+
+// Table of the shard described by manifest `entry`; `loadShard` imports the
+// full shard (a promise of its table).
+export function loadCachedShard(lang, entry, loadShard) {
+  const cached = typeof window === "undefined" ? null : readCached(lang);
+  if (cached && cached.hash === entry.hash) return Promise.resolve(cached.table);
+  const patchUrl = cached && entry.patches && entry.patches[cached.hash];
+  const table = patchUrl ? fetchPatched(patchUrl, cached, entry.hash).catch(loadShard) : loadShard();
+  return table.then((loaded) => {
+    if (typeof window !== "undefined") writeCached(lang, entry.hash, loaded);
+    return loaded;
+  });
+}
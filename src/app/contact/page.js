@@ -6,7 +6,8 @@ import { Navigation } from '../../components/Navigation';
 import { MathCaptcha } from '../../components/MathCaptcha';
 import { useLanguage } from '../../LanguageContext';
 import Link from 'next/link';
-import { getSchoolEmailWarningMessage, isSchoolEmailDomain } from '../../lib/spam-detection';
+import { getSchoolEmailWarningMessage, isSchoolEmailDomain, spamMessages } from '../../lib/spam-detection';
+import { useLocaleCatalog } from '../../lib/useLocaleCatalog';
 
 export default function Contact() {
   const { t, language } = useLanguage();
@@ -23,6 +24,7 @@ export default function Contact() {
   const [submitStatus, setSubmitStatus] = useState(null);
   const [captchaData, setCaptchaData] = useState({ token: '', answer: '' });
 
+  useLocaleCatalog(spamMessages, language);
   const schoolEmailWarning = getSchoolEmailWarningMessage(language);
 
   const handleChange = (e) => {
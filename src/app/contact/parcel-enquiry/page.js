@@ -6,7 +6,8 @@ import { Navigation } from '../../../components/Navigation';
 import { MathCaptcha } from '../../../components/MathCaptcha';
 import { useLanguage } from '../../../LanguageContext';
 import Link from 'next/link';
-import { getSchoolEmailWarningMessage, isSchoolEmailDomain } from '../../../lib/spam-detection';
+import { getSchoolEmailWarningMessage, isSchoolEmailDomain, spamMessages } from '../../../lib/spam-detection';
+import { useLocaleCatalog } from '../../../lib/useLocaleCatalog';
 
 export default function ParcelEnquiry() {
   const { t, language } = useLanguage();
@@ -28,6 +29,7 @@ export default function ParcelEnquiry() {
   const [showNoDeliveryMessage, setShowNoDeliveryMessage] = useState(false);
   const [captchaData, setCaptchaData] = useState({ token: '', answer: '' });
 
+  useLocaleCatalog(spamMessages, language);
   const schoolEmailWarning = getSchoolEmailWarningMessage(language);
 
   const handleChange = (e) => {
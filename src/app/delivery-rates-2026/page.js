@@ -4,10 +4,11 @@ import { useRouter } from 'next/navigation';
 import Link from 'next/link';
 import { useLanguage } from '../../LanguageContext';
 import { Navigation } from '../../components/Navigation';
-import { countryName, makeEmsZoneRegionText, makeSurchargeRegionText, rt } from '../../lib/ratesI18n';
+import { countryName, makeEmsZoneRegionText, makeSurchargeRegionText, rt, useRatesI18n } from '../../lib/ratesI18n';
 
 export default function DeliveryRates2026Page() {
   const { t, language } = useLanguage();
+  useRatesI18n(language);
   const router = useRouter();
   const tr = (key) => rt(language, key);
 
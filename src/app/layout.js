@@ -1,5 +1,6 @@
 import { Geist, Geist_Mono, Nunito, Noto_Sans_Tamil } from "next/font/google";
 import "./globals.css";
+import "./font-subsets.generated.css";
 import { LanguageProvider } from "../LanguageContext";
 import Script from "next/script";
 import { AccessGuard } from "../components/AccessGuard";
@@ -7,6 +8,7 @@ import { ChatbotWidget } from "../components/ChatbotWidget";
 import { PhoneRequirementPopup } from "../components/PhoneRequirementPopup";
 import { USSection122Popup } from "../components/USSection122Popup";
 import { AdSenseLoader } from "../components/AdSenseLoader";
+import { LocaleHtml } from "./LocaleHtml";
 
 const geistSans = Geist({
   variable: "--font-geist-sans",
@@ -69,7 +71,7 @@ export const metadata = {
 
 export default function RootLayout({ children }) {
   return (
-    <html lang="en">
+    <LocaleHtml>
       <head>
         <link rel="manifest" href="/manifest.json" />
         <link rel="icon" type="image/jpeg" href="/logo.jpg" />
@@ -126,6 +128,6 @@ export default function RootLayout({ children }) {
           </>
         ) : null}
       </body>
-    </html>
+    </LocaleHtml>
   );
 }
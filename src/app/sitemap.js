@@ -1,5 +1,20 @@
+import { alternates as parcelScamsAlternates } from './blog/parcel-scams/prerender';
+
 export default function sitemap() {
   const baseUrl = 'https://rhythmnexus.com';
+
+  // hreflang alternates emitted by the i18n generator: every language version
+  // lists all of the others.
+  const parcelScamsLanguages = Object.fromEntries(
+    Object.entries(parcelScamsAlternates).map(([hreflang, path]) => [hreflang, `${baseUrl}${path}`])
+  );
+  const parcelScamsEntries = Object.values(parcelScamsLanguages).map((url) => ({
+    url,
+    lastModified: new Date(),
+    changeFrequency: 'monthly',
+    priority: 0.7,
+    alternates: { languages: parcelScamsLanguages },
+  }));
   
   return [
     {
@@ -86,6 +101,7 @@ export default function sitemap() {
       changeFrequency: 'monthly',
       priority: 0.7,
     },
+    ...parcelScamsEntries,
     {
       url: `${baseUrl}/FAQ`,
       lastModified: new Date(),
@@ -4,10 +4,11 @@ import { useRouter } from 'next/navigation';
 import Link from 'next/link';
 import { useLanguage } from '../../LanguageContext';
 import { Navigation } from '../../components/Navigation';
-import { countryName, rt } from '../../lib/ratesI18n';
+import { countryName, rt, useRatesI18n } from '../../lib/ratesI18n';
 
 export default function SpeedpostExpressRatesPage() {
   const { t, language } = useLanguage();
+  useRatesI18n(language);
   const router = useRouter();
   const tr = (key) => rt(language, key);
   const zoneLabel = (suffix) => `${tr('zone')} ${suffix}`;
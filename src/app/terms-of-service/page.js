@@ -2,7 +2,7 @@
 
 import { Navigation } from '../../components/Navigation';
 import { useLanguage } from '../../LanguageContext';
-import { policyText } from '../../lib/policyI18n';
+import { usePolicyText } from '../../lib/policyI18n';
 import { getLocalizedPolicyDate, getTermsUiLabels } from '../../lib/policyUiI18n';
 import { Footer } from "../../components/Footer";
 
@@ -19,7 +19,7 @@ const normalizeLang = (language) => {
 
 export default function TermsOfServicePage() {
   const { t, language } = useLanguage();
-  const p = policyText(language);
+  const p = usePolicyText(language);
   const isEnglish = normalizeLang(language) === 'en';
   const ui = getTermsUiLabels(language);
   const localizedDate = getLocalizedPolicyDate(language);
@@ -19,6 +19,8 @@ import { Footer } from "../../components/Footer";
 import { Navigation } from "../../components/Navigation";
 import MiddleEastAirspaceNotice from "../../components/MiddleEastAirspaceNotice";
 import { EuropeAirspaceNotice } from "../../components/MiddleEastAirspaceNotice";
+import { checkLookalike } from "../../lib/typosquat";
+import { isSuspiciousDomain, lookupDomain } from "../../lib/scam-domains";
 
 // --- Service Announcement Component ---
 const ServiceAnnouncement = ({ allowedDestinations }) => {
@@ -428,6 +430,9 @@ function App() {
   const [allowedDestinations, setAllowedDestinations] = useState(null);
   const [countryLockedByGeo, setCountryLockedByGeo] = useState(false);
   const [countryLockedByUrl, setCountryLockedByUrl] = useState(false);
+  // Links from scam texts get pasted here: warn when one imitates a carrier site.
+  const suspiciousDomain = checkLookalike(trackingNumber)
+    || (isSuspiciousDomain(trackingNumber) ? lookupDomain(trackingNumber) : null);
   
 ///  const handleClosePopup = () => {
 ///     const currentIndex = popupSequence.indexOf(activePopup);
@@ -1045,6 +1050,14 @@ function App() {
             placeholder={t('trackingNumberExample') || "e.g. LG123456789SG"}
             disabled={accessBlocked}
           />
+          {suspiciousDomain && (
+            <div className="alert alert-danger mt-2 mb-0" role="alert">
+              ⚠️ {t('lookalikeDomainWarning')}
+              {suspiciousDomain.official && (
+                <> {t('lookalikeDomainOfficial')} <strong>{suspiciousDomain.official}</strong></>
+              )}
+            </div>
+          )}
         </div>
 
         <div className="mb-4">
@@ -3,11 +3,11 @@
 import React from 'react';
 import Link from 'next/link';
 import { useLanguage } from '../LanguageContext';
-import { policyText } from '../lib/policyI18n';
+import { usePolicyText } from '../lib/policyI18n';
 
 export const Footer = () => {
   const { t, language } = useLanguage();
-  const policy = policyText(language);
+  const policy = usePolicyText(language);
 
   return (
     <footer className="footer-modern">
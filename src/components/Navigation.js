@@ -10,11 +10,11 @@ import { LanguageSelector } from "../LanguageSelector";
 import TimezoneHeader from "./TimezoneHeader";
 import HolidayNotification from "./HolidayNotification";
 import { detectLanguageFromIPWithRestrictions } from "../ipGeolocation";
-import { policyText } from "../lib/policyI18n";
+import { usePolicyText } from "../lib/policyI18n";
 
 export const Navigation = () => {
   const { t, language } = useLanguage();
-  const policy = policyText(language);
+  const policy = usePolicyText(language);
   const [userCountry, setUserCountry] = useState(null);
   const [showCnyMessage, setShowCnyMessage] = useState(false);
   const searchParams = useSearchParams();
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Podmínky","navPrivacy":"Soukromí","termsTitle":"Podmínky služby","privacyTitle":"Zásady ochrany osobních údajů","updated":"Poslední aktualizace: 24. února 2026","termsText":"Tyto smluvní podmínky (dále jen „podmínky“) upravují váš přístup a používání služeb elektronického obchodu nabízených prostřednictvím https://rhythmnexus.org („webové stránky“) provozované společností Rhythm Nexus („my“, „nás“ nebo „náš“). Přístupem, procházením nebo nákupem na webových stránkách souhlasíte s tím, že budete vázáni těmito podmínkami. Pokud nesouhlasíte, nesmíte používat Webové stránky ani zadat objednávku. ||| Abyste mohli nakupovat produkty z této webové stránky, musíte být starší 18 let nebo být plnoletí ve vaší jurisdikci. Odesláním objednávky prohlašujete a zaručujete, že splňujete tento požadavek. ||| Chcete-li provést nákup, můžete být požádáni o vytvoření účtu. Souhlasíte s tím, že poskytnete přesné, aktuální a úplné informace. Jste odpovědní za ochranu přihlašovacích údajů k účtu. O každém neoprávněném použití nás musíte okamžitě informovat. Z důvodu porušení těchto podmínek můžeme váš účet kdykoli ukončit nebo pozastavit. ||| Snažíme se zobrazovat informace o produktech přesně, ale nezaručujeme, že popisy produktů nebo jiný obsah jsou bez chyb. ||| Ceny jsou uvedeny v amerických dolarech (USD) a zahrnují příslušné daně, pokud to vyžaduje zákon. Před zadáním objednávky můžeme ceny kdykoli změnit. ||| Vaše objednávka je nabídkou ke koupi. K přijetí dojde, když potvrdíme vaši objednávku e-mailem, nebo když odešleme produkty, podle toho, co nastane dříve. Můžeme odmítnout nebo zrušit objednávky z důvodů, včetně nesprávných cen, produktů, které nejsou skladem, nebo podezření z podvodu. ||| Přijímáme způsoby platby uvedené při placení. Odesláním platebních údajů nám dáváte oprávnění účtovat dlužnou částku a potvrzujete, že jste oprávněným držitelem účtu. K bezpečnému zpracování platebních údajů používáme externí zpracovatele plateb. ||| Odhady dopravy jsou poskytovány pro pohodlí a nezaručují termíny dodání. Jakmile jsou produkty převedeny na dopravce, přechází na vás riziko ztráty. Jste zodpovědní za cla a dovozní daně a za chyby v doručení způsobené nesprávnými údaji o adrese. ||| Pokud sídlíte v EU, EHP nebo Švýcarsku, máte zákonné právo na vrácení produktů do 14 dnů od obdržení, abyste získali plnou náhradu. Produkty musí být vráceny v původním stavu. Zaslání zpět může být na vaše náklady, jak to umožňuje zákon. Digitální produkty mohou být vyloučeny, pokud stahování začne s vaším souhlasem a uznáváte ztrátu práva na odstoupení od smlouvy. ||| Nárok na vrácení pro zákazníky z USA je popsán v našich samostatných Zásadách vrácení a vrácení peněz zveřejněných na webových stránkách. Některé položky (např. digitální stahování, personalizované položky) mohou být nevratné. ||| Pokud si zakoupíte digitální položky, doručení je elektronické, je vám udělena osobní nevýhradní licence k použití obsahu a stažené soubory nesmíte bez povolení dále distribuovat, přeprodávat ani sdílet. ||| Veškerý obsah webových stránek (text, návrhy, software, grafika, obrázky) je vlastněn nebo licencován Rhythm Nexus a je chráněn autorským právem a zákony o duševním vlastnictví. Bez písemného souhlasu nesmíte reprodukovat, upravovat, distribuovat nebo vytvářet odvozená díla.","privacyText":"Rhythm Nexus („my“, „nás“ nebo „náš“) respektuje vaše soukromí a zavazuje se chránit vaše osobní údaje. Tyto zásady ochrany osobních údajů vysvětlují, jaké osobní údaje shromažďujeme, jak je používáme, s kým je sdílíme a vaše práva. Tyto zásady se vztahují na uživatele z EU, EHP, Švýcarska a USA. ||| Shromažďujeme osobní údaje, které nám dobrovolně poskytnete, včetně jména, e-mailové adresy, fakturační a dodací adresy, telefonního čísla a platebních údajů, které zpracovávají třetí strany. ||| Automaticky shromažďujeme IP adresu, typ prohlížeče, údaje o zařízení, údaje o používání, soubory cookie a technologie sledování. ||| Pokud se nacházíte v EU/EHP/Švýcarsku, zpracováváme vaše údaje na základě plnění smlouvy (plnění objednávky), zákonné povinnosti, oprávněných zájmů a souhlasu tam, kde je to vyžadováno. ||| Vaše údaje používáme ke zpracování objednávek, zasílání produktů, komunikaci s vámi, poskytování zákaznické podpory, plnění zákonných povinností, zlepšování našich webových stránek a zasílání marketingových sdělení se souhlasem. ||| V případě potřeby můžeme vaše údaje sdílet se zpracovateli plateb, přepravními partnery, poskytovateli analytických služeb, poskytovateli marketingových služeb a právními orgány. Osobní údaje neprodáváme. ||| Uživatelé z EU/EHP/Švýcarska mají práva GDPR na přístup k osobním údajům, opravu nepřesných údajů, vymazání údajů, omezení zpracování, vznesení námitky proti zpracování, přenesení údajů a odvolání souhlasu. Chcete-li tato práva uplatnit, kontaktujte nás na adrese rhythmnexusco@gmail.com. ||| Uživatelé z USA (CCPA/CPRA, kde je to relevantní) mohou mít právo vědět, jaké osobní údaje jsou shromažďovány, požadovat vymazání, odmítnout sdílení údajů a nediskriminovat při výkonu práv. Chcete-li odeslat požadavky, pošlete e-mail na adresu rhythmnexusco@gmail.com. ||| Osobní údaje uchováváme po dobu nezbytně nutnou k plnění objednávek, plnění zákonných požadavků a řešení sporů. ||| Můžeme přenášet data mimo váš region. Při převodu z EU/EHP/Švýcarska používáme standardní smluvní doložky (SCC) a další zákonná ochranná opatření. ||| Zavádíme přiměřená technická a organizační zabezpečení včetně šifrování SSL, bezpečných platebních systémů a opatření pro kontrolu přístupu. Žádný systém však není 100% bezpečný.","termsSupplement":"V maximální míře povolené příslušnými zákony neneseme odpovědnost za nepřímé, náhodné nebo následné škody, ztrátu dat, ušlý zisk nebo přerušení podnikání. Naše celková odpovědnost nepřesáhne částku, kterou jste zaplatili za zakoupené produkty. Pro spotřebitele v EU/EHP/Švýcarsku nejsou povinná zákonná práva dotčena. ||| Tyto podmínky se řídí zákony [Vaše jurisdikce] bez ohledu na konflikt právních zásad. Uživatelé z EU/EHP/Švýcarska mohou mít podle místních zákonů další ochranu, které se nelze vzdát. ||| Uživatelé EU/EHP/Swiss mají přístup k platformě EU pro řešení sporů online: https://ec.europa.eu/consumers/odr/ ||| Uživatelé z USA mohou řešit spory vyjednáváním, rozhodčím řízením (pokud bylo dohodnuto) nebo soudním řízením v jejich jurisdikci. ||| Tyto Podmínky můžeme aktualizovat. Revidovaná verze bude zveřejněna na této adrese URL s novým datem účinnosti.","privacySupplement":"K provozování webových stránek, analýze použití a personalizaci obsahu používáme soubory cookie a podobné technologie. Návštěvníkům z EU/EHP/Švýcarska se zobrazí banner souhlasu se soubory cookie. Předvolby souborů cookie můžete spravovat v nastavení prohlížeče. ||| Vědomě neshromažďujeme osobní údaje od dětí mladších 13 let v USA nebo mladších 16 let v EU/EHP. Pokud se dozvíme, že jsme takové údaje shromáždili, vymažeme je. ||| Naše webové stránky mohou obsahovat odkazy na stránky třetích stran. Nejsme zodpovědní za jejich postupy ochrany osobních údajů. ||| Tyto zásady můžeme aktualizovat. Nová verze bude zveřejněna na této adrese URL s upraveným datem účinnosti."};
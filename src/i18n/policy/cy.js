@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Termau","navPrivacy":"Preifatrwydd","termsTitle":"Telerau Gwasanaeth","privacyTitle":"Polisi Preifatrwydd","updated":"Wedi ei ddiweddaru ddiwetha': 24 Chwefror 2026","termsText":"Mae'r Telerau Gwasanaeth hyn (\"Telerau\") yn llywodraethu eich mynediad i'r gwasanaethau e-fasnach a gynigir trwy https://rhythmnexus.org (\"Gwefan\") a weithredir gan Rhythm Nexus (\"ni\", \"ni\", neu \"ein\") a'ch defnydd ohonynt. Trwy gyrchu, pori, neu brynu o'r Wefan, rydych chi'n cytuno i gael eich rhwymo gan y Telerau hyn. Os nad ydych yn cytuno, ni chewch ddefnyddio'r Wefan na gosod archeb. ||| Rhaid i chi fod yn 18 oed o leiaf neu'r oedran mwyafrif yn eich awdurdodaeth i brynu cynhyrchion o'r Wefan hon. Trwy osod archeb, rydych yn cynrychioli ac yn gwarantu eich bod yn bodloni'r gofyniad hwn. ||| Efallai y gofynnir i chi greu cyfrif i brynu. Rydych yn cytuno i ddarparu gwybodaeth gywir, gyfredol a chyflawn. Chi sy'n gyfrifol am ddiogelu manylion eich cyfrif. Rhaid i chi roi gwybod i ni ar unwaith am unrhyw ddefnydd anawdurdodedig. Gallwn derfynu neu atal eich cyfrif ar unrhyw adeg am dorri’r Telerau hyn. ||| Rydym yn ymdrechu i arddangos gwybodaeth am gynnyrch yn gywir, ond nid ydym yn gwarantu bod disgrifiadau cynnyrch neu gynnwys arall yn rhydd o wallau. ||| Dangosir prisiau yn Doler yr Unol Daleithiau (USD) ac maent yn cynnwys trethi cymwys lle bo angen yn ôl y gyfraith. Efallai y byddwn yn newid prisiau ar unrhyw adeg cyn i chi osod archeb. ||| Cynnig i brynu yw eich archeb. Mae derbyniad yn digwydd pan fyddwn yn cadarnhau eich archeb trwy e-bost, neu pan fyddwn yn llongio'r cynhyrchion, pa un bynnag sy'n digwydd gyntaf. Mae'n bosibl y byddwn yn gwrthod neu'n canslo archebion am resymau sy'n cynnwys prisio anghywir, cynhyrchion allan o stoc, neu amheuaeth o dwyll. ||| Rydym yn derbyn y dulliau talu a ddangosir yn ystod y ddesg dalu. Trwy gyflwyno manylion talu, rydych yn ein hawdurdodi i godi'r swm sy'n ddyledus ac yn cadarnhau mai chi yw deiliad y cyfrif cywir. Rydym yn defnyddio proseswyr taliadau trydydd parti i drin gwybodaeth am daliadau yn ddiogel. ||| Darperir amcangyfrifon cludo er hwylustod ac nid ydynt yn gwarantu dyddiadau dosbarthu. Unwaith y bydd cynhyrchion yn cael eu trosglwyddo i gludwr, mae'r risg o golled yn mynd i chi. Chi sy'n gyfrifol am dollau tollau a threthi mewnforio, ac am wallau dosbarthu a achosir gan wybodaeth anghywir am gyfeiriadau. ||| Os ydych yn byw yn yr UE, AEE, neu'r Swistir, mae gennych yr hawl gyfreithiol i ddychwelyd cynhyrchion o fewn 14 diwrnod i'w derbyn am ad-daliad llawn. Rhaid dychwelyd cynhyrchion yn y cyflwr gwreiddiol. Gall llongau dychwelyd fod ar eich cost chi fel y caniateir gan y gyfraith. Efallai y bydd cynhyrchion digidol yn cael eu heithrio os bydd y lawrlwythiad yn dechrau gyda'ch caniatâd a'ch bod yn cydnabod colli hawl i dynnu'n ôl. ||| Amlinellir cymhwyster dychwelyd cwsmeriaid UDA yn ein Polisi Dychwelyd ac Ad-daliad ar wahân a bostiwyd ar y Wefan. Mae’n bosibl na fydd modd ad-dalu rhai eitemau (e.e. lawrlwythiadau digidol, eitemau personol). ||| Os ydych chi'n prynu eitemau digidol, mae'r dosbarthiad yn electronig, rhoddir trwydded anghyfyngedig bersonol i chi ddefnyddio'r cynnwys, ac ni chewch ailddosbarthu, ailwerthu na rhannu lawrlwythiadau heb ganiatâd. ||| Mae holl gynnwys y Wefan (testun, dyluniadau, meddalwedd, graffeg, delweddau) yn eiddo i Rhythm Nexus neu wedi'i drwyddedu iddo ac wedi'i ddiogelu gan gyfreithiau hawlfraint ac eiddo deallusol. Ni chewch atgynhyrchu, addasu, dosbarthu na chreu gweithiau deilliadol heb ganiatâd ysgrifenedig.","privacyText":"Mae Rhythm Nexus (\"ni\", \"ni\", neu \"ein\") yn parchu eich preifatrwydd ac wedi ymrwymo i ddiogelu eich data personol. Mae’r Polisi Preifatrwydd hwn yn esbonio pa ddata personol rydym yn ei gasglu, sut mae’n cael ei ddefnyddio, gyda phwy rydym yn ei rannu, a’ch hawliau. Mae'r polisi hwn yn berthnasol i ddefnyddwyr o'r UE, AEE, y Swistir ac UDA. ||| Rydyn ni'n casglu'r wybodaeth bersonol rydych chi'n ei darparu'n wirfoddol, gan gynnwys enw, cyfeiriad e-bost, cyfeiriad bilio a chludo, rhif ffôn, a gwybodaeth talu sy'n cael ei thrin gan broseswyr trydydd parti. ||| Rydym yn casglu cyfeiriad IP, math o borwr, data dyfais, data defnydd, cwcis a thechnolegau olrhain yn awtomatig. ||| Os ydych yn yr UE/AEE/Swistir, rydym yn prosesu eich data yn seiliedig ar berfformiad contract (cyflawni archeb), rhwymedigaeth gyfreithiol, buddiannau cyfreithlon, a chaniatâd lle bo angen. ||| Rydym yn defnyddio eich data i brosesu archebion, llongio cynhyrchion, cyfathrebu â chi, darparu cymorth i gwsmeriaid, cydymffurfio â rhwymedigaethau cyfreithiol, gwella ein Gwefan, ac anfon cyfathrebiadau marchnata gyda chaniatâd. ||| Mae’n bosibl y byddwn yn rhannu eich data â phroseswyr taliadau, partneriaid cludo, darparwyr dadansoddeg, darparwyr gwasanaethau marchnata, ac awdurdodau cyfreithiol pan fo angen. Nid ydym yn gwerthu data personol. ||| Mae gan ddefnyddwyr yr UE / AEE / Swistir hawliau GDPR i gael mynediad at ddata personol, cywiro data anghywir, dileu data, cyfyngu ar brosesu, gwrthwynebu prosesu, data porthladd, a thynnu caniatâd yn ôl. I arfer yr hawliau hyn, cysylltwch â ni yn rhythmnexusco@gmail.com. ||| Mae’n bosibl y bydd gan ddefnyddwyr UDA (CCPA/CPRA, lle bo’n berthnasol) hawliau i wybod pa ddata personol sy’n cael ei gasglu, gofyn am ddileu, optio allan o rannu data, a pheidio â gwahaniaethu ar gyfer arfer hawliau. I gyflwyno ceisiadau, e-bostiwch rhythmnexusco@gmail.com. ||| Rydym yn cadw data personol cyhyd ag y bo angen i gyflawni gorchmynion, cydymffurfio â gofynion cyfreithiol, a datrys anghydfodau. ||| Mae'n bosibl y byddwn yn trosglwyddo data y tu allan i'ch rhanbarth. Wrth drosglwyddo o’r UE/AEE/Swistir, rydym yn defnyddio Cymalau Cytundebol Safonol (SCCs) a mesurau diogelu cyfreithlon eraill. ||| Rydym yn gweithredu mesurau diogelu technegol a threfniadol rhesymol gan gynnwys amgryptio SSL, systemau talu diogel, a mesurau rheoli mynediad. Fodd bynnag, nid oes unrhyw system 100% yn ddiogel.","termsSupplement":"I'r graddau mwyaf a ganiateir gan gyfraith berthnasol, nid ydym yn atebol am iawndal anuniongyrchol, damweiniol, neu ganlyniadol, colli data, elw a gollwyd, neu amhariad busnes. Ni fydd cyfanswm ein hatebolrwydd yn fwy na'r swm a daloch am y cynnyrch(au) a brynwyd. Ar gyfer defnyddwyr yn yr UE/AEE/Swistir, nid yw hawliau statudol gorfodol yn cael eu heffeithio. ||| Mae’r Telerau hyn yn cael eu llywodraethu gan gyfreithiau [Eich Awdurdodaeth] heb ystyried egwyddorion gwrthdaro cyfraith. Efallai y bydd gan ddefnyddwyr yr UE/AEE/Swistir amddiffyniadau ychwanegol o dan gyfraith leol na ellir eu hepgor. ||| Gall defnyddwyr UE/EEA/Swistir ddefnyddio platfform Datrys Anghydfod Ar-lein yr UE: https://ec.europa.eu/consumers/odr/ ||| Gall defnyddwyr UDA ddatrys anghydfodau trwy drafod, cyflafareddu (os cytunir arnynt), neu achos llys yn eu hawdurdodaeth. ||| Efallai y byddwn yn diweddaru'r Telerau hyn. Bydd y fersiwn diwygiedig yn cael ei bostio yn yr URL hwn gyda dyddiad dod i rym newydd.","privacySupplement":"Rydym yn defnyddio cwcis a thechnolegau tebyg i weithredu'r Wefan, dadansoddi defnydd, a phersonoli cynnwys. Dangosir baner caniatâd cwci i ymwelwyr o'r UE/AEE/Swistir. Gallwch reoli dewisiadau cwcis yng ngosodiadau eich porwr. ||| Nid ydym yn casglu data personol yn fwriadol gan blant o dan 13 oed yn UDA neu o dan 16 yn yr UE/AEE. Os byddwn yn dysgu ein bod wedi casglu data o'r fath, byddwn yn ei ddileu. ||| Gall ein Gwefan gynnwys dolenni i wefannau trydydd parti. Nid ydym yn gyfrifol am eu harferion preifatrwydd. ||| Mae’n bosibl y byddwn yn diweddaru’r polisi hwn. Bydd y fersiwn newydd yn cael ei bostio yn yr URL hwn gyda dyddiad effeithiol diwygiedig."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Bedingungen","navPrivacy":"Privatsphäre","termsTitle":"Nutzungsbedingungen","privacyTitle":"Datenschutzrichtlinie","updated":"Letzte Aktualisierung: 24. Februar 2026","termsText":"Diese Nutzungsbedingungen („Bedingungen“) regeln Ihren Zugriff auf und Ihre Nutzung der E-Commerce-Dienste, die über https://rhythmnexus.org („Website“) angeboten werden, das von Rhythm Nexus („wir“, „uns“ oder „unser“) betrieben wird. Indem Sie auf die Website zugreifen, sie durchsuchen oder dort einkaufen, erklären Sie sich mit diesen Bedingungen einverstanden. Wenn Sie nicht einverstanden sind, dürfen Sie die Website nicht nutzen oder eine Bestellung aufgeben. ||| Sie müssen mindestens 18 Jahre alt oder in Ihrem Land volljährig sein, um Produkte von dieser Website kaufen zu können. Indem Sie eine Bestellung aufgeben, erklären und garantieren Sie, dass Sie diese Anforderung erfüllen. ||| Möglicherweise werden Sie aufgefordert, ein Konto zu erstellen, um einen Kauf zu tätigen. Sie verpflichten sich, genaue, aktuelle und vollständige Informationen bereitzustellen. Sie sind für den Schutz Ihrer Kontodaten verantwortlich. Sie müssen uns jede unbefugte Nutzung unverzüglich mitteilen. Bei Verstößen gegen diese Bedingungen können wir Ihr Konto jederzeit kündigen oder sperren. ||| Wir sind bestrebt, Produktinformationen korrekt anzuzeigen, übernehmen jedoch keine Garantie dafür, dass Produktbeschreibungen oder andere Inhalte fehlerfrei sind. ||| Die Preise werden in US-Dollar (USD) angezeigt und beinhalten die anfallenden Steuern, sofern gesetzlich vorgeschrieben. Wir können die Preise jederzeit ändern, bevor Sie eine Bestellung aufgeben. ||| Bei Ihrer Bestellung handelt es sich um ein Kaufangebot. Die Annahme erfolgt, wenn wir Ihre Bestellung per E-Mail bestätigen oder wenn wir die Produkte versenden, je nachdem, was zuerst eintritt. Wir können Bestellungen aus Gründen wie falschen Preisen, nicht vorrätigen Produkten oder Verdacht auf Betrug ablehnen oder stornieren. ||| Wir akzeptieren die beim Bezahlvorgang angezeigten Zahlungsmethoden. Durch die Übermittlung Ihrer Zahlungsdaten ermächtigen Sie uns, den fälligen Betrag abzubuchen und bestätigen, dass Sie der rechtmäßige Kontoinhaber sind. Wir nutzen Zahlungsabwickler von Drittanbietern, um Zahlungsinformationen sicher zu verarbeiten. ||| Versandschätzungen werden der Einfachheit halber bereitgestellt und stellen keine Garantie für Liefertermine dar. Sobald die Produkte an einen Spediteur übergeben werden, geht das Verlustrisiko auf Sie über. Sie sind für Zölle und Einfuhrsteuern sowie für Lieferfehler verantwortlich, die durch falsche Adressangaben verursacht werden. ||| Wenn Sie in der EU, im EWR oder in der Schweiz wohnen, haben Sie das gesetzliche Recht, Produkte innerhalb von 14 Tagen nach Erhalt gegen eine vollständige Rückerstattung zurückzugeben. Produkte müssen im Originalzustand zurückgegeben werden. Sofern gesetzlich zulässig, kann der Rückversand auf Ihre Kosten erfolgen. Ein Ausschluss digitaler Produkte ist möglich, wenn der Download mit Ihrer Einwilligung beginnt und Sie den Verlust des Widerrufsrechts anerkennen. ||| Die Rückgabeberechtigung für US-Kunden ist in unserer separaten Rückgabe- und Rückerstattungsrichtlinie beschrieben, die auf der Website veröffentlicht ist. Einige Artikel (z. B. digitale Downloads, personalisierte Artikel) sind möglicherweise nicht erstattungsfähig. ||| Wenn Sie digitale Artikel kaufen, erfolgt die Lieferung elektronisch, Sie erhalten eine persönliche, nicht ausschließliche Lizenz zur Nutzung der Inhalte und dürfen Downloads ohne Genehmigung nicht weiterverbreiten, weiterverkaufen oder teilen. ||| Der gesamte Inhalt der Website (Texte, Designs, Software, Grafiken, Bilder) ist Eigentum von Rhythm Nexus oder an Rhythm Nexus lizenziert und durch Urheberrechte und Gesetze zum Schutz des geistigen Eigentums geschützt. Sie dürfen ohne schriftliche Genehmigung keine reproduzieren, modifizieren, verbreiten oder abgeleitete Werke erstellen.","privacyText":"Rhythm Nexus („wir“, „uns“ oder „unser“) respektiert Ihre Privatsphäre und verpflichtet sich, Ihre personenbezogenen Daten zu schützen. Diese Datenschutzrichtlinie erläutert, welche personenbezogenen Daten wir erfassen, wie sie verwendet werden, mit wem wir sie teilen und welche Rechte Sie haben. Diese Richtlinie gilt für Benutzer aus der EU, dem EWR, der Schweiz und den USA. ||| Wir erfassen die personenbezogenen Daten, die Sie freiwillig angeben, einschließlich Name, E-Mail-Adresse, Rechnungs- und Lieferadresse, Telefonnummer sowie Zahlungsinformationen, die von Drittanbietern verarbeitet werden. ||| Wir erfassen automatisch IP-Adresse, Browsertyp, Gerätedaten, Nutzungsdaten, Cookies und Tracking-Technologien. ||| Wenn Sie sich in der EU/EWR/Schweiz befinden, verarbeiten wir Ihre Daten auf Grundlage der Vertragserfüllung (Auftragserfüllung), rechtlicher Verpflichtung, berechtigter Interessen und soweit erforderlich einer Einwilligung. ||| Wir verwenden Ihre Daten, um Bestellungen zu bearbeiten, Produkte zu versenden, mit Ihnen zu kommunizieren, Kundensupport zu bieten, gesetzlichen Verpflichtungen nachzukommen, unsere Website zu verbessern und mit Ihrer Einwilligung Marketingmitteilungen zu versenden. ||| Wir können Ihre Daten bei Bedarf an Zahlungsabwickler, Versandpartner, Analyseanbieter, Marketingdienstleister und Justizbehörden weitergeben. Wir verkaufen keine personenbezogenen Daten. ||| EU-/EWR-/Schweiz-Benutzer haben das Recht, auf personenbezogene Daten zuzugreifen, unrichtige Daten zu korrigieren, Daten zu löschen, die Verarbeitung einzuschränken, der Verarbeitung zu widersprechen, Daten zu übertragen und ihre Einwilligung zu widerrufen. Um diese Rechte auszuüben, kontaktieren Sie uns unter rhythmnexusco@gmail.com. ||| Benutzer in den USA (CCPA/CPRA, sofern zutreffend) haben möglicherweise das Recht, zu erfahren, welche personenbezogenen Daten erfasst werden, die Löschung zu beantragen, die Datenweitergabe abzulehnen und bei der Ausübung ihrer Rechte auf Nichtdiskriminierung zu verzichten. Um Anfragen einzureichen, senden Sie eine E-Mail an rhythmnexusco@gmail.com. ||| Wir bewahren personenbezogene Daten so lange auf, wie es zur Erfüllung von Bestellungen, zur Einhaltung gesetzlicher Anforderungen und zur Beilegung von Streitigkeiten erforderlich ist. ||| Wir können Daten außerhalb Ihrer Region übertragen. Bei Übermittlungen aus der EU/dem EWR/der Schweiz verwenden wir Standardvertragsklauseln (SCCs) und andere gesetzliche Schutzmaßnahmen. ||| Wir implementieren angemessene technische und organisatorische Sicherheitsmaßnahmen, einschließlich SSL-Verschlüsselung, sichere Zahlungssysteme und Zugriffskontrollmaßnahmen. Allerdings ist kein System 100 % sicher.","termsSupplement":"Soweit gesetzlich zulässig, haften wir nicht für indirekte, zufällige oder Folgeschäden, Datenverlust, entgangenen Gewinn oder Betriebsunterbrechung. Unsere Gesamthaftung übersteigt nicht den Betrag, den Sie für das/die gekaufte(n) Produkt(e) bezahlt haben. Für Verbraucher in der EU/EWR/Schweiz bleiben zwingende gesetzliche Rechte unberührt. ||| Diese Bedingungen unterliegen den Gesetzen [Ihrer Gerichtsbarkeit] ohne Rücksicht auf Kollisionsnormen. Benutzer aus der EU, dem EWR und der Schweiz können aufgrund lokaler Gesetze zusätzlichen Schutz genießen, auf den nicht verzichtet werden kann. ||| Benutzer aus der EU, dem EWR und der Schweiz können auf die Online-Streitbeilegungsplattform der EU zugreifen: https://ec.europa.eu/consumers/odr/ ||| Benutzer in den USA können Streitigkeiten durch Verhandlungen, Schiedsverfahren (sofern vereinbart) oder gerichtliche Schritte in ihrem Zuständigkeitsbereich beilegen. ||| Wir können diese Bedingungen aktualisieren. Die überarbeitete Version wird unter dieser URL mit einem neuen Datum des Inkrafttretens veröffentlicht.","privacySupplement":"Wir verwenden Cookies und ähnliche Technologien, um die Website zu betreiben, die Nutzung zu analysieren und Inhalte zu personalisieren. Besuchern aus der EU, dem EWR und der Schweiz wird ein Cookie-Zustimmungsbanner angezeigt. Sie können die Cookie-Einstellungen in Ihren Browsereinstellungen verwalten. ||| Wir erfassen wissentlich keine personenbezogenen Daten von Kindern unter 13 Jahren in den USA oder unter 16 Jahren in der EU/EWR. Wenn wir erfahren, dass wir solche Daten erhoben haben, werden wir diese löschen. ||| Unsere Website kann Links zu Websites Dritter enthalten. Wir sind nicht für deren Datenschutzpraktiken verantwortlich. ||| Wir können diese Richtlinie aktualisieren. Die neue Version wird unter dieser URL mit einem geänderten Datum des Inkrafttretens veröffentlicht."};
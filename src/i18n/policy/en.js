@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Terms","navPrivacy":"Privacy","termsTitle":"Terms of Service","privacyTitle":"Privacy Policy","updated":"Last updated: 24 February 2026","termsText":"These Terms of Service (\"Terms\") govern your access to and use of the e-commerce services offered through https://rhythmnexus.org (\"Website\") operated by Rhythm Nexus (\"we\", \"us\", or \"our\"). By accessing, browsing, or purchasing from the Website, you agree to be bound by these Terms. If you do not agree, you may not use the Website or place an order. ||| You must be at least 18 years old or the age of majority in your jurisdiction to purchase products from this Website. By placing an order, you represent and warrant that you meet this requirement. ||| You may be asked to create an account to make a purchase. You agree to provide accurate, current, and complete information. You are responsible for safeguarding your account credentials. You must notify us immediately of any unauthorized use. We may terminate or suspend your account at any time for violations of these Terms. ||| We strive to display product information accurately, but we do not warrant that product descriptions or other content are error-free. ||| Prices are shown in United States Dollar (USD) and include applicable taxes where required by law. We may change prices at any time before you place an order. ||| Your order is an offer to buy. Acceptance occurs when we confirm your order by email, or when we ship the products, whichever happens first. We may decline or cancel orders for reasons including incorrect pricing, out-of-stock products, or suspected fraud. ||| We accept the payment methods shown during checkout. By submitting payment details, you authorize us to charge the amount due and confirm you are the rightful account holder. We use third-party payment processors to securely handle payment information. ||| Shipping estimates are provided for convenience and do not guarantee delivery dates. Once products are transferred to a carrier, risk of loss passes to you. You are responsible for customs duties and import taxes, and for delivery errors caused by incorrect address information. ||| If you reside in the EU, EEA, or Switzerland, you have the legal right to return products within 14 days of receipt for a full refund. Products must be returned in original condition. Return shipping may be at your cost as allowed by law. Digital products may be excluded if the download begins with your consent and you acknowledge loss of right of withdrawal. ||| Return eligibility for US customers is outlined in our separate Return & Refund Policy posted on the Website. Some items (e.g., digital downloads, personalized items) may be non-refundable. ||| If you purchase digital items, delivery is electronic, you are granted a personal non-exclusive license to use the content, and you may not redistribute, resell, or share downloads without permission. ||| All Website content (text, designs, software, graphics, images) is owned by or licensed to Rhythm Nexus and protected by copyright and intellectual property laws. You may not reproduce, modify, distribute, or create derivative works without written permission.","privacyText":"Rhythm Nexus (\"we\", \"us\", or \"our\") respects your privacy and is committed to protecting your personal data. This Privacy Policy explains what personal data we collect, how it is used, who we share it with, and your rights. This policy applies to users from the EU, EEA, Switzerland, and the USA. ||| We collect the personal information you voluntarily provide, including name, email address, billing and shipping address, phone number, and payment information handled by third-party processors. ||| We automatically collect IP address, browser type, device data, usage data, cookies, and tracking technologies. ||| If you are in the EU/EEA/Switzerland, we process your data based on contract performance (order fulfillment), legal obligation, legitimate interests, and consent where required. ||| We use your data to process orders, ship products, communicate with you, provide customer support, comply with legal obligations, improve our Website, and send marketing communications with consent. ||| We may share your data with payment processors, shipping partners, analytics providers, marketing service providers, and legal authorities when required. We do not sell personal data. ||| EU/EEA/Swiss users have GDPR rights to access personal data, correct inaccurate data, erase data, restrict processing, object to processing, port data, and withdraw consent. To exercise these rights, contact us at rhythmnexusco@gmail.com. ||| USA users (CCPA/CPRA, where applicable) may have rights to know what personal data is collected, request deletion, opt-out of data sharing, and non-discrimination for exercising rights. To submit requests, email rhythmnexusco@gmail.com. ||| We retain personal data as long as necessary to fulfill orders, comply with legal requirements, and resolve disputes. ||| We may transfer data outside of your region. When transferring from the EU/EEA/Switzerland, we use Standard Contractual Clauses (SCCs) and other lawful safeguards. ||| We implement reasonable technical and organizational safeguards including SSL encryption, secure payment systems, and access control measures. However, no system is 100% secure.","termsSupplement":"To the maximum extent permitted by applicable law, we are not liable for indirect, incidental, or consequential damages, loss of data, lost profits, or business interruption. Our total liability shall not exceed the amount you paid for the product(s) purchased. For consumers in the EU/EEA/Switzerland, mandatory statutory rights are unaffected. ||| These Terms are governed by the laws of Singapore without regard to conflict of law principles. EU/EEA/Swiss users may have additional protections under local law that cannot be waived. ||| EU/EEA/Swiss users may access the EU Online Dispute Resolution platform: https://ec.europa.eu/consumers/odr/ ||| USA users may resolve disputes through negotiation, arbitration (if agreed), or court action in their jurisdiction. ||| We may update these Terms. The revised version will be posted at this URL with a new effective date.","privacySupplement":"We use cookies and similar technologies to operate the Website, analyze usage, and personalize content. EU/EEA/Swiss visitors will be shown a cookie consent banner. You can manage cookie preferences in your browser settings. ||| We do not knowingly collect personal data from children under 13 in the USA or under 16 in the EU/EEA. If we learn that we have collected such data, we will delete it. ||| Our Website may contain links to third-party sites. We are not responsible for their privacy practices. ||| We may update this policy. The new version will be posted at this URL with a revised effective date."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Términos","navPrivacy":"Privacidad","termsTitle":"Términos de servicio","privacyTitle":"política de privacidad","updated":"Última actualización: 24 de febrero de 2026","termsText":"Estos Términos de servicio (\"Términos\") rigen su acceso y uso de los servicios de comercio electrónico ofrecidos a través de https://rhythmnexus.org (\"Sitio web\") operados por Rhythm Nexus (\"nosotros\", \"nos\" o \"nuestro\"). Al acceder, navegar o comprar en el sitio web, usted acepta estar sujeto a estos Términos. Si no está de acuerdo, no podrá utilizar el sitio web ni realizar un pedido. ||| Debe tener al menos 18 años o la mayoría de edad en su jurisdicción para comprar productos en este sitio web. Al realizar un pedido, usted declara y garantiza que cumple con este requisito. ||| Es posible que se le solicite que cree una cuenta para realizar una compra. Usted acepta proporcionar información precisa, actual y completa. Usted es responsable de salvaguardar las credenciales de su cuenta. Debe notificarnos inmediatamente de cualquier uso no autorizado. Podemos cancelar o suspender su cuenta en cualquier momento por violaciones de estos Términos. ||| Nos esforzamos por mostrar la información del producto con precisión, pero no garantizamos que las descripciones de los productos u otro contenido estén libres de errores. ||| Los precios se muestran en dólares estadounidenses (USD) e incluyen los impuestos aplicables cuando lo exige la ley. Podemos cambiar los precios en cualquier momento antes de realizar un pedido. ||| Su pedido es una oferta de compra. La aceptación se produce cuando confirmamos su pedido por correo electrónico o cuando enviamos los productos, lo que ocurra primero. Podemos rechazar o cancelar pedidos por motivos que incluyen precios incorrectos, productos agotados o sospecha de fraude. ||| Aceptamos los métodos de pago que se muestran durante el proceso de pago. Al enviar los detalles de pago, nos autoriza a cobrar el monto adeudado y confirma que usted es el titular legítimo de la cuenta. Utilizamos procesadores de pagos de terceros para manejar de forma segura la información de pago. ||| Las estimaciones de envío se proporcionan para su comodidad y no garantizan fechas de entrega. Una vez que los productos se transfieren a un transportista, el riesgo de pérdida pasa a usted. Usted es responsable de los derechos de aduana e impuestos de importación, y de los errores de entrega causados ​​por información de dirección incorrecta. ||| Si reside en la UE, el EEE o Suiza, tiene el derecho legal de devolver los productos dentro de los 14 días posteriores a la recepción para obtener un reembolso completo. Los productos deben devolverse en su estado original. El envío de devolución puede correr a su cargo según lo permite la ley. Los productos digitales podrán quedar excluidos si la descarga comienza con su consentimiento y reconoce la pérdida del derecho de desistimiento. ||| La elegibilidad de devolución para clientes de EE. UU. se describe en nuestra Política de devolución y reembolso separada publicada en el sitio web. Es posible que algunos artículos (por ejemplo, descargas digitales, artículos personalizados) no sean reembolsables. ||| Si compra artículos digitales, la entrega es electrónica, se le otorga una licencia personal no exclusiva para usar el contenido y no puede redistribuir, revender ni compartir descargas sin permiso. ||| Todo el contenido del sitio web (texto, diseños, software, gráficos, imágenes) es propiedad de Rhythm Nexus o tiene licencia para ello y está protegido por las leyes de derechos de autor y propiedad intelectual. No puede reproducir, modificar, distribuir ni crear trabajos derivados sin permiso por escrito.","privacyText":"Rhythm Nexus (\"nosotros\", \"nos\" o \"nuestro\") respeta su privacidad y se compromete a proteger sus datos personales. Esta Política de Privacidad explica qué datos personales recopilamos, cómo se utilizan, con quién los compartimos y sus derechos. Esta política se aplica a usuarios de la UE, el EEE, Suiza y los EE. UU. ||| Recopilamos la información personal que usted proporciona voluntariamente, incluido el nombre, la dirección de correo electrónico, la dirección de facturación y envío, el número de teléfono y la información de pago manejada por procesadores externos. ||| Recopilamos automáticamente la dirección IP, el tipo de navegador, los datos del dispositivo, los datos de uso, las cookies y las tecnologías de seguimiento. ||| Si se encuentra en la UE, el EEE o Suiza, procesamos sus datos en función de la ejecución del contrato (cumplimiento del pedido), la obligación legal, los intereses legítimos y el consentimiento cuando sea necesario. ||| Utilizamos sus datos para procesar pedidos, enviar productos, comunicarnos con usted, brindar atención al cliente, cumplir con obligaciones legales, mejorar nuestro sitio web y enviar comunicaciones de marketing con su consentimiento. ||| Podemos compartir sus datos con procesadores de pagos, socios de envío, proveedores de análisis, proveedores de servicios de marketing y autoridades legales cuando sea necesario. No vendemos datos personales. ||| Los usuarios de la UE/EEE/Suiza tienen derechos GDPR para acceder a datos personales, corregir datos inexactos, borrar datos, restringir el procesamiento, oponerse al procesamiento, transferir datos y retirar el consentimiento. Para ejercer estos derechos, contáctenos en ritmonexusco@gmail.com. ||| Los usuarios de EE. UU. (CCPA/CPRA, cuando corresponda) pueden tener derecho a saber qué datos personales se recopilan, solicitar la eliminación, optar por no compartir datos y no discriminación para ejercer derechos. Para enviar solicitudes, envíe un correo electrónico a ritmonexusco@gmail.com. ||| Conservamos datos personales durante el tiempo necesario para cumplir con los pedidos, cumplir con los requisitos legales y resolver disputas. ||| Podemos transferir datos fuera de su región. Cuando realizamos transferencias desde la UE/EEE/Suiza, utilizamos cláusulas contractuales estándar (SCC) y otras salvaguardias legales. ||| Implementamos salvaguardias técnicas y organizativas razonables que incluyen cifrado SSL, sistemas de pago seguros y medidas de control de acceso. Sin embargo, ningún sistema es 100% seguro.","termsSupplement":"En la medida máxima permitida por la ley aplicable, no somos responsables de daños indirectos, incidentales o consecuentes, pérdida de datos, pérdida de ganancias o interrupción del negocio. Nuestra responsabilidad total no excederá el monto que usted pagó por los productos adquiridos. Para los consumidores de la UE/EEE/Suiza, los derechos legales obligatorios no se ven afectados. ||| Estos Términos se rigen por las leyes de [Su Jurisdicción] sin tener en cuenta los principios de conflicto de leyes. Los usuarios de la UE, el EEE y Suiza pueden tener protecciones adicionales según la legislación local a las que no se puede renunciar. ||| Los usuarios de la UE, el EEE y Suiza pueden acceder a la plataforma de resolución de disputas en línea de la UE: https://ec.europa.eu/consumers/odr/ ||| Los usuarios de EE. UU. pueden resolver disputas mediante negociación, arbitraje (si se acuerda) o acciones judiciales en su jurisdicción. ||| Podemos actualizar estos Términos. La versión revisada se publicará en esta URL con una nueva fecha de vigencia.","privacySupplement":"Utilizamos cookies y tecnologías similares para operar el sitio web, analizar el uso y personalizar el contenido. A los visitantes de la UE, el EEE y Suiza se les mostrará un banner de consentimiento de cookies. Puede administrar las preferencias de cookies en la configuración de su navegador. ||| No recopilamos intencionadamente datos personales de niños menores de 13 años en los EE. UU. o menores de 16 años en la UE/EEE. Si descubrimos que hemos recopilado dichos datos, los eliminaremos. ||| Nuestro sitio web puede contener enlaces a sitios de terceros. No somos responsables de sus prácticas de privacidad. ||| Es posible que actualicemos esta política. La nueva versión se publicará en esta URL con una fecha de vigencia revisada."};
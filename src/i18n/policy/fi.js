@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Ehdot","navPrivacy":"Yksityisyys","termsTitle":"Palveluehdot","privacyTitle":"Tietosuojakäytäntö","updated":"Viimeksi päivitetty: 24. helmikuuta 2026","termsText":"Nämä käyttöehdot (\"Ehdot\") säätelevät pääsyäsi verkkokauppapalveluihin, joita tarjotaan Rhythm Nexuksen (\"me\", \"meitä\" tai \"meidän\") kautta https://rhythmnexus.org (\"verkkosivusto\") tarjoamien verkkokauppapalveluiden kautta. Käyttämällä verkkosivustoa, selaamalla tai ostamalla sivustolta sitoudut noudattamaan näitä ehtoja. Jos et hyväksy, et voi käyttää verkkosivustoa tai tehdä tilausta. ||| Sinun on oltava vähintään 18-vuotias tai täysi-ikäinen lainkäyttöalueellasi ostaaksesi tuotteita tältä verkkosivustolta. Tekemällä tilauksen vakuutat ja takaat, että täytät tämän vaatimuksen. ||| Sinua saatetaan pyytää luomaan tili ostoksen tekemistä varten. Sitoudut antamaan tarkat, ajantasaiset ja täydelliset tiedot. Olet vastuussa tilisi tunnistetietojen turvaamisesta. Sinun tulee ilmoittaa meille välittömästi kaikesta luvattomasta käytöstä. Voimme sulkea tai jäädyttää tilisi milloin tahansa näiden ehtojen rikkomisesta. ||| Pyrimme näyttämään tuotetiedot oikein, mutta emme takaa, että tuotekuvaukset tai muu sisältö ovat virheettömiä. ||| Hinnat on ilmoitettu Yhdysvaltain dollareina (USD) ja sisältävät sovellettavat verot lain edellyttämissä tapauksissa. Voimme muuttaa hintoja milloin tahansa ennen tilauksen tekemistä. ||| Tilauksesi on ostotarjous. Hyväksyminen tapahtuu, kun vahvistamme tilauksesi sähköpostitse tai kun lähetämme tuotteet sen mukaan, kumpi tapahtuu ensin. Saatamme hylätä tai peruuttaa tilaukset syistä, kuten virheellisestä hinnoittelusta, lopputuotteista tai epäillystä petoksesta. ||| Hyväksymme kassalla näkyvät maksutavat. Lähettämällä maksutiedot valtuutat meidät veloittamaan erääntyvän summan ja vahvistamaan, että olet tilin oikeutettu haltija. Käytämme kolmannen osapuolen maksukäsittelijöitä maksutietojen turvalliseen käsittelyyn. ||| Toimitusarviot on annettu mukavuuden vuoksi, eivätkä ne takaa toimituspäiviä. Kun tuotteet on siirretty kuljetusliikkeelle, katoamisriski siirtyy sinulle. Olet vastuussa tulleista ja tuontiveroista sekä virheellisistä osoitetiedoista johtuvista toimitusvirheistä. ||| Jos asut EU:ssa, ETA:ssa tai Sveitsissä, sinulla on laillinen oikeus palauttaa tuotteet 14 päivän kuluessa vastaanottamisesta saadaksesi täyden hyvityksen. Tuotteet tulee palauttaa alkuperäisessä kunnossa. Palautus voi tapahtua omalla kustannuksellasi lain sallimalla tavalla. Digitaaliset tuotteet voidaan sulkea pois, jos lataus alkaa suostumuksellasi ja hyväksyt peruuttamisoikeuden menettämisen. ||| Yhdysvaltalaisten asiakkaiden palautusoikeus on kuvattu verkkosivustollamme julkaistussa erillisessä palautus- ja hyvityskäytännössämme. Jotkut tuotteet (esim. digitaaliset lataukset, henkilökohtaiset tuotteet) eivät välttämättä ole hyvitettäviä. ||| Jos ostat digitaalisia tuotteita, toimitus tapahtuu sähköisesti, sinulle myönnetään henkilökohtainen, ei-yksinomainen lisenssi käyttää sisältöä, etkä saa jakaa, jälleenmyydä tai jakaa latauksia ilman lupaa. ||| Kaikki Web-sivuston sisältö (teksti, mallit, ohjelmistot, grafiikat, kuvat) on Rhythm Nexuksen omistuksessa tai lisensoituna, ja se on suojattu tekijänoikeus- ja immateriaalioikeuksilla. Et saa jäljentää, muokata, jakaa tai luoda johdannaisteoksia ilman kirjallista lupaa.","privacyText":"Rhythm Nexus (\"me\", \"me\" tai \"meidän\") kunnioittaa yksityisyyttäsi ja on sitoutunut suojaamaan henkilötietojasi. Tämä tietosuojakäytäntö selittää, mitä henkilötietoja keräämme, miten niitä käytetään, kenen kanssa jaamme ne ja oikeutesi. Tämä käytäntö koskee käyttäjiä EU:sta, ETA:sta, Sveitsistä ja Yhdysvalloista. ||| Keräämme vapaaehtoisesti antamiasi henkilötietoja, mukaan lukien nimi, sähköpostiosoite, laskutus- ja toimitusosoite, puhelinnumero ja kolmannen osapuolen käsittelijöiden käsittelemät maksutiedot. ||| Keräämme automaattisesti IP-osoitteen, selaintyypin, laitetiedot, käyttötiedot, evästeet ja seurantateknologiat. ||| Jos olet EU/ETA/Sveitsissä, käsittelemme tietojasi sopimuksen toteuttamisen (tilauksen täyttämisen), lakisääteisen velvoitteen, oikeutetun edun ja tarvittaessa suostumuksen perusteella. ||| Käytämme tietojasi tilausten käsittelyyn, tuotteiden toimittamiseen, yhteydenpitoon kanssasi, asiakastuen tarjoamiseen, lakisääteisten velvoitteiden noudattamiseen, verkkosivustomme parantamiseen ja markkinointiviestien lähettämiseen suostumuksella. ||| Voimme tarvittaessa jakaa tietosi maksujen käsittelijöille, toimituskumppaneille, analytiikkatoimittajille, markkinointipalveluntarjoajille ja lakiviranomaisille. Emme myy henkilötietoja. ||| EU/ETA/Sveitsin käyttäjillä on GDPR-oikeudet päästä käsiksi henkilötietoihin, korjata virheellisiä tietoja, poistaa tietoja, rajoittaa käsittelyä, vastustaa käsittelyä, siirtää tietoja ja peruuttaa suostumus. Voit käyttää näitä oikeuksia ottamalla meihin yhteyttä osoitteeseen rhythmnexusco@gmail.com. ||| USA:n käyttäjillä (CCPA/CPRA, soveltuvin osin) voi olla oikeus tietää, mitä henkilötietoja kerätään, pyytää poistamista, kieltäytyä tietojen jakamisesta ja syrjimättömyyttä oikeuksiensa käyttämisessä. Lähetä pyyntöjä sähköpostitse rhythmnexusco@gmail.com. ||| Säilytämme henkilötietoja niin kauan kuin on tarpeen tilausten täyttämiseksi, lakisääteisten vaatimusten noudattamiseksi ja riitojen ratkaisemiseksi. ||| Saatamme siirtää tietoja alueesi ulkopuolelle. Siirtyessämme EU/ETA/Sveitsistä käytämme vakiosopimuslausekkeita (SCC) ja muita laillisia suojakeinoja. ||| Toteutamme kohtuulliset tekniset ja organisatoriset suojatoimenpiteet, kuten SSL-salauksen, turvalliset maksujärjestelmät ja kulunvalvontatoimenpiteet. Mikään järjestelmä ei kuitenkaan ole 100 % turvallinen.","termsSupplement":"Sovellettavan lain sallimissa rajoissa emme ole vastuussa välillisistä, satunnaisista tai välillisistä vahingoista, tietojen menetyksestä, menetetyistä voitoista tai liiketoiminnan keskeytymisestä. Kokonaisvastuumme ei ylitä summaa, jonka maksoit ostetusta tuotteesta/tuotteista. Tämä ei vaikuta EU:n/ETA:n/Sveitsin kuluttajien pakollisiin lakisääteisiin oikeuksiin. ||| Näitä ehtoja säätelevät [Oma lainkäyttöalueesi] lait ottamatta huomioon lainvalintaperiaatteita. EU/ETA/Sveitsin käyttäjillä voi olla paikallisen lain mukaisia ​​lisäsuojauksia, joista ei voida luopua. ||| EU/ETA/Sveitsin käyttäjät voivat käyttää EU:n online-riitojenratkaisualustaa: https://ec.europa.eu/consumers/odr/ ||| Yhdysvaltalaiset käyttäjät voivat ratkaista kiistat neuvottelujen, välimiesmenettelyn (jos niin on sovittu) tai tuomioistuinmenettelyn kautta lainkäyttöalueellaan. ||| Voimme päivittää näitä ehtoja. Tarkistettu versio julkaistaan ​​tässä URL-osoitteessa uudella voimaantulopäivämäärällä.","privacySupplement":"Käytämme evästeitä ja vastaavia tekniikoita verkkosivuston käyttämiseen, käytön analysointiin ja sisällön personointiin. EU/ETA/Sveitsin vierailijoille näytetään evästeen suostumusbanneri. Voit hallita evästeasetuksia selaimesi asetuksista. ||| Emme tietoisesti kerää henkilötietoja alle 13-vuotiailta lapsilta Yhdysvalloissa tai alle 16-vuotiailta lapsilta EU/ETA:ssa. Jos saamme tietää, että olemme keränneet tällaisia ​​tietoja, poistamme ne. ||| Verkkosivustomme voi sisältää linkkejä kolmansien osapuolien sivustoille. Emme ole vastuussa heidän tietosuojakäytännöistään. ||| Saatamme päivittää tätä käytäntöä. Uusi versio julkaistaan ​​tässä URL-osoitteessa tarkistetulla voimaantulopäivämäärällä."};
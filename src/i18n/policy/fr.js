@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Termes","navPrivacy":"Confidentialité","termsTitle":"Conditions d'utilisation","privacyTitle":"politique de confidentialité","updated":"Dernière mise à jour: 24 février 2026","termsText":"Ces conditions d'utilisation (« Conditions ») régissent votre accès et votre utilisation des services de commerce électronique proposés via https://rhythmnexus.org (« Site Web ») exploités par Rhythm Nexus (« nous », « notre » ou « notre »). En accédant, en naviguant ou en achetant sur le site Web, vous acceptez d'être lié par ces conditions. Si vous n’êtes pas d’accord, vous ne pouvez pas utiliser le site Web ni passer de commande. ||| Vous devez avoir au moins 18 ans ou avoir atteint l'âge de la majorité dans votre juridiction pour acheter des produits sur ce site Web. En passant une commande, vous déclarez et garantissez que vous répondez à cette exigence. ||| Il peut vous être demandé de créer un compte pour effectuer un achat. Vous acceptez de fournir des informations exactes, actuelles et complètes. Vous êtes responsable de la protection des informations d’identification de votre compte. Vous devez nous informer immédiatement de toute utilisation non autorisée. Nous pouvons résilier ou suspendre votre compte à tout moment en cas de violation de ces Conditions. ||| Nous nous efforçons d'afficher les informations sur les produits avec précision, mais nous ne garantissons pas que les descriptions de produits ou tout autre contenu sont exempts d'erreurs. ||| Les prix sont indiqués en dollars américains (USD) et incluent les taxes applicables lorsque la loi l'exige. Nous pouvons modifier les prix à tout moment avant que vous passiez une commande. ||| Votre commande est une offre d'achat. L'acceptation a lieu lorsque nous confirmons votre commande par e-mail ou lorsque nous expédions les produits, selon la première éventualité. Nous pouvons refuser ou annuler des commandes pour des raisons telles que des prix incorrects, des produits en rupture de stock ou des soupçons de fraude. ||| Nous acceptons les modes de paiement indiqués lors du paiement. En soumettant les détails du paiement, vous nous autorisez à facturer le montant dû et confirmez que vous êtes le titulaire légitime du compte. Nous utilisons des processeurs de paiement tiers pour traiter en toute sécurité les informations de paiement. ||| Les estimations d’expédition sont fournies pour plus de commodité et ne garantissent pas les dates de livraison. Une fois les produits transférés à un transporteur, le risque de perte vous est transféré. Vous êtes responsable des droits de douane et des taxes d'importation, ainsi que des erreurs de livraison causées par des informations d'adresse incorrectes. ||| Si vous résidez dans l'UE, l'EEE ou la Suisse, vous avez le droit légal de retourner les produits dans les 14 jours suivant leur réception pour un remboursement complet. Les produits doivent être retournés dans leur état d'origine. Les frais de retour peuvent être à vos frais, comme le permet la loi. Les produits numériques peuvent être exclus si le téléchargement commence avec votre consentement et que vous reconnaissez la perte du droit de rétractation. ||| L'éligibilité au retour pour les clients américains est décrite dans notre politique de retour et de remboursement distincte publiée sur le site Web. Certains articles (par exemple, les téléchargements numériques, les articles personnalisés) peuvent ne pas être remboursables. ||| Si vous achetez des articles numériques, la livraison est électronique, vous bénéficiez d'une licence personnelle non exclusive pour utiliser le contenu et vous ne pouvez pas redistribuer, revendre ou partager des téléchargements sans autorisation. ||| Tout le contenu du site Web (textes, conceptions, logiciels, graphiques, images) est la propriété ou sous licence de Rhythm Nexus et est protégé par les lois sur le droit d'auteur et la propriété intellectuelle. Vous ne pouvez pas reproduire, modifier, distribuer ou créer des œuvres dérivées sans autorisation écrite.","privacyText":"Rhythm Nexus (« nous », « notre » ou « notre ») respecte votre vie privée et s'engage à protéger vos données personnelles. Cette politique de confidentialité explique quelles données personnelles nous collectons, comment elles sont utilisées, avec qui nous les partageons et vos droits. Cette politique s'applique aux utilisateurs de l'UE, de l'EEE, de la Suisse et des États-Unis. ||| Nous collectons les informations personnelles que vous fournissez volontairement, notamment votre nom, votre adresse e-mail, votre adresse de facturation et d'expédition, votre numéro de téléphone et les informations de paiement traitées par des processeurs tiers. ||| Nous collectons automatiquement l'adresse IP, le type de navigateur, les données de l'appareil, les données d'utilisation, les cookies et les technologies de suivi. ||| Si vous résidez dans l'UE/EEE/Suisse, nous traitons vos données sur la base de l'exécution du contrat (exécution de la commande), de l'obligation légale, des intérêts légitimes et du consentement si nécessaire. ||| Nous utilisons vos données pour traiter les commandes, expédier des produits, communiquer avec vous, fournir une assistance client, respecter les obligations légales, améliorer notre site Web et envoyer des communications marketing avec votre consentement. ||| Nous pouvons partager vos données avec des processeurs de paiement, des partenaires d'expédition, des fournisseurs d'analyses, des prestataires de services marketing et des autorités judiciaires lorsque cela est nécessaire. Nous ne vendons pas de données personnelles. ||| Les utilisateurs de l'UE/EEE/Suisse disposent des droits RGPD pour accéder aux données personnelles, corriger les données inexactes, effacer les données, restreindre le traitement, s'opposer au traitement, transférer les données et retirer leur consentement. Pour exercer ces droits, contactez-nous à rythmenexusco@gmail.com. ||| Les utilisateurs américains (CCPA/CPRA, le cas échéant) peuvent avoir le droit de savoir quelles données personnelles sont collectées, de demander la suppression, de refuser le partage de données et de ne pas faire de discrimination dans l'exercice de leurs droits. Pour soumettre des demandes, envoyez un e-mail àrythmnexusco@gmail.com. ||| Nous conservons les données personnelles aussi longtemps que nécessaire pour exécuter les commandes, nous conformer aux exigences légales et résoudre les litiges. ||| Nous pouvons transférer des données en dehors de votre région. Lors d'un transfert depuis l'UE/EEE/Suisse, nous utilisons des clauses contractuelles types (CCS) et d'autres garanties légales. ||| Nous mettons en œuvre des mesures de protection techniques et organisationnelles raisonnables, notamment le cryptage SSL, des systèmes de paiement sécurisés et des mesures de contrôle d'accès. Cependant, aucun système n’est sécurisé à 100 %.","termsSupplement":"Dans la mesure permise par la loi applicable, nous ne sommes pas responsables des dommages indirects, accessoires ou consécutifs, de la perte de données, de la perte de bénéfices ou de l'interruption des activités. Notre responsabilité totale ne dépassera pas le montant que vous avez payé pour le(s) produit(s) acheté(s). Pour les consommateurs de l’UE/EEE/Suisse, les droits légaux obligatoires ne sont pas affectés. ||| Les présentes Conditions sont régies par les lois de [Votre Juridiction] sans égard aux principes de conflit de lois. Les utilisateurs de l’UE/EEE/Suisse peuvent bénéficier de protections supplémentaires en vertu de la législation locale auxquelles il est impossible de renoncer. ||| Les utilisateurs de l'UE/EEE/Suisse peuvent accéder à la plateforme de règlement des litiges en ligne de l'UE: https://ec.europa.eu/consumers/odr/ ||| Les utilisateurs américains peuvent résoudre les litiges par la négociation, l'arbitrage (si convenu) ou une action en justice dans leur juridiction. ||| Nous pouvons mettre à jour ces conditions. La version révisée sera publiée à cette URL avec une nouvelle date d'entrée en vigueur.","privacySupplement":"Nous utilisons des cookies et des technologies similaires pour exploiter le site Web, analyser l'utilisation et personnaliser le contenu. Les visiteurs de l’UE/EEE/Suisse verront une bannière de consentement aux cookies. Vous pouvez gérer les préférences en matière de cookies dans les paramètres de votre navigateur. ||| Nous ne collectons pas sciemment de données personnelles auprès d'enfants de moins de 13 ans aux États-Unis ou de moins de 16 ans dans l'UE/EEE. Si nous apprenons que nous avons collecté de telles données, nous les supprimerons. ||| Notre site Web peut contenir des liens vers des sites tiers. Nous ne sommes pas responsables de leurs pratiques de confidentialité. ||| Nous pouvons mettre à jour cette politique. La nouvelle version sera publiée à cette URL avec une date d'entrée en vigueur révisée."};
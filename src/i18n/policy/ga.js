@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Téarmaí","navPrivacy":"Príobháideacht","termsTitle":"Téarmaí Seirbhíse","privacyTitle":"Beartas Príobháideachta","updated":"Nuashonrú is déanaí: 24 Feabhra 2026","termsText":"Rialaíonn na Téarmaí Seirbhíse seo (“Téarmaí”) do rochtain ar agus úsáid na seirbhísí ríomhthráchtála a thairgtear trí https://rhythmnexus.org (\"Suíomh Gréasáin\") arna oibriú ag Rhythm Nexus (\"muid\", \"sinn\", nó \"ár\"). Trí rochtain, brabhsáil nó ceannach ón Láithreán Gréasáin, aontaíonn tú a bheith faoi cheangal ag na Téarmaí seo. Mura n-aontaíonn tú, ní fhéadfaidh tú an Láithreán Gréasáin a úsáid ná ordú a dhéanamh. ||| Ní mór duit a bheith 18 mbliana d’aois ar a laghad nó tromlach d’aois i do dhlínse chun táirgí a cheannach ón Láithreán Gréasáin seo. Trí ordú a dhéanamh, déanann tú ionadaíocht agus barántas go gcomhlíonann tú an riachtanas seo. ||| Seans go n-iarrfar ort cuntas a chruthú chun ceannachán a dhéanamh. Aontaíonn tú faisnéis chruinn, reatha agus iomlán a sholáthar. Tá tú freagrach as do dhintiúir chuntais a chosaint. Ní mór duit aon úsáid neamhúdaraithe a chur in iúl dúinn láithreach. Féadfaimid do chuntas a fhoirceannadh nó a chur ar fionraí ag am ar bith mar gheall ar shárú ar na Téarmaí seo. ||| Déanaimid ár ndícheall faisnéis faoi tháirgí a thaispeáint go cruinn, ach ní bharántaímid go bhfuil tuairiscí táirge nó ábhar eile saor ó earráidí. ||| Taispeántar praghsanna i nDollar na Stát Aontaithe (USD) agus áirítear leo cánacha is infheidhme nuair a éilíonn an dlí iad. Féadfaimid praghsanna a athrú ag am ar bith sula ndéanann tú ordú. ||| Is tairiscint le ceannach é d’ordú. Glactar leis nuair a dheimhnímid d'ordú trí ríomhphost, nó nuair a sheolaimid na táirgí, cibé acu is túisce a tharlaíonn. Féadfaimid orduithe a dhiúltú nó a chealú ar chúiseanna lena n-áirítear praghsáil mhícheart, táirgí as stoic, nó calaois amhrasta. ||| Glacaimid leis na modhanna íocaíochta a thaispeántar le linn an tseiceáil amach. Trí shonraí íocaíochta a chur isteach, údaraíonn tú dúinn an méid atá dlite a ghearradh agus deimhníonn tú gur tusa an sealbhóir ceart cuntais. Bainimid úsáid as próiseálaithe íocaíochta tríú páirtí chun faisnéis íocaíochta a láimhseáil go slán. ||| Cuirtear meastacháin loingseoireachta ar fáil mar áis agus ní ráthaítear dátaí seachadta. Nuair a aistrítear táirgí chuig iompróir, téann an riosca caillteanais chugat. Tá tú freagrach as dleachtanna custaim agus cánacha ar allmhairí, agus as earráidí seachadta de bharr faisnéis seolta mícheart. ||| Má tá cónaí ort san AE, LEE, nó san Eilvéis, tá an ceart dlíthiúil agat táirgí a thabhairt ar ais laistigh de 14 lá tar éis aisíocaíocht iomlán a fháil. Ní mór táirgí a thabhairt ar ais sa riocht bunaidh. D’fhéadfadh go mbeadh loingseoireachta fillte ar do chostas mar a cheadaítear de réir an dlí. Féadfar táirgí digiteacha a eisiamh má thosaíonn an t-íoslódáil le do thoiliú agus má admhaíonn tú cailleadh ceart aistarraingthe. ||| Tugtar breac-chuntas ar incháilitheacht do chustaiméirí SAM inár mBeartas um Fhilleadh agus Aisíocaíocht ar leith atá curtha suas ar an Láithreán Gréasáin. Seans go mbeidh roinnt míreanna (m.sh. íoslódálacha digiteacha, míreanna pearsantaithe) neamh-inaisíoctha. ||| Má cheannaíonn tú earraí digiteacha, is seachadadh leictreonach é, bronntar ceadúnas pearsanta neamheisiatach duit chun an t-ábhar a úsáid, agus ní féidir leat íoslódálacha a athdháileadh, a athdhíol nó a roinnt gan chead. ||| Tá gach ábhar ar an Láithreán Gréasáin (téacs, dearaí, bogearraí, grafaicí, íomhánna) faoi úinéireacht Rhythm Nexus nó ceadúnaithe dó agus cosanta ag dlíthe cóipchirt agus maoine intleachtúla. Ní féidir leat saothair díorthaigh a atáirgeadh, a mhodhnú, a dháileadh ná a chruthú gan cead scríofa.","privacyText":"Tá meas ag Rhythm Nexus (\"muid\", \"sinn\", nó \"ár\") do phríobháideachas agus tá sé tiomanta do shonraí pearsanta a chosaint. Míníonn an Beartas Príobháideachta seo na sonraí pearsanta a bhailímid, conas a úsáidtear iad, cé leis a roinnimid iad, agus do chearta. Baineann an beartas seo le húsáideoirí ón AE, LEE, an Eilvéis agus SAM. ||| Bailímid an fhaisnéis phearsanta a sholáthraíonn tú go deonach, lena n-áirítear ainm, seoladh ríomhphoist, seoladh billeála agus seolta, uimhir theileafóin, agus faisnéis íocaíochta a láimhseálann próiseálaithe tríú páirtí. ||| Bailímid go huathoibríoch seoladh IP, cineál brabhsálaí, sonraí gléis, sonraí úsáide, fianáin, agus teicneolaíochtaí rianaithe. ||| Má tá tú san AE/LEE/an Eilvéis, próiseálaimid do shonraí bunaithe ar fheidhmíocht conartha (comhlíonadh ordaithe), oibleagáid dhlíthiúil, leasanna dlisteanacha, agus toiliú nuair is gá. ||| Bainimid úsáid as do shonraí chun orduithe a phróiseáil, táirgí a sheoladh, cumarsáid a dhéanamh leat, tacaíocht a sholáthar do chustaiméirí, cloí le hoibleagáidí dlíthiúla, feabhas a chur ar ár Láithreán Gréasáin, agus cumarsáid mhargaíochta a sheoladh le toiliú. ||| Féadfaimid do shonraí a chomhroinnt le próiseálaithe íocaíochta, le comhpháirtithe loingseoireachta, le soláthraithe anailíse, le soláthraithe seirbhísí margaíochta, agus le húdaráis dhlíthiúla nuair is gá. Ní dhíolaimid sonraí pearsanta. ||| Tá cearta GDPR ag úsáideoirí an AE/LEE/na hEilvéise rochtain a fháil ar shonraí pearsanta, sonraí míchruinne a cheartú, sonraí a scriosadh, próiseáil a shrianadh, agóid a dhéanamh i gcoinne próiseála, sonraí calafoirt, agus toiliú a tharraingt siar. Chun na cearta seo a fheidhmiú, déan teagmháil linn ag rhythmnexusco@gmail.com. ||| D’fhéadfadh cearta a bheith ag úsáideoirí SAM (CCPA/CPRA, nuair is infheidhme) fios a bheith acu cad iad na sonraí pearsanta a bhailítear, scriosadh a iarraidh, diúltú do chomhroinnt sonraí, agus neamh-idirdhealú maidir le cearta a fheidhmiú. Chun iarratais a chur isteach, seol ríomhphost chuig rhythmnexusco@gmail.com. ||| Coimeádaimid sonraí pearsanta chomh fada agus is gá chun orduithe a chomhlíonadh, ceanglais dhlíthiúla a chomhlíonadh, agus chun díospóidí a réiteach. ||| Féadfaimid sonraí a aistriú lasmuigh de do réigiún. Agus muid ag aistriú ón AE/LEE/an Eilvéis, úsáidimid Clásail Chaighdeánacha Conarthacha (SCCanna) agus cosaintí dleathacha eile. ||| Cuirimid cosaintí teicniúla agus eagraíochtúla réasúnta i bhfeidhm lena n-áirítear criptiú SSL, córais íocaíochta slána, agus bearta rialaithe rochtana. Mar sin féin, níl aon chóras 100% slán.","termsSupplement":"A mhéid a cheadaítear faoin dlí is infheidhme, nílimid faoi dhliteanas i leith damáistí indíreacha, teagmhasacha nó iarmhartacha, cailleadh sonraí, brabúis chaillte, nó briseadh gnó. Ní sháróidh ár ndliteanas iomlán an méid a d'íoc tú as an táirge/na táirgí a ceannaíodh. I gcás tomhaltóirí san AE/LEE/an Eilvéis, níl aon tionchar ar chearta reachtúla éigeantacha. ||| Tá na Téarmaí seo á rialú ag dlíthe [Do Dhlínse] gan aird ar phrionsabail easaontachta dlí. D’fhéadfadh cosaintí breise a bheith ag úsáideoirí AE/LEE/na hEilvéise faoin dlí áitiúil nach féidir a tharscaoileadh. ||| Féadfaidh úsáideoirí AE/EEA/Eilvéise rochtain a fháil ar an ardán um Réiteach Díospóide Ar Líne an AE: https://ec.europa.eu/consumers/odr/ ||| Féadfaidh úsáideoirí SAM díospóidí a réiteach trí idirbheartaíocht, eadráin (má chomhaontaítear é), nó caingean cúirte ina ndlínse. ||| Is féidir linn na Téarmaí seo a nuashonrú. Déanfar an leagan athbhreithnithe a phostáil ag an URL seo le dáta éifeachtach nua.","privacySupplement":"Bainimid úsáid as fianáin agus teicneolaíochtaí cosúla chun an Láithreán Gréasáin a oibriú, chun anailís a dhéanamh ar úsáid agus chun ábhar a phearsantú. Taispeánfar bratach toilithe fianán do chuairteoirí AE/LEE/Eilvéise. Is féidir leat sainroghanna fianán a bhainistiú i socruithe do bhrabhsálaí. ||| Ní bhailímid go feasach sonraí pearsanta ó leanaí faoi 13 i SAM nó faoi 16 san AE/LEE. Má fhaigheann muid amach go bhfuil sonraí den sórt sin bailithe againn, scriosfaimid é. ||| Féadfaidh naisc chuig láithreáin tríú páirtí a bheith ar ár Láithreán Gréasáin. Nílimid freagrach as a gcleachtais phríobháideachais. ||| Féadfaimid an polasaí seo a nuashonrú. Déanfar an leagan nua a phostáil ag an URL seo le dáta éifeachtach athbhreithnithe."};
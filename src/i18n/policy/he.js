@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"תנאים","navPrivacy":"פְּרָטִיוּת","termsTitle":"תנאים והגבלות","privacyTitle":"מדיניות פרטיות","updated":"עדכון אחרון: 24 בפברואר 2026","termsText":"תנאים והגבלות אלה (\"תנאים\") מסדירים את הגישה והשימוש שלך בשירותי המסחר האלקטרוני המוצעים דרך https://rhythmnexus.org (\"אתר\") המופעל על ידי Rhythm Nexus (\"אנחנו\", \"אנחנו\" או \"שלנו\"). על ידי גישה, גלישה או רכישה מהאתר, אתה מסכים להיות כפוף לתנאים אלה. אם אינך מסכים, אינך רשאי להשתמש באתר או לבצע הזמנה. ||| עליך להיות בן 18 לפחות או בגיל הבגרות בתחום השיפוט שלך כדי לרכוש מוצרים מאתר זה. על ידי ביצוע הזמנה, אתה מצהיר ומתחייב שאתה עומד בדרישה זו. ||| ייתכן שתתבקש ליצור חשבון כדי לבצע רכישה. אתה מסכים לספק מידע מדויק, עדכני ומלא. אתה אחראי לשמירה על אישורי החשבון שלך. עליך להודיע ​​לנו מיד על כל שימוש לא מורשה. אנו עשויים לסיים או להשעות את חשבונך בכל עת עקב הפרות של תנאים אלה. ||| אנו שואפים להציג מידע מוצר בצורה מדויקת, אך איננו מתחייבים שתיאורי מוצר או תוכן אחר הינם נקיים מטעויות. ||| המחירים מוצגים בדולר ארה\"ב (דולר ארה\"ב) וכוללים מסים החלים כאשר הדבר נדרש על פי חוק. אנו עשויים לשנות מחירים בכל עת לפני שתבצע הזמנה. ||| ההזמנה שלך היא הצעה לקנייה. הקבלה מתרחשת כאשר אנו מאשרים את הזמנתך בדוא\"ל, או כאשר אנו שולחים את המוצרים, המוקדם מביניהם. אנו עשויים לדחות או לבטל הזמנות מסיבות כולל תמחור שגוי, מוצרים שאזלו מהמלאי או חשד להונאה. ||| אנו מקבלים את אמצעי התשלום המוצגים במהלך התשלום. על ידי שליחת פרטי תשלום, אתה מאשר לנו לחייב את הסכום המגיע ומאשר שאתה בעל החשבון החוקי. אנו משתמשים במעבדי תשלומים של צד שלישי כדי לטפל בצורה מאובטחת בפרטי תשלום. ||| הערכות משלוח מסופקות מטעמי נוחות ואינן מבטיחות תאריכי אספקה. לאחר העברת המוצרים למוביל, הסיכון לאובדן עובר אליך. אתה אחראי למכסים ומסי יבוא, ולשגיאות מסירה שנגרמו כתוצאה מפרטי כתובת שגויים. ||| אם אתה מתגורר באיחוד האירופי, EEA או שוויץ, יש לך את הזכות החוקית להחזיר מוצרים תוך 14 ימים מיום הקבלה לקבלת החזר מלא. יש להחזיר מוצרים במצב מקורי. משלוח חזרה עשוי להיות על חשבונך כפי שמותר בחוק. ייתכן שלא ייכללו מוצרים דיגיטליים אם ההורדה מתחילה בהסכמתך ואתה מכיר באובדן זכות הביטול. ||| זכאות החזרה ללקוחות בארה\"ב מתוארת במדיניות ההחזרה וההחזרים הנפרדת שלנו המפורסמת באתר. חלק מהפריטים (לדוגמה, הורדות דיגיטליות, פריטים מותאמים אישית) עשויים להיות שאינם ניתנים להחזר. ||| אם אתה רוכש פריטים דיגיטליים, המשלוח הוא אלקטרוני, אתה מקבל רישיון אישי לא בלעדי להשתמש בתוכן, ואין להפיץ מחדש, למכור מחדש או לשתף הורדות ללא רשות. ||| כל תוכן האתר (טקסט, עיצובים, תוכנות, גרפיקה, תמונות) הוא בבעלות או ברישיון ל-Rhythm Nexus ומוגן על ידי חוקי זכויות יוצרים וקניין רוחני. אינך רשאי לשכפל, לשנות, להפיץ או ליצור יצירות נגזרות ללא אישור בכתב.","privacyText":"Rhythm Nexus (\"אנחנו\", \"אנחנו\" או \"שלנו\") מכבדת את פרטיותך ומחויבת להגן על הנתונים האישיים שלך. מדיניות פרטיות זו מסבירה אילו נתונים אישיים אנו אוספים, כיצד נעשה בהם שימוש, עם מי אנו חולקים אותם וזכויותיך. מדיניות זו חלה על משתמשים מהאיחוד האירופי, EEA, שוויץ וארה\"ב. ||| אנו אוספים את המידע האישי שאתה מספק מרצון, לרבות שם, כתובת דואר אלקטרוני, כתובת לחיוב ומשלוח, מספר טלפון ופרטי תשלום המטופלים על ידי מעבדי צד שלישי. ||| אנו אוספים באופן אוטומטי כתובת IP, סוג דפדפן, נתוני מכשיר, נתוני שימוש, קובצי Cookie וטכנולוגיות מעקב. ||| אם אתה נמצא באיחוד האירופי/EEA/שוויץ, אנו מעבדים את הנתונים שלך על סמך ביצוע חוזה (מילוי הזמנה), חובה משפטית, אינטרסים לגיטימיים והסכמה במידת הצורך. ||| אנו משתמשים בנתונים שלך כדי לעבד הזמנות, לשלוח מוצרים, לתקשר איתך, לספק תמיכת לקוחות, לעמוד בהתחייבויות משפטיות, לשפר את האתר שלנו ולשלוח תקשורת שיווקית בהסכמה. ||| אנו עשויים לחלוק את הנתונים שלך עם מעבדי תשלומים, שותפי משלוח, ספקי ניתוח, ספקי שירותי שיווק ורשויות משפטיות בעת הצורך. אנחנו לא מוכרים נתונים אישיים. ||| למשתמשי האיחוד האירופי/EEA/שוויץ יש זכויות GDPR לגשת לנתונים אישיים, לתקן נתונים לא מדויקים, למחוק נתונים, להגביל עיבוד, להתנגד לעיבוד, לנתק נתונים ולבטל הסכמה. למימוש זכויות אלו, צור איתנו קשר בכתובת rhythmnexusco@gmail.com. ||| למשתמשים בארה\"ב (CCPA/CPRA, היכן שרלוונטי) עשויות להיות זכויות לדעת אילו נתונים אישיים נאספים, לבקש מחיקה, ביטול הסכמה לשיתוף נתונים ואי-אפליה בגין מימוש זכויות. להגשת בקשות, שלח דוא\"ל לrhythmnexusco@gmail.com. ||| אנו שומרים נתונים אישיים כל עוד נחוץ כדי למלא הזמנות, לציית לדרישות החוק ולפתור מחלוקות. ||| אנו עשויים להעביר נתונים מחוץ לאזור שלך. בעת העברה מהאיחוד האירופי/EEA/שוויץ, אנו משתמשים בסעיפים חוזיים סטנדרטיים (SCCs) ובאמצעי הגנה חוקיים אחרים. ||| אנו מיישמים אמצעי הגנה טכניים וארגוניים סבירים לרבות הצפנת SSL, מערכות תשלום מאובטחות ואמצעי בקרת גישה. עם זאת, אף מערכת לא מאובטחת ב-100%.","termsSupplement":"במידה המקסימלית המותרת על פי החוק החל, איננו אחראים לנזקים עקיפים, מקריים או תוצאתיים, אובדן נתונים, אובדן רווחים או הפרעה עסקית. החבות הכוללת שלנו לא תעלה על הסכום ששילמת עבור המוצר/ים שנרכשו. עבור צרכנים באיחוד האירופי/EEA/שוויץ, זכויות חובה בחוק אינן מושפעות. ||| תנאים אלה כפופים לחוקי [תחום השיפוט שלך] ללא התחשבות בעקרונות ניגוד החוק. למשתמשים באיחוד האירופי/EEA/שוויץ עשויות להיות הגנות נוספות במסגרת החוק המקומי שלא ניתן לוותר עליהן. ||| משתמשי EU/EEA/Swiss יכולים לגשת לפלטפורמת יישוב סכסוכים מקוונים של האיחוד האירופי: https://ec.europa.eu/consumers/odr/ ||| משתמשים בארה\"ב עשויים לפתור מחלוקות באמצעות משא ומתן, בוררות (אם הוסכם), או תביעה משפטית בתחום השיפוט שלהם. ||| אנו עשויים לעדכן תנאים אלה. הגרסה המתוקנת תפורסם בכתובת האתר הזו עם תאריך תוקף חדש.","privacySupplement":"אנו משתמשים בעוגיות ובטכנולוגיות דומות כדי לתפעל את האתר, לנתח את השימוש ולהתאים אישית את התוכן. למבקרים באיחוד האירופי/EEA/שווייץ יוצג באנר הסכמה לקובצי Cookie. אתה יכול לנהל את העדפות העוגיות בהגדרות הדפדפן שלך. ||| איננו אוספים ביודעין מידע אישי מילדים מתחת לגיל 13 בארה\"ב או מתחת לגיל 16 באיחוד האירופי/EEA. אם נודע שאספנו נתונים כאלה, נמחק אותם. ||| האתר שלנו עשוי להכיל קישורים לאתרי צד שלישי. איננו אחראים לנוהלי הפרטיות שלהם. ||| אנו עשויים לעדכן מדיניות זו. הגרסה החדשה תפורסם בכתובת האתר הזו עם תאריך תוקף מתוקן."};
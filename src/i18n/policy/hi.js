@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"शर्तें","navPrivacy":"गोपनीयता","termsTitle":"सेवा की शर्तें","privacyTitle":"गोपनीयता नीति","updated":"अंतिम अद्यतन: 24 फरवरी 2026","termsText":"सेवा की ये शर्तें (\"शर्तें\") रिदम नेक्सस (\"हम\", \"हम\", या \"हमारा\") द्वारा संचालित https://rhythmnexus.org (\"वेबसाइट\") के माध्यम से दी जाने वाली ई-कॉमर्स सेवाओं तक आपकी पहुंच और उपयोग को नियंत्रित करती हैं। वेबसाइट तक पहुंचने, ब्राउज़ करने या खरीदारी करने से, आप इन शर्तों से बंधे होने के लिए सहमत होते हैं। यदि आप सहमत नहीं हैं, तो आप वेबसाइट का उपयोग नहीं कर सकते या ऑर्डर नहीं दे सकते। ||| इस वेबसाइट से उत्पाद खरीदने के लिए आपकी आयु कम से कम 18 वर्ष या आपके अधिकार क्षेत्र में वयस्कता की आयु होनी चाहिए। ऑर्डर देकर, आप प्रतिनिधित्व करते हैं और आश्वासन देते हैं कि आप इस आवश्यकता को पूरा करते हैं। ||| आपको खरीदारी करने के लिए एक खाता बनाने के लिए कहा जा सकता है। आप सटीक, वर्तमान और संपूर्ण जानकारी प्रदान करने के लिए सहमत हैं। आप अपने खाते के क्रेडेंशियल्स की सुरक्षा के लिए जिम्मेदार हैं। आपको किसी भी अनधिकृत उपयोग के बारे में हमें तुरंत सूचित करना चाहिए। इन शर्तों के उल्लंघन के लिए हम किसी भी समय आपका खाता समाप्त या निलंबित कर सकते हैं। ||| हम उत्पाद जानकारी को सटीक रूप से प्रदर्शित करने का प्रयास करते हैं, लेकिन हम यह गारंटी नहीं देते हैं कि उत्पाद विवरण या अन्य सामग्री त्रुटि-मुक्त हैं। ||| कीमतें यूनाइटेड स्टेट्स डॉलर (यूएसडी) में दिखाई जाती हैं और जहां कानून द्वारा आवश्यक हो वहां लागू कर शामिल होते हैं। आपके ऑर्डर देने से पहले हम किसी भी समय कीमतें बदल सकते हैं। ||| आपका ऑर्डर खरीदने का एक प्रस्ताव है. स्वीकृति तब होती है जब हम ईमेल द्वारा आपके ऑर्डर की पुष्टि करते हैं, या जब हम उत्पादों को भेजते हैं, जो भी पहले हो। हम गलत मूल्य निर्धारण, आउट-ऑफ-स्टॉक उत्पाद या संदिग्ध धोखाधड़ी सहित कारणों से ऑर्डर को अस्वीकार या रद्द कर सकते हैं। ||| हम चेकआउट के दौरान दिखाई गई भुगतान विधियों को स्वीकार करते हैं। भुगतान विवरण जमा करके, आप हमें देय राशि वसूलने और पुष्टि करने के लिए अधिकृत करते हैं कि आप सही खाताधारक हैं। भुगतान जानकारी को सुरक्षित रूप से प्रबंधित करने के लिए हम तृतीय-पक्ष भुगतान प्रोसेसर का उपयोग करते हैं। ||| शिपिंग अनुमान सुविधा के लिए प्रदान किए जाते हैं और डिलीवरी की तारीखों की गारंटी नहीं देते हैं। एक बार जब उत्पाद किसी वाहक को स्थानांतरित कर दिए जाते हैं, तो नुकसान का जोखिम आप पर आ जाता है। आप सीमा शुल्क और आयात करों और गलत पते की जानकारी के कारण होने वाली डिलीवरी त्रुटियों के लिए जिम्मेदार हैं। ||| यदि आप ईयू, ईईए या स्विट्जरलैंड में रहते हैं, तो आपके पास पूर्ण धन-वापसी के लिए प्राप्ति के 14 दिनों के भीतर उत्पाद वापस करने का कानूनी अधिकार है। उत्पादों को मूल स्थिति में लौटाया जाना चाहिए। वापसी शिपिंग कानून द्वारा अनुमत आपकी लागत पर हो सकती है। यदि डाउनलोड आपकी सहमति से शुरू होता है और आप वापसी के अधिकार के नुकसान को स्वीकार करते हैं तो डिजिटल उत्पादों को बाहर रखा जा सकता है। ||| अमेरिकी ग्राहकों के लिए रिटर्न पात्रता वेबसाइट पर पोस्ट की गई हमारी अलग रिटर्न और रिफंड नीति में उल्लिखित है। कुछ आइटम (जैसे, डिजिटल डाउनलोड, वैयक्तिकृत आइटम) गैर-वापसी योग्य हो सकते हैं। ||| यदि आप डिजिटल आइटम खरीदते हैं, तो डिलीवरी इलेक्ट्रॉनिक होती है, आपको सामग्री का उपयोग करने के लिए एक व्यक्तिगत गैर-विशिष्ट लाइसेंस दिया जाता है, और आप अनुमति के बिना पुनर्वितरित, पुनर्विक्रय या डाउनलोड साझा नहीं कर सकते हैं। ||| वेबसाइट की सभी सामग्री (पाठ, डिज़ाइन, सॉफ़्टवेयर, ग्राफ़िक्स, चित्र) रिदम नेक्सस के स्वामित्व या लाइसेंस प्राप्त है और कॉपीराइट और बौद्धिक संपदा कानूनों द्वारा संरक्षित है। आप लिखित अनुमति के बिना व्युत्पन्न कार्यों का पुनरुत्पादन, संशोधन, वितरण या निर्माण नहीं कर सकते हैं।","privacyText":"रिदम नेक्सस (\"हम\", \"हमें\", या \"हमारा\") आपकी गोपनीयता का सम्मान करता है और आपके व्यक्तिगत डेटा की सुरक्षा के लिए प्रतिबद्ध है। यह गोपनीयता नीति बताती है कि हम कौन सा व्यक्तिगत डेटा एकत्र करते हैं, इसका उपयोग कैसे किया जाता है, हम इसे किसके साथ साझा करते हैं और आपके अधिकार। यह नीति ईयू, ईईए, स्विट्जरलैंड और यूएसए के उपयोगकर्ताओं पर लागू होती है। ||| हम आपके द्वारा स्वेच्छा से प्रदान की गई व्यक्तिगत जानकारी एकत्र करते हैं, जिसमें नाम, ईमेल पता, बिलिंग और शिपिंग पता, फोन नंबर और तीसरे पक्ष के प्रोसेसर द्वारा प्रबंधित भुगतान जानकारी शामिल है। ||| हम स्वचालित रूप से आईपी पता, ब्राउज़र प्रकार, डिवाइस डेटा, उपयोग डेटा, कुकीज़ और ट्रैकिंग तकनीकें एकत्र करते हैं। ||| यदि आप ईयू/ईईए/स्विट्जरलैंड में हैं, तो हम आपके डेटा को अनुबंध प्रदर्शन (ऑर्डर पूर्ति), कानूनी दायित्व, वैध हितों और जहां आवश्यक हो, सहमति के आधार पर संसाधित करते हैं। ||| हम आपके डेटा का उपयोग ऑर्डर संसाधित करने, उत्पाद भेजने, आपके साथ संवाद करने, ग्राहक सहायता प्रदान करने, कानूनी दायित्वों का अनुपालन करने, हमारी वेबसाइट को बेहतर बनाने और सहमति के साथ विपणन संचार भेजने के लिए करते हैं। ||| आवश्यकता पड़ने पर हम आपका डेटा भुगतान प्रोसेसर, शिपिंग पार्टनर, एनालिटिक्स प्रदाता, मार्केटिंग सेवा प्रदाता और कानूनी अधिकारियों के साथ साझा कर सकते हैं। हम व्यक्तिगत डेटा नहीं बेचते हैं. ||| ईयू/ईईए/स्विस उपयोगकर्ताओं के पास व्यक्तिगत डेटा तक पहुंचने, गलत डेटा को सही करने, डेटा मिटाने, प्रसंस्करण को प्रतिबंधित करने, प्रसंस्करण पर आपत्ति करने, डेटा पोर्ट करने और सहमति वापस लेने के जीडीपीआर अधिकार हैं। इन अधिकारों का प्रयोग करने के लिए, हमसे Rhythnexusco@gmail.com पर संपर्क करें। ||| यूएसए उपयोगकर्ताओं (सीसीपीए/सीपीआरए, जहां लागू हो) के पास यह जानने का अधिकार हो सकता है कि कौन सा व्यक्तिगत डेटा एकत्र किया गया है, हटाने का अनुरोध करें, डेटा साझा करने से ऑप्ट-आउट करें, और अधिकारों का प्रयोग करने में भेदभाव न करें। अनुरोध सबमिट करने के लिए, Rhythnexusco@gmail.com पर ईमेल करें। ||| आदेशों को पूरा करने, कानूनी आवश्यकताओं का अनुपालन करने और विवादों को हल करने के लिए जब तक आवश्यक हो हम व्यक्तिगत डेटा बनाए रखते हैं। ||| हम आपके क्षेत्र के बाहर डेटा स्थानांतरित कर सकते हैं। ईयू/ईईए/स्विट्जरलैंड से स्थानांतरित करते समय, हम मानक अनुबंध खंड (एससीसी) और अन्य वैध सुरक्षा उपायों का उपयोग करते हैं। ||| हम एसएसएल एन्क्रिप्शन, सुरक्षित भुगतान प्रणाली और पहुंच नियंत्रण उपायों सहित उचित तकनीकी और संगठनात्मक सुरक्षा उपायों को लागू करते हैं। हालाँकि, कोई भी सिस्टम 100% सुरक्षित नहीं है।","termsSupplement":"लागू कानून द्वारा अनुमत अधिकतम सीमा तक, हम अप्रत्यक्ष, आकस्मिक, या परिणामी क्षति, डेटा की हानि, खोए हुए मुनाफे या व्यावसायिक रुकावट के लिए उत्तरदायी नहीं हैं। हमारी कुल देनदारी आपके द्वारा खरीदे गए उत्पाद(उत्पादों) के लिए भुगतान की गई राशि से अधिक नहीं होगी। ईयू/ईईए/स्विट्जरलैंड में उपभोक्ताओं के लिए, अनिवार्य वैधानिक अधिकार अप्रभावित हैं। ||| ये शर्तें कानूनी सिद्धांतों के टकराव की परवाह किए बिना [आपके क्षेत्राधिकार] के कानूनों द्वारा शासित होती हैं। ईयू/ईईए/स्विस उपयोगकर्ताओं को स्थानीय कानून के तहत अतिरिक्त सुरक्षा मिल सकती है जिसे माफ नहीं किया जा सकता है। ||| EU/EEA/स्विस उपयोगकर्ता EU ऑनलाइन विवाद समाधान प्लेटफ़ॉर्म तक पहुंच सकते हैं: https://ec.europa.eu/consumers/odr/ ||| यूएसए उपयोगकर्ता अपने अधिकार क्षेत्र में बातचीत, मध्यस्थता (यदि सहमति हो) या अदालती कार्रवाई के माध्यम से विवादों को हल कर सकते हैं। ||| हम इन शर्तों को अद्यतन कर सकते हैं। संशोधित संस्करण एक नई प्रभावी तिथि के साथ इस यूआरएल पर पोस्ट किया जाएगा।","privacySupplement":"हम वेबसाइट को संचालित करने, उपयोग का विश्लेषण करने और सामग्री को वैयक्तिकृत करने के लिए कुकीज़ और समान तकनीकों का उपयोग करते हैं। ईयू/ईईए/स्विस आगंतुकों को कुकी सहमति बैनर दिखाया जाएगा। आप अपनी ब्राउज़र सेटिंग में कुकी प्राथमिकताएं प्रबंधित कर सकते हैं. ||| हम जानबूझकर संयुक्त राज्य अमेरिका में 13 वर्ष से कम उम्र के बच्चों या ईयू/ईईए में 16 वर्ष से कम उम्र के बच्चों का व्यक्तिगत डेटा एकत्र नहीं करते हैं। अगर हमें पता चलता है कि हमने ऐसा डेटा एकत्र किया है, तो हम इसे हटा देंगे। ||| हमारी वेबसाइट में तृतीय-पक्ष साइटों के लिंक हो सकते हैं। हम उनकी गोपनीयता प्रथाओं के लिए ज़िम्मेदार नहीं हैं। ||| हम इस नीति को अद्यतन कर सकते हैं. नया संस्करण संशोधित प्रभावी तिथि के साथ इस यूआरएल पर पोस्ट किया जाएगा।"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Ketentuan","navPrivacy":"Pribadi","termsTitle":"Ketentuan Layanan","privacyTitle":"Kebijakan Privasi","updated":"Terakhir diperbarui: 24 Februari 2026","termsText":"Ketentuan Layanan ini (\"Ketentuan\") mengatur akses Anda dan penggunaan layanan e-niaga yang ditawarkan melalui https://rhythmnexus.org (\"Situs Web\") yang dioperasikan oleh Rhythm Nexus (\"kami\", atau \"milik kami\"). Dengan mengakses, menelusuri, atau membeli dari Situs Web, Anda setuju untuk terikat oleh Ketentuan ini. Jika Anda tidak setuju, Anda tidak boleh menggunakan Situs Web atau melakukan pemesanan. ||| Anda harus berusia minimal 18 tahun atau usia dewasa di yurisdiksi Anda untuk membeli produk dari Situs Web ini. Dengan melakukan pemesanan, Anda menyatakan dan menjamin bahwa Anda memenuhi persyaratan ini. ||| Anda mungkin diminta membuat akun untuk melakukan pembelian. Anda setuju untuk memberikan informasi yang akurat, terkini, dan lengkap. Anda bertanggung jawab untuk menjaga kredensial akun Anda. Anda harus segera memberi tahu kami jika ada penggunaan yang tidak sah. Kami dapat menghentikan atau menangguhkan akun Anda kapan saja karena pelanggaran terhadap Ketentuan ini. ||| Kami berusaha menampilkan informasi produk secara akurat, namun kami tidak menjamin bahwa deskripsi produk atau konten lainnya bebas dari kesalahan. ||| Harga ditampilkan dalam Dolar Amerika Serikat (USD) dan sudah termasuk pajak yang berlaku jika diwajibkan oleh hukum. Kami dapat mengubah harga kapan saja sebelum Anda melakukan pemesanan. ||| Pesanan Anda adalah tawaran untuk membeli. Penerimaan terjadi ketika kami mengkonfirmasi pesanan Anda melalui email, atau ketika kami mengirimkan produk, mana saja yang lebih dulu. Kami dapat menolak atau membatalkan pesanan karena alasan termasuk harga yang salah, stok produk habis, atau dugaan penipuan. ||| Kami menerima metode pembayaran yang ditunjukkan saat checkout. Dengan mengirimkan rincian pembayaran, Anda memberi wewenang kepada kami untuk membebankan jumlah yang harus dibayar dan mengonfirmasi bahwa Anda adalah pemegang rekening yang sah. Kami menggunakan pemroses pembayaran pihak ketiga untuk menangani informasi pembayaran dengan aman. ||| Perkiraan pengiriman diberikan untuk kenyamanan dan tidak menjamin tanggal pengiriman. Setelah produk ditransfer ke operator, risiko kehilangan berpindah ke Anda. Anda bertanggung jawab atas bea masuk dan pajak impor, dan atas kesalahan pengiriman yang disebabkan oleh informasi alamat yang salah. ||| Jika Anda tinggal di UE, EEA, atau Swiss, Anda memiliki hak hukum untuk mengembalikan produk dalam waktu 14 hari sejak diterimanya untuk mendapatkan pengembalian dana penuh. Produk harus dikembalikan dalam kondisi asli. Pengiriman kembali mungkin menjadi biaya Anda sebagaimana diizinkan oleh hukum. Produk digital dapat dikecualikan jika pengunduhan dimulai dengan persetujuan Anda dan Anda mengakui hilangnya hak penarikan. ||| Kelayakan pengembalian untuk pelanggan AS diuraikan dalam Kebijakan Pengembalian & Pengembalian Dana terpisah yang diposting di Situs Web. Beberapa item (misalnya, unduhan digital, item yang dipersonalisasi) mungkin tidak dapat dikembalikan. ||| Jika Anda membeli barang digital, pengirimannya dilakukan secara elektronik, Anda diberikan lisensi non-eksklusif pribadi untuk menggunakan konten tersebut, dan Anda tidak boleh mendistribusikan ulang, menjual kembali, atau berbagi unduhan tanpa izin. ||| Semua konten Situs Web (teks, desain, perangkat lunak, grafik, gambar) dimiliki oleh atau dilisensikan kepada Rhythm Nexus dan dilindungi oleh undang-undang hak cipta dan kekayaan intelektual. Anda tidak boleh mereproduksi, memodifikasi, mendistribusikan, atau membuat karya turunan tanpa izin tertulis.","privacyText":"Rhythm Nexus (\"kami\", \"kita\", atau \"milik kami\") menghormati privasi Anda dan berkomitmen untuk melindungi data pribadi Anda. Kebijakan Privasi ini menjelaskan data pribadi apa yang kami kumpulkan, cara penggunaannya, dengan siapa kami membagikannya, dan hak-hak Anda. Kebijakan ini berlaku untuk pengguna dari UE, EEA, Swiss, dan Amerika Serikat. ||| Kami mengumpulkan informasi pribadi yang Anda berikan secara sukarela, termasuk nama, alamat email, alamat penagihan dan pengiriman, nomor telepon, dan informasi pembayaran yang ditangani oleh pemroses pihak ketiga. ||| Kami secara otomatis mengumpulkan alamat IP, jenis browser, data perangkat, data penggunaan, cookie, dan teknologi pelacakan. ||| Jika Anda berada di UE/EEA/Swiss, kami memproses data Anda berdasarkan kinerja kontrak (pemenuhan pesanan), kewajiban hukum, kepentingan sah, dan persetujuan jika diperlukan. ||| Kami menggunakan data Anda untuk memproses pesanan, mengirimkan produk, berkomunikasi dengan Anda, memberikan dukungan pelanggan, mematuhi kewajiban hukum, meningkatkan Situs Web kami, dan mengirimkan komunikasi pemasaran dengan persetujuan. ||| Kami dapat membagikan data Anda dengan pemroses pembayaran, mitra pengiriman, penyedia analisis, penyedia layanan pemasaran, dan otoritas hukum bila diperlukan. Kami tidak menjual data pribadi. ||| Pengguna UE/EEA/Swiss memiliki hak GDPR untuk mengakses data pribadi, memperbaiki data yang tidak akurat, menghapus data, membatasi pemrosesan, menolak pemrosesan, mentransfer data, dan membatalkan persetujuan. Untuk menggunakan hak ini, hubungi kami di rhythmnexusco@gmail.com. ||| Pengguna AS (CCPA/CPRA, jika berlaku) mungkin memiliki hak untuk mengetahui data pribadi apa yang dikumpulkan, meminta penghapusan, tidak ikut serta dalam pembagian data, dan non-diskriminasi dalam melaksanakan haknya. Untuk mengirimkan permintaan, kirim email ke rhythmnexusco@gmail.com. ||| Kami menyimpan data pribadi selama diperlukan untuk memenuhi pesanan, mematuhi persyaratan hukum, dan menyelesaikan perselisihan. ||| Kami mungkin mentransfer data ke luar wilayah Anda. Saat mentransfer dari UE/EEA/Swiss, kami menggunakan Klausul Kontrak Standar (SCC) dan perlindungan hukum lainnya. ||| Kami menerapkan pengamanan teknis dan organisasi yang wajar termasuk enkripsi SSL, sistem pembayaran yang aman, dan tindakan kontrol akses. Namun, tidak ada sistem yang 100% aman.","termsSupplement":"Sejauh diizinkan oleh hukum yang berlaku, kami tidak bertanggung jawab atas kerusakan tidak langsung, insidental, atau konsekuensial, kehilangan data, hilangnya keuntungan, atau gangguan bisnis. Tanggung jawab total kami tidak melebihi jumlah yang Anda bayarkan untuk produk yang dibeli. Bagi konsumen di UE/EEA/Swiss, hak wajib menurut undang-undang tidak terpengaruh. ||| Ketentuan ini diatur oleh hukum [Yurisdiksi Anda] tanpa memperhatikan pertentangan prinsip hukum. Pengguna UE/EEA/Swiss mungkin memiliki perlindungan tambahan berdasarkan hukum setempat yang tidak dapat diabaikan. ||| Pengguna EU/EEA/Swiss dapat mengakses platform Penyelesaian Sengketa Online UE: https://ec.europa.eu/consumers/odr/ ||| Pengguna AS dapat menyelesaikan perselisihan melalui negosiasi, arbitrase (jika disetujui), atau tindakan pengadilan di yurisdiksi mereka. ||| Kami dapat memperbarui Ketentuan ini. Versi revisi akan diposting di URL ini dengan tanggal efektif baru.","privacySupplement":"Kami menggunakan cookie dan teknologi serupa untuk mengoperasikan Situs Web, menganalisis penggunaan, dan mempersonalisasi konten. Pengunjung UE/EEA/Swiss akan diperlihatkan spanduk persetujuan cookie. Anda dapat mengelola preferensi cookie di pengaturan browser Anda. ||| Kami tidak dengan sengaja mengumpulkan data pribadi dari anak-anak di bawah 13 tahun di AS atau di bawah 16 tahun di UE/EEA. Jika kami mengetahui bahwa kami telah mengumpulkan data tersebut, kami akan menghapusnya. ||| Situs Web kami mungkin berisi tautan ke situs pihak ketiga. Kami tidak bertanggung jawab atas praktik privasi mereka. ||| Kami mungkin memperbarui kebijakan ini. Versi baru akan diposting di URL ini dengan tanggal efektif yang telah direvisi."};
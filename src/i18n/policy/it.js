@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Termini","navPrivacy":"Privacy","termsTitle":"Termini di servizio","privacyTitle":"politica sulla riservatezza","updated":"Ultimo aggiornamento: 24 febbraio 2026","termsText":"I presenti Termini di servizio (\"Termini\") regolano l'accesso e l'utilizzo dei servizi di e-commerce offerti tramite https://rhythmnexus.org (\"Sito Web\") gestito da Rhythm Nexus (\"noi\", \"ci\" o \"nostro\"). Accedendo, navigando o acquistando dal Sito, accetti di essere vincolato dai presenti Termini. Se non sei d'accordo, non potrai utilizzare il sito web o effettuare un ordine. ||| Per acquistare prodotti da questo sito Web è necessario avere almeno 18 anni o la maggiore età nella propria giurisdizione. Effettuando un ordine, dichiari e garantisci di soddisfare questo requisito. ||| Potrebbe esserti chiesto di creare un account per effettuare un acquisto. Accetti di fornire informazioni accurate, aggiornate e complete. Sei responsabile della salvaguardia delle credenziali del tuo account. È necessario avvisarci immediatamente di qualsiasi utilizzo non autorizzato. Possiamo chiudere o sospendere il tuo account in qualsiasi momento per violazioni di questi Termini. ||| Ci sforziamo di visualizzare le informazioni sui prodotti in modo accurato, ma non garantiamo che le descrizioni dei prodotti o altri contenuti siano privi di errori. ||| I prezzi sono indicati in dollari statunitensi (USD) e includono le tasse applicabili ove richiesto dalla legge. Possiamo modificare i prezzi in qualsiasi momento prima di effettuare un ordine. ||| Il tuo ordine è un'offerta di acquisto. L'accettazione avviene quando confermiamo il tuo ordine via e-mail o quando spediamo i prodotti, a seconda di quale evento si verifichi per primo. Potremmo rifiutare o annullare gli ordini per motivi quali prezzi errati, prodotti esauriti o sospetta frode. ||| Accettiamo i metodi di pagamento indicati durante il checkout. Inviando i dettagli di pagamento, ci autorizzi ad addebitare l'importo dovuto e confermi di essere il legittimo titolare del conto. Utilizziamo processori di pagamento di terze parti per gestire in modo sicuro le informazioni di pagamento. ||| Le stime di spedizione sono fornite per comodità e non garantiscono le date di consegna. Una volta che i prodotti vengono trasferiti a un corriere, il rischio di perdita passa a te. Sei responsabile dei dazi doganali e delle tasse di importazione e degli errori di consegna causati da informazioni errate sull'indirizzo. ||| Se risiedi nell'UE, nel SEE o in Svizzera, hai il diritto legale di restituire i prodotti entro 14 giorni dal ricevimento per un rimborso completo. I prodotti devono essere restituiti nello stato originale. La spedizione di restituzione potrebbe essere a tuo carico, come consentito dalla legge. I prodotti digitali possono essere esclusi se il download inizia con il tuo consenso e riconosci la perdita del diritto di recesso. ||| L'idoneità al reso per i clienti statunitensi è delineata nella nostra Politica di restituzione e rimborso separata pubblicata sul sito web. Alcuni articoli (ad esempio download digitali, articoli personalizzati) potrebbero non essere rimborsabili. ||| Se acquisti articoli digitali, la consegna è elettronica, ti viene concessa una licenza personale non esclusiva per utilizzare il contenuto e non puoi ridistribuire, rivendere o condividere i download senza autorizzazione. ||| Tutti i contenuti del sito Web (testo, design, software, grafica, immagini) sono di proprietà o concessi in licenza a Rhythm Nexus e protetti dalle leggi sul copyright e sulla proprietà intellettuale. Non è possibile riprodurre, modificare, distribuire o creare opere derivate senza autorizzazione scritta.","privacyText":"Rhythm Nexus (\"noi\", \"ci\" o \"nostro\") rispetta la tua privacy e si impegna a proteggere i tuoi dati personali. La presente Informativa sulla privacy spiega quali dati personali raccogliamo, come vengono utilizzati, con chi li condividiamo e i tuoi diritti. Questa politica si applica agli utenti dell'UE, del SEE, della Svizzera e degli Stati Uniti. ||| Raccogliamo le informazioni personali fornite volontariamente, inclusi nome, indirizzo e-mail, indirizzo di fatturazione e spedizione, numero di telefono e informazioni di pagamento gestite da processori di terze parti. ||| Raccogliamo automaticamente indirizzo IP, tipo di browser, dati del dispositivo, dati di utilizzo, cookie e tecnologie di tracciamento. ||| Se ti trovi nell'UE/SEE/Svizzera, trattiamo i tuoi dati in base all'esecuzione del contratto (adempimento degli ordini), agli obblighi legali, agli interessi legittimi e al consenso ove richiesto. ||| Utilizziamo i tuoi dati per elaborare gli ordini, spedire prodotti, comunicare con te, fornire assistenza clienti, rispettare gli obblighi legali, migliorare il nostro sito Web e inviare comunicazioni di marketing con il consenso. ||| Potremmo condividere i tuoi dati con elaboratori di pagamento, partner di spedizione, fornitori di analisi, fornitori di servizi di marketing e autorità legali quando richiesto. Non vendiamo dati personali. ||| Gli utenti UE/SEE/Svizzera hanno i diritti GDPR di accedere ai dati personali, correggere dati inesatti, cancellare dati, limitare il trattamento, opporsi al trattamento, trasferire dati e revocare il consenso. Per esercitare questi diritti, contattaci all'indirizzo rhythmnexusco@gmail.com. ||| Gli utenti statunitensi (CCPA/CPRA, ove applicabile) possono avere il diritto di sapere quali dati personali vengono raccolti, richiedere la cancellazione, rinunciare alla condivisione dei dati e non discriminazione per l'esercizio dei diritti. Per inviare richieste, inviare un'e-mail a rhythmnexusco@gmail.com. ||| Conserviamo i dati personali per il tempo necessario a evadere gli ordini, rispettare i requisiti legali e risolvere le controversie. ||| Potremmo trasferire dati al di fuori della tua regione. Quando ci trasferiamo da UE/SEE/Svizzera, utilizziamo clausole contrattuali standard (SCC) e altre tutele legali. ||| Implementiamo ragionevoli garanzie tecniche e organizzative tra cui crittografia SSL, sistemi di pagamento sicuri e misure di controllo degli accessi. Tuttavia, nessun sistema è sicuro al 100%.","termsSupplement":"Nella misura massima consentita dalla legge applicabile, non siamo responsabili per danni indiretti, incidentali o consequenziali, perdita di dati, perdita di profitti o interruzione dell'attività. La nostra responsabilità totale non supererà l'importo pagato per il/i prodotto/i acquistato/i. Per i consumatori nell'UE/SEE/Svizzera, i diritti legali obbligatori rimangono inalterati. ||| Le presenti Condizioni sono regolate dalle leggi di [La tua giurisdizione] indipendentemente dai principi di conflitto di leggi. Gli utenti UE/SEE/Svizzera potrebbero godere di protezioni aggiuntive ai sensi della legge locale a cui non è possibile rinunciare. ||| Gli utenti UE/SEE/svizzeri possono accedere alla piattaforma di risoluzione delle controversie online dell'UE: https://ec.europa.eu/consumers/odr/ ||| Gli utenti statunitensi possono risolvere le controversie tramite negoziazione, arbitrato (se concordato) o azione legale nella loro giurisdizione. ||| Potremmo aggiornare questi Termini. La versione rivista verrà pubblicata a questo URL con una nuova data di entrata in vigore.","privacySupplement":"Utilizziamo cookie e tecnologie simili per gestire il sito Web, analizzarne l'utilizzo e personalizzare i contenuti. Ai visitatori UE/SEE/Svizzera verrà mostrato un banner di consenso sui cookie. Puoi gestire le preferenze dei cookie nelle impostazioni del tuo browser. ||| Non raccogliamo consapevolmente dati personali di bambini sotto i 13 anni negli Stati Uniti o sotto i 16 anni nell'UE/SEE. Se apprendiamo di aver raccolto tali dati, li cancelleremo. ||| Il nostro sito Web può contenere collegamenti a siti di terze parti. Non siamo responsabili delle loro pratiche sulla privacy. ||| Potremmo aggiornare questa politica. La nuova versione verrà pubblicata a questo URL con una data di entrata in vigore rivista."};
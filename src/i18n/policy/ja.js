@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"条項","navPrivacy":"プライバシー","termsTitle":"利用規約","privacyTitle":"プライバシーポリシー","updated":"最終更新日: 2026 年 2 月 24 日","termsText":"これらの利用規約 (「規約」) は、Rhythm Nexus (「当社」) が運営する https://rhythmnexus.org (「ウェブサイト」) を通じて提供される電子商取引サービスへのお客様のアクセスおよび使用を規定します。本ウェブサイトにアクセス、閲覧、または購入することにより、お客様は本規約に拘束されることに同意したものとみなされます。同意しない場合は、ウェブサイトを使用したり、注文したりすることはできません。 ||| この Web サイトから製品を購入するには、18 歳以上、または管轄区域における成人年齢に達している必要があります。注文することにより、この要件を満たすことを表明および保証するものとします。 ||| 購入するにはアカウントの作成を求められる場合があります。あなたは、正確、最新、完全な情報を提供することに同意するものとします。あなたには、自分のアカウント資格情報を保護する責任があります。不正使用があった場合は、直ちに当社に通知する必要があります。これらの規約に違反した場合、当社はいつでもお客様のアカウントを終了または一時停止することができます。 ||| 商品情報を正確に表示するよう努めておりますが、商品説明やその他の内容に誤りがないことを保証するものではありません。 ||| 価格は米ドル (USD) で表示されており、法律で義務付けられている場合には適用される税金が含まれています。ご注文前に随時価格を変更させていただく場合がございます。 ||| あなたの注文は購入の申し出です。ご注文はメールで確認した時点、または商品を発送した時点のいずれか早い時点で承認となります。価格設定の誤り、商品の在庫切れ、詐欺の疑いなどの理由により、ご注文をお断りまたはキャンセルさせていただく場合がございます。 ||| チェックアウト時に表示される支払い方法を受け入れます。支払いの詳細を送信することにより、お客様は当社が未払い金額を請求することを承認し、お客様が正当なアカウント所有者であることを確認するものとします。当社は、支払い情報を安全に処理するためにサードパーティの支払い処理業者を使用しています。 ||| 配送見積もりは便宜のために提供されており、配送日を保証するものではありません。製品が運送業者に転送されると、紛失のリスクはお客様に移ります。関税および輸入税、および住所情報の誤りによる配送ミスについてはお客様の責任となります。 ||| EU、EEA、またはスイスにお住まいの場合、商品を受領後 14 日以内に返品し、全額返金を受ける法的権利があります。製品は元の状態で返品する必要があります。法律で認められているとおり、返品の送料はお客様のご負担となる場合があります。お客様の同意を得てダウンロードが開始され、取り消し権の喪失をお客様が認めた場合、デジタル製品は除外される場合があります。 ||| 米国のお客様の返品資格については、ウェブサイトに掲載されている別の返品および返金ポリシーに概説されています。一部の商品 (デジタル ダウンロード、パーソナライズされた商品など) は返金できない場合があります。 ||| デジタル アイテムを購入した場合、配信は電子的に行われ、コンテンツを使用するための個人的非独占的ライセンスが付与され、許可なくダウンロードを再配布、再販、または共有することはできません。 ||| すべての Web サイトのコンテンツ (テキスト、デザイン、ソフトウェア、グラフィック、画像) は Rhythm Nexus が所有するか、Rhythm Nexus にライセンス供与されており、著作権法および知的財産法によって保護されています。書面による許可なく複製、変更、配布、派生作品を作成することはできません。","privacyText":"Rhythm Nexus (「当社」) はお客様のプライバシーを尊重し、お客様の個人データの保護に努めます。このプライバシー ポリシーでは、当社が収集する個人データ、その使用方法、共有先、およびお客様の権利について説明します。このポリシーは、EU、EEA、スイス、米国のユーザーに適用されます。 ||| 当社は、名前、電子メール アドレス、請求先および配送先住所、電話番号、サードパーティの処理業者が処理する支払い情報など、お客様が自発的に提供した個人情報を収集します。 ||| 当社は、IP アドレス、ブラウザの種類、デバイス データ、使用状況データ、Cookie、および追跡テクノロジーを自動的に収集します。 ||| お客様が EU/EEA/スイスにお住まいの場合、当社は契約履行 (注文履行)、法的義務、正当な利益、および必要に応じて同意に基づいてお客様のデータを処理します。 ||| 当社は、注文の処理、製品の発送、お客様とのコミュニケーション、顧客サポートの提供、法的義務の遵守、当社ウェブサイトの改善、および同意を得たマーケティングコミュニケーションの送信のためにお客様のデータを使用します。 ||| 当社は、必要に応じて、お客様のデータを決済処理業者、配送パートナー、分析プロバイダー、マーケティング サービス プロバイダー、および法的当局と共有する場合があります。当社は個人データを販売しません。 ||| EU/EEA/スイスのユーザーは、個人データへのアクセス、不正確なデータの修正、データの消去、処理の制限、処理への異議、データの移植、および同意の撤回を行うための GDPR 権利を有します。これらの権利を行使するには、rhythmnexusco@gmail.com までご連絡ください。 ||| 米国のユーザー (CCPA/CPRA、該当する場合) は、収集される個人データを知る権利、削除要求、データ共有のオプトアウト、および権利行使に対する無差別の権利を有する場合があります。リクエストを送信するには、rhythmnexusco@gmail.com まで電子メールを送信してください。 ||| 当社は、注文の履行、法的要件の遵守、紛争の解決に必要な限り個人データを保持します。 ||| お住まいの地域外にデータを転送する場合があります。 EU/EEA/スイスから転送する場合、当社は標準契約条項 (SCC) およびその他の法的保護手段を使用します。 ||| 当社は、SSL暗号化、安全な支払いシステム、アクセス制御手段などの合理的な技術的および組織的保護措置を導入しています。ただし、100% 安全なシステムはありません。","termsSupplement":"適用される法律で認められる最大限の範囲で、当社は間接的、付随的、結果的損害、データの損失、利益の損失、または事業の中断に対して責任を負いません。当社の責任総額は、お客様が購入した製品に対して支払った金額を超えないものとします。 EU/EEA/スイスの消費者にとって、強制的な法的権利は影響を受けません。 ||| これらの規約は、法の抵触の原則に関係なく、[管轄区域] の法律に準拠します。 EU/EEA/スイスのユーザーは、現地法に基づいて放棄できない追加の保護を受ける場合があります。 ||| EU/EEA/スイスのユーザーは、EU オンライン紛争解決プラットフォームにアクセスできます: https://ec.europa.eu/consumers/odr/ ||| 米国のユーザーは、交渉、仲裁 (合意されている場合)、または管轄区域内の訴訟を通じて紛争を解決することができます。 ||| 当社は本規約を更新する場合があります。改訂版は新しい発効日とともにこの URL に掲載されます。","privacySupplement":"当社は、Web サイトの運営、使用状況の分析、コンテンツのパーソナライズに Cookie および同様のテクノロジーを使用します。 EU/EEA/スイスの訪問者には、Cookie 同意バナーが表示されます。ブラウザの設定で Cookie の設定を管理できます。 ||| 当社は、米国では 13 歳未満、EU/EEA では 16 歳未満の子供から故意に個人データを収集しません。当社がそのようなデータを収集したことが判明した場合、当社はそのデータを削除します。 ||| 当社のウェブサイトには、サードパーティのサイトへのリンクが含まれている場合があります。当社は、彼らのプライバシー慣行については責任を負いません。 ||| このポリシーは更新される場合があります。新しいバージョンは、発効日が変更されてこの URL に掲載されます。"};
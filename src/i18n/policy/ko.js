@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"자귀","navPrivacy":"은둔","termsTitle":"서비스 약관","privacyTitle":"개인 정보 보호 정책","updated":"최종 업데이트 날짜: 2026년 2월 24일","termsText":"본 서비스 약관(\"약관\")은 Rhythm Nexus(\"당사\", \"당사\" 또는 \"당사의\")가 운영하는 https://rhythmnexus.org(\"웹사이트\")를 통해 제공되는 전자 상거래 서비스에 대한 액세스 및 사용에 적용됩니다. 웹사이트에 액세스하거나 검색하거나 구매함으로써 귀하는 본 약관을 준수할 것에 동의하게 됩니다. 동의하지 않으면 웹사이트를 이용하거나 주문할 수 없습니다. ||| 이 웹사이트에서 제품을 구매하려면 최소 18세 이상이거나 해당 관할권에서 성년이어야 합니다. 주문함으로써 귀하는 이 요구 사항을 충족함을 진술하고 보증합니다. ||| 구매를 위해 계정을 생성하라는 메시지가 표시될 수 있습니다. 귀하는 정확하고 최신의 완전한 정보를 제공하는 데 동의합니다. 귀하는 귀하의 계정 자격 증명을 보호할 책임이 있습니다. 무단 사용 시 즉시 당사에 알려주셔야 합니다. 당사는 본 약관을 위반한 경우 언제든지 귀하의 계정을 종료하거나 정지할 수 있습니다. ||| 당사는 제품 정보를 정확하게 표시하기 위해 노력하지만 제품 설명이나 기타 내용에 오류가 없음을 보증하지는 않습니다. ||| 가격은 미국 달러(USD)로 표시되며 법률에서 요구하는 경우 관련 세금이 포함됩니다. 귀하가 주문하기 전에 언제든지 가격이 변경될 수 있습니다. ||| 귀하의 주문은 구매 제안입니다. 승인은 이메일로 주문을 확인하거나 제품을 배송할 때 이루어집니다. 잘못된 가격, 품절 제품, 사기 의심 등의 이유로 주문을 거부하거나 취소할 수 있습니다. ||| 결제 시 표시된 결제 방법을 사용할 수 있습니다. 결제 세부정보를 제출함으로써 귀하는 당사가 미결제 금액을 청구할 수 있는 권한을 부여하고 귀하가 적법한 계정 소유자임을 확인하게 됩니다. 당사는 결제 정보를 안전하게 처리하기 위해 제3자 결제 처리업체를 사용합니다. ||| 배송 견적은 편의를 위해 제공되며 배송 날짜를 보장하지 않습니다. 제품이 운송업체로 이전되면 손실 위험이 귀하에게 전달됩니다. 관세 및 수입세, 잘못된 주소 정보로 인한 배송 오류에 대한 책임은 귀하에게 있습니다. ||| EU, EEA 또는 스위스에 거주하는 경우 제품 수령 후 14일 이내에 제품을 반품하고 전액 환불받을 수 있는 법적 권리가 있습니다. 제품은 원래 상태로 반품되어야 합니다. 반품 배송비는 법률에서 허용하는 바에 따라 귀하가 부담할 수 있습니다. 귀하의 동의 하에 다운로드가 시작되고 철회권 상실을 인정하는 경우 디지털 제품은 제외될 수 있습니다. ||| 미국 고객의 반품 자격은 웹사이트에 게시된 별도의 반품 및 환불 정책에 설명되어 있습니다. 일부 상품(예: 디지털 다운로드, 맞춤 상품)은 환불되지 않을 수 있습니다. ||| 디지털 아이템을 구매하는 경우 전자 배송이 이루어지며 콘텐츠를 사용할 수 있는 개인 비독점 라이센스가 부여되며 허가 없이 다운로드를 재배포, 재판매 또는 공유할 수 없습니다. ||| 모든 웹사이트 콘텐츠(텍스트, 디자인, 소프트웨어, 그래픽, 이미지)는 Rhythm Nexus가 소유하거나 Rhythm Nexus가 라이센스를 보유하고 있으며 저작권 및 지적 재산권법에 의해 보호됩니다. 귀하는 서면 허가 없이 복제, 수정, 배포하거나 파생물을 생성할 수 없습니다.","privacyText":"Rhythm Nexus(\"당사\", \"당사\" 또는 \"당사의\")는 귀하의 개인정보를 존중하며 귀하의 개인 데이터를 보호하기 위해 최선을 다하고 있습니다. 본 개인정보 보호정책은 당사가 수집하는 개인 데이터의 종류, 사용 방법, 공유 대상 및 귀하의 권리에 대해 설명합니다. 이 정책은 EU, EEA, 스위스, 미국의 사용자에게 적용됩니다. ||| 당사는 이름, 이메일 주소, 청구서 수신 및 배송 주소, 전화번호, 제3자 처리업체가 처리하는 결제 정보 등 귀하가 자발적으로 제공하는 개인정보를 수집합니다. ||| 당사는 IP 주소, 브라우저 유형, 장치 데이터, 사용 데이터, 쿠키 및 추적 기술을 자동으로 수집합니다. ||| 귀하가 EU/EEA/스위스에 거주하는 경우 당사는 계약 이행(주문 이행), 법적 의무, 적법한 이익 및 필요한 경우 동의를 기반으로 귀하의 데이터를 처리합니다. ||| 당사는 귀하의 데이터를 사용하여 주문을 처리하고, 제품을 배송하고, 귀하와 소통하고, 고객 지원을 제공하고, 법적 의무를 준수하고, 웹사이트를 개선하고, 동의 하에 마케팅 커뮤니케이션을 보냅니다. ||| 당사는 필요한 경우 결제 처리업체, 배송 파트너, 분석 제공업체, 마케팅 서비스 제공업체 및 법률 당국과 귀하의 데이터를 공유할 수 있습니다. 우리는 개인 데이터를 판매하지 않습니다. ||| EU/EEA/스위스 사용자는 개인 데이터에 액세스하고, 부정확한 데이터를 수정하고, 데이터를 삭제하고, 처리를 제한하고, 처리에 반대하고, 데이터를 이동하고, 동의를 철회할 수 있는 GDPR 권리를 갖습니다. 이러한 권리를 행사하려면 리듬넥서스코@gmail.com으로 문의하세요. ||| 미국 사용자(해당되는 경우 CCPA/CPRA)는 어떤 개인 데이터가 수집되는지 확인하고, 삭제를 요청하고, 데이터 공유를 거부하고, 권리 행사에 대한 차별을 받지 않을 권리를 가질 수 있습니다. 요청을 제출하려면 리듬넥서스코@gmail.com으로 이메일을 보내주세요. ||| 당사는 주문을 이행하고 법적 요구 사항을 준수하며 분쟁을 해결하는 데 필요한 기간 동안 개인 데이터를 보관합니다. ||| 당사는 귀하의 지역 외부로 데이터를 전송할 수 있습니다. EU/EEA/스위스에서 이전할 때 당사는 표준 계약 조항(SCC) 및 기타 합법적인 보호 조치를 사용합니다. ||| 우리는 SSL 암호화, 안전한 결제 시스템, 액세스 제어 조치를 포함한 합리적인 기술 및 조직적 보호 장치를 구현합니다. 그러나 어떤 시스템도 100% 안전하지는 않습니다.","termsSupplement":"해당 법률이 허용하는 최대 한도 내에서 당사는 간접적, 우발적 또는 결과적 손해, 데이터 손실, 이익 손실 또는 비즈니스 중단에 대해 책임을 지지 않습니다. 당사의 총 책임은 귀하가 구매한 제품에 대해 지불한 금액을 초과하지 않습니다. EU/EEA/스위스 소비자의 경우 의무적인 법적 권리는 영향을 받지 않습니다. ||| 본 약관은 국제사법 원칙에 관계없이 [귀하의 관할권] 법률의 적용을 받습니다. EU/EEA/스위스 사용자는 현지 법률에 따라 포기할 수 없는 추가 보호를 받을 수 있습니다. ||| EU/EEA/스위스 사용자는 EU 온라인 분쟁 해결 플랫폼(https://ec.europa.eu/consumers/odr/)에 액세스할 수 있습니다. ||| 미국 사용자는 협상, 중재(합의된 경우) 또는 해당 관할권의 법원 소송을 통해 분쟁을 해결할 수 있습니다. ||| 당사는 본 약관을 업데이트할 수 있습니다. 개정된 버전은 새로운 발효일과 함께 이 URL에 게시됩니다.","privacySupplement":"당사는 웹사이트를 운영하고, 사용량을 분석하고, 콘텐츠를 개인화하기 위해 쿠키 및 유사 기술을 사용합니다. EU/EEA/스위스 방문자에게는 쿠키 동의 배너가 표시됩니다. 브라우저 설정에서 쿠키 기본 설정을 관리할 수 있습니다. ||| 당사는 미국의 경우 13세 미만, EU/EEA의 경우 16세 미만 어린이로부터 고의로 개인 데이터를 수집하지 않습니다. 당사가 그러한 데이터를 수집했다는 사실을 알게 되면 해당 데이터를 삭제할 것입니다. ||| 당사 웹사이트에는 제3자 사이트에 대한 링크가 포함될 수 있습니다. 우리는 그들의 개인 정보 보호 관행에 대해 책임을 지지 않습니다. ||| 당사는 이 정책을 업데이트할 수 있습니다. 새 버전은 개정된 발효일과 함께 이 URL에 게시됩니다."};
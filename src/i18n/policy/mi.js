@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Nga tikanga","navPrivacy":"Tūmataitinga","termsTitle":"Nga Ture Ratonga","privacyTitle":"Kaupapahere Tūmataiti","updated":"Whakahoutanga whakamutunga: 24 Hui-tanguru 2026","termsText":"Ko enei Ture o te Ratonga (\"Tuhinga\") ka whakahaere i to urunga me te whakamahi i nga ratonga e-tauhokohoko e tukuna ana ma https://rhythmnexus.org (\"Paetukutuku\") e whakahaeretia ana e Rhythm Nexus (\"we\", \"tatou\", \"tatou\" ranei). Ma te whakauru, te tirotiro, te hoko mai ranei i te Paetukutuku, ka whakaae koe kia herea koe e enei Ture. Ki te kore koe e whakaae, kare pea koe e whakamahi i te Paetukutuku me te tuku ota. ||| Me 18 neke atu ranei ou tau, te pakeke ranei o te nuinga o to rohe ki te hoko hua mai i tenei Paetukutuku. Ma te tuku ota, ka tohu koe me te whakamana ka tutuki koe i tenei whakaritenga. ||| Ka tonoa pea koe ki te hanga i tetahi kaute hei hoko. E whakaae ana koe ki te whakarato i nga korero tika, o naianei, me te whakaoti. Kei a koe te kawenga mo te tiaki i o tohu tohu kaute. Me whakamohio wawe koe ki a matou mo nga whakamahinga kore mana. Ka taea e matou te whakamutu, te whakatarewa ranei i to putea i nga wa katoa mo te takahi i enei Ture. ||| Ka whakapau kaha matou ki te whakaatu tika i nga korero hua, engari kaore matou e whakaae ko nga whakaahuatanga hua me etahi atu korero kaore he hapa. ||| Ka whakaatuhia nga utu ki te Taara o Amerika (USD) me te whakauru i nga taake e tika ana ina hiahiatia e te ture. Ka huri pea matou i nga utu i nga wa katoa i mua i to tuku ota. ||| Ko to ota he tuku ki te hoko. Ka puta te whakaaetanga ina whakamanahia e matou to ota ma te imeera, i te wa ranei ka tukuna e matou nga hua, ahakoa ko wai te mea tuatahi. Ka taea e matou te whakakore, te whakakore ranei i nga ota mo nga take tae atu ki te utu he, nga hua kore-kore, me te whakapae he tinihanga. ||| Ka whakaaetia e matou nga tikanga utu e whakaatuhia ana i te wa o te tirotiro. Ma te tuku i nga taipitopito utu, ka whakamana koe i a matou ki te utu i te moni e tika ana me te whakau ko koe te kaipupuri putea tika. Ka whakamahi matou i nga kaiwhakatuka utu-tuatoru hei hapai i nga korero utu. ||| Ka whakaratohia nga whakatau tata mo te waatea me te kore e kii i nga ra tuku. Ina tukuna nga hua ki tetahi kaikawe, ka pahemo te mate ki a koe. Kei a koe te kawenga mo nga taake me nga taake kawemai, me nga hapa tuku na te he o nga korero wahitau. ||| Mena kei te noho koe i te EU, EEA, Switzerland ranei, kei a koe te mana ture ki te whakahoki i nga hua i roto i nga ra 14 i muri i te whiwhinga mo te utu katoa. Me whakahoki nga hua i roto i nga ahuatanga taketake. Ko nga kaipuke whakahoki mai pea kei to utu e whakaaetia ana e te ture. Ka whakakorehia nga hua mamati mena ka timata te tango i runga i to whakaaetanga ka whakaae koe kua ngaro te mana tango. ||| Ko nga tohu mo te whakahoki mai mo nga kaihoko US kei roto i ta maatau kaupapa here Whakahoki me te Whakahoki i tukuna ki te Paetukutuku. Ko etahi o nga mea (hei tauira, nga tangohanga mamati, nga mea kua whakawhaiarohia) kaore pea e whakahokia. ||| Mena ka hoko koe i nga taonga matihiko, he hikohiko te tuku, ka whakawhiwhia koe ki tetahi raihana motuhake-kore ki te whakamahi i nga ihirangi, kaore pea koe e tohatoha, hoko atu, tiritiri ranei i nga tangohanga me te kore whakaaetanga. ||| Ko nga ihirangi Paetukutuku katoa (kuputuhi, hoahoa, rorohiko, whakairoiro, whakaahua) kei te mana, kua raihanatia ranei ki te Rhythm Nexus ka tiakina e nga ture mana pupuri me nga taonga hinengaro. Kaore e taea e koe te whakaputa, te whakarereke, te tohatoha, te hanga ranei i nga mahi whakaputa me te kore whakaaetanga a-tuhi.","privacyText":"Ko Rhythm Nexus (\"tatou\", \"tatou\", \"tatou\" ranei\") e whakaute ana i to noho muna me te pono ki te tiaki i o raraunga whaiaro. Ko tenei Kaupapahere Whaiaro e whakamarama ana he aha nga raraunga whaiaro ka kohia e matou, me pehea te whakamahi, ko wai ka tohatohahia e matou, me o tika. Ka pa tenei kaupapa here ki nga kaiwhakamahi mai i te EU, EEA, Switzerland, me nga USA. ||| Ka kohia e matou nga korero whaiaro ka tukuna e koe, tae atu ki te ingoa, te wahitau imeera, te nama nama me te wahitau kaipuke, te nama waea, me nga korero utu e whakahaerea ana e nga kaiwhakatikatika tuatoru. ||| Ka kohikohi aunoa matou i te wahitau IP, momo tirotiro, raraunga taputapu, raraunga whakamahinga, pihikete, me nga hangarau aroturuki. ||| Mena kei roto koe i te EU/EEA/Switzerland, ka tukatukahia e matou o raraunga i runga i te mahi kirimana (te whakatutuki ota), te herenga ture, nga paanga tika, me te whakaae ina hiahiatia. ||| Ka whakamahia e matou o raraunga ki te tukatuka i nga ota, ki nga hua kaipuke, ki te korero ki a koe, ki te whakarato i te tautoko a te kaihoko, ki te whakatutuki i nga herenga ture, ki te whakapai ake i to maatau Paetukutuku, me te tuku korero hokohoko me te whakaae. ||| Ka tohatoha pea matou i o raraunga ki nga kaiwhakatika utu, hoa tuku kaipuke, kaiwhakarato tātaritanga, kaiwhakarato ratonga hokohoko, me nga mana ture ina hiahiatia. Kaore matou e hoko raraunga whaiaro. ||| Kei nga kaiwhakamahi EU/EEA/Swiss nga mana GDPR ki te uru ki nga raraunga whaiaro, whakatika i nga raraunga kore tika, te whakakore i nga raraunga, te aukati i te tukatuka, te aukati ki te tukatuka, te raraunga tauranga, me te tango whakaaetanga. Hei whakamahi i enei mana, whakapaa mai ki a matou i rhythmnexusco@gmail.com. ||| Ko nga kaiwhakamahi o USA (CCPA/CPRA, ina e tika ana) ka whai mana ki te mohio he aha nga raraunga whaiaro ka kohia, tono kia mukua, kia puta ki waho o te tiritiri raraunga, me te kore whakakino mo te whakamahi motika. Hei tuku tono, imeera rhythmnexusco@gmail.com. ||| Ka pupuri matou i nga raraunga whaiaro i te wa e tika ana ki te whakatutuki i nga ota, ki te whakatutuki i nga whakaritenga ture, me te whakatau i nga tautohetohe. ||| Ka taea e matou te whakawhiti raraunga ki waho o to rohe. Ina whakawhiti mai i te EU/EEA/Switzerland, ka whakamahia e matou nga Rarangi Whakaaetanga Paerewa (SCCs) me etahi atu whakamarumaru ture. ||| Ka whakatinanahia e matou nga whakamarumaru hangarau me nga whakaritenga whakahaere tae atu ki te whakamunatanga SSL, nga punaha utu haumaru, me nga tikanga whakahaere uru. Engari, kaore he punaha e 100% te haumaru.","termsSupplement":"Ki te nui rawa atu e whakaaetia ana e te ture e tika ana, kaore matou e tika mo nga pakaru autaki, mokowhiti ranei, mo te ngaronga o nga raraunga, mo te ngaro o nga hua, mo te aukati pakihi ranei. Ko ta matou taunahatanga katoa kaua e neke ake i te moni i utua e koe mo nga hua i hokona. Mo nga kaihoko i roto i te EU/EEA/Switzerland, karekau e pa ki nga mana ture. ||| Ko enei Ture e whakahaeretia ana e nga ture o [Tou Mana Whakahaere] me te kore e aro ki nga paheketanga o nga kaupapa ture. Ka taea e nga kaiwhakamahi EU/EEA/Swiss etahi atu whakamarumaru i raro i nga ture a-rohe e kore e taea te whakakore. ||| Ka taea e nga kaiwhakamahi EU/EEA/Swiss te uru atu ki te papaaho Whakatau Amuamu Online EU: https://ec.europa.eu/consumers/odr/ ||| Ka taea e nga kaiwhakamahi USA te whakatau i nga tautohetohe na roto i te whiriwhiringa, te apitireihana (mehemea ka whakaaehia), te kooti ranei i roto i o raatau mana whakahaere. ||| Ka taea e matou te whakahou i enei Ture. Ka whakairihia te putanga whakahou ki tenei URL me te ra whai hua hou.","privacySupplement":"Ka whakamahi matou i nga pihikete me nga hangarau rite ki te whakahaere i te Paetukutuku, te tātari i te whakamahinga, me te whakawhaiaro i nga ihirangi. Ka whakaatuhia ki nga manuhiri EU/EEA/Swiss he haki whakaaetanga pihikete. Ka taea e koe te whakahaere i nga manakohanga pihikete i o tautuhinga tirotiro. ||| Kaore matou e kohi i nga raraunga whaiaro mai i nga tamariki kei raro iho i te 13 i te USA, i raro ranei i te 16 i te EU/EEA. Mena ka mohio matou kua kohia e matou enei raraunga, ka whakakorehia e matou. ||| Kei roto pea i ta maatau Paetukutuku nga hononga ki nga waahi tuatoru. Karekau he kawenga mo a raatau mahi tūmataitinga. ||| Ka whakahou pea tatou i tenei kaupapa here. Ka whakairihia te putanga hou ki tenei URL me te ra whai hua kua whakahoutia."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Syarat","navPrivacy":"Privasi","termsTitle":"Syarat Perkhidmatan","privacyTitle":"Dasar Privasi","updated":"Kemas kini terakhir: 24 Februari 2026","termsText":"Syarat Perkhidmatan (\"Syarat\") ini mengawal akses anda kepada dan penggunaan perkhidmatan e-dagang yang ditawarkan melalui https://rhythmnexus.org (\"Laman Web\") yang dikendalikan oleh Rhythm Nexus (\"kami\", \"kami\" atau \"kami\"). Dengan mengakses, menyemak imbas, atau membeli daripada Laman Web, anda bersetuju untuk terikat dengan Terma ini. Jika anda tidak bersetuju, anda tidak boleh menggunakan Laman Web atau membuat pesanan. ||| Anda mesti berumur sekurang-kurangnya 18 tahun atau umur majoriti dalam bidang kuasa anda untuk membeli produk daripada Laman Web ini. Dengan membuat pesanan, anda menyatakan dan menjamin bahawa anda memenuhi keperluan ini. ||| Anda mungkin diminta membuat akaun untuk membuat pembelian. Anda bersetuju untuk memberikan maklumat yang tepat, terkini dan lengkap. Anda bertanggungjawab untuk melindungi kelayakan akaun anda. Anda mesti memberitahu kami dengan segera tentang sebarang penggunaan yang tidak dibenarkan. Kami boleh menamatkan atau menggantung akaun anda pada bila-bila masa kerana melanggar Syarat ini. ||| Kami berusaha untuk memaparkan maklumat produk dengan tepat, tetapi kami tidak menjamin bahawa penerangan produk atau kandungan lain adalah bebas ralat. ||| Harga ditunjukkan dalam Dolar Amerika Syarikat (USD) dan termasuk cukai yang dikenakan jika dikehendaki oleh undang-undang. Kami boleh menukar harga pada bila-bila masa sebelum anda membuat pesanan. ||| Pesanan anda ialah tawaran untuk membeli. Penerimaan berlaku apabila kami mengesahkan pesanan anda melalui e-mel, atau apabila kami menghantar produk, yang mana berlaku dahulu. Kami mungkin menolak atau membatalkan pesanan atas sebab termasuk harga yang salah, produk kehabisan stok atau penipuan yang disyaki. ||| Kami menerima kaedah pembayaran yang ditunjukkan semasa pembayaran. Dengan menyerahkan butiran pembayaran, anda memberi kuasa kepada kami untuk mengenakan amaun yang perlu dibayar dan mengesahkan anda adalah pemegang akaun yang sah. Kami menggunakan pemproses pembayaran pihak ketiga untuk mengendalikan maklumat pembayaran dengan selamat. ||| Anggaran penghantaran disediakan untuk kemudahan dan tidak menjamin tarikh penghantaran. Sebaik sahaja produk dipindahkan kepada pembawa, risiko kerugian berpindah kepada anda. Anda bertanggungjawab untuk duti kastam dan cukai import, dan untuk ralat penghantaran yang disebabkan oleh maklumat alamat yang salah. ||| Jika anda tinggal di EU, EEA atau Switzerland, anda mempunyai hak undang-undang untuk memulangkan produk dalam tempoh 14 hari selepas penerimaan untuk bayaran balik penuh. Produk mesti dikembalikan dalam keadaan asal. Penghantaran balik mungkin atas kos anda seperti yang dibenarkan oleh undang-undang. Produk digital mungkin dikecualikan jika muat turun bermula dengan persetujuan anda dan anda mengakui kehilangan hak penarikan balik. ||| Kelayakan pemulangan untuk pelanggan AS digariskan dalam Polisi Pemulangan & Bayaran Balik kami yang berasingan yang disiarkan di Laman Web. Sesetengah item (mis., muat turun digital, item diperibadikan) mungkin tidak boleh dibayar balik. ||| Jika anda membeli item digital, penghantaran adalah elektronik, anda diberikan lesen bukan eksklusif peribadi untuk menggunakan kandungan tersebut dan anda tidak boleh mengedar semula, menjual semula atau berkongsi muat turun tanpa kebenaran. ||| Semua kandungan Laman Web (teks, reka bentuk, perisian, grafik, imej) dimiliki oleh atau dilesenkan kepada Rhythm Nexus dan dilindungi oleh undang-undang hak cipta dan harta intelek. Anda tidak boleh mengeluarkan semula, mengubah suai, mengedar atau mencipta karya terbitan tanpa kebenaran bertulis.","privacyText":"Rhythm Nexus (\"kami\", \"kami\" atau \"kami\") menghormati privasi anda dan komited untuk melindungi data peribadi anda. Dasar Privasi ini menerangkan data peribadi yang kami kumpulkan, cara ia digunakan, dengan siapa kami berkongsinya dan hak anda. Dasar ini terpakai kepada pengguna dari EU, EEA, Switzerland dan Amerika Syarikat. ||| Kami mengumpul maklumat peribadi yang anda berikan secara sukarela, termasuk nama, alamat e-mel, alamat pengebilan dan penghantaran, nombor telefon dan maklumat pembayaran yang dikendalikan oleh pemproses pihak ketiga. ||| Kami mengumpul alamat IP, jenis penyemak imbas, data peranti, data penggunaan, kuki dan teknologi penjejakan secara automatik. ||| Jika anda berada di EU/EEA/Switzerland, kami memproses data anda berdasarkan prestasi kontrak (pemenuhan pesanan), kewajipan undang-undang, kepentingan sah dan persetujuan jika diperlukan. ||| Kami menggunakan data anda untuk memproses pesanan, menghantar produk, berkomunikasi dengan anda, menyediakan sokongan pelanggan, mematuhi kewajipan undang-undang, menambah baik Laman Web kami dan menghantar komunikasi pemasaran dengan persetujuan. ||| Kami mungkin berkongsi data anda dengan pemproses pembayaran, rakan kongsi perkapalan, penyedia analitik, penyedia perkhidmatan pemasaran dan pihak berkuasa undang-undang apabila diperlukan. Kami tidak menjual data peribadi. ||| Pengguna EU/EEA/Swiss mempunyai hak GDPR untuk mengakses data peribadi, membetulkan data yang tidak tepat, memadamkan data, menyekat pemprosesan, membantah pemprosesan, data port dan menarik balik kebenaran. Untuk melaksanakan hak ini, hubungi kami di rhythmnexusco@gmail.com. ||| Pengguna USA (CCPA/CPRA, jika berkenaan) mungkin mempunyai hak untuk mengetahui data peribadi yang dikumpul, meminta pemadaman, menarik diri daripada perkongsian data dan tanpa diskriminasi untuk menggunakan hak. Untuk menyerahkan permintaan, e-mel rhythmnexusco@gmail.com. ||| Kami mengekalkan data peribadi selagi perlu untuk memenuhi pesanan, mematuhi keperluan undang-undang dan menyelesaikan pertikaian. ||| Kami mungkin memindahkan data ke luar wilayah anda. Apabila berpindah dari EU/EEA/Switzerland, kami menggunakan Klausa Kontrak Standard (SCC) dan perlindungan sah yang lain. ||| Kami melaksanakan perlindungan teknikal dan organisasi yang munasabah termasuk penyulitan SSL, sistem pembayaran selamat dan langkah kawalan akses. Walau bagaimanapun, tiada sistem yang 100% selamat.","termsSupplement":"Setakat maksimum yang dibenarkan oleh undang-undang yang terpakai, kami tidak bertanggungjawab ke atas kerosakan tidak langsung, sampingan atau berbangkit, kehilangan data, kehilangan keuntungan atau gangguan perniagaan. Jumlah liabiliti kami tidak boleh melebihi jumlah yang anda bayar untuk produk yang dibeli. Bagi pengguna di EU/EEA/Switzerland, hak berkanun mandatori tidak terjejas. ||| Syarat ini dikawal oleh undang-undang [Bidang Kuasa Anda] tanpa mengambil kira percanggahan prinsip undang-undang. Pengguna EU/EEA/Swiss mungkin mempunyai perlindungan tambahan di bawah undang-undang tempatan yang tidak boleh diketepikan. ||| Pengguna EU/EEA/Swiss boleh mengakses platform Penyelesaian Pertikaian Dalam Talian EU: https://ec.europa.eu/consumers/odr/ ||| Pengguna USA boleh menyelesaikan pertikaian melalui rundingan, timbang tara (jika dipersetujui), atau tindakan mahkamah dalam bidang kuasa mereka. ||| Kami mungkin mengemas kini Syarat ini. Versi yang disemak akan disiarkan di URL ini dengan tarikh kuat kuasa baharu.","privacySupplement":"Kami menggunakan kuki dan teknologi serupa untuk mengendalikan Laman Web, menganalisis penggunaan dan memperibadikan kandungan. Pelawat EU/EEA/Swiss akan ditunjukkan sepanduk kebenaran kuki. Anda boleh mengurus pilihan kuki dalam tetapan penyemak imbas anda. ||| Kami tidak mengumpul data peribadi daripada kanak-kanak bawah 13 tahun di AS atau bawah 16 tahun di EU/EEA secara tidak sengaja. Jika kami mengetahui bahawa kami telah mengumpul data sedemikian, kami akan memadamkannya. ||| Laman Web kami mungkin mengandungi pautan ke tapak pihak ketiga. Kami tidak bertanggungjawab ke atas amalan privasi mereka. ||| Kami mungkin mengemas kini dasar ini. Versi baharu akan disiarkan di URL ini dengan tarikh kuat kuasa yang disemak semula."};
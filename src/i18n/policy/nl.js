@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Voorwaarden","navPrivacy":"Privacy","termsTitle":"Servicevoorwaarden","privacyTitle":"Privacybeleid","updated":"Laatst bijgewerkt: 24 februari 2026","termsText":"Deze Servicevoorwaarden (\"Voorwaarden\") regelen uw toegang tot en gebruik van de e-commercediensten die worden aangeboden via https://rhythmnexus.org (\"Website\") beheerd door Rhythm Nexus (\"wij\", \"ons\" of \"onze\"). Door de Website te openen, te bekijken of te kopen, gaat u ermee akkoord gebonden te zijn aan deze Voorwaarden. Als u het er niet mee eens bent, mag u de Website niet gebruiken of een bestelling plaatsen. ||| U moet ten minste 18 jaar oud zijn of meerderjarig in uw rechtsgebied om producten via deze website te kunnen kopen. Door een bestelling te plaatsen, verklaart en garandeert u dat u aan deze vereiste voldoet. ||| Mogelijk wordt u gevraagd een account aan te maken om een ​​aankoop te doen. U gaat ermee akkoord nauwkeurige, actuele en volledige informatie te verstrekken. U bent verantwoordelijk voor het beschermen van uw accountgegevens. U moet ons onmiddellijk op de hoogte stellen van elk ongeoorloofd gebruik. We kunnen uw account op elk moment beëindigen of opschorten wegens schending van deze Voorwaarden. ||| We streven ernaar om productinformatie accuraat weer te geven, maar we garanderen niet dat productbeschrijvingen of andere inhoud foutloos zijn. ||| Prijzen worden weergegeven in Amerikaanse dollar (USD) en zijn inclusief toepasselijke belastingen waar dit wettelijk vereist is. Wij kunnen de prijzen op elk moment wijzigen voordat u een bestelling plaatst. ||| Uw bestelling is een aanbod om te kopen. Acceptatie vindt plaats wanneer wij uw bestelling per e-mail bevestigen, of wanneer wij de producten verzenden, afhankelijk van wat zich het eerst voordoet. We kunnen bestellingen weigeren of annuleren om redenen zoals onjuiste prijzen, producten die niet op voorraad zijn of vermoedelijke fraude. ||| Wij accepteren de betaalmethoden die tijdens het afrekenen worden weergegeven. Door betalingsgegevens in te dienen, machtigt u ons om het verschuldigde bedrag in rekening te brengen en bevestigt u dat u de rechtmatige rekeninghouder bent. We gebruiken externe betalingsverwerkers om betalingsinformatie veilig te verwerken. ||| Verzendingsschattingen worden voor het gemak gegeven en garanderen geen leverdata. Zodra producten zijn overgedragen aan een vervoerder, gaat het risico van verlies over op u. U bent verantwoordelijk voor douanerechten en importbelastingen, en voor leveringsfouten veroorzaakt door onjuiste adresgegevens. ||| Als u in de EU, EER of Zwitserland woont, heeft u het wettelijke recht om producten binnen 14 dagen na ontvangst te retourneren voor een volledige terugbetaling. Producten moeten in originele staat geretourneerd worden. Retourzending kan voor uw rekening zijn, zoals toegestaan ​​door de wet. Digitale producten kunnen worden uitgesloten als het downloaden begint met uw toestemming en u erkent dat u uw herroepingsrecht verliest. ||| Het recht op retournering voor Amerikaanse klanten wordt uiteengezet in ons afzonderlijke retour- en restitutiebeleid dat op de website is geplaatst. Voor sommige artikelen (bijvoorbeeld digitale downloads en gepersonaliseerde artikelen) is restitutie mogelijk niet mogelijk. ||| Als u digitale items koopt, vindt de levering elektronisch plaats, krijgt u een persoonlijke, niet-exclusieve licentie om de inhoud te gebruiken en mag u downloads niet zonder toestemming opnieuw distribueren, doorverkopen of delen. ||| Alle inhoud van de website (tekst, ontwerpen, software, afbeeldingen, afbeeldingen) is eigendom van of in licentie gegeven aan Rhythm Nexus en wordt beschermd door auteursrecht en intellectuele eigendomswetten. U mag zonder schriftelijke toestemming geen afgeleide werken reproduceren, wijzigen, distribueren of creëren.","privacyText":"Rhythm Nexus (\"wij\", \"ons\" of \"onze\") respecteert uw privacy en doet er alles aan om uw persoonlijke gegevens te beschermen. In dit privacybeleid wordt uitgelegd welke persoonlijke gegevens we verzamelen, hoe deze worden gebruikt, met wie we deze delen en wat uw rechten zijn. Dit beleid is van toepassing op gebruikers uit de EU, EER, Zwitserland en de VS. ||| Wij verzamelen de persoonlijke gegevens die u vrijwillig verstrekt, waaronder naam, e-mailadres, factuur- en verzendadres, telefoonnummer en betalingsinformatie die wordt verwerkt door externe verwerkers. ||| We verzamelen automatisch IP-adres, browsertype, apparaatgegevens, gebruiksgegevens, cookies en trackingtechnologieën. ||| Als u zich in de EU/EER/Zwitserland bevindt, verwerken wij uw gegevens op basis van contractuitvoering (orderuitvoering), wettelijke verplichting, legitieme belangen en toestemming waar vereist. ||| We gebruiken uw gegevens om bestellingen te verwerken, producten te verzenden, met u te communiceren, klantenondersteuning te bieden, te voldoen aan wettelijke verplichtingen, onze website te verbeteren en met toestemming marketingcommunicatie te verzenden. ||| We kunnen uw gegevens indien nodig delen met betalingsverwerkers, verzendpartners, analyseproviders, marketingdienstverleners en juridische autoriteiten. Wij verkopen geen persoonlijke gegevens. ||| EU/EER/Zwitserse gebruikers hebben AVG-rechten om toegang te krijgen tot persoonlijke gegevens, onnauwkeurige gegevens te corrigeren, gegevens te wissen, de verwerking te beperken, bezwaar te maken tegen verwerking, gegevens over te dragen en hun toestemming in te trekken. Om deze rechten uit te oefenen, kunt u contact met ons opnemen via ritmenexusco@gmail.com. ||| Gebruikers in de VS (CCPA/CPRA, indien van toepassing) hebben mogelijk het recht om te weten welke persoonlijke gegevens worden verzameld, om verwijdering aan te vragen, om zich af te melden voor het delen van gegevens en om niet te worden gediscrimineerd bij het uitoefenen van rechten. Stuur een e-mail naar ritmenexusco@gmail.com om verzoeken in te dienen. ||| Wij bewaren persoonsgegevens zo lang als nodig is om bestellingen uit te voeren, aan wettelijke eisen te voldoen en geschillen op te lossen. ||| Het is mogelijk dat wij gegevens buiten uw regio overdragen. Bij overdracht vanuit de EU/EER/Zwitserland maken we gebruik van standaardcontractbepalingen (SCC's) en andere wettelijke waarborgen. ||| We implementeren redelijke technische en organisatorische veiligheidsmaatregelen, waaronder SSL-codering, beveiligde betalingssystemen en toegangscontrolemaatregelen. Geen enkel systeem is echter 100% veilig.","termsSupplement":"Voor zover maximaal toegestaan ​​door de toepasselijke wetgeving, zijn wij niet aansprakelijk voor indirecte, incidentele of gevolgschade, verlies van gegevens, gederfde winst of bedrijfsonderbreking. Onze totale aansprakelijkheid zal niet hoger zijn dan het bedrag dat u voor het/de gekochte product(en) heeft betaald. Voor consumenten in de EU/EER/Zwitserland blijven de verplichte wettelijke rechten onaangetast. ||| Op deze Voorwaarden is de wetgeving van [Uw rechtsgebied] van toepassing, zonder rekening te houden met conflicterende wettelijke principes. EU/EER/Zwitserse gebruikers kunnen onder de lokale wetgeving aanvullende bescherming genieten waar geen afstand van kan worden gedaan. ||| EU/EER/Zwitserse gebruikers hebben toegang tot het EU Online Dispute Resolution-platform: https://ec.europa.eu/consumers/odr/ ||| Gebruikers in de VS kunnen geschillen oplossen door middel van onderhandelingen, arbitrage (indien overeengekomen) of gerechtelijke stappen in hun rechtsgebied. ||| Wij kunnen deze Voorwaarden bijwerken. De herziene versie wordt op deze URL geplaatst met een nieuwe ingangsdatum.","privacySupplement":"We gebruiken cookies en soortgelijke technologieën om de website te beheren, het gebruik te analyseren en de inhoud te personaliseren. Bezoekers uit de EU/EER/Zwitserland krijgen een banner voor toestemming voor cookies te zien. U kunt cookievoorkeuren beheren in uw browserinstellingen. ||| We verzamelen niet bewust persoonlijke gegevens van kinderen jonger dan 13 jaar in de VS of jonger dan 16 jaar in de EU/EER. Als we vernemen dat we dergelijke gegevens hebben verzameld, zullen we deze verwijderen. ||| Onze website kan links naar sites van derden bevatten. Wij zijn niet verantwoordelijk voor hun privacypraktijken. ||| We kunnen dit beleid bijwerken. De nieuwe versie wordt op deze URL geplaatst met een herziene ingangsdatum."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Vilkår","navPrivacy":"Privatliv","termsTitle":"Vilkår for bruk","privacyTitle":"Personvernerklæring","updated":"Sist oppdatert: 24. februar 2026","termsText":"Disse vilkårene for bruk (\"vilkårene\") styrer din tilgang til og bruk av e-handelstjenestene som tilbys gjennom https://rhythmnexus.org (\"nettstedet\") som drives av Rhythm Nexus (\"vi\", \"oss\" eller \"vår\"). Ved å gå inn på, surfe på eller kjøpe fra nettstedet godtar du å være bundet av disse vilkårene. Hvis du ikke samtykker, kan du ikke bruke nettstedet eller legge inn en bestilling. ||| Du må være minst 18 år gammel eller myndig i din jurisdiksjon for å kjøpe produkter fra denne nettsiden. Ved å legge inn en bestilling, representerer og garanterer du at du oppfyller dette kravet. ||| Du kan bli bedt om å opprette en konto for å foreta et kjøp. Du samtykker i å gi nøyaktig, oppdatert og fullstendig informasjon. Du er ansvarlig for å beskytte kontoen din. Du må varsle oss umiddelbart om uautorisert bruk. Vi kan avslutte eller suspendere kontoen din når som helst for brudd på disse vilkårene. ||| Vi streber etter å vise produktinformasjon nøyaktig, men vi garanterer ikke at produktbeskrivelser eller annet innhold er feilfritt. ||| Prisene er vist i amerikanske dollar (USD) og inkluderer gjeldende avgifter der det kreves av loven. Vi kan endre prisene når som helst før du legger inn en bestilling. ||| Bestillingen din er et tilbud om å kjøpe. Aksept skjer når vi bekrefter bestillingen din via e-post, eller når vi sender produktene, avhengig av hva som skjer først. Vi kan avslå eller kansellere bestillinger av årsaker, inkludert feil prissetting, utsolgte produkter eller mistanke om svindel. ||| Vi aksepterer betalingsmåtene som vises under kassen. Ved å sende inn betalingsopplysninger gir du oss fullmakt til å belaste det skyldige beløpet og bekrefter at du er den rettmessige kontoinnehaveren. Vi bruker tredjeparts betalingsbehandlere for å håndtere betalingsinformasjon på en sikker måte. ||| Fraktanslag er gitt for enkelhets skyld og garanterer ikke leveringsdatoer. Når produktene er overført til en transportør, går risikoen for tap over til deg. Du er ansvarlig for toll og importavgifter, og for leveringsfeil forårsaket av feil adresseinformasjon. ||| Hvis du er bosatt i EU, EØS eller Sveits, har du juridisk rett til å returnere produkter innen 14 dager etter mottak for full refusjon. Produkter må returneres i original stand. Returfrakt kan være på din egen regning, slik loven tillater det. Digitale produkter kan bli ekskludert hvis nedlastingen begynner med ditt samtykke og du erkjenner tap av angrerett. ||| Returkvalifisering for amerikanske kunder er beskrevet i våre separate retningslinjer for retur og refusjon som er lagt ut på nettstedet. Enkelte varer (f.eks. digitale nedlastinger, personlige varer) kan ikke refunderes. ||| Hvis du kjøper digitale varer, er leveringen elektronisk, du får en personlig ikke-eksklusiv lisens til å bruke innholdet, og du kan ikke videredistribuere, videreselge eller dele nedlastinger uten tillatelse. ||| Alt innhold på nettstedet (tekst, design, programvare, grafikk, bilder) eies av eller lisensieres til Rhythm Nexus og er beskyttet av lover om opphavsrett og immaterielle rettigheter. Du kan ikke reprodusere, modifisere, distribuere eller lage avledede verk uten skriftlig tillatelse.","privacyText":"Rhythm Nexus (\"vi\", \"oss\" eller \"vår\") respekterer ditt personvern og er forpliktet til å beskytte dine personlige data. Denne personvernerklæringen forklarer hvilke personopplysninger vi samler inn, hvordan de brukes, hvem vi deler dem med og dine rettigheter. Denne policyen gjelder for brukere fra EU, EØS, Sveits og USA. ||| Vi samler inn personopplysningene du frivillig oppgir, inkludert navn, e-postadresse, fakturerings- og leveringsadresse, telefonnummer og betalingsinformasjon som håndteres av tredjepartsbehandlere. ||| Vi samler automatisk inn IP-adresse, nettlesertype, enhetsdata, bruksdata, informasjonskapsler og sporingsteknologier. ||| Hvis du er i EU/EØS/Sveits, behandler vi dataene dine basert på kontraktsutførelse (ordreoppfyllelse), juridiske forpliktelser, legitime interesser og samtykke der det er nødvendig. ||| Vi bruker dataene dine til å behandle bestillinger, sende produkter, kommunisere med deg, gi kundestøtte, overholde juridiske forpliktelser, forbedre nettstedet vårt og sende markedsføringskommunikasjon med samtykke. ||| Vi kan dele dataene dine med betalingsbehandlere, fraktpartnere, analyseleverandører, leverandører av markedsføringstjenester og juridiske myndigheter når det er nødvendig. Vi selger ikke personopplysninger. ||| EU/EØS/Sveits-brukere har GDPR-rettigheter til å få tilgang til personopplysninger, korrigere unøyaktige data, slette data, begrense behandling, protestere mot behandling, overføre data og trekke tilbake samtykke. For å utøve disse rettighetene, kontakt oss på rhythmnexusco@gmail.com. ||| USA-brukere (CCPA/CPRA, der det er aktuelt) kan ha rettigheter til å vite hvilke personopplysninger som samles inn, be om sletting, velge bort datadeling og ikke-diskriminering for å utøve rettigheter. Send e-post til rhythmnexusco@gmail.com for å sende inn forespørsler. ||| Vi beholder personopplysninger så lenge det er nødvendig for å oppfylle bestillinger, overholde juridiske krav og løse tvister. ||| Vi kan overføre data utenfor din region. Når vi overfører fra EU/EØS/Sveits, bruker vi Standard Contractual Clauses (SCCs) og andre lovlige sikkerhetstiltak. ||| Vi implementerer rimelige tekniske og organisatoriske sikkerhetstiltak, inkludert SSL-kryptering, sikre betalingssystemer og tilgangskontrolltiltak. Ingen system er imidlertid 100 % sikre.","termsSupplement":"I den grad det er tillatt av gjeldende lov, er vi ikke ansvarlige for indirekte, tilfeldige eller følgeskader, tap av data, tapt fortjeneste eller forretningsavbrudd. Vårt totale ansvar skal ikke overstige beløpet du betalte for produktet/produktene du har kjøpt. For forbrukere i EU/EØS/Sveits er obligatoriske lovfestede rettigheter upåvirket. ||| Disse vilkårene styres av lovene i [din jurisdiksjon] uten hensyn til lovkonfliktprinsipper. EU/EØS/Sveits-brukere kan ha ytterligere beskyttelse i henhold til lokal lov som ikke kan fravikes. ||| EU/EØS/Sveits-brukere kan få tilgang til EUs plattform for onlinetvistløsning: https://ec.europa.eu/consumers/odr/ ||| USA-brukere kan løse tvister gjennom forhandlinger, voldgift (hvis avtalt), eller rettssak i deres jurisdiksjon. ||| Vi kan oppdatere disse vilkårene. Den reviderte versjonen vil bli lagt ut på denne URL-en med en ny ikrafttredelsesdato.","privacySupplement":"Vi bruker informasjonskapsler og lignende teknologier for å betjene nettstedet, analysere bruk og tilpasse innhold. Besøkende fra EU/EØS/Sveits vil bli vist et samtykkebanner for informasjonskapsler. Du kan administrere informasjonskapselpreferanser i nettleserinnstillingene. ||| Vi samler ikke bevisst inn personopplysninger fra barn under 13 år i USA eller under 16 år i EU/EØS. Hvis vi får vite at vi har samlet inn slike data, vil vi slette dem. ||| Nettstedet vårt kan inneholde lenker til tredjepartssider. Vi er ikke ansvarlige for deres personvernpraksis. ||| Vi kan oppdatere denne policyen. Den nye versjonen vil bli lagt ut på denne URL-en med en revidert ikrafttredelsesdato."};
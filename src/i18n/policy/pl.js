@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Warunki","navPrivacy":"Prywatność","termsTitle":"Warunki świadczenia usług","privacyTitle":"Polityka prywatności","updated":"Ostatnia aktualizacja: 24 lutego 2026 r","termsText":"Niniejsze Warunki świadczenia usług („Warunki”) regulują dostęp i korzystanie z usług handlu elektronicznego oferowanych za pośrednictwem https://rhythmnexus.org („Witryna internetowa”) obsługiwanych przez Rhythm Nexus („my”, „nas” lub „nasz”). Uzyskując dostęp, przeglądając lub dokonując zakupów w Witrynie, wyrażasz zgodę na przestrzeganie niniejszych Warunków. Jeżeli nie wyrażasz zgody, nie możesz korzystać z Serwisu ani składać zamówień. ||| Aby móc kupować produkty w tej Witrynie, musisz mieć ukończone 18 lat lub być osobą pełnoletnią w swojej jurysdykcji. Składając zamówienie, oświadczasz i gwarantujesz, że spełniasz ten wymóg. ||| Możesz zostać poproszony o utworzenie konta w celu dokonania zakupu. Zgadzasz się na podanie dokładnych, aktualnych i pełnych informacji. Jesteś odpowiedzialny za ochronę danych uwierzytelniających swojego konta. Należy natychmiast powiadomić nas o każdym nieupoważnionym użyciu. Możemy zamknąć lub zawiesić Twoje konto w dowolnym momencie z powodu naruszenia niniejszych Warunków. ||| Staramy się wyświetlać informacje o produktach w sposób dokładny, ale nie gwarantujemy, że opisy produktów lub inne treści są wolne od błędów. ||| Ceny podawane są w dolarach amerykańskich (USD) i zawierają obowiązujące podatki, jeżeli jest to wymagane przez prawo. Ceny możemy zmienić w dowolnym momencie przed złożeniem zamówienia. ||| Twoje zamówienie jest ofertą zakupu. Akceptacja następuje, gdy potwierdzimy Twoje zamówienie e-mailem lub gdy wyślemy produkty, w zależności od tego, co nastąpi wcześniej. Możemy odrzucić lub anulować zamówienia z powodów obejmujących nieprawidłowe ceny, brak produktów w magazynie lub podejrzenie oszustwa. ||| Akceptujemy metody płatności wskazane podczas realizacji transakcji. Podając szczegóły płatności, upoważniasz nas do pobrania należnej kwoty i potwierdzasz, że jesteś prawowitym posiadaczem konta. Korzystamy z zewnętrznych procesorów płatniczych, aby bezpiecznie przetwarzać informacje o płatnościach. ||| Szacunkowe koszty wysyłki podano dla wygody i nie gwarantują daty dostawy. Po przekazaniu produktów przewoźnikowi ryzyko utraty przechodzi na Ciebie. Ponosisz odpowiedzialność za opłaty celne i podatki importowe oraz za błędy w dostawie spowodowane nieprawidłowymi danymi adresowymi. ||| Jeśli mieszkasz na terenie UE, EOG lub Szwajcarii, masz prawo do zwrotu produktów w ciągu 14 dni od otrzymania w celu uzyskania pełnego zwrotu pieniędzy. Produkty muszą być zwrócone w oryginalnym stanie. Wysyłka zwrotna może odbywać się na Twój koszt, zgodnie z prawem. Produkty cyfrowe mogą zostać wykluczone, jeśli pobieranie rozpocznie się za Twoją zgodą i potwierdzisz utratę prawa do odstąpienia od umowy. ||| Uprawnienia do zwrotów dla klientów z USA są opisane w naszej osobnej Polityce zwrotów i zwrotów opublikowanej w Witrynie. Niektóre elementy (np. pliki cyfrowe do pobrania, elementy spersonalizowane) mogą nie podlegać zwrotowi. ||| Jeśli kupujesz produkty cyfrowe, dostawa odbywa się elektronicznie, otrzymujesz osobistą, niewyłączną licencję na korzystanie z treści i nie możesz redystrybuować, odsprzedawać ani udostępniać pobranych plików bez pozwolenia. ||| Cała zawartość Strony internetowej (tekst, projekty, oprogramowanie, grafika, obrazy) stanowi własność Rhythm Nexus lub jest przez nią licencjonowana i jest chroniona prawem autorskim i prawami własności intelektualnej. Nie możesz reprodukować, modyfikować, rozpowszechniać ani tworzyć dzieł pochodnych bez pisemnej zgody.","privacyText":"Rhythm Nexus („my”, „nas” lub „nasz”) szanuje Twoją prywatność i zobowiązuje się do ochrony Twoich danych osobowych. Niniejsza Polityka prywatności wyjaśnia, jakie dane osobowe gromadzimy, w jaki sposób je wykorzystujemy, komu je udostępniamy oraz jakie są Twoje prawa. Niniejsza polityka dotyczy użytkowników z UE, EOG, Szwajcarii i USA. ||| Gromadzimy dane osobowe, które dobrowolnie podajesz, w tym imię i nazwisko, adres e-mail, adres rozliczeniowy i adres wysyłki, numer telefonu i informacje o płatnościach obsługiwane przez zewnętrzne podmioty przetwarzające. ||| Automatycznie zbieramy adres IP, typ przeglądarki, dane urządzenia, dane o użytkowaniu, pliki cookie i technologie śledzenia. ||| Jeśli przebywasz na terenie UE/EOG/Szwajcarii, przetwarzamy Twoje dane w oparciu o realizację umowy (realizacja zamówienia), obowiązek prawny, uzasadnione interesy i zgodę, jeśli jest to wymagane. ||| Używamy Twoich danych w celu przetwarzania zamówień, wysyłki produktów, komunikacji z Tobą, zapewniania obsługi klienta, wypełniania obowiązków prawnych, ulepszania naszej Strony internetowej i wysyłania komunikacji marketingowej za zgodą. ||| W razie potrzeby możemy udostępniać Twoje dane podmiotom przetwarzającym płatności, partnerom spedycyjnym, dostawcom usług analitycznych, dostawcom usług marketingowych i organom prawnym. Nie sprzedajemy danych osobowych. ||| Użytkownicy z UE/EOG/Szwajcarii mają prawo dostępu do danych osobowych zgodnie z RODO, poprawiania nieprawidłowych danych, usuwania danych, ograniczania przetwarzania, sprzeciwu wobec przetwarzania, przenoszenia danych i cofania zgody. Aby skorzystać z tych praw, skontaktuj się z nami pod adresem rytmnexusco@gmail.com. ||| Użytkownicy z USA (CCPA/CPRA, w stosownych przypadkach) mogą mieć prawo do informacji, jakie dane osobowe są gromadzone, żądania usunięcia, rezygnacji z udostępniania danych i niedyskryminacji w zakresie korzystania z praw. Aby przesłać prośbę, wyślij e-mail na adres rytmnexusco@gmail.com. ||| Dane osobowe przechowujemy tak długo, jak jest to niezbędne do realizacji zamówień, spełnienia wymogów prawnych i rozwiązywania sporów. ||| Możemy przesyłać dane poza Twój region. W przypadku przeniesienia danych z UE/EOG/Szwajcarii stosujemy standardowe klauzule umowne (SCC) i inne zgodne z prawem zabezpieczenia. ||| Wdrażamy rozsądne zabezpieczenia techniczne i organizacyjne, w tym szyfrowanie SSL, bezpieczne systemy płatności i środki kontroli dostępu. Żaden system nie jest jednak w 100% bezpieczny.","termsSupplement":"W maksymalnym zakresie dozwolonym przez obowiązujące prawo nie ponosimy odpowiedzialności za szkody pośrednie, przypadkowe lub następcze, utratę danych, utratę zysków lub przerwę w działalności. Nasza całkowita odpowiedzialność nie może przekroczyć kwoty zapłaconej przez Państwa za zakupiony(e) produkt(y). W przypadku konsumentów w UE/EOG/Szwajcarii nie ma to wpływu na obowiązkowe prawa ustawowe. ||| Niniejsze Warunki podlegają prawu [Twoja jurysdykcja] bez względu na zasady kolizyjne. Użytkownicy z UE/EOG/Szwajcarii mogą korzystać z dodatkowych zabezpieczeń na mocy lokalnego prawa, od których nie można się odstąpić. ||| Użytkownicy z UE/EOG/Szwajcarii mogą uzyskać dostęp do unijnej platformy internetowego rozstrzygania sporów: https://ec.europa.eu/consumers/odr/ ||| Użytkownicy z USA mogą rozstrzygać spory w drodze negocjacji, arbitrażu (jeśli tak uzgodniono) lub działań sądowych w swojej jurysdykcji. ||| Możemy aktualizować niniejsze Warunki. Poprawiona wersja zostanie opublikowana pod tym adresem URL z nową datą wejścia w życie.","privacySupplement":"Używamy plików cookie i podobnych technologii do obsługi Witryny, analizowania użytkowania i personalizowania treści. Odwiedzającym z UE/EOG/Szwajcarii zostanie wyświetlony baner wyrażający zgodę na użycie plików cookie. Możesz zarządzać preferencjami dotyczącymi plików cookies w ustawieniach swojej przeglądarki. ||| Nie zbieramy świadomie danych osobowych od dzieci poniżej 13 roku życia w USA lub poniżej 16 roku życia w UE/EOG. Jeśli dowiemy się, że zebraliśmy takie dane, usuniemy je. ||| Nasza Witryna internetowa może zawierać łącza do witryn stron trzecich. Nie ponosimy odpowiedzialności za ich praktyki dotyczące prywatności. ||| Możemy zaktualizować tę politykę. Nowa wersja zostanie opublikowana pod tym adresem URL ze zmienioną datą wejścia w życie."};
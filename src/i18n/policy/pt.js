@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Termos","navPrivacy":"Privacidade","termsTitle":"Termos de Serviço","privacyTitle":"política de Privacidade","updated":"Última atualização: 24 de fevereiro de 2026","termsText":"Estes Termos de Serviço (\"Termos\") regem o seu acesso e uso dos serviços de comércio eletrônico oferecidos através de https://rhythmnexus.org (\"Site\") operado pela Rhythm Nexus (\"nós\", \"nos\" ou \"nosso\"). Ao acessar, navegar ou comprar no Site, você concorda em ficar vinculado a estes Termos. Se você não concordar, não poderá usar o Site ou fazer um pedido. ||| Você deve ter pelo menos 18 anos ou ser maior de idade em sua jurisdição para comprar produtos deste Site. Ao fazer um pedido, você declara e garante que atende a esse requisito. ||| Você pode ser solicitado a criar uma conta para fazer uma compra. Você concorda em fornecer informações precisas, atuais e completas. Você é responsável por proteger as credenciais da sua conta. Você deve nos notificar imediatamente sobre qualquer uso não autorizado. Poderemos encerrar ou suspender sua conta a qualquer momento por violação destes Termos. ||| Nós nos esforçamos para exibir as informações dos produtos com precisão, mas não garantimos que as descrições dos produtos ou outros conteúdos estejam livres de erros. ||| Os preços são mostrados em dólares dos Estados Unidos (USD) e incluem impostos aplicáveis ​​quando exigido por lei. Podemos alterar os preços a qualquer momento antes de você fazer um pedido. ||| Seu pedido é uma oferta de compra. A aceitação ocorre quando confirmamos seu pedido por e-mail, ou quando enviamos os produtos, o que ocorrer primeiro. Podemos recusar ou cancelar pedidos por motivos que incluem preços incorretos, produtos fora de estoque ou suspeita de fraude. ||| Aceitamos os métodos de pagamento apresentados durante a finalização da compra. Ao enviar os dados de pagamento, você nos autoriza a cobrar o valor devido e confirma que é o legítimo titular da conta. Usamos processadores de pagamento terceirizados para lidar com informações de pagamento com segurança. ||| As estimativas de envio são fornecidas por conveniência e não garantem datas de entrega. Depois que os produtos são transferidos para uma transportadora, o risco de perda passa para você. Você é responsável pelas taxas alfandegárias e impostos de importação e por erros de entrega causados ​​por informações de endereço incorretas. ||| Se você reside na UE, no EEE ou na Suíça, você tem o direito legal de devolver os produtos no prazo de 14 dias após o recebimento para obter reembolso total. Os produtos devem ser devolvidos nas condições originais. O frete de devolução pode ser por sua conta, conforme permitido por lei. Os produtos digitais podem ser excluídos se o download começar com o seu consentimento e você reconhecer a perda do direito de retirada. ||| A elegibilidade de devolução para clientes dos EUA está descrita em nossa Política de Devolução e Reembolso separada publicada no Site. Alguns itens (por exemplo, downloads digitais, itens personalizados) podem não ser reembolsáveis. ||| Se você comprar itens digitais, a entrega será eletrônica, você receberá uma licença pessoal não exclusiva para usar o conteúdo e não poderá redistribuir, revender ou compartilhar downloads sem permissão. ||| Todo o conteúdo do site (texto, designs, software, gráficos, imagens) é de propriedade ou licenciado à Rhythm Nexus e protegido por leis de direitos autorais e propriedade intelectual. Você não pode reproduzir, modificar, distribuir ou criar trabalhos derivados sem permissão por escrito.","privacyText":"A Rhythm Nexus (\"nós\", \"nos\" ou \"nosso\") respeita sua privacidade e está comprometida em proteger seus dados pessoais. Esta Política de Privacidade explica quais dados pessoais coletamos, como são utilizados, com quem os compartilhamos e seus direitos. Esta política se aplica a usuários da UE, EEE, Suíça e EUA. ||| Coletamos as informações pessoais que você fornece voluntariamente, incluindo nome, endereço de e-mail, endereço de cobrança e entrega, número de telefone e informações de pagamento gerenciadas por processadores terceirizados. ||| Coletamos automaticamente endereço IP, tipo de navegador, dados do dispositivo, dados de uso, cookies e tecnologias de rastreamento. ||| Se você estiver na UE/EEE/Suíça, processamos seus dados com base no desempenho do contrato (cumprimento de pedidos), obrigações legais, interesses legítimos e consentimento quando necessário. ||| Utilizamos os seus dados para processar encomendas, enviar produtos, comunicar consigo, fornecer apoio ao cliente, cumprir obrigações legais, melhorar o nosso Website e enviar comunicações de marketing com consentimento. ||| Poderemos partilhar os seus dados com processadores de pagamento, parceiros de envio, fornecedores de análises, prestadores de serviços de marketing e autoridades legais, quando necessário. Não vendemos dados pessoais. ||| Os usuários da UE/EEE/Suíça têm direitos do GDPR para acessar dados pessoais, corrigir dados imprecisos, apagar dados, restringir o processamento, opor-se ao processamento, transferir dados e retirar o consentimento. Para exercer estes direitos, contacte-nos em ritmonexusco@gmail.com. ||| Os usuários dos EUA (CCPA/CPRA, quando aplicável) podem ter direitos de saber quais dados pessoais são coletados, solicitar exclusão, cancelar o compartilhamento de dados e não discriminação no exercício de direitos. Para enviar solicitações, envie um e-mail para ritmonexusco@gmail.com. ||| Conservamos os dados pessoais enquanto for necessário para cumprir encomendas, cumprir requisitos legais e resolver litígios. ||| Podemos transferir dados para fora da sua região. Ao transferir da UE/EEE/Suíça, utilizamos Cláusulas Contratuais Padrão (SCCs) e outras salvaguardas legais. ||| Implementamos salvaguardas técnicas e organizacionais razoáveis, incluindo criptografia SSL, sistemas de pagamento seguros e medidas de controle de acesso. No entanto, nenhum sistema é 100% seguro.","termsSupplement":"Na extensão máxima permitida pela lei aplicável, não somos responsáveis ​​por danos indiretos, incidentais ou consequenciais, perda de dados, lucros cessantes ou interrupção de negócios. Nossa responsabilidade total não excederá o valor que você pagou pelo(s) produto(s) adquirido(s). Para os consumidores na UE/EEE/Suíça, os direitos legais obrigatórios não são afetados. ||| Estes Termos são regidos pelas leis de [Sua Jurisdição], sem levar em conta conflitos de princípios legais. Os usuários da UE/EEE/Suíça podem ter proteções adicionais sob a legislação local que não podem ser dispensadas. ||| Os utilizadores da UE/EEE/Suíça podem aceder à plataforma de resolução de litígios em linha da UE: https://ec.europa.eu/consumers/odr/ ||| Os usuários dos EUA podem resolver disputas por meio de negociação, arbitragem (se acordado) ou ação judicial em sua jurisdição. ||| Poderemos atualizar estes Termos. A versão revisada será publicada neste URL com uma nova data de vigência.","privacySupplement":"Utilizamos cookies e tecnologias semelhantes para operar o Site, analisar o uso e personalizar o conteúdo. Os visitantes da UE/EEE/Suíça verão um banner de consentimento de cookies. Você pode gerenciar as preferências de cookies nas configurações do seu navegador. ||| Não coletamos intencionalmente dados pessoais de crianças menores de 13 anos nos EUA ou menores de 16 anos na UE/EEE. Se soubermos que coletamos tais dados, iremos excluí-los. ||| Nosso site pode conter links para sites de terceiros. Não somos responsáveis ​​por suas práticas de privacidade. ||| Podemos atualizar esta política. A nova versão será publicada neste URL com uma data de vigência revisada."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Условия","navPrivacy":"Конфиденциальность","termsTitle":"Условия использования","privacyTitle":"политика конфиденциальности","updated":"Последнее обновление: 24 февраля 2026 г.","termsText":"Настоящие Условия обслуживания («Условия») регулируют ваш доступ и использование услуг электронной коммерции, предлагаемых через https://rhythmnexus.org («Веб-сайт»), управляемых Rhythm Nexus («мы», «нас» или «наш»). Получая доступ, просматривая или совершая покупки на Веб-сайте, вы соглашаетесь соблюдать настоящие Условия. Если вы не согласны, вы не имеете права использовать Веб-сайт или размещать заказ. ||| Для приобретения продуктов на этом веб-сайте вам должно быть не менее 18 лет или возраст совершеннолетия в соответствии с вашей юрисдикцией. Размещая заказ, вы заявляете и гарантируете, что соответствуете этому требованию. ||| Вам может быть предложено создать учетную запись для совершения покупки. Вы соглашаетесь предоставлять точную, актуальную и полную информацию. Вы несете ответственность за сохранность учетных данных своей учетной записи. Вы должны немедленно уведомить нас о любом несанкционированном использовании. Мы можем прекратить или приостановить действие вашей учетной записи в любое время за нарушение настоящих Условий. ||| Мы стремимся точно отображать информацию о продуктах, но не гарантируем, что описания продуктов или другой контент не содержат ошибок. ||| Цены указаны в долларах США (USD) и включают применимые налоги, если того требует закон. Мы можем изменить цены в любое время до того, как вы разместите заказ. ||| Ваш заказ является предложением о покупке. Принятие происходит, когда мы подтверждаем ваш заказ по электронной почте или когда мы отправляем товары, в зависимости от того, что произойдет раньше. Мы можем отклонить или отменить заказы по таким причинам, как неправильная цена, отсутствие товаров на складе или подозрение в мошенничестве. ||| Мы принимаем способы оплаты, указанные при оформлении заказа. Отправляя платежные реквизиты, вы разрешаете нам списать причитающуюся сумму и подтверждаете, что являетесь законным владельцем счета. Мы используем сторонние платежные системы для безопасной обработки платежной информации. ||| Стоимость доставки указана для удобства и не гарантирует даты доставки. Как только товары передаются перевозчику, риск потери переходит на вас. Вы несете ответственность за уплату таможенных пошлин и налогов на импорт, а также за ошибки доставки, вызванные неправильной информацией об адресе. ||| Если вы проживаете в ЕС, ЕЭЗ или Швейцарии, вы имеете законное право вернуть продукцию в течение 14 дней с момента получения и получить полный возврат средств. Товары должны быть возвращены в первоначальном состоянии. Обратная доставка может осуществляться за ваш счет, как это разрешено законом. Цифровые продукты могут быть исключены, если загрузка начинается с вашего согласия и вы признаете потерю права на отказ. ||| Право на возврат для клиентов из США изложено в нашей отдельной Политике возврата и возмещения, опубликованной на Веб-сайте. Некоторые товары (например, цифровые загрузки, персонализированные товары) могут не подлежать возврату. ||| Если вы приобретаете цифровые товары, доставка осуществляется электронно, вам предоставляется личная неисключительная лицензия на использование контента, и вы не имеете права распространять, перепродавать или делиться загрузками без разрешения. ||| Весь контент веб-сайта (текст, дизайн, программное обеспечение, графика, изображения) принадлежит компании Rhythm Nexus или лицензируется ею и защищен законами об авторском праве и интеллектуальной собственности. Вы не имеете права воспроизводить, изменять, распространять или создавать производные работы без письменного разрешения.","privacyText":"Rhythm Nexus («мы», «нас» или «наш») уважает вашу конфиденциальность и обязуется защищать ваши личные данные. В настоящей Политике конфиденциальности объясняется, какие персональные данные мы собираем, как они используются, кому мы ими делимся, а также ваши права. Эта политика распространяется на пользователей из ЕС, ЕЭЗ, Швейцарии и США. ||| Мы собираем личную информацию, которую вы добровольно предоставляете, включая имя, адрес электронной почты, адрес для выставления счетов и доставки, номер телефона и платежную информацию, обрабатываемую сторонними процессорами. ||| Мы автоматически собираем IP-адрес, тип браузера, данные об устройстве, данные об использовании, файлы cookie и технологии отслеживания. ||| Если вы находитесь в ЕС/ЕЭЗ/Швейцарии, мы обрабатываем ваши данные на основании выполнения контракта (выполнения заказа), юридических обязательств, законных интересов и согласия, когда это необходимо. ||| Мы используем ваши данные для обработки заказов, отправки продуктов, общения с вами, обеспечения поддержки клиентов, выполнения юридических обязательств, улучшения нашего веб-сайта и отправки маркетинговых сообщений с вашего согласия. ||| При необходимости мы можем передавать ваши данные платежным системам, партнерам по доставке, поставщикам аналитики, поставщикам маркетинговых услуг и юридическим органам. Мы не продаем персональные данные. ||| Пользователи ЕС/ЕЭЗ/Швейцарии имеют права GDPR на доступ к личным данным, исправление неточных данных, удаление данных, ограничение обработки, возражение против обработки, перенос данных и отзыв согласия. Чтобы воспользоваться этими правами, свяжитесь с нами по адресу ритмнексуско@gmail.com. ||| Пользователи из США (CCPA/CPRA, где применимо) могут иметь право знать, какие персональные данные собираются, требовать удаления, отказа от обмена данными и недискриминации при осуществлении прав. Чтобы отправить запросы, отправьте электронное письмо по адресу Rhythnexusco@gmail.com. ||| Мы храним персональные данные до тех пор, пока это необходимо для выполнения заказов, соблюдения требований законодательства и разрешения споров. ||| Мы можем передавать данные за пределы вашего региона. При передаче из ЕС/ЕЭЗ/Швейцарии мы используем Стандартные договорные условия (SCC) и другие законные гарантии. ||| Мы реализуем разумные технические и организационные меры безопасности, включая SSL-шифрование, безопасные платежные системы и меры контроля доступа. Однако ни одна система не является на 100% безопасной.","termsSupplement":"В максимальной степени, разрешенной применимым законодательством, мы не несем ответственности за косвенные, случайные или косвенные убытки, потерю данных, упущенную выгоду или перерыв в работе. Наша общая ответственность не должна превышать сумму, которую вы заплатили за приобретенный продукт(ы). Для потребителей в ЕС/ЕЭЗ/Швейцарии обязательные законные права не затрагиваются. ||| Настоящие Условия регулируются законодательством [Вашей юрисдикции] без учета принципов коллизионного права. Пользователи из ЕС/ЕЭЗ/Швейцарии могут иметь дополнительную защиту в соответствии с местным законодательством, от которой нельзя отказаться. ||| Пользователи из ЕС/ЕЭЗ/Швейцарии могут получить доступ к онлайн-платформе разрешения споров ЕС: https://ec.europa.eu/consumers/odr/ ||| Пользователи из США могут разрешать споры путем переговоров, арбитража (при наличии согласия) или суда в своей юрисдикции. ||| Мы можем обновлять настоящие Условия. Пересмотренная версия будет размещена по этому URL-адресу с новой датой вступления в силу.","privacySupplement":"Мы используем файлы cookie и аналогичные технологии для управления веб-сайтом, анализа использования и персонализации контента. Посетителям ЕС/ЕЭЗ/Швейцарии будет показан баннер согласия на использование файлов cookie. Вы можете управлять настройками файлов cookie в настройках вашего браузера. ||| Мы сознательно не собираем персональные данные детей до 13 лет в США или до 16 лет в ЕС/ЕЭЗ. Если мы узнаем, что собрали такие данные, мы удалим их. ||| Наш Веб-сайт может содержать ссылки на сторонние сайты. Мы не несем ответственности за их политику конфиденциальности. ||| Мы можем обновить эту политику. Новая версия будет размещена по этому URL-адресу с измененной датой вступления в силу."};
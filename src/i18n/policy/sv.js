@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Villkor","navPrivacy":"Privatliv","termsTitle":"Användarvillkor","privacyTitle":"Sekretesspolicy","updated":"Senast uppdaterad: 24 februari 2026","termsText":"Dessa användarvillkor (\"Villkor\") reglerar din åtkomst till och användning av e-handelstjänsterna som erbjuds via https://rhythmnexus.org (\"Webbplatsen\") som drivs av Rhythm Nexus (\"vi\", \"oss\" eller \"vår\"). Genom att komma åt, surfa eller köpa från webbplatsen samtycker du till att vara bunden av dessa villkor. Om du inte samtycker får du inte använda webbplatsen eller göra en beställning. ||| Du måste vara minst 18 år gammal eller myndig ålder i din jurisdiktion för att köpa produkter från denna webbplats. Genom att göra en beställning intygar och garanterar du att du uppfyller detta krav. ||| Du kan bli ombedd att skapa ett konto för att göra ett köp. Du samtycker till att tillhandahålla korrekt, aktuell och fullständig information. Du ansvarar för att skydda dina kontouppgifter. Du måste omedelbart meddela oss om all obehörig användning. Vi kan avsluta eller stänga av ditt konto när som helst för brott mot dessa villkor. ||| Vi strävar efter att visa produktinformation korrekt, men vi garanterar inte att produktbeskrivningar eller annat innehåll är felfritt. ||| Priserna visas i amerikanska dollar (USD) och inkluderar tillämpliga skatter där det krävs enligt lag. Vi kan ändra priser när som helst innan du gör en beställning. ||| Din beställning är ett köperbjudande. Acceptans sker när vi bekräftar din beställning via e-post, eller när vi skickar produkterna, beroende på vad som inträffar först. Vi kan avvisa eller annullera beställningar av anledningar, inklusive felaktig prissättning, slutsålda produkter eller misstänkt bedrägeri. ||| Vi accepterar de betalningsmetoder som visas i kassan. Genom att skicka in betalningsuppgifter godkänner du oss att debitera det förfallna beloppet och bekräftar att du är den rättmätige kontoinnehavaren. Vi använder tredje parts betalningsbehandlare för att säkert hantera betalningsinformation. ||| Leveransuppskattningar tillhandahålls för bekvämlighet och garanterar inte leveransdatum. När produkterna har överförts till en transportör övergår risken för förlust till dig. Du ansvarar för tullar och importskatter samt för leveransfel orsakade av felaktig adressinformation. ||| Om du bor i EU, EES eller Schweiz har du laglig rätt att returnera produkter inom 14 dagar efter mottagandet för full återbetalning. Produkter måste returneras i originalskick. Returfrakt kan ske på din bekostnad enligt lag. Digitala produkter kan uteslutas om nedladdningen börjar med ditt samtycke och du erkänner förlust av ångerrätten. ||| Returberättigande för amerikanska kunder beskrivs i vår separata retur- och återbetalningspolicy som publiceras på webbplatsen. Vissa artiklar (t.ex. digitala nedladdningar, personliga artiklar) kan inte återbetalas. ||| Om du köper digitala föremål är leveransen elektronisk, du beviljas en personlig icke-exklusiv licens att använda innehållet, och du får inte vidaredistribuera, sälja vidare eller dela nedladdningar utan tillstånd. ||| Allt innehåll på webbplatsen (text, design, programvara, grafik, bilder) ägs av eller licensieras till Rhythm Nexus och skyddas av upphovsrätts- och immateriella lagar. Du får inte reproducera, modifiera, distribuera eller skapa härledda verk utan skriftligt tillstånd.","privacyText":"Rhythm Nexus (\"vi\", \"oss\" eller \"vår\") respekterar din integritet och är engagerad i att skydda dina personuppgifter. Denna integritetspolicy förklarar vilka personuppgifter vi samlar in, hur de används, vem vi delar dem med och dina rättigheter. Denna policy gäller användare från EU, EES, Schweiz och USA. ||| Vi samlar in den personliga information som du frivilligt tillhandahåller, inklusive namn, e-postadress, fakturerings- och leveransadress, telefonnummer och betalningsinformation som hanteras av tredje parts processorer. ||| Vi samlar automatiskt in IP-adress, webbläsartyp, enhetsdata, användningsdata, cookies och spårningstekniker. ||| Om du befinner dig i EU/EES/Schweiz behandlar vi dina uppgifter baserat på kontraktsutförande (orderuppfyllelse), rättslig skyldighet, legitima intressen och samtycke där så krävs. ||| Vi använder dina uppgifter för att behandla beställningar, skicka produkter, kommunicera med dig, tillhandahålla kundsupport, följa rättsliga skyldigheter, förbättra vår webbplats och skicka marknadsföringskommunikation med samtycke. ||| Vi kan komma att dela dina uppgifter med betalningsprocessorer, fraktpartners, analysleverantörer, marknadsföringstjänsteleverantörer och juridiska myndigheter när så krävs. Vi säljer inte personuppgifter. ||| EU/EES/Schweiziska användare har GDPR-rättigheter att få tillgång till personuppgifter, korrigera felaktiga uppgifter, radera data, begränsa behandling, invända mot behandling, porta data och återkalla samtycke. För att utöva dessa rättigheter, kontakta oss på rhythmnexusco@gmail.com. ||| USA-användare (CCPA/CPRA, där tillämpligt) kan ha rätt att veta vilka personuppgifter som samlas in, begära radering, välja bort datadelning och icke-diskriminering för att utöva rättigheter. För att skicka in förfrågningar, e-posta rhythmnexusco@gmail.com. ||| Vi behåller personuppgifter så länge det är nödvändigt för att uppfylla beställningar, följa lagkrav och lösa tvister. ||| Vi kan överföra data utanför din region. Vid överföring från EU/EES/Schweiz använder vi standardavtalsklausuler (SCC) och andra lagliga skyddsåtgärder. ||| Vi implementerar rimliga tekniska och organisatoriska skyddsåtgärder inklusive SSL-kryptering, säkra betalningssystem och åtkomstkontrollåtgärder. Inget system är dock 100% säkert.","termsSupplement":"I den maximala utsträckning som tillåts enligt tillämplig lag är vi inte ansvariga för indirekta, tillfälliga skador eller följdskador, förlust av data, förlorad vinst eller affärsavbrott. Vårt totala ansvar ska inte överstiga det belopp som du betalade för produkten/varorna som köpts. För konsumenter i EU/EES/Schweiz påverkas inte obligatoriska lagstadgade rättigheter. ||| Dessa villkor styrs av lagarna i [din jurisdiktion] utan hänsyn till lagkonfliktprinciper. Användare inom EU/EES/Schweiz kan ha ytterligare skydd enligt lokal lag som inte kan frångås. ||| EU/EES/Schweiziska användare kan få tillgång till EU:s plattform för onlinetvistlösning: https://ec.europa.eu/consumers/odr/ ||| USA-användare kan lösa tvister genom förhandlingar, skiljeförfarande (om överenskommet) eller domstolsåtgärder i deras jurisdiktion. ||| Vi kan komma att uppdatera dessa villkor. Den reviderade versionen kommer att publiceras på denna webbadress med ett nytt ikraftträdandedatum.","privacySupplement":"Vi använder cookies och liknande tekniker för att driva webbplatsen, analysera användningen och anpassa innehållet. Besökare inom EU/EES/Schweiz kommer att se en banner med samtycke för cookies. Du kan hantera cookie-preferenser i din webbläsarinställningar. ||| Vi samlar inte medvetet in personuppgifter från barn under 13 år i USA eller under 16 år inom EU/EES. Om vi ​​får reda på att vi har samlat in sådana uppgifter kommer vi att radera dem. ||| Vår webbplats kan innehålla länkar till tredje parts webbplatser. Vi är inte ansvariga för deras sekretesspraxis. ||| Vi kan komma att uppdatera denna policy. Den nya versionen kommer att publiceras på denna URL med ett reviderat ikraftträdandedatum."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"விதிமுறைகள்","navPrivacy":"தனியுரிமை","termsTitle":"சேவை விதிமுறைகள்","privacyTitle":"தனியுரிமைக் கொள்கை","updated":"கடைசியாக புதுப்பிக்கப்பட்டது: 24 பிப்ரவரி 2026","termsText":"இந்த சேவை விதிமுறைகள் (\"விதிமுறைகள்\") Rhythm Nexus (\"நாங்கள்\", \"எங்கள்\" அல்லது \"எங்கள்\") மூலம் இயக்கப்படும் https://rhythmnexus.org (\"இணையதளம்\") மூலம் வழங்கப்படும் மின் வணிகச் சேவைகளுக்கான உங்கள் அணுகல் மற்றும் பயன்பாட்டை நிர்வகிக்கிறது. இணையதளத்தை அணுகுதல், உலாவுதல் அல்லது வாங்குதல் மூலம், இந்த விதிமுறைகளுக்குக் கட்டுப்படுவதை ஒப்புக்கொள்கிறீர்கள். நீங்கள் ஒப்புக்கொள்ளவில்லை என்றால், நீங்கள் வலைத்தளத்தைப் பயன்படுத்தவோ அல்லது ஆர்டர் செய்யவோ முடியாது. ||| இந்த இணையதளத்தில் தயாரிப்புகளை வாங்குவதற்கு நீங்கள் குறைந்தபட்சம் 18 வயது அல்லது உங்கள் அதிகார வரம்பில் வயது முதிர்ந்தவராக இருக்க வேண்டும். ஒரு ஆர்டரை வைப்பதன் மூலம், நீங்கள் இந்த தேவையை பூர்த்தி செய்வதை பிரதிநிதித்துவப்படுத்தி உத்தரவாதம் அளிக்கிறீர்கள். ||| வாங்குவதற்கு ஒரு கணக்கை உருவாக்கும்படி கேட்கப்படலாம். துல்லியமான, தற்போதைய மற்றும் முழுமையான தகவலை வழங்க ஒப்புக்கொள்கிறீர்கள். உங்கள் கணக்கு நற்சான்றிதழ்களைப் பாதுகாப்பதற்கு நீங்கள் பொறுப்பு. எந்தவொரு அங்கீகரிக்கப்படாத பயன்பாடு குறித்தும் நீங்கள் உடனடியாக எங்களுக்குத் தெரிவிக்க வேண்டும். இந்த விதிமுறைகளை மீறினால் உங்கள் கணக்கை எந்த நேரத்திலும் நாங்கள் நிறுத்தலாம் அல்லது இடைநிறுத்தலாம். ||| தயாரிப்புத் தகவலைத் துல்லியமாகக் காட்ட நாங்கள் முயற்சி செய்கிறோம், ஆனால் தயாரிப்பு விளக்கங்கள் அல்லது பிற உள்ளடக்கம் பிழையற்றது என்று நாங்கள் உத்தரவாதம் அளிக்கவில்லை. ||| விலைகள் யுனைடெட் ஸ்டேட்ஸ் டாலரில் (USD) காட்டப்படும் மற்றும் சட்டத்தின்படி தேவைப்படும் போது பொருந்தக்கூடிய வரிகளும் அடங்கும். நீங்கள் ஆர்டர் செய்வதற்கு முன் நாங்கள் எந்த நேரத்திலும் விலைகளை மாற்றலாம். ||| உங்கள் ஆர்டர் வாங்குவதற்கான வாய்ப்பாகும். உங்கள் ஆர்டரை மின்னஞ்சலில் உறுதிசெய்யும்போது அல்லது தயாரிப்புகளை நாங்கள் அனுப்பும்போது எது முதலில் நடக்கிறதோ அதை ஏற்றுக்கொள்வது ஏற்படுகிறது. தவறான விலை, கையிருப்பில் இல்லாத பொருட்கள் அல்லது சந்தேகத்திற்குரிய மோசடி உள்ளிட்ட காரணங்களுக்காக நாங்கள் ஆர்டர்களை நிராகரிக்கலாம் அல்லது ரத்து செய்யலாம். ||| செக் அவுட்டின் போது காட்டப்படும் கட்டண முறைகளை ஏற்கிறோம். கட்டண விவரங்களைச் சமர்ப்பிப்பதன் மூலம், செலுத்த வேண்டிய தொகையை வசூலிக்க எங்களுக்கு அதிகாரம் வழங்குகிறீர்கள் மற்றும் நீங்கள்தான் சரியான கணக்கு வைத்திருப்பவர் என்பதை உறுதிப்படுத்தவும். கட்டணத் தகவலைப் பாதுகாப்பாகக் கையாள மூன்றாம் தரப்பு கட்டணச் செயலிகளைப் பயன்படுத்துகிறோம். ||| ஷிப்பிங் மதிப்பீடுகள் வசதிக்காக வழங்கப்படுகின்றன மற்றும் விநியோக தேதிகளுக்கு உத்தரவாதம் இல்லை. தயாரிப்புகள் ஒரு கேரியருக்கு மாற்றப்பட்டவுடன், இழப்பு ஏற்படும் அபாயம் உங்களுக்கு செல்கிறது. சுங்க வரிகள் மற்றும் இறக்குமதி வரிகள் மற்றும் தவறான முகவரி தகவலால் ஏற்படும் டெலிவரி பிழைகளுக்கு நீங்கள் பொறுப்பாவீர்கள். ||| நீங்கள் EU, EEA அல்லது சுவிட்சர்லாந்தில் வசிக்கிறீர்கள் என்றால், முழுப் பணத்தைத் திரும்பப் பெறுவதற்கான ரசீது கிடைத்த 14 நாட்களுக்குள் தயாரிப்புகளைத் திருப்பித் தர உங்களுக்கு சட்டப்பூர்வ உரிமை உள்ளது. தயாரிப்புகள் அசல் நிலையில் திரும்பப் பெறப்பட வேண்டும். சட்டத்தால் அனுமதிக்கப்பட்ட உங்கள் செலவில் ரிட்டர்ன் ஷிப்பிங் இருக்கலாம். உங்கள் ஒப்புதலுடன் பதிவிறக்கம் தொடங்கி, திரும்பப் பெறுவதற்கான உரிமையை இழப்பதை நீங்கள் ஒப்புக்கொண்டால் டிஜிட்டல் தயாரிப்புகள் விலக்கப்படலாம். ||| அமெரிக்க வாடிக்கையாளர்களுக்குத் திரும்பப் பெறுவதற்கான தகுதியானது இணையதளத்தில் வெளியிடப்பட்ட எங்களின் தனியான திரும்பப் பெறுதல் & பணத்தைத் திரும்பப்பெறுதல் கொள்கையில் கோடிட்டுக் காட்டப்பட்டுள்ளது. சில உருப்படிகள் (எ.கா., டிஜிட்டல் பதிவிறக்கங்கள், தனிப்பயனாக்கப்பட்ட உருப்படிகள்) திரும்பப் பெறப்படாமல் இருக்கலாம். ||| நீங்கள் டிஜிட்டல் பொருட்களை வாங்கினால், டெலிவரி மின்னணு முறையில் இருந்தால், உள்ளடக்கத்தைப் பயன்படுத்த தனிப்பட்ட பிரத்தியேகமற்ற உரிமம் உங்களுக்கு வழங்கப்படும், மேலும் அனுமதியின்றி பதிவிறக்கங்களை மறுவிநியோகம் செய்யவோ, மறுவிற்பனை செய்யவோ, பகிரவோ கூடாது. ||| அனைத்து இணையதள உள்ளடக்கமும் (உரை, வடிவமைப்புகள், மென்பொருள், கிராபிக்ஸ், படங்கள்) Rhythm Nexus க்கு சொந்தமானது அல்லது உரிமம் பெற்றது மற்றும் பதிப்புரிமை மற்றும் அறிவுசார் சொத்துரிமை சட்டங்களால் பாதுகாக்கப்படுகிறது. எழுத்துப்பூர்வ அனுமதியின்றி நீங்கள் மறுஉருவாக்கம் செய்யவோ, மாற்றவோ, விநியோகிக்கவோ அல்லது வழித்தோன்றல் படைப்புகளை உருவாக்கவோ கூடாது.","privacyText":"ரிதம் நெக்ஸஸ் (\"நாங்கள்\", \"நாங்கள்\" அல்லது \"எங்கள்\") உங்கள் தனியுரிமையை மதிக்கிறது மற்றும் உங்கள் தனிப்பட்ட தரவைப் பாதுகாப்பதில் உறுதியாக உள்ளது. இந்த தனியுரிமைக் கொள்கையில் நாங்கள் சேகரிக்கும் தனிப்பட்ட தரவு என்ன, அது எவ்வாறு பயன்படுத்தப்படுகிறது, யாருடன் பகிர்கிறோம் மற்றும் உங்கள் உரிமைகளை விளக்குகிறது. இந்தக் கொள்கை EU, EEA, சுவிட்சர்லாந்து மற்றும் அமெரிக்காவைச் சேர்ந்த பயனர்களுக்குப் பொருந்தும். ||| மூன்றாம் தரப்பு செயலிகள் கையாளும் பெயர், மின்னஞ்சல் முகவரி, பில்லிங் மற்றும் ஷிப்பிங் முகவரி, தொலைபேசி எண் மற்றும் கட்டணத் தகவல் உட்பட நீங்கள் தானாக முன்வந்து வழங்கும் தனிப்பட்ட தகவல்களை நாங்கள் சேகரிக்கிறோம். ||| IP முகவரி, உலாவி வகை, சாதனத் தரவு, பயன்பாட்டுத் தரவு, குக்கீகள் மற்றும் கண்காணிப்பு தொழில்நுட்பங்கள் ஆகியவற்றை நாங்கள் தானாகவே சேகரிக்கிறோம். ||| நீங்கள் EU/EEA/Switzerland இல் இருந்தால், ஒப்பந்த செயல்திறன் (ஆர்டர் நிறைவேற்றுதல்), சட்டப்பூர்வ கடமைகள், சட்டபூர்வமான ஆர்வங்கள் மற்றும் தேவைப்படும் இடங்களில் ஒப்புதல் ஆகியவற்றின் அடிப்படையில் உங்கள் தரவைச் செயலாக்குவோம். ||| ஆர்டர்களைச் செயல்படுத்தவும், பொருட்களை அனுப்பவும், உங்களுடன் தொடர்பு கொள்ளவும், வாடிக்கையாளர் ஆதரவை வழங்கவும், சட்டப்பூர்வ கடமைகளுக்கு இணங்கவும், எங்கள் இணையதளத்தை மேம்படுத்தவும், சந்தைப்படுத்தல் தகவல்தொடர்புகளை ஒப்புதலுடன் அனுப்பவும் உங்கள் தரவைப் பயன்படுத்துகிறோம். ||| கட்டணச் செயலிகள், ஷிப்பிங் பார்ட்னர்கள், பகுப்பாய்வு வழங்குநர்கள், சந்தைப்படுத்தல் சேவை வழங்குநர்கள் மற்றும் சட்ட அதிகாரிகளுடன் தேவைப்படும்போது உங்கள் தரவை நாங்கள் பகிரலாம். நாங்கள் தனிப்பட்ட தரவை விற்கவில்லை. ||| EU/EEA/Swiss பயனர்களுக்கு தனிப்பட்ட தரவை அணுகவும், தவறான தரவைச் சரிசெய்யவும், தரவை அழிக்கவும், செயலாக்கத்தை கட்டுப்படுத்தவும், செயலாக்கத்திற்கு ஆட்சேபனை செய்யவும், போர்ட் டேட்டாவும் மற்றும் ஒப்புதலை திரும்பப் பெறவும் GDPR உரிமைகள் உள்ளன. இந்த உரிமைகளைப் பயன்படுத்த, rhythmnexusco@gmail.com இல் எங்களைத் தொடர்பு கொள்ளவும். ||| USA பயனர்கள் (CCPA/CPRA, பொருந்தக்கூடிய இடங்களில்) தனிப்பட்ட தரவு என்ன சேகரிக்கப்படுகிறது, நீக்கக் கோரிக்கை, தரவுப் பகிர்விலிருந்து விலகுதல் மற்றும் உரிமைகளைப் பயன்படுத்துவதில் பாகுபாடு காட்டாதது போன்ற உரிமைகளைக் கொண்டிருக்கலாம். கோரிக்கைகளைச் சமர்ப்பிக்க, மின்னஞ்சல் rhythmnexusco@gmail.com. ||| ஆர்டர்களை நிறைவேற்றவும், சட்டத் தேவைகளுக்கு இணங்கவும், தகராறுகளைத் தீர்க்கவும் தேவைப்படும் வரை தனிப்பட்ட தரவை நாங்கள் வைத்திருக்கிறோம். ||| உங்கள் பிராந்தியத்திற்கு வெளியே நாங்கள் தரவை மாற்றலாம். EU/EEA/Switzerland இலிருந்து மாற்றும் போது, ​​நாங்கள் நிலையான ஒப்பந்த விதிகள் (SCCகள்) மற்றும் பிற சட்டப்பூர்வமான பாதுகாப்புகளைப் பயன்படுத்துகிறோம். ||| SSL குறியாக்கம், பாதுகாப்பான கட்டண முறைகள் மற்றும் அணுகல் கட்டுப்பாட்டு நடவடிக்கைகள் உள்ளிட்ட நியாயமான தொழில்நுட்ப மற்றும் நிறுவனப் பாதுகாப்புகளை நாங்கள் செயல்படுத்துகிறோம். இருப்பினும், எந்த அமைப்பும் 100% பாதுகாப்பாக இல்லை.","termsSupplement":"பொருந்தக்கூடிய சட்டத்தால் அனுமதிக்கப்படும் அதிகபட்ச அளவிற்கு, மறைமுகமான, தற்செயலான அல்லது அதன் விளைவாக ஏற்படும் சேதங்கள், தரவு இழப்பு, இழந்த இலாபங்கள் அல்லது வணிகத் தடங்கல் ஆகியவற்றிற்கு நாங்கள் பொறுப்பல்ல. எங்களின் மொத்தப் பொறுப்பு நீங்கள் வாங்கிய தயாரிப்பு(களுக்கு) செலுத்திய தொகையை விட அதிகமாக இருக்காது. EU/EEA/சுவிட்சர்லாந்தில் உள்ள நுகர்வோருக்கு, கட்டாய சட்டப்பூர்வ உரிமைகள் பாதிக்கப்படாது. ||| இந்த விதிமுறைகள் சட்டக் கொள்கைகளின் முரண்பாட்டைப் பொருட்படுத்தாமல் [உங்கள் அதிகார வரம்பு] சட்டங்களால் நிர்வகிக்கப்படுகின்றன. EU/EEA/Swiss பயனர்களுக்கு உள்ளூர் சட்டத்தின் கீழ் கூடுதல் பாதுகாப்புகள் இருக்கலாம், அவற்றைத் தள்ளுபடி செய்ய முடியாது. ||| EU/EEA/Swiss பயனர்கள் EU ஆன்லைன் தகராறு தீர்வு தளத்தை அணுகலாம்: https://ec.europa.eu/consumers/odr/ ||| USA பயனர்கள் தங்கள் அதிகார வரம்பில் பேச்சுவார்த்தை, நடுவர் (ஒப்புக்கொண்டால்) அல்லது நீதிமன்ற நடவடிக்கை மூலம் சர்ச்சைகளைத் தீர்க்கலாம். ||| இந்த விதிமுறைகளை நாங்கள் புதுப்பிக்கலாம். திருத்தப்பட்ட பதிப்பு இந்த URL இல் புதிய பயனுள்ள தேதியுடன் வெளியிடப்படும்.","privacySupplement":"இணையதளத்தை இயக்கவும், பயன்பாட்டை பகுப்பாய்வு செய்யவும், உள்ளடக்கத்தை தனிப்பயனாக்கவும் குக்கீகள் மற்றும் ஒத்த தொழில்நுட்பங்களைப் பயன்படுத்துகிறோம். EU/EEA/சுவிஸ் பார்வையாளர்களுக்கு குக்கீ ஒப்புதல் பேனர் காட்டப்படும். உங்கள் உலாவி அமைப்புகளில் குக்கீ விருப்பங்களை நிர்வகிக்கலாம். ||| அமெரிக்காவில் 13 வயதுக்குட்பட்ட குழந்தைகளிடமிருந்து அல்லது EU/EEAவில் 16 வயதுக்குட்பட்ட குழந்தைகளிடமிருந்து தனிப்பட்ட தரவை நாங்கள் தெரிந்தே சேகரிப்பதில்லை. அத்தகைய தரவுகளை நாங்கள் சேகரித்தோம் என்று தெரிந்தால், அதை நீக்குவோம். ||| எங்கள் இணையதளத்தில் மூன்றாம் தரப்பு தளங்களுக்கான இணைப்புகள் இருக்கலாம். அவர்களின் தனியுரிமை நடைமுறைகளுக்கு நாங்கள் பொறுப்பல்ல. ||| இந்தக் கொள்கையை நாங்கள் புதுப்பிக்கலாம். புதிய பதிப்பு இந்த URL இல் திருத்தப்பட்ட பயனுள்ள தேதியுடன் வெளியிடப்படும்."};
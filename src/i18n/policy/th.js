@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"เงื่อนไข","navPrivacy":"ความเป็นส่วนตัว","termsTitle":"ข้อกำหนดในการให้บริการ","privacyTitle":"นโยบายความเป็นส่วนตัว","updated":"อัปเดตล่าสุด: 24 กุมภาพันธ์ 2569","termsText":"ข้อกำหนดในการให้บริการ (\"ข้อกำหนด\") เหล่านี้ควบคุมการเข้าถึงและการใช้บริการอีคอมเมิร์ซที่นำเสนอผ่าน https://rhythmnexus.org (\"เว็บไซต์\") ที่ดำเนินการโดย Rhythm Nexus (\"เรา\", \"พวกเรา\" หรือ \"ของเรา\") โดยการเข้าถึง เรียกดู หรือซื้อจากเว็บไซต์ แสดงว่าคุณตกลงที่จะผูกพันตามข้อกำหนดเหล่านี้ หากคุณไม่ตกลง คุณจะไม่สามารถใช้เว็บไซต์หรือสั่งซื้อได้ ||| คุณต้องมีอายุอย่างน้อย 18 ปีหรือบรรลุนิติภาวะในเขตอำนาจศาลของคุณจึงจะสามารถซื้อผลิตภัณฑ์จากเว็บไซต์นี้ได้ ในการสั่งซื้อ คุณรับรองและรับประกันว่าคุณปฏิบัติตามข้อกำหนดนี้ ||| คุณอาจถูกขอให้สร้างบัญชีเพื่อซื้อสินค้า คุณตกลงที่จะให้ข้อมูลที่ถูกต้อง เป็นปัจจุบัน และครบถ้วน คุณมีหน้าที่รับผิดชอบในการปกป้องข้อมูลรับรองบัญชีของคุณ คุณต้องแจ้งให้เราทราบทันทีเกี่ยวกับการใช้งานที่ไม่ได้รับอนุญาต เราอาจยกเลิกหรือระงับบัญชีของคุณได้ตลอดเวลาสำหรับการละเมิดข้อกำหนดเหล่านี้ ||| เรามุ่งมั่นที่จะแสดงข้อมูลผลิตภัณฑ์อย่างถูกต้อง แต่เราไม่รับประกันว่าคำอธิบายผลิตภัณฑ์หรือเนื้อหาอื่น ๆ ปราศจากข้อผิดพลาด ||| ราคาจะแสดงเป็นดอลลาร์สหรัฐ (USD) และรวมภาษีที่เกี่ยวข้องตามที่กฎหมายกำหนด เราอาจเปลี่ยนแปลงราคาได้ตลอดเวลาก่อนที่คุณจะสั่งซื้อ ||| คำสั่งซื้อของคุณเป็นข้อเสนอที่จะซื้อ การยอมรับจะเกิดขึ้นเมื่อเรายืนยันคำสั่งซื้อของคุณทางอีเมล หรือเมื่อเราจัดส่งสินค้า แล้วแต่ว่ากรณีใดจะเกิดขึ้นก่อน เราอาจปฏิเสธหรือยกเลิกคำสั่งซื้อด้วยเหตุผลต่างๆ รวมถึงการกำหนดราคาที่ไม่ถูกต้อง สินค้าหมดสต็อก หรือการฉ้อโกงที่น่าสงสัย ||| เรายอมรับวิธีการชำระเงินที่แสดงระหว่างการชำระเงิน โดยการส่งรายละเอียดการชำระเงิน คุณอนุญาตให้เราเรียกเก็บเงินจำนวนที่ต้องชำระและยืนยันว่าคุณเป็นเจ้าของบัญชีโดยชอบธรรม เราใช้ผู้ประมวลผลการชำระเงินบุคคลที่สามเพื่อจัดการข้อมูลการชำระเงินอย่างปลอดภัย ||| การประมาณการการจัดส่งมีไว้เพื่อความสะดวกและไม่รับประกันวันที่จัดส่ง เมื่อผลิตภัณฑ์ถูกโอนไปยังผู้ขนส่งแล้ว ความเสี่ยงในการสูญเสียจะส่งผ่านไปถึงคุณ คุณต้องรับผิดชอบภาษีศุลกากรและภาษีนำเข้า และข้อผิดพลาดในการจัดส่งที่เกิดจากข้อมูลที่อยู่ไม่ถูกต้อง ||| หากคุณอาศัยอยู่ในสหภาพยุโรป EEA หรือสวิตเซอร์แลนด์ คุณมีสิทธิ์ตามกฎหมายในการคืนผลิตภัณฑ์ภายใน 14 วันหลังจากได้รับเงินคืนเต็มจำนวน สินค้าจะต้องส่งคืนในสภาพเดิม การส่งคืนสินค้าอาจเป็นค่าใช้จ่ายของคุณตามที่กฎหมายอนุญาต ผลิตภัณฑ์ดิจิทัลอาจถูกยกเว้นหากการดาวน์โหลดเริ่มต้นด้วยความยินยอมของคุณและคุณรับทราบถึงการสูญเสียสิทธิ์ในการเพิกถอน ||| สิทธิ์การคืนสินค้าสำหรับลูกค้าในสหรัฐอเมริกามีระบุไว้ในนโยบายการคืนสินค้าและการคืนเงินแยกต่างหากของเราที่โพสต์บนเว็บไซต์ สินค้าบางรายการ (เช่น การดาวน์โหลดแบบดิจิทัล สินค้าเฉพาะบุคคล) อาจไม่สามารถขอคืนเงินได้ ||| หากคุณซื้อสินค้าดิจิทัล การจัดส่งเป็นแบบอิเล็กทรอนิกส์ คุณได้รับใบอนุญาตส่วนบุคคลแบบไม่ผูกขาดในการใช้เนื้อหา และคุณไม่สามารถแจกจ่ายต่อ ขายต่อ หรือแบ่งปันการดาวน์โหลดโดยไม่ได้รับอนุญาต ||| เนื้อหาเว็บไซต์ทั้งหมด (ข้อความ การออกแบบ ซอฟต์แวร์ กราฟิก รูปภาพ) เป็นของหรือได้รับอนุญาตจาก Rhythm Nexus และได้รับการคุ้มครองโดยกฎหมายลิขสิทธิ์และทรัพย์สินทางปัญญา คุณไม่สามารถทำซ้ำ ดัดแปลง แจกจ่าย หรือสร้างผลงานลอกเลียนแบบโดยไม่ได้รับอนุญาตเป็นลายลักษณ์อักษร","privacyText":"Rhythm Nexus (\"เรา\", \"พวกเรา\" หรือ \"ของเรา\") เคารพความเป็นส่วนตัวของคุณและมุ่งมั่นที่จะปกป้องข้อมูลส่วนบุคคลของคุณ นโยบายความเป็นส่วนตัวนี้อธิบายว่าข้อมูลส่วนบุคคลใดบ้างที่เรารวบรวม วิธีการนำไปใช้ ใครที่เราแบ่งปันด้วย และสิทธิ์ของคุณ นโยบายนี้ใช้กับผู้ใช้จาก EU, EEA, สวิตเซอร์แลนด์ และสหรัฐอเมริกา ||| เราเก็บรวบรวมข้อมูลส่วนบุคคลที่คุณให้ไว้โดยสมัครใจ รวมถึงชื่อ ที่อยู่อีเมล ที่อยู่สำหรับการเรียกเก็บเงินและการจัดส่ง หมายเลขโทรศัพท์ และข้อมูลการชำระเงินที่จัดการโดยผู้ประมวลผลบุคคลที่สาม ||| เรารวบรวมที่อยู่ IP ประเภทเบราว์เซอร์ ข้อมูลอุปกรณ์ ข้อมูลการใช้งาน คุกกี้ และเทคโนโลยีการติดตามโดยอัตโนมัติ ||| หากคุณอยู่ใน EU/EEA/สวิตเซอร์แลนด์ เราจะประมวลผลข้อมูลของคุณตามการปฏิบัติตามสัญญา (การปฏิบัติตามคำสั่งซื้อ) ภาระผูกพันทางกฎหมาย ประโยชน์โดยชอบด้วยกฎหมาย และความยินยอมตามที่จำเป็น ||| เราใช้ข้อมูลของคุณเพื่อประมวลผลคำสั่งซื้อ จัดส่งผลิตภัณฑ์ สื่อสารกับคุณ ให้การสนับสนุนลูกค้า ปฏิบัติตามภาระผูกพันทางกฎหมาย ปรับปรุงเว็บไซต์ของเรา และส่งการสื่อสารทางการตลาดโดยได้รับความยินยอม ||| เราอาจแบ่งปันข้อมูลของคุณกับผู้ประมวลผลการชำระเงิน พันธมิตรด้านการขนส่ง ผู้ให้บริการวิเคราะห์ ผู้ให้บริการด้านการตลาด และหน่วยงานทางกฎหมายเมื่อจำเป็น เราไม่ขายข้อมูลส่วนบุคคล ||| ผู้ใช้ EU/EEA/Swiss มีสิทธิ์ GDPR ในการเข้าถึงข้อมูลส่วนบุคคล แก้ไขข้อมูลที่ไม่ถูกต้อง ลบข้อมูล จำกัดการประมวลผล คัดค้านการประมวลผล ย้ายข้อมูล และเพิกถอนความยินยอม หากต้องการใช้สิทธิ์เหล่านี้ โปรดติดต่อเราที่ rhythmnexusco@gmail.com ||| ผู้ใช้ในสหรัฐอเมริกา (CCPA/CPRA หากมี) อาจมีสิทธิ์ทราบว่าข้อมูลส่วนบุคคลใดบ้างที่ถูกรวบรวม ขอลบ ยกเลิกการแบ่งปันข้อมูล และการไม่เลือกปฏิบัติในการใช้สิทธิ์ หากต้องการส่งคำขอส่งอีเมล rhythmnexusco@gmail.com ||| เราเก็บรักษาข้อมูลส่วนบุคคลไว้นานเท่าที่จำเป็นเพื่อปฏิบัติตามคำสั่งซื้อ ปฏิบัติตามข้อกำหนดทางกฎหมาย และแก้ไขข้อพิพาท ||| เราอาจถ่ายโอนข้อมูลนอกภูมิภาคของคุณ เมื่อย้ายจาก EU/EEA/สวิตเซอร์แลนด์ เราจะใช้ Standard Contractual Clauses (SCC) และมาตรการป้องกันทางกฎหมายอื่นๆ ||| เราใช้การป้องกันด้านเทคนิคและองค์กรที่เหมาะสม รวมถึงการเข้ารหัส SSL ระบบการชำระเงินที่ปลอดภัย และมาตรการควบคุมการเข้าถึง อย่างไรก็ตาม ไม่มีระบบใดที่ปลอดภัย 100%","termsSupplement":"ตามขอบเขตสูงสุดที่กฎหมายที่เกี่ยวข้องอนุญาต เราจะไม่รับผิดชอบต่อความเสียหายทางอ้อม ความเสียหายโดยบังเอิญหรือเป็นผลสืบเนื่อง การสูญเสียข้อมูล การสูญเสียผลกำไร หรือการหยุดชะงักทางธุรกิจ ความรับผิดทั้งหมดของเราจะไม่เกินจำนวนเงินที่คุณจ่ายสำหรับผลิตภัณฑ์ที่ซื้อ สำหรับผู้บริโภคใน EU/EEA/สวิตเซอร์แลนด์ สิทธิ์ตามกฎหมายที่บังคับจะไม่ได้รับผลกระทบ ||| ข้อกำหนดเหล่านี้อยู่ภายใต้กฎหมายของ [เขตอำนาจศาลของคุณ] โดยไม่คำนึงถึงหลักความขัดแย้งของกฎหมาย ผู้ใช้ EU/EEA/Swiss อาจมีการคุ้มครองเพิ่มเติมภายใต้กฎหมายท้องถิ่นซึ่งไม่สามารถยกเว้นได้ ||| ผู้ใช้ EU/EEA/Swiss สามารถเข้าถึงแพลตฟอร์มการระงับข้อพิพาทออนไลน์ของ EU: https://ec.europa.eu/consumers/odr/ ||| ผู้ใช้ในสหรัฐอเมริกาอาจแก้ไขข้อพิพาทผ่านการเจรจา การอนุญาโตตุลาการ (หากตกลง) หรือการดำเนินคดีของศาลในเขตอำนาจศาลของตน ||| เราอาจปรับปรุงข้อกำหนดเหล่านี้ เวอร์ชันที่แก้ไขจะถูกโพสต์ที่ URL นี้พร้อมวันที่มีผลบังคับใช้ใหม่","privacySupplement":"เราใช้คุกกี้และเทคโนโลยีที่คล้ายกันเพื่อดำเนินการเว็บไซต์ วิเคราะห์การใช้งาน และปรับแต่งเนื้อหาให้เป็นส่วนตัว ผู้เยี่ยมชมจาก EU/EEA/Swiss จะเห็นแบนเนอร์ยินยอมการใช้คุกกี้ คุณสามารถจัดการการตั้งค่าคุกกี้ได้ในการตั้งค่าเบราว์เซอร์ของคุณ ||| เราไม่จงใจรวบรวมข้อมูลส่วนบุคคลจากเด็กอายุต่ำกว่า 13 ปีในสหรัฐอเมริกาหรืออายุต่ำกว่า 16 ปีใน EU/EEA หากเราทราบว่าเราได้รวบรวมข้อมูลดังกล่าวแล้ว เราจะลบข้อมูลนั้น ||| เว็บไซต์ของเราอาจมีลิงก์ไปยังเว็บไซต์บุคคลที่สาม เราไม่รับผิดชอบต่อหลักปฏิบัติด้านความเป็นส่วนตัวของพวกเขา ||| เราอาจปรับปรุงนโยบายนี้ เวอร์ชันใหม่จะโพสต์ที่ URL นี้พร้อมวันที่มีผลแก้ไข"};
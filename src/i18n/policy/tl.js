@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Mga tuntunin","navPrivacy":"Pagkapribado","termsTitle":"Mga Tuntunin ng Serbisyo","privacyTitle":"Patakaran sa Privacy","updated":"Huling na-update: 24 Pebrero 2026","termsText":"Ang Mga Tuntunin ng Serbisyong ito (\"Mga Tuntunin\") ay namamahala sa iyong pag-access at paggamit ng mga serbisyong e-commerce na inaalok sa pamamagitan ng https://rhythmnexus.org (\"Website\") na pinamamahalaan ng Rhythm Nexus (\"kami\", \"kami\", o \"aming\"). Sa pamamagitan ng pag-access, pag-browse, o pagbili mula sa Website, sumasang-ayon ka na sumailalim sa Mga Tuntuning ito. Kung hindi ka sumasang-ayon, hindi mo maaaring gamitin ang Website o mag-order. ||| Ikaw ay dapat na hindi bababa sa 18 taong gulang o ang edad ng mayorya sa iyong hurisdiksyon upang bumili ng mga produkto mula sa Website na ito. Sa pamamagitan ng paglalagay ng order, kinakatawan at ginagarantiyahan mo na natutugunan mo ang kinakailangang ito. ||| Maaaring hilingin sa iyong lumikha ng isang account para makabili. Sumasang-ayon kang magbigay ng tumpak, kasalukuyan, at kumpletong impormasyon. Responsibilidad mong pangalagaan ang mga kredensyal ng iyong account. Dapat mong ipaalam kaagad sa amin ang anumang hindi awtorisadong paggamit. Maaari naming wakasan o suspindihin ang iyong account anumang oras para sa mga paglabag sa Mga Tuntuning ito. ||| Sinisikap naming ipakita ang impormasyon ng produkto nang tumpak, ngunit hindi namin ginagarantiyahan na ang mga paglalarawan ng produkto o iba pang nilalaman ay walang error. ||| Ang mga presyo ay ipinapakita sa United States Dollar (USD) at may kasamang mga naaangkop na buwis kung saan kinakailangan ng batas. Maaari naming baguhin ang mga presyo anumang oras bago ka mag-order. ||| Ang iyong order ay isang alok na bilhin. Nagaganap ang pagtanggap kapag kinumpirma namin ang iyong order sa pamamagitan ng email, o kapag ipinadala namin ang mga produkto, alinman ang mauna. Maaari naming tanggihan o kanselahin ang mga order para sa mga kadahilanang kabilang ang maling pagpepresyo, out-of-stock na mga produkto, o pinaghihinalaang panloloko. ||| Tinatanggap namin ang mga paraan ng pagbabayad na ipinapakita sa pag-checkout. Sa pamamagitan ng pagsusumite ng mga detalye ng pagbabayad, pinahihintulutan mo kaming singilin ang halagang dapat bayaran at kumpirmahin na ikaw ang nararapat na may-ari ng account. Gumagamit kami ng mga third-party na tagaproseso ng pagbabayad upang secure na pangasiwaan ang impormasyon sa pagbabayad. ||| Ang mga pagtatantya sa pagpapadala ay ibinigay para sa kaginhawahan at hindi ginagarantiyahan ang mga petsa ng paghahatid. Kapag nailipat na ang mga produkto sa isang carrier, ang panganib ng pagkawala ay ipapasa sa iyo. Responsable ka para sa mga tungkulin sa customs at mga buwis sa pag-import, at para sa mga error sa paghahatid na dulot ng maling impormasyon ng address. ||| Kung nakatira ka sa EU, EEA, o Switzerland, mayroon kang legal na karapatang magbalik ng mga produkto sa loob ng 14 na araw pagkatapos matanggap para sa buong refund. Dapat ibalik ang mga produkto sa orihinal na kondisyon. Ang pagpapadala sa pagbabalik ay maaaring nasa iyong halaga ayon sa pinapayagan ng batas. Maaaring hindi kasama ang mga digital na produkto kung magsisimula ang pag-download sa iyong pahintulot at kinikilala mo ang pagkawala ng karapatan sa pag-withdraw. ||| Ang pagiging karapat-dapat sa pagbabalik para sa mga customer sa US ay nakabalangkas sa aming hiwalay na Patakaran sa Pagbabalik at Pag-refund na naka-post sa Website. Ang ilang mga item (hal., mga digital na pag-download, mga personalized na item) ay maaaring hindi maibabalik. ||| Kung bibili ka ng mga digital na item, electronic ang delivery, bibigyan ka ng personal na hindi eksklusibong lisensya para gamitin ang content, at hindi ka maaaring muling ipamahagi, ibenta, o ibahagi ang mga download nang walang pahintulot. ||| Ang lahat ng nilalaman ng Website (teksto, disenyo, software, graphics, larawan) ay pagmamay-ari o lisensyado sa Rhythm Nexus at pinoprotektahan ng mga batas sa copyright at intelektwal na ari-arian. Hindi ka maaaring magparami, baguhin, ipamahagi, o lumikha ng mga hinangong gawa nang walang nakasulat na pahintulot.","privacyText":"Iginagalang ng Rhythm Nexus (\"kami\", \"kami\", o \"aming\") ang iyong privacy at nakatuon sa pagprotekta sa iyong personal na data. Ipinapaliwanag ng Patakaran sa Privacy na ito kung anong personal na data ang kinokolekta namin, kung paano ito ginagamit, kung kanino namin ito ibinabahagi, at ang iyong mga karapatan. Nalalapat ang patakarang ito sa mga user mula sa EU, EEA, Switzerland, at USA. ||| Kinokolekta namin ang personal na impormasyon na boluntaryo mong ibinibigay, kabilang ang pangalan, email address, billing at shipping address, numero ng telepono, at impormasyon sa pagbabayad na pinangangasiwaan ng mga third-party na processor. ||| Awtomatiko naming kinokolekta ang IP address, uri ng browser, data ng device, data ng paggamit, cookies, at mga teknolohiya sa pagsubaybay. ||| Kung ikaw ay nasa EU/EEA/Switzerland, pinoproseso namin ang iyong data batay sa pagganap ng kontrata (pagtupad sa order), legal na obligasyon, mga lehitimong interes, at pahintulot kung kinakailangan. ||| Ginagamit namin ang iyong data upang iproseso ang mga order, ipadala ang mga produkto, makipag-ugnayan sa iyo, magbigay ng suporta sa customer, sumunod sa mga legal na obligasyon, pahusayin ang aming Website, at magpadala ng mga komunikasyon sa marketing nang may pahintulot. ||| Maaari naming ibahagi ang iyong data sa mga tagaproseso ng pagbabayad, mga kasosyo sa pagpapadala, mga provider ng analytics, mga tagapagbigay ng serbisyo sa marketing, at mga legal na awtoridad kapag kinakailangan. Hindi kami nagbebenta ng personal na data. ||| Ang mga user ng EU/EEA/Swiss ay may mga karapatan sa GDPR na i-access ang personal na data, itama ang hindi tumpak na data, burahin ang data, paghigpitan ang pagpoproseso, tumutol sa pagproseso, data ng port, at bawiin ang pahintulot. Upang gamitin ang mga karapatang ito, makipag-ugnayan sa amin sa rhythmnexusco@gmail.com. ||| Ang mga user ng USA (CCPA/CPRA, kung saan naaangkop) ay maaaring may mga karapatan na malaman kung anong personal na data ang kinokolekta, humiling ng pagtanggal, mag-opt out sa pagbabahagi ng data, at walang diskriminasyon para sa paggamit ng mga karapatan. Para magsumite ng mga kahilingan, mag-email sa rhythmnexusco@gmail.com. ||| Pinapanatili namin ang personal na data hangga't kinakailangan upang matupad ang mga order, sumunod sa mga legal na kinakailangan, at malutas ang mga hindi pagkakaunawaan. ||| Maaari kaming maglipat ng data sa labas ng iyong rehiyon. Kapag naglilipat mula sa EU/EEA/Switzerland, gumagamit kami ng Standard Contractual Clauses (SCCs) at iba pang mga legal na pananggalang. ||| Nagpapatupad kami ng mga makatwirang teknikal at pang-organisasyong pag-iingat kabilang ang pag-encrypt ng SSL, mga secure na sistema ng pagbabayad, at mga hakbang sa pagkontrol sa pag-access. Gayunpaman, walang sistema ang 100% na ligtas.","termsSupplement":"Sa pinakamataas na lawak na pinahihintulutan ng naaangkop na batas, hindi kami mananagot para sa hindi direkta, hindi sinasadya, o kinahinatnang mga pinsala, pagkawala ng data, pagkawala ng kita, o pagkagambala sa negosyo. Ang aming kabuuang pananagutan ay hindi lalampas sa halagang binayaran mo para sa (mga) produktong binili. Para sa mga consumer sa EU/EEA/Switzerland, hindi naaapektuhan ang mga mandatoryong karapatan ayon sa batas. ||| Ang Mga Tuntuning ito ay pinamamahalaan ng mga batas ng [Iyong Hurisdiksiyon] nang walang pagsasaalang-alang sa salungatan ng mga prinsipyo ng batas. Ang mga user ng EU/EEA/Swiss ay maaaring magkaroon ng mga karagdagang proteksyon sa ilalim ng lokal na batas na hindi maaaring iwaksi. ||| Maaaring i-access ng mga user ng EU/EEA/Swiss ang platform ng EU Online Dispute Resolution: https://ec.europa.eu/consumers/odr/ ||| Maaaring lutasin ng mga user ng USA ang mga hindi pagkakaunawaan sa pamamagitan ng negosasyon, arbitrasyon (kung napagkasunduan), o aksyon ng hukuman sa kanilang nasasakupan. ||| Maaari naming i-update ang Mga Tuntuning ito. Ang binagong bersyon ay ipo-post sa URL na ito na may bagong petsa ng bisa.","privacySupplement":"Gumagamit kami ng cookies at mga katulad na teknolohiya upang patakbuhin ang Website, pag-aralan ang paggamit, at i-personalize ang nilalaman. Ang mga bisita sa EU/EEA/Swiss ay ipapakita sa isang cookie consent banner. Maaari mong pamahalaan ang mga kagustuhan sa cookie sa mga setting ng iyong browser. ||| Hindi namin sinasadyang nangongolekta ng personal na data mula sa mga batang wala pang 13 taong gulang sa USA o wala pang 16 taong gulang sa EU/EEA. Kung malaman namin na nakolekta namin ang naturang data, tatanggalin namin ito. ||| Ang aming Website ay maaaring maglaman ng mga link sa mga third-party na site. Hindi kami mananagot para sa kanilang mga kasanayan sa privacy. ||| Maaari naming i-update ang patakarang ito. Ang bagong bersyon ay ipo-post sa URL na ito na may binagong epektibong petsa."};
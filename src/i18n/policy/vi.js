@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"Điều khoản","navPrivacy":"Sự riêng tư","termsTitle":"Điều khoản dịch vụ","privacyTitle":"Chính sách bảo mật","updated":"Cập nhật lần cuối: ngày 24 tháng 2 năm 2026","termsText":"Các Điều khoản dịch vụ này (\"Điều khoản\") chi phối việc bạn truy cập và sử dụng các dịch vụ thương mại điện tử được cung cấp thông qua https://beatnexus.org (\"Trang web\") do Rhythm Nexus (\"chúng tôi\" hoặc \"của chúng tôi\"). Bằng cách truy cập, duyệt hoặc mua từ Trang web, bạn đồng ý bị ràng buộc bởi các Điều khoản này. Nếu bạn không đồng ý, bạn không được sử dụng Trang web hoặc đặt hàng. ||| Bạn phải ít nhất 18 tuổi hoặc độ tuổi trưởng thành trong khu vực pháp lý của bạn để mua sản phẩm từ Trang web này. Bằng cách đặt hàng, bạn tuyên bố và đảm bảo rằng bạn đáp ứng yêu cầu này. ||| Bạn có thể được yêu cầu tạo một tài khoản để mua hàng. Bạn đồng ý cung cấp thông tin chính xác, cập nhật và đầy đủ. Bạn có trách nhiệm bảo vệ thông tin đăng nhập tài khoản của mình. Bạn phải thông báo ngay cho chúng tôi về bất kỳ việc sử dụng trái phép nào. Chúng tôi có thể chấm dứt hoặc đình chỉ tài khoản của bạn bất kỳ lúc nào do vi phạm các Điều khoản này. ||| Chúng tôi cố gắng hiển thị thông tin sản phẩm một cách chính xác nhưng chúng tôi không đảm bảo rằng mô tả sản phẩm hoặc nội dung khác không có lỗi. ||| Giá được hiển thị bằng Đô la Mỹ (USD) và bao gồm các loại thuế hiện hành theo yêu cầu của pháp luật. Chúng tôi có thể thay đổi giá bất cứ lúc nào trước khi bạn đặt hàng. ||| Đơn đặt hàng của bạn là một lời đề nghị mua hàng. Việc chấp nhận xảy ra khi chúng tôi xác nhận đơn đặt hàng của bạn qua email hoặc khi chúng tôi vận chuyển sản phẩm, tùy điều kiện nào xảy ra trước. Chúng tôi có thể từ chối hoặc hủy đơn đặt hàng vì các lý do bao gồm định giá không chính xác, hết sản phẩm hoặc nghi ngờ có gian lận. ||| Chúng tôi chấp nhận các phương thức thanh toán được hiển thị trong quá trình thanh toán. Bằng cách gửi chi tiết thanh toán, bạn ủy quyền cho chúng tôi tính số tiền đến hạn và xác nhận bạn là chủ tài khoản hợp pháp. Chúng tôi sử dụng bộ xử lý thanh toán của bên thứ ba để xử lý thông tin thanh toán một cách an toàn. ||| Ước tính vận chuyển được cung cấp để thuận tiện và không đảm bảo ngày giao hàng. Sau khi sản phẩm được chuyển cho nhà vận chuyển, nguy cơ mất mát sẽ chuyển sang bạn. Bạn chịu trách nhiệm về thuế hải quan và thuế nhập khẩu cũng như các lỗi giao hàng do thông tin địa chỉ không chính xác. ||| Nếu bạn cư trú tại EU, EEA hoặc Thụy Sĩ, bạn có quyền hợp pháp trả lại sản phẩm trong vòng 14 ngày kể từ ngày nhận để được hoàn lại tiền đầy đủ. Sản phẩm phải được trả lại trong tình trạng ban đầu. Bạn có thể phải trả chi phí vận chuyển trả lại theo quy định của pháp luật. Các sản phẩm kỹ thuật số có thể bị loại trừ nếu quá trình tải xuống bắt đầu với sự đồng ý của bạn và bạn thừa nhận mất quyền rút lui. ||| Khả năng đủ điều kiện hoàn trả đối với khách hàng Hoa Kỳ được nêu trong Chính sách hoàn trả và hoàn tiền riêng của chúng tôi được đăng trên Trang web. Một số mặt hàng (ví dụ: tải xuống kỹ thuật số, mặt hàng được cá nhân hóa) có thể không được hoàn lại. ||| Nếu bạn mua các mặt hàng kỹ thuật số, việc phân phối được thực hiện dưới hình thức điện tử, bạn sẽ được cấp giấy phép cá nhân không độc quyền để sử dụng nội dung và bạn không được phân phối lại, bán lại hoặc chia sẻ các nội dung tải xuống mà không được phép. ||| Tất cả nội dung Trang web (văn bản, thiết kế, phần mềm, đồ họa, hình ảnh) đều thuộc sở hữu hoặc được cấp phép cho Rhythm Nexus và được bảo vệ bởi luật bản quyền và sở hữu trí tuệ. Bạn không được sao chép, sửa đổi, phân phối hoặc tạo tác phẩm phái sinh mà không có sự cho phép bằng văn bản.","privacyText":"Rhythm Nexus (\"chúng tôi\", \"của chúng tôi\" hoặc \"của chúng tôi\") tôn trọng quyền riêng tư của bạn và cam kết bảo vệ dữ liệu cá nhân của bạn. Chính sách quyền riêng tư này giải thích dữ liệu cá nhân nào chúng tôi thu thập, cách sử dụng, chúng tôi chia sẻ dữ liệu đó với ai và quyền của bạn. Chính sách này áp dụng cho người dùng từ EU, EEA, Thụy Sĩ và Hoa Kỳ. ||| Chúng tôi thu thập thông tin cá nhân mà bạn tự nguyện cung cấp, bao gồm tên, địa chỉ email, địa chỉ thanh toán và giao hàng, số điện thoại và thông tin thanh toán do bên xử lý bên thứ ba xử lý. ||| Chúng tôi tự động thu thập địa chỉ IP, loại trình duyệt, dữ liệu thiết bị, dữ liệu sử dụng, cookie và công nghệ theo dõi. ||| Nếu bạn ở EU/EEA/Thụy Sĩ, chúng tôi xử lý dữ liệu của bạn dựa trên việc thực hiện hợp đồng (thực hiện đơn hàng), nghĩa vụ pháp lý, lợi ích hợp pháp và sự đồng ý khi cần thiết. ||| Chúng tôi sử dụng dữ liệu của bạn để xử lý đơn đặt hàng, vận chuyển sản phẩm, liên lạc với bạn, cung cấp hỗ trợ khách hàng, tuân thủ nghĩa vụ pháp lý, cải thiện Trang web của chúng tôi và gửi thông tin tiếp thị với sự đồng ý. ||| Chúng tôi có thể chia sẻ dữ liệu của bạn với bộ xử lý thanh toán, đối tác vận chuyển, nhà cung cấp phân tích, nhà cung cấp dịch vụ tiếp thị và cơ quan pháp luật khi được yêu cầu. Chúng tôi không bán dữ liệu cá nhân. ||| Người dùng EU/EEA/Thụy Sĩ có quyền GDPR để truy cập dữ liệu cá nhân, sửa dữ liệu không chính xác, xóa dữ liệu, hạn chế xử lý, phản đối việc xử lý, chuyển dữ liệu và rút lại sự đồng ý. Để thực hiện các quyền này, hãy liên hệ với chúng tôi theo địa chỉ beatnexusco@gmail.com. ||| Người dùng Hoa Kỳ (CCPA/CPRA, nếu có) có thể có quyền biết dữ liệu cá nhân nào được thu thập, yêu cầu xóa, từ chối chia sẻ dữ liệu và không phân biệt đối xử khi thực hiện các quyền. Để gửi yêu cầu, hãy gửi email theo nhịp điệunexusco@gmail.com. ||| Chúng tôi lưu giữ dữ liệu cá nhân trong khoảng thời gian cần thiết để thực hiện đơn đặt hàng, tuân thủ các yêu cầu pháp lý và giải quyết tranh chấp. ||| Chúng tôi có thể chuyển dữ liệu ra ngoài khu vực của bạn. Khi chuyển từ EU/EEA/Thụy Sĩ, chúng tôi sử dụng Điều khoản hợp đồng tiêu chuẩn (SCC) và các biện pháp bảo vệ hợp pháp khác. ||| Chúng tôi thực hiện các biện pháp bảo vệ kỹ thuật và tổ chức hợp lý bao gồm mã hóa SSL, hệ thống thanh toán an toàn và các biện pháp kiểm soát truy cập. Tuy nhiên, không có hệ thống nào an toàn 100%.","termsSupplement":"Trong phạm vi tối đa được pháp luật hiện hành cho phép, chúng tôi không chịu trách nhiệm về các thiệt hại gián tiếp, ngẫu nhiên hoặc do hậu quả, mất dữ liệu, mất lợi nhuận hoặc gián đoạn kinh doanh. Tổng trách nhiệm pháp lý của chúng tôi sẽ không vượt quá số tiền bạn đã trả cho (các) sản phẩm đã mua. Đối với người tiêu dùng ở EU/EEA/Thụy Sĩ, các quyền theo luật định bắt buộc không bị ảnh hưởng. ||| Các Điều khoản này được điều chỉnh bởi luật pháp của [Khu vực tài phán của bạn] mà không tính đến xung đột với các nguyên tắc luật pháp. Người dùng ở EU/EEA/Thụy Sĩ có thể được hưởng các biện pháp bảo vệ bổ sung theo luật địa phương và không thể được miễn trừ. ||| Người dùng EU/EEA/Thụy Sĩ có thể truy cập nền tảng Giải quyết tranh chấp trực tuyến của EU: https://ec.europa.eu/consumers/odr/ ||| Người dùng Hoa Kỳ có thể giải quyết tranh chấp thông qua thương lượng, trọng tài (nếu đồng ý) hoặc kiện ra tòa trong khu vực pháp lý của họ. ||| Chúng tôi có thể cập nhật các Điều khoản này. Phiên bản sửa đổi sẽ được đăng tại URL này với ngày có hiệu lực mới.","privacySupplement":"Chúng tôi sử dụng cookie và các công nghệ tương tự để vận hành Trang web, phân tích việc sử dụng và cá nhân hóa nội dung. Khách truy cập EU/EEA/Thụy Sĩ sẽ được hiển thị biểu ngữ chấp thuận cookie. Bạn có thể quản lý tùy chọn cookie trong cài đặt trình duyệt của mình. ||| Chúng tôi không cố ý thu thập dữ liệu cá nhân từ trẻ em dưới 13 tuổi ở Hoa Kỳ hoặc dưới 16 tuổi ở EU/EEA. Nếu chúng tôi biết rằng chúng tôi đã thu thập dữ liệu đó, chúng tôi sẽ xóa dữ liệu đó. ||| Trang web của chúng tôi có thể chứa các liên kết đến các trang web của bên thứ ba. Chúng tôi không chịu trách nhiệm về thực tiễn bảo mật của họ. ||| Chúng tôi có thể cập nhật chính sách này. Phiên bản mới sẽ được đăng tại URL này với ngày hiệu lực được sửa đổi."};
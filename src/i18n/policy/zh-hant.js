@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"條款","navPrivacy":"隱私","termsTitle":"服務條款","privacyTitle":"隱私權政策","updated":"最後更新日期：2026 年 2 月 24 日","termsText":"本服務條款（「條款」）管轄您對由 Rhythm Nexus（「我們」或「我們的」）所經營的 https://rhythmnexus.org（「網站」）提供的電子商務服務的存取和使用。透過造訪、瀏覽或從本網站購買，您同意受這些條款的約束。如果您不同意，您不得使用本網站或下訂單。 ||| 您必須年滿 18 歲或您所在司法管轄區的法定成年年齡才能從本網站購買產品。透過下訂單，您聲明並保證您滿足此要求。 ||| 您可能會被要求建立帳戶才能進行購買。您同意提供準確、最新且完整的資訊。您有責任保護您的帳戶憑證。如果有任何未經授權的使用，您必須立即通知我們。如果您違反這些條款，我們可以隨時終止或暫停您的帳戶。 ||| 我們努力準確地顯示產品訊息，但我們不保證產品描述或其他內容沒有錯誤。 ||| 價格以美元 (USD) 顯示，並包含法律要求的適用稅費。在您下訂單之前，我們可能隨時更改價格。 ||| 您的訂單是購買要約。當我們透過電子郵件確認您的訂單或我們出貨時（以先發生者為準），即表示接受。我們可能會因定價不正確、產品缺貨或涉嫌詐欺等原因而拒絕或取消訂單。 ||| 我們接受結帳時顯示的付款方式。透過提交付款詳細信息，您授權我們收取應付金額並確認您是合法的帳戶持有人。我們使用第三方支付處理器來安全地處理支付資訊。 ||| 提供運費預估是為了方便起見，並不保證交貨日期。一旦產品轉移到承運商，損失風險就會轉移給您。您負責繳納關稅和進口稅，以及因地址資訊不正確而導致的遞送錯誤。 ||| 如果您居住在歐盟、歐洲經濟區或瑞士，您有合法權利在收到產品後 14 天內退貨並獲得全額退款。產品必須以原始狀態退回。根據法律允許，退貨運費可能由您承擔。如果在您同意的情況下開始下載並且您承認失去撤回權，則數位產品可能會被排除在外。 ||| 我們網站上發布的單獨退貨和退款政策概述了美國客戶的退貨資格。某些商品（例如數位下載、個人化商品）可能無法退款。 ||| 如果您購買數位商品，則以電子方式交付，您將被授予使用該內容的個人非獨佔許可，並且未經許可您不得重新散佈、轉售或分享下載。 ||| 所有網站內容（文字、設計、軟體、圖形、圖像）均為 Rhythm Nexus 所有或授權給 Rhythm Nexus，並受版權和智慧財產權法保護。未經書面許可，您不得複製、修改、散佈或創作衍生作品。","privacyText":"Rhythm Nexus（「我們」或「我們的」）尊重您的隱私並致力於保護您的個人資料。本隱私權政策解釋了我們收集哪些個人資料、如何使用這些資料、我們與誰分享這些資料以及您的權利。本政策適用於來自歐盟、歐洲經濟區、瑞士和美國的使用者。 ||| 我們收集您自願提供的個人信息，包括姓名、電子郵件地址、帳單和送貨地址、電話號碼以及由第三方處理商處理的付款資訊。 ||| 我們自動收集 IP 位址、瀏覽器類型、裝置資料、使用資料、cookie 和追蹤技術。 ||| 如果您位於歐盟/歐洲經濟區/瑞士，我們將根據合約履行（訂單履行）、法律義務、合法利益以及必要時的同意來處理您的資料。 ||| 我們使用您的資料來處理訂單、運送產品、與您溝通、提供客戶支援、遵守法律義務、改進我們的網站以及在您同意的徵得中發送行銷訊息。 ||| 必要時，我們可能會與支付處理商、運輸合作夥伴、分析提供者、行銷服務提供者和法律機構分享您的資料。我們不出售個人資料。 ||| 歐盟/歐洲經濟區/瑞士用戶擁有 GDPR 權利來存取個人資料、更正不準確的資料、刪除資料、限制處理、反對處理、移植資料和撤回同意。要行使這些權利，請透過節奏nexusco@gmail.com聯絡我們。 ||| 美國用戶（CCPA/CPRA，如適用）可能有權了解收集了哪些個人資料、請求刪除、選擇退出資料共享以及在行使權利時不受歧視。若要提交請求，請發送電子郵件至 Rhythnexusco@gmail.com。 ||| 我們會根據履行訂單、遵守法律要求和解決爭議的需要保留個人資料。 ||| 我們可能會將資料傳輸到您所在地區之外。從歐盟/歐洲經濟區/瑞士轉移時，我們使用標準合約條款 (SCC) 和其他合法保障措施。 ||| 我們實施合理的技術和組織保障措施，包括 SSL 加密、安全支付系統和存取控制措施。然而，沒有一個系統是 100% 安全的。","termsSupplement":"在適用法律允許的最大範圍內，我們對間接、偶發或後果性損害、資料遺失、利潤損失或業務中斷不承擔責任。我們的總責任不得超過您購買產品所支付的金額。對於歐盟/歐洲經濟區/瑞士的消費者來說，強制性法定權利不受影響。 ||| 這些條款受[您的司法管轄區]的法律管轄，不考慮法律衝突原則。根據當地法律，歐盟/歐洲經濟區/瑞士用戶可能享有無法豁免的額外保護。 ||| 歐盟/歐洲經濟區/瑞士用戶可以訪問歐盟線上爭議解決平台：https://ec.europa.eu/consumers/odr/ ||| 美國用戶可以透過談判、仲裁（如果同意）或在其管轄範圍內的法院訴訟來解決爭議。 ||| 我們可能會更新這些條款。修訂後的版本將在此 URL 上發布，並具有新的生效日期。","privacySupplement":"我們使用 cookie 和類似技術來經營網站、分析使用情況和個人化內容。歐盟/歐洲經濟區/瑞士訪客將看到 cookie 同意橫幅。您可以在瀏覽器設定中管理 cookie 首選項。 ||| 我們不會故意收集美國 13 歲以下兒童或歐盟/歐洲經濟區 16 歲以下兒童的個人資料。如果我們得知我們收集了此類數據，我們將刪除它。 ||| 我們的網站可能包含第三方網站的連結。我們不對他們的隱私做法負責。 ||| 我們可能會更新此政策。新版本將在此 URL 上發布，並更改生效日期。"};
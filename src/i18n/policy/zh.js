@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/policy/*.json. Do not edit by hand.
+export default {"navTerms":"条款","navPrivacy":"隐私","termsTitle":"服务条款","privacyTitle":"隐私政策","updated":"最后更新日期：2026 年 2 月 24 日","termsText":"这些服务条款（“条款”）管辖您对由 Rhythm Nexus（“我们”或“我们的”）运营的 https://rhythmnexus.org（“网站”）提供的电子商务服务的访问和使用。通过访问、浏览或从本网站购买，您同意受这些条款的约束。如果您不同意，您不得使用本网站或下订单。 ||| 您必须年满 18 岁或您所在司法管辖区的法定成年年龄才能从本网站购买产品。通过下订单，您声明并保证您满足此要求。 ||| 您可能会被要求创建一个帐户才能进行购买。您同意提供准确、最新且完整的信息。您有责任保护您的帐户凭据。如果有任何未经授权的使用，您必须立即通知我们。如果您违反这些条款，我们可以随时终止或暂停您的帐户。 ||| 我们努力准确地显示产品信息，但我们不保证产品描述或其他内容没有错误。 ||| 价格以美元 (USD) 显示，并包含法律要求的适用税费。在您下订单之前，我们可能随时更改价格。 ||| 您的订单是购买要约。当我们通过电子邮件确认您的订单或我们发货时（以先发生者为准），即表示接受。我们可能会因定价不正确、产品缺货或涉嫌欺诈等原因拒绝或取消订单。 ||| 我们接受结账时显示的付款方式。通过提交付款详细信息，您授权我们收取应付金额并确认您是合法的帐户持有人。我们使用第三方支付处理器来安全地处理支付信息。 ||| 提供运费预估是为了方便起见，并不保证交货日期。一旦产品转移到承运商，损失风险就转移给您。您负责缴纳关税和进口税，以及因地址信息不正确而导致的递送错误。 ||| 如果您居住在欧盟、欧洲经济区或瑞士，您有合法权利在收到产品后 14 天内退货并获得全额退款。产品必须以原始状态退回。根据法律允许，退货运费可能由您承担。如果在您同意的情况下开始下载并且您承认失去撤回权，则数字产品可能会被排除在外。 ||| 我们网站上发布的单独退货和退款政策概述了美国客户的退货资格。某些商品（例如数字下载、个性化商品）可能不可退款。 ||| 如果您购买数字商品，则以电子方式交付，您将被授予使用该内容的个人非独占许可，并且未经许可您不得重新分发、转售或共享下载。 ||| 所有网站内容（文本、设计、软件、图形、图像）均归 Rhythm Nexus 所有或授权给 Rhythm Nexus，并受版权和知识产权法保护。未经书面许可，您不得复制、修改、分发或创建衍生作品。","privacyText":"Rhythm Nexus（“我们”或“我们的”）尊重您的隐私并致力于保护您的个人数据。本隐私政策解释了我们收集哪些个人数据、如何使用这些数据、我们与谁共享这些数据以及您的权利。本政策适用于来自欧盟、欧洲经济区、瑞士和美国的用户。 ||| 我们收集您自愿提供的个人信息，包括姓名、电子邮件地址、账单和送货地址、电话号码以及由第三方处理商处理的付款信息。 ||| 我们自动收集 IP 地址、浏览器类型、设备数据、使用数据、cookie 和跟踪技术。 ||| 如果您位于欧盟/欧洲经济区/瑞士，我们将根据合同履行（订单履行）、法律义务、合法利益以及必要时的同意来处理您的数据。 ||| 我们使用您的数据来处理订单、运送产品、与您沟通、提供客户支持、遵守法律义务、改进我们的网站以及在征得您同意的情况下发送营销信息。 ||| 必要时，我们可能会与支付处理商、运输合作伙伴、分析提供商、营销服务提供商和法律机构共享您的数据。我们不出售个人数据。 ||| 欧盟/欧洲经济区/瑞士用户拥有 GDPR 权利来访问个人数据、更正不准确的数据、删除数据、限制处理、反对处理、移植数据和撤回同意。要行使这些权利，请通过节奏nexusco@gmail.com联系我们。 ||| 美国用户（CCPA/CPRA，如适用）可能有权了解收集了哪些个人数据、请求删除、选择退出数据共享以及在行使权利时不受歧视。要提交请求，请发送电子邮件至 Rhythnexusco@gmail.com。 ||| 我们会根据履行订单、遵守法律要求和解决争议的需要保留个人数据。 ||| 我们可能会将数据传输到您所在地区之外。从欧盟/欧洲经济区/瑞士转移时，我们使用标准合同条款 (SCC) 和其他合法保障措施。 ||| 我们实施合理的技术和组织保障措施，包括 SSL 加密、安全支付系统和访问控制措施。然而，没有一个系统是 100% 安全的。","termsSupplement":"在适用法律允许的最大范围内，我们对间接、偶然或后果性损害、数据丢失、利润损失或业务中断不承担责任。我们的总责任不得超过您购买产品所支付的金额。对于欧盟/欧洲经济区/瑞士的消费者来说，强制性法定权利不受影响。 ||| 这些条款受[您的司法管辖区]的法律管辖，不考虑法律冲突原则。根据当地法律，欧盟/欧洲经济区/瑞士用户可能享有无法豁免的额外保护。 ||| 欧盟/欧洲经济区/瑞士用户可以访问欧盟在线争议解决平台：https://ec.europa.eu/consumers/odr/ ||| 美国用户可以通过谈判、仲裁（如果同意）或在其管辖范围内的法院诉讼来解决争议。 ||| 我们可能会更新这些条款。修订后的版本将在此 URL 上发布，并具有新的生效日期。","privacySupplement":"我们使用 cookie 和类似技术来运营网站、分析使用情况和个性化内容。欧盟/欧洲经济区/瑞士访客将看到 cookie 同意横幅。您可以在浏览器设置中管理 cookie 首选项。 ||| 我们不会故意收集美国 13 岁以下儿童或欧盟/欧洲经济区 16 岁以下儿童的个人数据。如果我们得知我们收集了此类数据，我们将删除它。 ||| 我们的网站可能包含第三方网站的链接。我们不对他们的隐私做法负责。 ||| 我们可能会更新此政策。新版本将在此 URL 上发布，并更改生效日期。"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Související sazby","postalCourierLocal":"Poštovní a kurýrní sazby (místní)","service":"Služba","notes":"Poznámky","zone":"Zóna","countryRegion":"Země / Region","country":"Země","countryFullName":"Země (celý název)","weight":"Hmotnost","region":"Region","currentPrice":"Aktuální cena","noSurcharge":"Bez příplatku","handlingFeeSurcharge":"Příplatek za manipulaci (platí pouze pro ePAC)","currentSurchargeRates":"Aktuální sazby příplatku (platí pouze pro ePAC)","epacRates2026":"Mezinárodní poštovní sazby SingPost ePAC 2026","emsRates2026":"Sazby SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Sazby SpeedPost International Express","trackedPrepaidLabel":"Předplacený sledovaný štítek SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Odesláno přes SpeedPost Standard) - Doručení ke dveřím (1-3 pracovní dny)","southeastAsia":"Jihovýchodní Asie","europe":"Evropa","includes":"vč.","except":"kromě","asiaPacific":"Asie a Tichomoří","epacSaturdayGlobal":"ePAC bude nyní odesílán také v sobotu do zbytku světa.","etsyZoneLNoEmsSaturday":"Poznámka: Ceny na Etsy budou pevně nastaveny na zónu L. Kontaktujte nás prosím pro cenovou nabídku přes zprávy na Etsy. EMS se v sobotu neodesílá, protože doprava je příliš drahá.","spxPoBoxNotice":"Důležité: Tuto službu nelze odeslat na PO Box ani APO/FPO adresy. Doručení poslední míle zajišťuje DHL a sledování poslední míle je dostupné na tomto webu.","spxUsaDduNote":"Poznámka USA: Zásilky do USA jsou ve výchozím stavu DDU (Delivery Duty Unpaid); cla a daně hradí příjemce celnímu úřadu.","spxEtsyZone4Note":"Poznámka Etsy: Ceny na Etsy jsou pevně nastaveny na zónu 4. Pro cenovou nabídku nás kontaktujte přes zprávy na Etsy.","spxNoSaturdayNote":"Tato služba se v sobotu nepodává, protože náklady na dopravu jsou příliš vysoké."};
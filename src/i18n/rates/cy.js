@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Cyfraddau cysylltiedig","postalCourierLocal":"Cyfraddau Post a Chourier (Lleol)","service":"Gwasanaeth","notes":"Nodiadau","zone":"Parth","countryRegion":"Gwlad / Rhanbarth","country":"Gwlad","countryFullName":"Gwlad (enw llawn)","weight":"Pwysau","region":"Rhanbarth","currentPrice":"Pris cyfredol","noSurcharge":"Dim gordal","handlingFeeSurcharge":"Gordal ffi trin (yn berthnasol i ePAC yn unig)","currentSurchargeRates":"Cyfraddau gordal cyfredol (yn berthnasol i ePAC yn unig)","epacRates2026":"Cyfraddau Post Rhyngwladol SingPost ePAC 2026","emsRates2026":"Cyfraddau SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Cyfraddau SpeedPost International Express","trackedPrepaidLabel":"Label Rhagdaledig wedi’i Olrhain SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Wedi’i anfon trwy SpeedPost Standard) - Dosbarthu i’r drws (1-3 diwrnod busnes)","southeastAsia":"De-ddwyrain Asia","europe":"Ewrop","includes":"gan gynnwys","except":"heblaw","asiaPacific":"Asia a’r Môr Tawel","epacSaturdayGlobal":"Bydd ePAC nawr hefyd yn cael ei bostio ar ddydd Sadwrn ar gyfer gweddill y byd.","etsyZoneLNoEmsSaturday":"Nodyn: Bydd prisiau ar Etsy yn sefydlog i Barth L. Cysylltwch â ni am ddyfynbris drwy negeseuon Etsy. Nid oes postio EMS ar ddydd Sadwrn gan fod y cludo yn rhy gostus.","spxPoBoxNotice":"Pwysig: Ni ellir anfon y gwasanaeth hwn i gyfeiriadau PO Box nac APO/FPO. Mae danfon y filltir olaf yn cael ei drin gan DHL, ac mae olrhain y filltir olaf ar gael ar y wefan hon.","spxUsaDduNote":"Nodyn UDA: Mae cludo i’r Unol Daleithiau yn DDU (Delivery Duty Unpaid) yn ddiofyn; telir tollau a threthi gan y derbynnydd i’r tollau.","spxEtsyZone4Note":"Nodyn Etsy: Mae prisiau ar Etsy yn sefydlog i Barth 4. Cysylltwch â ni drwy negeseuon Etsy am ddyfynbris.","spxNoSaturdayNote":"Nid yw’r gwasanaeth hwn yn cael ei bostio ar ddydd Sadwrn gan fod cost cludo yn rhy uchel."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Verwandte Tarife","postalCourierLocal":"Post- & Kuriergebühren (lokal)","service":"Dienst","notes":"Hinweise","zone":"Zone","countryRegion":"Land / Region","country":"Land","countryFullName":"Land (vollständiger Name)","weight":"Gewicht","region":"Region","currentPrice":"Aktueller Preis","noSurcharge":"Kein Zuschlag","handlingFeeSurcharge":"Bearbeitungszuschlag (gilt nur für ePAC)","currentSurchargeRates":"Aktuelle Zuschlagssätze (gilt nur für ePAC)","epacRates2026":"SingPost ePAC Internationale Posttarife 2026","emsRates2026":"SpeedPost International Priority (EMS) Tarife 2026","speedpostExpressRates":"SpeedPost Internationale Express-Tarife","trackedPrepaidLabel":"SingPost verfolgtes Prepaid-Etikett","doorstepDeliveryStd":"0,00 - 5,00kg (Versand per SpeedPost Standard) - Zustellung an die Haustür (1-3 Werktage)","southeastAsia":"Südostasien","europe":"Europa","includes":"inkl.","except":"außer","asiaPacific":"Asien-Pazifik","epacSaturdayGlobal":"ePAC wird nun auch samstags für den Rest der Welt versendet.","etsyZoneLNoEmsSaturday":"Hinweis: Preise auf Etsy sind auf Zone L festgelegt. Bitte kontaktieren Sie uns freundlich für ein Angebot über Etsy-Nachrichten. EMS wird samstags nicht versendet, da der Versand zu teuer ist.","spxPoBoxNotice":"Wichtig: Dieser Service kann nicht an PO-Box- oder APO/FPO-Adressen versendet werden. Die letzte Meile wird von DHL zugestellt, und die Sendungsverfolgung der letzten Meile ist auf dieser Website verfügbar.","spxUsaDduNote":"Hinweis USA: Sendungen in die USA sind standardmäßig DDU (Delivery Duty Unpaid); Zölle und Steuern werden vom Empfänger an den Zoll gezahlt.","spxEtsyZone4Note":"Hinweis Etsy: Preise auf Etsy sind auf Zone 4 festgelegt. Bitte kontaktieren Sie uns für ein Angebot über Etsy-Nachrichten.","spxNoSaturdayNote":"Dieser Service wird samstags nicht aufgegeben, da die Versandkosten zu hoch sind."};
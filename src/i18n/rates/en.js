@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Related rates","postalCourierLocal":"Postal & Courier Rates (Local)","service":"Service","notes":"Notes","zone":"Zone","countryRegion":"Country / Region","country":"Country","countryFullName":"Country (Full Name)","weight":"Weight","region":"Region","currentPrice":"Current Price","noSurcharge":"No Surcharge","handlingFeeSurcharge":"Handling Fee Surcharge (applies to ePAC ONLY)","currentSurchargeRates":"Current Surcharge Rates (applies to ePAC only)","epacRates2026":"SingPost ePAC International Postal Rates 2026","emsRates2026":"SpeedPost International Priority (EMS) Rates 2026","speedpostExpressRates":"SpeedPost International Express Rates","trackedPrepaidLabel":"SingPost Tracked Prepaid Label","doorstepDeliveryStd":"0.00 - 5.00kg (Shipped via SpeedPost Standard) - Doorstep Delivery (1-3 business days)","southeastAsia":"Southeast Asia","europe":"Europe","includes":"incl.","except":"except","asiaPacific":"Asia Pacific","epacSaturdayGlobal":"ePAC will also now be posted on Saturdays for the rest of the world.","etsyZoneLNoEmsSaturday":"Note: Prices on Etsy will be fixed to Zone L. Please kindly contact us for a quote through Etsy messages. No posting for EMS on Saturdays as shipping is too costly.","spxPoBoxNotice":"Important: This service cannot be shipped to PO Box or APO/FPO addresses. Last-mile delivery is handled by DHL, and last-mile tracking is available on this website.","spxUsaDduNote":"USA note: Shipments to the United States are DDU (Delivery Duty Unpaid) by default; duties and taxes are paid by the recipient to customs.","spxEtsyZone4Note":"Etsy note: Prices on Etsy are fixed to Zone 4. Please contact us through Etsy messages for a quote.","spxNoSaturdayNote":"This service is not posted on Saturdays because shipping costs are too high."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Tarifas relacionadas","postalCourierLocal":"Tarifas postales y de mensajería (local)","service":"Servicio","notes":"Notas","zone":"Zona","countryRegion":"País / Región","country":"País","countryFullName":"País (nombre completo)","weight":"Peso","region":"Región","currentPrice":"Precio actual","noSurcharge":"Sin recargo","handlingFeeSurcharge":"Recargo por gestión (se aplica solo a ePAC)","currentSurchargeRates":"Tarifas de recargo actuales (se aplica solo a ePAC)","epacRates2026":"Tarifas postales internacionales SingPost ePAC 2026","emsRates2026":"Tarifas SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Tarifas SpeedPost International Express","trackedPrepaidLabel":"Etiqueta prepagada con seguimiento de SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Enviado por SpeedPost Standard) - Entrega a domicilio (1-3 días hábiles)","southeastAsia":"Sudeste Asiático","europe":"Europa","includes":"incl.","except":"excepto","asiaPacific":"Asia Pacífico","epacSaturdayGlobal":"ePAC ahora también se enviará los sábados para el resto del mundo.","etsyZoneLNoEmsSaturday":"Nota: Los precios en Etsy estarán fijados en la Zona L. Por favor contáctanos para una cotización por mensajes de Etsy. No hay envíos EMS los sábados porque el envío es demasiado costoso.","spxPoBoxNotice":"Importante: Este servicio no puede enviarse a direcciones PO Box ni APO/FPO. La última milla la gestiona DHL y el seguimiento de última milla está disponible en este sitio web.","spxUsaDduNote":"Nota para EE. UU.: Los envíos a Estados Unidos son DDU (Delivery Duty Unpaid) por defecto; los aranceles e impuestos los paga el destinatario a aduanas.","spxEtsyZone4Note":"Nota de Etsy: Los precios en Etsy están fijados en la Zona 4. Contáctanos por mensajes de Etsy para una cotización.","spxNoSaturdayNote":"Este servicio no se despacha los sábados porque el costo de envío es demasiado alto."};
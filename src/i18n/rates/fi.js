@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Liittyvät hinnat","postalCourierLocal":"Posti- ja kuriirihinnat (paikallinen)","service":"Palvelu","notes":"Huomautukset","zone":"Vyöhyke","countryRegion":"Maa / Alue","country":"Maa","countryFullName":"Maa (koko nimi)","weight":"Paino","region":"Alue","currentPrice":"Nykyinen hinta","noSurcharge":"Ei lisämaksua","handlingFeeSurcharge":"Käsittelymaksulisä (koskee vain ePACia)","currentSurchargeRates":"Nykyiset lisämaksuprosentit (koskee vain ePACia)","epacRates2026":"SingPost ePAC kansainväliset postihinnat 2026","emsRates2026":"SpeedPost International Priority (EMS) hinnat 2026","speedpostExpressRates":"SpeedPost International Express hinnat","trackedPrepaidLabel":"SingPost seurattu ennakkomaksutarra","doorstepDeliveryStd":"0.00 - 5.00kg (Lähetetään SpeedPost Standardilla) - Toimitus ovelle (1-3 arkipäivää)","southeastAsia":"Kaakkois-Aasia","europe":"Eurooppa","includes":"sis.","except":"paitsi","asiaPacific":"Aasian ja Tyynenmeren alue","epacSaturdayGlobal":"ePAC lähetetään nyt myös lauantaisin muualle maailmaan.","etsyZoneLNoEmsSaturday":"Huom: Etsy-hinnat kiinnitetään vyöhykkeeseen L. Ota ystävällisesti yhteyttä tarjouspyyntöä varten Etsy-viesteillä. EMS-lähetyksiä ei postiteta lauantaisin, koska toimitus on liian kallista.","spxPoBoxNotice":"Tärkeää: Tätä palvelua ei voi lähettää PO Box- tai APO/FPO-osoitteisiin. Viimeisen mailin toimituksen hoitaa DHL, ja viimeisen mailin seuranta on saatavilla tällä sivustolla.","spxUsaDduNote":"USA-huomio: Lähetykset Yhdysvaltoihin ovat oletuksena DDU (Delivery Duty Unpaid); tullit ja verot maksaa vastaanottaja tullille.","spxEtsyZone4Note":"Etsy-huomio: Etsy-hinnat on kiinnitetty vyöhykkeeseen 4. Ota yhteyttä Etsy-viesteillä saadaksesi tarjouksen.","spxNoSaturdayNote":"Tätä palvelua ei postiteta lauantaisin, koska toimituskustannukset ovat liian korkeat."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Tarifs liés","postalCourierLocal":"Tarifs postaux & coursier (local)","service":"Service","notes":"Notes","zone":"Zone","countryRegion":"Pays / Région","country":"Pays","countryFullName":"Pays (nom complet)","weight":"Poids","region":"Région","currentPrice":"Prix actuel","noSurcharge":"Sans surcharge","handlingFeeSurcharge":"Supplément de frais de traitement (s’applique uniquement à ePAC)","currentSurchargeRates":"Taux de surcharge actuels (s’applique uniquement à ePAC)","epacRates2026":"Tarifs postaux internationaux SingPost ePAC 2026","emsRates2026":"Tarifs SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Tarifs SpeedPost International Express","trackedPrepaidLabel":"Étiquette prépayée suivie SingPost","doorstepDeliveryStd":"0,00 - 5,00kg (Expédié via SpeedPost Standard) - Livraison à domicile (1-3 jours ouvrés)","southeastAsia":"Asie du Sud-Est","europe":"Europe","includes":"incl.","except":"sauf","asiaPacific":"Asie-Pacifique","epacSaturdayGlobal":"ePAC sera désormais également expédié le samedi pour le reste du monde.","etsyZoneLNoEmsSaturday":"Remarque : Les prix sur Etsy seront fixés à la zone L. Veuillez nous contacter pour un devis via les messages Etsy. Aucun envoi EMS le samedi car l’expédition est trop coûteuse.","spxPoBoxNotice":"Important : Ce service ne peut pas être expédié vers des adresses PO Box ou APO/FPO. La livraison du dernier kilomètre est assurée par DHL, et le suivi du dernier kilomètre est disponible sur ce site.","spxUsaDduNote":"Note USA : Les envois vers les États-Unis sont en DDU (Delivery Duty Unpaid) par défaut ; les droits et taxes sont payés par le destinataire aux douanes.","spxEtsyZone4Note":"Note Etsy : Les prix sur Etsy sont fixés à la zone 4. Veuillez nous contacter via les messages Etsy pour un devis.","spxNoSaturdayNote":"Ce service n’est pas expédié le samedi car les frais d’expédition sont trop élevés."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Rátaí gaolmhara","postalCourierLocal":"Rátaí Poist & Cúiréireachta (Áitiúil)","service":"Seirbhís","notes":"Nótaí","zone":"Crios","countryRegion":"Tír / Réigiún","country":"Tír","countryFullName":"Tír (ainm iomlán)","weight":"Meáchan","region":"Réigiún","currentPrice":"Praghas reatha","noSurcharge":"Gan formhuirear","handlingFeeSurcharge":"Formhuirear táille láimhseála (baineann le ePAC amháin)","currentSurchargeRates":"Rátaí formhuirir reatha (baineann le ePAC amháin)","epacRates2026":"Rátaí Poist Idirnáisiúnta SingPost ePAC 2026","emsRates2026":"Rátaí SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Rátaí SpeedPost International Express","trackedPrepaidLabel":"Lipéad réamhíoctha le rianú SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Seolta via SpeedPost Standard) - Seachadadh go doras (1-3 lá oibre)","southeastAsia":"Oirdheisceart na hÁise","europe":"An Eoraip","includes":"san áireamh","except":"seachas","asiaPacific":"Áise an Aigéin Chiúin","epacSaturdayGlobal":"Cuirfear ePAC sa phost anois ar an Satharn freisin don chuid eile den domhan.","etsyZoneLNoEmsSaturday":"Nóta: Socrófar praghsanna ar Etsy do Chrios L. Déan teagmháil linn le haghaidh luachan trí theachtaireachtaí Etsy. Ní sheoltar EMS ar an Satharn mar tá an loingseoireacht róchostasach.","spxPoBoxNotice":"Tábhachtach: Ní féidir an tseirbhís seo a sheoladh chuig seoltaí PO Box ná APO/FPO. Is DHL a láimhseálann seachadadh an mhíle dheireanaigh, agus tá rianú an mhíle dheireanaigh ar fáil ar an suíomh seo.","spxUsaDduNote":"Nóta SAM: Tá lastais chuig na Stáit Aontaithe mar DDU (Delivery Duty Unpaid) de réir réamhshocraithe; íocann an faighteoir dleachtanna agus cánacha leis an gcustam.","spxEtsyZone4Note":"Nóta Etsy: Tá praghsanna Etsy socraithe do Chrios 4. Déan teagmháil linn trí theachtaireachtaí Etsy le haghaidh luachan.","spxNoSaturdayNote":"Ní phostáiltear an tseirbhís seo ar an Satharn mar tá costas an loingseoireachta ró-ard."};
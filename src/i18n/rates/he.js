@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"תעריפים קשורים","postalCourierLocal":"תעריפי דואר ושליחויות (מקומי)","service":"שירות","notes":"הערות","zone":"אזור","countryRegion":"מדינה / אזור","country":"מדינה","countryFullName":"מדינה (שם מלא)","weight":"משקל","region":"אזור","currentPrice":"מחיר נוכחי","noSurcharge":"ללא תוספת","handlingFeeSurcharge":"תוספת דמי טיפול (חל רק על ePAC)","currentSurchargeRates":"שיעורי תוספת נוכחיים (חל רק על ePAC)","epacRates2026":"תעריפי דואר בינלאומיים SingPost ePAC לשנת 2026","emsRates2026":"תעריפי SpeedPost International Priority (EMS) לשנת 2026","speedpostExpressRates":"תעריפי SpeedPost International Express","trackedPrepaidLabel":"תווית משולמת מראש עם מעקב של SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (נשלח דרך SpeedPost Standard) - מסירה עד הדלת (1-3 ימי עסקים)","southeastAsia":"דרום־מזרח אסיה","europe":"אירופה","includes":"כולל","except":"למעט","asiaPacific":"אסיה פסיפיק","epacSaturdayGlobal":"ePAC יישלח כעת גם בימי שבת לשאר העולם.","etsyZoneLNoEmsSaturday":"הערה: המחירים ב-Etsy יקובעו לאזור L. אנא צרו איתנו קשר להצעת מחיר דרך הודעות Etsy. אין משלוח EMS בימי שבת משום שעלויות המשלוח גבוהות מדי.","spxPoBoxNotice":"חשוב: שירות זה לא ניתן למשלוח לכתובות PO Box או APO/FPO. המסירה במייל האחרון מתבצעת על ידי DHL, ומעקב המייל האחרון זמין באתר זה.","spxUsaDduNote":"הערת ארה״ב: משלוחים לארצות הברית הם DDU (Delivery Duty Unpaid) כברירת מחדל; מכסים ומסים משולמים על ידי הנמען לרשויות המכס.","spxEtsyZone4Note":"הערת Etsy: המחירים ב-Etsy קבועים לאזור 4. אנא צרו איתנו קשר דרך הודעות Etsy לקבלת הצעת מחיר.","spxNoSaturdayNote":"שירות זה אינו נשלח בשבת משום שעלויות המשלוח גבוהות מדי."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"संबंधित दरें","postalCourierLocal":"डाक और कूरियर दरें (स्थानीय)","service":"सेवा","notes":"टिप्पणियाँ","zone":"ज़ोन","countryRegion":"देश / क्षेत्र","country":"देश","countryFullName":"देश (पूरा नाम)","weight":"वज़न","region":"क्षेत्र","currentPrice":"वर्तमान मूल्य","noSurcharge":"कोई अधिभार नहीं","handlingFeeSurcharge":"हैंडलिंग शुल्क अधिभार (केवल ePAC पर लागू)","currentSurchargeRates":"वर्तमान अधिभार दरें (केवल ePAC पर लागू)","epacRates2026":"SingPost ePAC अंतरराष्ट्रीय डाक दरें 2026","emsRates2026":"SpeedPost इंटरनेशनल प्रायोरिटी (EMS) दरें 2026","speedpostExpressRates":"SpeedPost इंटरनेशनल एक्सप्रेस दरें","trackedPrepaidLabel":"SingPost ट्रैक्ड प्रीपेड लेबल","doorstepDeliveryStd":"0.00 - 5.00kg (SpeedPost Standard से भेजा गया) - घर तक डिलीवरी (1-3 कार्यदिवस)","southeastAsia":"दक्षिण-पूर्व एशिया","europe":"यूरोप","includes":"शामिल","except":"को छोड़कर","asiaPacific":"एशिया प्रशांत","epacSaturdayGlobal":"अब ePAC दुनिया के बाकी हिस्सों के लिए शनिवार को भी पोस्ट किया जाएगा।","etsyZoneLNoEmsSaturday":"नोट: Etsy पर कीमतें Zone L पर तय रहेंगी। कृपया कोटेशन के लिए Etsy संदेशों के माध्यम से हमसे संपर्क करें। शिपिंग बहुत महंगी होने के कारण शनिवार को EMS पोस्टिंग नहीं है।","spxPoBoxNotice":"महत्वपूर्ण: यह सेवा PO Box या APO/FPO पते पर नहीं भेजी जा सकती। अंतिम-मील डिलीवरी DHL द्वारा की जाती है और अंतिम-मील ट्रैकिंग इस वेबसाइट पर उपलब्ध है।","spxUsaDduNote":"यूएसए नोट: संयुक्त राज्य अमेरिका के लिए शिपमेंट डिफ़ॉल्ट रूप से DDU (Delivery Duty Unpaid) है; शुल्क और कर प्राप्तकर्ता द्वारा कस्टम्स को भुगतान किए जाते हैं।","spxEtsyZone4Note":"Etsy नोट: Etsy पर कीमतें Zone 4 पर निश्चित हैं। कृपया कोटेशन के लिए Etsy संदेशों के माध्यम से हमसे संपर्क करें।","spxNoSaturdayNote":"शिपिंग लागत बहुत अधिक होने के कारण यह सेवा शनिवार को पोस्ट नहीं की जाती।"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Tarif terkait","postalCourierLocal":"Tarif Pos & Kurir (Lokal)","service":"Layanan","notes":"Catatan","zone":"Zona","countryRegion":"Negara / Wilayah","country":"Negara","countryFullName":"Negara (nama lengkap)","weight":"Berat","region":"Wilayah","currentPrice":"Harga saat ini","noSurcharge":"Tanpa biaya tambahan","handlingFeeSurcharge":"Biaya tambahan penanganan (hanya berlaku untuk ePAC)","currentSurchargeRates":"Tarif biaya tambahan saat ini (hanya berlaku untuk ePAC)","epacRates2026":"Tarif Pos Internasional SingPost ePAC 2026","emsRates2026":"Tarif SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Tarif SpeedPost International Express","trackedPrepaidLabel":"Label prabayar terlacak SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Dikirim via SpeedPost Standard) - Antar ke depan pintu (1-3 hari kerja)","southeastAsia":"Asia Tenggara","europe":"Eropa","includes":"termasuk","except":"kecuali","asiaPacific":"Asia Pasifik","epacSaturdayGlobal":"ePAC sekarang juga akan dikirim pada hari Sabtu untuk seluruh dunia.","etsyZoneLNoEmsSaturday":"Catatan: Harga di Etsy akan tetap di Zona L. Silakan hubungi kami untuk penawaran melalui pesan Etsy. Tidak ada pengiriman EMS pada hari Sabtu karena biaya kirim terlalu mahal.","spxPoBoxNotice":"Penting: Layanan ini tidak dapat dikirim ke alamat PO Box atau APO/FPO. Pengantaran last-mile ditangani oleh DHL, dan pelacakan last-mile tersedia di situs web ini.","spxUsaDduNote":"Catatan USA: Pengiriman ke Amerika Serikat secara default adalah DDU (Delivery Duty Unpaid); bea dan pajak dibayar oleh penerima ke bea cukai.","spxEtsyZone4Note":"Catatan Etsy: Harga di Etsy ditetapkan pada Zona 4. Silakan hubungi kami melalui pesan Etsy untuk penawaran harga.","spxNoSaturdayNote":"Layanan ini tidak diposkan pada hari Sabtu karena biaya pengiriman terlalu tinggi."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Tariffe correlate","postalCourierLocal":"Tariffe postali e corriere (locale)","service":"Servizio","notes":"Note","zone":"Zona","countryRegion":"Paese / Regione","country":"Paese","countryFullName":"Paese (nome completo)","weight":"Peso","region":"Regione","currentPrice":"Prezzo attuale","noSurcharge":"Nessun sovrapprezzo","handlingFeeSurcharge":"Sovrapprezzo di gestione (si applica solo a ePAC)","currentSurchargeRates":"Tariffe sovrapprezzo attuali (si applica solo a ePAC)","epacRates2026":"Tariffe postali internazionali SingPost ePAC 2026","emsRates2026":"Tariffe SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Tariffe SpeedPost International Express","trackedPrepaidLabel":"Etichetta prepagata tracciata SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Spedito tramite SpeedPost Standard) - Consegna a domicilio (1-3 giorni lavorativi)","southeastAsia":"Sud-est asiatico","europe":"Europa","includes":"incl.","except":"tranne","asiaPacific":"Asia Pacifico","epacSaturdayGlobal":"ePAC sarà ora spedito anche il sabato per il resto del mondo.","etsyZoneLNoEmsSaturday":"Nota: I prezzi su Etsy saranno fissati alla Zona L. Ti preghiamo di contattarci per un preventivo tramite i messaggi Etsy. Nessuna spedizione EMS il sabato perché i costi di spedizione sono troppo elevati.","spxPoBoxNotice":"Importante: Questo servizio non può essere spedito a indirizzi PO Box o APO/FPO. La consegna dell’ultimo miglio è gestita da DHL e il tracciamento dell’ultimo miglio è disponibile su questo sito.","spxUsaDduNote":"Nota USA: Le spedizioni verso gli Stati Uniti sono DDU (Delivery Duty Unpaid) per impostazione predefinita; dazi e tasse sono pagati dal destinatario alla dogana.","spxEtsyZone4Note":"Nota Etsy: I prezzi su Etsy sono fissi per la Zona 4. Contattaci tramite i messaggi Etsy per un preventivo.","spxNoSaturdayNote":"Questo servizio non viene spedito il sabato perché i costi di spedizione sono troppo elevati."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"関連料金","postalCourierLocal":"郵便・宅配料金（国内）","service":"サービス","notes":"備考","zone":"ゾーン","countryRegion":"国 / 地域","country":"国","countryFullName":"国（正式名称）","weight":"重量","region":"地域","currentPrice":"現在価格","noSurcharge":"追加料金なし","handlingFeeSurcharge":"取扱手数料サーチャージ（ePACのみ適用）","currentSurchargeRates":"現在のサーチャージ率（ePACのみ適用）","epacRates2026":"SingPost ePAC 国際郵便料金 2026","emsRates2026":"SpeedPost International Priority（EMS）料金 2026","speedpostExpressRates":"SpeedPost International Express 料金","trackedPrepaidLabel":"SingPost 追跡付き前払いラベル","doorstepDeliveryStd":"0.00 - 5.00kg（SpeedPost Standard発送）- 玄関先配達（1〜3営業日）","southeastAsia":"東南アジア","europe":"ヨーロッパ","includes":"含む","except":"除く","asiaPacific":"アジア太平洋","epacSaturdayGlobal":"ePACは、世界のその他地域向けにも土曜日に発送されます。","etsyZoneLNoEmsSaturday":"注: Etsyでの価格はゾーンLで固定されます。Etsyメッセージでお見積もりをご連絡ください。EMSは送料が高すぎるため土曜日の発送はありません。","spxPoBoxNotice":"重要: このサービスは PO Box および APO/FPO 宛てには発送できません。ラストマイル配送は DHL が担当し、ラストマイル追跡はこのウェブサイトで確認できます。","spxUsaDduNote":"米国向け注意: 米国向け発送はデフォルトで DDU（関税・税金受取人払い）です。関税・税金は受取人が税関へ支払います。","spxEtsyZone4Note":"Etsy 注意: Etsy 上の価格は Zone 4 固定です。お見積りは Etsy メッセージでご連絡ください。","spxNoSaturdayNote":"送料が高すぎるため、このサービスは土曜日の発送を行っていません。"};
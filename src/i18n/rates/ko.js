@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"관련 요금","postalCourierLocal":"우편 및 택배 요금(국내)","service":"서비스","notes":"비고","zone":"구역","countryRegion":"국가 / 지역","country":"국가","countryFullName":"국가(전체 이름)","weight":"중량","region":"지역","currentPrice":"현재 가격","noSurcharge":"추가요금 없음","handlingFeeSurcharge":"취급 수수료 할증(ePAC에만 적용)","currentSurchargeRates":"현재 할증 요율(ePAC에만 적용)","epacRates2026":"SingPost ePAC 국제 우편 요금 2026","emsRates2026":"SpeedPost International Priority (EMS) 요금 2026","speedpostExpressRates":"SpeedPost International Express 요금","trackedPrepaidLabel":"SingPost 추적 선불 라벨","doorstepDeliveryStd":"0.00 - 5.00kg (SpeedPost Standard 발송) - 문앞 배송(영업일 1-3일)","southeastAsia":"동남아시아","europe":"유럽","includes":"포함","except":"제외","asiaPacific":"아시아 태평양","epacSaturdayGlobal":"ePAC은 이제 전 세계 나머지 지역으로도 토요일에 발송됩니다.","etsyZoneLNoEmsSaturday":"참고: Etsy 가격은 Zone L로 고정됩니다. Etsy 메시지로 견적을 문의해 주세요. 배송비가 너무 비싸서 토요일에는 EMS 발송이 없습니다.","spxPoBoxNotice":"중요: 이 서비스는 PO Box 및 APO/FPO 주소로 발송할 수 없습니다. 라스트마일 배송은 DHL이 담당하며, 라스트마일 추적은 이 웹사이트에서 확인할 수 있습니다.","spxUsaDduNote":"미국 안내: 미국행 배송은 기본적으로 DDU(Delivery Duty Unpaid)이며, 관세 및 세금은 수취인이 세관에 납부합니다.","spxEtsyZone4Note":"Etsy 안내: Etsy 가격은 Zone 4로 고정됩니다. 견적은 Etsy 메시지로 문의해 주세요.","spxNoSaturdayNote":"배송비가 너무 높아 이 서비스는 토요일에 접수되지 않습니다."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Ngā utu e pā ana","postalCourierLocal":"Ngā Utu Poutāpeta me te Kaikawe (Ā-rohe)","service":"Ratonga","notes":"Ngā tuhipoka","zone":"Rohe","countryRegion":"Whenua / Rohe","country":"Whenua","countryFullName":"Whenua (ingoa katoa)","weight":"Taumaha","region":"Rohe","currentPrice":"Utu onāianei","noSurcharge":"Kāore he utu tāpiri","handlingFeeSurcharge":"Utu tāpiri whakahaere (mō te ePAC anake)","currentSurchargeRates":"Ngā reiti utu tāpiri onāianei (mō te ePAC anake)","epacRates2026":"Ngā Utu Poutāpeta ā-ao SingPost ePAC 2026","emsRates2026":"Ngā Utu SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Ngā Utu SpeedPost International Express","trackedPrepaidLabel":"Tapanga Utu-Mua Aroturuki SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Ka tukuna mā SpeedPost Standard) - Tukunga ki te kūwaha (1-3 rā mahi)","southeastAsia":"Āhia ki te Tonga mā Rāwhiti","europe":"Ūropi","includes":"kei roto","except":"haunga","asiaPacific":"Āhia-Kiwa","epacSaturdayGlobal":"Ka tukuna hoki te ePAC i ngā Rāhoroi mō te toenga o te ao.","etsyZoneLNoEmsSaturday":"Tuhipoka: Ka pūmau ngā utu ki Etsy ki te Rohe L. Tēnā whakapā mai mō tētahi kōrero utu mā ngā karere Etsy. Kāore he tuku EMS i ngā Rāhoroi nā te nui rawa o te utu tuku.","spxPoBoxNotice":"He mea nui: Kāore tēnei ratonga e taea te tuku ki ngā wāhitau PO Box, APO/FPO rānei. Ko DHL te kaiwhakahaere o te tuku mile whakamutunga, ā, kei tēnei paetukutuku te aroturuki mile whakamutunga.","spxUsaDduNote":"Tuhipoka USA: Ko ngā tukunga ki te United States he DDU (Delivery Duty Unpaid) mā te taunoa; mā te kaiwhiwhi ngā taake me ngā utu ka utu ki ngā tikanga.","spxEtsyZone4Note":"Tuhipoka Etsy: Ka pūmau ngā utu Etsy ki te Rohe 4. Tēnā whakapā mai mā ngā karere Etsy mō tētahi kōrero utu.","spxNoSaturdayNote":"Kāore tēnei ratonga e whakairia i ngā Rāhoroi nā te nui rawa o te utu tuku."};
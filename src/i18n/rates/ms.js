@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Kadar berkaitan","postalCourierLocal":"Kadar Pos & Kurier (Tempatan)","service":"Perkhidmatan","notes":"Nota","zone":"Zon","countryRegion":"Negara / Wilayah","country":"Negara","countryFullName":"Negara (nama penuh)","weight":"Berat","region":"Wilayah","currentPrice":"Harga semasa","noSurcharge":"Tiada surcaj","handlingFeeSurcharge":"Surcaj yuran pengendalian (terpakai untuk ePAC sahaja)","currentSurchargeRates":"Kadar surcaj semasa (terpakai untuk ePAC sahaja)","epacRates2026":"Kadar Pos Antarabangsa SingPost ePAC 2026","emsRates2026":"Kadar SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Kadar SpeedPost International Express","trackedPrepaidLabel":"Label Prabayar Berjejak SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Dihantar melalui SpeedPost Standard) - Hantar ke pintu (1-3 hari bekerja)","southeastAsia":"Asia Tenggara","europe":"Eropah","includes":"termasuk","except":"kecuali","asiaPacific":"Asia Pasifik","epacSaturdayGlobal":"ePAC kini juga akan dipos pada hari Sabtu untuk seluruh dunia.","etsyZoneLNoEmsSaturday":"Nota: Harga di Etsy akan ditetapkan kepada Zon L. Sila hubungi kami untuk sebut harga melalui mesej Etsy. Tiada pengeposan EMS pada hari Sabtu kerana kos penghantaran terlalu tinggi.","spxPoBoxNotice":"Penting: Perkhidmatan ini tidak boleh dihantar ke alamat PO Box atau APO/FPO. Penghantaran last-mile dikendalikan oleh DHL dan penjejakan last-mile tersedia di laman web ini.","spxUsaDduNote":"Nota USA: Penghantaran ke Amerika Syarikat adalah DDU (Delivery Duty Unpaid) secara lalai; duti dan cukai dibayar oleh penerima kepada kastam.","spxEtsyZone4Note":"Nota Etsy: Harga di Etsy ditetapkan pada Zon 4. Sila hubungi kami melalui mesej Etsy untuk sebut harga.","spxNoSaturdayNote":"Perkhidmatan ini tidak dipos pada hari Sabtu kerana kos penghantaran terlalu tinggi."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Gerelateerde tarieven","postalCourierLocal":"Post- en koerierstarieven (lokaal)","service":"Service","notes":"Notities","zone":"Zone","countryRegion":"Land / Regio","country":"Land","countryFullName":"Land (volledige naam)","weight":"Gewicht","region":"Regio","currentPrice":"Huidige prijs","noSurcharge":"Geen toeslag","handlingFeeSurcharge":"Behandelingskostentoeslag (alleen van toepassing op ePAC)","currentSurchargeRates":"Huidige toeslagtarieven (alleen van toepassing op ePAC)","epacRates2026":"SingPost ePAC Internationale posttarieven 2026","emsRates2026":"SpeedPost International Priority (EMS) tarieven 2026","speedpostExpressRates":"SpeedPost International Express tarieven","trackedPrepaidLabel":"SingPost gevolgd prepaid label","doorstepDeliveryStd":"0.00 - 5.00kg (Verzonden via SpeedPost Standard) - Levering aan de deur (1-3 werkdagen)","southeastAsia":"Zuidoost-Azië","europe":"Europa","includes":"incl.","except":"behalve","asiaPacific":"Azië-Pacific","epacSaturdayGlobal":"ePAC wordt nu ook op zaterdag verzonden voor de rest van de wereld.","etsyZoneLNoEmsSaturday":"Opmerking: Prijzen op Etsy worden vastgesteld op Zone L. Neem vriendelijk contact met ons op voor een offerte via Etsy-berichten. Er is geen EMS-verzending op zaterdag omdat de verzendkosten te hoog zijn.","spxPoBoxNotice":"Belangrijk: Deze service kan niet worden verzonden naar PO Box- of APO/FPO-adressen. De last-mile levering wordt uitgevoerd door DHL en last-mile tracking is beschikbaar op deze website.","spxUsaDduNote":"VS-opmerking: Zendingen naar de Verenigde Staten zijn standaard DDU (Delivery Duty Unpaid); invoerrechten en belastingen worden door de ontvanger aan de douane betaald.","spxEtsyZone4Note":"Etsy-opmerking: Prijzen op Etsy staan vast op Zone 4. Neem via Etsy-berichten contact met ons op voor een offerte.","spxNoSaturdayNote":"Deze service wordt niet op zaterdag gepost omdat de verzendkosten te hoog zijn."};
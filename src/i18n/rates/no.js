@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Relaterte satser","postalCourierLocal":"Post- og budsatser (lokalt)","service":"Tjeneste","notes":"Merknader","zone":"Sone","countryRegion":"Land / Region","country":"Land","countryFullName":"Land (fullt navn)","weight":"Vekt","region":"Region","currentPrice":"Nåværende pris","noSurcharge":"Ingen tillegg","handlingFeeSurcharge":"Håndteringsgebyrtillegg (gjelder kun ePAC)","currentSurchargeRates":"Gjeldende tilleggssatser (gjelder kun ePAC)","epacRates2026":"SingPost ePAC internasjonale postpriser 2026","emsRates2026":"SpeedPost International Priority (EMS) satser 2026","speedpostExpressRates":"SpeedPost International Express satser","trackedPrepaidLabel":"SingPost sporet forhåndsbetalt etikett","doorstepDeliveryStd":"0.00 - 5.00kg (Sendt via SpeedPost Standard) - Levering på dørstokken (1-3 virkedager)","southeastAsia":"Sørøst-Asia","europe":"Europa","includes":"inkl.","except":"unntatt","asiaPacific":"Asia-Stillehavet","epacSaturdayGlobal":"ePAC vil nå også bli postet på lørdager for resten av verden.","etsyZoneLNoEmsSaturday":"Merk: Prisene på Etsy vil være fastsatt til sone L. Vennligst kontakt oss for et pristilbud via Etsy-meldinger. Ingen EMS-posting på lørdager fordi frakten er for kostbar.","spxPoBoxNotice":"Viktig: Denne tjenesten kan ikke sendes til PO Box- eller APO/FPO-adresser. Last-mile levering håndteres av DHL, og last-mile sporing er tilgjengelig på dette nettstedet.","spxUsaDduNote":"USA-merknad: Forsendelser til USA er som standard DDU (Delivery Duty Unpaid); toll og avgifter betales av mottakeren til tollmyndighetene.","spxEtsyZone4Note":"Etsy-merknad: Prisene på Etsy er fastsatt til sone 4. Kontakt oss via Etsy-meldinger for pristilbud.","spxNoSaturdayNote":"Denne tjenesten postes ikke på lørdager fordi fraktkostnaden er for høy."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Powiązane stawki","postalCourierLocal":"Stawki pocztowe i kurierskie (lokalne)","service":"Usługa","notes":"Uwagi","zone":"Strefa","countryRegion":"Kraj / Region","country":"Kraj","countryFullName":"Kraj (pełna nazwa)","weight":"Waga","region":"Region","currentPrice":"Aktualna cena","noSurcharge":"Bez dopłaty","handlingFeeSurcharge":"Dopłata manipulacyjna (dotyczy tylko ePAC)","currentSurchargeRates":"Aktualne stawki dopłat (dotyczy tylko ePAC)","epacRates2026":"Międzynarodowe stawki pocztowe SingPost ePAC 2026","emsRates2026":"Stawki SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Stawki SpeedPost International Express","trackedPrepaidLabel":"Przedpłacona etykieta śledzona SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Wysyłka przez SpeedPost Standard) - Dostawa pod drzwi (1-3 dni robocze)","southeastAsia":"Azja Południowo-Wschodnia","europe":"Europa","includes":"w tym","except":"z wyjątkiem","asiaPacific":"Azja i Pacyfik","epacSaturdayGlobal":"ePAC będzie teraz wysyłany także w soboty do reszty świata.","etsyZoneLNoEmsSaturday":"Uwaga: Ceny na Etsy będą ustawione na strefę L. Prosimy o kontakt w celu wyceny przez wiadomości Etsy. EMS nie jest nadawany w soboty, ponieważ wysyłka jest zbyt kosztowna.","spxPoBoxNotice":"Ważne: Ta usługa nie może być wysyłana na adresy PO Box ani APO/FPO. Dostawę ostatniej mili realizuje DHL, a śledzenie ostatniej mili jest dostępne na tej stronie.","spxUsaDduNote":"Uwaga USA: Przesyłki do Stanów Zjednoczonych są domyślnie DDU (Delivery Duty Unpaid); cła i podatki opłaca odbiorca w urzędzie celnym.","spxEtsyZone4Note":"Uwaga Etsy: Ceny na Etsy są stałe dla strefy 4. Skontaktuj się z nami przez wiadomości Etsy, aby otrzymać wycenę.","spxNoSaturdayNote":"Ta usługa nie jest nadawana w soboty, ponieważ koszty wysyłki są zbyt wysokie."};
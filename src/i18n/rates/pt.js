@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Tarifas relacionadas","postalCourierLocal":"Tarifas postais e de correio (local)","service":"Serviço","notes":"Notas","zone":"Zona","countryRegion":"País / Região","country":"País","countryFullName":"País (nome completo)","weight":"Peso","region":"Região","currentPrice":"Preço atual","noSurcharge":"Sem sobretaxa","handlingFeeSurcharge":"Sobretaxa de manuseio (aplica-se apenas ao ePAC)","currentSurchargeRates":"Taxas de sobretaxa atuais (aplica-se apenas ao ePAC)","epacRates2026":"Tarifas postais internacionais SingPost ePAC 2026","emsRates2026":"Tarifas SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Tarifas SpeedPost International Express","trackedPrepaidLabel":"Etiqueta pré-paga rastreada SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Enviado via SpeedPost Standard) - Entrega na porta (1-3 dias úteis)","southeastAsia":"Sudeste Asiático","europe":"Europa","includes":"incl.","except":"exceto","asiaPacific":"Ásia-Pacífico","epacSaturdayGlobal":"O ePAC agora também será enviado aos sábados para o resto do mundo.","etsyZoneLNoEmsSaturday":"Nota: Os preços no Etsy serão fixados na Zona L. Entre em contato conosco para um orçamento via mensagens do Etsy. Não há postagem EMS aos sábados, pois o frete é muito caro.","spxPoBoxNotice":"Importante: Este serviço não pode ser enviado para caixas postais (PO Box) ou endereços APO/FPO. A entrega de última milha é feita pela DHL, e o rastreamento da última milha está disponível neste site.","spxUsaDduNote":"Nota dos EUA: Envios para os Estados Unidos são DDU (Delivery Duty Unpaid) por padrão; taxas e impostos são pagos pelo destinatário à alfândega.","spxEtsyZone4Note":"Nota Etsy: Os preços no Etsy são fixos para a Zona 4. Entre em contato conosco por mensagens no Etsy para cotação.","spxNoSaturdayNote":"Este serviço não é postado aos sábados porque o custo de envio é muito alto."};
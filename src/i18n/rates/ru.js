@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Связанные тарифы","postalCourierLocal":"Почтовые и курьерские тарифы (местные)","service":"Услуга","notes":"Примечания","zone":"Зона","countryRegion":"Страна / Регион","country":"Страна","countryFullName":"Страна (полное название)","weight":"Вес","region":"Регион","currentPrice":"Текущая цена","noSurcharge":"Без надбавки","handlingFeeSurcharge":"Надбавка за обработку (только для ePAC)","currentSurchargeRates":"Текущие ставки надбавки (только для ePAC)","epacRates2026":"Международные почтовые тарифы SingPost ePAC 2026","emsRates2026":"Тарифы SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Тарифы SpeedPost International Express","trackedPrepaidLabel":"Отслеживаемая предоплаченная наклейка SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Отправка через SpeedPost Standard) - Доставка до двери (1-3 рабочих дня)","southeastAsia":"Юго-Восточная Азия","europe":"Европа","includes":"вкл.","except":"кроме","asiaPacific":"Азиатско-Тихоокеанский регион","epacSaturdayGlobal":"Теперь ePAC также будет отправляться по субботам в остальные страны мира.","etsyZoneLNoEmsSaturday":"Примечание: цены на Etsy будут фиксированы для зоны L. Пожалуйста, свяжитесь с нами для расчёта через сообщения Etsy. По субботам отправка EMS не осуществляется, так как доставка слишком дорогая.","spxPoBoxNotice":"Важно: Эта услуга не отправляется на адреса PO Box и APO/FPO. Доставку последней мили выполняет DHL, а отслеживание последней мили доступно на этом сайте.","spxUsaDduNote":"Примечание для США: Отправления в США по умолчанию идут как DDU (Delivery Duty Unpaid); пошлины и налоги оплачивает получатель таможне.","spxEtsyZone4Note":"Примечание Etsy: Цены на Etsy фиксированы для зоны 4. Свяжитесь с нами через сообщения Etsy для расчёта.","spxNoSaturdayNote":"Эта услуга не отправляется по субботам, так как стоимость доставки слишком высокая."};
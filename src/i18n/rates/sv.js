@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Relaterade priser","postalCourierLocal":"Post- och budpriser (lokalt)","service":"Tjänst","notes":"Anteckningar","zone":"Zon","countryRegion":"Land / Region","country":"Land","countryFullName":"Land (fullständigt namn)","weight":"Vikt","region":"Region","currentPrice":"Nuvarande pris","noSurcharge":"Ingen tilläggsavgift","handlingFeeSurcharge":"Hanteringsavgiftstillägg (gäller endast ePAC)","currentSurchargeRates":"Nuvarande tilläggsavgifter (gäller endast ePAC)","epacRates2026":"SingPost ePAC internationella postpriser 2026","emsRates2026":"SpeedPost International Priority (EMS) priser 2026","speedpostExpressRates":"SpeedPost International Express priser","trackedPrepaidLabel":"SingPost spårad förbetald etikett","doorstepDeliveryStd":"0.00 - 5.00kg (Skickas via SpeedPost Standard) - Leverans till dörren (1-3 arbetsdagar)","southeastAsia":"Sydostasien","europe":"Europa","includes":"inkl.","except":"förutom","asiaPacific":"Asien och Stillahavsområdet","epacSaturdayGlobal":"ePAC kommer nu även att skickas på lördagar till resten av världen.","etsyZoneLNoEmsSaturday":"Obs: Priser på Etsy kommer att vara fasta till zon L. Kontakta oss gärna för offert via Etsy-meddelanden. Ingen EMS-postning på lördagar eftersom frakten är för dyr.","spxPoBoxNotice":"Viktigt: Den här tjänsten kan inte skickas till PO Box- eller APO/FPO-adresser. Last-mile leverans hanteras av DHL, och last-mile spårning finns på denna webbplats.","spxUsaDduNote":"USA-notis: Försändelser till USA är som standard DDU (Delivery Duty Unpaid); tull och skatter betalas av mottagaren till tullen.","spxEtsyZone4Note":"Etsy-notis: Priser på Etsy är fasta för zon 4. Kontakta oss via Etsy-meddelanden för offert.","spxNoSaturdayNote":"Den här tjänsten postas inte på lördagar eftersom fraktkostnaden är för hög."};
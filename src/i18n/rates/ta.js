@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"தொடர்புடைய கட்டணங்கள்","postalCourierLocal":"அஞ்சல் மற்றும் கூரியர் கட்டணங்கள் (உள்ளூர்)","service":"சேவை","notes":"குறிப்புகள்","zone":"மண்டலம்","countryRegion":"நாடு / பகுதி","country":"நாடு","countryFullName":"நாடு (முழுப்பெயர்)","weight":"எடை","region":"பகுதி","currentPrice":"தற்போதைய விலை","noSurcharge":"கூடுதல் கட்டணம் இல்லை","handlingFeeSurcharge":"கையாளும் கட்டண கூடுதல் (ePAC-க்கு மட்டும் பொருந்தும்)","currentSurchargeRates":"தற்போதைய கூடுதல் கட்டண விகிதங்கள் (ePAC-க்கு மட்டும் பொருந்தும்)","epacRates2026":"SingPost ePAC சர்வதேச அஞ்சல் கட்டணங்கள் 2026","emsRates2026":"SpeedPost International Priority (EMS) கட்டணங்கள் 2026","speedpostExpressRates":"SpeedPost International Express கட்டணங்கள்","trackedPrepaidLabel":"SingPost கண்காணிப்பு முன்பணம் லேபிள்","doorstepDeliveryStd":"0.00 - 5.00kg (SpeedPost Standard மூலம் அனுப்பப்படுகிறது) - வீட்டு வாசல் விநியோகம் (1-3 வேலை நாட்கள்)","southeastAsia":"தென் கிழக்கு ஆசியா","europe":"ஐரோப்பா","includes":"உட்பட","except":"தவிர","asiaPacific":"ஆசியா பசிபிக்","epacSaturdayGlobal":"ePAC இப்போது உலகின் மற்ற பகுதிகளுக்காக சனிக்கிழமைகளிலும் அனுப்பப்படும்.","etsyZoneLNoEmsSaturday":"குறிப்பு: Etsy-இல் விலைகள் Zone L ஆக நிர்ணயமாக இருக்கும். விலை மேற்கோள் பெற Etsy செய்திகளின் மூலம் எங்களை தொடர்புகொள்ளவும். கப்பல் செலவு மிக அதிகமாக இருப்பதால் சனிக்கிழமைகளில் EMS அனுப்புதல் இல்லை.","spxPoBoxNotice":"முக்கியம்: இந்த சேவையை PO Box அல்லது APO/FPO முகவரிகளுக்கு அனுப்ப முடியாது. இறுதி-மைல் விநியோகம் DHL மூலம் நடைபெறும்; இறுதி-மைல் கண்காணிப்பு இந்த இணையதளத்தில் கிடைக்கும்.","spxUsaDduNote":"அமெரிக்க குறிப்பு: அமெரிக்காவுக்கான அனுப்புதல்கள் இயல்பாக DDU (Delivery Duty Unpaid) ஆகும்; சுங்கவரி மற்றும் வரிகளை பெறுநர் சுங்கத்துறைக்கு செலுத்த வேண்டும்.","spxEtsyZone4Note":"Etsy குறிப்பு: Etsy விலைகள் Zone 4-க்கு நிலைநிறுத்தப்பட்டுள்ளன. விலை மேற்கோள் பெற Etsy செய்திகளின் மூலம் எங்களை தொடர்புகொள்ளவும்.","spxNoSaturdayNote":"அனுப்பும் செலவு அதிகமாக இருப்பதால் இந்த சேவை சனிக்கிழமைகளில் அனுப்பப்படாது."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"อัตราค่าจัดส่งที่เกี่ยวข้อง","postalCourierLocal":"อัตราไปรษณีย์และขนส่ง (ภายในประเทศ)","service":"บริการ","notes":"หมายเหตุ","zone":"โซน","countryRegion":"ประเทศ / ภูมิภาค","country":"ประเทศ","countryFullName":"ประเทศ (ชื่อเต็ม)","weight":"น้ำหนัก","region":"ภูมิภาค","currentPrice":"ราคาปัจจุบัน","noSurcharge":"ไม่มีค่าธรรมเนียมเพิ่ม","handlingFeeSurcharge":"ค่าธรรมเนียมการจัดการเพิ่มเติม (ใช้กับ ePAC เท่านั้น)","currentSurchargeRates":"อัตราค่าธรรมเนียมปัจจุบัน (ใช้กับ ePAC เท่านั้น)","epacRates2026":"อัตราไปรษณีย์ระหว่างประเทศ SingPost ePAC ปี 2026","emsRates2026":"อัตรา SpeedPost International Priority (EMS) ปี 2026","speedpostExpressRates":"อัตรา SpeedPost International Express","trackedPrepaidLabel":"ฉลากชำระเงินล่วงหน้าแบบติดตาม SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (จัดส่งผ่าน SpeedPost Standard) - ส่งถึงหน้าบ้าน (1-3 วันทำการ)","southeastAsia":"เอเชียตะวันออกเฉียงใต้","europe":"ยุโรป","includes":"รวม","except":"ยกเว้น","asiaPacific":"เอเชียแปซิฟิก","epacSaturdayGlobal":"ขณะนี้ ePAC จะจัดส่งในวันเสาร์สำหรับประเทศอื่น ๆ ทั่วโลกด้วย","etsyZoneLNoEmsSaturday":"หมายเหตุ: ราคาบน Etsy จะถูกกำหนดเป็นโซน L กรุณาติดต่อเราผ่านข้อความ Etsy เพื่อขอใบเสนอราคา ไม่มีการส่ง EMS ในวันเสาร์เนื่องจากค่าขนส่งสูงเกินไป","spxPoBoxNotice":"สำคัญ: บริการนี้ไม่สามารถจัดส่งไปยัง PO Box หรือที่อยู่ APO/FPO ได้ การจัดส่งช่วงสุดท้ายดำเนินการโดย DHL และสามารถติดตามช่วงสุดท้ายได้บนเว็บไซต์นี้","spxUsaDduNote":"หมายเหตุสหรัฐฯ: การส่งไปสหรัฐอเมริกาเป็นแบบ DDU (Delivery Duty Unpaid) โดยค่าเริ่มต้น โดยผู้รับต้องชำระภาษีและอากรให้ศุลกากร","spxEtsyZone4Note":"หมายเหตุ Etsy: ราคาบน Etsy ถูกกำหนดคงที่ที่โซน 4 กรุณาติดต่อเราผ่านข้อความ Etsy เพื่อขอใบเสนอราคา","spxNoSaturdayNote":"บริการนี้ไม่ลงส่งในวันเสาร์เนื่องจากค่าจัดส่งสูงเกินไป"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Kaugnay na mga rate","postalCourierLocal":"Mga Rate ng Koreo at Courier (Lokal)","service":"Serbisyo","notes":"Mga Tala","zone":"Zone","countryRegion":"Bansa / Rehiyon","country":"Bansa","countryFullName":"Bansa (buong pangalan)","weight":"Bigat","region":"Rehiyon","currentPrice":"Kasalukuyang presyo","noSurcharge":"Walang dagdag singil","handlingFeeSurcharge":"Dagdag na bayad sa paghawak (para sa ePAC lamang)","currentSurchargeRates":"Kasalukuyang surcharge rates (para sa ePAC lamang)","epacRates2026":"SingPost ePAC International Postal Rates 2026","emsRates2026":"SpeedPost International Priority (EMS) Rates 2026","speedpostExpressRates":"SpeedPost International Express Rates","trackedPrepaidLabel":"SingPost Tracked Prepaid Label","doorstepDeliveryStd":"0.00 - 5.00kg (Ipinapadala via SpeedPost Standard) - Doorstep Delivery (1-3 business days)","southeastAsia":"Timog-Silangang Asya","europe":"Europa","includes":"kabilang","except":"maliban","asiaPacific":"Asya Pasipiko","epacSaturdayGlobal":"Ang ePAC ay ipo-post na rin tuwing Sabado para sa natitirang bahagi ng mundo.","etsyZoneLNoEmsSaturday":"Tandaan: Ang mga presyo sa Etsy ay naka-fix sa Zone L. Pakiusap makipag-ugnayan sa amin para sa quote sa pamamagitan ng Etsy messages. Walang EMS posting tuwing Sabado dahil masyadong mahal ang shipping.","spxPoBoxNotice":"Mahalaga: Ang serbisyong ito ay hindi maaaring ipadala sa PO Box o APO/FPO na address. Ang last-mile delivery ay pinamamahalaan ng DHL at ang last-mile tracking ay available sa website na ito.","spxUsaDduNote":"Paalala sa USA: Ang mga shipment papuntang United States ay DDU (Delivery Duty Unpaid) bilang default; ang duties at taxes ay binabayaran ng recipient sa customs.","spxEtsyZone4Note":"Paalala sa Etsy: Ang presyo sa Etsy ay naka-fix sa Zone 4. Makipag-ugnayan sa amin sa Etsy messages para sa quote.","spxNoSaturdayNote":"Hindi ito ipinopost tuwing Sabado dahil masyadong mataas ang shipping cost."};
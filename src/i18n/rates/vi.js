@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"Mức phí liên quan","postalCourierLocal":"Cước bưu chính & chuyển phát (nội địa)","service":"Dịch vụ","notes":"Ghi chú","zone":"Vùng","countryRegion":"Quốc gia / Khu vực","country":"Quốc gia","countryFullName":"Quốc gia (tên đầy đủ)","weight":"Khối lượng","region":"Khu vực","currentPrice":"Giá hiện tại","noSurcharge":"Không phụ phí","handlingFeeSurcharge":"Phụ phí xử lý (chỉ áp dụng cho ePAC)","currentSurchargeRates":"Mức phụ phí hiện tại (chỉ áp dụng cho ePAC)","epacRates2026":"Biểu phí bưu chính quốc tế SingPost ePAC 2026","emsRates2026":"Biểu phí SpeedPost International Priority (EMS) 2026","speedpostExpressRates":"Biểu phí SpeedPost International Express","trackedPrepaidLabel":"Nhãn trả trước có theo dõi SingPost","doorstepDeliveryStd":"0.00 - 5.00kg (Gửi qua SpeedPost Standard) - Giao tận cửa (1-3 ngày làm việc)","southeastAsia":"Đông Nam Á","europe":"Châu Âu","includes":"bao gồm","except":"ngoại trừ","asiaPacific":"Châu Á - Thái Bình Dương","epacSaturdayGlobal":"ePAC hiện cũng sẽ được gửi vào thứ Bảy cho phần còn lại của thế giới.","etsyZoneLNoEmsSaturday":"Lưu ý: Giá trên Etsy sẽ được cố định theo Vùng L. Vui lòng liên hệ chúng tôi để nhận báo giá qua tin nhắn Etsy. Không gửi EMS vào thứ Bảy vì chi phí vận chuyển quá cao.","spxPoBoxNotice":"Quan trọng: Dịch vụ này không thể gửi đến địa chỉ PO Box hoặc APO/FPO. Giao hàng chặng cuối do DHL thực hiện và theo dõi chặng cuối có sẵn trên website này.","spxUsaDduNote":"Lưu ý Mỹ: Lô hàng đến Hoa Kỳ mặc định là DDU (Delivery Duty Unpaid); thuế và phí do người nhận thanh toán cho hải quan.","spxEtsyZone4Note":"Lưu ý Etsy: Giá trên Etsy được cố định ở Zone 4. Vui lòng liên hệ chúng tôi qua tin nhắn Etsy để nhận báo giá.","spxNoSaturdayNote":"Dịch vụ này không gửi vào thứ Bảy vì chi phí vận chuyển quá cao."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"相關運費","postalCourierLocal":"郵政與快遞費（本地）","service":"服務","notes":"備註","zone":"分區","countryRegion":"國家 / 地區","country":"國家","countryFullName":"國家（全名）","weight":"重量","region":"地區","currentPrice":"目前價格","noSurcharge":"無附加費","handlingFeeSurcharge":"處理費附加費（僅適用 ePAC）","currentSurchargeRates":"目前附加費率（僅適用 ePAC）","epacRates2026":"SingPost ePAC 國際郵政費率 2026","emsRates2026":"SpeedPost 國際優先（EMS）費率 2026","speedpostExpressRates":"SpeedPost 國際快遞費率","trackedPrepaidLabel":"SingPost 可追蹤預付標籤","doorstepDeliveryStd":"0.00 - 5.00kg（透過 SpeedPost Standard 寄送）- 送到府（1-3 個工作天）","southeastAsia":"東南亞","europe":"歐洲","includes":"含","except":"不含","asiaPacific":"亞太","epacSaturdayGlobal":"ePAC 現在也會於星期六寄往世界其他地區。","etsyZoneLNoEmsSaturday":"注意：Etsy 上的價格將固定為 Zone L。請透過 Etsy 訊息聯絡我們索取報價。由於運費過高，EMS 週六不寄送。","spxPoBoxNotice":"重要：此服務無法寄送至郵政信箱（PO Box）或 APO/FPO 地址。末端派送由 DHL 負責，末端追蹤可在本網站查看。","spxUsaDduNote":"美國說明：寄往美國的貨件預設為 DDU（關稅未付）；關稅與稅費由收件人向海關支付。","spxEtsyZone4Note":"Etsy 說明：Etsy 上價格固定為 Zone 4。請透過 Etsy 訊息聯絡我們取得報價。","spxNoSaturdayNote":"由於運費過高，此服務週六不寄送。"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/rates/*.json. Do not edit by hand.
+export default {"relatedRates":"相关运费","postalCourierLocal":"邮政与快递费（本地）","service":"服务","notes":"备注","zone":"分区","countryRegion":"国家 / 地区","country":"国家","countryFullName":"国家（全称）","weight":"重量","region":"地区","currentPrice":"当前价格","noSurcharge":"无附加费","handlingFeeSurcharge":"手续费附加费（仅适用于 ePAC）","currentSurchargeRates":"当前附加费率（仅适用于 ePAC）","epacRates2026":"SingPost ePAC 国际邮政费率 2026","emsRates2026":"SpeedPost 国际优先（EMS）费率 2026","speedpostExpressRates":"SpeedPost 国际特快费率","trackedPrepaidLabel":"SingPost 可追踪预付标签","doorstepDeliveryStd":"0.00 - 5.00kg（通过 SpeedPost Standard 发货）- 送货上门（1-3个工作日）","southeastAsia":"东南亚","europe":"欧洲","includes":"含","except":"除","asiaPacific":"亚太","epacSaturdayGlobal":"ePAC 现在也会在周六寄往世界其他地区。","etsyZoneLNoEmsSaturday":"注意：Etsy 上的价格将固定为 Zone L。请通过 Etsy 消息联系我们获取报价。由于运费过高，EMS 周六不寄送。","spxPoBoxNotice":"重要：此服务无法寄送至邮政信箱（PO Box）或 APO/FPO 地址。末端派送由 DHL 负责，末端追踪可在本网站查看。","spxUsaDduNote":"美国说明：寄往美国的货件默认采用 DDU（关税未付）；关税与税费由收件人向海关支付。","spxEtsyZone4Note":"Etsy 说明：Etsy 上价格固定为 Zone 4。请通过 Etsy 讯息联系我们获取报价。","spxNoSaturdayNote":"由于运费过高，此服务周六不出货。"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Vaše odeslání se jeví jako spam. Pokud jde o legitimní dotaz, kontaktujte nás prosím prostřednictvím alternativních kanálů. Nepřijímáme nevyžádané nabídky SEO, návrhu webu, půjček ani podobných služeb.","capsLockWarning":"Prosíme, buďte při komunikaci s námi uctiví a nepište vše VELKÝMI PÍSMENY. Přepište prosím zprávu zdvořile a s běžným použitím velkých a malých písmen.","schoolEmailWarning":"Zdá se, že používáte školní e-mailovou adresu. Pokud absolvujete nebo později ztratíte přístup, nemusíte od nás v budoucnu dostávat e-maily. Pokud je to možné, použijte prosím dlouhodobou osobní e-mailovou adresu."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Mae eich cyflwyniad yn ymddangos fel sbam. Os yw hwn yn ymholiad dilys, cysylltwch â ni drwy sianeli amgen. Nid ydym yn derbyn cynigion diwahoddiad ar gyfer SEO, dylunio gwefan, benthyciadau na gwasanaethau tebyg.","capsLockWarning":"Byddwch yn barchus wrth siarad â ni a pheidiwch â theipio popeth mewn PRIFLYTHRENNAU. Ailysgrifennwch eich neges mewn naws gwrtais gan ddefnyddio priflythrennau a llythrennau bach arferol.","schoolEmailWarning":"Mae’n ymddangos eich bod yn defnyddio cyfeiriad e-bost ysgol. Os byddwch yn graddio neu’n colli mynediad yn nes ymlaen, efallai na fyddwch yn derbyn ein negeseuon e-bost yn y dyfodol. Pan fo’n bosibl, defnyddiwch gyfeiriad e-bost personol hirdymor."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Ihre Anfrage scheint Spam zu sein. Wenn es sich um eine berechtigte Anfrage handelt, kontaktieren Sie uns bitte über alternative Kanäle. Unaufgeforderte Angebote für SEO, Webdesign, Darlehen oder ähnliche Dienstleistungen akzeptieren wir nicht.","capsLockWarning":"Bitte bleiben Sie respektvoll, wenn Sie mit uns sprechen, und schreiben Sie nicht durchgehend in GROSSBUCHSTABEN. Formulieren Sie Ihre Nachricht bitte höflich und in normaler Groß- und Kleinschreibung neu.","schoolEmailWarning":"Sie verwenden offenbar eine Schul- oder Hochschul-E-Mail-Adresse. Wenn Sie Ihren Abschluss machen oder später den Zugriff verlieren, erhalten Sie unsere künftigen E-Mails möglicherweise nicht. Bitte wechseln Sie nach Möglichkeit zu einer langfristig genutzten persönlichen E-Mail-Adresse."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Your submission appears to be spam. If this is a legitimate enquiry, please contact us through alternative channels. We do not accept unsolicited offers for SEO, website design, loans, or similar services.","capsLockWarning":"Please be respectful when talking to us and do not type in all caps lock. Kindly rewrite your message in a polite tone using normal sentence case.","schoolEmailWarning":"You appear to be using a school email address. If you graduate or lose access later, you may not receive our future emails. Please switch to a long-term personal email when possible."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Su envío parece ser spam. Si se trata de una consulta legítima, póngase en contacto con nosotros a través de canales alternativos. No aceptamos ofertas no solicitadas de SEO, diseño web, préstamos o servicios similares.","capsLockWarning":"Por favor, sea respetuoso al hablar con nosotros y no escriba todo en MAYÚSCULAS. Reescriba su mensaje con un tono educado y con uso normal de mayúsculas y minúsculas.","schoolEmailWarning":"Parece que está usando un correo electrónico escolar. Si se gradúa o pierde el acceso más adelante, es posible que no reciba nuestros correos futuros. Cuando sea posible, cambie a un correo personal de uso a largo plazo."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Lähetyksesi vaikuttaa roskapostilta. Jos kyseessä on oikeutettu tiedustelu, ota meihin yhteyttä vaihtoehtoisten kanavien kautta. Emme hyväksy pyytämättömiä tarjouksia SEO:sta, verkkosivusuunnittelusta, lainoista tai vastaavista palveluista.","capsLockWarning":"Olethan kunnioittava viestiessäsi kanssamme etkä kirjoita koko viestiä SUURAAKKOSILLA. Kirjoita viesti uudelleen kohteliaalla sävyllä normaalilla kirjainkoolla.","schoolEmailWarning":"Näyttää siltä, että käytät oppilaitoksen sähköpostiosoitetta. Jos valmistut tai menetät pääsyn myöhemmin, et välttämättä saa tulevia sähköpostejamme. Vaihda mahdollisuuksien mukaan pitkäaikaisesti käytettävään henkilökohtaiseen sähköpostiin."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Votre demande semble être du spam. S'il s'agit d'une demande légitime, veuillez nous contacter via d'autres canaux. Nous n'acceptons pas les offres non sollicitées de SEO, de conception de site web, de prêts ou de services similaires.","capsLockWarning":"Merci de rester respectueux lorsque vous nous contactez et de ne pas écrire entièrement en MAJUSCULES. Veuillez reformuler votre message poliment avec une casse normale.","schoolEmailWarning":"Vous semblez utiliser une adresse e-mail scolaire. Si vous êtes diplômé(e) ou perdez l’accès plus tard, vous pourriez ne plus recevoir nos futurs e-mails. Veuillez utiliser, si possible, une adresse e-mail personnelle à long terme."};
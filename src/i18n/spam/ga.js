@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Is cosúil gur turscar atá i d’aighneacht. Más fiosrúchán dlisteanach é seo, déan teagmháil linn trí bhealaí eile. Ní ghlacaimid le tairiscintí gan iarraidh do SEO, dearadh gréasáin, iasachtaí ná seirbhísí comhchosúla.","capsLockWarning":"Bí measúil, le do thoil, agus tú ag labhairt linn agus ná clóscríobh gach rud i gCEANNLITREACHA. Athscríobh do theachtaireacht go béasach i ngnáthfhormáid litreacha, le do thoil.","schoolEmailWarning":"Is cosúil go bhfuil tú ag úsáid seoladh ríomhphoist scoile. Má bhainfidh tú céim amach nó má chailleann tú rochtain níos déanaí, seans nach bhfaighidh tú ár ríomhphoist amach anseo. Más féidir, úsáid seoladh ríomhphoist pearsanta fadtéarmach."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"נראה שהפנייה שלך היא ספאם. אם זו פנייה לגיטימית, אנא צור איתנו קשר דרך ערוצים חלופיים. איננו מקבלים הצעות לא רצויות ל-SEO, עיצוב אתרים, הלוואות או שירותים דומים.","capsLockWarning":"אנא שמרו על כבוד בעת הפנייה אלינו ואל תכתבו את כל ההודעה באותיות גדולות. אנא נסחו מחדש את ההודעה בניסוח מנומס ובכתיבה רגילה.","schoolEmailWarning":"נראה שאתה משתמש בכתובת דוא\"ל של מוסד לימודים. אם תסיים לימודים או תאבד גישה בהמשך, ייתכן שלא תקבל את המיילים העתידיים שלנו. אם אפשר, מומלץ לעבור לכתובת דוא\"ל אישית לטווח ארוך."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"आपका सबमिशन स्पैम प्रतीत होता है। यदि यह एक वैध पूछताछ है, तो कृपया वैकल्पिक माध्यमों से हमसे संपर्क करें। हम SEO, वेबसाइट डिज़ाइन, ऋण या समान सेवाओं के अनचाहे प्रस्ताव स्वीकार नहीं करते हैं।","capsLockWarning":"कृपया हमसे बात करते समय सम्मानजनक रहें और पूरा संदेश कैप्स लॉक में न लिखें। कृपया अपना संदेश विनम्र भाषा और सामान्य वाक्य लेखन में दोबारा लिखें।","schoolEmailWarning":"लगता है आप स्कूल/कॉलेज का ईमेल पता उपयोग कर रहे हैं। यदि आप स्नातक हो जाते हैं या बाद में इस ईमेल का एक्सेस खो देते हैं, तो हो सकता है कि आपको हमारे भविष्य के ईमेल न मिलें। कृपया संभव हो तो लंबे समय तक उपयोग होने वाला व्यक्तिगत ईमेल इस्तेमाल करें।"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Pengiriman Anda tampaknya merupakan spam. Jika ini adalah pertanyaan yang sah, silakan hubungi kami melalui saluran alternatif. Kami tidak menerima penawaran tanpa diminta untuk SEO, desain situs web, pinjaman, atau layanan serupa.","capsLockWarning":"Harap bersikap sopan saat berbicara dengan kami dan jangan mengetik seluruh pesan dengan HURUF KAPITAL. Mohon tulis ulang pesan Anda dengan nada yang santun dan penulisan huruf normal.","schoolEmailWarning":"Anda tampaknya menggunakan alamat email sekolah. Jika Anda lulus atau kehilangan akses nanti, Anda mungkin tidak akan menerima email kami di masa mendatang. Jika memungkinkan, gunakan email pribadi untuk jangka panjang."};
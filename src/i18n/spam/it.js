@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"La tua richiesta sembra essere spam. Se si tratta di una richiesta legittima, contattaci tramite canali alternativi. Non accettiamo offerte non richieste di SEO, progettazione di siti web, prestiti o servizi simili.","capsLockWarning":"Ti preghiamo di essere rispettoso quando ci contatti e di non scrivere tutto in MAIUSCOLO. Riscrivi il messaggio con un tono cortese e con la normale combinazione di maiuscole e minuscole.","schoolEmailWarning":"Sembra che tu stia usando un indirizzo e-mail scolastico. Se ti diplomi o perdi l’accesso in futuro, potresti non ricevere le nostre e-mail successive. Se possibile, passa a un indirizzo e-mail personale a lungo termine."};
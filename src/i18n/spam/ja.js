@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"送信内容はスパムの可能性があります。正当なお問い合わせの場合は、別の連絡手段でご連絡ください。SEO、Webサイト制作、融資、または類似サービスの営業提案は受け付けておりません。","capsLockWarning":"お問い合わせの際は敬意をもってご連絡ください。すべて大文字での入力はお控えいただき、通常の文章表記で丁寧に書き直してください。","schoolEmailWarning":"学校のメールアドレスを使用しているようです。卒業したり後でアクセスできなくなったりすると、今後の当社メールを受信できない可能性があります。可能であれば、長期的に使える個人メールアドレスへの変更をご検討ください。"};
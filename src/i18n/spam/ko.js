@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"제출하신 내용은 스팸으로 보입니다. 정상적인 문의라면 다른 채널을 통해 문의해 주세요. SEO, 웹사이트 디자인, 대출 또는 유사 서비스에 대한 사전 요청 없는 제안은 받지 않습니다.","capsLockWarning":"문의 시에는 존중하는 표현을 사용해 주시고 전체를 대문자로 입력하지 말아 주세요. 정중한 어조와 일반적인 문장 형태로 다시 작성해 주세요.","schoolEmailWarning":"학교 이메일 주소를 사용 중인 것으로 보입니다. 졸업하거나 나중에 접근 권한을 잃으면 향후 저희 이메일을 받지 못할 수 있습니다. 가능하면 장기간 사용할 수 있는 개인 이메일로 변경해 주세요."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"E āhua pāme ana tō tukunga. Mēnā he pātai tika tēnei, tēnā whakapā mai mā ētahi atu ara. Kāore mātou e whakaae ki ngā tuku kāore i tonoa mō te SEO, hoahoa paetukutuku, pūtea taurewa, ratonga ōrite rānei.","capsLockWarning":"Tēnā, kia whakaute mai i a koe e kōrero ana ki a mātou, ā, kaua e pato katoa i ngā pūmatua. Tuhia anō tō karere i runga i te reo ngākau pai me te whakamahi i te pūmatua me te pūriki i te āhua noa.","schoolEmailWarning":"Te āhua nei kei te whakamahi koe i tētahi wāhitau īmēra kura. Mēnā ka puta koe i te kura, ka ngaro rānei tō urunga ā muri ake, tērā pea kāore koe e whiwhi i ā mātou īmēra a muri ake nei. Mēnā ka taea, whakamahia he wāhitau īmēra whaiaro mō te wā roa."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Penghantaran anda kelihatan seperti spam. Jika ini ialah pertanyaan yang sah, sila hubungi kami melalui saluran alternatif. Kami tidak menerima tawaran tanpa diminta untuk SEO, reka bentuk laman web, pinjaman atau perkhidmatan yang serupa.","capsLockWarning":"Sila hormati kami semasa berkomunikasi dan jangan menaip semuanya dalam HURUF BESAR. Sila tulis semula mesej anda dengan nada sopan dan penggunaan huruf biasa.","schoolEmailWarning":"Anda nampaknya menggunakan alamat e-mel sekolah. Jika anda tamat pengajian atau kehilangan akses kemudian, anda mungkin tidak menerima e-mel kami pada masa hadapan. Sila tukar kepada e-mel peribadi jangka panjang jika boleh."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Uw inzending lijkt spam te zijn. Als dit een legitieme aanvraag is, neem dan via alternatieve kanalen contact met ons op. Wij accepteren geen ongevraagde aanbiedingen voor SEO, webdesign, leningen of vergelijkbare diensten.","capsLockWarning":"Wees respectvol wanneer u met ons communiceert en schrijf niet alles in HOOFDLETTERS. Schrijf uw bericht opnieuw in een beleefde toon met normale hoofdletters en kleine letters.","schoolEmailWarning":"U lijkt een school-e-mailadres te gebruiken. Als u afstudeert of later de toegang verliest, ontvangt u mogelijk onze toekomstige e-mails niet. Gebruik indien mogelijk een persoonlijk e-mailadres voor langdurig gebruik."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Innsendingen din ser ut til å være spam. Hvis dette er en legitim forespørsel, vennligst kontakt oss via alternative kanaler. Vi godtar ikke uoppfordrede tilbud om SEO, nettsidedesign, lån eller lignende tjenester.","capsLockWarning":"Vennligst vær respektfull når du snakker med oss, og ikke skriv hele meldingen med STORE BOKSTAVER. Skriv meldingen på nytt i en høflig tone med normal bruk av store og små bokstaver.","schoolEmailWarning":"Det ser ut til at du bruker en skole-e-postadresse. Hvis du fullfører studiene eller mister tilgang senere, kan det hende du ikke mottar våre fremtidige e-poster. Bytt om mulig til en personlig e-postadresse for langsiktig bruk."};
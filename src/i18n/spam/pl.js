@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Twoje zgłoszenie wygląda na spam. Jeśli jest to legalne zapytanie, skontaktuj się z nami innymi kanałami. Nie akceptujemy niezamówionych ofert SEO, projektowania stron internetowych, pożyczek ani podobnych usług.","capsLockWarning":"Prosimy o zachowanie szacunku podczas kontaktu z nami i niepisanie całej wiadomości WIELKIMI LITERAMI. Prosimy przepisać wiadomość uprzejmym tonem, używając normalnej pisowni.","schoolEmailWarning":"Wygląda na to, że używasz szkolnego adresu e-mail. Jeśli ukończysz szkołę lub później utracisz dostęp, możesz nie otrzymywać naszych przyszłych wiadomości. W miarę możliwości używaj długoterminowego prywatnego adresu e-mail."};
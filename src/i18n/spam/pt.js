@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"A sua submissão parece ser spam. Se esta for uma consulta legítima, entre em contacto connosco através de canais alternativos. Não aceitamos ofertas não solicitadas de SEO, design de websites, empréstimos ou serviços semelhantes.","capsLockWarning":"Por favor, seja respeitoso ao falar connosco e não escreva tudo em MAIÚSCULAS. Reescreva a sua mensagem com um tom educado e com capitalização normal.","schoolEmailWarning":"Parece que está a usar um e-mail escolar. Se concluir os estudos ou perder o acesso mais tarde, poderá deixar de receber os nossos e-mails futuros. Sempre que possível, mude para um e-mail pessoal de utilização a longo prazo."};
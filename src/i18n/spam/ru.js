@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Ваше сообщение похоже на спам. Если это законный запрос, пожалуйста, свяжитесь с нами через альтернативные каналы. Мы не принимаем нежелательные предложения по SEO, веб-дизайну, займам или аналогичным услугам.","capsLockWarning":"Пожалуйста, проявляйте уважение при обращении к нам и не пишите всё ЗАГЛАВНЫМИ БУКВАМИ. Перепишите сообщение в вежливом тоне с обычным регистром.","schoolEmailWarning":"Похоже, вы используете учебный адрес электронной почты. Если вы окончите учебное заведение или позже потеряете доступ, вы можете не получать наши будущие письма. По возможности используйте личный e-mail для долгосрочного использования."};
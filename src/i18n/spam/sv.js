@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Ditt meddelande verkar vara spam. Om detta är en legitim förfrågan, vänligen kontakta oss via alternativa kanaler. Vi accepterar inte oombedda erbjudanden om SEO, webbdesign, lån eller liknande tjänster.","capsLockWarning":"Var vänlig och respektfull när du skriver till oss och skriv inte hela meddelandet med VERSALER. Skriv om meddelandet i en artig ton med normal användning av stora och små bokstäver.","schoolEmailWarning":"Det verkar som att du använder en skol-e-postadress. Om du tar examen eller förlorar åtkomst senare kan du missa våra framtida e-postmeddelanden. Byt gärna till en personlig e-postadress för långsiktig användning när det är möjligt."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"உங்கள் சமர்ப்பிப்பு ஸ்பாம் போல தெரிகிறது. இது ஒரு செல்லத்தக்க விசாரணையாக இருந்தால், மாற்று வழிகள் மூலம் எங்களை தொடர்பு கொள்ளவும். SEO, இணையதள வடிவமைப்பு, கடன் அல்லது இதே போன்ற சேவைகளுக்கான கோரப்படாத சலுகைகளை நாம் ஏற்கவில்லை.","capsLockWarning":"எங்களுடன் தொடர்பு கொள்ளும் போது மரியாதையாக இருங்கள்; முழு செய்தியையும் பெரிய எழுத்துகளில் டைப் செய்ய வேண்டாம். தயவுசெய்து உங்கள் செய்தியை மரியாதையான சொற்களுடன் சாதாரண எழுத்து முறையில் மீண்டும் எழுதுங்கள்.","schoolEmailWarning":"நீங்கள் கல்வி நிறுவன மின்னஞ்சல் முகவரியை பயன்படுத்துகிறீர்கள் போல தெரிகிறது. நீங்கள் படிப்பு முடித்துவிட்டால் அல்லது பின்னர் அணுகலை இழந்தால், எங்கள் எதிர்கால மின்னஞ்சல்கள் உங்களுக்கு வராமல் போகலாம். முடிந்தால் நீண்டகாலம் பயன்படுத்தக்கூடிய தனிப்பட்ட மின்னஞ்சல் முகவரிக்கு மாற்றவும்."};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"ข้อความที่คุณส่งดูเหมือนเป็นสแปม หากเป็นคำสอบถามที่ถูกต้อง กรุณาติดต่อเราผ่านช่องทางอื่น เราไม่รับข้อเสนอที่ไม่ได้ร้องขอเกี่ยวกับ SEO การออกแบบเว็บไซต์ เงินกู้ หรือบริการที่คล้ายกัน","capsLockWarning":"โปรดให้เกียรติเมื่อสื่อสารกับเรา และอย่าพิมพ์ข้อความทั้งหมดเป็นตัวพิมพ์ใหญ่ กรุณาเขียนข้อความใหม่ด้วยถ้อยคำสุภาพและรูปแบบประโยคปกติ","schoolEmailWarning":"ดูเหมือนว่าคุณกำลังใช้อีเมลของสถาบันการศึกษา หากคุณเรียนจบหรือสูญเสียสิทธิ์การเข้าถึงในภายหลัง คุณอาจไม่ได้รับอีเมลจากเราในอนาคต กรุณาเปลี่ยนเป็นอีเมลส่วนตัวที่ใช้งานระยะยาวเมื่อเป็นไปได้"};
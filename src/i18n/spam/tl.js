@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Mukhang spam ang iyong isinumite. Kung lehitimong katanungan ito, mangyaring makipag-ugnayan sa amin sa ibang mga channel. Hindi kami tumatanggap ng hindi hinihinging alok para sa SEO, web design, pautang, o katulad na serbisyo.","capsLockWarning":"Pakiusap, maging magalang sa pakikipag-usap sa amin at huwag i-type ang buong mensahe sa ALL CAPS. Pakisulat muli ang iyong mensahe sa magalang na tono gamit ang normal na malaking at maliit na titik.","schoolEmailWarning":"Mukhang gumagamit ka ng school email address. Kapag nakapagtapos ka o nawalan ka ng access sa hinaharap, maaaring hindi mo matanggap ang aming mga susunod na email. Kung maaari, gumamit ng pangmatagalang personal na email address."};
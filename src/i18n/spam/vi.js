@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"Nội dung bạn gửi có vẻ là thư rác. Nếu đây là yêu cầu hợp lệ, vui lòng liên hệ với chúng tôi qua các kênh khác. Chúng tôi không chấp nhận các đề nghị không được yêu cầu về SEO, thiết kế website, khoản vay hoặc các dịch vụ tương tự.","capsLockWarning":"Vui lòng tôn trọng khi liên hệ với chúng tôi và không nhập toàn bộ bằng CHỮ IN HOA. Hãy viết lại nội dung với giọng điệu lịch sự và cách viết hoa/thường bình thường.","schoolEmailWarning":"Bạn có vẻ đang sử dụng email của trường học. Nếu bạn tốt nghiệp hoặc mất quyền truy cập sau này, bạn có thể không nhận được email của chúng tôi trong tương lai. Khi có thể, vui lòng chuyển sang email cá nhân dùng lâu dài."};
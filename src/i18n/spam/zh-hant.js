@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"您的提交內容似乎是垃圾訊息。如果這是合法查詢，請透過其他渠道聯絡我們。我們不接受未經請求的 SEO、網站設計、貸款或類似服務報價。","capsLockWarning":"請在與我們溝通時保持尊重，不要全部使用大寫字母輸入。請使用禮貌語氣並以正常書寫格式重新填寫您的訊息。","schoolEmailWarning":"您似乎正在使用學校郵箱。如果您畢業或之後失去該郵箱存取權限，可能無法收到我們後續郵件。建議您盡量改用可長期使用的個人郵箱。"};
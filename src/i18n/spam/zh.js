@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/spam/*.json. Do not edit by hand.
+export default {"spamRejection":"您的提交内容似乎是垃圾信息。如果这是合法咨询，请通过其他渠道联系我们。我们不接受未经请求的 SEO、网站设计、贷款或类似服务报价。","capsLockWarning":"请在与我们沟通时保持尊重，不要全部使用大写字母输入。请使用礼貌语气并按正常书写格式重新填写您的信息。","schoolEmailWarning":"您似乎正在使用学校邮箱。如果您毕业或之后失去该邮箱访问权限，可能无法收到我们后续邮件。建议您尽量改用可长期使用的个人邮箱。"};
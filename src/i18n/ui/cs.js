@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus využívá prémiové komerční sítě. Přesný okamžik, kdy dorazí do vaší země, se však přenese na místního domácího dopravce (např. USPS, Royal Mail, DHL místně). Sledovací předpony mění manipulační systémy na tomto prahu, ale náš univerzální sledovač balíků sešívá tyto stavy dohromady, aby vám poskytl nerušenou viditelnost.","trackingLastMileTitle":"Síť pro doručení poslední míle","trackingCustomsClearanceBody":"Všechny přeshraniční položky musí projít celní agenturou vaší místní země. Náš nástroj monitoruje přechody od příchodu do dovozního zařízení k celním předáním. Pohraniční hlídky ověří kódy HS a zajistí, aby byla odvedena správná DPH nebo poplatky (např. IOSS v EU, Voec v Norsku). Sledujte sledování speciálně pro varování „Podrženo na celnici“.","trackingCustomsClearanceTitle":"Informace o celním odbavení","trackingProcessingOriginBody":"Po vyložení se položka dostane do centra zpracování původu, kde je naskenována, zvážena a podrobena primárním bezpečnostním prověrkám exportu. Poté je odeslána do mezinárodní poštovní směnárny. Letové řády závisí na dostupné šířce pásma nákladu. Neznepokojujte se, pokud zůstane v tomto stavu několik dní.","trackingProcessingOriginTitle":"Zpracování v Centru původu","trackingInfoReceivedBody":"Když je objednávka poprvé zpracována na našich platformách elektronického obchodu (jako je Etsy, eBay nebo přímý prodej), sledovací číslo je generováno elektronicky. Dopravce obdrží údaje o zásilce před fyzickým držením krabice. Počítejte prosím s uvedením balíku do fyzického třídicího zařízení do 1 až 3 pracovních dnů.","trackingInfoReceivedTitle":"Informaci jsme obdrželi.","trackingStatusesIntro":"Děkujeme, že používáte náš jednotný mezinárodní nástroj pro sledování zásilek. Vzhledem k tomu, že vaše zásilka cestuje přes více globálních hranic, mohou být její stavy sledování složité. Pochopení životního cyklu logistiky pomáhá stanovit jasná očekávání.","trackingStatusesTitle":"Pochopení stavů sledování","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"dop.","pmText":"odp.","footerQuickLinks":"Rychlé odkazy","footerSupportLegal":"Podpora a právní záležitosti","copyrightText":"Všechna práva vyhrazena.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlantický)","tzEST":"EST (Východní)","tzCST":"CST (Centrální)","tzMST":"MST (Horský)","tzPST":"PST (Pacifický)","tzAKST":"AKST (Aljaška)","tzHST":"HST (Havaj)","tzBeijing":"Peking","tzXinjiang":"Sin-ťiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Kaliningradská oblast (UTC+2)","tzMoscow":"Moskva/Západní Rusko (UTC+3)","tzSamara":"Samarská oblast (UTC+4)","tzUral":"Uralský region (UTC+5)","tzOmsk":"Omská oblast (UTC+6)","tzKrasnoyarsk":"Krasnojarský kraj (UTC+7)","tzIrkutsk":"Irkutská oblast (UTC+8)","tzSakha":"Republika Sacha (UTC+9)","tzPrimorsky":"Přímořský kraj (UTC+10)","tzMagadan":"Magadanská oblast (UTC+11)","tzKamchatka":"Kamčatský kraj (UTC+12)","dstDayStartsLabel":"Letní čas začíná","dstDayEndsLabel":"Letní čas končí","dstRevertsLabel":"návrat na standardní čas","dstEuropeLabel":"Evropa","dstNewZealandLabel":"Nový Zéland","englishResponseNotice":"Upozornění: Všechny dotazy jsou zodpovězeny v angličtině. Pokud odešlete zprávu v jiném jazyce, může být vaše zpráva přeložena do angličtiny pro ověření.","parcelDisagreeCheckbox":"Nesouhlasím","contactDisagreeCheckbox":"Nesouhlasím","contactNamePlaceholder":"Např: Jan Novák","systemRequirementsTitle":"Minimální podporované verze systému","systemRequirements":"Windows: Windows 7 (with ESU updates installed) nebo vyšší\nmacOS: macOS 12 nebo vyšší\nAndroid: Android 13 nebo vyšší\niPhone/iOS: iOS 17 nebo vyšší\nLinux: Aktuálně podporovaná distribuce s aktivními bezpečnostními aktualizacemi","goodFridayEasterGreeting":"Veselé Velikonoce! Mír a radost na Velký pátek a Velikonoce.","christmasGreeting":"Veselé Vánoce a šťastný nový rok! Mír a radost od 25. prosince do 5. ledna.","captchaSystemRequirements":"Minimální požadavky: Windows 7 (with ESU updates installed) nebo 11, macOS 10.15+, nebo nejnovější verze Android/iOS.","title":"Ověřit přístup","subtitle":"Prosím dokončete výzvu níže pro pokračování.","selectLanguage":"Vybrat jazyk","selectLanguagePlaceholder":"-- Vyberte jazyk --","loadingChallenge":"Načítání výzvy...","answerLabel":"Vaše odpověď:","answerPlaceholder":"Zadejte svou odpověď","continueButton":"Pokračovat","refreshButton":"Nová výzva","verifying":"Ověřování...","chooseLanguageFirst":"Nejprve vyberte jazyk.","loadFailed":"Nepodařilo se načíst výzvu. Prosím zkuste znovu.","expiredChallenge":"Výzva vypršela. Načítání nové výzvy...","verifyFailed":"Ověření selhalo. Prosím zkuste znovu.","home":"Domů","blog":"Blog","aboutUs":"O Nás","faq":"Časté Dotazy","contact":"Kontakt","trackPackage":"Sledovat Balík","cnyYearOfHorseMessage":"🧧 Šťastný lunární nový rok! Přejeme vám prosperitu a radost v roce Koně! 🐴","singaporeNationalDayMessage":"🇸🇬 Šťastný státní svátek, Singapure! Oslavujeme 61 let nezávislosti! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonésie! Dirgahayu Republik Indonésie! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malajsie! Oslavujeme nezávislost naší země! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Oznámení o dočasném uzavření","temporaryClosureNoticeBody":"Vážení zákazníci,\n\nUpozorňujeme, že Rhythm Nexus bude z důvodu firemní akce dočasně uzavřen od 21. března 2026 do 26. března 2026.\n\nV rámci přípravy na uzavření bude obchod od 20. března 2026 od 3:00 PM (UTC +8) nastaven do prázdninového režimu. Objednávky vytvořené po tomto čase nemusí být zpracovány až do obnovení provozu.\n\nBěžný provoz bude obnoven 27. března 2026.\n\nOmlouváme se za případné nepříjemnosti a děkujeme za vaše pochopení a trvalou podporu.\n\nDěkujeme.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Rozumím","parcelTracking":"Sledování Balíku","serviceAnnouncement":"Oznámení služby","usaWinterStormTitle":"NALÉHAVÉ: Těžká zimní bouře - Narušení služeb","usaWinterStormSubtitle":"Poštovní služba Spojených států (USPS) Mimořádná okolnost","usaWinterStormNotice1":"Kvůli těžké zimní bouři, která postihuje oblast New York od 23. února 2026:","usaWinterStormNotice2":"Mezinárodní provoz na Mezinárodním letišti Johna F. Kennedyho byl účinně zastaven","usaWinterStormNotice3":"Hlášena jsou hromadná zrušení letů a významné narušení letištních služeb","usaWinterStormNotice4":"Tyto podmínky představují mimořádnou okolnost mimo kontrolu USPS","usaWinterStormNotice5":"Dopad na služby:","usaWinterStormNotice6":"Nebezpečná kombinace silného sněhu, mrznoucího deště, sleti a kousavého mrazu","usaWinterStormNotice7":"Hlášena jsou významná narušení a rozsáhlé výpadky proudu","usaWinterStormNotice8":"Sběr a dodání domácí a mezinárodní pošty (listy, balíky a položky EMS) jsou ovlivněny","usaWinterStormNotice9":"Postižené poštovní oblasti:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS podniká všechny nezbytné kroky, aby minimalizovala potíže zákazníkům a zároveň zajistila bezpečnost zaměstnanců. Ceníme si vaší trpělivosti a chápání během této mimořádné okolnosti.","usaWinterStormNotice12":"Poslední aktualizace: 25. února 2026","countryAutoDetected":"Cílová země přednastavena podle vaší polohy","countryAutoDetectedFromLink":"Cílová země přednastavena z odkazu","trackingNumber":"Sledovací Číslo","destinationCountry":"Cílová Země","postcode":"PSČ","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Šťastný Den Ruska! 🎉","taiwanFoundingDayMessage":"🇹🇼 Šťastný Den založení, Tchaj-wan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Šťastný Den dvojité desítky, Tchaj-wan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Š ťastný Den založení SAR Hongkong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Šťastný Den založení SAR Macao! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Šťastný Mezinárodní den práce! Oslavujeme práci a práva pracujících! 🎊","laborDayUSCAMessage":"⚒️ Šťastný Den práce! Ctíme přínos pracujících! 🎉","orderNumber":"Číslo Objednávky (Příklad: RTNX1234567890)","fromDate":"Od Data (POŽADOVÁNO)","toDate":"Do Data (POŽADOVÁNO)","trackParcel":"Sledovat Balík","selectCourier":"-- Vybrat Kurýra / Zemi --","singaporeCouriers":"Singapurští Kurýři","topCountries":"Top 5 Zemí","otherCountries":"Jiné Země","optionSingPost":"🇸🇬 Singapur Post (SingPost)","countryAU":"🇦🇺 Austrálie","countryCA":"🇨🇦 Kanada","countryDE":"🇩🇪 Německo","countryGB":"🇬🇧 Spojené království","countryUS":"🇺🇸 Spojené státy","countryAT":"🇦🇹 Rakousko","countryBE":"🇧🇪 Belgie","countryBN":"🇧🇳 Brunej","countryCN":"🇨🇳 Čína","countryCZ":"🇨🇿 Česko","countryFI":"🇫🇮 Finsko","countryFR":"🇫🇷 Francie","countryHK":"🇭🇰 Hongkong SAR Čína","countryIN":"🇮🇳 Indie","countryID":"🇮🇩 Indonésie","countryIE":"🇮🇪 Irsko","countryIL":"🇮🇱 Izrael","countryIT":"🇮🇹 Itálie","countryJP":"🇯🇵 Japonsko","countryMO":"🇲🇴 Macao SAR Čína","countryMY":"🇲🇾 Malajsie","countryNL":"🇳🇱 Nizozemsko","countryNZ":"🇳🇿 Nový Zéland","countryNO":"🇳🇴 Norsko","countryPH":"🇵🇭 Filipíny","countryPL":"🇵🇱 Polsko","countryPT":"🇵🇹 Portugalsko","countryKR":"🇰🇷 Jižní Korea","countryES":"🇪🇸 Španělsko","countrySE":"🇸🇪 Švédsko","countryCH":"🇨🇭 Švýcarsko","countryTW":"🇹🇼 Tchaj-wan","countryTH":"🇹🇭 Thajsko","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬 Singapur","note":"POZNÁMKA","disclaimer":"ZŘEKNUTÍ SE ODPOVĚDNOSTI","importantInformation":"Důležité Informace:","didNotReceiveEmail":"Pokud jste neobdrželi potvrzovací e-mail z Etsy, eBay, Shopee nebo Payhip, posuňte se dolů a vyhledejte svou objednávku prostřednictvím e-mailové adresy nebo telefonního čísla spojeného s touto objednávkou.","searchByEmailOrPhone":"Hledat podle E-mailu nebo Telefonu","searchOrder":"Hledat Objednávku","trackingResult":"Výsledek Sledování","noOrdersFound":"Žádné objednávky nenalezeny.","pleaseEnter":"Zadejte e-mail, telefon nebo číslo objednávky.","fillAllFields":"Vyplňte všechna povinná pole: sledovací číslo, cílovou zemi, číslo objednávky a PSČ.","noOrderMatchingFields":"Nenalezena žádná objednávka odpovídající všem polím.","postcodeRequired":"PSČ je vyžadováno pro tuto destinaci.","invalidUSZip":"Neplatný americký PSČ. Použijte 5 číslic nebo ZIP+4.","failedGenerateURL":"Nepodařilo se vygenerovat URL pro sledování. Zkontrolujte zadání.","trackingValidationSG":"Sledovací čísla pro Singapur musí být: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG nebo PX123456789SG. Pro DHL zásilky použijte 10místná čísla.","invalidSingPostFormat":"Neplatný formát sledovacího čísla SingPost.\nPřijímané formáty:\n• PP123456789SG → Předplacený sledovací štítek\n• SPNDD00012345 → SpeedPost standardní sledování","welcomeTitle":"Vítejte na webu Rhythm Nexus!","purchaseInfo":"Nakupujte u nás prostřednictvím našich oficiálních kanálů nebo se připojte k naší","purchaseInfoChina":"Nakupujte u nás prostřednictvím našich oficiálních kanálů.","purchaseInfoChinaSuffix":"","telegramGroup":"skupině Telegram","forUpdates":"pro oficiální aktualizace.","ourStores":"Naše Obchody","etsyStore":"Obchod Etsy","ebayStore":"Obchod eBay","shopeeStore":"Obchod Shopee","payhipStore":"Obchod Payhip","internationalShipping":"Mezinárodní Doprava","singaporeLocal":"Místní Singapur","asiaOnly":"Pouze Asie","deliveryInfo":"Informace o Dodání","deliveryRates2026":"Sazby Dodání 2026","sgDeliveryRates":"Sazby Dodání Singapur","speedPostRates":"Sazby SpeedPost Express Mezinárodní","aboutTitle":"O Rhythm Nexus","aboutP1":"Náš obchod jsme založili v roce 2022 a od té doby úspěšně prodáváme na platformách jako Etsy, eBay a Shopee.","aboutP2":"Postupem času jsme si vybudovali silnou pověst díky zaměření na spolehlivé plnění a přesné sledování.","aboutP3":"Naším cílem je poskytovat zákazníkům hladký a důvěryhodný nákupní zážitek.","aboutP4":"Děkujeme za podporu Rhythm Nexus.","faqTitle":"Často kladené otázky","faqQ1":"Co když je moje zboží vadné? Existuje nějaká záruka?","faqA1":"Ano! Na většinu objednávek se vztahuje roční záruka. Uveďte prosím číslo faktury/objednávky, abychom to mohli prošetřit. Poznámka: Výměna není povolena, pokud zboží odpovídá popisu, i když jste objednali nesprávně.","faqQ2":"Mohu svou objednávku upravit, aktualizovat nebo zrušit?","faqA2":"Ano. Z bezpečnostních důvodů může být nutné změny objednávky řešit e-mailem nebo prostřednictvím našeho kontaktního formuláře.","faqQ3":"Musím platit clo/dovozní daně?","faqA3":"Cla a daně se obecně neplatí předem, s výjimkou DDP do USA. DPH se může vztahovat na EU, Spojené království, Austrálii/Nový Zéland, Norsko, Švýcarsko a kanadské provincie, jako je Saskatchewan a Manitoba, které je již ve výchozím nastavení zaplaceno. Na Singapur se nevztahuje žádná GST. Nemůžeme vám poradit ohledně celních poplatků – podrobnosti vám sdělí místní celní úřad.","faqQ4":"Kdy bude moje objednávka odeslána?","faqA4":"Objednávky jsou obvykle odesílány do 1-5 pracovních dnů. V období velkého objemu to může trvat 5–7 dní.","faqQ5":"Omylem jsem si objednal dvakrát. Co mám dělat?","faqA5":"Vracíme pouze duplicitní poplatky za dopravu. Obě položky budou odeslány společně. Vrácení peněz = (1. poplatek za dopravu + 2. poplatek za dopravu) – skutečný poplatek za dopravu.","faqQ6":"Jak dlouho trvá doručení?","faqA6":"Zpracování trvá 1-5 pracovních dnů.\n\nVnitrostátní doprava:\n• SingPost Prepaid Tracked Label: 2-4 dny\n• SpeedPost Standard: 1-3 dny\n\nMezinárodní:\n• SingPost ePAC: 14-30 dní\n• SpeedPost Priority (EMS): 8-15 dní\n• SpeedPost Express: 4-8 dní\n\nKe zpoždění může dojít během hlavní sezóny.","faqQ7":"Moje zboží se vrací odesílateli. Co mám dělat?","faqA7":"Opětovná zásilka je povolena. Zrušení není možné u neplatných adres, nevyzvednutých balíků nebo nezaplacených celních poplatků. Kontaktujte svou poštovní službu pro opětovné doručení nebo nám pošlete zprávu s žádostí o pomoc.","faqQ8":"Moje zboží se ztratilo / bylo odcizeno při přepravě.","faqA8":"Povolujeme jednu opětovnou zásilku. Pokud se znovu ztratí, bude vrácena celá částka po uplynutí doručovací lhůty kurýra:\n\n• Místní služby Singapuru: 7 dní\n• SingPost ePAC & SpeedPost Priority International: 30 dní\n• SpeedPost Intl Express: 14 dní","blogTitle":"Databáze Znalostí o Dopravě & Poště","blogSubtitle":"Oficiální vysvětlení poštovních služeb, cel, DPH a poplatků.","readMore":"Přečíst Více","backButton":"Zpět","blogPost1Title":"Co je SingPost ePAC?","blogPost1Desc":"Dozvědět se o SingPost ePAC (ePacket), ekonomické sledované poštovní službě.","blogPost2Title":"Co je SpeedPost Priority International (EMS)?","blogPost2Desc":"Objevte EMS, mezinárodní prémiovou expresní poštovní službu.","blogPost3Title":"Co je SpeedPost Express?","blogPost3Desc":"Prozkoumejte SpeedPost Express s doručením DHL Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Porozumět PDDP pro USA.","blogPost5Title":"DPH EU & IOSS","blogPost5Desc":"Přehledy o DPH EU a systému IOSS.","blogPost6Title":"DPH UK & HMRC","blogPost6Desc":"Požadavky na DPH pro UK.","blogPost7Title":"Norsko VOEC","blogPost7Desc":"Norský systém VOEC.","blogPostNumberExample":"např. LG123456789SG","tracking8Title":"Švýcarská DPH","blogPost8Desc":"Švýcarské požadavky na DPH.","enterDestinationPostcode":"Zadejte poštovní směrovací číslo cíle","trackingCaseSensitive":"SLEDOVACÍ PÍSMENA JSOU CITLIVÁ NA VELIKOST PÍSMEN A MUSÍ BÝT VELKÁ.","usaPostcodeNote":"Pro země bez PSČ, např. Hongkong a Macao, zadejte 999077 (Hongkong) nebo 999078 (Macao).","epacDeliveryNote":"Vezměte prosím na vědomí, že všechny položky ePAC zaslané do místa určení by měly být doručeny do vaší poštovní schránky, ke dveřím, do schránky na balíky nebo ponechány na bezpečném místě!","currentTime":"Aktuální čas","timezoneNote":"Čas zobrazen v 12hodinovém formátu","sameTimeAsSingapore":"Stejný čas jako Singapur","hourAhead":"hodina před Singapurem","hoursAhead":"hodiny před Singapurem","hourBehind":"hodina za Singapurem","hoursBehind":"hodiny za Singapurem","collectAtPostOffice":"Pokud však vaše země nemá standardně k dispozici poštovní schránku, budete si ji muset vyzvednout na poště.","countriesNoMailbox":"Země, o kterých je známo, že nemají k dispozici doručování do poštovních schránek: Brunej, Čína, Indie, Izrael, Macao SAR Čína, Filipíny, Polsko a Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus NENÍ ODPOVĚDNÝ za vyřizování dodávek, protože je to mimo naši kontrolu a byli bychom raději, kdybyste sledovali stav své položky.","issuesAfterDelivery":"Jakékoli problémy s doručením po 30/45 dnech (14 dní pro SpeedPost Express) nebo stav ukazuje doručeno, ale neobdrželi jste, kontaktujte nás","cannotUseEmbed":"Pro sledování nemůžeme použít vložení, protože většina webových stránek poštovních služeb to nepodporuje.","clickLinkAbove":"Kliknutím na odkaz výše sledujte svůj balíček.","trackingDetailsNote":"Všimněte si, že podrobnosti o sledování se nemusí zobrazit ve výsledcích vyhledávání, proto se doporučuje vložit sledovací číslo do systému, abyste položku mohli sledovat.","thirdPartyWebsites":"Své balíčky můžete také sledovat na těchto webových stránkách třetích stran:","enterEmailOrPhone":"Zadejte e-mail nebo telefon","reviewShippingRates":"Prohlédněte si naše aktuální sazby za dopravu","here":"zde","contactUsForm":"Kontaktujte nás prostřednictvím","form":"formuláře","forEnquiries":"pro jakékoli dotazy týkající se vaší objednávky.","anPostNoDirectTracking":"An Post (Irsko) nepodporuje přímé sledovací odkazy ani vložené sledování.","anPostPasteManually":"Prosím, zkopírujte a vložte své sledovací číslo na jejich stránku pro sledování:","goToAnPost":"Přejít na An Post Sledování","countryMsgNL":"Pokud stav zobrazuje 'Held by Customs', kontaktujte prosím Nizozemskou celní informační linku pro pomoc:\n0800 0143 (zdarma), pondělí-pátek 7-23 hodin.\nSobota a neděle 8-16:30 hodin.\n\nDoporučuje se zaregistrovat účet u PostNL pro okamžitá push oznámení vašich balíčků:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nPokud je doručeno do PostNL Point nebo stav vám říká, abyste si jej vyzvědli na poště, budete muset zaplatit 7 EUR u přepážky. Maximálně 4 EUR, pokud je zaplaceno online.","countryMsgDE":"Doporučujeme vám stáhnout aplikaci Post & DHL pro příjem push oznámení o stavu sledování vašich balíčků:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nKontakt na zákaznický servis DHL Paket GmbH:\n+49-228-433-3112\nKontakt DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Budete muset podat dodatečné celní prohlášení o dovozu. Pokud tak neučiníte, může to vést k omezení vstupu a vrácení balíčku. \nDalší informace: https://www.posti.fi/en/receiving/customs-clearance \nDalší odkazy: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Je účtován poplatek za zpracování 4,95 EUR.\nStáhněte si aplikaci zde: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Je účtován poplatek za zpracování 8,50 PLN. \nBudete to muset zaplatit při vyzvednutí na poště,\nprotože balíček pravděpodobně nebude doručen ke dveřím nebo do vaší poštovní schránky.","countryMsgPH":"PHLPost je na Filipínách považována za neefektivní a nespolehlivou.\nProsím, vždy sledujte svůj balíček, protože stav 'na cestě k doručení'\nse někdy zobrazuje pouze po dobu 1-3 týdnů pro menší balíčky. U větších balíčků je\nvyzvednutí možné pouze v Manila Central Post Office nebo\nna nejbližší poště ve vaší oblasti. Vezměte prosím na vědomí, že je účtován poplatek za zpracování 112 PHP za balíčky\njakékoli hodnoty, které musíte zaplatit. Nezaplacení povede k vrácení balíčku\nnám. Doručení se očekává, že bude trvat 1-2 měsíce kvůli pomalým službám PHLPost. \nNemusíte platit daň za položky pod 10000 PHP, ale musíte tak učinit, pokud je hodnota rovna nebo překročí tuto částku. \nDoporučili bychom SpeedPost Express pro rychlejší proces příště, když si od nás objednáte. Poplatky však nemusí být účtovány, protože D&T pro příjemce je výchozí.","countryMsgCA":"De minimis je 20 CAD pro všechny objednávky odeslané do Kanady. Protože Singapur je součástí dohody CPTPP, cla nemusí být uplatňována, ale D&T může být uplatněn, pokud položka překročí práh 60 CAD a více nebo 100 CAD a více, což může záviset na kódu HS položky. Jakákoli hodnota nad tuto částku bude účtována DPH odpovídajícím způsobem.","countryMsgID":"Budete muset zaplatit jakékoli příslušné daně a cla při příjezdu do Indonésie. Prosím, sledujte svůj balíček a zaplaťte uvedenou částku indonéské celní správě.\nBudete také muset podat dodatečnou celní dokumentaci. Pokud tak neučiníte, může to vést k omezení vstupu nebo zabavení balíčku celní správou země. Prosím, zkontrolujte další podrobnosti zde:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Budete muset zaplatit jakékoli příslušné daně a cla při příjezdu do Indie. Prosím, sledujte svůj balíček a zaplaťte uvedenou částku indické celní správě.\nVezměte prosím na vědomí, že celní odbavení v Indii je přísné a můžete nebo nemusíte být účtovány cla, pokud hodnota vaší položky překročí 1000 INR (15 USD) - v závislosti na kódu HS, ve většině případů je to bez cla, ale můžete být účtovány vyšší cla, pokud položka překročí 5000 INR (60 USD). \nProtože India Post NEVYŘIZUJE standardně do poštovní schránky, můžete být požádáni, abyste byli doma nebo oprávněným zástupcem, abyste přijali svůj balíček nebo si jej vyzvedli na poště.","countryMsgMY":"De minimis je 500 MYR pro všechny objednávky odeslané do Malajsie. Objednávky nad tuto částku mohou být účtovány.","countryMsgUS":"Od 29. srpna 2025 bude de minimis USD800 oficiálně zrušen a dovozní cla budou standardně splatná odesílatelem v zemi původu.\nDodávky do USA VYŽADUJÍ platné telefonní číslo a e-mailovou adresu, aby se váš balíček vyhnul dalším zpožděním.","countryMsgIL":"De minimis je 240 ILS (75 USD) pro všechny zásilky do Izraele. Objednávky nad tuto částku mohou být účtovány. \nVezměte prosím na vědomí, že u objednávek odeslaných do Izraele nemusí Israel Post někdy uznat konečné doručení, jakmile je doručeno. \nProtože Israel Post NEVYŘIZUJE standardně do poštovní schránky, můžete být požádáni, abyste byli doma nebo oprávněným zástupcem, abyste přijali svůj balíček nebo si jej vyzvedli na poště.","countryMsgGB":"Vezměte prosím na vědomí, že u objednávek odeslaných do Spojeného království nemusí Royal Mail někdy uznat konečné doručení, jakmile je doručeno do vaší poštovní schránky.","countryMsgTH":"De minimis je 1500 THB (45 USD) pro všechny zásilky do Thajska. Objednávky nad tuto částku mohou být účtovány.","countryMsgTW":"De minimis je 2000 TWD (60 USD) pro všechny zásilky na Tchaj-wan. Objednávky nad tuto částku mohou být účtovány.","countryMsgMO":"Při odesílání do Macaa nejsou účtovány žádné D&T. Vezměte však prosím na vědomí, že Macau Post NEVYŘIZUJE standardně do poštovní schránky, MUSÍTE si vyzvednout svůj balíček na poště.","countryMsgBN":"Při odesílání do Bruneje nejsou účtovány žádné D&T. Vezměte však prosím na vědomí, že Brunei Post NEVYŘIZUJE standardně do poštovní schránky, MUSÍTE si vyzvednout svůj balíček na poště. \nSystém sledování pro tuto zemi není příliš stabilní a lze poskytnout pouze omezené informace a konečné výsledky doručení NEJSOU poskytovány původu.","countryMsgJP":"De minimis je 10000 JPY (65 USD) pro všechny zásilky do Japonska. Objednávky nad tuto částku mohou být účtovány.","countryMsgKR":"De minimis je 180000 KRW (150 USD) pro všechny zásilky do Jižní Koreje. Objednávky nad tuto částku mohou být účtovány.","countryMsgVN":"Pro Vietnam prosím zůstaňte DOSTUPNÍ během doručování, protože vám mohou být účtovány poplatky za zpracování při doručení položky. \nDe minimis je 1000000 (35 USD) pro všechny zásilky do Vietnamu. Objednávky nad tuto částku mohou být účtovány. \nProtože Vietnam Post NEVYŘIZUJE standardně do poštovní schránky, můžete být požádáni, abyste byli doma nebo oprávněným zástupcem, abyste přijali svůj balíček nebo si jej vyzvedli na poště.","countryMsgPP":"Položky Tracked Label budou odeslány v POPDrop/POPStop na poště. Položky SpeedPost Standard jsou obvykle odeslány na POPStop nebo POPStation.\nVezměte prosím na vědomí, že doručení položek Tracked Label je POUZE od pondělí do pátku, od 9 do 18 hodin. S výjimkou víkendů a svátků.","postedDate":"Datum odeslání:","status":"Stav:","shippedVia":"Odesláno prostřednictvím:","destination":"Cíl:","statusInPreparation":"V přípravě","statusInTransit":"V tranzitu","statusDelivered":"Doručeno","statusOutForDelivery":"Na cestě k dodání","statusArrived":"Přijel","statusProcessing":"Zpracování","statusDispatched":"Odesláno","statusReturned":"Vráceno","statusFailed":"Nepodařilo se","statusCancelled":"Zrušeno","statusHeldByCustoms":"Zadrženo celní správou","statusAwaitingCollection":"Čeká na vyzvednutí","aka":"také známý jako","thisServiceKnownAs":"Tato služba je známá jako","in":"v","viewTrackingDHL":"Zobrazit informace o sledování z DHL Express","viewTrackingSingPostSpeedPost":"Zobrazit informace o sledování z Singapore SpeedPost","viewTrackingDHLLastMile":"Zobrazit informace o sledování z DHL Express (Poslední míle)","viewTrackingDHLShipperRef":"Zobrazit informace o sledování z DHL Express (Reference odesílatele)","viewTrackingSingPost":"Zobrazit informace o sledování z Singapore Post","viewTrackingDestPost":"Zobrazit informace o sledování z","post":"Pošta","orderNumberExample":"Číslo objednávky (začíná RTNX - příklad: RTNX1234567890):","deliveryRecordNote":"Vezměte prosím na vědomí, že jakmile je položka doručena, záznam bude uložen pouze do 7 dnů a poté bude smazán.","copyrightAllRights":"Všechna práva vyhrazena.","countryAfghanistan":"Afghánistán","countryAlbania":"Albánie","countryAlgeria":"Alžírsko","countryAndorra":"Andorra","countryAngola":"Angola","countryArgentina":"Argentina","countryArmenia":"Arménie","countryAustralia":"Austrálie","countryAustria":"Rakousko","countryAzerbaijan":"Ázerbájdžán","countryBahrain":"Bahrajn","countryBangladesh":"Bangladéš","countryBelarus":"Bělorusko","countryBelgium":"Belgie","countryBhutan":"Bhután","countryBolivia":"Bolívie","countryBosnia":"Bosna a Hercegovina","countryBrazil":"Brazílie","countryBrunei":"Brunej","countryBulgaria":"Bulharsko","countryBurkinaFaso":"Burkina Faso","countryBurundi":"Burundi","countryCambodia":"Kambodža","countryCameroon":"Kamerun","countryCanada":"Kanada","countryCentralAfricanRep":"Středoafrická republika","countryChad":"Čad","countryChile":"Chile","countryChina":"Čína","countryColombia":"Kolumbie","countryCongo":"Kongo","countryCostaRica":"Kostarika","countryCroatia":"Chorvatsko","countryCyprus":"Kypr","countryCzech":"Česká republika","countryDenmark":"Dánsko","countryDjibouti":"Džibutsko","countryDominicanRep":"Dominikánská republika","countryEastTimor":"Východní Timor","countryEcuador":"Ekvádor","countryEgypt":"Egypt","countryElSalvador":"Salvador","countryEquatorialGuinea":"Rovníková Guinea","countryEstonia":"Estonsko","countryFiji":"Fidži","countryFinland":"Finsko","countryFrance":"Francie","countryGabon":"Gabon","countryGeorgia":"Gruzie","countryGermany":"Německo","countryGhana":"Ghana","countryGreece":"Řecko","countryGreenland":"Grónsko","countryGuam":"Guam","countryGuyana":"Guyana","countryHonduras":"Honduras","countryHongKong":"Hongkong","countryHungary":"Maďarsko","countryIceland":"Island","countryIndia":"Indie","countryIndonesia":"Indonésie","countryIran":"Írán","countryIreland":"Irsko","countryIsrael":"Izrael","countryItaly":"Itálie","countryIvoryCoast":"Pobřeží slonoviny","countryJapan":"Japonsko","countryJordan":"Jordánsko","countryKazakhstan":"Kazachstán","countryKenya":"Keňa","countryKiribati":"Kiribati","countryKoreaNorth":"Severní Korea","countryKoreaSouth":"Jižní Korea","countryKuwait":"Kuvajt","countryKyrgyzstan":"Kyrgyzstán","countryLaos":"Laos","countryLatvia":"Lotyšsko","countryLebanon":"Libanon","countryLesotho":"Lesotho","countryLiberia":"Libérie","countryLibya":"Libye","countryLiechtenstein":"Lichtenštejnsko","countryLithuania":"Litva","countryLuxembourg":"Lucembursko","countryMacau":"Macao","countryMadagascar":"Madagaskar","countryMalawi":"Malawi","countryMalaysia":"Malajsie","countryMaldives":"Maledivy","countryMali":"Mali","countryMalta":"Malta","countryMarshallIslands":"Marshallovy ostrovy","countryMauritania":"Mauritánie","countryMauritius":"Mauritius","countryMexico":"Mexiko","countryMicronesia":"Mikronésie","countryMoldova":"Moldavsko","countryMonaco":"Monako","countryMongolia":"Mongolsko","countryMontenegro":"Černá Hora","countryMorocco":"Maroko","countryMozambique":"Mosambik","countryMyanmar":"Myanmar","countryNamibia":"Namibie","countryNauru":"Nauru","countryNepal":"Nepál","countryNetherlands":"Nizozemsko","countryNewZealand":"Nový Zéland","countryNiger":"Niger","countryNigeria":"Nigérie","countryNiue":"Niue","countryNorthMacedonia":"Severní Makedonie","countryNorway":"Norsko","countryOman":"Omán","countryPakistan":"Pákistán","countryPalau":"Palau","countryPanama":"Panama","countryPapuaNewGuinea":"Papua-Nová Guinea","countryParaguay":"Paraguay","countryPeru":"Peru","countryPhilippines":"Filipíny","countryPoland":"Polsko","countryPortugal":"Portugalsko","countryQatar":"Katar","countryRomania":"Rumunsko","countryRussia":"Rusko","countryRwanda":"Rwanda","countrySamoa":"Samoa","countrySanMarino":"San Marino","countrySaudiArabia":"Saúdská Arábie","countrySenegal":"Senegal","countrySerbia":"Srbsko","countrySeychelles":"Seychely","countrySierraLeone":"Sierra Leone","countrySingapore":"Singapur","countrySlovakia":"Slovensko","countrySlovenia":"Slovinsko","countrySolomonIslands":"Šalamounovy ostrovy","countrySouthAfrica":"Jižní Afrika","countrySpain":"Španělsko","countrySriLanka":"Srí Lanka","countrySudan":"Súdán","countrySuriname":"Surinam","countrySwaziland":"Eswatini","countrySweden":"Švédsko","countrySwitzerland":"Švýcarsko","countrySyria":"Sýrie","countryTaiwan":"Tchaj-wan","countryTajikistan":"Táždíkistán","countryTanzania":"Tanzanie","countryThailand":"Thajsko","countryTogo":"Togo","countryTonga":"Tonga","countryTunisia":"Tunisko","countryTurkey":"Turecko","countryTurkmenistan":"Turkmenistán","countryTuvalu":"Tuvalu","countryUganda":"Uganda","countryUkraine":"Ukrajina","countryUAE":"Spojené arabské emiráty","countryUK":"Spojené království","countryUSA":"Spojené státy","countryUruguay":"Uruguay","countryUzbekistan":"Uzbekistán","countryVanuatu":"Vanuatu","countryVatican":"Vatikán","countryVenezuela":"Venezuela","countryVietnam":"Vietnam","countryWesternSahara":"Západní Sahara","countryYemen":"Jemen","countryZambia":"Zambie","countryZimbabwe":"Zimbabwe","epacUS":"Mezinárodní balíková služba první třídy","epacCH":"Priorita Plus","epacGB":"Mezinárodní sledování","epacMY":"Mezinárodní Tracked/Express","epacCA":"Mezinárodní příchozí expresní služba","epacAU":"Pack and Track International","epacNZ":"Mezinárodní ekonomické sledování","epacDE":"Warenpost International Premium","epacFR":"Mezinárodní dopis se sledováním","epacNL":"Sledování mezinárodních paketů","epacPL":"GLOBAL Expres","epacBE":"Mezinárodní Prime Inbound","epacAT":"Mezinárodní sledovaný balík","epacIN":"Mezinárodní sledovaný balík","epacFI":"Mezinárodní sledovaný dopis","epacSE":"Mezinárodní sledovaný dopis","epacNO":"PRIME Exprès","epacIT":"Vyjádřit","epacIL":"Vyjádřit","epacES":"Mezinárodní lehký balík","epacPT":"Mezinárodní modrá pošta","epacCZ":"Sledovaná zásilka do zahraničí","epacBN":"Mezinárodní ePacket","epacCN":"Mezinárodní ePacket","epacHK":"Mezinárodní ePacket","epacID":"Mezinárodní e-balík","epacMO":"Mezinárodní ePacket","epacPH":"Mezinárodní sledovaná zásilka","epacTW":"Mezinárodní ePacket","epacTH":"Mezinárodní ePacket","epacVN":"Mezinárodní E-balík (ASEAN balík)","epacKR":"K-Paket","epacJP":"Mezinárodní e-balík Light","epacIE":"Mezinárodní expresní pošta","blogSingPostEPACContent1":"SingPost ePAC (ePacket) je ekonomická sledovaná poštovní služba pro lehké mezinárodní zásilky elektronického obchodu.","blogSingPostEPACContent2":"Doručuje ji národní poštovní operátor cílové země a běžně se používá pro balíky do 2 kg, s rozměrovým limitem délka + šířka + výška pod 90 cm a délkou nepřesahující 60 cm.","blogSingPostEPACContent3":"Tato možnost byla původně nabízena pouze Hong Kong Post společně s eBay China, což umožňovalo zásilky z Číny a Hong Kongu posílat do USA se sledováním doručení bez nutnosti podpisu při doručení. Tato služba je ve Spojených státech známá jako USPS (United States Postal Service) First-Class Package International Service.","blogSingPostEPACContent4":"Od 1. ledna 2026 se ePAC nyní používá pro všechny země, aby se dodržovaly povinné předpisy UPU požadující sledování balíků a omezující doporučené položky pouze na dokumenty.","blogSingPostEPACContent5":"Předpony sledování: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS je mezinárodní prémiová expresní poštovní služba, upřednostňovaná poštovními operátory po celém světě.","blogSpeedPostEMSContent2":"Celní odbavení je obecně rychlejší než standardní pošta, ale přísnější v procesu, s úplným sledováním až do doručení.","blogSpeedPostEMSContent3":"V Singapuru je toto známé jako SpeedPost Priority International od SingPost.","blogSpeedPostEMSContent4":"Předpona sledování: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express je kurýrní služba.","blogSpeedPostExpressContent2":"V mnoha destinacích provádí DHL Express doručení na poslední míli a vybírá cla nebo daně před vydáním.","blogSpeedPostExpressContent3":"Předpona sledování: PX123456789SG (Poslední míle DHL Express používá 10místné sledovací číslo, které není veřejně viditelné, ale máme pro něj informace prostřednictvím našeho","blogSpeedPostExpressContent3Link":"Sledovacího systému.","blogUSPDDPContent1":"PDDP umožňuje předem zaplatit americká dovozní cla a daně před doručením, čímž se snižují překvapivé poplatky pro příjemce.","blogUSPDDPContent2":"Nové Předpisy (Platné od 29. srpna 2025)","blogUSPDDPContent2List1":"Povinné kódy HTS","blogUSPDDPContent2List2":"Přesné popisy položek","blogUSPDDPContent2List3":"Přísnější vymáhání cel","blogUSPDDPContent3":"Všem položkám zaslaným do USA nebude účtován žádný další tarif příjemci, protože platíme vaším jménem. Upozorňujeme však, že cena položky ve výchozím nastavení zahrnuje 10% dovozní poplatek, aby byla v souladu s předpisy.","blogUSPDDPContent4":"To platí pouze pro naše způsoby dopravy do USA, SpeedPost Priority International (EMS) a SingPost ePAC.","blogEUIOSSContent1":"EU uplatňuje DPH na všechny komerční dovozy bez ohledu na hodnotu.","blogEUIOSSContent2":"IOSS (Import One-Stop Shop)","blogEUIOSSContent3":"IOSS umožňuje prodejcům vybírat DPH EU při placení u zásilek do 150 €.","blogEUIOSSContent4":"DPH je poté odvedena prostřednictvím systému IOSS, což umožňuje rychlejší celní odbavení a žádný výběr DPH při doručení.","blogEUIOSSContent5":"U všech objednávek přes Etsy nebo eBay je DPH IOSS již vybrána při placení a uvedeme ji na daňovém referenčním čísle pro přenos dat do cílové poštovní služby prostřednictvím EDI (Electronic Data Interchange).","blogUKVATContent1":"Spojené království vyžaduje, aby byla DPH zohledněna u dovezeného zboží.","blogUKVATContent2":"U zásilek nízké hodnoty je DPH obvykle vybrána při placení a přímo odvedena HMRC prodejcem nebo tržištěm.","blogUKVATContent3":"U zásilek vyšší hodnoty může být DPH vybrána dopravcem před doručením.","blogUKVATContent4":"U všech objednávek přes Etsy nebo eBay je DPH již vybrána při placení a uvedeme ji na daňovém referenčním čísle pro přenos dat do cílové poštovní služby prostřednictvím EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"Norsko zavedlo systém VOEC (VAT on E-Commerce) pro zboží dovážené z mimo EU/EHP. To platí pro zboží v hodnotě do 3 000 NOK.","blogNorwayVOECContent2":"Prodejci se mohou zaregistrovat do systému VOEC pro výběr norské DPH při placení, což umožňuje rychlejší celní odbavení a žádný výběr DPH při doručení.","blogNorwayVOECContent3":"U všech objednávek přes Etsy nebo eBay je DPH VOEC již vybrána při placení. Sledování a celní dokumentace uvádějí daňové referenční číslo pro přenos dat do norské poštovní služby.","blogSwissVATContent1":"Švýcarsko účtuje DPH na dovezené zboží bez ohledu na hodnotu. Švýcarská federální celní správa vyžaduje, aby zahraniční prodejci vybírali DPH při placení u zboží do 65 CHF.","blogSwissVATContent2":"Prodejci registrovaní ve švýcarském systému DPH odvádějí vybranou DPH přímo, čímž zajišťují, že příjemce nezažije žádný dodatečný poplatek DPH při doručení.","blogSwissVATContent3":"U všech objednávek přes Etsy nebo eBay je švýcarská DPH již vybrána během placení a celní dokumentace zahrnuje daňové referenční číslo pro podání EDI.","dhlNoEmbed":"DHL Express nepodporuje sledování prostřednictvím vložení. Prosím","speedPostNoEmbed":"SpeedPost Singapore nepodporuje sledování prostřednictvím vložení. Prosím","operatorNoEmbed":"nepodporuje sledování prostřednictvím vložení. Prosím","clickHere":"klikněte zde","toTrackNewTab":"pro sledování (otevře se v nové kartě).","countryRU":"🇷🇺 Rusko","russiaServiceSuspended":"⚠️ DŮLEŽITÉ OZNÁMENÍ: V důsledku ruské invaze na Ukrajinu v roce 2022 SingPost společně s DHL pozastavil všechny zásilky do Ruska. V současné době Rusko neobsluhujeme, dokud nebude oznámeno obnovení služeb do této země.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Přeji vám a vaší rodině mír, radost a požehnání! 🌟","deepavaliMessage":"🪔 Šťastné Deepavali! Ať vám festival světel přinese radost, prosperitu a úspěch! ✨","diwaliMessage":"🪔 Šťastné Diwali! Ať vám festival světel přinese radost, prosperitu a úspěch! ✨","vesakMessage":"☸️ Šťastný den Vesak! Přeji vám mír, moudrost a osvícení v tento posvátný den! 🙏","vesakTHMessage":"☸️ Šťastný den Visakha Bucha! Přeji vám mír, moudrost a osvícení v tento posvátný den! 🙏","australiaNationalDayMessage":"🇦🇺 Šťastný den Austrálie! Oslava našeho národa! 🎉","canadaNationalDayMessage":"🇨🇦 Šťastný Den Kanady! Oslava našeho velkého národa! 🍁","usaNationalDayMessage":"🇺🇸 Šťastný Den nezávislosti, Ameriko! Oslava svobody a svobody! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! Vive la France! 🎊","germanyUnityDayMessage":"🇩🇪 Šťastný Den německé jednoty! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Šťastný den nadace, Japonsko! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Šťastný státní svátek, Čína! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Šťastný Den osvobození, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Šťastný Den nezávislosti, Indie! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Šťastný státní svátek, Thajsko! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Šťastný Den nezávislosti, Filipíny! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Šťastný státní svátek, Vietname! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Šťastný Den nezávislosti, Polsko! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Šťastný Den nezávislosti, Česká republika! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Ať žije král! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norsko! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Jsem rád, že Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Šťastný Den nezávislosti, Izraeli! 🎉","irelandNationalDayMessage":"🇮🇪 Šťastný den svatého Patrika, Irsko! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Šťastný den Waitangi, Nový Zéland! 🎉","switzerlandNationalDayMessage":"🇨🇭 Šťastný švýcarský národní den! Svátek národního suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgique! Fijne Nationale Feestdag! 🎊","blogPost8Title":"Vysvětlení švýcarské DPH","trackingNumberExample":"např. LG123456789SG","australianDSTTitle":"Australský letní čas je aktivní","australianDSTBothMessage":"V současné době platí jak AEDT (australský východní letní čas), tak ACDT (australský centrální letní čas).","australianAEDTMessage":"AEDT (australský východní letní čas) aktuálně platí pro Sydney, Melbourne a okolní oblasti.","australianACDTMessage":"ACDT (australský centrální letní čas) aktuálně platí pro Adelaide a jižní Austrálii.","australianDSTNote":"Výše uvedené dodací lhůty odrážejí aktuální letní čas.","filteredAllowedDestinations":"(Filtrováno podle povolených cílů)","loadingAnnouncements":"Načítání oznámení...","unableToLoadAnnouncements":"Momentálně nelze načíst oznámení služby.","viewOnSingPostWebsite":"Zobrazit na webu SingPost →","statusHeldByCustms":"V držení celnice","accessRestricted":"Přístup je omezen","vpnDetectedMessage":"Bylo zjištěno použití VPN. Pro přístup k této službě prosím vypněte VPN.","contactSupportError":"Pokud se domníváte, že se jedná o chybu, kontaktujte podporu.","postalContactsTitle":"Kontakty poštovních služeb","postalContactsNote":"Poznámka:","postalContactsPolandUKNote":"Pro Polsko a Velkou Británii budou všechny položky odeslané prostřednictvím SpeedPost Priority (EMS) zpracovány společnostmi Pocztex a Parcelforce.","postalContactsDHLNote":"Pro zásilky SpeedPost Express kontaktujte DHL prostřednictvím tohoto odkazu:","postalContactsCountry":"Země","postalContactsWebsite":"Webová stránka","postalContactsForm":"Kontaktní formulář","postalContactsPhone":"Telefonní číslo","postalContactsEmail":"Kontaktní e-mail","postalContactsFormLink":"Kontaktní formulář","postalContactsBackButton":"Zpět na formulář dotazu na balík","contactUsTitle":"Kontaktujte nás","contactNameLabel":"Jméno (ŽÁDNÉ PŘEZDÍVKY ANI TELEFONNÍ ČÍSLO)","contactEmailLabel":"E-mailová adresa (kam vám odpovíme)","contactEmailNote":"Soukromé relay e-maily (např. @privaterelay.appleid.com) nejsou přijímány. Použijte prosím platnou e-mailovou adresu.","contactEnquiryTypeLabel":"Je to?","contactSelectOption":"Vyberte možnost","contactGeneralEnquiry":"Obecný dotaz / Zpětná vazba","contactBusinessEnquiry":"Obchodní dotaz","contactOrderShippingEnquiry":"Dotaz na objednávku/dopravu","contactExchangeRefundEnquiry":"Výměna/Vrácení peněz/Vrácení","contactOthers":"Ostatní","contactParcelWarning":"Pokud váš balíček nebyl doručen více než 18/30/45 dní (14 dní pro FedEx), nebo stav ukazuje doručeno, ale není u vás, vyplňte prosím","contactParcelWarningLink":"TENTO FORMULÁŘ","contactParcelWarningEnd":"místo toho.","contactOrderNumberLabel":"Číslo objednávky","contactOrderNumberPlaceholder":"Příklad: RTNX1234567890","contactPlatformNote":"Číslo objednávky Etsy, eBay & Shopee zde. Nemáme ŽÁDNOU kontrolu nad vrácením peněz z těchto platforem. Kontaktujte prosím jejich zákaznický servis.","contactPlatformInstructions":"Pro zjištění čísla objednávky použijte prosím aplikaci, je v ní uloženo:","contactPlatformEtsy":"Etsy - Vpravo nahoře na vašem profilu → Nákupy","contactPlatformEbay":"eBay - Můj eBay → Nákupy","contactPlatformShopee":"Shopee - Já → Zobrazit historii nákupů (nebo klikněte na K odeslání/K přijetí)","contactRefundNote1":"Pokud se dotazujete na vrácení/vrácení peněz pro platformy, ze kterých jste nakoupili, vezměte prosím na vědomí, že nemáme ŽÁDNOU kontrolu nad vrácením peněz z těchto platforem. Kontaktujte prosím jejich zákaznický servis.","contactRefundNote2":"Pro vrácení nebo výměnu nepovolujeme rukavice maimai, pokud již byly použity při otevření (viditelné skvrny nebo prané v pračce/ručně), a nejsou povoleny vrácení ani výměny zábavních karet. Děkujeme.","contactRefundNote3":"Vezměte prosím na vědomí, že pro vrácení peněz přes Payhip kontaktujte svou banku nebo podporu Payhip na support@payhip.com, pokud jste neobdrželi vrácení peněz, protože nemáme kontrolu nad procesem.","contactMessageLabel":"Vaše zpráva (až 1000 znaků)","contactCharacterCount":"znaků","contactSpamWarningNote":"Poznámka:","contactSpamWarning":"Nevyžádané nabídky na SEO, návrh webu, půjčky nebo podobné služby budou automaticky odmítnuty.","contactAgreementText1":"Klikněte prosím na \"Souhlasím\", pokud souhlasíte s tím, aby vaše e-mailová adresa byla použita pro Rhythm Nexus k odpovědi, protože to vyžadujeme pro přečtení vaší odpovědi a odpověď vám, jakmile přijdeme s řešením vašeho dotazu.","contactAgreementText2":"Vezměte prosím na vědomí, že naše odpověď bude trvat 3-5 pracovních dní nebo déle během vysokého objemu e-mailů na naší straně.","contactAgreeCheckbox":"Souhlasím","contactSuccessMessage":"Vaše zpráva byla úspěšně odeslána! Odpovíme do 3-5 pracovních dnů.","contactErrorMessage":"Nepodařilo se odeslat zprávu. Zkuste to prosím znovu.","contactGeneralError":"Došlo k chybě. Zkuste to prosím později.","contactSubmitting":"Odesílání...","contactSubmit":"Odeslat","contactAlertAgree":"Pro odeslání formuláře prosím souhlaste s podmínkami.","parcelEnquiryTitle":"Dotaz na balíček","parcelInfoText":"Tento formulář je pro balíčky, které nejsou doručeny více než 18/30/45 dní (14 dní pro FedEx/DHL), nebo ukázaly stav doručeno, ale nejsou u vás.","parcelInfoLink":"Klikněte zde","parcelInfoEnd":"pro další dotazy.","parcelWaitTitle":"Počkejte prosím na váš balíček","parcelWaitText1":"Počkejte prosím na doručení vašeho balíčku. Vezměte prosím na vědomí, že mezinárodní dodávky NEJSOU stejné jako místní dodávky, protože potřebují čas. Děkujeme!","parcelWaitText2":"Pokud se po 18 dnech (7 dnů pro Singapur) nebo více nezobrazí žádný stav, můžete nás přímo informovat.","parcelCannotSubmit":"Tento formulář nemůžete odeslat, pokud jste vybrali \"Ne\".","parcelNameLabel":"Jméno","parcelOrderNumberLabel":"Číslo objednávky (Příklad: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"E-mailová adresa (odpovíme vám zde)","parcelEmailNote":"Soukromé relay e-maily nejsou přijímány. Použijte prosím platnou e-mailovou adresu.","parcelShippingMethodLabel":"Vybraná metoda dopravy?","parcelSelectShipping":"Vyberte metodu dopravy","parcelSingPostEpac":"SingPost ePacket (nebo ePAC) - také známý jako SpeedPost Saver International (Sledování: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost předplacený sledovaný štítek (Sledování: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Sledování: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Sledování: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Sledování: PX123456789SG)","parcelDHL":"DHL Express (pouze země EU) (Sledování: 1234567890)","parcelTrackingNumberLabel":"Číslo sledování vašeho balíčku?","parcelUndeliveredLabel":"Nebyl váš balíček nedoručen více než 18/30/45 dní? (Singapurské místní služby >7 dní, >14 dní pro SpeedPost Express/DHL)","parcelSelectOption":"Vyberte možnost","parcelYes":"Ano","parcelNo":"Ne","parcelDeliveredButMissingLabel":"Ukázal váš balíček stav doručeno, ale není ve vaší schránce/bezpečném místě/u dveří?","parcelCaseReferenceLabel":"Referenční ID případu z místní pošty","parcelCaseReferencePlaceholder":"Napište NA, pokud jste ze Singapuru","parcelCaseReferenceNote":"Před odesláním tohoto formuláře kontaktujte prosím svou místní poštu telefonicky nebo e-mailem a získejte od nich referenční ID případu. Poté jej zde zadejte.","parcelCaseReferenceLink":"Odkaz na kontakty poštovních služeb","parcelCaseReferenceMandatory":"NAPIŠTE NA POUZE POKUD JSTE ZE SINGAPURU. Pro ostatní země je POVINNÉ poskytnout. Vyžadováno i pro SpeedPost Express, pro ID případu DHL.","parcelImageEvidenceLabel":"Obrazový důkaz (pro doručené, ale chybějící balíčky)","parcelImageWarning":"Pro dodatečné ověření potřebujeme obrazový důkaz, abychom prokázali, že neděláte falešné tvrzení o nedoručení balíčku. (Pouze pro balíčky, které jsou již doručeny, ale nejsou ve schránce/venku u dveří. Můžeme zamítnout váš nárok, pokud není poskytnut fotografický důkaz pro doručené položky. Ignorujte to, pokud vaše položka NEUKÁZALA stav doručeno.)","parcelImageNote":"Nahrajte 1 podporovaný soubor: obrázek. Max 1 GB.","parcelAgreementText":"Klikněte prosím na \"Souhlasím\", pokud se ujistíte, že to, co se stalo s vaším balíčkem, byla pravda.","parcelAgreeCheckbox":"Souhlasím","parcelSuccessMessage":"Váš dotaz na balíček byl úspěšně odeslán! Odpovíme do 3-5 pracovních dnů.","parcelErrorMessage":"Nepodařilo se odeslat dotaz. Zkuste to prosím znovu.","parcelGeneralError":"Došlo k chybě. Zkuste to prosím později.","parcelAlertWait":"Počkejte prosím na doručení vašeho balíčku. Tento formulář můžete odeslat po uplynutí stanovené čekací doby.","parcelAlertAgree":"Pro odeslání formuláře prosím souhlaste s podmínkami.","parcelAlertCaseReference":"Zadejte prosím referenční ID případu od vaší místní pošty nebo napište NA, pokud jste ze Singapuru.","parcelSubmitting":"Odesílání...","parcelSubmit":"Odeslat","destinationNotAllowed":"Přístup do této cílové země není z vašeho místa dostupný. Vyberte prosím jinou destinaci.","lookalikeDomainWarning":"Toto není sledovací číslo, ale odkaz na web, který se vydává za přepravce. Nezadávejte tam osobní ani platební údaje.","lookalikeDomainOfficial":"Oficiální web:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Mae Rhythm Nexus yn defnyddio rhwydweithiau masnachol premiwm. Fodd bynnag, yr union eiliad y mae'n cyrraedd eich gwlad, trosglwyddir y ddalfa i'r cludwr domestig lleol (e.e., USPS, Royal Mail, DHL yn lleol). Mae rhagddodiaid tracio yn newid systemau trin ar y trothwy hwn, ond mae ein traciwr parseli cyffredinol yn pwytho'r statysau hyn at ei gilydd i roi gwelededd di-dor i chi.","trackingLastMileTitle":"Rhwydwaith Dosbarthu'r Filltir Olaf","trackingCustomsClearanceBody":"Rhaid i bob eitem drawsffiniol glirio asiantaeth tollau eich gwlad leol. Mae ein hofferyn yn monitro trosglwyddiadau o gyrraedd y cyfleuster mewnforio i drosglwyddo i'r tollau. Bydd patrolau'r ffin yn gwirio codau HS ac yn sicrhau bod TAW neu dollau cywir wedi'u talu (e.e., IOSS yn yr UE, VOEC yn Norwy). Monitrwch y tracio'n benodol am rybuddion \"Held at Customs\".","trackingCustomsClearanceTitle":"Gwybodaeth Clirio Tollau","trackingProcessingOriginBody":"Ar ol ei ollwng i mewn, mae'r eitem yn mynd i'r ganolfan brosesu tarddiad lle caiff ei sganio, ei phwyso, a'i rhoi trwy sgrinio diogelwch allforio cynradd. Yna caiff ei hanfon i'r gyfnewidfa bost ryngwladol. Mae amserlenni hedfan yn dibynnu ar led band cargo sydd ar gael. Peidiwch a phoeni os yw'n aros yn y statws hwn am sawl diwrnod.","trackingProcessingOriginTitle":"Prosesu yn y Canolfan Tarddiad","trackingInfoReceivedBody":"Pan brosesir archeb am y tro cyntaf ar ein llwyfannau e-fasnach (megis Etsy, eBay, neu werthiannau uniongyrchol), caiff y rhif tracio ei gynhyrchu'n electronig. Mae'r cludwr yn derbyn data'r llwyth cyn cymryd meddiant corfforol o'r blwch. Caniatewch 1 i 3 diwrnod busnes i'r parsel gael ei dderbyn i'r cyfleuster didoli corfforol.","trackingInfoReceivedTitle":"Gwybodaeth Wedi'i Derbyn","trackingStatusesIntro":"Diolch am ddefnyddio ein hofferyn unedig ar gyfer tracio parseli rhyngwladol. Gan fod eich pecyn yn teithio ar draws sawl ffin fyd-eang, gall y statysau tracio fod yn gymhleth. Mae deall cylch bywyd logisteg yn helpu i osod disgwyliadau clir.","trackingStatusesTitle":"Deall Statysau Tracio","footerDesc":"Eich prif gyrchfan ar gyfer cardiau adloniant arcade, menig gemau rhythm, a nwyddau arbenigol. Mwynhewch e-fasnach fyd-eang gyda thracio parseli rhyngwladol di-dor a data cludo dibynadwy.","amText":"yb","pmText":"yh","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Tir Newydd)","tzAST":"AST (Iwerydd)","tzEST":"EST (Dwyrain)","tzCST":"CST (Canol)","tzMST":"MST (Mynydd)","tzPST":"PST (Môr Tawel)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Beijing","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast Kaliningrad (UTC+2)","tzMoscow":"Moscfa/Rwsia Orllewinol (UTC+3)","tzSamara":"Oblast Samara (UTC+4)","tzUral":"Rhanbarth Ural (UTC+5)","tzOmsk":"Oblast Omsk (UTC+6)","tzKrasnoyarsk":"Krai Krasnoyarsk (UTC+7)","tzIrkutsk":"Oblast Irkutsk (UTC+8)","tzSakha":"Sakha Gweriniaeth (UTC+9)","tzPrimorsky":"Krai Primorsky (UTC+10)","tzMagadan":"Oblast Magadan (UTC+11)","tzKamchatka":"Krai Kamchatka (UTC+12)","dstDayStartsLabel":"Mae amser haf yn dechrau","dstDayEndsLabel":"Mae amser haf yn dod i ben","dstRevertsLabel":"dychwelyd i amser safonol","dstEuropeLabel":"Ewrop","dstNewZealandLabel":"Seland Newydd","englishResponseNotice":"Hysbysiad: Ymatebir i bob ymholiad yn Saesneg. Os cyflwynwch mewn iaith arall, efallai y bydd eich neges yn cael ei chyfieithu i'r Saesneg i'w dilysu.","contactNamePlaceholder":"E.e: Dafydd Jones","systemRequirementsTitle":"Fersiynau system a gefnogir yn isafswm","systemRequirements":"Windows: Windows 7 (with ESU updates installed) neu uwch\nmacOS: macOS 12 neu uwch\nAndroid: Android 13 neu uwch\niPhone/iOS: iOS 17 neu uwch\nLinux: Dosbarthiad sy'n cael ei gefnogi ar hyn o bryd gyda diweddariadau diogelwch gweithredol","goodFridayEasterGreeting":"Pasg Hapus! Heddwch a llawenydd ar Dydd Gwener y Groglith ac ar y Pasg.","christmasGreeting":"Nadolig Llawen a Blwyddyn Newydd Dda! Heddwch a llawenydd o 25 Rhagfyr i 5 Ionawr.","captchaSystemRequirements":"Gofynion system isaf: Windows 7 (with ESU updates installed) neu 11, macOS 10.15+, neu fersiwn ddiweddaraf Android/iOS.","title":"Dilysu Mynediad","subtitle":"Cwblhewch yr her isod i barhau.","selectLanguage":"Dewis Iaith","selectLanguagePlaceholder":"-- Dewiswch iaith --","loadingChallenge":"Wrthi'n llwytho'r her...","answerLabel":"Eich ateb:","answerPlaceholder":"Rhowch eich ateb","continueButton":"Parhau","refreshButton":"Her Newydd","verifying":"Wrthi'n dilysu...","chooseLanguageFirst":"Dewiswch iaith yn gyntaf.","loadFailed":"Methodd llwytho'r her. Rhowch gynnig arall arni.","expiredChallenge":"Mae'r her wedi dod i ben. Wrthi'n llwytho her newydd...","verifyFailed":"Methodd y dilysiad. Rhowch gynnig arall arni.","home":"Hafan","blog":"Blog","aboutUs":"Amdanom Ni","faq":"Cwestiynau Cyffredin","contact":"Cysylltu","trackPackage":"Olrhain Parsel","cnyYearOfHorseMessage":"🧧 Blwyddyn Newydd y Lleuad hapus! Dymunwn ffyniant a llawenydd i chi ym Mlwyddyn y Ceffyl! 🐴","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Heddwch, llawenydd a bendithion i chi a'ch teulu! 🌟","deepavaliMessage":"🪔 Deepavali Hapus! Boed i ŵyl y goleuadau ddod â llawenydd, ffyniant a llwyddiant! ✨","diwaliMessage":"🪔 Diwali Hapus! Boed i ŵyl y goleuadau ddod â llawenydd, ffyniant a llwyddiant! ✨","vesakMessage":"☸️ Diwrnod Vesak Hapus! Heddwch, doethineb a goleuni ar y diwrnod sanctaidd hwn! 🙏","vesakTHMessage":"☸️ Visakha Bucha Hapus! Heddwch, doethineb a goleuni ar y diwrnod sanctaidd hwn! 🙏","singaporeNationalDayMessage":"🇸🇬 Diwrnod Cenedlaethol hapus, Singapore! Yn dathlu 61 mlynedd o annibyniaeth! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesia! Dirgahayu Gweriniaeth Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Yn dathlu annibyniaeth ein cenedl! 🎊","australiaNationalDayMessage":"🇦🇺 Diwrnod Awstralia Hapus! Yn dathlu ein cenedl! 🎉","canadaNationalDayMessage":"🇨🇦 Diwrnod Canada Hapus! Yn dathlu ein cenedl fawr! 🍁","usaNationalDayMessage":"🇺🇸 Diwrnod Annibyniaeth Hapus, America! Yn dathlu rhyddid a rhyddfraint! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! Byw yn Ffrainc! 🎊","germanyUnityDayMessage":"🇩🇪 Diwrnod Undod yr Almaen Hapus! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Diwrnod Sefydlu Hapus, Japan! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Diwrnod Cenedlaethol Hapus, Tsieina! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Diwrnod Rhyddhad Hapus, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Diwrnod Annibyniaeth Hapus, India! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Diwrnod Cenedlaethol Hapus, Gwlad Thai! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Diwrnod Annibyniaeth Hapus, Pilipinas! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Diwrnod Cenedlaethol Hapus, Fietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Diwrnod Annibyniaeth Hapus, Gwlad Pwyl! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Diwrnod Annibyniaeth Hapus, Gweriniaeth Tsiec! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Hir oes i'r Brenin! 🧡","norwayConstitutionDayMessage":"🇳🇴 Llongyfarchiadau ar y diwrnod cyfansoddiad, Norwy! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Diwrnod Cenedlaethol Sweden Hapus! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Diwrnod Annibyniaeth Hapus, Y Ffindir! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Diwrnod Portiwgal Hapus! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Diwrnod Annibyniaeth Hapus, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Dydd Gŵyl Padrig Hapus, Iwerddon! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Diwrnod Waitangi Hapus, Seland Newydd! 🎉","switzerlandNationalDayMessage":"🇨🇭 Diwrnod Cenedlaethol y Swistir Hapus! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Gwlad Belg! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Diwrnod Rwsia Hapus! 🎉","taiwanFoundingDayMessage":"🇹🇼 Diwrnod Sefydlu Hapus, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Diwrnod Dwbl Deg Hapus, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Diwrnod Sefydlu RAA Hong Kong Hapus! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Diwrnod Sefydlu RAA Macau Hapus! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Diwrnod Gweithwyr Rhyngwladol Hapus! Yn dathlu llafur a hawliau gweithwyr! 🎊","laborDayUSCAMessage":"⚒️ Diwrnod Llafur Hapus! Yn anrhydeddu cyfraniadau gweithwyr! 🎉","temporaryClosureNoticeTitle":"Rhythm Nexus - Hysbysiad cau dros dro","temporaryClosureNoticeBody":"Annwyl gwsmeriaid gwerthfawr,\n\nSylwch y bydd Rhythm Nexus ar gau dros dro rhwng 21 Mawrth 2026 a 26 Mawrth 2026 oherwydd digwyddiad cwmni.\n\nI baratoi ar gyfer y cyfnod cau, bydd y siop yn cael ei rhoi ar fodd gwyliau o 20 Mawrth 2026 am 3:00 PM (UTC +8). Efallai na fydd archebion a roddir ar ol yr amser hwn yn cael eu prosesu nes i ni ailddechrau gweithrediadau.\n\nBydd gweithrediadau busnes arferol yn ailddechrau ar 27 Mawrth 2026.\n\nYmddiheurwn am unrhyw anghyfleustra ac rydym yn gwerthfawrogi eich dealltwriaeth a'ch cefnogaeth barhaus.\n\nDiolch.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Rwy'n deall","parcelTracking":"Olrhain Parsel","serviceAnnouncement":"Hysbysiad Gwasanaeth","usaWinterStormTitle":"BRYS: Storm Eira Ddifrifol - Tarfu ar Wasanaeth","usaWinterStormSubtitle":"Gwasanaeth Postol yr Unol Daleithiau (USPS) Digwyddiad Grym Mwyaf","usaWinterStormNotice1":"Oherwydd y storm eira ddifrifol sy'n effeithio ar y rhanbarth Efrog Newydd ers 23 Chwefror 2026:","usaWinterStormNotice2":"Mae gweithrediadau rhyngwladol ym Maes Awyr Rhyngwladol John F. Kennedy wedi'u hatal yn effeithiol","usaWinterStormNotice3":"Adroddwyd tarfu eang ar hedfanau a thorri ar gwasanaethau maes awyr yn sylweddol","usaWinterStormNotice4":"Mae'r amodau hyn yn cyfrif fel digwyddiad grym mwyaf y tu hwnt i reolaeth USPS","usaWinterStormNotice5":"Effaith ar y Wasanaeth:","usaWinterStormNotice6":"Cymysgedd peryglus o eira trwm, glawiad rewllyd, slwsh a rhew chwerw","usaWinterStormNotice7":"Adroddwyd tarfu mawr ac archollion pŵer eang","usaWinterStormNotice8":"Mae casglu a danfon post domestig a rhyngwladol (llythyr-bost, parseli-bost a nwyddau EMS) yn cael eu heffeithio","usaWinterStormNotice9":"Ardaloedd Cod Post yr Effeithir:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"Mae USPS yn cymryd pob cam angenrheidiol i leihau anghysur i gwsmeriaid tra'n cadw diogelwch gweithwyr. Rydym yn gwerthfawrogi eich amynedd a'ch dealltwriaeth yn ystod y digwyddiad grym mwyaf hwn.","usaWinterStormNotice12":"Diweddariad diwethaf: 25 Chwefror 2026","countryAutoDetected":"Cyrchfan wedi ei ragosod yn seiliedig ar eich lleoliad","countryAutoDetectedFromLink":"Cyrchfan wedi ei ragosod o'r ddolen","trackingNumber":"Rhif Olrhain","destinationCountry":"Gwlad Cyrchfan","postcode":"Cod Post","orderNumber":"Rhif Archeb (Enghraifft: RTNX1234567890)","fromDate":"O Ddyddiad (GOFYNNOL ar gyfer gwirio DHL)","toDate":"I Ddyddiad (GOFYNNOL ar gyfer gwirio DHL)","trackParcel":"Olrhain Parsel","selectCourier":"-- Dewis Cwmni Cludo / Gwlad --","singaporeCouriers":"Cwmnïau Cludo Singapore","topCountries":"5 Gwlad Uchaf","otherCountries":"Gwledydd Eraill","note":"NODYN","disclaimer":"YMWADIAD","importantInformation":"Gwybodaeth Bwysig:","didNotReceiveEmail":"Os na wnaethoch dderbyn eich e-bost cadarnhau o Etsy, eBay, Shopee neu Payhip, sgroliwch i lawr i chwilio am eich archeb trwy'ch cyfeiriad e-bost neu rif ffôn sy'n gysylltiedig â'r archeb hon.","searchByEmailOrPhone":"Chwilio yn ôl E-bost neu Ffôn","searchOrder":"Chwilio Archeb","trackingResult":"Canlyniad Olrhain","noOrdersFound":"Dim archebion wedi'u canfod ar gyfer yr ymholiad hwn.","pleaseEnter":"Rhowch e-bost, ffôn, neu rif archeb.","fillAllFields":"Llenwch yr holl feysydd gofynnol: rhif olrhain, gwlad cyrchfan, rhif archeb, a chod post.","noOrderMatchingFields":"Dim archeb wedi'i chanfod sy'n cyfateb i'r holl feysydd.","postcodeRequired":"Mae cod post yn ofynnol ar gyfer y cyrchfan hwn.","invalidUSZip":"Cod ZIP yr UD annilys. Defnyddiwch 5 digid neu ZIP+4.","failedGenerateURL":"Methu creu URL olrhain. Gwiriwch y mewnbwn.","trackingValidationSG":"Rhaid i rifau olrhain Singapore fod yn: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG neu PX123456789SG. Ar gyfer llwythi DHL defnyddiwch rifau 10 digid.","invalidSingPostFormat":"Fformat rhif olrhain SingPost annilys.\nFformatau derbyniol:\n• PP123456789SG → Label Wedi'i Ddilyn Rhagdaledig\n• SPNDD00012345 → Olrhain Safonol SpeedPost","welcomeTitle":"Croeso i Wefan Rhythm Nexus!","purchaseInfo":"Prynwch gennym drwy ein sianeli swyddogol, neu ymunwch â'n","purchaseInfoChina":"Prynwch gennym drwy ein sianeli swyddogol.","purchaseInfoChinaSuffix":"","telegramGroup":"grŵp Telegram","forUpdates":"am ddiweddariadau swyddogol.","ourStores":"Ein Siopau","etsyStore":"Siop Etsy","ebayStore":"Siop eBay","shopeeStore":"Siop Shopee","payhipStore":"Siop Payhip","internationalShipping":"Cludo Rhyngwladol","singaporeLocal":"Singapore Lleol","asiaOnly":"Asia yn unig","deliveryInfo":"Gwybodaeth Dosbarthu","deliveryRates2026":"Cyfraddau Dosbarthu 2026","sgDeliveryRates":"Cyfraddau Dosbarthu Singapore","speedPostRates":"Cyfraddau Rhyngwladol SpeedPost Express","aboutTitle":"Ynghylch Rhythm Nexus","aboutP1":"Fe wnaethom ddechrau ein siop yn 2022 ac wedi gwerthu ar lwyfannau fel Etsy, eBay, a Shopee dros y blynyddoedd heb fethu.","aboutP2":"Dros amser, rydym wedi adeiladu enw da cryf drwy ganolbwyntio ar gyflawni dibynadwy, cyfathrebu tryloyw, ac olrhain cywir ar gyfer pob archeb rydym yn ei hanfon.","aboutP3":"Ein nod yw darparu profiad siopa llyfn a dibynadwy i gwsmeriaid, boed yn prynu'n lleol neu'n rhyngwladol. Rydym yn addasu'n barhaus i ofynion post, tollau, a threth sy'n newid i sicrhau bod dosbarthiadau yn cyrraedd eu cyrchfannau mor effeithlon â phosibl.","aboutP4":"Diolch am gefnogi Rhythm Nexus.","faqTitle":"Cwestiynau Cyffredin","faqQ1":"Beth os yw fy eitem yn ddiffygiol? Oes gwarant?","faqA1":"Oes! Mae'r rhan fwyaf o archebion yn dod gyda gwarant 1 flwyddyn. Darparwch eich anfoneb/rhif archeb fel y gallwn ymchwilio. Nodyn: Ni chaniateir cyfnewidiadau os yw'r eitem yn cyfateb i'r disgrifiad, hyd yn oed os gwnaethoch archebu'n anghywir.","faqQ2":"A allaf olygu, diweddaru neu ganslo fy archeb?","faqA2":"Gallwch. Am resymau diogelwch, efallai y bydd angen trin newidiadau archeb trwy e-bost neu ar ein Ffurflen Gyswllt.","faqQ3":"Oes rhaid i mi dalu tollau/trethi mewnforio?","faqA3":"Nid yw tollau a dyletswyddau yn cael eu talu ymlaen llaw fel arfer, ac eithrio DDP i'r UD. Gall TAW fod yn berthnasol i'r UE, DU, AU/NZ, Norwy, Y Swistir, a thaleithiau Canada fel Saskatchewan a Manitoba, sy'n cael ei dalu eisoes yn ddiofyn. Nid oes TAW yn berthnasol i Singapore. Ni allwn gynghori ar ffioedd tollau—cysylltwch â'ch tollau lleol am fanylion.","faqQ4":"Pryd mae fy archeb yn cael ei hanfon?","faqA4":"Fel arfer caiff archebion eu hanfon o fewn 1-5 diwrnod gwaith. Yn ystod cyfnodau o nifer uchel, gall gymryd 5-7 diwrnod.","faqQ5":"Fe wnes i archebu ddwywaith drwy ddamwain. Beth ddylwn i ei wneud?","faqA5":"Rydym yn ad-dalu ffioedd cludo dyblyg yn unig. Bydd y ddwy eitem yn cael eu cludo gyda'i gilydd. Ad-daliad = (ffioedd cludo cyntaf + ail) – ffi cludo gwirioneddol.","faqQ6":"Pa mor hir mae dosbarthu'n cymryd?","faqA6":"Mae prosesu'n cymryd 1-5 diwrnod gwaith.\n\nCludo domestig:\n• Label Wedi'i Ddilyn Rhagdaledig SingPost: 2-4 diwrnod\n• SpeedPost Safonol: 1-3 diwrnod\n\nRhyngwladol:\n• SingPost ePAC: 14-30 diwrnod\n• SpeedPost Priority (EMS): 8-15 diwrnod\n• SpeedPost Express: 4-8 diwrnod\n\nGall oedi ddigwydd yn ystod tymhorau prysur.","faqQ7":"Mae fy eitem yn cael ei ddychwelyd i'r anfonwr. Beth ddylwn i ei wneud?","faqA7":"Caniateir un ail-anfon. Nid yw canslo'n bosibl ar gyfer cyfeiriadau annilys, parseli heb eu hawlio, neu ffioedd tollau heb eu talu. Cysylltwch â'ch gwasanaeth post am ail-ddosbarthu, neu anfonwch neges atom am gymorth.","faqQ8":"Mae fy eitem wedi'i golli / wedi'i ddwyn yn ystod cludo.","faqA8":"Rydym yn caniatáu un ail-anfon. Os caiff ei golli eto, rhoddir ad-daliad llawn ar ôl ffenestr dosbarthu'r cwmni cludo:\n\n• Gwasanaethau Lleol Singapore: 7 diwrnod\n• SingPost ePAC & SpeedPost Priority Rhyngwladol: 30 diwrnod\n• SpeedPost Rhyngwladol Express: 14 diwrnod","blogTitle":"Sylfaen Wybodaeth Cludo a Post","blogSubtitle":"Esboniadau swyddogol o wasanaethau post, tollau, TAW, a dyletswyddau yn berthnasol i gludo Rhythm Nexus.","readMore":"Darllen Mwy","backButton":"Nôl","copyrightText":"Cedwir pob hawl.","blogPost1Title":"Beth yw SingPost ePAC?","blogPost1Desc":"Dysgwch am SingPost ePAC (ePacket), gwasanaeth post economaidd wedi'i ddilyn ar gyfer llwythi e-fasnach rhyngwladol ysgafn.","blogPost2Title":"Beth yw SpeedPost Priority Rhyngwladol (EMS)?","blogPost2Desc":"Darganfyddwch EMS, y gwasanaeth post cyflym premiwm rhyngwladol sy'n cael ei flaenoriaethu gan weithredwyr post ledled y byd.","blogPost3Title":"Beth yw SpeedPost Express (Milltir Olaf DHL Express)?","blogPost3Desc":"Archwilio SpeedPost Express, gwasanaeth gradd cwrier gyda dosbarthu milltir olaf gan DHL Express.","blogPost4Title":"PDDP Post yr UD (Dyletswyddau Dosbarthu Wedi'u Talu)","blogPost4Desc":"Deall PDDP sy'n caniatáu dyletswyddau a threthi mewnforio'r UD i gael eu talu ymlaen llaw cyn dosbarthu.","blogPost5Title":"TAW yr UE ac IOSS wedi'u Hegluro","blogPost5Desc":"Cael mewnwelediad i TAW yr UE a'r system IOSS ar gyfer casglu TAW ar fewnforion hyd at €150.","blogPost6Title":"TAW y DU a Throsglwyddo i HMRC","blogPost6Desc":"Dysgu am ofynion TAW ar gyfer nwyddau wedi'u mewnforio yn y DU a throsglwyddo i HMRC.","blogPost7Title":"VOEC Norwy wedi'i Egluro","blogPost7Desc":"Deall system VOEC Norwy (TAW ar E-Fasnach) ar gyfer nwyddau wedi'u mewnforio o'r tu allan i'r UE/AEE.","currentTime":"Amser Cyfredol","timezoneNote":"Amser wedi'i arddangos mewn fformat 12 awr","sameTimeAsSingapore":"Yr un amser â Singapore","hourAhead":"awr o flaen Singapore","hoursAhead":"oriau o flaen Singapore","hourBehind":"awr tu ôl i Singapore","hoursBehind":"oriau tu ôl i Singapore","blogPost8Title":"TAW y Swistir wedi'i Egluro","blogPost8Desc":"Archwilio gofynion TAW y Swistir ar gyfer nwyddau wedi'u mewnforio a'r broses gasglu.","enterDestinationPostcode":"Rhowch god post cyrchfan","trackingNumberExample":"e.e. LG123456789SG","trackingCaseSensitive":"MAE LLYTHRENNAU OLRHAIN YN SENSITIF I LYTHRENNAU BACH A MAWR AC RHAID BOD MEWN LLYTHRENNAU MAWR.","usaPostcodeNote":"Ar gyfer gwledydd heb godau post, fel Hong Kong a Macau, rhowch 999077 (Hong Kong) neu 999078 (Macau).","epacDeliveryNote":"Nodwch yn GAREDIG fod pob eitem ePAC a anfonir i'r cyrchfan i gyd i gael eu dosbarthu i'ch blwch post, trothwy drws, locer parsel neu eu gadael mewn lle diogel!","countriesNoMailbox":"Gwledydd sy'n hysbys am beidio â bod â dosbarthu blwch post/blwch llythyrau ar gael: Brunei, Tsieina, India, Israel, Macau SAR Tsieina, Pilipinas, Gwlad Pwyl a Fietnam.","rhythmNexusNotResponsible":"NID YW Rhythm Nexus YN GYFRIFOL am drin y dosbarthiadau gan ei fod y tu allan i'n rheolaeth a byddem yn well gennym i chi olrhain statws eich eitem yn lle hynny.","issuesAfterDelivery":"Unrhyw broblemau gyda'ch dosbarthiad ar ôl 30/45 diwrnod (14 diwrnod ar gyfer SpeedPost Express) neu statws yn dangos wedi'i ddosbarthu ond na wnaethoch chi dderbyn, cysylltwch â ni","cannotUseEmbed":"Nid ydym yn gallu defnyddio mewnblannu ar gyfer olrhain gan nad yw'r rhan fwyaf o wefannau gwasanaeth post yn ei gefnogi.","clickLinkAbove":"Cliciwch ar y ddolen uchod i olrhain eich parsel.","trackingDetailsNote":"Nodwch efallai na fydd manylion olrhain yn ymddangos mewn canlyniadau chwilio, felly argymhellir gludo'r rhif olrhain i'r system i olrhain yr eitem.","thirdPartyWebsites":"Gallwch hefyd olrhain eich parseli ar y gwefannau trydydd parti hyn hefyd:","enterEmailOrPhone":"Rhowch e-bost neu ffôn","collectAtPostOffice":"Fodd bynnag, os nad oes gan eich gwlad flwch post fel safonol ar gael, bydd yn rhaid i chi ei gasglu yn y swyddfa bost.","reviewShippingRates":"Adolygu ein cyfraddau cludo cyfredol","here":"yma","contactUsForm":"Cysylltwch â ni drwy'r","form":"ffurflen","forEnquiries":"ar gyfer unrhyw ymholiadau sydd gennych ynghylch eich archeb.","anPostNoDirectTracking":"Nid yw An Post (Iwerddon) yn cefnogi dolenni olrhain uniongyrchol nac olrhain wedi'i fewnosod.","anPostPasteManually":"Copïwch a gludwch eich rhif olrhain yn llaw yn wefan An Post:","goToAnPost":"Ewch i An Post","postedDate":"Dyddiad Postio:","status":"Statws:","shippedVia":"Wedi'i Gludo Trwy:","destination":"Cyrchfan:","statusInPreparation":"Yn cael ei baratoi","statusInTransit":"Ar y ffordd","statusDelivered":"Wedi'i ddosbarthu","statusOutForDelivery":"Allan i'w ddosbarthu","statusArrived":"Wedi cyrraedd","statusProcessing":"Yn prosesu","statusDispatched":"Wedi'i anfon","statusReturned":"Wedi'i ddychwelyd","statusFailed":"Methodd y dosbarthiad","statusCancelled":"Wedi'i ganslo","statusHeldByCustoms":"Yn cael ei ddal gan Dollau","statusAwaitingCollection":"Yn aros i'w gasglu","aka":"hefyd yn cael ei adnabod fel","thisServiceKnownAs":"Mae'r gwasanaeth hwn yn cael ei adnabod fel","in":"yn","viewTrackingDHL":"Gweld Gwybodaeth Olrhain o DHL Express","viewTrackingSingPostSpeedPost":"Gweld Gwybodaeth Olrhain o Singapore SpeedPost","viewTrackingDHLLastMile":"Gweld Gwybodaeth Olrhain o DHL Express (Milltir Olaf)","viewTrackingDHLShipperRef":"Gweld Gwybodaeth Olrhain o DHL Express (Cyfeirnod Cludiwr)","viewTrackingSingPost":"Gweld Gwybodaeth Olrhain o Singapore Post","viewTrackingDestPost":"Gweld Gwybodaeth Olrhain o","post":"Post","orderNumberExample":"Rhif Archeb (yn dechrau gyda RTNX - enghraifft: RTNX1234567890):","deliveryRecordNote":"Nodwch unwaith y mae'r eitem wedi'i dosbarthu, dim ond am hyd at 7 diwrnod y bydd y cofnod yn cael ei storio a bydd yn cael ei ddileu.","copyrightAllRights":"Cedwir pob hawl.","filteredAllowedDestinations":"(Wedi'i hidlo ar gyfer eich cyrchfannau a ganiateir)","loadingAnnouncements":"Llwytho hysbysiadau...","unableToLoadAnnouncements":"Methu llwytho hysbysiadau gwasanaeth ar hyn o bryd.","viewOnSingPostWebsite":"Gweld ar Wefan SingPost →","accessRestricted":"Mynediad wedi'i Gyfyngu","vpnDetectedMessage":"Defnydd VPN wedi'i ganfod. Diffoddwch VPN i gael mynediad i'r gwasanaeth hwn.","contactSupportError":"Os credwch fod hyn yn gamgymeriad, cysylltwch â chymorth.","destinationNotAllowed":"Nid yw mynediad i'r wlad cyrchfan hon ar gael o'ch lleoliad. Dewiswch gyrchfan wahanol.","epacUS":"Gwasanaeth Pecyn Rhyngwladol Dosbarth Cyntaf","epacCH":"Blaenoriaeth Plus","epacGB":"Wedi'i Ddilyn Rhyngwladol","epacMY":"Wedi'i Ddilyn/Cyflym Rhyngwladol","epacCA":"Cyflym Mewnol Rhyngwladol","epacAU":"Pacio ac Olrhain Rhyngwladol","epacNZ":"Economaidd Wedi'i Ddilyn Rhyngwladol","epacDE":"Warenpost Rhyngwladol","epacFR":"Lettre internationale avec suivi","epacNL":"Pecyn Wedi'i Ddilyn Rhyngwladol","epacPL":"BYD-EANG Expres","epacBE":"Prime Mewnol Rhyngwladol","epacAT":"Parsel Wedi'i Ddilyn Rhyngwladol","epacIN":"Pecyn Wedi'i Ddilyn Rhyngwladol","epacFI":"Llythyr Wedi'i Ddilyn Rhyngwladol","epacSE":"Llythyr Wedi'i Ddilyn Rhyngwladol (PostNord MyPack Home)","epacNO":"PRIME Exprès","epacIT":"Cyflym","epacIL":"Cyflym","epacES":"Paquete Internacional Light","epacPT":"Correio Azul Internacional","epacCZ":"Sledovaná zásilka do zahraničí","epacBN":"ePacket Rhyngwladol","epacCN":"ePacket Rhyngwladol","epacHK":"ePacket Rhyngwladol","epacID":"ePacket Rhyngwladol","epacMO":"ePacket Rhyngwladol","epacPH":"Post Wedi'i Dracio Rhyngwladol","epacTW":"ePacket Rhyngwladol","epacTH":"ePacket Rhyngwladol","epacVN":"ePacket Rhyngwladol (Pecyn ASEAN)","epacKR":"K-Paced","epacJP":"ePacket Ysgafn Rhyngwladol","epacIE":"Post Cyflym Rhyngwladol","blogSingPostEPACContent1":"Mae SingPost ePAC (ePacket) yn wasanaeth post economaidd wedi'i ddilyn ar gyfer llwythi e-fasnach rhyngwladol ysgafn.","blogSingPostEPACContent2":"Caiff ei ddosbarthu gan weithredwr post cenedlaethol y wlad cyrchfan ac fe'i defnyddir yn gyffredin ar gyfer parseli o dan 2 kg, o fewn terfyn dimensiwn o hyd + lled + uchder o dan 90 cm a hyd heb fod yn fwy na 60 cm.","blogSingPostEPACContent3":"Cynigiwyd yr opsiwn hwn yn wreiddiol gan Hong Kong Post ynghyd ag eBay Tsieina yn unig, gan ganiatáu pecynnau o Tsieina a Hong Kong i bostio pecynnau bach i'r UD gydag olrhain dosbarthu heb yr angen am unrhyw lofnodwr ar ddosbarthu. Gelwir y gwasanaeth hwn fel USPS (Gwasanaeth Post yr Unol Daleithiau) Gwasanaeth Pecyn Rhyngwladol Dosbarth Cyntaf yn yr UD.","blogSingPostEPACContent4":"O 1 Ionawr 2026, defnyddir ePAC bellach ar gyfer pob gwlad i gydymffurfio â rheoliadau gorfodol UPU sy'n ei gwneud yn ofynnol olrhain ar gyfer parseli ac eitemau Cofrestredig i gael eu cyfyngu ar gyfer dogfennau yn unig.","blogSingPostEPACContent5":"Rhagddodiaid olrhain: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"Mae EMS yn wasanaeth post cyflym premiwm rhyngwladol, wedi'i flaenoriaethu gan weithredwyr post ledled y byd.","blogSpeedPostEMSContent2":"Mae clirio tollau yn gyffredinol yn gyflymach na phost safonol ond yn fwy llym yn y broses, gydag olrhain llawn hyd at ddosbarthu.","blogSpeedPostEMSContent3":"Yn Singapore, gelwir hyn yn SpeedPost Priority Rhyngwladol gan SingPost.","blogSpeedPostEMSContent4":"Rhagddodiad olrhain: EZ123456789SG","blogSpeedPostExpressContent1":"Mae SpeedPost Express yn wasanaeth gradd cwrier.","blogSpeedPostExpressContent2":"Mewn llawer o gyrchfannau, mae DHL Express yn perfformio dosbarthu milltir olaf ac yn casglu dyletswyddau neu drethi cyn rhyddhau.","blogSpeedPostExpressContent3":"Rhagddodiad olrhain: PX123456789SG (Mae milltir olaf DHL Express yn defnyddio rhif olrhain 10 digid, nad yw'n weladwy i'r cyhoedd, ond mae gennym wybodaeth amdano drwy ein","blogSpeedPostExpressContent3Link":"System Olrhain.","blogUSPDDPContent1":"Mae PDDP yn caniatáu dyletswyddau a threthi mewnforio'r UD i gael eu talu ymlaen llaw cyn dosbarthu, gan leihau taliadau annisgwyl i dderbynwyr.","blogUSPDDPContent2":"Rheoliadau Newydd (Yn Effeithiol 29 Awst 2025)","blogUSPDDPContent2List1":"Codau HTS gorfodol","blogUSPDDPContent2List2":"Disgrifiadau eitem gywir","blogUSPDDPContent2List3":"Gorfodi tariff llymach","blogUSPDDPContent3":"Ni fydd unrhyw eitemau a anfonir i'r UD yn cael eu codi unrhyw dariffau ychwanegol i'r derbynnydd gan ein bod yn talu ar eich rhan. Fodd bynnag, nodwch fod pris yr eitem yn cynnwys y ffi mewnforio 10% yn ddiofyn fel y'i gosodwyd i'w alinio â'r rheoliadau.","blogUSPDDPContent4":"Mae hyn ond yn berthnasol i'n dulliau cludo ar gyfer yr UD, SpeedPost Priority Rhyngwladol (EMS) a SingPost ePAC yn unig.","blogEUIOSSContent1":"Mae'r UE yn cymhwyso TAW ar bob mewnforion masnachol waeth beth fo'r gwerth.","blogEUIOSSContent2":"IOSS (Siop Un-Stop Mewnforio)","blogEUIOSSContent3":"Mae IOSS yn caniatáu i werthwyr gasglu TAW yr UE wrth dalu am lwythi hyd at €150.","blogEUIOSSContent4":"Yna caiff TAW ei drosglwyddo drwy'r system IOSS, gan alluogi clirio tollau cyflymach a dim casglu TAW ar ddosbarthu.","blogEUIOSSContent5":"Ar gyfer pob archeb trwy Etsy neu eBay, mae TAW IOSS eisoes wedi'i gasglu wrth dalu ac fe fyddwn yn ei nodi ar y Rhif Cyfeirnod Treth i drosglwyddo'r data i'r gwasanaeth post cyrchfan trwy EDI (Cyfnewid Data Electronig).","blogUKVATContent1":"Mae'r DU yn ei gwneud yn ofynnol i TAW gael ei gyfrif amdano ar nwyddau wedi'u mewnforio.","blogUKVATContent2":"Ar gyfer llwythi gwerth isel, fel arfer caiff TAW ei gasglu wrth dalu a'i drosglwyddo'n uniongyrchol i HMRC gan y gwerthwr neu'r farchnad.","blogUKVATContent3":"Ar gyfer llwythi gwerth uwch, efallai y caiff TAW ei gasglu gan y cludwr cyn dosbarthu.","blogUKVATContent4":"Ar gyfer pob archeb trwy Etsy neu eBay, mae TAW eisoes wedi'i gasglu wrth dalu ac fe fyddwn yn ei nodi ar y Rhif Cyfeirnod Treth i drosglwyddo'r data i'r gwasanaeth post cyrchfan trwy EDI (Cyfnewid Data Electronig).","blogNorwayVOECContent1":"Cyflwynodd Norwy system VOEC (TAW ar E-Fasnach) ar gyfer nwyddau wedi'u mewnforio o'r tu allan i'r UE/AEE. Mae hyn yn berthnasol i nwyddau gwerth hyd at NOK 3,000.","blogNorwayVOECContent2":"Gall gwerthwyr gofrestru yn y cynllun VOEC i gasglu TAW Norwy wrth dalu, gan ganiatáu clirio tollau cyflymach a dim casglu TAW ar ddosbarthu.","blogNorwayVOECContent3":"Ar gyfer pob archeb trwy Etsy neu eBay, mae TAW VOEC eisoes wedi'i gasglu wrth dalu. Mae olrhain a gwaith papur tollau yn nodi'r Rhif Cyfeirnod Treth i drosglwyddo data i wasanaeth post Norwy.","blogSwissVATContent1":"Mae'r Swistir yn codi TAW ar nwyddau wedi'u mewnforio waeth beth fo'r gwerth. Mae Gweinyddiaeth Tollau Ffederal y Swistir yn ei gwneud yn ofynnol i werthwyr tramor gasglu TAW wrth dalu ar gyfer nwyddau hyd at CHF 65.","blogSwissVATContent2":"Mae gwerthwyr sydd wedi'u cofrestru o dan system TAW y Swistir yn trosglwyddo'r TAW a gasglwyd yn uniongyrchol, gan sicrhau nad yw'r derbynnydd yn profi unrhyw dâl TAW ychwanegol ar ddosbarthu.","blogSwissVATContent3":"Ar gyfer pob archeb trwy Etsy neu eBay, mae TAW y Swistir eisoes wedi'i gasglu yn ystod talu, ac mae gwaith papur tollau yn cynnwys y Rhif Cyfeirnod Treth ar gyfer cyflwyno EDI.","optionSingPost":"🇸🇬 SingPost (SPNDD/PP)","countryAU":"🇦🇺 Awstralia","countryCA":"🇨🇦 Canada","countryDE":"🇩🇪 Yr Almaen","countryGB":"🇬🇧 Y Deyrnas Unedig","countryUS":"🇺🇸 Yr Unol Daleithiau","countryAT":"🇦🇹 Awstria","countryBE":"🇧🇪 Gwlad Belg","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Tsieina","countryCZ":"🇨🇿 Y Weriniaeth Tsiec","countryFI":"🇫🇮 Y Ffindir","countryFR":"🇫🇷 Ffrainc","countryHK":"🇭🇰 Hong Kong SAR Tsieina","countryIN":"🇮🇳 India","countryID":"🇮🇩 Indonesia","countryIE":"🇮🇪 Iwerddon","countryIL":"🇮🇱 Israel","countryIT":"🇮🇹 Yr Eidal","countryJP":"🇯🇵 Japan","countryMO":"🇲🇴 Macau SAR Tsieina","countryMY":"🇲🇾 Malaysia","countryNL":"🇳🇱 Yr Iseldiroedd","countryNZ":"🇳🇿 Seland Newydd","countryNO":"🇳🇴 Norwy","countryPH":"🇵🇭 Y Pilipinas","countryPL":"🇵🇱 Gwlad Pwyl","countryPT":"🇵🇹 Portiwgal","countryKR":"🇰🇷 De Corea","countryES":"🇪🇸 Sbaen","countrySE":"🇸🇪 Sweden","countryCH":"🇨🇭 Y Swistir","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Gwlad Thai","countryVN":"🇻🇳 Fietnam","countrySG":"🇸🇬 Singapôr","countryMsgNL":"Os yw'r statws yn dangos 'Held by Customs', cysylltwch â Llinell Gwybodaeth Tollau'r Iseldiroedd am gymorth:\n0800 0143 (am ddim), Llun-Gwener 7am-11pm.\nSad a Sul 8am-4:30pm.\n\nCynghorir i chi gofrestru cyfrif gyda PostNL i gael hysbysiadau gwthio ar unwaith o'ch parseli:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nOs yw'n cael ei ddosbarthu i bwynt PostNL neu mae'r statws yn dweud wrthych i'w gasglu yn y swyddfa bost, bydd rhaid i chi dalu 7 EUR wrth y cownter. 4 EUR ar y mwyaf os yn talu ar-lein.","countryMsgDE":"Rydym yn eich annog i lawrlwytho'r ap Post & DHL i gael hysbysiadau gwthio am statws olrhain eich parseli:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nCyswllt Gwasanaeth Cwsmeriaid DHL Paket GmbH:\n+49-228-433-3112\nCyswllt DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Bydd angen i chi gyflwyno datganiad mewnforio ychwanegol i'r tollau. Gallai methu â gwneud hyn arwain at gyfyngiad mynediad a dychwelyd y parsel. \nMwy o wybodaeth: https://www.posti.fi/en/receiving/customs-clearance \nDolenni eraill: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Mae ffioedd trin o 4.95 EUR yn daladwy.\nLlwythwch yr ap yma: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Mae ffioedd trin o 8.50 PLN yn daladwy. \nBydd rhaid i chi ei dalu wrth gasglu yn y swyddfa bost,\ngan ei bod yn annhebygol y bydd y parsel yn cael ei ddosbarthu i'ch drws neu flwch post.","countryMsgPH":"Mae PHLPost yn cael ei ystyried yn aneffeithlon ac yn annibynadwy yn y Pilipinas.\nCadwch olwg ar eich parsel bob amser oherwydd weithiau dim ond rhwng 1 i 3 wythnos y bydd statws allan ar gyfer dosbarthu \nyn ymddangos ar gyfer parseli llai. Ar gyfer parseli mwy, \ndim ond trwy Swyddfa Bost Ganolog Manila neu'r swyddfa bost agosaf \nyn eich ardal y mae casglu'n bosibl. Sylwch fod ffi drin 112PHP yn berthnasol i barseli o \nunrhyw werth y bydd angen i chi ei dalu. Bydd methu â thalu yn arwain at y parsel yn \ncael ei ddychwelyd atom. Amcangyfrifir bod y dosbarthu'n 1-2 mis oherwydd arafwch gwasanaethau PHLPost. \nNid oes angen i chi dalu trethi am eitemau o dan 10000PHP, ond bydd angen i chi os yw'n gyfartal neu uwch na'r swm hwnnw. \nByddem yn argymell SpeedPost Express ar gyfer proses gyflymach y tro nesaf y byddwch yn archebu gennym. Fodd bynnag, efallai na fydd y ffioedd yn berthnasol gan fod D&T ar gyfer derbynnydd yn rhagosodedig.","countryMsgCA":"De minimis yw 20CAD ar gyfer pob archeb a anfonir i Ganada, gan fod Singapore yn rhan o gytundeb CPTPP, efallai na fydd tollau yn berthnasol, ond gall D&T fod yn berthnasol os yw'r eitem yn mynd dros 60CAD a thrwch neu 100CAD a throthwy uwch a all ddibynnu ar god HS yr eitem. Bydd unrhyw werth uwch na'r swm hwnnw yn cael ei drethu TAW yn unol â hynny.","countryMsgID":"Mae'n ofynnol i chi dalu unrhyw drethi a thollau perthnasol wrth gyrraedd Indonesia. Cadwch olwg ar eich parsel a thalwch y swm a nodir i dollau Indonesia.\nBydd angen i chi hefyd gyflwyno gwaith papur cliri ychwanegol. Gallai methu â gwneud hyn arwain at gyfyngiad mynediad neu atafaelu'r parsel gan dollau'r wlad. Gwiriwch fanylion pellach yma:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Mae'n ofynnol i chi dalu unrhyw drethi a thollau perthnasol wrth gyrraedd India. Cadwch olwg ar eich parsel a thalwch y swm a nodir i dollau India.\nByddwch yn ymwybodol bod cliri tollau yn India yn llym a gall costau toll gael eu codi arnoch neu beidio os yw gwerth eich eitem dros 1000INR (15 USD) - yn dibynnu ar y cod HS, yn y rhan fwyaf o achosion mae'n rhydd o dollau, ond efallai y codir tollau uwch arnoch os yw'r eitem dros 5000INR (60 USD). \nGan nad yw India Post YN dosbarthu i flwch post fel safon, efallai y bydd ANGEN i chi fod gartref neu gynrychiolydd awdurdodedig i dderbyn eich parsel neu ei gasglu yn y swyddfa bost.","countryMsgMY":"De minimis yw 500MYR ar gyfer pob archeb a anfonir i Malaysia. Gall archebion uwchlaw'r swm hwnnw gael eu codi.","countryMsgUS":"O 29ain Awst 2025, bydd de minimis o USD800 yn cael ei ddileu'n swyddogol a bydd tollau mewnforio yn daladwy yn rhagosodedig i'r anfonwr yn y wlad tarddiad.\nBydd llongau i'r UDA yn GOFYN am rif ffôn a chyfeiriad e-bost dilys er mwyn i'ch parsel osgoi cael oedi pellach.","countryMsgIL":"De minimis yw 240 ILS (75 USD) ar gyfer pob archeb a gaiff ei llongio i Israel. Gall archebion uwchlaw'r swm hwnnw gael eu codi. \nSylwch ar gyfer archebion a anfonir i Israel, efallai na fydd Israel Post weithiau'n cydnabod dosbarthiad terfynol unwaith y'i dosbarthir. \nGan nad yw Israel Post YN dosbarthu i flwch post fel safon, efallai y bydd ANGEN i chi fod gartref neu gynrychiolydd awdurdodedig i dderbyn eich parsel neu ei gasglu yn y swyddfa bost.","countryMsgGB":"Sylwch ar gyfer archebion a anfonir i'r DU, efallai na fydd Royal Mail weithiau'n cydnabod dosbarthiad terfynol unwaith y'i dosbarthir i'ch blwch post.","countryMsgTH":"De minimis yw 1500THB (45 USD) ar gyfer pob archeb a gaiff ei llongio i Wlad Thai. Gall archebion uwchlaw'r swm hwnnw gael eu codi.","countryMsgTW":"De minimis yw 2000TWD (60 USD) ar gyfer pob archeb a gaiff ei llongio i Taiwan. Gall archebion uwchlaw'r swm hwnnw gael eu codi.","countryMsgMO":"Nid oes D&T yn cael ei dalu wrth anfon i Macau. Ond sylwch nad yw Macau Post YN dosbarthu i flwch post fel safon, bydd RHAID i chi gasglu eich parsel yn y swyddfa bost.","countryMsgBN":"Nid oes D&T yn cael ei dalu wrth anfon i Frunei. Ond sylwch nad yw Brunei Post YN dosbarthu i flwch post fel safon, bydd RHAID i chi gasglu eich parsel yn y swyddfa bost. \nNid yw system olrhain ar gyfer y wlad hon yn sefydlog iawn a dim ond gwybodaeth gyfyngedig a roddir, ac NID yw canlyniadau dosbarthu terfynol yn cael eu rhoi i darddiad.","countryMsgJP":"De minimis yw 10000JPY (65 USD) ar gyfer pob archeb a gaiff ei llongio i Japan. Gall archebion uwchlaw'r swm hwnnw gael eu codi.","countryMsgKR":"De minimis yw 180000KRW (150 USD) ar gyfer pob archeb a gaiff ei llongio i Dde Corea. Gall archebion uwchlaw'r swm hwnnw gael eu codi.","countryMsgVN":"Ar gyfer Fietnam, arhoswch yn GYSYLLTIEDIG yn ystod dosbarthu gan y gallai ffioedd trin gael eu codi arnoch wrth ddosbarthu'r eitem. \nDe minimis yw 1000000 (35 USD) ar gyfer pob archeb a gaiff ei llongio i Fietnam. Gall archebion uwchlaw'r swm hwnnw gael eu codi. \nGan nad yw Vietnam Post YN dosbarthu i flwch post fel safon, efallai y bydd ANGEN i chi fod gartref neu gynrychiolydd awdurdodedig i dderbyn eich parsel neu ei gasglu yn y swyddfa bost.","countryMsgPP":"Bydd eitemau Tracked Label yn cael eu postio mewn POPDrop/POPStop yn y swyddfa bost. Mae eitemau SpeedPost Standard fel arfer yn cael eu postio ar POPStop neu POPStation.\nSylwch mai dim ond bob dydd Llun i ddydd Gwener o 9am i 6pm y gwneir dosbarthiadau eitemau Tracked Label. Ac eithrio Penwythnosau a Gwyliau Cyhoeddus.","dhlNoEmbed":"Nid yw DHL Express yn cefnogi olrhain mewnol. Os gwelwch yn dda","speedPostNoEmbed":"Nid yw SpeedPost Singapore yn cefnogi olrhain mewnol. Os gwelwch yn dda","operatorNoEmbed":"nid yw'n cefnogi olrhain mewnol. Os gwelwch yn dda","clickHere":"cliciwch yma","toTrackNewTab":"i olrhain (yn agor mewn tab newydd).","countryRU":"🇷🇺 Rwsia","russiaServiceSuspended":"⚠️ HYSBYSIAD PWYSIG: Yn sgil goresgyniad Rwsia o Wcrain yn 2022, mae SingPost ynghyd â DHL wedi atal pob anfoniad i Rwsia. Nid ydym yn gwasanaethu Rwsia ar hyn o bryd tan fod cyhoeddiad am ailgychwyn gwasanaethau i'r wlad.","australianDSTTitle":"Awstralia Golau Dydd Arbed Amser Actif","australianDSTBothMessage":"Mae AEDT (Amser Golau Dydd Dwyrain Awstralia) ac ACDT (Amser Golau Dydd Canolog Awstralia) mewn grym ar hyn o bryd.","australianAEDTMessage":"Mae AEDT (Amser Golau Dydd Dwyrain Awstralia) mewn grym ar hyn o bryd ar gyfer Sydney, Melbourne, a'r ardaloedd cyfagos.","australianACDTMessage":"Mae ACDT (Amser Golau Dydd Canolog Awstralia) mewn grym ar hyn o bryd ar gyfer Adelaide a De Awstralia.","australianDSTNote":"Mae'r amseroedd dosbarthu a ddangosir uchod yn adlewyrchu'r amser arbed golau dydd cyfredol.","postalContactsTitle":"Cysylltiadau Gwasanaethau Post","postalContactsNote":"Nodyn:","postalContactsPolandUKNote":"Ar gyfer Gwlad Pwyl a'r DU, bydd pob eitem a anfonir drwy SpeedPost Priority (EMS) yn cael ei drin gan Pocztex a Parcelforce.","postalContactsDHLNote":"Ar gyfer llwythi SpeedPost Express, cysylltwch â DHL trwy'r ddolen hon:","postalContactsCountry":"Gwlad","postalContactsWebsite":"Gwefan","postalContactsForm":"Ffurflen Gyswllt","postalContactsPhone":"Rhif Cyswllt","postalContactsEmail":"E-bost Cyswllt","postalContactsFormLink":"Ffurflen Gyswllt","postalContactsBackButton":"Yn ôl i'r Ffurflen Ymholiad Parsel","statusHeldByCustms":"A ddelir gan y Tollau","contactUsTitle":"Cysylltwch â Ni","parcelDisagreeCheckbox":"Na","contactDisagreeCheckbox":"Na","contactNameLabel":"Enw","contactEmailLabel":"E-bost","contactEmailNote":"Ni dderbynnir e-byst cyfnewid preifat (e.e., @privaterelay.appleid.com). Defnyddiwch gyfeiriad e-bost dilys.","contactEnquiryTypeLabel":"A yw hyn yn?","contactSelectOption":"Dewiswch opsiwn","contactGeneralEnquiry":"Ymholiad Cyffredinol / Adborth","contactBusinessEnquiry":"Ymchwiliad Busnes","contactOrderShippingEnquiry":"Archeb / Ymholiad Cludo","contactExchangeRefundEnquiry":"Ymholiad Cyfnewid/Ad-daliad/Dychwelyd","contactOthers":"Eraill","contactParcelWarning":"Os nad yw eich parsel wedi'i ddosbarthu am fwy na 18/30/45 diwrnod (14 diwrnod ar gyfer FedEx), neu mae'r statws yn dangos wedi'i ddosbarthu ond nid yw gyda chi, llenwch y FFURFLEN HON yn lle hynny.","contactParcelWarningLink":"y FFURFLEN HON","contactParcelWarningEnd":"yn lle hynny.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"Rhifau archeb Etsy, eBay & Shopee ddim yma. Mae gennym NI reolaeth dros ad-daliadau o'r llwyfannau hyn. Cysylltwch â'u gwasanaeth cwsmeriaid ar wahân.","contactPlatformInstructions":"Defnyddiwch yr ap i edrych ar eich rhif archeb, gan ei fod wedi'i gadw yn yr ap:","contactPlatformEtsy":"Etsy - Top dde ar eich proffil → Pryniadau","contactPlatformEbay":"eBay - Fy eBay → Pryniadau","contactPlatformShopee":"Shopee - Fi → Gweld Hanes Prynu (neu gallwch glicio ar I'w Anfon/I'w Dderbyn)","contactRefundNote1":"Os ydych chi'n holi am ddychwelyd/ad-daliad o'r llwyfan y gwnaethoch brynu ohono, sylwch nad oes gennym NI reolaeth dros ad-daliadau o'r llwyfannau hyn. Cysylltwch â'u gwasanaeth cwsmeriaid ar wahân.","contactRefundNote2":"Ar gyfer dychweliadau neu gyfnewidiadau, os yw menig maimai eisoes wedi'u defnyddio pan agorwyd hwy (staeniau gweladwy neu eu golchi mewn peiriant golchi dwylo), nid ydym yn caniatáu, ac nid yw dychweliadau neu gyfnewidiadau cardiau arcêd yn cael eu caniatáu. Diolch.","contactRefundNote3":"Sylwch ar gyfer ad-daliadau trwy Payhip, os nad ydych yn derbyn yr ad-daliad, cysylltwch â'ch banc neu gymorth Payhip (support@payhip.com), gan nad oes gennym reolaeth dros y broses.","contactMessageLabel":"Neges","contactCharacterCount":"cymeriadau","contactSpamWarningNote":"Sylwch:","contactSpamWarning":"Bydd cynigion heb eu gofyn am SEO, dylunio gwefannau, benthyciadau neu wasanaethau tebyg yn cael eu gwrthod yn awtomatig.","contactAgreementText1":"Cliciwch ar \"Rwy'n Cytuno\", os ydych chi'n cytuno i'ch cyfeiriad e-bost gael ei ddefnyddio gan Rhythm Nexus i ymateb i chi, gan fod hyn yn ofynnol i ni ddarllen eich ymateb ac ymateb i chi unwaith y down allan â datrysiad i'ch ymholiad.","contactAgreementText2":"Sylwch y bydd ein hymateb yn cymryd 3-5 diwrnod gwaith, neu fwy yn ystod cyfaint uchel o e-byst ar ein rhan.","contactAgreeCheckbox":"Rwy'n Cytuno","contactSuccessMessage":"Mae eich neges wedi'i chyflwyno! Byddwn yn ymateb o fewn 3-5 diwrnod gwaith.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"Ymholiad Parsel","parcelInfoText":"Mae’r ffurflen hon ar gyfer parseli sydd heb eu danfon am fwy na 18/30/45 diwrnod (14 diwrnod ar gyfer FedEx/DHL), neu sydd wedi dangos statws danfonedig ond nad ydynt gyda chi.","parcelInfoLink":"Cliciwch yma","parcelInfoEnd":"ar gyfer ymholiadau eraill.","parcelWaitTitle":"Arhoswch am eich parsel","parcelWaitText1":"Arhoswch am ddosbarthiad eich parsel. Sylwch NAD yw dosbarthiadau rhyngwladol yr un peth â dosbarthiadau lleol oherwydd eu bod yn cymryd amser. Diolch!","parcelWaitText2":"Os nad yw statws yn ymddangos ar ôl 18 diwrnod (7 diwrnod ar gyfer Singapore) neu fwy, gallwch roi gwybod i ni yn uniongyrchol.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"Enw","parcelOrderNumberLabel":"Rhif Archeb (Enghraifft: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"E-bost","parcelEmailNote":"Ni dderbynnir e-byst cyfnewid preifat. Defnyddiwch gyfeiriad e-bost dilys.","parcelShippingMethodLabel":"Dull cludo wedi'i ddewis?","parcelSelectShipping":"Dewiswch ddull cludo","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"Rhif Olrhain","parcelUndeliveredLabel":"A yw eich parsel heb ei ddosbarthu am fwy na 18/30/45 diwrnod? (Gwasanaethau Lleol Singapore >7 diwrnod, >14 diwrnod ar gyfer SpeedPost Express/DHL)","parcelSelectOption":"Dewiswch opsiwn","parcelYes":"Oes","parcelNo":"Nac ydw","parcelDeliveredButMissingLabel":"A yw eich parsel wedi dangos statws wedi'i ddosbarthu, ond nid yw'n bresennol yn eich blwch post / man diogel / carreg drws?","parcelCaseReferenceLabel":"ID Cyfeirnod yr Achos o'r Swyddfa Bost Leol","parcelCaseReferencePlaceholder":"Rhowch NA os ydych yn dod o Singapore","parcelCaseReferenceNote":"Cyn cyflwyno'r ffurflen hon, cysylltwch â'ch swyddfa bost leol dros y ffôn neu e-bost a chael cyfeirnod achos ganddynt. Yna, rhowch eich cyfeirnod achos yma.","parcelCaseReferenceLink":"Cyfeiriwch at y ddolen hon am gysylltiadau Gwasanaeth Post","parcelCaseReferenceMandatory":"RHOI NA DIM OND OS YDYCH O SINGAPORE. Ar gyfer gwledydd eraill mae'n ORFODOL darparu. Yn ofynnol ar gyfer SpeedPost Express hefyd, ar gyfer ID achos DHL.","parcelImageEvidenceLabel":"Tystiolaeth Delwedd (ar gyfer parseli wedi'u dosbarthu ond ar goll)","parcelImageWarning":"Ar gyfer gwirio ychwanegol, mae angen tystiolaeth ddelwedd arnom i brofi nad ydych yn gwneud honiadau ffug am beidio â dosbarthu parseli. (Ar gyfer parseli sydd eisoes wedi'u dosbarthu yn unig, ond nad ydynt yn bresennol yn y blwch post/y tu allan i'r drws. Gallwn wrthod eich hawliad os na roddir tystiolaeth ffotograffig ar gyfer eitemau sydd wedi'u dosbarthu. Anwybyddwch hyn os nad oedd eich eitem wedi dangos statws wedi'i ddosbarthu.)","parcelImageNote":"Uwchlwythwch 1 ffeil a gefnogir: delwedd. Uchafswm 1 GB.","parcelAgreementText":"Cliciwch ar \"Rwy'n Cytuno\" os gwnewch yn siŵr bod yr hyn sydd wedi digwydd i'ch parsel yn wir.","parcelAgreeCheckbox":"Rwy'n Cytuno","parcelSuccessMessage":"Mae eich ymholiad parsel wedi'i gyflwyno! Byddwn yn ymateb o fewn 3-5 diwrnod gwaith.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","lookalikeDomainWarning":"Dolen i wefan sy’n dynwared cwmni cludo parseli yw hon, nid rhif olrhain. Peidiwch â rhoi manylion personol na manylion talu yno.","lookalikeDomainOfficial":"Gwefan swyddogol:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus nutzt erstklassige kommerzielle Netzwerke. Genau in dem Moment, in dem es in Ihrem Land ankommt, erfolgt jedoch die eichpflichtige Übertragung an den örtlichen inländischen Spediteur (z. B. USPS, Royal Mail, DHL vor Ort). Tracking-Präfixe ändern die Bearbeitungssysteme an diesem Schwellenwert, aber unser universeller Paket-Tracker fügt diese Status zusammen, um Ihnen eine ununterbrochene Sichtbarkeit zu bieten.","trackingLastMileTitle":"Last-Mile-Liefernetzwerk","trackingCustomsClearanceBody":"Alle grenzüberschreitenden Sendungen müssen von der Zollbehörde Ihres Landes abgefertigt werden. Unser Tool überwacht die Übergänge von der Ankunft in der Importeinrichtung bis zur Zollübergabe. Grenzpatrouillen überprüfen HS-Codes und stellen sicher, dass die Mehrwertsteuer oder Zölle korrekt abgeführt wurden (z. B. IOSS in der EU, VOEC in Norwegen). Überwachen Sie die Nachverfolgung speziell für Warnungen „Beim Zoll festgehalten“.","trackingCustomsClearanceTitle":"Informationen zur Zollabfertigung","trackingProcessingOriginBody":"Nach der Abgabe gelangt der Artikel in das Ursprungsverarbeitungszentrum, wo er gescannt, gewogen und einer primären Exportsicherheitskontrolle unterzogen wird. Anschließend wird es an den internationalen Postaustausch weitergeleitet. Die Flugpläne hängen von der verfügbaren Frachtbandbreite ab. Seien Sie nicht beunruhigt, wenn es mehrere Tage in diesem Zustand bleibt.","trackingProcessingOriginTitle":"Verarbeitung im Origin Hub","trackingInfoReceivedBody":"Wenn eine Bestellung zum ersten Mal auf unseren E-Commerce-Plattformen (wie Etsy, eBay oder Direktvertrieb) bearbeitet wird, wird die Sendungsverfolgungsnummer elektronisch generiert. Der Spediteur erhält die Sendungsdaten vor dem physischen Besitz der Box. Es kann 1 bis 3 Werktage dauern, bis das Paket in der physischen Sortieranlage eintrifft.","trackingInfoReceivedTitle":"Erhaltene Informationen","trackingStatusesIntro":"Vielen Dank, dass Sie unser einheitliches internationales Paketverfolgungstool nutzen. Da Ihr Paket über mehrere globale Grenzen hinweg reist, kann der Sendungsverfolgungsstatus komplex sein. Das Verständnis des Logistiklebenszyklus hilft dabei, klare Erwartungen zu formulieren.","trackingStatusesTitle":"Tracking-Status verstehen","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"vormittags","pmText":"nachmittags","footerQuickLinks":"Schnelllinks","footerSupportLegal":"Support & Rechtliches","copyrightText":"Alle Rechte vorbehalten.","englishResponseNotice":"Hinweis: Alle Anfragen werden auf Englisch beantwortet. Wenn Sie Ihre Nachricht in einer anderen Sprache einreichen, wird Ihre Nachricht zur Überprüfung möglicherweise ins Englische übersetzt.","parcelDisagreeCheckbox":"Ich stimme nicht zu","contactDisagreeCheckbox":"Ich stimme nicht zu","contactNamePlaceholder":"z.B. Max Mustermann","systemRequirementsTitle":"Minimal unterstützte Systemversionen","systemRequirements":"Windows: Windows 7 (with ESU updates installed) oder höher\nmacOS: macOS 12 oder höher\nAndroid: Android 13 oder höher\niPhone/iOS: iOS 17 oder höher\nLinux: Eine derzeit unterstützte Distribution mit aktiven Sicherheitsupdates","title":"Zugang überprüfen","subtitle":"Bitte lösen Sie die folgende Aufgabe, um fortzufahren.","selectLanguage":"Sprache wählen","selectLanguagePlaceholder":"-- Sprache auswählen --","loadingChallenge":"Aufgabe wird geladen...","answerLabel":"Ihre Antwort:","answerPlaceholder":"Antwort eingeben","continueButton":"Weiter","refreshButton":"Neue Aufgabe","verifying":"Überprüfe...","chooseLanguageFirst":"Bitte wählen Sie zuerst eine Sprache.","loadFailed":"Aufgabe konnte nicht geladen werden. Bitte versuchen Sie es erneut.","expiredChallenge":"Aufgabe abgelaufen. Neue Aufgabe wird geladen...","verifyFailed":"Überprüfung fehlgeschlagen. Bitte versuchen Sie es erneut.","home":"Startseite","blog":"Blog","aboutUs":"Über Uns","faq":"FAQ","contact":"Kontakt","trackPackage":"Paket Verfolgen","cnyYearOfHorseMessage":"🧧 Frohes Mondneujahr! Wir wünschen Ihnen Wohlstand und Freude im Jahr des Pferdes! 🐴","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Frieden, Freude und Segen für Sie und Ihre Familie! 🌟","deepavaliMessage":"🪔 Frohe Deepavali! Möge das Lichterfest Freude, Wohlstand und Erfolg bringen! ✨","diwaliMessage":"🪔 Frohe Diwali! Möge das Lichterfest Freude, Wohlstand und Erfolg bringen! ✨","vesakMessage":"☸️ Froher Vesak-Tag! Frieden, Weisheit und Erleuchtung an diesem heiligen Tag! 🙏","vesakTHMessage":"☸️ Froher Visakha Bucha! Frieden, Weisheit und Erleuchtung an diesem heiligen Tag! 🙏","singaporeNationalDayMessage":"🇸🇬 Froher Nationalfeiertag, Singapur! Feiern Sie 61 Jahre Unabhängigkeit! 🎉","indonesiaNationalDayMessage":"🇮🇩 Froher Unabhängigkeitstag, Indonesien! Es lebe die Republik Indonesien! 🎊","malaysiaNationalDayMessage":"🇲🇾 Froher Nationalfeiertag, Malaysia! Feiern Sie die Unabhängigkeit unseres Landes! 🎊","australiaNationalDayMessage":"🇦🇺 Frohen Australia Day! Feiern unsere Nation! 🎉","canadaNationalDayMessage":"🇨🇦 Frohen Canada Day! Feiern unsere großartige Nation! 🍁","usaNationalDayMessage":"🇺🇸 Frohen Unabhängigkeitstag, Amerika! Feiern Freiheit und Unabhängigkeit! 🎆","franceBastilleDayMessage":"🇫🇷 Fröhlichen 14. Juli! Es lebe Frankreich! 🎊","germanyUnityDayMessage":"🇩🇪 Froher Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Frohen Tag der Republik! 🇮🇹","spainNationalDayMessage":"🇪🇸 Frohen Nationalfeiertag Spaniens! 🎊","japanFoundationDayMessage":"🇯🇵 Frohen Gründungstag, Japan! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Frohen Nationalfeiertag, China! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Frohen Tag der Befreiung, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Frohen Unabhängigkeitstag, Indien! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Frohen Nationalfeiertag, Thailand! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Frohen Unabhängigkeitstag, Philippinen! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Frohen Nationalfeiertag, Vietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Frohen Unabhängigkeitstag, Polen! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Frohen Unabhängigkeitstag, Tschechien! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fröhlichen Königstag! Es lebe der König! 🧡","norwayConstitutionDayMessage":"🇳🇴 Herzlichen Glückwunsch zum Verfassungstag, Norwegen! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Frohen Nationalfeiertag Schwedens! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Frohen Unabhängigkeitstag, Finnland! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Frohen Tag Portugals! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Frohen Unabhängigkeitstag, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Frohen St. Patrick's Day, Irland! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Frohen Nationalfeiertag, Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Frohen Waitangi-Tag, Neuseeland! 🎉","switzerlandNationalDayMessage":"🇨🇭 Frohen Schweizer Bundesfeiertag! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Frohen Nationalfeiertag, Belgien! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Frohen Tag Russlands! 🎉","taiwanFoundingDayMessage":"🇹🇼 Frohen Gründungstag, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Frohen Doppelten Zehnten Tag, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Frohen Tag der Gründung der Sonderverwaltungszone Hongkong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Frohen Tag der Gründung der Sonderverwaltungszone Macau! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Frohen Internationalen Tag der Arbeit! Wir feiern Arbeit und Arbeitnehmerrechte! 🎊","laborDayUSCAMessage":"⚒️ Frohen Tag der Arbeit! Wir ehren die Beiträge der Arbeiter! 🎉","temporaryClosureNoticeTitle":"Rhythm Nexus - Hinweis auf voruebergehende Schliessung","temporaryClosureNoticeBody":"Liebe geschaetzte Kundinnen und Kunden,\n\nbitte beachten Sie, dass Rhythm Nexus aufgrund einer Firmenveranstaltung vom 21. Maerz 2026 bis zum 26. Maerz 2026 voruebergehend geschlossen ist.\n\nZur Vorbereitung der Schliessung wird der Shop ab dem 20. Maerz 2026 um 3:00 Uhr (UTC +8) in den Urlaubsmodus versetzt. Bestellungen, die nach diesem Zeitpunkt eingehen, werden moeglicherweise erst nach der Wiederaufnahme unseres Betriebs bearbeitet.\n\nDer normale Geschaeftsbetrieb wird am 27. Maerz 2026 wieder aufgenommen.\n\nWir entschuldigen uns fuer etwaige Unannehmlichkeiten und danken Ihnen fuer Ihr Verstaendnis und Ihre fortgesetzte Unterstuetzung.\n\nVielen Dank.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Ich habe verstanden","parcelTracking":"Paketverfolgung","serviceAnnouncement":"Dienstankündigung","usaWinterStormTitle":"DRINGEND: Schwerer Wintersturm - Betriebsstörung","usaWinterStormSubtitle":"United States Postal Service (USPS) Höhere Gewalt","usaWinterStormNotice1":"Aufgrund des schweren Wintersturms, der seit dem 23. Februar 2026 die Region New York betroffen hat:","usaWinterStormNotice2":"Der internationale Betrieb am internationalen Flughafen John F. Kennedy wurde praktisch eingestellt","usaWinterStormNotice3":"Weit verbreitete Flugausfälle und erhebliche Störungen der Flughafendienste gemeldet","usaWinterStormNotice4":"Diese Bedingungen stellen ein Ereignis höherer Gewalt dar, das außerhalb der Kontrolle der USPS liegt","usaWinterStormNotice5":"Auswirkungen auf den Dienst:","usaWinterStormNotice6":"Gefährliche Mischung aus schwerem Schneefall, Eisregen, Schneeregen und bitterer Kälte","usaWinterStormNotice7":"Berichtet über große Störungen und weit verbreitete Stromausfälle","usaWinterStormNotice8":"Erfassung und Zustellung von in- und ausländischem Postmail (Briefpost, Paketpost und EMS-Artikel) betroffen","usaWinterStormNotice9":"Betroffene Postleitzahlbereiche:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"Die USPS ergreift alle erforderlichen Maßnahmen, um Unannehmlichkeiten für Kunden zu minimieren und gleichzeitig die Sicherheit der Mitarbeiter zu gewährleisten. Wir schätzen Ihre Geduld und Ihr Verständnis während dieses Ereignisses höherer Gewalt.","usaWinterStormNotice12":"Zuletzt aktualisiert: 25. Februar 2026","countryAutoDetected":"Zielland basierend auf Ihrem Standort voreingestellt","countryAutoDetectedFromLink":"Zielland über Link voreingestellt","trackingNumber":"Tracking-Nummer","destinationCountry":"Zielland","postcode":"Postleitzahl","orderNumber":"Bestellnummer (Beispiel: RTNX1234567890)","fromDate":"Von Datum (ERFORDERLICH)","toDate":"Bis Datum (ERFORDERLICH)","trackParcel":"Paket Verfolgen","selectCourier":"-- Kurier / Land Wählen --","singaporeCouriers":"Singapurer Kurierdienste","topCountries":"Top 5 Länder","otherCountries":"Andere Länder","note":"HINWEIS","disclaimer":"HAFTUNGSAUSSCHLUSS","importantInformation":"Wichtige Informationen:","didNotReceiveEmail":"Wenn Sie Ihre Bestätigungs-E-Mail von Etsy, eBay, Shopee oder Payhip nicht erhalten haben, scrollen Sie nach unten, um Ihre Bestellung über Ihre E-Mail-Adresse oder Telefonnummer zu suchen, die mit dieser Bestellung verknüpft ist.","searchByEmailOrPhone":"Nach E-Mail oder Telefon suchen","searchOrder":"Bestellung Suchen","trackingResult":"Tracking-Ergebnis","noOrdersFound":"Keine Bestellungen gefunden.","pleaseEnter":"Bitte geben Sie eine E-Mail, Telefonnummer oder Bestellnummer ein.","fillAllFields":"Bitte füllen Sie alle Pflichtfelder aus: Tracking-Nummer, Zielland, Bestellnummer und Postleitzahl.","noOrderMatchingFields":"Keine Bestellung mit allen Feldern gefunden.","postcodeRequired":"Postleitzahl ist für dieses Ziel erforderlich.","invalidUSZip":"Ungültige US-Postleitzahl. Verwenden Sie 5 Ziffern oder ZIP+4.","failedGenerateURL":"Tracking-URL konnte nicht generiert werden. Bitte Eingabe überprüfen.","trackingValidationSG":"Tracking-Nummern für Singapur müssen sein: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG oder PX123456789SG. Für DHL-Sendungen verwenden Sie 10-stellige Nummern.","invalidSingPostFormat":"Ungültiges SingPost Tracking-Nummernformat.\nAkzeptierte Formate:\n• PP123456789SG → Prepaid Tracked Label\n• SPNDD00012345 → SpeedPost Standard Tracking","welcomeTitle":"Willkommen bei Rhythm Nexus!","purchaseInfo":"Kaufen Sie bei uns über unsere offiziellen Kanäle oder treten Sie unserer","purchaseInfoChina":"Kaufen Sie bei uns über unsere offiziellen Kanäle.","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram-Gruppe","forUpdates":"bei für Updates.","ourStores":"Unsere Geschäfte","etsyStore":"Etsy Shop","ebayStore":"eBay Shop","shopeeStore":"Shopee Shop","payhipStore":"Payhip Shop","internationalShipping":"Internationaler Versand","singaporeLocal":"Singapur Lokal","asiaOnly":"Nur Asien","deliveryInfo":"Lieferinformationen","deliveryRates2026":"Lieferpreise 2026","sgDeliveryRates":"Singapur Lieferpreise","speedPostRates":"SpeedPost Express International Preise","aboutTitle":"Über Rhythm Nexus","aboutP1":"Wir haben unseren Shop im Jahr 2022 eröffnet und verkaufen seitdem zuverlässig auf Plattformen wie Etsy, eBay und Shopee.","aboutP2":"Im Laufe der Zeit haben wir uns einen guten Ruf aufgebaut, indem wir uns auf zuverlässige Erfüllung, transparente Kommunikation und genaues Tracking konzentrieren.","aboutP3":"Unser Ziel ist es, Kunden ein reibungsloses und vertrauenswürdiges Einkaufserlebnis zu bieten. Wir passen uns kontinuierlich an sich ändernde Post-, Zoll- und Steueranforderungen an.","aboutP4":"Vielen Dank für Ihre Unterstützung von Rhythm Nexus.","faqTitle":"Häufig Gestellte Fragen","faqQ1":"Was ist, wenn mein Artikel defekt ist? Gibt es eine Garantie?","faqA1":"Ja! Die meisten Bestellungen haben eine 1-Jahres-Garantie. Bitte geben Sie Ihre Rechnungs-/Bestellnummer an, damit wir dies untersuchen können. Hinweis: Umtausch ist nicht gestattet, wenn der Artikel der Beschreibung entspricht, auch wenn Sie falsch bestellt haben.","faqQ2":"Kann ich meine Bestellung bearbeiten, aktualisieren oder stornieren?","faqA2":"Ja. Aus Sicherheitsgründen müssen Bestelländerungen per E-Mail oder über unser Kontaktformular abgewickelt werden.","faqQ3":"Muss ich Zoll-/Einfuhrsteuern zahlen?","faqA3":"Zoll und Abgaben werden im Allgemeinen nicht im Voraus bezahlt, außer für DDP in die USA. Die Mehrwertsteuer (MwSt.) kann für die EU, das Vereinigte Königreich, AU/NZ, Norwegen, die Schweiz und kanadische Provinzen wie Saskatchewan und Manitoba anfallen, die bereits standardmäßig bezahlt wird. Für Singapur fällt keine GST an. Wir können keine Auskunft über Zollgebühren geben – wenden Sie sich für Einzelheiten an Ihren örtlichen Zoll.","faqQ4":"Wann wird meine Bestellung versendet?","faqA4":"Bestellungen werden normalerweise innerhalb von 1-5 Werktagen versendet. In Zeiten mit hohem Aufkommen kann es 5–7 Tage dauern.","faqQ5":"Ich habe versehentlich zweimal bestellt. Was soll ich tun?","faqA5":"Wir erstatten nur doppelte Versandgebühren. Beide Artikel werden zusammen versendet. Erstattung = (erste + zweite Versandgebühr) – tatsächliche Versandgebühr.","faqQ6":"Wie lange dauert die Lieferung?","faqA6":"Die Bearbeitung dauert 1-5 Werktage.\n\nInlandsversand:\n• SingPost Prepaid Tracked Label: 2–4 Tage\n• SpeedPost Standard: 1–3 Tage\n\nInternational:\n• SingPost ePAC: 14-30 Tage\n• SpeedPost Priority (EMS): 8-15 Tage\n• SpeedPost Express: 4-8 Tage\n\nVerzögerungen können während der Hochsaison auftreten.","faqQ7":"Mein Artikel wird an den Absender zurückgeschickt. Was soll ich tun?","faqA7":"Eine erneute Zusendung ist erlaubt. Eine Stornierung ist bei ungültigen Adressen, nicht abgeholten Paketen oder unbezahlten Zollgebühren nicht möglich. Wenden Sie sich für eine erneute Zustellung an Ihren Postdienst oder schreiben Sie uns eine Nachricht.","faqQ8":"Mein Artikel ist auf dem Transportweg verloren gegangen / gestohlen worden.","faqA8":"Wir gestatten eine erneute Zusendung. Wenn er erneut verloren geht, wird nach dem Lieferfenster des Kuriers eine vollständige Rückerstattung ausgestellt:\n\n• Lokale Dienste in Singapur: 7 Tage\n• SingPost ePAC & SpeedPost Priority International: 30 Tage\n• SpeedPost Intl Express: 14 Tage","blogTitle":"Versand- & Postwissen","blogSubtitle":"Offizielle Erklärungen zu Postdiensten, Zoll, MwSt. und Abgaben.","readMore":"Mehr Lesen","backButton":"Zurück","blogPost1Title":"Was ist SingPost ePAC?","blogPost1Desc":"Erfahren Sie mehr über ePAC, einen wirtschaftlichen Postdienst.","blogPost2Title":"Was ist SpeedPost Priority International (EMS)?","blogPost2Desc":"Entdecken Sie EMS, den internationalen Premium-Express-Postdienst.","blogPost3Title":"Was ist SpeedPost Express?","blogPost3Desc":"Erkunden Sie SpeedPost Express mit DHL-Zustellung.","blogPost4Title":"USA PDDP","blogPost4Desc":"Verstehen Sie PDDP für die USA.","blogPost5Title":"EU MwSt. & IOSS","blogPost5Desc":"Einblicke in EU-MwSt. und IOSS.","blogPost6Title":"UK MwSt. & HMRC","blogPost6Desc":"MwSt.-Anforderungen für Großbritannien.","blogPost7Title":"Norwegen VOEC","blogPost7Desc":"Norwegens VOEC-System verstehen.","blogPost8Title":"Schweizer MwSt.","blogPost8Desc":"Schweizer MwSt.-Anforderungen.","enterDestinationPostcode":"Zielpostleitzahl eingeben","trackingNumberExample":"z. B. LG123456789SG","trackingCaseSensitive":"TRACKING-BUCHSTABEN SIND GROSS- UND KLEINSCHREIBUNGSEMPFINDLICH UND MÜSSEN IN GROSSBUCHSTABEN EINGEGEBEN WERDEN.","usaPostcodeNote":"Für Länder ohne Postleitzahlen, wie Hongkong und Macau, geben Sie bitte 999077 (Hongkong) oder 999078 (Macau) ein.","epacDeliveryNote":"Bitte beachten Sie FREUNDLICH, dass alle ePAC-Artikel, die an den Bestimmungsort gesendet werden, in Ihren Briefkasten, an Ihre Haustür, in ein Paketschließfach geliefert oder an einem sicheren Ort hinterlegt werden sollten!","currentTime":"Aktuelle Uhrzeit","timezoneNote":"Zeit im 12-Stunden-Format angezeigt","sameTimeAsSingapore":"Gleiche Zeit wie Singapur","hourAhead":"Stunde vor Singapur","hoursAhead":"Stunden vor Singapur","hourBehind":"Stunde hinter Singapur","hoursBehind":"Stunden hinter Singapur","collectAtPostOffice":"Wenn Ihr Land jedoch standardmäßig keinen Briefkasten zur Verfügung hat, müssen Sie ihn bei der Post abholen.","countriesNoMailbox":"Länder, in denen bekanntermaßen keine Zustellung in den Briefkasten/Briefkasten erfolgt: Brunei, China, Indien, Israel, Macau SAR China, Philippinen, Polen und Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus ist NICHT VERANTWORTLICH für die Abwicklung der Lieferungen, da dies außerhalb unserer Kontrolle liegt und wir es vorziehen würden, dass Sie Ihren Artikelstatus verfolgen.","issuesAfterDelivery":"Bei Problemen mit Ihrer Lieferung nach 30/45 Tagen (14 Tagen für SpeedPost Express) oder wenn der Status als zugestellt angezeigt wird, Sie ihn aber nicht erhalten haben, kontaktieren Sie uns bitte","filteredAllowedDestinations":"(Gefiltert für Ihre erlaubten Ziele)","loadingAnnouncements":"Ankündigungen werden geladen...","unableToLoadAnnouncements":"Dienstankündigungen können derzeit nicht geladen werden.","viewOnSingPostWebsite":"Auf der SingPost-Website ansehen →","cannotUseEmbed":"Wir können keine Einbettung für die Verfolgung verwenden, da die meisten Websites von Postdiensten dies nicht unterstützen.","clickLinkAbove":"Bitte klicken Sie auf den Link oben, um Ihr Paket zu verfolgen.","trackingDetailsNote":"Beachten Sie, dass Tracking-Details möglicherweise nicht in den Suchergebnissen angezeigt werden. Es wird daher empfohlen, die Tracking-Nummer in das System einzufügen, um den Artikel zu verfolgen.","thirdPartyWebsites":"Sie können Ihre Pakete auch auf diesen Websites von Drittanbietern verfolgen:","enterEmailOrPhone":"E-Mail oder Telefonnummer eingeben","reviewShippingRates":"Überprüfen Sie unsere aktuellen Versandkosten","here":"hier","contactUsForm":"Bitte kontaktieren Sie uns über","form":"Formular","forEnquiries":"für alle Anfragen zu Ihrer Bestellung.","anPostNoDirectTracking":"Ein Beitrag (Irland) unterstützt keine direkten Tracking-Links oder eingebettetes Tracking.","anPostPasteManually":"Bitte fügen Sie Ihre Sendungsnummer manuell auf der An-Post-Website ein.","goToAnPost":"Zu An Post gehen","countryMsgNL":"Wenn der Status 'Held by Customs' anzeigt, kontaktieren Sie bitte die niederländische Zollinformationslinie für Unterstützung:\n0800 0143 (kostenlos), Mo bis Fr von 7 bis 23 Uhr.\nSa & So von 8 bis 16:30 Uhr.\n\nEs wird empfohlen, ein Konto bei PostNL zu registrieren, um sofortige Push-Benachrichtigungen zu Ihren Paketen zu erhalten:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nWenn es an einen PostNL-Punkt geliefert wird oder der Status besagt, dass Sie es bei der Post abholen sollen, müssen Sie am Schalter 7 EUR bezahlen. Maximal 4 EUR, wenn online bezahlt.","countryMsgDE":"Wir empfehlen Ihnen, die Post & DHL App herunterzuladen, um Push-Benachrichtigungen für den Tracking-Status Ihrer Pakete zu erhalten:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH Kundenservice Kontakt:\n+49-228-433-3112\nDHL DE Kontakt: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Sie müssen eine zusätzliche Einfuhrerklärung beim Zoll einreichen. Andernfalls kann es zu Einreisebeschränkungen kommen und das Paket wird zurückgeschickt. \nWeitere Informationen: https://www.posti.fi/en/receiving/customs-clearance \nAndere Links: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Bearbeitungsgebühren von 4,95 EUR fallen an.\nLaden Sie die App hier herunter: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Bearbeitungsgebühren von 8,50 PLN fallen an. \nSie müssen diese bei der Abholung in der Postfiliale bezahlen,\nda das Paket wahrscheinlich nicht an Ihre Haustür oder Ihren Briefkasten geliefert wird.","countryMsgPH":"PHLPost gilt in den Philippinen als ineffizient und unzuverlässig.\nBitte verfolgen Sie Ihr Paket immer, da der Status 'Auf dem Weg zur Zustellung'\nmanchmal nur zwischen 1 und 3 Wochen für kleinere Pakete angezeigt wird. Für größere Pakete ist\ndie Abholung nur im Manila Central Post Office oder in der nächstgelegenen\nPostfiliale in Ihrer Nähe möglich. Bitte beachten Sie, dass eine Bearbeitungsgebühr von 112 PHP für Pakete\njeden Werts anfällt, die Sie bezahlen müssen. Bei Nichtzahlung wird das Paket an uns\nzurückgeschickt. Die Lieferung wird voraussichtlich 1-2 Monate dauern aufgrund der langsamen Dienste von PHLPost. \nSie müssen keine Steuern für Artikel unter 10000 PHP zahlen, aber Sie müssen dies tun, wenn der Wert diesem Betrag entspricht oder darüber liegt. \nWir würden SpeedPost Express für einen schnelleren Prozess beim nächsten Mal empfehlen, wenn Sie bei uns bestellen. Die Gebühren fallen jedoch möglicherweise nicht an, da D&T für den Empfänger standardmäßig gilt.","countryMsgCA":"De minimis beträgt 20 CAD für alle Bestellungen nach Kanada. Da Singapur Teil des CPTPP-Abkommens ist, fallen möglicherweise keine Zölle an, aber D&T kann anfallen, wenn der Artikel 60 CAD und darüber oder 100 CAD und darüber überschreitet, was vom HS-Code des Artikels abhängen kann. Jeder Wert darüber wird entsprechend mit MwSt. belastet.","countryMsgID":"Sie müssen alle anfallenden Steuern und Zölle bei Ankunft in Indonesien zahlen. Bitte verfolgen Sie Ihr Paket und zahlen Sie den angegebenen Betrag an den indonesischen Zoll.\nSie müssen auch zusätzliche Zollabfertigungsunterlagen einreichen. Andernfalls kann es zu Einreisebeschränkungen oder zur Beschlagnahmung des Pakets durch den Länderzoll kommen. Bitte überprüfen Sie weitere Details hier:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Sie müssen alle anfallenden Steuern und Zölle bei Ankunft in Indien zahlen. Bitte verfolgen Sie Ihr Paket und zahlen Sie den angegebenen Betrag an den indischen Zoll.\nBitte beachten Sie, dass die Zollabfertigung in Indien streng ist und Sie möglicherweise Zölle zahlen müssen, wenn der Wert Ihres Artikels über 1000 INR (15 USD) liegt - abhängig vom HS-Code, in den meisten Fällen ist es zollfrei, aber Sie könnten höhere Zölle zahlen, wenn der Artikel über 5000 INR (60 USD) liegt. \nDa India Post NICHT standardmäßig an den Briefkasten liefert, MÜSSEN Sie möglicherweise zu Hause sein oder ein autorisierter Vertreter sein, um Ihr Paket zu empfangen oder in der Postfiliale abzuholen.","countryMsgMY":"De minimis beträgt 500 MYR für alle Bestellungen nach Malaysia. Bestellungen über diesem Betrag können berechnet werden.","countryMsgUS":"Ab dem 29. August 2025 wird der De minimis von 800 USD offiziell abgeschafft und Einfuhrzölle sind standardmäßig vom Absender im Ursprungsland zu zahlen.\nUSA-Versand BENÖTIGT eine gültige Telefonnummer und E-Mail-Adresse, damit Ihr Paket weitere Verzögerungen vermeidet.","countryMsgIL":"De minimis beträgt 240 ILS (75 USD) für alle Sendungen nach Israel. Bestellungen über diesem Betrag können berechnet werden. \nBitte beachten Sie, dass Israel Post bei Bestellungen nach Israel manchmal die endgültige Zustellung nicht bestätigt, sobald sie zugestellt wurde. \nDa Israel Post NICHT standardmäßig an den Briefkasten liefert, MÜSSEN Sie möglicherweise zu Hause sein oder ein autorisierter Vertreter sein, um Ihr Paket zu empfangen oder in der Postfiliale abzuholen.","countryMsgGB":"Bitte beachten Sie, dass Royal Mail bei Bestellungen ins Vereinigte Königreich manchmal die endgültige Zustellung nicht bestätigt, sobald sie in Ihren Briefkasten geliefert wurde.","countryMsgTH":"De minimis beträgt 1500 THB (45 USD) für alle Sendungen nach Thailand. Bestellungen über diesem Betrag können berechnet werden.","countryMsgTW":"De minimis beträgt 2000 TWD (60 USD) für alle Sendungen nach Taiwan. Bestellungen über diesem Betrag können berechnet werden.","countryMsgMO":"Bei Sendungen nach Macau werden keine D&T berechnet. Bitte beachten Sie jedoch, dass Macau Post NICHT standardmäßig an den Briefkasten liefert, Sie MÜSSEN Ihr Paket in der Postfiliale abholen.","countryMsgBN":"Bei Sendungen nach Brunei werden keine D&T berechnet. Bitte beachten Sie jedoch, dass Brunei Post NICHT standardmäßig an den Briefkasten liefert, Sie MÜSSEN Ihr Paket in der Postfiliale abholen. \nDas Tracking-System für dieses Land ist nicht sehr stabil und es können nur begrenzte Informationen gegeben werden, und endgültige Lieferergebnisse werden NICHT an den Ursprung gegeben.","countryMsgJP":"De minimis beträgt 10000 JPY (65 USD) für alle Sendungen nach Japan. Bestellungen über diesem Betrag können berechnet werden.","countryMsgKR":"De minimis beträgt 180000 KRW (150 USD) für alle Sendungen nach Südkorea. Bestellungen über diesem Betrag können berechnet werden.","countryMsgVN":"Für Vietnam bleiben Sie bitte während der Zustellung ERREICHBAR, da Ihnen möglicherweise Bearbeitungsgebühren bei der Zustellung des Artikels berechnet werden. \nDe minimis beträgt 1000000 (35 USD) für alle Sendungen nach Vietnam. Bestellungen über diesem Betrag können berechnet werden. \nDa Vietnam Post NICHT standardmäßig an den Briefkasten liefert, MÜSSEN Sie möglicherweise zu Hause sein oder ein autorisierter Vertreter sein, um Ihr Paket zu empfangen oder in der Postfiliale abzuholen.","countryMsgPP":"Tracked Label-Artikel werden in POPDrop/POPStop in der Postfiliale aufgegeben. SpeedPost Standard-Artikel werden normalerweise auf POPStop oder POPStation aufgegeben.\nBitte beachten Sie, dass die Zustellung von Tracked Label-Artikeln NUR von Montag bis Freitag von 9 bis 18 Uhr erfolgt. Außer an Wochenenden und Feiertagen.","postedDate":"Versanddatum:","status":"Status:","shippedVia":"Versandt via:","destination":"Ziel:","statusInPreparation":"In Vorbereitung","statusInTransit":"Unterwegs","statusDelivered":"Zugestellt","statusOutForDelivery":"Zur Zustellung unterwegs","statusArrived":"Angekommen","statusProcessing":"In Bearbeitung","statusDispatched":"Versandt","statusReturned":"Zurückgeschickt","statusFailed":"Fehlgeschlagen","statusCancelled":"Storniert","statusHeldByCustoms":"Vom Zoll zurückgehalten","statusAwaitingCollection":"Abholbereit","aka":"auch bekannt als","thisServiceKnownAs":"Dieser Service ist bekannt als","in":"In","viewTrackingDHL":"Sendungsverfolgung von DHL Express anzeigen","viewTrackingSingPostSpeedPost":"Sendungsverfolgung von Singapore SpeedPost anzeigen","viewTrackingDHLLastMile":"Sendungsverfolgung von DHL Express (Letzte Meile) anzeigen","viewTrackingDHLShipperRef":"Sendungsverfolgung von DHL Express (Versenderreferenz) anzeigen","viewTrackingSingPost":"Sendungsverfolgung von Singapore Post anzeigen","viewTrackingDestPost":"Sendungsverfolgung von","post":"Post","orderNumberExample":"Bestellnummer (beginnt mit RTNX oder DLTB - Beispiel: RTNX1234567890):","deliveryRecordNote":"Bitte beachten Sie, dass nach der Zustellung der Artikel der Datensatz nur bis zu 7 Tage gespeichert und dann gelöscht wird.","copyrightAllRights":"Alle Rechte vorbehalten.","accessRestricted":"Zugriff Eingeschränkt","vpnDetectedMessage":"VPN-Nutzung erkannt. Bitte deaktivieren Sie das VPN, um auf diesen Service zuzugreifen.","contactSupportError":"Wenn Sie glauben, dass dies ein Fehler ist, wenden Sie sich bitte an den Support.","destinationNotAllowed":"Der Zugriff auf dieses Zielland ist von Ihrem Standort aus nicht verfügbar. Bitte wählen Sie ein anderes Ziel.","epacUS":"Erstklassiger internationaler Paketdienst","epacCH":"Priorität Plus","epacGB":"International verfolgt","epacMY":"International verfolgt/Express","epacCA":"Internationaler Eingangs-Express","epacAU":"International verpacken und verfolgen","epacNZ":"Internationales Economy Tracking","epacDE":"Warenpost International Premium","epacFR":"Internationaler Brief mit Sendungsverfolgung","epacNL":"Internationales Paket verfolgt","epacPL":"GLOBALE Expres","epacBE":"Internationaler Prime Inbound","epacAT":"Internationales verfolgtes Paket","epacIN":"Internationales verfolgtes Paket","epacFI":"Internationaler verfolgter Brief","epacSE":"Internationaler verfolgter Brief","epacNO":"PRIME Exprès","epacIT":"Äußern","epacIL":"Äußern","epacES":"Internationales Leichtpaket","epacPT":"Internationale Blaue Post","epacCZ":"Verfolgte Sendung aus dem Ausland","epacBN":"Internationales ePacket","epacCN":"Internationales ePacket","epacHK":"Internationales ePacket","epacID":"Internationales e-Paket","epacMO":"Internationales ePacket","epacPH":"Internationales Tracked Mail","epacTW":"Internationales ePacket","epacTH":"Internationales ePacket","epacVN":"Internationales E-Paket (ASEAN-Paket)","epacKR":"K-Paket","epacJP":"Internationales e-Paket Light","epacIE":"Internationaler Express-Postdienst","blogSingPostEPACContent1":"SingPost ePAC (ePacket) ist ein wirtschaftlicher Postdienst mit Sendungsverfolgung für leichte internationale E-Commerce-Sendungen.","blogSingPostEPACContent2":"Die Zustellung erfolgt durch den nationalen Postbetreiber des Ziellandes und wird üblicherweise für Pakete unter 2 kg verwendet, mit einer Maßbeschränkung von Länge + Breite + Höhe unter 90 cm und einer Länge von höchstens 60 cm.","blogSingPostEPACContent3":"Diese Option wurde zunächst nur von Hong Kong Post zusammen mit eBay China angeboten, wodurch Pakete aus China und Hongkong als kleine Päckchen in die USA gesendet werden konnten mit Sendungsverfolgung ohne Unterschriftserfordernis bei der Zustellung. Dieser Service ist in den USA als USPS (United States Postal Service) First-Class Package International Service bekannt.","blogSingPostEPACContent4":"Seit dem 1. Januar 2026 wird ePAC nun für alle Länder verwendet, um den verbindlichen UPU-Vorschriften zu entsprechen, die eine Sendungsverfolgung für Pakete erfordern und eingeschriebene Artikel nur für Dokumente vorbehalten.","blogSingPostEPACContent5":"Sendungsverfolgungspräfixe: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS ist ein internationaler Premium-Express-Postdienst, der von Postbetreibern weltweit priorisiert wird.","blogSpeedPostEMSContent2":"Die Zollabfertigung ist im Allgemeinen schneller als bei Standardpost, aber strenger im Prozess, mit vollständiger Sendungsverfolgung bis zur Zustellung.","blogSpeedPostEMSContent3":"In Singapur ist dies als SpeedPost Priority International von SingPost bekannt.","blogSpeedPostEMSContent4":"Sendungsverfolgungspräfix: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express ist ein Kurierdienst.","blogSpeedPostExpressContent2":"In vielen Zielländern übernimmt DHL Express die Zustellung auf der letzten Meile und zieht Zölle oder Steuern vor der Freigabe ein.","blogSpeedPostExpressContent3":"Sendungsverfolgungspräfix: PX123456789SG (DHL Express für die letzte Meile verwendet eine 10-stellige Sendungsverfolgungsnummer, die nicht öffentlich sichtbar ist, aber wir haben Informationen dazu über unser","blogSpeedPostExpressContent3Link":"Sendungsverfolgungssystem.","blogUSPDDPContent1":"PDDP ermöglicht es, US-Einfuhrzölle und -steuern vor der Zustellung vorzubezahlen, wodurch Überraschungsgebühren für Empfänger reduziert werden.","blogUSPDDPContent2":"Neue Vorschriften (Gültig ab 29. August 2025)","blogUSPDDPContent2List1":"Obligatorische HTS-Codes","blogUSPDDPContent2List2":"Genaue Artikelbeschreibungen","blogUSPDDPContent2List3":"Strengere Zolldurchsetzung","blogUSPDDPContent3":"Alle in die USA gesendeten Artikel werden dem Empfänger keine zusätzlichen Zölle berechnet, da wir diese in Ihrem Namen bezahlen. Beachten Sie jedoch, dass der Artikelpreis standardmäßig die 10%ige Einfuhrgebühr enthält, um den Vorschriften zu entsprechen.","blogUSPDDPContent4":"Dies gilt nur für unsere Versandmethoden in die USA, SpeedPost Priority International (EMS) und SingPost ePAC.","blogEUIOSSContent1":"Die EU erhebt MwSt. auf alle kommerziellen Einfuhren, unabhängig vom Wert.","blogEUIOSSContent2":"IOSS (Import One-Stop Shop)","blogEUIOSSContent3":"IOSS ermöglicht es Verkäufern, die EU-MwSt. beim Checkout für Sendungen bis zu 150 € einzuziehen.","blogEUIOSSContent4":"Die MwSt. wird dann über das IOSS-System abgeführt, was eine schnellere Zollabfertigung und keine MwSt.-Erhebung bei der Zustellung ermöglicht.","blogEUIOSSContent5":"Für alle Bestellungen über Etsy oder eBay wird die IOSS-MwSt. bereits beim Checkout eingezogen, und wir geben dies in der Steuerreferenznummer an, um die Daten über EDI (Electronic Data Interchange) an den Zielpostdienst zu übermitteln.","blogUKVATContent1":"Das Vereinigte Königreich verlangt, dass die MwSt. für importierte Waren berücksichtigt wird.","blogUKVATContent2":"Bei Sendungen mit geringem Wert wird die MwSt. normalerweise beim Checkout eingezogen und direkt vom Verkäufer oder Marktplatz an HMRC abgeführt.","blogUKVATContent3":"Bei höherwertigen Sendungen kann die MwSt. vom Spediteur vor der Zustellung eingezogen werden.","blogUKVATContent4":"Für alle Bestellungen über Etsy oder eBay wird die MwSt. bereits beim Checkout eingezogen, und wir geben dies in der Steuerreferenznummer an, um die Daten über EDI (Electronic Data Interchange) an den Zielpostdienst zu übermitteln.","blogNorwayVOECContent1":"Norwegen hat das VOEC-System (VAT on E-Commerce) für Waren eingeführt, die von außerhalb des EU/EWR importiert werden. Dies gilt für Waren mit einem Wert von bis zu 3.000 NOK.","blogNorwayVOECContent2":"Verkäufer können sich im VOEC-System registrieren, um die norwegische MwSt. beim Checkout einzuziehen, was eine schnellere Zollabfertigung und keine MwSt.-Erhebung bei der Zustellung ermöglicht.","blogNorwayVOECContent3":"Für alle Bestellungen über Etsy oder eBay wird die VOEC-MwSt. bereits beim Checkout eingezogen. Die Sendungsverfolgung und Zollunterlagen geben die Steuerreferenznummer an, um Daten an den norwegischen Postdienst zu übermitteln.","blogSwissVATContent1":"Die Schweiz erhebt MwSt. auf importierte Waren, unabhängig vom Wert. Die Eidgenössische Zollverwaltung verlangt von ausländischen Verkäufern, die MwSt. beim Checkout für Waren bis zu 65 CHF einzuziehen.","blogSwissVATContent2":"Verkäufer, die im Schweizer MwSt.-System registriert sind, führen die eingezogene MwSt. direkt ab, sodass dem Empfänger bei der Zustellung keine zusätzliche MwSt.-Gebühr entsteht.","blogSwissVATContent3":"Für alle Bestellungen über Etsy oder eBay wird die Schweizer MwSt. bereits beim Checkout eingezogen, und die Zollunterlagen enthalten die Steuerreferenznummer für die EDI-Übermittlung.","dhlNoEmbed":"DHL Express unterstützt keine eingebettete Sendungsverfolgung. Bitte","speedPostNoEmbed":"SpeedPost Singapur unterstützt keine eingebettete Sendungsverfolgung. Bitte","operatorNoEmbed":"unterstützt keine eingebettete Sendungsverfolgung. Bitte","clickHere":"hier klicken","toTrackNewTab":"zum Verfolgen (öffnet in neuem Tab).","optionSingPost":"🇸🇬 SingPost (SPNDD/PP)","countryAU":"🇦🇺 Australien","countryCA":"🇨🇦 Kanada","countryDE":"🇩🇪 Deutschland","countryGB":"🇬🇧 Vereinigtes Königreich","countryUS":"🇺🇸 Vereinigte Staaten","countryAT":"🇦🇹 Österreich","countryBE":"🇧🇪 Belgien","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 China","countryCZ":"🇨🇿 Tschechien","countryFI":"🇫🇮 Finnland","countryFR":"🇫🇷 Frankreich","countryHK":"🇭🇰 Hongkong SAR China","countryIN":"🇮🇳 Indien","countryID":"🇮🇩 Indonesien","countryIE":"🇮🇪 Irland","countryIL":"🇮🇱Israel","countryIT":"🇮🇹 Italien","countryJP":"🇯🇵 Japan","countryMO":"🇲🇴 Sonderverwaltungszone Macau","countryMY":"🇲🇾 Malaysia","countryNL":"🇳🇱 Niederlande","countryNZ":"🇳🇿 Neuseeland","countryNO":"🇳🇴 Norwegen","countryPH":"🇵🇭 Philippinen","countryPL":"🇵🇱 Polen","countryPT":"🇵🇹 Portugal","countryRU":"🇷🇺 Russland","countryKR":"🇰🇷 Südkorea","countryES":"🇪🇸 Spanien","countrySE":"🇸🇪 Schweden","countryCH":"🇨🇭 Schweiz","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Thailand","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬 Singapur","russiaServiceSuspended":"⚠️ WICHTIGER HINWEIS: Angesichts der russischen Invasion in der Ukraine im Jahr 2022 hat SingPost zusammen mit DHL alle Sendungen nach Russland eingestellt. Wir bedienen Russland derzeit nicht, bis die Wiederaufnahme der Dienste in das Land angekündigt wird.","goodFridayEasterGreeting":"Frohe Ostern! Ich wünsche Ihnen Frieden und Freude für Karfreitag und Ostern.","christmasGreeting":"Frohe Weihnachten und ein gutes neues Jahr! Ich wünsche Ihnen Frieden und Freude vom 25. Dezember bis 5. Januar.","captchaSystemRequirements":"Mindestsystemanforderungen: Windows 7 (with ESU updates installed) oder 11, macOS 10.15+ oder die neueste Android/iOS-Version.","australianDSTTitle":"Australische Sommerzeit aktiv","australianDSTBothMessage":"Derzeit gelten sowohl AEDT (Australian Eastern Daylight Time) als auch ACDT (Australian Central Daylight Time).","australianAEDTMessage":"Derzeit gilt AEDT (Australian Eastern Daylight Time) für Sydney, Melbourne und die umliegenden Gebiete.","australianACDTMessage":"Für Adelaide und Südaustralien gilt derzeit ACDT (Australian Central Daylight Time).","australianDSTNote":"Die oben angezeigten Lieferzeiten entsprechen der aktuellen Sommerzeit.","postalContactsTitle":"Postdienst-Kontakte","postalContactsNote":"Hinweis:","postalContactsPolandUKNote":"Für Polen und Großbritannien werden alle per SpeedPost Priority (EMS) versendeten Artikel von Pocztex und Parcelforce bearbeitet.","postalContactsDHLNote":"Für SpeedPost Express-Sendungen kontaktieren Sie bitte DHL über diesen Link:","postalContactsCountry":"Land","postalContactsWebsite":"Webseite","postalContactsForm":"Kontaktformular","postalContactsPhone":"Telefonnummer","postalContactsEmail":"E-Mail-Kontakt","postalContactsFormLink":"Kontaktformular","postalContactsBackButton":"Zurück zum Paket-Anfrageformular","contactUsTitle":"Kontaktieren Sie uns","contactNameLabel":"Name (KEINE SPITZNAMEN ODER TELEFONNUMMER)","contactEmailLabel":"E-Mail-Adresse (wohin wir Ihnen antworten werden)","contactEmailNote":"Private Relay-E-Mails (z. B. @privaterelay.appleid.com) werden nicht akzeptiert. Bitte verwenden Sie eine gültige E-Mail-Adresse.","contactEnquiryTypeLabel":"Ist dies ein?","contactSelectOption":"Wählen Sie eine Option","contactGeneralEnquiry":"Allgemeine Anfrage / Feedback","contactBusinessEnquiry":"Geschäftsanfrage","contactOrderShippingEnquiry":"Bestell-/Versandanfrage","contactExchangeRefundEnquiry":"Umtausch/Rückerstattung/Rücksendung","contactOthers":"Andere","contactParcelWarning":"Wenn Ihr Paket seit mehr als 18/30/45 Tagen (14 Tage für FedEx) nicht zugestellt wurde oder der Status \"zugestellt\" anzeigt, es aber nicht bei Ihnen ist, füllen Sie bitte","contactParcelWarningLink":"DIESES FORMULAR","contactParcelWarningEnd":"stattdessen aus.","contactOrderNumberLabel":"Bestellnummer","contactOrderNumberPlaceholder":"Beispiel: RTNX1234567890","contactPlatformNote":"Bestellnummer von Etsy, eBay & Shopee hier. Wir haben KEINE Kontrolle über Rückerstattungen von diesen Plattformen. Bitte kontaktieren Sie deren Kundenservice.","contactPlatformInstructions":"Bitte verwenden Sie die App, um Ihre Bestellnummer zu finden:","contactPlatformEtsy":"Etsy - Oben rechts auf Ihrem Profil → Käufe","contactPlatformEbay":"eBay - Mein eBay → Käufe","contactPlatformShopee":"Shopee - Ich → Kaufhistorie anzeigen","contactRefundNote1":"Wenn Sie eine Rückgabe/Rückerstattung für die Plattformen anfragen, beachten Sie bitte, dass wir KEINE Kontrolle haben.","contactRefundNote2":"Für Rückgaben oder Umtausch sind keine maimai-Handschuhe erlaubt, wenn sie bereits benutzt wurden.","contactRefundNote3":"Für Rückerstattungen über Payhip kontaktieren Sie Ihre Bank oder support@payhip.com.","contactMessageLabel":"Ihre Nachricht (bis zu 1000 Zeichen)","contactCharacterCount":"Zeichen","contactSpamWarningNote":"Hinweis:","contactSpamWarning":"Unaufgeforderte Angebote werden automatisch abgelehnt.","contactAgreementText1":"Bitte klicken Sie auf \"Ich stimme zu\", wenn Sie damit einverstanden sind.","contactAgreementText2":"Unsere Antwort dauert 3-5 Werktage.","contactAgreeCheckbox":"Ich stimme zu","contactSuccessMessage":"Ihre Nachricht wurde erfolgreich gesendet!","contactErrorMessage":"Nachricht konnte nicht gesendet werden.","contactGeneralError":"Ein Fehler ist aufgetreten.","contactSubmitting":"Wird gesendet...","contactSubmit":"Absenden","contactAlertAgree":"Bitte stimmen Sie den Bedingungen zu.","parcelEnquiryTitle":"Paketanfrage","parcelInfoText":"Dieses Formular ist für Pakete, die seit mehr als 18/30/45 Tagen nicht zugestellt wurden.","parcelInfoLink":"Klicken Sie hier","parcelInfoEnd":"für andere Anfragen.","parcelWaitTitle":"Bitte warten Sie auf Ihr Paket","parcelWaitText1":"Bitte warten Sie auf die Zustellung Ihres Pakets.","parcelWaitText2":"Wenn nach 18 Tagen kein Status angezeigt wird, informieren Sie uns.","parcelCannotSubmit":"Sie können dieses Formular nicht absenden, wenn Sie \"Nein\" ausgewählt haben.","parcelNameLabel":"Name","parcelOrderNumberLabel":"Bestellnummer (Beispiel: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"E-Mail-Adresse","parcelEmailNote":"Private Relay-E-Mails werden nicht akzeptiert.","parcelShippingMethodLabel":"Gewählte Versandmethode?","parcelSelectShipping":"Wählen Sie eine Versandmethode","parcelSingPostEpac":"SingPost ePacket (LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid (PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (PX123456789SG)","parcelDHL":"DHL Express (1234567890)","parcelTrackingNumberLabel":"Sendungsverfolgungsnummer?","parcelUndeliveredLabel":"Wurde Ihr Paket seit mehr als 18/30/45 Tagen nicht zugestellt?","parcelSelectOption":"Wählen Sie eine Option","parcelYes":"Ja","parcelNo":"Nein","parcelDeliveredButMissingLabel":"Hat Ihr Paket den Status \"zugestellt\", ist aber nicht vorhanden?","parcelCaseReferenceLabel":"Fall-Referenz-ID vom Postamt","parcelCaseReferencePlaceholder":"NA für Singapur","parcelCaseReferenceNote":"Kontaktieren Sie Ihr Postamt und erhalten Sie eine Fall-ID.","parcelCaseReferenceLink":"Link zu Postdienst-Kontakten","parcelCaseReferenceMandatory":"NUR NA FÜR SINGAPUR. Für andere Länder OBLIGATORISCH.","parcelImageEvidenceLabel":"Bildnachweis","parcelImageWarning":"Wir benötigen einen Bildnachweis zur Überprüfung.","parcelImageNote":"1 Bild hochladen. Max. 1 GB.","parcelAgreementText":"Klicken Sie auf \"Ich stimme zu\".","parcelAgreeCheckbox":"Ich stimme zu","parcelSuccessMessage":"Ihre Paketanfrage wurde erfolgreich übermittelt!","parcelErrorMessage":"Anfrage konnte nicht übermittelt werden.","parcelGeneralError":"Ein Fehler ist aufgetreten.","parcelAlertWait":"Bitte warten Sie auf die Zustellung.","parcelAlertAgree":"Bitte stimmen Sie den Bedingungen zu.","parcelAlertCaseReference":"Bitte geben Sie eine Fall-ID an oder NA für Singapur.","parcelSubmitting":"Wird übermittelt...","parcelSubmit":"Absenden","statusHeldByCustms":"Wird vom Zoll festgehalten","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Neufundland)","tzAST":"AST (Atlantik)","tzEST":"EST (Ostküste)","tzCST":"CST (Zentral)","tzMST":"MST (Mountain)","tzPST":"PST (Pazifik)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Peking","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast Kaliningrad (UTC+2)","tzMoscow":"Moskau/Westrussland (UTC+3)","tzSamara":"Oblast Samara (UTC+4)","tzUral":"Uralregion (UTC+5)","tzOmsk":"Oblast Omsk (UTC+6)","tzKrasnoyarsk":"Region Krasnojarsk (UTC+7)","tzIrkutsk":"Oblast Irkutsk (UTC+8)","tzSakha":"Sacha Republik (UTC+9)","tzPrimorsky":"Region Primorje (UTC+10)","tzMagadan":"Oblast Magadan (UTC+11)","tzKamchatka":"Region Kamtschatka (UTC+12)","dstDayStartsLabel":"Sommerzeit beginnt","dstDayEndsLabel":"Sommerzeit endet","dstRevertsLabel":"Rückkehr zur Standardzeit","dstEuropeLabel":"Europa","dstNewZealandLabel":"Neuseeland","lookalikeDomainWarning":"Das ist ein Link zu einer Website, die einen Paketdienst nachahmt, keine Sendungsnummer. Geben Sie dort keine persönlichen Daten oder Zahlungsdaten ein.","lookalikeDomainOfficial":"Offizielle Website:"};
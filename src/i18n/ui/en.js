@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus utilizes premium commercial networks. However, the exact moment it arrives in your country, custody transfers to the local domestic carrier (e.g., USPS, Royal Mail, DHL locally). Tracking prefixes change handling systems at this threshold, but our universal parcel tracker stitches these statuses together to give you uninterrupted visibility.","trackingLastMileTitle":"Last-Mile Delivery Network","trackingCustomsClearanceBody":"All cross-border items must clear your local country's customs agency. Our tool monitors transitions from import facility arrival to customs handovers. Border patrols will verify HS codes and ensure correct VAT or duties have been remitted (e.g., IOSS in the EU, VOEC in Norway). Monitor tracking specifically for \"Held at Customs\" warnings.","trackingCustomsClearanceTitle":"Customs Clearance Information","trackingProcessingOriginBody":"Once dropped off, the item enters the origin processing center where it is scanned, weighed, and subjected to primary export security screenings. It is then dispatched to the international mail exchange. Flight schedules depend on available cargo bandwidth. Do not be alarmed if it remains in this state for several days.","trackingProcessingOriginTitle":"Processing at Origin Hub","trackingInfoReceivedBody":"When an order is first processed on our e-commerce platforms (such as Etsy, eBay, or direct sales), the tracking number is generated electronically. The carrier receives the shipment data before physical possession of the box. Please allow 1 to 3 business days for the parcel to be inducted into the physical sorting facility.","trackingInfoReceivedTitle":"Information Received","trackingStatusesIntro":"Thank you for using our unified international parcel tracking tool. Because your package voyages across multiple global borders, its tracking statuses can be complex. Understanding the logistics lifecycle helps set clear expectations.","trackingStatusesTitle":"Understanding Tracking Statuses","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"AM","pmText":"PM","footerQuickLinks":"Quick Links","footerSupportLegal":"Support & Legal","copyrightText":"All rights reserved.","englishResponseNotice":"Notice: All enquiries are responded to in English. If you submit in another language, your message may be translated to English for verification.","systemRequirementsTitle":"Minimum supported system versions","systemRequirements":"Windows: Windows 7 (with ESU updates installed) or above\nmacOS: macOS 12 or above\nAndroid: Android 13 or above\niPhone/iOS: iOS 17 or above\nLinux: A currently supported distribution release with active security updates","goodFridayEasterGreeting":"Happy Easter! Wishing you peace and joy during Good Friday and Easter.","christmasGreeting":"Merry Christmas and Happy New Year! Wishing you peace and joy from December 25th to January 5th.","captchaSystemRequirements":"Minimum system requirements: Windows 7 (with ESU updates installed) or 11, macOS 10.15+, or Android/iOS latest version.","title":"Verify Access","subtitle":"Please complete the challenge below to continue.","selectLanguage":"Select Language","selectLanguagePlaceholder":"-- Choose a language --","loadingChallenge":"Loading challenge...","answerLabel":"Your answer:","answerPlaceholder":"Enter your answer","continueButton":"Continue","refreshButton":"New Challenge","verifying":"Verifying...","chooseLanguageFirst":"Please select a language first.","loadFailed":"Failed to load challenge. Please try again.","expiredChallenge":"Challenge expired. Loading new challenge...","verifyFailed":"Verification failed. Please try again.","home":"Home","blog":"Blog","aboutUs":"About Us","faq":"FAQ","contact":"Contact","trackPackage":"Track Package","cnyYearOfHorseMessage":"🧧 Happy Lunar New Year! Wishing you prosperity and joy in the Year of the Horse! 🐴","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Wishing you and your family peace, joy, and blessings! 🌟","deepavaliMessage":"🪔 Happy Deepavali! May the festival of lights bring you joy, prosperity, and success! ✨","diwaliMessage":"🪔 Happy Diwali! May the festival of lights bring you joy, prosperity, and success! ✨","vesakMessage":"☸️ Happy Vesak Day! Wishing you peace, wisdom, and enlightenment on this sacred day! 🙏","vesakTHMessage":"☸️ Happy Visakha Bucha Day! Wishing you peace, wisdom, and enlightenment on this sacred day! 🙏","singaporeNationalDayMessage":"🇸🇬 Happy National Day, Singapore! Celebrating 61 years of independence! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesia! Dirgahayu Republik Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Celebrating our nation's independence! 🎊","australiaNationalDayMessage":"🇦🇺 Happy Australia Day! Celebrating our nation! 🎉","canadaNationalDayMessage":"🇨🇦 Happy Canada Day! Celebrating our great nation! 🍁","usaNationalDayMessage":"🇺🇸 Happy Independence Day, America! Celebrating freedom and liberty! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! Vive la France! 🎊","germanyUnityDayMessage":"🇩🇪 Happy German Unity Day! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Happy Foundation Day, Japan! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Happy National Day, China! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Happy Liberation Day, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Happy Independence Day, India! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Happy National Day, Thailand! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Happy Independence Day, Philippines! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Happy National Day, Vietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Happy Independence Day, Poland! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Happy Independence Day, Czech Republic! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Long live the King! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Glad Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Happy Independence Day, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Happy St. Patrick's Day, Ireland! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Happy Waitangi Day, New Zealand! 🎉","switzerlandNationalDayMessage":"🇨🇭 Happy Swiss National Day! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgique! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Happy Russia Day! 🎉","taiwanFoundingDayMessage":"🇹🇼 Happy Founding Day, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Happy Double Ten Day, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Happy Hong Kong SAR Establishment Day! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Happy Macau SAR Establishment Day! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Happy International Workers' Day! Celebrating labor and workers' rights! 🎊","laborDayUSCAMessage":"⚒️ Happy Labor Day! Honoring the contributions of workers! 🎉","temporaryClosureNoticeTitle":"Rhythm Nexus - Temporary Closure Notice","temporaryClosureNoticeBody":"Dear valued customers,\n\nPlease note that Rhythm Nexus will be temporarily closed from 21 March 2026 to 26 March 2026 due to a company event.\n\nTo prepare for the closure, the shop will be placed on vacation mode starting 20 March 2026 at 3:00 PM (UTC +8). Orders placed after this time may not be processed until we resume operations.\n\nNormal business operations will resume on 27 March 2026.\n\nWe apologize for any inconvenience caused and appreciate your understanding and continued support.\n\nThank you.\n\nRhythm Nexus","temporaryClosureNoticeClose":"I Understand","parcelTracking":"Parcel Tracking","serviceAnnouncement":"Service Announcement","usaWinterStormTitle":"URGENT: Severe Winter Storm - Service Disruption","usaWinterStormSubtitle":"United States Postal Service (USPS) Force Majeure Event","usaWinterStormNotice1":"Due to the severe winter storm affecting the New York region since February 23, 2026:","usaWinterStormNotice2":"International operations at John F. Kennedy International Airport have been effectively halted","usaWinterStormNotice3":"Widespread flight cancellations and significant disruption to airport services reported","usaWinterStormNotice4":"These conditions constitute a force majeure event beyond USPS control","usaWinterStormNotice5":"Service Impact:","usaWinterStormNotice6":"Dangerous mix of heavy snow, freezing rain, sleet and bitter cold","usaWinterStormNotice7":"Major disruptions and widespread power outages reported","usaWinterStormNotice8":"Collection and delivery of domestic and international mail (letter-post, parcel-post and EMS items) affected","usaWinterStormNotice9":"Affected Postcode Areas:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS is taking all necessary steps to minimize inconvenience to customers while keeping employees safe. We appreciate your patience and understanding during this force majeure event.","usaWinterStormNotice12":"Last updated: February 25, 2026","countryAutoDetected":"Destination pre-set based on your location","countryAutoDetectedFromLink":"Destination pre-set from link","trackingNumber":"Tracking Number","destinationCountry":"Destination Country","postcode":"Postcode","orderNumber":"Order Number (Example: RTNX1234567890)","fromDate":"From Date (REQUIRED for DHL verification)","toDate":"To Date (REQUIRED for DHL verification)","trackParcel":"Track Parcel","selectCourier":"-- Select Courier / Country --","singaporeCouriers":"Singapore Couriers","topCountries":"Top 5 Countries","otherCountries":"Other Countries","note":"NOTE","disclaimer":"DISCLAIMER","importantInformation":"Important Information:","didNotReceiveEmail":"If you did not receive your confirmation email from Etsy, eBay, Shopee or Payhip, scroll down below to search your order via your email address or phone number linked with this order.","searchByEmailOrPhone":"Search by Email or Phone","searchOrder":"Search Order","trackingResult":"Tracking Result","noOrdersFound":"No orders found for this query.","pleaseEnter":"Please enter an email, phone, or order number.","fillAllFields":"Please fill in all required fields: tracking number, destination country, order number, and postcode.","noOrderMatchingFields":"No order found matching all fields.","postcodeRequired":"Postcode is required for this destination.","invalidUSZip":"Invalid US ZIP Code. Use 5 digits or ZIP+4.","failedGenerateURL":"Failed to generate tracking URL. Please check input.","trackingValidationSG":"Tracking numbers for Singapore must be: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG or PX123456789SG. For DHL Shipments use 10-digit numbers.","invalidSingPostFormat":"Invalid SingPost tracking number format.\nAccepted formats:\n• PP123456789SG → Prepaid Tracked Label\n• SPNDD00012345 → SpeedPost Standard Tracking","welcomeTitle":"Welcome to Rhythm Nexus's Website!","purchaseInfo":"Purchase from us through our official channels, or join our","purchaseInfoChina":"Purchase from us through our official channels.","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram group","forUpdates":"for official updates.","ourStores":"Our Stores","etsyStore":"Etsy Store","ebayStore":"eBay Store","shopeeStore":"Shopee Store","payhipStore":"Payhip Store","internationalShipping":"International Shipping","singaporeLocal":"Singapore Local","asiaOnly":"Asia-only","deliveryInfo":"Delivery Information","deliveryRates2026":"Delivery Rates 2026","sgDeliveryRates":"Singapore Delivery Rates","speedPostRates":"SpeedPost Express International Rates","aboutTitle":"About Rhythm Nexus","aboutP1":"We started our store in 2022 and have sold on platforms such as Etsy, eBay, and Shopee over the years without fail.","aboutP2":"Over time, we have built a strong reputation by focusing on reliable fulfillment, transparent communication, and accurate tracking for every order we ship.","aboutP3":"Our goal is to provide customers with a smooth and trustworthy shopping experience, whether purchasing locally or internationally. We continuously adapt to changing postal, customs, and tax requirements to ensure deliveries reach their destinations as efficiently as possible.","aboutP4":"Thank you for supporting Rhythm Nexus.","faqTitle":"Frequently Asked Questions","faqQ1":"What if my item is defective? Is there any warranty?","faqA1":"Yes! Most orders come with a 1-year warranty. Please provide your invoice/order number so we can investigate. Note: Exchanges aren't allowed if the item matches the description, even if you ordered incorrectly.","faqQ2":"Can I edit, update or cancel my order?","faqA2":"Yes. For security, order changes may need to be handled via email or on our Contact Form.","faqQ3":"Do I have to pay customs/import taxes?","faqA3":"Customs and duties are generally not prepaid, except for DDP to the USA. VAT may apply for EU, UK, AU/NZ, Norway, Switzerland, and Canadian provinces like Saskatchewan and Manitoba, which is already paid by default. No GST applies for Singapore. We cannot advise on customs fees—contact your local customs for details.","faqQ4":"When does my order ship?","faqA4":"Orders are usually dispatched within 1-5 business days. During high volume periods, it may take 5–7 days.","faqQ5":"I ordered twice by accident. What should I do?","faqA5":"We refund duplicate shipping fees only. Both items will be shipped together. Refund = (first + second shipping fees) – actual shipping fee.","faqQ6":"How long does delivery take?","faqA6":"Processing takes 1-5 business days.\n\nDomestic shipping:\n• SingPost Prepaid Tracked Label: 2–4 days\n• SpeedPost Standard: 1–3 days\n\nInternational:\n• SingPost ePAC: 14-30 days\n• SpeedPost Priority (EMS): 8-15 days\n• SpeedPost Express: 4-8 days\n\nDelays may occur during peak seasons.","faqQ7":"My item is being returned to sender. What should I do?","faqA7":"One reshipment is allowed. Cancellation isn't possible for invalid addresses, unclaimed parcels, or unpaid customs fees. Contact your postal service for redelivery, or message us for assistance.","faqQ8":"My item is lost / stolen in transit.","faqA8":"We allow one reshipment. If it's lost again, a full refund is issued after the courier's delivery window:\n\n• Singapore Local Services: 7 days\n• SingPost ePAC & SpeedPost Priority International: 30 days\n• SpeedPost Intl Express: 14 days","faqQ9":"What if I didn't receive my confirmation email?","faqA9":"1. Check your spam/junk folder — automated messages are sometimes filtered.\n2. Verify the email address you used at checkout; a typo can prevent delivery.\n3. If the address is correct and the email is still missing, contact us with your order number and the email address (or phone number) you used. We can resend the confirmation or provide the order details manually.\n\nYou can also go to https://rhythmnexus.org/track-your-item and use Search by Email or Phone to find your order from the confirmation email.","blogTitle":"Shipping & Postal Knowledge Base","blogSubtitle":"Official explanations of postal services, customs, VAT, and duties relevant to Rhythm Nexus shipments.","readMore":"Read More","backButton":"Back","blogPost1Title":"What is SingPost ePAC?","blogPost1Desc":"Learn about SingPost ePAC (ePacket), an economical tracked postal service for lightweight international e-commerce shipments.","blogPost2Title":"What is SpeedPost Priority International (EMS)?","blogPost2Desc":"Discover EMS, the International premium postal express service prioritized by postal operators worldwide.","blogPost3Title":"What is SpeedPost Express (Last-mile DHL Express)?","blogPost3Desc":"Explore SpeedPost Express, a courier-grade service with last-mile delivery by DHL Express.","blogPost4Title":"USA Postal Delivery Duties Paid (PDDP)","blogPost4Desc":"Understand PDDP that allows US import duties and taxes to be prepaid before delivery.","blogPost5Title":"EU VAT & IOSS Explained","blogPost5Desc":"Get insights into EU VAT and the IOSS system for collecting VAT on imports up to €150.","blogPost6Title":"UK VAT & Remittance to HMRC","blogPost6Desc":"Learn about VAT requirements for imported goods in the UK and remittance to HMRC.","blogPost7Title":"Norway VOEC Explained","blogPost7Desc":"Understand Norway's VOEC (VAT on E-Commerce) system for goods imported from outside the EU/EEA.","blogPost8Title":"Swiss VAT Explained","blogPost8Desc":"Explore Switzerland's VAT requirements for imported goods and the collection process.","enterDestinationPostcode":"Enter destination postcode","trackingNumberExample":"e.g. LG123456789SG","trackingCaseSensitive":"TRACKING LETTERS ARE CASE SENSITIVE AND MUST BE IN CAPITAL LETTERS.","usaPostcodeNote":"For countries without postcodes, such as Hong Kong & Macau, please put 999077 (Hong Kong) or 999078 (Macau).","currentTime":"Current Time","timezoneNote":"Time shown in 12-hour format","sameTimeAsSingapore":"Same time as Singapore","hourAhead":"hour ahead of Singapore","hoursAhead":"hours ahead of Singapore","hourBehind":"hour behind Singapore","hoursBehind":"hours behind Singapore","australianDSTTitle":"Australian Daylight Saving Time Active","australianDSTBothMessage":"Both AEDT (Australian Eastern Daylight Time) and ACDT (Australian Central Daylight Time) are currently in effect.","australianAEDTMessage":"AEDT (Australian Eastern Daylight Time) is currently in effect for Sydney, Melbourne, and surrounding areas.","australianACDTMessage":"ACDT (Australian Central Daylight Time) is currently in effect for Adelaide and South Australia.","australianDSTNote":"Delivery times displayed above reflect the current daylight saving time.","epacDeliveryNote":"Please KINDLY note that all ePAC items sent to the destination should all be delivered to your mailbox, doorstep, parcel locker or left in a safe place!","countriesNoMailbox":"Countries known to have mailbox/letterbox delivery unavailable: Brunei, China, India, Israel, Macau SAR China, Philippines, Poland and Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus is NOT RESPONSIBLE for handling the deliveries as it is out of our control and we would kindly prefer for you to track your item status instead.","issuesAfterDelivery":"Any issues with your delivery after 30/45 days (14 days for SpeedPost Express) or status show delivered but you didn't receive, please contact us","filteredAllowedDestinations":"(Filtered for your allowed destinations)","loadingAnnouncements":"Loading announcements...","unableToLoadAnnouncements":"Unable to load service announcements at this time.","viewOnSingPostWebsite":"View on SingPost Website →","cannotUseEmbed":"We are not able to use embed for tracking as most postal service websites do not support it.","clickLinkAbove":"Please click on the link above to track your parcel.","trackingDetailsNote":"Note that tracking details may not show up in search results, so it's recommended to paste the tracking number into the system to track the item.","thirdPartyWebsites":"You may also track your parcels on these third-party websites as well:","enterEmailOrPhone":"Enter email or phone","collectAtPostOffice":"However, if your country does not have mailbox as a standard available, you will have to collect it at the post office.","russiaServiceSuspended":"⚠️ IMPORTANT NOTICE: In view of the 2022 Russian Invasion of Ukraine, SingPost has suspended all shipments to Russia along with DHL. We currently do not serve Russia at this point until there is announcement of resumption of services to the country.","reviewShippingRates":"Review our current shipping rates","here":"here","contactUsForm":"Please contact us through","form":"form","forEnquiries":"for any enquiries you have regarding your order.","anPostNoDirectTracking":"An Post (Ireland) does not support direct tracking links or embedded tracking.","anPostPasteManually":"Please paste your tracking number manually on the An Post website.","goToAnPost":"Go to An Post","postedDate":"Posted Date:","status":"Status:","shippedVia":"Shipped Via:","destination":"Destination:","statusInPreparation":"In Preparation","statusInTransit":"In Transit","statusDelivered":"Delivered","statusOutForDelivery":"Out for Delivery","statusArrived":"Arrived","statusProcessing":"Processing","statusDispatched":"Dispatched","statusReturned":"Returned","statusFailed":"Failed","statusCancelled":"Cancelled","statusHeldByCustms":"Held by Customs","statusAwaitingCollection":"Awaiting Collection","aka":"aka","thisServiceKnownAs":"This service is known as","in":"in","viewTrackingDHL":"View Tracking Information from DHL Express","viewTrackingSingPostSpeedPost":"View Tracking Information from Singapore SpeedPost","viewTrackingDHLLastMile":"View Tracking Information from DHL Express (Last-mile)","viewTrackingDHLShipperRef":"View Tracking Information from DHL Express (Shipper Reference)","viewTrackingSingPost":"View Tracking Information from Singapore Post","viewTrackingDestPost":"View Tracking Information from","post":"Post","orderNumberExample":"Order Number (starts with RTNX or DLTB - example: RTNX1234567890):","deliveryRecordNote":"Please note that once item has been delivered, the record will only be stored up to 7 days and will be deleted.","copyrightAllRights":"All rights reserved.","accessRestricted":"Access Restricted","vpnDetectedMessage":"VPN usage detected. Please disable VPN to access this service.","contactSupportError":"If you believe this is an error, please contact support.","destinationNotAllowed":"Access to this destination country is not available from your location. Please select a different destination.","epacUS":"First-Class Package International Service","epacCH":"Priority Plus","epacGB":"International Tracked","epacMY":"International Tracked/Express","epacCA":"International Inbound Express","epacAU":"Pack and Track International","epacNZ":"International Economy Tracked","epacDE":"Warenpost International Premium","epacFR":"International letter with tracking","epacNL":"International Packet Tracked","epacPL":"GLOBAL Expres","epacBE":"International Prime Inbound","epacAT":"International Tracked Packet","epacIN":"International Tracked Packet","epacFI":"International Tracked Letter","epacSE":"International Tracked Letter","epacNO":"PRIME Exprès","epacIT":"Express","epacIL":"Express","epacES":"International Light Package","epacPT":"International Blue Mail","epacCZ":"Tracked shipment from abroad","epacBN":"International ePacket","epacCN":"International ePacket","epacHK":"International ePacket","epacID":"International e-Packet","epacMO":"International ePacket","epacPH":"International Tracked Mail","epacTW":"International ePacket","epacTH":"International ePacket","epacVN":"International E-Packet (ASEAN Pack)","epacKR":"K-Packet","epacJP":"International e-Packet Light","epacIE":"International Express Post","blogSingPostEPACContent1":"SingPost ePAC (ePacket) is an economical tracked postal service for lightweight international e-commerce shipments.","blogSingPostEPACContent2":"It is delivered by the destination country's national postal operator and is commonly used for parcels under 2 kg, within a dimension limit of length + width + height below 90 cm and and length not exceeding 60 cm.","blogSingPostEPACContent3":"This option was initially only offered by Hong Kong Post together with eBay China, allowing packages from China and Hong Kong to post small packets into USA with a delivery tracking without the requirement for any signatory upon delivery. This service is known as USPS (United States Postal Service) First-Class Package International Service within USA.","blogSingPostEPACContent4":"As of 1st January 2026, ePAC is now used for all countries to abide by the mandatory UPU regulations requiring tracking for parcels and Registered items to be limited for documents only.","blogSingPostEPACContent5":"Tracking prefixes: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS is an International premium postal express service, prioritised by postal operators worldwide.","blogSpeedPostEMSContent2":"Customs clearance is generally faster than standard mail but stricter in process, with full tracking until delivery.","blogSpeedPostEMSContent3":"In Singapore, this is known as SpeedPost Priority International by SingPost.","blogSpeedPostEMSContent4":"Tracking prefix: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express is a courier-grade service.","blogSpeedPostExpressContent2":"In many destinations, DHL Express performs last-mile delivery and collects duties or taxes before release.","blogSpeedPostExpressContent3":"Tracking prefix: PX123456789SG (Last-mile DHL Express uses a 10-digit tracking number, which is not visible to the public, but we have information for it through our","blogSpeedPostExpressContent3Link":"Tracking System.","blogUSPDDPContent1":"PDDP allows US import duties and taxes to be prepaid before delivery, reducing surprise charges for recipients.","blogUSPDDPContent2":"New Regulations (Effective 29 August 2025)","blogUSPDDPContent2List1":"Mandatory HTS codes","blogUSPDDPContent2List2":"Accurate item descriptions","blogUSPDDPContent2List3":"Stricter tariff enforcement","blogUSPDDPContent3":"All items sent to the USA will not be charged any additional tariffs to the recipient as we are paying on your behalf. However, do note that the item price is the 10% import fee by default as set to align with the regulations.","blogUSPDDPContent4":"This only applies for our shipping methods for the USA, SpeedPost Priority International (EMS) and SingPost ePAC only.","blogEUIOSSContent1":"The EU applies VAT on all commercial imports regardless of value.","blogEUIOSSContent2":"IOSS (Import One-Stop Shop)","blogEUIOSSContent3":"IOSS allows sellers to collect EU VAT at checkout for consignments up to €150.","blogEUIOSSContent4":"VAT is then remitted via the IOSS system, enabling faster customs clearance and no VAT collection on delivery.","blogEUIOSSContent5":"For all orders via Etsy or eBay, IOSS VAT is already collected on checkout and we will indicate it on the Tax Reference Number to transmit the data to the destination postal service via EDI (Electronic Data Intercharge).","blogUKVATContent1":"The UK requires VAT to be accounted for on imported goods.","blogUKVATContent2":"For low-value consignments, VAT is usually collected at checkout and remitted directly to HMRC by the seller or marketplace.","blogUKVATContent3":"For higher-value shipments, VAT may be collected by the carrier before delivery.","blogUKVATContent4":"For all orders via Etsy or eBay, VAT is already collected on checkout and we will indicate it on the Tax Reference Number to transmit the data to the destination postal service via EDI (Electronic Data Intercharge).","blogNorwayVOECContent1":"Norway introduced the VOEC (VAT on E-Commerce) system for goods imported from outside the EU/EEA. This applies to goods valued up to NOK 3,000.","blogNorwayVOECContent2":"Sellers can register in the VOEC scheme to collect Norwegian VAT at checkout, allowing for faster customs clearance and no VAT collection upon delivery.","blogNorwayVOECContent3":"For all orders via Etsy or eBay, VOEC VAT is already collected on checkout. Tracking and customs paperwork indicate the Tax Reference Number to transmit data to the Norwegian postal service.","blogSwissVATContent1":"Switzerland charges VAT on imported goods regardless of value. The Swiss Federal Customs Administration requires foreign sellers to collect VAT at checkout for goods up to CHF 65.","blogSwissVATContent2":"Sellers registered under the Swiss VAT system remit the collected VAT directly, ensuring that the recipient experiences no additional VAT charge upon delivery.","blogSwissVATContent3":"For all orders via Etsy or eBay, Swiss VAT is already collected during checkout, and customs paperwork includes the Tax Reference Number for EDI submission.","dhlNoEmbed":"DHL Express does not support tracking via embed. Please","speedPostNoEmbed":"SpeedPost Singapore does not support tracking via embed. Please","operatorNoEmbed":"does not support tracking via embed. Please","clickHere":"click here","toTrackNewTab":"to track (opens in new tab).","optionSingPost":"🇸🇬 SingPost (SPNDD/PP)","countryAU":"🇦🇺 Australia","countryCA":"🇨🇦 Canada","countryDE":"🇩🇪 Germany","countryGB":"🇬🇧 United Kingdom","countryUS":"🇺🇸 United States","countryAT":"🇦🇹 Austria","countryBE":"🇧🇪 Belgium","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 China","countryCZ":"🇨🇿 Czechia","countryFI":"🇫🇮 Finland","countryFR":"🇫🇷 France","countryHK":"🇭🇰 Hong Kong SAR China","countryIN":"🇮🇳 India","countryID":"🇮🇩 Indonesia","countryIE":"🇮🇪 Ireland","countryIL":"🇮🇱 Israel","countryIT":"🇮🇹 Italy","countryJP":"🇯🇵 Japan","countryMO":"🇲🇴 Macau SAR China","countryMY":"🇲🇾 Malaysia","countryNL":"🇳🇱 Netherlands","countryNZ":"🇳🇿 New Zealand","countryNO":"🇳🇴 Norway","countryPH":"🇵🇭 Philippines","countryPL":"🇵🇱 Poland","countryPT":"🇵🇹 Portugal","countryRU":"🇷🇺 Russia","countryKR":"🇰🇷 South Korea","countryES":"🇪🇸 Spain","countrySE":"🇸🇪 Sweden","countryCH":"🇨🇭 Switzerland","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Thailand","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬 Singapore","countryMsgNL":"If the status reflects 'Held by Customs', please contact the Netherlands Customs Information Line for assistance:\n0800 0143 (free of charge), Mon to Fri from 7 a.m. to 11 p.m.\nOn Sat & Sun from 8 a.m. to 4:30 p.m.\n\nYou are encouraged to register an account with PostNL for instant push notification of your packages:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nIf it is being delivered to a PostNL point or the status tells you to collect at the post office, you will have to pay 7 EUR at the counter. At most 4 EUR if paid online.","countryMsgDE":"We encourage you to download Post & DHL app to receive push notifications for tracking status of your packages:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH Customer Service Contact:\n+49-228-433-3112\nDHL DE Contact: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"You will need to submit additional import declaration to the customs. Failure to do so could result in entry restriction and the package being returned. \nMore information: https://www.posti.fi/en/receiving/customs-clearance \nOther links: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Handling fees of 4.95 EUR is chargeable.\nDownload the app here: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Handling fees of 8.50 PLN is chargeable. \nYou will have to pay it upon collection at the post office,\nas the parcel is unlikely to be delivered to your doorstep or mailbox.","countryMsgPH":"PHLPost is considered inefficient and unreliable in the Philippines.\nDo always keep track of your parcel as sometimes out for delivery status \nwill only show up between 1 to 3 weeks for smaller parcels. For bigger parcels, \ncollection is only possible through the Manila Central Post Office, or the nearest \npost office in your area. Do note that a 112PHP handling fee applies for parcels of \nany value that you will be required to pay. Failure to pay will result in the parcel's \nreturn to us. Delivery is estimated to be 1-2 months due to the slowness of PHLPost's services. \nYou don't need to pay taxes for items under 10000PHP, but you will need to if it is equal or above that amount. \nWe would recommend SpeedPost Express for a faster process the next time you order from us. However, the fees may not apply as D&T for recipient is by default.","countryMsgCA":"De minimis is 20CAD for all orders sent to Canada, as Singapore is part of the CPTPP agreement, duties may not apply, but D&T may be applicable if item exceeds 60CAD and above or 100CAD and above threshold which may depend on the item's HS code. Any value above that amount will be charged VAT accordingly.","countryMsgID":"You are required to pay any applicable taxes and duties upon arrival in Indonesia. Please keep track of your parcel and do pay the specified amount to the Indonesian customs.\nYou will also be required to submit additional clearance paperwork. Failure to do so may result in entry restriction or the seizure of the package by the country customs. Please check further details here:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"You are required to pay any applicable taxes and duties upon arrival in India. Please keep track of your parcel and do pay the specified amount to the Indian customs.\nDo be aware that customs clearance in India is strict and you may or may not be charged duties if your item's value is above 1000INR (15 USD) - depending on the HS code, in most cases it is duty free, but you might be charged higher duties if item is above 5000INR (60 USD). \nAs India Post DOES NOT deliver to mailbox as a standard, you MIGHT be required to be at home or an authorized representative to receive your package or to collect at the post office.","countryMsgMY":"De minimis is 500MYR for all orders sent to Malaysia. Orders above that amount may be charged.","countryMsgUS":"As of 29th August 2025, the de minimis of USD800 will officially be removed and import tariffs will be payable by default for the sender in the origin country.\nUSA shipping will REQUIRE a valid phone number and email address in order for your parcel to avoid having further delays.","countryMsgIL":"De minimis is 240 ILS (75 USD) for all orders shipped to Israel. Orders above that amount may be charged. \nPlease note for orders sent to the Israel, Israel Post may sometimes not acknowledge final delivery once it is delivered. \nAs Israel Post DOES NOT deliver to mailbox as a standard, you MIGHT be required to be at home or an authorized representative to receive your package or to collect at the post office.","countryMsgGB":"Please note for orders sent to the UK, Royal Mail may sometimes not acknowledge final delivery once it is delivered to your mailbox.","countryMsgTH":"De minimis is 1500THB (45 USD) for all orders shipped to Thailand. Orders above that amount may be charged.","countryMsgTW":"De minimis is 2000TWD (60 USD) for all orders shipped to Taiwan. Orders above that amount may be charged.","countryMsgMO":"No D&T is charged when sending to Macau. But do note that Macau Post DOES NOT deliver to mailbox as a standard, you WILL BE REQUIRED to collect your package at the post office.","countryMsgBN":"No D&T is charged when sending to Brunei. But do note that Brunei Post DOES NOT deliver to mailbox as a standard, you WILL BE REQUIRED to collect your package at the post office. \nTracking system for this country is not very stable and limited information may only be given, and final delivery results are NOT given to origin.","countryMsgJP":"De minimis is 10000JPY (65 USD) for all orders shipped to Japan. Orders above that amount may be charged.","countryMsgKR":"De minimis is 180000KRW (150 USD) for all orders shipped to South Korea. Orders above that amount may be charged.","countryMsgVN":"For Vietnam, please remain CONTACTABLE during delivery as you might be charged with handling fees upon delivery of the item. \nDe minimis is 1000000 (35 USD) for all orders shipped to Vietnam. Orders above that amount may be charged. \nAs Vietnam Post DOES NOT deliver to mailbox as a standard, you MIGHT be required to be at home or an authorized representative to receive your package or to collect at the post office.","countryMsgPP":"Tracked Label items will be posted in POPDrop/POPStop at the post office. SpeedPost Standard items are usually posted on POPStop or POPStation.\nDo NOTE that deliveries of Tracked Label items will be done ONLY every Monday to Friday from 9am to 6pm. Except for Weekends & Public Holidays.","postalContactsTitle":"Postal Service Contacts","postalContactsNote":"Note:","postalContactsPolandUKNote":"For Poland & UK, all items sent via SpeedPost Priority (EMS) will be handled by Pocztex and Parcelforce.","postalContactsDHLNote":"For SpeedPost Express shipments, please contact DHL through this link:","postalContactsCountry":"Country","postalContactsWebsite":"Website","postalContactsForm":"Contact Form","postalContactsPhone":"Contact Number","postalContactsEmail":"Contact Email","postalContactsFormLink":"Contact Form","postalContactsBackButton":"Back to Parcel Enquiry Form","contactUsTitle":"Contact Us","contactNameLabel":"Name (NO NICKNAMES NOR PHONE NUMBER)","contactNamePlaceholder":"e.g. John Smith","contactEmailLabel":"Email address (where we will respond to you)","contactEmailNote":"Private relay emails (e.g., @privaterelay.appleid.com) are not accepted. Please use a valid email address.","contactEnquiryTypeLabel":"Is this a?","contactSelectOption":"Select an option","contactGeneralEnquiry":"General Enquiry / Feedback","contactBusinessEnquiry":"Business Enquiry","contactOrderShippingEnquiry":"Order/Shipping Enquiry","contactExchangeRefundEnquiry":"Exchange/Refund/Return Enquiry","contactOthers":"Others","contactParcelWarning":"If your parcel is not delivered for more than 18/30/45 days (14 days for FedEx), or status shows delivered but it is not with you, please fill in","contactParcelWarningLink":"THIS FORM","contactParcelWarningEnd":"instead.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"Etsy, eBay & Shopee order number here. We have ZERO control of refunds from these platforms. Please contact their customer service respectively.","contactPlatformInstructions":"Please use the app to look into your order number, as it is saved in the app:","contactPlatformEtsy":"Etsy - Top right on your profile → Purchases","contactPlatformEbay":"eBay - My eBay → Purchases","contactPlatformShopee":"Shopee - Me → View Purchase History (or you can click on To Ship/To Receive)","contactRefundNote1":"If you are enquiring for Return/Refund for the platforms you purchased from, please note that we have ZERO control of refunds from these platforms. Please contact their customer service respectively.","contactRefundNote2":"For Returns or Exchanges, we do not allow it for maimai gloves if they have been used already when opened (visible stains or washed in washing machine/manual wash), and no returns or exchanges are allowed for amusement cards. Thank you.","contactRefundNote3":"Please note that for refunds through Payhip, contact your bank or Payhip support at support@payhip.com for information if you haven't received the refund as we have no control over the process.","contactMessageLabel":"Your Message (up to 1000 characters)","contactCharacterCount":"characters","contactSpamWarningNote":"Note:","contactSpamWarning":"Unsolicited offers for SEO, website design, loans, or similar services will be automatically rejected.","contactAgreementText1":"Please click on \"I Agree\", if you agree to your email address being used for Rhythm Nexus to respond to you, as this is required by us to read your response and reply to you once we come out with a solution for your enquiry.","contactAgreementText2":"Do note that our response will take between 3-5 business days, or longer during high volume of emails on our end.","contactAgreeCheckbox":"I Agree","contactSuccessMessage":"Your message has been sent successfully! We will respond within 3-5 business days.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"Parcel Enquiry","parcelInfoText":"This form is for parcels that are undelivered for more than 18/30/45 days (14 days for FedEx/DHL), or have shown delivered status but are not with you.","parcelInfoLink":"Click here","parcelInfoEnd":"for other enquiries.","parcelWaitTitle":"Please Wait for Your Parcel","parcelWaitText1":"Please await for your parcel to deliver. Do note International deliveries are NOT the same as local deliveries as they need to take time. Thanks!","parcelWaitText2":"If no status shows after 18 days (7 days for Singapore) or more, you can let us know directly.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"Name","parcelOrderNumberLabel":"Order Number (Example: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Email Address (We will respond to you through here)","parcelEmailNote":"Private relay emails are not accepted. Please use a valid email address.","parcelShippingMethodLabel":"Shipping Method Chosen?","parcelSelectShipping":"Select a shipping method","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"Tracking number of your parcel?","parcelUndeliveredLabel":"Has your parcel been undelivered for more than 18/30/45 days? (Singapore Local services >7 days, >14 days for SpeedPost Express/DHL)","parcelSelectOption":"Select an option","parcelYes":"Yes","parcelNo":"No","parcelDeliveredButMissingLabel":"Has your parcel showed status delivered, but it isn't present in your mailbox/safe place/doorstep?","parcelCaseReferenceLabel":"Case Reference ID from Local Post Office","parcelCaseReferencePlaceholder":"Put NA if you are from Singapore","parcelCaseReferenceNote":"Before submitting this form, please contact your local post office through telephone or email and get a case reference ID from them. Then, put your case reference ID here.","parcelCaseReferenceLink":"Refer to this link for Postal Service contacts","parcelCaseReferenceMandatory":"PUT NA ONLY IF YOU ARE FROM SINGAPORE. For other countries it is MANDATORY to provide. Required for SpeedPost Express too, for DHL's case ID.","parcelImageEvidenceLabel":"Image Evidence (for delivered but missing parcels)","parcelImageWarning":"For additional verification, we need image evidence to prove that you are not making false claims about parcel non-delivery. (Only for parcels that are delivered already, but are not present in mailbox/outside doorstep. We may reject your claim if no photo evidence is given for delivered items. Ignore this if your item has NOT shown delivered status.)","parcelImageNote":"Upload 1 supported file: image. Max 1 GB.","parcelAgreementText":"Please Click on \"I agree\" if you ensure that what has happened to your parcel was true.","parcelAgreeCheckbox":"I agree","parcelSuccessMessage":"Your parcel enquiry has been submitted successfully! We will respond within 3-5 business days.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlantic)","tzEST":"EST (Eastern)","tzCST":"CST (Central)","tzMST":"MST (Mountain)","tzPST":"PST (Pacific)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Beijing","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Kaliningrad Oblast (UTC+2)","tzMoscow":"Moscow/Western Russia (UTC+3)","tzSamara":"Samara Oblast (UTC+4)","tzUral":"Ural Region (UTC+5)","tzOmsk":"Omsk Oblast (UTC+6)","tzKrasnoyarsk":"Krasnoyarsk Krai (UTC+7)","tzIrkutsk":"Irkutsk Oblast (UTC+8)","tzSakha":"Sakha Republic (UTC+9)","tzPrimorsky":"Primorsky Krai (UTC+10)","tzMagadan":"Magadan Oblast (UTC+11)","tzKamchatka":"Kamchatka Krai (UTC+12)","dstDayStartsLabel":"Daylight time starts","dstDayEndsLabel":"Daylight time ends","dstRevertsLabel":"reverts to standard time","dstEuropeLabel":"Europe","dstNewZealandLabel":"New Zealand","lookalikeDomainWarning":"This is a link to a website imitating a parcel carrier, not a tracking number. Do not enter personal or payment details there.","lookalikeDomainOfficial":"Official website:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus utiliza redes comerciales premium. Sin embargo, en el momento exacto en que llega a su país, la custodia se transfiere al transportista nacional local (por ejemplo, USPS, Royal Mail, DHL localmente). Los prefijos de seguimiento cambian los sistemas de manejo en este umbral, pero nuestro rastreador de paquetes universal une estos estados para brindarle visibilidad ininterrumpida.","trackingLastMileTitle":"Red de entrega de última milla","trackingCustomsClearanceBody":"Todos los artículos transfronterizos deben pasar por la agencia de aduanas de su país local. Nuestra herramienta monitorea las transiciones desde la llegada a las instalaciones de importación hasta los traspasos aduaneros. Las patrullas fronterizas verificarán los códigos HS y garantizarán que se hayan remitido el IVA o los derechos correctos (por ejemplo, IOSS en la UE, VOEC en Noruega). Supervise el seguimiento específicamente para las advertencias de \"Retenido en la Aduana\".","trackingCustomsClearanceTitle":"Información de despacho de aduanas","trackingProcessingOriginBody":"Una vez entregado, el artículo ingresa al centro de procesamiento de origen donde se escanea, pesa y se somete a controles primarios de seguridad de exportación. Luego se envía al servicio de correo internacional. Los horarios de los vuelos dependen del ancho de banda de carga disponible. No te alarmes si permanece en este estado durante varios días.","trackingProcessingOriginTitle":"Procesamiento en Origin Hub","trackingInfoReceivedBody":"Cuando un pedido se procesa por primera vez en nuestras plataformas de comercio electrónico (como Etsy, eBay o ventas directas), el número de seguimiento se genera electrónicamente. El transportista recibe los datos del envío antes de la posesión física de la caja. Espere de 1 a 3 días hábiles para que el paquete llegue a las instalaciones de clasificación física.","trackingInfoReceivedTitle":"Información recibida","trackingStatusesIntro":"Gracias por utilizar nuestra herramienta unificada de seguimiento de paquetes internacionales. Debido a que su paquete viaja a través de múltiples fronteras globales, sus estados de seguimiento pueden ser complejos. Comprender el ciclo de vida de la logística ayuda a establecer expectativas claras.","trackingStatusesTitle":"Comprender los estados de seguimiento","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"a. m.","pmText":"p. m.","footerQuickLinks":"Enlaces rápidos","footerSupportLegal":"Soporte y legal","copyrightText":"Todos los derechos reservados.","englishResponseNotice":"Aviso: Todas las consultas se responden en inglés. Si envía en otro idioma, su mensaje puede traducirse al inglés para su verificación.","parcelDisagreeCheckbox":"No estoy de acuerdo","contactDisagreeCheckbox":"No estoy de acuerdo","contactNamePlaceholder":"Ej: Juan Pérez","systemRequirementsTitle":"Versiones mínimas soportadas del sistema","systemRequirements":"Windows: Windows 7 (with ESU updates installed) o superior\nmacOS: macOS 12 o superior\nAndroid: Android 13 o superior\niPhone/iOS: iOS 17 o superior\nLinux: Una distribución actualmente soportada con actualizaciones de seguridad activas","title":"Verificar acceso","subtitle":"Por favor complete el desafío a continuación para continuar.","selectLanguage":"Seleccionar idioma","selectLanguagePlaceholder":"-- Elija un idioma --","loadingChallenge":"Cargando desafío...","answerLabel":"Su respuesta:","answerPlaceholder":"Ingrese su respuesta","continueButton":"Continuar","refreshButton":"Nuevo desafío","verifying":"Verificando...","chooseLanguageFirst":"Por favor seleccione un idioma primero.","loadFailed":"Error al cargar el desafío. Por favor intente nuevamente.","expiredChallenge":"Desafío expirado. Cargando nuevo desafío...","verifyFailed":"Verificación fallida. Por favor intente nuevamente.","home":"Inicio","blog":"Blog","aboutUs":"Acerca De","faq":"Preguntas Frecuentes","contact":"Contacto","trackPackage":"Rastrear Paquete","cnyYearOfHorseMessage":"🧧 ¡Feliz Año Nuevo Lunar! Te deseamos prosperidad y alegría en el Año del Caballo! 🐴","singaporeNationalDayMessage":"🇸🇬 ¡Feliz Día Nacional, Singapur! ¡Celebrando 61 años de independencia! 🎉","indonesiaNationalDayMessage":"🇮🇩 ¡Feliz Día de la Independencia, Indonesia! ¡Viva la República de Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 ¡Feliz Día Nacional, Malasia! ¡Celebrando la independencia de nuestro país! 🎊","australiaNationalDayMessage":"🇦🇺 ¡Feliz Día de Australia! ¡Celebrando nuestra nación! 🎉","canadaNationalDayMessage":"🇨🇦 ¡Feliz Día de Canadá! ¡Celebrando nuestra gran nación! 🍁","usaNationalDayMessage":"🇺🇸 ¡Feliz Día de la Independencia, América! ¡Celebrando la libertad! 🎆","franceBastilleDayMessage":"🇫🇷 ¡Feliz 14 de Julio! ¡Viva Francia! 🎊","germanyUnityDayMessage":"🇩🇪 ¡Feliz Día de la Unidad Alemana! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 ¡Feliz Día de la República! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 ¡Feliz Día de la Fundación, Japón! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 ¡Feliz Día Nacional, China! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 ¡Feliz Día de la Liberación, Corea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 ¡Feliz Día de la Independencia, India! ¡Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 ¡Feliz Día Nacional, Tailandia! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 ¡Feliz Día de la Independencia, Filipinas! ¡Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 ¡Feliz Día Nacional, Vietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 ¡Feliz Día de la Independencia, Polonia! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 ¡Feliz Día de la Independencia, República Checa! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 ¡Feliz Día del Rey! ¡Viva el Rey! 🧡","norwayConstitutionDayMessage":"🇳🇴 ¡Felicidades, Noruega! 🇳🇴","swedenNationalDayMessage":"🇸🇪 ¡Feliz Día Nacional de Suecia! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 ¡Feliz Día de la Independencia, Finlandia! 🇫🇮","portugalNationalDayMessage":"🇵🇹 ¡Feliz Día de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! ¡Feliz Día de la Independencia, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 ¡Feliz Día de San Patricio, Irlanda! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 ¡Feliz Día Nacional de Brunéi! 🎊","newZealandWaitangiDayMessage":"🇳🇿 ¡Feliz Día de Waitangi, Nueva Zelanda! 🎉","switzerlandNationalDayMessage":"🇨🇭 ¡Feliz Día Nacional Suizo! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 ¡Feliz Día Nacional, Austria! 🎉","belgiumNationalDayMessage":"🇧🇪 ¡Feliz Fiesta Nacional, Bélgica! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! ¡Feliz Día de Rusia! 🎉","taiwanFoundingDayMessage":"🇹🇼 ¡Feliz Día de la Fundación, Taiwán! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 ¡Feliz Día del Doble Diez, Taiwán! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 ¡Feliz Día de la Fundación de la RAE de Hong Kong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 ¡Feliz Día de la Fundación de la RAE de Macao! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ ¡Feliz Día Internacional de los Trabajadores! ¡Celebrando el trabajo y los derechos laborales! 🎊","laborDayUSCAMessage":"⚒️ ¡Feliz Día del Trabajo! ¡Honrando las contribuciones de los trabajadores! 🎉","orderNumber":"Número de Pedido (Ejemplo: RTNX1234567890)","fromDate":"Desde Fecha (REQUERIDO)","toDate":"Hasta Fecha (REQUERIDO)","trackParcel":"Rastrear Paquete","selectCourier":"-- Seleccionar Mensajería / País --","singaporeCouriers":"Mensajerías de Singapur","topCountries":"Top 5 Países","otherCountries":"Otros Países","note":"NOTA","disclaimer":"DESCARGO DE RESPONSABILIDAD","importantInformation":"Información Importante:","didNotReceiveEmail":"Si no recibió su correo electrónico de confirmación de Etsy, eBay, Shopee o Payhip, desplácese hacia abajo para buscar su pedido a través de su dirección de correo electrónico o número de teléfono vinculado a este pedido.","searchByEmailOrPhone":"Buscar por Correo o Teléfono","searchOrder":"Buscar Pedido","trackingResult":"Resultado del Rastreo","noOrdersFound":"No se encontraron pedidos.","pleaseEnter":"Por favor ingrese un correo o número de pedido.","fillAllFields":"Por favor complete todos los campos requeridos: número de seguimiento, país de destino, número de pedido y código postal.","noOrderMatchingFields":"No se encontró pedido que coincida con todos los campos.","postcodeRequired":"Se requiere código postal para este destino.","invalidUSZip":"Código postal de EE.UU. inválido. Use 5 dígitos o ZIP+4.","failedGenerateURL":"Error al generar URL de seguimiento. Verifique la entrada.","trackingValidationSG":"Los números de seguimiento para Singapur deben ser: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG o PX123456789SG. Para envíos DHL use números de 10 dígitos.","invalidSingPostFormat":"Formato de número de seguimiento SingPost inválido.\nFormatos aceptados:\n• PP123456789SG → Etiqueta de seguimiento prepagada\n• SPNDD00012345 → Seguimiento SpeedPost Estándar","welcomeTitle":"¡Bienvenido al sitio web de Rhythm Nexus!","purchaseInfo":"Compre a través de nuestros canales oficiales, o únase a nuestro","purchaseInfoChina":"Compre a través de nuestros canales oficiales.","purchaseInfoChinaSuffix":"","telegramGroup":"grupo de Telegram","forUpdates":"para actualizaciones oficiales.","ourStores":"Nuestras Tiendas","etsyStore":"Tienda Etsy","ebayStore":"Tienda eBay","shopeeStore":"Tienda Shopee","payhipStore":"Tienda Payhip","internationalShipping":"Envío Internacional","singaporeLocal":"Singapur Local","asiaOnly":"Solo Asia","deliveryInfo":"Información de Entrega","deliveryRates2026":"Tarifas de Entrega 2026","sgDeliveryRates":"Tarifas de Entrega Singapur","speedPostRates":"Tarifas SpeedPost Express Internacional","aboutTitle":"Acerca de Rhythm Nexus","aboutP1":"Iniciamos nuestra tienda en 2022 y hemos vendido en Etsy, eBay y Shopee sin fallas.","aboutP2":"Hemos construido una sólida reputación enfocándonos en cumplimiento confiable y seguimiento preciso.","aboutP3":"Nuestro objetivo es proporcionar una experiencia de compra fluida y confiable.","aboutP4":"Gracias por apoyar a Rhythm Nexus.","faqTitle":"Preguntas Frecuentes","faqQ1":"¿Qué pasa si mi artículo está defectuoso? ¿Hay alguna garantía?","faqA1":"¡Sí! La mayoría de los pedidos vienen con una garantía de 1 año. Proporcione su número de factura/pedido para que podamos investigar. Nota: No se permiten cambios si el artículo coincide con la descripción, incluso si realizó el pedido incorrectamente.","faqQ2":"¿Puedo editar, actualizar o cancelar mi pedido?","faqA2":"Sí. Por seguridad, es posible que los cambios en el pedido deban gestionarse por correo electrónico o en nuestro formulario de contacto.","faqQ3":"¿Tengo que pagar impuestos de aduana/importación?","faqA3":"Las aduanas y los aranceles generalmente no se pagan por adelantado, excepto el DDP a los EE. UU. El IVA puede aplicarse a la UE, el Reino Unido, Australia/Nueva Zelanda, Noruega, Suiza y provincias canadienses como Saskatchewan y Manitoba, que ya se paga de forma predeterminada. No se aplica GST en Singapur. No podemos asesorar sobre tarifas aduaneras; comuníquese con la aduana local para obtener más detalles.","faqQ4":"¿Cuándo se envía mi pedido?","faqA4":"Los pedidos generalmente se envían dentro de 1 a 5 días hábiles. Durante los períodos de gran volumen, puede demorar entre 5 y 7 días.","faqQ5":"Pedí dos veces por accidente. ¿Qué debo hacer?","faqA5":"Solo reembolsamos los gastos de envío duplicados. Ambos artículos se enviarán juntos. Reembolso = (primera tarifa de envío + segunda tarifa de envío) – tarifa de envío real.","faqQ6":"¿Cuánto tiempo tarda la entrega?","faqA6":"El procesamiento demora entre 1 y 5 días hábiles.\n\nEnvío nacional:\n• Etiqueta con seguimiento prepago de SignPost: 2 a 4 días\n• Estándar de SpeedPost: 1 a 3 días\n\nInternacional:\n• SingPost ePAC: 14 a 30 días\n• Prioridad de SpeedPost (EMS): 8 a 15 días\n• SpeedPost Express: 4 a 8 días\n\nPueden ocurrir retrasos durante las temporadas altas.","faqQ7":"Mi artículo está siendo devuelto al remitente. ¿Qué debo hacer?","faqA7":"Se permite un reenvío. La cancelación no es posible para direcciones no válidas, paquetes no reclamados o tarifas de aduana impagas. Comuníquese con su servicio postal para la reentrega o envíenos un mensaje para obtener ayuda.","faqQ8":"Mi artículo se perdió / fue robado en tránsito.","faqA8":"Permitimos un reenvío. Si se pierde nuevamente, se emite un reembolso completo después de la ventana de entrega del servicio de mensajería:\n\n• Servicios locales de Singapur: 7 días\n• SingPost ePAC y SpeedPost Priority International: 30 días\n• SpeedPost Intl Express: 14 días","blogTitle":"Base de Conocimientos de Envío","blogSubtitle":"Explicaciones oficiales sobre servicios postales.","readMore":"Leer Más","backButton":"Atrás","blogPost1Title":"¿Qué es SingPost ePAC?","blogPost1Desc":"Aprenda sobre ePAC.","blogPost2Title":"¿Qué es SpeedPost Priority International (EMS)?","blogPost2Desc":"Descubra EMS.","blogPost3Title":"¿Qué es SpeedPost Express?","blogPost3Desc":"Explore SpeedPost Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Comprenda PDDP.","blogPost5Title":"IVA UE & IOSS","blogPost5Desc":"Información sobre IVA UE.","blogPost6Title":"IVA UK & HMRC","blogPost6Desc":"Requisitos de IVA en el Reino Unido.","blogPost7Title":"Noruega VOEC","blogPost7Desc":"Sistema VOEC de Noruega.","blogPost8Title":"IVA Suizo","blogPost8Desc":"Requisitos de IVA suizo.","enterDestinationPostcode":"Introducir código postal de destino","trackingNumberExample":"p. ej. LG123456789SG","trackingCaseSensitive":"LAS LETRAS DE SEGUIMIENTO DISTINGUEN MAYÚSCULAS DE MINÚSCULAS Y DEBEN ESTAR EN MAYÚSCULAS.","usaPostcodeNote":"Para países sin códigos postales, como Hong Kong y Macao, ingrese 999077 (Hong Kong) o 999078 (Macao).","epacDeliveryNote":"¡Tenga en cuenta que todos los artículos ePAC enviados al destino deben entregarse en su buzón, puerta, casillero de paquetes o dejarse en un lugar seguro!","currentTime":"Hora actual","timezoneNote":"Hora mostrada en formato de 12 horas","sameTimeAsSingapore":"Misma hora que Singapur","hourAhead":"hora adelante de Singapur","hoursAhead":"horas adelante de Singapur","hourBehind":"hora atrás de Singapur","hoursBehind":"horas atrás de Singapur","collectAtPostOffice":"Sin embargo, si su país no tiene buzón disponible como estándar, tendrá que recogerlo en la oficina de correos.","countriesNoMailbox":"Países que se sabe que no tienen entrega en buzón/buzón de correos disponible: Brunei, China, India, Israel, Macao RAE China, Filipinas, Polonia y Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus NO ES RESPONSABLE de gestionar las entregas, ya que está fuera de nuestro control y preferiríamos que usted rastree el estado de su artículo.","issuesAfterDelivery":"Cualquier problema con su entrega después de 30/45 días (14 días para SpeedPost Express) o si el estado muestra entregado pero no recibió, contáctenos","cannotUseEmbed":"No podemos usar la inserción para el seguimiento ya que la mayoría de los sitios web de servicios postales no lo admiten.","clickLinkAbove":"Haga clic en el enlace de arriba para rastrear su paquete.","trackingDetailsNote":"Tenga en cuenta que los detalles de seguimiento pueden no aparecer en los resultados de búsqueda, por lo que se recomienda pegar el número de seguimiento en el sistema para rastrear el artículo.","thirdPartyWebsites":"También puede rastrear sus paquetes en estos sitios web de terceros:","enterEmailOrPhone":"Correo electrónico o teléfono","reviewShippingRates":"Revise nuestras tarifas de envío actuales","here":"aquí","contactUsForm":"Comuníquese con nosotros a través de","form":"formulario","forEnquiries":"para cualquier consulta que tenga con respecto a su pedido.","anPostNoDirectTracking":"An Post (Irlanda) no admite enlaces de seguimiento directos ni seguimiento integrado.","anPostPasteManually":"Por favor, pega tu número de seguimiento manualmente en el sitio web de An Post. ","goToAnPost":"Ir a An Post","countryMsgNL":"Si el estado indica 'Retenido por Aduanas', póngase en contacto con la Línea de Información Aduanera de los Países Bajos para obtener ayuda:\n0800 0143 (gratuito), de lunes a viernes de 7 a 23 h.\nSábados y domingos de 8 a 16:30 h.\n\nSe recomienda registrar una cuenta con PostNL para recibir notificaciones push instantáneas de sus paquetes:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nSi se está entregando en un punto PostNL o el estado le dice que lo recoja en la oficina de correos, tendrá que pagar 7 EUR en el mostrador. Como máximo 4 EUR si se paga en línea.","countryMsgDE":"Le recomendamos que descargue la aplicación Post & DHL para recibir notificaciones push del estado de seguimiento de sus paquetes:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nContacto del Servicio al Cliente de DHL Paket GmbH:\n+49-228-433-3112\nContacto DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Deberá presentar una declaración de importación adicional a la aduana. No hacerlo podría resultar en una restricción de entrada y la devolución del paquete. \nMás información: https://www.posti.fi/en/receiving/customs-clearance \nOtros enlaces: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Se cobran tarifas de manejo de 4,95 EUR.\nDescargue la aplicación aquí: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Se cobran tarifas de manejo de 8,50 PLN. \nTendrá que pagarlas al recoger en la oficina de correos,\nya que es poco probable que el paquete se entregue en su puerta o buzón.","countryMsgPH":"PHLPost se considera ineficiente y poco confiable en Filipinas.\nSiempre haga un seguimiento de su paquete, ya que a veces el estado de salida para entrega\nsolo aparecerá entre 1 y 3 semanas para paquetes más pequeños. Para paquetes más grandes, \nla recogida solo es posible a través de la Oficina Central de Correos de Manila o la oficina de correos\nmás cercana en su área. Tenga en cuenta que se aplica una tarifa de manejo de 112 PHP para paquetes de\ncualquier valor que deberá pagar. No pagar resultará en la devolución del paquete\na nosotros. Se estima que la entrega será de 1-2 meses debido a la lentitud de los servicios de PHLPost. \nNo necesita pagar impuestos para artículos por debajo de 10000 PHP, pero deberá hacerlo si es igual o superior a esa cantidad. \nRecomendaríamos SpeedPost Express para un proceso más rápido la próxima vez que pida con nosotros. Sin embargo, las tarifas pueden no aplicarse ya que D&T para el destinatario es por defecto.","countryMsgCA":"El de minimis es de 20 CAD para todos los pedidos enviados a Canadá. Como Singapur es parte del acuerdo CPTPP, es posible que no se apliquen derechos, pero D&T puede aplicarse si el artículo excede los 60 CAD y más o 100 CAD y más, lo que puede depender del código HS del artículo. Cualquier valor por encima de esa cantidad se cobrará con IVA en consecuencia.","countryMsgID":"Debe pagar cualquier impuesto y derecho aplicable a su llegada a Indonesia. Haga un seguimiento de su paquete y pague el monto especificado a la aduana indonesia.\nTambién deberá presentar documentos de despacho adicionales. No hacerlo puede resultar en una restricción de entrada o la incautación del paquete por la aduana del país. Verifique más detalles aquí:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Debe pagar cualquier impuesto y derecho aplicable a su llegada a India. Haga un seguimiento de su paquete y pague el monto especificado a la aduana india.\nTenga en cuenta que el despacho de aduanas en India es estricto y puede o no cobrarse derechos si el valor de su artículo es superior a 1000 INR (15 USD) - dependiendo del código HS, en la mayoría de los casos está libre de derechos, pero podría cobrarse derechos más altos si el artículo es superior a 5000 INR (60 USD). \nComo India Post NO entrega en el buzón como estándar, ES POSIBLE que se le requiera estar en casa o un representante autorizado para recibir su paquete o recogerlo en la oficina de correos.","countryMsgMY":"El de minimis es de 500 MYR para todos los pedidos enviados a Malasia. Los pedidos por encima de esa cantidad pueden ser cobrados.","countryMsgUS":"A partir del 29 de agosto de 2025, el de minimis de 800 USD se eliminará oficialmente y los aranceles de importación serán pagaderos por defecto para el remitente en el país de origen.\nEl envío a EE.UU. REQUIERE un número de teléfono y dirección de correo electrónico válidos para que su paquete evite tener más demoras.","countryMsgIL":"El de minimis es de 240 ILS (75 USD) para todos los pedidos enviados a Israel. Los pedidos por encima de esa cantidad pueden ser cobrados. \nTenga en cuenta que para los pedidos enviados a Israel, Israel Post a veces puede no reconocer la entrega final una vez que se entrega. \nComo Israel Post NO entrega en el buzón como estándar, ES POSIBLE que se le requiera estar en casa o un representante autorizado para recibir su paquete o recogerlo en la oficina de correos.","countryMsgGB":"Tenga en cuenta que para los pedidos enviados al Reino Unido, Royal Mail a veces puede no reconocer la entrega final una vez que se entrega en su buzón.","countryMsgTH":"El de minimis es de 1500 THB (45 USD) para todos los pedidos enviados a Tailandia. Los pedidos por encima de esa cantidad pueden ser cobrados.","countryMsgTW":"El de minimis es de 2000 TWD (60 USD) para todos los pedidos enviados a Taiwán. Los pedidos por encima de esa cantidad pueden ser cobrados.","countryMsgMO":"No se cobra D&T al enviar a Macao. Pero tenga en cuenta que Macao Post NO entrega en el buzón como estándar, DEBERÁ recoger su paquete en la oficina de correos.","countryMsgBN":"No se cobra D&T al enviar a Brunei. Pero tenga en cuenta que Brunei Post NO entrega en el buzón como estándar, DEBERÁ recoger su paquete en la oficina de correos. \nEl sistema de seguimiento para este país no es muy estable y solo se puede dar información limitada, y los resultados de entrega final NO se dan al origen.","countryMsgJP":"El de minimis es de 10000 JPY (65 USD) para todos los pedidos enviados a Japón. Los pedidos por encima de esa cantidad pueden ser cobrados.","countryMsgKR":"El de minimis es de 180000 KRW (150 USD) para todos los pedidos enviados a Corea del Sur. Los pedidos por encima de esa cantidad pueden ser cobrados.","countryMsgVN":"Para Vietnam, permanezca CONTACTABLE durante la entrega, ya que es posible que se le cobren tarifas de manejo al entregar el artículo. \nEl de minimis es de 1000000 (35 USD) para todos los pedidos enviados a Vietnam. Los pedidos por encima de esa cantidad pueden ser cobrados. \nComo Vietnam Post NO entrega en el buzón como estándar, ES POSIBLE que se le requiera estar en casa o un representante autorizado para recibir su paquete o recogerlo en la oficina de correos.","countryMsgPP":"Los artículos de Tracked Label se publicarán en POPDrop/POPStop en la oficina de correos. Los artículos SpeedPost Standard generalmente se publican en POPStop o POPStation.\nTenga en cuenta que las entregas de artículos de Tracked Label se realizarán SOLO de lunes a viernes de 9 a.m. a 6 p.m. Excepto fines de semana y días festivos.","postedDate":"Fecha de Envío:","status":"Estado:","shippedVia":"Enviado vía:","destination":"Destino:","statusInPreparation":"En preparación","statusInTransit":"En tránsito","statusDelivered":"Entregado","statusOutForDelivery":"En ruta de entrega","statusArrived":"Llegado","statusProcessing":"Procesando","statusDispatched":"Despachado","statusReturned":"Devuelto","statusFailed":"Fallido","statusCancelled":"Cancelado","statusHeldByCustms":"Retenido por aduanas","statusAwaitingCollection":"En espera de recogida","aka":"también conocido como","thisServiceKnownAs":"Este servicio se conoce como","in":"en","viewTrackingDHL":"Ver información de seguimiento de DHL Express","viewTrackingSingPostSpeedPost":"Ver información de seguimiento de Singapore SpeedPost","viewTrackingDHLLastMile":"Ver información de seguimiento de DHL Express (Última milla)","viewTrackingDHLShipperRef":"Ver información de seguimiento de DHL Express (Referencia del remitente)","viewTrackingSingPost":"Ver información de seguimiento de Singapore Post","viewTrackingDestPost":"Ver información de seguimiento de","post":"Correos","orderNumberExample":"Número de Pedido (comienza con RTNX o DLTB - ejemplo: RTNX1234567890):","deliveryRecordNote":"Tenga en cuenta que una vez que el artículo ha sido entregado, el registro solo se almacenará hasta 7 días y será eliminado.","copyrightAllRights":"Todos los derechos reservados.","accessRestricted":"Acceso Restringido","vpnDetectedMessage":"Uso de VPN detectado. Desactive el VPN para acceder a este servicio.","contactSupportError":"Si cree que esto es un error, contacte con soporte.","destinationNotAllowed":"El acceso a este país de destino no está disponible desde su ubicación. Seleccione un destino diferente.","epacUS":"Servicio de paquete internacional de primera clase","epacCH":"Prioridad Plus","epacGB":"Seguimiento internacional","epacMY":"Seguimiento internacional/Express","epacCA":"Express internacional entrante","epacAU":"Empacar y rastrear internacionalmente","epacNZ":"Seguimiento económico internacional","epacDE":"Warenpost Premium Internacional","epacFR":"Carta internacional con seguimiento","epacNL":"Seguimiento de paquetes internacionales","epacPL":"GLOBAL Express","epacBE":"Prime internacional entrante","epacAT":"Paquete internacional con seguimiento","epacIN":"Paquete internacional con seguimiento","epacFI":"Carta internacional con seguimiento","epacSE":"Carta internacional con seguimiento","epacNO":"PRIME Exprès","epacIT":"Expresar","epacIL":"Expresar","epacES":"Paquete Internacional Light","epacPT":"Correo azul internacional","epacCZ":"Envío rastreado desde el extranjero","epacBN":"ePacket internacional","epacCN":"ePacket internacional","epacHK":"ePacket internacional","epacID":"e-Paquete internacional","epacMO":"ePacket internacional","epacPH":"Correo rastreado internacional","epacTW":"ePacket internacional","epacTH":"ePacket internacional","epacVN":"E-Paquete internacional (Paquete ASEAN)","epacKR":"Paquete K","epacJP":"e-Paquete internacional Light","epacIE":"Correo expreso internacional","blogSingPostEPACContent1":"SingPost ePAC (ePacket) es un servicio postal económico con seguimiento para envíos de comercio electrónico internacional ligeros.","blogSingPostEPACContent2":"Es entregado por el operador postal nacional del país de destino y se usa comúnmente para paquetes menores de 2 kg, con un límite de dimensión de longitud + ancho + alto por debajo de 90 cm y una longitud que no exceda los 60 cm.","blogSingPostEPACContent3":"Esta opción fue ofrecida inicialmente solo por Hong Kong Post junto con eBay China, permitiendo que los paquetes de China y Hong Kong se enviaran a EE.UU. con seguimiento de entrega sin requerir ninguna firma en la entrega. Este servicio es conocido como USPS (United States Postal Service) First-Class Package International Service en EE.UU.","blogSingPostEPACContent4":"A partir del 1 de enero de 2026, ePAC ahora se usa para todos los países para cumplir con las regulaciones obligatorias de la UPU que requieren seguimiento para paquetes y limitan los artículos registrados solo a documentos.","blogSingPostEPACContent5":"Prefijos de seguimiento: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS es un servicio postal expreso internacional premium, priorizado por operadores postales en todo el mundo.","blogSpeedPostEMSContent2":"El despacho de aduanas es generalmente más rápido que el correo estándar pero más estricto en el proceso, con seguimiento completo hasta la entrega.","blogSpeedPostEMSContent3":"En Singapur, esto se conoce como SpeedPost Priority International por SingPost.","blogSpeedPostEMSContent4":"Prefijo de seguimiento: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express es un servicio de calidad de mensajería.","blogSpeedPostExpressContent2":"En muchos destinos, DHL Express realiza la entrega de última milla y recauda aranceles o impuestos antes de la liberación.","blogSpeedPostExpressContent3":"Prefijo de seguimiento: PX123456789SG (La última milla de DHL Express usa un número de seguimiento de 10 dígitos, que no es visible al público, pero tenemos información al respecto a través de nuestro","blogSpeedPostExpressContent3Link":"Sistema de Seguimiento.","blogUSPDDPContent1":"PDDP permite que los aranceles e impuestos de importación de EE.UU. se paguen por adelantado antes de la entrega, reduciendo cargos sorpresa para los destinatarios.","blogUSPDDPContent2":"Nuevas Regulaciones (Efectivo 29 de agosto de 2025)","blogUSPDDPContent2List1":"Códigos HTS obligatorios","blogUSPDDPContent2List2":"Descripciones precisas de artículos","blogUSPDDPContent2List3":"Aplicación arancelaria más estricta","blogUSPDDPContent3":"Todos los artículos enviados a EE.UU. no se les cobrarán aranceles adicionales al destinatario ya que pagamos en su nombre. Sin embargo, tenga en cuenta que el precio del artículo incluye la tarifa de importación del 10% por defecto para cumplir con las regulaciones.","blogUSPDDPContent4":"Esto solo se aplica a nuestros métodos de envío a EE.UU., SpeedPost Priority International (EMS) y SingPost ePAC únicamente.","blogEUIOSSContent1":"La UE aplica IVA en todas las importaciones comerciales independientemente del valor.","blogEUIOSSContent2":"IOSS (ventanilla única de importación)","blogEUIOSSContent3":"IOSS permite a los vendedores cobrar el IVA de la UE al momento del pago para envíos de hasta €150.","blogEUIOSSContent4":"El IVA se remite a través del sistema IOSS, permitiendo un despacho de aduanas más rápido y sin cobro de IVA en la entrega.","blogEUIOSSContent5":"Para todos los pedidos a través de Etsy o eBay, el IVA IOSS ya se cobra al momento del pago y lo indicaremos en el Número de Referencia Fiscal para transmitir los datos al servicio postal de destino a través de EDI (Electronic Data Interchange).","blogUKVATContent1":"El Reino Unido requiere que se contabilice el IVA para los bienes importados.","blogUKVATContent2":"Para envíos de bajo valor, el IVA generalmente se cobra al momento del pago y se remite directamente a HMRC por el vendedor o mercado.","blogUKVATContent3":"Para envíos de mayor valor, el IVA puede ser cobrado por el transportista antes de la entrega.","blogUKVATContent4":"Para todos los pedidos a través de Etsy o eBay, el IVA ya se cobra al momento del pago y lo indicaremos en el Número de Referencia Fiscal para transmitir los datos al servicio postal de destino a través de EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"Noruega introdujo el sistema VOEC (VAT on E-Commerce) para bienes importados desde fuera de la UE/EEE. Esto se aplica a bienes valorados hasta 3,000 NOK.","blogNorwayVOECContent2":"Los vendedores pueden registrarse en el esquema VOEC para cobrar el IVA noruego al momento del pago, permitiendo un despacho de aduanas más rápido y sin cobro de IVA en la entrega.","blogNorwayVOECContent3":"Para todos los pedidos a través de Etsy o eBay, el IVA VOEC ya se cobra al momento del pago. El seguimiento y la documentación aduanera indican el Número de Referencia Fiscal para transmitir datos al servicio postal noruego.","blogSwissVATContent1":"Suiza cobra IVA en bienes importados independientemente del valor. La Administración Federal de Aduanas de Suiza requiere que los vendedores extranjeros cobren el IVA al momento del pago para bienes de hasta 65 CHF.","blogSwissVATContent2":"Los vendedores registrados en el sistema de IVA suizo remiten el IVA cobrado directamente, asegurando que el destinatario no experimente ningún cargo adicional de IVA en la entrega.","blogSwissVATContent3":"Para todos los pedidos a través de Etsy o eBay, el IVA suizo ya se cobra durante el pago, y la documentación aduanera incluye el Número de Referencia Fiscal para la presentación EDI.","dhlNoEmbed":"DHL Express no admite seguimiento mediante inserción. Por favor","speedPostNoEmbed":"SpeedPost Singapur no admite seguimiento mediante inserción. Por favor","operatorNoEmbed":"no admite seguimiento mediante inserción. Por favor","clickHere":"haga clic aquí","toTrackNewTab":"para rastrear (se abre en una nueva pestaña).","optionSingPost":"🇸🇬 SingPost (SPNDD/PP)","countryAU":"🇦🇺Australia","countryCA":"🇨🇦 Canadá","countryDE":"🇩🇪 Alemania","countryGB":"🇬🇧 Reino Unido","countryUS":"🇺🇸 Estados Unidos","countryAT":"🇦🇹 Austria","countryBE":"🇧🇪 Bélgica","countryBN":"🇧🇳 Brunéi","countryCN":"🇨🇳China","countryCZ":"🇨🇿 Chequia","countryFI":"🇫🇮 Finlandia","countryFR":"🇫🇷 Francia","countryHK":"🇭🇰 Hong Kong RAE China","countryIN":"🇮🇳 India","countryID":"🇮🇩Indonesia","countryIE":"🇮🇪 Irlanda","countryIL":"🇮🇱Israel","countryIT":"🇮🇹 Italia","countryJP":"🇯🇵 Japón","countryMO":"🇲🇴 Macao RAE China","countryMY":"🇲🇾 Malasia","countryNL":"🇳🇱 Países Bajos","countryNZ":"🇳🇿 Nueva Zelanda","countryNO":"🇳🇴 Noruega","countryPH":"🇵🇭 Filipinas","countryPL":"🇵🇱 Polonia","countryPT":"🇵🇹Portugal","countryRU":"🇷🇺 Rusia","countryKR":"🇰🇷 Corea del Sur","countryES":"🇪🇸 España","countrySE":"🇸🇪 Suecia","countryCH":"🇨🇭 Suiza","countryTW":"🇹🇼 Taiwán","countryTH":"🇹🇭 Tailandia","countryVN":"🇻🇳Vietnam","countrySG":"🇸🇬 Singapur","russiaServiceSuspended":"⚠️ AVISO IMPORTANTE: En vista de la invasión rusa de Ucrania en 2022, SingPost ha suspendido todos los envíos a Rusia junto con DHL. Actualmente no servimos a Rusia hasta que se anuncie la reanudación de servicios al país.","goodFridayEasterGreeting":"¡Felices Pascuas! Deseándoles paz y alegría durante el Viernes Santo y Pascua.","christmasGreeting":"¡Feliz Navidad y Próspero Año Nuevo! Deseándoles paz y alegría del 25 de diciembre al 5 de enero.","captchaSystemRequirements":"Requisitos mínimos del sistema: Windows 7 (with ESU updates installed) u 11, macOS 10.15+ o la última versión de Android/iOS.","hariRayaMessage":"🌙¡Selamat Hari Raya Aidilfitri! ¡Le deseo a usted y a su familia paz, alegría y bendiciones! 🌟","deepavaliMessage":"🪔 ¡Feliz Dipavali! ¡Que el festival de las luces les traiga alegría, prosperidad y éxito! ✨","diwaliMessage":"🪔 ¡Feliz Diwali! ¡Que el festival de las luces les traiga alegría, prosperidad y éxito! ✨","vesakMessage":"☸️ ¡Feliz día de Vesak! ¡Les deseo paz, sabiduría e iluminación en este día sagrado! 🙏","vesakTHMessage":"☸️ ¡Feliz día de Visakha Bucha! ¡Les deseo paz, sabiduría e iluminación en este día sagrado! 🙏","temporaryClosureNoticeTitle":"Rhythm Nexus - Aviso de cierre temporal","temporaryClosureNoticeBody":"Estimados clientes,\n\nTengan en cuenta que Rhythm Nexus estara temporalmente cerrado del 21 de marzo de 2026 al 26 de marzo de 2026 debido a un evento de la empresa.\n\nPara prepararnos para el cierre, la tienda entrara en modo vacaciones a partir del 20 de marzo de 2026 a las 3:00 PM (UTC +8). Los pedidos realizados despues de esta hora podrian no procesarse hasta que reanudemos nuestras operaciones.\n\nLas operaciones normales se reanudaran el 27 de marzo de 2026.\n\nPedimos disculpas por cualquier inconveniente y agradecemos su comprension y apoyo continuo.\n\nGracias.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Entiendo","parcelTracking":"Seguimiento de paquetes","serviceAnnouncement":"Anuncio de servicio","usaWinterStormTitle":"URGENTE: Tormenta de invierno severa - Interrupción de servicio","usaWinterStormSubtitle":"Evento de fuerza mayor del USPS","usaWinterStormNotice1":"Debido a la severa tormenta invernal que afecta la región de Nueva York desde el 23 de febrero de 2026:","usaWinterStormNotice2":"Las operaciones internacionales en el Aeropuerto Internacional John F. Kennedy han sido efectivamente detenidas","usaWinterStormNotice3":"Cancelaciones masivas de vuelos e interrupciones significativas de los servicios aeroportuarios reportadas","usaWinterStormNotice4":"Estas condiciones constituyen un evento de fuerza mayor más allá del control del USPS","usaWinterStormNotice5":"Impacto en el servicio:","usaWinterStormNotice6":"Mezcla peligrosa de fuertes nevadas, lluvia helada, aguanieve y frío extremo","usaWinterStormNotice7":"Interrupciones importantes y apagones generalizados reportados","usaWinterStormNotice8":"Afectación de la recopilación y entrega de correo nacional e internacional (correo de carta, correo de paquete e artículos EMS)","usaWinterStormNotice9":"Áreas de códigos postales afectadas:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS está tomando todas las medidas necesarias para minimizar inconvenientes a los clientes mientras mantiene la seguridad de los empleados. Apreciamos su paciencia y comprensión durante este evento de fuerza mayor.","usaWinterStormNotice12":"Última actualización: 25 de febrero de 2026","countryAutoDetected":"Destino preestablecido según su ubicación","countryAutoDetectedFromLink":"Destino preestablecido desde el enlace","trackingNumber":"El número de rastreo","destinationCountry":"País de destino","postcode":"Código postal","australianDSTTitle":"Horario de verano australiano activo","australianDSTBothMessage":"Actualmente están vigentes la AEDT (hora de verano del este de Australia) y la ACDT (hora de verano del centro de Australia).","australianAEDTMessage":"AEDT (hora de verano del este de Australia) está actualmente en vigor para Sydney, Melbourne y sus alrededores.","australianACDTMessage":"ACDT (hora de verano central de Australia) está actualmente en vigor para Adelaida y Australia del Sur.","australianDSTNote":"Los tiempos de entrega que se muestran arriba reflejan el horario de verano actual.","filteredAllowedDestinations":"(Filtrado por sus destinos permitidos)","loadingAnnouncements":"Cargando anuncios...","unableToLoadAnnouncements":"No se pueden cargar anuncios de servicio en este momento.","postalContactsTitle":"Contactos de Servicios Postales","postalContactsNote":"Nota:","postalContactsPolandUKNote":"Para Polonia y Reino Unido, todos los artículos enviados a través de SpeedPost Priority (EMS) serán manejados por Pocztex y Parcelforce.","postalContactsDHLNote":"Para envíos de SpeedPost Express, póngase en contacto con DHL a través de este enlace:","postalContactsCountry":"País","postalContactsWebsite":"Sitio web","postalContactsForm":"Formulario de contacto","postalContactsPhone":"Número de teléfono","postalContactsEmail":"Correo electrónico de contacto","postalContactsFormLink":"Formulario de contacto","postalContactsBackButton":"Volver al formulario de consulta de paquetes","viewOnSingPostWebsite":"Ver en el sitio web de SingPost →","contactUsTitle":"Contáctenos","contactNameLabel":"Nombre (SIN APODOS NI NÚMERO DE TELÉFONO)","contactEmailLabel":"Dirección de correo electrónico (donde le responderemos)","contactEmailNote":"No se aceptan correos electrónicos de retransmisión privada (por ejemplo, @privaterelay.appleid.com). Utilice una dirección de correo electrónico válida.","contactEnquiryTypeLabel":"¿Es esto un?","contactSelectOption":"Seleccione una opción","contactGeneralEnquiry":"Consulta general / Comentarios","contactBusinessEnquiry":"Consulta comercial","contactOrderShippingEnquiry":"Consulta de pedido/envío","contactExchangeRefundEnquiry":"Consulta de cambio/reembolso/devolución","contactOthers":"Otros","contactParcelWarning":"Si su paquete no se ha entregado durante más de 18/30/45 días (14 días para FedEx), o el estado muestra entregado pero no lo tiene, complete","contactParcelWarningLink":"ESTE FORMULARIO","contactParcelWarningEnd":"en su lugar.","contactOrderNumberLabel":"Número de pedido","contactOrderNumberPlaceholder":"Ejemplo: RTNX1234567890","contactPlatformNote":"Número de pedido de Etsy, eBay y Shopee aquí. NO tenemos NINGÚN control sobre los reembolsos de estas plataformas. Póngase en contacto con su servicio de atención al cliente respectivamente.","contactPlatformInstructions":"Utilice la aplicación para consultar su número de pedido, ya que está guardado en la aplicación:","contactPlatformEtsy":"Etsy - Arriba a la derecha en su perfil → Compras","contactPlatformEbay":"eBay - Mi eBay → Compras","contactPlatformShopee":"Shopee - Yo → Ver historial de compras (o puede hacer clic en Para enviar/Para recibir)","contactRefundNote1":"Si está consultando sobre devolución/reembolso para las plataformas desde las que realizó compras, tenga en cuenta que NO tenemos NINGÚN control sobre los reembolsos de estas plataformas. Póngase en contacto con su servicio de atención al cliente respectivamente.","contactRefundNote2":"Para devoluciones o cambios, no lo permitimos para guantes maimai si ya se han usado al abrirlos (manchas visibles o lavados en lavadora/lavado manual), y no se permiten devoluciones ni cambios para tarjetas de diversión. Gracias.","contactRefundNote3":"Tenga en cuenta que para reembolsos a través de Payhip, comuníquese con su banco o con el soporte de Payhip en support@payhip.com si no ha recibido el reembolso, ya que no tenemos control sobre el proceso.","contactMessageLabel":"Su mensaje (hasta 1000 caracteres)","contactCharacterCount":"caracteres","contactSpamWarningNote":"Nota:","contactSpamWarning":"Las ofertas no solicitadas de SEO, diseño web, préstamos o servicios similares se rechazarán automáticamente.","contactAgreementText1":"Haga clic en \"Acepto\" si acepta que Rhythm Nexus utilice su dirección de correo electrónico para responderle, ya que esto es necesario para que podamos leer su respuesta y responderle una vez que encontremos una solución a su consulta.","contactAgreementText2":"Tenga en cuenta que nuestra respuesta tomará entre 3 y 5 días hábiles, o más durante un alto volumen de correos electrónicos de nuestra parte.","contactAgreeCheckbox":"Acepto","contactSuccessMessage":"¡Su mensaje se ha enviado correctamente! Responderemos dentro de 3-5 días hábiles.","contactErrorMessage":"Error al enviar el mensaje. Inténtelo de nuevo.","contactGeneralError":"Ocurrió un error. Inténtelo de nuevo más tarde.","contactSubmitting":"Enviando...","contactSubmit":"Enviar","contactAlertAgree":"Acepte los términos para enviar el formulario.","parcelEnquiryTitle":"Consulta de paquete","parcelInfoText":"Este formulario es para paquetes que no se entregan durante más de 18/30/45 días (14 días para FedEx/DHL), o que han mostrado el estado de entregado pero no los tiene.","parcelInfoLink":"Haga clic aquí","parcelInfoEnd":"para otras consultas.","parcelWaitTitle":"Espere su paquete","parcelWaitText1":"Espere a que se entregue su paquete. Tenga en cuenta que las entregas internacionales NO son lo mismo que las entregas locales, ya que necesitan tiempo. ¡Gracias!","parcelWaitText2":"Si no aparece ningún estado después de 18 días (7 días para Singapur) o más, puede hacérnoslo saber directamente.","parcelCannotSubmit":"No puede enviar este formulario si seleccionó \"No\".","parcelNameLabel":"Nombre","parcelOrderNumberLabel":"Número de pedido (Ejemplo: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Dirección de correo electrónico (Le responderemos por aquí)","parcelEmailNote":"No se aceptan correos electrónicos de retransmisión privada. Utilice una dirección de correo electrónico válida.","parcelShippingMethodLabel":"¿Método de envío elegido?","parcelSelectShipping":"Seleccione un método de envío","parcelSingPostEpac":"SingPost ePacket (o ePAC) - alias SpeedPost Saver International (Seguimiento: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Seguimiento: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Seguimiento: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Seguimiento: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Seguimiento: PX123456789SG)","parcelDHL":"DHL Express (Solo países de la UE) (Seguimiento: 1234567890)","parcelTrackingNumberLabel":"¿Número de seguimiento de su paquete?","parcelUndeliveredLabel":"¿Su paquete no se ha entregado durante más de 18/30/45 días? (Servicios locales de Singapur >7 días, >14 días para SpeedPost Express/DHL)","parcelSelectOption":"Seleccione una opción","parcelYes":"Sí","parcelNo":"No","parcelDeliveredButMissingLabel":"¿Su paquete mostró el estado entregado, pero no está presente en su buzón/lugar seguro/puerta?","parcelCaseReferenceLabel":"ID de referencia de caso de la oficina de correos local","parcelCaseReferencePlaceholder":"Ponga NA si es de Singapur","parcelCaseReferenceNote":"Antes de enviar este formulario, comuníquese con su oficina de correos local por teléfono o correo electrónico y obtenga un ID de referencia de caso de ellos. Luego, ponga su ID de referencia de caso aquí.","parcelCaseReferenceLink":"Consulte este enlace para contactos del servicio postal","parcelCaseReferenceMandatory":"PONGA NA SOLO SI ES DE SINGAPUR. Para otros países es OBLIGATORIO proporcionarlo. Requerido para SpeedPost Express también, para el ID de caso de DHL.","parcelImageEvidenceLabel":"Evidencia de imagen (para paquetes entregados pero perdidos)","parcelImageWarning":"Para verificación adicional, necesitamos evidencia de imagen para demostrar que no está haciendo afirmaciones falsas sobre la no entrega del paquete. (Solo para paquetes que ya están entregados, pero no están presentes en el buzón/fuera de la puerta. Podemos rechazar su reclamo si no se proporciona evidencia fotográfica para artículos entregados. Ignore esto si su artículo NO ha mostrado el estado entregado.)","parcelImageNote":"Cargue 1 archivo compatible: imagen. Máx. 1 GB.","parcelAgreementText":"Haga clic en \"Acepto\" si se asegura de que lo que le sucedió a su paquete era cierto.","parcelAgreeCheckbox":"Acepto","parcelSuccessMessage":"¡Su consulta de paquete se ha enviado correctamente! Responderemos dentro de 3-5 días hábiles.","parcelErrorMessage":"Error al enviar la consulta. Inténtelo de nuevo.","parcelGeneralError":"Ocurrió un error. Inténtelo de nuevo más tarde.","parcelAlertWait":"Espere a que se entregue su paquete. Puede enviar este formulario después del período de espera especificado.","parcelAlertAgree":"Acepte los términos para enviar el formulario.","parcelAlertCaseReference":"Proporcione un ID de referencia de caso de su oficina de correos local, o ponga NA si es de Singapur.","parcelSubmitting":"Enviando...","parcelSubmit":"Enviar","tzAEST":"AEST (Sídney/Melbourne)","tzACST":"ACST (Adelaida)","tzAWST":"AWST (Perth)","tzNST":"NST (Terranova)","tzAST":"AST (Atlántico)","tzEST":"EST (Este)","tzCST":"CST (Central)","tzMST":"MST (Montaña)","tzPST":"PST (Pacífico)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawái)","tzBeijing":"Pekín","tzXinjiang":"Xinjiang","tzWIB":"WIB (Yakarta)","tzWITA":"WITA (Macasar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Óblast de Kaliningrado (UTC+2)","tzMoscow":"Moscú/Rusia Occidental (UTC+3)","tzSamara":"Óblast de Samara (UTC+4)","tzUral":"Región de los Urales (UTC+5)","tzOmsk":"Óblast de Omsk (UTC+6)","tzKrasnoyarsk":"Krai de Krasnoyarsk (UTC+7)","tzIrkutsk":"Óblast de Irkutsk (UTC+8)","tzSakha":"Sajá República (UTC+9)","tzPrimorsky":"Krai de Primorie (UTC+10)","tzMagadan":"Óblast de Magadán (UTC+11)","tzKamchatka":"Krai de Kamchatka (UTC+12)","dstDayStartsLabel":"El horario de verano comienza","dstDayEndsLabel":"El horario de verano termina","dstRevertsLabel":"vuelve al horario estándar","dstEuropeLabel":"Europa","dstNewZealandLabel":"Nueva Zelanda","lookalikeDomainWarning":"Esto es un enlace a un sitio web que imita a una empresa de paquetería, no un número de seguimiento. No introduzca allí datos personales ni de pago.","lookalikeDomainOfficial":"Sitio web oficial:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus hyodyntaa ensiluokkaisia kaupallisia verkostoja. Heti kun lahetys saapuu maahasi, vastuu siirtyy paikalliselle kotimaan kuljetusyhtiolle (esim. USPS, Royal Mail, DHL paikallisesti). Seurantatunnuksen etuliitteet vaihtavat kasittelyjarjestelmaa tassa vaiheessa, mutta universaali pakettiseurantamme yhdistaa nama tilat, jotta nakyvyys sailyy katkeamattomana.","trackingLastMileTitle":"Viimeisen Mailin Toimitusverkosto","trackingCustomsClearanceBody":"Kaikkien rajat ylittavien lahetysten on lapaistava maasi tulliviranomaisen kasittely. Tykalumme seuraa tilasiirtymia tuontikeskukseen saapumisesta tullille luovutukseen. Rajaviranomaiset tarkistavat HS-koodit ja varmistavat, etta oikea ALV tai tullimaksut on suoritettu (esim. IOSS EU:ssa, VOEC Norjassa). Seuraa erityisesti \"Held at Customs\" -varoituksia.","trackingCustomsClearanceTitle":"Tulliselvitystiedot","trackingProcessingOriginBody":"Kun lahetys on jtetty, se siirtyy lahtokasittelykeskukseen, jossa se skannataan, punnitaan ja kay lapi ensivaiheen vientiturvatarkastukset. Sen jalkeen se ohjataan kansainvaliseen postinvaihtoon. Lentoaikataulut riippuvat kaytettavissa olevasta rahtikapasiteetista. Ala huolestu, jos tama tila kestaa useita paivia.","trackingProcessingOriginTitle":"Kasittely Lahtokeskuksessa","trackingInfoReceivedBody":"Kun tilaus kasitellaan ensimmaista kertaa verkkokauppa-alustoillamme (kuten Etsy, eBay tai suoramyynti), seurantanumero luodaan sahkoisesti. Kuljetusyhtio vastaanottaa lahetyksen tiedot ennen paketin fyysista haltuunottoa. Varaa 1-3 arkipaivaa sille, etta paketti kirjautuu fyysiseen lajittelukeskukseen.","trackingInfoReceivedTitle":"Tiedot Vastaanotettu","trackingStatusesIntro":"Kiitos, etta kaytat yhtenaista kansainvalista pakettiseurantatyokaluamme. Koska pakettisi kulkee useiden kansainvalisten rajojen yli, sen seurantatilat voivat olla monimutkaisia. Logistiikan elinkaaren ymmartaminen auttaa asettamaan selkeat odotukset.","trackingStatusesTitle":"Seurantatilojen Ymmartaminen","footerDesc":"Ensisijainen kohteesi arcade-huvikorteille, rytmipelihanskoille ja erikoismerchille. Nauti globaalista verkkokaupasta saumattoman kansainvalisen pakettiseurannan ja luotettavan toimitusdatan avulla.","amText":"ap.","pmText":"ip.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlantti)","tzEST":"EST (Itäinen)","tzCST":"CST (Keskinen)","tzMST":"MST (Kalliovuoret)","tzPST":"PST (Tyynimeri)","tzAKST":"AKST (Alaska)","tzHST":"HST (Havaiji)","tzBeijing":"Peking","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Kaliningradin alue (UTC+2)","tzMoscow":"Moskova/Länsi-Venäjä (UTC+3)","tzSamara":"Samaran alue (UTC+4)","tzUral":"Uralin alue (UTC+5)","tzOmsk":"Omskin alue (UTC+6)","tzKrasnoyarsk":"Krasnojarskin aluepiiri (UTC+7)","tzIrkutsk":"Irkutskin alue (UTC+8)","tzSakha":"Sahan tasavalta (UTC+9)","tzPrimorsky":"Primorjen aluepiiri (UTC+10)","tzMagadan":"Magadanin alue (UTC+11)","tzKamchatka":"Kamtšatkan aluepiiri (UTC+12)","dstDayStartsLabel":"Kesäaika alkaa","dstDayEndsLabel":"Kesäaika päättyy","dstRevertsLabel":"paluu normaaliaikaan","dstEuropeLabel":"Eurooppa","dstNewZealandLabel":"Uusi-Seelanti","englishResponseNotice":"Huomautus: Kaikkiin tiedusteluihin vastataan englanniksi. Jos lähetät toisella kielellä, viestisi voidaan kääntää englanniksi vahvistusta varten.","contactNamePlaceholder":"Esim: Matti Virtanen","systemRequirementsTitle":"Vähimmäisjärjestelmäversiot","systemRequirements":"Windows: Windows 7 (with ESU updates installed) tai uudempi\nmacOS: macOS 12 tai uudempi\nAndroid: Android 13 tai uudempi\niPhone/iOS: iOS 17 tai uudempi\nLinux: Tällä hetkellä tuettu jakelu aktiivisilla tietoturvapäivityksillä","goodFridayEasterGreeting":"Hyvää pääsiäistä! Rauhaa ja iloa pitkäperjantaina ja pääsiäisenä.","christmasGreeting":"Hyvää joulua ja onnellista uutta vuotta! Rauhaa ja iloa 25. joulukuuta – 5. tammikuuta.","captchaSystemRequirements":"Vähimmäisjärjestelmävaatimukset: Windows 7 (with ESU updates installed) tai 11, macOS 10.15+, tai uusin Android/iOS-versio.","title":"Vahvista Pääsy","subtitle":"Ole hyvä ja suorita alla oleva haaste jatkaaksesi.","selectLanguage":"Valitse Kieli","selectLanguagePlaceholder":"-- Valitse kieli --","loadingChallenge":"Ladataan haastetta...","answerLabel":"Vastauksesi:","answerPlaceholder":"Syötä vastauksesi","continueButton":"Jatka","refreshButton":"Uusi Haaste","verifying":"Vahvistetaan...","chooseLanguageFirst":"Ole hyvä ja valitse ensin kieli.","loadFailed":"Haasteen lataaminen epäonnistui. Ole hyvä ja yritä uudelleen.","expiredChallenge":"Haaste on vanhentunut. Ladataan uutta haastetta...","verifyFailed":"Vahvistus epäonnistui. Ole hyvä ja yritä uudelleen.","home":"Etusivu","blog":"Blogi","aboutUs":"Tietoa meistä","faq":"UKK","contact":"Ota yhteyttä","trackPackage":"Seuraa pakettia","cnyYearOfHorseMessage":"🧧 Hyvää kuun uutta vuotta! Toivotamme sinulle vaurautta ja iloa Hevosen vuonna! 🐴","singaporeNationalDayMessage":"🇸🇬 Hyvää kansallispäivää, Singapore! Juhlistamme 61 vuotta itsenäisyyttä! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesia! Dirgahayu Republik Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malesia! Juhlistamme kansakuntamme itsenäisyyttä! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Ilmoitus valiaikaisesta sulkemisesta","temporaryClosureNoticeBody":"Hyvat arvostetut asiakkaat,\n\nHuomioithan, etta Rhythm Nexus on valiaikaisesti suljettu 21.3.2026-26.3.2026 yritystapahtuman vuoksi.\n\nSulkemiseen valmistautumiseksi kauppa asetetaan lomatilaan alkaen 20.3.2026 klo 3:00 PM (UTC +8). Taman ajan jalkeen tehdyt tilaukset saatetaan kasitella vasta, kun toimintamme jatkuu.\n\nNormaali liiketoiminta jatkuu 27.3.2026.\n\nPahoittelemme mahdollisia haittoja ja kiitamme ymmarryksestasi ja jatkuvasta tuestasi.\n\nKiitos.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Ymmarran","parcelTracking":"Paketin seuranta","serviceAnnouncement":"Palveluilmoitus","usaWinterStormTitle":"KIIREELLINEN: Vakava talvimyrsky - Palvelun häiriö","usaWinterStormSubtitle":"Yhdysvaltain postintoimisto (USPS) Ylivoimainen tapahtuma","usaWinterStormNotice1":"Johtuen New Yorkin aluetta 23. helmikuuta 2026 lähtien vaikuttavasta vakavasta talvimyrskystä:","usaWinterStormNotice2":"Kansainväliset toiminnot John F. Kennedyn kansainvälisellä lentokentällä on käytännössä pysäytetty","usaWinterStormNotice3":"Ilmoitettu laajoista lentojen peruutuksista ja merkittävistä lentokentän palvelujen häiriöistä","usaWinterStormNotice4":"Nämä olosuhteet muodostavat USPS:n valvontaa ylittävän ylivoimaisen tapahtuman","usaWinterStormNotice5":"Palvelun vaikutus:","usaWinterStormNotice6":"Vaarallinen yhdistelmä raskasta lumisadetta, jäätävää sadetta, räntää ja pistävää kylmyyttä","usaWinterStormNotice7":"Ilmoitettu suurista häiriöistä ja laajoista sähkökatkoksista","usaWinterStormNotice8":"Kotimaisen ja kansainvälisen postin (kirjeposti, pakettiposti ja EMS-tavarat) keruu ja toimitus ovat vaikutuksen alaisia","usaWinterStormNotice9":"Vaikutuksen alaisia postilaatikkokoodialueita:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS ryhtyy kaikkiin tarpeellisiin toimiin asiakkaiden häiriöiden minimoimiseksi samalla kun työntekijöiden turvallisuus säilyy. Arvostamme kärsivällisyyttäsi ja ymmärrystäsi tämän ylivoimaisen tapahtuman aikana.","usaWinterStormNotice12":"Viimeksi päivitetty: 25. helmikuuta 2026","countryAutoDetected":"Kohde esivalittu sijaintisi perusteella","countryAutoDetectedFromLink":"Kohde esivalittu linkin kautta","trackingNumber":"Seurantanumero","destinationCountry":"Kohdemaa","postcode":"Postinumero","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Hyvää Venäjän päivää! 🎉","taiwanFoundingDayMessage":"🇹🇼 Hyvää perustamispäivää, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Hyvää kaksoiskymmenen päivää, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Hyvää SAR Hongkongin perustamispäivää! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Hyvää SAR Macaun perustamispäivää! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Hyvää kansainvälistä työväenpäivää! Juhlimme työtä ja työntekijöiden oikeuksia! 🎊","laborDayUSCAMessage":"⚒️ Hyvää työväenpäivää! Kunnioitamme työntekijöiden panosta! 🎉","orderNumber":"Tilausnumero (Esimerkki: RTNX1234567890)","fromDate":"Alkaen (VAADITAAN)","toDate":"Päättyen (VAADITAAN)","trackParcel":"Seuraa pakettia","selectCourier":"-- Valitse kuriiri / maa --","singaporeCouriers":"Singaporen kuriirit","topCountries":"Top 5 maata","otherCountries":"Muut maat","note":"HUOMAUTUS","disclaimer":"VASTUUVAPAUSLAUSEKE","importantInformation":"Tärkeää tietoa:","didNotReceiveEmail":"Jos et saanut vahvistussähköpostia Etsystä, eBaysta, Shopeesta tai Payhipistä, vieritä alas etsiäksesi tilauksesi sähköpostiosoitteen tai puhelinnumeron kautta, joka on linkitetty tähän tilaukseen.","searchByEmailOrPhone":"Hae sähköpostilla tai puhelimella","searchOrder":"Hae tilausta","trackingResult":"Seurantatulos","noOrdersFound":"Tilauksia ei löytynyt.","pleaseEnter":"Anna sähköposti, puhelin tai tilausnumero.","fillAllFields":"Täytä kaikki pakolliset kentät: seurantanumero, kohdemaa, tilausnumero ja postinumero.","noOrderMatchingFields":"Kaikkia kenttiä vastaavaa tilausta ei löytynyt.","postcodeRequired":"Postinumero vaaditaan tälle kohteelle.","invalidUSZip":"Virheellinen USA:n postinumero. Käytä 5 numeroa tai ZIP+4.","failedGenerateURL":"Seuranta-URL:n luominen epäonnistui. Tarkista syöte.","filteredAllowedDestinations":"(Suodatettu sallittujen kohteiden mukaan)","loadingAnnouncements":"Ladataan ilmoituksia...","unableToLoadAnnouncements":"Palveluilmoituksia ei voida ladata tällä hetkellä.","viewOnSingPostWebsite":"Näytä SingPostin verkkosivulla →","trackingValidationSG":"Singaporen seurantanumeroiden on oltava: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG tai PX123456789SG. DHL-lähetyksille käytä 10-numeroista numeroa.","invalidSingPostFormat":"Virheellinen SingPost-seurantanumeron muoto.\\nHyväksytyt muodot:\\n• PP123456789SG → Prepaid Tracked Label\\n• SPNDD00012345 → SpeedPost Standard Tracking","welcomeTitle":"Tervetuloa Rhythm Nexuksen verkkosivustolle!","purchaseInfo":"Osta meiltä virallisten kanaviemme kautta tai liity","purchaseInfoChina":"Osta meiltä virallisten kanaviemme kautta.","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram-ryhmäämme","forUpdates":"saadaksesi viralliset päivitykset.","ourStores":"Kauppamme","etsyStore":"Etsy-kauppa","ebayStore":"eBay-kauppa","shopeeStore":"Shopee-kauppa","payhipStore":"Payhip-kauppa","internationalShipping":"Kansainvälinen toimitus","singaporeLocal":"Singaporen paikallinen","asiaOnly":"Vain Aasia","deliveryInfo":"Toimitustiedot","deliveryRates2026":"Toimitushinnat 2026","sgDeliveryRates":"Singaporen toimitushinnat","speedPostRates":"SpeedPost Express kansainväliset hinnat","aboutTitle":"Tietoa Rhythm Nexuksesta","aboutP1":"Aloitimme kauppamme vuonna 2022 ja olemme myyneet alustoilla kuten Etsy, eBay ja Shopee vuosien varrella ilman ongelmia.","aboutP2":"Ajan myötä olemme rakentaneet vahvan maineen keskittymällä luotettavaan toimitukseen, läpinäkyvään viestintään ja tarkkoihin seurantatietoihin jokaiselle lähetyksellemme.","aboutP3":"Tavoitteemme on tarjota asiakkaille sujuva ja luotettava ostokokemus, oli kyse sitten paikallisesta tai kansainvälisestä ostoksesta. Mukaudumme jatkuvasti muuttuviin posti-, tulli- ja verovaatimuksiin varmistaaksemme, että toimitukset saapuvat määränpäähänsä mahdollisimman tehokkaasti.","aboutP4":"Kiitos Rhythm Nexuksen tukemisesta.","faqTitle":"Usein kysytyt kysymykset","faqQ1":"Entä jos tuotteeni on viallinen? Onko takuuta?","faqA1":"Kyllä! Useimpiin tilauksiin sisältyy 1 vuoden takuu. Anna laskusi/tilausnumerosi, jotta voimme tutkia asiaa. Huomaa: Vaihtoja ei sallita, jos tuote vastaa kuvausta, vaikka olisit tilannut väärin.","faqQ2":"Voinko muokata, päivittää tai peruuttaa tilaukseni?","faqA2":"Kyllä. Turvallisuussyistä tilausmuutokset on ehkä käsiteltävä sähköpostitse tai yhteydenottolomakkeellamme.","faqQ3":"Pitääkö minun maksaa tulli-/tuontimaksuja?","faqA3":"Tullit ja maksut eivät yleensä ole ennakkoon maksettuja, lukuun ottamatta DDP:tä Yhdysvaltoihin. ALV voi koskea EU:ta, Iso-Britanniaa, AU/NZ:aa, Norjaa, Sveitsiä ja Kanadan provinsseja kuten Saskatchewania ja Manitobaa, joka on jo maksettu oletuksena. Singaporelle ei sovelleta GST:tä. Emme voi neuvoa tullimaksuista – ota yhteyttä paikalliseen tulliisi saadaksesi lisätietoja.","faqQ4":"Milloin tilaukseni lähetetään?","faqA4":"Tilaukset lähetetään yleensä 1-5 arkipäivän kuluessa. Ruuhka-aikoina se voi kestää 5-7 päivää.","faqQ5":"Tilasin vahingossa kahdesti. Mitä minun pitäisi tehdä?","faqA5":"Hyvitämme vain päällekkäiset toimitusmaksut. Molemmat tuotteet lähetetään yhdessä. Hyvitys = (ensimmäinen + toinen toimitusmaksu) – todellinen toimitusmaksu.","faqQ6":"Kuinka kauan toimitus kestää?","faqA6":"Käsittely kestää 1-5 arkipäivää.\n\nKotimainen toimitus:\n• SingPost Prepaid Tracked Label: 2–4 päivää\n• SpeedPost Standard: 1–3 päivää\n\nKansainvälinen:\n• SingPost ePAC: 14-30 päivää\n• SpeedPost Priority (EMS): 8-15 päivää\n• SpeedPost Express: 4-8 päivää\n\nViivästyksiä voi esiintyä sesonkiaikoina.","faqQ7":"Tuotteeni palautetaan lähettäjälle. Mitä minun pitäisi tehdä?","faqA7":"Yksi uudelleenlähetys on sallittu. Peruutus ei ole mahdollista virheellisten osoitteiden, noutamattomien pakettien tai maksamattomien tullimaksujen vuoksi. Ota yhteyttä postipalveluusi uudelleentoimitusta varten tai lähetä meille viesti saadaksesi apua.","faqQ8":"Tuotteeni on kadonnut / varastettu kuljetuksessa.","faqA8":"Sallimme yhden uudelleenlähetyksen. Jos se katoaa uudelleen, täysi hyvitys myönnetään kuriirin toimitusikkunan jälkeen:\n\n• Singaporen paikalliset palvelut: 7 päivää\n• SingPost ePAC & SpeedPost Priority International: 30 päivää\n• SpeedPost Intl Express: 14 päivää","blogTitle":"Toimitus- ja postitietopankki","blogSubtitle":"Viralliset selvitykset postipalveluista, tullista, ALV:sta ja maksuista, jotka liittyvät Rhythm Nexuksen lähetyksiin.","readMore":"Lue lisää","backButton":"Takaisin","copyrightText":"Kaikki oikeudet pidätetään.","blogPost1Title":"Mikä on SingPost ePAC?","blogPost1Desc":"Opi SingPost ePAC:sta (ePacket), edullisesta seurantaan perustuvasta postipalvelusta kevyille kansainvälisille verkkokauppalähetyksille.","blogPost2Title":"Mikä on SpeedPost Priority International (EMS)?","blogPost2Desc":"Tutustu EMS:ään, kansainväliseen premium-postipikapalveluun, jota postioperaattorit priorisoivat maailmanlaajuisesti.","blogPost3Title":"Mikä on SpeedPost Express (viimeinen maili DHL Express)?","blogPost3Desc":"Tutustu SpeedPost Expressiin, kuriiriluokan palveluun, jossa viimeinen maili toimitetaan DHL Expressin kautta.","blogPost4Title":"Yhdysvaltain postitoimitustullit maksettu (PDDP)","blogPost4Desc":"Ymmärrä PDDP, joka mahdollistaa USA:n tuontitullien ja verojen ennakkomaksun ennen toimitusta.","blogPost5Title":"EU ALV ja IOSS selitetty","blogPost5Desc":"Saa tietoa EU:n ALV:sta ja IOSS-järjestelmästä ALV:n keräämiseen enintään 150 euron tuonnissa.","blogPost6Title":"Britannian ALV ja siirtomaksu HMRC:lle","blogPost6Desc":"Opi Britannian tuontitavaroiden ALV-vaatimuksista ja siirtomaksusta HMRC:lle.","blogPost7Title":"Norjan VOEC selitetty","blogPost7Desc":"Ymmärrä Norjan VOEC (ALV sähköisestä kaupankäynnistä) -järjestelmä EU:n/ETA:n ulkopuolelta tuoduille tavaroille.","blogPost8Title":"Sveitsin ALV selitetty","blogPost8Desc":"Tutustu Sveitsin ALV-vaatimuksiin tuontitavaroille ja keräysprosessiin.","blogSingPostEPACContent1":"SingPost ePAC (ePacket) on taloudellinen seurattu postipalvelu kevyille kansainvälisille verkkokauppalähetyksille.","blogSingPostEPACContent2":"Sen toimittaa kohdemaan kansallinen postioperaattori ja sitä käytetään yleisesti alle 2 kg painaville paketeille, joiden mitoitus on pituus + leveys + korkeus alle 90 cm ja pituus enintään 60 cm.","blogSingPostEPACContent3":"Tätä vaihtoehtoa tarjosi alun perin vain Hong Kong Post yhdessä eBay Chinan kanssa, mikä mahdollisti Kiinasta ja Hongkongista lähetettyjen pienten pakettien lähettämisen Yhdysvaltoihin seurantatiedoilla ilman allekirjoitusvaatimusta toimituksen yhteydessä. Tämä palvelu tunnetaan Yhdysvalloissa nimellä USPS (United States Postal Service) First-Class Package International Service.","blogSingPostEPACContent4":"1. tammikuuta 2026 alkaen ePAC:ia käytetään nyt kaikissa maissa pakollisten UPU-määräysten noudattamiseksi, jotka vaativat seurannan paketeille ja rekisteröidyt lähetykset rajoitetaan vain asiakirjoille.","blogSingPostEPACContent5":"Seurantaetuliitteet: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS on kansainvälinen premium-postipikapalvelu, jota postioperaattorit priorisoivat maailmanlaajuisesti.","blogSpeedPostEMSContent2":"Tulliselvitys on yleensä nopeampaa kuin tavallisessa postissa, mutta tiukempaa prosessiltaan, ja seuranta jatkuu toimitukseen asti.","blogSpeedPostEMSContent3":"Singaporessa tämä tunnetaan nimellä SpeedPost Priority International by SingPost.","blogSpeedPostEMSContent4":"Seurantaetuliite: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express on kuriiriluokan palvelu.","blogSpeedPostExpressContent2":"Monissa kohteissa DHL Express suorittaa viimeisen mailin toimituksen ja kerää tullit tai verot ennen luovutusta.","blogSpeedPostExpressContent3":"Seurantaetuliite: PX123456789SG (Viimeisen mailin DHL Express käyttää 10-numeroista seurantanumeroa, joka ei ole julkisesti näkyvissä, mutta meillä on tiedot siitä","blogSpeedPostExpressContent3Link":"Seurantajärjestelmämme kautta.","blogUSPDDPContent1":"PDDP mahdollistaa USA:n tuontitullien ja verojen ennakkomaksun ennen toimitusta, mikä vähentää vastaanottajien yllätyskuluja.","blogUSPDDPContent2":"Uudet määräykset (Voimassa 29. elokuuta 2025)","blogUSPDDPContent2List1":"Pakolliset HTS-koodit","blogUSPDDPContent2List2":"Tarkat tuotekuvaukset","blogUSPDDPContent2List3":"Tiukempi tullien valvonta","blogUSPDDPContent3":"Kaikista Yhdysvaltoihin lähetettävistä tuotteista ei veloiteta vastaanottajalta lisätulleja, koska maksamme puolestanne. Huomaa kuitenkin, että tuotteen hintaan sisältyy oletuksena 10 %:n tuontimaksu määräysten mukaisesti.","blogUSPDDPContent4":"Tämä koskee vain Yhdysvaltoihin suuntautuvia toimitustapojamme, SpeedPost Priority International (EMS) ja SingPost ePAC.","blogEUIOSSContent1":"EU soveltaa ALV:tä kaikkiin kaupallisiin tuonteihin arvosta riippumatta.","blogEUIOSSContent2":"IOSS (tuonnin keskitetty palvelu)","blogEUIOSSContent3":"IOSS mahdollistaa myyjien EU:n ALV:n keräämisen kassalla enintään 150 euron lähetyksille.","blogEUIOSSContent4":"ALV maksetaan sitten IOSS-järjestelmän kautta, mikä mahdollistaa nopeamman tulliselvityksen eikä ALV:tä peritä toimituksen yhteydessä.","blogEUIOSSContent5":"Kaikista Etsyn tai eBayn kautta tehdyistä tilauksista IOSS-ALV on jo kerätty kassalla ja merkitsemme sen Tax Reference Number -kenttään tietojen siirtämiseksi kohdemaan postipalvelulle EDI:n (Electronic Data Interchange) kautta.","blogUKVATContent1":"Britannia vaatii ALV:n huomioimista tuontitavaroille.","blogUKVATContent2":"Pienen arvon lähetyksille ALV kerätään yleensä kassalla ja maksetaan suoraan HMRC:lle myyjän tai markkinapaikan toimesta.","blogUKVATContent3":"Korkeamman arvon lähetyksille kuljettaja voi periä ALV:n ennen toimitusta.","blogUKVATContent4":"Kaikista Etsyn tai eBayn kautta tehdyistä tilauksista ALV on jo kerätty kassalla ja merkitsemme sen Tax Reference Number -kenttään tietojen siirtämiseksi kohdemaan postipalvelulle EDI:n (Electronic Data Interchange) kautta.","blogNorwayVOECContent1":"Norja otti käyttöön VOEC (VAT on E-Commerce) -järjestelmän EU:n/ETA:n ulkopuolelta tuoduille tavaroille. Tämä koskee enintään 3 000 NOK arvoltaan olevia tavaroita.","blogNorwayVOECContent2":"Myyjät voivat rekisteröityä VOEC-järjestelmään kerätäkseen Norjan ALV:n kassalla, mikä mahdollistaa nopeamman tulliselvityksen eikä ALV:tä peritä toimituksen yhteydessä.","blogNorwayVOECContent3":"Kaikista Etsyn tai eBayn kautta tehdyistä tilauksista VOEC-ALV on jo kerätty kassalla. Seuranta- ja tulliasiakirjat osoittavat Tax Reference Number -numeron tietojen siirtämiseksi Norjan postipalvelulle.","blogSwissVATContent1":"Sveitsi veloittaa ALV:n tuontitavaroilta arvosta riippumatta. Sveitsin liittovaltion tulliviranomainen vaatii ulkomaisia myyjiä keräämään ALV:n kassalla enintään 65 CHF arvoisista tavaroista.","blogSwissVATContent2":"Sveitsin ALV-järjestelmään rekisteröityneet myyjät maksavat kerätyn ALV:n suoraan, mikä varmistaa, että vastaanottajalle ei tule ylimääräisiä ALV-kuluja toimituksen yhteydessä.","blogSwissVATContent3":"Kaikista Etsyn tai eBayn kautta tehdyistä tilauksista Sveitsin ALV on jo kerätty kassalla, ja tulliasiakirjat sisältävät Tax Reference Number -numeron EDI-lähetystä varten.","enterDestinationPostcode":"Anna kohteen postinumero","trackingNumberExample":"esim. LG123456789SG","trackingCaseSensitive":"SEURANTAKIRJAIMET OVAT ISOJEN JA PIENTEN KIRJAINTEN EROTTAVIA JA NIIDEN ON OLTAVA ISOILLA KIRJAIMILLA.","usaPostcodeNote":"Maille, joilla ei ole postinumeroita, kuten Hong Kong ja Macao, laita 999077 (Hong Kong) tai 999078 (Macao).","epacDeliveryNote":"Huomioi YSTÄVÄLLISESTI, että kaikki ePAC-tuotteet, jotka lähetetään kohteeseen, tulisi toimittaa postilaatikkoosi, ovelle, pakettilokeroosi tai jättää turvalliseen paikkaan!","countriesNoMailbox":"Maat, joissa postilaatikko-/kirjelaatikkotoimitus ei ole saatavilla: Brunei, Kiina, Intia, Israel, Macau SAR Kiina, Filippiinit, Puola ja Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus EI OLE VASTUUSSA toimitusten käsittelystä, koska se on meidän hallintamme ulkopuolella ja toivoisimme mieluummin, että seuraat tuotteesi tilaa.","issuesAfterDelivery":"Mahdolliset ongelmat toimituksesi kanssa 30/45 päivän jälkeen (14 päivää SpeedPost Expressille) tai tila näyttää toimitettu, mutta et saanut sitä, ota yhteyttä meihin","cannotUseEmbed":"Emme voi käyttää upotettua seurantaa, koska useimmat postipalvelujen verkkosivustot eivät tue sitä.","clickLinkAbove":"Klikkaa yllä olevaa linkkiä seurataksesi pakettisi.","trackingDetailsNote":"Huomaa, että seurantatiedot eivät ehkä näy hakutuloksissa, joten on suositeltavaa liittää seurantanumero järjestelmään tuotteen seuraamiseksi.","thirdPartyWebsites":"Voit myös seurata pakettejasi näillä kolmansien osapuolien verkkosivustoilla:","enterEmailOrPhone":"Anna sähköposti tai puhelin","collectAtPostOffice":"Jos maassasi ei kuitenkaan ole postilaatikkoa saatavilla standardina, sinun on noudettava se postista.","reviewShippingRates":"Tarkista nykyiset toimitusmaksumme","here":"täällä","contactUsForm":"Ota yhteyttä meihin","form":"lomakkeen","forEnquiries":"kautta kaikissa tilaukseesi liittyvissä kyselyissä.","anPostNoDirectTracking":"An Post (Irlanti) ei tue suoria seurantalkkejä tai upotettua seurantaa.","anPostPasteManually":"Kopioi ja liitä seurantanumerosi manuaalisesti An Postin verkkosivustolle:","goToAnPost":"Siirry An Postiin","countryMsgNL":"Jos tila näyttää 'Held by Customs', ota yhteyttä Alankomaiden tullin tietolinjaan: 0800 0143 (maksuton), maanantai-perjantai 7-23. Lauantai ja sunnuntai 8-16:30.\n\nOn suositeltavaa rekisteröidä tili PostNL:ään saadaksesi välittömät push-ilmoitukset paketeistasi: https://www.postnl.nl/campagnes/online-pakket-volgen/\n\nJos se toimitetaan PostNL-pisteeseen tai tila kehottaa hakemaan postista, sinun on maksettava 7 EUR tiskillä. Enintään 4 EUR, jos maksetaan verkossa.","countryMsgDE":"Suosittelemme lataamaan Post & DHL -sovelluksen saadaksesi push-ilmoituksia pakettien seurantatilasta: https://www.deutschepost.de/de/p/post-und-dhl-app.html DHL Paket GmbH Asiakaspalvelu: +49-228-433-3112 DHL DE Yhteystiedot: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Sinun on toimitettava lisätuontilmoitus tullille. Jos näin ei tehdä, voi seurata maahantulokielto ja paketin palauttaminen. Lisätietoja: https://www.posti.fi/en/receiving/customs-clearance Muut linkit: https://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number https://tulli.fi/en/about-us/contact-information https://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Käsittelymaksu 4,95 EUR on veloitettavissa. Lataa sovellus tästä: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Käsittelymaksu 8,50 PLN on veloitettavissa. Sinun on maksettava se noudettaessa postista, koska pakettia ei todennäköisesti toimiteta ovellesi tai postilaatikkoosi.","countryMsgPH":"PHLPostia pidetään tehottomana ja epäluotettavana Filippiineillä. Seuraa aina pakettiasi, koska tila 'Matkalla toimitukseen' näkyy joskus vain 1-3 viikon ajan pienemmissä paketeissa. Suurempien pakettien nouto on mahdollista vain Manila Central Post Officessa tai lähimmässä postitoimistossa lähelläsi. Huomaa, että kaikista paketeista veloitetaan 112 PHP:n käsittelymaksu, joka sinun on maksettava. Jos maksua ei suoriteta, paketti lähetetään takaisin meille. Toimituksen odotetaan kestävän 1-2 kuukautta PHLPostin hitaiden palveluiden vuoksi. Sinun ei tarvitse maksaa veroa alle 10000 PHP:n arvoisista tuotteista, mutta sinun on maksettava, jos arvo on tämän summan verran tai enemmän. Suosittelemme SpeedPost Expressiä nopeampaan prosessiin, kun seuraavan kerran tilaat meiltä. Maksut eivät kuitenkaan välttämättä koske, koska D&T vastaanottajalle on oletuksena.","countryMsgCA":"De minimis on 20CAD kaikille Kanadaan lähetetyille tilauksille, koska Singapore on osa CPTPP-sopimusta, tulleja ei välttämättä sovelleta, mutta D&T voi soveltua, jos tuote ylittää 60CAD ja sen yli tai 100CAD ja sen yläpuolella olevan kynnyksen, joka voi riippua tuotteen HS-koodista. Tämän summan ylittävästä arvosta peritään ALV vastaavasti.","countryMsgID":"Sinun on maksettava kaikki sovellettavat verot ja tullit saavuttaessa Indonesiaan. Pidä pakettisi silmällä ja maksa määritetty summa Indonesian tullille. Sinun on myös toimitettava lisäselvityspapereita. Jos näin ei tehdä, voi seurata maahantulokielto tai paketin takavarikointi maan tullin toimesta. Tarkista lisätiedot täältä: https://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Sinun on maksettava kaikki sovellettavat verot ja tullit saavuttaessa Intiaan. Pidä pakettisi silmällä ja maksa määritetty summa Intian tullille. Ole tietoinen siitä, että tullimuodollisuudet Intiassa ovat tiukat ja sinua voidaan veloittaa tullimaksuja tai ei, jos tuotteesi arvo on yli 1000INR (15 USD) - riippuen HS-koodista, useimmissa tapauksissa se on tullivapaa, mutta sinua saatetaan veloittaa korkeampia tulleja, jos tuote on yli 5000INR (60 USD). Koska India Post EI toimita postilaatikkoon vakiona, sinun ON EHKÄ oltava kotona tai valtuutettu edustaja vastaanottamassa pakettisi tai noutamassa se postista.","countryMsgMY":"De minimis on 500MYR kaikille Malesiaan lähetetyille tilauksille. Tämän summan ylittävistä tilauksista voidaan veloittaa.","countryMsgUS":"29. elokuuta 2025 alkaen USD800:n de minimis poistetaan virallisesti ja tuontitullit ovat maksettavissa oletuksena lähettäjälle lähtömaassa. USA-toimitukset VAATIVAT kelvollisen puhelinnumeron ja sähköpostiosoitteen, jotta pakettisi välttää lisäviivästykset.","countryMsgIL":"De minimis on 240 ILS (75 USD) kaikille Israeliin toimitetuille tilauksille. Tämän summan ylittävistä tilauksista voidaan veloittaa. Huomaa, että Israeliin lähetettyjen tilausten osalta Israel Post ei välttämättä aina vahvista lopullista toimitusta sen jälkeen, kun se on toimitettu. Koska Israel Post EI toimita postilaatikkoon vakiona, sinun ON EHKÄ oltava kotona tai valtuutettu edustaja vastaanottamassa pakettisi tai noutamassa se postista.","countryMsgGB":"Huomaa, että Yhdistyneeseen kuningaskuntaan lähetettyjen tilausten osalta Royal Mail ei välttämättä aina vahvista lopullista toimitusta sen jälkeen, kun se on toimitettu postilaatikkoosi.","countryMsgTH":"De minimis on 1500THB (45 USD) kaikille Thaimaahan toimitetuille tilauksille. Tämän summan ylittävistä tilauksista voidaan veloittaa.","countryMsgTW":"De minimis on 2000TWD (60 USD) kaikille Taiwaniin toimitetuille tilauksille. Tämän summan ylittävistä tilauksista voidaan veloittaa.","countryMsgMO":"Macaoon lähetettäessä ei veloiteta D&T:tä. Mutta huomaa, että Macau Post EI toimita postilaatikkoon vakiona, sinun ON noudettava pakettisi postista.","countryMsgBN":"Bruneihin lähetettäessä ei veloiteta D&T:tä. Mutta huomaa, että Brunei Post EI toimita postilaatikkoon vakiona, sinun ON noudettava pakettisi postista. Tämän maan seurantajärjestelmä ei ole kovin vakaa ja vain rajallista tietoa voidaan antaa, eikä lopullisia toimitustuloksia anneta alkuperälle.","countryMsgJP":"De minimis on 10000JPY (65 USD) kaikille Japaniin toimitetuille tilauksille. Tämän summan ylittävistä tilauksista voidaan veloittaa.","countryMsgKR":"De minimis on 180000KRW (150 USD) kaikille Etelä-Koreaan toimitetuille tilauksille. Tämän summan ylittävistä tilauksista voidaan veloittaa.","countryMsgVN":"Vietnamiin lähetettäessä ole TAVOITETTAVISSA toimituksen aikana, koska sinulta saatetaan veloittaa käsittelymaksuja tuotteen toimituksen yhteydessä. De minimis on 1000000 (35 USD) kaikille Vietnamiin toimitetuille tilauksille. Tämän summan ylittävistä tilauksista voidaan veloittaa. Koska Vietnam Post EI toimita postilaatikkoon vakiona, sinun ON EHKÄ oltava kotona tai valtuutettu edustaja vastaanottamassa pakettisi tai noutamassa se postista.","countryMsgPP":"Tracked Label -tuotteet lähetetään POPDrop/POPStop -pisteessä postissa. SpeedPost Standard -tuotteet lähetetään yleensä POPStop- tai POPStation-pisteessä. Huomaa, että Tracked Label -tuotteiden toimitukset tehdään VAIN maanantaista perjantaihin klo 9-18. Paitsi viikonloppuisin ja yleisinä vapaapäivinä.","postedDate":"Lähetyspäivä:","status":"Tila:","shippedVia":"Lähetetty:","destination":"Kohde:","statusInPreparation":"Valmisteilla","statusInTransit":"Matkalla","statusDelivered":"Toimitettu","statusOutForDelivery":"Lähdössä toimitukseen","statusArrived":"Saapunut","statusProcessing":"Käsittelyssä","statusDispatched":"Lähetetty","statusReturned":"Palautettu","statusFailed":"Toimitus epäonnistui","statusCancelled":"Peruutettu","statusHeldByCustoms":"Tullissa pidätettynä","statusAwaitingCollection":"Odottaa noutoa","aka":"tunnetaan myös nimellä","thisServiceKnownAs":"Tämä palvelu tunnetaan nimellä","in":"maassa","viewTrackingDHL":"Näytä seurantatiedot DHL Expressistä","viewTrackingSingPostSpeedPost":"Näytä seurantatiedot Singapore SpeedPostista","viewTrackingDHLLastMile":"Näytä seurantatiedot DHL Expressistä (viimeinen maili)","viewTrackingDHLShipperRef":"Näytä seurantatiedot DHL Expressistä (Lähettäjän viite)","viewTrackingSingPost":"Näytä seurantatiedot Singapore Postista","viewTrackingDestPost":"Näytä seurantatiedot kohteesta","post":"Posti","orderNumberExample":"Tilausnumero (alkaa RTNX - esimerkki: RTNX1234567890):","deliveryRecordNote":"Huomaa, että kun tuote on toimitettu, tietue säilytetään vain 7 päivää ja se poistetaan.","copyrightAllRights":"Kaikki oikeudet pidätetään.","optionSingPost":"🇸🇬 SingPost (SPNDD/PP)","countryAU":"🇦🇺 Australia","countryCA":"🇨🇦 Kanada","countryDE":"🇩🇪 Saksa","countryGB":"🇬🇧 Yhdistynyt kuningaskunta","countryUS":"🇺🇸 Yhdysvallat","countryAT":"🇦🇹 Itävalta","countryBE":"🇧🇪 Belgia","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Kiina","countryCZ":"🇨🇿 Tšekki","countryFI":"🇫🇮 Suomi","countryFR":"🇫🇷 Ranska","countryHK":"🇭🇰 Hongkong","countryIN":"🇮🇳 Intia","countryID":"🇮🇩 Indonesia","countryIE":"🇮🇪 Irlanti","countryIL":"🇮🇱 Israel","countryIT":"🇮🇹 Italia","countryJP":"🇯🇵 Japani","countryMO":"🇲🇴 Macao","countryMY":"🇲🇾 Malesia","countryNL":"🇳🇱 Alankomaat","countryNZ":"🇳🇿 Uusi-Seelanti","countryNO":"🇳🇴 Norja","countryPH":"🇵🇭 Filippiinit","countryPL":"🇵🇱 Puola","countryPT":"🇵🇹 Portugali","countryKR":"🇰🇷 Etelä-Korea","countryES":"🇪🇸 Espanja","countrySE":"🇸🇪 Ruotsi","countryCH":"🇨🇭 Sveitsi","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Thaimaa","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬 Singapore","currentTime":"Nykyinen aika","timezoneNote":"Aika näytetään 12 tunnin muodossa","sameTimeAsSingapore":"Sama aika kuin Singapore","hourAhead":"tunti Singaporea edellä","hoursAhead":"tuntia Singaporea edellä","hourBehind":"tunti Singaporea jäljessä","hoursBehind":"tuntia Singaporea jäljessä","epacUS":"Ensimmäisen luokan kansainvälinen pakettip alvelau","epacCH":"Priority Plus","epacGB":"Kansainvälinen seurattu","epacMY":"Kansainvälinen seurattu/Express","epacCA":"Kansainvälinen saapuva Express","epacAU":"Pakkaa ja seuraa kansainvälinen","epacNZ":"Kansainvälinen taloudellinen seurattu","epacDE":"Warenpost International Premium","epacFR":"Lettre internationale suivie","epacNL":"Kansainvälinen paketti seurattu","epacPL":"GLOBAL Express","epacBE":"Kansainvälinen Prime saapuva","epacAT":"Kansainvälinen seurattu paketti","epacIN":"Kansainvälinen seurattu paketti","epacFI":"Kansainvälinen seurattu kirje","epacSE":"Kansainvälinen seurattu kirje","epacNO":"PRIME Exprès","epacIT":"Ilmaista","epacIL":"Ilmaista","epacES":"Kansainvälinen kevyt paketti","epacPT":"Kansainvälinen sininen posti","epacCZ":"Seurattu lähetys ulkomailta","epacBN":"Kansainvälinen ePaketti","epacCN":"Kansainvälinen ePaketti","epacHK":"Kansainvälinen ePaketti","epacID":"Kansainvälinen e-paketti","epacMO":"Kansainvälinen ePaketti","epacPH":"Kansainvälinen seurattu posti","epacTW":"Kansainvälinen ePaketti","epacTH":"Kansainvälinen ePaketti","epacVN":"Kansainvälinen E-paketti (ASEAN Pack)","epacKR":"K-Paketti","epacJP":"Kansainvälinen e-paketti Light","epacIE":"Kansainvälinen Express posti","dhlNoEmbed":"DHL Express ei tue upotettua seurantaa. Ole hyvä","speedPostNoEmbed":"SpeedPost Singapore ei tue upotettua seurantaa. Ole hyvä","operatorNoEmbed":"ei tue upotettua seurantaa. Ole hyvä","clickHere":"napsauta tästä","toTrackNewTab":"seurataksesi (avautuu uuteen välilehteen).","countryRU":"🇷🇺 Venäjä","russiaServiceSuspended":"⚠️ TÄRKEÄ ILMOITUS: Venäjän Ukrainaan hyökkäyksen johdosta vuonna 2022 SingPost on DHL:n kanssa keskeyttänyt kaikki lähetykset Venäjälle. Emme tällä hetkellä palvele Venäjää ennen kuin maahan palveluiden jatkamisesta ilmoitetaan.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Toivon sinulle ja perheellesi rauhaa, iloa ja siunauksia! 🌟","deepavaliMessage":"🪔 Hyvää Deepavalia! Tuokoon valojen festivaali sinulle iloa, vaurautta ja menestystä! ✨","diwaliMessage":"🪔 Hyvää Diwalia! Tuokoon valojen festivaali sinulle iloa, vaurautta ja menestystä! ✨","vesakMessage":"☸️ Hyvää Vesakin päivää! Toivon sinulle rauhaa, viisautta ja valaistumista tänä pyhänä päivänä! 🙏","vesakTHMessage":"☸️ Hyvää Visakha Bucha -päivää! Toivon sinulle rauhaa, viisautta ja valaistumista tänä pyhänä päivänä! 🙏","australiaNationalDayMessage":"🇦🇺 Hyvää Australian päivää! Juhlistamme kansaamme! 🎉","canadaNationalDayMessage":"🇨🇦 Hyvää Kanadan päivää! Juhlistamme suurta kansaamme! 🍁","usaNationalDayMessage":"🇺🇸 Hyvää itsenäisyyspäivää, Amerikka! Juhlitaan vapautta ja vapautta! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! Eläköön Ranska! 🎊","germanyUnityDayMessage":"🇩🇪 Hyvää Saksan yhtenäisyyden päivää! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Hyvää säätiön päivää, Japani! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Hyvää kansallispäivää, Kiina! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Hyvää vapautuspäivää, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Hyvää itsenäisyyspäivää, Intia! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Hyvää kansallispäivää, Thaimaa! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Hyvää itsenäisyyspäivää, Filippiinit! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Hyvää kansallispäivää, Vietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Hyvää itsenäisyyspäivää, Puola! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Hyvää itsenäisyyspäivää, Tšekki! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Eläköön kuningas! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Hyvää Ruotsin kansallispäivää! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Hyvää itsenäisyyspäivää Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Hyvää St. Patrick's Day -päivää, Irlanti! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Hyvää Waitangi-päivää, Uusi-Seelanti! 🎉","switzerlandNationalDayMessage":"🇨🇭 Hyvää Sveitsin kansallispäivää! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgique! Fijne Nationale Feestdag! 🎊","australianDSTTitle":"Australian kesäaika aktiivinen","australianDSTBothMessage":"Sekä AEDT (Australian Eastern Daylight Time) että ACDT (Australian Central Daylight Time) ovat tällä hetkellä voimassa.","australianAEDTMessage":"AEDT (Australian Eastern Daylight Time) on tällä hetkellä voimassa Sydneyssä, Melbournessa ja lähialueilla.","australianACDTMessage":"ACDT (Australian Central Daylight Time) on tällä hetkellä voimassa Adelaidessa ja Etelä-Australiassa.","australianDSTNote":"Yllä näkyvät toimitusajat vastaavat nykyistä kesäaikaa.","statusHeldByCustms":"Tullin hallussa","accessRestricted":"Pääsy rajoitettu","vpnDetectedMessage":"VPN:n käyttö havaittu. Poista VPN käytöstä päästäksesi tähän palveluun.","contactSupportError":"Jos uskot tämän olevan virhe, ota yhteyttä tukeen.","postalContactsTitle":"Postipalvelun yhteystiedot","postalContactsNote":"Huomautus:","postalContactsPolandUKNote":"Puolaan ja Yhdistyneeseen kuningaskuntaan SpeedPost Priority (EMS) -palvelulla lähetetyt tuotteet käsittelee Pocztex ja Parcelforce.","postalContactsDHLNote":"SpeedPost Express -lähetyksiä varten ota yhteyttä DHL:ään tämän linkin kautta:","postalContactsCountry":"Maa","postalContactsWebsite":"Verkkosivusto","postalContactsForm":"Yhteydenottolomake","postalContactsPhone":"Puhelinnumero","postalContactsEmail":"Yhteys sähköposti","postalContactsFormLink":"Yhteydenottolomake","postalContactsBackButton":"Takaisin lähetyskyselyn lomakkeeseen","destinationNotAllowed":"Pääsy tähän kohdemaahan ei ole saatavilla sijainnistasi. Valitse toinen kohde.","contactUsTitle":"Ota Yhteyttä","parcelDisagreeCheckbox":"Ei","contactDisagreeCheckbox":"Ei","contactNameLabel":"Nimi","contactEmailLabel":"Sähköposti","contactEmailNote":"Yksityisiä välityssähköposteja (esim. @privaterelay.appleid.com) ei hyväksytä. Käytä kelvollista sähköpostiosoitetta.","contactEnquiryTypeLabel":"Onko tämä a?","contactSelectOption":"Valitse vaihtoehto","contactGeneralEnquiry":"Yleinen tiedustelu / palaute","contactBusinessEnquiry":"Yrityskysely","contactOrderShippingEnquiry":"Tilaus/toimituskysely","contactExchangeRefundEnquiry":"Vaihto/palautus/palautuskysely","contactOthers":"muut","contactParcelWarning":"Jos pakettisi ei ole toimitettu yli 18/30/45 päivään (14 päivää FedExille), tai tila näyttää toimitettu mutta sinulla ei ole sitä, täytä TÄMÄ LOMAKE sen sijaan.","contactParcelWarningLink":"TÄMÄ LOMAKE","contactParcelWarningEnd":"sen sijaan.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"Etsy, eBay & Shopee tilausnumero ei ole täällä. Meillä ei ole MITÄÄN valtaa näiden alustojen hyvityksiin. Ota yhteyttä heidän asiakaspalveluunsa erikseen.","contactPlatformInstructions":"Käytä sovellusta tilausnumerosi katsomiseen, koska se on tallennettu sovellukseen:","contactPlatformEtsy":"Etsy - Oikeassa yläkulmassa profiilissasi → Ostot","contactPlatformEbay":"eBay - Oma eBay → Ostot","contactPlatformShopee":"Shopee - Minä → Näytä ostohistoria (tai voit klikata Lähetettävät/Vastaanotettavat)","contactRefundNote1":"Jos kysyt palautuksesta/hyvityksestä alustalta, josta ostit, huomaa, että meillä ei ole MITÄÄN valtaa näiden alustojen hyvityksiin. Ota yhteyttä heidän asiakaspalveluunsa erikseen.","contactRefundNote2":"Palautuksille tai vaihdoille, jos maimai-käsineet on jo käytetty auki avatessa (näkyvät tahrat tai pesty koneessa käsinpesu), emme salli, ja arkadikorttojen palautukset tai vaihdot eivät ole sallittuja. Kiitos.","contactRefundNote3":"Huomaa, että Payhipin kautta tuleville hyvityksille, jos et saa hyvitystä, ota yhteyttä pankkiisi tai Payhip-tukeen (support@payhip.com), koska emme hallitse prosessia.","contactMessageLabel":"Viesti","contactCharacterCount":"hahmoja","contactSpamWarningNote":"Huomaa:","contactSpamWarning":"Ei-toivotut tarjoukset SEO:sta, verkkosivuston suunnittelusta, lainoista tai vastaavista palveluista hylätään automaattisesti.","contactAgreementText1":"Napsauta \"Hyväksyn\", jos hyväksyt sähköpostiosoitteesi käytön Rhythm Nexuksen toimesta vastatakseen sinulle, koska tämä on meille välttämätöntä vastauksesi lukemiseksi ja vastataksemme sinulle, kun olemme löytäneet ratkaisun kyselyysi.","contactAgreementText2":"Huomaa, että vastauksemme kestää 3-5 arkipäivää tai pidempään suurien sähköpostimäärien aikana.","contactAgreeCheckbox":"Hyväksyn","contactSuccessMessage":"Viestisi on lähetetty! Vastaamme 3-5 arkipäivän kuluessa.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"Pakettikysely","parcelInfoText":"Tämä lomake on tarkoitettu paketeille, joita ei ole toimitettu yli 18/30/45 päivää (14 päivää FedEx/DHL:ssä) tai joiden tila on toimitettu, mutta jotka eivät ole mukanasi.","parcelInfoLink":"Klikkaa tästä","parcelInfoEnd":"muita tiedusteluja varten.","parcelWaitTitle":"Odota pakettisi","parcelWaitText1":"Ole hyvä ja odota pakettisi toimitusta. Huomaa, että kansainväliset toimitukset EIVÄT ole samoja kuin paikalliset toimitukset, koska ne vievät aikaa. Kiitos!","parcelWaitText2":"Jos tilaa ei näy 18 päivän (7 päivää Singaporessa) tai pitemmän ajan kuluttua, voit ilmoittaa meille suoraan.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"Nimi","parcelOrderNumberLabel":"Tilausnumero (esimerkki: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Sähköposti","parcelEmailNote":"Yksityisiä välityssähköposteja ei hyväksytä. Käytä kelvollista sähköpostiosoitetta.","parcelShippingMethodLabel":"Lähetystapa valittu?","parcelSelectShipping":"Valitse toimitustapa","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"Seurantanumero","parcelUndeliveredLabel":"Onko pakettiasi ollut toimittamatta yli 18/30/45 päivää? (Singaporen paikallispalvelut > 7 päivää, > 14 päivää SpeedPost Express/DHL)","parcelSelectOption":"Valitse vaihtoehto","parcelYes":"Kyllä","parcelNo":"Ei","parcelDeliveredButMissingLabel":"Onko pakettisi tila toimitettu, mutta se ei ole postilaatikossasi/turvapaikassasi/ovellasi?","parcelCaseReferenceLabel":"Asian viitetunnus paikalliselta postitoimistolta","parcelCaseReferencePlaceholder":"Laita NA, jos olet Singaporesta","parcelCaseReferenceNote":"Ennen tämän lomakkeen lähettämistä ota yhteyttä paikalliseen postitoimistoon puhelimitse tai sähköpostitse ja pyydä heiltä tapausviitetunnus. Laita sitten tapauksen viitetunnus tähän.","parcelCaseReferenceLink":"Tästä linkistä löydät Postin yhteystiedot","parcelCaseReferenceMandatory":"LAITA NA VAIN JOS OLET SINGAPORISTA. Muissa maissa se on PAKOLLINEN toimitettava. Vaaditaan myös SpeedPost Expressissä, DHL:n tapaustunnuksessa.","parcelImageEvidenceLabel":"Kuvatodisteet (toimitetuille mutta puuttuville paketeille)","parcelImageWarning":"Ylimääräistä vahvistusta varten tarvitsemme kuvatodisteita todistaaksemme, ettet esitä vääriä väitteitä pakettien toimittamatta jättämisestä. (Vain jo toimitetuille paketeille, jotka eivät ole postilaatikossa/oven ulkopuolella. Voimme hylätä vaatimuksesi, jos toimitetuista tuotteista ei anneta valokuvatodisteita. Älä huomioi tätä, jos tuotteesi EI ole näyttänyt toimitettu-tilaa.)","parcelImageNote":"Lataa 1 tuettu tiedosto: kuva. Enintään 1 GB.","parcelAgreementText":"Napsauta \"Hyväksyn\", jos varmistat, että se, mitä paketillesi on tapahtunut, oli totta.","parcelAgreeCheckbox":"Hyväksyn","parcelSuccessMessage":"Pakettisi on lähetetty! Vastaamme 3-5 arkipäivän kuluessa.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","lookalikeDomainWarning":"Tämä ei ole seurantanumero vaan linkki sivustolle, joka esiintyy kuljetusyhtiönä. Älä syötä sinne henkilö- tai maksutietoja.","lookalikeDomainOfficial":"Virallinen sivusto:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus utilise des réseaux commerciaux premium. Cependant, au moment précis où il arrive dans votre pays, la garde est transférée au transporteur national local (par exemple, USPS, Royal Mail, DHL localement). Les préfixes de suivi modifient les systèmes de traitement à ce seuil, mais notre outil de suivi de colis universel rassemble ces statuts pour vous offrir une visibilité ininterrompue.","trackingLastMileTitle":"Réseau de livraison du dernier kilomètre","trackingCustomsClearanceBody":"Tous les articles transfrontaliers doivent être dédouanés par l'agence douanière de votre pays local. Notre outil surveille les transitions depuis l’arrivée dans les installations d’importation jusqu’à la remise en douane. Les patrouilles frontalières vérifieront les codes SH et s'assureront que la TVA ou les droits de douane corrects ont été versés (par exemple, IOSS dans l'UE, VOEC en Norvège). Surveillez le suivi spécifiquement pour les avertissements « Détenu à la douane ».","trackingCustomsClearanceTitle":"Informations sur le dédouanement","trackingProcessingOriginBody":"Une fois déposé, l'article entre dans le centre de traitement d'origine où il est numérisé, pesé et soumis aux contrôles de sécurité primaires à l'exportation. Il est ensuite expédié vers l'échange postal international. Les horaires de vol dépendent de la bande passante disponible pour le fret. Ne vous inquiétez pas s'il reste dans cet état pendant plusieurs jours.","trackingProcessingOriginTitle":"Traitement à Origin Hub","trackingInfoReceivedBody":"Lorsqu'une commande est traitée pour la première fois sur nos plateformes de commerce électronique (telles que Etsy, eBay ou la vente directe), le numéro de suivi est généré électroniquement. Le transporteur reçoit les données d'expédition avant la prise de possession physique du colis. Veuillez prévoir 1 à 3 jours ouvrables pour que le colis soit introduit dans l'installation de tri physique.","trackingInfoReceivedTitle":"Informations reçues","trackingStatusesIntro":"Merci d'utiliser notre outil de suivi international unifié des colis. Étant donné que votre colis traverse plusieurs frontières mondiales, ses statuts de suivi peuvent être complexes. Comprendre le cycle de vie logistique permet de définir des attentes claires.","trackingStatusesTitle":"Comprendre les statuts de suivi","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"AM","pmText":"PM","footerQuickLinks":"Liens rapides","footerSupportLegal":"Assistance et mentions légales","copyrightText":"Tous droits réservés.","englishResponseNotice":"Remarque : Toutes les demandes reçoivent une réponse en anglais. Si vous soumettez dans une autre langue, votre message peut être traduit en anglais pour vérification.","parcelDisagreeCheckbox":"Je ne suis pas d'accord","contactDisagreeCheckbox":"Je ne suis pas d'accord","contactNamePlaceholder":"Ex: Jean Dupont","systemRequirementsTitle":"Versions minimales prises en charge du système","systemRequirements":"Windows : Windows 7 (with ESU updates installed) ou supérieur\nmacOS : macOS 12 ou supérieur\nAndroid : Android 13 ou supérieur\niPhone/iOS : iOS 17 ou supérieur\nLinux : Une distribution actuellement prise en charge avec des mises à jour de sécurité actives","title":"Vérifier l'accès","subtitle":"Veuillez résoudre le défi ci-dessous pour continuer.","selectLanguage":"Sélectionner la langue","selectLanguagePlaceholder":"-- Choisir une langue --","loadingChallenge":"Chargement du défi...","answerLabel":"Votre réponse :","answerPlaceholder":"Entrez votre réponse","continueButton":"Continuer","refreshButton":"Nouveau défi","verifying":"Vérification...","chooseLanguageFirst":"Veuillez d'abord sélectionner une langue.","loadFailed":"Échec du chargement du défi. Veuillez réessayer.","expiredChallenge":"Défi expiré. Chargement d'un nouveau défi...","verifyFailed":"Échec de la vérification. Veuillez réessayer.","home":"Accueil","blog":"Blogue","aboutUs":"À Propos","faq":"FAQ","contact":"Contact","trackPackage":"Suivi de Colis","cnyYearOfHorseMessage":"🧧 Bonne année lunaire ! Nous vous souhaitons prospérité et joie pour l'Année du Cheval ! 🐴","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri ! Nous vous souhaitons, à vous et votre famille, paix, joie et bénédictions ! 🌟","deepavaliMessage":"🪔 Joyeuse Deepavali ! Que la fête des lumières vous apporte joie, prospérité et succès ! ✨","diwaliMessage":"🪔 Joyeux Diwali ! Que la fête des lumières vous apporte joie, prospérité et succès ! ✨","vesakMessage":"☸️ Joyeux jour de Vesak ! Nous vous souhaitons paix, sagesse et illumination en ce jour sacré ! 🙏","vesakTHMessage":"☸️ Joyeux jour de Visakha Bucha ! Nous vous souhaitons paix, sagesse et illumination en ce jour sacré ! 🙏","singaporeNationalDayMessage":"🇸🇬 Joyeuse fête nationale, Singapour ! Célébrons 61 ans d'indépendance ! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesia ! Dirgahayu Republik Indonesia ! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaisie ! Célébrons l'indépendance de notre nation ! 🎊","australiaNationalDayMessage":"🇦🇺 Joyeux jour de l'Australie ! Célébrons notre nation ! 🎉","canadaNationalDayMessage":"🇨🇦 Joyeux jour du Canada ! Célébrons notre grande nation ! 🍁","usaNationalDayMessage":"🇺🇸 Joyeux jour de l'indépendance, Amérique ! Célébrons la liberté ! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet ! Vive la France ! 🎊","germanyUnityDayMessage":"🇩🇪 Joyeux jour de l'unité allemande ! Tag der Deutschen Einheit ! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica ! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad ! 🎊","japanFoundationDayMessage":"🇯🇵 Joyeux jour de la fondation, Japon ! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Joyeuse fête nationale, Chine ! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Joyeux jour de la libération, Corée ! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Joyeux jour de l'indépendance, Inde ! Jai Hind ! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Joyeuse fête nationale, Thaïlande ! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Joyeux jour de l'indépendance, Philippines ! Mabuhay ! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Joyeuse fête nationale, Vietnam ! Quốc khánh Việt Nam ! 🎊","polandNationalDayMessage":"🇵🇱 Joyeux jour de l'indépendance, Pologne ! Święto Niepodległości ! 🎉","czechNationalDayMessage":"🇨🇿 Joyeux jour de l'indépendance, République tchèque ! Den nezávislosti ! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag ! Vive le Roi ! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge ! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Glad Sveriges nationaldag ! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi ! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal ! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Joyeux jour de l'indépendance, Israël ! 🎉","irelandNationalDayMessage":"🇮🇪 Joyeuse Saint-Patrick, Irlande ! Lá Fhéile Pádraig sona duit ! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei ! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Joyeux jour de Waitangi, Nouvelle-Zélande ! 🎉","switzerlandNationalDayMessage":"🇨🇭 Joyeuse fête nationale suisse ! Fête nationale suisse ! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich ! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgique ! Fijne Nationale Feestdag ! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России ! Joyeux jour de la Russie ! 🎉","taiwanFoundingDayMessage":"🇹🇼 Joyeux jour de la fondation, Taïwan ! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Joyeux jour du Double Dix, Taïwan ! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Joyeux jour de la fondation de la RAS de Hong Kong ! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Joyeux jour de la fondation de la RAS de Macao ! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Joyeuse Journée Internationale des Travailleurs ! Célébrons le travail et les droits des travailleurs ! 🎊","laborDayUSCAMessage":"⚒️ Joyeuse Fête du Travail ! Rendons hommage aux contributions des travailleurs ! 🎉","orderNumber":"Numéro de Commande (Exemple: RTNX1234567890)","fromDate":"De la Date (REQUIS)","toDate":"À la Date (REQUIS)","trackParcel":"Suivre le Colis","selectCourier":"-- Sélectionner Coursier / Pays --","singaporeCouriers":"Coursiers Singapouriens","topCountries":"Top 5 Pays","otherCountries":"Autres Pays","note":"REMARQUE","disclaimer":"AVERTISSEMENT","importantInformation":"Informations Importantes:","didNotReceiveEmail":"Si vous n'avez pas reçu votre e-mail de confirmation d'Etsy, eBay, Shopee ou Payhip, faites défiler vers le bas pour rechercher votre commande via votre adresse e-mail ou votre numéro de téléphone associé à cette commande.","searchByEmailOrPhone":"Rechercher par E-mail ou Téléphone","searchOrder":"Rechercher la Commande","trackingResult":"Résultat du Suivi","noOrdersFound":"Aucune commande trouvée.","pleaseEnter":"Veuillez entrer un e-mail, un numéro de téléphone ou un numéro de commande.","fillAllFields":"Veuillez remplir tous les champs obligatoires : numéro de suivi, pays de destination, numéro de commande et code postal.","noOrderMatchingFields":"Aucune commande trouvée correspondant à tous les champs.","postcodeRequired":"Le code postal est requis pour cette destination.","invalidUSZip":"Code postal américain invalide. Utilisez 5 chiffres ou ZIP+4.","failedGenerateURL":"Impossible de générer l'URL de suivi. Veuillez vérifier la saisie.","trackingValidationSG":"Les numéros de suivi pour Singapour doivent être : LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG ou PX123456789SG. Pour les envois DHL, utilisez des numéros à 10 chiffres.","invalidSingPostFormat":"Format de numéro de suivi SingPost invalide.\nFormats acceptés :\n• PP123456789SG → Etiquette de suivi prépayée\n• SPNDD00012345 → Suivi SpeedPost Standard","welcomeTitle":"Bienvenue sur le site de Rhythm Nexus!","purchaseInfo":"Achetez chez nous via nos canaux officiels, ou rejoignez notre","purchaseInfoChina":"Achetez chez nous via nos canaux officiels.","purchaseInfoChinaSuffix":"","telegramGroup":"groupe Telegram","forUpdates":"pour les mises à jour officielles.","ourStores":"Nos Magasins","etsyStore":"Boutique Etsy","ebayStore":"Boutique eBay","shopeeStore":"Boutique Shopee","payhipStore":"Boutique Payhip","internationalShipping":"Expédition Internationale","singaporeLocal":"Singapour Local","asiaOnly":"Asie seulement","deliveryInfo":"Informations de Livraison","deliveryRates2026":"Tarifs de Livraison 2026","sgDeliveryRates":"Tarifs de Livraison Singapour","speedPostRates":"Tarifs SpeedPost Express International","aboutTitle":"À Propos de Rhythm Nexus","aboutP1":"Nous avons lancé notre boutique en 2022 et vendons sur Etsy, eBay et Shopee sans échec.","aboutP2":"Nous avons bâti une solide réputation en nous concentrant sur un traitement fiable et un suivi précis.","aboutP3":"Notre objectif est d'offrir une expérience d'achat fluide et digne de confiance.","aboutP4":"Merci de soutenir Rhythm Nexus.","faqTitle":"Foire Aux Questions","faqQ1":"Que faire si mon article est défectueux ? Y a-t-il une garantie ?","faqA1":"Oui ! La plupart des commandes sont accompagnées d'une garantie d'un an. Veuillez fournir votre numéro de facture/commande afin que nous puissions enquêter. Remarque : Les échanges ne sont pas autorisés si l'article correspond à la description, même si vous avez commandé de manière incorrecte.","faqQ2":"Puis-je modifier, mettre à jour ou annuler ma commande ?","faqA2":"Oui. Pour des raisons de sécurité, les modifications de commande peuvent devoir être traitées par e-mail ou via notre formulaire de contact.","faqQ3":"Dois-je payer des taxes de douane/d'importation ?","faqA3":"Les frais de douane et droits ne sont généralement pas prépayés, sauf pour le DDP vers les États-Unis. La TVA peut s'appliquer pour l'UE, le Royaume-Uni, l'Australie/Nouvelle-Zélande, la Norvège, la Suisse et les provinces canadiennes comme la Saskatchewan et le Manitoba, qui est déjà payée par défaut. Aucune TPS ne s'applique pour Singapour. Nous ne pouvons pas donner de conseils sur les frais de douane — contactez vos douanes locales pour plus de détails.","faqQ4":"Quand ma commande sera-t-elle expédiée ?","faqA4":"Les commandes sont généralement expédiées dans un délai de 1 à 5 jours ouvrables. Pendant les périodes de fort volume, cela peut prendre 5 à 7 jours.","faqQ5":"J'ai commandé deux fois par accident. Que dois-je faire ?","faqA5":"Nous remboursons uniquement les frais d'expédition en double. Les deux articles seront expédiés ensemble. Remboursement = (premiers frais d'expédition + deuxièmes frais d'expédition) – frais d'expédition réels.","faqQ6":"Combien de temps prend la livraison ?","faqA6":"Le traitement prend 1 à 5 jours ouvrables.\n\nExpédition nationale :\n• SingPost Prepaid Tracked Label : 2 à 4 jours\n• SpeedPost Standard : 1 à 3 jours\n\nInternational :\n• SingPost ePAC : 14 à 30 jours\n• SpeedPost Priority (EMS) : 8 à 15 jours\n• SpeedPost Express : 4 à 8 jours\n\nDes retards peuvent survenir pendant les hautes saisons.","faqQ7":"Mon article est renvoyé à l'expéditeur. Que dois-je faire ?","faqA7":"Une réexpédition est autorisée. L'annulation n'est pas possible pour les adresses invalides, les colis non réclamés ou les frais de douane impayés. Contactez votre service postal pour une nouvelle livraison, ou envoyez-nous un message pour obtenir de l'aide.","faqQ8":"Mon article est perdu / volé pendant le transport.","faqA8":"Nous autorisons une réexpédition. S'il est à nouveau perdu, un remboursement complet est émis après la fenêtre de livraison du transporteur :\n\n• Services locaux de Singapour : 7 jours\n• SingPost ePAC & SpeedPost Priority International : 30 jours\n• SpeedPost Intl Express : 14 jours","blogTitle":"Base de Connaissances d'Expédition","blogSubtitle":"Explications officielles sur les services postaux.","readMore":"Lire Plus","backButton":"Retour","blogPost1Title":"Qu'est-ce que SingPost ePAC?","blogPost1Desc":"En savoir plus sur ePAC.","blogPost2Title":"Qu'est-ce que SpeedPost Priority International (EMS)?","blogPost2Desc":"Découvrez l'EMS.","blogPost3Title":"Qu'est-ce que SpeedPost Express?","blogPost3Desc":"Explorez SpeedPost Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Comprendre PDDP.","blogPost5Title":"TVA UE & IOSS","blogPost5Desc":"Aperçu de la TVA UE.","blogPost6Title":"TVA UK & HMRC","blogPost6Desc":"Exigences TVA au Royaume-Uni.","blogPost7Title":"Norvège VOEC","blogPost7Desc":"Système VOEC de Norvège.","blogPost8Title":"TVA Suisse","blogPost8Desc":"Exigences TVA suisse.","enterDestinationPostcode":"Entrer le code postal de destination","trackingNumberExample":"ex. LG123456789SG","trackingCaseSensitive":"LES LETTRES DE SUIVI SONT SENSIBLES À LA CASSE ET DOIVENT ÊTRE EN MAJUSCULES.","usaPostcodeNote":"Pour les pays sans code postal, comme Hong Kong et Macao, veuillez indiquer 999077 (Hong Kong) ou 999078 (Macao).","epacDeliveryNote":"Veuillez noter que tous les articles ePAC envoyés à destination doivent être livrés dans votre boîte aux lettres, sur le pas de votre porte, dans un casier à colis ou laissés en lieu sûr !","currentTime":"Heure actuelle","timezoneNote":"Heure affichée au format 12 heures","sameTimeAsSingapore":"Même heure qu'à Singapour","hourAhead":"heure d'avance sur Singapour","hoursAhead":"heures d'avance sur Singapour","hourBehind":"heure de retard sur Singapour","hoursBehind":"heures de retard sur Singapour","collectAtPostOffice":"Cependant, si votre pays ne dispose pas de boîte aux lettres standard, vous devrez le retirer au bureau de poste.","countriesNoMailbox":"Pays connus pour ne pas avoir de livraison en boîte aux lettres/boîte aux lettres : Brunei, Chine, Inde, Israël, RAS de Macao Chine, Philippines, Pologne et Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus N'EST PAS RESPONSABLE de la gestion des livraisons car cela échappe à notre contrôle et nous préférerions que vous suiviez l'état de votre article.","issuesAfterDelivery":"Tout problème avec votre livraison après 30/45 jours (14 jours pour SpeedPost Express) ou si le statut indique livré mais que vous n'avez pas reçu, veuillez nous contacter","cannotUseEmbed":"Nous ne pouvons pas utiliser l'intégration pour le suivi car la plupart des sites Web des services postaux ne le prennent pas en charge.","clickLinkAbove":"Veuillez cliquer sur le lien ci-dessus pour suivre votre colis.","trackingDetailsNote":"Notez que les détails de suivi peuvent ne pas apparaître dans les résultats de recherche, il est donc recommandé de coller le numéro de suivi dans le système pour suivre l'article.","thirdPartyWebsites":"Vous pouvez également suivre vos colis sur ces sites Web tiers :","enterEmailOrPhone":"E-mail ou téléphone","reviewShippingRates":"Consultez nos tarifs d'expédition actuels","here":"ici","contactUsForm":"Veuillez nous contacter via","form":"formulaire","forEnquiries":"pour toute demande concernant votre commande.","anPostNoDirectTracking":"An Post (Irlande) ne prend pas en charge les liens de suivi directs ni le suivi intégré.","anPostPasteManually":"Veuillez coller votre numéro de suivi manuellement sur le site Web d'An Post.","goToAnPost":"Aller à An Post","countryMsgNL":"Si le statut indique 'Retenu par les douanes', veuillez contacter la ligne d'information douanière des Pays-Bas pour obtenir de l'aide:\n0800 0143 (gratuit), du lundi au vendredi de 7h à 23h.\nLe samedi et le dimanche de 8h à 16h30.\n\nIl est recommandé de créer un compte chez PostNL pour recevoir des notifications push instantanées de vos colis:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nS'il est livré à un point PostNL ou si le statut vous indique de le retirer au bureau de poste, vous devrez payer 7 EUR au comptoir. Au maximum 4 EUR si payé en ligne.","countryMsgDE":"Nous vous encourageons à télécharger l'application Post & DHL pour recevoir des notifications push sur le statut de suivi de vos colis:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nContact du service client DHL Paket GmbH:\n+49-228-433-3112\nContact DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Vous devrez soumettre une déclaration d'importation supplémentaire aux douanes. Le non-respect de cette obligation pourrait entraîner une restriction d'entrée et le retour du colis. \nPlus d'informations: https://www.posti.fi/en/receiving/customs-clearance \nAutres liens: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Des frais de traitement de 4,95 EUR sont facturables.\nTéléchargez l'application ici: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Des frais de traitement de 8,50 PLN sont facturables. \nVous devrez les payer lors du retrait au bureau de poste,\ncar le colis ne sera probablement pas livré à votre porte ou dans votre boîte aux lettres.","countryMsgPH":"PHLPost est considéré comme inefficace et peu fiable aux Philippines.\nVeuillez toujours suivre votre colis car parfois le statut de livraison en cours\nn'apparaîtra qu'entre 1 et 3 semaines pour les petits colis. Pour les colis plus grands, \nle retrait n'est possible qu'au bureau de poste central de Manille ou au bureau de poste\nle plus proche de votre région. Veuillez noter qu'une taxe de traitement de 112 PHP s'applique pour les colis de\ntoute valeur que vous devrez payer. Le non-paiement entraînera le retour du colis\nchez nous. La livraison est estimée à 1-2 mois en raison de la lenteur des services de PHLPost. \nVous n'avez pas besoin de payer de taxes pour les articles de moins de 10000 PHP, mais vous devrez le faire s'ils sont égaux ou supérieurs à ce montant. \nNous recommanderions SpeedPost Express pour un processus plus rapide la prochaine fois que vous commandez chez nous. Cependant, les frais peuvent ne pas s'appliquer car D&T pour le destinataire est par défaut.","countryMsgCA":"Le de minimis est de 20 CAD pour toutes les commandes envoyées au Canada. Comme Singapour fait partie de l'accord CPTPP, les droits peuvent ne pas s'appliquer, mais D&T peut s'appliquer si l'article dépasse 60 CAD et plus ou 100 CAD et plus, ce qui peut dépendre du code SH de l'article. Toute valeur supérieure à ce montant sera facturée TVA en conséquence.","countryMsgID":"Vous devez payer toutes les taxes et droits applicables à l'arrivée en Indonésie. Veuillez suivre votre colis et payer le montant spécifié aux douanes indonésiennes.\nVous devrez également soumettre des documents de dédouanement supplémentaires. Le non-respect de cette obligation peut entraîner une restriction d'entrée ou la saisie du colis par les douanes du pays. Veuillez vérifier les détails supplémentaires ici:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Vous devez payer toutes les taxes et droits applicables à l'arrivée en Inde. Veuillez suivre votre colis et payer le montant spécifié aux douanes indiennes.\nSoyez conscient que le dédouanement en Inde est strict et vous pouvez ou non être facturé des droits si la valeur de votre article est supérieure à 1000 INR (15 USD) - en fonction du code SH, dans la plupart des cas c'est en franchise de droits, mais vous pourriez être facturé des droits plus élevés si l'article est supérieur à 5000 INR (60 USD). \nComme India Post NE livre PAS dans la boîte aux lettres en standard, vous DEVREZ être à la maison ou un représentant autorisé pour recevoir votre colis ou le retirer au bureau de poste.","countryMsgMY":"Le de minimis est de 500 MYR pour toutes les commandes envoyées en Malaisie. Les commandes supérieures à ce montant peuvent être facturées.","countryMsgUS":"À partir du 29 août 2025, le de minimis de 800 USD sera officiellement supprimé et les droits d'importation seront payables par défaut pour l'expéditeur dans le pays d'origine.\nL'expédition aux États-Unis NÉCESSITE un numéro de téléphone et une adresse e-mail valides pour que votre colis évite d'avoir d'autres retards.","countryMsgIL":"Le de minimis est de 240 ILS (75 USD) pour toutes les commandes expédiées en Israël. Les commandes supérieures à ce montant peuvent être facturées. \nVeuillez noter que pour les commandes envoyées en Israël, Israel Post peut parfois ne pas confirmer la livraison finale une fois qu'elle est livrée. \nComme Israel Post NE livre PAS dans la boîte aux lettres en standard, vous DEVREZ être à la maison ou un représentant autorisé pour recevoir votre colis ou le retirer au bureau de poste.","countryMsgGB":"Veuillez noter que pour les commandes envoyées au Royaume-Uni, Royal Mail peut parfois ne pas confirmer la livraison finale une fois qu'elle est livrée dans votre boîte aux lettres.","countryMsgTH":"Le de minimis est de 1500 THB (45 USD) pour toutes les commandes expédiées en Thaïlande. Les commandes supérieures à ce montant peuvent être facturées.","countryMsgTW":"Le de minimis est de 2000 TWD (60 USD) pour toutes les commandes expédiées à Taiwan. Les commandes supérieures à ce montant peuvent être facturées.","countryMsgMO":"Aucun D&T n'est facturé lors de l'envoi à Macao. Mais veuillez noter que Macao Post NE livre PAS dans la boîte aux lettres en standard, vous DEVREZ récupérer votre colis au bureau de poste.","countryMsgBN":"Aucun D&T n'est facturé lors de l'envoi au Brunei. Mais veuillez noter que Brunei Post NE livre PAS dans la boîte aux lettres en standard, vous DEVREZ récupérer votre colis au bureau de poste. \nLe système de suivi pour ce pays n'est pas très stable et des informations limitées peuvent uniquement être fournies, et les résultats de livraison finale ne sont PAS donnés à l'origine.","countryMsgJP":"Le de minimis est de 10000 JPY (65 USD) pour toutes les commandes expédiées au Japon. Les commandes supérieures à ce montant peuvent être facturées.","countryMsgKR":"Le de minimis est de 180000 KRW (150 USD) pour toutes les commandes expédiées en Corée du Sud. Les commandes supérieures à ce montant peuvent être facturées.","countryMsgVN":"Pour le Vietnam, veuillez rester JOIGNABLE pendant la livraison car vous pourriez être facturé des frais de traitement lors de la livraison de l'article. \nLe de minimis est de 1000000 (35 USD) pour toutes les commandes expédiées au Vietnam. Les commandes supérieures à ce montant peuvent être facturées. \nComme Vietnam Post NE livre PAS dans la boîte aux lettres en standard, vous DEVREZ être à la maison ou un représentant autorisé pour recevoir votre colis ou le retirer au bureau de poste.","countryMsgPP":"Les articles Tracked Label seront postés dans POPDrop/POPStop au bureau de poste. Les articles SpeedPost Standard sont généralement postés sur POPStop ou POPStation.\nVeuillez NOTER que les livraisons des articles Tracked Label ne seront effectuées que du lundi au vendredi de 9h à 18h. Sauf les week-ends et les jours fériés.","postedDate":"Date d'Envoi:","status":"Statut:","shippedVia":"Expédié via:","destination":"Destination:","statusInPreparation":"En préparation","statusInTransit":"En transit","statusDelivered":"Livré","statusOutForDelivery":"En cours de livraison","statusArrived":"Arrivé","statusProcessing":"En traitement","statusDispatched":"Expédié","statusReturned":"Retourné","statusFailed":"Échoué","statusCancelled":"Annulé","statusHeldByCustms":"Retenu par la douane","statusAwaitingCollection":"En attente de collecte","aka":"alias","thisServiceKnownAs":"Ce service est connu sous le nom de","in":"en","viewTrackingDHL":"Voir les informations de suivi de DHL Express","viewTrackingSingPostSpeedPost":"Voir les informations de suivi de Singapore SpeedPost","viewTrackingDHLLastMile":"Voir les informations de suivi de DHL Express (Dernier kilomètre)","viewTrackingDHLShipperRef":"Voir les informations de suivi de DHL Express (Référence expéditeur)","viewTrackingSingPost":"Voir les informations de suivi de Singapore Post","viewTrackingDestPost":"Voir les informations de suivi de","post":"Poste","orderNumberExample":"Numéro de Commande (commence par RTNX ou DLTB - exemple: RTNX1234567890):","deliveryRecordNote":"Veuillez noter qu'une fois l'article livré, l'enregistrement ne sera conservé que pendant 7 jours, puis sera supprimé.","copyrightAllRights":"Tous droits réservés.","accessRestricted":"Accès Restreint","vpnDetectedMessage":"Utilisation VPN détectée. Veuillez désactiver le VPN pour accéder à ce service.","contactSupportError":"Si vous pensez qu'il s'agit d'une erreur, veuillez contacter le support.","destinationNotAllowed":"L'accès à ce pays de destination n'est pas disponible depuis votre emplacement. Veuillez sélectionner une autre destination.","epacUS":"Service de colis international de première classe","epacCH":"Priorité Plus","epacGB":"Suivi international","epacMY":"International suivi/express","epacCA":"Express international entrant","epacAU":"Emballer et suivre à l'international","epacNZ":"Suivi économique international","epacDE":"Prime internationale Warenpost","epacFR":"Lettre internationale avec suivi","epacNL":"Paquet international suivi","epacPL":"GLOBAL Express","epacBE":"International Prime entrant","epacAT":"Colis international suivi","epacIN":"Colis international suivi","epacFI":"Lettre internationale suivie","epacSE":"Lettre internationale suivie","epacNO":"PRIME Exprès","epacIT":"Exprimer","epacIL":"Exprimer","epacES":"Colis léger international","epacPT":"Courrier bleu international","epacCZ":"Envoi suivi de l'étranger","epacBN":"ePacket international","epacCN":"ePacket international","epacHK":"ePacket international","epacID":"e-Paquet international","epacMO":"ePacket international","epacPH":"Courrier suivi international","epacTW":"ePacket international","epacTH":"ePacket international","epacVN":"E-Paquet international (Pack ASEAN)","epacKR":"Paquet K","epacJP":"e-Paquet international Light","epacIE":"Poste express international","blogSingPostEPACContent1":"SingPost ePAC (ePacket) est un service postal économique avec suivi pour les envois e-commerce internationaux légers.","blogSingPostEPACContent2":"Il est livré par l'opérateur postal national du pays de destination et est couramment utilisé pour les colis de moins de 2 kg, avec une limite de dimension de longueur + largeur + hauteur inférieure à 90 cm et une longueur ne dépassant pas 60 cm.","blogSingPostEPACContent3":"Cette option n'était initialement proposée que par Hong Kong Post en collaboration avec eBay China, permettant aux colis de Chine et de Hong Kong d'être expédiés vers les États-Unis avec suivi sans nécessiter de signature à la livraison. Ce service est connu sous le nom de USPS (United States Postal Service) First-Class Package International Service aux États-Unis.","blogSingPostEPACContent4":"À partir du 1er janvier 2026, ePAC est désormais utilisé pour tous les pays afin de se conformer aux règlements obligatoires de l'UPU exigeant le suivi des colis et limitant les articles recommandés aux documents uniquement.","blogSingPostEPACContent5":"Préfixes de suivi: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS est un service postal express international premium, priorisé par les opérateurs postaux du monde entier.","blogSpeedPostEMSContent2":"Le dédouanement est généralement plus rapide que le courrier standard mais plus strict dans le processus, avec un suivi complet jusqu'à la livraison.","blogSpeedPostEMSContent3":"À Singapour, ce service est connu sous le nom de SpeedPost Priority International par SingPost.","blogSpeedPostEMSContent4":"Préfixe de suivi: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express est un service de qualité coursier.","blogSpeedPostExpressContent2":"Dans de nombreuses destinations, DHL Express effectue la livraison du dernier kilomètre et collecte les droits ou taxes avant la libération.","blogSpeedPostExpressContent3":"Préfixe de suivi: PX123456789SG (Le dernier kilomètre DHL Express utilise un numéro de suivi à 10 chiffres, qui n'est pas visible au public, mais nous avons des informations à ce sujet via notre","blogSpeedPostExpressContent3Link":"Système de Suivi.","blogUSPDDPContent1":"Le PDDP permet de prépayer les droits et taxes d'importation américains avant la livraison, réduisant ainsi les frais surprises pour les destinataires.","blogUSPDDPContent2":"Nouvelles Réglementations (En vigueur le 29 août 2025)","blogUSPDDPContent2List1":"Codes HTS obligatoires","blogUSPDDPContent2List2":"Descriptions précises des articles","blogUSPDDPContent2List3":"Application tarifaire plus stricte","blogUSPDDPContent3":"Tous les articles envoyés aux États-Unis ne seront pas soumis à des tarifs supplémentaires pour le destinataire car nous payons en votre nom. Notez toutefois que le prix de l'article inclut par défaut les frais d'importation de 10 % pour se conformer aux réglementations.","blogUSPDDPContent4":"Ceci ne s'applique qu'à nos méthodes d'expédition vers les États-Unis, SpeedPost Priority International (EMS) et SingPost ePAC uniquement.","blogEUIOSSContent1":"L'UE applique la TVA sur toutes les importations commerciales quelle que soit la valeur.","blogEUIOSSContent2":"IOSS (guichet unique d'importation)","blogEUIOSSContent3":"L'IOSS permet aux vendeurs de collecter la TVA de l'UE au moment du paiement pour les envois jusqu'à 150 €.","blogEUIOSSContent4":"La TVA est ensuite reversée via le système IOSS, permettant un dédouanement plus rapide et aucune collecte de TVA à la livraison.","blogEUIOSSContent5":"Pour toutes les commandes via Etsy ou eBay, la TVA IOSS est déjà collectée au moment du paiement et nous l'indiquerons sur le numéro de référence fiscale pour transmettre les données au service postal de destination via EDI (Electronic Data Interchange).","blogUKVATContent1":"Le Royaume-Uni exige que la TVA soit comptabilisée pour les marchandises importées.","blogUKVATContent2":"Pour les envois de faible valeur, la TVA est généralement collectée au moment du paiement et reversée directement au HMRC par le vendeur ou la place de marché.","blogUKVATContent3":"Pour les envois de valeur plus élevée, la TVA peut être collectée par le transporteur avant la livraison.","blogUKVATContent4":"Pour toutes les commandes via Etsy ou eBay, la TVA est déjà collectée au moment du paiement et nous l'indiquerons sur le numéro de référence fiscale pour transmettre les données au service postal de destination via EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"La Norvège a introduit le système VOEC (VAT on E-Commerce) pour les marchandises importées de l'extérieur de l'UE/EEE. Cela s'applique aux marchandises d'une valeur allant jusqu'à 3 000 NOK.","blogNorwayVOECContent2":"Les vendeurs peuvent s'inscrire au système VOEC pour collecter la TVA norvégienne au moment du paiement, permettant un dédouanement plus rapide et aucune collecte de TVA à la livraison.","blogNorwayVOECContent3":"Pour toutes les commandes via Etsy ou eBay, la TVA VOEC est déjà collectée au moment du paiement. Le suivi et les documents douaniers indiquent le numéro de référence fiscale pour transmettre les données au service postal norvégien.","blogSwissVATContent1":"La Suisse applique la TVA sur les marchandises importées quelle que soit la valeur. L'Administration fédérale des douanes exige que les vendeurs étrangers collectent la TVA au moment du paiement pour les marchandises jusqu'à 65 CHF.","blogSwissVATContent2":"Les vendeurs enregistrés dans le système de TVA suisse reversent directement la TVA collectée, garantissant que le destinataire ne subisse aucun frais de TVA supplémentaire à la livraison.","blogSwissVATContent3":"Pour toutes les commandes via Etsy ou eBay, la TVA suisse est déjà collectée lors du paiement, et les documents douaniers incluent le numéro de référence fiscale pour la soumission EDI.","dhlNoEmbed":"DHL Express ne prend pas en charge le suivi intégré. Veuillez","speedPostNoEmbed":"SpeedPost Singapour ne prend pas en charge le suivi intégré. Veuillez","operatorNoEmbed":"ne prend pas en charge le suivi intégré. Veuillez","clickHere":"cliquer ici","toTrackNewTab":"pour suivre (s'ouvre dans un nouvel onglet).","optionSingPost":"🇸🇬 SingPost (SPNDD/PP)","countryAU":"🇦🇺 Australie","countryCA":"🇨🇦Canada","countryDE":"🇩🇪 Allemagne","countryGB":"🇬🇧 Royaume-Uni","countryUS":"🇺🇸 États-Unis","countryAT":"🇦🇹 Autriche","countryBE":"🇧🇪 Belgique","countryBN":"🇧🇳 Brunéi","countryCN":"🇨🇳 Chine","countryCZ":"🇨🇿 Tchéquie","countryFI":"🇫🇮 Finlande","countryFR":"🇫🇷France","countryHK":"🇭🇰 Hong Kong R.A.S. Chine","countryIN":"🇮🇳 Inde","countryID":"🇮🇩 Indonésie","countryIE":"🇮🇪 Irlande","countryIL":"🇮🇱 Israël","countryIT":"🇮🇹 Italie","countryJP":"🇯🇵 Japon","countryMO":"🇲🇴 Macao R.A.S. Chine","countryMY":"🇲🇾 Malaisie","countryNL":"🇳🇱 Pays-Bas","countryNZ":"🇳🇿 Nouvelle-Zélande","countryNO":"🇳🇴 Norvège","countryPH":"🇵🇭 Philippines","countryPL":"🇵🇱 Pologne","countryPT":"🇵🇹Portugal","countryRU":"🇷🇺 Russie","countryKR":"🇰🇷 Corée du Sud","countryES":"🇪🇸 Espagne","countrySE":"🇸🇪 Suède","countryCH":"🇨🇭 Suisse","countryTW":"🇹🇼 Taïwan","countryTH":"🇹🇭 Thaïlande","countryVN":"🇻🇳Vietnam","countrySG":"🇸🇬 Singapour","russiaServiceSuspended":"⚠️ AVIS IMPORTANT: En raison de l'invasion russe de l'Ukraine en 2022, SingPost a suspendu tous les envois vers la Russie ainsi que DHL. Nous ne desservons actuellement pas la Russie jusqu'à ce qu'il y ait une annonce de reprise des services vers le pays.","goodFridayEasterGreeting":"Joyeuses Pâques ! Je vous souhaite paix et joie pendant le Vendredi Saint et Pâques.","christmasGreeting":"Joyeux Noël et bonne année ! Je vous souhaite paix et joie du 25 décembre au 5 janvier.","captchaSystemRequirements":"Configuration minimale requise : Windows 7 (with ESU updates installed) ou 11, macOS 10.15+ ou dernière version d'Android/iOS.","temporaryClosureNoticeTitle":"Rhythm Nexus - Avis de fermeture temporaire","temporaryClosureNoticeBody":"Chers clients,\n\nVeuillez noter que Rhythm Nexus sera temporairement ferme du 21 mars 2026 au 26 mars 2026 en raison d'un evenement d'entreprise.\n\nPour preparer cette fermeture, la boutique passera en mode vacances a partir du 20 mars 2026 a 3h00 (UTC +8). Les commandes passees apres cet horaire pourront ne pas etre traitees avant la reprise de nos activites.\n\nLes activites normales reprendront le 27 mars 2026.\n\nNous nous excusons pour la gene occasionnee et vous remercions de votre comprehension et de votre soutien continu.\n\nMerci.\n\nRhythm Nexus","temporaryClosureNoticeClose":"J'ai compris","parcelTracking":"Suivi des colis","serviceAnnouncement":"Annonce de service","usaWinterStormTitle":"URGENT: Tempête hivernale sévère - Interruption de service","usaWinterStormSubtitle":"Événement de force majeure de l'USPS","usaWinterStormNotice1":"En raison de la grave tempête hivernale affectant la région de New York depuis le 23 février 2026:","usaWinterStormNotice2":"Les opérations internationales à l'aéroport international John F. Kennedy ont été effectivement arrêtées","usaWinterStormNotice3":"Annulations massives de vols et perturbations importantes des services aéroportuaires signalées","usaWinterStormNotice4":"Ces conditions constituent un événement de force majeure échappant au contrôle de l'USPS","usaWinterStormNotice5":"Impact du service:","usaWinterStormNotice6":"Mélange dangereux de fortes neiges, verglas, grésil et froid intense","usaWinterStormNotice7":"Perturbations majeures et pannes généralisées d'électricité signalées","usaWinterStormNotice8":"Impact sur la collecte et la livraison du courrier intérieur et international (lettres, colis et articles EMS)","usaWinterStormNotice9":"Secteurs d'adressage affectés:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"L'USPS prend toutes les mesures nécessaires pour minimiser les désagréments aux clients tout en assurant la sécurité des employés. Nous apprécions votre patience et votre compréhension pendant cet événement de force majeure.","usaWinterStormNotice12":"Dernière mise à jour : 25 février 2026","countryAutoDetected":"Destination prédéfinie selon votre localisation","countryAutoDetectedFromLink":"Destination prédéfinie depuis le lien","trackingNumber":"Numéro de suivi","destinationCountry":"Pays de destination","postcode":"Code postal","australianDSTTitle":"Heure d'été australienne active","australianDSTBothMessage":"L'AEDT (Australian Eastern Daylight Time) et l'ACDT (Australian Central Daylight Time) sont actuellement en vigueur.","australianAEDTMessage":"L'AEDT (Australian Eastern Daylight Time) est actuellement en vigueur pour Sydney, Melbourne et ses environs.","australianACDTMessage":"L'ACDT (Australian Central Daylight Time) est actuellement en vigueur pour Adélaïde et l'Australie du Sud.","australianDSTNote":"Les délais de livraison affichés ci-dessus reflètent l'heure d'été actuelle.","filteredAllowedDestinations":"(Filtré pour vos destinations autorisées)","loadingAnnouncements":"Chargement des annonces...","unableToLoadAnnouncements":"Impossible de charger les annonces de service pour le moment.","postalContactsTitle":"Contacts des services postaux","postalContactsNote":"Remarque :","postalContactsPolandUKNote":"Pour la Pologne et le Royaume-Uni, tous les articles envoyés via SpeedPost Priority (EMS) seront traités par Pocztex et Parcelforce.","postalContactsDHLNote":"Pour les envois SpeedPost Express, veuillez contacter DHL via ce lien :","postalContactsCountry":"Pays","postalContactsWebsite":"Site web","postalContactsForm":"Formulaire de contact","postalContactsPhone":"Numéro de téléphone","postalContactsEmail":"E-mail de contact","postalContactsFormLink":"Formulaire de contact","postalContactsBackButton":"Retour au formulaire d'enquête sur le colis","viewOnSingPostWebsite":"Voir sur le site SingPost →","contactUsTitle":"Nous contacter","contactNameLabel":"Nom (PAS DE SURNOMS NI DE NUMÉRO DE TÉLÉPHONE)","contactEmailLabel":"Adresse e-mail (où nous vous répondrons)","contactEmailNote":"Les e-mails relais privés (par exemple @privaterelay.appleid.com) ne sont pas acceptés. Veuillez utiliser une adresse e-mail valide.","contactEnquiryTypeLabel":"S'agit-il d'une ?","contactSelectOption":"Sélectionnez une option","contactGeneralEnquiry":"Demande générale / Commentaires","contactBusinessEnquiry":"Demande commerciale","contactOrderShippingEnquiry":"Demande de commande/expédition","contactExchangeRefundEnquiry":"Demande d'échange/remboursement/retour","contactOthers":"Autres","contactParcelWarning":"Si votre colis n'est pas livré depuis plus de 18/30/45 jours (14 jours pour FedEx), ou si le statut indique livré mais que vous ne l'avez pas reçu, veuillez remplir","contactParcelWarningLink":"CE FORMULAIRE","contactParcelWarningEnd":"à la place.","contactOrderNumberLabel":"Numéro de commande","contactOrderNumberPlaceholder":"Exemple: RTNX1234567890","contactPlatformNote":"Numéro de commande Etsy, eBay et Shopee ici. Nous n'avons AUCUN contrôle sur les remboursements de ces plateformes. Veuillez contacter leur service client respectif.","contactPlatformInstructions":"Veuillez utiliser l'application pour consulter votre numéro de commande, car il est enregistré dans l'application:","contactPlatformEtsy":"Etsy - En haut à droite sur votre profil → Achats","contactPlatformEbay":"eBay - Mon eBay → Achats","contactPlatformShopee":"Shopee - Moi → Voir l'historique des achats (ou cliquez sur À expédier/À recevoir)","contactRefundNote1":"Si vous demandez un retour/remboursement pour les plateformes sur lesquelles vous avez effectué vos achats, veuillez noter que nous n'avons AUCUN contrôle sur les remboursements de ces plateformes. Veuillez contacter leur service client respectif.","contactRefundNote2":"Pour les retours ou échanges, nous n'autorisons pas les gants maimai s'ils ont déjà été utilisés lors de l'ouverture (taches visibles ou lavés en machine/lavage manuel), et aucun retour ou échange n'est autorisé pour les cartes d'amusement. Merci.","contactRefundNote3":"Veuillez noter que pour les remboursements via Payhip, contactez votre banque ou le support Payhip à support@payhip.com si vous n'avez pas reçu le remboursement car nous n'avons aucun contrôle sur le processus.","contactMessageLabel":"Votre message (jusqu'à 1000 caractères)","contactCharacterCount":"caractères","contactSpamWarningNote":"Remarque:","contactSpamWarning":"Les offres non sollicitées pour le référencement, la conception de sites Web, les prêts ou des services similaires seront automatiquement rejetées.","contactAgreementText1":"Veuillez cliquer sur \"J'accepte\" si vous acceptez que votre adresse e-mail soit utilisée par Rhythm Nexus pour vous répondre, car cela est nécessaire pour que nous puissions lire votre réponse et vous répondre une fois que nous aurons trouvé une solution à votre demande.","contactAgreementText2":"Veuillez noter que notre réponse prendra entre 3 et 5 jours ouvrables, ou plus en cas de volume élevé d'e-mails de notre côté.","contactAgreeCheckbox":"J'accepte","contactSuccessMessage":"Votre message a été envoyé avec succès! Nous vous répondrons dans les 3-5 jours ouvrables.","contactErrorMessage":"Échec de l'envoi du message. Veuillez réessayer.","contactGeneralError":"Une erreur s'est produite. Veuillez réessayer plus tard.","contactSubmitting":"Envoi en cours...","contactSubmit":"Soumettre","contactAlertAgree":"Veuillez accepter les conditions pour soumettre le formulaire.","parcelEnquiryTitle":"Demande de renseignements sur le colis","parcelInfoText":"Ce formulaire est destiné aux colis non livrés depuis plus de 18/30/45 jours (14 jours pour FedEx/DHL), ou dont le statut indique livré mais que vous n'avez pas reçus.","parcelInfoLink":"Cliquez ici","parcelInfoEnd":"pour d'autres demandes.","parcelWaitTitle":"Veuillez attendre votre colis","parcelWaitText1":"Veuillez attendre la livraison de votre colis. Notez que les livraisons internationales ne sont PAS les mêmes que les livraisons locales car elles prennent du temps. Merci!","parcelWaitText2":"Si aucun statut n'apparaît après 18 jours (7 jours pour Singapour) ou plus, vous pouvez nous le faire savoir directement.","parcelCannotSubmit":"Vous ne pouvez pas soumettre ce formulaire si vous avez sélectionné \"Non\".","parcelNameLabel":"Nom","parcelOrderNumberLabel":"Numéro de commande (Exemple: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Adresse e-mail (Nous vous répondrons par ici)","parcelEmailNote":"Les e-mails relais privés ne sont pas acceptés. Veuillez utiliser une adresse e-mail valide.","parcelShippingMethodLabel":"Méthode d'expédition choisie?","parcelSelectShipping":"Sélectionnez une méthode d'expédition","parcelSingPostEpac":"SingPost ePacket (ou ePAC) - alias SpeedPost Saver International (Suivi: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Suivi: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Suivi: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Suivi: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Suivi: PX123456789SG)","parcelDHL":"DHL Express (Pays de l'UE uniquement) (Suivi: 1234567890)","parcelTrackingNumberLabel":"Numéro de suivi de votre colis?","parcelUndeliveredLabel":"Votre colis n'a-t-il pas été livré depuis plus de 18/30/45 jours? (Services locaux de Singapour >7 jours, >14 jours pour SpeedPost Express/DHL)","parcelSelectOption":"Sélectionnez une option","parcelYes":"Oui","parcelNo":"Non","parcelDeliveredButMissingLabel":"Votre colis a-t-il affiché le statut livré, mais il n'est pas présent dans votre boîte aux lettres/lieu sûr/devant la porte?","parcelCaseReferenceLabel":"ID de référence du cas du bureau de poste local","parcelCaseReferencePlaceholder":"Mettez NA si vous êtes de Singapour","parcelCaseReferenceNote":"Avant de soumettre ce formulaire, veuillez contacter votre bureau de poste local par téléphone ou par e-mail et obtenir un ID de référence de cas de leur part. Ensuite, mettez votre ID de référence de cas ici.","parcelCaseReferenceLink":"Consultez ce lien pour les contacts du service postal","parcelCaseReferenceMandatory":"METTEZ NA UNIQUEMENT SI VOUS ÊTES DE SINGAPOUR. Pour les autres pays, c'est OBLIGATOIRE de fournir. Requis pour SpeedPost Express également, pour l'ID de cas DHL.","parcelImageEvidenceLabel":"Preuve d'image (pour les colis livrés mais manquants)","parcelImageWarning":"Pour une vérification supplémentaire, nous avons besoin de preuves d'image pour prouver que vous ne faites pas de fausses déclarations concernant la non-livraison des colis. (Uniquement pour les colis qui ont déjà été livrés, mais qui ne sont pas présents dans la boîte aux lettres/devant la porte. Nous pouvons rejeter votre réclamation si aucune preuve photo n'est fournie pour les articles livrés. Ignorez ceci si votre article n'a PAS affiché le statut livré.)","parcelImageNote":"Téléchargez 1 fichier pris en charge: image. Max 1 Go.","parcelAgreementText":"Veuillez cliquer sur \"J'accepte\" si vous vous assurez que ce qui est arrivé à votre colis était vrai.","parcelAgreeCheckbox":"J'accepte","parcelSuccessMessage":"Votre demande de renseignements sur le colis a été soumise avec succès! Nous vous répondrons dans les 3-5 jours ouvrables.","parcelErrorMessage":"Échec de la soumission de la demande. Veuillez réessayer.","parcelGeneralError":"Une erreur s'est produite. Veuillez réessayer plus tard.","parcelAlertWait":"Veuillez attendre la livraison de votre colis. Vous pouvez soumettre ce formulaire après la période d'attente spécifiée.","parcelAlertAgree":"Veuillez accepter les conditions pour soumettre le formulaire.","parcelAlertCaseReference":"Veuillez fournir un ID de référence de cas de votre bureau de poste local, ou mettez NA si vous êtes de Singapour.","parcelSubmitting":"Envoi en cours...","parcelSubmit":"Soumettre","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adélaïde)","tzAWST":"AWST (Perth)","tzNST":"NST (Terre-Neuve)","tzAST":"AST (Atlantique)","tzEST":"EST (Est)","tzCST":"CST (Centre)","tzMST":"MST (Montagnes)","tzPST":"PST (Pacifique)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaï)","tzBeijing":"Pékin","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast de Kaliningrad (UTC+2)","tzMoscow":"Moscou/Russie occidentale (UTC+3)","tzSamara":"Oblast de Samara (UTC+4)","tzUral":"Région de l'Oural (UTC+5)","tzOmsk":"Oblast d'Omsk (UTC+6)","tzKrasnoyarsk":"Kraï de Krasnoïarsk (UTC+7)","tzIrkutsk":"Oblast d'Irkoutsk (UTC+8)","tzSakha":"Sakha République (UTC+9)","tzPrimorsky":"Kraï du Primorié (UTC+10)","tzMagadan":"Oblast de Magadan (UTC+11)","tzKamchatka":"Kraï du Kamtchatka (UTC+12)","dstDayStartsLabel":"L'heure d'été commence","dstDayEndsLabel":"L'heure d'été se termine","dstRevertsLabel":"retour à l'heure standard","dstEuropeLabel":"Europe","dstNewZealandLabel":"Nouvelle-Zélande","lookalikeDomainWarning":"Ceci est un lien vers un site qui imite un transporteur de colis, pas un numéro de suivi. N’y saisissez aucune donnée personnelle ou bancaire.","lookalikeDomainOfficial":"Site officiel :"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Usaideann Rhythm Nexus lionrai trachtala preimhe. Mar sin fein, direach nuair a shroicheann se do thir, aistritear an choimead chuig an iomproir baile aituil (m.sh., USPS, Royal Mail, DHL go haituil). Athraionn reimireanna rianaithe corais laimhseala ag an tairseach seo, ach nascann ar rianaire beartan uilioch na stadais seo le cheile chun infheictheacht leanunach a thabhairt duit.","trackingLastMileTitle":"Lionra Seachadta an Mhile Dheireanaigh","trackingCustomsClearanceBody":"Caithfidh gach earra trasteorann dul tri ghniomhaireacht custaim do thire aituili. Deanann ar n-uirlis monatoireacht ar aistrithe o theacht chuig an ais allmhairithe go dti laimhseu custaim. Fioroidh na hudarais teorann coid HS agus cinnteoidh siad go bhfuil CBL no dleachtanna cui ioctha (m.sh., IOSS san AE, VOEC san Iorua). Dean monatoireacht ar an rianu go sonrach le haghaidh rabhaidh \"Held at Customs\".","trackingCustomsClearanceTitle":"Eolas faoi Imreiteach Custaim","trackingProcessingOriginBody":"Nuair a fhagtar isteach e, teann an mhir isteach san ionad proiseala tionscnaimh ait a ndeantar i a scanadh, a mhea, agus a chur faoi phriomhscagthastalacha slandala easportala. Seoltar ansin i chuig an malartan poist idirnaisiunta. Braitheann sceidil eitilte ar an acmhainn lasta ata ar fail. Na bi buartha ma fhanann se sa staid seo ar feadh roinnt laethanta.","trackingProcessingOriginTitle":"Proiseail ag an Mol Tionscnaimh","trackingInfoReceivedBody":"Nuair a phroiseailtear ordu den chead uair ar ar n-ardain riomhthrachtala (amhail Etsy, eBay, no diolachain dhireacha), gintear an uimhir rianaithe go leictreonach. Faigheann an t-iomproir sonrai an tseolta sula mbionn an bosca ina sheilbh fhisiciuil aige. Ceadaigh 1 go 3 la gno chun an beartan a chur isteach san ais shortala fhisiciuil.","trackingInfoReceivedTitle":"Eolas Faighte","trackingStatusesIntro":"Go raibh maith agat as ar n-uirlis aontaithe rianaithe beartan idirnaisiunta a usaid. Toisc go dtrasnaionn do phacaiste ilteorainneacha domhanda, d'fheadfadh a stadais rianaithe a bheith casta. Cabhraionn tuiscint ar shaolre na loistiochta le hionchais shoileire a leagan sios.","trackingStatusesTitle":"Stadais Rianaithe a Thuiscint","footerDesc":"Do cheann scribe den scoth do chartai siamsa stuara, lamhainni cluiche rithime, agus marsantas speisialaithe. Bain taitneamh as riomhthrachtail dhomhanda le rianu beartan idirnaisiunta gan uaim agus sonrai loingseoireachta iontaofa.","amText":"r.n.","pmText":"i.n.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Talamh an Éisc)","tzAST":"AST (An tAtlantach)","tzEST":"EST (An tOirthear)","tzCST":"CST (Lárnach)","tzMST":"MST (Sléibhtiúil)","tzPST":"PST (An tAigéan Ciúin)","tzAKST":"AKST (Alasca)","tzHST":"HST (Haváí)","tzBeijing":"Béising","tzXinjiang":"Xinjiang","tzWIB":"WIB (Iacárta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Cúige Kaliningrad (UTC+2)","tzMoscow":"Moscó/Iarthar na Rúise (UTC+3)","tzSamara":"Cúige Samara (UTC+4)","tzUral":"Réigiún na hÚraile (UTC+5)","tzOmsk":"Cúige Omsk (UTC+6)","tzKrasnoyarsk":"Críoch Krasnoyarsk (UTC+7)","tzIrkutsk":"Cúige Irkutsk (UTC+8)","tzSakha":"Sakha Poblacht (UTC+9)","tzPrimorsky":"Críoch Primorsky (UTC+10)","tzMagadan":"Cúige Magadan (UTC+11)","tzKamchatka":"Críoch Kamchatka (UTC+12)","dstDayStartsLabel":"Tosaíonn am samhraidh","dstDayEndsLabel":"Críochnaíonn am samhraidh","dstRevertsLabel":"fill ar an am caighdeánach","dstEuropeLabel":"an Eoraip","dstNewZealandLabel":"an Nua-Shéalainn","englishResponseNotice":"Fógra: Freagraítear gach fiosrúchán i mBéarla. Má chuireann tú isteach i dteanga eile, féadfar do theachtaireacht a aistriú go Béarla lena fhíorú.","contactNamePlaceholder":"Mar shampla: Seán Ó Briain","systemRequirementsTitle":"Leaganacha Ísealú Córais a Thacaithe","systemRequirements":"Windows: Windows 7 (with ESU updates installed) nó níos airde\nmacOS: macOS 12 nó níos airde\nAndroid: Android 13 nó níos airde\niPhone/iOS: iOS 17 nó níos airde\nLinux: Dáileadh tacaithe reatha le nuashonrú slándala ghníomhacha","goodFridayEasterGreeting":"Cáisc Shona! Síocháin agus áthas ar Aoine an Chéasta agus Cáisc.","christmasGreeting":"Nollaig Shona agus Athbhliain faoi mhaise duit! Síocháin agus áthas ó 25 Nollaig go 5 Eanáir.","captchaSystemRequirements":"Íosriachtanais chórais: Windows 7 (with ESU updates installed) nó 11, macOS 10.15+, nó an leagan is déanaí Android/iOS.","title":"Fíordheimhniú Rochtana","subtitle":"Comhlánaigh an dúshlán thíos le lean ort le do thoil.","selectLanguage":"Roghnaigh Teanga","selectLanguagePlaceholder":"-- Roghnaigh teanga --","loadingChallenge":"Ag luchtú dúshlán...","answerLabel":"Do fhreagra:","answerPlaceholder":"Iontráil do fhreagra","continueButton":"Ar Aghaidh","refreshButton":"Dúshlán Nua","verifying":"Ag fíordheimhniú...","chooseLanguageFirst":"Roghnaigh teanga ar dtús le do thoil.","loadFailed":"Theip ar luchtú an dúshláin. Bain triail eile as le do thoil.","expiredChallenge":"Dúshlán imithe in éag. Ag luchtú dúshlán nua...","verifyFailed":"Theip ar fhíordheimhniú. Bain triail eile as le do thoil.","home":"Baile","blog":"Blag","aboutUs":"Fúinn","faq":"Ceisteanna Coitianta","contact":"Teagmháil","trackPackage":"Rianú Pacáiste","cnyYearOfHorseMessage":"🧧 Athbhliain na Síne faoi mhaise duit! Guímid rath ort i mBliain an Chapaill 🐴","singaporeNationalDayMessage":"🇸🇬 Lá Náisiúnta faoi mhaise duit, Singeapór! Ag ceiliúradh 61 bliain de neamhspleáchas! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indinéis! Dirgahayu Poblacht na hIndinéise! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, an Mhalaeisia! Ag ceiliúradh neamhspleáchas ár náisiúin! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Fogra dúnadh sealadach","temporaryClosureNoticeBody":"A chustaiméirí luachmhara,\n\nTabhair faoi deara go mbeidh Rhythm Nexus dúnta go sealadach ón 21 Márta 2026 go dtí an 26 Márta 2026 mar gheall ar imeacht cuideachta.\n\nMar ullmhúchán don dúnadh, cuirfear an siopa i mód saoire ag tosú ar an 20 Márta 2026 ag 3:00 PM (UTC +8). D'fhéadfadh sé nach bpróiseálfar orduithe a chuirtear isteach tar éis an ama seo go dtí go n-athosóimid oibríochtaí.\n\nAthosóidh gnáthoibríochtaí gnó ar an 27 Márta 2026.\n\nGabhaimid leithscéal as aon mhíchaoithiúlacht agus gabhaimid buíochas leat as do thuiscint agus as do thacaíocht leanúnach.\n\nGo raibh maith agat.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Tuigim","parcelTracking":"Rianú Pacáiste","serviceAnnouncement":"Fógra Seirbhíse","usaWinterStormTitle":"PRÁINN: Stoirm Ghéimhridh Dhochtuaithe - Cur isteach ar Sheirbhís","usaWinterStormSubtitle":"Seirbhís Poist na Stáit Aontaithe (USPS) Imeachta Fórsa Níos Mó","usaWinterStormNotice1":"Mar gheall ar an stoirm ghéimhridh dhochtuaithe atá i bhfeidhm ar réigiún New York ó 23 Feabhra 2026:","usaWinterStormNotice2":"Cuireadh deireadh go héifeachtach ar oibríochtaí idirnáisiúnta ar Aerfort Idirnáisiúnta John F. Kennedy","usaWinterStormNotice3":"Tuairiscítear scor fairsinge ar eitiltí agus cur isteach suntasach ar sheirbhísí aerfoirt","usaWinterStormNotice4":"Freagraíonn na coinníollacha seo d'imeacht fórsa níos mó lasmuigh de dhreach USPS","usaWinterStormNotice5":"Galar ar an Seirbhís:","usaWinterStormNotice6":"Meascán contúirteach de gheal dhrom, fras fhuarchúiseach, sleet agus fuar fheargach","usaWinterStormNotice7":"Tuairiscítear drochúintí mór agus meirgeach cumhachta fairsinge","usaWinterStormNotice8":"Bailiú agus seachadadh ar dhríochodar dhomhanda agus idirnáisiúnta (litir-poist, párcal-poist agus míreanna EMS) a bheith i ndeacair","usaWinterStormNotice9":"Limistéir Chóid Phoist Agata:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"Tá USPS ag gabhála do na céimeanna ar fad is gá chun míchompord do chustaiméirí a ísliú agus dáingneacht na bhfostaithe a choinneáil. Bhuíochas do do fhoighne agus do thuiscint le linn an imeachta seo i bhfórsa níos mó.","usaWinterStormNotice12":"Nuashonrú deireanach: 25 Feabhra 2026","countryAutoDetected":"Ceann scríbe réamhshocraithe bunaithe ar do shuíomh","countryAutoDetectedFromLink":"Ceann scríbe réamhshocraithe ón nasc","trackingNumber":"Uimhir Rianaithe","destinationCountry":"Tír Ceann Scríbe","postcode":"Cód Poist","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Lá Rúise faoi mhaise duit! 🎉","taiwanFoundingDayMessage":"🇹🇼 Lá Bunaithe faoi mhaise duit, an Téaváin! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Lá Dúbailte Deich faoi mhaise duit, an Téaváin! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Lá Bunaithe SAR Hong Cong faoi mhaise duit! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Lá Bunaithe SAR Macao faoi mhaise duit! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Lá Oibrithe Idirnáisiunta faoi mhaise duit! Ag ceiliúradh saotha ir agus cearta oibrithe! 🎊","laborDayUSCAMessage":"⚒️ Lá Saothair faoi mhaise duit! Ag tabhairt onóra do ranníocaíochtaí oibrithe! 🎉","orderNumber":"Uimhir Ordú (Sampla: RTNX1234567890)","fromDate":"Ó Dháta (RIACHTANACH)","toDate":"Go Dáta (RIACHTANACH)","trackParcel":"Rianú Pacáiste","selectCourier":"-- Roghnaigh Teachtaire / Tír --","singaporeCouriers":"Teachtairí Singeapór","topCountries":"5 Thír is Fearr","otherCountries":"Tíortha Eile","optionSingPost":"🇸🇬 Singapore Post (SingPost)","countryAU":"🇦🇺 An Astráil","countryCA":"🇨🇦 Ceanada","countryDE":"🇩🇪 An Ghearmáin","countryGB":"🇬🇧 An Ríocht Aontaithe","countryUS":"🇺🇸 Stáit Aontaithe","countryAT":"🇦🇹 An Ostair","countryBE":"🇧🇪 An Bheilg","countryBN":"🇧🇳 Brúiné","countryCN":"🇨🇳 An tSín","countryCZ":"🇨🇿 An tSeicia","countryFI":"🇫🇮 An Fhionlainn","countryFR":"🇫🇷 An Fhrainc","countryHK":"🇭🇰 Hong Cong SAR An tSín","countryIN":"🇮🇳 An India","countryID":"🇮🇩 An Indinéis","countryIE":"🇮🇪 Éire","countryIL":"🇮🇱 Iosrael","countryIT":"🇮🇹 An Iodáil","countryJP":"🇯🇵 An tSeapáin","countryMO":"🇲🇴 Macao SAR An tSín","countryMY":"🇲🇾 An Mhalaeisia","countryNL":"🇳🇱 An Ísiltír","countryNZ":"🇳🇿 An Nua-Shéalainn","countryNO":"🇳🇴 An Iorua","countryPH":"🇵🇭 Na hOileáin Fhilipíneacha","countryPL":"🇵🇱 An Pholainn","countryPT":"🇵🇹 An Phortaingéil","countryKR":"🇰🇷 An Chóiré Theas","countryES":"🇪🇸 An Spáinn","countrySE":"🇸🇪 An tSualainn","countryCH":"🇨🇭 An Eilvéis","countryTW":"🇹🇼 Téaváin","countryTH":"🇹🇭 An Téalainn","countryVN":"🇻🇳 Vítneam","countrySG":"🇸🇬 Singeapór","note":"NÓTA","disclaimer":"SÉANADH","importantInformation":"Faisnéis Thábhachtach:","didNotReceiveEmail":"Mura bhfuair tú do ríomhphost dearbhaithe ó Etsy, eBay, Shopee nó Payhip, scrollaigh síos chun do ordú a chuardach trí do sheoladh ríomhphoist nó d'uimhir ghutháin a bhaineann leis an ordú seo.","searchByEmailOrPhone":"Cuardaigh de réir Ríomhphoist nó Gutháin","searchOrder":"Cuardaigh Ordú","trackingResult":"Toradh Rianaithe","noOrdersFound":"Níor aimsíodh orduithe.","pleaseEnter":"Cuir isteach ríomhphost, guthán nó uimhir ordaithe.","welcomeTitle":"Fáilte go suíomh Gréasáin Rhythm Nexus!","purchaseInfo":"Ceannaigh uainn trínár mbealaí oifigiúla, nó bí páirteach inár","purchaseInfoChina":"Ceannaigh uainn trínár mbealaí oifigiúla.","purchaseInfoChinaSuffix":"","telegramGroup":"ngrúpa Telegram","forUpdates":"le haghaidh nuashonruithe oifigiúla.","ourStores":"Ár Siopaí","etsyStore":"Siopa Etsy","ebayStore":"Siopa eBay","shopeeStore":"Siopa Shopee","payhipStore":"Siopa Payhip","internationalShipping":"Loingseoireacht Idirnáisiúnta","singaporeLocal":"Áitiúil Singeapór","asiaOnly":"An Áise Amháin","deliveryInfo":"Eolas Seachadta","deliveryRates2026":"Rátaí Seachadta 2026","sgDeliveryRates":"Rátaí Seachadta Singeapór","speedPostRates":"Rátaí SpeedPost Express Idirnáisiúnta","aboutTitle":"Faoi Rhythm Nexus","aboutP1":"Thosaigh muid ár siopa in 2022 agus táimid ag díol ar ardáin mar Etsy, eBay, agus Shopee gan teip.","aboutP2":"Le himeacht aimsire, táimid tar éis cáil láidir a thógáil trí dhíriú ar chomhlíonadh iontaofa agus rianú beacht.","aboutP3":"Is é ár gcuspóir taithí siopadóireachta rianúil agus iontaofa a sholáthar do chustaiméirí.","aboutP4":"Go raibh maith agat as tacú le Rhythm Nexus.","faqTitle":"Ceisteanna Coitianta","faqQ1":"Cad a tharlaíonn má tá mo mhír lochtach? An bhfuil aon bharántas ann?","faqA1":"Tá! Tagann barántas 1 bliana le formhór na n-orduithe. Tabhair d'uimhir sonraisc/ordaithe le do thoil ionas gur féidir linn imscrúdú a dhéanamh. Nóta: Ní cheadaítear malartuithe má mheaitseálann an mhír leis an tuairisc fiú má d'ordaigh tú go mícheart.","faqQ2":"An féidir liom m'ordú a chur in eagar, a nuashonrú nó a chealú?","faqA2":"Tá. Ar mhaithe le slándáil, d'fhéadfadh go mbeadh gá le hathruithe ordaithe a láimhseáil via ríomhphost nó ár bhfoirm teagmhála.","faqQ3":"An gcaithfidh mé Cánacha Custaim/Iompórtála a íoc?","faqA3":"Go ginearálta ní dhéantar custaim agus dleachtanna a réamhíoc, ach amháin i gcás DDP go SAM. D'fhéadfadh CBL a bheith i bhfeidhm maidir leis an AE, an Ríocht Aontaithe, AU/NZ, an Iorua, an Eilvéis, agus cúigí Cheanada ar nós Saskatchewan agus Manitoba atá íoctha cheana féin de réir réamhshocraithe. Níl aon GST i bhfeidhm maidir le Singeapór. Ní féidir linn comhairle a thabhairt maidir le táillí custaim — déan teagmháil le do chustaim áitiúla le haghaidh sonraí.","faqQ4":"Cathain a sheoltar m'ordú?","faqA4":"Seoltar orduithe go ginearálta laistigh de 1-5 lá oibre. Le linn tréimhsí ardtoirte, d'fhéadfadh sé 5–7 lá a thógáil.","faqQ5":"D'ordaigh mé faoi dhó trí thimpiste. Cad ba cheart dom a dhéanamh?","faqA5":"Ní aisíocaimid ach táillí seolta dúblacha. Seolfar an dá mhír le chéile. Aisíocaíocht = (1ú táille loingseoireachta + 2ú táille loingseoireachta) – táille loingseoireachta iarbhír.","faqQ6":"Cé chomh fada a thógann an seachadadh?","faqA6":"Tógann próiseáil 1-5 lá oibre.\n\nLoingseoireacht Intíre:\n• Lipéad Rianaithe SingPost Réamhíoctha: 2-4 lá\n• SpeedPost Standard: 1-3 lá\n\nIdirnáisiúnta:\n• SingPost ePAC: 14-30 lá\n• SpeedPost Priority (EMS): 8-15 lá\n• SpeedPost Express: 4-8 lá\n\nD'fhéadfadh moilleanna tarlú le linn buaicshéasúir.","faqQ7":"Tá mo mhír á cur ar ais chuig an seoltóir. Cad ba cheart dom a dhéanamh?","faqA7":"Ceadaítear athsheoladh amháin. Ní féidir cealú le haghaidh seoltaí neamhbhailí, beartáin neamhsheilimhithe, nó táillí custaim neamhíoctha. Déan teagmháil le do sheirbhís phoist le haghaidh athsheachadadh, nó seol teachtaireacht chugainn le haghaidh cúnaimh.","faqQ8":"Tá mo mhír caillte / goidte faoi bhealach.","faqA8":"Ceadaímid athsheoladh amháin. Má chailltear arís é, eisítear aisíocaíocht iomlán tar éis fhuinneog seachadta an chúiréara:\n\n• Seirbhísí Áitiúla Shingeapór: 7 lá\n• SingPost ePAC & SpeedPost Priority International: 30 lá\n• SpeedPost Intl Express: 14 lá","blogTitle":"Bonn Eolais Loingseoireachta & Poist","blogSubtitle":"Mínithe oifigiúla ar sheirbhísí poist, custaim, CBL agus dleachtanna.","readMore":"Léigh Tuilleadh","backButton":"Ar Ais","copyrightText":"Gach ceart ar cosaint.","blogPost1Title":"Cad é SingPost ePAC?","blogPost1Desc":"Foghlaim faoi SingPost ePAC (ePacket), seirbhís poist rianaithe eacnamaíoch.","blogPost2Title":"Cad é SpeedPost Priority International (EMS)?","blogPost2Desc":"Faigh amach faoi EMS, an tseirbhís poist préimhe idirnáisiúnta.","blogPost3Title":"Cad é SpeedPost Express?","blogPost3Desc":"Iniúchadh SpeedPost Express le seachadadh DHL Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Tuig PDDP do SAM.","blogPost5Title":"CBL AE & IOSS","blogPost5Desc":"Léargais ar CBL AE agus córas IOSS.","blogPost6Title":"CBL RA & HMRC","blogPost6Desc":"Riachtanais CBL don RA.","blogPost7Title":"An Iorua VOEC","blogPost7Desc":"Córas VOEC na hIorua.","blogPost8Title":"CBL na hEilvéise","blogPost8Desc":"Riachtanais CBL na hEilvéise.","enterDestinationPostcode":"Iontráil cód poist ceann scríbe","trackingCaseSensitive":"TÁ LITREACHARIANaithe ÍOGAIR DO CHÁS AGUS CAITHFIDH SIAD A BHEITH I NÓRA MÓR.","usaPostcodeNote":"I gcás tíortha nach bhfuil aon chóid phoist acu, m.sh. Hong Cong agus Macao, cuir 999077 (Hong Cong) nó 999078 (Macao).","epacDeliveryNote":"Tabhair faoi deara le do thoil go gcaithfear gach mír ePAC a sheoltar chuig an gceann scríbe a sheachadadh chuig do Bhosca Poist, Doras, Taisceadán Dáileachta nó a fhágáil in áit shábháilte!","currentTime":"Am Reatha","timezoneNote":"Am taispeánta i bhformáid 12 uair","sameTimeAsSingapore":"An t-am céanna le Singeapór","hourAhead":"uair an chloig chun tosaigh ar Shingeapór","hoursAhead":"uaireanta chun tosaigh ar Shingeapór","hourBehind":"uair an chloig taobh thiar de Shingeapór","hoursBehind":"uaireanta taobh thiar de Shingeapór","collectAtPostOffice":"Mar sin féin, mura bhfuil Bosca Poist agat mar chaighdeán ar fáil i do thír féin, beidh ort é a bhailiú san Oifig Phoist.","countriesNoMailbox":"Tíortha arb eol nach bhfuil seachadadh Bosca Poist/Bosca Litreach ar fáil acu: Brúiné, an tSín, an India, Iosrael, Macao SAR An tSín, na hOileáin Fhilipíneacha, an Pholainn agus Vítneam.","rhythmNexusNotResponsible":"Níl Rhythm Nexus FREAGRACH as na seachadtaí a láimhseáil toisc go bhfuil sé as ár smacht agus b'fhearr linn go cineálta go ndéanfá stádas do mhíre a rianú.","issuesAfterDelivery":"Aon cheisteanna le do sheachadadh tar éis 30/45 lá (14 lá le haghaidh SpeedPost Express) nó má thaispeánann an stádas seachadta ach nár ghlac tú leis, déan teagmháil linn le do thoil","cannotUseEmbed":"Ní féidir linn leabú a úsáid le haghaidh rianaithe mar ní thacaíonn formhór láithreáin ghréasáin na seirbhísí poist leis.","clickLinkAbove":"Cliceáil an nasc thuas le do thoil chun do bheartán a rianú.","trackingDetailsNote":"Tabhair faoi deara go mb'fhéidir nach mbeidh sonraí rianaithe le feiceáil sna torthaí cuardaigh mar sin moltar an uimhir rianaithe a ghreamú isteach sa chóras chun an mhír a rianú.","thirdPartyWebsites":"Is féidir leat do bheartáin a rianú ar na láithreáin ghréasáin 3ú páirtí seo freisin:","enterEmailOrPhone":"Iontráil ríomhphost nó fón","reviewShippingRates":"Athbhreithnigh ár Rátaí Loingseoireachta reatha","here":"anseo","contactUsForm":"Déan teagmháil linn trí","form":"foirm","forEnquiries":"le haghaidh aon Fhiosrúcháin atá agat maidir le d'ordú.","anPostNoDirectTracking":"Ní thacaíonn An Post (Éire) le naisc rianaithe dhíreacha ná le rianú leabaithe.","anPostPasteManually":"Le do thoil cóipeáil agus greamaigh do uimhir rianaithe go láimhe ar shuíomh Gréasáin An Post:","goToAnPost":"Téigh go An Post","countryMsgNL":"Má thaispeánann an stádas 'Held by Customs', déan teagmháil le Líne Faisnéise Custaim na hÍsiltíre le haghaidh cúnaimh:\n0800 0143 (saor in aisce), Luan-Aoine 7am-11pm.\nDé Sathairn & Dé Domhnaigh 8am-4:30pm.\n\nMoltar cuntas a chlárú le PostNL chun fógraí brú láithreach a fháil do do bheartáin:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nMá dhéantar é a sheachadadh chuig Pointe PostNL nó má dheir an stádas leat é a bhailiú ag an oifig phoist, beidh ort 7 EUR a íoc ag an gcuntar. 4 EUR ar a mhéad má íoctar ar líne.","countryMsgDE":"Molaimid duit an aip Post & DHL a íoslódáil chun fógraí brú a fháil le haghaidh stádas rianaithe do bheartán:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nTeagmháil le Seirbhís Custaiméara DHL Paket GmbH:\n+49-228-433-3112\nTeagmháil DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Beidh ort dearbhú allmhairithe breise a chur isteach leis na custaim. Mura ndéanann tú é sin, d'fhéadfadh sé srianta iontrála agus filleadh an bheart a bheith mar thoradh air. \nTuilleadh faisnéise: https://www.posti.fi/en/receiving/customs-clearance \nNaisc eile: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Gearrtar táille próiseála 4.95 EUR.\nÍoslódáil an aip anseo: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Gearrtar táille próiseála 8.50 PLN. \nBeidh ort é seo a íoc agus é á bhailiú ag an oifig phoist,\ntoisc nach dócha go seachadadh an beartán chuig do dhoras nó bosca poist.","countryMsgPH":"Meastar PHLPost sa Fhilipín a bheith neamhéifeachtach agus neamh-iontaofa.\nDéan do bheartán a rianú i gcónaí mar go dtaispeántar an stádas 'ar an mbealach chun seachadta'\nuaireanta idir 1-3 seachtaine amháin do bheartáin níos lú. I gcás beartán níos mó,\ntá bailiú amháin indéanta ag an Manila Central Post Office nó\nag an oifig poist is gaire i do cheantar. Tabhair faoi deara go ngearrtar táille próiseála 112 PHP ar bheartáin\nd'aon luach a chaithfidh tú a íoc. Mar thoradh ar mhainneachtain íocaíochta, déanfar an beartán\na chur ar ais chugainn. Meastar go dtógfaidh an seachadadh 1-2 mhí mar gheall ar sheirbhísí malla PHLPost. \nNí chaithfidh tú cáin a íoc ar mhíreanna faoi bhun 10000 PHP, ach caithfidh tú é sin a dhéanamh má tá an luach cothrom le nó os cionn an méid sin. \nMholfaimis SpeedPost Express le haghaidh próisis níos tapa an chéad uair eile a ordaíonn tú uainn. Mar sin féin, d'fhéadfadh nach mbaineann na táillí leis toisc go bhfuil D&T don fhaighteoir réamhshocraithe.","countryMsgCA":"Is é 20 CAD an de minimis do gach ordú a sheoltar go Ceanada. Ós rud é go bhfuil Singeapór mar chuid den chomhaontú CPTPP, b'fhéidir nach mbaineann dleachtanna, ach d'fhéadfadh D&T a bheith infheidhme má sháraíonn an mír tairseach 60 CAD agus os a chionn nó 100 CAD agus os a chionn, a d'fhéadfadh a bheith ag brath ar chód HS an mhír. Gearrfar CBL ar aon luach os cionn an méid sin dá réir.","countryMsgID":"Beidh ort aon chánacha agus dleachtanna infheidhme a íoc ag teacht go dtí an Indinéis. Déan do bheartán a rianú agus íoc an méid sonraithe leis na custaim Indinéise.\nBeidh ort doiciméadacht chustaim bhreise a chur isteach freisin. Mura ndéanann tú é sin, d'fhéadfadh sé srianta iontrála nó urrú an bheart ag custaim na tíre a bheith mar thoradh air. Seiceáil tuilleadh sonraí anseo:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Beidh ort aon chánacha agus dleachtanna infheidhme a íoc ag teacht go dtí an India. Déan do bheartán a rianú agus íoc an méid sonraithe leis na custaim Indiach.\nTabhair faoi deara go bhfuil imréiteach custaim san India dian, agus d'fhéadfaí dleachtanna a ghearradh ort mura ngearrtar má sháraíonn luach do mhír 1000 INR (15 USD) - ag brath ar an gcód HS, i bhformhór na gcásanna tá sé saor ó dhleacht, ach d'fhéadfaí dleachtanna níos airde a ghearradh má sháraíonn an mír 5000 INR (60 USD). \nÓs rud é nach seachadann India Post chuig boscaí poist de réir réamhshocraithe, b'fhéidir go mbeadh ort a bheith sa bhaile nó ionadaí údaraithe chun do bheartán a fháil nó é a bhailiú ag an oifig phoist.","countryMsgMY":"Is é 500 MYR an de minimis do gach ordú a sheoltar go dtí an Mhalaeisia. D'fhéadfaí orduithe os cionn an méid sin a ghearradh.","countryMsgUS":"Ón 29 Lúnasa 2025, bainfear an de minimis USD800 go hoifigiúil agus beidh dleachtanna iompórtála iníoctha de réir réamhshocraithe ag an seoltóir sa tír tionscnaimh.\nTeastaíonn uimhir fóin agus seoladh ríomhphoist bailí le haghaidh loingseoireachta SAM chun do bheartán a sheachaint moilleanna breise.","countryMsgIL":"Is é 240 ILS (75 USD) an de minimis do gach loingeas chuig Iosrael. D'fhéadfaí orduithe os cionn an méid sin a ghearradh. \nTabhair faoi deara d'orduithe a sheoltar chuig Iosrael, b'fhéidir nach n-admhódh Israel Post an seachadadh deiridh nuair a sheachadtar é. \nÓs rud é nach seachadann Israel Post chuig boscaí poist de réir réamhshocraithe, b'fhéidir go mbeadh ort a bheith sa bhaile nó ionadaí údaraithe chun do bheartán a fháil nó é a bhailiú ag an oifig phoist.","countryMsgGB":"Tabhair faoi deara d'orduithe a sheoltar chuig an RA, b'fhéidir nach n-admhódh Royal Mail an seachadadh deiridh nuair a sheachadtar chuig do bhosca poist é.","countryMsgTH":"Is é 1500 THB (45 USD) an de minimis do gach loingeas chuig an Téalainn. D'fhéadfaí orduithe os cionn an méid sin a ghearradh.","countryMsgTW":"Is é 2000 TWD (60 USD) an de minimis do gach loingeas chuig an Téaváin. D'fhéadfaí orduithe os cionn an méid sin a ghearradh.","countryMsgMO":"Ní ghearrtar D&T agus é á sheoladh chuig Macau. Mar sin féin, tabhair faoi deara nach seachadann Macau Post chuig boscaí poist de réir réamhshocraithe, CAITHFIDH tú do bheartán a bhailiú ag an oifig phoist.","countryMsgBN":"Ní ghearrtar D&T agus é á sheoladh chuig Brúiné. Mar sin féin, tabhair faoi deara nach seachadann Brunei Post chuig boscaí poist de réir réamhshocraithe, CAITHFIDH tú do bheartán a bhailiú ag an oifig phoist. \nNíl an córas rianaithe don tír seo an-chobhsaí agus is féidir faisnéis theoranta a sholáthar, agus NÍ thugtar torthaí seachadta deiridh don bhunús.","countryMsgJP":"Is é 10000 JPY (65 USD) an de minimis do gach loingeas chuig an tSeapáin. D'fhéadfaí orduithe os cionn an méid sin a ghearradh.","countryMsgKR":"Is é 180000 KRW (150 USD) an de minimis do gach loingeas chuig an gCóiré Theas. D'fhéadfaí orduithe os cionn an méid sin a ghearradh.","countryMsgVN":"Don Vítneam, fan INROCHTANA le linn an tseachadta mar d'fhéadfaí táillí próiseála a ghearradh ort ag seachadadh an mhír. \nIs é 1000000 (35 USD) an de minimis do gach loingeas chuig Vítneam. D'fhéadfaí orduithe os cionn an méid sin a ghearradh. \nÓs rud é nach seachadann Vietnam Post chuig boscaí poist de réir réamhshocraithe, b'fhéidir go mbeadh ort a bheith sa bhaile nó ionadaí údaraithe chun do bheartán a fháil nó é a bhailiú ag an oifig phoist.","countryMsgPP":"Postálfar míreanna Tracked Label in POPDrop/POPStop ag an oifig phoist. De ghnáth postálfar míreanna SpeedPost Standard ar POPStop nó POPStation.\nTabhair faoi deara nach seachadtar míreanna Tracked Label ach ó Luan go hAoine, 9am go 6pm. Seachas ag deireadh seachtaine agus ar laethanta saoire poiblí.","postedDate":"Dáta Postála:","status":"Stádas:","shippedVia":"Seolta trí:","destination":"Ceann scríbe:","statusInPreparation":"In ullmhúchán","statusInTransit":"Ar an mbealach","statusDelivered":"Seachadta","statusOutForDelivery":"Imithe le seachadadh","statusArrived":"Tar éis","statusProcessing":"Á phróiseáil","statusDispatched":"Seolta","statusReturned":"Tuairiscithe ar ais","statusFailed":"Theip ar an seachadadh","statusCancelled":"Cealaithe","statusHeldByCustoms":"Coinnithe ag Custam","statusAwaitingCollection":"Ag fanacht le bailiú","aka":"ar a dtugtar freisin","thisServiceKnownAs":"Aithnítear an tseirbhís seo mar","in":"i","viewTrackingDHL":"Féach ar fhaisnéis rianaithe ó DHL Express","viewTrackingSingPostSpeedPost":"Féach ar fhaisnéis rianaithe ó Singapore SpeedPost","viewTrackingDHLLastMile":"Féach ar fhaisnéis rianaithe ó DHL Express (Míle deireanach)","viewTrackingDHLShipperRef":"Féach ar fhaisnéis rianaithe ó DHL Express (Tagairt seoltóra)","viewTrackingSingPost":"Féach ar fhaisnéis rianaithe ó Singapore Post","viewTrackingDestPost":"Féach ar fhaisnéis rianaithe ó","post":"Post","orderNumberExample":"Uimhir Ordú (tosaíonn le RTNX - sampla: RTNX1234567890):","deliveryRecordNote":"Tabhair faoi deara go gcoinneádfar an taifead go ceann 7 lá amháin nuair a sheachadadh an mhír agus scriosfar é ina dhiaidh sin.","copyrightAllRights":"Gach ceart ar cosaint.","epacUS":"Seirbhís Pacáiste Idirnáisiúnta Céad Rang","epacCH":"Tosaíocht Plus","epacGB":"Idirnáisiúnta Rianaithe","epacMY":"Idirnáisiúnta Rianaithe/Express","epacCA":"Express Isteach Idirnáisiúnta","epacAU":"Pacáiste agus Rian Idirnáisiúnta","epacNZ":"Rianaithe Eacnamaíoch Idirnáisiúnta","epacDE":"Préimh Idirnáisiúnta Warenpost","epacFR":"Litir idirnáisiúnta le rianú","epacNL":"Paicéad Idirnáisiúnta Rianaithe","epacPL":"GLOBAL Express","epacBE":"Príomh-Isteach Idirnáisiúnta","epacAT":"Pacáiste Rianaithe Idirnáisiúnta","epacIN":"Pacáiste Rianaithe Idirnáisiúnta","epacFI":"Litir Rianaithe Idirnáisiúnta","epacSE":"Litir Rianaithe Idirnáisiúnta","epacNO":"PRIME Exprès","epacIT":"Sloinn","epacIL":"Sloinn","epacES":"Pacáiste Éadrom Idirnáisiúnta","epacPT":"Post Gorm Idirnáisiúnta","epacCZ":"Seoladh rianaithe ó thar lear","epacBN":"ePacket Idirnáisiúnta","epacCN":"ePacket Idirnáisiúnta","epacHK":"ePacket Idirnáisiúnta","epacID":"e-Pacáiste Idirnáisiúnta","epacMO":"ePacket Idirnáisiúnta","epacPH":"Post Rianaithe Idirnáisiúnta","epacTW":"ePacket Idirnáisiúnta","epacTH":"ePacket Idirnáisiúnta","epacVN":"E-Pacáiste Idirnáisiúnta (Pacáiste ASEAN)","epacKR":"K-Paicéad","epacJP":"e-Pacáiste Idirnáisiúnta Light","epacIE":"Post Express Idirnáisiúnta","dhlNoEmbed":"Ní thacaíonn DHL Express leis an rianú trí leabaithe. Le do thoil","speedPostNoEmbed":"Ní thacaíonn SpeedPost Singeapór leis an rianú trí leabaithe. Le do thoil","operatorNoEmbed":"ní thacaíonn leis an rianú trí leabaithe. Le do thoil","clickHere":"cliceáil anseo","toTrackNewTab":"chun rianú (osclaíonn i gcárta nua).","countryRU":"🇷🇺 An Rúis","russiaServiceSuspended":"⚠️ FÓGRA TÁBHACHTACH: I bhfianaise ionsaí na Rúise ar an Úcáin in 2022, tá SingPost tar éis gach seachadadh chuig an Rúis a chur ar fíonraí in éineacht le DHL. Níl muid ag freastal ar an Rúis faoi láthair go dtí go mbeidh fógra faoi athchúrsáil seirbhísí chuig an tír.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Guímid síocháin, áthas agus beannacht ort féin agus ar do theaghlach! 🌟","deepavaliMessage":"🪔 Deepavali faoi mhaise duit! Go dtabharfaidh féile na soilse áthas, rathúnas agus rath ort! ✨","diwaliMessage":"🪔 Diwali sona daoibh! Go dtabharfaidh féile na soilse áthas, rathúnas agus rath ort! ✨","vesakMessage":"☸️ Lá Véacóige faoi mhaise duit! Guímid síocháin, eagna, agus soillseachadh ort ar an lá naofa seo! 🙏","vesakTHMessage":"☸️ Lá Visakha Bucha faoi mhaise duit! Guímid síocháin, eagna, agus soillseachadh ort ar an lá naofa seo! 🙏","australiaNationalDayMessage":"🇦🇺 Lá na hAstráile faoi mhaise duit! Ár náisiún á cheiliúradh! 🎉","canadaNationalDayMessage":"🇨🇦 Lá Cheanada faoi mhaise duit! Ár náisiún iontach á cheiliúradh! 🍁","usaNationalDayMessage":"🇺🇸 Lá Saoirse Mheiriceá faoi mhaise duit! Saoirse agus saoirse á ceiliúradh! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Iúil! Beannaigh an Fhrainc! 🎊","germanyUnityDayMessage":"🇩🇪 Lá Aontacht na Gearmáine faoi mhaise duit! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Lá Bunaithe Shona, an tSeapáin! 建国記念の日おめでとうございます)","chinaNationalDayMessage":"🇨🇳 Lá Náisiúnta na Síne faoi mhaise duit! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Lá na Saoirse faoi mhaise duit, an Chóiré! sladmhargadh! 🎊","indiaIndependenceDayMessage":"🇮🇳 Lá Saoirse na hIndia faoi mhaise duit! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Lá Náisiúnta na Téalainne faoi mhaise duit! abair! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Lá Saoirse na hOileáin Fhilipíneacha faoi mhaise duit! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Lá Náisiúnta Vítneam faoi mhaise duit! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Lá Saoirse na Polainne faoi mhaise duit! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Lá Saoirse na Seice faoi mhaise duit! Ná déan dearmad! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Go maire sibh a Rí! 🧡","norwayConstitutionDayMessage":"🇳🇴 Go raibh maith agat le rá, a Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪🇪 Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia na Portaingéile! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Lá Saoirse Iosrael faoi mhaise duit! 🎉","irelandNationalDayMessage":"🇮🇪 Beannachtaí na Féile Pádraig ort, Éire! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brúiné! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Lá Waitangi faoi mhaise duit, an Nua-Shéalainn! 🎉","switzerlandNationalDayMessage":"🇨🇭 Lá Náisiúnta na hEilvéise faoi mhaise duit! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, An Bheilg! Fijne Nationale Feestdag! 🎊","fillAllFields":"Líon isteach na réimsí riachtanacha go léir le do thoil: uimhir rianaithe, tír chinn scríbe, uimhir ordaithe, agus cód poist.","noOrderMatchingFields":"Níor aimsíodh aon ordú a fhreagraíonn do gach réimse.","postcodeRequired":"Tá cód poist ag teastáil don cheann scríbe seo.","invalidUSZip":"Cód Poist neamhbhailí SAM. Úsáid 5 dhigit nó ZIP+4.","failedGenerateURL":"Theip ar URL rianaithe a ghiniúint. Seiceáil le do thoil ionchur.","trackingValidationSG":"Ní mór na huimhreacha rianaithe do Shingeapór a bheith: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG nó PX123456789SG. Úsáid uimhreacha 10 ndigit le haghaidh lastais DHL.","invalidSingPostFormat":"Formáid uimhir rianaithe SingPost neamhbhailí.\nFormáidí a nglactar leo:\n• PP123456789SG → Lipéad Rianaithe Réamhíoctha\n• SPDD0000001234 → Rianú Caighdeánach SpeedPost","trackingNumberExample":"e.g. LG123456789SG","australianDSTTitle":"Solas Lae na hAstráile Am Shábháil Gníomhach","australianDSTBothMessage":"Tá AEDT (Am Solas Lae Oirthear na hAstráile) agus ACDT (Am Soilse Lae Láir na hAstráile) i bhfeidhm faoi láthair.","australianAEDTMessage":"Tá AEDT (Am Solas Lae Oirthear na hAstráile) i bhfeidhm faoi láthair do Sydney, Melbourne, agus na ceantair máguaird.","australianACDTMessage":"Tá ACDT (Am Soilse Lae Láir na hAstráile) i bhfeidhm faoi láthair do Adelaide agus an Astráil Theas.","australianDSTNote":"Léiríonn na hamanna seachadta a thaispeántar thuas an t-am coigilte solas lae atá ann faoi láthair.","filteredAllowedDestinations":"(Scagtha do do chinn scríbe ceadaithe)","loadingAnnouncements":"Fógraí á lódáil...","unableToLoadAnnouncements":"Ní féidir fógraí seirbhíse a lódáil faoi láthair.","viewOnSingPostWebsite":"Amharc ar shuíomh Gréasáin SingPost →","statusHeldByCustms":"Ar siúl ag Custaim","accessRestricted":"Rochtain Teoranta","vpnDetectedMessage":"Braitheadh ​​úsáid VPN. Díchumasaigh VPN chun an tseirbhís seo a rochtain.","contactSupportError":"Má chreideann tú gur earráid é seo, déan teagmháil leis an bhfoireann tacaíochta.","destinationNotAllowed":"Níl rochtain ar an tír chinn scríbe seo ar fáil ó do shuíomh. Roghnaigh ceann scríbe eile le do thoil.","blogSingPostEPACContent1":"Is seirbhís poist rianaithe eacnamaíoch é SingPost ePAC (ePacket) le haghaidh lastais éadroma ríomhthráchtála idirnáisiúnta.","blogSingPostEPACContent2":"Seachadtar é ag oibreoir poist náisiúnta na tíre cinn scríbe agus úsáidtear é go coitianta le haghaidh beartán faoi 2 kg, laistigh de theorainn toisí fad + leithead + airde faoi 90 cm agus fad nach mó ná 60 cm.","blogSingPostEPACContent3":"Ba iad Hong Kong Post amháin a thairg an rogha seo ar dtús in éineacht le eBay China, rud a ligeann do phacáistí ón tSín agus ó Hong Cong paicéid bheaga a phostáil isteach sna Stáit Aontaithe le rianú seachadta gan aon ghá le sínitheoir ar sheachadadh. Tugtar USPS (Seirbhís Poist na Stát Aontaithe) ar an tseirbhís seo mar Sheirbhís Idirnáisiúnta Pacáiste den Chéad Rang laistigh de Stáit Aontaithe Mheiriceá.","blogSingPostEPACContent4":"Ón 1 Eanáir 2026, úsáidtear ePAC anois chun go gcloífidh gach tír leis na rialacháin éigeantacha UPU a éilíonn go gcuirfí teorainn le rianú beartán agus míreanna Cláraithe do dhoiciméid amháin.","blogSingPostEPACContent5":"Réimíreanna rianaithe: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"Is seirbhís tapa poist idirnáisiúnta den scoth é EMS, a dtugann oibreoirí poist ar fud an domhain tosaíocht dó.","blogSpeedPostEMSContent2":"Go ginearálta bíonn imréiteach custaim níos tapúla ná gnáthphost ach níos déine sa phróiseas, le rianú iomlán go dtí go seachadtar é.","blogSpeedPostEMSContent3":"I Singeapór, tugtar SpeedPost Priority International le SingPost air seo.","blogSpeedPostEMSContent4":"Réimír rianaithe: EZ123456789SG","blogSpeedPostExpressContent1":"Is seirbhís de ghrád cúiréireachta é SpeedPost Express.","blogSpeedPostExpressContent2":"I go leor ceann scríbe, déanann DHL Express seachadadh an mhíle dheireanach agus bailíonn sé dleachtanna nó cánacha roimh scaoileadh.","blogSpeedPostExpressContent3":"Réimír rianaithe: PX123456789SG (Úsáideann DHL Express an mhíle dheiridh uimhir rianaithe 10 ndigit, nach bhfuil le feiceáil ag an bpobal, ach tá faisnéis againn le haghaidh é trínár","blogSpeedPostExpressContent3Link":"Córas Rianaithe.","blogUSPDDPContent1":"Ligeann PDDP dleachtanna agus cánacha ar allmhairí na Stát Aontaithe a réamhíoc roimh an seachadadh, ag laghdú táillí iontasacha d'fhaighteoirí.","blogUSPDDPContent2":"Rialacháin Nua (Le hÉifeacht 29 Lúnasa 2025)","blogUSPDDPContent2List1":"Cóid HTS éigeantach","blogUSPDDPContent2List2":"Cur síos cruinn ar mhíreanna","blogUSPDDPContent2List3":"Forfheidhmiú taraife níos déine","blogUSPDDPContent3":"Ní ghearrfar aon taraifí breise ar an bhfaighteoir ar gach earra a sheoltar chuig SAM agus muid ag íoc ar do shon. Tabhair faoi deara, áfach, gurb é praghas na míre an táille iompórtála 10% de réir réamhshocraithe mar atá socraithe chun ailíniú leis na rialacháin.","blogUSPDDPContent4":"Ní bhaineann sé seo ach lenár modhanna loingseoireachta do SAM, SpeedPost Priority International (EMS) agus SingPost ePAC amháin.","blogEUIOSSContent1":"Cuireann an AE CBL i bhfeidhm ar gach allmhairí tráchtála beag beann ar luach.","blogEUIOSSContent2":"IOSS (Iompórtáil Siopa Ilfhreastail)","blogEUIOSSContent3":"Ligeann IOSS do dhíoltóirí CBL an AE a bhailiú ag an tseiceáil amach le haghaidh coinsíneachtaí suas le €150.","blogEUIOSSContent4":"Tarchuirtear CBL ansin tríd an gcóras IOSS, rud a éascaíonn imréiteach custaim níos tapúla agus gan aon bhailiú CBL ar sheachadadh.","blogEUIOSSContent5":"I gcás gach ordú trí Etsy nó eBay, tá CBL IOSS bailithe cheana féin ar an tseiceáil amach agus cuirfimid in iúl é ar an Uimhir Thagartha Cánach chun na sonraí a tharchur chuig an tseirbhís poist ceann scríbe trí EDI (Electronic Data Intercharge).","blogUKVATContent1":"Éilíonn an RA go dtabharfar cuntas ar CBL ar earraí allmhairithe.","blogUKVATContent2":"I gcás coinsíneachtaí ar luach íseal, bailítear CBL ag an tseiceáil amach de ghnáth agus cuireann an díoltóir nó an margadh é ar ais go díreach chuig HMRC.","blogUKVATContent3":"I gcás lastais ar luach níos airde, féadfaidh an t-iompróir CBL a bhailiú roimh sheachadadh.","blogUKVATContent4":"I gcás gach ordú trí Etsy nó eBay, tá CBL bailithe cheana féin ar an tseiceáil amach agus cuirfimid é in iúl ar an Uimhir Thagartha Cánach chun na sonraí a tharchur chuig an tseirbhís poist ceann scríbe trí EDI (Electronic Data Intercharge).","blogNorwayVOECContent1":"Thug an Iorua isteach córas VOEC (CBL ar Ríomhthráchtáil) le haghaidh earraí a allmhairítear ó lasmuigh den AE/LEE. Baineann sé seo le hearraí a bhfuil luach suas le NOK 3,000 orthu.","blogNorwayVOECContent2":"Is féidir le díoltóirí clárú sa scéim VOEC chun CBL na hIorua a bhailiú ag an tseiceáil amach, rud a cheadaíonn imréiteach custaim níos tapúla agus gan bailiú CBL ar sheachadadh.","blogNorwayVOECContent3":"I gcás gach ordú trí Etsy nó eBay, tá CBL VOEC bailithe cheana féin ar an tseiceáil amach. Léiríonn páipéarachas rianaithe agus custaim an Uimhir Thagartha Cánach chun sonraí a tharchur chuig seirbhís poist na hIorua.","blogSwissVATContent1":"Gearrann an Eilvéis CBL ar earraí allmhairithe beag beann ar luach. Éilíonn Riarachán Custaim Chónaidhme na hEilvéise ar dhíoltóirí eachtracha CBL a bhailiú ag an tseiceáil amach ar earraí suas go dtí CHF 65.","blogSwissVATContent2":"Déanann díoltóirí atá cláraithe faoi chóras CBL na hEilvéise an CBL a bhailítear a íoc go díreach, ag cinntiú nach mbíonn aon táille CBL breise ar an bhfaighteoir nuair a sheachadtar é.","postalContactsTitle":"Sonraí Teagmhála Seirbhísí Poist","postalContactsNote":"Nóta:","postalContactsPolandUKNote":"I gcás na Polainne agus na Ríochta Aontaithe, láimhseálfar gach mír a sheoltar trí SpeedPost Priority (EMS) ag Pocztex agus Parcelforce.","postalContactsDHLNote":"Le haghaidh seoladh SpeedPost Express, déan teagmháil le DHL tríd an nasc seo:","postalContactsCountry":"Tír","postalContactsWebsite":"Suíomh Gréasáin","postalContactsForm":"Foirm Teagmhála","postalContactsPhone":"Uimhir Teagmhála","postalContactsEmail":"Ríomhphost Teagmhála","postalContactsFormLink":"Foirm Teagmhála","postalContactsBackButton":"Ar ais chuig an bhFoirm Fiosrúcháin Beirte","blogSwissVATContent3":"I gcás gach ordú trí Etsy nó eBay, bailítear CBL na hEilvéise cheana féin le linn an tseiceáil amach, agus áirítear leis an bpáipéarachas custaim an Uimhir Thagartha Cánach chun EDI a chur isteach.","contactUsTitle":"Déan Teagmháil Linn","parcelDisagreeCheckbox":"Ní hea","contactDisagreeCheckbox":"Ní hea","contactNameLabel":"Ainm","contactEmailLabel":"Ríomhphost","contactEmailNote":"Ní ghlactar le ríomhphoist athsheachadta príobháideacha (m.sh., @privaterelay.appleid.com). Úsáid seoladh ríomhphoist bailí.","contactEnquiryTypeLabel":"An é seo a?","contactSelectOption":"Roghnaigh rogha","contactGeneralEnquiry":"Fiosrúchán Ginearálta / Aiseolas","contactBusinessEnquiry":"Fiosrúchán Gnó","contactOrderShippingEnquiry":"Fiosrúchán Ordaithe/Loingseoireachta","contactExchangeRefundEnquiry":"Fiosrúchán Malartú/Aisíocaíochta/Tuairisceáin","contactOthers":"Daoine eile","contactParcelWarning":"Mura bhfuil do bheartán seachadta ar feadh níos mó ná 18/30/45 lá (14 lá d'FedEx), nó má thaispeánann an stádas seachadta ach nach bhfuil sé agat, líon isteach AN FHOIRM SEO ina ionad.","contactParcelWarningLink":"AN FHOIRM SEO","contactParcelWarningEnd":"ina ionad.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"Uimhreacha ordú Etsy, eBay & Shopee ní anseo. Níl aon smacht againn ar aisíocaíochtaí ó na hardáin seo. Déan teagmháil lena seirbhís custaiméara faoi seach.","contactPlatformInstructions":"Úsáid an aip chun breathnú ar d'uimhir ordaithe, mar tá sé sábháilte san aip:","contactPlatformEtsy":"Etsy - Barr ar dheis ar do phróifíl → Ceannacháin","contactPlatformEbay":"eBay - Mo eBay → Ceannacháin","contactPlatformShopee":"Shopee - Mise → Féach ar Stair Ceannacháin (nó is féidir leat cliceáil ar Le Sheoladh/Le Fáil)","contactRefundNote1":"Má tá tú ag fiafraí faoi aisíocaíocht/aisíocaíocht ón ardán a cheannaigh tú uaidh, tabhair faoi deara nach bhfuil aon smacht againn ar aisíocaíochtaí ó na hardáin seo. Déan teagmháil lena seirbhís custaiméara faoi seach.","contactRefundNote2":"Maidir le haisíocaíochtaí nó malartuithe, má tá lámhainní maimai úsáidte cheana féin nuair a osclaíodh iad (spotaí infheicthe nó níte i ní láimhe meaisín), ní cheadaímid, agus ní cheadaítear aisíocaíochtaí nó malartuithe ar chártaí arcade. Go raibh maith agat.","contactRefundNote3":"Tabhair faoi deara go gcaithfidh tú d'aisíocaíocht a fháil trí Payhip, mura bhfaigheann tú an t-aisíocaíocht, déan teagmháil le do bhanc nó tacaíocht Payhip (support@payhip.com), mar níl smacht againn ar an bpróiseas.","contactMessageLabel":"Teachtaireacht","contactCharacterCount":"carachtair","contactSpamWarningNote":"Tabhair faoi deara:","contactSpamWarning":"Diúltófar do thairiscintí gan iarraidh maidir le SEO, dearadh gréasáin, iasachtaí nó seirbhísí comhchosúla go huathoibríoch.","contactAgreementText1":"Cliceáil ar \"Aontaím\", má aontaíonn tú go n-úsáidfidh Rhythm Nexus do sheoladh ríomhphoist chun freagra a thabhairt duit, mar is gá dúinn é seo chun do fhreagra a léamh agus freagra a thabhairt duit chomh luath agus a thiocfaimid amach le réiteach ar d'fhiosrúchán.","contactAgreementText2":"Tabhair faoi deara go dtógfaidh ár bhfreagra 3-5 lá oibre, nó níos faide le linn toirt ard ríomhphoist ar ár dtaobh.","contactAgreeCheckbox":"Aontaím","contactSuccessMessage":"Seoladh do theachtaireacht! Freagróimid laistigh de 3-5 lá oibre.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"Fiosrúchán Beartáin","parcelInfoText":"Tá an fhoirm seo le haghaidh beartán nár seachadadh ar feadh níos mó ná 18/30/45 lá (14 lá le haghaidh FedEx/DHL), nó a bhfuil stádas seachadta léirithe acu ach nach bhfuil leat.","parcelInfoLink":"Cliceáil anseo","parcelInfoEnd":"le haghaidh fiosrúcháin eile.","parcelWaitTitle":"Fan le do bheartán","parcelWaitText1":"Fan le seachadadh do bheartán le do thoil. Tabhair faoi deara NACH bhfuil seachadtaí idirnáisiúnta mar an gcéanna le seachadtaí áitiúla toisc go dtógann siad am. Go raibh maith agat!","parcelWaitText2":"Mura dtaispeántar aon stádas tar éis 18 lá (7 lá do Singeapór) nó níos mó, is féidir leat inseacht dúinn go díreach.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"Ainm","parcelOrderNumberLabel":"Uimhir Ordaithe (Sampla: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Ríomhphost","parcelEmailNote":"Ní ghlactar le ríomhphoist athsheachadta príobháideacha. Úsáid seoladh ríomhphoist bailí.","parcelShippingMethodLabel":"Modh Loingseoireachta Roghnaithe?","parcelSelectShipping":"Roghnaigh modh loingseoireachta","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"Uimhir Rianaithe","parcelUndeliveredLabel":"An bhfuil do bheartán neamhsheachadta ar feadh níos mó ná 18/30/45 lá? (Seirbhísí áitiúla Singeapór >7 lá, >14 lá do SpeedPost Express/DHL)","parcelSelectOption":"Roghnaigh rogha","parcelYes":"Tá","parcelNo":"Níl","parcelDeliveredButMissingLabel":"Ar léirigh do dháileacht stádas seachadta, ach nach bhfuil sé i do bhosca poist/áit shábháilte/ar leac an dorais?","parcelCaseReferenceLabel":"Aitheantas Tagartha an Cháis ó Oifig an Phoist Áitiúil","parcelCaseReferencePlaceholder":"Cuir NA más as Singeapór thú","parcelCaseReferenceNote":"Sula gcuireann tú an fhoirm seo isteach, déan teagmháil le d’oifig phoist áitiúil le do thoil ar an teileafón nó trí ríomhphost agus faigh ID tagartha cáis uathu. Ansin, cuir ID tagartha do chás anseo.","parcelCaseReferenceLink":"Déan tagairt don nasc seo le haghaidh teagmhálaithe Seirbhíse Poist","parcelCaseReferenceMandatory":"Cuir NA AMHÁIN MÁ TÁ TÚ Ó SINGAPÓR. I gcás tíortha eile tá sé ÉIGEANTACH a chur ar fáil. Ag teastáil le haghaidh SpeedPost Express freisin, le haghaidh ID cáis DHL.","parcelImageEvidenceLabel":"Fianaise Íomhá (le dáileachtaí seachadta ach in easnamh)","parcelImageWarning":"Le haghaidh fíorú breise, ní mór dúinn cruthúnas íomhá a bheith againn lena chruthú nach bhfuil éilimh bhréagacha á ndéanamh agat faoi neamhsheachadadh beartán. (Amháin do bheartáin a seachadh cheana féin, ach nach bhfuil i láthair sa bhosca poist/lasmuigh den doras. D'fhéadfaimis d'éileamh a dhiúltú mura dtugtar cruthúnas grianghraf d'earraí seachadta. Déan neamhshuim air seo mura ndearna do mhír stádas seachadta a thaispeáint.)","parcelImageNote":"Uaslódáil 1 chomhad tacaithe: íomhá. Uasmhéid 1 GB.","parcelAgreementText":"Cliceáil ar \"Aontaím leis\" má chinntíonn tú gur fíor an méid a tharla do do bheartán.","parcelAgreeCheckbox":"Aontaím","parcelSuccessMessage":"Cuireadh isteach d'fhiosrúchán beartáin! Freagróimid laistigh de 3-5 lá oibre.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","lookalikeDomainWarning":"Is nasc é seo chuig suíomh gréasáin atá ag ligean air gur cuideachta seachadta beart é, ní uimhir rianaithe. Ná cuir isteach sonraí pearsanta ná sonraí íocaíochta ann.","lookalikeDomainOfficial":"Suíomh gréasáin oifigiúil:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus utilizes premium commercial networks. However, the exact moment it arrives in your country, custody transfers to the local domestic carrier (e.g., USPS, Royal Mail, DHL locally). Tracking prefixes change handling systems at this threshold, but our universal parcel tracker stitches these statuses together to give you uninterrupted visibility.","trackingLastMileTitle":"רשת המשלוחים של המייל האחרון","trackingCustomsClearanceBody":"כל הפריטים מעבר לגבול חייבים לנקות את סוכנות המכס של המדינה המקומית שלך. הכלי שלנו מנטר את המעברים מהגעה למתקן הייבוא למסירת המכס. סיורי גבול יאמתו קודי HS ויבטיחו שמע\"מ או מכסים נכונים שולמו (למשל, IOSS באיחוד האירופי, VOEC בנורבגיה). עקוב אחר מעקב במיוחד עבור אזהרות \"מוחזקות במכס \".","trackingCustomsClearanceTitle":"מידע על עמילות מכס","trackingProcessingOriginBody":"לאחר ההורדה, הפריט נכנס למרכז עיבוד המוצא שבו הוא נסרק, נשקל ונתון לבדיקות אבטחה ראשוניות לייצוא. לאחר מכן הוא נשלח לחילופי הדואר הבינלאומיים. לוחות הזמנים של הטיסות תלויים ברוחב הפס הזמין של המטען. אל תיבהלו אם הוא נשאר במצב זה במשך מספר ימים.","trackingProcessingOriginTitle":"מעבד ב - Origin Hub","trackingInfoReceivedBody":"כאשר הזמנה מעובדת לראשונה בפלטפורמות המסחר האלקטרוני שלנו (כגון Etsy, eBay או מכירות ישירות), מספר המעקב מופק באופן אלקטרוני. המוביל מקבל את נתוני המשלוח לפני החזקה פיזית של הקופסה. אנא המתן 1 עד 3 ימי עסקים עד שהחבילה תצורף למתקן המיון הפיזי.","trackingInfoReceivedTitle":"המידע שהתקבל","trackingStatusesIntro":"תודה שהשתמשת בכלי הבינלאומי המאוחד שלנו למעקב אחר חבילות. מכיוון שהחבילה שלך יוצאת למסעות מעבר לגבולות גלובליים מרובים, מצבי המעקב שלה יכולים להיות מורכבים. הבנת מחזור החיים הלוגיסטי עוזרת להגדיר ציפיות ברורות.","trackingStatusesTitle":"הבנת סטטוסים למעקב","footerDesc":"היעד המוביל שלכם לכרטיסי משחק ארקייד, כפפות משחק קצב ומוצרים מיוחדים. ליהנות ממסחר אלקטרוני גלובלי עם מעקב חבילות בינלאומי חלק ונתוני משלוח אמינים.","amText":"לפני הצהריים","pmText":"אחרי הצהריים","tzAEST":"AEST (סידני/מלבורן)","tzACST":"ACST (אדלייד)","tzAWST":"AWST (פרת')","tzNST":"NST (ניופאונדלנד)","tzAST":"AST (האטלנטי)","tzEST":"EST (מזרח)","tzCST":"CST (מרכז)","tzMST":"MST (הרים)","tzPST":"PST (פסיפיק)","tzAKST":"AKST (אלסקה)","tzHST":"HST (הוואי)","tzBeijing":"בייג'ינג","tzXinjiang":"שינג'יאנג","tzWIB":"WIB (ג'קרטה)","tzWITA":"WITA (מקאסאר)","tzWIT":"WIT (ג'איאפורה)","tzKaliningrad":"מחוז קלינינגרד (UTC+2)","tzMoscow":"מוסקבה/מערב רוסיה (UTC+3)","tzSamara":"מחוז סמרה (UTC+4)","tzUral":"אזור אורל (UTC+5)","tzOmsk":"מחוז אומסק (UTC+6)","tzKrasnoyarsk":"מחוז קרסנויארסק (UTC+7)","tzIrkutsk":"מחוז אירקוטסק (UTC+8)","tzSakha":"סאחה רפובליקת (UTC+9)","tzPrimorsky":"מחוז פרימורסקי (UTC+10)","tzMagadan":"מחוז מגדן (UTC+11)","tzKamchatka":"מחוז קמצ'טקה (UTC+12)","dstDayStartsLabel":"שעון קיץ מתחיל","dstDayEndsLabel":"שעון קיץ מסתיים","dstRevertsLabel":"חזרה לשעון תקני","dstEuropeLabel":"אירופה","dstNewZealandLabel":"ניו זילנד","englishResponseNotice":"שים לב: כל הפניות נענות באנגלית. אם תשלח בשפה אחרת, ייתכן שההודעה שלך תתורגם לאנגלית לצורך אימות.","contactNamePlaceholder":"לדוגמה: ישראל כהן","systemRequirementsTitle":"גרסאות מערכת נתמכות מינימלית","systemRequirements":"Windows: Windows 7 (with ESU updates installed) ומעלה\nmacOS: macOS 12 ומעלה\nAndroid: Android 13 ומעלה\niPhone/iOS: iOS 17 ומעלה\nLinux: הפצה נתמכת עם עדכוני אבטחה פעילים","goodFridayEasterGreeting":"חג פסח שמח! שלום ושמחה ביום שישי הטוב ובפסח.","christmasGreeting":"חג מולד שמח ושנה טובה! שלום ושמחה מ-25 בדצמבר עד 5 בינואר.","captchaSystemRequirements":"דרישות מערכת מינימליות: Windows 7 (with ESU updates installed) או 11, macOS 10.15+, או גרסה עדכנית של Android/iOS.","title":"אימות גישה","subtitle":"אנא השלם את האתגר למטה כדי להמשיך.","selectLanguage":"בחר שפה","selectLanguagePlaceholder":"-- בחר שפה --","loadingChallenge":"טוען אתגר...","answerLabel":"התשובה שלך:","answerPlaceholder":"הזן את התשובה שלך","continueButton":"המשך","refreshButton":"אתגר חדש","verifying":"מאמת...","chooseLanguageFirst":"אנא בחר תחילה שפה.","loadFailed":"נכשל בטעינת האתגר. אנא נסה שוב.","expiredChallenge":"האתגר פג. טוען אתגר חדש...","verifyFailed":"האימות נכשל. אנא נסה שוב.","home":"בית","blog":"בלוג","aboutUs":"אודות","faq":"שאלות נפוצות","contact":"צור קשר","trackPackage":"מעקב חבילה","cnyYearOfHorseMessage":"🧧 שנה לונארית חדשה שמחה! מאחלים לך שגשוג ושמחה בשנת הסוס! 🐴","singaporeNationalDayMessage":"🇸🇬 יום עצמאות שמח, סינגפור! חוגגים 61 שנות עצמאות! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan אינדונזיה! Dirgahayu רפובליקה אינדונזיה! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, מלזיה! חוגגים את עצמאות האומה שלנו! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - הודעת סגירה זמנית","temporaryClosureNoticeBody":"לקוחות יקרים,\n\nשימו לב כי Rhythm Nexus תהיה סגורה זמנית בין 21 במרץ 2026 ל-26 במרץ 2026 עקב אירוע חברה.\n\nכהיערכות לסגירה, החנות תעבור למצב חופשה החל מ-20 במרץ 2026 בשעה 3:00 PM (UTC +8). הזמנות שיבוצעו לאחר זמן זה עשויות שלא להיות מעובדות עד לחידוש הפעילות.\n\nהפעילות העסקית הרגילה תחודש ב-27 במרץ 2026.\n\nאנו מתנצלים על אי הנוחות ומעריכים את ההבנה והתמיכה המתמשכת שלכם.\n\nתודה.\n\nRhythm Nexus","temporaryClosureNoticeClose":"הבנתי","parcelTracking":"מעקב חבילות","serviceAnnouncement":"הודעת שירות","usaWinterStormTitle":"דחוף: סערת חורף קשה - הפרעה לשירות","usaWinterStormSubtitle":"שירות הדואר של ארצות הברית (USPS) אירוע כוח עליון","usaWinterStormNotice1":"עקב סערת חורף קשה החוצה את אזור ניו יורק מאז 23 בפברואר 2026:","usaWinterStormNotice2":"פעולות בינלאומיות בנמל התעופה הבינלאומי ג'ון פ. קנדי הופסקו באופן קבוע","usaWinterStormNotice3":"דווח על ביטולי טיסות נרחבים והפרעות משמעותיות לשירותי נמל התעופה","usaWinterStormNotice4":"תנאים אלה מהווים אירוע כוח עליון מחוץ לשליטת USPS","usaWinterStormNotice5":"השפעה על השירות:","usaWinterStormNotice6":"תערובת מסוכנת של שלג כבד, גשם קר, שלג מעורב וקור קוצב","usaWinterStormNotice7":"דווח על הפרעות גדולות והפסקות זרם נרחבות","usaWinterStormNotice8":"איסוף והעברה של דואר מקומי וביןלאומי (דואר מכתב, דואר חבילה ופריטי EMS) הושפעו","usaWinterStormNotice9":"אזורי קוד דואר מושפעים:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS נוקטת בכל הצעדים הנדרשים כדי למזער אי-נוחות ללקוחות תוך שמירה על בטיחות העובדים. אנו מעריכים את סבלנותכם והבנתכם במהלך אירוע כוח עליון זה.","usaWinterStormNotice12":"עדכון אחרון: 25 בפברואר 2026","countryAutoDetected":"יעד שנקבע מראש על פי מיקומך","countryAutoDetectedFromLink":"יעד שנקבע מראש מהקישור","trackingNumber":"מספר מעקב","destinationCountry":"מדינת יעד","postcode":"מיקוד","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! יום רוסיה שמח! 🎉","taiwanFoundingDayMessage":"🇹🇼 יום ייסוד שמח, טייוואן! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 יום עשר כפול שמח, טייוואן! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 יום הקמת אזור מנהלי מיוחד הונג קונג שמח! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 יום הקמת אזור מנהלי מיוחד מקאו שמח! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ יום העובדים הבינלאומי שמח! חוגגים עבודה וזכויות עובדים! 🎊","laborDayUSCAMessage":"⚒️ יום העבודה שמח! מכבדים את תרומות העובדים! 🎉","orderNumber":"מספר הזמנה (דוגמה: RTNX1234567890)","fromDate":"מתאריך (נדרש)","toDate":"עד תאריך (נדרש)","trackParcel":"מעקב אחר חבילה","selectCourier":"-- בחר שליח / מדינה --","singaporeCouriers":"שליחים מסינגפור","topCountries":"5 המדינות המובילות","otherCountries":"מדינות אחרות","optionSingPost":"🇸🇬 Singapore Post (SingPost)","countryAU":"🇦🇺 אוסטרליה","countryCA":"🇨🇦 קנדה","countryDE":"🇩🇪 גרמניה","countryGB":"🇬🇧 בריטניה","countryUS":"🇺🇸 ארצות הברית","countryAT":"🇦🇹 אוסטריה","countryBE":"🇧🇪 בלגיה","countryBN":"🇧🇳 ברוניי","countryCN":"🇨🇳 סין","countryCZ":"🇨🇿 צ'כיה","countryFI":"🇫🇮 פינלנד","countryFR":"🇫🇷 צרפת","countryHK":"🇭🇰 הונג קונג SAR סין","countryIN":"🇮🇳 הודו","countryID":"🇮🇩 אינדונזיה","countryIE":"🇮🇪 אירלנד","countryIL":"🇮🇱 ישראל","countryIT":"🇮🇹 איטליה","countryJP":"🇯🇵 יפן","countryMO":"🇲🇴 מקאו SAR סין","countryMY":"🇲🇾 מלזיה","countryNL":"🇳🇱 הולנד","countryNZ":"🇳🇿 ניו זילנד","countryNO":"🇳🇴 נורווגיה","countryPH":"🇵🇭 הפיליפינים","countryPL":"🇵🇱 פולין","countryPT":"🇵🇹 פורטוגל","countryKR":"🇰🇷 דרום קוריאה","countryES":"🇪🇸 ספרד","countrySE":"🇸🇪 שוודיה","countryCH":"🇨🇭 שווייץ","countryTW":"🇹🇼 טייוואן","countryTH":"🇹🇭 תאילנד","countryVN":"🇻🇳 וייטנאם","countrySG":"🇸🇬 סינגפור","note":"הערה","disclaimer":"כתב ויתור","importantInformation":"מידע חשוב:","didNotReceiveEmail":"אם לא קיבלת את אימייל האישור שלך מ-Etsy, eBay, Shopee או Payhip, גלול למטה כדי לחפש את ההזמנה שלך באמצעות כתובת האימייל או מספר הטלפון המקושר להזמנה זו.","searchByEmailOrPhone":"חיפוש לפי אימייל או טלפון","searchOrder":"חפש הזמנה","trackingResult":"תוצאת מעקב","noOrdersFound":"לא נמצאו הזמנות.","pleaseEnter":"אנא הזן אימייל, טלפון או מספר הזמנה.","welcomeTitle":"ברוכים הבאים לאתר Rhythm Nexus!","purchaseInfo":"קנה אצלנו דרך הערוצים הרשמיים שלנו, או הצטרף ל","purchaseInfoChina":"קנו מאיתנו דרך הערוצים הרשמיים שלנו.","purchaseInfoChinaSuffix":"","telegramGroup":"קבוצת הטלגרם","forUpdates":"שלנו לעדכונים רשמיים.","ourStores":"החנויות שלנו","etsyStore":"חנות Etsy","ebayStore":"חנות eBay","shopeeStore":"חנות Shopee","payhipStore":"חנות Payhip","internationalShipping":"משלוח בינלאומי","singaporeLocal":"מקומי סינגפור","asiaOnly":"אסיה בלבד","deliveryInfo":"מידע משלוח","deliveryRates2026":"תעריפי משלוח 2026","sgDeliveryRates":"תעריפי משלוח סינגפור","speedPostRates":"תעריפי SpeedPost Express בינלאומי","aboutTitle":"אודות Rhythm Nexus","aboutP1":"התחלנו את החנות שלנו בשנת 2022 ומכרנו בפלטפורמות כמו Etsy, eBay ו-Shopee ללא כישלון.","aboutP2":"עם הזמן בנינו מוניטין חזק על ידי התמקדות בביצוע אמין ומעקב מדויק.","aboutP3":"המטרה שלנו היא לספק ללקוחות חווית קנייה חלקה ואמינה.","aboutP4":"תודה שתמכת ב-Rhythm Nexus.","faqTitle":"שאלות נפוצות","faqQ1":"מה אם הפריט שלי פגום? יש אחריות?","faqA1":"כן! רוב ההזמנות מגיעות עם אחריות לשנה. אנא ספק את מספר החשבונית/ההזמנה שלך כדי שנוכל לחקור. הערה: החלפות אינן מותרות אם הפריט תואם את התיאור גם אם הזמנתם בטעות.","faqQ2":"האם אני יכול לערוך, לעדכן או לבטל את ההזמנה שלי?","faqA2":"כן. מטעמי אבטחה, ייתכן שיהיה צורך לטפל בשינויים בהזמנה באמצעות דואר אלקטרוני או בטופס יצירת הקשר שלנו.","faqQ3":"האם אני צריך לשלם מכס/מיסי יבוא?","faqA3":"מכס וחובות בדרך כלל אינם משולמים מראש, למעט DDP לארה\"ב. מע\"מ עשוי לחול על האיחוד האירופי, בריטניה, אוסטרליה/ניו זילנד, נורבגיה, שוויץ ומחוזות קנדיים כמו ססקצ'ואן ומניטובה שכבר משולם כברירת מחדל. אין מע\"מ בסינגפור. איננו יכולים לייעץ לגבי עמלות מכס - צור קשר עם המכס המקומי שלך לפרטים.","faqQ4":"מתי ההזמנה שלי נשלחת?","faqA4":"הזמנות נשלחות בדרך כלל תוך 1-5 ימי עסקים. בתקופות של נפח גבוה, זה עשוי לקחת 5-7 ימים.","faqQ5":"הזמנתי פעמיים בטעות. מה עלי לעשות?","faqA5":"אנו מחזירים רק דמי משלוח כפולים. שני הפריטים יישלחו יחד. החזר = (דמי משלוח ראשון + דמי משלוח שני) – דמי משלוח בפועל.","faqQ6":"כמה זמן לוקח המשלוח?","faqA6":"העיבוד לוקח 1-5 ימי עסקים.\n\nמשלוח מקומי:\n• SingPost תווית במעקב בתשלום מראש: 2-4 ימים\n• תקן SpeedPost: 1-3 ימים\n\nבינלאומי:\n• SingPost ePAC: 14-30 ימים\n• עדיפות SpeedPost (EMS): 8-15 ימים\n• SpeedPost Express: 4-8 ימים\n\nעיכובים עשויים להתרחש בעונות השיא.","faqQ7":"הפריט שלי מוחזר לשולח. מה עלי לעשות?","faqA7":"מותר משלוח חוזר. ביטול אינו אפשרי עבור כתובות לא חוקיות, חבילות שלא נתבעו או עמלות מכס שלא שולמו. צור קשר עם שירות הדואר שלך למשלוח מחדש, או שלח לנו הודעה לסיוע.","faqQ8":"הפריט שלי אבד / נגנב במעבר.","faqA8":"אנו מאפשרים משלוח חוזר אחד. אם אבד שוב, החזר מלא מונפק לאחר חלון המשלוח של השליח:\n\n• שירותים מקומיים בסינגפור: 7 ימים\n• SingPost ePAC & SpeedPost Priority International: 30 יום\n• SpeedPost Intl Express: 14 ימים","blogTitle":"בסיס ידע למשלוח ודואר","blogSubtitle":"הסברים רשמיים על שירותי דואר, מכס, מע\"מ ומיסים.","readMore":"קרא עוד","backButton":"חזרה","copyrightText":"כל הזכויות שמורות.","blogPost1Title":"מה זה SingPost ePAC?","blogPost1Desc":"למד על SingPost ePAC (ePacket), שירות דואר מעוקב חסכוני.","blogPost2Title":"מה זה SpeedPost Priority International (EMS)?","blogPost2Desc":"גלה EMS, שירות האקספרס הדואר הבינלאומי הפרימיום.","blogPost3Title":"מה זה SpeedPost Express?","blogPost3Desc":"חקור SpeedPost Express עם משלוח DHL Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"הבן PDDP לארה\"ב.","blogPost5Title":"מע\"מ EU & IOSS","blogPost5Desc":"תובנות על מע\"מ EU ומערכת IOSS.","blogPostNumberExample":"דוגמה: LG123456789SG","tracking6Title":"מע\"מ UK & HMRC","blogPost6Desc":"דרישות מע\"מ לבריטניה.","blogPost7Title":"נורווגיה VOEC","blogPost7Desc":"מערכת VOEC הנורווגית.","blogPost8Title":"מע\"מ שוויצרי","blogPost8Desc":"דרישות מע\"מ שוויצריות.","enterDestinationPostcode":"הזן מיקוד יעד","trackingCaseSensitive":"אותיות מעקב רגישות לרישיות וחייבות להיות באותיות גדולות.","usaPostcodeNote":"למדינות ללא מיקוד, כגון הונג קונג ומקאו, יש להזין 999077 (הונג קונג) או 999078 (מקאו).","epacDeliveryNote":"אנא שים לב שכל פריטי ePAC שנשלחים ליעד צריכים להימסר לתיבת הדואר, לפתח הדלת, ללוקר החבילות או להשאיר במקום בטוח!","currentTime":"שעה נוכחית","timezoneNote":"הזמן מוצג בפורמט של 12 שעות","sameTimeAsSingapore":"אותה שעה כמו סינגפור","hourAhead":"שעה לפני סינגפור","hoursAhead":"שעות לפני סינגפור","hourBehind":"שעה אחרי סינגפור","hoursBehind":"שעות אחרי סינגפור","collectAtPostOffice":"עם זאת, אם במדינה שלך אין תיבת דואר זמינה כסטנדרט, תצטרך לאסוף אותה בסניף הדואר.","countriesNoMailbox":"מדינות שידוע כי אין להן משלוח תיבת דואר/תיבת מכתבים זמין: ברוניי, סין, הודו, ישראל, מקאו SAR סין, פיליפינים, פולין ווייטנאם.","rhythmNexusNotResponsible":"Rhythm Nexus אינה אחראית לטיפול במשלוחים מכיוון שזה מחוץ לשליטתנו ואנו מעדיפים שתעקוב אחר סטטוס הפריט שלך.","issuesAfterDelivery":"כל בעיה עם המשלוח שלך לאחר 30/45 ימים (14 ימים עבור SpeedPost Express) או שהסטטוס מוצג ונמסר אך לא קיבלת, אנא צור איתנו קשר","cannotUseEmbed":"איננו יכולים להשתמש בהטמעה למעקב מכיוון שרוב אתרי שירותי הדואר אינם תומכים בכך.","clickLinkAbove":"אנא לחץ על הקישור למעלה כדי לעקוב אחר החבילה שלך.","trackingDetailsNote":"שימו לב שפרטי מעקב עשויים שלא להופיע בתוצאות החיפוש ולכן מומלץ להדביק את מספר המעקב במערכת כדי לעקוב אחר הפריט.","thirdPartyWebsites":"אתה יכול גם לעקוב אחר החבילות שלך באתרי צד שלישי אלה:","enterEmailOrPhone":"הזן אימייל או טלפון","reviewShippingRates":"סקור את תעריפי המשלוח הנוכחיים שלנו","here":"כאן","contactUsForm":"אנא צור איתנו קשר באמצעות","form":"טופס","forEnquiries":"לכל שאלה שיש לך לגבי ההזמנה שלך.","anPostNoDirectTracking":"An Post (אירלנד) אינו תומך בקישורי מעקב ישירים או במעקב מוטמע.","anPostPasteManually":"אנא העתק והדבק את מספר המעקב באתר An Post כדי לעקוב אחר החבילה שלך:","goToAnPost":"עבור לאתר An Post","countryMsgNL":"אם הסטטוס מציג 'Held by Customs', אנא צור קשר עם קו המידע המכס ההולנדי לקבלת סיוע:\n0800 0143 (חינם), שני-שישי 7-23.\nשבת וראשון 8-16:30.\n\nמומלץ לרשום חשבון עם PostNL כדי לקבל הודעות דחיפה מיידיות של החבילות שלך:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nאם זה מועבר לנקודת PostNL או שהסטטוס אומר לך לאסוף בסניף הדואר, תצטרך לשלם 7 EUR בדלפק. מקסימום 4 EUR אם משולם באינטרנט.","countryMsgDE":"אנו ממליצים להוריד את אפליקציית Post & DHL כדי לקבל הודעות דחיפה לסטטוס המעקב של החבילות שלך:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nצור קשר עם שירות הלקוחות של DHL Paket GmbH:\n+49-228-433-3112\nצור קשר עם DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"תצטרך להגיש הצהרת יבוא נוספת למכס. אם לא, זה עלול להוביל להגבלות כניסה והחזרת החבילה. \nמידע נוסף: https://www.posti.fi/en/receiving/customs-clearance \nקישורים אחרים: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"נגבית עמלת טיפול של 4.95 EUR.\nהורד את האפליקציה כאן: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"נגבית עמלת טיפול של 8.50 PLN. \nתצטרך לשלם את זה באיסוף בסניף הדואר,\nמכיוון שהחבילה כנראה לא תימסר לדלת שלך או לתיבת הדואר שלך.","countryMsgPH":"PHLPost בפיליפינים נחשבת לא יעילה ולא אמינה.\nאנא עקוב תמיד אחר החבילה שלך מכיוון שהסטטוס 'בדרך למשלוח'\nלפעמים מוצג רק במשך 1-3 שבועות עבור חבילות קטנות יותר. עבור חבילות גדולות יותר,\nאיסוף אפשרי רק ב-Manila Central Post Office או\nבסניף הדואר הקרוב ביותר באזור שלך. אנא שים לב שנגבית עמלת טיפול של 112 PHP עבור חבילות\nמכל ערך שעליך לשלם. אי תשלום יוביל להחזרת החבילה\nאלינו. המשלוח צפוי לקחת 1-2 חודשים בגלל השירותים האיטיים של PHLPost. \nאינך צריך לשלם מס על פריטים מתחת ל-10000 PHP, אבל אתה צריך לעשות זאת אם הערך שווה או עולה על הסכום הזה. \nאנו נמליץ על SpeedPost Express לתהליך מהיר יותר בפעם הבאה כשאתה מזמין מאיתנו. עם זאת, העמלות עשויות שלא לחול מכיוון ש-D&T עבור הנמען הוא ברירת מחדל.","countryMsgCA":"ה-de minimis הוא 20 CAD עבור כל ההזמנות שנשלחות לקנדה. מכיוון שסינגפור היא חלק מהסכם CPTPP, מכסים עשויים שלא לחול, אך D&T עשוי לחול אם הפריט עולה על הסף של 60 CAD ומעלה או 100 CAD ומעלה, מה שיכול להיות תלוי בקוד HS של הפריט. כל ערך מעל הסכום הזה יחויב במע\"מ בהתאם.","countryMsgID":"תצטרך לשלם כל מסים ומכסים רלוונטיים עם ההגעה לאינדונזיה. אנא עקוב אחר החבילה שלך ושלם את הסכום שצוין למכס האינדונזי.\nתצטרך גם להגיש תיעוד מכס נוסף. אם לא, זה עלול להוביל להגבלות כניסה או תפיסת החבילה על ידי מכס המדינה. אנא בדוק פרטים נוספים כאן:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"תצטרך לשלם כל מסים ומכסים רלוונטיים עם ההגעה להודו. אנא עקוב אחר החבילה שלך ושלם את הסכום שצוין למכס ההודי.\nאנא שים לב שהיטול מכס בהודו קפדני, ואתה עשוי או לא להיות מחויב במכסים אם ערך הפריט שלך עולה על 1000 INR (15 USD) - תלוי בקוד HS, ברוב המקרים זה פטור ממכס, אבל אתה עלול להיות מחויב במכסים גבוהים יותר אם הפריט עולה על 5000 INR (60 USD). \nמכיוון ש-India Post אינו מוסר לתיבות דואר כברירת מחדל, ייתכן שתצטרך להיות בבית או נציג מורשה כדי לקבל את החבילה שלך או לאסוף בסניף הדואר.","countryMsgMY":"ה-de minimis הוא 500 MYR עבור כל ההזמנות שנשלחות למלזיה. הזמנות מעל הסכום הזה עשויות להיות מחויבות.","countryMsgUS":"החל מ-29 באוגוסט 2025, ה-de minimis של USD800 יוסר באופן רשמי ומכסי יבוא ישולמו כברירת מחדל על ידי השולח במדינת המוצא.\nמשלוח לארה\"ב דורש מספר טלפון וכתובת אימייל תקפים כדי שהחבילה שלך תימנע מעיכובים נוספים.","countryMsgIL":"ה-de minimis הוא 240 ILS (75 USD) עבור כל המשלוחים לישראל. הזמנות מעל הסכום הזה עשויות להיות מחויבות. \nאנא שים לב שעבור הזמנות שנשלחות לישראל, דואר ישראל לפעמים עשוי שלא לאשר את המשלוח הסופי ברגע שהוא נמסר. \nמכיוון שדואר ישראל אינו מוסר לתיבות דואר כברירת מחדל, ייתכן שתצטרך להיות בבית או נציג מורשה כדי לקבל את החבילה שלך או לאסוף בסניף הדואר.","countryMsgGB":"אנא שים לב שעבור הזמנות שנשלחות לבריטניה, Royal Mail לפעמים עשוי שלא לאשר את המשלוח הסופי ברגע שהוא נמסר לתיבת הדואר שלך.","countryMsgTH":"ה-de minimis הוא 1500 THB (45 USD) עבור כל המשלוחים לתאילנד. הזמנות מעל הסכום הזה עשויות להיות מחויבות.","countryMsgTW":"ה-de minimis הוא 2000 TWD (60 USD) עבור כל המשלוחים לטייוואן. הזמנות מעל הסכום הזה עשויות להיות מחויבות.","countryMsgMO":"לא נגבים D&T בעת שליחה למקאו. עם זאת, אנא שים לב שדואר מקאו אינו מוסר לתיבות דואר כברירת מחדל, אתה חייב לאסוף את החבילה שלך בסניף הדואר.","countryMsgBN":"לא נגבים D&T בעת שליחה לברוניי. עם זאת, אנא שים לב שדואר ברוניי אינו מוסר לתיבות דואר כברירת מחדל, אתה חייב לאסוף את החבילה שלך בסניף הדואר. \nמערכת המעקב למדינה זו אינה יציבה מאוד וניתן לספק מידע מוגבל, ותוצאות משלוח סופיות אינן ניתנות למקור.","countryMsgJP":"ה-de minimis הוא 10000 JPY (65 USD) עבור כל המשלוחים ליפן. הזמנות מעל הסכום הזה עשויות להיות מחויבות.","countryMsgKR":"ה-de minimis הוא 180000 KRW (150 USD) עבור כל המשלוחים לדרום קוריאה. הזמנות מעל הסכום הזה עשויות להיות מחויבות.","countryMsgVN":"עבור וייטנאם, אנא הישאר זמין במהלך המשלוח מכיוון שעשויות להיות מחויבות עמלות טיפול בעת מסירת הפריט. \nה-de minimis הוא 1000000 (35 USD) עבור כל המשלוחים לוייטנאם. הזמנות מעל הסכום הזה עשויות להיות מחויבות. \nמכיוון שדואר וייטנאם אינו מוסר לתיבות דואר כברירת מחדל, ייתכן שתצטרך להיות בבית או נציג מורשה כדי לקבל את החבילה שלך או לאסוף בסניף הדואר.","countryMsgPP":"פריטי Tracked Label יפורסמו ב-POPDrop/POPStop בסניף הדואר. פריטי SpeedPost Standard מפורסמים בדרך כלל ב-POPStop או POPStation.\nאנא שים לב שמשלוח פריטי Tracked Label הוא רק מיום שני עד שישי, 9-18. למעט בסופי שבוע ובחגים.","postedDate":"תאריך שליחה:","status":"סטטוס:","shippedVia":"נשלח דרך:","destination":"יעד:","statusInPreparation":"בהכנה","statusInTransit":"בדרך","statusDelivered":"נמסר","statusOutForDelivery":"יצא למשלוח","statusArrived":"הגיע","statusProcessing":"בטיפול","statusDispatched":"נשלח","statusReturned":"הוחזר","statusFailed":"המשלוח נכשל","statusCancelled":"בוטל","statusHeldByCustoms":"מוחזק במכס","statusAwaitingCollection":"ממתין לאיסוף","aka":"ידוע גם בשם","thisServiceKnownAs":"השירות הזה ידוע בתור","in":"ב","viewTrackingDHL":"הצג מידע מעקב מ-DHL Express","viewTrackingSingPostSpeedPost":"הצג מידע מעקב מ-Singapore SpeedPost","viewTrackingDHLLastMile":"הצג מידע מעקב מ-DHL Express (קילומטר אחרון)","viewTrackingDHLShipperRef":"הצג מידע מעקב מ-DHL Express (הפניית שולח)","viewTrackingSingPost":"הצג מידע מעקב מ-Singapore Post","viewTrackingDestPost":"הצג מידע מעקב מ","post":"דואר","orderNumberExample":"מספר הזמנה (מתחיל ב-RTNX - דוגמה: RTNX1234567890):","deliveryRecordNote":"אנא שים לב שברגע שהפריט נמסר, הרשומה תישמר רק עד 7 ימים ואז תימחק.","copyrightAllRights":"כל הזכויות שמורות.","epacUS":"שירות חבילות בינלאומי מדרגה ראשונה","epacCH":"פריוריטי פלוס","epacGB":"מעקב בינלאומי","epacMY":"מעקב בינלאומי/אקספרס","epacCA":"אקספרס נכנס בינלאומי","epacAU":"Pack and Track בינלאומי","epacNZ":"מעקב כלכלי בינלאומי","epacDE":"Warenpost International Premium","epacFR":"מכתב בינלאומי עם מעקב","epacNL":"מעקב אחר מנות בינלאומיות","epacPL":"GLOBAL Expres","epacBE":"Prime Inbound הבינלאומי","epacAT":"חבילה ממוקבת בינלאומית","epacIN":"חבילה ממוקבת בינלאומית","epacFI":"מכתב ממוקב בינלאומי","epacSE":"מכתב ממוקב בינלאומי","epacNO":"PRIME Exprès","epacIT":"אֶקְסְפּרֶס","epacIL":"אֶקְסְפּרֶס","epacES":"חבילה קלה בינלאומית","epacPT":"דואר כחול בינלאומי","epacCZ":"משלוח ממוקב מהחו״ל","epacBN":"ePacket בינלאומי","epacCN":"ePacket בינלאומי","epacHK":"ePacket בינלאומי","epacID":"e-חבילה בינלאומית","epacMO":"ePacket בינלאומי","epacPH":"דואר מעוקב בינלאומי","epacTW":"ePacket בינלאומי","epacTH":"ePacket בינלאומי","epacVN":"E-חבילה בינלאומית (חבילת ASEAN)","epacKR":"K-Packet","epacJP":"e-חבילה בינלאומית Light","epacIE":"דואר מהיר בינלאומי","dhlNoEmbed":"DHL Express לא תומכת במעקב דרך שילוב. אנא","speedPostNoEmbed":"SpeedPost סינגפור לא תומכת במעקב דרך שילוב. אנא","operatorNoEmbed":"לא תומכת במעקב דרך שילוב. אנא","clickHere":"לחץ כאן","toTrackNewTab":"למעקב (נפתח בלשונית חדשה).","countryRU":"🇷🇺 רוסיה","russiaServiceSuspended":"⚠️ הודעה חשובה: לאור הפלישה הרוסית לאוקראינה ב-2022, SingPost השעתה את כל המשלוחים לרוסיה יחד עם DHL. אנחנו לא משרתים כיום את רוסיה עד שיהיה הכרזה על חידוש השירותים למדינה.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! מאחלת לך ולמשפחתך שלום, שמחה וברכה! 🌟","deepavaliMessage":"🪔 דיפוואלי שמח! יהי רצון שחג האורות יביא לך שמחה, שגשוג והצלחה! ✨","diwaliMessage":"🪔 דיוואלי שמח! יהי רצון שחג האורות יביא לך שמחה, שגשוג והצלחה! ✨","vesakMessage":"☸️ יום ווסק שמח! מאחלת לך שלום, חוכמה והארה ביום קדוש זה! 🙏","vesakTHMessage":"☸️ יום Visakha Bucha שמח! מאחלת לך שלום, חוכמה והארה ביום קדוש זה! 🙏","australiaNationalDayMessage":"🇦🇺 יום אוסטרליה שמח! חוגגים את האומה שלנו! 🎉","canadaNationalDayMessage":"🇨🇦 יום קנדה שמח! חוגגים את האומה הגדולה שלנו! 🍁","usaNationalDayMessage":"🇺🇸 יום עצמאות שמח, אמריקה! חוגגים חופש וחירות! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! Vive la France! 🎊","germanyUnityDayMessage":"🇩🇪 יום אחדות גרמניה שמח! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 יום קרן שמח, יפן! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 יום לאומי שמח, סין! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 יום שחרור שמח, קוריאה! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 יום עצמאות שמח, הודו! ג'אי הינד! 🇮🇳","thailandNationalDayMessage":"🇹🇭 יום לאומי שמח, תאילנד! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 יום עצמאות שמח, הפיליפינים! מאבוהיי! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 יום לאומי שמח, וייטנאם! Quốc khanh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 יום עצמאות שמח, פולין! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 יום עצמאות שמח, צ'כיה! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! יחי המלך! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, נורווגיה! 🇳🇴","swedenNationalDayMessage":"🇸🇪 שמח ליום הלאומי של שוודיה! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 פליז דיא דה פורטוגל! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! חג עצמאות שמח, ישראל! 🎉","irelandNationalDayMessage":"🇮🇪 יום פטריק הקדוש שמח, אירלנד! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan ברוניי! 🎊","newZealandWaitangiDayMessage":"🇳🇿 יום Waitangi שמח, ניו זילנד! 🎉","switzerlandNationalDayMessage":"🇨🇭 יום לאומי שוויצרי שמח! Fête National Suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, בלגיה! חגיגת פיין הלאומית! 🎊","fillAllFields":"אנא מלא את כל השדות הנדרשים: מספר מעקב, מדינת יעד, מספר הזמנה ומיקוד.","noOrderMatchingFields":"לא נמצאה הזמנה התואמת לכל השדות.","postcodeRequired":"מיקוד נדרש עבור יעד זה.","invalidUSZip":"מיקוד לא חוקי בארה\"ב. השתמש ב-5 ספרות או ב-ZIP+4.","failedGenerateURL":"יצירת כתובת אתר למעקב נכשלה. אנא בדוק את הקלט.","trackingValidationSG":"מספרי מעקב עבור סינגפור חייבים להיות: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG או PX123456789SG. עבור משלוחי DHL השתמש במספרים בני 10 ספרות.","invalidSingPostFormat":"פורמט מספר מעקב SingPost לא חוקי.\nפורמטים מקובלים:\n• PP123456789SG → תווית מעקב בתשלום מראש\n• SPNDD00012345 ← מעקב סטנדרטי של SpeedPost","blogPost6Title":"מע\"מ בבריטניה והעברה ל-HMRC","trackingNumberExample":"לְמָשָׁל LG123456789SG","australianDSTTitle":"שעון קיץ אוסטרלי פעיל","australianDSTBothMessage":"הן AEDT (שעון קיץ מזרחי אוסטרלי) והן ACDT (שעון קיץ מרכזי אוסטרלי) בתוקף כרגע.","australianAEDTMessage":"AEDT (שעון קיץ מזרחי אוסטרלי) פועל כעת עבור סידני, מלבורן והאזורים הסובבים אותה.","australianACDTMessage":"ACDT (שעון קיץ מרכזי אוסטרלי) בתוקף כעת עבור אדלייד ודרום אוסטרליה.","australianDSTNote":"זמני האספקה ​​המוצגים למעלה משקפים את שעון הקיץ הנוכחי.","filteredAllowedDestinations":"(מסונן עבור היעדים המותרים שלך)","loadingAnnouncements":"טוען הודעות...","unableToLoadAnnouncements":"לא ניתן לטעון הודעות שירות בשלב זה.","viewOnSingPostWebsite":"הצג באתר SingPost →","statusHeldByCustms":"מוחזק על ידי המכס","accessRestricted":"גישה מוגבלת","vpnDetectedMessage":"זוהה שימוש ב-VPN. אנא השבת את VPN כדי לגשת לשירות זה.","contactSupportError":"אם אתה סבור שזו שגיאה, אנא צור קשר עם התמיכה.","destinationNotAllowed":"הגישה למדינת יעד זו אינה זמינה מהמיקום שלך. אנא בחר יעד אחר.","blogSingPostEPACContent1":"SingPost ePAC (ePacket) הוא שירות דואר חסכוני במעקב עבור משלוחי מסחר אלקטרוני בינלאומיים קלים.","blogSingPostEPACContent2":"הוא נמסר על ידי מפעיל הדואר הלאומי של מדינת היעד, והוא נפוץ עבור חבילות מתחת ל-2 ק\"ג, בתוך מגבלת מימד של אורך + רוחב + גובה מתחת ל-90 ס\"מ ואורך שלא יעלה על 60 ס\"מ.","blogSingPostEPACContent3":"אפשרות זו הוצעה בתחילה רק על ידי הונג קונג פוסט יחד עם איביי סין, מה שאפשר לחבילות מסין והונג קונג לשלוח חבילות קטנות לארה\"ב עם מעקב משלוחים ללא דרישה לחתום כלשהו עם המסירה. שירות זה ידוע בשם USPS (United States Postal Service) First Class Package International Service בתוך ארה\"ב.","blogSingPostEPACContent4":"החל מה-1 בינואר 2026, ePAC משמש כעת עבור כל המדינות כדי לציית לתקנות החובה של UPU המחייבות מעקב אחר חבילות ופריטים רשומים להיות מוגבל למסמכים בלבד.","blogSingPostEPACContent5":"קידומות מעקב: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS הוא שירות דואר אקספרס בינלאומי פרימיום, המועדף על ידי מפעילי דואר ברחבי העולם.","blogSpeedPostEMSContent2":"שחרור מהמכס הוא בדרך כלל מהיר יותר מדואר רגיל אך קפדני יותר בתהליך, עם מעקב מלא עד המסירה.","blogSpeedPostEMSContent3":"בסינגפור, זה ידוע בשם SpeedPost Priority International על ידי SingPost.","blogSpeedPostEMSContent4":"קידומת מעקב: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express הוא שירות שליחויות.","blogSpeedPostExpressContent2":"ביעדים רבים, DHL Express מבצעת משלוח למייל האחרון וגובה מכסים או מיסים לפני השחרור.","blogSpeedPostExpressContent3":"קידומת מעקב: PX123456789SG (Last mile DHL Express משתמש במספר מעקב בן 10 ספרות, שאינו גלוי לציבור, אך יש לנו מידע עבורו דרך","blogSpeedPostExpressContent3Link":"מערכת מעקב.","blogUSPDDPContent1":"PDDP מאפשר תשלום מראש של מסי יבוא ומסי ארה\"ב לפני המסירה, מה שמפחית את חיובי הפתע לנמענים.","blogUSPDDPContent2":"תקנות חדשות (בתוקף 29 באוגוסט 2025)","blogUSPDDPContent2List1":"קודי HTS חובה","blogUSPDDPContent2List2":"תיאורי פריט מדויקים","blogUSPDDPContent2List3":"אכיפת תעריפים מחמירה","blogUSPDDPContent3":"כל הפריטים שנשלחו לארה\"ב לא יחויבו בתעריפים נוספים מהנמען מכיוון שאנו משלמים בשמך. עם זאת, שימו לב שמחיר הפריט הוא עמלת יבוא של 10% כברירת מחדל כפי שהוגדרה בהתאם לתקנות.","blogUSPDDPContent4":"זה חל רק על שיטות המשלוח שלנו עבור ארה\"ב, SpeedPost Priority International (EMS) ו-SingPost ePAC בלבד.","blogEUIOSSContent1":"האיחוד האירופי מחיל מע\"מ על כל יבוא מסחרי ללא קשר לערך.","blogEUIOSSContent2":"IOSS (ייבוא ​​One Stop Shop)","blogEUIOSSContent3":"IOSS מאפשר למוכרים לגבות מע\"מ של האיחוד האירופי בקופה עבור משלוחים של עד 150 אירו.","blogEUIOSSContent4":"מע\"מ נשלח לאחר מכן באמצעות מערכת IOSS, מה שמאפשר שחרור ממכס מהיר יותר וללא גביית מע\"מ במשלוח.","blogEUIOSSContent5":"עבור כל ההזמנות דרך Etsy או eBay, מע\"מ IOSS כבר נגבה בקופה ואנו נציין זאת במספר הפניה למס כדי להעביר את הנתונים לשירות הדואר היעד באמצעות EDI (Electronic Data Intercharge).","blogUKVATContent1":"בריטניה דורשת לחייב מע\"מ על סחורות מיובאות.","blogUKVATContent2":"עבור משלוחים בעלי ערך נמוך, מע\"מ נגבה בדרך כלל בקופה ומועבר ישירות ל-HMRC על ידי המוכר או השוק.","blogUKVATContent3":"עבור משלוחים בעלי ערך גבוה יותר, ייתכן שהספק יגבה מע\"מ לפני המסירה.","blogUKVATContent4":"עבור כל ההזמנות דרך Etsy או eBay, מע\"מ כבר נגבה בקופה ואנו נציין אותו במספר סימוכין המס כדי להעביר את הנתונים לשירות הדואר היעד באמצעות EDI (Electronic Data Intercharge).","blogNorwayVOECContent1":"נורבגיה הציגה את מערכת VOEC (מע\"מ על מסחר אלקטרוני) עבור סחורות המיובאות מחוץ לאיחוד האירופי/EEA. זה חל על מוצרים בשווי של עד 3,000 NOK.","blogNorwayVOECContent2":"מוכרים יכולים להירשם בתוכנית VOEC כדי לגבות מע\"מ נורבגי בקופה, מה שמאפשר שחרור ממכס מהיר יותר וללא גביית מע\"מ עם המסירה.","blogNorwayVOECContent3":"עבור כל ההזמנות דרך Etsy או eBay, מע\"מ VOEC כבר נגבה בקופה. ניירת מעקב וניירת מכס מציינת את מספר סימוכין המס להעברת נתונים לשירות הדואר הנורבגי.","blogSwissVATContent1":"שוויץ גובה מע\"מ על סחורות מיובאות ללא קשר לערך. מינהל המכס הפדרלי של שוויץ דורש ממוכרים זרים לגבות מע\"מ בקופה עבור סחורות עד 65 CHF.","blogSwissVATContent2":"מוכרים הרשומים תחת מערכת המע\"מ השוויצרית מעבירים את המע\"מ שנגבה ישירות, ומבטיחים שהנמען לא יחווה חיוב נוסף במע\"מ בעת המסירה.","postalContactsTitle":"אנשי קשר של שירותי דואר","postalContactsNote":"הערה:","postalContactsPolandUKNote":"עבור פולין ובריטניה, כל הפריטים הנשלחים דרך SpeedPost Priority (EMS) יטופלו על ידי Pocztex ו-Parcelforce.","postalContactsDHLNote":"עבור משלוחי SpeedPost Express, אנא צור קשר עם DHL דרך קישור זה:","postalContactsCountry":"מדינה","postalContactsWebsite":"אתר אינטרנט","postalContactsForm":"טופס יצירת קשר","postalContactsPhone":"מספר טלפון","postalContactsEmail":"דוא\"ל ליצירת קשר","postalContactsFormLink":"טופס יצירת קשר","postalContactsBackButton":"חזרה לטופס בירור חבילה","blogSwissVATContent3":"עבור כל ההזמנות דרך Etsy או eBay, מע\"מ שוויצרי כבר נגבה במהלך התשלום, וניירת המכס כוללת את מספר סימוכין המס להגשת EDI.","contactUsTitle":"צור קשר","parcelDisagreeCheckbox":"לא","contactDisagreeCheckbox":"לא","contactNameLabel":"שם","contactEmailLabel":"דוא\"ל","contactEmailNote":"אימיילים של ממסר פרטי (למשל, @privaterelay.appleid.com) אינם מתקבלים. השתמש בכתובת אימייל תקפה.","contactEnquiryTypeLabel":"האם זה א?","contactSelectOption":"בחר אפשרות","contactGeneralEnquiry":"בירור כללי / משוב","contactBusinessEnquiry":"חקירה עסקית","contactOrderShippingEnquiry":"בקשת הזמנה/משלוח","contactExchangeRefundEnquiry":"בקשת החלפה/החזר/החזרה","contactOthers":"אחרים","contactParcelWarning":"אם החבילה שלך לא נמסרה במשך יותר מ-18/30/45 ימים (14 ימים ל-FedEx), או שהסטטוס מציג נמסר אבל היא לא אצלך, אנא מלא את הטופס הזה במקום.","contactParcelWarningLink":"הטופס הזה","contactParcelWarningEnd":"במקום.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"מספרי הזמנה של Etsy, eBay ו-Shopee לא כאן. אין לנו שליטה על החזרים מפלטפורמות אלה. אנא צור קשר עם שירות הלקוחות שלהם בנפרד.","contactPlatformInstructions":"השתמש באפליקציה כדי לראות את מספר ההזמנה שלך, מכיוון שהוא שמור באפליקציה:","contactPlatformEtsy":"Etsy - בפינה הימנית העליונה בפרופיל שלך → רכישות","contactPlatformEbay":"eBay - ה-eBay שלי → רכישות","contactPlatformShopee":"Shopee - אני → הצג היסטוריית רכישות (או שאתה יכול ללחוץ על לשלוח/לקבל)","contactRefundNote1":"אם אתה שואל על החזרה/החזר מהפלטפורמה שקנית ממנה, שים לב שאין לנו שליטה על החזרים מפלטפורמות אלה. אנא צור קשר עם שירות הלקוחות שלהם בנפרד.","contactRefundNote2":"עבור החזרות או החלפות, אם כפפות maimai כבר נעשה שימוש כאשר נפתחו (כתמים גלויים או נשטפו במכונת כביסה ידנית), אנחנו לא מאפשרים, והחזרות או החלפות של כרטיסי ארקייד אינן מותרות. תודה.","contactRefundNote3":"שים לב שעבור החזרים דרך Payhip, אם אינך מקבל את ההחזר, צור קשר עם הבנק שלך או תמיכת Payhip (support@payhip.com), מכיוון שאין לנו שליטה על התהליך.","contactMessageLabel":"הודעה","contactCharacterCount":"תווים","contactSpamWarningNote":"שים לב:","contactSpamWarning":"הצעות לא רצויות עבור SEO, עיצוב אתרים, הלוואות או שירותים דומים יידחו אוטומטית.","contactAgreementText1":"לחץ על \"אני מסכים\", אם אתה מסכים שכתובת האימייל שלך תשמש את Rhythm Nexus כדי להגיב לך, מכיוון שזה נדרש לנו לקרוא את תשובתך ולהשיב לך ברגע שנמצא פתרון לפנייתך.","contactAgreementText2":"שים לב שהתשובה שלנו תיקח 3-5 ימי עסקים, או יותר במהלך נפח גבוה של מיילים מצדנו.","contactAgreeCheckbox":"אני מסכים","contactSuccessMessage":"ההודעה שלך נשלחה! נגיב תוך 3-5 ימי עסקים.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"בירור חבילה","parcelInfoText":"טופס זה מיועד לחבילות שלא נמסרו במשך יותר מ-18/30/45 ימים (14 ימים עבור FedEx/DHL), או שהראו סטטוס מסירה אך אינן איתך.","parcelInfoLink":"לחץ כאן","parcelInfoEnd":"לבירורים אחרים.","parcelWaitTitle":"המתן לחבילה שלך","parcelWaitText1":"אנא המתן למשלוח החבילה שלך. שים לב שמשלוחים בינלאומיים אינם זהים למשלוחים מקומיים מכיוון שהם לוקחים זמן. תודה!","parcelWaitText2":"אם לא מופיע סטטוס לאחר 18 ימים (7 ימים עבור סינגפור) או יותר, תוכל ליידע אותנו ישירות.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"שם","parcelOrderNumberLabel":"מספר הזמנה (דוגמה: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"דוא\"ל","parcelEmailNote":"אימיילים של ממסר פרטי אינם מתקבלים. השתמש בכתובת אימייל תקפה.","parcelShippingMethodLabel":"שיטת משלוח נבחרה?","parcelSelectShipping":"בחר שיטת משלוח","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"מספר מעקב","parcelUndeliveredLabel":"האם החבילה שלך לא נמסרה במשך יותר מ-18/30/45 ימים? (שירותים מקומיים של סינגפור >7 ימים, >14 ימים עבור SpeedPost Express/DHL)","parcelSelectOption":"בחר אפשרות","parcelYes":"כֵּן","parcelNo":"לֹא","parcelDeliveredButMissingLabel":"האם החבילה שלך הראתה סטטוס מסירה, אבל היא לא נמצאת בתיבת הדואר/מקום בטוח/מפתח?","parcelCaseReferenceLabel":"מזהה הפניה למקרה ממשרד הדואר המקומי","parcelCaseReferencePlaceholder":"שים NA אם אתה מסינגפור","parcelCaseReferenceNote":"לפני שליחת טופס זה, אנא צור קשר עם סניף הדואר המקומי שלך בטלפון או בדוא\"ל וקבל מהם תעודה מזהה למקרה. לאחר מכן, שים את מזהה הפניה למקרה שלך כאן.","parcelCaseReferenceLink":"עיין בקישור זה לאנשי קשר של שירות הדואר","parcelCaseReferenceMandatory":"שים NA רק אם אתה מסינגפור. עבור מדינות אחרות חובה לספק. נדרש גם עבור SpeedPost Express, עבור מזהה התיק של DHL.","parcelImageEvidenceLabel":"עדות תמונה (עבור חבילות שנמסרו אך חסרות)","parcelImageWarning":"לאימות נוסף אנו זקוקים להוכחת תמונה כדי להוכיח שאתה לא מגיש תביעות שווא על אי-מסירת חבילות. (רק עבור חבילות שכבר נמסרו, אך אינן נמצאות בתיבת הדואר/מחוץ לדלת. אנו עשויים לדחות את תביעתך אם לא ניתנת הוכחת תמונה עבור פריטים שנמסרו. התעלם מכך אם הפריט שלך לא הראה סטטוס נמסר.)","parcelImageNote":"העלה קובץ אחד נתמך: תמונה. מקסימום 1 GB.","parcelAgreementText":"אנא לחץ על \"אני מסכים\" אם אתה מוודא שמה שקרה לחבילה שלך היה נכון.","parcelAgreeCheckbox":"אני מסכים","parcelSuccessMessage":"בירור החבילה שלך נשלח! נגיב תוך 3-5 ימי עסקים.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","lookalikeDomainWarning":"זה לא מספר מעקב אלא קישור לאתר שמתחזה לחברת שילוח. אל תזינו שם פרטים אישיים או פרטי תשלום.","lookalikeDomainOfficial":"האתר הרשמי:"};
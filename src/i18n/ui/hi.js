@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"रिदम नेक्सस प्रीमियम वाणिज्यिक नेटवर्क का उपयोग करता है। हालाँकि, जैसे ही यह आपके देश में आता है, हिरासत स्थानीय घरेलू वाहक (जैसे, यूएसपीएस, रॉयल मेल, स्थानीय रूप से डीएचएल) को स्थानांतरित हो जाती है। ट्रैकिंग उपसर्ग इस सीमा पर हैंडलिंग सिस्टम को बदलते हैं, लेकिन हमारा यूनिवर्सल पार्सल ट्रैकर आपको निर्बाध दृश्यता प्रदान करने के लिए इन स्थितियों को एक साथ जोड़ता है।","trackingLastMileTitle":"लास्ट - माइल डिलीवरी नेटवर्क","trackingCustomsClearanceBody":"सभी क्रॉस - बॉर्डर आइटम को आपके स्थानीय देश की सीमा शुल्क एजेंसी को साफ़ करना होगा। हमारा टूल आयात सुविधा के आगमन से लेकर कस्टम हैंडओवर तक के बदलावों की निगरानी करता है। बॉर्डर पेट्रोल HS कोड को वेरिफ़ाई करेंगे और पक्का करेंगे कि सही वैट या ड्यूटी भेज दी गई है (जैसे, EU में IOSS, नॉर्वे में VOEC)। विशेष रूप से \"सीमा शुल्क पर आयोजित\" चेतावनियों के लिए ट्रैकिंग की निगरानी करें।","trackingCustomsClearanceTitle":"सीमा शुल्क निकासी की जानकारी","trackingProcessingOriginBody":"एक बार ड्रॉप ऑफ़ होने के बाद, आइटम मूल प्रसंस्करण केंद्र में प्रवेश करता है जहां इसे स्कैन किया जाता है, तौला जाता है, और प्राथमिक निर्यात सुरक्षा स्क्रीनिंग के अधीन किया जाता है। इसके बाद इसे अंतर्राष्ट्रीय मेल एक्सचेंज में भेज दिया जाता है। फ्लाइट शेड्यूल उपलब्ध कार्गो बैंडविड्थ पर निर्भर करता है। यदि यह कई दिनों तक इस स्थिति में रहता है तो चिंतित न हों।","trackingProcessingOriginTitle":"ओरिजिन हब में प्रोसेस किया जा रहा है","trackingInfoReceivedBody":"जब कोई ऑर्डर पहली बार हमारे ई - कॉमर्स प्लैटफ़ॉर्म (जैसे Etsy, eBay या डायरेक्ट सेल्स) पर प्रोसेस किया जाता है, तो ट्रैकिंग नंबर इलेक्ट्रॉनिक रूप से जनरेट किया जाता है। कैरियर बॉक्स के भौतिक कब्जे से पहले शिपमेंट डेटा प्राप्त करता है। कृपया पार्सल को भौतिक छँटाई सुविधा में शामिल करने के लिए 1 से 3 कार्य दिवसों की अनुमति दें।","trackingInfoReceivedTitle":"प्राप्त जानकारी","trackingStatusesIntro":"हमारे एकीकृत अंतर्राष्ट्रीय पार्सल ट्रैकिंग टूल का उपयोग करने के लिए धन्यवाद। चूँकि आपका पैकेज कई वैश्विक सीमाओं के पार यात्रा करता है, इसलिए इसकी ट्रैकिंग स्थिति जटिल हो सकती है। लॉजिस्टिक्स जीवनचक्र को समझने से स्पष्ट अपेक्षाओं को निर्धारित करने में मदद मिलती है।","trackingStatusesTitle":"ट्रैकिंग की स्थिति को समझना","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"पूर्वाह्न","pmText":"अपराह्न","footerQuickLinks":"त्वरित लिंक","footerSupportLegal":"समर्थन और कानूनी","copyrightText":"सर्वाधिकार सुरक्षित।","tzAEST":"AEST (सिडनी/मेलबर्न)","tzACST":"ACST (एडिलेड)","tzAWST":"AWST (पर्थ)","tzNST":"NST (न्यूफाउंडलैंड)","tzAST":"AST (अटलांटिक)","tzEST":"EST (पूर्वी)","tzCST":"CST (केंद्रीय)","tzMST":"MST (पर्वतीय)","tzPST":"PST (प्रशांत)","tzAKST":"AKST (अलास्का)","tzHST":"HST (हवाई)","tzBeijing":"बीजिंग","tzXinjiang":"शिनजियांग","tzWIB":"WIB (जकार्ता)","tzWITA":"WITA (मकस्सर)","tzWIT":"WIT (जयपुरा)","tzKaliningrad":"कलिनिनग्राद ओब्लास्ट (UTC+2)","tzMoscow":"मास्को/पश्चिमी रूस (UTC+3)","tzSamara":"समारा ओब्लास्ट (UTC+4)","tzUral":"यूराल क्षेत्र (UTC+5)","tzOmsk":"ओम्स्क ओब्लास्ट (UTC+6)","tzKrasnoyarsk":"क्रास्नोयार्स्क क्राय (UTC+7)","tzIrkutsk":"इर्कुत्स्क ओब्लास्ट (UTC+8)","tzSakha":"सखा गणराज्य (UTC+9)","tzPrimorsky":"प्राइमोरस्की क्राय (UTC+10)","tzMagadan":"मगादान ओब्लास्ट (UTC+11)","tzKamchatka":"कमचटका क्राय (UTC+12)","dstDayStartsLabel":"डेलाइट समय शुरू होता है","dstDayEndsLabel":"डेलाइट समय समाप्त होता है","dstRevertsLabel":"मानक समय पर वापसी","dstEuropeLabel":"यूरोप","dstNewZealandLabel":"न्यूज़ीलैंड","englishResponseNotice":"सूचना: सभी पूछताछ का उत्तर अंग्रेजी में दिया जाता है। यदि आप किसी अन्य भाषा में सबमिट करते हैं, तो सत्यापन के लिए आपके संदेश का अंग्रेजी में अनुवाद किया जा सकता है।","parcelDisagreeCheckbox":"मैं सहमत नहीं हूं","contactDisagreeCheckbox":"मैं सहमत नहीं हूं","contactNamePlaceholder":"उदाहरण: राजेश कुमार","systemRequirementsTitle":"न्यूनतम समर्थित सिस्टम संस्करण","systemRequirements":"Windows: Windows 7 (with ESU updates installed) या ऊपर\nmacOS: macOS 12 या ऊपर\nAndroid: Android 13 या ऊपर\niPhone/iOS: iOS 17 या ऊपर\nLinux: सक्रिय सुरक्षा अपडेट के साथ वर्तमान में समर्थित वितरण","title":"पहुंच सत्यापित करें","subtitle":"कृपया जारी रखने के लिए नीचे दी गई चुनौती पूरी करें।","selectLanguage":"भाषा चुनें","selectLanguagePlaceholder":"-- एक भाषा चुनें --","loadingChallenge":"चुनौती लोड हो रही है...","answerLabel":"आपका उत्तर:","answerPlaceholder":"अपना उत्तर दर्ज करें","continueButton":"जारी रखें","refreshButton":"नई चुनौती","verifying":"सत्यापन हो रहा है...","chooseLanguageFirst":"कृपया पहले एक भाषा चुनें।","loadFailed":"चुनौती लोड करने में विफल। कृपया पुनः प्रयास करें।","expiredChallenge":"चुनौती समाप्त हो गई। नई चुनौती लोड हो रही है...","verifyFailed":"सत्यापन विफल रहा। कृपया पुनः प्रयास करें।","goodFridayEasterGreeting":"ईस्टर की शुभकामनाएँ! गुड फ्राइडे और ईस्टर पर शांति और खुशी की कामना।","christmasGreeting":"क्रिसमस और नव वर्ष की शुभकामनाएँ! 25 दिसंबर से 5 जनवरी तक शांति और खुशी की कामना।","captchaSystemRequirements":"न्यूनतम सिस्टम आवश्यकताएँ: Windows 7 (with ESU updates installed) या 11, macOS 10.15+, या Android/iOS का नवीनतम संस्करण।","home":"होम","blog":"ब्लॉग","aboutUs":"हमारे बारे में","faq":"अक्सर पूछे जाने वाले प्रश्न","contact":"संपर्क करें","trackPackage":"पार्सल ट्रैक करें","cnyYearOfHorseMessage":"🧧 लूनर न्यू ईयर की शुभकामनाएँ! घोड़े के वर्ष में समृद्धि और खुशी की कामना है! 🐴","diwaliMessage":"🪔 दीपावली की शुभकामनाएँ! प्रकाश का त्योहार आपके जीवन में खुशियाँ और समृद्धि लाए! ✨","singaporeNationalDayMessage":"🇸🇬 सिंगापुर राष्ट्रीय दिवस की शुभकामनाएँ! 61 वर्षों की स्वतंत्रता का उत्سव! 🎉","indonesiaNationalDayMessage":"🇮🇩 इंडोनेशिया स्वतंत्रता दिवस की शुभकामनाएँ! गणतंत्र इंडोनेशिया की जय! 🎊","malaysiaNationalDayMessage":"🇲🇾 मलेशिया राष्ट्रीय दिवस की शुभकामनाएँ! हमारे देश की स्वतंत्रता का जश्न! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! रूस दिवस की शुभकामनाएँ! 🎉","taiwanFoundingDayMessage":"🇹🇼 ताइवान स्थापना दिवस की शुभकामनाएँ! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 ताइवान दोहरा दस दिवस की शुभकामनाएँ! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 हांगकांग विशेष प्रशासनिक क्षेत्र स्थापना दिवस की शुभकामनाएँ! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 मकाउ विशेष प्रशासनिक क्षेत्र स्थापना दिवस की शुभकामनाएँ! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ अंतर्राष्ट्रीय श्रमिक दिवस की शुभकामनाएँ! श्रम और श्रमिकों के अधिकारों का जश्न! 🎊","laborDayUSCAMessage":"⚒️ श्रम दिवस की शुभकामनाएँ! श्रमिकों के योगदान का सम्मान! 🎉","orderNumber":"ऑर्डर नंबर (उदाहरण: RTNX1234567890)","fromDate":"से तारीख (आवश्यक)","toDate":"तक तारीख (आवश्यक)","trackParcel":"पार्सल ट्रैक करें","selectCourier":"-- कूरियर / देश चुनें --","optionSingPost":"🇸🇬 सिंगापुर पोस्ट (SingPost)","singaporeCouriers":"सिंगापुर कूरियर","topCountries":"शीर्ष 5 देश","otherCountries":"अन्य देश","note":"नोट","disclaimer":"अस्वीकरण","importantInformation":"महत्वपूर्ण जानकारी:","didNotReceiveEmail":"यदि आपको Etsy, eBay, Shopee या Payhip से अपना पुष्टि ईमेल प्राप्त नहीं हुआ है, तो इस आदेश से जुड़े अपने ईमेल पते या फ़ोन नंबर के माध्यम से अपने आदेश को खोजने के लिए नीचे स्क्रॉल करें।","searchByEmailOrPhone":"ईमेल या फोन से खोजें","searchOrder":"ऑर्डर खोजें","trackingResult":"ट्रैकिंग परिणाम","noOrdersFound":"कोई ऑर्डर नहीं मिला।","pleaseEnter":"कृपया ईमेल, फोन नंबर या ऑर्डर नंबर दर्ज करें।","fillAllFields":"कृपया सभी आवश्यक फ़ील्ड भरें: ट्रैकिंग नंबर, गंतव्य देश, ऑर्डर नंबर और पिन कोड।","noOrderMatchingFields":"सभी फ़ील्ड से मेल खाने वाला कोई ऑर्डर नहीं मिला।","postcodeRequired":"इस गंतव्य के लिए पिन कोड आवश्यक है।","invalidUSZip":"अमान्य यूएस ZIP कोड। 5 अंकों या ZIP+4 का उपयोग करें।","failedGenerateURL":"ट्रैकिंग URL बनाने में विफल। कृपया इनपुट जांचें।","trackingValidationSG":"सिंगापुर के लिए ट्रैकिंग नंबर होना चाहिए: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG या PX123456789SG। DHL शिपमेंट के लिए 10-अंकीय नंबर का उपयोग करें।","invalidSingPostFormat":"अमान्य SingPost ट्रैकिंग नंबर प्रारूप।\nस्वीकार्य प्रारूप:\n• PP123456789SG → प्रीपेड ट्रैक्ड लेबल\n• SPNDD00012345 → SpeedPost मानक ट्रैकिंग","welcomeTitle":"Rhythm Nexus की वेबसाइट में आपका स्वागत है!","purchaseInfo":"हमारे आधिकारिक चैनलों से खरीदें, या हमारे","purchaseInfoChina":"हमारे आधिकारिक चैनलों से खरीदें।","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram समूह","forUpdates":"में शामिल हों आधिकारिक अपडेट के लिए।","ourStores":"हमारे स्टोर","etsyStore":"Etsy स्टोर","ebayStore":"eBay स्टोर","shopeeStore":"Shopee स्टोर","payhipStore":"Payhip स्टोर","internationalShipping":"अंतर्राष्ट्रीय शिपिंग","singaporeLocal":"सिंगापुर स्थानीय","asiaOnly":"केवल एशिया","deliveryInfo":"वितरण जानकारी","deliveryRates2026":"वितरण दरें 2026","sgDeliveryRates":"सिंगापुर वितरण दरें","speedPostRates":"SpeedPost Express अंतर्राष्ट्रीय दरें","aboutTitle":"Rhythm Nexus के बारे में","aboutP1":"हमने 2022 में अपना स्टोर शुरू किया और Etsy, eBay और Shopee पर बेचा है।","aboutP2":"हमने विश्वसनीय पूर्ति और सटीक ट्रैकिंग पर ध्यान केंद्रित करके एक मजबूत प्रतिष्ठा बनाई है।","aboutP3":"हमारा लक्ष्य एक सहज और विश्वसनीय खरीदारी अनुभव प्रदान करना है।","aboutP4":"Rhythm Nexus का समर्थन करने के लिए धन्यवाद।","faqTitle":"अक्सर पूछे जाने वाले प्रश्न","faqQ1":"यदि मेरा आइटम दोषपूर्ण है तो क्या? कोई वारंटी है?","faqA1":"हाँ! अधिकांश ऑर्डर 1 साल की वारंटी के साथ आते हैं। कृपया अपना चालान/ऑर्डर नंबर प्रदान करें ताकि हम जांच कर सकें। नोट: यदि आइटम विवरण से मेल खाता है, तो एक्सचेंज की अनुमति नहीं है, भले ही आपने गलत ऑर्डर किया हो।","faqQ2":"क्या मैं अपना ऑर्डर संपादित, अपडेट या रद्द कर सकता हूं?","faqA2":"हाँ। सुरक्षा के लिए, ऑर्डर परिवर्तन ईमेल के माध्यम से या हमारे संपर्क फ़ॉर्म पर संभाले जाने की आवश्यकता हो सकती है।","faqQ3":"क्या मुझे सीमा शुल्क/आयात कर देना होगा?","faqA3":"सीमा शुल्क और कर्तव्य आम तौर पर पूर्व भुगतान नहीं होते हैं, संयुक्त राज्य अमेरिका के लिए DDP को छोड़कर। EU, UK, AU/NZ, नॉर्वे, स्विट्जरलैंड, और कनाडाई प्रांतों जैसे Saskatchewan और Manitoba के लिए VAT लागू हो सकता है, जो पहले से डिफ़ॉल्ट रूप से भुगतान किया जाता है। सिंगापुर के लिए कोई GST लागू नहीं होता है। हम सीमा शुल्क शुल्क पर सलाह नहीं दे सकते - विवरण के लिए अपने स्थानीय सीमा शुल्क से संपर्क करें।","faqQ4":"मेरा ऑर्डर कब शिप होगा?","faqA4":"ऑर्डर आमतौर पर 1-5 व्यावसायिक दिनों के भीतर भेजे जाते हैं। उच्च मात्रा अवधि के दौरान, इसमें 5-7 दिन लग सकते हैं।","faqQ5":"मैंने गलती से दो बार ऑर्डर कर दिया। मुझे क्या करना चाहिए?","faqA5":"हम केवल डुप्लिकेट शिपिंग शुल्क वापस करते हैं। दोनों आइटम एक साथ भेजे जाएंगे। धनवापसी = (पहला + दूसरा शिपिंग शुल्क) - वास्तविक शिपिंग शुल्क।","faqQ6":"डिलीवरी में कितना समय लगता है?","faqA6":"प्रसंस्करण में 1-5 व्यावसायिक दिन लगते हैं।\n\nघरेलू शिपिंग:\n• SingPost प्रीपेड ट्रैक्ड लेबल: 2–4 दिन\n• SpeedPost मानक: 1–3 दिन\n\nअंतर्राष्ट्रीय:\n• SingPost ePAC: 14-30 दिन\n• SpeedPost Priority (EMS): 8-15 दिन\n• SpeedPost Express: 4-8 दिन\n\nपीक सीज़न के दौरान देरी हो सकती है।","faqQ7":"मेरा आइटम प्रेषक को वापस भेजा जा रहा है। मुझे क्या करना चाहिए?","faqA7":"एक पुनः शिपमेंट की अनुमति है। अमान्य पते, अदावा पार्सल, या अवैतनिक सीमा शुल्क शुल्क के लिए रद्दीकरण संभव नहीं है। पुनर्वितरण के लिए अपनी डाक सेवा से संपर्क करें, या सहायता के लिए हमें संदेश भेजें।","faqQ8":"मेरा आइटम ट्रांजिट में खो गया / चोरी हो गया।","faqA8":"हम एक पुनः शिपमेंट की अनुमति देते हैं। यदि यह फिर से खो जाता है, तो कूरियर की डिलीवरी विंडो के बाद पूर्ण धनवापसी जारी की जाती है:\n\n• सिंगापुर स्थानीय सेवाएं: 7 दिन\n• SingPost ePAC और SpeedPost Priority अंतर्राष्ट्रीय: 30 दिन\n• SpeedPost अंतर्राष्ट्रीय Express: 14 दिन","blogTitle":"शिपिंग और डाक ज्ञान आधार","blogSubtitle":"डाक सेवाओं पर आधिकारिक स्पष्टीकरण।","readMore":"और पढ़ें","backButton":"वापस","blogPost1Title":"SingPost ePAC क्या है?","blogPost1Desc":"ePAC के बारे में जानें।","blogPost2Title":"SpeedPost Priority International (EMS) क्या है?","blogPost2Desc":"EMS की खोज करें।","blogPost3Title":"SpeedPost Express क्या है?","blogPost3Desc":"SpeedPost Express का अन्वेषण करें।","blogPost4Title":"USA PDDP","blogPost4Desc":"PDDP को समझें।","blogPost5Title":"EU VAT & IOSS","blogPost5Desc":"EU VAT पर अंतर्दृष्टि।","blogPost6Title":"UK VAT & HMRC","blogPost6Desc":"यूके VAT आवश्यकताएं।","blogPost7Title":"नॉर्वे VOEC","blogPost7Desc":"नॉर्वे VOEC प्रणाली।","blogPost8Title":"स्विस VAT","blogPost8Desc":"स्विस VAT आवश्यकताएं।","enterDestinationPostcode":"गंतव्य पिन कोड दर्ज करें","trackingNumberExample":"उदा.: LG123456789SG","trackingCaseSensitive":"ट्रैकिंग अक्षर केस-संवेदी हैं और बड़े अक्षरों में होने चाहिए।","usaPostcodeNote":"बिना पिन कोड वाले देशों के लिए, जैसे हांगकांग और मकाऊ, कृपया 999077 (हांगकांग) या 999078 (मकाऊ) डालें।","epacDeliveryNote":"कृपया ध्यान दें कि गंतव्य पर भेजे गए सभी ePAC आइटम आपके मेलबॉक्स, दरवाजे, पार्सल लॉकर में वितरित किए जाने चाहिए या एक सुरक्षित स्थान पर छोड़े जाने चाहिए!","currentTime":"वर्तमान समय","timezoneNote":"समय 12 घंटे के प्रारूप में दिखाया गया है","sameTimeAsSingapore":"सिंगापुर के समान समय","hourAhead":"घंटा सिंगापुर से आगे","hoursAhead":"घंटे सिंगापुर से आगे","hourBehind":"घंटा सिंगापुर से पीछे","hoursBehind":"घंटे सिंगापुर से पीछे","countriesNoMailbox":"जिन देशों में मेलबॉक्स/लेटरबॉक्स डिलीवरी अनुपलब्ध है: ब्रुनेई, चीन, भारत, इज़राइल, मकाऊ SAR चीन, फिलीपींस, पोलैंड और वियतनाम।","rhythmNexusNotResponsible":"Rhythm Nexus डिलीवरी को संभालने के लिए जिम्मेदार नहीं है क्योंकि यह हमारे नियंत्रण से बाहर है और हम चाहेंगे कि आप इसके बजाय अपने आइटम की स्थिति को ट्रैक करें।","issuesAfterDelivery":"आपकी डिलीवरी के साथ 30/45 दिनों के बाद (SpeedPost Express के लिए 14 दिन) या स्थिति डिलीवर हो गई दिखाती है लेकिन आपको प्राप्त नहीं हुआ, तो कृपया हमसे संपर्क करें","cannotUseEmbed":"हम ट्रैकिंग के लिए एम्बेड का उपयोग नहीं कर सकते क्योंकि अधिकांश डाक सेवा वेबसाइटें इसका समर्थन नहीं करती हैं।","clickLinkAbove":"कृपया अपने पार्सल को ट्रैक करने के लिए ऊपर दिए गए लिंक पर क्लिक करें।","trackingDetailsNote":"ध्यान दें कि ट्रैकिंग विवरण खोज परिणामों में प्रदर्शित नहीं हो सकते हैं, इसलिए आइटम को ट्रैक करने के लिए ट्रैकिंग नंबर को सिस्टम में पेस्ट करने की अनुशंसा की जाती है।","thirdPartyWebsites":"आप इन तृतीय-पक्ष वेबसाइटों पर भी अपने पार्सल को ट्रैक कर सकते हैं:","enterEmailOrPhone":"ईमेल या फोन दर्ज करें","collectAtPostOffice":"हालाँकि, यदि आपके देश में मानक रूप से मेलबॉक्स उपलब्ध नहीं है, तो आपको इसे डाकघर से एकत्र करना होगा।","reviewShippingRates":"हमारी वर्तमान शिपिंग दरों की समीक्षा करें","here":"यहाँ","contactUsForm":"कृपया हमसे इस","form":"फ़ॉर्म","forEnquiries":"के माध्यम से अपने ऑर्डर के बारे में किसी भी पूछताछ के लिए संपर्क करें।","anPostNoDirectTracking":"An Post (आयरलैंड) सीधे ट्रैकिंग लिंक या एम्बेडेड ट्रैकिंग का समर्थन नहीं करता है।","anPostPasteManually":"कृपया An Post वेबसाइट पर अपना ट्रैकिंग नंबर मैन्युअल रूप से पेस्ट करें।","goToAnPost":"An Post पर जाएं","countryMsgNL":"यदि स्थिति 'Held by Customs' दिखाती है, तो कृपया सहायता के लिए नीदरलैंड कस्टम सूचना लाइन से संपर्क करें:\n0800 0143 (मुफ्त), सोमवार से शुक्रवार सुबह 7 बजे से रात 11 बजे तक।\nशनिवार और रविवार सुबह 8 बजे से शाम 4:30 बजे तक।\n\nआपको PostNL के साथ खाता पंजीकृत करने के लिए प्रोत्साहित किया जाता है ताकि आपके पैकेज की तुरंत पुश सूचना प्राप्त हो:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nयदि यह PostNL पॉइंट पर डिलीवर किया जा रहा है या स्थिति आपको पोस्ट ऑफिस पर एकत्र करने के लिए कहती है, तो आपको काउंटर पर 7 EUR देना होगा। ऑनलाइन भुगतान करने पर अधिकतम 4 EUR।","countryMsgDE":"हम आपको अपने पैकेज की ट्रैकिंग स्थिति के पुश नोटिफिकेशन प्राप्त करने के लिए Post & DHL ऐप डाउनलोड करने के लिए प्रोत्साहित करते हैं:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH ग्राहक सेवा संपर्क:\n+49-228-433-3112\nDHL DE संपर्क: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"आपको सीमा शुल्क को अतिरिक्त आयात घोषणा जमा करनी होगी। एसा न करने से प्रवेश प्रतिबंध और पैकेज वापस किए जाने का परिणाम हो सकता है। \nअधिक जानकारी: https://www.posti.fi/en/receiving/customs-clearance \nअन्य लिंक: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"4.95 EUR का हैंडलिंग शुल्क लिया जाता है।\nऐप यहाँ डाउनलोड करें: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"8.50 PLN का हैंडलिंग शुल्क लिया जाता है। \nआपको पोस्ट ऑफिस में संग्रह पर इसे अदा करना होगा,\nक्योंकि पार्सल को आपके घर के दरवाजे या मेलबॉक्स पर डिलीवर करने की संभावना नहीं है।","countryMsgPH":"PHLPost को फिलीपींस में अकुशल और अविश्वसनीय माना जाता है।\nहमेशा अपने पार्सल का पता लगाएं क्योंकि कभी-कभी डिलीवरी के लिए बाहर की स्थिति\nछोटे पार्सल के लिए केवल 1 से 3 सप्ताह के बीच दिखाई देती है। बड़े पार्सल के लिए, \nसंग्रह केवल मनिला सेंट्रल पोस्ट ऑफिस या आपके क्षेत्र में निकटतम\nपोस्ट ऑफिस के माध्यम से संभव है। कृपया ध्यान दें कि किसी भी मूल्य के पार्सल के लिए 112PHP का हैंडलिंग शुल्क लागू होता है\nजिसे आपको अदा करने की आवश्यकता होगी। भुगतान करने में विफलता के परिणामस्वरूप पार्सल\nहमें वापस कर दिया जाएगा। PHLPost की सेवाओं की धीमी गति के कारण डिलीवरी का अनुमान 1-2 महीने है। \n10000PHP से कम वस्तुओं के लिए आपको कर देने की जरूरत नहीं है, लेकिन यदि यह उस राशि के बराबर या उससे अधिक है तो आपको आवश्यकता होगी। \nहम अगली बार जब आप हमसे ऑर्डर करें तो तेजी से प्रक्रिया के लिए SpeedPost Express की सिफारिश करेंगे। हालांकि, शुल्क लागू नहीं हो सकते हैं क्योंकि प्राप्तकर्ता के लिए D&T डिफ़ॉल्ट रूप से है।","countryMsgCA":"कनाडा भेजे गए सभी ऑर्डर के लिए de minimis 20CAD है। चूंकि सिंगापुर CPTPP समझौते का हिस्सा है, शुल्क लागू नहीं हो सकते हैं, लेकिन D&T लागू हो सकता है यदि वस्तु 60CAD और उससे अधिक या 100CAD और उससे अधिक की सीमा से अधिक है, जो वस्तु के HS कोड पर निर्भर कर सकता है। उस राशि से अधिक की कोई भी राशि को तदनुसार VAT लिया जाएगा।","countryMsgID":"आपको इंडोनेशिया पहुंचने पर कोई भी लागू कर और शुल्क का भुगतान करना होगा। कृपया अपने पार्सल का पता लगाएं और इंडोनेशियाई सीमा शुल्क को निर्दिष्ट राशि का भुगतान करें।\nआपको अतिरिक्त क्लीयरेंस कागजात भी जमा करने की आवश्यकता होगी। एसा न करने से प्रवेश प्रतिबंध या देश के सीमा शुल्क द्वारा पैकेज की जब्ती हो सकती है। कृपया यहां अधिक विवरण देखें:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"आपको भारत पहुंचने पर कोई भी लागू कर और शुल्क का भुगतान करना होगा। कृपया अपने पार्सल का पता लगाएं और भारतीय सीमा शुल्क को निर्दिष्ट राशि का भुगतान करें।\nकृपया ध्यान दें कि भारत में सीमा शुल्क क्लीयरेंस कठोर है और यदि आपकी वस्तु का मूल्य 1000INR (15 USD) से अधिक है तो आपसे शुल्क लिया जा सकता है या नहीं - HS कोड पर निर्भर करते हुए, अधिकांश मामलों में यह शुल्क मुक्त है, लेकिन यदि वस्तु 5000INR (60 USD) से अधिक है तो आपसे अधिक शुल्क लिया जा सकता है। \nचूंकि India Post मानक रूप से मेलबॉक्स में डिलीवर नहीं करता है, आपको अपने पैकेज को प्राप्त करने के लिए घर पर रहना पड़ सकता है या एक अधिकृत प्रतिनिधि की आवश्यकता हो सकती है या पोस्ट ऑफिस में संग्रह करना पड़ सकता है।","countryMsgMY":"मलेशिया भेजे गए सभी ऑर्डर के लिए de minimis 500MYR है। उस राशि से अधिक के ऑर्डर चार्ज किए जा सकते हैं।","countryMsgUS":"29 अगस्त 2025 से, USD800 का de minimis आधिकारिक रूप से हटा दिया जाएगा और आयात शुल्क मूल देश में प्रेषक द्वारा डिफ़ॉल्ट रूप से देय होगा।\nUSA शिपिंग के लिए आपके पार्सल को आगे की देरी से बचने के लिए एक वैध फ़ोन नंबर और ईमेल पता की आवश्यकता होगी।","countryMsgIL":"इज़राइल भेजे गए सभी ऑर्डर के लिए de minimis 240 ILS (75 USD) है। उस राशि से अधिक के ऑर्डर चार्ज किए जा सकते हैं। \nकृपया ध्यान दें कि इज़राइल भेजे गए ऑर्डर के लिए, Israel Post कभी-कभी डिलीवर होने के बाद अंतिम डिलीवरी को स्वीकार नहीं कर सकता है। \nचूंकि Israel Post मानक रूप से मेलबॉक्स में डिलीवर नहीं करता है, आपको अपने पैकेज को प्राप्त करने के लिए घर पर रहना पड़ सकता है या एक अधिकृत प्रतिनिधि की आवश्यकता हो सकती है या पोस्ट ऑफिस में संग्रह करना पड़ सकता है।","countryMsgGB":"कृपया ध्यान दें कि UK भेजे गए ऑर्डर के लिए, Royal Mail कभी-कभी आपके मेलबॉक्स में डिलीवर होने के बाद अंतिम डिलीवरी को स्वीकार नहीं कर सकता है।","countryMsgTH":"थाईलैंड भेजे गए सभी ऑर्डर के लिए de minimis 1500THB (45 USD) है। उस राशि से अधिक के ऑर्डर चार्ज किए जा सकते हैं।","countryMsgTW":"ताइवान भेजे गए सभी ऑर्डर के लिए de minimis 2000TWD (60 USD) है। उस राशि से अधिक के ऑर्डर चार्ज किए जा सकते हैं।","countryMsgMO":"मकाउ भेजते समय कोई D&T नहीं लिया जाता है। लेकिन कृपया ध्यान दें कि Macau Post मानक रूप से मेलबॉक्स में डिलीवर नहीं करता है, आपको पोस्ट ऑफिस में अपने पैकेज को लेने की आवश्यकता होगी।","countryMsgBN":"ब्रुनेई भेजते समय कोई D&T नहीं लिया जाता है। लेकिन कृपया ध्यान दें कि Brunei Post मानक रूप से मेलबॉक्स में डिलीवर नहीं करता है, आपको पोस्ट ऑफिस में अपने पैकेज को लेने की आवश्यकता होगी। \nइस देश के लिए ट्रैकिंग सिस्टम बहुत स्थिर नहीं है और केवल सीमित जानकारी दी जा सकती है, और अंतिम डिलीवरी के परिणाम मूल को नहीं दिए जाते हैं।","countryMsgJP":"जापान भेजे गए सभी ऑर्डर के लिए de minimis 10000JPY (65 USD) है। उस राशि से अधिक के ऑर्डर चार्ज किए जा सकते हैं।","countryMsgKR":"दक्षिण कोरिया भेजे गए सभी ऑर्डर के लिए de minimis 180000KRW (150 USD) है। उस राशि से अधिक के ऑर्डर चार्ज किए जा सकते हैं।","countryMsgVN":"वियतनाम के लिए, कृपया डिलीवरी के दौरान संपर्कीय बने रहें क्योंकि आपसे वस्तु की डिलीवरी पर हैंडलिंग शुल्क लिया जा सकता है। \nवियतनाम भेजे गए सभी ऑर्डर के लिए de minimis 1000000 (35 USD) है। उस राशि से अधिक के ऑर्डर चार्ज किए जा सकते हैं। \nचूंकि Vietnam Post मानक रूप से मेलबॉक्स में डिलीवर नहीं करता है, आपको अपने पैकेज को प्राप्त करने के लिए घर पर रहना पड़ सकता है या एक अधिकृत प्रतिनिधि की आवश्यकता हो सकती है या पोस्ट ऑफिस में संग्रह करना पड़ सकता है।","countryMsgPP":"Tracked Label वस्तुओं को पोस्ट ऑफिस में POPDrop/POPStop में पोस्ट किया जाएगा। SpeedPost Standard वस्तुएं आमतौर पर POPStop या POPStation पर पोस्ट की जाती हैं।\nकृपया ध्यान दें कि Tracked Label वस्तुओं की डिलीवरी केवल सोमवार से शुक्रवार सुबह 9 बजे से शाम 6 बजे तक की जाएगी। सप्ताहांत और सार्वजनिक छुट्टियों को छोड़कर।","postedDate":"भेजने की तारीख:","status":"स्थिति:","shippedVia":"के माध्यम से भेजा गया:","destination":"गंतव्य:","statusInPreparation":"तैयारी में","statusInTransit":"ट्रांजिट में","statusDelivered":"डिलीवर किया गया","statusOutForDelivery":"डिलीवरी के लिए निकला","statusArrived":"पहुंचा","statusProcessing":"प्रोसेसिंग में","statusDispatched":"भेजा गया","statusReturned":"लौटाया गया","statusFailed":"डिलीवरी विफल","statusCancelled":"रद्द किया गया","statusHeldByCustoms":"सीमा शुल्क द्वारा रोका गया","statusAwaitingCollection":"संग्रह की प्रतीक्षा में","aka":"के रूप में भी जाना जाता है","thisServiceKnownAs":"इस सेवा को जाना जाता है","in":"में","viewTrackingDHL":"DHL Express से ट्रैकिंग जानकारी देखें","viewTrackingSingPostSpeedPost":"Singapore SpeedPost से ट्रैकिंग जानकारी देखें","viewTrackingDHLLastMile":"DHL Express (अंतिम मील) से ट्रैकिंग जानकारी देखें","viewTrackingDHLShipperRef":"DHL Express (प्रेषक संदर्भ) से ट्रैकिंग जानकारी देखें","viewTrackingSingPost":"Singapore Post से ट्रैकिंग जानकारी देखें","viewTrackingDestPost":"से ट्रैकिंग जानकारी देखें","post":"डाक","orderNumberExample":"ऑर्डर नंबर (RTNX से शुरू होता है - उदाहरण: RTNX1234567890):","deliveryRecordNote":"ध्यान दें कि आइटम डिलीवर हो जाने के बाद, रिकॉर्ड केवल 7 दिनों तक संग्रहीत किया जाएगा और हटा दिया जाएगा।","copyrightAllRights":"सर्वाधिकार सुरक्षित।","countryAF":"अफ़ग़ानिस्तान","countryAL":"अल्बानिया","countryDZ":"अल्जीरिया","countryAS":"अमेरिकी समोआ","countryAD":"अंडोरा","countryAO":"अंगोला","countryAI":"एंग्विला","countryAQ":"अंटार्कटिका","countryAG":"एंटीगुआ और बारबुडा","countryAR":"अर्जेंटीना","countryAM":"आर्मेनिया","countryAW":"अरूबा","countryAU":"🇦🇺 ऑस्ट्रेलिया","countryAT":"🇦🇹 ऑस्ट्रिया","countryAZ":"अज़रबैजान","countryBS":" बहामास","countryBH":"बहरीन","countryBD":"बांग्लादेश","countryBB":"बारबाडोस","countryBY":"बेलारूस","countryBE":"🇧🇪 बेल्जियम","countryBZ":"बेलीज","countryBJ":"बेनिन","countryBM":"बरमूडा","countryBT":"भूटान","countryBO":"बोलीविया","countryBA":"बोस्निया और हर्जेगोविना","countryBW":"बोत्सवाना","countryBV":"बौवेट द्वीप","countryBR":"ब्राज़ील","countryIO":"ब्रिटिश हिंद महासागर क्षेत्र","countryBN":"🇧🇳 ब्रुनेई","countryBG":"बुल्गारिया","countryBF":"बुर्किना फासो","countryBI":"बुरुंडी","countryKH":"कंबोडिया","countryCM":"कैमरून","countryCA":"🇨🇦 कनाडा","countryCV":"केप वर्डे","countryKY":"केमैन द्वीपसमूह","countryCF":"मध्य अफ़्रीकी गणराज्य","countryTD":"चाड","countryCL":"चिली","countryCN":"🇨🇳 चीन","countryCX":"क्रिसमस द्वीप","countryCC":"कोकोस (कीलिंग) द्वीपसमूह","countryCO":"कोलम्बिया","countryKM":"कोमोरोस","countryCG":"कांगो","countryCD":"कांगो (डीआरसी)","countryCK":"कुक्स द्वीपसमूह","countryCR":"कोस्टा रिका","countryCI":"कोटे डी आइवर","countryHR":"क्रोएशिया","countryCU":"क्यूबा","countryCY":"साइप्रस","countryCZ":"🇨🇿 चेकिया","countryDK":"डेनमार्क","countryDJ":"जिबूती","countryDM":"डोमिनिका","countryDO":"डोमिनिकन गणराज्य","countryEC":"इक्वाडोर","countryEG":"मिस्र","countrySV":"अल साल्वाडोर","countryGQ":"इक्वेटोरियल गिनी","countryER":"इरिट्रिया","countryEE":"एस्टोनिया","countryET":"इथियोपिया","countryFK":"फ़ॉकलैंड द्वीपसमूह","countryFO":"फ़रो द्वीपसमूह","countryFJ":"फ़िजी","countryFI":"🇫🇮 फ़िनलैंड","countryFR":"🇫🇷 फ़्रांस","countryGF":"फ्रेंच गुयाना","countryPF":"फ्रेंच पोलिनेशिया","countryTF":"फ्रेंच दक्षिणी क्षेत्र","countryGA":"गैबोन","countryGM":"गाम्बिया","countryGE":"जॉर्जिया","countryDE":"🇩🇪 जर्मनी","countryGH":"घाना","countryGI":"जिब्राल्टर","countryGR":"ग्रीस","countryGL":"ग्रीनलैंड","countryGD":"ग्रेनेडा","countryGP":"गुआदेलूप","countryGU":"गुआम","countryGT":"ग्वाटेमाला","countryGN":"गिनी","countryGW":"गिनी-बिसाऊ","countryGY":"गुयाना","countryHT":"हैट","countryHM":"हर्ड द्वीप और मैकडोनाल्ड द्वीपसमूह","countryVA":"वेटिकन सिटी","countryHN":"होंडुरास","countryHK":"🇭🇰 हांगकांग एसएआर","countryHU":"हंगरी","countryIS":"आइसलैंड","countryIN":"🇮🇳 भारत","countryID":"🇮🇩 इंडोनेशिया","countryIR":"ईरान","countryIQ":"इराक","countryIE":"🇮🇪 आयरलैंड","countryIL":"🇮🇱 इज़राइल","countryIT":"🇮🇹 इटली","countryJM":"जमैका","countryJP":"🇯🇵 जापान","countryJO":"जॉर्डन","countryKZ":"कजाखस्तान","countryKE":"केन्या","countryKI":"किरिबाती","countryKP":"उत्तर कोरिया","countryKR":"🇰🇷 दक्षिण कोरिया","countryKW":"कुवैत","countryKG":"किर्गिस्तान","countryLA":"लाओस","countryLV":"लातविया","countryLB":"लेबनान","countryLS":"लेसोथो","countryLR":"लाइबेरिया","countryLY":"लीबिया","countryLI":"लिकटेंस्टीन","countryLT":"लिथुआनिया","countryLU":"लक्ज़मबर्ग","countryMO":"🇲🇴 मकाऊ एसएआर","countryMK":"उत्तरी मैसेडोनिया","countryMG":"मेडागास्कर","countryMW":"मलावी","countryMY":"🇲🇾 मलेशिया","countryMV":"मालदीव","countryML":"माली","countryMT":"माल्टा","countryMH":"मार्शल द्वीपसमूह","countryMQ":"मार्टीनिक","countryMR":"मॉरिटानिया","countryMU":"मॉरीशस","countryYT":"मायोट","countryMX":"मेक्सिको","countryFM":"माइक्रोनेशिया","countryMD":"मोल्दोवा","countryMC":"मोनाको","countryMN":"मंगोलिया","countryME":"मोंटेनेग्रो","countryMS":"मोंटसेराट","countryMA":"मोरक्को","countryMZ":"मोज़ाम्बिक","countryMM":"म्यांमार","countryNA":"नामीबिया","countryNR":"नाउरू","countryNP":"नेपाल","countryNL":"🇳🇱 नीदरलैंड","countryAN":"नीदरलैंड एंटीलिज","countryNC":"न्यू कैलेडोनिया","countryNZ":"🇳🇿 न्यूजीलैंड","countryNI":"निकारागुआ","countryNE":"नाइजर","countryNG":"नाइजीरिया","countryNU":"नीयू","countryNF":"नॉरफ़ॉक द्वीप","countryMP":"उत्तरी मारियाना द्वीपसमूह","countryNO":"🇳🇴 नॉर्वे","countryOM":"ओमान","countryPK":"पाकिस्तान","countryPW":"पलाऊ","countryPS":"फिलिस्तीनी क्षेत्र","countryPA":"पनामा","countryPG":"पापुआ न्यू गिनी","countryPY":"पैराग्वे","countryPE":"पेरू","countryPH":"🇵🇭 फिलीपींस","countryPN":"पिटकेर्न","countryPL":"🇵🇱 पोलैंड","countryPT":"🇵🇹 पुर्तगाल","countryPR":"प्यूर्टो रिको","countryQA":"कतर","countryRE":"रीयूनियन","countryRO":"रोमानिया","countryRU":"🇷🇺 रूस","countryRW":"रवांडा","countrySH":"सेंट हेलेना","countryKN":"सेंट किट्स और नेविस","countryLC":"सेंट लूसिया","countryPM":"सेंट पियरे और मिकेलॉन","countryVC":"सेंट विंसेंट और ग्रेनेडाइंस","countryWS":"समोआ","countrySM":"सैन मैरिनो","countryST":"साओ तोमे और प्रिंसिपे","countrySA":"सऊदी अरब","countrySN":"सेनेगल","countryRS":"सर्बिया","countrySC":"सेशेल्स","countrySL":"सिएरा लियोन","countrySG":"🇸🇬 सिंगापुर","countrySK":"स्लोवाकिया","countrySI":"स्लोवेनिया","countrySB":"सोलोमन द्वीपसमूह","countrySO":"सोमालिया","countryZA":"दक्षिण अफ्रीका","countryGS":"दक्षिण जॉर्जिया और दक्षिण सैंडविच द्वीपसमूह","countryES":"🇪🇸 स्पेन","countryLK":"श्रीलंका","countrySD":"सूडान","countrySR":"सूरीनाम","countrySJ":"स्वालबार्ड और जान मायेन","countrySZ":"एस्वातीनी","countrySE":"🇸🇪 स्वीडन","countryCH":"🇨🇭 स्विट्ज़रलैंड","countrySY":"सीरिया","countryTW":"🇹🇼 ताइवान","countryTJ":"ताजिकिस्तान","countryTZ":"तंजानिया","countryTH":"🇹🇭 थाईलैंड","countryTL":"तिमोर-लेस्ते","countryTG":"टोगो","countryTK":"टोकेलाऊ","countryTO":"टोंगा","countryTT":"त्रिनिदाद और टोबैगो","countryTN":"ट्यूनीशिया","countryTR":"तुर्की","countryTM":"तुर्कमेनिस्तान","countryTC":"तुर्क और कैकोस द्वीपसमूह","countryTV":"तुवालु","countryUG":"युगांडा","countryUA":"यूक्रेन","countryAE":"संयुक्त अरब अमीरात","countryGB":"🇬🇧 यूनाइटेड किंगडम","countryUS":"🇺🇸 संयुक्त राज्य अमेरिका","countryUM":"यूएस माइनर आउटलाइंग आइलैंड्स","countryUY":"उरुग्वे","countryUZ":"उज़्बेकिस्तान","countryVU":"वानुआतु","countryVE":"वेनेजुएला","countryVN":"🇻🇳 वियतनाम","countryVG":"ब्रिटिश वर्जिन द्वीपसमूह","countryVI":"यूएस वर्जिन द्वीपसमूह","countryWF":"वालिस और फ़्यूच्युना","countryEH":"पश्चिमी सहारा","countryYE":"यमन","countryZM":"जाम्बिया","countryZW":"ज़िम्बाब्वे","epacUS":"प्रथम श्रेणी अंतर्राष्ट्रीय पैकेज सेवा","epacCH":"प्राथमिकता प्लस","epacGB":"अंतर्राष्ट्रीय ट्रैक किया गया","epacMY":"अंतर्राष्ट्रीय ट्रैक/एक्सप्रेस","epacCA":"अंतर्राष्ट्रीय इनबाउंड एक्सप्रेस","epacAU":"पैक एंड ट्रैक इंटरनेशनल","epacNZ":"अंतर्राष्ट्रीय आर्थिक ट्रैकिंग","epacDE":"वॉरेनपोस्ट इंटरनेशनल प्रीमियम","epacFR":"ट्रैकिंग के साथ अंतर्राष्ट्रीय पत्र","epacNL":"अंतर्राष्ट्रीय पैकेट ट्रैक किया गया","epacPL":"ग्लोबल एक्सप्रेस","epacBE":"इंटरनेशनल प्राइम इनबाउंड","epacAT":"अंतर्राष्ट्रीय ट्रैक्ड पैकेज","epacIN":"अंतर्राष्ट्रीय ट्रैक्ड पैकेज","epacFI":"अंतर्राष्ट्रीय ट्रैक्ड पत्र","epacSE":"अंतर्राष्ट्रीय ट्रैक्ड पत्र","epacNO":"प्राइम एक्सप्रेस","epacIT":"अभिव्यक्त करना","epacIL":"अभिव्यक्त करना","epacES":"अंतर्राष्ट्रीय लाइट पैकेज","epacPT":"अंतर्राष्ट्रीय ब्लू मेल","epacCZ":"विदेश से ट्रैक किया गया शिपमेंट","epacBN":"अंतर्राष्ट्रीय ePacket","epacCN":"अंतर्राष्ट्रीय ePacket","epacHK":"अंतर्राष्ट्रीय ePacket","epacID":"अंतर्राष्ट्रीय e-पैकेज","epacMO":"अंतर्राष्ट्रीय ePacket","epacPH":"अंतर्राष्ट्रीय ट्रैक्ड मेल","epacTW":"अंतर्राष्ट्रीय ePacket","epacTH":"अंतर्राष्ट्रीय ePacket","epacVN":"अंतर्राष्ट्रीय E-पैकेज (ASEAN पैक)","epacKR":"के-पैकेट","epacJP":"अंतर्राष्ट्रीय e-पैकेज Light","epacIE":"अंतर्राष्ट्रीय एक्सप्रेस पोस्ट","blogSingPostEPACContent1":"SingPost ePAC (ePacket) हल्के अंतर्राष्ट्रीय ई-कॉमर्स शिपमेंट के लिए एक किफायती ट्रैक की गई डाक सेवा है।","blogSingPostEPACContent2":"यह गंतव्य देश के राष्ट्रीय डाक ऑपरेटर द्वारा वितरित किया जाता है और आमतौर पर 2 किलो से कम पार्सल के लिए उपयोग किया जाता है, जिसमें लंबाई + चौड़ाई + ऊंचाई 90 सेमी से कम और लंबाई 60 सेमी से अधिक नहीं होनी चाहिए।","blogSingPostEPACContent3":"यह विकल्प शुरू में केवल हांगकांग पोस्ट द्वारा eBay चीन के साथ मिलकर पेश किया गया था, जिससे चीन और हांगकांग से पैकेज को डिलीवरी ट्रैकिंग के साथ यूएसए में भेजा जा सकता था बिना डिलीवरी पर किसी हस्ताक्षर की आवश्यकता के। इस सेवा को यूएसए में USPS (United States Postal Service) First-Class Package International Service के रूप में जाना जाता है।","blogSingPostEPACContent4":"1 जनवरी 2026 से, ePAC अब सभी देशों के लिए उपयोग किया जाता है ताकि अनिवार्य UPU नियमों का पालन किया जा सके जो पार्सल के लिए ट्रैकिंग की आवश्यकता रखते हैं और पंजीकृत वस्तुओं को केवल दस्तावेजों तक सीमित करते हैं।","blogSingPostEPACContent5":"ट्रैकिंग उपसर्ग: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS एक अंतर्राष्ट्रीय प्रीमियम डाक एक्सप्रेस सेवा है, जिसे दुनिया भर के डाक ऑपरेटरों द्वारा प्राथमिकता दी जाती है।","blogSpeedPostEMSContent2":"सीमा शुल्क निकासी आम तौर पर मानक मेल की तुलना में तेज़ होती है लेकिन प्रक्रिया में सख्त होती है, डिलीवरी तक पूर्ण ट्रैकिंग के साथ।","blogSpeedPostEMSContent3":"सिंगापुर में, इसे SingPost द्वारा SpeedPost Priority International के रूप में जाना जाता है।","blogSpeedPostEMSContent4":"ट्रैकिंग उपसर्ग: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express एक कूरियर-ग्रेड सेवा है।","blogSpeedPostExpressContent2":"कई गंतव्यों में, DHL Express अंतिम-मील डिलीवरी करता है और रिलीज़ से पहले ड्यूटी या टैक्स एकत्र करता है।","blogSpeedPostExpressContent3":"ट्रैकिंग उपसर्ग: PX123456789SG (अंतिम-मील DHL Express 10-अंकीय ट्रैकिंग नंबर का उपयोग करता है, जो सार्वजनिक रूप से दिखाई नहीं देता है, लेकिन हमारे पास इसके लिए जानकारी है हमारे","blogSpeedPostExpressContent3Link":"ट्रैकिंग सिस्टम के माध्यम से।","blogUSPDDPContent1":"PDDP अमेरिकी आयात शुल्क और करों को डिलीवरी से पहले पूर्व भुगतान करने की अनुमति देता है, प्राप्तकर्ताओं के लिए आश्चर्यजनक शुल्क को कम करता है।","blogUSPDDPContent2":"नए नियम (29 अगस्त 2025 से प्रभावी)","blogUSPDDPContent2List1":"अनिवार्य HTS कोड","blogUSPDDPContent2List2":"सटीक वस्तु विवरण","blogUSPDDPContent2List3":"सख्त टैरिफ प्रवर्तन","blogUSPDDPContent3":"यूएसए में भेजी गई सभी वस्तुओं पर प्राप्तकर्ता को कोई अतिरिक्त टैरिफ नहीं लगाया जाएगा क्योंकि हम आपकी ओर से भुगतान कर रहे हैं। हालांकि, ध्यान दें कि वस्तु की कीमत में नियमों के अनुरूप डिफ़ॉल्ट रूप से 10% आयात शुल्क शामिल है।","blogUSPDDPContent4":"यह केवल यूएसए के लिए हमारे शिपिंग तरीकों, SpeedPost Priority International (EMS) और SingPost ePAC पर लागू होता है।","blogEUIOSSContent1":"EU मूल्य की परवाह किए बिना सभी वाणिज्यिक आयातों पर VAT लागू करता है।","blogEUIOSSContent2":"आईओएसएस (आयात वन-स्टॉप शॉप)","blogEUIOSSContent3":"IOSS विक्रेताओं को €150 तक की खेपों के लिए चेकआउट पर EU VAT एकत्र करने की अनुमति देता है।","blogEUIOSSContent4":"VAT फिर IOSS सिस्टम के माध्यम से भेजा जाता है, जिससे तेज़ सीमा शुल्क निकासी और डिलीवरी पर कोई VAT संग्रह नहीं होता है।","blogEUIOSSContent5":"Etsy या eBay के माध्यम से सभी ऑर्डर के लिए, IOSS VAT पहले से ही चेकआउट पर एकत्र किया जाता है और हम इसे टैक्स संदर्भ संख्या पर इंगित करेंगे ताकि EDI (Electronic Data Interchange) के माध्यम से गंतव्य डाक सेवा को डेटा प्रेषित किया जा सके।","blogUKVATContent1":"UK को आयातित वस्तुओं पर VAT के लिए लेखांकन की आवश्यकता होती है।","blogUKVATContent2":"कम मूल्य की खेपों के लिए, VAT आमतौर पर चेकआउट पर एकत्र किया जाता है और विक्रेता या मार्केटप्लेस द्वारा सीधे HMRC को भेजा जाता है।","blogUKVATContent3":"उच्च मूल्य की शिपमेंट के लिए, VAT डिलीवरी से पहले वाहक द्वारा एकत्र किया जा सकता है।","blogUKVATContent4":"Etsy या eBay के माध्यम से सभी ऑर्डर के लिए, VAT पहले से ही चेकआउट पर एकत्र किया जाता है और हम इसे टैक्स संदर्भ संख्या पर इंगित करेंगे ताकि EDI (Electronic Data Interchange) के माध्यम से गंतव्य डाक सेवा को डेटा प्रेषित किया जा सके।","blogNorwayVOECContent1":"नॉर्वे ने EU/EEA के बाहर से आयातित वस्तुओं के लिए VOEC (VAT on E-Commerce) प्रणाली शुरू की है। यह 3,000 NOK तक मूल्य वाली वस्तुओं पर लागू होता है।","blogNorwayVOECContent2":"विक्रेता चेकआउट पर नॉर्वेजियन VAT एकत्र करने के लिए VOEC योजना में पंजीकरण कर सकते हैं, जिससे तेज़ सीमा शुल्क निकासी और डिलीवरी पर कोई VAT संग्रह नहीं होता है।","blogNorwayVOECContent3":"Etsy या eBay के माध्यम से सभी ऑर्डर के लिए, VOEC VAT पहले से ही चेकआउट पर एकत्र किया जाता है। ट्रैकिंग और सीमा शुल्क कागजी कार्रवाई नॉर्वेजियन डाक सेवा को डेटा प्रेषित करने के लिए टैक्स संदर्भ संख्या को इंगित करती है।","blogSwissVATContent1":"स्विट्जरलैंड मूल्य की परवाह किए बिना आयातित वस्तुओं पर VAT लगाता है। स्विस फेडरल कस्टम्स प्रशासन विदेशी विक्रेताओं को 65 CHF तक की वस्तुओं के लिए चेकआउट पर VAT एकत्र करने की आवश्यकता रखता है।","blogSwissVATContent2":"स्विस VAT प्रणाली में पंजीकृत विक्रेता एकत्रित VAT को सीधे भेजते हैं, यह सुनिश्चित करते हुए कि प्राप्तकर्ता को डिलीवरी पर कोई अतिरिक्त VAT शुल्क का अनुभव नहीं होता है।","blogSwissVATContent3":"Etsy या eBay के माध्यम से सभी ऑर्डर के लिए, स्विस VAT पहले से ही चेकआउट के दौरान एकत्र किया जाता है, और सीमा शुल्क कागजी कार्रवाई में EDI सबमिशन के लिए टैक्स संदर्भ संख्या शामिल है।","dhlNoEmbed":"DHL Express एम्बेड के माध्यम से ट्रैकिंग का समर्थन नहीं करता है। कृपया","speedPostNoEmbed":"SpeedPost सिंगापुर एम्बेड के माध्यम से ट्रैकिंग का समर्थन नहीं करता है। कृपया","operatorNoEmbed":"एम्बेड के माध्यम से ट्रैकिंग का समर्थन नहीं करता है। कृपया","clickHere":"यहाँ क्लिक करें","toTrackNewTab":"ट्रैक करने के लिए (नए टैब में खुलता है)।","russiaServiceSuspended":"⚠️ महत्वपूर्ण सूचना: 2022 में यूक्रेन पर रूसी आक्रमण के कारण, SingPost ने DHL के साथ रूस के लिए सभी शिपमेंट निलंबित कर दिया है। देश में सेवाओं की बहाली की घोषणा होने तक हम वर्तमान में रूस की सेवा नहीं कर रहे हैं।","hariRayaMessage":"🌙 सेलामत हरि राया ऐदिलफित्री! आपको और आपके परिवार को शांति, खुशी और आशीर्वाद की शुभकामनाएं! 🌟","deepavaliMessage":"🪔 शुभ दीपावली! रोशनी का त्योहार आपके लिए खुशी, समृद्धि और सफलता लाए! ✨","vesakMessage":"☸️ वेसाक दिवस की शुभकामनाएँ! इस पवित्र दिन पर आपको शांति, ज्ञान और ज्ञान की शुभकामनाएं! 🙏","vesakTHMessage":"☸️ विशाखा बुचा दिवस की शुभकामनाएँ! इस पवित्र दिन पर आपको शांति, ज्ञान और ज्ञान की शुभकामनाएं! 🙏","australiaNationalDayMessage":"🇦🇺 ऑस्ट्रेलिया दिवस की शुभकामनाएँ! हमारे राष्ट्र का जश्न मना रहे हैं! 🎉","canadaNationalDayMessage":"🇨🇦कनाडा दिवस की शुभकामनाएँ! हमारे महान राष्ट्र का जश्न मना रहे हैं! 🍁","usaNationalDayMessage":"🇺🇸 स्वतंत्रता दिवस की शुभकामनाएं, अमेरिका! आज़ादी और आजादी का जश्न! 🎆","franceBastilleDayMessage":"🇫🇷 जॉयएक्स 14 जुइलेट! विवे ला फ्रांस! 🎊","germanyUnityDayMessage":"🇩🇪जर्मन एकता दिवस की शुभकामनाएँ! टैग डेर डॉयचे एइनहाइट! 🎉","italyRepublicDayMessage":"🇮🇹बुओना फेस्टा डेला रिपब्लिका! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡फ़ेलिज़ डिया डे ला हिस्पैनिडाड! 🎊","japanFoundationDayMessage":"🇯🇵 जापान, स्थापना दिवस की शुभकामनाएँ! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 हैप्पी नेशनल डे, चीन! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 हैप्पी लिबरेशन डे, कोरिया! यह एक अच्छा विचार है! 🎊","indiaIndependenceDayMessage":"🇮🇳 स्वतंत्रता दिवस की शुभकामनाएं, भारत! जय हिंद! 🇮🇳","thailandNationalDayMessage":"🇹🇭 हैप्पी नेशनल डे, थाईलैंड! धन्यवाद! 🎉","philippinesIndependenceDayMessage":"🇵🇭 स्वतंत्रता दिवस की शुभकामनाएं, फिलीपींस! मबुहाय! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 राष्ट्रीय दिवस की शुभकामनाएं, वियतनाम! क्वोक खान वियतनाम! 🎊","polandNationalDayMessage":"🇵🇱 स्वतंत्रता दिवस की शुभकामनाएं, पोलैंड! स्विटो नीपोडलेग्लोस्की! 🎉","czechNationalDayMessage":"🇨🇿 स्वतंत्रता दिवस की शुभकामनाएं, चेक गणराज्य! इससे कोई फर्क नहीं पड़ता! 🎊","netherlandsKingsDayMessage":"🇳🇱फिजे कोनिंग्सडैग! राजा अमर रहें! 🧡","norwayConstitutionDayMessage":"🇳🇴 डेगन, नॉर्गे के साथ आभारी! 🇳🇴","swedenNationalDayMessage":"🇸🇪खुश स्वेरिजेस नेशनलडैग! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 हाइवा इत्सेनाइस्यस्पाइवा, सुओमी! 🇫🇮","portugalNationalDayMessage":"🇵🇹 फ़ेलिज़ दीया डे पुर्तगाल! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! स्वतंत्रता दिवस की शुभकामनाएँ, इज़राइल! 🎉","irelandNationalDayMessage":"🇮🇪हैप्पी सेंट पैट्रिक दिवस, आयरलैंड! ला फ़ेइले पाड्रेग सोना डुइट! 🍀","bruneiNationalDayMessage":"🇧🇳 सेलामत हरि केबांगसान ब्रुनेई! 🎊","newZealandWaitangiDayMessage":"🇳🇿हैप्पी वेटांगी दिवस, न्यूज़ीलैंड! 🎉","switzerlandNationalDayMessage":"🇨🇭स्विस राष्ट्रीय दिवस की शुभकामनाएँ! फ़ेते नेशनल सुइस! 🎊","austriaNationalDayMessage":"🇦🇹 फ्रोहर नेशनलफ़ीएर्टाग, ओस्टररेइच! 🎉","belgiumNationalDayMessage":"🇧🇪 जॉययूसे फेटे नेशनले, बेल्गिक! फिजने नेशनले फीस्टडैग! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - अस्थायी बंद होने की सूचना","temporaryClosureNoticeBody":"प्रिय ग्राहकों,\n\nकृपया ध्यान दें कि कंपनी इवेंट के कारण Rhythm Nexus 21 मार्च 2026 से 26 मार्च 2026 तक अस्थायी रूप से बंद रहेगा।\n\nबंद अवधि की तैयारी के लिए, दुकान 20 मार्च 2026 को दोपहर 3:00 बजे (UTC +8) से वैकेशन मोड में रखी जाएगी। इस समय के बाद किए गए ऑर्डर, हमारे संचालन फिर से शुरू होने तक प्रोसेस नहीं किए जा सकते हैं।\n\nसामान्य व्यावसायिक संचालन 27 मार्च 2026 से फिर शुरू होगा।\n\nकिसी भी असुविधा के लिए हमें खेद है और आपके समझ तथा निरंतर समर्थन के लिए धन्यवाद।\n\nधन्यवाद।\n\nRhythm Nexus","temporaryClosureNoticeClose":"मैं समझ गया/गई","parcelTracking":"पार्सल ट्रैकिंग","serviceAnnouncement":"सेवा घोषणा","usaWinterStormTitle":"तत्काल: गंभीर सर्दियों का तूफान - सेवा में व्यवधान","usaWinterStormSubtitle":"संयुक्त राज्य डाक सेवा (USPS) बलवत्तर घटना","usaWinterStormNotice1":"23 फरवरी 2026 से न्यूयॉर्क क्षेत्र को प्रभावित करने वाले गंभीर सर्दियों के तूफान के कारण:","usaWinterStormNotice2":"जॉन एफ केनेडी अंतर्राष्ट्रीय हवाई अड्डे पर अंतर्राष्ट्रीय संचालन प्रभावी रूप से रोक दिए गए हैं","usaWinterStormNotice3":"व्यापक उड़ान रद्दीकरण और हवाई अड्डों की सेवाओं में महत्वपूर्ण व्यवधान की सूचना दी गई है","usaWinterStormNotice4":"ये स्थितियां USPS के नियंत्रण से परे एक बलवत्तर घटना का गठन करती हैं","usaWinterStormNotice5":"सेवा प्रभाव:","usaWinterStormNotice6":"भारी बर्फ, जमी हुई वर्षा, स्लीट और कड़ाके की ठंड का खतरनाक मिश्रण","usaWinterStormNotice7":"बड़े पैमाने पर व्यवधान और व्यापक बिजली कटौती की सूचना दी गई है","usaWinterStormNotice8":"घरेलू और अंतर्राष्ट्रीय डाक (पत्र-पोस्ट, पार्सल-पोस्ट और ईएमएस आइटम) का संग्रह और डिलीवरी प्रभावित है","usaWinterStormNotice9":"प्रभावित पोस्टकोड क्षेत्र:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS ग्राहकों को असुविधा को कम करने और कर्मचारियों की सुरक्षा बनाए रखने के लिए सभी आवश्यक कदम ले रहा है। हम इस बलवत्तर घटना के दौरान आपके धैर्य और समझ की सराहना करते हैं।","usaWinterStormNotice12":"अंतिम अपडेट: 25 फरवरी, 2026","countryAutoDetected":"आपके स्थान के आधार पर गंतव्य पूर्व-निर्धारित","countryAutoDetectedFromLink":"लिंक से गंतव्य पूर्व-निर्धारित","trackingNumber":"ट्रैकिंग नंबर","destinationCountry":"गंतव्य देश","postcode":"पोस्टकोड","australianDSTTitle":"ऑस्ट्रेलियाई डेलाइट सेविंग टाइम सक्रिय","australianDSTBothMessage":"एईडीटी (ऑस्ट्रेलियाई पूर्वी डेलाइट टाइम) और एसीडीटी (ऑस्ट्रेलियाई सेंट्रल डेलाइट टाइम) दोनों वर्तमान में प्रभावी हैं।","australianAEDTMessage":"AEDT (ऑस्ट्रेलियाई पूर्वी डेलाइट समय) वर्तमान में सिडनी, मेलबर्न और आसपास के क्षेत्रों में प्रभावी है।","australianACDTMessage":"एसीडीटी (ऑस्ट्रेलियाई सेंट्रल डेलाइट टाइम) वर्तमान में एडिलेड और दक्षिण ऑस्ट्रेलिया के लिए प्रभावी है।","australianDSTNote":"ऊपर प्रदर्शित डिलीवरी समय वर्तमान डेलाइट सेविंग टाइम को दर्शाता है।","filteredAllowedDestinations":"(आपके अनुमत गंतव्यों के लिए फ़िल्टर किया गया)","loadingAnnouncements":"घोषणाएँ लोड हो रही हैं...","unableToLoadAnnouncements":"इस समय सेवा घोषणाएँ लोड करने में असमर्थ.","viewOnSingPostWebsite":"सिंगपोस्ट वेबसाइट पर देखें →","statusHeldByCustms":"सीमा शुल्क द्वारा आयोजित","accessRestricted":"प्रवेश प्रतिबंधित","vpnDetectedMessage":"वीपीएन उपयोग का पता चला. कृपया इस सेवा तक पहुँचने के लिए वीपीएन अक्षम करें।","contactSupportError":"यदि आपको लगता है कि यह एक त्रुटि है, तो कृपया सहायता से संपर्क करें।","postalContactsTitle":"डाक सेवा संपर्क","postalContactsNote":"नोट:","postalContactsPolandUKNote":"पोलैंड और यूके के लिए, SpeedPost Priority (EMS) के माध्यम से भेजी गई सभी वस्तुओं को Pocztex और Parcelforce द्वारा संभाला जाएगा।","postalContactsDHLNote":"SpeedPost Express शिपमेंट के लिए, कृपया इस लिंक के माध्यम से DHL से संपर्क करें:","postalContactsCountry":"देश","postalContactsWebsite":"वेबसाइट","postalContactsForm":"संपर्क फ़ॉर्म","postalContactsPhone":"संपर्क नंबर","postalContactsEmail":"संपर्क ईमेल","postalContactsFormLink":"संपर्क फ़ॉर्म","postalContactsBackButton":"पार्सल जांच फ़ॉर्म पर वापस जाएं","destinationNotAllowed":"आपके स्थान से इस गंतव्य देश तक पहुंच उपलब्ध नहीं है। कृपया कोई भिन्न गंतव्य चुनें.","contactUsTitle":"संपर्क करें","contactNameLabel":"नाम (उपनाम या फ़ोन नंबर की अनुमति नहीं)","contactEmailLabel":"ईमेल पता (हम यहां जवाब देंगे)","contactEmailNote":"निजी रिले ईमेल (@privaterelay.appleid.com) की अनुमति नहीं है। कृपया एक वैध ईमेल पता उपयोग करें।","contactEnquiryTypeLabel":"यह क्या है?","contactSelectOption":"एक विकल्प चुनें","contactGeneralEnquiry":"सामान्य पूछताछ / प्रतिक्रिया","contactBusinessEnquiry":"व्यवसाय पूछताछ","contactOrderShippingEnquiry":"आदेश/शिपिंग पूछताछ","contactExchangeRefundEnquiry":"विनिमय/धनवापसी/वापसी पूछताछ","contactOthers":"अन्य","contactParcelWarning":"यदि आपका पार्सल 18/30/45 दिनों से अधिक समय तक डिलीवर नहीं हुआ है (FedEx के लिए 14 दिन), या डिलीवर हो गया दिखाता है लेकिन आपके पास नहीं है, तो कृपया भरें","contactParcelWarningLink":"यह फॉर्म","contactParcelWarningEnd":"इसके बजाय।","contactOrderNumberLabel":"आदेश संख्या","contactOrderNumberPlaceholder":"उदाहरण: RTNX1234567890","contactPlatformNote":"Etsy, eBay और Shopee ऑर्डर नंबर यहां। हमारा इन प्लेटफार्मों से रिफंड पर कोई नियंत्रण नहीं है। कृपया उनकी ग्राहक सेवा से संपर्क करें।","contactPlatformInstructions":"कृपया अपने ऑर्डर नंबर को देखने के लिए ऐप का उपयोग करें, क्योंकि यह ऐप में सहेजा गया है:","contactPlatformEtsy":"Etsy - आपकी प्रोफ़ाइल के ऊपर दाईं ओर → खरीदारी","contactPlatformEbay":"eBay - मेरा eBay → खरीदारी","contactPlatformShopee":"Shopee - मैं → खरीद इतिहास देखें (या आप शिप करने के लिए/प्राप्त करने के लिए क्लिक कर सकते हैं)","contactRefundNote1":"यदि आप उस प्लेटफॉर्म के रिटर्न/रिफंड के लिए पूछताछ कर रहे हैं जहां से आपने खरीदा है, तो कृपया ध्यान दें कि हमारा इन प्लेटफार्मों से रिफंड पर कोई नियंत्रण नहीं है। कृपया उनकी ग्राहक सेवा से संपर्क करें।","contactRefundNote2":"रिटर्न या एक्सचेंज के लिए, यदि maimai दस्ताने खोलते समय पहले ही उपयोग किए जा चुके हैं (दिखाई देने वाले दाग या वॉशिंग मशीन/मैनुअल वॉश में धोए गए), तो हम इसकी अनुमति नहीं देते हैं, और मनोरंजन कार्ड के लिए कोई रिटर्न या एक्सचेंज की अनुमति नहीं है। धन्यवाद।","contactRefundNote3":"कृपया ध्यान दें कि Payhip के माध्यम से रिफंड के लिए, यदि आपने रिफंड प्राप्त नहीं किया है, तो अपने बैंक या Payhip सहायता (support@payhip.com) से संपर्क करें क्योंकि हमारा इस प्रक्रिया पर कोई नियंत्रण नहीं है।","contactMessageLabel":"आपका संदेश (अधिकतम 1000 वर्ण)","contactCharacterCount":"वर्ण","contactSpamWarningNote":"नोट:","contactSpamWarning":"SEO, वेबसाइट डिज़ाइन, ऋण या समान सेवाओं के लिए अवांछित प्रस्तावों को स्वचालित रूप से अस्वीकार कर दिया जाएगा।","contactAgreementText1":"कृपया \"मैं सहमत हूं\" पर क्लिक करें, यदि आप सहमत हैं कि Rhythm Nexus द्वारा आपको जवाब देने के लिए आपके ईमेल पते का उपयोग किया जाए, क्योंकि यह हमारे लिए आपकी प्रतिक्रिया पढ़ने और आपकी पूछताछ का समाधान निकालने के बाद आपको जवाब देने के लिए आवश्यक है।","contactAgreementText2":"कृपया ध्यान दें कि हमारी प्रतिक्रिया में 3-5 व्यावसायिक दिन लगेंगे, या हमारी ओर से अधिक ईमेल की मात्रा के दौरान अधिक समय लग सकता है।","contactAgreeCheckbox":"मैं सहमत हूं","contactSuccessMessage":"आपका संदेश सफलतापूर्वक भेज दिया गया है! हम 3-5 व्यावसायिक दिनों के भीतर जवाब देंगे।","contactErrorMessage":"संदेश भेजने में विफल। कृपया पुनः प्रयास करें।","contactGeneralError":"एक त्रुटि हुई। कृपया बाद में पुनः प्रयास करें।","contactSubmitting":"सबमिट कर रहे हैं...","contactSubmit":"सबमिट करें","contactAlertAgree":"फॉर्म सबमिट करने के लिए कृपया शर्तों से सहमत हों।","parcelEnquiryTitle":"पार्सल पूछताछ","parcelInfoText":"यह फॉर्म उन पार्सल के लिए है जो 18/30/45 दिनों से अधिक समय तक डिलीवर नहीं हुए हैं (FedEx/DHL के लिए 14 दिन), या डिलीवर स्थिति दिखाते हैं लेकिन आपके पास नहीं हैं।","parcelInfoLink":"यहां क्लिक करें","parcelInfoEnd":"अन्य पूछताछ के लिए।","parcelWaitTitle":"कृपया अपने पार्सल की प्रतीक्षा करें","parcelWaitText1":"कृपया अपने पार्सल के डिलीवर होने की प्रतीक्षा करें। कृपया ध्यान दें कि अंतर्राष्ट्रीय डिलीवरी स्थानीय डिलीवरी के समान नहीं है क्योंकि उन्हें समय लगता है। धन्यवाद!","parcelWaitText2":"यदि 18 दिनों (सिंगापुर के लिए 7 दिन) या अधिक के बाद कोई स्थिति नहीं दिखती है, तो आप हमें सीधे बता सकते हैं।","parcelCannotSubmit":"यदि आपने \"नहीं\" चुना है तो आप यह फॉर्म सबमिट नहीं कर सकते।","parcelNameLabel":"नाम","parcelOrderNumberLabel":"आदेश संख्या (उदाहरण: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"ईमेल पता (हम यहां आपको जवाब देंगे)","parcelEmailNote":"निजी रिले ईमेल की अनुमति नहीं है। कृपया एक वैध ईमेल पता उपयोग करें।","parcelShippingMethodLabel":"चुनी गई शिपिंग विधि?","parcelSelectShipping":"एक शिपिंग विधि चुनें","parcelSingPostEpac":"SingPost ePacket (या ePAC) - SpeedPost Saver International के नाम से भी जाना जाता है (ट्रैकिंग: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (ट्रैकिंग: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (ट्रैकिंग: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (ट्रैकिंग: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (ट्रैकिंग: PX123456789SG)","parcelDHL":"DHL Express (केवल EU देश) (ट्रैकिंग: 1234567890)","parcelTrackingNumberLabel":"आपके पार्सल का ट्रैकिंग नंबर?","parcelUndeliveredLabel":"क्या आपका पार्सल 18/30/45 दिनों से अधिक समय तक डिलीवर नहीं हुआ है? (सिंगापुर स्थानीय सेवाएं >7 दिन, SpeedPost Express/DHL >14 दिन)","parcelSelectOption":"एक विकल्प चुनें","parcelYes":"हां","parcelNo":"नहीं","parcelDeliveredButMissingLabel":"क्या आपका पार्सल डिलीवर स्थिति दिखाता है, लेकिन यह आपके मेलबॉक्स/सुरक्षित स्थान/दरवाजे पर मौजूद नहीं है?","parcelCaseReferenceLabel":"स्थानीय डाक घर से केस संदर्भ ID","parcelCaseReferencePlaceholder":"यदि आप सिंगापुर से हैं तो NA डालें","parcelCaseReferenceNote":"इस फॉर्म को सबमिट करने से पहले, कृपया टेलीफोन या ईमेल के माध्यम से अपने स्थानीय डाक घर से संपर्क करें और उनसे केस संदर्भ ID प्राप्त करें। फिर, यहां अपना केस संदर्भ ID डालें।","parcelCaseReferenceLink":"डाक सेवा संपर्कों के लिए इस लिंक को देखें","parcelCaseReferenceMandatory":"केवल तभी NA डालें यदि आप सिंगापुर से हैं। अन्य देशों के लिए यह अनिवार्य है। SpeedPost Express के लिए भी आवश्यक है, DHL के केस ID के लिए।","parcelImageEvidenceLabel":"छवि प्रमाण (डिलीवर किए गए लेकिन गायब पार्सल के लिए)","parcelImageWarning":"अतिरिक्त सत्यापन के लिए, हमें यह साबित करने के लिए छवि प्रमाण की आवश्यकता है कि आप पार्सल गैर-डिलीवरी के बारे में झूठे दावे नहीं कर रहे हैं। (केवल उन पार्सल के लिए जो पहले से ही डिलीवर हो चुके हैं, लेकिन मेलबॉक्स/दरवाजे के बाहर मौजूद नहीं हैं। यदि डिलीवर किए गए आइटम के लिए कोई फोटो प्रमाण नहीं दिया गया है तो हम आपके दावे को अस्वीकार कर सकते हैं। यदि आपका आइटम डिलीवर स्थिति नहीं दिखाता है तो इसे अनदेखा करें।)","parcelImageNote":"1 समर्थित फ़ाइल अपलोड करें: छवि। अधिकतम 1 GB।","parcelAgreementText":"कृपया \"मैं सहमत हूं\" पर क्लिक करें यदि आप सुनिश्चित करते हैं कि आपके पार्सल के साथ जो हुआ वह सच था।","parcelAgreeCheckbox":"मैं सहमत हूं","parcelSuccessMessage":"आपकी पार्सल पूछताछ सफलतापूर्वक सबमिट कर दी गई है! हम 3-5 व्यावसायिक दिनों के भीतर जवाब देंगे।","parcelErrorMessage":"पूछताछ सबमिट करने में विफल। कृपया पुनः प्रयास करें।","parcelGeneralError":"एक त्रुटि हुई। कृपया बाद में पुनः प्रयास करें।","parcelAlertWait":"कृपया अपने पार्सल के डिलीवर होने की प्रतीक्षा करें। आप निर्दिष्ट प्रतीक्षा अवधि के बाद यह फॉर्म सबमिट कर सकते हैं।","parcelAlertAgree":"फॉर्म सबमिट करने के लिए कृपया शर्तों से सहमत हों।","parcelAlertCaseReference":"कृपया अपने स्थानीय डाक घर से केस संदर्भ ID प्रदान करें, या यदि आप सिंगापुर से हैं तो NA डालें।","parcelSubmitting":"सबमिट कर रहे हैं...","parcelSubmit":"सबमिट करें","lookalikeDomainWarning":"यह ट्रैकिंग नंबर नहीं है, बल्कि किसी कूरियर कंपनी की नकल करने वाली वेबसाइट का लिंक है। वहाँ अपनी निजी या भुगतान जानकारी न डालें।","lookalikeDomainOfficial":"आधिकारिक वेबसाइट:"};
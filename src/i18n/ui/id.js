@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus menggunakan jaringan komersial premium. Namun, saat yang tepat tiba di negara Anda, transfer hak asuh ke operator domestik lokal (misalnya, USPS, Royal Mail, DHL secara lokal). Melacak awalan mengubah sistem penanganan di ambang batas ini, tetapi pelacak paket universal kami menyatukan status - status ini untuk memberi Anda visibilitas tanpa gangguan.","trackingLastMileTitle":"Jaringan Pengiriman Last - Mile","trackingCustomsClearanceBody":"Semua item lintas batas harus menghapus agen bea cukai negara setempat. Alat kami memantau transisi dari kedatangan fasilitas impor ke serah terima bea cukai. Patroli perbatasan akan memverifikasi kode HS dan memastikan PPN atau bea yang benar telah disetorkan (misalnya, IOSS di UE, VOEC di Norwegia). Pantau pelacakan khusus untuk peringatan \"Diadakan di Bea Cukai \".","trackingCustomsClearanceTitle":"Informasi Bea Cukai","trackingProcessingOriginBody":"Setelah diturunkan, barang memasuki pusat pemrosesan asal tempat barang dipindai, ditimbang, dan menjalani pemeriksaan keamanan ekspor utama. Kemudian dikirim ke pertukaran surat internasional. Jadwal penerbangan tergantung pada bandwidth kargo yang tersedia. Jangan khawatir jika tetap dalam keadaan ini selama beberapa hari.","trackingProcessingOriginTitle":"Memproses di Pusat Asal","trackingInfoReceivedBody":"Ketika pesanan pertama kali diproses di platform e - commerce kami (seperti Etsy, eBay, atau penjualan langsung), nomor pelacakan dihasilkan secara elektronik. Pengangkut menerima data pengiriman sebelum kepemilikan fisik kotak. Harap tunggu 1 hingga 3 hari kerja agar paket dimasukkan ke fasilitas penyortiran fisik.","trackingInfoReceivedTitle":"informasi diterima,","trackingStatusesIntro":"Terima kasih telah menggunakan alat pelacak paket internasional terpadu kami. Karena paket perjalanan Anda melintasi beberapa perbatasan global, status pelacakannya bisa rumit. Memahami siklus hidup logistik membantu menetapkan ekspektasi yang jelas.","trackingStatusesTitle":"Memahami Status Pelacakan","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"pagi","pmText":"sore","footerQuickLinks":"Tautan Cepat","footerSupportLegal":"Dukungan & Hukum","copyrightText":"Hak cipta dilindungi.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlantik)","tzEST":"EST (Timur)","tzCST":"CST (Tengah)","tzMST":"MST (Pegunungan)","tzPST":"PST (Pasifik)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Beijing","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast Kaliningrad (UTC+2)","tzMoscow":"Moskow/Rusia Barat (UTC+3)","tzSamara":"Oblast Samara (UTC+4)","tzUral":"Wilayah Ural (UTC+5)","tzOmsk":"Oblast Omsk (UTC+6)","tzKrasnoyarsk":"Krai Krasnoyarsk (UTC+7)","tzIrkutsk":"Oblast Irkutsk (UTC+8)","tzSakha":"Republik Sakha (UTC+9)","tzPrimorsky":"Krai Primorsky (UTC+10)","tzMagadan":"Oblast Magadan (UTC+11)","tzKamchatka":"Krai Kamchatka (UTC+12)","dstDayStartsLabel":"Waktu musim panas dimulai","dstDayEndsLabel":"Waktu musim panas berakhir","dstRevertsLabel":"kembali ke waktu standar","dstEuropeLabel":"Eropa","dstNewZealandLabel":"Selandia Baru","englishResponseNotice":"Pemberitahuan: Semua pertanyaan ditanggapi dalam bahasa Inggris. Jika Anda mengirimkan dalam bahasa lain, pesan Anda mungkin diterjemahkan ke bahasa Inggris untuk verifikasi.","parcelDisagreeCheckbox":"Saya Tidak Setuju","contactDisagreeCheckbox":"Saya Tidak Setuju","contactNamePlaceholder":"Contoh: Budi Santoso","systemRequirementsTitle":"Versi sistem minimum yang didukung","systemRequirements":"Windows: Windows 7 (with ESU updates installed) atau lebih tinggi\nmacOS: macOS 12 atau lebih tinggi\nAndroid: Android 13 atau lebih tinggi\niPhone/iOS: iOS 17 atau lebih tinggi\nLinux: Distribusi yang didukung dengan pembaruan keamanan aktif","title":"Verifikasi akses","subtitle":"Harap selesaikan tantangan di bawah ini untuk melanjutkan.","selectLanguage":"Pilih bahasa","selectLanguagePlaceholder":"-- Pilih bahasa --","loadingChallenge":"Memuat tantangan...","answerLabel":"Jawaban Anda:","answerPlaceholder":"Masukkan jawaban Anda","continueButton":"Lanjutkan","refreshButton":"Tantangan baru","verifying":"Memverifikasi...","chooseLanguageFirst":"Harap pilih bahasa terlebih dahulu.","loadFailed":"Gagal memuat tantangan. Harap coba lagi.","expiredChallenge":"Tantangan kedaluwarsa. Memuat tantangan baru...","verifyFailed":"Verifikasi gagal. Harap coba lagi.","goodFridayEasterGreeting":"Selamat Paskah! Damai dan sukacita di Good Friday dan Paskah.","christmasGreeting":"Selamat Natal dan Tahun Baru! Damai dan sukacita dari 25 Desember hingga 5 Januari.","captchaSystemRequirements":"Persyaratan minimum: Windows 7 (with ESU updates installed) atau 11, macOS 10.15+, atau versi Android/iOS terbaru.","home":"Beranda","blog":"blog","aboutUs":"Tentang Kami","faq":"Pertanyaan Umum","contact":"Kontak","trackPackage":"Lacak Paket","cnyYearOfHorseMessage":"🧧 Selamat Tahun Baru Lunar! Semoga Anda makmur dan bahagia di Tahun Kuda! 🐴","hariRayaMessage":"🌙 Selamat Hari Raya Idul Fitri! Semoga Anda dan keluarga diberkati dengan kedamaian dan kebahagiaan! 🌟","deepavaliMessage":"🪔 Selamat Deepavali! Semoga festival cahaya membawa Anda sukacita dan kemakmuran! ✨","vesakMessage":"☸️ Selamat Hari Waisak! Semoga Anda diberkati with kedamaian dan kebijaksanaan! 🙏","vesakTHMessage":"☸️ Selamat Hari Visakha Bucha! Semoga Anda diberkati dengan kedamaian dan kebijaksanaan! 🙏","singaporeNationalDayMessage":"🇸🇬 Selamat Hari Nasional Singapura! Merayakan 61 tahun kemerdekaan! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesia! Dirgahayu Republik Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Merayakan kemerdekaan negara kita! 🎊","australiaNationalDayMessage":"🇦🇺 Selamat Hari Australia! Merayakan negara kita! 🎉","canadaNationalDayMessage":"🇨🇦 Selamat Hari Kanada! Merayakan negara kita yang hebat! 🍁","usaNationalDayMessage":"🇺🇸 Selamat Hari Kemerdekaan, Amerika! Merayakan kebebasan! 🎆","franceBastilleDayMessage":"🇫🇷 Selamat Hari Bastille! Hidup Prancis! 🎊","germanyUnityDayMessage":"🇩🇪 Selamat Hari Persatuan Jerman! 🎉","italyRepublicDayMessage":"🇮🇹 Selamat Hari Republik Italia! 🇮🇹","spainNationalDayMessage":"🇪🇸 Selamat Hari Nasional Spanyol! 🎊","japanFoundationDayMessage":"🇯🇵 Selamat Hari Pendirian Jepang! 🎌","chinaNationalDayMessage":"🇨🇳 Selamat Hari Nasional Tiongkok! 🎉","koreaLiberationDayMessage":"🇰🇷 Selamat Hari Pembebasan Korea! 🎊","indiaIndependenceDayMessage":"🇮🇳 Selamat Hari Kemerdekaan India! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Selamat Hari Nasional Thailand! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Selamat Hari Kemerdekaan Filipina! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Selamat Hari Nasional Vietnam! 🎊","polandNationalDayMessage":"🇵🇱 Selamat Hari Kemerdekaan Polandia! 🎉","czechNationalDayMessage":"🇨🇿 Selamat Hari Kemerdekaan Republik Ceko! 🎊","netherlandsKingsDayMessage":"🇳🇱 Selamat Hari Raja Belanda! 🧡","norwayConstitutionDayMessage":"🇳🇴 Selamat Hari Konstitusi Norwegia! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Selamat Hari Nasional Swedia! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Selamat Hari Kemerdekaan Finlandia! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Selamat Hari Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 Selamat Hari Kemerdekaan Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Selamat Hari St. Patrick, Irlandia! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Nasional Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Selamat Hari Waitangi, Selandia Baru! 🎉","switzerlandNationalDayMessage":"🇨🇭 Selamat Hari Nasional Swiss! 🎊","austriaNationalDayMessage":"🇦🇹 Selamat Hari Nasional Austria! 🎉","belgiumNationalDayMessage":"🇧🇪 Selamat Hari Nasional Belgia! 🎊","russiaDayOfRussiaMessage":"🇷🇺 Selamat Hari Rusia! 🎉","taiwanFoundingDayMessage":"🇹🇼 Selamat Hari Pendirian, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Selamat Hari Double Ten, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Selamat Hari Pendirian SAR Hong Kong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Selamat Hari Pendirian SAR Makau! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Selamat Hari Buruh Internasional! Merayakan tenaga kerja dan hak-hak pekerja! 🎊","laborDayUSCAMessage":"⚒️ Selamat Hari Buruh! Menghormati kontribusi para pekerja! 🎉","orderNumber":"Nomor Pesanan (Contoh: RTNX1234567890)","fromDate":"Dari Tanggal (WAJIB)","toDate":"Hingga Tanggal (WAJIB)","trackParcel":"Lacak Paket","selectCourier":"-- Pilih Kurir / Negara --","singaporeCouriers":"Kurir Singapura","topCountries":"5 Negara Teratas","otherCountries":"Negara Lain","optionSingPost":"🇸🇬 Pos Singapura (SingPost)","countryAU":"Angola Australia","countryCA":"🇨🇦 Kanada","countryDE":"🇩🇪 Jerman","countryGB":"🇬🇧 Inggris Raya","countryUS":"🇺🇸 Amerika Serikat","countryAT":"<br>Austria","countryBE":"🇧🇪 Belgia","countryBN":"🇧€Brunei","countryCN":"🇨🇳 Cina","countryCZ":"🇨🇿 Ceko","countryFI":"🇫🇮 Finlandia","countryFR":"🇫🇷 Perancis","countryHK":"🇭🇰 Hong Kong SAR Cina","countryIN":"🇮🇩 India","countryID":"🇮🇩Indonesia","countryIE":"🇮🇪 Irlandia","countryIL":"🇮🇱Israel","countryIT":"🇮🇹 Italia","countryJP":"🇯🇵 Jepang","countryMO":"🇲🇴 Makau SAR Cina","countryMY":"🇲🇾Malaysia","countryNL":"🇳🇱 Belanda","countryNZ":"🇳🇿 Selandia Baru","countryNO":"🇳🇴 Norwegia","countryPH":"🇵🇭 Filipina","countryPL":"🇵🇱 Polandia","countryPT":"👉Portugal","countryKR":"🇰🇷 Korea Selatan","countryES":"🇪🇸 Spanyol","countrySE":"🇸🇪 Swedia","countryCH":"🇨🇭 Swiss","countryTW":"🇹🇼 Taiwan","countryTH":"👉Thailand","countryVN":"🇻€ Vietnam","countrySG":"🇸🇬 Singapura","note":"CATATAN","disclaimer":"PENAFIAN","importantInformation":"Informasi Penting:","didNotReceiveEmail":"Jika Anda tidak menerima email konfirmasi dari Etsy, eBay, Shopee atau Payhip, gulir ke bawah untuk mencari pesanan Anda melalui alamat email atau nomor telepon yang terkait dengan pesanan ini.","searchByEmailOrPhone":"Cari berdasarkan Email atau Telepon","searchOrder":"Cari Pesanan","trackingResult":"Hasil Pelacakan","noOrdersFound":"Tidak ada pesanan ditemukan.","pleaseEnter":"Silakan masukkan email, telepon, atau nomor pesanan.","welcomeTitle":"Selamat datang di situs web Rhythm Nexus!","purchaseInfo":"Beli dari kami melalui saluran resmi, atau bergabung dengan","purchaseInfoChina":"Beli dari kami melalui saluran resmi kami.","purchaseInfoChinaSuffix":"","telegramGroup":"grup Telegram","forUpdates":"kami untuk pembaruan resmi.","ourStores":"Toko Kami","etsyStore":"Toko Etsy","ebayStore":"Toko eBay","shopeeStore":"Toko Shopee","payhipStore":"Toko Payhip","internationalShipping":"Pengiriman Internasional","singaporeLocal":"Lokal Singapura","asiaOnly":"Hanya Asia","deliveryInfo":"Informasi Pengiriman","deliveryRates2026":"Tarif Pengiriman 2026","sgDeliveryRates":"Tarif Pengiriman Singapura","speedPostRates":"Tarif SpeedPost Express Internasional","aboutTitle":"Tentang Rhythm Nexus","aboutP1":"Kami memulai toko kami pada tahun 2022 dan telah menjual di platform seperti Etsy, eBay, dan Shopee tanpa gagal.","aboutP2":"Seiring waktu, kami telah membangun reputasi yang kuat dengan fokus pada pemenuhan yang andal dan pelacakan yang akurat.","aboutP3":"Tujuan kami adalah memberikan pengalaman belanja yang lancar dan terpercaya kepada pelanggan.","aboutP4":"Terima kasih telah mendukung Rhythm Nexus.","faqTitle":"Pertanyaan yang Sering Diajukan","faqQ1":"Bagaimana jika barang saya cacat? Apakah ada garansi?","faqA1":"Ya! Sebagian besar pesanan dilengkapi dengan garansi 1 tahun. Harap berikan nomor faktur/pesanan Anda agar kami dapat menyelidikinya. Catatan: Penukaran tidak diperbolehkan jika barang sesuai dengan deskripsi meskipun Anda salah memesan.","faqQ2":"Bisakah saya mengedit, memperbarui, atau membatalkan pesanan saya?","faqA2":"Ya. Demi keamanan, perubahan pesanan mungkin perlu ditangani melalui email atau formulir kontak kami.","faqQ3":"Apakah saya harus membayar Bea/Pajak Impor?","faqA3":"Bea cukai dan pajak umumnya tidak dibayar di muka, kecuali untuk DDP ke AS. PPN mungkin berlaku untuk UE, Inggris, AU/NZ, Norwegia, Swiss, dan provinsi Kanada seperti Saskatchewan dan Manitoba yang sudah dibayar secara default. Tidak ada GST yang berlaku untuk Singapura. Kami tidak dapat menyarankan biaya bea cukai — hubungi bea cukai setempat Anda untuk detailnya.","faqQ4":"Kapan pesanan saya dikirim?","faqA4":"Pesanan umumnya dikirim dalam 1-5 hari kerja. Selama periode volume tinggi, mungkin diperlukan waktu 5-7 hari.","faqQ5":"Saya tidak sengaja memesan dua kali. Apa yang harus saya lakukan?","faqA5":"Kami hanya mengembalikan biaya pengiriman duplikat. Kedua barang akan dikirim bersamaan. Pengembalian dana = (biaya pengiriman pertama + biaya pengiriman kedua) – biaya pengiriman sebenarnya.","faqQ6":"Berapa lama pengiriman berlangsung?","faqA6":"Pemrosesan memakan waktu 1-5 hari kerja.\n\nPengiriman Domestik:\n• SingPost Prepaid Tracked Label: 2-4 hari\n• SpeedPost Standard: 1-3 hari\n\nInternasional:\n• SingPost ePAC: 14-30 hari\n• SpeedPost Priority (EMS): 8-15 hari\n• SpeedPost Express: 4-8 hari\n\nKeterlambatan dapat terjadi selama musim puncak.","faqQ7":"Barang saya dikembalikan ke pengirim. Apa yang harus saya lakukan?","faqA7":"Pengiriman ulang diperbolehkan satu kali. Pembatalan tidak dimungkinkan untuk alamat yang tidak valid, paket yang tidak diklaim, atau biaya bea cukai yang belum dibayar. Hubungi layanan pos Anda untuk pengiriman ulang, atau kirim pesan kepada kami untuk bantuan.","faqQ8":"Barang saya hilang / dicuri dalam perjalanan.","faqA8":"Kami mengizinkan satu kali pengiriman ulang. Jika hilang lagi, pengembalian dana penuh diberikan setelah jendela pengiriman kurir:\n\n• Layanan Lokal Singapura: 7 hari\n• SingPost ePAC & SpeedPost Priority International: 30 hari\n• SpeedPost Intl Express: 14 hari","blogTitle":"Basis Pengetahuan Pengiriman & Pos","blogSubtitle":"Penjelasan resmi tentang layanan pos, bea cukai, PPN, dan bea.","readMore":"Baca Lebih Lanjut","backButton":"Kembali","blogPost1Title":"Apa itu SingPost ePAC?","blogPost1Desc":"Pelajari tentang SingPost ePAC (ePacket), layanan pos terlacak ekonomis.","blogPost2Title":"Apa itu SpeedPost Priority International (EMS)?","blogPost2Desc":"Temukan EMS, layanan ekspres pos premium internasional.","blogPost3Title":"Apa itu SpeedPost Express?","blogPost3Desc":"Jelajahi SpeedPost Express dengan pengiriman DHL Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Pahami PDDP untuk AS.","blogPost5Title":"PPN EU & IOSS","blogPost5Desc":"Wawasan tentang PPN EU dan sistem IOSS.","blogPost6Title":"PPN UK & HMRC","blogPost6Desc":"Persyaratan PPN untuk UK.","blogPost7Title":"Norway VOEC","blogPost7Desc":"Sistem VOEC Norwegia.","blogPost8Title":"PPN Swiss","blogPost8Desc":"Persyaratan PPN Swiss.","enterDestinationPostcode":"Masukkan kode pos tujuan","trackingNumberExample":"mis. LG123456789SG","trackingCaseSensitive":"HURUF PELACAKAN SENSITIF HURUF BESAR/KECIL DAN HARUS DALAM HURUF BESAR.","usaPostcodeNote":"Untuk negara tanpa kode pos, misalnya Hong Kong dan Makau, masukkan 999077 (Hong Kong) atau 999078 (Makau).","epacDeliveryNote":"Harap DICATAT bahwa semua barang ePAC yang dikirim ke tujuan harus dikirim ke Kotak Surat, Pintu Rumah, Loker Paket, atau ditinggalkan di tempat yang aman!","currentTime":"Waktu Saat Ini","timezoneNote":"Waktu ditampilkan dalam format 12 jam","sameTimeAsSingapore":"Waktu yang sama dengan Singapura","hourAhead":"jam lebih cepat dari Singapura","hoursAhead":"jam lebih cepat dari Singapura","hourBehind":"jam lebih lambat dari Singapura","hoursBehind":"jam lebih lambat dari Singapura","collectAtPostOffice":"Namun, jika negara Anda tidak memiliki Kotak Surat sebagai standar yang tersedia, Anda harus mengambilnya di Kantor Pos.","countriesNoMailbox":"Negara yang diketahui tidak memiliki pengiriman Kotak Surat/Kotak Pos: Brunei, Tiongkok, India, Israel, Makau SAR Tiongkok, Filipina, Polandia, dan Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus TIDAK BERTANGGUNG JAWAB untuk menangani pengiriman karena di luar kendali kami dan kami lebih suka Anda melacak status barang Anda.","issuesAfterDelivery":"Ada masalah dengan pengiriman Anda setelah 30/45 hari (14 hari untuk SpeedPost Express) atau status menunjukkan terkirim tetapi Anda tidak menerima, silakan hubungi kami","cannotUseEmbed":"Kami tidak dapat menggunakan sematan untuk pelacakan karena sebagian besar situs web layanan pos tidak mendukungnya.","clickLinkAbove":"Silakan klik tautan di atas untuk melacak paket Anda.","trackingDetailsNote":"Perhatikan bahwa detail pelacakan mungkin tidak muncul di hasil pencarian sehingga disarankan untuk menempelkan nomor pelacakan ke dalam sistem untuk melacak barang tersebut.","thirdPartyWebsites":"Anda juga dapat melacak paket Anda di situs web pihak ketiga ini:","enterEmailOrPhone":"Masukkan email atau telepon","reviewShippingRates":"Tinjau Tarif Pengiriman kami saat ini","here":"di sini","contactUsForm":"Silakan hubungi kami melalui","form":"formulir","forEnquiries":"untuk setiap Pertanyaan yang Anda miliki terkait pesanan Anda.","anPostNoDirectTracking":"An Post (Irlandia) tidak mendukung tautan pelacakan langsung atau pelacakan tertanam.","anPostPasteManually":"Silakan salin dan tempel nomor pelacakan Anda secara manual di situs web An Post:","goToAnPost":"Pergi ke An Post","countryMsgNL":"Jika status menunjukkan 'Held by Customs', silakan hubungi Jalur Informasi Bea Cukai Belanda untuk bantuan:\n0800 0143 (gratis), Senin-Jumat 7 pagi - 11 malam.\nSabtu & Minggu 8 pagi - 4:30 sore.\n\nDisarankan untuk mendaftar akun dengan PostNL untuk menerima pemberitahuan langsung paket Anda:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nJika dikirim ke PostNL Point atau status memberitahu Anda untuk mengambil di kantor pos, Anda harus membayar 7 EUR di loket. Maksimal 4 EUR jika dibayar online.","countryMsgDE":"Kami mendorong Anda untuk mengunduh aplikasi Post & DHL untuk menerima pemberitahuan status pelacakan paket Anda:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nKontak Layanan Pelanggan DHL Paket GmbH:\n+49-228-433-3112\nKontak DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Anda perlu mengajukan deklarasi impor tambahan dengan bea cukai. Jika tidak, dapat menyebabkan pembatasan masuk dan paket dikembalikan. \nInformasi lebih lanjut: https://www.posti.fi/en/receiving/customs-clearance \nTautan lain: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Biaya pemrosesan 4,95 EUR dikenakan.\nUnduh aplikasi di sini: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Biaya pemrosesan 8,50 PLN dikenakan. \nAnda harus membayar ini saat mengambil di kantor pos,\nkarena paket kemungkinan tidak akan dikirim ke pintu atau kotak surat Anda.","countryMsgPH":"PHLPost di Filipina dianggap tidak efisien dan tidak dapat diandalkan.\nSilakan selalu lacak paket Anda karena status 'dalam perjalanan untuk pengiriman'\nterkadang hanya ditampilkan selama 1-3 minggu untuk paket yang lebih kecil. Untuk paket yang lebih besar,\nmengambil hanya mungkin di Manila Central Post Office atau\nkantor pos terdekat di wilayah Anda. Harap dicatat bahwa biaya pemrosesan 112 PHP untuk paket\nnilai apa pun dikenakan yang harus Anda bayar. Gagal membayar akan mengakibatkan paket\ndikembalikan kepada kami. Pengiriman diperkirakan memakan waktu 1-2 bulan karena layanan PHLPost yang lambat. \nAnda tidak perlu membayar pajak untuk barang di bawah 10000 PHP, tetapi Anda harus melakukannya jika nilainya sama atau melebihi jumlah itu. \nKami akan merekomendasikan SpeedPost Express untuk proses yang lebih cepat di lain waktu saat Anda memesan dari kami. Namun, biaya mungkin tidak berlaku karena D&T untuk penerima adalah default.","countryMsgCA":"De minimis adalah 20 CAD untuk semua pesanan yang dikirim ke Kanada. Karena Singapura adalah bagian dari perjanjian CPTPP, bea mungkin tidak berlaku, tetapi D&T mungkin berlaku jika barang melebihi ambang 60 CAD ke atas atau 100 CAD ke atas, yang dapat bergantung pada kode HS barang. Nilai apa pun di atas jumlah itu akan dikenakan PPN sesuai.","countryMsgID":"Anda perlu membayar pajak dan bea yang berlaku saat tiba di Indonesia. Silakan lacak paket Anda dan bayar jumlah yang ditentukan ke bea cukai Indonesia.\nAnda juga perlu mengajukan dokumentasi bea cukai tambahan. Jika tidak, dapat menyebabkan pembatasan masuk atau penyitaan paket oleh bea cukai negara. Silakan periksa detail lebih lanjut di sini:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Anda perlu membayar pajak dan bea yang berlaku saat tiba di India. Silakan lacak paket Anda dan bayar jumlah yang ditentukan ke bea cukai India.\nHarap dicatat bahwa pembebasan bea cukai di India ketat, dan Anda mungkin atau mungkin tidak dikenakan bea jika nilai barang Anda melebihi 1000 INR (15 USD) - tergantung pada kode HS, dalam kebanyakan kasus itu bebas bea, tetapi Anda dapat dikenakan bea yang lebih tinggi jika barang melebihi 5000 INR (60 USD). \nKarena India Post TIDAK mengirim ke kotak surat secara default, Anda mungkin perlu berada di rumah atau perwakilan resmi untuk menerima paket Anda atau mengambil di kantor pos.","countryMsgMY":"De minimis adalah 500 MYR untuk semua pesanan yang dikirim ke Malaysia. Pesanan di atas jumlah itu mungkin dikenakan biaya.","countryMsgUS":"Mulai 29 Agustus 2025, de minimis USD800 akan dihapus secara resmi dan bea impor akan dibayar secara default oleh pengirim di negara asal.\nPengiriman AS MEMERLUKAN nomor telepon dan alamat email yang valid agar paket Anda menghindari penundaan lebih lanjut.","countryMsgIL":"De minimis adalah 240 ILS (75 USD) untuk semua pengiriman ke Israel. Pesanan di atas jumlah itu mungkin dikenakan biaya. \nHarap dicatat bahwa untuk pesanan yang dikirim ke Israel, Israel Post terkadang mungkin tidak mengakui pengiriman akhir setelah dikirim. \nKarena Israel Post TIDAK mengirim ke kotak surat secara default, Anda mungkin perlu berada di rumah atau perwakilan resmi untuk menerima paket Anda atau mengambil di kantor pos.","countryMsgGB":"Harap dicatat bahwa untuk pesanan yang dikirim ke Inggris, Royal Mail terkadang mungkin tidak mengakui pengiriman akhir setelah dikirim ke kotak surat Anda.","countryMsgTH":"De minimis adalah 1500 THB (45 USD) untuk semua pengiriman ke Thailand. Pesanan di atas jumlah itu mungkin dikenakan biaya.","countryMsgTW":"De minimis adalah 2000 TWD (60 USD) untuk semua pengiriman ke Taiwan. Pesanan di atas jumlah itu mungkin dikenakan biaya.","countryMsgMO":"Tidak ada D&T yang dikenakan saat mengirim ke Makau. Namun, harap dicatat bahwa Macau Post TIDAK mengirim ke kotak surat secara default, Anda HARUS mengambil paket Anda di kantor pos.","countryMsgBN":"Tidak ada D&T yang dikenakan saat mengirim ke Brunei. Namun, harap dicatat bahwa Brunei Post TIDAK mengirim ke kotak surat secara default, Anda HARUS mengambil paket Anda di kantor pos. \nSistem pelacakan untuk negara ini tidak terlalu stabil dan informasi terbatas dapat diberikan, dan hasil pengiriman akhir TIDAK diberikan ke asal.","countryMsgJP":"De minimis adalah 10000 JPY (65 USD) untuk semua pengiriman ke Jepang. Pesanan di atas jumlah itu mungkin dikenakan biaya.","countryMsgKR":"De minimis adalah 180000 KRW (150 USD) untuk semua pengiriman ke Korea Selatan. Pesanan di atas jumlah itu mungkin dikenakan biaya.","countryMsgVN":"Untuk Vietnam, harap tetap DAPAT DIHUBUNGI selama pengiriman karena Anda mungkin dikenakan biaya pemrosesan saat pengiriman barang. \nDe minimis adalah 1000000 (35 USD) untuk semua pengiriman ke Vietnam. Pesanan di atas jumlah itu mungkin dikenakan biaya. \nKarena Vietnam Post TIDAK mengirim ke kotak surat secara default, Anda mungkin perlu berada di rumah atau perwakilan resmi untuk menerima paket Anda atau mengambil di kantor pos.","countryMsgPP":"Item Tracked Label akan dipos di POPDrop/POPStop di kantor pos. Item SpeedPost Standard biasanya dipos di POPStop atau POPStation.\nHarap dicatat bahwa pengiriman item Tracked Label adalah HANYA dari Senin hingga Jumat, 9 pagi hingga 6 sore. Kecuali pada akhir pekan dan hari libur umum.","postedDate":"Tanggal Pos:","status":"Status:","shippedVia":"Dikirim melalui:","destination":"Tujuan:","statusInPreparation":"Dalam persiapan","statusInTransit":"Dalam perjalanan","statusDelivered":"Terkirim","statusOutForDelivery":"Keluar untuk pengiriman","statusArrived":"Tiba","statusProcessing":"Dalam pemrosesan","statusDispatched":"Dikirim","statusReturned":"Dikembalikan","statusFailed":"Gagal terkirim","statusCancelled":"Dibatalkan","statusHeldByCustoms":"Ditahan oleh bea cukai","statusAwaitingCollection":"Menunggu pengambilan","aka":"juga dikenal sebagai","thisServiceKnownAs":"Layanan ini dikenal sebagai","in":"di","viewTrackingDHL":"Lihat informasi pelacakan dari DHL Express","viewTrackingSingPostSpeedPost":"Lihat informasi pelacakan dari Singapore SpeedPost","viewTrackingDHLLastMile":"Lihat informasi pelacakan dari DHL Express (Mil terakhir)","viewTrackingDHLShipperRef":"Lihat informasi pelacakan dari DHL Express (Referensi pengirim)","viewTrackingSingPost":"Lihat informasi pelacakan dari Singapore Post","viewTrackingDestPost":"Lihat informasi pelacakan dari","post":"Pos","orderNumberExample":"Nomor Pesanan (dimulai dengan RTNX - contoh: RTNX1234567890):","deliveryRecordNote":"Harap dicatat bahwa setelah item dikirim, catatan hanya akan disimpan hingga 7 hari dan akan dihapus.","copyrightAllRights":"Hak cipta dilindungi.","countryAfghanistan":"Afganistan","countryAlbania":"Albania","countryAlgeria":"Aljazair","countryAndorra":"Andorra","countryAngola":"Angola","countryArgentina":"Argentina","countryArmenia":"Armenia","countryAustralia":"Australia","countryAustria":"Austria","countryAzerbaijan":"Azerbaijan","countryBahrain":"Bahrain","countryBangladesh":"Bangladesh","countryBelarus":"Belarus","countryBelgium":"Belgia","countryBhutan":"Bhutan","countryBolivia":"Bolivia","countryBosnia":"Bosnia & Herzegovina","countryBrazil":"Brasil","countryBrunei":"Brunei","countryBulgaria":"Bulgaria","countryBurkinaFaso":"Burkina Faso","countryBurundi":"Burundi","countryCambodia":"Kamboja","countryCameroon":"Kamerun","countryCanada":"Kanada","countryCentralAfricanRep":"Republik Afrika Tengah","countryChad":"Chad","countryChile":"Chili","countryChina":"Tiongkok","countryColombia":"Kolombia","countryCongo":"Kongo","countryCostaRica":"Kosta Rika","countryCroatia":"Kroasia","countryCyprus":"Siprus","countryCzech":"Republik Ceko","countryDenmark":"Denmark","countryDjibouti":"Djibouti","countryDominicanRep":"Republik Dominika","countryEastTimor":"Timor Leste","countryEcuador":"Ekuador","countryEgypt":"Mesir","countryElSalvador":"El Salvador","countryEquatorialGuinea":"Guinea Khatulistiwa","countryEstonia":"Estonia","countryFiji":"Fiji","countryFinland":"Finlandia","countryFrance":"Prancis","countryGabon":"Gabon","countryGeorgia":"Georgia","countryGermany":"Jerman","countryGhana":"Ghana","countryGreece":"Yunani","countryGreenland":"Greenland","countryGuam":"Guam","countryGuyana":"Guyana","countryHonduras":"Honduras","countryHongKong":"Hong Kong","countryHungary":"Hungaria","countryIceland":"Islandia","countryIndia":"India","countryIndonesia":"Indonesia","countryIran":"Iran","countryIreland":"Irlandia","countryIsrael":"Israel","countryItaly":"Italia","countryIvoryCoast":"Pantai Gading","countryJapan":"Jepang","countryJordan":"Yordania","countryKazakhstan":"Kazakhstan","countryKenya":"Kenya","countryKiribati":"Kiribati","countryKoreaNorth":"Korea Utara","countryKoreaSouth":"Korea Selatan","countryKuwait":"Kuwait","countryKyrgyzstan":"Kirgizstan","countryLaos":"Laos","countryLatvia":"Latvia","countryLebanon":"Lebanon","countryLesotho":"Lesotho","countryLiberia":"Liberia","countryLibya":"Libya","countryLiechtenstein":"Liechtenstein","countryLithuania":"Lituania","countryLuxembourg":"Luksemburg","countryMacau":"Makau","countryMadagascar":"Madagaskar","countryMalawi":"Malawi","countryMalaysia":"Malaysia","countryMaldives":"Maladewa","countryMali":"Mali","countryMalta":"Malta","countryMarshallIslands":"Kepulauan Marshall","countryMauritania":"Mauritania","countryMauritius":"Mauritius","countryMexico":"Meksiko","countryMicronesia":"Mikronesia","countryMoldova":"Moldova","countryMonaco":"Monako","countryMongolia":"Mongolia","countryMontenegro":"Montenegro","countryMorocco":"Maroko","countryMozambique":"Mozambik","countryMyanmar":"Myanmar","countryNamibia":"Namibia","countryNauru":"Nauru","countryNepal":"Nepal","countryNetherlands":"Belanda","countryNewZealand":"Selandia Baru","countryNiger":"Niger","countryNigeria":"Nigeria","countryNiue":"Niue","countryNorthMacedonia":"Makedonia Utara","countryNorway":"Norwegia","countryOman":"Oman","countryPakistan":"Pakistan","countryPalau":"Palau","countryPanama":"Panama","countryPapuaNewGuinea":"Papua Nugini","countryParaguay":"Paraguay","countryPeru":"Peru","countryPhilippines":"Filipina","countryPoland":"Polandia","countryPortugal":"Portugal","countryQatar":"Qatar","countryRomania":"Rumania","countryRussia":"Rusia","countryRwanda":"Rwanda","countrySamoa":"Samoa","countrySanMarino":"San Marino","countrySaudiArabia":"Arab Saudi","countrySenegal":"Senegal","countrySerbia":"Serbia","countrySeychelles":"Seychelles","countrySierraLeone":"Sierra Leone","countrySingapore":"Singapura","countrySlovakia":"Slowakia","countrySlovenia":"Slovenia","countrySolomonIslands":"Kepulauan Solomon","countrySouthAfrica":"Afrika Selatan","countrySpain":"Spanyol","countrySriLanka":"Sri Lanka","countrySudan":"Sudan","countrySuriname":"Suriname","countrySwaziland":"Eswatini","countrySweden":"Swedia","countrySwitzerland":"Swiss","countrySyria":"Suriah","countryTaiwan":"Taiwan","countryTajikistan":"Tajikistan","countryTanzania":"Tanzania","countryThailand":"Thailand","countryTogo":"Togo","countryTonga":"Tonga","countryTunisia":"Tunisia","countryTurkey":"Turki","countryTurkmenistan":"Turkmenistan","countryTuvalu":"Tuvalu","countryUganda":"Uganda","countryUkraine":"Ukraina","countryUAE":"Uni Emirat Arab","countryUK":"Inggris Raya","countryUSA":"Amerika Serikat","countryUruguay":"Uruguay","countryUzbekistan":"Uzbekistan","countryVanuatu":"Vanuatu","countryVatican":"Vatikan","countryVenezuela":"Venezuela","countryVietnam":"Vietnam","countryWesternSahara":"Sahara Barat","countryYemen":"Yaman","countryZambia":"Zambia","countryZimbabwe":"Zimbabwe","epacUS":"Layanan Paket Internasional Kelas Pertama","epacCH":"Prioritas Ditambah","epacGB":"Dilacak Internasional","epacMY":"Dilacak/Ekspres Internasional","epacCA":"Ekspres Masuk Internasional","epacAU":"Kemas dan Lacak Internasional","epacNZ":"Pelacakan Ekonomi Internasional","epacDE":"Premium Internasional Warenpost","epacFR":"Surat internasional dengan pelacakan","epacNL":"Paket Internasional Dilacak","epacPL":"Ekspres GLOBAL","epacBE":"Perdana Internasional Masuk","epacAT":"Paket Terlacak Internasional","epacIN":"Paket Terlacak Internasional","epacFI":"Surat Terlacak Internasional","epacSE":"Surat Terlacak Internasional","epacNO":"PRIME Ekspres","epacIT":"Cepat","epacIL":"Cepat","epacES":"Paket Ringan Internasional","epacPT":"Surat Biru Internasional","epacCZ":"Pengiriman terlacak dari luar negeri","epacBN":"ePacket Internasional","epacCN":"ePacket Internasional","epacHK":"ePacket Internasional","epacID":"e-Paket Internasional","epacMO":"ePacket Internasional","epacPH":"Surat Terlacak Internasional","epacTW":"ePacket Internasional","epacTH":"ePacket Internasional","epacVN":"E-Paket Internasional (Paket ASEAN)","epacKR":"K-Paket","epacJP":"e-Paket Internasional Light","epacIE":"Pos Ekspres Internasional","blogSingPostEPACContent1":"SingPost ePAC (ePacket) adalah layanan pos terlacak ekonomis untuk pengiriman e-commerce internasional ringan.","blogSingPostEPACContent2":"Dikirim oleh operator pos nasional negara tujuan dan umumnya digunakan untuk paket di bawah 2 kg, dengan batas dimensi panjang + lebar + tinggi di bawah 90 cm dan panjang tidak melebihi 60 cm.","blogSingPostEPACContent3":"Opsi ini awalnya hanya ditawarkan oleh Hong Kong Post bersama dengan eBay China, memungkinkan paket dari China dan Hong Kong dikirim ke AS dengan pelacakan pengiriman tanpa memerlukan tanda tangan saat pengiriman. Layanan ini dikenal sebagai USPS (United States Postal Service) First-Class Package International Service di AS.","blogSingPostEPACContent4":"Mulai 1 Januari 2026, ePAC sekarang digunakan untuk semua negara untuk mematuhi peraturan UPU wajib yang mewajibkan pelacakan untuk paket dan membatasi item terdaftar hanya untuk dokumen.","blogSingPostEPACContent5":"Awalan pelacakan: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS adalah layanan ekspres pos internasional premium, diprioritaskan oleh operator pos di seluruh dunia.","blogSpeedPostEMSContent2":"Bea cukai umumnya lebih cepat daripada surat standar tetapi lebih ketat dalam prosesnya, dengan pelacakan penuh hingga pengiriman.","blogSpeedPostEMSContent3":"Di Singapura, ini dikenal sebagai SpeedPost Priority International oleh SingPost.","blogSpeedPostEMSContent4":"Awalan pelacakan: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express adalah layanan tingkat kurir.","blogSpeedPostExpressContent2":"Di banyak tujuan, DHL Express melakukan pengiriman mil terakhir dan mengumpulkan bea atau pajak sebelum pelepasan.","blogSpeedPostExpressContent3":"Awalan pelacakan: PX123456789SG (Mil terakhir DHL Express menggunakan nomor pelacakan 10 digit, yang tidak terlihat oleh publik, tetapi kami memiliki informasi untuk itu melalui","blogSpeedPostExpressContent3Link":"Sistem Pelacakan kami.","blogUSPDDPContent1":"PDDP memungkinkan bea impor dan pajak AS dibayar di muka sebelum pengiriman, mengurangi biaya kejutan bagi penerima.","blogUSPDDPContent2":"Peraturan Baru (Berlaku 29 Agustus 2025)","blogUSPDDPContent2List1":"Kode HTS wajib","blogUSPDDPContent2List2":"Deskripsi item yang akurat","blogUSPDDPContent2List3":"Penegakan tarif yang lebih ketat","blogUSPDDPContent3":"Semua item yang dikirim ke AS tidak akan dikenakan tarif tambahan kepada penerima karena kami membayar atas nama Anda. Namun, perhatikan bahwa harga item secara default mencakup biaya impor 10% untuk mematuhi peraturan.","blogUSPDDPContent4":"Ini hanya berlaku untuk metode pengiriman kami ke AS, SpeedPost Priority International (EMS) dan SingPost ePAC saja.","blogEUIOSSContent1":"UE menerapkan PPN pada semua impor komersial terlepas dari nilainya.","blogEUIOSSContent2":"IOSS (Toko Terpadu Impor)","blogEUIOSSContent3":"IOSS memungkinkan penjual untuk mengumpulkan PPN UE saat checkout untuk pengiriman hingga €150.","blogEUIOSSContent4":"PPN kemudian dikirimkan melalui sistem IOSS, memungkinkan bea cukai lebih cepat dan tidak ada pengumpulan PPN saat pengiriman.","blogEUIOSSContent5":"Untuk semua pesanan melalui Etsy atau eBay, PPN IOSS sudah dikumpulkan saat checkout dan kami akan menunjukkannya pada Nomor Referensi Pajak untuk mengirimkan data ke layanan pos tujuan melalui EDI (Electronic Data Interchange).","blogUKVATContent1":"Inggris memerlukan PPN untuk diperhitungkan untuk barang impor.","blogUKVATContent2":"Untuk pengiriman bernilai rendah, PPN biasanya dikumpulkan saat checkout dan dikirimkan langsung ke HMRC oleh penjual atau marketplace.","blogUKVATContent3":"Untuk pengiriman bernilai lebih tinggi, PPN dapat dikumpulkan oleh operator sebelum pengiriman.","blogUKVATContent4":"Untuk semua pesanan melalui Etsy atau eBay, PPN sudah dikumpulkan saat checkout dan kami akan menunjukkannya pada Nomor Referensi Pajak untuk mengirimkan data ke layanan pos tujuan melalui EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"Norwegia memperkenalkan sistem VOEC (VAT on E-Commerce) untuk barang yang diimpor dari luar UE/EEA. Ini berlaku untuk barang yang bernilai hingga 3.000 NOK.","blogNorwayVOECContent2":"Penjual dapat mendaftar dalam skema VOEC untuk mengumpulkan PPN Norwegia saat checkout, memungkinkan bea cukai lebih cepat dan tidak ada pengumpulan PPN saat pengiriman.","blogNorwayVOECContent3":"Untuk semua pesanan melalui Etsy atau eBay, PPN VOEC sudah dikumpulkan saat checkout. Pelacakan dan dokumen bea cukai menunjukkan Nomor Referensi Pajak untuk mengirimkan data ke layanan pos Norwegia.","blogSwissVATContent1":"Swiss mengenakan PPN pada barang impor terlepas dari nilainya. Administrasi Bea Cukai Federal Swiss mengharuskan penjual asing untuk mengumpulkan PPN saat checkout untuk barang hingga 65 CHF.","blogSwissVATContent2":"Penjual yang terdaftar dalam sistem PPN Swiss mengirimkan PPN yang dikumpulkan secara langsung, memastikan penerima tidak mengalami biaya PPN tambahan saat pengiriman.","blogSwissVATContent3":"Untuk semua pesanan melalui Etsy atau eBay, PPN Swiss sudah dikumpulkan selama checkout, dan dokumen bea cukai mencakup Nomor Referensi Pajak untuk pengiriman EDI.","dhlNoEmbed":"DHL Express tidak mendukung pelacakan melalui embed. Silakan","speedPostNoEmbed":"SpeedPost Singapura tidak mendukung pelacakan melalui embed. Silakan","operatorNoEmbed":"tidak mendukung pelacakan melalui embed. Silakan","clickHere":"klik di sini","toTrackNewTab":"untuk melacak (buka di tab baru).","countryRU":"🇷🇺 Rusia","russiaServiceSuspended":"⚠️ PEMBERITAHUAN PENTING: Mengingat invasi Rusia ke Ukraina pada tahun 2022, SingPost telah menangguhkan semua pengiriman ke Rusia bersama dengan DHL. Kami saat ini tidak melayani Rusia sampai ada pengumuman pemulihan layanan ke negara tersebut.","diwaliMessage":"🪔 Selamat Diwali! Semoga festival lampu memberi Anda kegembiraan, kemakmuran, dan kesuksesan! ✨","temporaryClosureNoticeTitle":"Rhythm Nexus - Pemberitahuan Penutupan Sementara","temporaryClosureNoticeBody":"Pelanggan yang terhormat,\n\nMohon diperhatikan bahwa Rhythm Nexus akan tutup sementara dari 21 Maret 2026 hingga 26 Maret 2026 karena acara perusahaan.\n\nUntuk persiapan penutupan, toko akan masuk mode liburan mulai 20 Maret 2026 pukul 3:00 PM (UTC +8). Pesanan yang dibuat setelah waktu tersebut mungkin belum diproses hingga kami kembali beroperasi.\n\nOperasional bisnis normal akan kembali pada 27 Maret 2026.\n\nKami mohon maaf atas ketidaknyamanan yang terjadi dan berterima kasih atas pengertian serta dukungan Anda yang berkelanjutan.\n\nTerima kasih.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Saya mengerti","parcelTracking":"Pelacakan Paket","serviceAnnouncement":"Pengumuman Layanan","usaWinterStormTitle":"MENDESAK: Badai Musim Dingin Parah - Gangguan Layanan","usaWinterStormSubtitle":"Layanan Pos Amerika Serikat (USPS) Peristiwa Keadaan Memaksa","usaWinterStormNotice1":"Karena badai musim dingin parah yang mempengaruhi wilayah New York sejak 23 Februari 2026:","usaWinterStormNotice2":"Operasi internasional di Bandara Internasional John F. Kennedy telah secara efektif dihentikan","usaWinterStormNotice3":"Pembatalan penerbangan yang luas dan gangguan signifikan terhadap layanan bandara dilaporkan","usaWinterStormNotice4":"Kondisi ini merupakan peristiwa keadaan memaksa di luar kontrol USPS","usaWinterStormNotice5":"Dampak Layanan:","usaWinterStormNotice6":"Campuran berbahaya dari salju lebat, hujan beku, hujan es dan udara dingin yang menggigit","usaWinterStormNotice7":"Gangguan besar dan pemadaman listrik yang luas dilaporkan","usaWinterStormNotice8":"Pengumpulan dan pengiriman surat dalam negeri dan internasional (surat pos, paket pos dan item EMS) terpengaruh","usaWinterStormNotice9":"Wilayah Kode Pos yang Terdampak:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS mengambil semua langkah yang diperlukan untuk meminimalkan ketidaknyamanan bagi pelanggan sambil menjaga keselamatan karyawan. Kami menghargai kesabaran dan pemahaman Anda selama peristiwa keadaan memaksa ini.","usaWinterStormNotice12":"Terakhir diperbarui: 25 Februari 2026","countryAutoDetected":"Tujuan telah ditetapkan sesuai lokasi Anda","countryAutoDetectedFromLink":"Tujuan telah ditetapkan dari tautan","trackingNumber":"Nomor Pelacakan","destinationCountry":"Negara Tujuan","postcode":"Kode pos","fillAllFields":"Silakan isi semua kolom yang wajib diisi: nomor pelacakan, negara tujuan, nomor pesanan, dan kode pos.","noOrderMatchingFields":"Tidak ditemukan pesanan yang cocok dengan semua bidang.","postcodeRequired":"Kode pos diperlukan untuk tujuan ini.","invalidUSZip":"Kode Pos AS tidak valid. Gunakan 5 digit atau ZIP+4.","failedGenerateURL":"Gagal membuat URL pelacakan. Silakan periksa masukannya.","trackingValidationSG":"Nomor pelacakan untuk Singapura harus: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG atau PX123456789SG. Untuk Pengiriman DHL gunakan 10 digit angka.","invalidSingPostFormat":"Format nomor pelacakan SingPost tidak valid.\nFormat yang diterima:\n• PP123456789SG → Label Terlacak Prabayar\n• SPNDD00012345 → Pelacakan Standar SpeedPost","australianDSTTitle":"Waktu Musim Panas Australia Aktif","australianDSTBothMessage":"AEDT (Waktu Musim Panas Bagian Timur Australia) dan ACDT (Waktu Musim Panas Tengah Australia) saat ini berlaku.","australianAEDTMessage":"AEDT (Waktu Musim Panas Bagian Timur Australia) saat ini berlaku untuk wilayah Sydney, Melbourne, dan sekitarnya.","australianACDTMessage":"ACDT (Waktu Musim Panas Tengah Australia) saat ini berlaku untuk Adelaide dan Australia Selatan.","australianDSTNote":"Waktu pengiriman yang ditampilkan di atas mencerminkan waktu musim panas saat ini.","filteredAllowedDestinations":"(Difilter berdasarkan tujuan yang diizinkan)","loadingAnnouncements":"Memuat pengumuman...","unableToLoadAnnouncements":"Tidak dapat memuat pengumuman layanan saat ini.","viewOnSingPostWebsite":"Lihat di Situs Web SingPost →","statusHeldByCustms":"Diselenggarakan oleh Bea Cukai","accessRestricted":"Akses Dibatasi","vpnDetectedMessage":"Penggunaan VPN terdeteksi. Harap nonaktifkan VPN untuk mengakses layanan ini.","contactSupportError":"Jika Anda yakin ini adalah kesalahan, harap hubungi dukungan.","postalContactsTitle":"Kontak Layanan Pos","postalContactsNote":"Catatan:","postalContactsPolandUKNote":"Untuk Polandia & Inggris, semua item yang dikirim melalui SpeedPost Priority (EMS) akan ditangani oleh Pocztex dan Parcelforce.","postalContactsDHLNote":"Untuk pengiriman SpeedPost Express, silakan hubungi DHL melalui tautan ini:","postalContactsCountry":"Negara","postalContactsWebsite":"Situs web","postalContactsForm":"Formulir Kontak","postalContactsPhone":"Nomor Telepon","postalContactsEmail":"Email Kontak","postalContactsFormLink":"Formulir Kontak","postalContactsBackButton":"Kembali ke Formulir Pertanyaan Paket","destinationNotAllowed":"Akses ke negara tujuan ini tidak tersedia dari lokasi Anda. Silakan pilih tujuan lain.","contactUsTitle":"Hubungi Kami","contactNameLabel":"Nama (nama panggilan atau nomor telepon tidak diizinkan)","contactEmailLabel":"Alamat Email (kami akan membalas Anda)","contactEmailNote":"Email relay pribadi (misalnya @privaterelay.appleid.com) tidak diterima. Silakan gunakan alamat email yang valid.","contactEnquiryTypeLabel":"Ini tentang apa?","contactSelectOption":"Pilih opsi","contactGeneralEnquiry":"Pertanyaan Umum / Umpan Balik","contactBusinessEnquiry":"Pertanyaan Bisnis","contactOrderShippingEnquiry":"Pertanyaan Pesanan/Pengiriman","contactExchangeRefundEnquiry":"Pertanyaan Tukar/Pengembalian Dana/Retur","contactOthers":"Lainnya","contactParcelWarning":"Jika paket Anda belum terkirim lebih dari 18/30/45 hari (FedEx 14 hari), atau menunjukkan status terkirim tetapi Anda tidak menerimanya, silakan isi","contactParcelWarningLink":"formulir ini","contactParcelWarningEnd":"sebagai gantinya.","contactOrderNumberLabel":"Nomor Pesanan","contactOrderNumberPlaceholder":"Contoh: RTNX1234567890","contactPlatformNote":"Nomor pesanan Etsy, eBay & Shopee di sini. Kami TIDAK memiliki kendali atas pengembalian dana dari platform ini. Silakan hubungi layanan pelanggan mereka masing-masing.","contactPlatformInstructions":"Silakan gunakan aplikasi untuk melihat nomor pesanan Anda, karena disimpan di aplikasi:","contactPlatformEtsy":"Etsy - Kanan atas pada profil Anda → Pembelian","contactPlatformEbay":"eBay - eBay Saya → Pembelian","contactPlatformShopee":"Shopee - Saya → Lihat Riwayat Pembelian (atau Anda bisa klik Perlu Dikirim/Perlu Diterima)","contactRefundNote1":"Jika Anda menanyakan Retur/Pengembalian Dana untuk platform tempat Anda membeli, harap dicatat bahwa kami TIDAK memiliki kendali atas pengembalian dana dari platform ini. Silakan hubungi layanan pelanggan mereka masing-masing.","contactRefundNote2":"Untuk Retur atau Tukar, kami tidak mengizinkan untuk sarung tangan maimai jika sudah digunakan saat dibuka (noda terlihat atau dicuci di mesin cuci/cuci manual), dan tidak ada retur atau tukar yang diizinkan untuk kartu hiburan. Terima kasih.","contactRefundNote3":"Harap dicatat bahwa untuk pengembalian dana melalui Payhip, jika Anda belum menerima pengembalian dana, hubungi bank Anda atau dukungan Payhip di support@payhip.com karena kami tidak memiliki kendali atas prosesnya.","contactMessageLabel":"Pesan Anda (hingga 1000 karakter)","contactCharacterCount":"karakter","contactSpamWarningNote":"Catatan:","contactSpamWarning":"Penawaran yang tidak diminta untuk SEO, desain situs web, pinjaman, atau layanan serupa akan otomatis ditolak.","contactAgreementText1":"Silakan klik \"Saya Setuju\", jika Anda setuju alamat email Anda digunakan oleh Rhythm Nexus untuk merespons Anda, karena ini diperlukan oleh kami untuk membaca respons Anda dan membalas Anda setelah kami menemukan solusi untuk pertanyaan Anda.","contactAgreementText2":"Harap dicatat bahwa respons kami akan memakan waktu 3-5 hari kerja, atau lebih lama selama volume email yang tinggi di pihak kami.","contactAgreeCheckbox":"Saya Setuju","contactSuccessMessage":"Pesan Anda telah berhasil dikirim! Kami akan merespons dalam 3-5 hari kerja.","contactErrorMessage":"Gagal mengirim pesan. Silakan coba lagi.","contactGeneralError":"Terjadi kesalahan. Silakan coba lagi nanti.","contactSubmitting":"Mengirim...","contactSubmit":"Kirim","contactAlertAgree":"Silakan setuju dengan persyaratan untuk mengirim formulir.","parcelEnquiryTitle":"Pertanyaan Paket","parcelInfoText":"Formulir ini untuk paket yang tidak terkirim lebih dari 18/30/45 hari (14 hari untuk FedEx/DHL), atau telah menunjukkan status terkirim tetapi tidak bersama Anda.","parcelInfoLink":"Klik di sini","parcelInfoEnd":"untuk pertanyaan lainnya.","parcelWaitTitle":"Silahkan Tunggu Paket Anda","parcelWaitText1":"Silakan tunggu paket Anda terkirim. Harap dicatat pengiriman Internasional TIDAK sama dengan pengiriman lokal karena mereka memerlukan waktu. Terima kasih!","parcelWaitText2":"Jika tidak ada status yang ditampilkan setelah 18 hari (7 hari untuk Singapura) atau lebih, Anda dapat memberi tahu kami secara langsung.","parcelCannotSubmit":"Anda tidak dapat mengirim formulir ini jika Anda memilih \"Tidak\".","parcelNameLabel":"Nama","parcelOrderNumberLabel":"Nomor Pesanan (Contoh: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Alamat Email (Kami akan merespons Anda melalui sini)","parcelEmailNote":"Email relay pribadi tidak diterima. Silakan gunakan alamat email yang valid.","parcelShippingMethodLabel":"Metode Pengiriman yang Dipilih?","parcelSelectShipping":"Pilih metode pengiriman","parcelSingPostEpac":"SingPost ePacket (atau ePAC) - alias SpeedPost Saver International (Pelacakan: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Pelacakan: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Pelacakan: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Pelacakan: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Pelacakan: PX123456789SG)","parcelDHL":"DHL Express (Hanya Negara UE) (Pelacakan: 1234567890)","parcelTrackingNumberLabel":"Nomor pelacakan paket Anda?","parcelUndeliveredLabel":"Apakah paket Anda tidak terkirim lebih dari 18/30/45 hari? (Layanan Lokal Singapura >7 hari, >14 hari untuk SpeedPost Express/DHL)","parcelSelectOption":"Pilih opsi","parcelYes":"Ya","parcelNo":"Tidak","parcelDeliveredButMissingLabel":"Apakah paket Anda menunjukkan status terkirim, tetapi tidak ada di kotak surat/tempat aman/depan pintu Anda?","parcelCaseReferenceLabel":"ID Referensi Kasus dari Kantor Pos Lokal","parcelCaseReferencePlaceholder":"Masukkan NA jika Anda dari Singapura","parcelCaseReferenceNote":"Sebelum mengirimkan formulir ini, silakan hubungi kantor pos lokal Anda melalui telepon atau email dan dapatkan ID referensi kasus dari mereka. Kemudian, masukkan ID referensi kasus Anda di sini.","parcelCaseReferenceLink":"Lihat tautan ini untuk kontak Layanan Pos","parcelCaseReferenceMandatory":"MASUKKAN NA HANYA JIKA ANDA DARI SINGAPURA. Untuk negara lain WAJIB menyediakan. Diperlukan untuk SpeedPost Express juga, untuk ID kasus DHL.","parcelImageEvidenceLabel":"Bukti Gambar (untuk paket yang terkirim tetapi hilang)","parcelImageWarning":"Untuk verifikasi tambahan, kami memerlukan bukti gambar untuk membuktikan bahwa Anda tidak membuat klaim palsu tentang ketidakterkirimanpaket. (Hanya untuk paket yang sudah terkirim, tetapi tidak ada di kotak surat/luar depan pintu. Kami dapat menolak klaim Anda jika tidak ada bukti foto yang diberikan untuk item yang terkirim. Abaikan ini jika item Anda TIDAK menunjukkan status terkirim.)","parcelImageNote":"Unggah 1 file yang didukung: gambar. Maks 1 GB.","parcelAgreementText":"Silakan Klik \"Saya setuju\" jika Anda memastikan bahwa apa yang terjadi pada paket Anda adalah benar.","parcelAgreeCheckbox":"Saya setuju","parcelSuccessMessage":"Pertanyaan paket Anda telah berhasil dikirim! Kami akan merespons dalam 3-5 hari kerja.","parcelErrorMessage":"Gagal mengirim pertanyaan. Silakan coba lagi.","parcelGeneralError":"Terjadi kesalahan. Silakan coba lagi nanti.","parcelAlertWait":"Silakan tunggu paket Anda terkirim. Anda dapat mengirim formulir ini setelah periode tunggu yang ditentukan.","parcelAlertAgree":"Silakan setuju dengan persyaratan untuk mengirim formulir.","parcelAlertCaseReference":"Silakan berikan ID referensi kasus dari kantor pos lokal Anda, atau masukkan NA jika Anda dari Singapura.","parcelSubmitting":"Mengirim...","parcelSubmit":"Kirim","lookalikeDomainWarning":"Ini bukan nomor pelacakan, melainkan tautan ke situs yang meniru perusahaan kurir. Jangan memasukkan data pribadi atau pembayaran di sana.","lookalikeDomainOfficial":"Situs resmi:"};
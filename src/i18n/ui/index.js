@@ -0,0 +1,106 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export const locales = ["en","cs","cy","de","es","fi","fr","ga","he","hi","id","it","ja","ko","mi","ms","nl","no","pl","pt","ru","sv","ta","th","tl","vi","yue","zh","zh-hant"];
+
+// One chunk per locale: only the language that is actually requested is downloaded.
+export const loaders = {
+  "en": () => import("./en.js"),
+  "cs": () => import("./cs.js"),
+  "cy": () => import("./cy.js"),
+  "de": () => import("./de.js"),
+  "es": () => import("./es.js"),
+  "fi": () => import("./fi.js"),
+  "fr": () => import("./fr.js"),
+  "ga": () => import("./ga.js"),
+  "he": () => import("./he.js"),
+  "hi": () => import("./hi.js"),
+  "id": () => import("./id.js"),
+  "it": () => import("./it.js"),
+  "ja": () => import("./ja.js"),
+  "ko": () => import("./ko.js"),
+  "mi": () => import("./mi.js"),
+  "ms": () => import("./ms.js"),
+  "nl": () => import("./nl.js"),
+  "no": () => import("./no.js"),
+  "pl": () => import("./pl.js"),
+  "pt": () => import("./pt.js"),
+  "ru": () => import("./ru.js"),
+  "sv": () => import("./sv.js"),
+  "ta": () => import("./ta.js"),
+  "th": () => import("./th.js"),
+  "tl": () => import("./tl.js"),
+  "vi": () => import("./vi.js"),
+  "yue": () => import("./yue.js"),
+  "zh": () => import("./zh.js"),
+  "zh-hant": () => import("./zh-hant.js"),
+};
+
+export const languageMap = {
+  "en": "English",
+  "de": "Deutsch",
+  "fr": "Français",
+  "es": "Español",
+  "ja": "日本語",
+  "zh": "中文（简体）",
+  "zh-hant": "中文（繁體）",
+  "pt": "Português",
+  "hi": "हिंदी",
+  "th": "ไทย",
+  "ms": "Bahasa Melayu",
+  "nl": "Nederlands",
+  "id": "Bahasa Indonesia",
+  "cs": "Čeština",
+  "it": "Italiano",
+  "he": "עברית",
+  "ga": "Gaeilge",
+  "pl": "Polski",
+  "ko": "한국어",
+  "no": "Norsk",
+  "ru": "Русский",
+  "sv": "Svenska",
+  "fi": "Suomi",
+  "tl": "Tagalog",
+  "vi": "Tiếng Việt",
+  "cy": "Cymraeg",
+  "ta": "தமிழ்",
+  "mi": "Māori",
+  "yue": "廣東話"
+};
+
+export const countryLanguageMap = {
+  "AU": "en",
+  "CA": "en",
+  "GB": "en",
+  "US": "en",
+  "IE": "ga",
+  "NZ": "mi",
+  "DE": "de",
+  "AT": "de",
+  "FR": "fr",
+  "PT": "pt",
+  "ES": "es",
+  "IT": "it",
+  "BE": "nl",
+  "CH": "de",
+  "PL": "pl",
+  "CZ": "cs",
+  "FI": "fi",
+  "SE": "sv",
+  "NO": "no",
+  "NL": "nl",
+  "RU": "ru",
+  "CN": "zh",
+  "HK": "yue",
+  "MO": "yue",
+  "TW": "zh-hant",
+  "JP": "ja",
+  "KR": "ko",
+  "TH": "th",
+  "VN": "vi",
+  "ID": "id",
+  "PH": "tl",
+  "MY": "ms",
+  "BN": "ms",
+  "IN": "ta",
+  "IL": "he",
+  "SG": "en"
+};
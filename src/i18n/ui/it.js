@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus utilizza reti commerciali premium. Tuttavia, nel momento esatto in cui arriva nel tuo paese, la custodia viene trasferita al vettore nazionale locale (ad es. USPS, Royal Mail, DHL a livello locale). I prefissi di tracciamento cambiano i sistemi di movimentazione a questa soglia, ma il nostro localizzatore universale di pacchi unisce questi stati per darti una visibilità ininterrotta.","trackingLastMileTitle":"Rete di consegna dell'ultimo miglio","trackingCustomsClearanceBody":"Tutti gli articoli transfrontalieri devono essere sdoganati presso l'agenzia doganale del tuo paese. Il nostro strumento monitora le transizioni dall'arrivo della struttura di importazione alla consegna alla dogana. Le pattuglie di frontiera verificheranno i codici HS e garantiranno che l'IVA o i dazi siano stati rimessi correttamente (ad esempio, IOSS nell'UE, VOEC in Norvegia). Monitorare il tracciamento specifico per gli avvisi \"Tenuto in dogana\".","trackingCustomsClearanceTitle":"Informazioni di sdoganamento","trackingProcessingOriginBody":"Una volta riconsegnato, l'articolo entra nel centro di lavorazione di origine dove viene scansionato, pesato e sottoposto a screening di sicurezza dell'esportazione primaria. Viene quindi inviato allo scambio di posta internazionale. Gli orari dei voli dipendono dalla larghezza di banda del carico disponibile. Non allarmatevi se rimane in questo stato per diversi giorni.","trackingProcessingOriginTitle":"Elaborazione nell'hub di origine","trackingInfoReceivedBody":"Quando un ordine viene elaborato per la prima volta sulle nostre piattaforme di e-commerce (come Etsy, eBay o vendite dirette), il numero di tracciamento viene generato elettronicamente. Il vettore riceve i dati di spedizione prima del possesso fisico della scatola. Si prega di attendere da 1 a 3 giorni lavorativi affinché il pacco venga introdotto nella struttura di smistamento fisica.","trackingInfoReceivedTitle":"Informazione ricevuta","trackingStatusesIntro":"Grazie per aver utilizzato il nostro strumento unificato di tracciamento internazionale dei pacchi. Poiché il tuo pacco viaggia attraverso più confini globali, i suoi stati di tracciamento possono essere complessi. Comprendere il ciclo di vita della logistica aiuta a stabilire aspettative chiare.","trackingStatusesTitle":"Comprensione degli stati di tracciamento","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"AM","pmText":"PM","footerQuickLinks":"Link rapidi","footerSupportLegal":"Supporto e note legali","copyrightText":"Tutti i diritti riservati.","englishResponseNotice":"Avviso: tutte le richieste ricevono risposta in inglese. Se invii in un'altra lingua, il tuo messaggio potrebbe essere tradotto in inglese per la verifica.","parcelDisagreeCheckbox":"Non sono d'accordo","contactDisagreeCheckbox":"Non sono d'accordo","contactNamePlaceholder":"Es: Mario Rossi","systemRequirementsTitle":"Versioni minime supportate del sistema","systemRequirements":"Windows: Windows 7 (with ESU updates installed) o superiore\nmacOS: macOS 12 o superiore\nAndroid: Android 13 o superiore\niPhone/iOS: iOS 17 o superiore\nLinux: Una distribuzione attualmente supportata con aggiornamenti di sicurezza attivi","goodFridayEasterGreeting":"Buona Pasqua! Pace e gioia per il Venerdì Santo e Pasqua.","christmasGreeting":"Buon Natale e Felice Anno Nuovo! Pace e gioia dal 25 dicembre al 5 gennaio.","captchaSystemRequirements":"Requisiti minimi: Windows 7 (with ESU updates installed) o 11, macOS 10.15+, o versione Android/iOS più recente.","title":"Verifica Accesso","subtitle":"Si prega di completare la sfida qui sotto per continuare.","selectLanguage":"Seleziona Lingua","selectLanguagePlaceholder":"-- Scegli una lingua --","loadingChallenge":"Caricamento sfida...","answerLabel":"La tua risposta:","answerPlaceholder":"Inserisci la tua risposta","continueButton":"Continua","refreshButton":"Nuova Sfida","verifying":"Verifica in corso...","chooseLanguageFirst":"Si prega di selezionare prima una lingua.","loadFailed":"Impossibile caricare la sfida. Si prega di riprovare.","expiredChallenge":"Sfida scaduta. Caricamento di una nuova sfida...","verifyFailed":"Verifica fallita. Si prega di riprovare.","home":"Casa","blog":"Blog","aboutUs":"Chi Siamo","faq":"Domande Frequenti","contact":"Contatto","trackPackage":"Traccia Pacco","cnyYearOfHorseMessage":"🧧 Buon Capodanno Lunare! Ti auguriamo prosperità e gioia nell'Anno del Cavallo! 🐴","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Auguriamo a te e alla tua famiglia pace, gioia e benedizioni! 🌟","deepavaliMessage":"🪔 Felice Deepavali! Che la festa delle luci ti porti gioia, prosperità e successo! ✨","diwaliMessage":"🪔 Felice Diwali! Che la festa delle luci ti porti gioia, prosperità e successo! ✨","vesakMessage":"☸️ Felice Giorno di Vesak! Ti auguriamo pace, saggezza e illuminazione in questo giorno sacro! 🙏","vesakTHMessage":"☸️ Felice Giorno di Visakha Bucha! Ti auguriamo pace, saggezza e illuminazione in questo giorno sacro! 🙏","singaporeNationalDayMessage":"🇸🇬 Buon giorno nazionale, Singapore! Festeggiamo 61 anni di indipendenza! 🎉","indonesiaNationalDayMessage":"🇮🇩Selamat Hari Kemerdekaan Indonesia! Dirgahayu Repubblica Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Festeggiamo l'indipendenza della nostra nazione! 🎊","australiaNationalDayMessage":"🇦🇺 Buon giorno dell'Australia! Festeggiamo la nostra nazione! 🎉","canadaNationalDayMessage":"🇨🇦 Buon giorno del Canada! Festeggiamo la nostra grande nazione! 🍁","usaNationalDayMessage":"🇺🇸 Buon giorno dell'indipendenza, America! Festeggiamo la libertà! 🎆","franceBastilleDayMessage":"🇫🇷 Buon 14 luglio! Viva la Francia! 🎊","germanyUnityDayMessage":"🇩🇪 Buon giorno dell'unità tedesca! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Buon giorno della fondazione, Giappone! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Buon giorno nazionale, Cina! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Buon giorno della liberazione, Corea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Buon giorno dell'indipendenza, India! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Buon giorno nazionale, Thailandia! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Buon giorno dell'indipendenza, Filippine! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Buon giorno nazionale, Vietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Buon giorno dell'indipendenza, Polonia! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Buon giorno dell'indipendenza, Repubblica Ceca! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Lunga vita al Re! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Sono contento del giorno nazionale di Sveriges! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Buon giorno dell'indipendenza, Israele! 🎉","irelandNationalDayMessage":"🇮🇪 Buon giorno di San Patrizio, Irlanda! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Buon giorno di Waitangi, Nuova Zelanda! 🎉","switzerlandNationalDayMessage":"🇨🇭 Buon giorno nazionale svizzero! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Buon giorno nazionale, Belgio! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Buon giorno della Russia! 🎉","taiwanFoundingDayMessage":"🇹🇼 Buon Giorno della Fondazione, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Buon Giorno del Doppio Dieci, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Buon Giorno della Fondazione della RAS di Hong Kong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Buon Giorno della Fondazione della RAS di Macao! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Buona Festa Internazionale dei Lavoratori! Celebriamo il lavoro e i diritti dei lavoratori! 🎊","laborDayUSCAMessage":"⚒️ Buona Festa del Lavoro! Onoriamo i contributi dei lavoratori! 🎉","orderNumber":"Numero Ordine (Esempio: RTNX1234567890)","fromDate":"Da Data (RICHIESTO)","toDate":"A Data (RICHIESTO)","trackParcel":"Traccia Pacco","selectCourier":"-- Seleziona Corriere / Paese --","singaporeCouriers":"Corrieri Singapore","topCountries":"Top 5 Paesi","otherCountries":"Altri Paesi","optionSingPost":"🇸🇬 Singapore Post (SingPost)","countryAU":"🇦🇺 Australia","countryCA":"🇨🇦 Canada","countryDE":"🇩🇪 Germania","countryGB":"🇬🇧 Regno Unito","countryUS":"🇺🇸 Stati Uniti","countryAT":"🇦🇹Austria","countryBE":"🇧🇪 Belgio","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Cina","countryCZ":"🇨🇿 Cechia","countryFI":"🇫🇮 Finlandia","countryFR":"🇫🇷 Francia","countryHK":"🇭🇰 Hong Kong SAR Cina","countryIN":"🇮🇳India","countryID":"🇮🇩Indonesia","countryIE":"🇮🇪 Irlanda","countryIL":"🇮🇱 Israele","countryIT":"🇮🇹 Italia","countryJP":"🇯🇵 Giappone","countryMO":"🇲🇴 Macao SAR Cina","countryMY":"🇲🇾 Malesia","countryNL":"🇳🇱 Paesi Bassi","countryNZ":"🇳🇿 Nuova Zelanda","countryNO":"🇳🇴 Norvegia","countryPH":"🇵🇭 Filippine","countryPL":"🇵🇱 Polonia","countryPT":"🇵🇹 Portogallo","countryKR":"🇰🇷 Corea del Sud","countryES":"🇪🇸 Spagna","countrySE":"🇸🇪 Svezia","countryCH":"🇨🇭 Svizzera","countryTW":"🇹🇼Taiwan","countryTH":"🇹🇭 Thailandia","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬Singapore","note":"NOTA","disclaimer":"DISCLAIMER","importantInformation":"Informazioni Importanti:","didNotReceiveEmail":"Se non hai ricevuto l'e-mail di conferma da Etsy, eBay, Shopee o Payhip, scorri verso il basso per cercare il tuo ordine tramite l'indirizzo e-mail o il numero di telefono associato a questo ordine.","searchByEmailOrPhone":"Cerca per Email o Telefono","searchOrder":"Cerca Ordine","trackingResult":"Risultato Tracciamento","noOrdersFound":"Nessun ordine trovato.","pleaseEnter":"Inserisci un'email, telefono o numero ordine.","welcomeTitle":"Benvenuto sul sito web di Rhythm Nexus!","purchaseInfo":"Acquista da noi tramite i nostri canali ufficiali, o unisciti al nostro","purchaseInfoChina":"Acquista da noi tramite i nostri canali ufficiali.","purchaseInfoChinaSuffix":"","telegramGroup":"gruppo Telegram","forUpdates":"per aggiornamenti ufficiali.","ourStores":"I Nostri Negozi","etsyStore":"Negozio Etsy","ebayStore":"Negozio eBay","shopeeStore":"Negozio Shopee","payhipStore":"Negozio Payhip","internationalShipping":"Spedizione Internazionale","singaporeLocal":"Locale Singapore","asiaOnly":"Solo Asia","deliveryInfo":"Informazioni Consegna","deliveryRates2026":"Tariffe Consegna 2026","sgDeliveryRates":"Tariffe Consegna Singapore","speedPostRates":"Tariffe SpeedPost Express Internazionale","aboutTitle":"Chi Siamo - Rhythm Nexus","aboutP1":"Abbiamo avviato il nostro negozio nel 2022 e abbiamo venduto su piattaforme come Etsy, eBay e Shopee senza problemi.","aboutP2":"Nel tempo, abbiamo costruito una solida reputazione concentrandoci su evasione affidabile e tracciamento accurato.","aboutP3":"Il nostro obiettivo è fornire ai clienti un'esperienza di acquisto fluida e affidabile.","aboutP4":"Grazie per aver supportato Rhythm Nexus.","faqTitle":"Domande Frequenti","faqQ1":"Cosa succede se il mio articolo è difettoso? C'è una garanzia?","faqA1":"Sì! La maggior parte degli ordini ha una garanzia di 1 anno. Fornisci il numero della fattura/ordine per consentirci di indagare. Nota: i cambi non sono consentiti se l'articolo corrisponde alla descrizione, anche se hai ordinato in modo errato.","faqQ2":"Posso modificare, aggiornare o annullare il mio ordine?","faqA2":"Sì. Per sicurezza, le modifiche agli ordini potrebbero dover essere gestite via e-mail o tramite il nostro modulo di contatto.","faqQ3":"Devo pagare tasse doganali/di importazione?","faqA3":"Le dogane e i dazi non sono generalmente prepagati, ad eccezione del DDP per gli USA. L'IVA può essere applicata per UE, Regno Unito, AU/NZ, Norvegia, Svizzera e province canadesi come Saskatchewan e Manitoba che è già pagata per impostazione predefinita. Nessuna GST si applica a Singapore. Non siamo in grado di fornire consulenza sulle spese doganali: contatta la dogana locale per i dettagli.","faqQ4":"Quando viene spedito il mio ordine?","faqA4":"Gli ordini vengono generalmente spediti entro 1-5 giorni lavorativi. Durante i periodi di volume elevato, potrebbero essere necessari 5-7 giorni.","faqQ5":"Ho ordinato due volte per errore. Cosa devo fare?","faqA5":"Rimborsiamo solo le spese di spedizione duplicate. Entrambi gli articoli verranno spediti insieme. Rimborso = (1a tariffa di spedizione + 2a tariffa di spedizione) – tariffa di spedizione effettiva.","faqQ6":"Quanto tempo richiede la consegna?","faqA6":"L'elaborazione richiede 1-5 giorni lavorativi.\n\nSpedizione nazionale:\n• SingPost Prepaid Tracked Label: 2-4 giorni\n• SpeedPost Standard: 1-3 giorni\n\nInternazionale:\n• SingPost ePAC: 14-30 giorni\n• SpeedPost Priority (EMS): 8-15 giorni\n• SpeedPost Express: 4-8 giorni\n\nPossono verificarsi ritardi durante le stagioni di punta.","faqQ7":"Il mio articolo viene restituito al mittente. Cosa devo fare?","faqA7":"È consentita una rispedizione. L'annullamento non è possibile per indirizzi non validi, pacchi non reclamati o tasse doganali non pagate. Contatta il servizio postale per la riconsegna o inviaci un messaggio per assistenza.","faqQ8":"Il mio articolo è stato smarrito / rubato durante il trasporto.","faqA8":"Consentiamo una rispedizione. Se perso di nuovo, viene emesso un rimborso completo dopo la finestra di consegna del corriere:\n\n• Servizi locali di Singapore: 7 giorni\n• SingPost ePAC e SpeedPost Priority International: 30 giorni\n• SpeedPost Intl Express: 14 giorni","blogTitle":"Base di Conoscenza Spedizione & Postale","blogSubtitle":"Spiegazioni ufficiali sui servizi postali, dogane, IVA e dazi.","readMore":"Leggi di Più","backButton":"Indietro","blogPost1Title":"Cos'è SingPost ePAC?","blogPost1Desc":"Scopri SingPost ePAC (ePacket), un servizio postale tracciato economico.","blogPost2Title":"Cos'è SpeedPost Priority International (EMS)?","blogPost2Desc":"Scopri EMS, il servizio espresso postale premium internazionale.","blogPost3Title":"Cos'è SpeedPost Express?","blogPost3Desc":"Esplora SpeedPost Express con consegna DHL Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Comprendi PDDP per gli USA.","blogPost5Title":"IVA UE & IOSS","blogPost5Desc":"Approfondimenti su IVA UE e sistema IOSS.","blogPost6Title":"IVA UK & HMRC","blogPost6Desc":"Requisiti IVA per il Regno Unito.","blogPostNumberExample":"es. LG123456789SG","tracking7Title":"Norvegia VOEC","blogPost7Desc":"Sistema VOEC norvegese.","blogPost8Title":"IVA Svizzera","blogPost8Desc":"Requisiti IVA svizzeri.","enterDestinationPostcode":"Inserisci il codice postale di destinazione","trackingCaseSensitive":"LE LETTERE DI TRACCIAMENTO SONO SENSIBILI ALLE MAIUSCOLE E DEVONO ESSERE IN MAIUSCOLO.","usaPostcodeNote":"Per i paesi senza codici postali, ad es. Hong Kong e Macao, inserire 999077 (Hong Kong) o 999078 (Macao).","epacDeliveryNote":"Si prega di notare GENTILMENTE che tutti gli articoli ePAC inviati a destinazione devono essere consegnati alla cassetta postale, alla porta di casa, all'armadietto dei pacchi o lasciati in un luogo sicuro!","currentTime":"Ora Attuale","timezoneNote":"Ora visualizzata in formato a 12 ore","sameTimeAsSingapore":"Stesso orario di Singapore","hourAhead":"ora avanti rispetto a Singapore","hoursAhead":"ore avanti rispetto a Singapore","hourBehind":"ora indietro rispetto a Singapore","hoursBehind":"ore indietro rispetto a Singapore","collectAtPostOffice":"Tuttavia, se il tuo paese non dispone di una cassetta postale standard disponibile, sarai tenuto a ritirarlo presso l'ufficio postale.","countriesNoMailbox":"Paesi noti per non avere la consegna in cassetta postale/cassetta delle lettere disponibile: Brunei, Cina, India, Israele, Macao SAR Cina, Filippine, Polonia e Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus NON È RESPONSABILE della gestione delle consegne in quanto è fuori dal nostro controllo e preferiremmo gentilmente che tu monitorassi lo stato del tuo articolo.","issuesAfterDelivery":"Per qualsiasi problema con la consegna dopo 30/45 giorni (14 giorni per SpeedPost Express) o se lo stato risulta consegnato ma non hai ricevuto, contattaci","cannotUseEmbed":"Non possiamo utilizzare l'incorporamento per il tracciamento poiché la maggior parte dei siti Web dei servizi postali non lo supporta.","clickLinkAbove":"Fai clic sul link sopra per tracciare il tuo pacco.","trackingDetailsNote":"Tieni presente che i dettagli di tracciamento potrebbero non apparire nei risultati di ricerca, quindi si consiglia di incollare il numero di tracciamento nel sistema per tracciare l'articolo.","thirdPartyWebsites":"Puoi anche tracciare i tuoi pacchi su questi siti Web di terze parti:","enterEmailOrPhone":"Inserisci email o telefono","reviewShippingRates":"Rivedi le nostre attuali tariffe di spedizione","here":"qui","contactUsForm":"Contattaci tramite","form":"modulo","forEnquiries":"per qualsiasi domanda tu abbia riguardo al tuo ordine.","anPostNoDirectTracking":"An Post (Irlanda) non supporta link di tracciamento diretti né il tracciamento incorporato.","anPostPasteManually":"Si prega di copiare e incollare manualmente il numero di tracciamento sul sito web di An Post:","goToAnPost":"Vai a An Post","countryMsgNL":"Se lo stato mostra 'Held by Customs', contatta la Linea Informazioni Doganali dei Paesi Bassi per assistenza:\n0800 0143 (gratuito), lunedì-venerdì 7-23.\nSabato e domenica 8-16:30.\n\nSi consiglia di registrare un account con PostNL per ricevere notifiche push immediate dei tuoi pacchi:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nSe viene consegnato a un PostNL Point o lo stato ti dice di ritirarlo presso l'ufficio postale, dovrai pagare 7 EUR al bancone. Massimo 4 EUR se pagato online.","countryMsgDE":"Ti incoraggiamo a scaricare l'app Post & DHL per ricevere notifiche push sullo stato di tracciamento dei tuoi pacchi:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nContatto Servizio Clienti DHL Paket GmbH:\n+49-228-433-3112\nContatto DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Dovrai presentare una dichiarazione di importazione aggiuntiva con le dogane. In caso contrario, potrebbe comportare restrizioni all'ingresso e restituzione del pacco. \nUlteriori informazioni: https://www.posti.fi/en/receiving/customs-clearance \nAltri collegamenti: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Viene addebitata una commissione di elaborazione di 4,95 EUR.\nScarica l'app qui: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Viene addebitata una commissione di elaborazione di 8,50 PLN. \nDovrai pagarlo al ritiro presso l'ufficio postale,\npoiché è improbabile che il pacco venga consegnato a casa tua o nella cassetta postale.","countryMsgPH":"PHLPost nelle Filippine è considerato inefficiente e inaffidabile.\nSi prega di tracciare sempre il tuo pacco poiché lo stato 'in transito per la consegna'\na volte viene visualizzato solo per 1-3 settimane per pacchi più piccoli. Per pacchi più grandi,\nil ritiro è possibile solo presso il Manila Central Post Office o\nl'ufficio postale più vicino nella tua zona. Tieni presente che viene addebitata una commissione di elaborazione di 112 PHP per pacchi\ndi qualsiasi valore che devi pagare. La mancata pagamento comporterà la restituzione del pacco\na noi. La consegna dovrebbe richiedere 1-2 mesi a causa dei servizi lenti di PHLPost. \nNon devi pagare le tasse per articoli sotto 10000 PHP, ma devi farlo se il valore è uguale o supera tale importo. \nConsigliamo SpeedPost Express per un processo più veloce la prossima volta che ordini da noi. Tuttavia, le commissioni potrebbero non essere applicabili poiché D&T per il destinatario è predefinito.","countryMsgCA":"Il de minimis è di 20 CAD per tutti gli ordini spediti in Canada. Poiché Singapore fa parte dell'accordo CPTPP, i dazi potrebbero non essere applicati, ma D&T potrebbe essere applicabile se l'articolo supera la soglia di 60 CAD e oltre o 100 CAD e oltre, il che può dipendere dal codice HS dell'articolo. Qualsiasi valore superiore a tale importo verrà addebitato con IVA di conseguenza.","countryMsgID":"Dovrai pagare eventuali tasse e dazi applicabili all'arrivo in Indonesia. Si prega di tracciare il tuo pacco e pagare l'importo specificato alle dogane indonesiane.\nDovrai anche presentare documentazione doganale aggiuntiva. In caso contrario, potrebbe comportare restrizioni all'ingresso o sequestro del pacco da parte delle dogane del paese. Si prega di controllare ulteriori dettagli qui:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Dovrai pagare eventuali tasse e dazi applicabili all'arrivo in India. Si prega di tracciare il tuo pacco e pagare l'importo specificato alle dogane indiane.\nTieni presente che lo sdoganamento in India è rigoroso e potresti o non essere addebitato dazi se il valore del tuo articolo supera 1000 INR (15 USD) - a seconda del codice HS, nella maggior parte dei casi è esente da dazi, ma potresti essere addebitato dazi più elevati se l'articolo supera 5000 INR (60 USD). \nPoiché India Post NON consegna alle cassette postali per impostazione predefinita, potresti dover essere a casa o un rappresentante autorizzato per ricevere il tuo pacco o ritirarlo presso l'ufficio postale.","countryMsgMY":"Il de minimis è di 500 MYR per tutti gli ordini spediti in Malaysia. Gli ordini superiori a tale importo potrebbero essere addebitati.","countryMsgUS":"Dal 29 agosto 2025, il de minimis di USD800 sarà ufficialmente rimosso e i dazi all'importazione saranno pagabili per impostazione predefinita dal mittente nel paese di origine.\nLa spedizione negli USA RICHIEDE un numero di telefono e un indirizzo e-mail validi affinché il tuo pacco eviti ulteriori ritardi.","countryMsgIL":"Il de minimis è di 240 ILS (75 USD) per tutte le spedizioni in Israele. Gli ordini superiori a tale importo potrebbero essere addebitati. \nTieni presente che per gli ordini spediti in Israele, Israel Post a volte potrebbe non riconoscere la consegna finale una volta consegnata. \nPoiché Israel Post NON consegna alle cassette postali per impostazione predefinita, potresti dover essere a casa o un rappresentante autorizzato per ricevere il tuo pacco o ritirarlo presso l'ufficio postale.","countryMsgGB":"Tieni presente che per gli ordini spediti nel Regno Unito, Royal Mail a volte potrebbe non riconoscere la consegna finale una volta consegnata nella cassetta postale.","countryMsgTH":"Il de minimis è di 1500 THB (45 USD) per tutte le spedizioni in Thailandia. Gli ordini superiori a tale importo potrebbero essere addebitati.","countryMsgTW":"Il de minimis è di 2000 TWD (60 USD) per tutte le spedizioni a Taiwan. Gli ordini superiori a tale importo potrebbero essere addebitati.","countryMsgMO":"Nessun D&T viene addebitato quando si spedisce a Macao. Tuttavia, tieni presente che Macau Post NON consegna alle cassette postali per impostazione predefinita, DEVI ritirare il tuo pacco presso l'ufficio postale.","countryMsgBN":"Nessun D&T viene addebitato quando si spedisce in Brunei. Tuttavia, tieni presente che Brunei Post NON consegna alle cassette postali per impostazione predefinita, DEVI ritirare il tuo pacco presso l'ufficio postale. \nIl sistema di tracciamento per questo paese non è molto stabile e possono essere fornite informazioni limitate e i risultati di consegna finale NON vengono forniti all'origine.","countryMsgJP":"Il de minimis è di 10000 JPY (65 USD) per tutte le spedizioni in Giappone. Gli ordini superiori a tale importo potrebbero essere addebitati.","countryMsgKR":"Il de minimis è di 180000 KRW (150 USD) per tutte le spedizioni in Corea del Sud. Gli ordini superiori a tale importo potrebbero essere addebitati.","countryMsgVN":"Per il Vietnam, si prega di rimanere RAGGIUNGIBILI durante la consegna poiché potresti essere addebitato commissioni di elaborazione al momento della consegna dell'articolo. \nIl de minimis è di 1000000 (35 USD) per tutte le spedizioni in Vietnam. Gli ordini superiori a tale importo potrebbero essere addebitati. \nPoiché Vietnam Post NON consegna alle cassette postali per impostazione predefinita, potresti dover essere a casa o un rappresentante autorizzato per ricevere il tuo pacco o ritirarlo presso l'ufficio postale.","countryMsgPP":"Gli articoli Tracked Label verranno inviati in POPDrop/POPStop presso l'ufficio postale. Gli articoli SpeedPost Standard vengono generalmente inviati in POPStop o POPStation.\nTieni presente che la consegna degli articoli Tracked Label è SOLO dal lunedì al venerdì, dalle 9 alle 18. Tranne nei fine settimana e nei giorni festivi.","postedDate":"Data di Invio:","status":"Stato:","shippedVia":"Spedito tramite:","destination":"Destinazione:","statusInPreparation":"In preparazione","statusInTransit":"In transito","statusDelivered":"Consegnato","statusOutForDelivery":"In consegna","statusArrived":"Arrivato","statusProcessing":"In elaborazione","statusDispatched":"Spedito","statusReturned":"Restituito","statusFailed":"Consegna fallita","statusCancelled":"Annullato","statusHeldByCustoms":"Trattenuto dalla dogana","statusAwaitingCollection":"In attesa di ritiro","aka":"noto anche come","thisServiceKnownAs":"Questo servizio è conosciuto come","in":"In","viewTrackingDHL":"Visualizza informazioni di tracciamento da DHL Express","viewTrackingSingPostSpeedPost":"Visualizza informazioni di tracciamento da Singapore SpeedPost","viewTrackingDHLLastMile":"Visualizza informazioni di tracciamento da DHL Express (Ultimo miglio)","viewTrackingDHLShipperRef":"Visualizza informazioni di tracciamento da DHL Express (Riferimento mittente)","viewTrackingSingPost":"Visualizza informazioni di tracciamento da Singapore Post","viewTrackingDestPost":"Visualizza informazioni di tracciamento da","post":"Poste","orderNumberExample":"Numero Ordine (inizia con RTNX - esempio: RTNX1234567890):","deliveryRecordNote":"Si prega di notare che una volta consegnato l'articolo, il record verrà conservato solo fino a 7 giorni e poi verrà eliminato.","copyrightAllRights":"Tutti i diritti riservati.","epacUS":"Servizio pacchi internazionale di prima classe","epacCH":"Priorità Plus","epacGB":"Tracciato internazionale","epacMY":"Tracciato internazionale/espresso","epacCA":"Express internazionale in entrata","epacAU":"Prepara e traccia a livello internazionale","epacNZ":"Tracciamento economico internazionale","epacDE":"Premio internazionale Warenpost","epacFR":"Lettera internazionale con tracciamento","epacNL":"Pacchetto internazionale tracciato","epacPL":"Espressioni GLOBALI","epacBE":"Prime in entrata internazionali","epacAT":"Pacco tracciato internazionale","epacIN":"Pacco tracciato internazionale","epacFI":"Lettera tracciata internazionale","epacSE":"Lettera tracciata internazionale","epacNO":"PRIME Exprès","epacIT":"Esprimere","epacIL":"Esprimere","epacES":"Pacco leggero internazionale","epacPT":"Posta blu internazionale","epacCZ":"Spedizione tracciata dall'estero","epacBN":"ePacket internazionale","epacCN":"ePacket internazionale","epacHK":"ePacket internazionale","epacID":"e-Pacco internazionale","epacMO":"ePacket internazionale","epacPH":"Posta tracciata internazionale","epacTW":"ePacket internazionale","epacTH":"ePacket internazionale","epacVN":"E-Pacco internazionale (Pacco ASEAN)","epacKR":"Pacchetto K","epacJP":"e-Pacco internazionale Light","epacIE":"Posta espressa internazionale","blogSingPostEPACContent1":"SingPost ePAC (ePacket) è un servizio postale tracciato economico per spedizioni e-commerce internazionali leggere.","blogSingPostEPACContent2":"Viene consegnato dall'operatore postale nazionale del paese di destinazione ed è comunemente utilizzato per pacchi sotto i 2 kg, con un limite dimensionale di lunghezza + larghezza + altezza sotto 90 cm e lunghezza non superiore a 60 cm.","blogSingPostEPACContent3":"Questa opzione è stata inizialmente offerta solo da Hong Kong Post insieme a eBay China, consentendo ai pacchi provenienti dalla Cina e da Hong Kong di essere spediti negli Stati Uniti con tracciamento della consegna senza richiedere alcuna firma alla consegna. Questo servizio è conosciuto negli Stati Uniti come USPS (United States Postal Service) First-Class Package International Service.","blogSingPostEPACContent4":"Dal 1° gennaio 2026, ePAC è ora utilizzato per tutti i paesi per rispettare le normative UPU obbligatorie che richiedono il tracciamento per i pacchi e limitano gli articoli registrati solo ai documenti.","blogSingPostEPACContent5":"Prefissi di tracciamento: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS è un servizio postale espresso internazionale premium, prioritario dagli operatori postali in tutto il mondo.","blogSpeedPostEMSContent2":"Lo sdoganamento è generalmente più veloce della posta standard ma più rigoroso nel processo, con tracciamento completo fino alla consegna.","blogSpeedPostEMSContent3":"A Singapore, questo è conosciuto come SpeedPost Priority International di SingPost.","blogSpeedPostEMSContent4":"Prefisso di tracciamento: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express è un servizio di livello corriere.","blogSpeedPostExpressContent2":"In molte destinazioni, DHL Express esegue la consegna dell'ultimo miglio e riscuote dazi o tasse prima del rilascio.","blogSpeedPostExpressContent3":"Prefisso di tracciamento: PX123456789SG (L'ultimo miglio DHL Express utilizza un numero di tracciamento a 10 cifre, che non è visibile al pubblico, ma abbiamo informazioni a riguardo tramite il nostro","blogSpeedPostExpressContent3Link":"Sistema di Tracciamento.","blogUSPDDPContent1":"PDDP consente di prepagare dazi e tasse di importazione statunitensi prima della consegna, riducendo le spese a sorpresa per i destinatari.","blogUSPDDPContent2":"Nuove Normative (In vigore dal 29 agosto 2025)","blogUSPDDPContent2List1":"Codici HTS obbligatori","blogUSPDDPContent2List2":"Descrizioni accurate degli articoli","blogUSPDDPContent2List3":"Applicazione tariffaria più rigorosa","blogUSPDDPContent3":"Tutti gli articoli inviati negli Stati Uniti non verranno addebitati tariffe aggiuntive al destinatario poiché paghiamo per conto tuo. Tuttavia, si prega di notare che il prezzo dell'articolo include per impostazione predefinita la tariffa di importazione del 10% per conformarsi alle normative.","blogUSPDDPContent4":"Questo si applica solo ai nostri metodi di spedizione per gli Stati Uniti, SpeedPost Priority International (EMS) e SingPost ePAC.","blogEUIOSSContent1":"L'UE applica l'IVA su tutte le importazioni commerciali indipendentemente dal valore.","blogEUIOSSContent2":"IOSS (Sportello Unico Importazioni)","blogEUIOSSContent3":"IOSS consente ai venditori di riscuotere l'IVA UE al momento del checkout per spedizioni fino a €150.","blogEUIOSSContent4":"L'IVA viene quindi versata tramite il sistema IOSS, consentendo uno sdoganamento più rapido e nessuna riscossione di IVA alla consegna.","blogEUIOSSContent5":"Per tutti gli ordini tramite Etsy o eBay, l'IVA IOSS è già riscossa al momento del checkout e lo indicheremo sul Numero di Riferimento Fiscale per trasmettere i dati al servizio postale di destinazione tramite EDI (Electronic Data Interchange).","blogUKVATContent1":"Il Regno Unito richiede che l'IVA sia contabilizzata per le merci importate.","blogUKVATContent2":"Per spedizioni di basso valore, l'IVA è solitamente riscossa al momento del checkout e versata direttamente a HMRC dal venditore o dal marketplace.","blogUKVATContent3":"Per spedizioni di valore più elevato, l'IVA può essere riscossa dal corriere prima della consegna.","blogUKVATContent4":"Per tutti gli ordini tramite Etsy o eBay, l'IVA è già riscossa al momento del checkout e lo indicheremo sul Numero di Riferimento Fiscale per trasmettere i dati al servizio postale di destinazione tramite EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"La Norvegia ha introdotto il sistema VOEC (VAT on E-Commerce) per le merci importate da fuori UE/SEE. Questo si applica alle merci valutate fino a 3.000 NOK.","blogNorwayVOECContent2":"I venditori possono registrarsi nel sistema VOEC per riscuotere l'IVA norvegese al momento del checkout, consentendo uno sdoganamento più rapido e nessuna riscossione di IVA alla consegna.","blogNorwayVOECContent3":"Per tutti gli ordini tramite Etsy o eBay, l'IVA VOEC è già riscossa al momento del checkout. Il tracciamento e la documentazione doganale indicano il Numero di Riferimento Fiscale per trasmettere i dati al servizio postale norvegese.","blogSwissVATContent1":"La Svizzera addebita l'IVA sulle merci importate indipendentemente dal valore. L'Amministrazione federale delle dogane svizzere richiede ai venditori stranieri di riscuotere l'IVA al momento del checkout per merci fino a 65 CHF.","blogSwissVATContent2":"I venditori registrati nel sistema IVA svizzero versano l'IVA riscossa direttamente, assicurando che il destinatario non subisca alcun addebito IVA aggiuntivo alla consegna.","blogSwissVATContent3":"Per tutti gli ordini tramite Etsy o eBay, l'IVA svizzera è già riscossa durante il checkout e la documentazione doganale include il Numero di Riferimento Fiscale per l'invio EDI.","dhlNoEmbed":"DHL Express non supporta il tracciamento tramite incorporamento. Per favore","speedPostNoEmbed":"SpeedPost Singapore non supporta il tracciamento tramite incorporamento. Per favore","operatorNoEmbed":"non supporta il tracciamento tramite incorporamento. Per favore","clickHere":"clicca qui","toTrackNewTab":"per tracciare (si apre in una nuova scheda).","countryRU":"🇷🇺 Russia","russiaServiceSuspended":"⚠️ AVVISO IMPORTANTE: In vista dell'invasione russa dell'Ucraina nel 2022, SingPost ha sospeso tutte le spedizioni verso la Russia insieme a DHL. Attualmente non serviamo la Russia fino a quando non ci sarà un annuncio di ripresa dei servizi nel paese.","temporaryClosureNoticeTitle":"Rhythm Nexus - Avviso di chiusura temporanea","temporaryClosureNoticeBody":"Gentili clienti,\n\nVi informiamo che Rhythm Nexus sarà temporaneamente chiuso dal 21 marzo 2026 al 26 marzo 2026 a causa di un evento aziendale.\n\nPer prepararci alla chiusura, il negozio entrerà in modalità vacanza a partire dal 20 marzo 2026 alle 3:00 PM (UTC +8). Gli ordini effettuati dopo questo orario potrebbero non essere elaborati fino alla ripresa delle attività.\n\nLe normali operazioni riprenderanno il 27 marzo 2026.\n\nCi scusiamo per qualsiasi inconveniente e vi ringraziamo per la comprensione e il continuo supporto.\n\nGrazie.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Ho capito","parcelTracking":"Monitoraggio dei pacchi","serviceAnnouncement":"Annuncio di servizio","usaWinterStormTitle":"URGENTE: Tempesta invernale grave - Interruzione del servizio","usaWinterStormSubtitle":"Servizio postale degli Stati Uniti (USPS) Evento di forza maggiore","usaWinterStormNotice1":"A causa della grave tempesta invernale che colpisce la regione di New York dal 23 febbraio 2026:","usaWinterStormNotice2":"Le operazioni internazionali presso l'Aeroporto Internazionale John F. Kennedy sono state effettivamente interrotte","usaWinterStormNotice3":"Sono segnalate cancellazioni di voli diffuse e significative interruzioni dei servizi aeroportuali","usaWinterStormNotice4":"Queste condizioni costituiscono un evento di forza maggiore al di là del controllo dell'USPS","usaWinterStormNotice5":"Impatto sul servizio:","usaWinterStormNotice6":"Pericolosa combinazione di neve abbondante, pioggia gelata, nevischio e freddo pungente","usaWinterStormNotice7":"Sono segnalati importanti disservizi e diffusi blackout","usaWinterStormNotice8":"La raccolta e la consegna di corrispondenza nazionale e internazionale (corrispondenza, pacchi e articoli EMS) sono interessate","usaWinterStormNotice9":"Zone di codice postale interessate:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"L'USPS sta adottando tutte le misure necessarie per ridurre al minimo i disagi ai clienti mantenendo la sicurezza dei dipendenti. Apprezziamo la vostra pazienza e comprensione durante questo evento di forza maggiore.","usaWinterStormNotice12":"Ultimo aggiornamento: 25 febbraio 2026","countryAutoDetected":"Destinazione preimpostata in base alla tua posizione","countryAutoDetectedFromLink":"Destinazione preimpostata dal link","trackingNumber":"Numero di identificazione","destinationCountry":"Paese di destinazione","postcode":"Codice postale","fillAllFields":"Compila tutti i campi obbligatori: numero di tracciamento, paese di destinazione, numero dell'ordine e codice postale.","noOrderMatchingFields":"Nessun ordine trovato corrispondente a tutti i campi.","postcodeRequired":"Per questa destinazione è richiesto il codice postale.","invalidUSZip":"Codice postale statunitense non valido. Utilizza 5 cifre o ZIP+4.","failedGenerateURL":"Impossibile generare l'URL di monitoraggio. Si prega di controllare l'input.","trackingValidationSG":"I numeri di riferimento per Singapore devono essere: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG o PX123456789SG. Per le spedizioni DHL utilizzare numeri di 10 cifre.","invalidSingPostFormat":"Formato del numero di tracciamento SingPost non valido.\nFormati accettati:\n• PP123456789SG → Etichetta Tracciata Prepagata\n• SPNDD00012345 → Monitoraggio standard SpeedPost","blogPost7Title":"Norvegia VOEC spiegato","trackingNumberExample":"per esempio. LG123456789SG","australianDSTTitle":"Ora legale australiana attiva","australianDSTBothMessage":"Attualmente sono in vigore sia l'AEDT (Australian Eastern Daylight Time) che l'ACDT (Australian Central Daylight Time).","australianAEDTMessage":"AEDT (Australian Eastern Daylight Time) è attualmente in vigore per Sydney, Melbourne e le aree circostanti.","australianACDTMessage":"L'ACDT (Australian Central Daylight Time) è attualmente in vigore per Adelaide e l'Australia meridionale.","australianDSTNote":"I tempi di consegna visualizzati sopra riflettono l'attuale ora legale.","filteredAllowedDestinations":"(Filtrato per le destinazioni consentite)","loadingAnnouncements":"Caricamento annunci...","unableToLoadAnnouncements":"Impossibile caricare gli annunci di servizio in questo momento.","viewOnSingPostWebsite":"Visualizza sul sito web SingPost →","statusHeldByCustms":"Trattenuto dalla dogana","accessRestricted":"Accesso limitato","vpnDetectedMessage":"Rilevato utilizzo della VPN. Disattiva la VPN per accedere a questo servizio.","contactSupportError":"Se ritieni che si tratti di un errore, contatta l'assistenza.","postalContactsTitle":"Contatti dei Servizi Postali","postalContactsNote":"Nota:","postalContactsPolandUKNote":"Per Polonia e Regno Unito, tutti gli articoli inviati tramite SpeedPost Priority (EMS) saranno gestiti da Pocztex e Parcelforce.","postalContactsDHLNote":"Per le spedizioni SpeedPost Express, si prega di contattare DHL tramite questo link:","postalContactsCountry":"Paese","postalContactsWebsite":"Sito web","postalContactsForm":"Modulo di contatto","postalContactsPhone":"Numero di telefono","postalContactsEmail":"Email di contatto","postalContactsFormLink":"Modulo di contatto","postalContactsBackButton":"Torna al modulo di richiesta informazioni sul pacco","destinationNotAllowed":"L'accesso a questo Paese di destinazione non è disponibile dalla tua posizione. Seleziona una destinazione diversa.","contactUsTitle":"Contattaci","contactNameLabel":"Nome (NESSUN SOPRANNOME NÉ NUMERO DI TELEFONO)","contactEmailLabel":"Indirizzo email (dove ti risponderemo)","contactEmailNote":"Le email di relay privato (ad es. @privaterelay.appleid.com) non sono accettate. Si prega di utilizzare un indirizzo email valido.","contactEnquiryTypeLabel":"È questo un?","contactSelectOption":"Seleziona un'opzione","contactGeneralEnquiry":"Richiesta generale / Feedback","contactBusinessEnquiry":"Richiesta commerciale","contactOrderShippingEnquiry":"Richiesta ordine/spedizione","contactExchangeRefundEnquiry":"Richiesta scambio/rimborso/reso","contactOthers":"Altri","contactParcelWarning":"Se il tuo pacco non è stato consegnato per più di 18/30/45 giorni (14 giorni per FedEx), o lo stato mostra consegnato ma non ce l'hai, compila","contactParcelWarningLink":"QUESTO MODULO","contactParcelWarningEnd":"invece.","contactOrderNumberLabel":"Numero d'ordine","contactOrderNumberPlaceholder":"RTNX1234567890","contactPlatformNote":"Numero d'ordine Etsy, eBay e Shopee qui. NON abbiamo ALCUN controllo sui rimborsi di queste piattaforme. Si prega di contattare il loro servizio clienti rispettivamente.","contactPlatformInstructions":"Si prega di utilizzare l'app per consultare il numero d'ordine, poiché è salvato nell'app:","contactPlatformEtsy":"Etsy - In alto a destra sul tuo profilo → Acquisti","contactPlatformEbay":"eBay - Il mio eBay → Acquisti","contactPlatformShopee":"Shopee - Io → Visualizza cronologia acquisti (o puoi fare clic su Da spedire/Da ricevere)","contactRefundNote1":"Se stai richiedendo un reso/rimborso per le piattaforme da cui hai effettuato acquisti, tieni presente che NON abbiamo ALCUN controllo sui rimborsi di queste piattaforme. Si prega di contattare il loro servizio clienti rispettivamente.","contactRefundNote2":"Per resi o cambi, non lo permettiamo per i guanti maimai se sono già stati usati quando aperti (macchie visibili o lavati in lavatrice/lavaggio manuale), e non sono consentiti resi o cambi per le carte di divertimento. Grazie.","contactRefundNote3":"Si prega di notare che per i rimborsi tramite Payhip, contatta la tua banca o il supporto Payhip a support@payhip.com se non hai ricevuto il rimborso poiché non abbiamo controllo sul processo.","contactMessageLabel":"Il tuo messaggio (fino a 1000 caratteri)","contactCharacterCount":"caratteri","contactSpamWarningNote":"Nota:","contactSpamWarning":"Le offerte non richieste per SEO, progettazione web, prestiti o servizi simili verranno automaticamente rifiutate.","contactAgreementText1":"Si prega di fare clic su \"Accetto\" se accetti che il tuo indirizzo email venga utilizzato da Rhythm Nexus per risponderti, poiché questo è necessario per noi per leggere la tua risposta e risponderti una volta che avremo trovato una soluzione alla tua richiesta .","contactAgreementText2":"Si prega di notare che la nostra risposta richiederà tra 3 e 5 giorni lavorativi, o più durante un alto volume di email da parte nostra.","contactAgreeCheckbox":"Accetto","contactSuccessMessage":"Il tuo messaggio è stato inviato con successo! Risponderemo entro 3-5 giorni lavorativi.","contactErrorMessage":"Impossibile inviare il messaggio. Si prega di riprovare.","contactGeneralError":"Si è verificato un errore. Si prega di riprovare più tardi.","contactSubmitting":"Invio in corso...","contactSubmit":"Invia","contactAlertAgree":"Si prega di accettare i termini per inviare il modulo.","parcelEnquiryTitle":"Richiesta pacco","parcelInfoText":"Questo modulo è per pacchi non consegnati per più di 18/30/45 giorni (14 giorni per FedEx/DHL), o che hanno mostrato lo stato consegnato ma non li hai.","parcelInfoLink":"Clicca qui","parcelInfoEnd":"per altre richieste.","parcelWaitTitle":"Attendere il pacco","parcelWaitText1":"Si prega di attendere la consegna del pacco. Si noti che le consegne internazionali NON sono le stesse delle consegne locali poiché richiedono tempo. Grazie!","parcelWaitText2":"Se non viene visualizzato alcuno stato dopo 18 giorni (7 giorni per Singapore) o più, puoi farcelo sapere direttamente.","parcelCannotSubmit":"Non puoi inviare questo modulo se hai selezionato \"No\".","parcelNameLabel":"Nome","parcelOrderNumberLabel":"Numero d'ordine (Esempio: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Indirizzo email (Ti risponderemo qui)","parcelEmailNote":"Le email di relay privato non sono accettate. Si prega di utilizzare un indirizzo email valido.","parcelShippingMethodLabel":"Metodo di spedizione scelto?","parcelSelectShipping":"Seleziona un metodo di spedizione","parcelSingPostEpac":"SingPost ePacket (o ePAC) - alias SpeedPost Saver International (Tracciamento: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracciamento: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracciamento: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracciamento: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracciamento: PX123456789SG)","parcelDHL":"DHL Express (Solo paesi UE) (Tracciamento: 1234567890)","parcelTrackingNumberLabel":"Numero di tracciamento del tuo pacco?","parcelUndeliveredLabel":"Il tuo pacco non è stato consegnato per più di 18/30/45 giorni? (Servizi locali di Singapore >7 giorni, >14 giorni per SpeedPost Express/DHL)","parcelSelectOption":"Seleziona un'opzione","parcelYes":"Sì","parcelNo":"No","parcelDeliveredButMissingLabel":"Il tuo pacco ha mostrato lo stato consegnato, ma non è presente nella tua casella postale/luogo sicuro/porta?","parcelCaseReferenceLabel":"ID di riferimento caso dall'ufficio postale locale","parcelCaseReferencePlaceholder":"NA","parcelCaseReferenceNote":"Prima di inviare questo modulo, si prega di contattare il proprio ufficio postale locale tramite telefono o email e ottenere un ID di riferimento caso da loro. Quindi, inserisci qui il tuo ID di riferimento caso.","parcelCaseReferenceLink":"Fare riferimento a questo link per i contatti del servizio postale","parcelCaseReferenceMandatory":"METTI NA SOLO SE SEI DA SINGAPORE. Per altri paesi è OBBLIGATORIO fornirlo. Richiesto anche per SpeedPost Express, per l'ID caso DHL.","parcelImageEvidenceLabel":"Prova immagine (per pacchi consegnati ma mancanti)","parcelImageWarning":"Per ulteriore verifica, abbiamo bisogno di prove fotografiche per dimostrare che non stai facendo false affermazioni sulla non consegna del pacco. (Solo per pacchi che sono già stati consegnati, ma non sono presenti nella casella postale/fuori dalla porta. Potremmo rifiutare il tuo reclamo se non viene fornita alcuna prova fotografica per gli articoli consegnati. Ignora questo se il tuo articolo NON ha mostrato lo stato consegnato.)","parcelImageNote":"Carica 1 file supportato: immagine. Max 1 GB.","parcelAgreementText":"Si prega di fare clic su \"Accetto\" se ti assicuri che ciò che è successo al tuo pacco fosse vero.","parcelAgreeCheckbox":"Accetto","parcelSuccessMessage":"La tua richiesta pacco è stata inviata con successo! Risponderemo entro 3-5 giorni lavorativi.","parcelErrorMessage":"Impossibile inviare la richiesta. Si prega di riprovare.","parcelGeneralError":"Si è verificato un errore. Si prega di riprovare più tardi.","parcelAlertWait":"Si prega di attendere la consegna del pacco. Puoi inviare questo modulo dopo il periodo di attesa specificato.","parcelAlertAgree":"Si prega di accettare i termini per inviare il modulo.","parcelAlertCaseReference":"Si prega di fornire un ID di riferimento caso dal proprio ufficio postale locale, o mettere NA se sei da Singapore.","parcelSubmitting":"Invio in corso...","parcelSubmit":"Invia","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Terranova)","tzAST":"AST (Atlantico)","tzEST":"EST (Orientale)","tzCST":"CST (Centrale)","tzMST":"MST (Montagne)","tzPST":"PST (Pacifico)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Pechino","tzXinjiang":"Xinjiang","tzWIB":"WIB (Giacarta)","tzWITA":"WITA (Macassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast di Kaliningrad (UTC+2)","tzMoscow":"Mosca/Russia Occidentale (UTC+3)","tzSamara":"Oblast di Samara (UTC+4)","tzUral":"Regione degli Urali (UTC+5)","tzOmsk":"Oblast di Omsk (UTC+6)","tzKrasnoyarsk":"Territorio di Krasnojarsk (UTC+7)","tzIrkutsk":"Oblast di Irkutsk (UTC+8)","tzSakha":"Sacha Repubblica (UTC+9)","tzPrimorsky":"Territorio del Litorale (UTC+10)","tzMagadan":"Oblast di Magadan (UTC+11)","tzKamchatka":"Territorio della Kamchatka (UTC+12)","dstDayStartsLabel":"L'ora legale inizia","dstDayEndsLabel":"L'ora legale finisce","dstRevertsLabel":"ritorno all'ora standard","dstEuropeLabel":"Europa","dstNewZealandLabel":"Nuova Zelanda","lookalikeDomainWarning":"Questo è un link a un sito che imita un corriere, non un numero di tracciamento. Non inserire lì dati personali o di pagamento.","lookalikeDomainOfficial":"Sito ufficiale:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus はプレミアム商用ネットワークを利用します。ただし、あなたの国に到着した瞬間に、保管は現地の国内運送業者 (USPS、Royal Mail、DHL など) に転送されます。追跡プレフィックスはこのしきい値で処理システムを変更しますが、当社のユニバーサル小包トラッカーはこれらのステータスをつなぎ合わせて、中断のない可視性を提供します。","trackingLastMileTitle":"ラストマイル配送ネットワーク","trackingCustomsClearanceBody":"すべての国境を越える商品は、地元の国の税関を通過する必要があります。当社のツールは、輸入施設の到着から税関引き渡しまでの移行を監視します。国境警備隊は HS コードを検証し、正しい VAT または関税が免除されていることを確認します (例: EU の IOSS、ノルウェーの VOEC)。 「税関で保留中」の警告に特化した追跡を監視します。","trackingCustomsClearanceTitle":"通関情報","trackingProcessingOriginBody":"降ろされると、商品は原産地処理センターに入り、そこでスキャン、重量測定が行われ、一次輸出安全検査が行われます。その後、国際郵便交換局に発送されます。フライトスケジュールは利用可能な貨物帯域幅によって異なります。この状態が数日間続いても心配する必要はありません。","trackingProcessingOriginTitle":"オリジンハブでの処理","trackingInfoReceivedBody":"注文が当社の e コマース プラットフォーム (Etsy、eBay、直販など) で最初に処理されると、追跡番号が電子的に生成されます。配送業者は、箱を物理的に所有する前に出荷データを受け取ります。荷物が物理的な仕分け施設に搬入されるまでに 1 ～ 3 営業日かかります。","trackingInfoReceivedTitle":"受け取った情報","trackingStatusesIntro":"弊社の統一国際荷物追跡ツールをご利用いただきありがとうございます。荷物は複数の国境を越えて航行するため、追跡ステータスが複雑になる場合があります。物流ライフサイクルを理解することは、明確な期待を設定するのに役立ちます。","trackingStatusesTitle":"追跡ステータスについて","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"午前","pmText":"午後","footerQuickLinks":"クイックリンク","footerSupportLegal":"サポートと法的情報","copyrightText":"全著作権所有。","tzAEST":"AEST (シド니ー/メルボルン)","tzACST":"ACST (アデレード)","tzAWST":"AWST (パース)","tzNST":"NST (ニューファンドランド)","tzAST":"AST (大西洋)","tzEST":"EST (東部)","tzCST":"CST (中部)","tzMST":"MST (山岳部)","tzPST":"PST (太平洋)","tzAKST":"AKST (アラスカ)","tzHST":"HST (ハワイ)","tzBeijing":"北京","tzXinjiang":"新疆","tzWIB":"WIB (ジャカルタ)","tzWITA":"WITA (マカッサル)","tzWIT":"WIT (ジャヤプラ)","tzKaliningrad":"カリーニングラード州 (UTC+2)","tzMoscow":"モスクワ/西ロシア (UTC+3)","tzSamara":"サマラ州 (UTC+4)","tzUral":"ウラル地方 (UTC+5)","tzOmsk":"オムスク州 (UTC+6)","tzKrasnoyarsk":"クラスノヤルスク地方 (UTC+7)","tzIrkutsk":"イルクーツク州 (UTC+8)","tzSakha":"サハ共和国 (UTC+9)","tzPrimorsky":"沿海地方 (UTC+10)","tzMagadan":"マガダン州 (UTC+11)","tzKamchatka":"カムチャツカ地方 (UTC+12)","dstDayStartsLabel":"夏時間が開始","dstDayEndsLabel":"夏時間が終了","dstRevertsLabel":"標準時に戻ります","dstEuropeLabel":"ヨーロッパ","dstNewZealandLabel":"ニュージーランド","englishResponseNotice":"注意: すべてのお問い合わせは英語で回答されます。別の言語で送信した場合、メッセージは確認のために英語に翻訳される場合があります。","parcelDisagreeCheckbox":"同意しません","contactDisagreeCheckbox":"同意しません","contactNamePlaceholder":"例：山田太郎","systemRequirementsTitle":"最低サポートシステムバージョン","systemRequirements":"Windows：Windows 7 (with ESU updates installed)以上\nmacOS：macOS 12以上\nAndroid：Android 13以上\niPhone/iOS：iOS 17以上\nLinux：現在サポートされているディストリビューション（アクティブなセキュリティアップデート付き）","title":"アクセス確認","subtitle":"続行するには、以下のチャレンジを完了してください。","selectLanguage":"言語を選択","selectLanguagePlaceholder":"-- 言語を選択してください --","loadingChallenge":"チャレンジを読み込んでいます...","answerLabel":"あなたの答え：","answerPlaceholder":"答えを入力してください","continueButton":"続ける","refreshButton":"新しいチャレンジ","verifying":"確認中...","chooseLanguageFirst":"まず言語を選択してください。","loadFailed":"チャレンジの読み込みに失敗しました。もう一度お試しください。","expiredChallenge":"チャレンジの有効期限が切れました。新しいチャレンジを読み込んでいます...","verifyFailed":"確認に失敗しました。もう一度お試しください。","home":"ホーム","blog":"ブログ","aboutUs":"について","faq":"よくある質問","contact":"お問い合わせ","trackPackage":"小包を追跡する","cnyYearOfHorseMessage":"🧧 旧正月おめでとうございます！午年の繁栄をお祈りします 🐴","singaporeNationalDayMessage":"🇸🇬 シンガポール建国記念日おめでとうございます！独立61周年を祝いましょう！🎉","indonesiaNationalDayMessage":"🇮🇩 インドネシア独立記念日おめでとうございます！インドネシア共和国万歳！🎊","malaysiaNationalDayMessage":"🇲🇾 マレーシア独立記念日おめでとうございます！我が国の独立を祝いましょう！🎊","australiaNationalDayMessage":"🇦🇺 オーストラリアの日おめでとうございます！私たちの国を祝いましょう！🎉","canadaNationalDayMessage":"🇨🇦 カナダの日おめでとうございます！私たちの偉大な国を祝いましょう！🍁","usaNationalDayMessage":"🇺🇸 独立記念日おめでとう、アメリカ！自由と独立を祝いましょう！🎆","franceBastilleDayMessage":"🇫🇷 7月14日おめでとうございます！フランス万歳！🎊","germanyUnityDayMessage":"🇩🇪 ドイツ統一の日おめでとうございます！Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 共和国記念日おめでとうございます！🇮🇹","spainNationalDayMessage":"🇪🇸 スペイン建国記念日おめでとうございます！🎊","japanFoundationDayMessage":"🇯🇵 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 中国建国記念日おめでとうございます！国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 光復節おめでとうございます、韓国！광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 インド独立記念日おめでとうございます！Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 タイ建国記念日おめでとうございます！สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 フィリピン独立記念日おめでとうございます！Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 ベトナム建国記念日おめでとうございます！Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 ポーランド独立記念日おめでとうございます！Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 チェコ独立記念日おめでとうございます！Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 国王の日おめでとうございます！国王万歳！🧡","norwayConstitutionDayMessage":"🇳🇴 おめでとう、ノルウェー！🇳🇴","swedenNationalDayMessage":"🇸🇪 スウェーデン建国記念日おめでとうございます！🇸🇪","finlandIndependenceDayMessage":"🇫🇮 フィンランド独立記念日おめでとうございます！🇫🇮","portugalNationalDayMessage":"🇵🇹 ポルトガルの日おめでとうございます！🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! イスラエル独立記念日おめでとうございます！🎉","irelandNationalDayMessage":"🇮🇪 聖パトリックの日おめでとうございます、アイルランド！Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 ブルネイ建国記念日おめでとうございます！🎊","newZealandWaitangiDayMessage":"🇳🇿 ワイタンギの日おめでとうございます、ニュージーランド！🎉","switzerlandNationalDayMessage":"🇨🇭 スイス建国記念日おめでとうございます！Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 オーストリア建国記念日おめでとうございます！🎉","belgiumNationalDayMessage":"🇧🇪 ベルギー建国記念日おめでとうございます！Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! ロシアの日おめでとうございます！🎉","taiwanFoundingDayMessage":"🇹🇼 台湾建国記念日おめでとうございます！中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 台湾双十節おめでとうございます！國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 香港特別行政区設立記念日おめでとうございます！香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 マカオ特別行政区設立記念日おめでとうございます！澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ 国際労働者の日おめでとうございます！労働と労働者の権利を祝います！🎊","laborDayUSCAMessage":"⚒️ 労働者の日おめでとうございます！労働者の貢献に敬意を表します！🎉","orderNumber":"注文番号（例：RTNX1234567890）","fromDate":"開始日（必須）","toDate":"終了日（必須）","trackParcel":"小包を追跡","selectCourier":"-- 配送業者/国を選択 --","singaporeCouriers":"シンガポール配送業者","topCountries":"トップ5国","otherCountries":"その他の国","note":"注","disclaimer":"免責事項","importantInformation":"重要な情報:","didNotReceiveEmail":"Etsy、eBay、Shopee、またはPayhipからの確認メールが届いていない場合は、下にスクロールして、この注文にリンクされているメールアドレスまたは電話番号で注文を検索してください。","searchByEmailOrPhone":"メールまたは電話で検索","searchOrder":"注文を検索","trackingResult":"追跡結果","noOrdersFound":"注文が見つかりません。","pleaseEnter":"メール、電話番号、または注文番号を入力してください。","fillAllFields":"必須項目をすべて入力してください：追跡番号、配送先国、注文番号、郵便番号。","noOrderMatchingFields":"すべての項目に一致する注文が見つかりません。","postcodeRequired":"この配送先には郵便番号が必要です。","invalidUSZip":"無効なUS郵便番号です。5桁またはZIP+4を使用してください。","failedGenerateURL":"追跡URLの生成に失敗しました。入力を確認してください。","trackingValidationSG":"シンガポールの追跡番号は：LG123456789SG、LP123456789SG、LT123456789SG、EZ123456789SG、またはPX123456789SGである必要があります。DHL配送の場合は10桁の番号を使用してください。","invalidSingPostFormat":"無効なSingPost追跡番号形式です。\n使用可能な形式：\n• PP123456789SG → プリペイド追跡ラベル\n• SPNDD00012345 → SpeedPostスタンダード追跡","welcomeTitle":"Rhythm Nexusのウェブサイトへようこそ！","purchaseInfo":"公式チャネルから購入するか、","purchaseInfoChina":"公式チャネルから購入してください。","purchaseInfoChinaSuffix":"","telegramGroup":"Telegramグループ","forUpdates":"に参加して公式更新を受け取りましょう。","ourStores":"私たちの店舗","etsyStore":"Etsyストア","ebayStore":"eBayストア","shopeeStore":"Shopeeストア","payhipStore":"Payhipストア","internationalShipping":"国際配送","singaporeLocal":"シンガポール国内","asiaOnly":"アジアのみ","deliveryInfo":"配送情報","deliveryRates2026":"2026年配送料金","sgDeliveryRates":"シンガポール配送料金","speedPostRates":"SpeedPost Express国際料金","aboutTitle":"Rhythm Nexusについて","aboutP1":"2022年に店舗を開始し、Etsy、eBay、Shopeeで販売してきました。","aboutP2":"信頼できる配送と正確な追跡に重点を置いて、強い評判を築いてきました。","aboutP3":"スムーズで信頼できるショッピング体験を提供することが私たちの目標です。","aboutP4":"Rhythm Nexusをサポートしていただきありがとうございます。","faqTitle":"よくある質問","faqQ1":"商品に欠陥がある場合はどうすればよいですか？ 保証はありますか？","faqA1":"はい！ ほとんどの注文には1年間の保証が付いています。 調査いたしますので、請求書/注文番号をお知らせください。 注意：間違って注文した場合でも、商品が説明と一致する場合は交換できません。","faqQ2":"注文を編集、更新、またはキャンセルできますか？","faqA2":"はい。 セキュリティ上の理由から、注文の変更はメールまたはお問い合わせフォームで処理する必要がある場合があります。","faqQ3":"関税/輸入税を支払う必要がありますか？","faqA3":"関税と税金は通常、米国へのDDPを除き、前払いされません。 VATは、EU、英国、オーストラリア/ニュージーランド、ノルウェー、スイス、およびサスカチュワン州やマニトバ州などのカナダの州に適用される場合があり、これらはデフォルトですでに支払われています。 シンガポールにはGSTは適用されません。 関税についてはアドバイスできません。詳細については、最寄りの税関にお問い合わせください。","faqQ4":"注文はいつ発送されますか？","faqA4":"注文は通常1〜5営業日以内に発送されます。 繁忙期には5〜7日かかる場合があります。","faqQ5":"誤って2回注文してしまいました。 どうすればよいですか？","faqA5":"重複した送料のみを返金いたします。 両方のアイテムは一緒に発送されます。 返金 =（最初の送料+ 2番目の送料）– 実際の送料。","faqQ6":"配達にはどのくらい時間がかかりますか？","faqA6":"処理には1〜5営業日かかります。\n\n国内配送：\n• SingPost Prepaid Tracked Label：2〜4日\n• SpeedPost Standard：1〜3日\n\n国際：\n• SingPost ePAC：14〜30日\n• SpeedPost Priority（EMS）：8〜15日\n• SpeedPost Express：4〜8日\n\n繁忙期には遅延が発生する場合があります。","faqQ7":"商品が差出人に返送されています。 どうすればよいですか？","faqA7":"再発送は1回許可されています。 無効な住所、未請求の小包、または未払いの関税については、キャンセルできません。 再配達については郵便局に連絡するか、サポートについてメッセージを送信してください。","faqQ8":"輸送中に商品が紛失/盗難に遭いました。","faqA8":"再発送を1回許可します。 再び紛失した場合は、宅配便の配達期間後に全額返金されます：\n\n• シンガポールローカルサービス：7日\n• SingPost ePAC＆SpeedPost Priority International：30日\n• SpeedPost Intl Express：14日","blogTitle":"配送・郵便知識ベース","blogSubtitle":"郵便サービス、関税、VATに関する公式説明。","readMore":"続きを読む","backButton":"戻る","blogPost1Title":"SingPost ePACとは？","blogPost1Desc":"ePACについて学びましょう。","blogPost2Title":"SpeedPost Priority International (EMS)とは？","blogPost2Desc":"EMSを発見しましょう。","blogPost3Title":"SpeedPost Expressとは？","blogPost3Desc":"SpeedPost Expressを探索しましょう。","blogPost4Title":"米国PDDP","blogPost4Desc":"PDDPを理解しましょう。","blogPost5Title":"EU VAT & IOSS","blogPost5Desc":"EU VATに関する洞察。","blogPost6Title":"UK VAT & HMRC","blogPost6Desc":"英国のVAT要件。","blogPost7Title":"ノルウェーVOEC","blogPost7Desc":"ノルウェーのVOECシステム。","blogPost8Title":"スイスVAT","blogPost8Desc":"スイスのVAT要件。","enterDestinationPostcode":"宛先の郵便番号を入力してください","trackingNumberExample":"例: LG123456789SG","trackingCaseSensitive":"追跡文字は大文字と小文字が区別されるため、大文字にする必要があります。","usaPostcodeNote":"香港やマカオなど、郵便番号のない国の場合は、999077（香港）または999078（マカオ）を入力してください。","epacDeliveryNote":"目的地に送信されるすべてのePACアイテムは、郵便受け、玄関先、宅配ロッカーに配達されるか、安全な場所に残される必要があることに注意してください！","currentTime":"現在時刻","timezoneNote":"時刻は12時間形式で表示されます","sameTimeAsSingapore":"シンガポールと同じ時刻","hourAhead":"時間シンガポールより進んでいます","hoursAhead":"時間シンガポールより進んでいます","hourBehind":"時間シンガポールより遅れています","hoursBehind":"時間シンガポールより遅れています","collectAtPostOffice":"ただし、お住まいの国で標準としてメールボックスを利用できない場合は、郵便局で収集する必要があります。","countriesNoMailbox":"郵便受け/郵便受けの配達が利用できないことがわかっている国：ブルネイ、中国、インド、イスラエル、マカオ特別行政区中国、フィリピン、ポーランド、ベトナム。","rhythmNexusNotResponsible":"Rhythm Nexusは、配達の処理について責任を負いません。これは当社の管理外であり、商品のステータスを追跡していただくことをお勧めします。","issuesAfterDelivery":"30/45日（SpeedPost Expressの場合は14日）後の配達に関する問題、またはステータスが配達済みと表示されているが受け取っていない場合は、お問い合わせください","cannotUseEmbed":"ほとんどの郵便サービスのWebサイトがサポートしていないため、追跡に埋め込みを使用できません。","clickLinkAbove":"荷物を追跡するには、上のリンクをクリックしてください。","trackingDetailsNote":"検索結果に追跡の詳細が表示されない場合があることに注意してください。そのため、追跡番号をシステムに貼り付けてアイテムを追跡することをお勧めします。","thirdPartyWebsites":"次のサードパーティのWebサイトでも小包を追跡できます：","enterEmailOrPhone":"メールアドレスまたは電話番号を入力","reviewShippingRates":"現在の配送料を確認する","here":"こちら","contactUsForm":"こちらからお問い合わせください","form":"フォーム","forEnquiries":"ご注文に関するお問い合わせ。","anPostNoDirectTracking":"An Post（アイルランド）は、直接の追跡リンクや埋め込み追跡に対応していません。","anPostPasteManually":"An Postのウェブサイトに追跡番号を手動で貼り付けてください。","goToAnPost":"An Postに移動","countryMsgNL":"ステータスが「Held by Customs」と表示されている場合は、オランダ税関情報ラインにお問い合わせください：\n0800 0143 (無料)、月曜日〜金曜日 午前7時〜午後11時\n土曜日 & 日曜日 午前8時〜午後4時30分\n\nPostNLでアカウントを登録して、荷物のプッシュ通知を即座に受け取ることをお勧めします：\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nPostNLポイントに配達される場合、または郵便局で受け取るようステータスが表示されている場合は、窪口で7 EUR支払う必要があります。オンラインで支払う場合は最大4 EURです。","countryMsgDE":"Post & DHLアプリをダウンロードして、荷物の追跡ステータスのプッシュ通知を受け取ることをお勧めします：\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbHカスタマーサービス連絡先：\n+49-228-433-3112\nDHL DE連絡先: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"税関に追加の輸入申告を提出する必要があります。提出しない場合、入国制限や荷物の返送につながる可能性があります。 \n詳細情報: https://www.posti.fi/en/receiving/customs-clearance \nその他のリンク: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"取り扱い手数4.95 EURが請求されます。\nアプリをここからダウンロード: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"取り扱い手数8.50 PLNが請求されます。 \n荷物はドアや郵便受けに配達される可能性が低いため、\n郵便局での受け取り時に支払う必要があります。","countryMsgPH":"PHLPostはフィリピンでは非効率的で信頼性の低いと考えられています。\n小さな荷物の場合、配達中のステータスが1～3週間の間にのみ表示されることがあるため、\n常に荷物を追跡してください。大きな荷物の場合、\n受け取りはマニラ中央郵便局またはお住まいの地域の最寄りの\n郵便局でのみ可能です。どの金額の荷物にも112PHPの取り扱い手数料が適用されることに注意してください。\n支払わない場合、荷物は当社に返送されます。PHLPostのサービスの遅さのため、配達は1～2ヶ月と推定されます。 \n10000PHP未満の商品には税金を支払う必要はありませんが、それ以上の場合は必要です。 \n次回ご注文いただく際には、より迅速なプロセスのためにSpeedPost Expressをお勧めします。ただし、受取人のD&Tはデフォルトであるため、手数料は適用されない可能性があります。","countryMsgCA":"カナダに送られるすべての注文のデミニマスは20CADです。シンガポールはCPTPP協定の一部であるため、関税は適用されない可能性がありますが、商品が60CAD以上または100CAD以上の閾値を超える場合、D&Tが適用される可能性があります。これは商品のHSコードによって異なります。それ以上の価値には、それに応じてVATが請求されます。","countryMsgID":"インドネシア到着時に該当する税金と関税を支払う必要があります。荷物を追跡し、インドネシア税関に指定された金額を支払ってください。\n追加の通関書類を提出する必要があります。提出しない場合、入国制限または国の税関による荷物の押収につながる可能性があります。詳細はこちらをご確認ください：\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"インド到着時に該当する税金と関税を支払う必要があります。荷物を追跡し、インド税関に指定された金額を支払ってください。\nインドの税関清算は厳格であり、商品の価値が1000 INR（15 USD）を超える場合、HSコードによって関税が請求される場合とされない場合があります。ほとんどの場合、関税は無料ですが、商品が5000 INR（60 USD）を超える場合、より高い関税が請求される可能性があります。 \nIndia Postは標準で郵便受けに配達しないため、荷物を受け取るために在宅するか、正式な代理人が必要になるか、郵便局で受け取る必要がある場合があります。","countryMsgMY":"マレーシアに送られるすべての注文のデミニマスは500MYRです。それ以上の注文には請求される可能性があります。","countryMsgUS":"2025年8月29日より、800USDのデミニマスが正式に廃止され、輸入関税はデフォルトで発送国の送信者が支払うことになります。\n米国への発送には、さらなる遅延を避けるために有効な電話番号とメールアドレスが必要です。","countryMsgIL":"イスラエルに発送されるすべての注文のデミニマスは240 ILS（75 USD）です。それ以上の注文には請求される可能性があります。 \nイスラエルに送られる注文の場合、Israel Postは配達後に最終配達を確認しない場合があります。 \nIsrael Postは標準で郵便受けに配達しないため、荷物を受け取るために在宅するか、正式な代理人が必要になるか、郵便局で受け取る必要がある場合があります。","countryMsgGB":"英国に送られる注文の場合、Royal Mailは郵便受けに配達後に最終配達を確認しない場合があります。","countryMsgTH":"タイに発送されるすべての注文のデミニマスは1500 THB（45 USD）です。それ以上の注文には請求される可能性があります。","countryMsgTW":"台湾に発送されるすべての注文のデミニマスは2000 TWD（60 USD）です。それ以上の注文には請求される可能性があります。","countryMsgMO":"マカオに送信する際、D&Tは請求されません。しかし、Macau Postは標準で郵便受けに配達しないため、郵便局で荷物を受け取る必要があります。","countryMsgBN":"ブルネイに送信する際、D&Tは請求されません。しかし、Brunei Postは標準で郵便受けに配達しないため、郵便局で荷物を受け取る必要があります。 \nこの国の追跡システムはあまり安定しておらず、限られた情報しか提供されず、最終配達結果は発送元に通知されません。","countryMsgJP":"日本に発送されるすべての注文のデミニマスは10000 JPY（65 USD）です。それ以上の注文には請求される可能性があります。","countryMsgKR":"韓国に発送されるすべての注文のデミニマスは180000 KRW（150 USD）です。それ以上の注文には請求される可能性があります。","countryMsgVN":"ベトナムの場合、配達中は連絡が取れるようにしてください。商品の配達時に取り扱い手数料が請求される場合があります。 \nベトナムに発送されるすべての注文のデミニマスは1000000（35 USD）です。それ以上の注文には請求される可能性があります。 \nVietnam Postは標準で郵便受けに配達しないため、荷物を受け取るために在宅するか、正式な代理人が必要になるか、郵便局で受け取る必要がある場合があります。","countryMsgPP":"Tracked Labelアイテムは郵便局のPOPDrop/POPStopに投函されます。SpeedPost Standardアイテムは通常POPStopまたはPOPStationに投函されます。\nTracked Labelアイテムの配達は、月曜日から金曜日の午前9時から午後6時までのみ行われます。週末と祝日を除く。","postedDate":"投函日:","status":"ステータス:","shippedVia":"配送方法:","destination":"宛先:","statusInPreparation":"準備中","statusInTransit":"輸送中","statusDelivered":"配達完了","statusOutForDelivery":"配達中","statusArrived":"到着","statusProcessing":"処理中","statusDispatched":"発送済み","statusReturned":"返送済み","statusFailed":"配達失敗","statusCancelled":"キャンセル済み","statusHeldByCustoms":"税関保留","statusAwaitingCollection":"受取待ち","aka":"別名","thisServiceKnownAs":"このサービスは以下の名称で知られています","in":"で","viewTrackingDHL":"DHL Expressの追跡情報を表示","viewTrackingSingPostSpeedPost":"Singapore SpeedPostの追跡情報を表示","viewTrackingDHLLastMile":"DHL Express（ラストマイル）の追跡情報を表示","viewTrackingDHLShipperRef":"DHL Express（荷主参照番号）の追跡情報を表示","viewTrackingSingPost":"Singapore Postの追跡情報を表示","viewTrackingDestPost":"追跡情報を表示：","post":"郵便","orderNumberExample":"注文番号（RTNXまたはDLTBで始まる - 例：RTNX1234567890）:","deliveryRecordNote":"商品が配達されると、記録は7日間のみ保存され、その後削除されることにご注意ください。","copyrightAllRights":"無断転載禁止。","epacUS":"ファーストクラス国際小包サービス","epacCH":"プライオリティプラス","epacGB":"国際追跡あり","epacMY":"国際追跡/速達","epacCA":"国際インバウンドエクスプレス","epacAU":"パックアンドトラックインターナショナル","epacNZ":"国際エコノミー追跡","epacDE":"ワーレンポスト・インターナショナル・プレミアム","epacFR":"追跡付き国際レター","epacNL":"国際パケット追跡あり","epacPL":"グローバルエクスプレス","epacBE":"国際線プライムインバウンド","epacAT":"国際追跡小包","epacIN":"国際追跡小包","epacFI":"国際追跡レター","epacSE":"国際追跡レター","epacNO":"プライムエクスプレス","epacIT":"急行","epacIL":"急行","epacES":"国際ライトパッケージ","epacPT":"国際ブルーメール","epacCZ":"海外からの追跡配送","epacBN":"国際eパケット","epacCN":"国際eパケット","epacHK":"国際eパケット","epacID":"国際e-パケット","epacMO":"国際eパケット","epacPH":"国際追跡郵便","epacTW":"国際eパケット","epacTH":"国際eパケット","epacVN":"国際E-パケット（ASEANパック）","epacKR":"Kパケット","epacJP":"国際e-パケットライト","epacIE":"国際速達郵便","blogSingPostEPACContent1":"SingPost ePAC（ePacket）は、軽量な国際eコマース配送のための経済的な追跡付き郵便サービスです。","blogSingPostEPACContent2":"配送先国の国営郵便事業者によって配達され、一般的に2kg未満の小包に使用されます。寸法制限は長さ+幅+高さが90cm未満、長さが60cmを超えないものです。","blogSingPostEPACContent3":"このオプションは当初、香港郵政とeBay Chinaによってのみ提供されており、中国と香港からの小包を配達追跡付きで米国に送ることができ、配達時に署名を必要としませんでした。このサービスは米国ではUSPS（United States Postal Service）First-Class Package International Serviceとして知られています。","blogSingPostEPACContent4":"2026年1月1日より、ePACはすべての国で使用され、小包の追跡を義務付けるUPU規則に準拠し、書留品は文書のみに制限されます。","blogSingPostEPACContent5":"追跡プレフィックス：LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMSは国際プレミアム郵便速達サービスで、世界中の郵便事業者によって優先されます。","blogSpeedPostEMSContent2":"通関は一般的に標準郵便よりも速いですが、プロセスはより厳格で、配達まで完全な追跡が可能です。","blogSpeedPostEMSContent3":"シンガポールでは、SingPostによってSpeedPost Priority Internationalとして知られています。","blogSpeedPostEMSContent4":"追跡プレフィックス：EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Expressは宅配便グレードのサービスです。","blogSpeedPostExpressContent2":"多くの目的地では、DHL Expressがラストマイル配送を行い、リリース前に関税または税金を徴収します。","blogSpeedPostExpressContent3":"追跡プレフィックス：PX123456789SG（ラストマイルのDHL Expressは10桁の追跡番号を使用しますが、公開されていません。当社の","blogSpeedPostExpressContent3Link":"追跡システムで情報を確認できます。","blogUSPDDPContent1":"PDDPにより、米国の輸入関税と税金を配達前に前払いでき、受取人への予期しない料金を削減します。","blogUSPDDPContent2":"新規制（2025年8月29日発効）","blogUSPDDPContent2List1":"HTSコードの義務化","blogUSPDDPContent2List2":"正確な商品説明","blogUSPDDPContent2List3":"より厳格な関税の適用","blogUSPDDPContent3":"米国に送られるすべての商品は、当社があなたに代わって支払うため、受取人に追加の関税は請求されません。ただし、商品価格には規制に準拠するために10％の輸入手数料がデフォルトで含まれていることに注意してください。","blogUSPDDPContent4":"これは米国への配送方法、SpeedPost Priority International（EMS）およびSingPost ePACにのみ適用されます。","blogEUIOSSContent1":"EUは価値に関係なく、すべての商業輸入にVATを適用します。","blogEUIOSSContent2":"IOSS（Import One-Stop Shop）","blogEUIOSSContent3":"IOSSにより、販売者は150ユーロまでの荷物に対してチェックアウト時にEU VATを徴収できます。","blogEUIOSSContent4":"VATはIOSSシステムを介して送金され、より迅速な通関とdelivery時のVAT徴収なしが可能になります。","blogEUIOSSContent5":"EtsyまたはeBay経由のすべての注文について、IOSS VATはすでにチェックアウト時に徴収されており、EDI（Electronic Data Interchange）を介して配送先の郵便サービスにデータを送信するために税参照番号に表示します。","blogUKVATContent1":"英国では、輸入品にVATを計上する必要があります。","blogUKVATContent2":"低価値の荷物の場合、VATは通常チェックアウト時に徴収され、販売者またはマーケットプレイスによってHMRCに直接送金されます。","blogUKVATContent3":"高価値の貨物の場合、VATは配達前に運送業者によって徴収される場合があります。","blogUKVATContent4":"EtsyまたはeBay経由のすべての注文について、VATはすでにチェックアウト時に徴収されており、EDI（Electronic Data Interchange）を介して配送先の郵便サービスにデータを送信するために税参照番号に表示します。","blogNorwayVOECContent1":"ノルウェーは、EU/EEA域外から輸入される商品に対してVOEC（VAT on E-Commerce）システムを導入しました。これは3,000 NOKまでの商品に適用されます。","blogNorwayVOECContent2":"販売者はVOECスキームに登録して、チェックアウト時にノルウェーのVATを徴収でき、より迅速な通関と配達時のVAT徴収なしが可能になります。","blogNorwayVOECContent3":"EtsyまたはeBay経由のすべての注文について、VOEC VATはすでにチェックアウト時に徴収されています。追跡と通関書類は、ノルウェーの郵便サービスにデータを送信するための税参照番号を示します。","blogSwissVATContent1":"スイスは、価値に関係なく輸入品にVATを課します。スイス連邦税関は、外国の販売者が65 CHFまでの商品に対してチェックアウト時にVATを徴収することを要求しています。","blogSwissVATContent2":"スイスのVATシステムに登録されている販売者は、徴収されたVATを直接送金し、受取人が配達時に追加のVAT料金を負担しないようにします。","blogSwissVATContent3":"EtsyまたはeBay経由のすべての注文について、スイスのVATはチェックアウト時にすでに徴収されており、通関書類にはEDI提出用の税参照番号が含まれています。","optionSingPost":"🇸🇬シングポスト (SPNDD/PP)","countryAU":"🇦🇺 オーストラリア","countryCA":"🇨🇦 カナダ","countryDE":"🇩🇪 ドイツ","countryGB":"🇬🇧 イギリス","countryUS":"🇺🇸 アメリカ合衆国","countryAT":"🇦🇹 オーストリア","countryBE":"🇧🇪 ベルギー","countryBN":"🇧🇳 ブルネイ","countryCN":"🇨🇳 中国","countryCZ":"🇨🇿 チェコ","countryFI":"🇫🇮 フィンランド","countryFR":"🇫🇷 フランス","countryHK":"🇭🇰 香港特別行政区","countryIN":"🇮🇳 インド","countryID":"🇮🇩 インドネシア","countryIE":"🇮🇪 アイルランド","countryIL":"🇮🇱 イスラエル","countryIT":"🇮🇹 イタリア","countryJP":"🇯🇵 日本","countryMO":"🇲🇴 マカオ特別行政区","countryMY":"🇲🇾 マレーシア","countryNL":"🇳🇱 オランダ","countryNZ":"🇳🇿 ニュージーランド","countryNO":"🇳🇴 ノルウェー","countryPH":"🇵🇭 フィリピン","countryPL":"🇵🇱 ポーランド","countryPT":"🇵🇹 ポルトガル","countryRU":"🇷🇺 ロシア","countryKR":"🇰🇷 韓国","countryES":"🇪🇸 スペイン","countrySE":"🇸🇪 スウェーデン","countryCH":"🇨🇭 スイス","countryTW":"🇹🇼 台湾","countryTH":"🇹🇭 タイ","countryVN":"🇻🇳 ベトナム","countrySG":"🇸🇬 シンガポール","russiaServiceSuspended":"⚠️ 重要なお知らせ：2022年のロシアのウクライナ侵攻を受けて、SingPostはDHLと共にロシアへのすべての配送を停止しました。同国へのサービス再開が発表されるまで、現在ロシアにはサービスを提供していません。","goodFridayEasterGreeting":"イースター、おめでとう！グッドフライデーとイースターの平和と喜びをお祈りします。","christmasGreeting":"メリークリスマス、そして新年明けましておめでとうございます! 12月25日から1月5日まで、皆様の平和と喜びをお祈り申し上げます。","captchaSystemRequirements":"最小システム要件: Windows 7 (with ESU updates installed) または 11、macOS 10.15 以降、または Android/iOS 最新バージョン。","hariRayaMessage":"🌙 セラマット・ハリラヤ・アイディルフィトリ！あなたとあなたの家族の平和、喜び、そして祝福をお祈りします。 🌟","deepavaliMessage":"🪔 ディーパバリさん、おめでとうございます！光の祭りがあなたに喜び、繁栄、そして成功をもたらしますように! ✨","diwaliMessage":"🪔 ハッピーディワリ！光の祭りがあなたに喜び、繁栄、そして成功をもたらしますように! ✨","vesakMessage":"☸️ ベサックデーおめでとうございます!この神聖な日に、あなたに平和、知恵、そして啓発が訪れますように！ 🙏","vesakTHMessage":"☸️ ヴィシャカ・ブチャの日おめでとうございます!この神聖な日に、あなたに平和、知恵、そして啓発が訪れますように！ 🙏","temporaryClosureNoticeTitle":"Rhythm Nexus - 一時休業のお知らせ","temporaryClosureNoticeBody":"お客様各位\n\n社内イベントのため、Rhythm Nexusは2026年3月21日から2026年3月26日まで一時休業となります。\n\n休業準備のため、ショップは2026年3月20日 3:00 PM（UTC+8）より休暇モードに切り替わります。この時刻以降のご注文は、営業再開まで処理されない場合があります。\n\n通常営業は2026年3月27日に再開いたします。\n\nご不便をおかけしますことをお詫び申し上げるとともに、ご理解と継続的なご支援に心より感謝いたします。\n\nありがとうございます。\n\nRhythm Nexus","temporaryClosureNoticeClose":"了解しました","parcelTracking":"小包追跡","serviceAnnouncement":"サービスのお知らせ","usaWinterStormTitle":"緊急：厳しい冬嵐 - サービス中断","usaWinterStormSubtitle":"米国郵政公社（USPS）不可抗力事象","usaWinterStormNotice1":"2026年2月23日以降のニューヨーク地域に影響を与えている厳しい冬嵐により：","usaWinterStormNotice2":"ジョン・F・ケネディ国際空港の国際便運航は実質的に停止されています","usaWinterStormNotice3":"広範な便の欠航および空港サービスの大規模な中断が報告されています","usaWinterStormNotice4":"これらの状況はUSPSの管理外にある不可抗力事象に該当します","usaWinterStormNotice5":"サービスへの影響:","usaWinterStormNotice6":"大雪、凍雨、みぞれおよび厳しい寒冷の危険な組み合わせ","usaWinterStormNotice7":"広範な混乱と広域停電が報告されています","usaWinterStormNotice8":"国内および国際郵便物（信書便、荷物便およびEMS品目）の回収と配達に影響があります","usaWinterStormNotice9":"影響を受ける郵便番号地域:","usaWinterStormNotice10":"06000–06999、01000–02799、03900–04999、03000–03899、07000–08999、10001–14925、15000–19699、02800–02999、05000–05999、20001–20020、20100–24699、04699、35000–36999","usaWinterStormNotice11":"USPSは顧客への不便を最小限に抑えながら従業員の安全を確保するため、あらゆる必要な措置を講じています。この不可抗力事象中のご辛抱と皆様のご理解に感謝いたします。","usaWinterStormNotice12":"最終更新: 2026年2月25日","countryAutoDetected":"お届け先はお客様の所在地に基づいて自動設定されました","countryAutoDetectedFromLink":"リンクからお届け先が自動設定されました","trackingNumber":"追跡番号","destinationCountry":"目的地の国","postcode":"郵便番号","australianDSTTitle":"オーストラリア夏時間有効","australianDSTBothMessage":"AEDT (オーストラリア東部夏時間) と ACDT (オーストラリア中部夏時間) の両方が現在有効です。","australianAEDTMessage":"AEDT (オーストラリア東部夏時間) は現在、シドニー、メルボルン、およびその周辺地域で実施されています。","australianACDTMessage":"ACDT (オーストラリア中央夏時間) は現在、アデレードと南オーストラリア州で実施されています。","australianDSTNote":"上に表示されている配送時間は、現在の夏時間を反映しています。","filteredAllowedDestinations":"(許可された目的地に合わせてフィルタリングされます)","loadingAnnouncements":"お知らせを読み込んでいます...","unableToLoadAnnouncements":"現時点ではサービスのお知らせを読み込むことができません。","viewOnSingPostWebsite":"SingPost ウェブサイトで見る →","statusHeldByCustms":"税関で保管される","accessRestricted":"アクセス制限あり","vpnDetectedMessage":"VPN の使用が検出されました。このサービスにアクセスするには、VPN を無効にしてください。","contactSupportError":"これがエラーであると思われる場合は、サポートにお問い合わせください。","destinationNotAllowed":"お住まいの地域からはこの目的地の国にアクセスできません。別の宛先を選択してください。","dhlNoEmbed":"DHL Express は、埋め込みによる追跡をサポートしていません。お願いします","speedPostNoEmbed":"SpeedPost Singapore は埋め込みによる追跡をサポートしていません。お願いします","operatorNoEmbed":"埋め込みによる追跡はサポートされていません。お願いします","clickHere":"ここをクリック","postalContactsTitle":"郵便サービス連絡先","postalContactsNote":"注意：","postalContactsPolandUKNote":"ポーランドと英国の場合、SpeedPost Priority（EMS）経由で送信されるすべてのアイテムは、PocztexとParcelforceによって処理されます。","postalContactsDHLNote":"SpeedPost Expressの配送については、このリンクからDHLにお問い合わせください：","postalContactsCountry":"国","postalContactsWebsite":"ウェブサイト","postalContactsForm":"お問い合わせフォーム","postalContactsPhone":"電話番号","postalContactsEmail":"メールアドレス","postalContactsFormLink":"お問い合わせフォーム","postalContactsBackButton":"荷物お問い合わせフォームに戻る","toTrackNewTab":"追跡します (新しいタブで開きます)。","contactUsTitle":"お問い合わせ","contactNameLabel":"名前 (ニックネームや電話番号不可)","contactEmailLabel":"メールアドレス (返信先)","contactEmailNote":"プライベートリレーメール (例: @privaterelay.appleid.com) は使用できません。有効なメールアドレスを使用してください。","contactEnquiryTypeLabel":"これは何ですか？","contactSelectOption":"オプションを選択","contactGeneralEnquiry":"一般的なお問い合わせ / フィードバック","contactBusinessEnquiry":"ビジネスに関するお問い合わせ","contactOrderShippingEnquiry":"注文/配送に関するお問い合わせ","contactExchangeRefundEnquiry":"交換/返金/返品に関するお問い合わせ","contactOthers":"その他","contactParcelWarning":"荷物が18/30/45日以上配達されていない場合 (FedExは14日)、または配達済みと表示されているが受け取っていない場合は","contactParcelWarningLink":"このフォーム","contactParcelWarningEnd":"に記入してください。","contactOrderNumberLabel":"注文番号","contactOrderNumberPlaceholder":"例: RTNX1234567890","contactPlatformNote":"Etsy、eBay、Shopeeの注文番号はこちら。これらのプラットフォームの返金に関して当社は一切管理できません。それぞれのカスタマーサービスにお問い合わせください。","contactPlatformInstructions":"注文番号を確認するには、アプリに保存されているため、アプリを使用してください:","contactPlatformEtsy":"Etsy - プロフィールの右上 → 購入履歴","contactPlatformEbay":"eBay - マイeBay → 購入履歴","contactPlatformShopee":"Shopee - 私 → 購入履歴を表示 (または「発送待ち/受取待ち」をクリック)","contactRefundNote1":"購入したプラットフォームの返品/返金についてお問い合わせの場合、これらのプラットフォームの返金に関して当社は一切管理できないことにご注意ください。それぞれのカスタマーサービスにお問い合わせください。","contactRefundNote2":"返品または交換について、開封時に既に使用されている maimai グローブ (目に見える汚れまたは洗濯機/手洗いで洗われたもの) は許可しておらず、アミューズメントカードの返品または交換は許可していません。ありがとうございます。","contactRefundNote3":"Payhip経由の返金について、返金を受け取っていない場合は、銀行またはPayhipサポート (support@payhip.com) にお問い合わせください。当社はそのプロセスを管理できません。","contactMessageLabel":"メッセージ (最大1000文字)","contactCharacterCount":"文字","contactSpamWarningNote":"注意：","contactSpamWarning":"SEO、Web サイトデザイン、ローン、または類似のサービスに関する未承諾のオファーは自動的に拒否されます。","contactAgreementText1":"お客様のメールアドレスがRhythm Nexusによってご返信のために使用されることに同意される場合は、\"同意します\"をクリックしてください。これは、お客様のご返信を読み、お問い合わせの解決策を見つけ次第ご返信するために必要です。","contactAgreementText2":"ご返信には3〜5営業日かかります。メールの量が多い場合はさらに時間がかかる場合があります。","contactAgreeCheckbox":"同意します","contactSuccessMessage":"メッセージが正常に送信されました！3〜5営業日以内に返信いたします。","contactErrorMessage":"メッセージの送信に失敗しました。もう一度お試しください。","contactGeneralError":"エラーが発生しました。後でもう一度お試しください。","contactSubmitting":"送信中...","contactSubmit":"送信","contactAlertAgree":"フォームを送信するには利用規約に同意してください。","parcelEnquiryTitle":"荷物お問い合わせ","parcelInfoText":"このフォームは、18/30/45日以上配達されていない荷物 (FedEx/DHLは14日)、または配達済みと表示されているが受け取っていない荷物用です。","parcelInfoLink":"こちらをクリック","parcelInfoEnd":"その他のお問い合わせはこちら。","parcelWaitTitle":"荷物をお待ちください","parcelWaitText1":"荷物の配達をお待ちください。国際配送は国内配送とは異なり、時間がかかることにご注意ください。ありがとうございます！","parcelWaitText2":"18日 (シンガポールは7日) 以上経過してもステータスが表示されない場合は、直接お知らせください。","parcelCannotSubmit":"\"いいえ\"を選択した場合、このフォームを送信できません。","parcelNameLabel":"名前","parcelOrderNumberLabel":"注文番号 (例: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"メールアドレス (こちらで返信いたします)","parcelEmailNote":"プライベートリレーメールは使用できません。有効なメールアドレスを使用してください。","parcelShippingMethodLabel":"選択された配送方法は？","parcelSelectShipping":"配送方法を選択","parcelSingPostEpac":"SingPost ePacket (またはePAC) - SpeedPost Saver International とも呼ばれます (追跡: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (追跡: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (追跡: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (追跡: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (追跡: PX123456789SG)","parcelDHL":"DHL Express (EU諸国のみ) (追跡: 1234567890)","parcelTrackingNumberLabel":"荷物の追跡番号は？","parcelUndeliveredLabel":"荷物は18/30/45日以上配達されていませんか？ (シンガポール国内サービス >7日、SpeedPost Express/DHL >14日)","parcelSelectOption":"オプションを選択","parcelYes":"はい","parcelNo":"いいえ","parcelDeliveredButMissingLabel":"荷物は配達済みと表示されていますが、郵便受け/安全な場所/玄関先にありませんか？","parcelCaseReferenceLabel":"地元郵便局からのケースリファレンスID","parcelCaseReferencePlaceholder":"シンガポールの方はNAと入力してください","parcelCaseReferenceNote":"このフォームを送信する前に、電話またはメールで地元の郵便局に連絡し、ケースリファレンスIDを取得してください。次に、ここにケースリファレンスIDを入力してください。","parcelCaseReferenceLink":"郵便サービスの連絡先についてはこちらのリンクを参照してください","parcelCaseReferenceMandatory":"シンガポールの方のみNAと入力してください。その他の国は必須です。SpeedPost ExpressおよびDHLのケースIDにも必要です。","parcelImageEvidenceLabel":"画像証拠 (配達済みだが紛失した荷物用)","parcelImageWarning":"追加の確認のために、荷物の不配達について虚偽の主張をしていないことを証明する画像証拠が必要です。(既に配達済みだが郵便受け/玄関先にない荷物のみ。配達済み商品に写真証拠が提供されない場合、請求を拒否する場合があります。商品が配達済みステータスを示していない場合は、これを無視してください。)","parcelImageNote":"サポートされているファイル1つをアップロード: 画像。最大1 GB。","parcelAgreementText":"荷物に起こったことが真実であることを確認する場合は、\"同意します\"をクリックしてください。","parcelAgreeCheckbox":"同意します","parcelSuccessMessage":"荷物お問い合わせが正常に送信されました！3〜5営業日以内に返信いたします。","parcelErrorMessage":"お問い合わせの送信に失敗しました。もう一度お試しください。","parcelGeneralError":"エラーが発生しました。後でもう一度お試しください。","parcelAlertWait":"荷物の配達をお待ちください。指定された待機期間の後にこのフォームを送信できます。","parcelAlertAgree":"フォームを送信するには利用規約に同意してください。","parcelAlertCaseReference":"地元の郵便局からケースリファレンスIDを提供するか、シンガポールの方はNAと入力してください。","parcelSubmitting":"送信中...","parcelSubmit":"送信","lookalikeDomainWarning":"これは追跡番号ではなく、配送業者を装ったウェブサイトへのリンクです。個人情報や支払い情報を入力しないでください。","lookalikeDomainOfficial":"公式サイト："};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus는 프리미엄 상업 배송 네트워크를 활용합니다. 다만 물품이 고객님의 국가에 도착하는 즉시 인계 책임은 현지 국내 배송사(예: USPS, Royal Mail, 현지 DHL)로 전환됩니다. 이 지점에서 추적 번호 접두사가 처리 시스템에 따라 바뀔 수 있지만, 당사의 범용 소포 추적기는 상태를 연결해 끊김 없는 가시성을 제공합니다.","trackingLastMileTitle":"라스트마일 배송 네트워크","trackingCustomsClearanceBody":"모든 국제 발송 물품은 수취 국가의 세관 절차를 거쳐야 합니다. 당사 도구는 수입 시설 도착부터 세관 인계까지의 상태 전환을 모니터링합니다. 국경 당국은 HS 코드를 확인하고 적정 VAT 또는 관세 납부 여부를 검증합니다(예: EU의 IOSS, 노르웨이의 VOEC). 특히 \"Held at Customs\" 경고가 있는지 추적 상태를 확인해 주세요.","trackingCustomsClearanceTitle":"통관 정보","trackingProcessingOriginBody":"접수 후 물품은 출발지 처리 센터로 이동하여 스캔, 계량 및 1차 수출 보안 검사를 거칩니다. 이후 국제 우편 교환국으로 발송됩니다. 항공편 일정은 가용 화물 용량에 따라 달라집니다. 이 상태가 며칠간 유지되더라도 걱정하지 않으셔도 됩니다.","trackingProcessingOriginTitle":"출발지 허브 처리 중","trackingInfoReceivedBody":"주문이 이커머스 플랫폼(예: Etsy, eBay 또는 직접 판매)에서 처음 처리되면 추적 번호가 전자적으로 생성됩니다. 운송사는 상자를 물리적으로 인수하기 전에 먼저 발송 데이터를 받습니다. 소포가 실제 분류 시설에 접수되기까지 영업일 기준 1~3일이 소요될 수 있습니다.","trackingInfoReceivedTitle":"정보 접수됨","trackingStatusesIntro":"통합 국제 소포 추적 도구를 이용해 주셔서 감사합니다. 고객님의 소포는 여러 국가의 경계를 넘나들기 때문에 추적 상태가 복잡하게 보일 수 있습니다. 물류 라이프사이클을 이해하면 보다 명확한 기대치를 설정할 수 있습니다.","trackingStatusesTitle":"추적 상태 이해하기","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"오전","pmText":"오후","footerQuickLinks":"빠른 링크","footerSupportLegal":"지원 및 법적 정보","copyrightText":"모든 권리 보유.","tzAEST":"AEST (시드니/멜버른)","tzACST":"ACST (애들레이드)","tzAWST":"AWST (퍼스)","tzNST":"NST (뉴펀들랜드)","tzAST":"AST (대서양)","tzEST":"EST (동부)","tzCST":"CST (중부)","tzMST":"MST (산악)","tzPST":"PST (태평양)","tzAKST":"AKST (알래스카)","tzHST":"HST (하와이)","tzBeijing":"베이징","tzXinjiang":"신장","tzWIB":"WIB (자카르타)","tzWITA":"WITA (마카사르)","tzWIT":"WIT (자야푸라)","tzKaliningrad":"칼리닌그라드주 (UTC+2)","tzMoscow":"모스크바/서부 러시아 (UTC+3)","tzSamara":"사마라주 (UTC+4)","tzUral":"우랄 지역 (UTC+5)","tzOmsk":"옴스크주 (UTC+6)","tzKrasnoyarsk":"크라스노야르스크 지방 (UTC+7)","tzIrkutsk":"이르쿠츠크주 (UTC+8)","tzSakha":"사하 공화국 (UTC+9)","tzPrimorsky":"연해주 (UTC+10)","tzMagadan":"마가단주 (UTC+11)","tzKamchatka":"캄차카 지방 (UTC+12)","dstDayStartsLabel":"일광절약시간 시작","dstDayEndsLabel":"일광절약시간 종료","dstRevertsLabel":"표준시로 전환","dstEuropeLabel":"유럽","dstNewZealandLabel":"뉴질랜드","englishResponseNotice":"주의사항: 모든 문의사항은 영어로 답변됩니다. 다른 언어로 제출하는 경우 확인을 위해 메시지가 영어로 번역될 수 있습니다.","parcelDisagreeCheckbox":"동의하지 않습니다","contactDisagreeCheckbox":"동의하지 않습니다","contactNamePlaceholder":"예: 홍길동","systemRequirementsTitle":"최소 지원 시스템 버전","systemRequirements":"Windows: Windows 7 (with ESU updates installed) 이상\nmacOS: macOS 12 이상\nAndroid: Android 13 이상\niPhone/iOS: iOS 17 이상\nLinux: 현재 지원되는 배포판(활성 보안 업데이트 포함)","goodFridayEasterGreeting":"부활절 축하합니다! 성금요일과 부활절에 평화와 기쁨을 기원합니다.","christmasGreeting":"메리 크리스마스와 새해 복 많이 받으세요! 12월 25일부터 1월 5일까지 평화와 기쁨을 기원합니다.","captchaSystemRequirements":"최소 시스템 요구 사항: Windows 7 (with ESU updates installed) 또는 11, macOS 10.15+, 또는 최신 Android/iOS 버전.","title":"액세스 확인","subtitle":"계속하려면 아래 챌린지를 완료하십시오.","selectLanguage":"언어 선택","selectLanguagePlaceholder":"-- 언어를 선택하십시오 --","loadingChallenge":"챌린지 로딩 중...","answerLabel":"답변:","answerPlaceholder":"답변을 입력하십시오","continueButton":"계속","refreshButton":"새 챌린지","verifying":"확인 중...","chooseLanguageFirst":"먼저 언어를 선택하십시오.","loadFailed":"챌린지 로드에 실패했습니다. 다시 시도하십시오.","expiredChallenge":"챌린지가 만료되었습니다. 새 챌린지 로딩 중...","verifyFailed":"확인에 실패했습니다. 다시 시도하십시오.","home":"홈","blog":"블로그","aboutUs":"회사 소개","faq":"자주 묻는 질문","contact":"문의","trackPackage":"소포 추적","cnyYearOfHorseMessage":"🧧 즐거운 음력 설날! 말의 해에 번영과 기쁨을 기원합니다! 🐴","singaporeNationalDayMessage":"🇸🇬 싱가포르 건국 기념일을 축하합니다! 독립 61주년을 기념합니다! 🎉","indonesiaNationalDayMessage":"🇮🇩 인도네시아 독립 기념일을 축하합니다! 인도네시아 공화국 만세! 🎊","malaysiaNationalDayMessage":"🇲🇾 말레이시아 독립 기념일을 축하합니다! 우리 나라의 독립을 기념합니다! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - 임시 휴무 안내","temporaryClosureNoticeBody":"고객님께,\n\n회사 행사로 인해 Rhythm Nexus는 2026년 3월 21일부터 2026년 3월 26일까지 임시 휴무입니다.\n\n휴무 준비를 위해 매장은 2026년 3월 20일 오후 3:00 (UTC +8)부터 휴가 모드로 전환됩니다. 이 시간 이후 주문은 운영 재개 시점까지 처리되지 않을 수 있습니다.\n\n정상 영업은 2026년 3월 27일에 재개됩니다.\n\n불편을 드려 죄송하며, 너른 이해와 지속적인 성원에 감사드립니다.\n\n감사합니다.\n\nRhythm Nexus","temporaryClosureNoticeClose":"확인했습니다","parcelTracking":"소포 추적","serviceAnnouncement":"서비스 공지","usaWinterStormTitle":"긴급: 심각한 겨울 폭풍 - 서비스 중단","usaWinterStormSubtitle":"미국 우편 서비스(USPS) 불가항력 사건","usaWinterStormNotice1":"2026년 2월 23일부터 뉴욕 지역에 영향을 미치는 심각한 겨울 폭풍으로 인해:","usaWinterStormNotice2":"존 F. 케네디 국제공항의 국제 운영은 실질적으로 중단되었습니다","usaWinterStormNotice3":"광범위한 항공편 취소 및 공항 서비스의 심각한 중단이 보도되었습니다","usaWinterStormNotice4":"이러한 상황은 USPS의 통제를 벗어난 불가항력적 사건에 해당합니다","usaWinterStormNotice5":"서비스 영향:","usaWinterStormNotice6":"폭설, 냉동우, 진눈깨비 및 혹독한 추위의 위험한 혼합","usaWinterStormNotice7":"광범위한 중단 및 광범위한 정전이 보도되었습니다","usaWinterStormNotice8":"국내 및 국제 우편물(편지, 소포 및 EMS 물품)의 수거 및 배송이 영향을 받습니다","usaWinterStormNotice9":"영향을 받는 우편번호 지역:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS는 직원의 안전을 유지하면서 고객의 불편을 최소화하기 위해 필요한 모든 조치를 취하고 있습니다. 이 불가항력 사건 기간 동안 여러분의 인내와 이해에 감사드립니다.","usaWinterStormNotice12":"마지막 업데이트: 2026년 2월 25일","countryAutoDetected":"귀하의 위치를 기반으로 목적지가 자동 설정되었습니다","countryAutoDetectedFromLink":"링크에서 목적지가 자동 설정되었습니다","trackingNumber":"추적 번호","destinationCountry":"목적지 국가","postcode":"우편번호","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! 러시아의 날을 축하합니다! 🎉","taiwanFoundingDayMessage":"🇹🇼 대만 건국 기념일을 축하합니다! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 대만 쌍십절을 축하합니다! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 홍콩 특별행정구 설립 기념일을 축하합니다! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 마카오 특별행정구 설립 기념일을 축하합니다! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ 세계 노동절을 축하합니다! 노동과 노동자 권리를 기념합니다! 🎊","laborDayUSCAMessage":"⚒️ 노동절을 축하합니다! 노동자의 공헌을 기립니다! 🎉","orderNumber":"주문 번호 (예: RTNX1234567890)","fromDate":"시작 날짜 (필수)","toDate":"종료 날짜 (필수)","trackParcel":"소포 추적","selectCourier":"-- 택배사 / 국가 선택 --","singaporeCouriers":"싱가포르 택배사","topCountries":"상위 5개 국가","otherCountries":"기타 국가","note":"참고","disclaimer":"면책 조항","importantInformation":"중요 정보:","didNotReceiveEmail":"Etsy, eBay, Shopee 또는 Payhip에서 확인 이메일을 받지 못한 경우 아래로 스크롤하여 이 주문과 연결된 이메일 주소 또는 전화번호를 통해 주문을 검색하십시오.","searchByEmailOrPhone":"이메일 또는 전화로 검색","searchOrder":"주문 검색","trackingResult":"추적 결과","noOrdersFound":"주문을 찾을 수 없습니다.","pleaseEnter":"이메일, 전화번호 또는 주문 번호를 입력하세요.","welcomeTitle":"Rhythm Nexus 웹사이트에 오신 것을 환영합니다!","purchaseInfo":"공식 채널을 통해 구매하거나","purchaseInfoChina":"공식 채널을 통해 구매하세요.","purchaseInfoChinaSuffix":"","telegramGroup":"텔레그램 그룹","forUpdates":"에 가입하여 공식 업데이트를 받으세요.","ourStores":"우리 매장","etsyStore":"Etsy 스토어","ebayStore":"eBay 스토어","shopeeStore":"Shopee 스토어","payhipStore":"Payhip 스토어","internationalShipping":"국제 배송","singaporeLocal":"싱가포르 현지","asiaOnly":"아시아 전용","deliveryInfo":"배송 정보","deliveryRates2026":"2026년 배송 요금","sgDeliveryRates":"싱가포르 배송 요금","speedPostRates":"SpeedPost Express 국제 요금","aboutTitle":"Rhythm Nexus 소개","aboutP1":"2022년에 매장을 시작하여 Etsy, eBay, Shopee와 같은 플랫폼에서 문제없이 판매해 왔습니다.","aboutP2":"시간이 지남에 따라 신뢰할 수 있는 이행과 정확한 추적에 중점을 두어 강력한 평판을 구축했습니다.","aboutP3":"우리의 목표는 고객에게 원활하고 신뢰할 수 있는 쇼핑 경험을 제공하는 것입니다.","aboutP4":"Rhythm Nexus를 지원해 주셔서 감사합니다.","faqTitle":"자주 묻는 질문","faqQ1":"내 상품에 결함이 있으면 어떻게 합니까? 보증이 있습니까?","faqA1":"네! 대부분의 주문에는 1년 보증이 제공됩니다. 조사할 수 있도록 송장/주문 번호를 알려주십시오. 참고: 잘못 주문했더라도 상품이 설명과 일치하는 경우 교환이 허용되지 않습니다.","faqQ2":"주문을 수정, 업데이트 또는 취소할 수 있습니까?","faqA2":"네. 보안을 위해 주문 변경은 이메일이나 문의 양식을 통해 처리해야 할 수 있습니다.","faqQ3":"관세/수입세를 납부해야 합니까?","faqA3":"관세 및 세금은 일반적으로 미국으로의 DDP를 제외하고는 선불되지 않습니다. VAT는 EU, 영국, 호주/뉴질랜드, 노르웨이, 스위스 및 서스캐처원 및 매니토바와 같은 캐나다 지방에 적용될 수 있으며 이미 기본적으로 지불되었습니다. 싱가포르에는 GST가 적용되지 않습니다. 관세 수수료에 대해서는 조언해 드릴 수 없습니다. 자세한 내용은 현지 세관에 문의하십시오.","faqQ4":"내 주문은 언제 배송됩니까?","faqA4":"주문은 일반적으로 영업일 기준 1-5일 이내에 발송됩니다. 물량이 많은 기간에는 5-7일이 소요될 수 있습니다.","faqQ5":"실수로 두 번 주문했습니다. 어떻게 해야 합니까?","faqA5":"중복 배송비만 환불해 드립니다. 두 상품 모두 함께 배송됩니다. 환불 = (1차 배송비 + 2차 배송비) – 실제 배송비.","faqQ6":"배송은 얼마나 걸립니까?","faqA6":"처리에 영업일 기준 1-5일이 소요됩니다.\n\n국내 배송:\n• SingPost 선불 추적 라벨: 2-4일\n• SpeedPost Standard: 1-3일\n\n국제:\n• SingPost ePAC: 14-30일\n• SpeedPost Priority (EMS): 8-15일\n• SpeedPost Express: 4-8일\n\n성수기에는 지연이 발생할 수 있습니다.","faqQ7":"내 상품이 보낸 사람에게 반송되고 있습니다. 어떻게 해야 합니까?","faqA7":"재배송은 허용됩니다. 유효하지 않은 주소, 청구되지 않은 소포 또는 미납된 관세 수수료에 대해서는 취소가 불가능합니다. 재배송을 위해 우편 서비스에 문의하거나 지원을 위해 메시지를 보내주십시오.","faqQ8":"내 상품이 운송 중 분실/도난당했습니다.","faqA8":"재배송을 1회 허용합니다. 다시 분실된 경우 택배사의 배송 기간 후 전액 환불됩니다.\n\n• 싱가포르 로컬 서비스: 7일\n• SingPost ePAC 및 SpeedPost Priority International: 30일\n• SpeedPost Intl Express: 14일","blogTitle":"배송 및 우편 지식 베이스","blogSubtitle":"우편 서비스, 관세, VAT 및 관세에 대한 공식 설명.","readMore":"더 읽기","backButton":"뒤로","blogPost1Title":"SingPost ePAC이란?","blogPost1Desc":"SingPost ePAC (ePacket)에 대해 알아보세요. 경제적인 추적 우편 서비스입니다.","blogPost2Title":"SpeedPost Priority International (EMS)이란?","blogPost2Desc":"EMS, 국제 프리미엄 우편 특급 서비스를 알아보세요.","blogPost3Title":"SpeedPost Express란?","blogPost3Desc":"DHL Express 배송이 포함된 SpeedPost Express를 탐색하세요.","blogPost4Title":"USA PDDP","blogPost4Desc":"미국 PDDP 이해하기.","blogPost5Title":"EU VAT & IOSS","blogPost5Desc":"EU VAT 및 IOSS 시스템에 대한 통찰력.","blogPost6Title":"UK VAT & HMRC","blogPost6Desc":"영국 VAT 요구사항.","blogPost7Title":"노르웨이 VOEC","blogPost7Desc":"노르웨이 VOEC 시스템.","blogPost8Title":"스위스 VAT","blogPost8Desc":"스위스 VAT 요구사항.","enterDestinationPostcode":"목적지 우편번호 입력","trackingCaseSensitive":"추적 문자는 대소문자를 구분하므로 대문자여야 합니다.","usaPostcodeNote":"홍콩 및 마카오와 같이 우편번호가 없는 국가의 경우 999077(홍콩) 또는 999078(마카오)을 입력하십시오.","epacDeliveryNote":"목적지로 발송되는 모든 ePAC 품목은 우편함, 현관, 택배 보관함으로 배달되거나 안전한 장소에 두어야 합니다!","currentTime":"현재 시간","timezoneNote":"시간은 12시간 형식으로 표시됩니다","sameTimeAsSingapore":"싱가포르와 같은 시간","hourAhead":"시간 싱가포르보다 앞서 있습니다","hoursAhead":"시간 싱가포르보다 앞서 있습니다","hourBehind":"시간 싱가포르보다 뒤처져 있습니다","hoursBehind":"시간 싱가포르보다 뒤처져 있습니다","collectAtPostOffice":"그러나 해당 국가에 우편함이 표준으로 제공되지 않는 경우 우체국에서 수령해야 합니다.","countriesNoMailbox":"우편함/편지함 배달이 불가능한 것으로 알려진 국가: 브루나이, 중국, 인도, 이스라엘, 마카오 SAR 중국, 필리핀, 폴란드 및 베트남.","rhythmNexusNotResponsible":"Rhythm Nexus는 배송 처리에 대해 책임을 지지 않으며 이는 당사의 통제 범위를 벗어나므로 귀하가 상품 상태를 추적하는 것을 정중히 선호합니다.","issuesAfterDelivery":"30/45일(SpeedPost Express의 경우 14일) 후 배송 문제 또는 상태가 배송 완료로 표시되지만 받지 못한 경우 당사에 문의하십시오.","cannotUseEmbed":"대부분의 우편 서비스 웹사이트에서 지원하지 않으므로 추적에 임베드를 사용할 수 없습니다.","clickLinkAbove":"소포를 추적하려면 위의 링크를 클릭하십시오.","trackingDetailsNote":"검색 결과에 추적 세부 정보가 나타나지 않을 수 있으므로 추적 번호를 시스템에 붙여넣어 항목을 추적하는 것이 좋습니다.","thirdPartyWebsites":"다음 타사 웹사이트에서도 소포를 추적할 수 있습니다.","enterEmailOrPhone":"이메일 또는 전화번호 입력","reviewShippingRates":"현재 배송비 검토","here":"여기","contactUsForm":"다음을 통해 문의하십시오","form":"양식","forEnquiries":"주문에 대한 모든 문의 사항.","anPostNoDirectTracking":"An Post(아일랜드)는 직접 추적 링크 또는 내장 추적을 지원하지 않습니다.","anPostPasteManually":"An Post 웹사이트에 추적 번호를 수동으로 복사하여 붙여넣으십시오:","goToAnPost":"An Post로 이동","countryMsgNL":"상태가 'Held by Customs'로 표시되는 경우 네덜란드 세관 정보 라인에 문의하십시오:\n0800 0143(무료), 월-금 오전 7시-오후 11시.\n토-일 오전 8시-오후 4시 30분.\n\n소포의 즉각적인 푸시 알림을 받으려면 PostNL에 계정을 등록하는 것이 좋습니다:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nPostNL 포인트로 배달되거나 상태에서 우체국에서 수령하라고 알려주는 경우 카운터에서 7 EUR를 지불해야 합니다. 온라인으로 지불하는 경우 최대 4 EUR.","countryMsgDE":"소포의 추적 상태에 대한 푸시 알림을 받으려면 Post & DHL 앱을 다운로드하는 것이 좋습니다:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH 고객 서비스 연락처:\n+49-228-433-3112\nDHL DE 연락처: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"세관에 추가 수입 신고서를 제출해야 합니다. 그렇지 않으면 입국 제한 및 소포 반품으로 이어질 수 있습니다. \n자세한 정보: https://www.posti.fi/en/receiving/customs-clearance \n기타 링크: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"처리 수수료 4.95 EUR가 부과됩니다.\n여기에서 앱을 다운로드하십시오: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"처리 수수료 8.50 PLN이 부과됩니다. \n소포가 문이나 우편함으로 배달될 가능성이 낮으므로\n우체국에서 수령할 때 이를 지불해야 합니다.","countryMsgPH":"필리핀의 PHLPost는 비효율적이고 신뢰할 수 없는 것으로 간주됩니다.\n소형 소포의 경우 '배송 중' 상태가\n때때로 1-3주 동안만 표시되므로\n항상 소포를 추적하십시오. 대형 소포의 경우\n마닐라 중앙 우체국 또는\n해당 지역의 가장 가까운 우체국에서만 수령할 수 있습니다. 모든 가치의 소포에 대해 112 PHP의 처리 수수료가 부과되며 이를 지불해야 합니다. 지불하지 않으면 소포가\n저희에게 반송됩니다. PHLPost의 느린 서비스로 인해 배송에 1-2개월이 소요될 것으로 예상됩니다. \n10000 PHP 미만의 품목에 대해서는 세금을 납부할 필요가 없지만 가치가 해당 금액과 같거나 초과하는 경우 그렇게 해야 합니다. \n다음에 저희에게 주문할 때 더 빠른 프로세스를 위해 SpeedPost Express를 권장합니다. 그러나 수령인에 대한 D&T가 기본이므로 수수료가 적용되지 않을 수 있습니다.","countryMsgCA":"캐나다로 발송되는 모든 주문의 de minimis는 20 CAD입니다. 싱가포르가 CPTPP 협정의 일부이기 때문에 관세가 적용되지 않을 수 있지만 품목이 60 CAD 이상 또는 100 CAD 이상의 임계값을 초과하는 경우 D&T가 적용될 수 있으며 이는 품목의 HS 코드에 따라 달라질 수 있습니다. 해당 금액을 초과하는 모든 가치는 그에 따라 VAT가 부과됩니다.","countryMsgID":"인도네시아 도착 시 해당 세금 및 관세를 지불해야 합니다. 소포를 추적하고 인도네시아 세관에 지정된 금액을 지불하십시오.\n추가 세관 문서를 제출해야 합니다. 그렇지 않으면 입국 제한 또는 국가 세관에 의한 소포 압류로 이어질 수 있습니다. 여기에서 자세한 내용을 확인하십시오:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"인도 도착 시 해당 세금 및 관세를 지불해야 합니다. 소포를 추적하고 인도 세관에 지정된 금액을 지불하십시오.\n인도의 세관 통관은 엄격하며 품목의 가치가 1000 INR(15 USD)을 초과하는 경우 관세가 부과될 수 있거나 부과되지 않을 수 있습니다 - HS 코드에 따라 대부분의 경우 면세이지만 품목이 5000 INR(60 USD)을 초과하는 경우 더 높은 관세가 부과될 수 있습니다. \nIndia Post는 기본적으로 우편함으로 배달하지 않으므로 소포를 받거나 우체국에서 수령하려면 집에 있거나 권한이 있는 대리인이 필요할 수 있습니다.","countryMsgMY":"말레이시아로 발송되는 모든 주문의 de minimis는 500 MYR입니다. 해당 금액을 초과하는 주문은 요금이 부과될 수 있습니다.","countryMsgUS":"2025년 8월 29일부터 USD800의 de minimis가 공식적으로 제거되고 수입 관세는 기본적으로 원산지 국가의 발송인이 지불합니다.\n미국 배송에는 소포가 추가 지연을 피하기 위해 유효한 전화번호와 이메일 주소가 필요합니다.","countryMsgIL":"이스라엘로의 모든 배송에 대한 de minimis는 240 ILS(75 USD)입니다. 해당 금액을 초과하는 주문은 요금이 부과될 수 있습니다. \n이스라엘로 발송된 주문의 경우 Israel Post가 배송 후 최종 배송을 확인하지 않을 수 있습니다. \nIsrael Post는 기본적으로 우편함으로 배달하지 않으므로 소포를 받거나 우체국에서 수령하려면 집에 있거나 권한이 있는 대리인이 필요할 수 있습니다.","countryMsgGB":"영국으로 발송된 주문의 경우 Royal Mail이 우편함으로 배송 후 최종 배송을 확인하지 않을 수 있습니다.","countryMsgTH":"태국으로의 모든 배송에 대한 de minimis는 1500 THB(45 USD)입니다. 해당 금액을 초과하는 주문은 요금이 부과될 수 있습니다.","countryMsgTW":"대만으로의 모든 배송에 대한 de minimis는 2000 TWD(60 USD)입니다. 해당 금액을 초과하는 주문은 요금이 부과될 수 있습니다.","countryMsgMO":"마카오로 발송할 때 D&T가 부과되지 않습니다. 그러나 Macau Post는 기본적으로 우편함으로 배달하지 않으므로 우체국에서 소포를 수령해야 합니다.","countryMsgBN":"브루나이로 발송할 때 D&T가 부과되지 않습니다. 그러나 Brunei Post는 기본적으로 우편함으로 배달하지 않으므로 우체국에서 소포를 수령해야 합니다. \n이 국가의 추적 시스템은 그다지 안정적이지 않으며 제한된 정보만 제공할 수 있으며 최종 배송 결과는 원산지에 제공되지 않습니다.","countryMsgJP":"일본으로의 모든 배송에 대한 de minimis는 10000 JPY(65 USD)입니다. 해당 금액을 초과하는 주문은 요금이 부과될 수 있습니다.","countryMsgKR":"한국으로의 모든 배송에 대한 de minimis는 180000 KRW(150 USD)입니다. 해당 금액을 초과하는 주문은 요금이 부과될 수 있습니다.","countryMsgVN":"베트남의 경우 품목 배송 시 처리 수수료가 부과될 수 있으므로 배송 중에 연락 가능한 상태로 유지하십시오. \n베트남으로의 모든 배송에 대한 de minimis는 1000000(35 USD)입니다. 해당 금액을 초과하는 주문은 요금이 부과될 수 있습니다. \nVietnam Post는 기본적으로 우편함으로 배달하지 않으므로 소포를 받거나 우체국에서 수령하려면 집에 있거나 권한이 있는 대리인이 필요할 수 있습니다.","countryMsgPP":"Tracked Label 품목은 우체국의 POPDrop/POPStop에서 게시됩니다. SpeedPost Standard 품목은 일반적으로 POPStop 또는 POPStation에서 게시됩니다.\nTracked Label 품목의 배송은 월-금 오전 9시-오후 6시에만 가능합니다. 주말 및 공휴일 제외.","trackingNumberExample":"예: LG123456789SG","copyrightAllRights":"모든 권리 보유.","statusInPreparation":"준비 중","statusInTransit":"배송 중","statusDelivered":"배송 완료","statusOutForDelivery":"배송 출발","statusArrived":"도착","statusProcessing":"처리 중","statusDispatched":"발송됨","statusReturned":"반송됨","statusFailed":"배송 실패","statusCancelled":"취소됨","statusHeldByCustoms":"세관 보류","statusAwaitingCollection":"수령 대기","aka":"일명","thisServiceKnownAs":"이 서비스는 다음과 같이 알려져 있습니다","in":"에서","viewTrackingDHL":"DHL Express에서 추적 정보 보기","viewTrackingSingPostSpeedPost":"Singapore SpeedPost에서 추적 정보 보기","viewTrackingDHLLastMile":"DHL Express(라스트 마일)에서 추적 정보 보기","viewTrackingDHLShipperRef":"DHL Express(발송인 참조)에서 추적 정보 보기","viewTrackingSingPost":"Singapore Post에서 추적 정보 보기","viewTrackingDestPost":"다음에서 추적 정보 보기:","post":"우편","orderNumberExample":"주문 번호 (RTNX로 시작 - 예: RTNX1234567890):","deliveryRecordNote":"배달이 완료되면 기록은 7일 동안만 저장되고 삭제됩니다.","accessRestricted":"접근 제한됨","vpnDetectedMessage":"VPN 사용이 감지되었습니다. 이 서비스를 이용하려면 VPN을 비활성화하세요.","contactSupportError":"오류라고 생각되시면 지원팀에 문의하세요.","destinationNotAllowed":"귀하의 위치에서는 이 목적지 국가에 접근할 수 없습니다. 다른 목적지를 선택하세요.","epacUS":"퍼스트 클래스 국제 소포 서비스","epacCH":"프라이어리티 플러스","epacGB":"국제 추적","epacMY":"국제 추적/익스프레스","epacCA":"국제 인바운드 익스프레스","epacAU":"포장 및 추적 국제","epacNZ":"국제 이코노미 추적","epacDE":"Warenpost 국제 프리미엄","epacFR":"추적이 가능한 국제 서신","epacNL":"국제 패킷 추적","epacPL":"글로벌 익스프레스","epacBE":"인터내셔널 프라임 인바운드","epacAT":"국제 추적 소포","epacIN":"국제 추적 소포","epacFI":"국제 추적 서신","epacSE":"국제 추적 서신","epacNO":"프라임 익스프레스","epacIT":"표현하다","epacIL":"표현하다","epacES":"국제 라이트 패키지","epacPT":"국제 블루 메일","epacCZ":"해외에서 추적된 배송","epacBN":"국제 ePacket","epacCN":"국제 ePacket","epacHK":"국제 ePacket","epacID":"국제 e-패키지","epacMO":"국제 ePacket","epacPH":"국제 추적 우편","epacTW":"국제 ePacket","epacTH":"국제 ePacket","epacVN":"국제 E-패키지 (ASEAN 패키지)","epacKR":"K-패킷","epacJP":"국제 e-패키지 라이트","epacIE":"국제 특급 우편","dhlNoEmbed":"DHL Express는 임베드를 통한 추적을 지원하지 않습니다.","speedPostNoEmbed":"SpeedPost 싱가포르는 임베드를 통한 추적을 지원하지 않습니다.","operatorNoEmbed":"는 임베드를 통한 추적을 지원하지 않습니다.","clickHere":"여기를 클릭하세요","toTrackNewTab":"추적하려면 (새 탭에서 열림).","optionSingPost":"🇸🇬 싱포스트(SPNDD/PP)","countryAF":"🇦🇫 아프가니스탄","countryAX":"🇦🇽 올란드 제도","countryAL":"🇦🇱 알바니아","countryDZ":"🇩🇿 알제리","countryAS":"🇦🇸 아메리칸 사모아","countryAD":"🇦🇩 안도라","countryAO":"🇦🇴 앙골라","countryAI":"🇦🇮 앵귈라","countryAQ":"🇦🇶 남극","countryAG":"🇦🇬 앤티가 바부다","countryAR":"🇦🇷 아르헨티나","countryAM":"🇦🇲 아르메니아","countryAW":"🇦🇼 아루바","countryAU":"🇦🇺 호주","countryAT":"🇦🇹 오스트리아","countryAZ":"🇦🇿 아제르바이잔","countryBS":"🇧🇸 바하마","countryBH":"🇧🇭 바레인","countryBD":"🇧🇩 방글라데시","countryBB":"🇧🇧 바베이도스","countryBY":"🇧🇾 벨라루스","countryBE":"🇧🇪 벨기에","countryBZ":"🇧🇿 벨리즈","countryBJ":"🇧🇯 베냉","countryBM":"🇧🇲 버뮤다","countryBT":"🇧🇹 부탄","countryBO":"🇧🇴 볼리비아","countryBA":"🇧🇦 보스니아 헤르체고비나","countryBW":"🇧🇼 보츠와나","countryBV":"🇧🇻 부베섬","countryBR":"🇧🇷 브라질","countryIO":"🇮🇴 영국령 인도양 지역","countryBN":"🇧🇳 브루나이","countryBG":"🇧🇬 불가리아","countryBF":"🇧🇫 부르키나파소","countryBI":"🇧🇮 부룬디","countryKH":"🇰🇭 캄보디아","countryCM":"🇨🇲 카메룬","countryCA":"🇨🇦 캐나다","countryCV":"🇨🇻 카보베르데","countryKY":"🇰🇾 케이맨 제도","countryCF":"🇨🇫 중앙아프리카 공화국","countryTD":"🇹🇩 차드","countryCL":"🇨🇱 칠레","countryCN":"🇨🇳 중국","countryCX":"🇨🇽 크리스마스섬","countryCC":"🇨🇨 코코스(킬링) 제도","countryCO":"🇨🇴 콜롬비아","countryKM":"🇰🇲 코모로","countryCG":"🇨🇬 콩고 공화국","countryCD":"🇨🇩 콩고 민주 공화국","countryCK":"🇨🇰 쿡 제도","countryCR":"🇨🇷 코스타리카","countryCI":"🇨🇮 코트디부아르","countryHR":"🇭🇷 크로아티아","countryCU":"🇨🇺 쿠바","countryCY":"🇨🇾 키프로스","countryCZ":"🇨🇿 체코","countryDK":"🇩🇰 덴마크","countryDJ":"🇩🇯 지부티","countryDM":"🇩🇲 도미니카 연방","countryDO":"🇩🇴 도미니카 공화국","countryEC":"🇪🇨 에콰도르","countryEG":"🇪🇬 이집트","countrySV":"🇸🇻 엘살바도르","countryGQ":"🇬🇶 적도 기니","countryER":"🇪🇷 에리트레아","countryEE":"🇪🇪 에스토니아","countryET":"🇪🇹 에티오피아","countryFK":"🇫🇰 포클랜드 제도","countryFO":"🇫🇴 페로 제도","countryFJ":"🇫🇯 피지","countryFI":"🇫🇮 핀란드","countryFR":"🇫🇷 프랑스","countryGF":"🇬🇫 프랑스령 기아나","countryPF":"🇵🇫 프랑스령 폴리네시아","countryTF":"🇹🇫 프랑스 남부 지방","countryGA":"🇬🇦 가봉","countryGM":"🇬🇲 감비아","countryGE":"🇬🇪 조지아","countryDE":"🇩🇪 독일","countryGH":"🇬🇭 가나","countryGI":"🇬🇮 지브롤터","countryGR":"🇬🇷 그리스","countryGL":"🇬🇱 그린란드","countryGD":"🇬🇩 그레나다","countryGP":"🇬🇵 과들루프","countryGU":"🇬🇺 괌","countryGT":"🇬🇹 과테말라","countryGG":"🇬🇬 건지","countryGN":"🇬🇳 기니","countryGW":"🇬🇼 기니비사우","countryGY":"🇬🇾 가이아나","countryHT":"🇭🇹 아이티","countryHM":"🇭🇲 허드 맥도널드 제도","countryVA":"🇻🇦 바티칸 시국","countryHN":"🇭🇳 온두라스","countryHK":"🇭🇰 홍콩 SAR 중국","countryHU":"🇭🇺 헝가리","countryIS":"🇮🇸 아이슬란드","countryIN":"🇮🇳 인도","countryID":"🇮🇩 인도네시아","countryIR":"🇮🇷 이란","countryIQ":"🇮🇶 이라크","countryIE":"🇮🇪 아일랜드","countryIM":"🇮🇲 맨섬","countryIL":"🇮🇱 이스라엘","countryIT":"🇮🇹 이탈리아","countryJM":"🇯🇲 자메이카","countryJP":"🇯🇵 일본","countryJE":"🇯🇪 저지","countryJO":"🇯🇴 요르단","countryKZ":"🇰🇿 카자흐스탄","countryKE":"🇰🇪 케냐","countryKI":"🇰🇮 키리바시","countryKP":"🇰🇵 북한","countryKR":"🇰🇷 대한민국","countryKW":"🇰🇼 쿠웨이트","countryKG":"🇰🇬 키르기스스탄","countryLA":"🇱🇦 라오스","countryLV":"🇱🇻 라트비아","countryLB":"🇱🇧 레바논","countryLS":"🇱🇸 레소토","countryLR":"🇱🇷 라이베리아","countryLY":"🇱🇾 리비아","countryLI":"🇱🇮 리히텐슈타인","countryLT":"🇱🇹 리투아니아","countryLU":"🇱🇺 룩셈부르크","countryMO":"🇲🇴 마카오 SAR 중국","countryMK":"🇲🇰 북마케도니아","countryMG":"🇲🇬 마다가스카르","countryMW":"🇲🇼 말라위","countryMY":"🇲🇾 말레이시아","countryMV":"🇲🇻 몰디브","countryML":"🇲🇱 말리","countryMT":"🇲🇹 몰타","countryMH":"🇲🇭 마셜 제도","countryMQ":"🇲🇶 마르티니크","countryMR":"🇲🇷 모리타니","countryMU":"🇲🇺 모리셔스","countryYT":"🇾🇹 마요트","countryMX":"🇲🇽 멕시코","countryFM":"🇫🇲 미크로네시아","countryMD":"🇲🇩 몰도바","countryMC":"🇲🇨 모나코","countryMN":"🇲🇳 몽골","countryME":"🇲🇪 몬테네그로","countryMS":"🇲🇸 몬트세랫","countryMA":"🇲🇦 모로코","countryMZ":"🇲🇿 모잠비크","countryMM":"🇲🇲 미얀마","countryNA":"🇳🇦 나미비아","countryNR":"🇳🇷 나우루","countryNP":"🇳🇵 네팔","countryNL":"🇳🇱 네덜란드","countryNC":"🇳🇨 뉴칼레도니아","countryNZ":"🇳🇿 뉴질랜드","countryNI":"🇳🇮 니카라과","countryNE":"🇳🇪 니제르","countryNG":"🇳🇬 나이지리아","countryNU":"🇳🇺 니우에","countryNF":"🇳🇫 노퍽섬","countryMP":"🇲🇵 북마리아나 제도","countryNO":"🇳🇴 노르웨이","countryOM":"🇴🇲 오만","countryPK":"🇵🇰 파키스탄","countryPW":"🇵🇼 팔라우","countryPS":"🇵🇸 팔레스타인","countryPA":"🇵🇦 파나마","countryPG":"🇵🇬 파푸아뉴기니","countryPY":"🇵🇾 파라과이","countryPE":"🇵🇪 페루","countryPH":"🇵🇭 필리핀","countryPN":"🇵🇳 핏케언 제도","countryPL":"🇵🇱 폴란드","countryPT":"🇵🇹 포르투갈","countryPR":"🇵🇷 푸에르토리코","countryQA":"🇶🇦 카타르","countryRE":"🇷🇪 레위니옹","countryRO":"🇷🇴 루마니아","countryRU":"🇷🇺 러시아","countryRW":"🇷🇼 르완다","countryBL":"🇧🇱 생바르텔레미","countrySH":"🇸🇭 세인트헬레나","countryKN":"🇰🇳 세인트키츠 네비스","countryLC":"🇱🇨 세인트루시아","countryMF":"🇲🇫 생마르탱","countryPM":"🇵🇲 생피에르 미클롱","countryVC":"🇻🇨 세인트빈센트 그레나딘","countryWS":"🇼🇸 사모아","countrySM":"🇸🇲 산마리노","countryST":"🇸🇹 상투메 프린시페","countrySA":"🇸🇦 사우디아라비아","countrySN":"🇸🇳 세네갈","countryRS":"🇷🇸 세르비아","countrySC":"🇸🇨 세이셸","countrySL":"🇸🇱 시에라리온","countrySG":"🇸🇬 싱가포르","countrySK":"🇸🇰 슬로바키아","countrySI":"🇸🇮 슬로베니아","countrySB":"🇸🇧 솔로몬 제도","countrySO":"🇸🇴 소말리아","countryZA":"🇿🇦 남아프리카 공화국","countryGS":"🇬🇸 사우스조지아 사우스샌드위치 제도","countryES":"🇪🇸 스페인","countryLK":"🇱🇰 스리랑카","countrySD":"🇸🇩 수단","countrySR":"🇸🇷 수리남","countrySJ":"🇸🇯 스발바르 얀마옌","countrySZ":"🇸🇿 에스와티니","countrySE":"🇸🇪 스웨덴","countryCH":"🇨🇭 스위스","countrySY":"🇸🇾 시리아","countryTW":"🇹🇼 대만","countryTJ":"🇹🇯 타지키스탄","countryTZ":"🇹🇿 탄자니아","countryTH":"🇹🇭 태국","countryTL":"🇹🇱 동티모르","countryTG":"🇹🇬 토고","countryTK":"🇹🇰 토켈라우","countryTO":"🇹🇴 통가","countryTT":"🇹🇹 트리니다드 토바고","countryTN":"🇹🇳 튀니지","countryTR":"🇹🇷 튀르키예","countryTM":"🇹🇲 투르크메니스탄","countryTC":"🇹🇨 터크스 케이커스 제도","countryTV":"🇹🇻 투발루","countryUG":"🇺🇬 우간다","countryUA":"🇺🇦 우크라이나","countryAE":"🇦🇪 아랍에미리트","countryGB":"🇬🇧 영국","countryUS":"🇺🇸 미국","countryUM":"🇺🇲 미국령 군소 제도","countryUY":"🇺🇾 우루과이","countryUZ":"🇺🇿 우즈베키스탄","countryVU":"🇻🇺 바누아투","countryVE":"🇻🇪 베네수엘라","countryVN":"🇻🇳 베트남","countryVG":"🇻🇬 영국령 버진아일랜드","countryVI":"🇻🇮 미국령 버진아일랜드","countryWF":"🇼🇫 왈리스 푸투나","countryEH":"🇪🇭 서사하라","countryYE":"🇾🇪 예멘","countryZM":"🇿🇲 잠비아","countryZW":"🇿🇼 짐바브웨","russiaServiceSuspended":"⚠️ 중요 공지: 2022년 러시아의 우크라이나 침공에 따라 SingPost는 DHL과 함께 러시아로의 모든 배송을 중단했습니다. 해당 국가로의 서비스 재개가 발표될 때까지 현재 러시아 서비스를 제공하지 않습니다.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! 귀하와 귀하의 가족에게 평화와 기쁨과 축복이 있기를 바랍니다! 🌟","deepavaliMessage":"🪔 해피 디파발리! 빛의 축제가 당신에게 기쁨, 번영, 성공을 가져다주기를 바랍니다! ✨","diwaliMessage":"🪔 해피 디왈리! 빛의 축제가 당신에게 기쁨, 번영, 성공을 가져다주기를 바랍니다! ✨","vesakMessage":"☸️ 행복한 베삭데이! 이 신성한 날에 여러분에게 평화와 지혜, 깨달음을 기원합니다! 🙏","vesakTHMessage":"☸️ 행복한 비사카 부차 데이! 이 신성한 날에 여러분에게 평화와 지혜, 깨달음을 기원합니다! 🙏","australiaNationalDayMessage":"🇦🇺 행복한 호주의 날! 우리 민족을 축하합니다! 🎉","canadaNationalDayMessage":"🇨🇦 행복한 캐나다 데이! 우리의 위대한 조국을 축하합니다! 🍁","usaNationalDayMessage":"🇺🇸 미국 독립기념일을 축하합니다! 자유와 해방을 축하합니다! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! 프랑스 만세! 🎊","germanyUnityDayMessage":"🇩🇪 독일 통일의 날을 축하합니다! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 부오나 페스타 델라 레푸블리카! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 일본의 창립기념일을 축하합니다! 建國記念の日 あめととуございまс！🎌","chinaNationalDayMessage":"🇨🇳 중국 국경일을 축하합니다! 國庆节快乐！🎉","koreaLiberationDayMessage":"``대한민국 광복절을 축하합니다! 광복절을 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 인도의 독립기념일을 축하합니다! 자이 하인드! 🇮🇳","thailandNationalDayMessage":"🇹🇭 태국의 국경일을 축하합니다! 정말 멋지네요! 🎉","philippinesIndependenceDayMessage":"🇵🇭 필리핀 독립기념일을 축하합니다! 마부하이! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 베트남 국경일을 축하합니다! Quốc khánh Viet Nam! 🎊","polandNationalDayMessage":"🇵🇱 폴란드 독립기념일을 축하합니다! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 체코 독립기념일을 축하합니다! 정말 조심하세요! 🎊","netherlandsKingsDayMessage":"🇳🇱 피네 코닝스다그! 왕 만세! ✌","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 다행 Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 펠리스 디아 드 포르투갈! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 정말 멋지네요! 이스라엘, 독립기념일을 축하합니다! 🎉","irelandNationalDayMessage":"🇮🇪 아일랜드, 성 패트릭의 날을 축하합니다! Lá Fhéile Pádraig sona duit! ☺","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan 브루나이! 🎊","newZealandWaitangiDayMessage":"🇳🇿 뉴질랜드, 와이탕이의 날을 축하합니다! 🎉","switzerlandNationalDayMessage":"🇨🇭 행복한 스위스 국경일! 스위스 국민축제! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, 벨기에! Fijne Nationale Feestdag! 🎊","fillAllFields":"추적 번호, 도착 국가, 주문 번호, 우편번호 등 필수 필드를 모두 입력하세요.","noOrderMatchingFields":"모든 필드와 일치하는 주문을 찾을 수 없습니다.","postcodeRequired":"이 목적지에는 우편번호가 필요합니다.","invalidUSZip":"미국 우편번호가 잘못되었습니다. 5자리 숫자 또는 ZIP+4를 사용하세요.","failedGenerateURL":"추적 URL 생성에 실패했습니다. 입력을 확인해주세요.","trackingValidationSG":"싱가포르의 추적 번호는 LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG 또는 PX123456789SG여야 합니다. DHL 배송의 경우 10자리 숫자를 사용하세요.","invalidSingPostFormat":"SingPost 추적 번호 형식이 잘못되었습니다.\n허용되는 형식:\n• PP123456789SG → 선불 추적 라벨\n• SPNDD00012345 → SpeedPost 표준 추적","australianDSTTitle":"호주 일광 절약 시간제 활성화","australianDSTBothMessage":"현재 AEDT(호주 동부 일광 절약 시간)와 ACDT(호주 중부 일광 절약 시간)가 모두 적용됩니다.","australianAEDTMessage":"현재 시드니, 멜버른 및 주변 지역에는 AEDT(호주 동부 일광 절약 시간)가 시행되고 있습니다.","australianACDTMessage":"ACDT(호주 중부 일광절약시간)는 현재 애들레이드와 남호주에 적용됩니다.","australianDSTNote":"위에 표시된 배송 시간은 현재 일광 절약 시간을 반영합니다.","filteredAllowedDestinations":"(허용된 목적지로 필터링됨)","loadingAnnouncements":"공지사항 로드 중...","unableToLoadAnnouncements":"지금은 서비스 공지를 로드할 수 없습니다.","viewOnSingPostWebsite":"SingPost 웹사이트에서 보기 →","postedDate":"게시 날짜:","status":"상태:","shippedVia":"배송 방법:","destination":"목적지:","statusHeldByCustms":"세관에서 보관","blogSingPostEPACContent1":"SingPost ePAC(ePacket)은 경량 국제 전자 상거래 발송물을 위한 경제적인 추적 우편 서비스입니다.","blogSingPostEPACContent2":"도착 국가의 국내 우편 사업자를 통해 배송되며 일반적으로 2kg 미만의 소포에 사용되며, 길이 + 너비 + 높이의 한도는 90cm 미만, 길이는 60cm를 초과하지 않습니다.","blogSingPostEPACContent3":"이 옵션은 처음에는 eBay China와 함께 Hong Kong Post에서만 제공되었으며, 중국과 홍콩의 패키지가 배송 시 서명이 필요 없이 배송 추적을 통해 미국으로 작은 패킷을 보낼 수 있도록 허용했습니다. 이 서비스는 미국 내 USPS(미국 우편 서비스) 일류 패키지 국제 서비스로 알려져 있습니다.","blogSingPostEPACContent4":"2026년 1월 1일부터 ePAC는 모든 국가에서 소포 및 등록 품목 추적을 문서로만 제한하도록 요구하는 필수 UPU 규정을 준수하는 데 사용됩니다.","blogSingPostEPACContent5":"추적 접두사: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS는 전 세계 우편 사업자가 우선적으로 사용하는 국제 프리미엄 우편 특급 서비스입니다.","blogSpeedPostEMSContent2":"통관은 일반적으로 일반 우편보다 빠르지만 배송까지 전체 추적이 가능하므로 절차가 더 엄격합니다.","blogSpeedPostEMSContent3":"싱가포르에서는 SingPost의 SpeedPost Priority International로 알려져 있습니다.","blogSpeedPostEMSContent4":"추적 접두사: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express는 택배급 서비스입니다.","blogSpeedPostExpressContent2":"많은 목적지에서 DHL Express는 라스트 마일 배송을 수행하고 출고 전에 관세나 세금을 징수합니다.","blogSpeedPostExpressContent3":"추적 번호: PX123456789SG(라스트 마일 DHL Express는 일반에게 공개되지 않는 10자리 추적 번호를 사용하지만 이에 대한 정보는 당사를 통해 제공됩니다.","blogSpeedPostExpressContent3Link":"추적 시스템.","blogUSPDDPContent1":"PDDP를 사용하면 배송 전에 미국 수입 관세 및 세금을 선불로 지불할 수 있어 수령인이 예상치 못한 비용을 줄일 수 있습니다.","blogUSPDDPContent2":"새로운 규정(2025년 8월 29일 발효)","blogUSPDDPContent2List1":"필수 HTS 코드","blogUSPDDPContent2List2":"정확한 품목 설명","blogUSPDDPContent2List3":"더욱 엄격한 관세 집행","blogUSPDDPContent3":"미국으로 발송되는 모든 품목에는 당사가 귀하를 대신하여 지불하므로 수취인에게 추가 관세가 부과되지 않습니다. 그러나 품목 가격은 규정에 따라 기본적으로 10% 수입 수수료로 설정되어 있습니다.","blogUSPDDPContent4":"이는 미국, SpeedPost Priority International(EMS) 및 SingPost ePAC의 배송 방법에만 적용됩니다.","blogEUIOSSContent1":"EU는 가치에 관계없이 모든 상업용 수입품에 VAT를 적용합니다.","blogEUIOSSContent2":"IOSS(수입원스톱샵)","blogEUIOSSContent3":"IOSS를 통해 판매자는 최대 €150의 배송물에 대해 결제 시 EU VAT를 징수할 수 있습니다.","blogEUIOSSContent4":"그런 다음 VAT가 IOSS 시스템을 통해 송금되므로 통관이 더 빨라지고 배송 시 VAT 징수가 필요하지 않습니다.","blogEUIOSSContent5":"Etsy 또는 eBay를 통한 모든 주문의 경우 IOSS VAT는 결제 시 이미 징수되며 세금 참조 번호에 이를 표시하여 EDI(Electronic Data Intercharge)를 통해 대상 우편 서비스로 데이터를 전송합니다.","blogUKVATContent1":"영국은 수입품에 대해 VAT를 부과하도록 요구합니다.","blogUKVATContent2":"저가 화물의 경우 일반적으로 VAT는 결제 시 징수되어 판매자나 마켓플레이스에서 HMRC로 직접 송금됩니다.","blogUKVATContent3":"고가의 배송품의 경우 배송 전에 배송업체에서 VAT를 징수할 수 있습니다.","blogUKVATContent4":"Etsy 또는 eBay를 통한 모든 주문의 경우 VAT는 결제 시 이미 징수되며 세금 참조 번호에 이를 표시하여 EDI(Electronic Data Intercharge)를 통해 데이터를 대상 우편 서비스로 전송합니다.","blogNorwayVOECContent1":"노르웨이는 EU/EEA 외부에서 수입되는 상품에 대해 VOEC(전자상거래에 대한 VAT) 시스템을 도입했습니다. 이는 최대 NOK 3,000 상당의 상품에 적용됩니다.","blogNorwayVOECContent2":"판매자는 VOEC 제도에 등록하여 결제 시 노르웨이 VAT를 징수할 수 있으므로 통관이 더 빨라지고 배송 시 VAT가 징수되지 않습니다.","blogNorwayVOECContent3":"Etsy 또는 eBay를 통한 모든 주문의 경우 결제 시 VOEC VAT가 이미 징수됩니다. 추적 및 세관 서류에는 노르웨이 우편 서비스로 데이터를 전송하기 위한 세금 참조 번호가 표시됩니다.","blogSwissVATContent1":"스위스는 가치에 관계없이 수입품에 VAT를 부과합니다. 스위스 연방 관세청에서는 외국 셀러에게 최대 CHF 65까지 상품 결제 시 VAT를 징수하도록 규정하고 있습니다.","blogSwissVATContent2":"스위스 VAT 시스템에 등록된 셀러는 징수된 VAT를 직접 송금하므로 배송 시 수취인에게 추가 VAT 요금이 부과되지 않습니다.","postalContactsTitle":"우편 서비스 연락처","postalContactsNote":"참고:","postalContactsPolandUKNote":"폴란드 및 영국의 경우 SpeedPost Priority(EMS)를 통해 발송된 모든 품목은 Pocztex 및 Parcelforce에서 처리됩니다.","postalContactsDHLNote":"SpeedPost Express 배송의 경우 이 링크를 통해 DHL에 문의하십시오:","postalContactsCountry":"국가","postalContactsWebsite":"웹사이트","postalContactsForm":"연락 양식","postalContactsPhone":"연락처 번호","postalContactsEmail":"연락 이메일","postalContactsFormLink":"연락 양식","postalContactsBackButton":"소포 문의 양식으로 돌아가기","blogSwissVATContent3":"Etsy 또는 eBay를 통한 모든 주문의 경우 결제 시 스위스 VAT가 이미 징수되며 세관 서류에는 EDI 제출을 위한 세금 참조 번호가 포함됩니다.","contactUsTitle":"문의하기","contactNameLabel":"이름 (닉네임이나 전화번호 금지)","contactEmailLabel":"이메일 주소 (답변을 보낼 곳)","contactEmailNote":"비공개 릴레이 이메일 (예: @privaterelay.appleid.com)은 허용되지 않습니다. 유효한 이메일 주소를 사용하십시오.","contactEnquiryTypeLabel":"이것은 무엇입니까?","contactSelectOption":"옵션 선택","contactGeneralEnquiry":"일반 문의 / 피드백","contactBusinessEnquiry":"비즈니스 문의","contactOrderShippingEnquiry":"주문/배송 문의","contactExchangeRefundEnquiry":"교환/환불/반품 문의","contactOthers":"기타","contactParcelWarning":"소포가 18/30/45일 이상 배달되지 않았거나 (FedEx는 14일), 배달 완료로 표시되었지만받지 못한 경우","contactParcelWarningLink":"이 양식","contactParcelWarningEnd":"을 작성하십시오.","contactOrderNumberLabel":"주문 번호","contactOrderNumberPlaceholder":"예: RTNX1234567890","contactPlatformNote":"Etsy, eBay 및 Shopee 주문 번호 여기. 이러한 플랫폼의 환불에 대해 당사는 전혀 통제할 수 없습니다. 각 고객 서비스에 문의하십시오.","contactPlatformInstructions":"앱에 저장되어 있으므로 앱을 사용하여 주문 번호를 확인하십시오:","contactPlatformEtsy":"Etsy - 프로필 오른쪽 상단 → 구매","contactPlatformEbay":"eBay - 내 eBay → 구매","contactPlatformShopee":"Shopee - 나 → 구매 기록 보기 (또는 발송 대기/수령 대기 클릭)","contactRefundNote1":"구매한 플랫폼의 반품/환불에 대해 문의하는 경우, 이러한 플랫폼의 환불에 대해 당사는 전혀 통제할 수 없음을 유의하십시오. 각 고객 서비스에 문의하십시오.","contactRefundNote2":"반품 또는 교환의 경우, 개봉 시 이미 사용된 maimai 장갑 (눈에 보이는 얼룩 또는 세탁기/손빨래로 세탁됨)은 허용하지 않으며, 오락 카드의 반품 또는 교환은 허용하지 않습니다. 감사합니다.","contactRefundNote3":"Payhip을 통한 환불의 경우, 환불을 받지 못한 경우 은행 또는 Payhip 지원 (support@payhip.com)에 문의하십시오. 해당 프로세스를 통제할 수 없습니다.","contactMessageLabel":"메시지 (최대 1000자)","contactCharacterCount":"자","contactSpamWarningNote":"참고:","contactSpamWarning":"SEO, 웹 사이트 디자인, 대출 또는 유사한 서비스에 대한 원치 않는 제안은 자동으로 거부됩니다.","contactAgreementText1":"귀하의 이메일 주소가 Rhythm Nexus에서 답변하는 데 사용되는 것에 동의하시면 \"동의함\"을 클릭하십시오. 이는 답변을 읽고 문의에 대한 해결책을 찾으면 답변하는 데 필요합니다.","contactAgreementText2":"답변은 3~5 영업일이 소요되며, 이메일 양이 많을 경우 더 오래 걸릴 수 있습니다.","contactAgreeCheckbox":"동의함","contactSuccessMessage":"메시지가 성공적으로 전송되었습니다! 3~5 영업일 이내에 답변드리겠습니다.","contactErrorMessage":"메시지 전송에 실패했습니다. 다시 시도하십시오.","contactGeneralError":"오류가 발생했습니다. 나중에 다시 시도하십시오.","contactSubmitting":"전송 중...","contactSubmit":"제출","contactAlertAgree":"양식을 제출하려면 약관에 동의하십시오.","parcelEnquiryTitle":"소포 문의","parcelInfoText":"이 양식은 18/30/45일 이상 배달되지 않은 소포 (FedEx/DHL은 14일) 또는 배달 완료로 표시되었지만 받지 못한 소포용입니다.","parcelInfoLink":"여기를 클릭","parcelInfoEnd":"기타 문의사항.","parcelWaitTitle":"소포를 기다려 주십시오","parcelWaitText1":"소포 배달을 기다려 주십시오. 국제 배송은 국내 배송과 다르며 시간이 걸립니다. 감사합니다!","parcelWaitText2":"18일 (싱가포르는 7일) 이상 경과했는데도 상태가 표시되지 않으면 직접 알려주십시오.","parcelCannotSubmit":"\"아니오\"를 선택한 경우 이 양식을 제출할 수 없습니다.","parcelNameLabel":"이름","parcelOrderNumberLabel":"주문 번호 (예: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"이메일 주소 (여기로 답변드리겠습니다)","parcelEmailNote":"비공개 릴레이 이메일은 허용되지 않습니다. 유효한 이메일 주소를 사용하십시오.","parcelShippingMethodLabel":"선택한 배송 방법?","parcelSelectShipping":"배송 방법 선택","parcelSingPostEpac":"SingPost ePacket (또는 ePAC) - SpeedPost Saver International이라고도 함 (추적: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (추적: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (추적: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (추적: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (추적: PX123456789SG)","parcelDHL":"DHL Express (EU 국가만) (추적: 1234567890)","parcelTrackingNumberLabel":"소포의 추적 번호?","parcelUndeliveredLabel":"소포가 18/30/45일 이상 배달되지 않았습니까? (싱가포르 국내 서비스 >7일, SpeedPost Express/DHL >14일)","parcelSelectOption":"옵션 선택","parcelYes":"예","parcelNo":"아니오","parcelDeliveredButMissingLabel":"소포가 배달 완료로 표시되었지만 우편함/안전한 장소/현관문에 없습니까?","parcelCaseReferenceLabel":"지역 우체국의 사례 참조 ID","parcelCaseReferencePlaceholder":"싱가포르 출신이면 NA를 입력하십시오","parcelCaseReferenceNote":"이 양식을 제출하기 전에 전화 또는 이메일로 지역 우체국에 연락하여 사례 참조 ID를 받으십시오. 그런 다음 여기에 사례 참조 ID를 입력하십시오.","parcelCaseReferenceLink":"우편 서비스 연락처는 이 링크를 참조하십시오","parcelCaseReferenceMandatory":"싱가포르 출신인 경우에만 NA를 입력하십시오. 다른 국가는 필수입니다. SpeedPost Express 및 DHL 사례 ID도 필요합니다.","parcelImageEvidenceLabel":"이미지 증거 (배달되었지만 분실된 소포용)","parcelImageWarning":"추가 확인을 위해 소포 미배달에 대한 허위 주장을 하지 않았음을 증명하는 이미지 증거가 필요합니다. (이미 배달되었지만 우편함/현관문 밖에 없는 소포만 해당됩니다. 배달된 품목에 대한 사진 증거가 제공되지 않으면 청구를 거부할 수 있습니다. 품목이 배달 완료 상태를 표시하지 않은 경우 이를 무시하십시오.)","parcelImageNote":"지원되는 파일 1개 업로드: 이미지. 최대 1GB.","parcelAgreementText":"소포에 일어난 일이 사실임을 확인하는 경우 \"동의함\"을 클릭하십시오.","parcelAgreeCheckbox":"동의함","parcelSuccessMessage":"소포 문의가 성공적으로 제출되었습니다! 3~5 영업일 이내에 답변드리겠습니다.","parcelErrorMessage":"문의 제출에 실패했습니다. 다시 시도하십시오.","parcelGeneralError":"오류가 발생했습니다. 나중에 다시 시도하십시오.","parcelAlertWait":"소포 배달을 기다려 주십시오. 지정된 대기 기간 후에 이 양식을 제출할 수 있습니다.","parcelAlertAgree":"양식을 제출하려면 약관에 동의하십시오.","parcelAlertCaseReference":"지역 우체국의 사례 참조 ID를 제공하거나 싱가포르 출신이면 NA를 입력하십시오.","parcelSubmitting":"전송 중...","parcelSubmit":"제출","lookalikeDomainWarning":"이것은 운송장 번호가 아니라 택배사를 사칭하는 웹사이트 링크입니다. 개인 정보나 결제 정보를 입력하지 마세요.","lookalikeDomainOfficial":"공식 웹사이트:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Ka whakamahi a Rhythm Nexus i nga whatunga arumoni taumata teitei. Heoi ano, i te wa tonu ka tae mai ki to whenua, ka whakawhitia te kawenga ki te kaikawe a-roto o reira (hei tauira, USPS, Royal Mail, DHL a-rohe). Ka panoni nga kupu timatanga aroturuki i nga punaha whakahaere i tenei paepae, engari ka hono tahi ta matou kaitaki parakete ao i aua tunga kia kore e motu to tirohanga.","trackingLastMileTitle":"Te Whatunga Tukunga Last-Mile","trackingCustomsClearanceBody":"Me whakawatea nga taonga whakawhiti-rohe katoa e te tari tikanga o to whenua. Ka aroturuki ta matou taputapu i nga nekehanga mai i te taenga ki te whare kawemai tae noa ki te tuku ki nga tikanga. Ka manatoko nga kaitiaki rohe i nga waehere HS, a, ka whakarite kua utua tika te VAT, nga take ranei (hei tauira, IOSS i te EU, VOEC i Nowei). Aroturukihia motuhaketia mo nga whakatupato \"Held at Customs\".","trackingCustomsClearanceTitle":"Korero Whakawatea Tikanga","trackingProcessingOriginBody":"Kia tukuna atu, ka uru te taonga ki te pokapu tukatuka takenga, ka karapahia, ka paunahia, a, ka whakamatauria ki nga tirohanga haumaru kaweake tuatahi. Ka tukuna atu ki te pokapu whakawhiti mera a-ao. Ka whakawhirinaki nga hotaka rerenga ki te kaha waatea o te utanga. Kaua e maharahara mena ka noho tonu ki tenei tunga mo etahi ra.","trackingProcessingOriginTitle":"Te Tukatuka i te Putahi Takenga","trackingInfoReceivedBody":"Ina tukatukahia tuatahitia tetahi ota i runga i a matou papa e-commerce (pera i Etsy, eBay, hoko tika ranei), ka hangaia a-ipurangi te tau aroturuki. Ka whiwhi te kaikawe i nga raraunga tuku i mua i te pupuri a-tinana i te pouaka. Tena, waiho kia 1 ki te 3 ra pakihi kia uru te parakete ki te whare komaka a-tinana.","trackingInfoReceivedTitle":"Kua Tae Mai te Korero","trackingStatusesIntro":"Nga mihi mo to whakamahi i ta matou taputapu kotahi mo te aroturuki parakete a-ao. Na te mea ka whakawhiti to mokihi i nga pae rohe maha o te ao, ka uaua pea nga tunga aroturuki. Ma te marama ki te huringa oranga o te logistics ka marama ake nga tumanako.","trackingStatusesTitle":"Te Marama ki nga Tunga Aroturuki","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"AM","pmText":"PM","footerQuickLinks":"Hononga Tere","footerSupportLegal":"Tautoko me te Ture","copyrightText":"Katoa nga mana.","tzAEST":"AEST (Poihākena/Mēpene)","tzACST":"ACST (Atereira)","tzAWST":"AWST (Pētia)","tzNST":"NST (Whenua Hou)","tzAST":"AST (Ranga Te Moana-nui-a-Kiwa)","tzEST":"EST (Rāwhiti)","tzCST":"CST (Waenga)","tzMST":"MST (Maunga)","tzPST":"PST (Te Moana-nui-a-Kiwa)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Pēkīngi","tzXinjiang":"Xinjiang","tzWIB":"WIB (Tiakāta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast Kaliningrad (UTC+2)","tzMoscow":"Mohikau/Rūhia ki te Uru (UTC+3)","tzSamara":"Oblast Samara (UTC+4)","tzUral":"Rohe Ural (UTC+5)","tzOmsk":"Oblast Omsk (UTC+6)","tzKrasnoyarsk":"Krai Krasnoyarsk (UTC+7)","tzIrkutsk":"Oblast Irkutsk (UTC+8)","tzSakha":"Whenua Sakha (UTC+9)","tzPrimorsky":"Krai Primorsky (UTC+10)","tzMagadan":"Oblast Magadan (UTC+11)","tzKamchatka":"Krai Kamchatka (UTC+12)","dstDayStartsLabel":"Ka timata te hora arorangirangi","dstDayEndsLabel":"Ka mutu te hora arorangirangi","dstRevertsLabel":"ka hoki ki te wā ture","dstEuropeLabel":"Europa","dstNewZealandLabel":"Aotearoa Hou","englishResponseNotice":"Panui: Ka whakautua nga patai katoa i te reo Ingarihi. Mena ka tuku koe i tetahi atu reo, ka whakamaoritia to korero ki te reo Ingarihi mo te manatoko.","parcelImageEvidenceLabel":"Taunakitanga Whakaahua (mō ngā pāhekoheko i tukuna kē, engari kāore i te pouaka mēra)","contactNamePlaceholder":"hei tauira: Hone Tīmoti","contactEnquiryTypeLabel":"He aha tēnei?","contactSelectOption":"Tīpakohia tētahi kōwhiringa","contactGeneralEnquiry":"Pātai Whānui / Whakahoki Kōrero","contactBusinessEnquiry":"Pātai Pakihi","contactOrderShippingEnquiry":"Pātai Ōta/Tuku","contactExchangeRefundEnquiry":"Pātai Whakawhiti/Whakahoki Moni/Whakahoki","contactOthers":"Ētahi atu","contactOrderNumberLabel":"Tau Ōta","contactOrderNumberPlaceholder":"Tauira: RTNX1234567890","contactCharacterCount":"ngā pūāhua","contactAlertAgree":"Whakaaetia ngā tikanga kia tukuna te puka.","contactErrorMessage":"I rahua te tuku karere. Ngana anō.","contactGeneralError":"I puta tētahi hapa. Ngana anō i muri mai.","contactSubmitting":"E tuku ana...","contactSubmit":"Tuku","parcelInfoText":"Ko tēnei puka mō ngā pāka kāore anō kia tukuna i te 18/30/45 rā (14 rā mō FedEx/DHL), kua whakaaturia rānei te tūnga tukuna engari kāore i a koe.","parcelInfoLink":"Pāwhiritia ki konei","parcelInfoEnd":"mō ētahi atu pātai.","parcelSelectShipping":"Tīpakohia te huarahi tuku","parcelSingPostEpac":"SingPost ePacket (ePAC rānei) - arā ko te SpeedPost Saver International (Aroturuki: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Tohu Aroturuki Utu-o-mua (Aroturuki: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Paerewa (Aroturuki: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Matua (EMS) (Aroturuki: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Tere (Aroturuki: PX123456789SG)","parcelDHL":"DHL Express (Ngā Whenua EU anake) (Aroturuki: 1234567890)","parcelUndeliveredLabel":"Kua kore anō tō pāka kia tukuna mō te 18/30/45 rā neke atu? (Ngā ratonga ā-rohe o Hīngapoa >7 rā, >14 rā mō SpeedPost Express/DHL)","parcelSelectOption":"Tīpakohia tētahi kōwhiringa","parcelYes":"Āe","parcelNo":"Kāo","parcelDeliveredButMissingLabel":"Kua whakaaturia e tō pāka te tūnga kua tukuna, engari kāore i tō pouaka mēra/wāhi haumaru/tūranga tatau?","parcelOrderNumberLabel":"Tau Ōta (Tauira: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelShippingMethodLabel":"Huarahi Tuku Kua Tīpakohia?","parcelCaseReferenceLabel":"ID Tohutoro Kēhi mai i te Tari Pouaka Mēra ā-Rohe","parcelCaseReferencePlaceholder":"Whakauruhia NA mēnā nō Hīngapoa koe","parcelCaseReferenceNote":"I mua i te tukunga o tēnei puka, whakapā atu ki tō tari pouaka mēra ā-rohe mā te waea, īmēra rānei, ka tiki i tētahi ID tohutoro kēhi mai i a rātou. Kātahi, whakauruhia tō ID tohutoro kēhi ki konei.","parcelCaseReferenceLink":"Tirohia tēnei hononga mō ngā whakapā Ratonga Pouaka Mēra","postalContactsTitle":"Ngā whakapā Ratonga Pouaka Mēra","parcelCaseReferenceMandatory":"WHAKAURUHIA NA ANAKE MĒNĀ NŌ HĪNGAPOA KOE. Mō ētahi atu whenua he MĀTĀWAE te whakarato. E hiahiatia ana mō SpeedPost Express hoki, mō te ID kēhi DHL.","parcelAlertWait":"Tataria tō pāka kia tukuna. Ka taea e koe te tuku i tēnei puka i muri i te wā tatari kua whakaritea.","parcelAlertAgree":"Whakaaetia ngā tikanga kia tukuna te puka.","parcelAlertCaseReference":"Whakaarahia tētahi ID tohutoro kēhi mai i tō tari pouaka mēra ā-rohe, whakauruhia rānei NA mēnā nō Hīngapoa koe.","parcelSubmitting":"E tuku ana...","parcelSubmit":"Tuku","parcelErrorMessage":"I rahua te tuku pātai. Ngana anō.","parcelGeneralError":"I puta tētahi hapa. Ngana anō i muri mai.","systemRequirementsTitle":"Putanga punaha tautoko iti","contactUsTitle":"Whakapā Mai","contactRefundNote3":"Kia mōhio mō ngā whakahoki moni mā Payhip, mēnā kāore koe i whiwhi i te whakahoki moni, whakapa atu ki tō pēke, tautoko Payhip rānei (support@payhip.com), nā te mea kāore mātou e whai mana ki te tukanga.","contactRefundNote2":"Mō ngā whakahoki mai, whakakapi rānei, mēnā kua whakamahia ngā mākini maimai i te wā i huakina (ngā pōkē e kitea ana, horoia rānei i roto i te kapa horoi ringaringa), kāore mātou e whakaae, ā, kāore e whakaaetia ngā whakahoki, whakakapi rānei o ngā kāri kēmu. Mauruuru.","contactRefundNote1":"Mēnā kei te pātai koe mō te whakahoki/whakahoki moni mai i te papaaho i hokona e koe, kia mōhio kāore mātou e whai mana ki ngā whakahoki moni mai i ēnei papaaho. Tēnā whakapa atu ki ō rātou ratonga kiritaki.","parcelEmailNote":"Kāore e whakaae ki ngā īmēra whakawhiti tūmataiti. Tēnā whakamahia he wāhitau īmēra tika.","parcelSuccessMessage":"Kua tukuna tō pātai pāhekoheko! Ka whakautu mātou i roto i te 3-5 rā mahi.","parcelDisagreeCheckbox":"Kāo","parcelAgreeCheckbox":"Ae Au","parcelAgreementText":"Pāwhiritia \"Ae Au\" mēnā ka whakaū koe i te āhua o tō pāhekoheko i pono.","parcelImageNote":"Tukuake 1 kōnae e tautokohia ana: whakaahua. Mōrahi 1 GB.","parcelImageWarning":"Mō te manatoko taapiri, me whai mātou i te taunakitanga whakaahua kia whakaatu ai kāore koe e mahi i ngā kerēme parau mō te kore tukuna o ngā pāhekoheko. (Mō ngā pāhekoheko kua tukuna kē, engari kāore i roto i te pouaka mēra/waho o te tatau. Ka taea e mātou te whakakore i tō kerēme mēnā kāore he taunakitanga whakaahua kua homai mō ngā taonga kua tukuna. Whakakore tēnei mēnā kāore tō taonga i whakaatu i te tūnga kua tukuna.)","parcelAdditionalInfoLabel":"Kōrero Taapiri (whiriwhiri)","parcelWhatHappenedLabel":"He aha i pā ki tō pāhekoheko?","parcelDestinationLabel":"Ūnga","parcelTrackingNumberLabel":"Tau Aroturuki","parcelEmailLabel":"Īmēra","parcelNameLabel":"Ingoa","parcelCannotSubmit":"Kāore e taea e koe te tuku i tēnei puka mēnā i kōwhiria e koe \"Kāo\".","parcelWaitText2":"Mēnā kāore he tūnga e puta mai i muri i te 18 rā (7 rā mō Singapore) neke atu rānei, ka taea e koe te whakamōhio tika ki a mātou.","parcelWaitText1":"Tēnā tatari ki te tuku mai o tō pāhekoheko. Kia mōhio kāore ngā tuku ao-whānui rite ki ngā tuku ā-rohe nā te mea ka tango wā. Mauruuru!","parcelWaitTitle":"Tatari ki tō pāhekoheko","parcelEnquiryTitle":"Pātai Pāhekoheko","contactDisagreeCheckbox":"Kāo","contactParcelWarningEnd":"kē atu.","contactParcelWarningLink":"TĒNEI PUKA","contactParcelWarning":"Mēnā kāore tō pāhekoheko kia tukuna mai mō te nui ake i te 18/30/45 rā (14 rā mō FedEx), tūnga ranei e whakaatu ana kua tukuna engari kāore kei a koe, tēnā whakakiia TĒNEI PUKA.","contactEmailNote":"Kāore e whakaae ki ngā īmēra whakawhiti tūmataiti (hei tauira, @privaterelay.appleid.com). Tēnā whakamahia he wāhitau īmēra tika.","contactPlatformShopee":"Shopee - Ahau → Tirohia te Hītori Hokonga (ka taea hoki e koe te pāwhiri ki te Tuku/Ki te Whiwhi)","contactPlatformEbay":"eBay - Taku eBay → Hokonga","contactPlatformEtsy":"Etsy - Te taha matau runga o tō kōtaha → Hokonga","contactPlatformInstructions":"Tēnā whakamahia te taupānga ki te tirotiro i tō tau ōta, nā te mea kei roto i te taupānga:","contactPlatformNote":"Etsy, eBay & Shopee tau ōta kāore i konei. Kāore mātou e whai mana ki ngā whakahoki moni mai i ēnei papaaho. Tēnā whakapa atu ki ō rātou ratonga kiritaki.","contactAgreeCheckbox":"Ae Au","contactAgreementText2":"Kia mōhio ko tā mātou whakautu ka tango i te 3-5 rā mahi, neke atu rānei i te wā o te nui o ngā īmēra mai i tō mātou taha.","contactAgreementText1":"Pāwhiritia \"Ae Au\", mēnā ka whakaae koe ki tō wāhitau īmēra e whakamahia e Rhythm Nexus kia whakautu ki a koe, nā te mea ko tēnei e hiahiatia ana e mātou ki te pānui i tō whakautu me te whakautu ki a koe i te wā ka puta mai tētahi rongoā mō tō pātai.","contactSpamWarning":"Ka whakakāhoretia ngā tuku kāore i tonoa mō te SEO, hoahoa paetukutuku, nama moni rānei, ratonga rite rānei.","contactSpamWarningNote":"Kia Mōhio:","contactSuccessMessage":"Kua tukuna tō karere! Ka whakautu mātou i roto i te 3-5 rā mahi.","contactSubmitButton":"Tuku","contactMessageLabel":"Karere","contactEmailLabel":"Īmēra","contactNameLabel":"Ingoa","systemRequirements":"Matapihi: Windows 7 (with ESU updates installed) i runga ake ranei\nmacOS: macOS 12, i runga ake ranei\nAndroid: Android 13 ki runga ake ranei\niPhone/iOS: iOS 17 ki runga ake ranei\nLinux: He tuku tohatoha e tautokohia ana me nga whakahoutanga haumarutanga kaha","goodFridayEasterGreeting":"Hari Aranga! Kia mau te rongo me te koa i te Paraire Pai me te Aranga.","christmasGreeting":"Meri Kirihimete me te Tau Hou! Kia mau te rongo me te koa mai i te 25 o Tihema ki te 5 o Hanuere.","captchaSystemRequirements":"Nga whakaritenga punaha iti: Windows 7 (with ESU updates installed), 11 ranei, macOS 10.15+, Android/iOS ranei te putanga hou.","title":"Manatoko Uru","subtitle":"Whakaotihia te wero kei raro nei kia haere tonu.","selectLanguage":"Tīpakohia te Reo","selectLanguagePlaceholder":"-- Whiriwhiria he reo --","loadingChallenge":"Uta ana te wero...","answerLabel":"To whakautu:","answerPlaceholder":"Whakauruhia to whakautu","continueButton":"Haere tonu","refreshButton":"Wero Hou","verifying":"Manatoko ana...","chooseLanguageFirst":"Tīpakohia he reo i te tuatahi.","loadFailed":"I rahua te uta i te wero. Me ngana ano.","expiredChallenge":"Kua pau te wero. Uta ana i te wero hou...","verifyFailed":"I rahua te manatoko. Me ngana ano.","home":"Kainga","blog":"Blog","aboutUs":"Mo matou","faq":"FAQ","contact":"Whakapā","trackPackage":"Mōkī Aroturuki","cnyYearOfHorseMessage":"🧧 Nga mihi o te Tau Hou! Kia ora koutou me te hari i roto i te tau o te Hoiho! 🐴","hariRayaMessage":"🌙 Meri Hari Raya Aidilfitri! Kia ora koe me to whanau, harikoa me nga manaakitanga! 🌟","deepavaliMessage":"🪔 Hari Deepavali! Ma te hakari o nga rama e kawe mai i a koe te hari, te pai me te angitu! ✨","diwaliMessage":"🪔 Hari Diwali! Ma te hakari o nga rama e kawe mai i a koe te hari, te pai me te angitu! ✨","vesakMessage":"☸️ Kia hari a Waisak! Kia mau te rongo, te whakaaro nui, me te maramatanga i tenei ra tapu! 🙏","vesakTHMessage":"☸️ Hari Visakha Bucha Day! Kia mau te rongo, te whakaaro nui, me te maramatanga i tenei ra tapu! 🙏","singaporeNationalDayMessage":"🇸🇬 Hari Motu, Singapore! Te whakanui i te 61 tau o te mana motuhake! 🎉","indonesiaNationalDayMessage":"🇮🇩 Kia Ora Hari Kemerdekaan Indonesia! Dirgahayu Republik Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Kia ora Hari Merdeka, Malaysia! Te whakanui i te mana motuhake o to tatou motu! 🎊","australiaNationalDayMessage":"🇦🇺 Kia hari o Ahitereiria! Whakanuia to tatou iwi! 🎉","canadaNationalDayMessage":"🇨🇦 Kia hari o Kanata! Te whakanui i to tatou iwi nui! 🍁","usaNationalDayMessage":"🇺🇸 Kia hari o te Rangatiratanga, Amerika! Te whakanui i te herekore me te herekoretanga! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! Kia ora a France! 🎊","germanyUnityDayMessage":"🇩🇪 Kia ora te ra kotahitanga Tiamana! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Kia ora te Ra Tuāpapa, Japan! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Hari Motu, Haina! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Kia ora te Ra Whakaoranga, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Ngā mihi o te rā Independence, India! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Kia ora a motu, Thailand! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Kia ora te Ra motuhake, Philippines! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Hari Motu, Vietnam! Ko Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Kia hari te Rangatiratanga, Poroni! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Kia hari te Rangatiratanga, Czech Republic! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Kia ora te Kingi! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 koa Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Kia pai te ra o te Rangatiratanga, Iharaira! 🎉","irelandNationalDayMessage":"🇮🇪 Kia pai te ra o Hato Patricia, Ireland! Lá Fhéile Pádraig sona moni! 🍀","bruneiNationalDayMessage":"🇧🇳 Kia ora Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Kia ora o Waitangi, Aotearoa! 🎉","switzerlandNationalDayMessage":"🇨🇭 Hari Motu a Swiss! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgique! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Kia hari a Russia! 🎉","taiwanFoundingDayMessage":"🇹🇼 Kia ora te Ra Whakaturanga, Taiwana! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Kia Ora Rua Tekau Ra, Taiwana! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Hari Whakatūnga SAR Hong Kong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Kia hari te Ra Whakaturanga Macau SAR! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Kia pai te Ra Kaimahi o te Ao! Te whakanui i nga mana mahi me nga mana o nga kaimahi! 🎊","laborDayUSCAMessage":"⚒️ Kia pai te Ra Reipa! Te whakanui i nga takoha a nga kaimahi! 🎉","temporaryClosureNoticeTitle":"Rhythm Nexus - Panui kati mo te wa poto","temporaryClosureNoticeBody":"E nga kiritaki whai mana,\n\nTena koa, kia mahara ka kati a Rhythm Nexus mo te wa poto mai i te 21 o Maehe 2026 ki te 26 o Maehe 2026 na tetahi huihuinga kamupene.\n\nHei whakarite mo te kati, ka whakatakotoria te toa ki te aratau hararei timata i te 20 o Maehe 2026 a te 3:00 PM (UTC +8). Ko nga ota ka tukuna i muri i tenei wa, tera pea kaore e tukatukahia kia timata ano ra ano a matou mahi.\n\nKa hoki ano nga mahi pakihi ki te tikanga noa a te 27 o Maehe 2026.\n\nE mihi ana matou mo nga raruraru ka pa mai, a e tino maioha ana matou ki to koutou maramatanga me to koutou tautoko tonu.\n\nNga mihi.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Kua marama au","parcelTracking":"Aroturuki Peeke","serviceAnnouncement":"Panuitanga Ratonga","usaWinterStormTitle":"TONA: Urauwataka Kōpeke Taumaha - Whakatutu Mahi","usaWinterStormSubtitle":"Hāpaitanga Pōsita o Aotearoa Hou (USPS) Kaupapa whakahehehe","usaWinterStormNotice1":"Na te wahine kōpeke taumaha e aawe ana i te rohe o New York mai i te 23 Pēpuere 2026:","usaWinterStormNotice2":"Kua mutu noa iho te mahi o waenganui a waenganui i te aerodome o John F. Kennedy","usaWinterStormNotice3":"Kua kōrerotia te whakakorea nui o te rererangi me te whakatūtū nui o te mahi aerodome","usaWinterStormNotice4":"Ko ēnei ahuatanga he kaupapa whakahehehe kei waho i te mana o te USPS","usaWinterStormNotice5":"Te aawe o te mahi:","usaWinterStormNotice6":"He huinga antikipa kino o te huia kaumoe, te uakitai rūrū, te uakitai whakamarama me te kakaroa kino","usaWinterStormNotice7":"Kua kōrerotia te whakatūtū nui me te heuheu hiko nui","usaWinterStormNotice8":"Ko te kohikohi me te tuku o te pokapū o roto me o waho (pokapū-pokapū, pokapū-pokapū me te kaupapa EMS) kua aawe","usaWinterStormNotice9":"Nga rohe Ipurangi Pokapū e aawe ana:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"Kei te whakatutuki a USPS i ngā kaupapa katoa e hiahiatia ana kia whakaiti i te whakaaweawe ki ngā kaihoko me te pupuri i te haumarutanga o ngā kaimahi. E whakamoemoeange ana mātou i tō whakapono me tō whakaaro i a ia kaupapa whakahehehe.","usaWinterStormNotice12":"Whakahou o muri: 25 Pēpuere 2026","countryAutoDetected":"Tūāhuatanga kua tohua i runga i tōu tūnga","countryAutoDetectedFromLink":"Tūāhuatanga kua tohua mai i te hononga","trackingNumber":"Tau Aroturuki","destinationCountry":"Whenua Whainga","postcode":"Waehere poutāpeta","orderNumber":"Tau Raupapa (Tauira: RTNX1234567890)","fromDate":"Mai i te Ra (HE WHAKAMAHI mo te manatoko DHL)","toDate":"Ki tenei ra (HE WHAKAMAHI mo te manatoko DHL)","trackParcel":"Aroturuki Peeke","selectCourier":"-- Tīpakohia te Kaikawe / Whenua --","singaporeCouriers":"Singapore Couriers","topCountries":"Top 5 Whenua","otherCountries":"Ētahi atu Whenua","note":"FAKATOKANGA","disclaimer":"KAUPAPA","importantInformation":"Mōhiohio Hiranga:","didNotReceiveEmail":"Mena kaore koe i whiwhi i to imeera whakau mai i Etsy, eBay, Shopee, Payhip ranei, panuku ki raro ki te rapu i to ota ma to wahitau imeera me to nama waea e hono ana ki tenei ota.","searchByEmailOrPhone":"Rapua ma te imeera, ma te Waea ranei","searchOrder":"Raupapa Rapu","trackingResult":"Hua Aroturuki","noOrdersFound":"Karekau he ota i kitea mo tenei patai.","pleaseEnter":"Whakauruhia he imeera, waea, nama tono ranei.","fillAllFields":"Tena koa whakakiia nga waahi katoa e hiahiatia ana: te tau aroturuki, te whenua haerenga, te nama ota, me te waehere poutāpeta.","noOrderMatchingFields":"Karekau he ota i kitea e rite ana ki nga mara katoa.","postcodeRequired":"Kei te hiahiatia te Waeherehere mo tenei haerenga.","invalidUSZip":"Waehere ZIP US muhu. Whakamahia kia 5 mati, ZIP+4 ranei.","failedGenerateURL":"I rahua te whakaputa URL aroturuki. Tena koa tirohia te whakaurunga.","trackingValidationSG":"Ko nga nama aroturuki mo Singapore me: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG, PX123456789SG ranei. Mo nga Tukunga DHL whakamahia nga nama 10-mati.","invalidSingPostFormat":"Ko te whakatakotoranga tau aroturuki SingPost muhu.\nNgā hōputu kua whakaaetia:\n• PP123456789SG → Tapanga Aroturuki Tomua\n• SPNDD00012345 → Aroturuki Paerewa SpeedPost","welcomeTitle":"Nau mai ki te paetukutuku a Rhythm Nexus!","purchaseInfo":"Hokona mai i a maatau ma o maatau hongere mana, uru mai ranei ki a maatau","purchaseInfoChina":"Hokona mai i a maatau ma o maatau hongere mana.","purchaseInfoChinaSuffix":"","telegramGroup":"Roopu Telegram","forUpdates":"mo nga whakahou mana.","ourStores":"Ko o matou Toa","etsyStore":"Toa Etsy","ebayStore":"Toa eBay","shopeeStore":"Toa Shopee","payhipStore":"Toa Payhip","internationalShipping":"Tukunga o te Ao","singaporeLocal":"Takiwa o Singapore","asiaOnly":"Ahia-anake","deliveryInfo":"Nga korero tuku","deliveryRates2026":"Reiti Tukunga 2026","sgDeliveryRates":"Reiti Tukunga a Singapore","speedPostRates":"Nga utu o te ao SpeedPost Express","aboutTitle":"Mō Rhythm Nexus","aboutP1":"I tiimata to maatau toa i te tau 2022 kua hokona i runga i nga papaaho penei i a Etsy, eBay, me Shopee i roto i nga tau kaore i taka.","aboutP2":"I te roanga o te wa, kua hanga e matou he ingoa kaha ma te aro ki te whakatutukitanga pono, te whakawhitiwhiti korero marama, me te aroturuki tika mo ia ota ka tukuna e matou.","aboutP3":"Ko ta matou whaainga ko te whakarato ki nga kaihoko he wheako hokohoko maeneene me te pono, ahakoa te hoko mai i te rohe, i te ao ranei. Ka urutau tonu matou ki te whakarereke i nga poutapeta, tikanga, me nga whakaritenga taake kia pai ai te tae atu o nga tuku ki o ratou haerenga.","aboutP4":"Mauruuru koe mo te tautoko i te Rhythm Nexus.","faqTitle":"Pātai Auau","faqQ1":"Ka aha mena kei te he taku taonga? He raihana?","faqA1":"Ae! Ko te nuinga o nga ota ka tae mai me te raihana 1 tau. Tena koa homai to nama nama/tau ota kia taea ai e matou te tirotiro. Tuhipoka: Kaore e whakaaetia te whakawhiti mena ka rite te taonga ki te whakaahuatanga, ahakoa i he to ota.","faqQ2":"Ka taea e au te whakatika, te whakahou, te whakakore ranei i taku ota?","faqA2":"Ae. Mo te haumarutanga, me whakahaere nga huringa ota ma te imeera, i runga ranei i ta maatau Puka Whakapā.","faqQ3":"Me utu au i nga taake ritenga/ kawemai?","faqA3":"Ko nga tikanga me nga taake kaore i utua i mua, engari mo te DDP ki nga USA. Ka tono pea te VAT mo te EU, UK, AU/NZ, Norway, Switzerland, me nga kawanatanga o Kanata penei i a Saskatchewan me Manitoba, kua utua na te taunoa. Karekau he taake utu mo Singapore. Kare e taea e matou te tohutohu mo nga utu ritenga—whakapa atu ki o tikanga rohe mo nga korero taipitopito.","faqQ4":"Ahea taku ota ka tukuna?","faqA4":"Ko nga ota ka tukuna i roto i nga ra mahi 1-5. I roto i nga wa ororongo nui, ka roa pea te 5-7 ra.","faqQ5":"E rua nga wa i ota ai ahau. Me aha ahau?","faqA5":"Ka whakahokia e matou nga utu kaipuke takirua anake. Ka tukuna tahi nga taonga e rua. Whakahoki = (tuatahi + utu kaipuke tuarua) - utu kaipuke tuuturu.","faqQ6":"Kia pehea te roa o te tuku?","faqA6":"Ka 1-5 nga ra mahi mahi.\n\nNga kaipuke a-whare:\n• Tapanga Aroturuki Tomua a SingPost: 2–4 ra\n• Paerewa TerePost: 1–3 ra\n\nAo:\n• SingPost ePAC: 14-30 ra\n• TerePost Priority (EMS): 8-15 ra\n• SpeedPost Express: 4-8 ra\n\nKa taea te whakaroa i nga wa tino nui.","faqQ7":"Kei te whakahokia taku taonga ki te kaituku. Me aha ahau?","faqA7":"Ka whakaaetia kia kotahi te tuku. Kaore e taea te whakakore mo nga wahitau muhu, nga peera kaore i keremehia, me nga utu tikanga kaore ano kia utua. Whakapa atu ki to ratonga poutapeta mo te tuku ano, me korero mai ranei mo te awhina.","faqQ8":"Kua ngaro / tahaetia taku taonga i te whakawhiti.","faqA8":"Ka tukuna e matou kia kotahi te tuku. Mena ka ngaro ano, ka tukuna he moni whakahoki katoa i muri i te matapihi tuku a te kaikawe:\n\n• Ratonga Takiwa o Singapore: 7 ra\n• SingPost ePAC & SpeedPost Priority International: 30 ra\n• SpeedPost Intl Express: 14 ra","blogTitle":"Te Tukunga me te Poutapeta Te turanga matauranga","blogSubtitle":"Ko nga whakamarama whai mana mo nga ratonga poutapeta, tikanga, VAT, me nga mahi e pa ana ki nga kaipuke Rhythm Nexus.","readMore":"Pānuitia atu","backButton":"Whakamuri","blogPost1Title":"He aha te SingPost ePAC?","blogPost1Desc":"Akohia mo SingPost ePAC (ePacket), he ratonga poutapeta whai hua mo nga kaipuke e-tauhokohoko mama.","blogPost2Title":"He aha te SpeedPost Priority International (EMS)?","blogPost2Desc":"Tirohia te EMS, te ratonga tuku poutapeta utu nui o te ao e tohuhia ana e nga kaiwhakahaere poutapeta puta noa i te ao.","blogPost3Title":"He aha te SpeedPost Express (Maero whakamutunga DHL Express)?","blogPost3Desc":"Tirohia te SpeedPost Express, he ratonga kaikawe me te tuku maero whakamutunga na DHL Express.","blogPost4Title":"Utuhia nga Whakautu Poutapeta (PDDP)","blogPost4Desc":"Kia mohio ki te PDDP e taea ai e te US te utu taake me nga taake i mua i te tuku.","blogPost5Title":"EU VAT & IOSS Kua whakamaramatia","blogPost5Desc":"Tikina he tirohanga mo te EU VAT me te punaha IOSS mo te kohi taake mo nga kawemai tae atu ki te €150.","blogPost6Title":"UK VAT & Remittance to HMRC","blogPost6Desc":"Akohia nga whakaritenga VAT mo nga taonga kawemai i te UK me te tuku moni ki HMRC.","blogPost7Title":"Norway VOEC Whakamarama","blogPost7Desc":"Kia mohio koe ki te punaha VOEC (VAT on E-Commerce) o Norway mo nga taonga kawemai mai i waho o te EU/EEA.","blogPost8Title":"I whakamaramahia te VAT a Swiss","blogPost8Desc":"Tirohia nga whakaritenga VAT a Switzerland mo nga taonga kawemai me te tukanga kohikohi.","enterDestinationPostcode":"Whakauruhia te waehere poutāpeta ūnga","trackingNumberExample":"e.g. LG123456789SG","trackingCaseSensitive":"HE KAUPAPA KAUPAPA KAUPAPA KAUPAPA KAUPAPA KAUPAPA KAUPAPA.","usaPostcodeNote":"Mo nga whenua karekau he waehere poutapeta, penei i a Hong Kong me Macau, tuhia koa te 999077 (Hong Kong) me te 999078 (Macau).","currentTime":"Wā o nāianei","timezoneNote":"Te wa e whakaatuhia ana i roto i te whakatakotoranga 12-haora","sameTimeAsSingapore":"He wa ano ki a Singapore","hourAhead":"haora i mua o Singapore","hoursAhead":"haora i mua o Singapore","hourBehind":"haora i muri o Singapore","hoursBehind":"haora i muri i Singapore","australianDSTTitle":"Te Wā Tiaki Awa o Ahitereiria","australianDSTBothMessage":"Ko te AEDT (Australian Eastern Daylight Time) me te ACDT (Australian Central Daylight Time) e whai mana ana i tenei wa.","australianAEDTMessage":"Ko te AEDT (Australian Eastern Daylight Time) e mana ana i tenei wa mo Poihakena, Poipiripi, me nga rohe e tata ana.","australianACDTMessage":"ACDT (Australian Central Daylight Time) kei te mana i tenei wa mo Adelaide me Ahitereiria ki te Tonga.","australianDSTNote":"Ko nga wa tuku e whakaatuhia ana i runga ake nei e whakaatu ana i te wa whakaora awatea o naianei.","epacDeliveryNote":"Tena koa kia mahara ko nga mea ePAC katoa ka tukuna ki te taunga me tuku katoa ki to pouaka mēra, ki to kuaha, ki to kati peera ka waiho ranei ki tetahi waahi haumaru!","countriesNoMailbox":"Ko nga whenua e mohiotia ana he pouaka mēra/pouaka reta kaore i te waatea: Brunei, Haina, Inia, Iharaira, Macau SAR Haina, Philippines, Poroni me Vietnam.","rhythmNexusNotResponsible":"Ko Rhythm Nexus KORE WHAKAMAHI mo te whakahaere i nga tuku na te mea kei waho i a maatau te mana ka pai ake maau maau koe e whai i to ahuatanga o to taonga.","issuesAfterDelivery":"Ko nga take mo to tukunga i muri i nga ra 30/45 (14 ra mo te SpeedPost Express) he whakaaturanga mana ranei i tukuna engari kaore koe i whiwhi, tena koa whakapiri mai ki a maatau.","filteredAllowedDestinations":"(Kua tātarihia mo o waahi e whakaaetia ana)","loadingAnnouncements":"Uta ana nga panui...","unableToLoadAnnouncements":"Kaore e taea te uta nga panui ratonga i tenei wa.","viewOnSingPostWebsite":"Tirohia ki te paetukutuku SingPost →","cannotUseEmbed":"Kaore e taea e matou te whakamahi i te whakauru mo te aroturuki i te mea kaore te nuinga o nga paetukutuku ratonga poutapeta e tautoko ana.","clickLinkAbove":"Paatohia te hono i runga ki te whai i to peera.","trackingDetailsNote":"Kia mahara karekau pea nga taipitopito aroturuki e puta ki nga hua rapu, na reira ka tūtohu kia whakapirihia te nama aroturuki ki te punaha hei whai i te taonga.","thirdPartyWebsites":"Ka taea hoki e koe te whai i o peera i runga i enei paetukutuku tuatoru:","enterEmailOrPhone":"Whakauruhia he imeera, waea ranei","collectAtPostOffice":"Heoi, mena karekau he pouaka mēra i to whenua hei paerewa e waatea ana, me kohi koe ki te poutapeta.","russiaServiceSuspended":"⚠️ WHAKAMAHI WHAKAMAHI: I runga i te 2022 Russian Invasion of Ukraine, SingPost kua aukati nga tuku katoa ki Ruhia me te DHL. I tenei wa kaore matou e mahi ana ki a Ruhia i tenei wa tae noa ki te panui mo te whakahou i nga ratonga ki te whenua.","reviewShippingRates":"Whakaarohia o maatau utu kaipuke o naianei","here":"konei","contactUsForm":"Tena koa whakapā mai ma","form":"puka","forEnquiries":"mo nga patai kei a koe mo to ota.","anPostNoDirectTracking":"Karekau te Pou (Ireland) e tautoko ana i nga hononga aroturuki tika, i te aroturuki kua mau ranei.","anPostPasteManually":"Whakapirihia to nama aroturuki ki te paetukutuku An Post.","goToAnPost":"Haere ki He Panui","postedDate":"Rā Whakairi:","status":"Tūnga:","shippedVia":"Ka tukuna ma te:","destination":"tauranga:","statusInPreparation":"I te Takanga","statusInTransit":"I te Whakawhitiwhiti","statusDelivered":"Kua tukuna","statusOutForDelivery":"Kei waho mo te Tukunga","statusArrived":"Kua tae mai","statusProcessing":"Tukatuka","statusDispatched":"Kua tukuna","statusReturned":"Kua hoki mai","statusFailed":"I rahua","statusCancelled":"Kua whakakorehia","statusHeldByCustms":"Ka mauhia e nga Tikanga","statusAwaitingCollection":"Tatari Kohinga","aka":"aka","thisServiceKnownAs":"E mohiotia ana tenei ratonga ko","in":"i roto","viewTrackingDHL":"Tirohia nga korero Aroturuki mai i te DHL Express","viewTrackingSingPostSpeedPost":"Tirohia nga korero Aroturuki mai i Singapore SpeedPost","viewTrackingDHLLastMile":"Tiro Mōhiohio Aroturuki mai i te DHL Express (Maero whakamutunga)","viewTrackingDHLShipperRef":"Tiro Mōhiohio Aroturuki mai i te DHL Express (Torotoro Kaituku)","viewTrackingSingPost":"Tirohia nga korero Aroturuki mai i Singapore Post","viewTrackingDestPost":"Tirohia nga korero Aroturuki mai i","post":"Whakairi","orderNumberExample":"Tau Whakatau (ka timata ki te RTNX, ki te DLTB ranei - tauira: RTNX1234567890):","deliveryRecordNote":"Kia mahara ka tukuna mai nga taonga, ka penapenahia te rekoata ki te 7 ra ka mukua.","copyrightAllRights":"Katoa nga mana.","accessRestricted":"Kua Rahuitia te Uru","vpnDetectedMessage":"Kua kitea te whakamahi VPN. Tena koa monohia te VPN kia uru atu ki tenei ratonga.","contactSupportError":"Ki te whakapono koe he hapa tenei, tena koa whakapā atu ki te tautoko.","destinationNotAllowed":"Ko te uru ki tenei whenua haerenga kaore i te waatea mai i to waahi. Tīpakohia he ūnga rerekē.","epacUS":"Ratonga A-ao mo te Kura Tuatahi","epacCH":"Kaupapa Matua","epacGB":"Ao Aroturuki","epacMY":"Te Ao Aroturuki/Express","epacCA":"International Inbound Express","epacAU":"Puke me te Aroturuki i te Ao","epacNZ":"Aroturuki Ohanga Ao","epacDE":"Warenpost International Premium","epacFR":"He reta o te ao me te whai","epacNL":"Aroturukihia te Peeke o te Ao","epacPL":"Ko nga korero mo te ao","epacBE":"Te Pirimia o te Ao ki roto","epacAT":"Mōkihi Aroturuki Ao","epacIN":"Mōkihi Aroturuki Ao","epacFI":"Reta Aroturuki Ao","epacSE":"Reta Aroturuki Ao","epacNO":"PRIME Exprès","epacIT":"Whakaaturia","epacIL":"Whakaaturia","epacES":"Mōkī Maama o te Ao","epacPT":"Mēra Kahurangi o te Ao","epacCZ":"Ko nga tukunga whaiwhai mai i tawahi","epacBN":"ePacket International","epacCN":"ePacket International","epacHK":"ePacket International","epacID":"Mōkī-e o te ao","epacMO":"ePacket International","epacPH":"International Tracked Mail","epacTW":"ePacket International","epacTH":"ePacket International","epacVN":"Mōkī-E o te Ao (Mākī ASEAN)","epacKR":"K-Pakete","epacJP":"Maama e-Packet International","epacIE":"Panui Whakatere o te Ao","blogSingPostEPACContent1":"Ko te SingPost ePAC (ePacket) he ratonga poutapeta whai hua mo nga kaipuke e-tauhokohoko ngawari o te ao.","blogSingPostEPACContent2":"Ka tukuna mai e te kaiwhakahaere poutapeta a motu o te whenua e haere ana, ka whakamahia mo nga peeke kei raro iho i te 2 kg, i roto i te tepe o te roa + te whanui + te teitei i raro i te 90 cm me te roa kaua e neke atu i te 60 cm.","blogSingPostEPACContent3":"Ko tenei whiringa i te tuatahi i tukuna e Hong Kong Post me te eBay Haina, ka tuku nga kete mai i Haina me Hong Kong ki te tuku i nga paanui iti ki USA me te whai i te tuku tuku me te kore he tono mo tetahi hainatanga i te tukunga. E mohiotia ana tenei ratonga ko USPS (United States Postal Service) Tuatahi-Class Package International Service i roto i te USA.","blogSingPostEPACContent4":"Mai i te 1 o Hanuere 2026, kei te whakamahia te ePAC mo nga whenua katoa ki te u ki nga ture UPU e whakahau ana me whakawhäitihia nga peera me nga mea kua Rehita mo nga tuhinga anake.","blogSingPostEPACContent5":"Aroturuki mua: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"Ko te EMS he ratonga tuku panui utu nui o te ao, he mea nui na nga kaiwhakahaere poutapeta huri noa i te ao.","blogSpeedPostEMSContent2":"Ko te tikanga he tere ake i te mēra paerewa engari he uaua ake te mahi, me te whai tonu kia tae noa ki te tuku.","blogSpeedPostEMSContent3":"I Singapore, e mohiotia ana tenei ko SpeedPost Priority International na SingPost.","blogSpeedPostEMSContent4":"Aroturuki mua: EZ123456789SG","blogSpeedPostExpressContent1":"Ko te SpeedPost Express he ratonga kaikawe pukapuka.","blogSpeedPostExpressContent2":"I te maha o nga waahi, ka tukuna e DHL Express nga maero whakamutunga me te kohi utu, taake ranei i mua i te tukunga.","blogSpeedPostExpressContent3":"Tuhinga o mua: PX123456789SG (Maero whakamutunga DHL Express e whakamahi ana i te nama aroturuki 10-mati, kaore e kitea e te marea, engari kei a maatau nga korero mo tera","blogSpeedPostExpressContent3Link":"Pūnaha Aroturuki.","blogUSPDDPContent1":"Ka whakaaetia e te PDDP nga utu kawemai me nga taake a te US i mua i te tukunga, ka whakaheke i nga utu ohorere mo nga kaiwhiwhi.","blogUSPDDPContent2":"Nga Ture Hou (Whakamana 29 Akuhata 2025)","blogUSPDDPContent2List1":"Waehere HTS mana","blogUSPDDPContent2List2":"He tika nga korero mo nga taonga","blogUSPDDPContent2List3":"Te whakakaha ake i te utu utu","blogUSPDDPContent3":"Ko nga mea katoa ka tukuna ki te USA kaore e utua he utu taapiri ki te kaiwhiwhi na te mea kei te utu matou mo koe. Heoi, kia mahara ko te utu o te taonga ko te 10% utu kawemai ma te taunoa ka whakaritea kia rite ki nga ture.","blogUSPDDPContent4":"Ka pa ana tenei mo a maatau tikanga tuku mo nga USA, SpeedPost Priority International (EMS) me SingPost ePAC anake.","blogEUIOSSContent1":"Ka tukuna e te EU te VAT mo nga kawemai arumoni katoa ahakoa te uara.","blogEUIOSSContent2":"IOSS (Kawemai Toa Kotahi)","blogEUIOSSContent3":"Ka taea e IOSS nga kaihoko ki te kohi i te EU VAT i te utu mo nga tukunga tae atu ki te €150.","blogEUIOSSContent4":"Ka tukuna te VAT ma te punaha IOSS, kia tere ake ai te tuku tikanga me te kore kohi taake i te tukunga.","blogEUIOSSContent5":"Mo nga ota katoa ma te Etsy, eBay ranei, kua kohia te IOSS VAT i runga i te tirotiro ka tohua e matou ki runga i te Tau Tohutoro Taake hei tuku i nga raraunga ki te ratonga poutapeta haerenga ma te EDI (Electronic Data Intercharge).","blogUKVATContent1":"Ko te UK e hiahia ana kia utua te VAT mo nga taonga kawemai.","blogUKVATContent2":"Mo nga tuku utu iti, ka kohia te VAT i te utu ka tukuna tika ki te HMRC e te kaihoko, te kainga hokohoko ranei.","blogUKVATContent3":"Mo nga kaipuke utu nui ake, ka kohia pea te VAT e te kaikawe i mua i te tuku.","blogUKVATContent4":"Mo nga ota katoa ma Etsy, eBay ranei, kua kohia te VAT i runga i te utu ka tohua e matou ki runga i te Tau Tohutoro Taake hei tuku i nga raraunga ki te ratonga poutapeta haerenga ma te EDI (Electronic Data Intercharge).","blogNorwayVOECContent1":"I whakauruhia e Norway te punaha VOEC (VAT on E-Commerce) mo nga taonga i kawemai mai i waho o te EU/EEA. E pa ana tenei ki nga taonga kua eke ki te NOK 3,000.","blogNorwayVOECContent2":"Ka taea e nga kaihoko te rehita i roto i te kaupapa VOEC ki te kohi i te VAT Norwegian i te wa e tirotirohia ana, kia tere ake ai te tango i nga tikanga me te kore he kohinga VAT i runga i te tuku.","blogNorwayVOECContent3":"Mo nga ota katoa ma te Etsy, eBay ranei, kua kohia a VOEC VAT i runga i te utu. Ko nga pepa aroturuki me nga tikanga e tohu ana i te Tau Tohutoro Taake hei tuku raraunga ki te ratonga poutapeta Norwegian.","blogSwissVATContent1":"Ka utua e Switzerland te VAT mo nga taonga kawemai ahakoa te uara. Ko te Whakahaere Whakahaere a te Federal Federal Customs e kii ana ki nga kaihoko ke ki te kohi VAT i te utu mo nga taonga tae atu ki te CHF 65.","blogSwissVATContent2":"Ko nga kaihoko kua rehitatia i raro i te punaha VAT a Swiss ka tuku tika i te VAT kua kohia, me te whakarite kia kore te kaiwhiwhi e whai utu taapiri i te tukunga.","blogSwissVATContent3":"Mo nga ota katoa ma Etsy, eBay ranei, kua kohia a Swiss VAT i te wa e tirotirohia ana, kei roto hoki i nga pepa ritenga te Tau Tohutoro Taake mo te tuku EDI.","dhlNoEmbed":"Karekau a DHL Express e tautoko i te aroturuki ma te whakauru. Tena koa","speedPostNoEmbed":"Karekau a SpeedPost Singapore e tautoko i te aroturuki ma te whakauru. Tena koa","operatorNoEmbed":"e kore e tautoko i te aroturuki ma te whakauru. Tena koa","clickHere":"pāwhiri i konei","toTrackNewTab":"ki te aroturuki (tuwhera ki te ripa hou).","optionSingPost":"🇸🇬 Waiata Waiata (SPNDD/PP)","countryAU":"🇦🇺 Ahitereiria","countryCA":"🇨🇦 Kanata","countryDE":"🇩🇪 Tiamana","countryGB":"🇬🇧 United Kingdom","countryUS":"🇺🇸 United States","countryAT":"🇦🇹 Ateria","countryBE":"🇧🇪 Belgium","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Haina","countryCZ":"🇨🇿 Czechia","countryFI":"🇫🇮 Finland","countryFR":"🇫🇷 France","countryHK":"🇭🇰 Hong Kong SAR Haina","countryIN":"🇮🇳 Inia","countryID":"🇮🇩 Indonesia","countryIE":"🇮🇪 Ireland","countryIL":"🇮🇱 Iharaira","countryIT":"🇮🇹 Itari","countryJP":"🇯🇵 Japan","countryMO":"🇲🇴 Makau SAR Haina","countryMY":"🇲🇾 Mareia","countryNL":"🇳🇱 Hōrana","countryNZ":"🇳🇿 Aotearoa","countryNO":"🇳🇴 Nōwei","countryPH":"🇵🇭 Philippines","countryPL":"🇵🇱 Poroni","countryPT":"🇵🇹 Potukara","countryRU":"🇷🇺 Ruhia","countryKR":"🇰🇷 Korea ki te Tonga","countryES":"🇪🇸 Spain","countrySE":"🇸🇪 Sweden","countryCH":"🇨🇭 Switzerland","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Thailand","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬 Singapore","countryMsgNL":"Mena kei te whakaatu te mana ki te 'Held by Customs', tena koa whakapā atu ki te Raina Momohio Tiaki o Netherlands mo te awhina:\n0800 0143 (kore utu), Mane ki te Paraire mai i te 7 karaka ki te 11 i te po.\nHei te Hatarei me te Ra mai i te 8 karaka ki te 4:30 karaka.\n\nE whakatenatenahia ana koe ki te rehita i tetahi kaute me PostNL mo te whakamohiotanga pana tonu mo o kete:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nMena kei te tukuna ki te waahi PostNL, ka kii mai ranei te mana ki a koe ki te kohi i te tari poutapeta, me utu e koe te 7 EUR i te kaute. I te nuinga o te 4 EUR mena ka utua i runga ipurangi.","countryMsgDE":"Ka akiaki koe ki te tango i te taupānga Post & DHL kia whiwhi panui pana mo te whai i te mana o o kete:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH Ratonga Kaihoko Whakapā:\n+49-228-433-3112\nWhakapā DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Me tuku e koe etahi atu korero kawemai ki nga tikanga. Ki te kore e pena ka taea te aukati i te urunga me te whakahoki mai i te kete. \nHe korero ano: https://www.posti.fi/en/receiving/customs-clearance \nĒtahi atu hononga: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Ko nga utu whakahaere o te 4.95 EUR he utu.\nTangohia te taupānga i konei: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Ko nga utu whakahaere mo te 8.50 PLN he utu. \nMe utu e koe ina kohi i te poutapeta,\nna te mea kare pea e tukuna atu te peera ki to kuaha, pouaka mēra ranei.","countryMsgPH":"Ko te PHLPost e kiia ana he koretake me te kore pono i te Philippines.\nKia mau tonu ki to peera i etahi wa ka puta mo te tuunga tuku \nka puta noa i waenga i te 1 ki te 3 wiki mo nga peera iti. Mo nga peera nui ake, \nka taea anake te kohikohi mai i te Tari Poutapeta o Manila Central, i te waahi tata ranei \ntari poutapeta i to rohe. Kia mahara ko te utu whakahaere 112PHP mo nga peera o \nahakoa he uara ka utua e koe. Ko te kore utu ka puta mai te utu o te peera \nhoki mai ki a matou. E kiia ana he 1-2 marama te tuku na te puhoi o nga ratonga a PHLPost. \nKare koe e hiahia ki te utu taake mo nga mea kei raro iho i te 10000PHP, engari me utu koe mena he rite, kei runga ake ranei i tera moni. \nKa t��tohu matou ki a SpeedPost Express mo te tere tere ake i te wa ka ota koe mai i a maatau. Heoi, kare pea nga utu e pa ana i te mea he taunoa te D&T mo te kaiwhiwhi.","countryMsgCA":"De minimis he 20CAD mo nga ota katoa ka tukuna ki Kanata, na te mea ko Singapore tetahi waahanga o te whakaaetanga CPTPP, kare pea nga mahi e pa ana, engari ka taea te whakamahi a D&T mena ka neke ake te taonga i te 60CAD me runga ake ranei i te 100CAD me runga ake i te paepae ka whakawhirinaki ki te waehere HS o te taonga. Ko nga uara kei runga ake i tera moni ka utua te VAT.","countryMsgID":"Me utu e koe nga taake me nga taake e tika ana i te taenga mai ki Iniaone. Tena koa tirohia to peera me te utu i nga moni kua tohua ki nga tikanga Iniarangi.\nKa tonohia ano koe ki te tuku i etahi atu pepa whakamana. Ki te kore e pera, ka aukatihia te urunga, te kapohia ranei o te kete e nga tikanga whenua. Tena koa tirohia etahi atu korero i konei:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Me utu e koe nga taake me nga taake e tika ana i te taenga mai ki Inia. Tena koa tirohia to peera ka utua nga moni kua tohua ki nga tikanga Inia.\nKia mohio koe he mea tino tika te whakakore i nga tikanga i Inia, ka utua pea koe mena ka nui ake te uara o to taonga ki te 1000INR (15 USD) - i runga i te waehere HS, i te nuinga o te waa he utu kore utu, engari ka nui ake pea te utu mena kei runga ake i te 5000INR (60 USD) te utu. \nI te mea karekau a India Post e tuku ki te pouaka mēra hei paerewa, ka hiahia pea koe ki te noho ki te kainga, ki tetahi mangai mana ranei ki te tango i to kete, ki te kohi ranei i te tari poutapeta.","countryMsgMY":"De minimis he 500MYR mo nga ota katoa ka tukuna ki Malaysia. Ko nga ota kei runga ake i tera moni ka taea te utu.","countryMsgUS":"Mai i te 29 o Akuhata 2025, ka whakakorehia te iti o te USD800, ka utua nga reeti kawemai ma te taunoa mo te kaituku i te whenua taketake.\nKo nga kaipuke a USA ka WHAKAMAHI i te nama waea whaimana me te wahitau imeera kia kore ai to peera e whakaroa.","countryMsgIL":"De minimis he 240 ILS (75 USD) mo nga ota katoa ka tukuna ki a Iharaira. Ko nga ota kei runga ake i tera moni ka taea te utu. \nKia mahara mo nga ota i tukuna ki a Iharaira, kaore pea a Israel Post e whakaae ki te tuku whakamutunga ina tukuna ana. \nI te mea karekau a Israel Post e tuku ki te pouaka mēra hei paerewa, KAUPAPA me noho koe ki te kainga, ki tetahi mangai mana ranei ki te tango i to kete, ki te kohi ranei i te tari poutapeta.","countryMsgGB":"Kia mahara mo nga ota ka tukuna ki te UK, kaore pea a Royal Mail e whakaae ki te tuku whakamutunga ina tukuna ana ki to pouaka pouaka.","countryMsgTH":"De minimis he 1500THB (45 USD) mo nga ota katoa ka tukuna ki Thailand. Ko nga ota kei runga ake i tera moni ka taea te utu.","countryMsgTW":"De minimis he 2000TWD (60 USD) mo nga ota katoa ka tukuna ki Taiwan. Ko nga ota kei runga ake i tera moni ka taea te utu.","countryMsgMO":"Karekau he utu D&T ina tuku ki Macau. Engari kia mahara kaore a Macau Post e tuku ki te pouaka mēra hei paerewa, KA WHAKAMAHI koe ki te kohi i to kete ki te tari poutapeta.","countryMsgBN":"Karekau he utu D&T ina tukuna ana ki Brunei. Engari kia mahara ko Brunei Post KORE e tuku ki te pouaka mēra hei paerewa, KA WHAKAMAHI koe ki te kohikohi i to kete i te tari pou. \nKo te punaha aroturuki mo tenei whenua kaore i te tino pumau, he iti noa nga korero ka tukuna, kaare nga hua tuku whakamutunga ka tukuna ki te takenga mai.","countryMsgJP":"De minimis he 10000JPY (65 USD) mo nga ota katoa ka tukuna ki Japan. Ko nga ota kei runga ake i tera moni ka taea te utu.","countryMsgKR":"De minimis he 180000KRW (150 USD) mo nga ota katoa ka tukuna ki Korea ki te Tonga. Ko nga ota kei runga ake i tera moni ka taea te utu.","countryMsgVN":"Mo Vietnam, me noho tonu ki te WHAKAPAKI i te wa e tukuna ana na te mea ka utua koe mo nga utu whakahaere mo te tukunga o te taonga. \nDe minimis he 1000000 (35 USD) mo nga ota katoa ka tukuna ki Vietnam. Ko nga ota kei runga ake i tera moni ka taea te utu. \nI te mea karekau a Vietnam Post e tuku ki te pouaka mēra hei paerewa, ka tono pea koe me noho koe ki te kainga, he mangai mana ranei ki te tango i to kete, ki te kohi ranei ki te tari poutapeta.","countryMsgPP":"Ka whakairihia nga taonga Tapanga Whaiwhai ki POPDrop/POPStop i te tari poutāpeta. Ko nga mea Paerewa SpeedPost ka whakairia ki runga POPStop, POPStation ranei.\nKia mahara ko te tuku i nga taonga Tapanga Aroturuki ka mahia anake ia Mane ki te Paraire mai i te 9am ki te 6pm. Haunga nga wiki me nga hararei a te iwi.","lookalikeDomainWarning":"He hono tēnei ki tētahi paetukutuku e whakataruhae ana i tētahi kaikawe pūkei, ehara i te nama aroturuki. Kaua e tāuru i ō taipitopito whaiaro, utu rānei ki reira.","lookalikeDomainOfficial":"Paetukutuku ōkawa:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus menggunakan rangkaian komersial premium. Walau bagaimanapun, sebaik sahaja ia tiba di negara anda, pemindahan hak penjagaan kepada pembawa domestik tempatan (contohnya, USPS, Royal Mail, DHL tempatan). Awalan penjejakan menukar sistem pengendalian pada ambang ini, tetapi penjejak bungkusan sejagat kami menggabungkan status ini untuk memberikan anda keterlihatan tanpa gangguan.","trackingLastMileTitle":"Rangkaian Penghantaran Mile Terakhir","trackingCustomsClearanceBody":"Semua item rentas sempadan mesti membersihkan agensi kastam negara tempatan anda. Alat kami memantau peralihan daripada ketibaan kemudahan import kepada penyerahan kastam. Rondaan sempadan akan mengesahkan kod HS dan memastikan VAT atau duti yang betul telah dihantar (contohnya, IOSS di EU, VOEC di Norway). Pantau penjejakan khusus untuk amaran \"Diadakan di Kastam\".","trackingCustomsClearanceTitle":"Maklumat Pelepasan Kastam","trackingProcessingOriginBody":"Setelah diturunkan, item memasuki pusat pemprosesan asal di mana ia diimbas, ditimbang, dan tertakluk kepada pemeriksaan keselamatan eksport utama. Ia kemudian dihantar ke bursa mel antarabangsa. Jadual penerbangan bergantung pada lebar jalur kargo yang tersedia. Jangan bimbang jika ia kekal dalam keadaan ini selama beberapa hari.","trackingProcessingOriginTitle":"Sedang diproses di Hab Asal","trackingInfoReceivedBody":"Apabila pesanan pertama kali diproses di platform e-dagang kami (seperti Etsy, eBay, atau jualan langsung), nombor penjejakan dijana secara elektronik. Pembawa menerima data penghantaran sebelum pemilikan fizikal kotak. Sila berikan 1 hingga 3 hari bekerja untuk bungkusan dimasukkan ke dalam kemudahan pengisihan fizikal.","trackingInfoReceivedTitle":"maklumat yang diterima.","trackingStatusesIntro":"Terima kasih kerana menggunakan alat penjejakan bungkusan antarabangsa bersatu kami. Oleh kerana pelayaran pakej anda merentasi berbilang sempadan global, status penjejakannya boleh menjadi rumit. Memahami kitaran hayat logistik membantu menetapkan jangkaan yang jelas.","trackingStatusesTitle":"Memahami Status Penjejakan","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"pagi","pmText":"petang","footerQuickLinks":"Pautan Pantas","footerSupportLegal":"Sokongan & Perundangan","copyrightText":"Hak cipta terpelihara.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlantik)","tzEST":"EST (Timur)","tzCST":"CST (Tengah)","tzMST":"MST (Pergunungan)","tzPST":"PST (Pasifik)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Beijing","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast Kaliningrad (UTC+2)","tzMoscow":"Moscow/Rusia Barat (UTC+3)","tzSamara":"Oblast Samara (UTC+4)","tzUral":"Wilayah Ural (UTC+5)","tzOmsk":"Oblast Omsk (UTC+6)","tzKrasnoyarsk":"Krai Krasnoyarsk (UTC+7)","tzIrkutsk":"Oblast Irkutsk (UTC+8)","tzSakha":"Republik Sakha (UTC+9)","tzPrimorsky":"Krai Primorsky (UTC+10)","tzMagadan":"Oblast Magadan (UTC+11)","tzKamchatka":"Krai Kamchatka (UTC+12)","dstDayStartsLabel":"Waktu musim panas bermula","dstDayEndsLabel":"Waktu musim panas berakhir","dstRevertsLabel":"kembali ke waktu standard","dstEuropeLabel":"Eropah","dstNewZealandLabel":"New Zealand","englishResponseNotice":"Notis: Semua pertanyaan dijawab dalam bahasa Inggeris. Jika anda menyerahkan dalam bahasa lain, mesej anda mungkin diterjemahkan ke bahasa Inggeris untuk pengesahan.","parcelDisagreeCheckbox":"Saya Tidak Setuju","contactDisagreeCheckbox":"Saya Tidak Setuju","contactNamePlaceholder":"Contoh: Ahmad bin Ali","systemRequirementsTitle":"Versi minimum sistem yang disokong","systemRequirements":"Windows: Windows 7 (with ESU updates installed) atau ke atas\nmacOS: macOS 12 atau ke atas\nAndroid: Android 13 atau ke atas\niPhone/iOS: iOS 17 atau ke atas\nLinux: Pengedaran yang disokong dengan kemas kini keselamatan aktif","title":"Sahkan akses","subtitle":"Sila selesaikan cabaran di bawah untuk meneruskan.","selectLanguage":"Pilih bahasa","selectLanguagePlaceholder":"-- Pilih bahasa --","loadingChallenge":"Memuatkan cabaran...","answerLabel":"Jawapan anda:","answerPlaceholder":"Masukkan jawapan anda","continueButton":"Teruskan","refreshButton":"Cabaran baharu","verifying":"Mengesahkan...","chooseLanguageFirst":"Sila pilih bahasa terlebih dahulu.","loadFailed":"Gagal memuatkan cabaran. Sila cuba lagi.","expiredChallenge":"Cabaran tamat tempoh. Memuatkan cabaran baharu...","verifyFailed":"Pengesahan gagal. Sila cuba lagi.","goodFridayEasterGreeting":"Selamat Hari Easter! Semoga damai dan gembira pada Good Friday dan Easter.","christmasGreeting":"Selamat Hari Krismas dan Tahun Baru! Damai dan gembira dari 25 Disember hingga 5 Januari.","captchaSystemRequirements":"Keperluan minimum: Windows 7 (with ESU updates installed) atau 11, macOS 10.15+, atau versi Android/iOS terkini.","home":"Laman Utama","blog":"Blog","aboutUs":"Tentang Kami","faq":"Soalan Lazim","contact":"Hubungi","trackPackage":"Jejak Bungkusan","cnyYearOfHorseMessage":"🧧 Selamat Tahun Baru Lunar! Semoga anda makmur dan gembira dalam Tahun Kuda! 🐴","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Semoga anda dan keluarga diberkati dengan kedamaian dan kegembiraan! 🌟","deepavaliMessage":"🪔 Selamat Deepavali! Semoga perayaan cahaya membawa anda kegembiraan dan kemakmuran! ✨","diwaliMessage":"🪔 Selamat Deepavali! Semoga perayaan cahaya membawa anda kegembiraan dan kemakmuran! ✨","vesakMessage":"☸️ Selamat Hari Wesak! Semoga anda diberkati dengan kedamaian dan kebijaksanaan! 🙏","vesakTHMessage":"☸️ Selamat Hari Visakha Bucha! Semoga anda diberkati dengan kedamaian dan kebijaksanaan! 🙏","singaporeNationalDayMessage":"🇸🇬 Selamat Hari Kebangsaan Singapura! Meraikan 61 tahun kemerdekaan! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesia! Dirgahayu Republik Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Meraikan kemerdekaan negara kita! 🎊","australiaNationalDayMessage":"🇦🇺 Selamat Hari Australia! Meraikan negara kita! 🎉","canadaNationalDayMessage":"🇨🇦 Selamat Hari Kanada! Meraikan negara kita yang hebat! 🍁","usaNationalDayMessage":"🇺🇸 Selamat Hari Kemerdekaan, Amerika! Meraikan kebebasan! 🎆","franceBastilleDayMessage":"🇫🇷 Selamat Hari Bastille! Hidup Perancis! 🎊","germanyUnityDayMessage":"🇩🇪 Selamat Hari Perpaduan Jerman! 🎉","italyRepublicDayMessage":"🇮🇹 Selamat Hari Republik Itali! 🇮🇹","spainNationalDayMessage":"🇪🇸 Selamat Hari Kebangsaan Sepanyol! 🎊","japanFoundationDayMessage":"🇯🇵 Selamat Hari Penubuhan Jepun! 🎌","chinaNationalDayMessage":"🇨🇳 Selamat Hari Kebangsaan China! 🎉","koreaLiberationDayMessage":"🇰🇷 Selamat Hari Pembebasan Korea! 🎊","indiaIndependenceDayMessage":"🇮🇳 Selamat Hari Kemerdekaan India! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Selamat Hari Kebangsaan Thailand! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Selamat Hari Kemerdekaan Filipina! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Selamat Hari Kebangsaan Vietnam! 🎊","polandNationalDayMessage":"🇵🇱 Selamat Hari Kemerdekaan Poland! 🎉","czechNationalDayMessage":"🇨🇿 Selamat Hari Kemerdekaan Czech! 🎊","netherlandsKingsDayMessage":"🇳🇱 Selamat Hari Raja Belanda! 🧡","norwayConstitutionDayMessage":"🇳🇴 Selamat Hari Perlembagaan Norway! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Selamat Hari Kebangsaan Sweden! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Selamat Hari Kemerdekaan Finland! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Selamat Hari Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 Selamat Hari Kemerdekaan Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Selamat Hari St. Patrick, Ireland! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Selamat Hari Waitangi, New Zealand! 🎉","switzerlandNationalDayMessage":"🇨🇭 Selamat Hari Kebangsaan Switzerland! 🎊","austriaNationalDayMessage":"🇦🇹 Selamat Hari Kebangsaan Austria! 🎉","belgiumNationalDayMessage":"🇧🇪 Selamat Hari Kebangsaan Belgium! 🎊","russiaDayOfRussiaMessage":"🇷🇺 Selamat Hari Rusia! 🎉","taiwanFoundingDayMessage":"🇹🇼 Selamat Hari Penubuhan, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Selamat Hari Double Ten, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Selamat Hari Penubuhan SAR Hong Kong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Selamat Hari Penubuhan SAR Macau! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Selamat Hari Pekerja Antarabangsa! Meraikan buruh dan hak pekerja! 🎊","laborDayUSCAMessage":"⚒️ Selamat Hari Buruh! Menghormati sumbangan pekerja! 🎉","orderNumber":"Nombor Pesanan (Contoh: RTNX1234567890)","fromDate":"Dari Tarikh (DIPERLUKAN)","toDate":"Hingga Tarikh (DIPERLUKAN)","trackParcel":"Jejak Bungkusan","selectCourier":"-- Pilih Kurier / Negara --","optionSingPost":"🇸🇬 Pos Singapura (SingPost)","singaporeCouriers":"Kurier Singapura","topCountries":"5 Negara Teratas","otherCountries":"Negara Lain","countryAU":"🇦🇺 Australia","countryCA":"🇨🇦 Kanada","countryDE":"🇩🇪 Jerman","countryGB":"🇬🇧 United Kingdom","countryUS":"🇺🇸 Amerika Syarikat","countryAT":"🇦🇹 Austria","countryBE":"🇧🇪 Belgium","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 China","countryCZ":"🇨🇿 Republik Czech","countryFI":"🇫🇮 Finland","countryFR":"🇫🇷 Perancis","countryHK":"🇭🇰 Hong Kong SAR China","countryIN":"🇮🇳 India","countryID":"🇮🇩 Indonesia","countryIE":"🇮🇪 Ireland","countryIL":"🇮🇱 Israel","countryIT":"🇮🇹 Itali","countryJP":"🇯🇵 Jepun","countryMO":"🇲🇴 Macau SAR China","countryMY":"🇲🇾 Malaysia","countryNL":"🇳🇱 Belanda","countryNZ":"🇳🇿 New Zealand","countryNO":"🇳🇴 Norway","countryPH":"🇵🇭 Filipina","countryPL":"🇵🇱 Poland","countryPT":"🇵🇹 Portugal","countryKR":"🇰🇷 Korea Selatan","countryES":"🇪🇸 Sepanyol","countrySE":"🇸🇪 Sweden","countryCH":"🇨🇭 Switzerland","countrySG":"🇸🇬 Singapura","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Thailand","countryVN":"🇻🇳 Vietnam","note":"NOTA","disclaimer":"PENAFIAN","importantInformation":"Maklumat Penting:","didNotReceiveEmail":"Jika anda tidak menerima e-mel pengesahan dari Etsy, eBay, Shopee atau Payhip, tatal ke bawah untuk mencari pesanan anda melalui alamat e-mel atau nombor telefon yang dikaitkan dengan pesanan ini.","searchByEmailOrPhone":"Cari mengikut E-mel atau Telefon","searchOrder":"Cari Pesanan","trackingResult":"Hasil Penjejakan","noOrdersFound":"Tiada pesanan ditemui.","pleaseEnter":"Sila masukkan e-mel, telefon, atau nombor pesanan.","welcomeTitle":"Selamat datang ke laman web Rhythm Nexus!","purchaseInfo":"Beli dari kami melalui saluran rasmi, atau sertai","purchaseInfoChina":"Beli daripada kami melalui saluran rasmi kami.","purchaseInfoChinaSuffix":"","telegramGroup":"kumpulan Telegram","forUpdates":"kami untuk kemas kini rasmi.","ourStores":"Kedai Kami","etsyStore":"Kedai Etsy","ebayStore":"Kedai eBay","shopeeStore":"Kedai Shopee","payhipStore":"Kedai Payhip","internationalShipping":"Penghantaran Antarabangsa","singaporeLocal":"Tempatan Singapura","asiaOnly":"Asia sahaja","deliveryInfo":"Maklumat Penghantaran","deliveryRates2026":"Kadar Penghantaran 2026","sgDeliveryRates":"Kadar Penghantaran Singapura","speedPostRates":"Kadar SpeedPost Express Antarabangsa","aboutTitle":"Tentang Rhythm Nexus","aboutP1":"Kami memulakan kedai kami pada tahun 2022 dan telah menjual di platform seperti Etsy, eBay, dan Shopee tanpa gagal.","aboutP2":"Dari masa ke masa, kami telah membina reputasi yang kukuh dengan memberi tumpuan kepada pemenuhan yang boleh dipercayai dan penjejakan yang tepat.","aboutP3":"Matlamat kami adalah untuk memberikan pengalaman membeli-belah yang lancar dan boleh dipercayai kepada pelanggan.","aboutP4":"Terima kasih kerana menyokong Rhythm Nexus.","faqTitle":"Soalan Lazim","faqQ1":"Bagaimana jika barang saya rosak? Adakah ada waranti?","faqA1":"Ya! Kebanyakan pesanan dilengkapi dengan waranti 1 tahun. Sila berikan nombor invois/pesanan anda supaya kami boleh menyiasat. Nota: Pertukaran tidak dibenarkan jika barang sepadan dengan penerangan, walaupun anda salah memesan.","faqQ2":"Bolehkah saya edit, kemas kini atau batalkan pesanan saya?","faqA2":"Ya. Untuk keselamatan, perubahan pesanan mungkin perlu dikendalikan melalui e-mel atau di Borang Hubungi kami.","faqQ3":"Adakah saya perlu membayar cukai kastam/import?","faqA3":"Kastam dan duti umumnya tidak prabayar, kecuali untuk DDP ke Amerika Syarikat. VAT mungkin terpakai untuk EU, UK, AU/NZ, Norway, Switzerland, dan wilayah Kanada seperti Saskatchewan dan Manitoba, yang sudah dibayar secara lalai. Tiada GST dikenakan untuk Singapura. Kami tidak boleh memberi nasihat mengenai yuran kastam - hubungi kastam tempatan anda untuk butiran.","faqQ4":"Bilakah pesanan saya akan dihantar?","faqA4":"Pesanan biasanya dihantar dalam masa 1-5 hari bekerja. Semasa tempoh volum tinggi, ia mungkin mengambil masa 5-7 hari.","faqQ5":"Saya memesan dua kali secara tidak sengaja. Apa yang perlu saya lakukan?","faqA5":"Kami hanya membayar balik yuran penghantaran pendua. Kedua-dua barang akan dihantar bersama. Bayaran balik = (yuran penghantaran pertama + kedua) - yuran penghantaran sebenar.","faqQ6":"Berapa lama masa penghantaran?","faqA6":"Pemprosesan mengambil masa 1-5 hari bekerja.\n\nPenghantaran domestik:\n• SingPost Prepaid Tracked Label: 2–4 hari\n• SpeedPost Standard: 1–3 hari\n\nAntarabangsa:\n• SingPost ePAC: 14-30 hari\n• SpeedPost Priority (EMS): 8-15 hari\n• SpeedPost Express: 4-8 hari\n\nKelewatan mungkin berlaku semasa musim puncak.","faqQ7":"Barang saya sedang dikembalikan kepada pengirim. Apa yang perlu saya lakukan?","faqA7":"Satu penghantaran semula dibenarkan. Pembatalan tidak boleh untuk alamat yang tidak sah, bungkusan tidak dituntut, atau yuran kastam tidak dibayar. Hubungi perkhidmatan pos anda untuk penghantaran semula, atau mesej kami untuk bantuan.","faqQ8":"Barang saya hilang / dicuri dalam transit.","faqA8":"Kami membenarkan satu penghantaran semula. Jika ia hilang lagi, bayaran balik penuh dikeluarkan selepas tetingkap penghantaran kurier:\n\n• Perkhidmatan Tempatan Singapura: 7 hari\n• SingPost ePAC & SpeedPost Priority International: 30 hari\n• SpeedPost Intl Express: 14 hari","blogTitle":"Pangkalan Pengetahuan Penghantaran & Pos","blogSubtitle":"Penjelasan rasmi tentang perkhidmatan pos, kastam, VAT dan duti.","readMore":"Baca Lagi","backButton":"Kembali","blogPost1Title":"Apakah SingPost ePAC?","blogPost1Desc":"Ketahui tentang SingPost ePAC (ePacket), perkhidmatan pos jejak ekonomi.","blogPost2Title":"Apakah SpeedPost Priority International (EMS)?","blogPost2Desc":"Temui EMS, perkhidmatan ekspres pos premium antarabangsa.","blogPost3Title":"Apakah SpeedPost Express?","blogPost3Desc":"Terokai SpeedPost Express dengan penghantaran DHL Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Fahami PDDP untuk AS.","blogPost5Title":"VAT EU & IOSS","blogPost5Desc":"Pandangan tentang VAT EU dan sistem IOSS.","blogPost6Title":"VAT UK & HMRC","blogPost6Desc":"Keperluan VAT untuk UK.","blogPost7Title":"Norway VOEC","blogPost7Desc":"Sistem VOEC Norway.","blogPost8Title":"VAT Switzerland","blogPost8Desc":"Keperluan VAT Switzerland.","enterDestinationPostcode":"Masukkan poskod destinasi","trackingNumberExample":"cth. LG123456789SG","trackingCaseSensitive":"HURUF JEJAK ADALAH SENSITIF HURUF DAN MESTI DALAM HURUF BESAR.","usaPostcodeNote":"Untuk negara tanpa poskod, seperti Hong Kong & Macau, sila masukkan 999077 (Hong Kong) atau 999078 (Macau).","epacDeliveryNote":"Sila ambil perhatian bahawa semua item ePAC yang dihantar ke destinasi sepatutnya dihantar ke peti surat anda, pintu rumah, loker bungkusan atau ditinggalkan di tempat yang selamat!","currentTime":"Masa Semasa","timezoneNote":"Masa ditunjukkan dalam format 12 jam","sameTimeAsSingapore":"Masa yang sama dengan Singapura","hourAhead":"jam lebih awal daripada Singapura","hoursAhead":"jam lebih awal daripada Singapura","hourBehind":"jam lewat daripada Singapura","hoursBehind":"jam lewat daripada Singapura","countriesNoMailbox":"Negara yang diketahui tidak mempunyai penghantaran peti surat/kotak surat: Brunei, China, India, Israel, Macau SAR China, Filipina, Poland dan Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus TIDAK BERTANGGUNGJAWAB untuk mengendalikan penghantaran kerana ia di luar kawalan kami dan kami dengan senang hati lebih suka anda menjejak status item anda.","issuesAfterDelivery":"Sebarang masalah dengan penghantaran anda selepas 30/45 hari (14 hari untuk SpeedPost Express) atau status menunjukkan dihantar tetapi anda tidak menerima, sila hubungi kami","cannotUseEmbed":"Kami tidak dapat menggunakan embed untuk penjejakan kerana kebanyakan laman web perkhidmatan pos tidak menyokongnya.","clickLinkAbove":"Sila klik pautan di atas untuk menjejak bungkusan anda.","trackingDetailsNote":"Perhatikan bahawa butiran penjejakan mungkin tidak muncul dalam hasil carian, jadi disyorkan untuk menampal nombor penjejakan ke dalam sistem untuk menjejak item.","thirdPartyWebsites":"Anda juga boleh menjejak bungkusan anda di laman web pihak ketiga ini juga:","enterEmailOrPhone":"Masukkan e-mel atau telefon","collectAtPostOffice":"Walau bagaimanapun, jika negara anda tidak mempunyai peti surat sebagai standard tersedia, anda perlu mengambilnya di pejabat pos.","reviewShippingRates":"Semak kadar penghantaran semasa kami","here":"di sini","contactUsForm":"Sila hubungi kami melalui","form":"borang","forEnquiries":"ini untuk sebarang pertanyaan yang anda ada mengenai pesanan anda.","anPostNoDirectTracking":"An Post (Ireland) tidak menyokong pautan penjejakan terus atau penjejakan terbenam.","anPostPasteManually":"Sila tampal nombor penjejakan anda secara manual di laman web An Post untuk menjejak bungkusan anda:","goToAnPost":"Pergi ke An Post","countryMsgNL":"Jika status menunjukkan 'Held by Customs', sila hubungi Talian Maklumat Kastam Belanda untuk bantuan:\n0800 0143 (percuma), Isnin-Jumaat 7 pagi - 11 malam.\nSabtu & Ahad 8 pagi - 4:30 petang.\n\nDisyorkan untuk mendaftar akaun dengan PostNL untuk menerima pemberitahuan segera bungkusan anda:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nJika dihantar ke PostNL Point atau status memberitahu anda mengambil di pejabat pos, anda perlu membayar 7 EUR di kaunter. Maksimum 4 EUR jika dibayar dalam talian.","countryMsgDE":"Kami menggalakkan anda memuat turun aplikasi Post & DHL untuk menerima pemberitahuan status penjejakan bungkusan anda:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nHubungi Perkhidmatan Pelanggan DHL Paket GmbH:\n+49-228-433-3112\nHubungi DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Anda perlu mengemukakan pengisytiharan import tambahan dengan kastam. Jika tidak, ia boleh menyebabkan sekatan kemasukan dan bungkusan dipulangkan. \nMaklumat lanjut: https://www.posti.fi/en/receiving/customs-clearance \nPautan lain: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Yuran pemprosesan 4.95 EUR dikenakan.\nMuat turun aplikasi di sini: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Yuran pemprosesan 8.50 PLN dikenakan. \nAnda perlu membayar ini apabila mengambil di pejabat pos,\nkerana bungkusan tidak mungkin dihantar ke pintu atau peti surat anda.","countryMsgPH":"PHLPost di Filipina dianggap tidak cekap dan tidak boleh dipercayai.\nSila sentiasa jejak bungkusan anda kerana status 'sedang dalam penghantaran'\nkadang-kadang hanya ditunjukkan selama 1-3 minggu untuk bungkusan kecil. Untuk bungkusan besar,\nmengambil hanya mungkin di Manila Central Post Office atau\npejabat pos terdekat di kawasan anda. Sila ambil perhatian bahawa yuran pemprosesan 112 PHP untuk bungkusan\napa-apa nilai dikenakan yang anda perlu bayar. Kegagalan membayar akan menyebabkan bungkusan\ndipulangkan kepada kami. Penghantaran dijangka mengambil masa 1-2 bulan kerana perkhidmatan PHLPost yang perlahan. \nAnda tidak perlu membayar cukai untuk item di bawah 10000 PHP, tetapi anda perlu berbuat demikian jika nilainya sama atau melebihi jumlah itu. \nKami akan mengesyorkan SpeedPost Express untuk proses yang lebih cepat pada masa akan datang apabila anda memesan dari kami. Walau bagaimanapun, yuran mungkin tidak dikenakan kerana D&T untuk penerima adalah lalai.","countryMsgCA":"De minimis ialah 20 CAD untuk semua pesanan yang dihantar ke Kanada. Memandangkan Singapura adalah sebahagian daripada perjanjian CPTPP, duti mungkin tidak dikenakan, tetapi D&T mungkin dikenakan jika item melebihi ambang 60 CAD ke atas atau 100 CAD ke atas, yang boleh bergantung pada kod HS item. Apa-apa nilai di atas jumlah itu akan dikenakan VAT dengan sewajarnya.","countryMsgID":"Anda perlu membayar sebarang cukai dan duti yang berkenaan apabila tiba di Indonesia. Sila jejak bungkusan anda dan bayar jumlah yang dinyatakan kepada kastam Indonesia.\nAnda juga perlu mengemukakan dokumentasi pelepasan kastam tambahan. Jika tidak, ia boleh menyebabkan sekatan kemasukan atau bungkusan dirampas oleh kastam negara. Sila semak butiran lanjut di sini:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Anda perlu membayar sebarang cukai dan duti yang berkenaan apabila tiba di India. Sila jejak bungkusan anda dan bayar jumlah yang dinyatakan kepada kastam India.\nSila ambil perhatian bahawa pelepasan kastam di India adalah ketat, dan anda mungkin atau mungkin tidak dikenakan duti jika nilai item anda melebihi 1000 INR (15 USD) - bergantung pada kod HS, dalam kebanyakan kes ia adalah bebas duti, tetapi anda boleh dikenakan duti yang lebih tinggi jika item melebihi 5000 INR (60 USD). \nMemandangkan India Post TIDAK menghantar ke peti surat secara standard, anda mungkin perlu berada di rumah atau wakil yang dibenarkan untuk menerima bungkusan anda atau mengambil di pejabat pos.","countryMsgMY":"De minimis ialah 500 MYR untuk semua pesanan yang dihantar ke Malaysia. Pesanan melebihi jumlah itu boleh dikenakan caj.","countryMsgUS":"Mulai 29 Ogos 2025, de minimis USD800 akan dihapuskan secara rasmi dan duti import akan dibayar secara lalai oleh penghantar di negara asal.\nPenghantaran USA MEMERLUKAN nombor telefon dan alamat e-mel yang sah untuk bungkusan anda mengelakkan kelewatan selanjutnya.","countryMsgIL":"De minimis ialah 240 ILS (75 USD) untuk semua penghantaran ke Israel. Pesanan melebihi jumlah itu boleh dikenakan caj. \nSila ambil perhatian bahawa untuk pesanan yang dihantar ke Israel, Israel Post kadang-kadang mungkin tidak mengakui penghantaran akhir sebaik sahaja ia dihantar. \nMemandangkan Israel Post TIDAK menghantar ke peti surat secara standard, anda mungkin perlu berada di rumah atau wakil yang dibenarkan untuk menerima bungkusan anda atau mengambil di pejabat pos.","countryMsgGB":"Sila ambil perhatian bahawa untuk pesanan yang dihantar ke UK, Royal Mail kadang-kadang mungkin tidak mengakui penghantaran akhir sebaik sahaja ia dihantar ke peti surat anda.","countryMsgTH":"De minimis ialah 1500 THB (45 USD) untuk semua penghantaran ke Thailand. Pesanan melebihi jumlah itu boleh dikenakan caj.","countryMsgTW":"De minimis ialah 2000 TWD (60 USD) untuk semua penghantaran ke Taiwan. Pesanan melebihi jumlah itu boleh dikenakan caj.","countryMsgMO":"Tiada D&T dikenakan apabila menghantar ke Macau. Walau bagaimanapun, sila ambil perhatian bahawa Macau Post TIDAK menghantar ke peti surat secara standard, anda MESTI mengambil bungkusan anda di pejabat pos.","countryMsgBN":"Tiada D&T dikenakan apabila menghantar ke Brunei. Walau bagaimanapun, sila ambil perhatian bahawa Brunei Post TIDAK menghantar ke peti surat secara standard, anda MESTI mengambil bungkusan anda di pejabat pos. \nSistem penjejakan untuk negara ini tidak begitu stabil dan maklumat terhad boleh diberikan, dan keputusan penghantaran akhir TIDAK diberikan kepada asal.","countryMsgJP":"De minimis ialah 10000 JPY (65 USD) untuk semua penghantaran ke Jepun. Pesanan melebihi jumlah itu boleh dikenakan caj.","countryMsgKR":"De minimis ialah 180000 KRW (150 USD) untuk semua penghantaran ke Korea Selatan. Pesanan melebihi jumlah itu boleh dikenakan caj.","countryMsgVN":"Untuk Vietnam, sila sentiasa BOLEH DIHUBUNGI semasa penghantaran kerana anda mungkin dikenakan yuran pemprosesan semasa penghantaran item. \nDe minimis ialah 1000000 (35 USD) untuk semua penghantaran ke Vietnam. Pesanan melebihi jumlah itu boleh dikenakan caj. \nMemandangkan Vietnam Post TIDAK menghantar ke peti surat secara standard, anda mungkin perlu berada di rumah atau wakil yang dibenarkan untuk menerima bungkusan anda atau mengambil di pejabat pos.","countryMsgPP":"Item Tracked Label akan disiarkan dalam POPDrop/POPStop di pejabat pos. Item SpeedPost Standard biasanya disiarkan di POPStop atau POPStation.\nSila ambil perhatian bahawa penghantaran item Tracked Label adalah HANYA dari Isnin hingga Jumaat, 9 pagi hingga 6 petang. Kecuali pada hujung minggu dan cuti umum.","postedDate":"Tarikh Dipos:","status":"Status:","shippedVia":"Dihantar melalui:","destination":"Destinasi:","statusInPreparation":"Dalam persediaan","statusInTransit":"Dalam transit","statusDelivered":"Telah dihantar","statusOutForDelivery":"Keluar untuk penghantaran","statusArrived":"Tiba","statusProcessing":"Dalam pemprosesan","statusDispatched":"Dihantar","statusReturned":"Dikembalikan","statusFailed":"Gagal dihantar","statusCancelled":"Dibatalkan","statusHeldByCustoms":"Ditahan oleh kastam","statusAwaitingCollection":"Menunggu pengambilan","aka":"juga dikenali sebagai","thisServiceKnownAs":"Perkhidmatan ini dikenali sebagai","in":"di","viewTrackingDHL":"Lihat maklumat penjejakan dari DHL Express","viewTrackingSingPostSpeedPost":"Lihat maklumat penjejakan dari Singapore SpeedPost","viewTrackingDHLLastMile":"Lihat maklumat penjejakan dari DHL Express (Batu terakhir)","viewTrackingDHLShipperRef":"Lihat maklumat penjejakan dari DHL Express (Rujukan pengirim)","viewTrackingSingPost":"Lihat maklumat penjejakan dari Singapore Post","viewTrackingDestPost":"Lihat maklumat penjejakan dari","post":"Pos","orderNumberExample":"Nombor Pesanan (bermula dengan RTNX - contoh: RTNX1234567890):","deliveryRecordNote":"Sila ambil perhatian bahawa setelah item dihantar, rekod hanya akan disimpan sehingga 7 hari dan akan dipadamkan.","copyrightAllRights":"Hak cipta terpelihara.","epacUS":"Perkhidmatan Pakej Antarabangsa Kelas Pertama","epacCH":"Keutamaan Plus","epacGB":"Antarabangsa Dijejaki","epacMY":"Jejak/Ekspres Antarabangsa","epacCA":"Express Masuk Antarabangsa","epacAU":"Pek dan Jejak Antarabangsa","epacNZ":"Penjejakan Ekonomi Antarabangsa","epacDE":"Warenpost International Premium","epacFR":"Surat antarabangsa dengan penjejakan","epacNL":"Paket Antarabangsa Dijejaki","epacPL":"Ekspres GLOBAL","epacBE":"Perdana Masuk Antarabangsa","epacAT":"Pakej Dijejak Antarabangsa","epacIN":"Pakej Dijejak Antarabangsa","epacFI":"Surat Dijejak Antarabangsa","epacSE":"Surat Dijejak Antarabangsa","epacNO":"Ekspres PRIME","epacIT":"Ekspres","epacIL":"Ekspres","epacES":"Pakej Ringan Antarabangsa","epacPT":"Mel Biru Antarabangsa","epacCZ":"Penghantaran dijejak dari luar negara","epacBN":"ePacket Antarabangsa","epacCN":"ePacket Antarabangsa","epacHK":"ePacket Antarabangsa","epacID":"e-Pakej Antarabangsa","epacMO":"ePacket Antarabangsa","epacPH":"Mel Berjejak Antarabangsa","epacTW":"ePacket Antarabangsa","epacTH":"ePacket Antarabangsa","epacVN":"E-Pakej Antarabangsa (Pakej ASEAN)","epacKR":"K-Paket","epacJP":"e-Pakej Antarabangsa Light","epacIE":"Pos Express Antarabangsa","blogSingPostEPACContent1":"SingPost ePAC (ePacket) adalah perkhidmatan pos jejak ekonomi untuk penghantaran e-dagang antarabangsa ringan.","blogSingPostEPACContent2":"Ia dihantar oleh pengendali pos nasional negara destinasi dan biasanya digunakan untuk bungkusan di bawah 2 kg, dengan had dimensi panjang + lebar + tinggi di bawah 90 cm dan panjang tidak melebihi 60 cm.","blogSingPostEPACContent3":"Pilihan ini pada mulanya hanya ditawarkan oleh Hong Kong Post bersama eBay China, membolehkan bungkusan dari China dan Hong Kong dihantar ke AS dengan penjejakan penghantaran tanpa memerlukan tandatangan semasa penghantaran. Perkhidmatan ini dikenali sebagai USPS (United States Postal Service) First-Class Package International Service di AS.","blogSingPostEPACContent4":"Mulai 1 Januari 2026, ePAC kini digunakan untuk semua negara untuk mematuhi peraturan UPU mandatori yang memerlukan penjejakan untuk bungkusan dan mengehadkan barang berdaftar hanya untuk dokumen.","blogSingPostEPACContent5":"Awalan penjejakan: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS adalah perkhidmatan ekspres pos antarabangsa premium, diutamakan oleh pengendali pos di seluruh dunia.","blogSpeedPostEMSContent2":"Pelepasan kastam umumnya lebih cepat daripada mel standard tetapi lebih ketat dalam proses, dengan penjejakan penuh sehingga penghantaran.","blogSpeedPostEMSContent3":"Di Singapura, ini dikenali sebagai SpeedPost Priority International oleh SingPost.","blogSpeedPostEMSContent4":"Awalan penjejakan: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express adalah perkhidmatan gred kurier.","blogSpeedPostExpressContent2":"Di banyak destinasi, DHL Express melakukan penghantaran batu terakhir dan mengutip duti atau cukai sebelum pelepasan.","blogSpeedPostExpressContent3":"Awalan penjejakan: PX123456789SG (Batu terakhir DHL Express menggunakan nombor penjejakan 10 digit, yang tidak kelihatan kepada orang ramai, tetapi kami mempunyai maklumat untuknya melalui","blogSpeedPostExpressContent3Link":"Sistem Penjejakan kami.","blogUSPDDPContent1":"PDDP membolehkan duti import dan cukai AS dibayar terlebih dahulu sebelum penghantaran, mengurangkan caj mengejut untuk penerima.","blogUSPDDPContent2":"Peraturan Baru (Berkesan 29 Ogos 2025)","blogUSPDDPContent2List1":"Kod HTS mandatori","blogUSPDDPContent2List2":"Penerangan barang yang tepat","blogUSPDDPContent2List3":"Penguatkuasaan tarif yang lebih ketat","blogUSPDDPContent3":"Semua barang yang dihantar ke AS tidak akan dikenakan tarif tambahan kepada penerima kerana kami membayar bagi pihak anda. Walau bagaimanapun, ambil perhatian bahawa harga barang secara lalai termasuk yuran import 10% untuk mematuhi peraturan.","blogUSPDDPContent4":"Ini hanya terpakai untuk kaedah penghantaran kami ke AS, SpeedPost Priority International (EMS) dan SingPost ePAC sahaja.","blogEUIOSSContent1":"EU mengenakan VAT ke atas semua import komersial tanpa mengira nilai.","blogEUIOSSContent2":"IOSS (Import Kedai Sehenti)","blogEUIOSSContent3":"IOSS membolehkan penjual mengutip VAT EU semasa pembayaran untuk penghantaran sehingga €150.","blogEUIOSSContent4":"VAT kemudiannya dirujuk melalui sistem IOSS, membolehkan pelepasan kastam lebih cepat dan tiada kutipan VAT semasa penghantaran.","blogEUIOSSContent5":"Untuk semua pesanan melalui Etsy atau eBay, VAT IOSS sudah dikutip semasa pembayaran dan kami akan menunjukkannya pada Nombor Rujukan Cukai untuk menghantar data ke perkhidmatan pos destinasi melalui EDI (Electronic Data Interchange).","blogUKVATContent1":"UK memerlukan VAT diambil kira untuk barang import.","blogUKVATContent2":"Untuk penghantaran bernilai rendah, VAT biasanya dikutip semasa pembayaran dan dirujuk terus kepada HMRC oleh penjual atau pasaran.","blogUKVATContent3":"Untuk penghantaran bernilai lebih tinggi, VAT mungkin dikutip oleh pembawa sebelum penghantaran.","blogUKVATContent4":"Untuk semua pesanan melalui Etsy atau eBay, VAT sudah dikutip semasa pembayaran dan kami akan menunjukkannya pada Nombor Rujukan Cukai untuk menghantar data ke perkhidmatan pos destinasi melalui EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"Norway memperkenalkan sistem VOEC (VAT on E-Commerce) untuk barang yang diimport dari luar EU/EEA. Ini terpakai untuk barang bernilai sehingga 3,000 NOK.","blogNorwayVOECContent2":"Penjual boleh mendaftar dalam skim VOEC untuk mengutip VAT Norway semasa pembayaran, membolehkan pelepasan kastam lebih cepat dan tiada kutipan VAT semasa penghantaran.","blogNorwayVOECContent3":"Untuk semua pesanan melalui Etsy atau eBay, VAT VOEC sudah dikutip semasa pembayaran. Penjejakan dan kertas kerja kastam menunjukkan Nombor Rujukan Cukai untuk menghantar data ke perkhidmatan pos Norway.","blogSwissVATContent1":"Switzerland mengenakan VAT ke atas barang import tanpa mengira nilai. Pentadbiran Kastam Persekutuan Switzerland memerlukan penjual asing mengutip VAT semasa pembayaran untuk barang sehingga 65 CHF.","blogSwissVATContent2":"Penjual yang berdaftar di bawah sistem VAT Switzerland menghantar VAT yang dikutip secara langsung, memastikan penerima tidak mengalami caj VAT tambahan semasa penghantaran.","blogSwissVATContent3":"Untuk semua pesanan melalui Etsy atau eBay, VAT Switzerland sudah dikutip semasa pembayaran, dan kertas kerja kastam termasuk Nombor Rujukan Cukai untuk penyerahan EDI.","dhlNoEmbed":"DHL Express tidak menyokong penjejakan melalui embed. Sila","speedPostNoEmbed":"SpeedPost Singapura tidak menyokong penjejakan melalui embed. Sila","operatorNoEmbed":"tidak menyokong penjejakan melalui embed. Sila","clickHere":"klik di sini","toTrackNewTab":"untuk menjejak (buka dalam tab baru).","countryRU":"🇷🇺 Rusia","russiaServiceSuspended":"⚠️ NOTIS PENTING: Memandangkan pencerobohan Rusia ke Ukraine pada tahun 2022, SingPost bersama DHL telah menggantung semua penghantaran ke Rusia. Kami pada masa ini tidak berkhidmat untuk Rusia sehingga ada pengumuman pemulihan perkhidmatan ke negara tersebut.","temporaryClosureNoticeTitle":"Rhythm Nexus - Notis Penutupan Sementara","temporaryClosureNoticeBody":"Pelanggan yang dihargai,\n\nSila ambil maklum bahawa Rhythm Nexus akan ditutup sementara dari 21 Mac 2026 hingga 26 Mac 2026 disebabkan acara syarikat.\n\nSebagai persediaan penutupan, kedai akan diletakkan dalam mod percutian bermula 20 Mac 2026 pada 3:00 PM (UTC +8). Pesanan yang dibuat selepas waktu ini mungkin tidak diproses sehingga kami menyambung semula operasi.\n\nOperasi perniagaan biasa akan disambung semula pada 27 Mac 2026.\n\nKami memohon maaf atas sebarang kesulitan dan menghargai pemahaman serta sokongan berterusan anda.\n\nTerima kasih.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Saya faham","parcelTracking":"Penjejakan Bungkusan","serviceAnnouncement":"Pengumuman Perkhidmatan","usaWinterStormTitle":"SEGERA: Ribut Musim Sejuk Teruk - Gangguan Perkhidmatan","usaWinterStormSubtitle":"Perkhidmatan Pos Amerika Syarikat (USPS) Peristiwa Keadaan Memaksa","usaWinterStormNotice1":"Disebabkan ribut musim sejuk teruk yang menjejaskan rantau New York sejak 23 Februari 2026:","usaWinterStormNotice2":"Operasi antarabangsa di Lapangan Terbang Antarabangsa John F. Kennedy telah dihentikan dengan berkesan","usaWinterStormNotice3":"Pembatalan penerbangan yang meluas dan gangguan ketara kepada perkhidmatan lapangan terbang dilaporkan","usaWinterStormNotice4":"Keadaan ini merupakan peristiwa keadaan memaksa di luar kawalan USPS","usaWinterStormNotice5":"Kesan Perkhidmatan:","usaWinterStormNotice6":"Campuran berbahaya hujan salji lebat, hujan berais, hujan bercampur salji dan sejuk yang gawat","usaWinterStormNotice7":"Gangguan besar dan gangguan bekalan kuasa meluas dilaporkan","usaWinterStormNotice8":"Kutipan dan penghantaran mel dalam negara dan antarabangsa (mel, paket dan barang EMS) terkesan","usaWinterStormNotice9":"Kawasan Kod Pos yang Terjejaskan:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS mengambil semua langkah yang perlu untuk meminimalkan kesulitan kepada pelanggan sambil menjaga keselamatan pekerja. Kami menghargai kesabaran dan pemahaman anda semasa peristiwa keadaan memaksa ini.","usaWinterStormNotice12":"Dikemaskini terakhir: 25 Februari 2026","countryAutoDetected":"Destinasi ditetapkan terlebih dahulu berdasarkan lokasi anda","countryAutoDetectedFromLink":"Destinasi ditetapkan terlebih dahulu daripada pautan","trackingNumber":"Nombor Penjejakan","destinationCountry":"Negara Destinasi","postcode":"Poskod","fillAllFields":"Sila isi semua medan yang diperlukan: nombor penjejakan, negara destinasi, nombor pesanan dan poskod.","noOrderMatchingFields":"Tiada pesanan ditemui sepadan dengan semua medan.","postcodeRequired":"Poskod diperlukan untuk destinasi ini.","invalidUSZip":"Poskod AS tidak sah. Gunakan 5 digit atau ZIP+4.","failedGenerateURL":"Gagal menjana URL penjejakan. Sila semak input.","trackingValidationSG":"Nombor penjejakan untuk Singapura mestilah: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG atau PX123456789SG. Untuk Penghantaran DHL gunakan nombor 10 digit.","invalidSingPostFormat":"Format nombor penjejakan SingPost tidak sah.\nFormat yang diterima:\n• PP123456789SG → Label Jejak Prabayar\n• SPNDD00012345 → Penjejakan Standard SpeedPost","australianDSTTitle":"Waktu Penjimatan Siang Australia Aktif","australianDSTBothMessage":"Kedua-dua AEDT (Waktu Siang Timur Australia) dan ACDT (Waktu Siang Tengah Australia) sedang berkuat kuasa.","australianAEDTMessage":"AEDT (Waktu Siang Timur Australia) sedang berkuat kuasa untuk Sydney, Melbourne dan kawasan sekitar.","australianACDTMessage":"ACDT (Waktu Siang Tengah Australia) sedang berkuat kuasa untuk Adelaide dan Australia Selatan.","australianDSTNote":"Masa penghantaran yang dipaparkan di atas mencerminkan masa penjimatan siang semasa.","filteredAllowedDestinations":"(Ditapis untuk destinasi yang dibenarkan anda)","loadingAnnouncements":"Memuatkan pengumuman...","unableToLoadAnnouncements":"Tidak dapat memuatkan pengumuman perkhidmatan pada masa ini.","viewOnSingPostWebsite":"Lihat di Laman Web SingPost →","statusHeldByCustms":"Dipegang oleh Kastam","accessRestricted":"Akses Terhad","vpnDetectedMessage":"Penggunaan VPN dikesan. Sila lumpuhkan VPN untuk mengakses perkhidmatan ini.","contactSupportError":"Jika anda percaya ini adalah ralat, sila hubungi sokongan.","postalContactsTitle":"Kenalan Perkhidmatan Pos","postalContactsNote":"Nota:","postalContactsPolandUKNote":"Untuk Poland & UK, semua item yang dihantar melalui SpeedPost Priority (EMS) akan dikendalikan oleh Pocztex dan Parcelforce.","postalContactsDHLNote":"Untuk penghantaran SpeedPost Express, sila hubungi DHL melalui pautan ini:","postalContactsCountry":"Negara","postalContactsWebsite":"Laman web","postalContactsForm":"Borang Hubungi","postalContactsPhone":"Nombor Telefon","postalContactsEmail":"E-mel Hubungi","postalContactsFormLink":"Borang Hubungi","postalContactsBackButton":"Kembali ke Borang Pertanyaan Bungkusan","destinationNotAllowed":"Akses ke negara destinasi ini tidak tersedia dari lokasi anda. Sila pilih destinasi lain.","contactUsTitle":"Hubungi Kami","contactNameLabel":"Nama (nama panggilan atau nombor telefon tidak dibenarkan)","contactEmailLabel":"Alamat E-mel (kami akan membalas anda)","contactEmailNote":"E-mel relay peribadi (cth: @privaterelay.appleid.com) tidak diterima. Sila gunakan alamat e-mel yang sah.","contactEnquiryTypeLabel":"Ini tentang apa?","contactSelectOption":"Pilih pilihan","contactGeneralEnquiry":"Pertanyaan Am / Maklum Balas","contactBusinessEnquiry":"Pertanyaan Perniagaan","contactOrderShippingEnquiry":"Pertanyaan Pesanan/Penghantaran","contactExchangeRefundEnquiry":"Pertanyaan Tukar/Bayaran Balik/Pulangan","contactOthers":"Lain-lain","contactParcelWarning":"Jika bungkusan anda tidak dihantar dalam lebih daripada 18/30/45 hari (FedEx 14 hari), atau menunjukkan status dihantar tetapi anda tidak menerimanya, sila isi","contactParcelWarningLink":"borang ini","contactParcelWarningEnd":"sebaliknya.","contactOrderNumberLabel":"Nombor Pesanan","contactOrderNumberPlaceholder":"Contoh: RTNX1234567890","contactPlatformNote":"Nombor pesanan Etsy, eBay & Shopee di sini. Kami TIADA kawalan ke atas bayaran balik dari platform ini. Sila hubungi khidmat pelanggan mereka masing-masing.","contactPlatformInstructions":"Sila gunakan aplikasi untuk melihat nombor pesanan anda, kerana ia disimpan dalam aplikasi:","contactPlatformEtsy":"Etsy - Atas kanan pada profil anda → Pembelian","contactPlatformEbay":"eBay - eBay Saya → Pembelian","contactPlatformShopee":"Shopee - Saya → Lihat Sejarah Pembelian (atau anda boleh klik Untuk Dihantar/Untuk Diterima)","contactRefundNote1":"Jika anda bertanya mengenai Pulangan/Bayaran Balik untuk platform yang anda beli, sila ambil perhatian bahawa kami TIADA kawalan ke atas bayaran balik dari platform ini. Sila hubungi khidmat pelanggan mereka masing-masing.","contactRefundNote2":"Untuk Pulangan atau Tukar, kami tidak membenarkan untuk sarung tangan maimai jika ia telah digunakan semasa dibuka (kesan kotoran yang kelihatan atau dibasuh dalam mesin basuh/basuh manual), dan tiada pulangan atau tukar dibenarkan untuk kad hiburan. Terima kasih.","contactRefundNote3":"Sila ambil perhatian bahawa untuk bayaran balik melalui Payhip, jika anda belum menerima bayaran balik, hubungi bank anda atau sokongan Payhip di support@payhip.com kerana kami tiada kawalan ke atas proses tersebut.","contactMessageLabel":"Mesej Anda (sehingga 1000 aksara)","contactCharacterCount":"aksara","contactSpamWarningNote":"Nota:","contactSpamWarning":"Tawaran yang tidak diminta untuk SEO, reka bentuk laman web, pinjaman, atau perkhidmatan serupa akan ditolak secara automatik.","contactAgreementText1":"Sila klik \"Saya Bersetuju\", jika anda bersetuju alamat e-mel anda digunakan oleh Rhythm Nexus untuk membalas anda, kerana ini diperlukan oleh kami untuk membaca respons anda dan membalas anda sebaik sahaja kami mendapat penyelesaian untuk pertanyaan anda.","contactAgreementText2":"Sila ambil perhatian bahawa respons kami akan mengambil masa antara 3-5 hari bekerja, atau lebih lama semasa jumlah e-mel yang tinggi di pihak kami.","contactAgreeCheckbox":"Saya Bersetuju","contactSuccessMessage":"Mesej anda telah berjaya dihantar! Kami akan membalas dalam 3-5 hari bekerja.","contactErrorMessage":"Gagal menghantar mesej. Sila cuba lagi.","contactGeneralError":"Ralat berlaku. Sila cuba lagi kemudian.","contactSubmitting":"Menghantar...","contactSubmit":"Hantar","contactAlertAgree":"Sila bersetuju dengan terma untuk menghantar borang.","parcelEnquiryTitle":"Pertanyaan Bungkusan","parcelInfoText":"Borang ini untuk bungkusan yang tidak dihantar dalam lebih daripada 18/30/45 hari (14 hari untuk FedEx/DHL), atau telah menunjukkan status dihantar tetapi tidak bersama anda.","parcelInfoLink":"Klik di sini","parcelInfoEnd":"untuk pertanyaan lain.","parcelWaitTitle":"Sila Tunggu Bungkusan Anda","parcelWaitText1":"Sila tunggu bungkusan anda dihantar. Sila ambil perhatian penghantaran Antarabangsa TIDAK sama dengan penghantaran tempatan kerana ia memerlukan masa. Terima kasih!","parcelWaitText2":"Jika tiada status ditunjukkan selepas 18 hari (7 hari untuk Singapura) atau lebih, anda boleh memberitahu kami secara langsung.","parcelCannotSubmit":"Anda tidak boleh menghantar borang ini jika anda memilih \"Tidak\".","parcelNameLabel":"Nama","parcelOrderNumberLabel":"Nombor Pesanan (Contoh: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Alamat E-mel (Kami akan membalas anda melalui sini)","parcelEmailNote":"E-mel relay peribadi tidak diterima. Sila gunakan alamat e-mel yang sah.","parcelShippingMethodLabel":"Kaedah Penghantaran Dipilih?","parcelSelectShipping":"Pilih kaedah penghantaran","parcelSingPostEpac":"SingPost ePacket (atau ePAC) - aka SpeedPost Saver International (Penjejakan: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Penjejakan: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Penjejakan: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Penjejakan: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Penjejakan: PX123456789SG)","parcelDHL":"DHL Express (Negara EU Sahaja) (Penjejakan: 1234567890)","parcelTrackingNumberLabel":"Nombor penjejakan bungkusan anda?","parcelUndeliveredLabel":"Adakah bungkusan anda tidak dihantar dalam lebih daripada 18/30/45 hari? (Perkhidmatan Tempatan Singapura >7 hari, >14 hari untuk SpeedPost Express/DHL)","parcelSelectOption":"Pilih pilihan","parcelYes":"Ya","parcelNo":"Tidak","parcelDeliveredButMissingLabel":"Adakah bungkusan anda menunjukkan status dihantar, tetapi tidak ada dalam peti mel/tempat selamat/depan pintu anda?","parcelCaseReferenceLabel":"ID Rujukan Kes dari Pejabat Pos Tempatan","parcelCaseReferencePlaceholder":"Letakkan NA jika anda dari Singapura","parcelCaseReferenceNote":"Sebelum menghantar borang ini, sila hubungi pejabat pos tempatan anda melalui telefon atau e-mel dan dapatkan ID rujukan kes dari mereka. Kemudian, letakkan ID rujukan kes anda di sini.","parcelCaseReferenceLink":"Rujuk pautan ini untuk kenalan Perkhidmatan Pos","parcelCaseReferenceMandatory":"LETAKKAN NA SAHAJA JIKA ANDA DARI SINGAPURA. Untuk negara lain ia adalah WAJIB untuk disediakan. Diperlukan untuk SpeedPost Express juga, untuk ID kes DHL.","parcelImageEvidenceLabel":"Bukti Gambar (untuk bungkusan dihantar tetapi hilang)","parcelImageWarning":"Untuk pengesahan tambahan, kami memerlukan bukti gambar untuk membuktikan bahawa anda tidak membuat tuntutan palsu tentang ketidakhantaran bungkusan. (Hanya untuk bungkusan yang sudah dihantar, tetapi tidak ada dalam peti mel/di luar depan pintu. Kami mungkin menolak tuntutan anda jika tiada bukti foto diberikan untuk item yang dihantar. Abaikan ini jika item anda TIDAK menunjukkan status dihantar.)","parcelImageNote":"Muat naik 1 fail yang disokong: gambar. Maks 1 GB.","parcelAgreementText":"Sila Klik \"Saya bersetuju\" jika anda memastikan bahawa apa yang berlaku kepada bungkusan anda adalah benar.","parcelAgreeCheckbox":"Saya bersetuju","parcelSuccessMessage":"Pertanyaan bungkusan anda telah berjaya dihantar! Kami akan membalas dalam 3-5 hari bekerja.","parcelErrorMessage":"Gagal menghantar pertanyaan. Sila cuba lagi.","parcelGeneralError":"Ralat berlaku. Sila cuba lagi kemudian.","parcelAlertWait":"Sila tunggu bungkusan anda dihantar. Anda boleh menghantar borang ini selepas tempoh tunggu yang dinyatakan.","parcelAlertAgree":"Sila bersetuju dengan terma untuk menghantar borang.","parcelAlertCaseReference":"Sila berikan ID rujukan kes dari pejabat pos tempatan anda, atau letakkan NA jika anda dari Singapura.","parcelSubmitting":"Menghantar...","parcelSubmit":"Hantar","lookalikeDomainWarning":"Ini bukan nombor penjejakan, tetapi pautan ke laman web yang menyamar sebagai syarikat kurier. Jangan masukkan maklumat peribadi atau pembayaran di sana.","lookalikeDomainOfficial":"Laman web rasmi:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus maakt gebruik van premium commerciële netwerken. Op het exacte moment dat het echter in uw land aankomt, wordt de bewaring overgedragen aan de lokale binnenlandse vervoerder (bijv. USPS, Royal Mail, DHL lokaal). Tracking prefixen veranderen afhandelingssystemen op deze drempel, maar onze universele pakket tracker hecht deze statussen aan elkaar om u ononderbroken zichtbaarheid te geven.","trackingLastMileTitle":"Last-mile bezorgnetwerk","trackingCustomsClearanceBody":"Alle grensoverschrijdende artikelen moeten het douaneagentschap van je land inklaren. Onze tool bewaakt de overgangen van aankomst in de importfaciliteit tot douaneafhandeling. Grenspatrouilles zullen HS-codes verifiëren en ervoor zorgen dat de juiste btw of invoerrechten zijn afgedragen (bijv. IOSS in de EU, VOEC in Noorwegen). Monitor tracking specifiek voor waarschuwingen \"Vastgehouden bij de douane\".","trackingCustomsClearanceTitle":"Informatie over douane-inklaring","trackingProcessingOriginBody":"Eenmaal afgeleverd, komt het artikel in het oorsprongsverwerkingscentrum waar het wordt gescand, gewogen en onderworpen aan primaire exportbeveiligingsonderzoeken. Het wordt vervolgens verzonden naar de internationale postuitwisseling. Vluchtschema's zijn afhankelijk van de beschikbare bandbreedte van de lading. Wees niet ongerust als het meerdere dagen in deze toestand blijft.","trackingProcessingOriginTitle":"Verwerking bij Origin Hub","trackingInfoReceivedBody":"Wanneer een bestelling voor het eerst wordt verwerkt op onze e-commerceplatforms (zoals Etsy, eBay of directe verkoop), wordt het trackingnummer elektronisch gegenereerd. De vervoerder ontvangt de verzendgegevens voordat hij de doos fysiek in bezit heeft. Het kan 1 tot 3 werkdagen duren voordat het pakket in de fysieke sorteerfaciliteit wordt binnengebracht.","trackingInfoReceivedTitle":"Ontvangen informatie","trackingStatusesIntro":"Bedankt voor het gebruik van onze uniforme internationale trackingtool voor pakketten. Omdat je pakket over meerdere wereldwijde grenzen reist, kunnen de trackingstatussen complex zijn. Het begrijpen van de logistieke levenscyclus helpt om duidelijke verwachtingen te stellen.","trackingStatusesTitle":"Inzicht in trackingstatussen","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"v.m.","pmText":"n.m.","footerQuickLinks":"Snelle koppelingen","footerSupportLegal":"Ondersteuning & Juridisch","copyrightText":"Alle rechten voorbehouden.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlantisch)","tzEST":"EST (Oostelijk)","tzCST":"CST (Centraal)","tzMST":"MST (Berggebied)","tzPST":"PST (Grote Oceaan)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaï)","tzBeijing":"Peking","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast Kaliningrad (UTC+2)","tzMoscow":"Moskou/West-Rusland (UTC+3)","tzSamara":"Oblast Samara (UTC+4)","tzUral":"Oeral (UTC+5)","tzOmsk":"Oblast Omsk (UTC+6)","tzKrasnoyarsk":"Kraj Krasnojarsk (UTC+7)","tzIrkutsk":"Oblast Irkoetsk (UTC+8)","tzSakha":"Sacha Republiek (UTC+9)","tzPrimorsky":"Kraj Primorje (UTC+10)","tzMagadan":"Oblast Magadan (UTC+11)","tzKamchatka":"Kraj Kamtsjatka (UTC+12)","dstDayStartsLabel":"Zomertijd begint","dstDayEndsLabel":"Zomertijd eindigt","dstRevertsLabel":"terug naar standaardtijd","dstEuropeLabel":"Europa","dstNewZealandLabel":"Nieuw-Zeeland","englishResponseNotice":"Opmerking: alle vragen worden in het Engels beantwoord. Als u uw bericht in een andere taal indient, kan uw bericht ter verificatie naar het Engels worden vertaald.","parcelDisagreeCheckbox":"Ik ben het niet eens","contactDisagreeCheckbox":"Ik ben het niet eens","contactNamePlaceholder":"Bijv: Jan de Vries","systemRequirementsTitle":"Minimaal ondersteunde systeemversies","systemRequirements":"Windows: Windows 7 (with ESU updates installed) of hoger\nmacOS: macOS 12 of hoger\nAndroid: Android 13 of hoger\niPhone/iOS: iOS 17 of hoger\nLinux: Een momenteel ondersteunde distributie met actieve beveiligingsupdates","title":"Toegang verifiëren","subtitle":"Voltooi de onderstaande uitdaging om door te gaan.","selectLanguage":"Selecteer taal","selectLanguagePlaceholder":"-- Kies een taal --","loadingChallenge":"Uitdaging laden...","answerLabel":"Uw antwoord:","answerPlaceholder":"Voer uw antwoord in","continueButton":"Doorgaan","refreshButton":"Nieuwe uitdaging","verifying":"Verifiëren...","chooseLanguageFirst":"Selecteer eerst een taal.","loadFailed":"Kan uitdaging niet laden. Probeer het opnieuw.","expiredChallenge":"Uitdaging verlopen. Nieuwe uitdaging laden...","verifyFailed":"Verificatie mislukt. Probeer het opnieuw.","goodFridayEasterGreeting":"Vrolijk Pasen! Vrede en vreugde met Goede Vrijdag en Pasen.","christmasGreeting":"Prettige Kerst en een Gelukkig Nieuwjaar! Vrede en vreugde van 25 december tot 5 januari.","captchaSystemRequirements":"Minimale systeemvereisten: Windows 7 (with ESU updates installed) of 11, macOS 10.15+, of nieuwste Android/iOS-versie.","home":"Thuis","blog":"Bloggen","aboutUs":"Over Ons","faq":"Veelgestelde Vragen","contact":"Contact","trackPackage":"Pakket Volgen","cnyYearOfHorseMessage":"🧧 Gelukkig Lunar Nieuwjaar! Wij wensen je voorspoed en vreugde in het Jaar van het Paard! 🐴","singaporeNationalDayMessage":"🇸🇬 Fijne Nationale Feestdag, Singapore! 61 jaar onafhankelijkheid vieren! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesië! Dirgahayu Republik Indonesië! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Maleisië! De onafhankelijkheid van onze natie vieren! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Fijne Rusland Dag! 🎉","taiwanFoundingDayMessage":"🇹🇼 Fijne Stichtingsdag, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Fijne Dubbel Tien Dag, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Fijne SAR Hong Kong Oprichtingsdag! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Fijne SAR Macau Oprichtingsdag! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Fijne Internationale Dag van de Arbeid! Vieren van arbeid en werknemersrechten! 🎊","laborDayUSCAMessage":"⚒️ Fijne Dag van de Arbeid! Hulde aan de bijdragen van arbeiders! 🎉","orderNumber":"Bestelnummer (Voorbeeld: RTNX1234567890)","fromDate":"Van Datum (VEREIST)","toDate":"Tot Datum (VEREIST)","trackParcel":"Pakket Volgen","selectCourier":"-- Koerier / Land Selecteren --","optionSingPost":"🇸🇬 Singapore Post (SingPost)","singaporeCouriers":"Singapore Koeriers","topCountries":"Top 5 Landen","otherCountries":"Andere Landen","countryAU":"🇦🇺 Australië","countryCA":"🇨🇦 Canada","countryDE":"🇩🇪 Duitsland","countryGB":"🇬🇧 Verenigd Koninkrijk","countryUS":"🇺🇸 Verenigde Staten","countryAT":"🇦🇹 Oostenrijk","countryBE":"🇧🇪 België","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳China","countryCZ":"🇨🇿 Tsjechië","countryFI":"🇫🇮 Finland","countryFR":"🇫🇷 Frankrijk","countryHK":"🇭🇰Hong Kong SAR China","countryIN":"🇮🇳India","countryID":"🇮🇩 Indonesië","countryIE":"🇮🇪 Ierland","countryIL":"🇮🇱 Israël","countryIT":"🇮🇹 Italië","countryJP":"🇯🇵 Japan","countryMO":"🇲🇴 Macau SAR China","countryMY":"🇲🇾 Maleisië","countryNL":"🇳🇱 Nederland","countryNZ":"🇳🇿 Nieuw-Zeeland","countryNO":"🇳🇴 Noorwegen","countryPH":"🇵🇭 Filippijnen","countryPL":"🇵🇱 Polen","countryPT":"🇵🇹Portugal","countryKR":"🇰🇷 Zuid-Korea","countryES":"🇪🇸 Spanje","countrySE":"🇸🇪 Zweden","countryCH":"🇨🇭 Zwitserland","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭Thailand","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬Singapore","note":"OPMERKING","disclaimer":"VRIJWARING","importantInformation":"Belangrijke Informatie:","didNotReceiveEmail":"Als u uw bevestigingsmail van Etsy, eBay, Shopee of Payhip niet hebt ontvangen, scroll dan naar beneden om uw bestelling te zoeken via uw e-mailadres of telefoonnummer dat aan deze bestelling is gekoppeld.","searchByEmailOrPhone":"Zoeken op E-mail of Telefoon","searchOrder":"Bestelling Zoeken","trackingResult":"Tracking Resultaat","noOrdersFound":"Geen bestellingen gevonden.","pleaseEnter":"Voer een e-mail, telefoonnummer of bestelnummer in.","fillAllFields":"Vul alle verplichte velden in: trackingnummer, bestemmingsland, bestelnummer en postcode.","noOrderMatchingFields":"Geen bestelling gevonden die overeenkomt met alle velden.","postcodeRequired":"Postcode is vereist voor deze bestemming.","invalidUSZip":"Ongeldige Amerikaanse postcode. Gebruik 5 cijfers of ZIP+4.","failedGenerateURL":"Kan tracking URL niet genereren. Controleer invoer.","trackingValidationSG":"Trackingnummers voor Singapore moeten zijn: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG of PX123456789SG. Voor DHL-zendingen gebruik 10-cijferige nummers.","invalidSingPostFormat":"Ongeldig SingPost trackingnummer formaat.\nGeaccepteerde formaten:\n• PP123456789SG → Prepaid Tracked Label\n• SPNDD00012345 → SpeedPost Standaard Tracking","welcomeTitle":"Welkom op de website van Rhythm Nexus!","purchaseInfo":"Koop bij ons via onze officiële kanalen, of word lid van onze","purchaseInfoChina":"Koop bij ons via onze officiële kanalen.","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram groep","forUpdates":"voor officiële updates.","ourStores":"Onze Winkels","etsyStore":"Etsy Winkel","ebayStore":"eBay Winkel","shopeeStore":"Shopee Winkel","payhipStore":"Payhip Winkel","internationalShipping":"Internationale Verzending","singaporeLocal":"Singapore Lokaal","asiaOnly":"Alleen Azië","deliveryInfo":"Bezorginformatie","deliveryRates2026":"Bezorgtarieven 2026","sgDeliveryRates":"Singapore Bezorgtarieven","speedPostRates":"SpeedPost Express Internationale Tarieven","aboutTitle":"Over Rhythm Nexus","aboutP1":"We zijn begonnen met onze winkel in 2022 en hebben sindsdien verkocht op platforms zoals Etsy, eBay en Shopee zonder problemen.","aboutP2":"In de loop der tijd hebben we een sterke reputatie opgebouwd door te focussen op betrouwbare uitvoering en nauwkeurige tracking.","aboutP3":"Ons doel is om klanten een soepele en betrouwbare winkelervaring te bieden.","aboutP4":"Bedankt voor het ondersteunen van Rhythm Nexus.","faqTitle":"Veelgestelde Vragen","faqQ1":"Wat als mijn artikel defect is? Is er een garantie?","faqA1":"Ja! De meeste bestellingen worden geleverd met een garantie van 1 jaar. Geef uw factuur/bestelnummer op zodat we kunnen onderzoeken. Let op: Ruilen is niet toegestaan als het artikel overeenkomt met de beschrijving, zelfs als u verkeerd heeft besteld.","faqQ2":"Kan ik mijn bestelling bewerken, bijwerken of annuleren?","faqA2":"Ja. Voor de beveiliging moeten bestellingswijzigingen mogelijk via e-mail of op ons Contactformulier worden afgehandeld.","faqQ3":"Moet ik douane/invoerbelastingen betalen?","faqA3":"Douane en rechten worden over het algemeen niet vooraf betaald, behalve voor DDP naar de VS. BTW kan van toepassing zijn voor EU, VK, AU/NZ, Noorwegen, Zwitserland en Canadese provincies zoals Saskatchewan en Manitoba, die standaard al betaald zijn. Er is geen GST van toepassing voor Singapore. We kunnen geen advies geven over douanekosten - neem contact op met uw lokale douane voor details.","faqQ4":"Wanneer wordt mijn bestelling verzonden?","faqA4":"Bestellingen worden meestal binnen 1-5 werkdagen verzonden. Tijdens periodes met een hoog volume kan het 5-7 dagen duren.","faqQ5":"Ik heb per ongeluk twee keer besteld. Wat moet ik doen?","faqA5":"We betalen alleen dubbele verzendkosten terug. Beide artikelen worden samen verzonden. Terugbetaling = (eerste + tweede verzendkosten) - werkelijke verzendkosten.","faqQ6":"Hoe lang duurt de levering?","faqA6":"Verwerking duurt 1-5 werkdagen.\n\nBinnenlandse verzending:\n• SingPost Prepaid Tracked Label: 2–4 dagen\n• SpeedPost Standard: 1–3 dagen\n\nInternationaal:\n• SingPost ePAC: 14-30 dagen\n• SpeedPost Priority (EMS): 8-15 dagen\n• SpeedPost Express: 4-8 dagen\n\nVertragingen kunnen optreden tijdens piekperiodes.","faqQ7":"Mijn artikel wordt teruggestuurd naar de afzender. Wat moet ik doen?","faqA7":"Eén herverzending is toegestaan. Annulering is niet mogelijk voor ongeldige adressen, niet-opgehaalde pakketten of onbetaalde douanekosten. Neem contact op met uw postdienst voor herlevering, of stuur ons een bericht voor hulp.","faqQ8":"Mijn artikel is verloren / gestolen tijdens het transport.","faqA8":"We staan één herverzending toe. Als het opnieuw verloren gaat, wordt een volledige terugbetaling uitgegeven na het leveringsvenster van de koerier:\n\n• Singapore Local Services: 7 dagen\n• SingPost ePAC & SpeedPost Priority International: 30 dagen\n• SpeedPost Intl Express: 14 dagen","blogTitle":"Verzending & Post Kennisbank","blogSubtitle":"Officiële uitleg over postdiensten, douane, BTW en rechten.","readMore":"Lees Meer","backButton":"Terug","blogPost1Title":"Wat is SingPost ePAC?","blogPost1Desc":"Leer over SingPost ePAC (ePacket), een economische getraceerde postdienst.","blogPost2Title":"Wat is SpeedPost Priority International (EMS)?","blogPost2Desc":"Ontdek EMS, de internationale premium postexpressdienst.","blogPost3Title":"Wat is SpeedPost Express?","blogPost3Desc":"Verken SpeedPost Express met DHL Express bezorging.","blogPost4Title":"USA PDDP","blogPost4Desc":"Begrijp PDDP voor de VS.","blogPost5Title":"EU BTW & IOSS","blogPost5Desc":"Inzichten in EU BTW en IOSS.","blogPost6Title":"UK BTW & HMRC","blogPost6Desc":"BTW-vereisten voor het VK.","blogPost7Title":"Noorwegen VOEC","blogPost7Desc":"Noorweegse VOEC-systeem.","blogPost8Title":"Zwitserse BTW","blogPost8Desc":"Zwitserse BTW-vereisten.","enterDestinationPostcode":"Voer bestemmingspostcode in","trackingNumberExample":"bijv. LG123456789SG","trackingCaseSensitive":"TRACKINGLETTERS ZIJN HOOFDLETTERGEVOELIG EN MOETEN IN HOOFDLETTERS WORDEN GESCHREVEN.","usaPostcodeNote":"Voor landen zonder postcodes, zoals Hongkong en Macau, voer 999077 (Hongkong) of 999078 (Macau) in.","epacDeliveryNote":"Let op: alle ePAC-artikelen worden bezorgd in uw brievenbus / voor uw deur / in een locker.","currentTime":"Huidige Tijd","timezoneNote":"Tijd weergegeven in 12-uursformaat","sameTimeAsSingapore":"Zelfde tijd als Singapore","hourAhead":"uur voor op Singapore","hoursAhead":"uur voor op Singapore","hourBehind":"uur achter op Singapore","hoursBehind":"uur achter op Singapore","countriesNoMailbox":"Landen waarvan bekend is dat brievenbus-/briefbuslevering niet beschikbaar is: Brunei, China, India, Israël, Macau, Filipijnen, Polen, Vietnam","rhythmNexusNotResponsible":"Rhythm Nexus is NIET VERANTWOORDELIJK voor niet-levering als gevolg van uw onoplettendheid bij het controleren van uw brievenbus.","issuesAfterDelivery":"Eventuele problemen met uw levering na 30 dagen (voor ePAC en SpeedPost Priority International) en 45 dagen (voor SpeedPost Express), neem dan contact op met uw lokale postdienst voor deze zaken. Klik op de link in het trackingnummer om meer informatie te bekijken.","cannotUseEmbed":"We kunnen geen embedded tracking gebruiken voor het volgen van uw pakket omdat cookies mogelijk niet correct worden geladen door de browser.","clickLinkAbove":"Klik op de bovenstaande link om uw pakket te volgen.","trackingDetailsNote":"Opmerking: trackingdetails worden mogelijk niet direct weergegeven, aangezien het tot 7 dagen kan duren voordat de informatie verschijnt bij het inschrijven bij de plaatselijke postdienst. Het wordt aanbevolen om uw trackingnummer te kopiëren en te plakken in het volgsysteem om fouten te voorkomen.","thirdPartyWebsites":"U kunt uw pakketten ook op deze websites van derden volgen:","enterEmailOrPhone":"Voer email of telefoon in","collectAtPostOffice":"Als uw land echter geen brievenbus als standaard heeft, moet u het artikel ophalen bij het postkantoor. U ontvangt een ophaalbericht zodra het op het postkantoor is aangekomen.","reviewShippingRates":"Bekijk onze huidige verzendkosten","here":"hier","contactUsForm":"Neem contact met ons op via","form":"formulier","forEnquiries":"voor eventuele vragen die u heeft over uw bestelling.","anPostNoDirectTracking":"An Post (Ierland) ondersteunt geen directe trackinglinks of ingebedde tracking.","anPostPasteManually":"Kopieer en plak uw trackingnummer handmatig in hun volgsysteem:","goToAnPost":"Ga naar An Post","countryMsgNL":"Als de status 'Held by Customs' aangeeft, neem dan contact op met de Nederlandse Douane Informatielijn voor hulp:\n0800 0143 (gratis), maandag tot vrijdag van 7 tot 23 uur.\nZaterdag & zondag van 8 tot 16:30 uur.\n\nHet wordt aanbevolen een account te registreren bij PostNL om directe pushmeldingen van uw pakketten te ontvangen:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nAls het wordt bezorgd bij een PostNL-punt of de status aangeeft dat u het moet ophalen bij het postkantoor, moet u 7 EUR betalen aan de balie. Maximaal 4 EUR als online betaald.","countryMsgDE":"We raden u aan de Post & DHL-app te downloaden om pushmeldingen te ontvangen voor de trackingstatus van uw pakketten:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH Klantenservice Contact:\n+49-228-433-3112\nDHL DE Contact: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"U moet een aanvullende importaangifte indienen bij de douane. Anders kan dit leiden tot invoerbeperkingen en wordt het pakket teruggestuurd. \nMeer informatie: https://www.posti.fi/en/receiving/customs-clearance \nAndere links: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Er worden verwerkingskosten van 4,95 EUR in rekening gebracht.\nDownload de app hier: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Er worden verwerkingskosten van 8,50 PLN in rekening gebracht. \nU moet dit betalen bij het ophalen op het postkantoor,\nomdat het pakket waarschijnlijk niet bij uw deur of brievenbus wordt bezorgd.","countryMsgPH":"PHLPost wordt in de Filipijnen beschouwd als inefficiënt en onbetrouwbaar.\nHoud uw pakket altijd in de gaten, omdat de status 'onderweg voor levering'\nsoms alleen tussen 1 en 3 weken wordt weergegeven voor kleinere pakketten. Voor grotere pakketten is\nophalen alleen mogelijk bij het Manila Central Post Office of het dichtstbijzijnde\npostkantoor in uw regio. Houd er rekening mee dat er verwerkingskosten van 112 PHP zijn voor pakketten\nvan elke waarde die u moet betalen. Als u niet betaalt, wordt het pakket\nterug naar ons gestuurd. De levering zal naar verwachting 1-2 maanden duren vanwege de trage diensten van PHLPost. \nU hoeft geen belasting te betalen voor artikelen onder 10000 PHP, maar u moet dit wel doen als de waarde gelijk is aan of dat bedrag overschrijdt. \nWe raden SpeedPost Express aan voor een sneller proces de volgende keer dat u bij ons bestelt. De kosten zijn echter mogelijk niet van toepassing omdat D&T voor de ontvanger standaard is.","countryMsgCA":"De de minimis is 20 CAD voor alle bestellingen die naar Canada worden verzonden. Aangezien Singapore deel uitmaakt van de CPTPP-overeenkomst, zijn de rechten mogelijk niet van toepassing, maar D&T kan van toepassing zijn als het artikel de drempel van 60 CAD en hoger of 100 CAD en hoger overschrijdt, wat kan afhangen van de HS-code van het artikel. Elke waarde daarboven wordt dienovereenkomstig met BTW belast.","countryMsgID":"U moet alle toepasselijke belastingen en rechten betalen bij aankomst in Indonesië. Volg uw pakket en betaal het opgegeven bedrag aan de Indonesische douane.\nU moet ook aanvullende douanedocumentatie indienen. Anders kan dit leiden tot invoerbeperkingen of inbeslagname van het pakket door de douane van het land. Controleer verdere details hier:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"U moet alle toepasselijke belastingen en rechten betalen bij aankomst in India. Volg uw pakket en betaal het opgegeven bedrag aan de Indiase douane.\nHoud er rekening mee dat de douane-inklaring in India strikt is en u mogelijk wel of niet rechten in rekening worden gebracht als de waarde van uw artikel meer dan 1000 INR (15 USD) bedraagt - afhankelijk van de HS-code, in de meeste gevallen is het belastingvrij, maar u kunt hogere rechten in rekening krijgen als het artikel meer dan 5000 INR (60 USD) bedraagt. \nAangezien India Post NIET standaard naar de brievenbus bezorgt, moet u mogelijk thuis zijn of een geautoriseerde vertegenwoordiger zijn om uw pakket te ontvangen of op te halen bij het postkantoor.","countryMsgMY":"De de minimis is 500 MYR voor alle bestellingen die naar Maleisië worden verzonden. Bestellingen boven dat bedrag kunnen worden aangerekend.","countryMsgUS":"Vanaf 29 augustus 2025 wordt de de minimis van USD800 officieel afgeschaft en zijn invoerrechten standaard betaalbaar door de afzender in het land van herkomst.\nVerzending naar de VS VEREIST een geldig telefoonnummer en e-mailadres om verdere vertragingen van uw pakket te voorkomen.","countryMsgIL":"De de minimis is 240 ILS (75 USD) voor alle zendingen naar Israël. Bestellingen boven dat bedrag kunnen worden aangerekend. \nHoud er rekening mee dat voor bestellingen die naar Israël worden verzonden, Israel Post soms de definitieve levering mogelijk niet erkent zodra deze is bezorgd. \nAangezien Israel Post NIET standaard naar de brievenbus bezorgt, moet u mogelijk thuis zijn of een geautoriseerde vertegenwoordiger zijn om uw pakket te ontvangen of op te halen bij het postkantoor.","countryMsgGB":"Houd er rekening mee dat voor bestellingen die naar het VK worden verzonden, Royal Mail soms de definitieve levering mogelijk niet erkent zodra deze in uw brievenbus is bezorgd.","countryMsgTH":"De de minimis is 1500 THB (45 USD) voor alle zendingen naar Thailand. Bestellingen boven dat bedrag kunnen worden aangerekend.","countryMsgTW":"De de minimis is 2000 TWD (60 USD) voor alle zendingen naar Taiwan. Bestellingen boven dat bedrag kunnen worden aangerekend.","countryMsgMO":"Er worden geen D&T in rekening gebracht bij verzending naar Macau. Houd er echter rekening mee dat Macau Post NIET standaard naar de brievenbus bezorgt, u MOET uw pakket ophalen bij het postkantoor.","countryMsgBN":"Er worden geen D&T in rekening gebracht bij verzending naar Brunei. Houd er echter rekening mee dat Brunei Post NIET standaard naar de brievenbus bezorgt, u MOET uw pakket ophalen bij het postkantoor. \nHet trackingsysteem voor dit land is niet erg stabiel en er kan slechts beperkte informatie worden gegeven, en definitieve leveringsresultaten worden NIET aan de oorsprong gegeven.","countryMsgJP":"De de minimis is 10000 JPY (65 USD) voor alle zendingen naar Japan. Bestellingen boven dat bedrag kunnen worden aangerekend.","countryMsgKR":"De de minimis is 180000 KRW (150 USD) voor alle zendingen naar Zuid-Korea. Bestellingen boven dat bedrag kunnen worden aangerekend.","countryMsgVN":"Voor Vietnam, blijf alstublieft BEREIKBAAR tijdens de levering, omdat u mogelijk verwerkingskosten in rekening worden gebracht bij de levering van het artikel. \nDe de minimis is 1000000 (35 USD) voor alle zendingen naar Vietnam. Bestellingen boven dat bedrag kunnen worden aangerekend. \nAangezien Vietnam Post NIET standaard naar de brievenbus bezorgt, moet u mogelijk thuis zijn of een geautoriseerde vertegenwoordiger zijn om uw pakket te ontvangen of op te halen bij het postkantoor.","countryMsgPP":"Tracked Label-artikelen worden gepost in POPDrop/POPStop op het postkantoor. SpeedPost Standard-artikelen worden meestal gepost op POPStop of POPStation.\nHoud er rekening mee dat levering van Tracked Label-artikelen ALLEEN is van maandag tot vrijdag van 9 tot 18 uur. Behalve op weekends en feestdagen.","postedDate":"Verzenddatum:","status":"Status:","shippedVia":"Verzonden via:","destination":"Bestemming:","statusInPreparation":"In voorbereiding","statusInTransit":"Onderweg","statusDelivered":"Afgeleverd","statusOutForDelivery":"Uit voor levering","statusArrived":"Aangekomen","statusProcessing":"Verwerken","statusDispatched":"Verzonden","statusReturned":"Geretourneerd","statusFailed":"Levering mislukt","statusCancelled":"Geannuleerd","statusHeldByCustoms":"Vastgehouden door douane","statusAwaitingCollection":"Wachten op ophalen","aka":"ook bekend als","thisServiceKnownAs":"Deze dienst staat bekend als","in":"in","viewTrackingDHL":"Bekijk trackinginformatie van DHL Express","viewTrackingSingPostSpeedPost":"Bekijk trackinginformatie van Singapore SpeedPost","viewTrackingDHLLastMile":"Bekijk trackinginformatie van DHL Express (Laatste mijl)","viewTrackingDHLShipperRef":"Bekijk trackinginformatie van DHL Express (Verzendersreferentie)","viewTrackingSingPost":"Bekijk trackinginformatie van Singapore Post","viewTrackingDestPost":"Bekijk trackinginformatie van","post":"Na","orderNumberExample":"Bestelnummer (begint met RTNX - voorbeeld: RTNX1234567890):","deliveryRecordNote":"Houd er rekening mee dat zodra het artikel is bezorgd, het record slechts tot 7 dagen wordt bewaard en vervolgens wordt verwijderd.","copyrightAllRights":"Alle rechten voorbehouden.","countryAfghanistan":"Afghanistan","countryAlbania":"Albanië","countryAlgeria":"Algerije","countryAndorra":"Andorra","countryAngola":"Angola","countryArgentina":"Argentinië","countryArmenia":"Armenië","countryAustralia":"Australië","countryAustria":"Oostenrijk","countryAzerbaijan":"Azerbeidzjan","countryBahrain":"Bahrein","countryBangladesh":"Bangladesh","countryBelarus":"Wit-Rusland","countryBelgium":"België","countryBhutan":"Bhutan","countryBolivia":"Bolivia","countryBosnia":"Bosnië en Herzegovina","countryBrazil":"Brazilië","countryBrunei":"Brunei","countryBulgaria":"Bulgarije","countryBurkinaFaso":"Burkina Faso","countryBurundi":"Burundi","countryCambodia":"Cambodja","countryCameroon":"Kameroen","countryCanada":"Canada","countryCentralAfricanRep":"Centraal-Afrikaanse Republiek","countryChad":"Tsjaad","countryChile":"Chili","countryChina":"China","countryColombia":"Colombia","countryCongo":"Congo","countryCostaRica":"Costa Rica","countryCroatia":"Kroatië","countryCyprus":"Cyprus","countryCzech":"Tsjechië","countryDenmark":"Denemarken","countryDjibouti":"Djibouti","countryDominicanRep":"Dominicaanse Republiek","countryEastTimor":"Oost-Timor","countryEcuador":"Ecuador","countryEgypt":"Egypte","countryElSalvador":"El Salvador","countryEquatorialGuinea":"Equatoriaal-Guinea","countryEstonia":"Estland","countryFiji":"Fiji","countryFinland":"Finland","countryFrance":"Frankrijk","countryGabon":"Gabon","countryGeorgia":"Georgië","countryGermany":"Duitsland","countryGhana":"Ghana","countryGreece":"Griekenland","countryGreenland":"Groenland","countryGuam":"Guam","countryGuyana":"Guyana","countryHonduras":"Honduras","countryHongKong":"Hong Kong","countryHungary":"Hongarije","countryIceland":"IJsland","countryIndia":"India","countryIndonesia":"Indonesië","countryIran":"Iran","countryIreland":"Ierland","countryIsrael":"Israël","countryItaly":"Italië","countryIvoryCoast":"Ivoorkust","countryJapan":"Japan","countryJordan":"Jordanië","countryKazakhstan":"Kazachstan","countryKenya":"Kenia","countryKiribati":"Kiribati","countryKoreaNorth":"Noord-Korea","countryKoreaSouth":"Zuid-Korea","countryKuwait":"Koeweit","countryKyrgyzstan":"Kirgizië","countryLaos":"Laos","countryLatvia":"Letland","countryLebanon":"Libanon","countryLesotho":"Lesotho","countryLiberia":"Liberia","countryLibya":"Libië","countryLiechtenstein":"Liechtenstein","countryLithuania":"Litouwen","countryLuxembourg":"Luxemburg","countryMacau":"Macau","countryMadagascar":"Madagaskar","countryMalawi":"Malawi","countryMalaysia":"Maleisië","countryMaldives":"Maldiven","countryMali":"Mali","countryMalta":"Malta","countryMarshallIslands":"Marshalleilanden","countryMauritania":"Mauritanië","countryMauritius":"Mauritius","countryMexico":"Mexico","countryMicronesia":"Micronesië","countryMoldova":"Moldavië","countryMonaco":"Monaco","countryMongolia":"Mongolië","countryMontenegro":"Montenegro","countryMorocco":"Marokko","countryMozambique":"Mozambique","countryMyanmar":"Myanmar","countryNamibia":"Namibië","countryNauru":"Nauru","countryNepal":"Nepal","countryNetherlands":"Nederland","countryNewZealand":"Nieuw-Zeeland","countryNiger":"Niger","countryNigeria":"Nigeria","countryNiue":"Niue","countryNorthMacedonia":"Noord-Macedonië","countryNorway":"Noorwegen","countryOman":"Oman","countryPakistan":"Pakistan","countryPalau":"Palau","countryPanama":"Panama","countryPapuaNewGuinea":"Papoea-Nieuw-Guinea","countryParaguay":"Paraguay","countryPeru":"Peru","countryPhilippines":"Filipijnen","countryPoland":"Polen","countryPortugal":"Portugal","countryQatar":"Qatar","countryRomania":"Roemenië","countryRussia":"Rusland","countryRwanda":"Rwanda","countrySamoa":"Samoa","countrySanMarino":"San Marino","countrySaudiArabia":"Saoedi-Arabië","countrySenegal":"Senegal","countrySerbia":"Servië","countrySeychelles":"Seychellen","countrySierraLeone":"Sierra Leone","countrySingapore":"Singapore","countrySlovakia":"Slowakije","countrySlovenia":"Slovenië","countrySolomonIslands":"Salomonseilanden","countrySouthAfrica":"Zuid-Afrika","countrySpain":"Spanje","countrySriLanka":"Sri Lanka","countrySudan":"Soedan","countrySuriname":"Suriname","countrySwaziland":"Eswatini","countrySweden":"Zweden","countrySwitzerland":"Zwitserland","countrySyria":"Syrië","countryTaiwan":"Taiwan","countryTajikistan":"Tadzjikistan","countryTanzania":"Tanzania","countryThailand":"Thailand","countryTogo":"Togo","countryTonga":"Tonga","countryTunisia":"Tunesië","countryTurkey":"Turkije","countryTurkmenistan":"Turkmenistan","countryTuvalu":"Tuvalu","countryUganda":"Oeganda","countryUkraine":"Oekraïne","countryUAE":"Verenigde Arabische Emiraten","countryUK":"Verenigd Koninkrijk","countryUSA":"Verenigde Staten","countryUruguay":"Uruguay","countryUzbekistan":"Oezbekistan","countryVanuatu":"Vanuatu","countryVatican":"Vaticaanstad","countryVenezuela":"Venezuela","countryVietnam":"Vietnam","countryWesternSahara":"Westelijke Sahara","countryYemen":"Jemen","countryZambia":"Zambia","countryZimbabwe":"Zimbabwe","epacUS":"Eersteklas internationaal pakketservice","epacCH":"Prioriteit Plus","epacGB":"Internationaal gevolgd","epacMY":"Internationaal bijgehouden/Express","epacCA":"Internationale inkomende express","epacAU":"Internationaal inpakken en volgen","epacNZ":"Internationale economische tracking","epacDE":"Warenpost Internationale Premium","epacFR":"Internationale brief met tracking","epacNL":"Internationaal pakket gevolgd","epacPL":"GLOBAL Expres","epacBE":"Internationale Prime Inkomend","epacAT":"Internationaal getrackt pakket","epacIN":"Internationaal getrackt pakket","epacFI":"Internationale getrackte brief","epacSE":"Internationale getrackte brief","epacNO":"PRIME Expres","epacIT":"Nadrukkelijk","epacIL":"Nadrukkelijk","epacES":"Internationaal licht pakket","epacPT":"Internationale blauwe post","epacCZ":"Getraceerde zending uit het buitenland","epacBN":"Internationaal ePacket","epacCN":"Internationaal ePacket","epacHK":"Internationaal ePacket","epacID":"Internationaal e-pakket","epacMO":"Internationaal ePacket","epacPH":"Internationaal Getraceerde Post","epacTW":"Internationaal ePacket","epacTH":"Internationaal ePacket","epacVN":"Internationaal E-pakket (ASEAN-pakket)","epacKR":"K-pakket","epacJP":"Internationaal e-pakket Light","epacIE":"Internationale exprespost","blogSingPostEPACContent1":"SingPost ePAC (ePacket) is een economische getrackte postdienst voor lichte internationale e-commerce zendingen.","blogSingPostEPACContent2":"Het wordt bezorgd door de nationale postoperator van het bestemmingsland en wordt vaak gebruikt voor pakketten onder de 2 kg, met een dimensielimiet van lengte + breedte + hoogte onder 90 cm en een lengte van maximaal 60 cm.","blogSingPostEPACContent3":"Deze optie werd aanvankelijk alleen aangeboden door Hong Kong Post samen met eBay China, waardoor pakketten uit China en Hong Kong naar de VS konden worden verzonden met bezorgtracking zonder dat er een handtekening bij aflevering nodig was. Deze service staat in de VS bekend als USPS (United States Postal Service) First-Class Package International Service.","blogSingPostEPACContent4":"Vanaf 1 januari 2026 wordt ePAC nu gebruikt voor alle landen om te voldoen aan de verplichte UPU-regelgeving die tracking vereist voor pakketten en aangetekende zendingen beperkt tot alleen documenten.","blogSingPostEPACContent5":"Trackingprefixes: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS is een internationale premium postexpressdienst, geprioriteerd door postoperators wereldwijd.","blogSpeedPostEMSContent2":"Douane-inklaring is over het algemeen sneller dan standaardpost maar strenger in het proces, met volledige tracking tot bezorging.","blogSpeedPostEMSContent3":"In Singapore staat dit bekend als SpeedPost Priority International van SingPost.","blogSpeedPostEMSContent4":"Trackingprefix: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express is een koeriersdienst.","blogSpeedPostExpressContent2":"In veel bestemmingen voert DHL Express de bezorging op de laatste kilometer uit en int belastingen of rechten voor vrijgave.","blogSpeedPostExpressContent3":"Trackingprefix: PX123456789SG (Last-mile DHL Express gebruikt een 10-cijferig trackingnummer, dat niet zichtbaar is voor het publiek, maar we hebben er informatie over via ons","blogSpeedPostExpressContent3Link":"Trackingsysteem.","blogUSPDDPContent1":"PDDP maakt het mogelijk om Amerikaanse invoerrechten en belastingen vooraf te betalen voor bezorging, waardoor verrassingskosten voor ontvangers worden verminderd.","blogUSPDDPContent2":"Nieuwe Regelgeving (Van kracht op 29 augustus 2025)","blogUSPDDPContent2List1":"Verplichte HTS-codes","blogUSPDDPContent2List2":"Nauwkeurige artikelbeschrijvingen","blogUSPDDPContent2List3":"Strengere tariefhandhaving","blogUSPDDPContent3":"Alle artikelen die naar de VS worden verzonden, worden niet aan de ontvanger in rekening gebracht omdat wij namens u betalen. Houd er echter rekening mee dat de artikelprijs standaard de invoerheffing van 10% bevat om aan de regelgeving te voldoen.","blogUSPDDPContent4":"Dit geldt alleen voor onze verzendmethoden naar de VS, SpeedPost Priority International (EMS) en SingPost ePAC.","blogEUIOSSContent1":"De EU past btw toe op alle commerciële invoer, ongeacht de waarde.","blogEUIOSSContent2":"IOSS (one-stop-shop importeren)","blogEUIOSSContent3":"IOSS stelt verkopers in staat om EU-btw te innen bij het afrekenen voor zendingen tot €150.","blogEUIOSSContent4":"Btw wordt vervolgens afgedragen via het IOSS-systeem, waardoor snellere douane-inklaring mogelijk is en geen btw-inning bij bezorging.","blogEUIOSSContent5":"Voor alle bestellingen via Etsy of eBay wordt IOSS-btw al geïnd bij het afrekenen en we geven dit aan op het belastingreferentienummer om de gegevens via EDI (Electronic Data Interchange) naar de bestemmingspostdienst te verzenden.","blogUKVATContent1":"Het VK vereist dat btw wordt verantwoord voor geïmporteerde goederen.","blogUKVATContent2":"Voor zendingen van lage waarde wordt btw meestal geïnd bij het afrekenen en rechtstreeks aan HMRC afgedragen door de verkoper of marktplaats.","blogUKVATContent3":"Voor zendingen van hogere waarde kan btw door de vervoerder worden geïnd voor bezorging.","blogUKVATContent4":"Voor alle bestellingen via Etsy of eBay wordt btw al geïnd bij het afrekenen en we geven dit aan op het belastingreferentienummer om de gegevens via EDI (Electronic Data Interchange) naar de bestemmingspostdienst te verzenden.","blogNorwayVOECContent1":"Noorwegen heeft het VOEC-systeem (VAT on E-Commerce) geïntroduceerd voor goederen die van buiten de EU/EER worden geïmporteerd. Dit geldt voor goederen tot een waarde van 3.000 NOK.","blogNorwayVOECContent2":"Verkopers kunnen zich registreren in het VOEC-schema om Noorse btw te innen bij het afrekenen, waardoor snellere douane-inklaring mogelijk is en geen btw-inning bij bezorging.","blogNorwayVOECContent3":"Voor alle bestellingen via Etsy of eBay wordt VOEC-btw al geïnd bij het afrekenen. Tracking en douanedocumentatie geven het belastingreferentienummer aan om gegevens naar de Noorse postdienst te verzenden.","blogSwissVATContent1":"Zwitserland heft btw over geïmporteerde goederen, ongeacht de waarde. De Zwitserse Federale Douaneadministratie vereist dat buitenlandse verkopers btw innen bij het afrekenen voor goederen tot 65 CHF.","blogSwissVATContent2":"Verkopers die zijn geregistreerd in het Zwitserse btw-systeem dragen de geïnde btw rechtstreeks af, zodat de ontvanger geen extra btw-kosten ervaart bij bezorging.","blogSwissVATContent3":"Voor alle bestellingen via Etsy of eBay wordt Zwitserse btw al geïnd tijdens het afrekenen, en douanedocumentatie bevat het belastingreferentienummer voor EDI-indiening.","dhlNoEmbed":"DHL Express ondersteunt geen tracking via embed. Gelieve","speedPostNoEmbed":"SpeedPost Singapore ondersteunt geen tracking via embed. Gelieve","operatorNoEmbed":"ondersteunt geen tracking via embed. Gelieve","clickHere":"hier te klikken","toTrackNewTab":"om te volgen (opent in nieuw tabblad).","countryRU":"🇷🇺 Rusland","russiaServiceSuspended":"⚠️ BELANGRIJKE KENNISGEVING: Gezien de Russische invasie van Oekraïne in 2022 heeft SingPost alle zendingen naar Rusland samen met DHL opgeschort. We bedienen momenteel geen Rusland tot er een aankondiging is van hervatting van diensten naar het land.","hariRayaMessage":"🌙Selamat Hari Raya Aidilfitri! Ik wens u en uw gezin vrede, vreugde en zegeningen! 🌟","deepavaliMessage":"🪔 Fijne Deepavali! Moge het lichtfestival u vreugde, voorspoed en succes brengen! ✨","diwaliMessage":"🪔 Fijne Divali! Moge het lichtfestival u vreugde, voorspoed en succes brengen! ✨","vesakMessage":"☸️ Fijne Vesak-dag! Ik wens je vrede, wijsheid en verlichting op deze heilige dag! 🙏","vesakTHMessage":"☸️ Fijne Visakha Bucha-dag! Ik wens je vrede, wijsheid en verlichting op deze heilige dag! 🙏","australiaNationalDayMessage":"🇦🇺 Fijne Australiëdag! Het vieren van onze natie! 🎉","canadaNationalDayMessage":"🇨🇦 Fijne Canadadag! Het vieren van onze geweldige natie! 🍁","usaNationalDayMessage":"🇺🇸 Fijne Onafhankelijkheidsdag, Amerika! Vrijheid en vrijheid vieren! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 juli! Leef la Frankrijk! 🎊","germanyUnityDayMessage":"🇩🇪 Fijne dag van de Duitse Eenheid! Tag der Duitse Einheit! 🎉","italyRepublicDayMessage":"🇮🇹Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Fijne Stichtingsdag, Japan! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Fijne Nationale Dag, China! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Fijne Bevrijdingsdag, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Fijne Onafhankelijkheidsdag, India! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Fijne nationale feestdag, Thailand! Veel plezier! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Fijne Onafhankelijkheidsdag, Filipijnen! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Fijne nationale feestdag, Vietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Fijne Onafhankelijkheidsdag, Polen! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Fijne Onafhankelijkheidsdag, Tsjechië! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Lang leve de Koning! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Fijn Sveriges nationaledag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Fijne Onafhankelijkheidsdag, Israël! 🎉","irelandNationalDayMessage":"🇮🇪 Fijne St. Patrick's Day, Ierland! Lá Fhéile Pádraig is duit! 🍀","bruneiNationalDayMessage":"🇧🇳Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Fijne Waitangi-dag, Nieuw-Zeeland! 🎉","switzerlandNationalDayMessage":"🇨🇭 Fijne Zwitserse nationale feestdag! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Feest Nationale, België! Fijne Nationale Feestdag! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Tijdelijke sluitingsmelding","temporaryClosureNoticeBody":"Beste gewaardeerde klanten,\n\nHoud er rekening mee dat Rhythm Nexus tijdelijk gesloten is van 21 maart 2026 tot en met 26 maart 2026 vanwege een bedrijfsevenement.\n\nTer voorbereiding op de sluiting wordt de winkel vanaf 20 maart 2026 om 3:00 PM (UTC +8) in vakantiemodus gezet. Bestellingen die na dit tijdstip worden geplaatst, worden mogelijk pas verwerkt wanneer we onze activiteiten hervatten.\n\nDe normale bedrijfsvoering wordt hervat op 27 maart 2026.\n\nOnze excuses voor het eventuele ongemak en bedankt voor uw begrip en voortdurende steun.\n\nDank u wel.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Ik begrijp het","parcelTracking":"Pakket volgen","serviceAnnouncement":"Dienstaankondiging","usaWinterStormTitle":"DRINGEND: Ernstige winterstorm - Serviceonderbreking","usaWinterStormSubtitle":"United States Postal Service (USPS) Overmacht","usaWinterStormNotice1":"Vanwege de ernstige winterstorm die sinds 23 februari 2026 de regio New York treft:","usaWinterStormNotice2":"Internationale operaties op John F. Kennedy International Airport zijn effectief stilgelegd","usaWinterStormNotice3":"Wijdverspreide vluchten worden geannuleerd en aanzienlijke verstoringen van luchthavendiensten gemeld","usaWinterStormNotice4":"Deze omstandigheden vormen een geval van overmacht buiten de controle van USPS","usaWinterStormNotice5":"Serviceimpact:","usaWinterStormNotice6":"Gevaarlijke combinatie van zware sneeuw, vrieskost, natte sneeuw en bitterkoud","usaWinterStormNotice7":"Grote verstoringen en wijdverbreide stroomuitval gemeld","usaWinterStormNotice8":"Verzamelen en bezorgen van binnenlands en internationaal postverkeer (brievenpost, pakketpost en EMS-items) aangetast","usaWinterStormNotice9":"Getroffen postcodebereiken:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS neemt alle noodzakelijke stappen om ongemak voor klanten te beperken, terwijl de veiligheid van werknemers wordt gehandhaafd. Wij waarderen uw geduld en begrip tijdens dit geval van overmacht.","usaWinterStormNotice12":"Laatst bijgewerkt: 25 februari 2026","countryAutoDetected":"Bestemming vooraf ingesteld op basis van uw locatie","countryAutoDetectedFromLink":"Bestemming vooraf ingesteld via link","trackingNumber":"Trackingnummer","destinationCountry":"Land van bestemming","postcode":"Postcode","australianDSTTitle":"Australische zomertijd actief","australianDSTBothMessage":"Zowel AEDT (Australian Eastern Daylight Time) als ACDT (Australian Central Daylight Time) zijn momenteel van kracht.","australianAEDTMessage":"AEDT (Australian Eastern Daylight Time) is momenteel van kracht voor Sydney, Melbourne en omliggende gebieden.","australianACDTMessage":"ACDT (Australian Central Daylight Time) is momenteel van kracht voor Adelaide en Zuid-Australië.","australianDSTNote":"De hierboven weergegeven bezorgtijden weerspiegelen de huidige zomertijd.","filteredAllowedDestinations":"(Gefilterd op uw toegestane bestemmingen)","loadingAnnouncements":"Aankondigingen laden...","unableToLoadAnnouncements":"Kan momenteel geen serviceaankondigingen laden.","viewOnSingPostWebsite":"Bekijk op de SingPost-website →","statusHeldByCustms":"Vastgehouden door de douane","accessRestricted":"Toegang beperkt","vpnDetectedMessage":"VPN-gebruik gedetecteerd. Schakel VPN uit om toegang te krijgen tot deze service.","contactSupportError":"Als u denkt dat dit een fout is, neem dan contact op met de ondersteuning.","postalContactsTitle":"Postdienst Contacten","postalContactsNote":"Let op:","postalContactsPolandUKNote":"Voor Polen en het VK worden alle items verzonden via SpeedPost Priority (EMS) afgehandeld door Pocztex en Parcelforce.","postalContactsDHLNote":"Voor SpeedPost Express-zendingen kunt u contact opnemen met DHL via deze link:","postalContactsCountry":"Land","postalContactsWebsite":"Website","postalContactsForm":"Contactformulier","postalContactsPhone":"Telefoonnummer","postalContactsEmail":"Contact E-mail","postalContactsFormLink":"Contactformulier","postalContactsBackButton":"Terug naar het pakketonderzoeksformulier","destinationNotAllowed":"Toegang tot dit land van bestemming is niet beschikbaar vanaf uw locatie. Selecteer een andere bestemming.","contactUsTitle":"Neem contact op","contactNameLabel":"Naam (GEEN BIJNAMEN OF TELEFOONNUMMER)","contactEmailLabel":"E-mailadres (waar we u zullen antwoorden)","contactEmailNote":"Privé relay e-mails (bijv. @privaterelay.appleid.com) worden niet geaccepteerd. Gebruikaeen geldig e-mailadres.","contactEnquiryTypeLabel":"Is dit een?","contactSelectOption":"Selecteer een optie","contactGeneralEnquiry":"Algemene vraag / Feedback","contactBusinessEnquiry":"Zakelijke vraag","contactOrderShippingEnquiry":"Bestelling/verzending vraag","contactExchangeRefundEnquiry":"Ruil/terugbetaling/retour vraag","contactOthers":"Anderen","contactParcelWarning":"Als uw pakket niet is bezorgd sinds meer dan 18/30/45 dagen (14 dagen voor FedEx), of de status toont bezorgd maar u heeft het niet, vul dan in","contactParcelWarningLink":"DIT FORMULIER","contactParcelWarningEnd":"in plaats daarvan.","contactOrderNumberLabel":"Bestelnummer","contactOrderNumberPlaceholder":"Voorbeeld: RTNX1234567890","contactPlatformNote":"Etsy, eBay & Shopee bestelnummer hier. We hebben GEEN controle over terugbetalingen van deze platforms. Neem contact op met hun respectievelijke klantenservice.","contactPlatformInstructions":"Gebruik de app om uw bestelnummer te bekijken, aangezien het is opgeslagen in de app:","contactPlatformEtsy":"Etsy - Rechtsboven op uw profiel → Aankopen","contactPlatformEbay":"eBay - Mijn eBay → Aankopen","contactPlatformShopee":"Shopee - Ik → Aankoopgeschiedenis bekijken (of u kunt klikken op Te verzenden/Te ontvangen)","contactRefundNote1":"Als u vraagt om retour/terugbetaling voor de platforms waar u aankopen heeft gedaan, let op dat we GEEN controle hebben over terugbetalingen van deze platforms. Neem contact op met hun respectievelijke klantenservice.","contactRefundNote2":"Voor retouren of ruilen staan we het niet toe voor maimai handschoenen als ze al zijn gebruikt bij opening (zichtbare vlekken of gewassen in wasmachine/handwas), en geen retouren of ruilen zijn toegestaan voor amusementskaarten. Bedankt.","contactRefundNote3":"Let op dat voor terugbetalingen via Payhip, neem contact op met uw bank of Payhip support op support@payhip.com als u de terugbetaling niet heeft ontvangen aangezien we geen controle hebben over het proces.","contactMessageLabel":"Uw bericht (tot 1000 tekens)","contactCharacterCount":"tekens","contactSpamWarningNote":"Let op:","contactSpamWarning":"Ongevraagde aanbiedingen voor SEO, webdesign, leningen of vergelijkbare diensten worden automatisch afgewezen.","contactAgreementText1":"Klik op \"Ik ga akkoord\" als u ermee akkoord gaat dat uw e-mailadres wordt gebruikt door Rhythm Nexus om u te antwoorden, aangezien dit vereist is om uw antwoord te lezen en u te antwoorden zodra we een oplossing hebben gevonden voor uw vraag.","contactAgreementText2":"Let op dat ons antwoord tussen 3-5 werkdagen duurt, of langer tijdens een hoog volume aan e-mails aan onze kant.","contactAgreeCheckbox":"Ik ga akkoord","contactSuccessMessage":"Uw bericht is succesvol verzonden! We reageren binnen 3-5 werkdagen.","contactErrorMessage":"Verzenden mislukt. Probeer het opnieuw.","contactGeneralError":"Er is een fout opgetreden. Probeer het later opnieuw.","contactSubmitting":"Verzenden...","contactSubmit":"Verzenden","contactAlertAgree":"Ga akkoord met de voorwaarden om het formulier in te dienen.","parcelEnquiryTitle":"Pakketvraag","parcelInfoText":"Dit formulier is voor pakketten die niet zijn bezorgd sinds meer dan 18/30/45 dagen (14 dagen voor FedEx/DHL), of die bezorgd status hebben getoond maar u heeft ze niet.","parcelInfoLink":"Klik hier","parcelInfoEnd":"voor andere vragen.","parcelWaitTitle":"Wacht op uw pakket","parcelWaitText1":"Wacht op de bezorging van uw pakket. Let op: internationale bezorgingen zijn NIET hetzelfde als lokale bezorgingen omdat ze tijd nodig hebben. Bedankt!","parcelWaitText2":"Als er geen status verschijnt na 18 dagen (7 dagen voor Singapore) of meer, kunt u het ons direct laten weten.","parcelCannotSubmit":"U kunt dit formulier niet indienen als u \"Nee\" heeft geselecteerd.","parcelNameLabel":"Naam","parcelOrderNumberLabel":"Bestelnummer (Voorbeeld: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"E-mailadres (We zullen u hier antwoorden)","parcelEmailNote":"Privé relay e-mails worden niet geaccepteerd. Gebruik een geldig e-mailadres.","parcelShippingMethodLabel":"Verzendmethode gekozen?","parcelSelectShipping":"Selecteer een verzendmethode","parcelSingPostEpac":"SingPost ePacket (of ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (Alleen EU-landen) (Tracking: 1234567890)","parcelTrackingNumberLabel":"Trackingnummer van uw pakket?","parcelUndeliveredLabel":"Is uw pakket niet bezorgd sinds meer dan 18/30/45 dagen? (Singapore lokale diensten >7 dagen, >14 dagen voor SpeedPost Express/DHL)","parcelSelectOption":"Selecteer een optie","parcelYes":"Ja","parcelNo":"Nee","parcelDeliveredButMissingLabel":"Heeft uw pakket bezorgd status getoond, maar is het niet aanwezig in uw brievenbus/veilige plaats/voor de deur?","parcelCaseReferenceLabel":"Case referentie ID van lokaal postkantoor","parcelCaseReferencePlaceholder":"Zet NA als u uit Singapore komt","parcelCaseReferenceNote":"Voordat u dit formulier indient, neem contact op met uw lokale postkantoor via telefoon of e-mail en verkrijg een case referentie ID van hen. Plaats dan hier uw case referentie ID.","parcelCaseReferenceLink":"Raadpleeg deze link voor postd ienstcontacten","parcelCaseReferenceMandatory":"ZET NA ALLEEN ALS U UIT SINGAPORE KOMT. Voor andere landen is het VERPLICHT om te verstrekken. Ook vereist voor SpeedPost Express, voor DHL's case ID.","parcelImageEvidenceLabel":"Beeldbewijs (voor bezorgde maar ontbrekende pakketten)","parcelImageWarning":"Voor extra verificatie hebben we beeldbewijs nodig om te bewijzen dat u geen valse claims maakt over niet-bezorging van pakketten. (Alleen voor pakketten die al zijn bezorgd, maar niet aanwezig zijn in brievenbus/buiten de deur. We kunnen uw claim afwijzen als er geen fotobewijs wordt gegeven voor bezorgde items. Negeer dit als uw item NIET bezorgd status heeft getoond.)","parcelImageNote":"Upload 1 ondersteund bestand: afbeelding. Max 1 GB.","parcelAgreementText":"Klik op \"Ik ga akkoord\" als u zeker weet dat wat er met uw pakket is gebeurd waar was.","parcelAgreeCheckbox":"Ik ga akkoord","parcelSuccessMessage":"Uw pakketvraag is succesvol ingediend! We reageren binnen 3-5 werkdagen.","parcelErrorMessage":"Indienen mislukt. Probeer het opnieuw.","parcelGeneralError":"Er is een fout opgetreden. Probeer het later opnieuw.","parcelAlertWait":"Wacht op de bezorging van uw pakket. U kunt dit formulier indienen na de gespecificeerde wachtperiode.","parcelAlertAgree":"Ga akkoord met de voorwaarden om het formulier in te dienen.","parcelAlertCaseReference":"Verstrek een case referentie ID van uw lokale postkantoor, of zet NA als u uit Singapore komt.","parcelSubmitting":"Verzenden...","parcelSubmit":"Verzenden","lookalikeDomainWarning":"Dit is een link naar een website die zich voordoet als pakketbezorger, geen trackingnummer. Vul daar geen persoons- of betaalgegevens in.","lookalikeDomainOfficial":"Officiële website:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus benytter forsteklasses kommersielle nettverk. Men idet pakken ankommer landet ditt, overfores ansvaret til lokal innenlandsk transportor (f.eks. USPS, Royal Mail, DHL lokalt). Sporingsprefikser bytter handteringssystem ved denne terskelen, men var universelle pakkesporing syr statusene sammen slik at du far uavbrutt oversikt.","trackingLastMileTitle":"Sisteleddets leveringsnettverk","trackingCustomsClearanceBody":"Alle grensekryssende varer ma klareres av tollmyndighetene i landet ditt. Vart verktoy overvakker overganger fra ankomst ved importanlegg til overlevering til toll. Grensemyndighetene verifiserer HS-koder og sikrer at korrekt mva. eller avgifter er innbetalt (f.eks. IOSS i EU, VOEC i Norge). Folg spesielt med pa varsler om \"Held at Customs\".","trackingCustomsClearanceTitle":"Informasjon om tollklarering","trackingProcessingOriginBody":"Nar pakken er innlevert, gar varen inn i opprinnelsessenteret der den skannes, veies og gjennomgar primaer eksport-sikkerhetskontroll. Deretter sendes den til internasjonalt postsorteringsknutepunkt. Flyavganger avhenger av tilgjengelig lastekapasitet. Ikke bli bekymret hvis denne statusen varer i flere dager.","trackingProcessingOriginTitle":"Behandling ved opprinnelseshub","trackingInfoReceivedBody":"Nar en ordre forst behandles pa vare e-handelsplattformer (som Etsy, eBay eller direkte salg), genereres sporingsnummeret elektronisk. Transportoren mottar forsendelsesdata for fysisk overtakelse av pakken. Beregn 1 til 3 virkedager for pakken registreres i det fysiske sorteringsanlegget.","trackingInfoReceivedTitle":"Informasjon mottatt","trackingStatusesIntro":"Takk for at du bruker vart samlede verktoy for internasjonal pakkesporing. Siden pakken din reiser over flere landegrenser, kan sporingsstatusene vare komplekse. A forsta logistikkens livssyklus hjelper deg med a sette tydelige forventninger.","trackingStatusesTitle":"Forsta sporingsstatuser","footerDesc":"Din fremste destinasjon for arkadekort, hansker for rytmespill og spesialisert merch. Opplev global netthandel med somlos internasjonal pakkesporing og palitelige fraktdata.","amText":"a.m.","pmText":"p.m.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlanterhavet)","tzEST":"EST (Østlig)","tzCST":"CST (Sentral)","tzMST":"MST (Fjellene)","tzPST":"PST (Stillehavet)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Beijing","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Kaliningrad oblast (UTC+2)","tzMoscow":"Moskva/Vest-Russland (UTC+3)","tzSamara":"Samara oblast (UTC+4)","tzUral":"Uralregionen (UTC+5)","tzOmsk":"Omsk oblast (UTC+6)","tzKrasnoyarsk":"Krasnojarsk kraj (UTC+7)","tzIrkutsk":"Irkutsk oblast (UTC+8)","tzSakha":"Sakha Republikken (UTC+9)","tzPrimorsky":"Primorskij kraj (UTC+10)","tzMagadan":"Magadan oblast (UTC+11)","tzKamchatka":"Kamtsjatka kraj (UTC+12)","dstDayStartsLabel":"Sommertid starter","dstDayEndsLabel":"Sommertid slutter","dstRevertsLabel":"går tilbake til normaltid","dstEuropeLabel":"Europa","dstNewZealandLabel":"New Zealand","englishResponseNotice":"Merknad: Alle henvendelser besvares på engelsk. Hvis du sender inn på et annet språk, kan meldingen din bli oversatt til engelsk for bekreftelse.","contactNamePlaceholder":"F.eks: Ola Nordmann","systemRequirementsTitle":"Minimum støttede systemversjoner","systemRequirements":"Windows: Windows 7 (with ESU updates installed) eller nyere\nmacOS: macOS 12 eller nyere\nAndroid: Android 13 eller nyere\niPhone/iOS: iOS 17 eller nyere\nLinux: En støttet distribusjon med aktive sikkerhetsoppdateringer","goodFridayEasterGreeting":"God påske! Fred og glede på langfredag og påske.","christmasGreeting":"God jul og godt nyttår! Fred og glede fra 25. desember til 5. januar.","captchaSystemRequirements":"Minimum systemkrav: Windows 7 (with ESU updates installed) eller 11, macOS 10.15+, eller nyeste Android/iOS-versjon.","title":"Bekreft Tilgang","subtitle":"Vennligst fullfør utfordringen nedenfor for å fortsette.","selectLanguage":"Velg Språk","selectLanguagePlaceholder":"-- Velg et språk --","loadingChallenge":"Laster inn utfordring...","answerLabel":"Ditt svar:","answerPlaceholder":"Skriv inn svaret ditt","continueButton":"Fortsett","refreshButton":"Ny Utfordring","verifying":"Bekrefter...","chooseLanguageFirst":"Vennligst velg et språk først.","loadFailed":"Kunne ikke laste inn utfordring. Vennligst prøv igjen.","expiredChallenge":"Utfordringen har utløpt. Laster inn ny utfordring...","verifyFailed":"Bekreftelsen mislyktes. Vennligst prøv igjen.","home":"Hjem","blog":"Blogg","aboutUs":"Om Oss","faq":"Ofte Stilte Spørsmål","contact":"Kontakt","trackPackage":"Spor Pakke","cnyYearOfHorseMessage":"🧧 Godt månenyttår! Vi ønsker deg velstand og glede i Hestens år! 🐴","singaporeNationalDayMessage":"🇸🇬 Gratulerer med nasjonaldagen, Singapore! Feirer 61 år med uavhengighet! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesia! Dirgahayu Republikk Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Feirer vår nasjons uavhengighet! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Midlertidig stengingsvarsel","temporaryClosureNoticeBody":"Kjære verdsatte kunder,\n\nVennligst merk at Rhythm Nexus vil være midlertidig stengt fra 21. mars 2026 til 26. mars 2026 på grunn av et firmaarrangement.\n\nFor å forberede stengingen settes butikken i feriemodus fra 20. mars 2026 kl. 3:00 PM (UTC +8). Bestillinger som legges inn etter dette tidspunktet kan bli behandlet først når vi gjenopptar driften.\n\nNormal drift gjenopptas 27. mars 2026.\n\nVi beklager eventuelle ulemper og setter pris på din forståelse og fortsatte støtte.\n\nTakk.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Jeg forstår","parcelTracking":"Pakkesporing","serviceAnnouncement":"Tjenestekunngjøring","usaWinterStormTitle":"HASTVERK: Alvorlig vinterstorm - Tjenesteavbrudd","usaWinterStormSubtitle":"United States Postal Service (USPS) Force Majeure-hendelse","usaWinterStormNotice1":"På grunn av alvorlig vinterstorm som påvirker New York-regionen siden 23. februar 2026:","usaWinterStormNotice2":"Internasjonale operasjoner ved John F. Kennedy International Airport er effektivt stoppet","usaWinterStormNotice3":"Omfattende kanselleringer av flyvninger og betydelige forstyrrelser av flyplass-tjenester rapporteres","usaWinterStormNotice4":"Disse forholdene utgjør en force majeure-hendelse utenfor USPS kontroll","usaWinterStormNotice5":"Tjenestepåvirkning:","usaWinterStormNotice6":"Farlig blanding av tung snø, frysende regn, sludd og bitter kulde","usaWinterStormNotice7":"Større forstyrrelser og omfattende strømbrudd rapporteres","usaWinterStormNotice8":"Innsamling og levering av innenlands og internasionale postpakker (brevpost, pakkepost og EMS-varer) påvirkes","usaWinterStormNotice9":"Berørte postnummerområder:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS tar alle nødvendige skritt for å minimere ulemper for kunder samtidig som man opprettholder ansattes sikkerhet. Vi setter pris på din tålmodighet og forståelse under denne force majeure-hendelsen.","usaWinterStormNotice12":"Sist oppdatert: 25. februar 2026","countryAutoDetected":"Destinasjon er forhåndsinnstilt basert på din plassering","countryAutoDetectedFromLink":"Destinasjon er forhåndsinnstilt fra lenken","trackingNumber":"Sporingsnummer","destinationCountry":"Destinasjonsland","postcode":"Postnummer","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Gratulerer med Russlands dag! 🎉","taiwanFoundingDayMessage":"🇹🇼 Gratulerer med grunnleggelsesdagen, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Gratulerer med dobbel ti-dagen, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Gratulerer med SAR Hong Kongs grunnleggelsesdag! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Gratulerer med SAR Macaus grunnleggelsesdag! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Gratulerer med den internasjonale arbeiderdagen! Feirer arbeid og arbeidstakernes rettigheter! 🎊","laborDayUSCAMessage":"⚒️ Gratulerer med arbeidsdagen! Ærer arbeidernes bidrag! 🎉","orderNumber":"Ordrenummer (Eksempel: RTNX1234567890)","fromDate":"Fra Dato (PÅKREVD)","toDate":"Til Dato (PÅKREVD)","trackParcel":"Spor Pakke","selectCourier":"-- Velg Kurir / Land --","singaporeCouriers":"Singapore Kurerer","topCountries":"Topp 5 Land","otherCountries":"Andre Land","optionSingPost":"🇸🇬 Singapore Post (SingPost)","countryAU":"🇦🇺 Australia","countryCA":"🇨🇦 Canada","countryDE":"🇩🇪 Tyskland","countryGB":"🇬🇧 Storbritannia","countryUS":"🇺🇸 USA","countryAT":"🇦🇹 Østerrike","countryBE":"🇧🇪 Belgia","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Kina","countryCZ":"🇨🇿 Tsjekkia","countryFI":"🇫🇮 Finland","countryFR":"🇫🇷 Frankrike","countryHK":"🇭🇰 Hong Kong SAR Kina","countryIN":"🇮🇳 India","countryID":"🇮🇩 Indonesia","countryIE":"🇮🇪 Irland","countryIL":"🇮🇱 Israel","countryIT":"🇮🇹 Italia","countryJP":"🇯🇵 Japan","countryMO":"🇲🇴 Macao SAR Kina","countryMY":"🇲🇾 Malaysia","countryNL":"🇳🇱 Nederland","countryNZ":"🇳🇿 New Zealand","countryNO":"🇳🇴 Norge","countryPH":"🇵🇭 Filippinene","countryPL":"🇵🇱 Polen","countryPT":"🇵🇹 Portugal","countryKR":"🇰🇷 Sør-Korea","countryES":"🇪🇸 Spania","countrySE":"🇸🇪 Sverige","countryCH":"🇨🇭 Sveits","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Thailand","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬 Singapore","note":"MERK","disclaimer":"ANSVARSFRASKRIVELSE","importantInformation":"Viktig Informasjon:","didNotReceiveEmail":"Hvis du ikke mottok bekreftelses-e-posten fra Etsy, eBay, Shopee eller Payhip, rull ned for å søke etter bestillingen din via e-postadressen eller telefonnummeret som er knyttet til denne bestillingen.","searchByEmailOrPhone":"Søk etter E-post eller Telefon","searchOrder":"Søk Ordre","trackingResult":"Sporingsresultat","noOrdersFound":"Ingen ordrer funnet.","pleaseEnter":"Vennligst skriv inn e-post, telefon eller ordrenummer.","welcomeTitle":"Velkommen til Rhythm Nexus sin nettside!","purchaseInfo":"Kjøp fra oss gjennom våre offisielle kanaler, eller bli med i vår","purchaseInfoChina":"Kjøp fra oss gjennom våre offisielle kanaler.","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram-gruppe","forUpdates":"for offisielle oppdateringer.","ourStores":"Våre Butikker","etsyStore":"Etsy Butikk","ebayStore":"eBay Butikk","shopeeStore":"Shopee Butikk","payhipStore":"Payhip Butikk","internationalShipping":"Internasjonal Frakt","singaporeLocal":"Singapore Lokal","asiaOnly":"Kun Asia","deliveryInfo":"Leveringsinformasjon","deliveryRates2026":"Leveringspriser 2026","sgDeliveryRates":"Singapore Leveringspriser","speedPostRates":"SpeedPost Express Internasjonale Priser","aboutTitle":"Om Rhythm Nexus","aboutP1":"Vi startet butikken vår i 2022 og har solgt på plattformer som Etsy, eBay og Shopee uten problemer.","aboutP2":"Over tid har vi bygget et sterkt omdømme ved å fokusere på pålitelig oppfyllelse og nøyaktig sporing.","aboutP3":"Målet vårt er å gi kundene en smidig og pålitelig handleopplevelse.","aboutP4":"Takk for at du støtter Rhythm Nexus.","faqTitle":"Ofte Stilte Spørsmål","faqQ1":"Hva om varen min er defekt? Er det noen garanti?","faqA1":"Ja! De fleste bestillinger kommer med 1 års garanti. Vennligst oppgi faktura-/ordrenummeret ditt slik at vi kan undersøke. Merk: Bytte er ikke tillatt hvis varen samsvarer med beskrivelsen selv om du har bestilt feil.","faqQ2":"Kan jeg redigere, oppdatere eller kansellere bestillingen min?","faqA2":"Ja. For sikkerhets skyld må ordreendringer kanskje behandles via e-post eller kontaktskjemaet vårt.","faqQ3":"Må jeg betale toll/importavgifter?","faqA3":"Toll og avgifter er generelt ikke forhåndsbetalt, bortsett fra DDP til USA. MVA kan gjelde for EU, Storbritannia, AU/NZ, Norge, Sveits og kanadiske provinser som Saskatchewan og Manitoba, som allerede er betalt som standard. Ingen GST gjelder for Singapore. Vi kan ikke gi råd om tollavgifter – kontakt din lokale toll for detaljer.","faqQ4":"Når sendes bestillingen min?","faqA4":"Bestillinger sendes vanligvis innen 1-5 virkedager. I perioder med høyt volum kan det ta 5–7 dager.","faqQ5":"Jeg bestilte to ganger ved en feiltakelse. Hva skal jeg gjøre?","faqA5":"Vi refunderer kun doble fraktgebyrer. Begge varene sendes sammen. Refusjon = (1. fraktgebyr + 2. fraktgebyr) – faktisk fraktgebyr.","faqQ6":"Hvor lang tid tar leveringen?","faqA6":"Behandling tar 1-5 virkedager.\n\nInnenlands frakt:\n• SingPost Prepaid Tracked Label: 2-4 dager\n• SpeedPost Standard: 1-3 dager\n\nInternasjonalt:\n• SingPost ePAC: 14-30 dager\n• SpeedPost Priority (EMS): 8-15 dager\n• SpeedPost Express: 4-8 dager\n\nForsinkelser kan oppstå i høysesonger.","faqQ7":"Varen min returneres til avsender. Hva skal jeg gjøre?","faqA7":"En ny sending er tillatt. Kansellering er ikke mulig for ugyldige adresser, uavhentede pakker eller ubetalte tollavgifter. Kontakt posttjenesten din for ny levering, eller send oss en melding for å få hjelp.","faqQ8":"Varen min er tapt / stjålet under transport.","faqA8":"Vi tillater en ny sending. Hvis den går tapt igjen, utstedes full refusjon etter kurerens leveringsvindu:\n\n• Singapore lokale tjenester: 7 dager\n• SingPost ePAC & SpeedPost Priority International: 30 dager\n• SpeedPost Intl Express: 14 dager","blogTitle":"Frakt & Post Kunnskapsbase","blogSubtitle":"Offisielle forklaringer på posttjenester, toll, MVA og avgifter.","readMore":"Les Mer","backButton":"Tilbake","copyrightText":"Alle rettigheter forbeholdt.","blogPost1Title":"Hva er SingPost ePAC?","blogPost1Desc":"Lær om SingPost ePAC (ePacket), en økonomisk sporet posttjeneste.","blogPost2Title":"Hva er SpeedPost Priority International (EMS)?","blogPost2Desc":"Oppdag EMS, den internasjonale premium postekspressetjenesten.","blogPost3Title":"Hva er SpeedPost Express?","blogPost3Desc":"Utforsk SpeedPost Express med DHL Express levering.","blogPost4Title":"USA PDDP","blogPost4Desc":"Forstå PDDP for USA.","blogPost5Title":"EU MVA & IOSS","blogPost5Desc":"Innsikt i EU MVA og IOSS-systemet.","blogPost6Title":"UK MVA & HMRC","blogPost6Desc":"MVA-krav for Storbritannia.","blogPost7Title":"Norge VOEC","blogPost7Desc":"Norges VOEC-system.","blogPost8Title":"Sveitsisk MVA","blogPost8Desc":"Sveitsiske MVA-krav.","enterDestinationPostcode":"Skriv inn destinasjonens postnummer","trackingCaseSensitive":"SPORINGS BOKSTAVER SKILLER MELLOM STORE OG SMÅ BOKSTAVER OG MÅ VÆRE I STORE BOKSTAVER.","usaPostcodeNote":"For land uten postnummer, f.eks. Hong Kong og Macao, skriv inn 999077 (Hong Kong) eller 999078 (Macao).","epacDeliveryNote":"Vennligst MERK at alle ePAC-varer som sendes til destinasjonen skal leveres til postkassen, døren, pakkeskapet eller legges igjen på et trygt sted!","currentTime":"Nåværende tid","timezoneNote":"Tid vist i 12-timers format","sameTimeAsSingapore":"Samme tid som Singapore","hourAhead":"time foran Singapore","hoursAhead":"timer foran Singapore","hourBehind":"time bak Singapore","hoursBehind":"timer bak Singapore","collectAtPostOffice":"Men hvis landet ditt ikke har postkasse tilgjengelig som standard, må du hente den på postkontoret.","countriesNoMailbox":"Land som er kjent for ikke å ha postkasse/postkasselevering tilgjengelig: Brunei, Kina, India, Israel, Macao SAR Kina, Filippinene, Polen og Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus ER IKKE ANSVARLIG for håndtering av leveransene da det er utenfor vår kontroll, og vi vil helst at du sporer statusen til varen din.","issuesAfterDelivery":"Eventuelle problemer med leveringen din etter 30/45 dager (14 dager for SpeedPost Express) eller status viser levert men du har ikke mottatt, vennligst kontakt oss","cannotUseEmbed":"Vi kan ikke bruke innbygging for sporing da de fleste posttjenestens nettsteder ikke støtter det.","clickLinkAbove":"Vennligst klikk på lenken ovenfor for å spore pakken din.","trackingDetailsNote":"Merk at sporingsdetaljer kanskje ikke vises i søkeresultatene, så det anbefales å lime inn sporingsnummeret i systemet for å spore varen.","thirdPartyWebsites":"Du kan også spore pakkene dine på disse tredjeparts nettstedene:","enterEmailOrPhone":"Skriv inn e-post eller telefon","reviewShippingRates":"Se våre gjeldende fraktpriser","here":"her","contactUsForm":"Vennligst kontakt oss via","form":"skjemaet","forEnquiries":"for eventuelle spørsmål du har angående bestillingen din.","anPostNoDirectTracking":"An Post (Irland) støtter ikke direkte sporingslenker eller innebygd sporing.","anPostPasteManually":"Vennligst kopier og lim inn sporingsnummeret ditt manuelt på An Posts nettsted:","goToAnPost":"Gå til An Post","countryMsgNL":"Hvis statusen viser 'Held by Customs', vennligst kontakt Nederlands Toll Informasjonslinje for hjelp:\n0800 0143 (gratis), mandag-fredag 7-23.\nLørdag og søndag 8-16:30.\n\nDet anbefales å registrere en konto hos PostNL for å motta umiddelbare push-varsler om pakkene dine:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nHvis det leveres til et PostNL-punkt eller statusen ber deg hente på postkontoret, må du betale 7 EUR ved skranken. Maksimalt 4 EUR hvis det betales online.","countryMsgDE":"Vi anbefaler at du laster ned Post & DHL-appen for å motta push-varsler om sporingsstatusen til pakkene dine:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH Kundeservice Kontakt:\n+49-228-433-3112\nDHL DE Kontakt: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Du må sende inn en ekstra importdeklarasjon til tollmyndighetene. Ellers kan det bli innreisebegrensninger og pakken sendes tilbake. \nMer informasjon: https://www.posti.fi/en/receiving/customs-clearance \nAndre lenker: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Behandlingsgebyr på 4,95 EUR påløper.\nLast ned appen her: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Behandlingsgebyr på 8,50 PLN påløper. \nDu må betale dette når du henter på postkontoret,\nda pakken sannsynligvis ikke vil bli levert til døren eller postkassen din.","countryMsgPH":"PHLPost anses som ineffektiv og upålitelig i Filippinene.\nVennligst spor pakken din alltid, siden statusen 'På vei til levering'\nnoen ganger bare vises mellom 1 og 3 uker for mindre pakker. For større pakker er\nhenting kun tilgjengelig på Manila Central Post Office eller nærmeste\npostkontor i nærheten av deg. Vær oppmerksom på at det påløper en behandlingsgebyr på 112 PHP for pakker\nav enhver verdi som du må betale. Ved manglende betaling vil pakken bli sendt tilbake til oss.\nLeveringen forventes å ta 1-2 måneder på grunn av PHLPosts langsomme tjenester. \nDu trenger ikke betale skatt for varer under 10000 PHP, men du må gjøre det hvis verdien er lik eller over dette beløpet. \nVi vil anbefale SpeedPost Express for en raskere prosess neste gang du bestiller fra oss. Imidlertid kan avgiftene ikke påløpe siden D&T gjelder for mottakeren som standard.","countryMsgCA":"De minimis er 20 CAD for alle bestillinger til Canada. Siden Singapore er en del av CPTPP-avtalen, kan det være at det ikke påløper toll, men D&T kan påløpe hvis varen overstiger 60 CAD og oppover eller 100 CAD og oppover, avhengig av varens HS-kode. Enhver verdi over vil bli belastet tilsvarende med moms.","countryMsgID":"Du må betale alle påløpte skatter og toll ved ankomst til Indonesia. Vennligst spor pakken din og betal det angitte beløpet til det indonesiske tollvesenet.\nDu må også sende inn ytterligere tolldokumenter. Ellers kan det bli innreisebegrensninger eller beslagleggelse av pakken av landets tollvesen. Vennligst sjekk flere detaljer her:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Du må betale alle påløpte skatter og toll ved ankomst til India. Vennligst spor pakken din og betal det angitte beløpet til det indiske tollvesenet.\nVær oppmerksom på at tollklarering i India er streng, og du må kanskje betale toll hvis verdien av varen din overstiger 1000 INR (15 USD) - avhengig av HS-koden, i de fleste tilfeller er det tollfritt, men du kan betale høyere toll hvis varen overstiger 5000 INR (60 USD). \nSiden India Post IKKE leverer til postkassen som standard, MÅ du kanskje være hjemme eller være en autorisert representant for å motta pakken din eller hente den på postkontoret.","countryMsgMY":"De minimis er 500 MYR for alle bestillinger til Malaysia. Bestillinger over dette beløpet kan bli belastet.","countryMsgUS":"Fra 29. august 2025 vil De minimis på 800 USD offisielt bli avskaffet, og importavgifter skal som standard betales av avsenderen i opprinnelseslandet.\nUSA-forsendelse KREVER et gyldig telefonnummer og e-postadresse for at pakken din skal unngå ytterligere forsinkelser.","countryMsgIL":"De minimis er 240 ILS (75 USD) for alle forsendelser til Israel. Bestillinger over dette beløpet kan bli belastet. \nVær oppmerksom på at Israel Post noen ganger ikke bekrefter endelig levering når den er levert ved bestillinger til Israel. \nSiden Israel Post IKKE leverer til postkassen som standard, MÅ du kanskje være hjemme eller være en autorisert representant for å motta pakken din eller hente den på postkontoret.","countryMsgGB":"Vær oppmerksom på at Royal Mail noen ganger ikke bekrefter endelig levering når den er levert til postkassen din ved bestillinger til Storbritannia.","countryMsgTH":"De minimis er 1500 THB (45 USD) for alle forsendelser til Thailand. Bestillinger over dette beløpet kan bli belastet.","countryMsgTW":"De minimis er 2000 TWD (60 USD) for alle forsendelser til Taiwan. Bestillinger over dette beløpet kan bli belastet.","countryMsgMO":"Det påløper ikke D&T for forsendelser til Macau. Vær imidlertid oppmerksom på at Macau Post IKKE leverer til postkassen som standard, du MÅ hente pakken din på postkontoret.","countryMsgBN":"Det påløper ikke D&T for forsendelser til Brunei. Vær imidlertid oppmerksom på at Brunei Post IKKE leverer til postkassen som standard, du MÅ hente pakken din på postkontoret. \nSporingssystemet for dette landet er ikke veldig stabilt, og det kan kun gis begrenset informasjon, og endelige leveringsresultater gis IKKE til opprinnelsen.","countryMsgJP":"De minimis er 10000 JPY (65 USD) for alle forsendelser til Japan. Bestillinger over dette beløpet kan bli belastet.","countryMsgKR":"De minimis er 180000 KRW (150 USD) for alle forsendelser til Sør-Korea. Bestillinger over dette beløpet kan bli belastet.","countryMsgVN":"For Vietnam, vennligst vær TILGJENGELIG under leveringen, da du kan bli belastet behandlingsgebyrer ved leveringen av varen. \nDe minimis er 1000000 (35 USD) for alle forsendelser til Vietnam. Bestillinger over dette beløpet kan bli belastet. \nSiden Vietnam Post IKKE leverer til postkassen som standard, MÅ du kanskje være hjemme eller være en autorisert representant for å motta pakken din eller hente den på postkontoret.","countryMsgPP":"Tracked Label-varer blir plassert i POPDrop/POPStop på postkontoret. SpeedPost Standard-varer blir vanligvis plassert på POPStop eller POPStation.\nVær oppmerksom på at levering av Tracked Label-varer BARE skjer mandag-fredag 9-18. Unntatt helger og helligdager.","epacUS":"Førsteklasses internasjonal pakkeservice","epacCH":"Prioritet pluss","epacGB":"Internasjonal sporet","epacMY":"Internasjonal sporet/Express","epacCA":"Internasjonal innkommende Express","epacAU":"Pakk og spor internasjonal","epacNZ":"Internasjonal økonomi sporet","epacDE":"Warenpost Internasjonal Premium","epacFR":"Lettre internationale suivie","epacNL":"Internasjonal pakke sporet","epacPL":"GLOBAL Expres","epacBE":"Internasjonal Prime innkommende","epacAT":"Internasjonal sporet pakke","epacIN":"Internasjonal sporet pakke","epacFI":"Internasjonal sporet brev","epacSE":"Internasjonal sporet brev","epacNO":"PRIME Exprès","epacIT":"Uttrykke","epacIL":"Uttrykke","epacES":"Internasjonal lett pakke","epacPT":"Internasjonal blå post","epacCZ":"Sporet forsendelse fra utlandet","epacBN":"Internasjonal ePacket","epacCN":"Internasjonal ePacket","epacHK":"Internasjonal ePacket","epacID":"Internasjonal e-pakke","epacMO":"Internasjonal ePacket","epacPH":"Internasjonal sporet post","epacTW":"Internasjonal ePacket","epacTH":"Internasjonal ePacket","epacVN":"Internasjonal E-pakke (ASEAN Pack)","epacKR":"K-Pakke","epacJP":"Internasjonal e-pakke Light","epacIE":"Internasjonal Express post","dhlNoEmbed":"DHL Express støtter ikke innebygd sporing. Vennligst","speedPostNoEmbed":"SpeedPost Singapore støtter ikke innebygd sporing. Vennligst","operatorNoEmbed":"støtter ikke innebygd sporing. Vennligst","clickHere":"klikk her","toTrackNewTab":"for å spore (åpnes i ny fane).","statusInPreparation":"Under forberedelse","statusInTransit":"På vei","statusDelivered":"Levert","statusOutForDelivery":"Ute for levering","statusArrived":"Ankom","statusProcessing":"Behandler","statusDispatched":"Sendt","statusReturned":"Returnert","statusFailed":"Leveringen mislyktes","statusCancelled":"Kansellert","statusHeldByCustoms":"Holdt av tollvesenet","statusAwaitingCollection":"Venter på henting","aka":"også kjent som","thisServiceKnownAs":"Denne tjenesten er kjent som","in":"i","viewTrackingDHL":"Vis sporingsinformasjon fra DHL Express","viewTrackingSingPostSpeedPost":"Vis sporingsinformasjon fra Singapore SpeedPost","viewTrackingDHLLastMile":"Vis sporingsinformasjon fra DHL Express (Siste mil)","viewTrackingDHLShipperRef":"Vis sporingsinformasjon fra DHL Express (Avsenderreferanse)","viewTrackingSingPost":"Vis sporingsinformasjon fra Singapore Post","viewTrackingDestPost":"Vis sporingsinformasjon fra","post":"Stolpe","countryRU":"🇷🇺 Russland","russiaServiceSuspended":"⚠️ VIKTIG MELDING: På grunn av den russiske invasjonen av Ukraina i 2022 har SingPost suspendert alle forsendelser til Russland sammen med DHL. Vi betjener for øyeblikket ikke Russland inntil det er kunngjort gjenopptagelse av tjenester til landet.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Ønsker deg og din familie fred, glede og velsignelser! 🌟","deepavaliMessage":"🪔 Glad Deepavali! Måtte lysfesten gi deg glede, velstand og suksess! ✨","diwaliMessage":"🪔 Glad Diwali! Måtte lysfesten gi deg glede, velstand og suksess! ✨","vesakMessage":"☸️ Gratulerer med Vesak-dagen! Ønsker deg fred, visdom og opplysning på denne hellige dagen! 🙏","vesakTHMessage":"☸️ Gratulerer med Visakha Bucha-dagen! Ønsker deg fred, visdom og opplysning på denne hellige dagen! 🙏","australiaNationalDayMessage":"🇦🇺 Gratulerer med Australia Day! Vi feirer nasjonen vår! 🎉","canadaNationalDayMessage":"🇨🇦 Gratulerer med Canada-dagen! Vi feirer vår flotte nasjon! 🍁","usaNationalDayMessage":"🇺🇸 Gratulerer med uavhengighetsdagen, Amerika! Vi feirer frihet og frihet! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! Vive la Frankrike! 🎊","germanyUnityDayMessage":"🇩🇪 Gratulerer med tysk enhetsdag! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Gratulerer med Foundation Day, Japan! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Gratulerer med nasjonaldagen, Kina! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Gratulerer med frigjøringsdagen, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Gratulerer med uavhengighetsdagen, India! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Gratulerer med nasjonaldagen, Thailand! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Gratulerer med uavhengighetsdagen, Filippinene! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Gratulerer med nasjonaldagen, Vietnam! Quốc khanh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Gratulerer med uavhengighetsdagen, Polen! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Gratulerer med uavhengighetsdagen, Tsjekkia! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Lenge leve kongen! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Glad Sveriges nasjonaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום frihet, glede! Gratulerer med uavhengighetsdagen, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Gratulerer med St. Patrick's Day, Irland! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Gratulerer med Waitangi-dagen, New Zealand! 🎉","switzerlandNationalDayMessage":"🇨🇭 Gratulerer med den sveitsiske nasjonaldagen! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Østerrike! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgia! Fijne Nationale Feestdag! 🎊","fillAllFields":"Fyll ut alle obligatoriske felter: sporingsnummer, destinasjonsland, bestillingsnummer og postnummer.","noOrderMatchingFields":"Ingen ordre funnet som samsvarer med alle feltene.","postcodeRequired":"Postnummer kreves for denne destinasjonen.","invalidUSZip":"Ugyldig amerikansk postnummer. Bruk 5 sifre eller ZIP+4.","failedGenerateURL":"Kunne ikke generere sporings-URL. Vennligst sjekk inndata.","trackingValidationSG":"Sporingsnumre for Singapore må være: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG eller PX123456789SG. For DHL-forsendelser bruk 10-sifrede tall.","invalidSingPostFormat":"Ugyldig SingPost-sporingsnummerformat.\nGodkjente formater:\n• PP123456789SG → Forhåndsbetalt sporet etikett\n• SPNDD00012345 → SpeedPost standardsporing","trackingNumberExample":"f.eks. LG123456789SG","australianDSTTitle":"Australsk sommertid aktiv","australianDSTBothMessage":"Både AEDT (Australian Eastern Daylight Time) og ACDT (Australian Central Daylight Time) er i kraft.","australianAEDTMessage":"AEDT (Australian Eastern Daylight Time) er for øyeblikket i kraft for Sydney, Melbourne og områdene rundt.","australianACDTMessage":"ACDT (Australian Central Daylight Time) gjelder for øyeblikket for Adelaide og Sør-Australia.","australianDSTNote":"Leveringstidene vist ovenfor gjenspeiler gjeldende sommertid.","filteredAllowedDestinations":"(filtrert for tillatte destinasjoner)","loadingAnnouncements":"Laster inn kunngjøringer...","unableToLoadAnnouncements":"Kan ikke laste inn tjenestekunngjøringer for øyeblikket.","viewOnSingPostWebsite":"Se på SingPost-nettstedet →","postedDate":"Postet dato:","status":"Status:","shippedVia":"Sendes via:","destination":"Destinasjon:","statusHeldByCustms":"Holdes av tollvesenet","orderNumberExample":"Bestillingsnummer (starter med RTNX eller DLTB - eksempel: RTNX1234567890):","deliveryRecordNote":"Vær oppmerksom på at når varen er levert, vil posten kun lagres i opptil 7 dager og vil bli slettet.","copyrightAllRights":"Alle rettigheter forbeholdt.","accessRestricted":"Begrenset tilgang","vpnDetectedMessage":"VPN-bruk oppdaget. Vennligst deaktiver VPN for å få tilgang til denne tjenesten.","contactSupportError":"Hvis du mener dette er en feil, vennligst kontakt support.","destinationNotAllowed":"Tilgang til dette destinasjonslandet er ikke tilgjengelig fra din plassering. Vennligst velg en annen destinasjon.","blogSingPostEPACContent1":"SingPost ePAC (ePacket) er en økonomisk sporet posttjeneste for lette internasjonale e-handelsforsendelser.","blogSingPostEPACContent2":"Den leveres av destinasjonslandets nasjonale postoperatør og brukes vanligvis for pakker under 2 kg, innenfor en dimensjonsgrense på lengde + bredde + høyde under 90 cm og lengde som ikke overstiger 60 cm.","blogSingPostEPACContent3":"Dette alternativet ble i utgangspunktet bare tilbudt av Hong Kong Post sammen med eBay Kina, slik at pakker fra Kina og Hong Kong kunne sende små pakker til USA med leveringssporing uten krav om underskriver ved levering. Denne tjenesten er kjent som USPS (United States Postal Service) First-Class Package International Service i USA.","blogSingPostEPACContent4":"Fra 1. januar 2026 brukes ePAC nå for alle land for å overholde de obligatoriske UPU-forskriftene som krever at sporing av pakker og registrerte varer kun skal begrenses for dokumenter.","blogSingPostEPACContent5":"Sporingsprefikser: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS er en internasjonal premium postekspresstjeneste, prioritert av postoperatører over hele verden.","blogSpeedPostEMSContent2":"Fortolling er generelt raskere enn vanlig post, men strengere i prosessen, med full sporing frem til levering.","blogSpeedPostEMSContent3":"I Singapore er dette kjent som SpeedPost Priority International av SingPost.","blogSpeedPostEMSContent4":"Sporingsprefiks: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express er en budtjeneste.","blogSpeedPostExpressContent2":"På mange destinasjoner utfører DHL Express levering siste mil og innkrever avgifter eller avgifter før frigjøring.","blogSpeedPostExpressContent3":"Sporingsprefiks: PX123456789SG (Last-mile DHL Express bruker et 10-sifret sporingsnummer, som ikke er synlig for publikum, men vi har informasjon for det gjennom vår","blogSpeedPostExpressContent3Link":"Sporingssystem.","blogUSPDDPContent1":"PDDP tillater at amerikanske importavgifter og avgifter forhåndsbetales før levering, noe som reduserer overraskelsesgebyrer for mottakere.","blogUSPDDPContent2":"Nye forskrifter (i kraft 29. august 2025)","blogUSPDDPContent2List1":"Obligatoriske HTS-koder","blogUSPDDPContent2List2":"Nøyaktige varebeskrivelser","blogUSPDDPContent2List3":"Strengere taksthåndhevelse","blogUSPDDPContent3":"Alle varer som sendes til USA vil ikke bli belastet med noen ekstra tariffer til mottakeren da vi betaler på dine vegne. Vær imidlertid oppmerksom på at vareprisen er 10 % importavgift som standard som er satt i samsvar med regelverket.","blogUSPDDPContent4":"Dette gjelder kun for våre fraktmetoder for USA, SpeedPost Priority International (EMS) og SingPost ePAC.","blogEUIOSSContent1":"EU pålegger merverdiavgift på all kommersiell import uavhengig av verdi.","blogEUIOSSContent2":"IOSS (Import One-Stop Shop)","blogEUIOSSContent3":"IOSS lar selgere kreve inn EU-mva ved kassen for forsendelser opp til €150.","blogEUIOSSContent4":"Merverdiavgift sendes deretter via IOSS-systemet, noe som muliggjør raskere fortolling og ingen momsinnkreving ved levering.","blogEUIOSSContent5":"For alle bestillinger via Etsy eller eBay, er IOSS MVA allerede samlet inn ved kassen, og vi vil indikere det på skattereferansenummeret for å overføre dataene til destinasjonsposttjenesten via EDI (Electronic Data Intercharge).","blogUKVATContent1":"Storbritannia krever at det skal regnskapsføres merverdiavgift på importerte varer.","blogUKVATContent2":"For forsendelser med lav verdi, blir mva vanligvis samlet inn i kassen og sendt direkte til HMRC av selgeren eller markedsplassen.","blogUKVATContent3":"For forsendelser med høyere verdi kan transportøren kreve inn moms før levering.","blogUKVATContent4":"For alle bestillinger via Etsy eller eBay, er MVA allerede samlet inn ved kassen, og vi vil indikere det på skattereferansenummeret for å overføre dataene til destinasjonsposttjenesten via EDI (Electronic Data Intercharge).","blogNorwayVOECContent1":"Norge innførte VOEC-systemet (VAT on E-Commerce) for varer importert fra utenfor EU/EØS. Dette gjelder varer verdt inntil 3000 kr.","blogNorwayVOECContent2":"Selgere kan registrere seg i VOEC-ordningen for å kreve inn norsk moms i kassen, noe som gir raskere fortolling og ingen momsinnkreving ved levering.","blogNorwayVOECContent3":"For alle bestillinger via Etsy eller eBay, er VOEC MVA allerede samlet inn ved kassen. Sporing og tollpapirer angir skattereferansenummeret for å overføre data til det norske postvesenet.","blogSwissVATContent1":"Sveits krever moms på importerte varer uavhengig av verdi. Den sveitsiske føderale tolladministrasjonen krever at utenlandske selgere krever inn moms ved kassen for varer opptil 65 CHF.","blogSwissVATContent2":"Selgere registrert under det sveitsiske merverdiavgiftssystemet betaler den innsamlede merverdiavgiften direkte, og sikrer at mottakeren ikke opplever ekstra merverdiavgift ved levering.","postalContactsTitle":"Posttjeneste Kontakter","postalContactsNote":"Merk:","postalContactsPolandUKNote":"For Polen og Storbritannia vil alle varer sendt via SpeedPost Priority (EMS) bli håndtert av Pocztex og Parcelforce.","postalContactsDHLNote":"For SpeedPost Express-forsendelser, vennligst kontakt DHL gjennom denne lenken:","postalContactsCountry":"Land","postalContactsWebsite":"Nettsted","postalContactsForm":"Kontaktskjema","postalContactsPhone":"Kontaktnummer","postalContactsEmail":"Kontakt E-post","postalContactsFormLink":"Kontaktskjema","postalContactsBackButton":"Tilbake til pakkeskjema","blogSwissVATContent3":"For alle bestillinger via Etsy eller eBay, er sveitsisk moms allerede samlet inn under kassen, og tollpapirene inkluderer skattereferansenummeret for EDI-innsending.","contactUsTitle":"Kontakt Oss","parcelDisagreeCheckbox":"Nei","contactDisagreeCheckbox":"Nei","contactNameLabel":"Navn","contactEmailLabel":"E-post","contactEmailNote":"Private relé-e-poster (f.eks. @privaterelay.appleid.com) aksepteres ikke. Bruk en gyldig e-postadresse.","contactEnquiryTypeLabel":"er dette en?","contactSelectOption":"Velg et alternativ","contactGeneralEnquiry":"Generell forespørsel / tilbakemelding","contactBusinessEnquiry":"Forretningsforespørsel","contactOrderShippingEnquiry":"Forespørsel om ordre/frakt","contactExchangeRefundEnquiry":"Forespørsel om bytte/refusjon/retur","contactOthers":"Andre","contactParcelWarning":"Hvis pakken din ikke er levert i mer enn 18/30/45 dager (14 dager for FedEx), eller status viser levert men du ikke har den, vennligst fyll ut DETTE SKJEMAET i stedet.","contactParcelWarningLink":"DETTE SKJEMAET","contactParcelWarningEnd":"i stedet.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"Etsy, eBay & Shopee ordrenummer ikke her. Vi har INGEN kontroll over refusjoner fra disse plattformene. Vennligst kontakt kundeservicen deres separat.","contactPlatformInstructions":"Bruk appen for å se ordrenummeret ditt, da det er lagret i appen:","contactPlatformEtsy":"Etsy - Øverst til høyre på profilen din → Kjøp","contactPlatformEbay":"eBay - Min eBay → Kjøp","contactPlatformShopee":"Shopee - Meg → Se kjøpshistorikk (eller du kan klikke på Til Sending/Til Mottak)","contactRefundNote1":"Hvis du spør om retur/refusjon fra plattformen du kjøpte fra, vær oppmerksom på at vi har INGEN kontroll over refusjoner fra disse plattformene. Vennligst kontakt kundeservicen deres separat.","contactRefundNote2":"For returer eller bytter, hvis maimai-hanskene allerede har blitt brukt når de åpnes (synlige flekker eller vasket i maskin håndvask), tillater vi ikke, og returer eller bytter av arkadekort er ikke tillatt. Takk.","contactRefundNote3":"Vær oppmerksom på at for refusjoner via Payhip, hvis du ikke mottar refusjonen, kontakt banken din eller Payhip support (support@payhip.com), da vi ikke har kontroll over den prosessen.","contactMessageLabel":"Melding","contactCharacterCount":"tegn","contactSpamWarningNote":"Merk:","contactSpamWarning":"Uønskede tilbud om SEO, nettdesign, lån eller lignende tjenester vil automatisk bli avvist.","contactAgreementText1":"Klikk på \"Jeg godtar\" hvis du godtar at e-postadressen din brukes av Rhythm Nexus for å svare deg, da dette er nødvendig for oss å lese svaret ditt og svare deg når vi kommer med en løsning på forespørselen din.","contactAgreementText2":"Vær oppmerksom på at svaret vårt vil ta 3-5 virkedager, eller lenger under høy mengde e-poster fra vår side.","contactAgreeCheckbox":"Jeg godtar","contactSuccessMessage":"Din melding er sendt inn! Vi vil svare innen 3-5 virkedager.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"Pakkeforespørsel","parcelInfoText":"Dette skjemaet er for pakker som ikke er levert i mer enn 18/30/45 dager (14 dager for FedEx/DHL), eller som har vist leveringsstatus, men ikke er hos deg.","parcelInfoLink":"Klikk her","parcelInfoEnd":"for andre henvendelser.","parcelWaitTitle":"Vent på pakken din","parcelWaitText1":"Vennligst vent på leveransen av pakken din. Merk at internasjonale leveranser IKKE er det samme som lokale leveranser fordi de tar tid. Takk!","parcelWaitText2":"Hvis ingen status vises etter 18 dager (7 dager for Singapore) eller mer, kan du informere oss direkte.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"Navn","parcelOrderNumberLabel":"Bestillingsnummer (eksempel: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"E-post","parcelEmailNote":"Private relé-e-poster aksepteres ikke. Bruk en gyldig e-postadresse.","parcelShippingMethodLabel":"Valgt forsendelsesmetode?","parcelSelectShipping":"Velg en fraktmetode","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"Sporingsnummer","parcelUndeliveredLabel":"Har pakken din ikke vært levert i mer enn 18/30/45 dager? (Singapore lokale tjenester >7 dager, >14 dager for SpeedPost Express/DHL)","parcelSelectOption":"Velg et alternativ","parcelYes":"Ja","parcelNo":"Ingen","parcelDeliveredButMissingLabel":"Har pakken din vist status levert, men den ligger ikke i postkassen/trygt sted/dørstokken din?","parcelCaseReferenceLabel":"Saksreferanse-ID fra det lokale postkontoret","parcelCaseReferencePlaceholder":"Sett NA hvis du er fra Singapore","parcelCaseReferenceNote":"Før du sender inn dette skjemaet, vennligst kontakt ditt lokale postkontor via telefon eller e-post og få en saksreferanse-ID fra dem. Deretter legger du inn saksreferanse-ID-en din her.","parcelCaseReferenceLink":"Se denne lenken for posttjenester","parcelCaseReferenceMandatory":"SETT NA KUN HVIS DU ER FRA SINGAPORE. For andre land er det OBLIGATORISK å gi. Påkrevd for SpeedPost Express også, for DHLs saks-ID.","parcelImageEvidenceLabel":"Bildebevis (for leverte, men manglende pakker)","parcelImageWarning":"For ekstra verifisering trenger vi bildebevis for å bevise at du ikke fremsetter falske krav om ikke-levering av pakker. (Kun for pakker som allerede er levert, men ikke til stede i postkassen/utenfor døren. Vi kan avvise kravet ditt hvis det ikke gis fotobevis for leverte varer. Ignorer dette hvis varen din IKKE har vist levert status.)","parcelImageNote":"Last opp 1 støttet fil: bilde. Maks 1 GB.","parcelAgreementText":"Vennligst klikk på \"Jeg godtar\" hvis du forsikrer deg om at det som har skjedd med pakken din var sant.","parcelAgreeCheckbox":"Jeg godtar","parcelSuccessMessage":"Din pakkeforespørsel er sendt inn! Vi vil svare innen 3-5 virkedager.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","lookalikeDomainWarning":"Dette er ikke et sporingsnummer, men en lenke til et nettsted som utgir seg for å være et pakkeselskap. Ikke oppgi person- eller betalingsopplysninger der.","lookalikeDomainOfficial":"Offisielt nettsted:"};
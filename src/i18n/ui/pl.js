@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus korzysta z premium sieci komercyjnych. Jednak w momencie dotarcia do Twojego kraju odpowiedzialnosc za przesylke przejmuje lokalny operator krajowy (np. USPS, Royal Mail, lokalnie DHL). Na tym etapie prefiksy numeru sledzenia zmieniaja system obslugi, ale nasz uniwersalny tracker laczy te statusy, zapewniajac Ci nieprzerwana widocznosc.","trackingLastMileTitle":"Siec doreczen ostatniej mili","trackingCustomsClearanceBody":"Wszystkie przesylki transgraniczne musza przejsc odprawe w lokalnym urzedzie celnym Twojego kraju. Nasze narzedzie monitoruje przejscia od przybycia do obiektu importowego po przekazanie do odprawy celnej. Sluzby graniczne weryfikuja kody HS i potwierdzaja, ze wlasciwy VAT lub cla zostaly oplacone (np. IOSS w UE, VOEC w Norwegii). Szczegolnie monitoruj sledzenie pod katem ostrzezen \"Held at Customs\".","trackingCustomsClearanceTitle":"Informacje o odprawie celnej","trackingProcessingOriginBody":"Po nadaniu przesylka trafia do centrum przetwarzania w kraju nadania, gdzie jest skanowana, wazona i poddawana podstawowym kontrolom bezpieczenstwa eksportowego. Nastepnie jest kierowana do miedzynarodowego wezla wymiany pocztowej. Harmonogram lotow zalezy od dostepnej przepustowosci cargo. Nie niepokoj sie, jesli ten status utrzymuje sie przez kilka dni.","trackingProcessingOriginTitle":"Przetwarzanie w centrum nadawczym","trackingInfoReceivedBody":"Gdy zamowienie jest po raz pierwszy przetwarzane na naszych platformach e-commerce (takich jak Etsy, eBay lub sprzedaz bezposrednia), numer sledzenia jest generowany elektronicznie. Przewoznik otrzymuje dane przesylki, zanim fizycznie przejmie paczke. Prosimy odczekac od 1 do 3 dni roboczych na przyjecie przesylki do fizycznej sortowni.","trackingInfoReceivedTitle":"Informacje otrzymane","trackingStatusesIntro":"Dziekujemy za korzystanie z naszego zunifikowanego narzedzia do miedzynarodowego sledzenia przesylek. Poniewaz Twoja paczka przekracza wiele granic na swiecie, jej statusy moga byc zlozone. Zrozumienie cyklu logistycznego pomaga ustawic jasne oczekiwania.","trackingStatusesTitle":"Jak rozumiec statusy sledzenia","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"AM","pmText":"PM","footerQuickLinks":"Szybkie linki","footerSupportLegal":"Wsparcie i kwestie prawne","copyrightText":"Wszelkie prawa zastrzeżone.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Nowa Fundlandia)","tzAST":"AST (Atlantycki)","tzEST":"EST (Wschodni)","tzCST":"CST (Centralny)","tzMST":"MST (Górski)","tzPST":"PST (Pacyficzny)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaje)","tzBeijing":"Pekin","tzXinjiang":"Sinciang","tzWIB":"WIB (Dżakarta)","tzWITA":"WITA (Makasar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Obwód królewiecki (UTC+2)","tzMoscow":"Moskwa/Zachodnia Rosja (UTC+3)","tzSamara":"Obwód samarski (UTC+4)","tzUral":"Ural (UTC+5)","tzOmsk":"Obwód omski (UTC+6)","tzKrasnoyarsk":"Kraj Krasnojarski (UTC+7)","tzIrkutsk":"Obwód irkucki (UTC+8)","tzSakha":"Sacha Republika (UTC+9)","tzPrimorsky":"Kraj Nadmorski (UTC+10)","tzMagadan":"Obwód magadański (UTC+11)","tzKamchatka":"Kraj Kamczacki (UTC+12)","dstDayStartsLabel":"Czas letni zaczyna się","dstDayEndsLabel":"Czas letni kończy się","dstRevertsLabel":"powrót do czasu standardowego","dstEuropeLabel":"Europa","dstNewZealandLabel":"Nowa Zelandia","englishResponseNotice":"Uwaga: Odpowiedzi na wszystkie zapytania udzielane są w języku angielskim. Jeśli prześlesz wiadomość w innym języku, Twoja wiadomość może zostać przetłumaczona na język angielski w celu weryfikacji.","parcelDisagreeCheckbox":"Nie zgadzam się","contactDisagreeCheckbox":"Nie zgadzam się","contactNamePlaceholder":"Np: Jan Kowalski","systemRequirementsTitle":"Minimalne obsługiwane wersje systemu","systemRequirements":"Windows: Windows 7 (with ESU updates installed) lub nowszy\nmacOS: macOS 12 lub nowszy\nAndroid: Android 13 lub nowszy\niPhone/iOS: iOS 17 lub nowszy\nLinux: Obsługiwana dystrybucja z aktywnymi aktualizacjami zabezpieczeń","goodFridayEasterGreeting":"Wesołej Wielkanocy! Pokój i radość w Wielki Piątek i Wielkanoc.","christmasGreeting":"Wesołych Świąt i Szczęśliwego Nowego Roku! Pokój i radość od 25 grudnia do 5 stycznia.","captchaSystemRequirements":"Minimalne wymagania systemowe: Windows 7 (with ESU updates installed) lub 11, macOS 10.15+, lub najnowsza wersja Android/iOS.","title":"Weryfikacja Dostępu","subtitle":"Proszę wypełnić wyzwanie poniżej, aby kontynuować.","selectLanguage":"Wybierz Język","selectLanguagePlaceholder":"-- Wybierz język --","loadingChallenge":"Ładowanie wyzwania...","answerLabel":"Twoja odpowiedź:","answerPlaceholder":"Wpisz swoją odpowiedź","continueButton":"Kontynuuj","refreshButton":"Nowe Wyzwanie","verifying":"Weryfikacja...","chooseLanguageFirst":"Proszę najpierw wybrać język.","loadFailed":"Nie udało się załadować wyzwania. Proszę spróbować ponownie.","expiredChallenge":"Wyzwanie wygasło. Ładowanie nowego wyzwania...","verifyFailed":"Weryfikacja nie powiodła się. Proszę spróbować ponownie.","home":"Strona Główna","blog":"Bloga","aboutUs":"O Nas","faq":"Najczęściej Zadawane Pytania","contact":"Kontakt","trackPackage":"Śledź Paczkę","cnyYearOfHorseMessage":"🧧 Szczęśliwego Nowego Roku Księżycowego! Życzymy pomyślności i radości w Roku Konia! 🐴","singaporeNationalDayMessage":"🇸🇬 Szczęśliwego Święta Narodowego, Singapur! Świętujemy 61 lat niepodległości! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonezja! Dirgahayu Republik Indonezja! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malezjo! Świętujemy niepodległość naszego narodu! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Tymczasowe zamknięcie","temporaryClosureNoticeBody":"Szanowni Klienci,\n\nInformujemy, że Rhythm Nexus będzie tymczasowo zamknięte od 21 marca 2026 do 26 marca 2026 z powodu wydarzenia firmowego.\n\nW ramach przygotowań do zamknięcia sklep zostanie przełączony w tryb urlopowy od 20 marca 2026, godz. 3:00 PM (UTC +8). Zamówienia złożone po tym czasie mogą nie zostać przetworzone do momentu wznowienia działalności.\n\nNormalna działalność zostanie wznowiona 27 marca 2026.\n\nPrzepraszamy za wszelkie niedogodności i dziękujemy za wyrozumiałość oraz dalsze wsparcie.\n\nDziękujemy.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Rozumiem","parcelTracking":"Śledzenie Paczki","serviceAnnouncement":"Ogłoszenie Serwisowe","usaWinterStormTitle":"PILNIE: Poważna burza zimowa - Przerwanie usługi","usaWinterStormSubtitle":"Ustawa Poczty Stanów Zjednoczonych (USPS) Zdarzenia Siły Wyższej","usaWinterStormNotice1":"Z powodu poważnej burzy zimowej, która dotyka region Nowego Jorku od 23 lutego 2026 r.:","usaWinterStormNotice2":"Operacje międzynarodowe na Międzynarodowym Lotnisku im. Johna F. Kennedy'ego zostały faktycznie wstrzymane","usaWinterStormNotice3":"Zgłaszane są masowe odwołania lotów i znaczące zakłócenia usług lotniska","usaWinterStormNotice4":"Warunki te stanowią zdarzenie siły wyższej poza kontrolą USPS","usaWinterStormNotice5":"Wpływ na usługę:","usaWinterStormNotice6":"Niebezpieczna mieszanina obfitego śniegu, marznącego deszczu, śnieżycy i przenikliwego chłodu","usaWinterStormNotice7":"Zgłaszane są poważne zakłócenia i powszechne przerwy w zasilaniu","usaWinterStormNotice8":"Odbiór i dostawa krajowej i międzynarodowej poczty (list, paczka i przedmioty EMS) są objęte","usaWinterStormNotice9":"Obszary kodów pocztowych, których to dotyczy:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS podejmuje wszelkie niezbędne kroki, aby zminimalizować niedogodności dla klientów, jednocześnie zapewniając bezpieczeństwo pracowników. Dziękujemy za Twoją cierpliwość i zrozumienie podczas tego zdarzenia siły wyższej.","usaWinterStormNotice12":"Ostatnia aktualizacja: 25 lutego 2026","countryAutoDetected":"Kraj docelowy ustawiony automatycznie na podstawie Twojej lokalizacji","countryAutoDetectedFromLink":"Kraj docelowy ustawiony automatycznie z linku","trackingNumber":"Numer Śledzenia","destinationCountry":"Kraj Docelowy","postcode":"Kod Pocztowy","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Szczęśliwego Dnia Rosji! 🎉","taiwanFoundingDayMessage":"🇹🇼 Szczęśliwego Dnia Założenia, Tajwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Szczęśliwego Dnia Podwójnej Dziesiątki, Tajwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Szczęśliwego Dnia Ustanowienia SAR Hongkong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Szczęśliwego Dnia Ustanowienia SAR Makau! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Szczęśliwego Międzynarodowego Dnia Pracy! Świętujemy pracę i prawa pracowników! 🎊","laborDayUSCAMessage":"⚒️ Szczęśliwego Dnia Pracy! Uczcimy wkład pracowników! 🎉","orderNumber":"Numer Zamówienia (Przykład: RTNX1234567890)","fromDate":"Od Daty (WYMAGANE)","toDate":"Do Daty (WYMAGANE)","trackParcel":"Śledź Paczkę","selectCourier":"-- Wybierz Kuriera / Kraj --","singaporeCouriers":"Kurierzy z Singapuru","topCountries":"Top 5 Krajów","otherCountries":"Inne Kraje","optionSingPost":"🇸🇬 Singapore Post (SingPost)","countryAU":"🇦🇺Australia","countryCA":"🇨🇦 Kanada","countryDE":"🇩🇪 Niemcy","countryGB":"🇬🇧 Wielka Brytania","countryUS":"🇺🇸 Stany Zjednoczone","countryAT":"🇦🇹Austria","countryBE":"🇧🇪 Belgia","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Chiny","countryCZ":"🇨🇿 Czechy","countryFI":"🇫🇮 Finlandia","countryFR":"🇫🇷 Francja","countryHK":"🇭🇰 Hongkong SAR Chiny","countryIN":"🇮🇳 Indie","countryID":"🇮🇩 Indonezja","countryIE":"🇮🇪 Irlandia","countryIL":"🇮🇱 Izrael","countryIT":"🇮🇹 Włochy","countryJP":"🇯🇵 Japonia","countryMO":"🇲🇴 Makau SAR Chiny","countryMY":"🇲🇾 Malezja","countryNL":"🇳🇱 Holandia","countryNZ":"🇳🇿 Nowa Zelandia","countryNO":"🇳🇴 Norwegia","countryPH":"🇵🇭 Filipiny","countryPL":"🇵🇱 Polska","countryPT":"🇵🇹 Portugalia","countryKR":"🇰🇷 Korea Południowa","countryES":"🇪🇸 Hiszpania","countrySE":"🇸🇪 Szwecja","countryCH":"🇨🇭 Szwajcaria","countryTW":"🇹🇼 Tajwan","countryTH":"🇹🇭 Tajlandia","countryVN":"🇻🇳 Wietnam","countrySG":"🇸🇬 Singapur","note":"UWAGA","disclaimer":"ZASTRZEŻENIE","importantInformation":"Ważne Informacje:","didNotReceiveEmail":"Jeśli nie otrzymałeś e-maila z potwierdzeniem od Etsy, eBay, Shopee lub Payhip, przewiń w dół, aby wyszukać swoje zamówienie za pomocą adresu e-mail lub numeru telefonu powiązanego z tym zamówieniem.","searchByEmailOrPhone":"Wyszukaj według E-maila lub Telefonu","searchOrder":"Szukaj Zamówienia","trackingResult":"Wynik Śledzenia","noOrdersFound":"Nie znaleziono zamówień.","pleaseEnter":"Wprowadź e-mail, telefon lub numer zamówienia.","welcomeTitle":"Witamy na stronie Rhythm Nexus!","purchaseInfo":"Kupuj od nas przez nasze oficjalne kanały lub dołącz do naszej","purchaseInfoChina":"Kupuj od nas przez nasze oficjalne kanały.","purchaseInfoChinaSuffix":"","telegramGroup":"grupy Telegram","forUpdates":"aby otrzymywać oficjalne aktualizacje.","ourStores":"Nasze Sklepy","etsyStore":"Sklep Etsy","ebayStore":"Sklep eBay","shopeeStore":"Sklep Shopee","payhipStore":"Sklep Payhip","internationalShipping":"Wysyłka Międzynarodowa","singaporeLocal":"Lokalnie Singapur","asiaOnly":"Tylko Azja","deliveryInfo":"Informacje o Dostawie","deliveryRates2026":"Stawki Dostawy 2026","sgDeliveryRates":"Stawki Dostawy Singapur","speedPostRates":"Stawki SpeedPost Express Międzynarodowe","aboutTitle":"O Rhythm Nexus","aboutP1":"Uruchomiliśmy nasz sklep w 2022 roku i sprzedajemy na platformach takich jak Etsy, eBay i Shopee bez awarii.","aboutP2":"Z biegiem czasu zbudowaliśmy silną reputację, skupiając się na niezawodnej realizacji i dokładnym śledzeniu.","aboutP3":"Naszym celem jest zapewnienie klientom płynnego i godnego zaufania doświadczenia zakupowego.","aboutP4":"Dziękujemy za wsparcie Rhythm Nexus.","faqTitle":"Często Zadawane Pytania","faqQ1":"Co się stanie, jeśli mój przedmiot jest wadliwy? Czy jest jakaś gwarancja?","faqA1":"Tak! Większość zamówień objęta jest roczną gwarancją. Podaj numer faktury/zamówienia, abyśmy mogli to zbadać. Uwaga: Wymiana nie jest dozwolona, jeśli przedmiot jest zgodny z opisem, nawet jeśli zamówiłeś nieprawidłowo.","faqQ2":"Czy mogę edytować, aktualizować lub anulować zamówienie?","faqA2":"Tak. Ze względów bezpieczeństwa zmiany zamówienia mogą wymagać obsługi za pośrednictwem poczty e-mail lub naszego formularza kontaktowego.","faqQ3":"Czy muszę płacić cła/podatki importowe?","faqA3":"Cła i podatki zazwyczaj nie są opłacane z góry, z wyjątkiem DDP do USA. Podatek VAT może obowiązywać w UE, Wielkiej Brytanii, Australii/Nowej Zelandii, Norwegii, Szwajcarii i prowincjach kanadyjskich, takich jak Saskatchewan i Manitoba, który jest już domyślnie opłacony. W Singapurze nie obowiązuje podatek GST. Nie możemy doradzać w sprawach opłat celnych — skontaktuj się z lokalnym urzędem celnym, aby uzyskać szczegółowe informacje.","faqQ4":"Kiedy moje zamówienie zostanie wysłane?","faqA4":"Zamówienia są zazwyczaj wysyłane w ciągu 1-5 dni roboczych. W okresach dużego natężenia może to potrwać 5–7 dni.","faqQ5":"Przez pomyłkę złożyłem zamówienie dwa razy. Co powinienem zrobić?","faqA5":"Zwracamy tylko zduplikowane opłaty za wysyłkę. Oba przedmioty zostaną wysłane razem. Zwrot = (1. opłata za wysyłkę + 2. opłata za wysyłkę) – rzeczywista opłata za wysyłkę.","faqQ6":"Jak długo trwa dostawa?","faqA6":"Przetwarzanie trwa 1-5 dni roboczych.\n\nWysyłka krajowa:\n• SingPost Prepaid Tracked Label: 2-4 dni\n• SpeedPost Standard: 1-3 dni\n\nMiędzynarodowa:\n• SingPost ePAC: 14-30 dni\n• SpeedPost Priority (EMS): 8-15 dni\n• SpeedPost Express: 4-8 dni\n\nOpóźnienia mogą wystąpić w szczytowych sezonach.","faqQ7":"Mój przedmiot jest zwracany do nadawcy. Co powinienem zrobić?","faqA7":"Dozwolona jest jedna ponowna wysyłka. Anulowanie nie jest możliwe w przypadku nieprawidłowych adresów, nieodebranych paczek lub niezapłaconych opłat celnych. Skontaktuj się z usługami pocztowymi w celu ponownego doręczenia lub wyślij do nas wiadomość, aby uzyskać pomoc.","faqQ8":"Mój przedmiot zaginął / został skradziony w transporcie.","faqA8":"Zezwalamy na jedną ponowną wysyłkę. Jeśli zaginie ponownie, pełny zwrot pieniędzy zostanie wydany po upływie terminu dostawy kuriera:\n\n• Lokalne usługi w Singapurze: 7 dni\n• SingPost ePAC i SpeedPost Priority International: 30 dni\n• SpeedPost Intl Express: 14 dni","blogTitle":"Baza Wiedzy o Wysyłce & Poczcie","blogSubtitle":"Oficjalne wyjaśnienia dotyczące usług pocztowych, ceł, VAT i opłat.","readMore":"Czytaj Więcej","backButton":"Wstecz","blogPost1Title":"Co to jest SingPost ePAC?","blogPost1Desc":"Dowiedz się o SingPost ePAC (ePacket), ekonomicznej śledzonej usłudze pocztowej.","blogPost2Title":"Co to jest SpeedPost Priority International (EMS)?","blogPost2Desc":"Odkryj EMS, międzynarodową usługę ekspresową pocztową premium.","blogPost3Title":"Co to jest SpeedPost Express?","blogPost3Desc":"Poznaj SpeedPost Express z dostawą DHL Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Zrozum PDDP dla USA.","blogPost5Title":"VAT UE & IOSS","blogPost5Desc":"Informacje o VAT UE i systemie IOSS.","blogPost6Title":"VAT UK & HMRC","blogPost6Desc":"Wymagania VAT dla Wielkiej Brytanii.","blogPost7Title":"Norwegia VOEC","blogPost7Desc":"Norweski system VOEC.","blogPost8Title":"VAT Szwajcarski","blogPost8Desc":"Szwajcarskie wymagania VAT.","enterDestinationPostcode":"Wprowadź kod pocztowy miejsca docelowego","trackingCaseSensitive":"LITERY ŚLEDZENIA ROZRÓŻNIAJĄ WIELKOŚĆ LITER I MUSZĄ BYĆ PISANE WIELKIMI LITERAMI.","usaPostcodeNote":"W przypadku krajów bez kodów pocztowych, np. Hongkongu i Makau, wpisz 999077 (Hongkong) lub 999078 (Makau).","epacDeliveryNote":"Należy pamiętać, że wszystkie przedmioty ePAC wysyłane do miejsca przeznaczenia powinny zostać dostarczone do skrzynki pocztowej, pod drzwi, do paczkomatu lub pozostawione w bezpiecznym miejscu!","currentTime":"Aktualny czas","timezoneNote":"Czas wyświetlany w formacie 12-godzinnym","sameTimeAsSingapore":"Ten sam czas co Singapur","hourAhead":"godzina przed Singapurem","hoursAhead":"godziny przed Singapurem","hourBehind":"godzina za Singapurem","hoursBehind":"godziny za Singapurem","collectAtPostOffice":"Jeśli jednak w Twoim kraju nie ma standardowo dostępnej skrzynki pocztowej, będziesz musiał odebrać przesyłkę na poczcie.","countriesNoMailbox":"Kraje, w których nie ma możliwości dostarczenia przesyłki do skrzynki pocztowej: Brunei, Chiny, Indie, Izrael, Makau SAR Chiny, Filipiny, Polska i Wietnam.","rhythmNexusNotResponsible":"Rhythm Nexus NIE PONOSI ODPOWIEDZIALNOŚCI za obsługę dostaw, ponieważ jest to poza naszą kontrolą i wolelibyśmy, abyś śledził status swojego przedmiotu.","issuesAfterDelivery":"Wszelkie problemy z dostawą po 30/45 dniach (14 dni w przypadku SpeedPost Express) lub status pokazuje dostarczone, ale nie otrzymałeś, skontaktuj się z nami","cannotUseEmbed":"Nie możemy używać osadzania do śledzenia, ponieważ większość stron internetowych usług pocztowych tego nie obsługuje.","clickLinkAbove":"Kliknij powyższy link, aby śledzić przesyłkę.","trackingDetailsNote":"Pamiętaj, że szczegóły śledzenia mogą nie pojawić się w wynikach wyszukiwania, dlatego zaleca się wklejenie numeru śledzenia do systemu w celu śledzenia przedmiotu.","thirdPartyWebsites":"Możesz również śledzić swoje przesyłki na tych stronach internetowych stron trzecich:","enterEmailOrPhone":"Wprowadź e-mail lub telefon","reviewShippingRates":"Przejrzyj nasze aktualne stawki wysyłki","here":"tutaj","contactUsForm":"Skontaktuj się z nami za pomocą","form":"formularza","forEnquiries":"w przypadku jakichkolwiek zapytań dotyczących zamówienia.","anPostNoDirectTracking":"An Post (Irlandia) nie obsługuje bezpośrednich linków do śledzenia ani wbudowanego śledzenia.","anPostPasteManually":"Proszę ręcznie skopiować i wkleić swój numer śledzenia na stronie internetowej An Post:","goToAnPost":"Przejdź do An Post","countryMsgNL":"Jeśli status pokazuje 'Held by Customs', skontaktuj się z holenderską linią informacji celnej w celu uzyskania pomocy:\n0800 0143 (bezpłatnie), poniedziałek-piątek 7-23.\nSobota i niedziela 8-16:30.\n\nZaleca się zarejestrowanie konta w PostNL, aby otrzymywać natychmiastowe powiadomienia push o przesyłkach:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nJeśli jest dostarczana do punktu PostNL lub status każe odebrać na poczcie, będziesz musiał zapłacić 7 EUR przy ladzie. Maksymalnie 4 EUR, jeśli zapłacisz online.","countryMsgDE":"Zalecamy pobranie aplikacji Post & DHL, aby otrzymywać powiadomienia push o statusie śledzenia przesyłek:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nKontakt z obsługą klienta DHL Paket GmbH:\n+49-228-433-3112\nKontakt DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Będziesz musiał złożyć dodatkową deklarację importową w urzędzie celnym. W przeciwnym razie może to prowadzić do ograniczeń wjazdu i zwrotu przesyłki. \nWięcej informacji: https://www.posti.fi/en/receiving/customs-clearance \nInne linki: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Pobierana jest opłata manipulacyjna w wysokości 4,95 EUR.\nPobierz aplikację tutaj: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Pobierana jest opłata manipulacyjna w wysokości 8,50 PLN. \nBędziesz musiał zapłacić przy odbiorze na poczcie,\nponieważ przesyłka prawdopodobnie nie zostanie dostarczona pod Twoje drzwi ani do skrzynki pocztowej.","countryMsgPH":"PHLPost na Filipinach jest uważany za nieefektywny i zawodny.\nZawsze śledź swoją przesyłkę, ponieważ status 'w drodze do dostawy'\nczasami jest wyświetlany tylko przez 1-3 tygodnie dla mniejszych paczek. W przypadku większych paczek\nodbiór jest możliwy tylko w Manila Central Post Office lub\nw najbliższej placówce pocztowej w Twoim regionie. Należy pamiętać, że pobierana jest opłata manipulacyjna w wysokości 112 PHP za paczki\no dowolnej wartości, którą musisz zapłacić. Nieudana płatność spowoduje zwrot przesyłki\ndo nas. Oczekuje się, że dostawa zajmie 1-2 miesiące z powodu wolnych usług PHLPost. \nNie musisz płacić podatku za przedmioty poniżej 10000 PHP, ale musisz to zrobić, jeśli wartość jest równa lub przekracza tę kwotę. \nZalecilibyśmy SpeedPost Express dla szybszego procesu następnym razem, gdy zamawiasz od nas. Opłaty mogą jednak nie mieć zastosowania, ponieważ D&T dla odbiorcy jest domyślny.","countryMsgCA":"De minimis wynosi 20 CAD dla wszystkich zamówień wysyłanych do Kanady. Ponieważ Singapur jest częścią umowy CPTPP, cła mogą nie mieć zastosowania, ale D&T może mieć zastosowanie, jeśli przedmiot przekroczy próg 60 CAD i więcej lub 100 CAD i więcej, co może zależeć od kodu HS przedmiotu. Każda wartość powyżej tej kwoty zostanie odpowiednio obciążona VAT.","countryMsgID":"Będziesz musiał zapłacić wszelkie obowiązujące podatki i cła po przybyciu do Indonezji. Śledź swoją przesyłkę i zapłać określoną kwotę indonezyjskiemu urzędowi celnemu.\nBędziesz także musiał złożyć dodatkową dokumentację celną. W przeciwnym razie może to prowadzić do ograniczeń wjazdu lub zajęcia przesyłki przez urząd celny kraju. Sprawdź dalsze szczegóły tutaj:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Będziesz musiał zapłacić wszelkie obowiązujące podatki i cła po przybyciu do Indii. Śledź swoją przesyłkę i zapłać określoną kwotę indyjskiemu urzędowi celnemu.\nNależy pamiętać, że odprawa celna w Indiach jest rygorystyczna i możesz lub nie być obciążony cłami, jeśli wartość Twojego przedmiotu przekracza 1000 INR (15 USD) - w zależności od kodu HS, w większości przypadków jest to wolne od cła, ale możesz być obciążony wyższymi cłami, jeśli przedmiot przekracza 5000 INR (60 USD). \nPonieważ India Post NIE dostarcza do skrzynek pocztowych domyślnie, możesz być wymagany, aby być w domu lub upoważnionym przedstawicielem, aby odebrać przesyłkę lub odebrać na poczcie.","countryMsgMY":"De minimis wynosi 500 MYR dla wszystkich zamówień wysyłanych do Malezji. Zamówienia powyżej tej kwoty mogą być obciążone.","countryMsgUS":"Od 29 sierpnia 2025 r. de minimis w wysokości 800 USD zostanie oficjalnie usunięte, a cła importowe będą domyślnie płatne przez nadawcę w kraju pochodzenia.\nWysyłka do USA WYMAGA ważnego numeru telefonu i adresu e-mail, aby Twoja przesyłka uniknęła dalszych opóźnień.","countryMsgIL":"De minimis wynosi 240 ILS (75 USD) dla wszystkich przesyłek do Izraela. Zamówienia powyżej tej kwoty mogą być obciążone. \nNależy pamiętać, że w przypadku zamówień wysyłanych do Izraela, Israel Post czasami może nie potwierdzić ostatecznej dostawy po dostarczeniu. \nPonieważ Israel Post NIE dostarcza do skrzynek pocztowych domyślnie, możesz być wymagany, aby być w domu lub upoważnionym przedstawicielem, aby odebrać przesyłkę lub odebrać na poczcie.","countryMsgGB":"Należy pamiętać, że w przypadku zamówień wysyłanych do Wielkiej Brytanii, Royal Mail czasami może nie potwierdzić ostatecznej dostawy po dostarczeniu do skrzynki pocztowej.","countryMsgTH":"De minimis wynosi 1500 THB (45 USD) dla wszystkich przesyłek do Tajlandii. Zamówienia powyżej tej kwoty mogą być obciążone.","countryMsgTW":"De minimis wynosi 2000 TWD (60 USD) dla wszystkich przesyłek na Tajwan. Zamówienia powyżej tej kwoty mogą być obciążone.","countryMsgMO":"Nie są pobierane żadne D&T przy wysyłce do Makau. Należy jednak pamiętać, że Macau Post NIE dostarcza do skrzynek pocztowych domyślnie, MUSISZ odebrać przesyłkę na poczcie.","countryMsgBN":"Nie są pobierane żadne D&T przy wysyłce do Brunei. Należy jednak pamiętać, że Brunei Post NIE dostarcza do skrzynek pocztowych domyślnie, MUSISZ odebrać przesyłkę na poczcie. \nSystem śledzenia dla tego kraju nie jest bardzo stabilny i można podać tylko ograniczone informacje, a ostateczne wyniki dostawy NIE są podawane do pochodzenia.","countryMsgJP":"De minimis wynosi 10000 JPY (65 USD) dla wszystkich przesyłek do Japonii. Zamówienia powyżej tej kwoty mogą być obciążone.","countryMsgKR":"De minimis wynosi 180000 KRW (150 USD) dla wszystkich przesyłek do Korei Południowej. Zamówienia powyżej tej kwoty mogą być obciążone.","countryMsgVN":"W przypadku Wietnamu prosimy o pozostawanie DOSTĘPNYM podczas dostawy, ponieważ mogą zostać pobrane opłaty manipulacyjne przy dostarczeniu przedmiotu. \nDe minimis wynosi 1000000 (35 USD) dla wszystkich przesyłek do Wietnamu. Zamówienia powyżej tej kwoty mogą być obciążone. \nPonieważ Vietnam Post NIE dostarcza do skrzynek pocztowych domyślnie, możesz być wymagany, aby być w domu lub upoważnionym przedstawicielem, aby odebrać przesyłkę lub odebrać na poczcie.","countryMsgPP":"Elementy Tracked Label zostaną wysłane w POPDrop/POPStop na poczcie. Elementy SpeedPost Standard są zazwyczaj wysyłane na POPStop lub POPStation.\nNależy pamiętać, że dostawa elementów Tracked Label jest TYLKO od poniedziałku do piątku, od 9 do 18. Z wyjątkiem weekendów i świąt państwowych.","postedDate":"Data nadania:","status":"Status:","shippedVia":"Wysłane przez:","destination":"Miejsce docelowe:","statusInPreparation":"W przygotowaniu","statusInTransit":"W transporcie","statusDelivered":"Dostarczono","statusOutForDelivery":"W dostawie","statusArrived":"Przybył","statusProcessing":"Przetwarzanie","statusDispatched":"Wysłano","statusReturned":"Zwrócono","statusFailed":"Dostawa nie powiodła się","statusCancelled":"Anulowano","statusHeldByCustoms":"Zatrzymano przez celników","statusAwaitingCollection":"Oczekiwanie na odbiór","aka":"znany również jako","thisServiceKnownAs":"Ta usługa jest znana jako","in":"w","viewTrackingDHL":"Zobacz informacje o śledzeniu z DHL Express","viewTrackingSingPostSpeedPost":"Zobacz informacje o śledzeniu z Singapore SpeedPost","viewTrackingDHLLastMile":"Zobacz informacje o śledzeniu z DHL Express (Ostatnia mila)","viewTrackingDHLShipperRef":"Zobacz informacje o śledzeniu z DHL Express (Referencja nadawcy)","viewTrackingSingPost":"Zobacz informacje o śledzeniu z Singapore Post","viewTrackingDestPost":"Zobacz informacje o śledzeniu z","post":"Poczta","orderNumberExample":"Numer zamówienia (zaczyna się od RTNX - przykład: RTNX1234567890):","deliveryRecordNote":"Należy pamiętać, że po dostarczeniu przedmiotu rekord będzie przechowywany tylko przez 7 dni, a następnie zostanie usunięty.","copyrightAllRights":"Wszelkie prawa zastrzeżone.","epacUS":"Międzynarodowa usługa paczkowa pierwszej klasy","epacCH":"Priorytet Plusa","epacGB":"Międzynarodowe śledzone","epacMY":"Międzynarodowe śledzone/ekspresowe","epacCA":"Międzynarodowy ekspres przychodzący","epacAU":"Pakuj i śledź międzynarodowe","epacNZ":"Międzynarodowe śledzenie ekonomiczne","epacDE":"Warenpost International Premium","epacFR":"List międzynarodowy ze śledzeniem","epacNL":"Śledzenie przesyłek międzynarodowych","epacPL":"GLOBALNE Ekspresy","epacBE":"Międzynarodowe Prime Przychodzące","epacAT":"Międzynarodowa paczka śledzona","epacIN":"Międzynarodowa paczka śledzona","epacFI":"Międzynarodowy list śledzony","epacSE":"Międzynarodowy list śledzony","epacNO":"PRIME Expres","epacIT":"Wyrazić","epacIL":"Wyrazić","epacES":"Międzynarodowa paczka lekka","epacPT":"Międzynarodowa poczta niebieska","epacCZ":"Śledzona przesyłka z zagranicy","epacBN":"Międzynarodowy ePacket","epacCN":"Międzynarodowy ePacket","epacHK":"Międzynarodowy ePacket","epacID":"Międzynarodowy e-pakiet","epacMO":"Międzynarodowy ePacket","epacPH":"Międzynarodowa Śledzona Przesyłka Pocztowa","epacTW":"Międzynarodowy ePacket","epacTH":"Międzynarodowy ePacket","epacVN":"Międzynarodowy E-pakiet (Pakiet ASEAN)","epacKR":"Pakiet K","epacJP":"Międzynarodowy e-pakiet Light","epacIE":"Międzynarodowa poczta ekspresowa","blogSingPostEPACContent1":"SingPost ePAC (ePacket) to ekonomiczna śledzona usługa pocztowa dla lekkich międzynarodowych przesyłek e-commerce.","blogSingPostEPACContent2":"Jest dostarczana przez krajowego operatora pocztowego kraju docelowego i jest powszechnie stosowana do paczek poniżej 2 kg, o wymiarach długość + szerokość + wysokość poniżej 90 cm i długości nieprzekraczającej 60 cm.","blogSingPostEPACContent3":"Ta opcja była początkowo oferowana tylko przez Hong Kong Post wraz z eBay China, umożliwiając wysyłanie małych paczek z Chin i Hongkongu do USA ze śledzeniem dostawy bez wymogu podpisu przy odbiorze. Ta usługa jest znana jako USPS (United States Postal Service) First-Class Package International Service w USA.","blogSingPostEPACContent4":"Od 1 stycznia 2026 r. ePAC jest obecnie używany we wszystkich krajach, aby przestrzegać obowiązkowych przepisów UPU wymagających śledzenia paczek i ograniczania przesyłek poleconych tylko do dokumentów.","blogSingPostEPACContent5":"Prefiksy śledzenia: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS to międzynarodowa usługa ekspresowa premium, priorytetowa dla operatorów pocztowych na całym świecie.","blogSpeedPostEMSContent2":"Odprawa celna jest zazwyczaj szybsza niż w przypadku standardowej poczty, ale bardziej rygorystyczna w procesie, z pełnym śledzeniem aż do dostawy.","blogSpeedPostEMSContent3":"W Singapurze jest to znane jako SpeedPost Priority International przez SingPost.","blogSpeedPostEMSContent4":"Prefiks śledzenia: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express to usługa na poziomie kurierskim.","blogSpeedPostExpressContent2":"W wielu miejscach docelowych DHL Express realizuje dostawę na ostatniej mili i pobiera cła lub podatki przed wydaniem.","blogSpeedPostExpressContent3":"Prefiks śledzenia: PX123456789SG (Ostatnia mila DHL Express używa 10-cyfrowego numeru śledzenia, który nie jest widoczny publicznie, ale mamy informacje na ten temat przez nasz","blogSpeedPostExpressContent3Link":"System Śledzenia.","blogUSPDDPContent1":"PDDP umożliwia opłacenie amerykańskich ceł importowych i podatków przed dostawą, zmniejszając niespodziewane opłaty dla odbiorców.","blogUSPDDPContent2":"Nowe Przepisy (Obowiązujące od 29 sierpnia 2025)","blogUSPDDPContent2List1":"Obowiązkowe kody HTS","blogUSPDDPContent2List2":"Dokładne opisy przedmiotów","blogUSPDDPContent2List3":"Bardziej rygorystyczne egzekwowanie taryf","blogUSPDDPContent3":"Wszystkie przedmioty wysyłane do USA nie będą obciążane żadnymi dodatkowymi taryfami dla odbiorcy, ponieważ płacimy w Twoim imieniu. Należy jednak pamiętać, że cena przedmiotu domyślnie obejmuje 10% opłatę importową, aby była zgodna z przepisami.","blogUSPDDPContent4":"Dotyczy to tylko naszych metod wysyłki do USA, SpeedPost Priority International (EMS) i SingPost ePAC.","blogEUIOSSContent1":"UE nakłada VAT na wszystkie importy handlowe niezależnie od wartości.","blogEUIOSSContent2":"IOSS (punkt kompleksowej obsługi importu)","blogEUIOSSContent3":"IOSS umożliwia sprzedawcom pobieranie podatku VAT UE przy kasie dla przesyłek do 150 €.","blogEUIOSSContent4":"VAT jest następnie odprowadzany za pośrednictwem systemu IOSS, co umożliwia szybszą odprawę celną i brak poboru VAT przy dostawie.","blogEUIOSSContent5":"W przypadku wszystkich zamówień za pośrednictwem Etsy lub eBay, VAT IOSS jest już pobierany przy kasie i wskażemy go na numerze referencyjnym podatku, aby przesłać dane do docelowej usługi pocztowej za pośrednictwem EDI (Electronic Data Interchange).","blogUKVATContent1":"Wielka Brytania wymaga rozliczenia podatku VAT od importowanych towarów.","blogUKVATContent2":"W przypadku przesyłek o niskiej wartości VAT jest zazwyczaj pobierany przy kasie i przekazywany bezpośrednio do HMRC przez sprzedawcę lub platformę handlową.","blogUKVATContent3":"W przypadku przesyłek o wyższej wartości VAT może być pobierany przez przewoźnika przed dostawą.","blogUKVATContent4":"W przypadku wszystkich zamówień za pośrednictwem Etsy lub eBay, VAT jest już pobierany przy kasie i wskażemy go na numerze referencyjnym podatku, aby przesłać dane do docelowej usługi pocztowej za pośrednictwem EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"Norwegia wprowadziła system VOEC (VAT on E-Commerce) dla towarów importowanych spoza UE/EOG. Dotyczy to towarów o wartości do 3 000 NOK.","blogNorwayVOECContent2":"Sprzedawcy mogą zarejestrować się w systemie VOEC, aby pobierać norweski VAT przy kasie, co umożliwia szybszą odprawę celną i brak poboru VAT przy dostawie.","blogNorwayVOECContent3":"W przypadku wszystkich zamówień za pośrednictwem Etsy lub eBay, VAT VOEC jest już pobierany przy kasie. Śledzenie i dokumentacja celna wskazują numer referencyjny podatku, aby przesłać dane do norweskiej usługi pocztowej.","blogSwissVATContent1":"Szwajcaria nalicza VAT od importowanych towarów niezależnie od wartości. Szwajcarska Federalna Administracja Celna wymaga od zagranicznych sprzedawców pobierania podatku VAT przy kasie dla towarów do 65 CHF.","blogSwissVATContent2":"Sprzedawcy zarejestrowani w szwajcarskim systemie VAT odprowadzają pobrany VAT bezpośrednio, zapewniając, że odbiorca nie poniesie żadnych dodatkowych opłat VAT przy dostawie.","blogSwissVATContent3":"W przypadku wszystkich zamówień przez Etsy lub eBay, szwajcarski VAT jest już pobierany podczas kasy, a dokumentacja celna zawiera numer referencyjny podatku do zgłoszenia EDI.","dhlNoEmbed":"DHL Express nie obsługuje śledzenia poprzez osadzenie. Proszę","speedPostNoEmbed":"SpeedPost Singapur nie obsługuje śledzenia poprzez osadzenie. Proszę","operatorNoEmbed":"nie obsługuje śledzenia poprzez osadzenie. Proszę","clickHere":"kliknij tutaj","toTrackNewTab":"aby śledzić (otwiera się w nowej karcie).","countryRU":"🇷🇺 Rosja","russiaServiceSuspended":"⚠️ WAŻNE POWIADOMIENIE: W związku z rosyjską inwazją na Ukrainę w 2022 roku, SingPost zawiesiła wszystkie przesyłki do Rosji wraz z DHL. Obecnie nie obsługujemy Rosji do czasu ogłoszenia wznowienia usług do tego kraju.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Życzę Tobie i Twojej rodzinie pokoju, radości i błogosławieństwa! 🌟","deepavaliMessage":"🪔 Szczęśliwego Deepavali! Niech święto świateł przyniesie wam radość, dobrobyt i sukces! ✨","diwaliMessage":"🪔 Wesołego Diwali! Niech święto świateł przyniesie wam radość, dobrobyt i sukces! ✨","vesakMessage":"☸️ Wszystkiego najlepszego z okazji Dnia Vesaka! Życzę Wam pokoju, mądrości i oświecenia w tym świętym dniu! 🙏","vesakTHMessage":"☸️ Szczęśliwego dnia Visakha Bucha! Życzę Wam pokoju, mądrości i oświecenia w tym świętym dniu! 🙏","australiaNationalDayMessage":"🇦🇺 Szczęśliwego Dnia Australii! Świętujemy nasz naród! 🎉","canadaNationalDayMessage":"🇨🇦 Wszystkiego najlepszego z okazji Dnia Kanady! Świętujemy nasz wspaniały naród! 🍁","usaNationalDayMessage":"🇺🇸 Szczęśliwego Dnia Niepodległości, Ameryko! Świętujemy wolność i wolność! 🎆","franceBastilleDayMessage":"🇫🇷Joyeux 14 lipca! Żyj Francją! 🎊","germanyUnityDayMessage":"🇩🇪 Szczęśliwego Dnia Jedności Niemiec! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Szczęśliwego Dnia Fundacji, Japonia! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Wszystkiego najlepszego z okazji Święta Narodowego, Chiny! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Szczęśliwego Dnia Wyzwolenia, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Szczęśliwego Dnia Niepodległości, Indie! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Wszystkiego najlepszego z okazji Dnia Narodowego, Tajlandia! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Szczęśliwego Dnia Niepodległości, Filipiny! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Wszystkiego najlepszego z okazji Święta Narodowego, Wietnamie! Quốc khánh Wietnam! 🎊","polandNationalDayMessage":"🇵🇱 Wszystkiego najlepszego z okazji Dnia Niepodległości, Polsko! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Wszystkiego najlepszego z okazji Dnia Niepodległości, Czechy! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Niech żyje Król! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Cieszę się, że Szwecja jest krajem narodowym! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Szczęśliwego Dnia Niepodległości, Izraelu! 🎉","irelandNationalDayMessage":"🇮🇪 Wszystkiego najlepszego z okazji Dnia Świętego Patryka, Irlandia! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Szczęśliwego Dnia Waitangi, Nowa Zelandia! 🎉","switzerlandNationalDayMessage":"🇨🇭 Wszystkiego najlepszego z okazji Święta Narodowego Szwajcarii! Święto narodowe Suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Austria! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgia! Fijne Nationale Feestdag! 🎊","fillAllFields":"Proszę wypełnić wszystkie wymagane pola: numer śledzenia, kraj docelowy, numer zamówienia i kod pocztowy.","noOrderMatchingFields":"Nie znaleziono zamówienia pasującego do wszystkich pól.","postcodeRequired":"Dla tego miejsca docelowego wymagany jest kod pocztowy.","invalidUSZip":"Nieprawidłowy kod pocztowy w USA. Użyj 5 cyfr lub kodu ZIP+4.","failedGenerateURL":"Nie udało się wygenerować adresu URL monitorującego. Sprawdź dane wejściowe.","trackingValidationSG":"Numery śledzenia dla Singapuru muszą być następujące: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG lub PX123456789SG. W przypadku przesyłek DHL użyj liczb 10-cyfrowych.","invalidSingPostFormat":"Nieprawidłowy format numeru śledzenia SingPost.\nAkceptowane formaty:\n• PP123456789SG → Przedpłacona etykieta śledzona\n• SPNDD00012345 → Standardowe śledzenie SpeedPost","trackingNumberExample":"np. LG123456789SG","australianDSTTitle":"Aktywny czas letni w Australii","australianDSTBothMessage":"Obecnie obowiązują AEDT (australijski wschodni czas letni) i ACDT (australijski środkowo-letni czas letni).","australianAEDTMessage":"AEDT (australijski czas letni wschodni) obowiązuje obecnie w Sydney, Melbourne i okolicach.","australianACDTMessage":"ACDT (Australijski Środkowy Czas Letni) obowiązuje obecnie w Adelajdzie i Australii Południowej.","australianDSTNote":"Czasy dostawy podane powyżej odzwierciedlają aktualny czas letni.","filteredAllowedDestinations":"(Filtrowane według dozwolonych miejsc docelowych)","loadingAnnouncements":"Ładowanie ogłoszeń...","unableToLoadAnnouncements":"W tej chwili nie można załadować ogłoszeń o usługach.","viewOnSingPostWebsite":"Zobacz na stronie SingPost →","statusHeldByCustms":"Przetrzymywany przez Urząd Celny","accessRestricted":"Dostęp ograniczony","vpnDetectedMessage":"Wykryto użycie VPN. Aby uzyskać dostęp do tej usługi, wyłącz VPN.","contactSupportError":"Jeśli uważasz, że to błąd, skontaktuj się z pomocą techniczną.","postalContactsTitle":"Kontakty Służb Pocztowych","postalContactsNote":"Uwaga:","postalContactsPolandUKNote":"W przypadku Polski i Wielkiej Brytanii wszystkie przesyłki wysłane za pośrednictwem SpeedPost Priority (EMS) będą obsługiwane przez Pocztex i Parcelforce.","postalContactsDHLNote":"W przypadku przesyłek SpeedPost Express prosimy o kontakt z DHL przez ten link:","postalContactsCountry":"Kraj","postalContactsWebsite":"Strona internetowa","postalContactsForm":"Formularz kontaktowy","postalContactsPhone":"Numer telefonu","postalContactsEmail":"E-mail kontaktowy","postalContactsFormLink":"Formularz kontaktowy","postalContactsBackButton":"Powrót do formularza zapytania o przesyłkę","destinationNotAllowed":"Dostęp do tego kraju docelowego nie jest możliwy z Twojej lokalizacji. Proszę wybrać inny cel podróży.","contactUsTitle":"Kontakt","contactNameLabel":"Imię (pseudonimy lub numery telefonów niedozwolone)","contactEmailLabel":"Adres e-mail (odpowiemy Ci tutaj)","contactEmailNote":"Prywatne e-maile przekaźnikowe (np. @privaterelay.appleid.com) nie są akceptowane. Użyj prawidłowego adresu e-mail.","contactEnquiryTypeLabel":"O co chodzi?","contactSelectOption":"Wybierz opcję","contactGeneralEnquiry":"Ogólne zapytanie / Opinia","contactBusinessEnquiry":"Zapytanie biznesowe","contactOrderShippingEnquiry":"Zapytanie o zamówienie/wysyłkę","contactExchangeRefundEnquiry":"Zapytanie o wymianę/zwrot pieniędzy/zwrot towaru","contactOthers":"Inne","contactParcelWarning":"Jeśli Twoja paczka nie została dostarczona przez ponad 18/30/45 dni (FedEx 14 dni), lub pokazuje status dostarczono, ale jej nie otrzymałeś, wypełnij","contactParcelWarningLink":"ten formularz","contactParcelWarningEnd":"zamiast tego.","contactOrderNumberLabel":"Numer zamówienia","contactOrderNumberPlaceholder":"Przykład: RTNX1234567890","contactPlatformNote":"Numery zamówień Etsy, eBay i Shopee tutaj. NIE mamy ŻADNEJ kontroli nad zwrotami pieniędzy z tych platform. Skontaktuj się z ich obsługą klienta.","contactPlatformInstructions":"Użyj aplikacji, aby sprawdzić numer zamówienia, ponieważ jest zapisany w aplikacji:","contactPlatformEtsy":"Etsy - Prawy górny róg Twojego profilu → Zakupy","contactPlatformEbay":"eBay - Mój eBay → Zakupy","contactPlatformShopee":"Shopee - Ja → Zobacz historię zakupów (lub możesz kliknąć Do wysłania/Do odbioru)","contactRefundNote1":"Jeśli pytasz o Zwrot/Zwrot pieniędzy dla platform, z których kupiłeś, pamiętaj, że NIE mamy ŻADNEJ kontroli nad zwrotami pieniędzy z tych platform. Skontaktuj się z ich obsługą klienta.","contactRefundNote2":"W przypadku zwrotów lub wymian nie zezwalamy na rękawice maimai, jeśli zostały już użyte po otwarciu (widoczne plamy lub wyprane w pralce/ręcznie), i nie zezwalamy na zwroty lub wymiany kart rozrywkowych. Dziękujemy.","contactRefundNote3":"Pamiętaj, że w przypadku zwrotów pieniędzy przez Payhip, jeśli nie otrzymałeś zwrotu pieniędzy, skontaktuj się z bankiem lub wsparciem Payhip pod adresem support@payhip.com, ponieważ nie mamy kontroli nad tym procesem.","contactMessageLabel":"Twoja wiadomość (do 1000 znaków)","contactCharacterCount":"znaków","contactSpamWarningNote":"Uwaga:","contactSpamWarning":"Niechciane oferty SEO, projektowania stron internetowych, pożyczek lub podobnych usług zostaną automatycznie odrzucone.","contactAgreementText1":"Kliknij \"Zgadzam się\", jeśli zgadzasz się, aby Rhythm Nexus używał Twojego adresu e-mail do odpowiedzi, ponieważ jest to wymagane do przeczytania Twojej odpowiedzi i odpowiedzi po znalezieniu rozwiązania Twojego zapytania.","contactAgreementText2":"Pamiętaj, że nasza odpowiedź zajmie 3-5 dni roboczych lub dłużej w przypadku dużej liczby e-maili po naszej stronie.","contactAgreeCheckbox":"Zgadzam się","contactSuccessMessage":"Twoja wiadomość została wysłana pomyślnie! Odpowiemy w ciągu 3-5 dni roboczych.","contactErrorMessage":"Nie udało się wysłać wiadomości. Spróbuj ponownie.","contactGeneralError":"Wystąpił błąd. Spróbuj ponownie później.","contactSubmitting":"Wysyłanie...","contactSubmit":"Wyślij","contactAlertAgree":"Zaakceptuj warunki, aby wysłać formularz.","parcelEnquiryTitle":"Zapytanie o paczkę","parcelInfoText":"Ten formularz jest dla paczek niedostarczonych przez ponad 18/30/45 dni (14 dni dla FedEx/DHL) lub pokazujących status dostarczono, ale nie są z Tobą.","parcelInfoLink":"Kliknij tutaj","parcelInfoEnd":"dla innych zapytań.","parcelWaitTitle":"Poczekaj na swoją paczkę","parcelWaitText1":"Poczekaj na dostarczenie paczki. Pamiętaj, że dostawy międzynarodowe NIE są takie same jak dostawy lokalne, ponieważ wymagają czasu. Dziękujemy!","parcelWaitText2":"Jeśli po 18 dniach (7 dni dla Singapuru) lub dłużej nie pojawi się żaden status, możesz nas powiadomić bezpośrednio.","parcelCannotSubmit":"Nie możesz wysłać tego formularza, jeśli wybrałeś \"Nie\".","parcelNameLabel":"Imię","parcelOrderNumberLabel":"Numer zamówienia (Przykład: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Adres e-mail (Odpowiemy Ci tutaj)","parcelEmailNote":"Prywatne e-maile przekaźnikowe nie są akceptowane. Użyj prawidłowego adresu e-mail.","parcelShippingMethodLabel":"Wybrana metoda wysyłki?","parcelSelectShipping":"Wybierz metodę wysyłki","parcelSingPostEpac":"SingPost ePacket (lub ePAC) - znany jako SpeedPost Saver International (Śledzenie: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Śledzenie: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Śledzenie: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Śledzenie: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Śledzenie: PX123456789SG)","parcelDHL":"DHL Express (Tylko kraje UE) (Śledzenie: 1234567890)","parcelTrackingNumberLabel":"Numer śledzenia Twojej paczki?","parcelUndeliveredLabel":"Czy Twoja paczka nie została dostarczona przez ponad 18/30/45 dni? (Usługi lokalne Singapur >7 dni, >14 dni dla SpeedPost Express/DHL)","parcelSelectOption":"Wybierz opcję","parcelYes":"Tak","parcelNo":"Nie","parcelDeliveredButMissingLabel":"Czy Twoja paczka pokazuje status dostarczono, ale nie ma jej w skrzynce pocztowej/bezpiecznym miejscu/przy drzwiach?","parcelCaseReferenceLabel":"ID referencyjne sprawy z lokalnej poczty","parcelCaseReferencePlaceholder":"Wpisz NA, jeśli jesteś z Singapuru","parcelCaseReferenceNote":"Przed przesłaniem tego formularza skontaktuj się z lokalną pocztą telefonicznie lub e-mailem i uzyskaj od nich ID referencyjne sprawy. Następnie wpisz swoje ID referencyjne sprawy tutaj.","parcelCaseReferenceLink":"Zobacz ten link, aby uzyskać kontakty do usług pocztowych","parcelCaseReferenceMandatory":"WPISZ NA TYLKO JEŚLI JESTEŚ Z SINGAPURU. Dla innych krajów jest to OBOWIĄZKOWE. Wymagane również dla SpeedPost Express, dla ID sprawy DHL.","parcelImageEvidenceLabel":"Dowód obrazkowy (dla dostarczonych, ale zaginionych paczek)","parcelImageWarning":"W celu dodatkowej weryfikacji potrzebujemy dowodu obrazkowego, aby udowodnić, że nie składasz fałszywych roszczeń o niedostarczenie paczki. (Tylko dla paczek, które zostały już dostarczone, ale nie ma ich w skrzynce pocztowej/przy drzwiach. Możemy odrzucić Twoje roszczenie, jeśli nie zostanie dostarczony dowód fotograficzny dla dostarczonych przedmiotów. Zignoruj to, jeśli Twój przedmiot NIE pokazuje statusu dostarczono.)","parcelImageNote":"Prześlij 1 obsługiwany plik: obraz. Maks. 1 GB.","parcelAgreementText":"Kliknij \"Zgadzam się\", jeśli zapewniasz, że to, co stało się z Twoją paczką, jest prawdą.","parcelAgreeCheckbox":"Zgadzam się","parcelSuccessMessage":"Twoje zapytanie o paczkę zostało wysłane pomyślnie! Odpowiemy w ciągu 3-5 dni roboczych.","parcelErrorMessage":"Nie udało się wysłać zapytania. Spróbuj ponownie.","parcelGeneralError":"Wystąpił błąd. Spróbuj ponownie później.","parcelAlertWait":"Poczekaj na dostarczenie paczki. Możesz wysłać ten formularz po określonym okresie oczekiwania.","parcelAlertAgree":"Zaakceptuj warunki, aby wysłać formularz.","parcelAlertCaseReference":"Podaj ID referencyjne sprawy z lokalnej poczty lub wpisz NA, jeśli jesteś z Singapuru.","parcelSubmitting":"Wysyłanie...","parcelSubmit":"Wyślij","lookalikeDomainWarning":"To nie jest numer przesyłki, tylko link do strony podszywającej się pod firmę kurierską. Nie podawaj tam danych osobowych ani płatniczych.","lookalikeDomainOfficial":"Oficjalna strona:"};
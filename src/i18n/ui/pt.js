@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus utilizes premium commercial networks. However, the exact moment it arrives in your country, custody transfers to the local domestic carrier (e.g., USPS, Royal Mail, DHL locally). Tracking prefixes change handling systems at this threshold, but our universal parcel tracker stitches these statuses together to give you uninterrupted visibility.","trackingLastMileTitle":"Last-Mile Delivery Network","trackingCustomsClearanceBody":"All cross-border items must clear your local country's customs agency. Our tool monitors transitions from import facility arrival to customs handovers. Border patrols will verify HS codes and ensure correct VAT or duties have been remitted (e.g., IOSS in the EU, VOEC in Norway). Monitor tracking specifically for \"Held at Customs\" warnings.","trackingCustomsClearanceTitle":"Customs Clearance Information","trackingProcessingOriginBody":"Depois de entregue, o item entra no centro de processamento de origem, onde é escaneado, pesado e submetido a verificações primárias de segurança de exportação. Em seguida, é despachado para a bolsa de correio internacional. Os horários dos voos dependem da largura de banda de carga disponível. Não se assuste se permanecer neste estado por vários dias.","trackingProcessingOriginTitle":"Processamento no Origin Hub","trackingInfoReceivedBody":"Quando um pedido é processado pela primeira vez em nossas plataformas de comércio eletrônico (como Etsy, eBay ou vendas diretas), o número de rastreamento é gerado eletronicamente. A transportadora recebe os dados do envio antes da posse física da caixa. Aguarde de 1 a 3 dias úteis para que o pacote seja introduzido na instalação de triagem física.","trackingInfoReceivedTitle":"Informações recebidas","trackingStatusesIntro":"Obrigado por usar nossa ferramenta unificada de rastreamento de pacotes internacionais. Como o seu pacote viaja através de múltiplas fronteiras globais, seus status de rastreamento podem ser complexos. Compreender o ciclo de vida logístico ajuda a definir expectativas claras.","trackingStatusesTitle":"Compreendendo os status de rastreamento","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"AM","pmText":"PM","footerQuickLinks":"Links rápidos","footerSupportLegal":"Suporte e Legal","copyrightText":"Todos os direitos reservados.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Terra Nova)","tzAST":"AST (Atlântico)","tzEST":"EST (Oriental)","tzCST":"CST (Central)","tzMST":"MST (Montanhas)","tzPST":"PST (Pacífico)","tzAKST":"AKST (Alasca)","tzHST":"HST (Havaí)","tzBeijing":"Pequim","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jacarta)","tzWITA":"WITA (Macáçar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Oblast de Kaliningrado (UTC+2)","tzMoscow":"Moscou/Rússia Ocidental (UTC+3)","tzSamara":"Oblast de Samara (UTC+4)","tzUral":"Região dos Urais (UTC+5)","tzOmsk":"Oblast de Omsk (UTC+6)","tzKrasnoyarsk":"Krai de Krasnoiarsk (UTC+7)","tzIrkutsk":"Oblast de Irkutsk (UTC+8)","tzSakha":"Sakha República (UTC+9)","tzPrimorsky":"Krai do Litoral (UTC+10)","tzMagadan":"Oblast de Magadan (UTC+11)","tzKamchatka":"Krai de Kamchatka (UTC+12)","dstDayStartsLabel":"Horário de verão começa","dstDayEndsLabel":"Horário de verão termina","dstRevertsLabel":"retorno ao horário padrão","dstEuropeLabel":"Europa","dstNewZealandLabel":"Nova Zelândia","englishResponseNotice":"Aviso: Todas as perguntas são respondidas em inglês. Se você enviar em outro idioma, sua mensagem poderá ser traduzida para o inglês para verificação.","parcelDisagreeCheckbox":"Não concordo","contactDisagreeCheckbox":"Não concordo","contactNamePlaceholder":"Ex: João Silva","systemRequirementsTitle":"Versões mínimas suportadas do sistema","systemRequirements":"Windows: Windows 7 (with ESU updates installed) ou superior\nmacOS: macOS 12 ou superior\nAndroid: Android 13 ou superior\niPhone/iOS: iOS 17 ou superior\nLinux: Uma distribuição atualmente suportada com atualizações de segurança ativas","title":"Verificar acesso","subtitle":"Por favor, complete o desafio abaixo para continuar.","selectLanguage":"Selecionar idioma","selectLanguagePlaceholder":"-- Escolha um idioma --","loadingChallenge":"Carregando desafio...","answerLabel":"Sua resposta:","answerPlaceholder":"Digite sua resposta","continueButton":"Continuar","refreshButton":"Novo desafio","verifying":"Verificando...","chooseLanguageFirst":"Por favor, selecione um idioma primeiro.","loadFailed":"Falha ao carregar o desafio. Por favor, tente novamente.","expiredChallenge":"Desafio expirado. Carregando novo desafio...","verifyFailed":"Verificação falhou. Por favor, tente novamente.","goodFridayEasterGreeting":"Feliz Páscoa! Paz e alegria na Sexta-feira Santa e Páscoa.","christmasGreeting":"Feliz Natal e Ano Novo! Paz e alegria de 25 de dezembro a 5 de janeiro.","captchaSystemRequirements":"Requisitos mínimos: Windows 7 (with ESU updates installed) ou 11, macOS 10.15+, ou versão mais recente de Android/iOS.","home":"Início","blog":"Blogue","aboutUs":"Sobre Nós","faq":"Perguntas Frequentes","contact":"Contato","trackPackage":"Rastrear Encomenda","cnyYearOfHorseMessage":"🧧 Feliz Ano Novo Lunar! Desejamos prosperidade e alegria no Ano do Cavalo! 🐴","singaporeNationalDayMessage":"🇸🇬 Feliz Dia Nacional, Singapura! Celebrando 61 anos de independência! 🎉","indonesiaNationalDayMessage":"🇮🇩 Feliz Dia da Independência, Indonésia! Viva a República da Indonésia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malásia! Celebrando a independência de nossa nação! 🎊","australiaNationalDayMessage":"🇦🇺 Feliz Dia da Austrália! Celebrando nossa nação! 🎉","canadaNationalDayMessage":"🇨🇦 Feliz Dia do Canadá! Celebrando nossa grande nação! 🍁","usaNationalDayMessage":"🇺🇸 Feliz Dia da Independência, América! Celebrando a liberdade! 🎆","franceBastilleDayMessage":"🇫🇷 Feliz 14 de Julho! Viva a França! 🎊","germanyUnityDayMessage":"🇩🇪 Feliz Dia da Unidade Alemã! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Feliz Dia da República! 🇮🇹","spainNationalDayMessage":"🇪🇸 Feliz Dia da Hispanidade! 🎊","japanFoundationDayMessage":"🇯🇵 Feliz Dia da Fundação, Japão! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Feliz Dia Nacional, China! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Feliz Dia da Libertação, Coreia! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Feliz Dia da Independência, Índia! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Feliz Dia Nacional, Tailândia! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Feliz Dia da Independência, Filipinas! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Feliz Dia Nacional, Vietnã! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Feliz Dia da Independência, Polônia! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Feliz Dia da Independência, República Checa! Den nezรกvislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Feliz Dia do Rei! Vida longa ao Rei! 🧡","norwayConstitutionDayMessage":"🇳🇴 Parabéns, Noruega! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Feliz Dia Nacional da Suécia! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Feliz Dia da Independência, Finlândia! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Feliz Dia da Independência, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Feliz Dia de São Patrício, Irlanda! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Feliz Dia Nacional do Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Feliz Dia de Waitangi, Nova Zelândia! 🎉","switzerlandNationalDayMessage":"🇨🇭 Feliz Dia Nacional Suíço! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Feliz Dia Nacional, Áustria! 🎉","belgiumNationalDayMessage":"🇧🇪 Feliz Dia Nacional, Bélgica! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Feliz Dia da Rússia! 🎉","taiwanFoundingDayMessage":"🇹🇼 Feliz Dia da Fundação, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Feliz Dia do Duplo Dez, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Feliz Dia da Fundação da RAE de Hong Kong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Feliz Dia da Fundação da RAE de Macau! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Feliz Dia Internacional dos Trabalhadores! Celebrando o trabalho e os direitos dos trabalhadores! 🎊","laborDayUSCAMessage":"⚒️ Feliz Dia do Trabalho! Homenageando as contribuições dos trabalhadores! 🎉","orderNumber":"Número do Pedido (Exemplo: RTNX1234567890)","fromDate":"Data De (NECESSÁRIO)","toDate":"Data Até (NECESSÁRIO)","trackParcel":"Rastrear Encomenda","selectCourier":"-- Selecionar Transportadora / País --","optionSingPost":"🇸🇬 Singapore Post (SingPost)","singaporeCouriers":"Transportadoras de Singapura","topCountries":"Top 5 Países","otherCountries":"Outros Países","note":"NOTA","disclaimer":"ISENÇÃO DE RESPONSABILIDADE","importantInformation":"Informações Importantes:","didNotReceiveEmail":"Se você não recebeu seu e-mail de confirmação da Etsy, eBay, Shopee ou Payhip, role para baixo para pesquisar seu pedido através do seu endereço de e-mail ou número de telefone vinculado a este pedido.","searchByEmailOrPhone":"Pesquisar por E-mail ou Telefone","searchOrder":"Pesquisar Pedido","trackingResult":"Resultado do Rastreamento","noOrdersFound":"Nenhum pedido encontrado.","pleaseEnter":"Digite um e-mail, número de telefone ou número de pedido.","fillAllFields":"Preencha todos os campos obrigatórios: número de rastreamento, país de destino, número do pedido e código postal.","noOrderMatchingFields":"Nenhum pedido encontrado correspondente a todos os campos.","postcodeRequired":"Código postal é obrigatório para este destino.","invalidUSZip":"Código postal americano inválido. Use 5 dígitos ou ZIP+4.","failedGenerateURL":"Falha ao gerar URL de rastreamento. Verifique a entrada.","trackingValidationSG":"Números de rastreamento para Singapura devem ser: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG ou PX123456789SG. Para envios DHL use números de 10 dígitos.","invalidSingPostFormat":"Formato de número de rastreamento SingPost inválido.\nFormatos aceitos:\n• PP123456789SG → Etiqueta de rastreamento pré-paga\n• SPNDD00012345 → Rastreamento SpeedPost Padrão","welcomeTitle":"Bem-vindo ao site da Rhythm Nexus!","purchaseInfo":"Compre através dos nossos canais oficiais, ou junte-se ao nosso","purchaseInfoChina":"Compre através dos nossos canais oficiais.","purchaseInfoChinaSuffix":"","telegramGroup":"grupo Telegram","forUpdates":"para atualizações oficiais.","ourStores":"Nossas Lojas","etsyStore":"Loja Etsy","ebayStore":"Loja eBay","shopeeStore":"Loja Shopee","payhipStore":"Loja Payhip","internationalShipping":"Envio Internacional","singaporeLocal":"Singapura Local","asiaOnly":"Somente Ásia","deliveryInfo":"Informações de Entrega","deliveryRates2026":"Tarifas de Entrega 2026","sgDeliveryRates":"Tarifas de Entrega Singapura","speedPostRates":"Tarifas SpeedPost Express Internacional","aboutTitle":"Sobre a Rhythm Nexus","aboutP1":"Iniciamos nossa loja em 2022 e vendemos na Etsy, eBay e Shopee.","aboutP2":"Construímos uma sólida reputação focando em cumprimento confiável e rastreamento preciso.","aboutP3":"Nosso objetivo é proporcionar uma experiência de compra suave e confiável.","aboutP4":"Obrigado por apoiar a Rhythm Nexus.","faqTitle":"Perguntas Frequentes","faqQ1":"E se meu item estiver com defeito? Existe alguma garantia?","faqA1":"Sim! A maioria dos pedidos vem com garantia de 1 ano. Forneça o número da sua fatura/pedido para que possamos investigar. Nota: Trocas não são permitidas se o item corresponder à descrição, mesmo que você tenha pedido incorretamente.","faqQ2":"Posso editar, atualizar o cancelar meu pedido?","faqA2":"Sim. Por segurança, alterações no pedido podem precisar ser tratadas por e-mail ou em nosso formulário de contato.","faqQ3":"Tenho que pagar taxas alfandegárias/de importação?","faqA3":"Alfândega e impostos geralmente não são pré-pagos, exceto para DDP para os EUA. O IVA pode ser aplicado para a UE, Reino Unido, AU/NZ, Noruega, Suíça e províncias canadenses como Saskatchewan e Manitoba, que já é pago por padrão. Nenhum GST se aplica a Cingapura. Não podemos aconselhar sobre taxas alfandegárias - entre em contato com a alfândega local para obter detalhes.","faqQ4":"Quando meu pedido será enviado?","faqA4":"Os pedidos geralmente são despachados dentro de 1 a 5 dias úteis. Durante períodos de grande volume, pode levar de 5 a 7 dias.","faqQ5":"Pedi duas vezes por acidente. O que devo fazer?","faqA5":"Reembolsamos apenas as taxas de envio duplicadas. Ambos os itens serão enviados juntos. Reembolso = (primeira taxa de envio + segunda taxa de envio) – taxa de envio real.","faqQ6":"Quanto tempo leva a entrega?","faqA6":"O processamento leva de 1 a 5 dias úteis.\n\nEnvio doméstico:\n• SingPost Prepaid Tracked Label: 2 a 4 dias\n• SpeedPost Standard: 1 a 3 dias\n\nInternacional:\n• SingPost ePAC: 14 a 30 dias\n• SpeedPost Priority (EMS): 8 a 15 dias\n• SpeedPost Express: 4 a 8 dias\n\nAtrasos podem ocorrer durante as altas temporadas.","faqQ7":"Meu item está sendo devolvido ao remetente. O que devo fazer?","faqA7":"Um reenvio é permitido. O cancelamento não é possível para endereços inválidos, encomendas não reclamadas ou taxas alfandegárias não pagas. Entre em contato com seu serviço postal para reentrega ou envie-nos uma mensagem para obter assistência.","faqQ8":"Meu item foi perdido/roubado em trânsito.","faqA8":"Permitimos um reenvio. Se for perdido novamente, um reembolso total será emitido após a janela de entrega do correio:\n\n• Serviços locais de Cingapura: 7 dias\n• SingPost ePAC e SpeedPost Priority International: 30 dias\n• SpeedPost Intl Express: 14 dias","blogTitle":"Base de Conhecimento de Envio","blogSubtitle":"Explicações oficiais sobre serviços postais.","readMore":"Leia Mais","backButton":"Voltar","blogPost1Title":"O que é SingPost ePAC?","blogPost1Desc":"Aprenda sobre ePAC.","blogPost2Title":"O que é SpeedPost Priority International (EMS)?","blogPost2Desc":"Descubra o EMS.","blogPost3Title":"O que é SpeedPost Express?","blogPost3Desc":"Explore SpeedPost Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Entenda PDDP.","blogPost5Title":"IVA UE & IOSS","blogPost5Desc":"Insights sobre IVA UE.","blogPost6Title":"IVA UK & HMRC","blogPost6Desc":"Requisitos de IVA no Reino Unido.","blogPost7Title":"Noruega VOEC","blogPost7Desc":"Sistema VOEC da Noruega.","blogPost8Title":"IVA Suíço","blogPost8Desc":"Requisitos de IVA suíço.","enterDestinationPostcode":"Digite o código postal de destino","trackingNumberExample":"ex. LG123456789SG","trackingCaseSensitive":"AS LETRAS DE RASTREAMENTO SENSÍVEIS A MAIÚSCULAS E DEVEM ESTAR EM MAIÚSCULAS.","usaPostcodeNote":"Para países sem códigos postais, como Hong Kong e Macau, coloque 999077 (Hong Kong) o 999078 (Macau).","epacDeliveryNote":"Observe GENTILMENTE que todos os itens ePAC enviados ao destino devem ser entregues em sua caixa de correio, porta, armário de encomendas ou deixados em um local seguro!","currentTime":"Hora Atual","timezoneNote":"Hora exibida em formato de 12 horas","sameTimeAsSingapore":"Mesmo horário de Singapura","hourAhead":"hora à frente de Singapura","hoursAhead":"horas à frente de Singapura","hourBehind":"hora atrás de Singapura","hoursBehind":"horas atrás de Singapura","countriesNoMailbox":"Países conhecidos por não terem entrega em caixa de correio/caixa de correio disponível: Brunei, China, Índia, Israel, Macau SAR China, Filipinas, Polônia e Vietnã.","rhythmNexusNotResponsible":"A Rhythm Nexus NÃO É RESPONSÁVEL pelo manuseio das entregas, pois está fora de nosso controle e preferimos gentilmente que você rastreie o status do seu item.","issuesAfterDelivery":"Quaisquer problemas com sua entrega após 30/45 dias (14 dias para SpeedPost Express) ou status mostram entregue, mas você não recebeu, entre em contato conosco","cannotUseEmbed":"Não podemos usar incorporação para rastreamento, pois a maioria dos sites de serviços postais não oferece suporte a isso.","clickLinkAbove":"Clique no link acima para rastrear sua encomenda.","trackingDetailsNote":"Observe que os detalhes de rastreamento podem não aparecer nos resultados da pesquisa, por isso é recomendado colar o número de rastreamento no sistema para rastrear o item.","thirdPartyWebsites":"Você também pode rastrear suas encomendas nestes sites de terceiros:","enterEmailOrPhone":"Digite e-mail ou telefone","collectAtPostOffice":"No entanto, se o seu país não tiver caixa de correio como padrão disponível, você terá que coletá-lo nos correios.","reviewShippingRates":"Revise nossas taxas de envio atuais","here":"aqui","contactUsForm":"Entre em contato conosco através de","form":"formulário","forEnquiries":"para quaisquer dúvidas que você tenha sobre seu pedido.","anPostNoDirectTracking":"O An Post (Irlanda) não oferece suporte a links diretos de rastreamento nem a rastreamento incorporado.","anPostPasteManually":"Por favor, cole manualmente seu número de rastreamento no site do An Post.","goToAnPost":"Ir para An Post","countryMsgNL":"Se o status refletir 'Held by Customs', entre em contato com a Linha de Informações da Alfandega da Holanda para obter assistência:\n0800 0143 (gratuito), de segunda a sexta das 7h às 23h.\nAos sábados e domingos das 8h às 16h30.\n\nÉ recomendado registrar uma conta com a PostNL para receber notificações push instantâneas de seus pacotes:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nSe estiver sendo entregue em um ponto PostNL ou o status informar para coletar no correio, você terá que pagar 7 EUR no balcão. No máximo 4 EUR se pago online.","countryMsgDE":"Recomendamos que você baixe o aplicativo Post & DHL para receber notificações push do status de rastreamento de seus pacotes:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nContato do Atendimento ao Cliente da DHL Paket GmbH:\n+49-228-433-3112\nContato DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Você precisará enviar declaração de importação adicional para a alfândega. Não fazer isso pode resultar em restrição de entrada e devolução do pacote. \nMais informações: https://www.posti.fi/en/receiving/customs-clearance \nOutros links: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Taxa de manuseio de 4,95 EUR é cobrável.\nBaixe o aplicativo aqui: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Taxa de manuseio de 8,50 PLN é cobrável. \nVocê terá que pagá-la ao coletar no correio,\npois o pacote provavelmente não será entregue à sua porta ou caixa de correio.","countryMsgPH":"PHLPost é considerado ineficiente e não confiável nas Filipinas.\nSempre acompanhe seu pacote, pois às vezes o status de saída para entrega\nsó aparecerá entre 1 e 3 semanas para pacotes menores. Para pacotes maiores, \na coleta só é possível através do Correio Central de Manila ou do correio\nmais próximo de sua área. Observe que uma taxa de manuseio de 112PHP se aplica a pacotes de\nqualquer valor que você será obrigado a pagar. A falta de pagamento resultará na devolução do pacote\npara nós. A entrega é estimada em 1-2 meses devido à lentidão dos serviços da PHLPost. \nVocê não precisa pagar impostos para itens abaixo de 10000PHP, mas precisará se for igual ou acima desse valor. \nRecomendaríamos SpeedPost Express para um processo mais rápido na próxima vez que você pedir conosco. No entanto, as taxas podem não se aplicar, pois D&T para o destinatário é por padrão.","countryMsgCA":"O de minimis é de 20CAD para todos os pedidos enviados ao Canadá. Como Cingapura faz parte do acordo CPTPP, os direitos podem não se aplicar, mas D&T pode ser aplicável se o item exceder 60CAD e acima ou 100CAD e acima, o que pode depender do código HS do item. Qualquer valor acima desse valor será cobrado com IVA de acordo.","countryMsgID":"Você é obrigado a pagar quaisquer impostos e taxas aplicáveis ​​após a chegada à Indonésia. Por favor, acompanhe seu pacote e pague o valor especificado à alfândega indonesa.\nVocê também será obrigado a enviar documentação de desembaraço adicional. Não fazer isso pode resultar em restrição de entrada ou apreensão do pacote pela alfândega do país. Por favor, verifique mais detalhes aqui:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Você é obrigado a pagar quaisquer impostos e taxas aplicáveis ​​após a chegada à Índia. Por favor, acompanhe seu pacote e pague o valor especificado à alfândega indiana.\nEsteja ciente de que o desembaraço alfândegário na Índia é rigoroso e você pode ou não ser cobrado taxas se o valor do seu item estiver acima de 1000INR (15 USD) - dependendo do código HS, na maioria dos casos é isento de impostos, mas você pode ser cobrado taxas mais altas se o item estiver acima de 5000INR (60 USD). \nComo o India Post NÃO entrega na caixa de correio como padrão, você PODERÁ ser obrigado a estar em casa ou um representante autorizado para receber seu pacote ou coletá-lo no correio.","countryMsgMY":"O de minimis é de 500MYR para todos os pedidos enviados à Malásia. Pedidos acima desse valor podem ser cobrados.","countryMsgUS":"A partir de 29 de agosto de 2025, o de minimis de USD800 será oficialmente removido e as tarifas de importação serão pagáveis ​​por padrão pelo remetente no país de origem.\nO envio para os EUA EXIGIRÁ um número de telefone e endereço de e-mail válidos para que seu pacote evite ter mais atrasos.","countryMsgIL":"O de minimis é de 240 ILS (75 USD) para todos os pedidos enviados para Israel. Pedidos acima desse valor podem ser cobrados. \nObserve que, para pedidos enviados para Israel, o Israel Post pode às vezes não reconhecer a entrega final assim que for entregue. \nComo o Israel Post NÃO entrega na caixa de correio como padrão, você PODERÁ ser obrigado a estar em casa ou um representante autorizado para receber seu pacote ou coletá-lo no correio.","countryMsgGB":"Observe que, para pedidos enviados ao Reino Unido, o Royal Mail pode às vezes não reconhecer a entrega final assim que for entregue à sua caixa de correio.","countryMsgTH":"O de minimis é de 1500THB (45 USD) para todos os pedidos enviados para a Tailândia. Pedidos acima desse valor podem ser cobrados.","countryMsgTW":"O de minimis é de 2000TWD (60 USD) para todos os pedidos enviados para Taiwan. Pedidos acima desse valor podem ser cobrados.","countryMsgMO":"Nenhum D&T é cobrado ao enviar para Macau. Mas observe que o Macau Post NÃO entrega na caixa de correio como padrão, você SERÁ OBRIGADO a coletar seu pacote no correio.","countryMsgBN":"Nenhum D&T é cobrado ao enviar para Brunei. Mas observe que o Brunei Post NÃO entrega na caixa de correio como padrão, você SERÁ OBRIGADO a coletar seu pacote no correio. \nO sistema de rastreamento para este país não é muito estável e apenas informações limitadas podem ser fornecidas, e os resultados de entrega final NÃO são fornecidos à origem.","countryMsgJP":"O de minimis é de 10000JPY (65 USD) para todos os pedidos enviados para o Japão. Pedidos acima desse valor podem ser cobrados.","countryMsgKR":"O de minimis é de 180000KRW (150 USD) para todos os pedidos enviados para a Coreia do Sul. Pedidos acima desse valor podem ser cobrados.","countryMsgVN":"Para o Vietnã, por favor, fique CONTACTÁVEL durante a entrega, pois você pode ser cobrado com taxas de manuseio na entrega do item. \nO de minimis é de 1000000 (35 USD) para todos os pedidos enviados para o Vietnã. Pedidos acima desse valor podem ser cobrados. \nComo o Vietnam Post NÃO entrega na caixa de correio como padrão, você PODERÁ ser obrigado a estar em casa ou um representante autorizado para receber seu pacote ou coletá-lo no correio.","countryMsgPP":"Itens de Etiqueta Rastreada serão postados em POPDrop/POPStop no correio. Itens SpeedPost Standard geralmente são postados em POPStop ou POPStation.\nObserve que as entregas de itens de Etiqueta Rastreada serão feitas APENAS de segunda a sexta das 9h às 18h. Exceto fins de semana e feriados.","postedDate":"Data de Envio:","status":"Status:","shippedVia":"Enviado via:","destination":"Destino:","statusInPreparation":"Em preparação","statusInTransit":"Em trânsito","statusDelivered":"Entregue","statusOutForDelivery":"Saiu para entrega","statusArrived":"Chegou","statusProcessing":"Em processamento","statusDispatched":"Enviado","statusReturned":"Devolvido","statusFailed":"Falhou na entrega","statusCancelled":"Cancelado","statusHeldByCustoms":"Retido pela alfândega","statusAwaitingCollection":"Aguardando coleta","aka":"também conhecido como","thisServiceKnownAs":"Este serviço é conhecido como","in":"em","viewTrackingDHL":"Ver informações de rastreamento da DHL Express","viewTrackingSingPostSpeedPost":"Ver informações de rastreamento do Singapore SpeedPost","viewTrackingDHLLastMile":"Ver informações de rastreamento da DHL Express (Última milha)","viewTrackingDHLShipperRef":"Ver informações de rastreamento da DHL Express (Referência do remetente)","viewTrackingSingPost":"Ver informações de rastreamento do Singapore Post","viewTrackingDestPost":"Ver informações de rastreamento de","post":"Correios","orderNumberExample":"Número do Pedido (começa com RTNX - exemplo: RTNX1234567890):","deliveryRecordNote":"Observe que, uma vez que o item seja entregue, o registro será armazenado por apenas até 7 dias e será excluído.","copyrightAllRights":"Todos os direitos reservados.","countryAF":"Afeganistão","countryAX":"Ilhas Åland","countryAL":"Albânia","countryDZ":"Argélia","countryAS":"Samoa Americana","countryAD":"Andorra","countryAO":"Angola","countryAI":"Anguilla","countryAQ":"Antártida","countryAG":"Antígua e Barbuda","countryAR":"Argentina","countryAM":"Armênia","countryAW":"Aruba","countryAU":"🇦🇺 Austrália","countryAT":"🇦🇹 Áustria","countryAZ":"🇦🇿 Azerbaijão","countryBS":"🇧🇸 Bahamas","countryBH":"🇧🇭 Bahrein","countryBD":"🇧🇩 Bangladesh","countryBB":"🇧🇧 Barbados","countryBY":"🇧🇾 Bielorrússia","countryBE":"🇧🇪 Bélgica","countryBZ":"🇧🇿 Belize","countryBJ":"🇧🇯 Benim","countryBM":"🇧🇲 Bermudas","countryBT":"Butão","countryBO":"Bolívia","countryBA":"Bósnia e Herzegovina","countryBW":"Botsuana","countryBV":"Ilha Bouvet","countryBR":"Brasil","countryIO":"Território Britânico do Oceano Índico","countryBN":"🇧🇳 Brunei","countryBG":"Bulgária","countryBF":"Burkina Faso","countryBI":"Burundi","countryKH":"Camboja","countryCM":"Camarões","countryCA":"🇨🇦 Canadá","countryCV":"Cabo Verde","countryKY":"Ilhas Cayman","countryCF":"República Centro-Africana","countryTD":"Chade","countryCL":"Chile","countryCN":"🇨🇳 China","countryCX":"Ilha Christmas","countryCC":"Ilhas Cocos (Keeling)","countryCO":"Colômbia","countryKM":"Comores","countryCG":"Congo","countryCD":"República Democrática do Congo","countryCK":"Ilhas Cook","countryCR":"Costa Rica","countryCI":"Costa do Marfim","countryHR":"Croácia","countryCU":"Cuba","countryCY":"Chipre","countryCZ":"🇨🇿 República Checa","countryDK":"Dinamarca","countryDJ":"Djibouti","countryDM":"Dominica","countryDO":"República Dominicana","countryEC":"Equador","countryEG":"Egito","countrySV":"El Salvador","countryGQ":"Guiné Equatorial","countryER":"Eritreia","countryEE":"Estônia","countryET":"Etiópia","countryFK":"Ilhas Malvinas","countryFO":"Ilhas Faroé","countryFJ":"Fiji","countryFI":"🇫🇮 Finlândia","countryFR":"🇫🇷 França","countryGF":"Guiana Francesa","countryPF":"Polinésia Francesa","countryTF":"Terras Austrais e Antárticas Francesas","countryGA":"Gabão","countryGM":"Gâmbia","countryGE":"Geórgia","countryDE":"🇩🇪 Alemanha","countryGH":"Gana","countryGI":"Gibraltar","countryGR":"Grécia","countryGL":"Groenlândia","countryGD":"Granada","countryGP":"Guadalupe","countryGU":"Guam","countryGT":"Guatemala","countryGG":"Guernsey","countryGN":"Guiné","countryGW":"Guiné-Bissau","countryGY":"Guiana","countryHT":"Haiti","countryHM":"Ilha Heard e Ilhas McDonald","countryVA":"Vaticano","countryHN":"Honduras","countryHK":"🇭🇰 Hong Kong","countryHU":"Hungria","countryIS":"Islândia","countryIN":"🇮🇳 Índia","countryID":"🇮🇩 Indonésia","countryIR":"Irã","countryIQ":"Iraque","countryIE":"🇮🇪 Irlanda","countryIM":"Ilha de Man","countryIL":"🇮🇱Israel","countryIT":"🇮🇹 Itália","countryJM":"Jamaica","countryJP":"🇯🇵 Japão","countryJE":"Jersey","countryJO":"Jordânia","countryKZ":"Cazaquistão","countryKE":"Quênia","countryKI":"Kiribati","countryKP":"Coreia do Norte","countryKR":"🇰🇷 Coreia do Sul","countryKW":"Kuwait","countryKG":"Quirguistão","countryLA":"Laos","countryLV":"Letônia","countryLB":"Líbano","countryLS":"Lesoto","countryLR":"Libéria","countryLY":"Líbia","countryLI":"Liechtenstein","countryLT":"Lituânia","countryLU":"Luxemburgo","countryMO":"🇲🇴 Macau","countryMK":"Macedônia do Norte","countryMG":"Madagascar","countryMW":"Malawi","countryMY":"🇲🇾 Malásia","countryMV":"Maldivas","countryML":"Mali","countryMT":"Malta","countryMH":"Ilhas Marshall","countryMQ":"Martinica","countryMR":"Mauritânia","countryMU":"Maurício","countryYT":"Mayotte","countryMX":"México","countryFM":"Micronésia","countryMD":"Moldávia","countryMC":"Mônaco","countryMN":"Mongólia","countryME":"Montenegro","countryMS":"Montserrat","countryMA":"Marrocos","countryMZ":"Moçambique","countryMM":"Mianmar","countryNA":"Namíbia","countryNR":"Nauru","countryNP":"Nepal","countryNL":"🇳🇱 Holanda","countryAN":"Antilhas Holandesas","countryNC":"Nova Caledônia","countryNZ":"🇳🇿 Nova Zelândia","countryNI":"Nicarágua","countryNE":"Níger","countryNG":"Nigéria","countryNU":"Niue","countryNF":"Ilha Norfolk","countryMP":"Ilhas Marianas do Norte","countryNO":"🇳🇴 Noruega","countryOM":"Omã","countryPK":"Paquistão","countryPW":"Palau","countryPS":"Palestina","countryPA":"Panamá","countryPG":"Papua Nova Guiné","countryPY":"Paraguai","countryPE":"Peru","countryPH":"🇵🇭 Filipinas","countryPN":"Pitcairn","countryPL":"🇵🇱 Polônia","countryPT":"🇵🇹 Portugal","countryPR":"Porto Rico","countryQA":"Catar","countryRE":"Reunião","countryRO":"Romênia","countryRU":"🇷🇺 Rússia","countryRW":"Ruanda","countrySH":"Santa Helena","countryKN":"São Cristóvão e Neves","countryLC":"Santa Lúcia","countryPM":"São Pedro e Miquelon","countryVC":"São Vicente e Granadinas","countryWS":"Samoa","countrySM":"San Marino","countryST":"São Tomé e Príncipe","countrySA":"Arábia Saudita","countrySN":"Senegal","countryRS":"Sérvia","countrySC":"Seychelles","countrySL":"Serra Leoa","countrySG":"🇸🇬 Cingapura","countrySK":"Eslováquia","countrySI":"Eslovênia","countrySB":"Ilhas Salomão","countrySO":"Somália","countryZA":"África do Sul","countryGS":"Ilhas Geórgia do Sul e Sandwich do Sul","countryES":"🇪🇸 Espanha","countryLK":"Sri Lanka","countrySD":"Sudão","countrySR":"Suriname","countrySJ":"Svalbard e Jan Mayen","countrySZ":"Essuatíni","countrySE":"🇸🇪 Suécia","countryCH":"🇨🇭 Suíça","countrySY":"Síria","countryTW":"🇹🇼Taiwan","countryTJ":"Tajiquistão","countryTZ":"Tanzânia","countryTH":"🇹🇭 Tailândia","countryTL":"Timor-Leste","countryTG":"Togo","countryTK":"Tokelau","countryTO":"Tonga","countryTT":"Trinidad e Tobago","countryTN":"Tunísia","countryTR":"Turquia","countryTM":"Turcomenistão","countryTC":"Ilhas Turcas e Caicos","countryTV":"Tuvalu","countryUG":"Uganda","countryUA":"Ucrânia","countryAE":"Emirados Árabes Unidos","countryGB":"🇬🇧 Reino Unido","countryUS":"🇺🇸 Estados Unidos","countryUM":"Ilhas Menores Distantes dos Estados Unidos","countryUY":"Uruguai","countryUZ":"Uzbequistão","countryVU":"Vanuatu","countryVE":"Venezuela","countryVN":"🇻🇳 Vietnã","countryVG":"Ilhas Virgens Britânicas","countryVI":"Ilhas Virgens Americanas","countryWF":"Wallis e Futuna","countryEH":"Saara Ocidental","countryYE":"Iêmen","countryZM":"Zâmbia","countryZW":"Zimbábue","accessRestricted":"Acesso Restrito","vpnDetectedMessage":"Uso de VPN detectado. Desative o VPN para acessar este serviço.","contactSupportError":"Se acredita que isto é um erro, contacte o suporte.","destinationNotAllowed":"O acesso a este país de destino não está disponível da sua localização. Selecione um destino diferente.","epacUS":"Serviço de pacote internacional de primeira classe","epacCH":"Prioridade Plus","epacGB":"Rastreado Internacional","epacMY":"Rastreado/Expresso Internacional","epacCA":"Express internacional de entrada","epacAU":"Embalar e rastrear internacionalmente","epacNZ":"Rastreamento econômico internacional","epacDE":"Warenpost Internacional Premium","epacFR":"Carta internacional com rastreamento","epacNL":"Pacote Internacional Rastreado","epacPL":"Expresso GLOBAL","epacBE":"Entrada Internacional Prime","epacAT":"Pacote internacional rastreado","epacIN":"Pacote internacional rastreado","epacFI":"Carta internacional rastreada","epacSE":"Carta internacional rastreada","epacNO":"PRIME Express","epacIT":"Expressar","epacIL":"Expressar","epacES":"Pacote leve internacional","epacPT":"Correio azul internacional","epacCZ":"Remessa rastreada do exterior","epacBN":"ePacket internacional","epacCN":"ePacket internacional","epacHK":"ePacket internacional","epacID":"e-Pacote internacional","epacMO":"ePacket internacional","epacPH":"Correio rastreado internacional","epacTW":"ePacket internacional","epacTH":"ePacket internacional","epacVN":"E-Pacote internacional (Pacote ASEAN)","epacKR":"Pacote K","epacJP":"e-Pacote internacional Light","epacIE":"Correio expresso internacional","blogSingPostEPACContent1":"SingPost ePAC (ePacket) é um serviço postal econômico com rastreamento para remessas leves de comércio eletrônico internacional.","blogSingPostEPACContent2":"É entregue pelo operador postal nacional do país de destino e é comumente usado para encomendas abaixo de 2 kg, com limite de dimensão de comprimento + largura + altura abaixo de 90 cm e comprimento não excedendo 60 cm.","blogSingPostEPACContent3":"Esta opção foi inicialmente oferecida apenas pelo Hong Kong Post em conjunto com eBay China, permitindo que pacotes da China e Hong Kong fossem enviados para os EUA com rastreamento de entrega sem exigir qualquer assinatura na entrega. Este serviço é conhecido como USPS (United States Postal Service) First-Class Package International Service nos EUA.","blogSingPostEPACContent4":"A partir de 1º de janeiro de 2026, o ePAC agora é usado para todos os países para cumprir os regulamentos obrigatórios da UPU que exigem rastreamento para encomendas e limitam itens registrados apenas para documentos.","blogSingPostEPACContent5":"Prefixos de rastreamento: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS é um serviço postal expresso internacional premium, priorizado por operadores postais em todo o mundo.","blogSpeedPostEMSContent2":"O desembaraço aduaneiro é geralmente mais rápido que o correio padrão, mas mais rigoroso no processo, com rastreamento completo até a entrega.","blogSpeedPostEMSContent3":"Em Cingapura, isso é conhecido como SpeedPost Priority International pela SingPost.","blogSpeedPostEMSContent4":"Prefixo de rastreamento: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express é um serviço de nível de courrier.","blogSpeedPostExpressContent2":"Em muitos destinos, a DHL Express realiza a entrega da última milha e cobra impostos ou taxas antes da liberação.","blogSpeedPostExpressContent3":"Prefixo de rastreamento: PX123456789SG (A última milha da DHL Express usa um número de rastreamento de 10 dígitos, que não é visível ao público, mas temos informações sobre isso através do nosso","blogSpeedPostExpressContent3Link":"Sistema de Rastreamento.","blogUSPDDPContent1":"PDDP permite que impostos e taxas de importação dos EUA sejam pagos antecipadamente antes da entrega, reduzindo cobranças surpresa para os destinatários.","blogUSPDDPContent2":"Novos Regulamentos (Efetivo em 29 de agosto de 2025)","blogUSPDDPContent2List1":"Códigos HTS obrigatórios","blogUSPDDPContent2List2":"Descrições precisas de itens","blogUSPDDPContent2List3":"Aplicação tarifária mais rigorosa","blogUSPDDPContent3":"Todos os itens enviados para os EUA não serão cobrados tarifas adicionais ao destinatário, pois pagamos em seu nome. No entanto, note que o preço do item inclui a taxa de importação de 10% por padrão para cumprir as regulamentações.","blogUSPDDPContent4":"Isso se aplica apenas aos nossos métodos de envio para os EUA, SpeedPost Priority International (EMS) e SingPost ePAC.","blogEUIOSSContent1":"A UE aplica IVA em todas as importações comerciais, independentemente do valor.","blogEUIOSSContent2":"IOSS (balcão único de importação)","blogEUIOSSContent3":"O IOSS permite que os vendedores coletem o IVA da UE no checkout para remessas de até €150.","blogEUIOSSContent4":"O IVA é então remetido via sistema IOSS, permitindo desembaraço aduaneiro mais rápido e sem cobrança de IVA na entrega.","blogEUIOSSContent5":"Para todos os pedidos via Etsy ou eBay, o IVA IOSS já é coletado no checkout e indicaremos no Número de Referência Fiscal para transmitir os dados ao serviço postal de destino via EDI (Electronic Data Interchange).","blogUKVATContent1":"O Reino Unido exige que o IVA seja contabilizado para mercadorias importadas.","blogUKVATContent2":"Para remessas de baixo valor, o IVA geralmente é coletado no checkout e remetido diretamente ao HMRC pelo vendedor ou marketplace.","blogUKVATContent3":"Para remessas de maior valor, o IVA pode ser coletado pela transportadora antes da entrega.","blogUKVATContent4":"Para todos os pedidos via Etsy ou eBay, o IVA já é coletado no checkout e indicaremos no Número de Referência Fiscal para transmitir os dados ao serviço postal de destino via EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"A Noruega introduziu o sistema VOEC (VAT on E-Commerce) para mercadorias importadas de fora da UE/EEE. Isso se aplica a mercadorias avaliadas em até 3.000 NOK.","blogNorwayVOECContent2":"Os vendedores podem se registrar no esquema VOEC para coletar o IVA norueguês no checkout, permitindo desembaraço aduaneiro mais rápido e sem cobrança de IVA na entrega.","blogNorwayVOECContent3":"Para todos os pedidos via Etsy ou eBay, o IVA VOEC já é coletado no checkout. O rastreamento e a documentação aduaneira indicam o Número de Referência Fiscal para transmitir dados ao serviço postal norueguês.","blogSwissVATContent1":"A Suíça cobra IVA em mercadorias importadas, independentemente do valor. A Administração Federal de Alfândegas da Suíça exige que vendedores estrangeiros coletem o IVA no checkout para mercadorias de até 65 CHF.","blogSwissVATContent2":"Os vendedores registrados no sistema de IVA suíço remetem o IVA coletado diretamente, garantindo que o destinatário não experimente nenhuma cobrança adicional de IVA na entrega.","blogSwissVATContent3":"Para todos os pedidos via Etsy ou eBay, o IVA suíço já é coletado durante o checkout, e a documentação aduaneira inclui o Número de Referência Fiscal para envio EDI.","dhlNoEmbed":"A DHL Express não suporta rastreamento via incorporação. Por favor","speedPostNoEmbed":"O SpeedPost Singapura não suporta rastreamento via incorporação. Por favor","operatorNoEmbed":"não suporta rastreamento via incorporação. Por favor","clickHere":"clique aqui","toTrackNewTab":"para rastrear (abre em nova aba).","russiaServiceSuspended":"⚠️ AVISO IMPORTANTE: Tendo em vista a invasão russa da Ucrânia em 2022, a SingPost suspendeu todas as remessas para a Rússia junto com a DHL. Atualmente não servimos a Rússia até que haja anúncio de retomada dos serviços para o país.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Desejo a você e sua família paz, alegria e bênçãos! 🌟","deepavaliMessage":"🪔 Feliz Deepavali! Que o festival das luzes lhe traga alegria, prosperidade e sucesso! ✨","diwaliMessage":"🪔 Feliz Diwali! Que o festival das luzes lhe traga alegria, prosperidade e sucesso! ✨","vesakMessage":"☸️Feliz Dia de Vesak! Desejo a você paz, sabedoria e iluminação neste dia sagrado! 🙏","vesakTHMessage":"☸️ Feliz Dia de Visakha Bucha! Desejo a você paz, sabedoria e iluminação neste dia sagrado! 🙏","temporaryClosureNoticeTitle":"Rhythm Nexus - Aviso de encerramento temporario","temporaryClosureNoticeBody":"Prezados clientes,\n\nInformamos que a Rhythm Nexus estara temporariamente fechada de 21 de marco de 2026 a 26 de marco de 2026 devido a um evento da empresa.\n\nPara preparar o periodo de fechamento, a loja entrara em modo ferias a partir de 20 de marco de 2026, as 3:00 PM (UTC +8). Pedidos feitos apos esse horario podem nao ser processados ate retomarmos as operacoes.\n\nAs operacoes normais serao retomadas em 27 de marco de 2026.\n\nPedimos desculpas por qualquer inconveniente e agradecemos sua compreensao e apoio continuo.\n\nObrigado.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Entendi","parcelTracking":"Rastreamento de encomendas","serviceAnnouncement":"Anúncio de serviço","usaWinterStormTitle":"URGENTE: Tempestade de inverno severa - Interrupção de serviço","usaWinterStormSubtitle":"United States Postal Service (USPS) Evento de Força Maior","usaWinterStormNotice1":"Devido à severa tempestade de inverno que afeta a região de Nova York desde 23 de fevereiro de 2026:","usaWinterStormNotice2":"As operações internacionais no Aeroporto Internacional John F. Kennedy foram efetivamente interrompidas","usaWinterStormNotice3":"Relata-se cancelamentos generalizados de voos e perturbações significativas dos serviços aeroportuários","usaWinterStormNotice4":"Essas condições constituem um evento de força maior além do controle do USPS","usaWinterStormNotice5":"Impacto no serviço:","usaWinterStormNotice6":"Mistura perigosa de neve pesada, chuva congelante, granizo e frio extremo","usaWinterStormNotice7":"Relata-se grandes perturbações e apagões generalizados","usaWinterStormNotice8":"A coleta e entrega de correio doméstico e internacional (correspondência, encomendas e itens de EMS) foram afetadas","usaWinterStormNotice9":"Áreas de código postal afetadas:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"A USPS está tomando todas as medidas necessárias para minimizar inconvenientes aos clientes, mantendo a segurança dos funcionários. Agradecemos sua paciência e compreensão durante este evento de força maior.","usaWinterStormNotice12":"Última atualização: 25 de fevereiro de 2026","countryAutoDetected":"Destino pré-definido com base na sua localização","countryAutoDetectedFromLink":"Destino pré-definido a partir do link","trackingNumber":"Número de rastreamento","destinationCountry":"País de destino","postcode":"Código postal","australianDSTTitle":"Horário de verão australiano ativo","australianDSTBothMessage":"Tanto o AEDT (horário de verão do leste da Austrália) quanto o ACDT (horário de verão central da Austrália) estão atualmente em vigor.","australianAEDTMessage":"AEDT (horário de verão do leste da Austrália) está atualmente em vigor para Sydney, Melbourne e áreas vizinhas.","australianACDTMessage":"O ACDT (horário de verão central da Austrália) está atualmente em vigor para Adelaide e Sul da Austrália.","australianDSTNote":"Os prazos de entrega exibidos acima refletem o horário de verão atual.","filteredAllowedDestinations":"(Filtrado para seus destinos permitidos)","loadingAnnouncements":"Carregando anúncios...","unableToLoadAnnouncements":"Não é possível carregar anúncios de serviço neste momento.","viewOnSingPostWebsite":"Ver no site SingPost →","postalContactsTitle":"Contatos dos Serviços Postais","postalContactsNote":"Nota:","postalContactsPolandUKNote":"Para a Polônia e Reino Unido, todos os itens enviados via SpeedPost Priority (EMS) serão tratados pela Pocztex e Parcelforce.","postalContactsDHLNote":"Para remessas SpeedPost Express, entre em contato com a DHL através deste link:","postalContactsCountry":"País","postalContactsWebsite":"Site","postalContactsForm":"Formulário de contato","postalContactsPhone":"Número de telefone","postalContactsEmail":"E-mail de contato","postalContactsFormLink":"Formulário de contato","postalContactsBackButton":"Voltar ao formulário de consulta de encomendas","statusHeldByCustms":"Detido pela Alfândega","contactUsTitle":"Contacte-nos","contactNameLabel":"Nome (SEM APELIDOS OU NÚMERO DE TELEFONE)","contactEmailLabel":"Endereço de e-mail (onde responderemos)","contactEmailNote":"E-mails de retransmissão privada (por exemplo, @privaterelay.appleid.com) não são aceites. Por favor, use um endereço de e-mail válido.","contactEnquiryTypeLabel":"Isto é um?","contactSelectOption":"Selecione uma opção","contactGeneralEnquiry":"Consulta geral / Feedback","contactBusinessEnquiry":"Consulta empresarial","contactOrderShippingEnquiry":"Consulta de pedido/envio","contactExchangeRefundEnquiry":"Consulta de troca/reembolso/devolução","contactOthers":"Outros","contactParcelWarning":"Se a sua encomenda não foi entregue há mais de 18/30/45 dias (14 dias para FedEx), ou o estado mostra entregue mas não a tem, preencha","contactParcelWarningLink":"ESTE FORMULÁRIO","contactParcelWarningEnd":"em vez disso.","contactOrderNumberLabel":"Número do pedido","contactOrderNumberPlaceholder":"Exemplo: RTNX1234567890","contactPlatformNote":"Número de pedido Etsy, eBay e Shopee aqui. NÃO temos NENHUM controlo sobre reembolsos destas plataformas. Contacte o respetivo serviço de apoio ao cliente.","contactPlatformInstructions":"Use a aplicação para ver o número do pedido, pois está guardado na aplicação:","contactPlatformEtsy":"Etsy - Canto superior direito no seu perfil → Compras","contactPlatformEbay":"eBay - O meu eBay → Compras","contactPlatformShopee":"Shopee - Eu → Ver histórico de compras (ou pode clicar em Para enviar/Para receber)","contactRefundNote1":"Se está a consultar sobre devolução/reembolso para as plataformas onde fez compras, note que NÃO temos NENHUM controlo sobre reembolsos destas plataformas. Contacte o respetivo serviço de apoio ao cliente.","contactRefundNote2":"Para devoluções ou trocas, não permitimos para luvas maimai se já foram usadas quando abertas (manchas visíveis ou lavadas na máquina/lavagem manual), e não são permitidas devoluções ou trocas para cartões de diversão. Obrigado.","contactRefundNote3":"Note que para reembolsos através do Payhip, contacte o seu banco ou o suporte Payhip em support@payhip.com se não recebeu o reembolso, pois não temos controlo sobre o processo.","contactMessageLabel":"A sua mensagem (até 1000 caracteres)","contactCharacterCount":"caracteres","contactSpamWarningNote":"Nota:","contactSpamWarning":"Ofertas não solicitadas para SEO, design de websites, empréstimos ou serviços semelhantes serão automaticamente rejeitadas.","contactAgreementText1":"Clique em \"Aceito\" se concorda que o seu endereço de e-mail seja usado pela Rhythm Nexus para lhe responder, pois isto é necessário para lermos a sua resposta e respondermos assim que encontrarmos uma solução para a sua consulta.","contactAgreementText2":"Note que a nossa resposta demorará entre 3 a 5 dias úteis, ou mais durante um alto volume de e-mails da nossa parte.","contactAgreeCheckbox":"Aceito","contactSuccessMessage":"A sua mensagem foi enviada com sucesso! Responderemos dentro de 3-5 dias úteis.","contactErrorMessage":"Falha ao enviar mensagem. Por favor, tente novamente.","contactGeneralError":"Ocorreu um erro. Por favor, tente mais tarde.","contactSubmitting":"A enviar...","contactSubmit":"Submeter","contactAlertAgree":"Aceite os termos para submeter o formulário.","parcelEnquiryTitle":"Consulta de encomenda","parcelInfoText":"Este formulário é para encomendas não entregues há mais de 18/30/45 dias (14 dias para FedEx/DHL), ou que mostraram estado entregue mas não as tem.","parcelInfoLink":"Clique aqui","parcelInfoEnd":"para outras consultas.","parcelWaitTitle":"Aguarde a sua encomenda","parcelWaitText1":"Aguarde a entrega da sua encomenda. Note que entregas internacionais NÃO são iguais a entregas locais pois demoram tempo. Obrigado!","parcelWaitText2":"Se não aparecer nenhum estado após 18 dias (7 dias para Singapura) ou mais, pode informar-nos diretamente.","parcelCannotSubmit":"Não pode submeter este formulário se selecionou \"Não\".","parcelNameLabel":"Nome","parcelOrderNumberLabel":"Número do pedido (Exemplo: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Endereço de e-mail (Responderemos por aqui)","parcelEmailNote":"E-mails de retransmissão privada não são aceites. Use um endereço de e-mail válido.","parcelShippingMethodLabel":"Método de envio escolhido?","parcelSelectShipping":"Selecione um método de envio","parcelSingPostEpac":"SingPost ePacket (ou ePAC) - aka SpeedPost Saver International (Rastreio: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Rastreio: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Rastreio: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Rastreio: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Rastreio: PX123456789SG)","parcelDHL":"DHL Express (Apenas países da UE) (Rastreio: 1234567890)","parcelTrackingNumberLabel":"Número de rastreio da sua encomenda?","parcelUndeliveredLabel":"A sua encomenda não foi entregue há mais de 18/30/45 dias? (Serviços locais de Singapura >7 dias, >14 dias para SpeedPost Express/DHL)","parcelSelectOption":"Selecione uma opção","parcelYes":"Sim","parcelNo":"Não","parcelDeliveredButMissingLabel":"A sua encomenda mostrou estado entregue, mas não está presente na sua caixa de correio/local seguro/porta?","parcelCaseReferenceLabel":"ID de referência de caso dos correios locais","parcelCaseReferencePlaceholder":"Coloque NA se for de Singapura","parcelCaseReferenceNote":"Antes de submeter este formulário, contacte os seus correios locais por telefone ou e-mail e obtenha um ID de referência de caso deles. Depois, coloque aqui o seu ID de referência de caso.","parcelCaseReferenceLink":"Consulte este link para contactos do serviço postal","parcelCaseReferenceMandatory":"COLOQUE NA APENAS SE FOR DE SINGAPURA. Para outros países é OBRIGATÓRIO fornecer. Necessário também para SpeedPost Express, para o ID de caso DHL.","parcelImageEvidenceLabel":"Evidência de imagem (para encomendas entregues mas em falta)","parcelImageWarning":"Para verificação adicional, precisamos de evidência de imagem para provar que não está a fazer falsas declarações sobre não entrega da encomenda. (Apenas para encomendas já entregues, mas não presentes na caixa de correio/fora da porta. Podemos rejeitar a sua reclamação se não for fornecida evidência fotográfica para itens entregues. Ignore isto se o seu item NÃO mostrou estado entregue.)","parcelImageNote":"Carregue 1 ficheiro suportado: imagem. Máx. 1 GB.","parcelAgreementText":"Clique em \"Aceito\" se garante que o que aconteceu à sua encomenda era verdade.","parcelAgreeCheckbox":"Aceito","parcelSuccessMessage":"A sua consulta de encomenda foi submetida com sucesso! Responderemos dentro de 3-5 dias úteis.","parcelErrorMessage":"Falha ao submeter consulta. Tente novamente.","parcelGeneralError":"Ocorreu um erro. Tente mais tarde.","parcelAlertWait":"Aguarde a entrega da sua encomenda. Pode submeter este formulário após o período de espera especificado.","parcelAlertAgree":"Aceite os termos para submeter o formulário.","parcelAlertCaseReference":"Forneça um ID de referência de caso dos seus correios locais, ou coloque NA se for de Singapura.","parcelSubmitting":"A enviar...","parcelSubmit":"Submeter","lookalikeDomainWarning":"Este é um link para um site que imita uma transportadora, não um número de rastreio. Não introduza aí dados pessoais ou de pagamento.","lookalikeDomainOfficial":"Site oficial:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus использует премиальные коммерческие сети. Однако в момент прибытия в вашу страну ответственность за отправление передается местному внутреннему перевозчику (например, USPS, Royal Mail, DHL на местном уровне). На этом этапе префиксы трек-номера переходят между системами обработки, но наш универсальный трекер объединяет эти статусы, обеспечивая непрерывную видимость.","trackingLastMileTitle":"Сеть доставки последней мили","trackingCustomsClearanceBody":"Все трансграничные отправления должны пройти оформление в таможенной службе вашей страны. Наш инструмент отслеживает переходы от прибытия в импортный центр до передачи на таможню. Пограничные службы проверяют коды HS и подтверждают, что корректно уплачены НДС или пошлины (например, IOSS в ЕС, VOEC в Норвегии). Отдельно следите за предупреждениями \"Held at Customs\".","trackingCustomsClearanceTitle":"Информация о таможенном оформлении","trackingProcessingOriginBody":"После сдачи отправления товар поступает в центр обработки в стране отправления, где его сканируют, взвешивают и проводят первичные проверки экспортной безопасности. Затем он направляется в международный почтовый обмен. Расписание рейсов зависит от доступной грузовой емкости. Не беспокойтесь, если этот статус сохраняется несколько дней.","trackingProcessingOriginTitle":"Обработка в узле отправления","trackingInfoReceivedBody":"Когда заказ впервые обрабатывается на наших платформах электронной коммерции (например, Etsy, eBay или прямые продажи), трек-номер формируется в электронном виде. Перевозчик получает данные об отправлении до фактического приема коробки. Пожалуйста, заложите от 1 до 3 рабочих дней на поступление посылки в физический сортировочный центр.","trackingInfoReceivedTitle":"Информация получена","trackingStatusesIntro":"Спасибо, что используете наш единый инструмент международного отслеживания посылок. Поскольку ваша посылка проходит через несколько международных границ, статусы отслеживания могут быть сложными. Понимание логистического цикла помогает сформировать четкие ожидания.","trackingStatusesTitle":"Понимание статусов отслеживания","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"ДП","pmText":"ПП","footerQuickLinks":"Быстрые ссылки","footerSupportLegal":"Поддержка и правовая информация","copyrightText":"Все права защищены.","tzAEST":"AEST (Сидней/Мельбурн)","tzACST":"ACST (Аделаида)","tzAWST":"AWST (Перт)","tzNST":"NST (Ньюфаундленд)","tzAST":"AST (Атлантическое)","tzEST":"EST (Восточное)","tzCST":"CST (Центральное)","tzMST":"MST (Горное)","tzPST":"PST (Тихоокеанское)","tzAKST":"AKST (Аляска)","tzHST":"HST (Гавайи)","tzBeijing":"Пекин","tzXinjiang":"Синьцзян","tzWIB":"WIB (Джакарта)","tzWITA":"WITA (Макасар)","tzWIT":"WIT (Джаяпура)","tzKaliningrad":"Калининградская область (UTC+2)","tzMoscow":"Москва/Западная Россия (UTC+3)","tzSamara":"Самарская область (UTC+4)","tzUral":"Уральский регион (UTC+5)","tzOmsk":"Омская область (UTC+6)","tzKrasnoyarsk":"Красноярский край (UTC+7)","tzIrkutsk":"Иркутская область (UTC+8)","tzSakha":"Саха Республика (UTC+9)","tzPrimorsky":"Приморский край (UTC+10)","tzMagadan":"Магаданская область (UTC+11)","tzKamchatka":"Камчатский край (UTC+12)","dstDayStartsLabel":"Летнее время начинается","dstDayEndsLabel":"Летнее время заканчивается","dstRevertsLabel":"переход на стандартное время","dstEuropeLabel":"Европа","dstNewZealandLabel":"Новая Зеландия","englishResponseNotice":"Примечание: на все запросы отвечают на английском языке. Если вы отправляете сообщение на другом языке, ваше сообщение может быть переведено на английский для проверки.","parcelDisagreeCheckbox":"Я не согласен","contactDisagreeCheckbox":"Я не согласен","contactNamePlaceholder":"Например: Иван Иванов","systemRequirementsTitle":"Минимально поддерживаемые версии системы","systemRequirements":"Windows: Windows 7 (with ESU updates installed) или выше\nmacOS: macOS 12 или выше\nAndroid: Android 13 или выше\niPhone/iOS: iOS 17 или выше\nLinux: Поддерживаемый дистрибутив с активными обновлениями безопасности","goodFridayEasterGreeting":"С Пасхой! Мира и радости в Страстную пятницу и Пасху.","christmasGreeting":"С Рождеством и Новым годом! Мира и радости с 25 декабря по 5 января.","captchaSystemRequirements":"Минимальные системные требования: Windows 7 (with ESU updates installed) или 11, macOS 10.15+, или последняя версия Android/iOS.","title":"Проверка доступа","subtitle":"Пожалуйста, пройдите тест ниже, чтобы продолжить.","selectLanguage":"Выберите язык","selectLanguagePlaceholder":"-- Выберите язык --","loadingChallenge":"Загрузка теста...","answerLabel":"Ваш ответ:","answerPlaceholder":"Введите ваш ответ","continueButton":"Продолжить","refreshButton":"Новый тест","verifying":"Проверка...","chooseLanguageFirst":"Пожалуйста, сначала выберите язык.","loadFailed":"Не удалось загрузить тест. Пожалуйста, попробуйте еще раз.","expiredChallenge":"Срок действия теста истек. Загрузка нового теста...","verifyFailed":"Проверка не удалась. Пожалуйста, попробуйте еще раз.","home":"Главная","blog":"Блог","aboutUs":"О нас","faq":"Часто задаваемые вопросы","contact":"Контакты","trackPackage":"Отследить посылку","cnyYearOfHorseMessage":"🧧 С Лунным Новым годом! Желаем вам процветания и радости в Год Лошади! 🐴","singaporeNationalDayMessage":"🇸🇬 С Днем Независимости, Сингапур! Празднуем 61 год независимости! 🎉","indonesiaNationalDayMessage":"🇮🇩 Селамат Хари Кемердекаан, Индонезия! Диргахаю Республика Индонезия! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Малайзия! Празднуем независимость нашей страны! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Уведомление о временном закрытии","temporaryClosureNoticeBody":"Уважаемые клиенты,\n\nОбратите внимание, что Rhythm Nexus будет временно закрыт с 21 марта 2026 года по 26 марта 2026 года в связи с корпоративным мероприятием.\n\nДля подготовки к закрытию магазин будет переведен в режим отпуска с 20 марта 2026 года, 3:00 PM (UTC +8). Заказы, оформленные после этого времени, могут быть обработаны только после возобновления работы.\n\nОбычная работа будет возобновлена 27 марта 2026 года.\n\nПриносим извинения за возможные неудобства и благодарим вас за понимание и постоянную поддержку.\n\nСпасибо.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Понятно","parcelTracking":"Отслеживание посылки","serviceAnnouncement":"Сервисное объявление","usaWinterStormTitle":"СРОЧНО: Сильный зимний шторм - Сбой в обслуживании","usaWinterStormSubtitle":"Почтовая служба Соединенных Штатов (USPS) Событие непреодолимой силы","usaWinterStormNotice1":"Из-за сильного зимнего шторма, поражающего регион Нью-Йорка с 23 февраля 2026 года:","usaWinterStormNotice2":"Международные операции в международном аэропорту имени Джона Ф. Кеннеди фактически прекращены","usaWinterStormNotice3":"Сообщается о массовых отмены полетов и значительных нарушениях в обслуживании аэропортов","usaWinterStormNotice4":"Эти условия представляют собой событие непреодолимой силы, выходящее за рамки контроля USPS","usaWinterStormNotice5":"Влияние на обслуживание:","usaWinterStormNotice6":"Опасная комбинация обильного снега, ледяного дождя, мокрого снега и трескучего мороза","usaWinterStormNotice7":"Сообщается о серьезных нарушениях и массовых отключениях электроэнергии","usaWinterStormNotice8":"Сбор и доставка внутренних и международных почтовых отправлений (писем, посылок и товаров EMS) затронуты","usaWinterStormNotice9":"Затронутые почтовые индексы:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS предпринимает все необходимые меры для минимизации неудобств для клиентов при сохранении безопасности сотрудников. Мы ценим вашу терпеливость и понимание во время этого события непреодолимой силы.","usaWinterStormNotice12":"Последнее обновление: 25 февраля 2026 г.","countryAutoDetected":"Страна назначения предустановлена на основе вашего местоположения","countryAutoDetectedFromLink":"Страна назначения предустановлена по ссылке","trackingNumber":"Номер отслеживания","destinationCountry":"Страна назначения","postcode":"Почтовый индекс","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! 🎉","taiwanFoundingDayMessage":"🇹🇼 С Днём основания, Тайвань! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 С Днём двойной десятки, Тайвань! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 С Днём образования САР Гонконг! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 С Днём образования САР Макао! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ С Международным днём труда! Празднуем труд и права трудящихся! 🎊","laborDayUSCAMessage":"⚒️ С Днём труда! Чтим вклад трудящихся! 🎉","orderNumber":"Номер заказа (пример: RTNX1234567890)","fromDate":"С даты (ОБЯЗАТЕЛЬНО)","toDate":"По дату (ОБЯЗАТЕЛЬНО)","trackParcel":"Отследить посылку","selectCourier":"-- Выберите курьера / страну --","singaporeCouriers":"Курьеры Сингапура","topCountries":"Топ 5 стран","otherCountries":"Другие страны","note":"ПРИМЕЧАНИЕ","disclaimer":"ОТКАЗ ОТ ОТВЕТСТВЕННОСТИ","importantInformation":"Важная информация:","didNotReceiveEmail":"Если вы не получили письмо с подтверждением от Etsy, eBay, Shopee или Payhip, прокрутите вниз, чтобы найти свой заказ по адресу электронной почты или номеру телефона, связанному с этим заказом.","searchByEmailOrPhone":"Поиск по Email или телефону","searchOrder":"Поиск заказа","trackingResult":"Результат отслеживания","noOrdersFound":"Заказы по вашему запросу не найдены.","pleaseEnter":"Пожалуйста, введите Email, телефон или номер заказа.","fillAllFields":"Пожалуйста, заполните все обязательные поля: номер отслеживания, страну назначения, номер заказа и почтовый индекс.","noOrderMatchingFields":"Заказ, соответствующий всем полям, не найден.","postcodeRequired":"Для этого места назначения требуется почтовый индекс.","invalidUSZip":"Неверный ZIP-код США. Используйте 5 цифр или ZIP+4.","failedGenerateURL":"Не удалось сгенерировать ссылку для отслеживания. Проверьте ввод.","trackingValidationSG":"Номера отслеживания для Сингапура должны быть: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG или PX123456789SG. Для отправлений DHL используйте 10-значные номера.","invalidSingPostFormat":"Неверный формат номера отслеживания SingPost.\nПринятые форматы:\n• PP123456789SG → Предоплаченный отслеживаемый ярлык\n• SPNDD00012345 → Стандартное отслеживание SpeedPost","filteredAllowedDestinations":"(Отфильтровано по разрешённым направлениям)","loadingAnnouncements":"Загрузка объявлений...","unableToLoadAnnouncements":"Не удаётся загрузить объявления службы в данный момент.","viewOnSingPostWebsite":"Смотреть на сайте SingPost →","welcomeTitle":"Добро пожаловать на сайт Rhythm Nexus!","purchaseInfo":"Покупайте у нас через официальные каналы или присоединяйтесь к нашей","purchaseInfoChina":"Покупайте у нас через официальные каналы.","purchaseInfoChinaSuffix":"","telegramGroup":"группе Telegram","forUpdates":"для официальных обновлений.","ourStores":"Наши магазины","etsyStore":"Магазин Etsy","ebayStore":"Магазин eBay","shopeeStore":"Магазин Shopee","payhipStore":"Магазин Payhip","internationalShipping":"Международная доставка","singaporeLocal":"Местная доставка (Сингапур)","asiaOnly":"Только Азия","deliveryInfo":"Информация о доставке","deliveryRates2026":"Тарифы на доставку 2026","sgDeliveryRates":"Тарифы доставки по Сингапуру","speedPostRates":"Тарифы SpeedPost Express International","aboutTitle":"О Rhythm Nexus","aboutP1":"Мы открыли наш магазин в 2022 году и с тех пор успешно продаем на таких платформах, как Etsy, eBay и Shopee.","aboutP2":"Со временем мы создали прочную репутацию, сосредоточившись на надежном исполнении, прозрачном общении и точном отслеживании каждого отправляемого заказа.","aboutP3":"Наша цель — обеспечить клиентам удобный и надежный опыт покупок, будь то покупка на месте или за границей. Мы постоянно адаптируемся к изменяющимся почтовым, таможенным и налоговым требованиям.","aboutP4":"Спасибо за поддержку Rhythm Nexus.","faqTitle":"Часто задаваемые вопросы","faqQ1":"Что делать, если товар бракованный? Есть ли гарантия?","faqA1":"Да! На большинство заказов распространяется гарантия 1 год. Пожалуйста, предоставьте номер счета/заказа, чтобы мы могли провести расследование. Примечание: Обмен не допускается, если товар соответствует описанию, даже если вы заказали неправильно.","faqQ2":"Могу ли я изменить, обновить или отменить заказ?","faqA2":"Да. В целях безопасности изменения заказа могут обрабатываться через электронную почту или через нашу Контактную форму.","faqQ3":"Нужно ли платить таможенные/импортные пошлины?","faqA3":"Таможенные пошлины и налоги, как правило, не оплачиваются заранее, за исключением DDP в США. НДС может применяться для ЕС, Великобритании, Австралии/Новой Зеландии, Норвегии, Швейцарии и канадских провинций, таких как Саскачеван и Манитоба, который уже оплачен по умолчанию. Для Сингапура GST не применяется. Мы не можем консультировать по таможенным сборам - обратитесь в местную таможню для получения подробной информации.","faqQ4":"Когда будет отправлен мой заказ?","faqA4":"Заказы обычно отправляются в течение 1-5 рабочих дней. В периоды высокой загрузки это может занять 5-7 дней.","faqQ5":"Я случайно сделал два заказа. Что делать?","faqA5":"Мы возвещаем только дублирующие расходы на доставку. Оба товара будут отправлены вместе. Возврат = (стоимость первой доставки + стоимость второй доставки) - фактическая стоимость доставки.","faqQ6":"Сколько времени занимает доставка?","faqA6":"Обработка занимает 1-5 рабочих дней.\n\nДоставка внутри страны:\n• SingPost Prepaid Tracked Label: 2–4 дня\n• SpeedPost Standard: 1–3 дня\n\nМеждународная доставка:\n• SingPost ePAC: 14-30 дней\n• SpeedPost Priority (EMS): 8-15 дней\n• SpeedPost Express: 4-8 дней\n\nВ пиковые сезоны могут возникнуть задержки.","faqQ7":"Мой товар возвращается отправителю. Что делать?","faqA7":"Допускается одна повторная отправка. Отмена невозможна для неверных адресов, невостребованных посылок или неоплаченных таможенных сборов. Свяжитесь с вашей почтовой службой для повторной доставки или напишите нам для получения помощи.","faqQ8":"Мой товар утерян / украден в пути.","faqA8":"Мы разрешаем одну повторную отправку. Если товар будет утерян снова, полный возврат средств будет произведен после окончания срока доставки курьера:\n\n• Местные службы Сингапура: 7 дней\n• SingPost ePAC и SpeedPost Priority International: 30 дней\n• SpeedPost Intl Express: 14 дней","blogTitle":"База знаний о доставке и почте","blogSubtitle":"Официальные разъяснения о почтовых услугах, таможне, НДС и пошлинах.","readMore":"Читать далее","backButton":"Назад","copyrightAllRights":"Все права защищены.","blogPost1Title":"Что такое SingPost ePAC?","blogPost1Desc":"Узнайте о SingPost ePAC (ePacket), экономичной отслеживаемой почтовой услуге.","blogPost2Title":"Что такое SpeedPost Priority International (EMS)?","blogPost2Desc":"Откройте для себя EMS, международную премиальную почтовую экспресс-услугу.","blogPost3Title":"Что такое SpeedPost Express?","blogPost3Desc":"Изучите SpeedPost Express с доставкой DHL.","blogPost4Title":"USA PDDP","blogPost4Desc":"Понимание PDDP в США.","blogPost5Title":"НДС ЕС и IOSS","blogPost5Desc":"Информация о НДС в ЕС и системе IOSS.","blogPost6Title":"НДС Великобритании и HMRC","blogPost6Desc":"Требования по НДС в Великобритании.","blogPost7Title":"Норвегия VOEC","blogPost7Desc":"Система VOEC в Норвегии.","blogPost8Title":"НДС Швейцарии","blogPost8Desc":"Требования по НДС в Швейцарии.","enterDestinationPostcode":"Введите почтовый индекс назначения","trackingNumberExample":"напр. LG123456789SG","trackingCaseSensitive":"БУКВЫ В НОМЕРЕ ОТСЛЕЖИВАНИЯ ЧУВСТВИТЕЛЬНЫ К РЕГИСТРУ И ДОЛЖНЫ БЫТЬ ЗАГЛАВНЫМИ.","usaPostcodeNote":"Для стран без почтовых индексов, таких как Гонконг и Макао, введите 999077 (Гонконг) или 999078 (Макао).","epacDeliveryNote":"Обратите внимание, что все отправления ePAC должны быть доставлены в ваш почтовый ящик, до двери, в почтомат или оставлены в безопасном месте!","currentTime":"Текущее время","timezoneNote":"Время отображается в 12-часовом формате","sameTimeAsSingapore":"Такое же время, как в Сингапуре","hourAhead":"час впереди Сингапура","hoursAhead":"часов впереди Сингапура","hourBehind":"час позади Сингапура","hoursBehind":"часов позади Сингапура","collectAtPostOffice":"Однако, если в вашей стране нет стандарта доставки в почтовый ящик, вам придется забрать посылку в почтовом отделении.","countriesNoMailbox":"Страны, в которых, как известно, недоступна доставка в почтовый ящик: Бруней, Китай, Индия, Израиль, Макао, Филиппины, Польша и Вьетнам.","rhythmNexusNotResponsible":"Rhythm Nexus НЕ НЕСЕТ ОТВЕТСТВЕННОСТИ за процесс доставки, так как это вне нашего контроля. Мы просим вас самостоятельно отслеживать статус вашего отправления.","issuesAfterDelivery":"Если у вас возникли проблемы с доставкой после 30/45 дней (14 дней для SpeedPost Express) или статус показывает \"Доставлено\", но вы не получили посылку, свяжитесь с нами.","cannotUseEmbed":"Мы не можем использовать встроенное отслеживание, так как большинство сайтов почтовых служб его не поддерживают.","clickLinkAbove":"Пожалуйста, нажмите на ссылку выше, чтобы отследить вашу посылку.","trackingDetailsNote":"Обратите внимание, что детали отслеживания могут не отображаться в результатах поиска, поэтому рекомендуется вставить номер отслеживания в систему.","thirdPartyWebsites":"Вы также можете отследить свои посылки на этих сторонних сайтах:","enterEmailOrPhone":"Введите Email или телефон","reviewShippingRates":"Ознакомьтесь с нашими текущими тарифами на доставку","here":"здесь","contactUsForm":"Пожалуйста, свяжитесь с нами через","form":"форму","forEnquiries":"для любых вопросов, касающихся вашего заказа.","anPostNoDirectTracking":"An Post (Ирландия) не поддерживает прямые ссылки для отслеживания или встроенное отслеживание.","anPostPasteManually":"Пожалуйста, скопируйте и вставьте ваш номер отслеживания вручную на сайте An Post:","goToAnPost":"Перейти на An Post","countryMsgNL":"Если статус показывает 'Held by Customs', пожалуйста, свяжитесь с информационной линией таможни Нидерландов: 0800 0143 (бесплатно), Пн-Пт с 7:00 до 23:00. Сб и Вс с 8:00 до 16:30.\n\nВам рекомендуется зарегистрировать учетную запись в PostNL для мгновенных пуш-уведомлений о ваших посылках: https://www.postnl.nl/campagnes/online-pakket-volgen/\n\nЕсли посылка доставляется в пункт PostNL или статус указывает на получение на почте, вам придется заплатить 7 EUR на кассе. Максимум 4 EUR при оплате онлайн.","countryMsgDE":"Мы рекомендуем загрузить приложение Post & DHL для получения пуш-уведомлений о статусе отслеживания ваших посылок: https://www.deutschepost.de/de/p/post-und-dhl-app.html DHL Paket GmbH служба поддержки: +49-228-433-3112 DHL DE контакты: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Вам нужно предоставить дополнительную импортную декларацию в таможню. Несоблюдение может привести к ограничению въезда и возврату посылки. Дополнительная информация: https://www.posti.fi/en/receiving/customs-clearance Другие ссылки: https://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number https://tulli.fi/en/about-us/contact-information https://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Комиссия за обработку 4,95 EUR. Загрузите приложение здесь: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Комиссия за обработку 8,50 PLN. Вам придется оплатить ее при получении на почте, так как посылка вряд ли будет доставлена к вашей двери или почтовому ящику.","countryMsgPH":"PHLPost считается неэффективной и ненадежной на Филиппинах. Всегда отслеживайте свою посылку, так как иногда статус доставки появляется только через 1-3 недели для меньших посылок. Для более крупных посылок получение возможно только в центральном почтовом отделении Манилы или в ближайшем почтовом отделении. Обратите внимание, что комиссия за обработку 112PHP применяется для посылок любой стоимости, которую вам придется оплатить. Неуплата приведет к возврату посылки нам. Доставка, по оценкам, займет 1-2 месяца из-за медленности служб PHLPost. Вам не нужно платить налоги за товары стоимостью ниже 10000PHP, но вам придется платить, если стоимость равна или превышает эту сумму. Мы рекомендуем SpeedPost Express для более быстрого процесса в следующий раз, когда вы заказываете у нас. Однако сборы могут не применяться, так как D&T для получателя по умолчанию.","countryMsgCA":"De minimis составляет 20CAD для всех заказов, отправленных в Канаду, поскольку Сингапур является частью соглашения CPTPP, пошлины могут не применяться, но D&T может применяться, если товар превышает 60CAD и выше или 100CAD и выше пороговое значение, которое может зависеть от HS-кода товара. Стоимость выше этой суммы будет обложена НДС соответственно.","countryMsgID":"Вы обязаны уплатить все применимые налоги и сборы по прибытии в Индонезию. Отслеживайте свою посылку и оплачивайте указанную сумму индонезийской таможне. Вам также потребуется предоставить дополнительные таможенные документы. Несоблюдение может привести к ограничению въезда или конфискации посылки таможней страны. Проверьте дополнительные детали здесь: https://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Вы обязаны уплатить все применимые налоги и сборы по прибытии в Индию. Отслеживайте свою посылку и оплачивайте указанную сумму индийской таможне. Имейте в виду, что таможенное оформление в Индии строгое, и с вас могут взимать пошлины или нет, если стоимость вашего товара превышает 1000INR (15 USD) - в зависимости от HS-кода, в большинстве случаев это беспошлинно, но с вас могут взимать более высокие пошлины, если товар превышает 5000INR (60 USD). Поскольку India Post НЕ доставляет в почтовый ящик по стандарту, вам МОЖЕТ потребоваться быть дома или уполномоченный представитель для получения вашей посылки или получения на почте.","countryMsgMY":"De minimis составляет 500MYR для всех заказов, отправленных в Малайзию. Заказы свыше этой суммы могут быть обложены сборами.","countryMsgUS":"С 29 августа 2025 года de minimis в размере 800 USD будет официально удален, и импортные пошлины будут подлежать оплате по умолчанию для отправителя в стране-отправителе. Доставка в США ТРЕБУЕТ действительного номера телефона и адреса электронной почты, чтобы избежать дополнительных задержек.","countryMsgIL":"De minimis составляет 240 ILS (75 USD) для всех заказов, отправленных в Израиль. Заказы свыше этой суммы могут быть обложены сборами. Обратите внимание, что для заказов, отправленных в Израиль, Israel Post иногда может не подтверждать окончательную доставку после того, как она доставлена. Поскольку Israel Post НЕ доставляет в почтовый ящик по стандарту, вам МОЖЕТ потребоваться быть дома или уполномоченный представитель для получения вашей посылки или получения на почте.","countryMsgGB":"Обратите внимание, что для заказов, отправленных в Великобританию, Royal Mail иногда может не подтверждать окончательную доставку после того, как она доставлена в ваш почтовый ящик.","countryMsgTH":"De minimis составляет 1500THB (45 USD) для всех заказов, отправленных в Таиланд. Заказы свыше этой суммы могут быть обложены сборами.","countryMsgTW":"De minimis составляет 2000TWD (60 USD) для всех заказов, отправленных на Тайвань. Заказы свыше этой суммы могут быть обложены сборами.","countryMsgMO":"При отправке в Макао D&T не взимается. Но обратите внимание, что Macau Post НЕ доставляет в почтовый ящик по стандарту, вам ПРИДЕТСЯ получить свою посылку на почте.","countryMsgBN":"При отправке в Бруней D&T не взимается. Но обратите внимание, что Brunei Post НЕ доставляет в почтовый ящик по стандарту, вам ПРИДЕТСЯ получить свою посылку на почте. Система отслеживания для этой страны не очень стабильна, может быть предоставлена только ограниченная информация, и результаты окончательной доставки НЕ предоставляются происхождению.","countryMsgJP":"De minimis составляет 10000JPY (65 USD) для всех заказов, отправленных в Японию. Заказы свыше этой суммы могут быть обложены сборами.","countryMsgKR":"De minimis составляет 180000KRW (150 USD) для всех заказов, отправленных в Южную Корею. Заказы свыше этой суммы могут быть обложены сборами.","countryMsgVN":"Для Вьетнама, пожалуйста, оставайтесь НА СВЯЗИ во время доставки, так как с вас могут взиматься сборы за обработку при доставке. De minimis составляет 1000000 (35 USD) для всех заказов, отправленных во Вьетнам. Заказы свыше этой суммы могут быть обложены сборами. Поскольку Vietnam Post НЕ доставляет в почтовый ящик по стандарту, вам МОЖЕТ потребоваться быть дома или уполномоченный представитель для получения вашей посылки или получения на почте.","countryMsgPP":"Элементы Tracked Label будут отправлены через POPDrop/POPStop на почте. Элементы SpeedPost Standard обычно отправляются через POPStop или POPStation. Обратите внимание, что доставка элементов Tracked Label осуществляется ТОЛЬКО с понедельника по пятницу с 9:00 до 18:00. За исключением выходных и праздничных дней.","postedDate":"Дата отправки:","status":"Статус:","shippedVia":"Отправлено через:","destination":"Назначение:","statusInPreparation":"В подготовке","statusInTransit":"В пути","statusDelivered":"Доставлено","statusOutForDelivery":"Выехало на доставку","statusArrived":"Прибыло","statusProcessing":"Обрабатывается","statusDispatched":"Отправлено","statusReturned":"Возвращено","statusFailed":"Доставка не удалась","statusCancelled":"Отменено","statusHeldByCustoms":"Задержано таможней","statusAwaitingCollection":"Ожидает получения","aka":"также известный как","thisServiceKnownAs":"Эта услуга известна как","in":"в","viewTrackingDHL":"Просмотреть информацию об отслеживании DHL Express","viewTrackingSingPostSpeedPost":"Просмотреть информацию об отслеживании Singapore SpeedPost","viewTrackingDHLLastMile":"Просмотреть информацию об отслеживании DHL Express (Последняя миля)","viewTrackingDHLShipperRef":"Просмотреть информацию об отслеживании DHL Express (Ссылка отправителя)","viewTrackingSingPost":"Просмотреть информацию об отслеживании Singapore Post","viewTrackingDestPost":"Просмотреть информацию об отслеживании","post":"Почта","orderNumberExample":"Номер заказа (начинается с RTNX - пример: RTNX1234567890):","deliveryRecordNote":"Обратите внимание, что после доставки товара запись будет храниться только до 7 дней, а затем будет удалена.","accessRestricted":"Доступ ограничен","vpnDetectedMessage":"Обнаружено использование VPN. Пожалуйста, отключите VPN, чтобы воспользоваться этой услугой.","contactSupportError":"Если вы считаете, что это ошибка, обратитесь в службу поддержки.","destinationNotAllowed":"Доступ к этой стране назначения недоступен из вашего местоположения. Пожалуйста, выберите другое назначение.","epacUS":"Международная посылочная служба первого класса","epacCH":"Приоритет Плюс","epacGB":"Международный гусеничный","epacMY":"Международный отслеживаемый/экспресс","epacCA":"Международный входящий экспресс","epacAU":"Упаковка и отслеживание по всему миру","epacNZ":"Международное экономическое отслеживание","epacDE":"Warenpost International Премиум","epacFR":"Международное письмо с отслеживанием","epacNL":"Международное отслеживание пакетов","epacPL":"ГЛОБАЛЬНЫЕ Экспрессы","epacBE":"Международный Прайм Входящий","epacAT":"Международная отслеживаемая посылка","epacIN":"Международная отслеживаемая посылка","epacFI":"Международное отслеживаемое письмо","epacSE":"Международное отслеживаемое письмо","epacNO":"ПРАЙМ Экспресс","epacIT":"Выражать","epacIL":"Выражать","epacES":"Международная легкая посылка","epacPT":"Международная синяя почта","epacCZ":"Отслеживаемое отправление из-за рубежа","epacBN":"Международный ePacket","epacCN":"Международный ePacket","epacHK":"Международный ePacket","epacID":"Международный e-пакет","epacMO":"Международный ePacket","epacPH":"Международная отслеживаемая почта","epacTW":"Международный ePacket","epacTH":"Международный ePacket","epacVN":"Международный E-пакет (пакет ASEAN)","epacKR":"К-пакет","epacJP":"Международный e-пакет Light","epacIE":"Международная экспресс-почта","dhlNoEmbed":"DHL Express не поддерживает отслеживание через встраивание. Пожалуйста","speedPostNoEmbed":"SpeedPost Сингапур не поддерживает отслеживание через встраивание. Пожалуйста","operatorNoEmbed":"не поддерживает отслеживание через встраивание. Пожалуйста","clickHere":"нажмите здесь","toTrackNewTab":"чтобы отследить (откроется в новой вкладке).","optionSingPost":"🇸🇬 SingPost (СПНДД/ПП)","countryAF":"🇦🇫 Афганистан","countryAX":"🇦🇽 Аландские о-ва","countryAL":"🇦🇱 Албания","countryDZ":"🇩🇿 Алжир","countryAS":"🇦🇸 Амер. Самоа","countryAD":"🇦🇩 Андорра","countryAO":"🇦🇴 Ангола","countryAI":"🇦🇮 Ангилья","countryAQ":"🇦🇶 Антарктида","countryAG":"🇦🇬 Антигуа и Барбуда","countryAR":"🇦🇷 Аргентина","countryAM":"🇦🇲 Армения","countryAW":"🇦🇼 Аруба","countryAU":"🇦🇺 Австралия","countryAT":"🇦🇹 Австрия","countryAZ":"🇦🇿 Азербайджан","countryBS":"🇧🇸 Багамы","countryBH":"🇧🇭 Бахрейн","countryBD":"🇧🇩 Бангладеш","countryBB":"🇧🇧 Барбадос","countryBY":"🇧🇾 Беларусь","countryBE":"🇧🇪 Бельгия","countryBZ":"🇧🇿 Белиз","countryBJ":"🇧🇯 Бенин","countryBM":"🇧🇲 Бермуды","countryBT":"🇧🇹 Бутан","countryBO":"🇧🇴 Боливия","countryBA":"🇧🇦 Босния и Герцеговина","countryBW":"🇧🇼 Ботсвана","countryBV":"🇧🇻 Остров Буве","countryBR":"🇧🇷 Бразилия","countryIO":"🇮🇴 Брит. терр. в Индийском океане","countryBN":"🇧🇳 Бруней","countryBG":"🇧🇬 Болгария","countryBF":"🇧🇫 Буркина-Фасо","countryBI":"🇧🇮 Бурунди","countryKH":"🇰🇭 Камбоджа","countryCM":"🇨🇲 Камерун","countryCA":"🇨🇦 Канада","countryCV":"🇨🇻 Кабо-Верде","countryKY":"🇰🇾 Каймановы о-ва","countryCF":"🇨🇫 ЦАР","countryTD":"🇹🇩 Чад","countryCL":"🇨🇱 Чили","countryCN":"🇨🇳 Китай","countryCX":"🇨🇽 Остров Рождества","countryCC":"🇨🇨 Кокосовые (Килинг) о-ва","countryCO":"🇨🇴 Колумбия","countryKM":"🇰🇲 Коморы","countryCG":"🇨🇬 Конго","countryCD":"🇨🇩 ДР Конго","countryCK":"🇨🇰 Острова Кука","countryCR":"🇨🇷 Коста-Рика","countryCI":"🇨🇮 Кот-д'Ивуар","countryHR":"🇭🇷 Хорватия","countryCU":"🇨🇺 Куба","countryCY":"🇨🇾 Кипр","countryCZ":"🇨🇿 Чехия","countryDK":"🇩🇰 Дания","countryDJ":"🇩🇯 Джибути","countryDM":"🇩🇲 Доминика","countryDO":"🇩🇴 Доминиканская Республика","countryEC":"🇪🇨 Эквадор","countryEG":"🇪🇬 Египет","countrySV":"🇸🇻 Сальвадор","countryGQ":"🇬🇶 Экваториальная Гвинея","countryER":"🇪🇷 Эритрея","countryEE":"🇪🇪 Эстония","countryET":"🇪🇹 Эфиопия","countryFK":"🇫🇰 Фолклендские о-ва","countryFO":"🇫🇴 Фарерские о-ва","countryFJ":"🇫🇯 Фиджи","countryFI":"🇫🇮 Финляндия","countryFR":"🇫🇷 Франция","countryGF":"🇬🇫 Гвиана","countryPF":"🇵🇫 Французская Полинезия","countryTF":"🇹🇫 Французские Южные территории","countryGA":"🇬🇦 Габон","countryGM":"🇬🇲 Гамбия","countryGE":"🇬🇪 Грузия","countryDE":"🇩🇪 Германия","countryGH":"🇬🇭 Гана","countryGI":"🇬🇮 Гибралтар","countryGR":"🇬🇷 Греция","countryGL":"🇬🇱 Гренландия","countryGD":"🇬🇩 Гренада","countryGP":"🇬🇵 Гваделупа","countryGU":"🇬🇺 Гуам","countryGT":"🇬🇹 Гватемала","countryGG":"🇬🇬 Гернси","countryGN":"🇬🇳 Гвинея","countryGW":"🇬🇼 Гвинея-Бисау","countryGY":"🇬🇾 Гайана","countryHT":"🇭🇹 Гаити","countryHM":"🇭🇲 Остров Херд и острова Макдональд","countryVA":"🇻🇦 Ватикан","countryHN":"🇭🇳 Гондурас","countryHK":"🇭🇰 Гонконг","countryHU":"🇭🇺 Венгрия","countryIS":"🇮🇸 Исландия","countryIN":"🇮🇳 Индия","countryID":"🇮🇩 Индонезия","countryIR":"🇮🇷 Иран","countryIQ":"🇮🇶 Ирак","countryIE":"🇮🇪 Ирландия","countryIM":"🇮🇲 Остров Мэн","countryIL":"🇮🇱 Израиль","countryIT":"🇮🇹 Италия","countryJM":"🇯🇲 Ямайка","countryJP":"🇯🇵 Япония","countryJE":"🇯🇪 Джерси","countryJO":"🇯🇴 Иордания","countryKZ":"🇰🇿 Казахстан","countryKE":"🇰🇪 Кения","countryKI":"🇰🇮 Кирибати","countryKP":"🇰🇵 КНДР","countryKR":"🇰🇷 Южная Корея","countryKW":"🇰🇼 Кувейт","countryKG":"🇰🇬 Кыргызстан","countryLA":"🇱🇦 Лаос","countryLV":"🇱🇻 Латвия","countryLB":"🇱🇧 Ливан","countryLS":"🇱🇸 Лесото","countryLR":"🇱🇷 Либерия","countryLY":"🇱🇾 Ливия","countryLI":"🇱🇮 Лихтенштейн","countryLT":"🇱🇹 Литва","countryLU":"🇱🇺 Люксембург","countryMO":"🇲🇴 Макао","countryMK":"🇲🇰 Северная Македония","countryMG":"🇲🇬 Мадагаскар","countryMW":"🇲🇼 Малави","countryMY":"🇲🇾 Малайзия","countryMV":"🇲🇻 Мальдивы","countryML":"🇲🇱 Мали","countryMT":"🇲🇹 Мальта","countryMH":"🇲🇭 Маршалловы о-ва","countryMQ":"🇲🇶 Мартиника","countryMR":"🇲🇷 Мавритания","countryMU":"🇲🇺 Маврикий","countryYT":"🇾🇹 Майотта","countryMX":"🇲🇽 Мексика","countryFM":"🇫🇲 Микронезия","countryMD":"🇲🇩 Молдова","countryMC":"🇲🇨 Монако","countryMN":"🇲🇳 Монголия","countryME":"🇲🇪 Черногория","countryMS":"🇲🇸 Монтсеррат","countryMA":"🇲🇦 Марокко","countryMZ":"🇲🇿 Мозамбик","countryMM":"🇲🇲 Мьянма","countryNA":"🇳🇦 Намибия","countryNR":"🇳🇷 Науру","countryNP":"🇳🇵 Непал","countryNL":"🇳🇱 Нидерланды","countryNC":"🇳🇨 Новая Каледония","countryNZ":"🇳🇿 Новая Зеландия","countryNI":"🇳🇮 Никарагуа","countryNE":"🇳🇪 Нигер","countryNG":"🇳🇳 Нигерия","countryNU":"🇳🇺 Ниуэ","countryNF":"🇳🇫 Норфолк","countryMP":"🇲🇵 Северные Марианские о-ва","countryNO":"🇳🇴 Норвегия","countryOM":"🇴🇲 Оман","countryPK":"🇵🇰 Пакистан","countryPW":"🇵🇼 Палау","countryPS":"🇵🇸 Палестина","countryPA":"🇵🇦 Панама","countryPG":"🇵🇬 Папуа — Новая Гвинея","countryPY":"🇵🇾 Парагвай","countryPE":"🇵🇪 Перу","countryPH":"🇵🇭 Филиппины","countryPN":"🇵🇳 Питкэрн","countryPL":"🇵🇱 Польша","countryPT":"🇵🇹 Португалия","countryPR":"🇵🇷 Пуэрто-Рико","countryQA":"🇶🇦 Катар","countryRE":"🇷🇪 Реюньон","countryRO":"🇷🇴 Румыния","countryRU":"🇷🇺 Россия","countryRW":"🇷🇼 Руанда","countryBL":"🇧🇱 Сен-Бартелеми","countrySH":"🇸🇭 Остров Святой Елены","countryKN":"🇰🇳 Сент-Китс и Невис","countryLC":"🇱🇨 Сент-Люсия","countryMF":"🇲🇫 Сен-Мартен","countryPM":"🇵🇲 Сен-Пьер и Микелон","countryVC":"🇻🇨 Сент-Винсент и Гренадины","countryWS":"🇼🇸 Самоа","countrySM":"🇸🇲 Сан-Марино","countryST":"🇸🇹 Сан-Томе и Принсипи","countrySA":"🇸🇦 Саудовская Аравия","countrySN":"🇸🇳 Сенегал","countryRS":"🇷🇸 Сербия","countrySC":"🇸🇨 Сейшелы","countrySL":"🇸🇱 Сьерра-Леоне","countrySG":"🇸🇬 Сингапур","countrySK":"🇸🇰 Словакия","countrySI":"🇸🇮 Словения","countrySB":"🇸🇧 Соломоновы о-ва","countrySO":"🇸🇴 Сомали","countryZA":"🇿🇦 ЮАР","countryGS":"🇬🇸 Южная Георгия и Южные Сандвичевы о-ва","countryES":"🇪🇸 Испания","countryLK":"🇱🇰 Шри-Ланка","countrySD":"🇸🇩 Судан","countrySR":"🇸🇷 Суринам","countrySJ":"🇸🇯 Шпицберген и Ян-Майен","countrySZ":"🇸🇿 Эсватини","countrySE":"🇸🇪 Швеция","countryCH":"🇨Ｈ Швейцария","countrySY":"🇸🇾 Сирия","countryTW":"🇹🇼 Тайвань","countryTJ":"🇹🇯 Таджикистан","countryTZ":"🇹🇿 Танзания","countryTH":"🇹🇭 Таиланд","countryTL":"🇹🇱 Тимор-Лешти","countryTG":"🇹🇬 Того","countryTK":"🇹🇰 Токелау","countryTO":"🇹🇴 Тонга","countryTT":"🇹🇹 Тринидад и Тобаго","countryTN":"🇹🇳 Тунис","countryTR":"🇹🇷 Турция","countryTM":"🇹🇲 Туркменистан","countryTC":"🇹🇨 Теркс и Кайкос","countryTV":"🇹🇻 Тувалу","countryUG":"🇺🇬 Уганда","countryUA":"🇺🇦 Украина","countryAE":"🇦🇪 ОАЭ","countryGB":"🇬🇧 Великобритания","countryUS":"🇺🇸 США","countryUM":"🇺🇲 Внешние малые о-ва США","countryUY":"🇺🇾 Уругвай","countryUZ":"🇺🇿 Узбекистан","countryVU":"🇻🇺 Вануату","countryVE":"🇻🇪 Венесуэла","countryVN":"🇻🇳 Вьетнам","countryVG":"🇻🇬 Виргинские о-ва (Великобритания)","countryVI":"🇻🇮 Виргинские о-ва (США)","countryWF":"🇼🇫 Уоллис и Футуна","countryEH":"🇪🇭 Западная Сахара","countryYE":"🇾🇪 Йемен","countryZM":"🇿🇲 Замбия","countryZW":"🇿🇼 Зимбабве","russiaServiceSuspended":"⚠️ ВАЖНОЕ УВЕДОМЛЕНИЕ: В связи с российским вторжением в Украину в 2022 году, SingPost приостановила все отправления в Россию вместе с DHL. В настоящее время мы не обслуживаем Россию до объявления о возобновлении услуг в страну.","hariRayaMessage":"🌙Селамат Хари Рая Айдильфитри! Желаю Вам и Вашей семье мира, радости и добра! 🌟","deepavaliMessage":"🪔Счастливого Дипавали! Пусть праздник огней принесет вам радость, благополучие и успех! ✨","diwaliMessage":"🪔Счастливого Дивали! Пусть праздник огней принесет вам радость, благополучие и успех! ✨","vesakMessage":"☸️С Днем Весак! Желаю вам мира, мудрости и просветления в этот священный день! 🙏","vesakTHMessage":"☸️С Днём Висакха Бучи! Желаю вам мира, мудрости и просветления в этот священный день! 🙏","australiaNationalDayMessage":"🇦🇺 С Днем Австралии! Праздник нашей нации! 🎉","canadaNationalDayMessage":"🇨🇦С Днём Канады! Праздник нашей великой нации! 🍁","usaNationalDayMessage":"🇺🇸 С Днем независимости, Америка! Праздник свободы и свободы! 🎆","franceBastilleDayMessage":"🇫🇷Жуайе 14 Июля! Да здравствует Франция! 🎊","germanyUnityDayMessage":"🇩🇪 С Днем немецкого единства! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 С Днем основания, Япония! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 С Национальным праздником, Китай! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 С Днем освобождения, Корея! Вот это да! 🎊","indiaIndependenceDayMessage":"🇮🇳 С Днем независимости, Индия! Джай Хинд! 🇮🇳","thailandNationalDayMessage":"🇹🇭 С Национальным праздником, Таиланд! Отлично! 🎉","philippinesIndependenceDayMessage":"🇵🇭 С Днем независимости, Филиппины! Мабухай! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 С Национальным праздником, Вьетнам! Куок хан Вьетнам! 🎊","polandNationalDayMessage":"🇵🇱 С Днем Независимости, Польша! Свето Неподлеглосци! 🎉","czechNationalDayMessage":"🇨🇿 С Днем Независимости, Чехия! День независимости! 🎊","netherlandsKingsDayMessage":"🇳🇱Фейне Конингсдаг! Да здравствует король! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Рад Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvaä itsenäisyyspäivää, Суоми! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Фелис Диа де Португалия! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! С Днем независимости, Израиль! 🎉","irelandNationalDayMessage":"🇮🇪 С Днем Святого Патрика, Ирландия! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Селамат Хари Кебангсаан Бруней! 🎊","newZealandWaitangiDayMessage":"🇳🇿 С Днем Вайтанги, Новая Зеландия! 🎉","switzerlandNationalDayMessage":"🇨🇭 С Национальным днём Швейцарии! Национальный праздник Швейцарии! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Австрия! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Бельгия! Национальный праздник Фейне! 🎊","australianDSTTitle":"В Австралии действует летнее время","australianDSTBothMessage":"В настоящее время действуют как AEDT (восточное австралийское летнее время), так и ACDT (центральное австралийское летнее время).","australianAEDTMessage":"AEDT (Австралийское восточное летнее время) в настоящее время действует в Сиднее, Мельбурне и прилегающих районах.","australianACDTMessage":"ACDT (центральное летнее время Австралии) в настоящее время действует в Аделаиде и Южной Австралии.","australianDSTNote":"Время доставки, указанное выше, соответствует текущему летнему времени.","statusHeldByCustms":"Удерживается таможней","blogSingPostEPACContent1":"SingPost ePAC (ePacket) — это экономичная отслеживаемая почтовая служба для легких международных отправлений электронной коммерции.","blogSingPostEPACContent2":"Он доставляется национальным почтовым оператором страны назначения и обычно используется для посылок весом менее 2 кг, в пределах длины + ширины + высоты менее 90 см и длины не более 60 см.","blogSingPostEPACContent3":"Первоначально этот вариант предлагался только Почтой Гонконга совместно с eBay China, позволяя посылкам из Китая и Гонконга отправлять небольшие посылки в США с отслеживанием доставки без необходимости подписи при доставке. Эта услуга известна как Международная служба посылок первого класса USPS (Почтовая служба США) в пределах США.","blogSingPostEPACContent4":"С 1 января 2026 года ePAC теперь используется во всех странах в целях соблюдения обязательных правил ВПС, требующих, чтобы отслеживание посылок и заказных отправлений было ограничено только для документов.","blogSingPostEPACContent5":"Префиксы отслеживания: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS — это международная почтовая экспресс-служба премиум-класса, пользующаяся приоритетом почтовых операторов по всему миру.","blogSpeedPostEMSContent2":"Таможенное оформление, как правило, происходит быстрее, чем стандартное почтовое отправление, но более строгое по процессу и с полным отслеживанием до момента доставки.","blogSpeedPostEMSContent3":"В Сингапуре это известно компанией SingPost как SpeedPost Priority International.","blogSpeedPostEMSContent4":"Префикс отслеживания: EZ123456789SG.","blogSpeedPostExpressContent1":"SpeedPost Express — это курьерская служба.","blogSpeedPostExpressContent2":"Во многих пунктах назначения DHL Express осуществляет доставку последней мили и взимает пошлины или налоги перед отправкой.","blogSpeedPostExpressContent3":"Префикс отслеживания: PX123456789SG (DHL Express на последней миле использует 10-значный номер отслеживания, который не виден публике, но у нас есть информация об этом через нашу","blogSpeedPostExpressContent3Link":"Система отслеживания.","blogUSPDDPContent1":"PDDP позволяет предварительно оплатить импортные пошлины и налоги США перед доставкой, что снижает неожиданные расходы для получателей.","blogUSPDDPContent2":"Новые правила (вступают в силу 29 августа 2025 г.)","blogUSPDDPContent2List1":"Обязательные коды HTS","blogUSPDDPContent2List2":"Точные описания предметов","blogUSPDDPContent2List3":"Более строгое соблюдение тарифов","blogUSPDDPContent3":"За все товары, отправленные в США, с получателя не взимаются никакие дополнительные пошлины, поскольку мы платим от вашего имени. Однако обратите внимание, что цена товара по умолчанию представляет собой импортную пошлину в размере 10 %, установленную в соответствии с правилами.","blogUSPDDPContent4":"Это применимо только к нашим методам доставки для США, SpeedPost Priority International (EMS) и SingPost ePAC.","blogEUIOSSContent1":"ЕС применяет НДС ко всему коммерческому импорту независимо от его стоимости.","blogEUIOSSContent2":"IOSS (единое окно импорта)","blogEUIOSSContent3":"IOSS позволяет продавцам взимать НДС ЕС при оформлении заказа для партий стоимостью до 150 евро.","blogEUIOSSContent4":"Затем НДС перечисляется через систему IOSS, что позволяет ускорить таможенное оформление и не взимать НДС при доставке.","blogEUIOSSContent5":"Для всех заказов через Etsy или eBay НДС IOSS уже взимается при оформлении заказа, и мы укажем его в налоговом ссылочном номере для передачи данных в почтовую службу назначения через EDI (электронная обработка данных).","blogUKVATContent1":"Великобритания требует учета НДС на импортируемые товары.","blogUKVATContent2":"Для партий малой стоимости НДС обычно взимается при оформлении заказа и переводится продавцом или торговой площадкой непосредственно в HMRC.","blogUKVATContent3":"Для отправлений более высокой стоимости НДС может взиматься перевозчиком перед доставкой.","blogUKVATContent4":"Для всех заказов через Etsy или eBay НДС уже взимается при оформлении заказа, и мы укажем его в налоговом ссылочном номере для передачи данных в почтовую службу назначения через EDI (электронная обработка данных).","blogNorwayVOECContent1":"Норвегия ввела систему VOEC (НДС на электронную торговлю) для товаров, импортируемых из-за пределов ЕС/ЕЭЗ. Это касается товаров стоимостью до 3000 норвежских крон.","blogNorwayVOECContent2":"Продавцы могут зарегистрироваться в схеме VOEC для взимания норвежского НДС при оформлении заказа, что позволяет ускорить таможенное оформление и не взимать НДС при доставке.","blogNorwayVOECContent3":"Для всех заказов через Etsy или eBay НДС VOEC уже взимается при оформлении заказа. В документах для отслеживания и таможенных документов указывается налоговый номер для передачи данных в норвежскую почтовую службу.","blogSwissVATContent1":"Швейцария взимает НДС с импортируемых товаров независимо от их стоимости. Федеральное таможенное управление Швейцарии требует от иностранных продавцов взимать НДС при оформлении заказа на товары стоимостью до 65 швейцарских франков.","blogSwissVATContent2":"Продавцы, зарегистрированные в швейцарской системе НДС, перечисляют собранный НДС напрямую, гарантируя, что получателю не придется платить дополнительный НДС при доставке.","postalContactsTitle":"Контакты почтовых служб","postalContactsNote":"Примечание:","postalContactsPolandUKNote":"Для Польши и Великобритании все отправления через SpeedPost Priority (EMS) будут обрабатываться Pocztex и Parcelforce.","postalContactsDHLNote":"Для отправлений SpeedPost Express, пожалуйста, свяжитесь с DHL по этой ссылке:","postalContactsCountry":"Страна","postalContactsWebsite":"Веб-сайт","postalContactsForm":"Контактная форма","postalContactsPhone":"Контактный номер","postalContactsEmail":"Контактный email","postalContactsFormLink":"Контактная форма","postalContactsBackButton":"Вернуться к форме запроса о посылке","blogSwissVATContent3":"Для всех заказов через Etsy или eBay швейцарский НДС уже взимается во время оформления заказа, а таможенные документы включают налоговый справочный номер для подачи EDI.","contactUsTitle":"Связаться с нами","contactNameLabel":"Имя (никнеймы или номера телефонов запрещены)","contactEmailLabel":"Адрес электронной почты (мы ответим вам сюда)","contactEmailNote":"Приватные релейные электронные письма (например, @privaterelay.appleid.com) не принимаются. Используйте действительный адрес электронной почты.","contactEnquiryTypeLabel":"О чем это?","contactSelectOption":"Выберите вариант","contactGeneralEnquiry":"Общий запрос / Отзыв","contactBusinessEnquiry":"Деловой запрос","contactOrderShippingEnquiry":"Запрос о заказе/доставке","contactExchangeRefundEnquiry":"Запрос об обмене/возврате денег/возврате товара","contactOthers":"Другое","contactParcelWarning":"Если ваша посылка не доставлена более 18/30/45 дней (FedEx 14 дней), или показывает статус доставлено, но вы её не получили, пожалуйста, заполните","contactParcelWarningLink":"эту форму","contactParcelWarningEnd":"вместо этого.","contactOrderNumberLabel":"Номер заказа","contactOrderNumberPlaceholder":"Пример: RTNX1234567890","contactPlatformNote":"Номера заказов Etsy, eBay и Shopee здесь. Мы НЕ имеем НИКАКОГО контроля над возвратами денег с этих платформ. Пожалуйста, свяжитесь с их службой поддержки клиентов.","contactPlatformInstructions":"Пожалуйста, используйте приложение, чтобы посмотреть номер вашего заказа, так как он сохранен в приложении:","contactPlatformEtsy":"Etsy - Правый верхний угол вашего профиля → Покупки","contactPlatformEbay":"eBay - Мой eBay → Покупки","contactPlatformShopee":"Shopee - Я → Просмотреть историю покупок (или вы можете нажать К отправке/К получению)","contactRefundNote1":"Если вы запрашиваете возврат/возврат денег для платформ, с которых вы купили, обратите внимание, что мы НЕ имеем НИКАКОГО контроля над возвратами денег с этих платформ. Пожалуйста, свяжитесь с их службой поддержки клиентов.","contactRefundNote2":"Для возвратов или обменов мы не разрешаем перчатки maimai, если они уже были использованы при открытии (видимые пятна или стирка в стиральной машине/ручная стирка), и не разрешаем возврат или обмен развлекательных карт. Спасибо.","contactRefundNote3":"Обратите внимание, что для возвратов денег через Payhip, если вы не получили возврат денег, свяжитесь с вашим банком или поддержкой Payhip по адресу support@payhip.com, так как мы не контролируем этот процесс.","contactMessageLabel":"Ваше сообщение (до 1000 символов)","contactCharacterCount":"символов","contactSpamWarningNote":"Примечание:","contactSpamWarning":"Нежелательные предложения SEO, дизайна веб-сайтов, кредитов или подобных услуг будут автоматически отклонены.","contactAgreementText1":"Пожалуйста, нажмите \"Я согласен\", если вы согласны, чтобы Rhythm Nexus использовал ваш адрес электронной почты для ответа вам, так как это требуется нам для прочтения вашего ответа и ответа вам, как только мы найдем решение для вашего запроса.","contactAgreementText2":"Обратите внимание, что наш ответ займет 3-5 рабочих дней или дольше при большом объеме электронных писем с нашей стороны.","contactAgreeCheckbox":"Я согласен","contactSuccessMessage":"Ваше сообщение успешно отправлено! Мы ответим в течение 3-5 рабочих дней.","contactErrorMessage":"Не удалось отправить сообщение. Попробуйте еще раз.","contactGeneralError":"Произошла ошибка. Пожалуйста, повторите попытку позже.","contactSubmitting":"Отправка...","contactSubmit":"Отправить","contactAlertAgree":"Пожалуйста, согласитесь с условиями, чтобы отправить форму.","parcelEnquiryTitle":"Запрос о посылке","parcelInfoText":"Эта форма для посылок, которые не доставлены более 18/30/45 дней (14 дней для FedEx/DHL), или показывают статус доставлено, но не с вами.","parcelInfoLink":"Нажмите здесь","parcelInfoEnd":"для других запросов.","parcelWaitTitle":"Пожалуйста, подождите вашу посылку","parcelWaitText1":"Пожалуйста, дождитесь доставки вашей посылки. Обратите внимание, что международные доставки НЕ такие же, как местные доставки, так как им требуется время. Спасибо!","parcelWaitText2":"Если после 18 дней (7 дней для Сингапура) или дольше не появляется статус, вы можете сообщить нам напрямую.","parcelCannotSubmit":"Вы не можете отправить эту форму, если выбрали \"Нет\".","parcelNameLabel":"Имя","parcelOrderNumberLabel":"Номер заказа (Пример: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Адрес электронной почты (Мы ответим вам здесь)","parcelEmailNote":"Приватные релейные электронные письма не принимаются. Используйте действительный адрес электронной почты.","parcelShippingMethodLabel":"Выбранный метод доставки?","parcelSelectShipping":"Выберите метод доставки","parcelSingPostEpac":"SingPost ePacket (или ePAC) - также известен как SpeedPost Saver International (Отслеживание: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Отслеживание: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Отслеживание: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Отслеживание: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Отслеживание: PX123456789SG)","parcelDHL":"DHL Express (Только страны ЕС) (Отслеживание: 1234567890)","parcelTrackingNumberLabel":"Номер отслеживания вашей посылки?","parcelUndeliveredLabel":"Ваша посылка не доставлена более 18/30/45 дней? (Местные услуги Сингапур >7 дней, >14 дней для SpeedPost Express/DHL)","parcelSelectOption":"Выберите вариант","parcelYes":"Да","parcelNo":"Нет","parcelDeliveredButMissingLabel":"Ваша посылка показывает статус доставлено, но её нет в вашем почтовом ящике/безопасном месте/у дверей?","parcelCaseReferenceLabel":"ID ссылки на дело от местного почтового отделения","parcelCaseReferencePlaceholder":"Введите NA, если вы из Сингапура","parcelCaseReferenceNote":"Перед отправкой этой формы, пожалуйста, свяжитесь с вашим местным почтовым отделением по телефону или электронной почте и получите от них ID ссылки на дело. Затем введите ваш ID ссылки на дело здесь.","parcelCaseReferenceLink":"См. эту ссылку для контактов почтовой службы","parcelCaseReferenceMandatory":"ВВЕДИТЕ NA ТОЛЬКО ЕСЛИ ВЫ ИЗ СИНГАПУРА. Для других стран это ОБЯЗАТЕЛЬНО предоставить. Требуется также для SpeedPost Express, для ID дела DHL.","parcelImageEvidenceLabel":"Фотодоказательство (для доставленных, но пропавших посылок)","parcelImageWarning":"Для дополнительной проверки нам нужно фотодоказательство, чтобы доказать, что вы не делаете ложные заявления о недоставке посылки. (Только для посылок, которые уже доставлены, но их нет в почтовом ящике/за дверью. Мы можем отклонить ваше заявление, если не предоставлено фотодоказательство для доставленных предметов. Проигнорируйте это, если ваш предмет НЕ показывает статус доставлено.)","parcelImageNote":"Загрузите 1 поддерживаемый файл: изображение. Макс. 1 ГБ.","parcelAgreementText":"Пожалуйста, нажмите \"Я согласен\", если вы уверены, что то, что случилось с вашей посылкой, правда.","parcelAgreeCheckbox":"Я согласен","parcelSuccessMessage":"Ваш запрос о посылке успешно отправлен! Мы ответим в течение 3-5 рабочих дней.","parcelErrorMessage":"Не удалось отправить запрос. Попробуйте еще раз.","parcelGeneralError":"Произошла ошибка. Пожалуйста, повторите попытку позже.","parcelAlertWait":"Пожалуйста, дождитесь доставки вашей посылки. Вы можете отправить эту форму после указанного периода ожидания.","parcelAlertAgree":"Пожалуйста, согласитесь с условиями, чтобы отправить форму.","parcelAlertCaseReference":"Пожалуйста, предоставьте ID ссылки на дело от вашего местного почтового отделения или введите NA, если вы из Сингапура.","parcelSubmitting":"Отправка...","parcelSubmit":"Отправить","lookalikeDomainWarning":"Это не номер отслеживания, а ссылка на сайт, который выдаёт себя за службу доставки. Не вводите там личные и платёжные данные.","lookalikeDomainOfficial":"Официальный сайт:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus anvander premium kommersiella natverk. Men i samma ogonblick forsandelsen anlnder till ditt land overfors ansvaret till den lokala inrikestransportoren (t.ex. USPS, Royal Mail, DHL lokalt). Sparningsprefix byter hanteringssystem vid denna troskel, men var universella paketsprare sammanfogar dessa statusar sa att du far oavbruten insyn.","trackingLastMileTitle":"Natverk for sista milen-leverans","trackingCustomsClearanceBody":"Alla gransoverskridande forsandelser maste tullklareras av ditt lands tullmyndighet. Vart verktyg overvakar overganger fran ankomst till importanlaggning till overlamning till tullen. Gransmyndigheter verifierar HS-koder och sakerstaller att korrekt moms eller tullavgifter har betalats (t.ex. IOSS i EU, VOEC i Norge). Hall sarskilt koll pa sparningen for varningar om \"Held at Customs\".","trackingCustomsClearanceTitle":"Information om tullklarering","trackingProcessingOriginBody":"Efter inlamning gar varan in i ursprungscentret dar den skannas, vags och genomgar primara exportsakerhetskontroller. Darefter skickas den vidare till internationell postutvaxling. Flygscheman beror pa tillganglig fraktkapacitet. Bli inte orolig om den ligger kvar i detta lage i flera dagar.","trackingProcessingOriginTitle":"Bearbetning vid ursprungshubb","trackingInfoReceivedBody":"Nar en order forst behandlas pa vara e-handelsplattformar (som Etsy, eBay eller direktforsaljning) genereras sparningsnumret elektroniskt. Transportoren far forsandelsedata innan den fysiskt tar emot paketet. Rakna med 1 till 3 arbetsdagar innan paketet registreras i den fysiska sorteringsanlaggningen.","trackingInfoReceivedTitle":"Information mottagen","trackingStatusesIntro":"Tack for att du anvander vart enhetliga verktyg for internationell paketsparning. Eftersom ditt paket passerar flera internationella granser kan sparningsstatusarna vara komplexa. Att forsta logistikens livscykel hjalper dig att satta tydliga forvantningar.","trackingStatusesTitle":"Forsta sparningsstatusar","footerDesc":"Din framsta destination for arkadkort, handskar for rytmspel och specialiserad merch. Njut av global e-handel med somlos internationell paketsparning och tillforlitliga fraktdata.","amText":"fm","pmText":"em","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlanten)","tzEST":"EST (Östlig)","tzCST":"CST (Central)","tzMST":"MST (Klippiga bergen)","tzPST":"PST (Stillahavstid)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Peking","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Kaliningrad oblast (UTC+2)","tzMoscow":"Moskva/Västra Ryssland (UTC+3)","tzSamara":"Samara oblast (UTC+4)","tzUral":"Uralregionen (UTC+5)","tzOmsk":"Omsk oblast (UTC+6)","tzKrasnoyarsk":"Krasnojarsk kraj (UTC+7)","tzIrkutsk":"Irkutsk oblast (UTC+8)","tzSakha":"Sacha Republiken (UTC+9)","tzPrimorsky":"Primorje kraj (UTC+10)","tzMagadan":"Magadan oblast (UTC+11)","tzKamchatka":"Kamtjatka kraj (UTC+12)","dstDayStartsLabel":"Sommartid börjar","dstDayEndsLabel":"Sommartid slutar","dstRevertsLabel":"återgår till normaltid","dstEuropeLabel":"Europa","dstNewZealandLabel":"Nya Zeeland","englishResponseNotice":"Observera: Alla förfrågningar besvaras på engelska. Om du skickar in på ett annat språk kan ditt meddelande översättas till engelska för verifiering.","contactNamePlaceholder":"T.ex: Erik Andersson","systemRequirementsTitle":"Minsta stödda systemversioner","systemRequirements":"Windows: Windows 7 (with ESU updates installed) eller senare\nmacOS: macOS 12 eller senare\nAndroid: Android 13 eller senare\niPhone/iOS: iOS 17 eller senare\nLinux: En för närvarande stödd distribution med aktiva säkerhetsuppdateringar","goodFridayEasterGreeting":"Glad påsk! Fred och glädje på långfredagen och påsken.","christmasGreeting":"God jul och gott nytt år! Fred och glädje från 25 december till 5 januari.","captchaSystemRequirements":"Minsta systemkrav: Windows 7 (with ESU updates installed) eller 11, macOS 10.15+, eller senaste Android/iOS-version.","title":"Verifiera Åtkomst","subtitle":"Vänligen slutför utmaningen nedan för att fortsätta.","selectLanguage":"Välj Språk","selectLanguagePlaceholder":"-- Välj ett språk --","loadingChallenge":"Laddar utmaning...","answerLabel":"Ditt svar:","answerPlaceholder":"Ange ditt svar","continueButton":"Fortsätt","refreshButton":"Ny Utmaning","verifying":"Verifierar...","chooseLanguageFirst":"Vänligen välj ett språk först.","loadFailed":"Kunde inte ladda utmaning. Vänligen försök igen.","expiredChallenge":"Utmaningen har löpt ut. Laddar ny utmaning...","verifyFailed":"Verifieringen misslyckades. Vänligen försök igen.","home":"Hem","blog":"Blogg","aboutUs":"Om Oss","faq":"Vanliga Frågor","contact":"Kontakt","trackPackage":"Spåra Paket","cnyYearOfHorseMessage":"🧧 Gott månyår! Vi önskar dig välstånd och glädje under Hästens år! 🐴","singaporeNationalDayMessage":"🇸🇬 Grattis på nationaldagen, Singapore! Firar 61 år av självständighet! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesien! Dirgahayu Republik Indonesien! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Firar vår nations självständighet! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Tillfällig stängningsinformation","temporaryClosureNoticeBody":"Kära värdefulla kunder,\n\nObservera att Rhythm Nexus kommer att vara tillfälligt stängt från 21 mars 2026 till 26 mars 2026 på grund av ett företagsevenemang.\n\nFör att förbereda stängningen kommer butiken att sättas i semesterläge från och med 20 mars 2026 kl. 3:00 PM (UTC +8). Beställningar som läggs efter denna tid kanske inte behandlas förrän vi återupptar verksamheten.\n\nNormal verksamhet återupptas den 27 mars 2026.\n\nVi ber om ursäkt för eventuella besvär och uppskattar er förståelse och fortsatta support.\n\nTack.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Jag förstår","parcelTracking":"Paketspårning","serviceAnnouncement":"Servicemeddellande","usaWinterStormTitle":"BRÅDSKANDE: Svår vinterstorm - Servicestörning","usaWinterStormSubtitle":"United States Postal Service (USPS) Force Majeure-händelse","usaWinterStormNotice1":"På grund av svår vinterstorm som drabbar New York-området sedan 23 februari 2026:","usaWinterStormNotice2":"Internationell verksamhet på John F. Kennedy International Airport har effektivt stoppats","usaWinterStormNotice3":"Omfattande flygavbokningar och betydande störningar av flygplatstjänster rapporteras","usaWinterStormNotice4":"Dessa förhållanden utgör en force majeure-händelse bortom USPS kontroll","usaWinterStormNotice5":"Servicepåverkan:","usaWinterStormNotice6":"Farlig blandning av tungt snöfall, frusen regn, slask och bitter kyla","usaWinterStormNotice7":"Stora störningar och omfattande strömavbrott rapporteras","usaWinterStormNotice8":"Insamling och leverans av inhemsk och internationell post (brevpost, paketpost och EMS-varor) påverkas","usaWinterStormNotice9":"Påverkade postnummerområden:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS vidtar alla nödvändiga åtgärder för att minimera olägenheter för kunder samtidigt som personalsäkerhet upprätthålls. Vi uppskattar er tålamod och förståelse under denna force majeure-händelse.","usaWinterStormNotice12":"Senast uppdaterad: 25 februari 2026","countryAutoDetected":"Destination förinställd baserat på din plats","countryAutoDetectedFromLink":"Destination förinställd från länk","trackingNumber":"Spårningsnummer","destinationCountry":"Destinationsland","postcode":"Postnummer","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Grattis på Rysslands dag! 🎉","taiwanFoundingDayMessage":"🇹🇼 Grattis på grundläggelsedagen, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Grattis på dubbel tio-dagen, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Grattis på SAR Hong Kongs grundläggalsedag! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Grattis på SAR Macaus grundläggalsedag! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Grattis på den internationella arbetardagen! Firar arbete och arbetares rättigheter! 🎊","laborDayUSCAMessage":"⚒️ Grattis på arbetsdagen! Hedrar arbetarnas bidrag! 🎉","orderNumber":"Ordernummer (Exempel: RTNX1234567890)","fromDate":"Från Datum (KRÄVS)","toDate":"Till Datum (KRÄVS)","trackParcel":"Spåra Paket","selectCourier":"-- Välj Kurir / Land --","singaporeCouriers":"Singapore Kurirer","topCountries":"Topp 5 Länder","otherCountries":"Andra Länder","optionSingPost":"🇸🇬 Singapore Post (SingPost)","countryAU":"🇦🇺 Australien","countryCA":"🇨🇦 Kanada","countryDE":"🇩🇪 Tyskland","countryGB":"🇬🇧 Storbritannien","countryUS":"🇺🇸 USA","countryAT":"🇦🇹 Österrike","countryBE":"🇧🇪 Belgien","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Kina","countryCZ":"🇨🇿 Tjeckien","countryFI":"🇫🇮 Finland","countryFR":"🇫🇷 Frankrike","countryHK":"🇭🇰 Hongkong SAR Kina","countryIN":"🇮🇳 Indien","countryID":"🇮🇩 Indonesien","countryIE":"🇮🇪 Irland","countryIL":"🇮🇱 Israel","countryIT":"🇮🇹 Italien","countryJP":"🇯🇵 Japan","countryMO":"🇲🇴 Macao SAR Kina","countryMY":"🇲🇾 Malaysia","countryNL":"🇳🇱 Nederländerna","countryNZ":"🇳🇿 Nya Zeeland","countryNO":"🇳🇴 Norge","countryPH":"🇵🇭 Filippinerna","countryPL":"🇵🇱 Polen","countryPT":"🇵🇹 Portugal","countryKR":"🇰🇷 Sydkorea","countryES":"🇪🇸 Spanien","countrySE":"🇸🇪 Sverige","countryCH":"🇨🇭 Schweiz","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Thailand","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬 Singapore","epacUS":"Förstklassig internationell paketservice","epacCH":"Prioritet Plus","epacGB":"Internationell spårad","epacMY":"Internationell spårad/Express","epacCA":"Internationell inkommande Express","epacAU":"Packa och spåra internationell","epacNZ":"Internationell ekonomi spårad","epacDE":"Warenpost International Premium","epacFR":"Lettre internationale suivie","epacNL":"Internationellt paket spårat","epacPL":"GLOBAL Expres","epacBE":"Internationell Prime inkommande","epacAT":"Internationellt spårat paket","epacIN":"Internationellt spårat paket","epacFI":"Internationellt spårat brev","epacSE":"Internationellt spårat brev","epacNO":"PRIME Exprès","epacIT":"Uttrycka","epacIL":"Uttrycka","epacES":"Internationellt lätt paket","epacPT":"Internationell blå post","epacCZ":"Spårad försändelse från utlandet","epacBN":"Internationellt ePacket","epacCN":"Internationellt ePacket","epacHK":"Internationellt ePacket","epacID":"Internationellt e-paket","epacMO":"Internationellt ePacket","epacPH":"Internationell spårad post","epacTW":"Internationellt ePacket","epacTH":"Internationellt ePacket","epacVN":"Internationellt E-paket (ASEAN Pack)","epacKR":"K-Paket","epacJP":"Internationellt e-paket Light","epacIE":"Internationell Express post","note":"OBS","disclaimer":"FRISKRIVNINGSKLAUSUL","importantInformation":"Viktig Information:","didNotReceiveEmail":"Om du inte fick ditt bekräftelsemail från Etsy, eBay, Shopee eller Payhip, scrolla ner för att söka efter din beställning via din e-postadress eller telefonnummer som är kopplat till denna beställning.","searchByEmailOrPhone":"Sök efter E-post eller Telefon","searchOrder":"Sök Order","trackingResult":"Spårningsresultat","noOrdersFound":"Inga beställningar hittades.","pleaseEnter":"Ange ett e-postmeddelande, telefonnummer eller ordernummer.","welcomeTitle":"Välkommen till Rhythm Nexus webbplats!","purchaseInfo":"Köp från oss via våra officiella kanaler, eller gå med i vår","purchaseInfoChina":"Köp från oss via våra officiella kanaler.","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram-grupp","forUpdates":"för officiella uppdateringar.","ourStores":"Våra Butiker","etsyStore":"Etsy Butik","ebayStore":"eBay Butik","shopeeStore":"Shopee Butik","payhipStore":"Payhip Butik","internationalShipping":"Internationell Frakt","singaporeLocal":"Singapore Lokal","asiaOnly":"Endast Asien","deliveryInfo":"Leveransinformation","deliveryRates2026":"Leveranspriser 2026","sgDeliveryRates":"Singapore Leveranspriser","speedPostRates":"SpeedPost Express Internationella Priser","aboutTitle":"Om Rhythm Nexus","aboutP1":"Vi startade vår butik 2022 och har sålt på plattformar som Etsy, eBay och Shopee utan problem.","aboutP2":"Med tiden har vi byggt upp ett starkt rykte genom att fokusera på pålitlig uppfyllelse och exakt spårning.","aboutP3":"Vårt mål är att ge kunderna en smidig och pålitlig shoppingupplevelse.","aboutP4":"Tack för att du stödjer Rhythm Nexus.","faqTitle":"Vanliga Frågor","faqQ1":"Vad händer om min vara är defekt? Finns det någon garanti?","faqA1":"Ja! De flesta beställningar kommer med 1 års garanti. Vänligen ange ditt faktura-/ordernummer så att vi kan undersöka saken. Obs: Byten är inte tillåtna om varan matchar beskrivningen även om du har beställt felaktigt.","faqQ2":"Kan jag redigera, uppdatera eller avbryta min beställning?","faqA2":"Ja. För säkerhets skull kan orderändringar behöva hanteras via e-post eller vårt kontaktformulär.","faqQ3":"Måste jag betala tull/importskatt?","faqA3":"Tull och avgifter betalas i allmänhet inte i förskott, förutom DDP till USA. OBS kan tillkomma för EU, Storbritannien, AU/NZ, Norge, Schweiz och kanadensiska provinser som Saskatchewan och Manitoba som redan är betalda som standard. Ingen GST gäller för Singapore. Vi kan inte ge råd om tullavgifter – kontakta din lokala tullmyndighet för mer information.","faqQ4":"När skickas min beställning?","faqA4":"Beställningar skickas vanligtvis inom 1-5 arbetsdagar. Under perioder med hög volym kan det ta 5–7 dagar.","faqQ5":"Jag beställde två gånger av misstag. Vad ska jag göra?","faqA5":"Vi återbetalar endast dubbla fraktavgifter. Båda varorna skickas tillsammans. Återbetalning = (1:a fraktavgiften + 2:a fraktavgiften) – faktisk fraktavgift.","faqQ6":"Hur lång tid tar leveransen?","faqA6":"Bearbetningen tar 1-5 arbetsdagar.\n\nInrikes frakt:\n• SingPost Prepaid Tracked Label: 2-4 dagar\n• SpeedPost Standard: 1-3 dagar\n\nInternationell:\n• SingPost ePAC: 14-30 dagar\n• SpeedPost Priority (EMS): 8-15 dagar\n• SpeedPost Express: 4-8 dagar\n\nFörseningar kan uppstå under högsäsong.","faqQ7":"Min vara returneras till avsändaren. Vad ska jag göra?","faqA7":"En återsändning är tillåten. Avbokning är inte möjlig för ogiltiga adresser, outlösta paket eller obetalda tullavgifter. Kontakta din posttjänst för omleverans, eller skicka ett meddelande till oss för hjälp.","faqQ8":"Min vara har försvunnit / stulet under transport.","faqA8":"Vi tillåter en återsändning. Om den försvinner igen utfärdas en full återbetalning efter kurirens leveransfönster:\n\n• Singapore lokala tjänster: 7 dagar\n• SingPost ePAC & SpeedPost Priority International: 30 dagar\n• SpeedPost Intl Express: 14 dagar","blogTitle":"Frakt & Post Kunskapsbas","blogSubtitle":"Officiella förklaringar om posttjänster, tull, moms och avgifter.","readMore":"Läs Mer","backButton":"Tillbaka","copyrightText":"Alla rättigheter förbehållna.","blogPost1Title":"Vad är SingPost ePAC?","blogPost1Desc":"Lär dig om SingPost ePAC (ePacket), en ekonomisk spårad posttjänst.","blogPost2Title":"Vad är SpeedPost Priority International (EMS)?","blogPost2Desc":"Upptäck EMS, den internationella premium postepresstjänsten.","blogPost3Title":"Vad är SpeedPost Express?","blogPost3Desc":"Utforska SpeedPost Express med DHL Express leverans.","blogPost4Title":"USA PDDP","blogPost4Desc":"Förstå PDDP för USA.","blogPost5Title":"EU Moms & IOSS","blogPost5Desc":"Insikter om EU-moms och IOSS-systemet.","blogPost6Title":"UK Moms & HMRC","blogPost6Desc":"Momskrav för Storbritannien.","blogPost7Title":"Norge VOEC","blogPost7Desc":"Norges VOEC-system.","blogPost8Title":"Schweizisk Moms","blogPost8Desc":"Schweiziska momskrav.","enterDestinationPostcode":"Ange destinationspostnummer","trackingCaseSensitive":"SPÅRNINGSBOKSTÄVER ÄR SKIFTLÄGESKÄNSLIGA OCH MÅSTE VARA MED VERSALER.","usaPostcodeNote":"För länder utan postnummer, t.ex. Hongkong och Macao, ange 999077 (Hongkong) eller 999078 (Macao).","epacDeliveryNote":"Vänligen NOTERA att alla ePAC-varor som skickas till destinationen ska levereras till din brevlåda, dörr, paketskåp eller lämnas på en säker plats!","currentTime":"Aktuell tid","timezoneNote":"Tid visas i 12-timmarsformat","sameTimeAsSingapore":"Samma tid som Singapore","hourAhead":"timme före Singapore","hoursAhead":"timmar före Singapore","hourBehind":"timme efter Singapore","hoursBehind":"timmar efter Singapore","collectAtPostOffice":"Men om ditt land inte har brevlåda tillgänglig som standard måste du hämta den på postkontoret.","countriesNoMailbox":"Länder som är kända för att inte ha leverans till brevlåda/brevlåda tillgänglig: Brunei, Kina, Indien, Israel, Macao SAR Kina, Filippinerna, Polen och Vietnam.","rhythmNexusNotResponsible":"Rhythm Nexus ANSVARAR INTE för hanteringen av leveranserna eftersom det ligger utanför vår kontroll och vi föredrar vänligen att du spårar statusen för din vara.","issuesAfterDelivery":"Eventuella problem med din leverans efter 30/45 dagar (14 dagar för SpeedPost Express) eller status visar levererad men du har inte fått, vänligen kontakta oss","cannotUseEmbed":"Vi kan inte använda inbäddning för spårning eftersom de flesta posttjänsters webbplatser inte stöder det.","clickLinkAbove":"Klicka på länken ovan för att spåra ditt paket.","trackingDetailsNote":"Observera att spårningsdetaljer kanske inte visas i sökresultaten, så det rekommenderas att klistra in spårningsnumret i systemet för att spåra varan.","thirdPartyWebsites":"Du kan också spåra dina paket på dessa tredjepartswebbplatser:","enterEmailOrPhone":"Ange e-post eller telefon","reviewShippingRates":"Granska våra aktuella fraktpriser","here":"här","contactUsForm":"Vänligen kontakta oss via","form":"formulär","forEnquiries":"för alla förfrågningar du har angående din beställning.","anPostNoDirectTracking":"An Post (Irland) stöder inte direkta spårningslänkar eller inbäddad spårning.","anPostPasteManually":"Vänligen kopiera och klistra in ditt spårningsnummer manuellt på An Posts webbplats:","goToAnPost":"Gå till An Post","countryMsgNL":"Om statusen visar 'Held by Customs', vänligen kontakta Nederländernas Tull Informationslinje för hjälp:\n0800 0143 (gratis), måndag-fredag 7-23.\nLördag och söndag 8-16:30.\n\nDet rekommenderas att registrera ett konto hos PostNL för att få omedelbara push-aviseringar för dina paket:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nOm det levereras till en PostNL-punkt eller statusen säger att du ska hämta på postkontoret måste du betala 7 EUR vid disken. Max 4 EUR om det betalas online.","countryMsgDE":"Vi rekommenderar att du laddar ner Post & DHL-appen för att få push-aviseringar om spårningsstatus för dina paket:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH Kundservice Kontakt:\n+49-228-433-3112\nDHL DE Kontakt: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Du måste skicka in en extra importdeklaration till tullen. Annars kan det bli inreseförbud och paketet skickas tillbaka. \nMer information: https://www.posti.fi/en/receiving/customs-clearance \nAndra länkar: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Hanteringsavgift på 4,95 EUR tillkommer.\nLadda ner appen här: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Hanteringsavgift på 8,50 PLN tillkommer. \nDu måste betala detta när du hämtar på postkontoret,\neftersom paketet troligen inte kommer att levereras till din dörr eller brevlåda.","countryMsgPH":"PHLPost anses som ineffektiv och opålitlig i Filippinerna.\nVänligen spåra alltid ditt paket, eftersom statusen 'På väg till leverans'\nibland bara visas mellan 1 och 3 veckor för mindre paket. För större paket är\nhämtning endast tillgänglig på Manila Central Post Office eller närmaste\npostkontor i närheten av dig. Observera att en hanteringsavgift på 112 PHP tillkommer för paket\nav vilket värde som helst som du måste betala. Vid utebliven betalning kommer paketet att skickas tillbaka till oss.\nLeveransen förväntas ta 1-2 månader på grund av PHLPosts långsamma tjänster. \nDu behöver inte betala skatt för varor under 10000 PHP, men du måste göra det om värdet motsvarar eller överstiger detta belopp. \nVi skulle rekommendera SpeedPost Express för en snabbare process nästa gång du beställer från oss. Dock kan avgifterna inte tillkomma eftersom D&T gäller för mottagaren som standard.","countryMsgCA":"De minimis är 20 CAD för alla beställningar till Kanada. Eftersom Singapore är en del av CPTPP-avtalet kan det hända att inga tullavgifter tillkommer, men D&T kan tillkomma om varan överstiger 60 CAD och uppåt eller 100 CAD och uppåt, beroende på varans HS-kod. Alla värden över kommer att debiteras därefter med moms.","countryMsgID":"Du måste betala alla påförda skatter och tullar vid ankomst till Indonesien. Vänligen spåra ditt paket och betala det angivna beloppet till den indonesiska tullen.\nDu måste också skicka in ytterligare tulldokument. Annars kan det bli inreseförbud eller beslag av paketet av landets tull. Vänligen kontrollera fler detaljer här:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Du måste betala alla påförda skatter och tullar vid ankomst till Indien. Vänligen spåra ditt paket och betala det angivna beloppet till den indiska tullen.\nObservera att tullklarering i Indien är strikt och du kan behöva betala tull om värdet på din vara överstiger 1000 INR (15 USD) - beroende på HS-koden, i de flesta fall är det tullfritt, men du kan betala högre tull om varan överstiger 5000 INR (60 USD). \nEftersom India Post INTE levererar till brevlådan som standard MÅSTE du kanske vara hemma eller vara en auktoriserad representant för att ta emot ditt paket eller hämta det på postkontoret.","countryMsgMY":"De minimis är 500 MYR för alla beställningar till Malaysia. Beställningar över detta belopp kan debiteras.","countryMsgUS":"Från 29 augusti 2025 kommer De minimis på 800 USD officiellt att avskaffas och importavgifter ska som standard betalas av avsändaren i ursprungslandet.\nUSA-frakt KRÄVER ett giltigt telefonnummer och e-postadress för att ditt paket ska undvika ytterligare förseningar.","countryMsgIL":"De minimis är 240 ILS (75 USD) för alla försändelser till Israel. Beställningar över detta belopp kan debiteras. \nObservera att Israel Post ibland inte bekräftar slutlig leverans när den har levererats vid beställningar till Israel. \nEftersom Israel Post INTE levererar till brevlådan som standard MÅSTE du kanske vara hemma eller vara en auktoriserad representant för att ta emot ditt paket eller hämta det på postkontoret.","countryMsgGB":"Observera att Royal Mail ibland inte bekräftar slutlig leverans när den har levererats till din brevlåda vid beställningar till Storbritannien.","countryMsgTH":"De minimis är 1500 THB (45 USD) för alla försändelser till Thailand. Beställningar över detta belopp kan debiteras.","countryMsgTW":"De minimis är 2000 TWD (60 USD) för alla försändelser till Taiwan. Beställningar över detta belopp kan debiteras.","countryMsgMO":"Inga D&T tillkommer för försändelser till Macau. Observera dock att Macau Post INTE levererar till brevlådan som standard, du MÅSTE hämta ditt paket på postkontoret.","countryMsgBN":"Inga D&T tillkommer för försändelser till Brunei. Observera dock att Brunei Post INTE levererar till brevlådan som standard, du MÅSTE hämta ditt paket på postkontoret. \nSpårningssystemet för detta land är inte särskilt stabilt och endast begränsad information kan ges, och slutliga leveransresultat ges INTE till ursprunget.","countryMsgJP":"De minimis är 10000 JPY (65 USD) för alla försändelser till Japan. Beställningar över detta belopp kan debiteras.","countryMsgKR":"De minimis är 180000 KRW (150 USD) för alla försändelser till Sydkorea. Beställningar över detta belopp kan debiteras.","countryMsgVN":"För Vietnam, vänligen var TILLGÄNGLIG under leveransen, eftersom du kan debiteras hanteringsavgifter vid leverans av varan. \nDe minimis är 1000000 (35 USD) för alla försändelser till Vietnam. Beställningar över detta belopp kan debiteras. \nEftersom Vietnam Post INTE levererar till brevlådan som standard MÅSTE du kanske vara hemma eller vara en auktoriserad representant för att ta emot ditt paket eller hämta det på postkontoret.","countryMsgPP":"Tracked Label-artiklar placeras i POPDrop/POPStop på postkontoret. SpeedPost Standard-artiklar placeras vanligtvis på POPStop eller POPStation.\nObservera att leverans av Tracked Label-artiklar ENDAST sker måndag-fredag 9-18. Utom helger och helgdagar.","dhlNoEmbed":"DHL Express stödjer inte inbäddad spårning. Vänligen","speedPostNoEmbed":"SpeedPost Singapore stödjer inte inbäddad spårning. Vänligen","operatorNoEmbed":"stödjer inte inbäddad spårning. Vänligen","clickHere":"klicka här","toTrackNewTab":"för att spåra (öppnas i ny flik).","statusInPreparation":"Förbereder","statusInTransit":"På väg","statusDelivered":"Levererat","statusOutForDelivery":"Ute för leverans","statusArrived":"Anlänt","statusProcessing":"Bearbetar","statusDispatched":"Skickat","statusReturned":"Returnerat","statusFailed":"Leverans misslyckades","statusCancelled":"Avbruten","statusHeldByCustoms":"Hålls av tull","statusAwaitingCollection":"Väntar på upphämtning","aka":"även känd som","thisServiceKnownAs":"Denna tjänst är känd som","in":"i","viewTrackingDHL":"Visa spårningsinformation från DHL Express","viewTrackingSingPostSpeedPost":"Visa spårningsinformation från Singapore SpeedPost","viewTrackingDHLLastMile":"Visa spårningsinformation från DHL Express (Sista milen)","viewTrackingDHLShipperRef":"Visa spårningsinformation från DHL Express (Avsändarreferens)","viewTrackingSingPost":"Visa spårningsinformation från Singapore Post","viewTrackingDestPost":"Visa spårningsinformation från","post":"Posta","countryRU":"🇷🇺 Ryssland","russiaServiceSuspended":"⚠️ VIKTIGT MEDDELANDE: Med anledning av den ryska invasionen av Ukraina 2022 har SingPost suspenderat alla försändelser till Ryssland tillsammans med DHL. Vi betjänar för närvarande inte Ryssland tills det finns ett tillkännagivande om återupptande av tjänster till landet.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Jag önskar dig och din familj frid, glädje och välsignelser! 🌟","deepavaliMessage":"🪔 Glad Deepavali! Må ljusets högtid ge dig glädje, välstånd och framgång! ✨","diwaliMessage":"🪔 Glad Diwali! Må ljusets högtid ge dig glädje, välstånd och framgång! ✨","vesakMessage":"☸️ Glad Vesak-dagen! Jag önskar dig frid, visdom och upplysning på denna heliga dag! 🙏","vesakTHMessage":"☸️ Glad Visakha Bucha-dagen! Jag önskar dig frid, visdom och upplysning på denna heliga dag! 🙏","australiaNationalDayMessage":"🇦🇺 Glad Australiens dag! Vi firar vår nation! 🎉","canadaNationalDayMessage":"🇨🇦 Glad Kanadadagen! Vi firar vår stora nation! 🍁","usaNationalDayMessage":"🇺🇸 Grattis på självständighetsdagen, Amerika! Vi firar frihet och frihet! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! Vive la Frankrike! 🎊","germanyUnityDayMessage":"🇩🇪 Glad tysk enhetsdag! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Glad Foundation Day, Japan! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Grattis på nationaldagen, Kina! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Glad befrielsedag, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Grattis på självständighetsdagen, Indien! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Grattis på nationaldagen, Thailand! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Grattis på självständighetsdagen, Filippinerna! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Grattis på nationaldagen, Vietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Grattis på självständighetsdagen, Polen! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Grattis på självständighetsdagen, Tjeckien! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Länge leve kungen! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Glad Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום frihet שמח! Grattis på självständighetsdagen, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Glad St Patrick's Day, Irland! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Glad Waitangi-dag, Nya Zeeland! 🎉","switzerlandNationalDayMessage":"🇨🇭 Glad schweizisk nationaldag! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgien! Fijne Nationale Festdag! 🎊","fillAllFields":"Vänligen fyll i alla obligatoriska fält: spårningsnummer, destinationsland, ordernummer och postnummer.","noOrderMatchingFields":"Ingen beställning hittades som matchar alla fält.","postcodeRequired":"Postnummer krävs för denna destination.","invalidUSZip":"Ogiltigt amerikanskt postnummer. Använd 5 siffror eller ZIP+4.","failedGenerateURL":"Det gick inte att generera spårnings-URL. Kontrollera inmatningen.","trackingValidationSG":"Spårningsnummer för Singapore måste vara: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG eller PX123456789SG. För DHL-försändelser använd 10-siffriga nummer.","invalidSingPostFormat":"Ogiltigt SingPost-spårningsnummerformat.\nGodkända format:\n• PP123456789SG → Förbetald spårad etikett\n• SPNDD00012345 → SpeedPost standardspårning","trackingNumberExample":"till exempel LG123456789SG","australianDSTTitle":"Australisk sommartid aktiv","australianDSTBothMessage":"Både AEDT (Australian Eastern Daylight Time) och ACDT (Australian Central Daylight Time) är för närvarande i kraft.","australianAEDTMessage":"AEDT (Australian Eastern Daylight Time) är för närvarande i kraft för Sydney, Melbourne och omgivande områden.","australianACDTMessage":"ACDT (Australian Central Daylight Time) är för närvarande i kraft för Adelaide och South Australia.","australianDSTNote":"Leveranstider som visas ovan återspeglar aktuell sommartid.","filteredAllowedDestinations":"(filtrerad för dina tillåtna destinationer)","loadingAnnouncements":"Läser in meddelanden...","unableToLoadAnnouncements":"Det går inte att läsa in servicemeddelanden just nu.","viewOnSingPostWebsite":"Visa på SingPosts webbplats →","postedDate":"Postat datum:","status":"Status:","shippedVia":"Skickas via:","destination":"Destination:","statusHeldByCustms":"Innehas av tullen","orderNumberExample":"Ordernummer (börjar med RTNX eller DLTB - exempel: RTNX1234567890):","deliveryRecordNote":"Observera att när varan väl har levererats kommer posten endast att lagras i upp till 7 dagar och kommer att raderas.","copyrightAllRights":"Alla rättigheter reserverade.","accessRestricted":"Åtkomst begränsad","vpnDetectedMessage":"VPN-användning upptäckt. Inaktivera VPN för att komma åt den här tjänsten.","contactSupportError":"Om du tror att detta är ett fel, vänligen kontakta supporten.","destinationNotAllowed":"Åtkomst till det här destinationslandet är inte tillgängligt från din plats. Välj en annan destination.","blogSingPostEPACContent1":"SingPost ePAC (ePacket) är en ekonomisk spårad posttjänst för lätta internationella e-handelsförsändelser.","blogSingPostEPACContent2":"Den levereras av destinationslandets nationella postoperatör och används vanligtvis för paket under 2 kg, inom en dimensionsgräns på längd + bredd + höjd under 90 cm och längd som inte överstiger 60 cm.","blogSingPostEPACContent3":"Det här alternativet erbjöds initialt endast av Hong Kong Post tillsammans med eBay Kina, vilket gjorde det möjligt för paket från Kina och Hong Kong att skicka små paket till USA med leveransspårning utan krav på någon undertecknare vid leverans. Denna tjänst är känd som USPS (United States Postal Service) First-Class Package International Service inom USA.","blogSingPostEPACContent4":"Från och med den 1 januari 2026 används ePAC nu för alla länder för att följa de obligatoriska UPU-bestämmelserna som kräver att spårning av paket och registrerade föremål ska begränsas endast för dokument.","blogSingPostEPACContent5":"Spårningsprefix: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS är en internationell premiumpostexpresstjänst, prioriterad av postoperatörer över hela världen.","blogSpeedPostEMSContent2":"Tullklareringen är i allmänhet snabbare än vanlig post men strängare i processen, med full spårning fram till leverans.","blogSpeedPostEMSContent3":"I Singapore är detta känt som SpeedPost Priority International av SingPost.","blogSpeedPostEMSContent4":"Spårningsprefix: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express är en budtjänst.","blogSpeedPostExpressContent2":"På många destinationer utför DHL Express last-mile-leverans och tar in tullar eller skatter innan frisläppandet.","blogSpeedPostExpressContent3":"Spårningsprefix: PX123456789SG (Last-mile DHL Express använder ett 10-siffrigt spårningsnummer, som inte är synligt för allmänheten, men vi har information för det via vår","blogSpeedPostExpressContent3Link":"Spårningssystem.","blogUSPDDPContent1":"PDDP tillåter amerikanska importtullar och skatter att betalas i förväg före leverans, vilket minskar överraskningsavgifterna för mottagarna.","blogUSPDDPContent2":"Nya förordningar (gäller 29 augusti 2025)","blogUSPDDPContent2List1":"Obligatoriska HTS-koder","blogUSPDDPContent2List2":"Noggranna artikelbeskrivningar","blogUSPDDPContent2List3":"Strängare tullkontroll","blogUSPDDPContent3":"Alla varor som skickas till USA kommer inte att debiteras några extra avgifter till mottagaren eftersom vi betalar för din räkning. Observera dock att artikelpriset är 10 % importavgift som standard som är inställd för att anpassa sig till bestämmelserna.","blogUSPDDPContent4":"Detta gäller endast för våra fraktmetoder för USA, SpeedPost Priority International (EMS) och SingPost ePAC.","blogEUIOSSContent1":"EU tillämpar moms på all kommersiell import oavsett värde.","blogEUIOSSContent2":"IOSS (Import One-Stop Shop)","blogEUIOSSContent3":"IOSS tillåter säljare att samla in EU-moms i kassan för försändelser upp till 150 €.","blogEUIOSSContent4":"Momsen remitteras sedan via IOSS-systemet, vilket möjliggör snabbare tullklarering och ingen momsuppbörd vid leverans.","blogEUIOSSContent5":"För alla beställningar via Etsy eller eBay, har IOSS moms redan samlats in vid kassan och vi kommer att ange det på skattereferensnumret för att överföra data till destinationsposttjänsten via EDI (Electronic Data Intercharge).","blogUKVATContent1":"Storbritannien kräver att moms redovisas på importerade varor.","blogUKVATContent2":"För försändelser med lågt värde, samlas moms vanligtvis in i kassan och skickas direkt till HMRC av säljaren eller marknadsplatsen.","blogUKVATContent3":"För försändelser med högre värde kan moms tas ut av transportören före leverans.","blogUKVATContent4":"För alla beställningar via Etsy eller eBay, har moms redan samlats in vid kassan och vi kommer att ange det på skattereferensnumret för att överföra data till destinationsposttjänsten via EDI (Electronic Data Intercharge).","blogNorwayVOECContent1":"Norge införde VOEC-systemet (VAT on E-Commerce) för varor som importeras från länder utanför EU/EES. Detta gäller varor värderade upp till 3 000 NOK.","blogNorwayVOECContent2":"Säljare kan registrera sig i VOEC-systemet för att samla in norsk moms i kassan, vilket möjliggör snabbare tullklarering och ingen momsuppbörd vid leverans.","blogNorwayVOECContent3":"För alla beställningar via Etsy eller eBay, är VOEC-moms redan inkasserad vid kassan. Spårnings- och tullpapper anger skattereferensnumret för att överföra data till den norska posten.","blogSwissVATContent1":"Schweiz tar ut moms på importerade varor oavsett värde. Den schweiziska federala tullmyndigheten kräver att utländska säljare tar in moms i kassan för varor upp till 65 CHF.","blogSwissVATContent2":"Säljare som är registrerade under det schweiziska momssystemet betalar in den insamlade momsen direkt, för att säkerställa att mottagaren inte upplever någon extra momsavgift vid leverans.","postalContactsTitle":"Posttjänst Kontakter","postalContactsNote":"Observera:","postalContactsPolandUKNote":"För Polen och Storbritannien kommer alla artiklar som skickas via SpeedPost Priority (EMS) att hanteras av Pocztex och Parcelforce.","postalContactsDHLNote":"För SpeedPost Express-leveranser, vänligen kontakta DHL via denna länk:","postalContactsCountry":"Land","postalContactsWebsite":"Webbplats","postalContactsForm":"Kontaktformulär","postalContactsPhone":"Telefonnummer","postalContactsEmail":"Kontakt E-post","postalContactsFormLink":"Kontaktformulär","postalContactsBackButton":"Tillbaka till paketförfrågningsformuläret","blogSwissVATContent3":"För alla beställningar via Etsy eller eBay debiteras schweizisk moms redan vid kassan, och tullpapper inkluderar skattereferensnumret för EDI-inlämning.","contactUsTitle":"Kontakta Oss","parcelDisagreeCheckbox":"Nej","contactDisagreeCheckbox":"Nej","contactNameLabel":"Namn (inga smeknamn ELLER TELEFONNUMMER)","contactEmailLabel":"E-post","contactEmailNote":"Privata relä-e-postmeddelanden (t.ex. @privaterelay.appleid.com) accepteras inte. Använd en giltig e-postadress.","contactEnquiryTypeLabel":"Är detta en?","contactSelectOption":"Välj ett alternativ","contactGeneralEnquiry":"Allmän förfrågan / feedback","contactBusinessEnquiry":"Företagsförfrågan","contactOrderShippingEnquiry":"Beställning/fraktförfrågan","contactExchangeRefundEnquiry":"Förfrågan om utbyte/återbetalning/retur","contactOthers":"Andra","contactParcelWarning":"Om ditt paket inte levereras inom mer än 18/30/45 dagar (14 dagar för FedEx), eller statusen visar levererad men du inte har det, vänligen fyll i DETTA FORMULÄR istället.","contactParcelWarningLink":"DETTA FORMULÄR","contactParcelWarningEnd":"istället.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"Etsy, eBay & Shopee ordernummer inte här. Vi har INGEN kontroll över återbetalningar från dessa plattformar. Vänligen kontakta deras kundtjänst separat.","contactPlatformInstructions":"Använd appen för att se ditt ordernummer, eftersom det sparas i appen:","contactPlatformEtsy":"Etsy - Högst upp till höger på din profil → Köp","contactPlatformEbay":"eBay - Mitt eBay → Köp","contactPlatformShopee":"Shopee - Jag → Visa köphistorik (eller du kan klicka på Att Skicka/Att Ta Emot)","contactRefundNote1":"Om du frågar om retur/återbetalning från plattformen du köpte från, observera att vi har INGEN kontroll över återbetalningar från dessa plattformar. Vänligen kontakta deras kundtjänst separat.","contactRefundNote2":"För returer eller byten, om maimai-handskarna redan har använts när de öppnas (synliga fläckar eller tvättats i maskin handtvätt), tillåter vi inte, och returer eller byten av arkadkort är inte tillåtna. Tack.","contactRefundNote3":"Observera att för återbetalningar via Payhip, om du inte får återbetalningen, kontakta din bank eller Payhip support (support@payhip.com), eftersom vi inte har kontroll över den processen.","contactMessageLabel":"Meddelande","contactCharacterCount":"tecken","contactSpamWarningNote":"Obs:","contactSpamWarning":"Oönskade erbjudanden om SEO, webbdesign, lån eller liknande tjänster kommer automatiskt att avvisas.","contactAgreementText1":"Klicka på \"Jag godkänner\" om du godkänner att din e-postadress används av Rhythm Nexus för att svara dig, eftersom detta krävs av oss för att läsa ditt svar och svara dig när vi kommer fram till en lösning för din förfrågan.","contactAgreementText2":"Observera att vårt svar tar 3-5 arbetsdagar, eller längre under hög volym av e-post från vår sida.","contactAgreeCheckbox":"Jag godkänner","contactSuccessMessage":"Ditt meddelande har skickats in! Vi svarar inom 3-5 arbetsdagar.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"Paketförfrågan","parcelInfoText":"Det här formuläret är för paket som inte har levererats i mer än 18/30/45 dagar (14 dagar för FedEx/DHL), eller som har visat leveransstatus men som inte finns hos dig.","parcelInfoLink":"Klicka här","parcelInfoEnd":"för andra förfrågningar.","parcelWaitTitle":"Vänta på ditt paket","parcelWaitText1":"Vänligen vänta på leveransen av ditt paket. Observera att internationella leveranser INTE är samma sak som lokala leveranser eftersom de tar tid. Tack!","parcelWaitText2":"Om ingen status visas efter 18 dagar (7 dagar för Singapore) eller mer, kan du informera oss direkt.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"Namn","parcelOrderNumberLabel":"Beställningsnummer (exempel: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"E-post","parcelEmailNote":"Privata relä-e-postmeddelanden accepteras inte. Använd en giltig e-postadress.","parcelShippingMethodLabel":"Vald fraktmetod?","parcelSelectShipping":"Välj en fraktmetod","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"Spårningsnummer","parcelUndeliveredLabel":"Har ditt paket varit olevererat i mer än 18/30/45 dagar? (Lokala tjänster i Singapore >7 dagar, >14 dagar för SpeedPost Express/DHL)","parcelSelectOption":"Välj ett alternativ","parcelYes":"Ja","parcelNo":"Inga","parcelDeliveredButMissingLabel":"Har ditt paket visat status levererat, men det finns inte i din brevlåda/säkra plats/dörr?","parcelCaseReferenceLabel":"Ärendereferens-ID från det lokala postkontoret","parcelCaseReferencePlaceholder":"Sätt NA om du är från Singapore","parcelCaseReferenceNote":"Innan du skickar in detta formulär, vänligen kontakta ditt lokala postkontor via telefon eller e-post och få ett ärendereferens-ID från dem. Lägg sedan in ditt ärendereferens-ID här.","parcelCaseReferenceLink":"Se den här länken för postens kontakter","parcelCaseReferenceMandatory":"SÄTT NA ENDAST OM DU ÄR FRÅN SINGAPORE. För andra länder är det OBLIGATORISKT att tillhandahålla. Krävs även för SpeedPost Express, för DHL:s ärende-ID.","parcelImageEvidenceLabel":"Bildbevis (för levererade men saknade paket)","parcelImageWarning":"För extra verifiering behöver vi bildbevis för att bevisa att du inte gör falska påståenden om icke-leverans av paket. (Endast för paket som redan levererats, men inte finns i brevlådan/utanför dörren. Vi kan avvisa ditt anspråk om ingen fotografisk bevisning ges för levererade varor. Ignorera detta om din vara INTE visade levererad status.)","parcelImageNote":"Ladda upp 1 fil som stöds: bild. Max 1 GB.","parcelAgreementText":"Vänligen klicka på \"Jag godkänner\" om du säkerställer att det som har hänt med ditt paket var sant.","parcelAgreeCheckbox":"Jag godkänner","parcelSuccessMessage":"Din paketförfrågan skickades in! Vi svarar inom 3-5 arbetsdagar.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","lookalikeDomainWarning":"Det här är inte ett spårningsnummer utan en länk till en webbplats som utger sig för att vara ett paketbolag. Ange inga person- eller betaluppgifter där.","lookalikeDomainOfficial":"Officiell webbplats:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus உயர்தர வணிக வலைப்பின்னல்களை பயன்படுத்துகிறது. இருப்பினும், அது உங்கள் நாட்டை அடையும் துல்லியமான தருணத்தில், பொறுப்பு உள்ளூர் உள்நாட்டு கேரியருக்கு மாற்றப்படுகிறது (எ.கா., USPS, Royal Mail, உள்ளூர் DHL). இந்த எல்லைப்புள்ளியில் கண்காணிப்பு முன்னொட்டங்கள் கையாளும் அமைப்புகளை மாற்றினாலும், எங்கள் உலகளாவிய பார்சல் டிராக்கர் இந்த நிலைகளை ஒன்றிணைத்து உங்களுக்கு இடையறாத தெளிவை வழங்குகிறது.","trackingLastMileTitle":"இறுதி மைல் விநியோக வலைப்பின்னல்","trackingCustomsClearanceBody":"எல்லைத் தாண்டும் அனைத்து பொருட்களும் உங்கள் நாட்டின் உள்ளூர் சுங்க அமைப்பின் அனுமதியை பெற வேண்டும். இறக்குமதி நிலையம் வருகையிலிருந்து சுங்க ஒப்படைப்பு வரை உள்ள மாற்றங்களை எங்கள் கருவி கண்காணிக்கிறது. எல்லைப் பாதுகாப்பு அதிகாரிகள் HS குறியீடுகளை சரிபார்த்து, சரியான VAT அல்லது சுங்கக் கட்டணங்கள் செலுத்தப்பட்டுள்ளனவா என்பதை உறுதிப்படுத்துவார்கள் (எ.கா., EU-வில் IOSS, நோர்வேயில் VOEC). \"Held at Customs\" எச்சரிக்கைகளுக்காக கண்காணிப்பை குறிப்பாக கவனிக்கவும்.","trackingCustomsClearanceTitle":"சுங்க அனுமதி தகவல்","trackingProcessingOriginBody":"ஒப்படைக்கப்பட்டதும், பொருள் தொடக்க செயலாக்க மையத்திற்குள் நுழைகிறது; அங்கு அது ஸ்கேன் செய்யப்படுகிறது, எடை பார்க்கப்படுகிறது, மேலும் முதன்மை ஏற்றுமதி பாதுகாப்பு சோதனைகளுக்கு உட்படுத்தப்படுகிறது. பின்னர் அது சர்வազգային அஞ்சல் பரிமாற்ற மையத்திற்கு அனுப்பப்படுகிறது. விமான அட்டவணைகள் கிடைக்கும் சரக்கு திறனைப் பொறுத்தது. இது சில நாட்கள் இந்த நிலையில் இருந்தாலும் கவலைப்பட வேண்டாம்.","trackingProcessingOriginTitle":"தொடக்க மையத்தில் செயலாக்கம்","trackingInfoReceivedBody":"எங்கள் இ-காமர்ஸ் தளங்களில் (Etsy, eBay அல்லது நேரடி விற்பனை போன்றவை) ஒரு ஆர்டர் முதன்முதலில் செயலாக்கப்படும் போது, கண்காணிப்பு எண் மின்னணுவாக உருவாக்கப்படுகிறது. பெட்டியை உடலுறப் பெறுவதற்கு முன், கேரியர் அனுப்பல் தரவைப் பெறுகிறது. பார்சல் உடல்முறை வகைப்பாட்டு மையத்தில் சேர 1 முதல் 3 வேலை நாட்கள் வரை அனுமதிக்கவும்.","trackingInfoReceivedTitle":"தகவல் பெறப்பட்டது","trackingStatusesIntro":"எங்கள் ஒருங்கிணைந்த சர்வதேச பார்சல் கண்காணிப்பு கருவியை பயன்படுத்தியதற்கு நன்றி. உங்கள் பார்சல் பல உலக எல்லைகளை கடந்து பயணிப்பதால், அதன் கண்காணிப்பு நிலைகள் சிக்கலாக இருக்கலாம். லாஜிஸ்டிக்ஸ் வாழ்க்கைச் சுழற்சியை புரிந்துகொள்வது தெளிவான எதிர்பார்ப்புகளை அமைக்க உதவுகிறது.","trackingStatusesTitle":"கண்காணிப்பு நிலைகளை புரிந்துகொள்வது","footerDesc":"ஆர்கேட் அம்யூஸ்மென்ட் கார்டுகள், ரிதம் கேம் கையுறைகள் மற்றும் சிறப்பு பொருட்களுக்கு உங்கள் முன்னணி தளம். இடையறாத சர்வதேச பார்சல் கண்காணிப்பும் நம்பகமான கப்பல் அனுப்பும் தரவுகளும் கொண்ட உலகளாவிய இ-காமர்ஸை அனுபவிக்குங்கள்.","amText":"முற்பகல்","pmText":"பிற்பகல்","tzAEST":"AEST (சிட்னி/மெல்போர்ன்)","tzACST":"ACST (அடிலெய்டு)","tzAWST":"AWST (பெர்த்)","tzNST":"NST (நியூஃபவுண்ட்லாந்து)","tzAST":"AST (அட்லாண்டிக்)","tzEST":"EST (கிழக்கு)","tzCST":"CST (மத்திய)","tzMST":"MST (மலை)","tzPST":"PST (பசிபிக்)","tzAKST":"AKST (அலாஸ்கா)","tzHST":"HST (ஹவாய்)","tzBeijing":"பெய்ஜிங்","tzXinjiang":"சின்ஜியாங்","tzWIB":"WIB (ஜகார்த்தா)","tzWITA":"WITA (மகாசர்)","tzWIT":"WIT (ஜெயபுரா)","tzKaliningrad":"கலினின்கிராட் ஒப்லாஸ்ட் (UTC+2)","tzMoscow":"மாஸ்கோ/மேற்கு ரஷ்யா (UTC+3)","tzSamara":"சமாரா ஒப்லாஸ்ட் (UTC+4)","tzUral":"யூரல் பகுதி (UTC+5)","tzOmsk":"ஓம்ஸ்க் ஒப்லாஸ்ட் (UTC+6)","tzKrasnoyarsk":"க்ராஸ்நோயார்ஸ்க் க்ராய் (UTC+7)","tzIrkutsk":"இர்குட்ஸ்க் ஒப்லாஸ்ட் (UTC+8)","tzSakha":"சகா குடியரசு (UTC+9)","tzPrimorsky":"பிரிமோர்ஸ்கி க்ராய் (UTC+10)","tzMagadan":"மகாதான் ஒப்லாஸ்ட் (UTC+11)","tzKamchatka":"கம்சட்கா க்ராய் (UTC+12)","dstDayStartsLabel":"டேலைட் நேரம் தொடங்குகிறது","dstDayEndsLabel":"டேலைட் நேரம் முடிந்துவிட்டது","dstRevertsLabel":"நிலையான நேரத்திற்கு திரும்பியது","dstEuropeLabel":"ஐரோப்பா","dstNewZealandLabel":"நியூ சிலாந்து","englishResponseNotice":"அறிவிப்பு: அனைத்து விசாரணைகளுக்கும் ஆங்கிலத்தில் பதிலளிக்கப்படும். நீங்கள் வேறொரு மொழியில் சமர்ப்பித்தால், சரிபார்ப்பிற்காக உங்கள் செய்தி ஆங்கிலத்தில் மொழிபெயர்க்கப்படலாம்.","contactNamePlaceholder":"உதாரணம்: ராஜேஷ் குமார்","systemRequirementsTitle":"குறைந்தபட்ச ஆதரவு கணினி பதிப்புகள்","systemRequirements":"Windows: Windows 7 (with ESU updates installed) அல்லது அதற்கு மேல்\nmacOS: macOS 12 அல்லது அதற்கு மேல்\nAndroid: Android 13 அல்லது அதற்கு மேல்\niPhone/iOS: iOS 17 அல்லது அதற்கு மேல்\nLinux: செயலில் உள்ள பாதுகாப்பு புதுப்பிப்புகளுடன் தற்போது ஆதரிக்கப்படும் விநியோக வெளியீடு","goodFridayEasterGreeting":"ஈஸ்டர் வாழ்த்துக்கள்! புனித வெள்ளி மற்றும் ஈஸ்டர் நாட்களில் உங்களுக்கு அமைதி மற்றும் மகிழ்ச்சியை விரும்புகிறேன்.","christmasGreeting":"இனிய கிறிஸ்துமஸ் மற்றும் புத்தாண்டு வாழ்த்துக்கள்! டிசம்பர் 25 முதல் ஜனவரி 5 வரை உங்களுக்கு அமைதியும் மகிழ்ச்சியும் வாழ்த்துக்கள்.","captchaSystemRequirements":"குறைந்தபட்ச கணினி தேவைகள்: Windows 7 (with ESU updates installed) அல்லது 11, macOS 10.15+, அல்லது Android/iOS சமீபத்திய பதிப்பு.","title":"அணுகலைச் சரிபார்க்கவும்","subtitle":"தொடர, கீழே உள்ள சவாலை முடிக்கவும்.","selectLanguage":"மொழியைத் தேர்ந்தெடுக்கவும்","selectLanguagePlaceholder":"-- ஒரு மொழியை தேர்ந்தெடு --","loadingChallenge":"சவாலை ஏற்றுகிறது...","answerLabel":"உங்கள் பதில்:","answerPlaceholder":"உங்கள் பதிலை உள்ளிடவும்","continueButton":"தொடரவும்","refreshButton":"புதிய சவால்","verifying":"சரிபார்க்கிறது...","chooseLanguageFirst":"முதலில் ஒரு மொழியைத் தேர்ந்தெடுக்கவும்.","loadFailed":"சவாலை ஏற்ற முடியவில்லை. மீண்டும் முயற்சிக்கவும்.","expiredChallenge":"சவால் காலாவதியானது. புதிய சவாலை ஏற்றுகிறது...","verifyFailed":"சரிபார்ப்பு தோல்வியடைந்தது. மீண்டும் முயற்சிக்கவும்.","home":"வீடு","blog":"வலைப்பதிவு","aboutUs":"எங்களைப் பற்றி","faq":"அடிக்கடி கேட்கப்படும் கேள்விகள்","contact":"தொடர்பு கொள்ளவும்","trackPackage":"தொகுப்பைக் கண்காணிக்கவும்","cnyYearOfHorseMessage":"🧧 சந்திர புத்தாண்டு வாழ்த்துக்கள்! குதிரை ஆண்டில் நீங்கள் செழிப்பையும் மகிழ்ச்சியையும் விரும்புகிறேன்! 🐴","hariRayaMessage":"🌙 செளமட் ஹரி ராயா ஐதில்பித்ரி! உங்களுக்கும் உங்கள் குடும்பத்தினருக்கும் அமைதி, மகிழ்ச்சி மற்றும் ஆசீர்வாதங்கள்! 🌟","deepavaliMessage":"🪔 இனிய தீபாவளி! விளக்குகளின் திருவிழா உங்களுக்கு மகிழ்ச்சியையும், செழிப்பையும், வெற்றியையும் தரட்டும்! ✨","diwaliMessage":"🪔 இனிய தீபாவளி! விளக்குகளின் திருவிழா உங்களுக்கு மகிழ்ச்சியையும், செழிப்பையும், வெற்றியையும் தரட்டும்! ✨","vesakMessage":"☸️ வெசாக் தின வாழ்த்துக்கள்! இந்த புனித நாளில் உங்களுக்கு அமைதி, ஞானம் மற்றும் ஞானம் கிடைக்க வாழ்த்துக்கள்! 🙏","vesakTHMessage":"☸️ விசாகா புச்சா தின வாழ்த்துக்கள்! இந்த புனித நாளில் உங்களுக்கு அமைதி, ஞானம் மற்றும் ஞானம் கிடைக்க வாழ்த்துக்கள்! 🙏","singaporeNationalDayMessage":"🇸🇬 தேசிய தின வாழ்த்துக்கள், சிங்கப்பூர்! சுதந்திரத்தின் 61வது ஆண்டு விழா! 🎉","indonesiaNationalDayMessage":"🇮🇩 செலமட் ஹரி கெமர்டேகான் இந்தோனேசியா! Dirgahayu குடியரசு இந்தோனேசியா! 🎊","malaysiaNationalDayMessage":"🇲🇾 செலமட் ஹரி மெர்டேகா, மலேசியா! நமது தேசத்தின் சுதந்திரத்தைக் கொண்டாடுவோம்! 🎊","australiaNationalDayMessage":"🇦🇺 ஆஸ்திரேலிய தின வாழ்த்துக்கள்! நம் தேசத்தைக் கொண்டாடுகிறோம்! 🎉","canadaNationalDayMessage":"🇨🇦 கனடா தின வாழ்த்துக்கள்! நமது மகத்தான தேசத்தைக் கொண்டாடுகிறோம்! 🍁","usaNationalDayMessage":"🇺🇸 சுதந்திர தின வாழ்த்துக்கள், அமெரிக்கா! சுதந்திரத்தையும் சுதந்திரத்தையும் கொண்டாடுகிறோம்! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet! விவ் லா பிரான்ஸ்! 🎊","germanyUnityDayMessage":"🇩🇪 இனிய ஜெர்மன் ஒற்றுமை தின வாழ்த்துக்கள்! டேக் டெர் டியூச்சன் ஐன்ஹீட்! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 இனிய நிறுவன தின வாழ்த்துகள், ஜப்பான்! 建国記念の日おめでとうございます!🎌","chinaNationalDayMessage":"🇨🇳 தேசிய தின வாழ்த்துக்கள், சீனா! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 விடுதலை தின வாழ்த்துகள், கொரியா! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 இந்திய சுதந்திர தின வாழ்த்துக்கள்! ஜெய் ஹிந்த்! 🇮🇳","thailandNationalDayMessage":"🇹🇭 தேசிய தின வாழ்த்துக்கள், தாய்லாந்து! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 சுதந்திர தின வாழ்த்துக்கள், பிலிப்பைன்ஸ்! மபுஹாய்! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 இனிய தேசிய தின வாழ்த்துக்கள், வியட்நாம்! Quốc kánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 சுதந்திர தின வாழ்த்துக்கள், போலந்து! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 சுதந்திர தின வாழ்த்துக்கள், செக் குடியரசு! டென் நெஜாவிஸ்லோஸ்டி! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! அரசன் வாழ்க! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 மகிழ்ச்சியான Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, சுவோமி! 🇫🇮","portugalNationalDayMessage":"🇵🇹 ஃபெலிஸ் தியா டி போர்ச்சுகல்! 🇵🇹","israelIndependenceDayMessage":"🇮🙏 சுதந்திர தின வாழ்த்துக்கள், இஸ்ரேல்! 🎉","irelandNationalDayMessage":"🇮🇪 செயின்ட் பேட்ரிக் தின வாழ்த்துக்கள், அயர்லாந்து! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 செலமட் ஹரி கெபாங்சான் புருனே! 🎊","newZealandWaitangiDayMessage":"🇳🇿 வைதாங்கி தின வாழ்த்துக்கள், நியூசிலாந்து! 🎉","switzerlandNationalDayMessage":"🇨🇭 சுவிஸ் தேசிய தின வாழ்த்துக்கள்! Fête Nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, Belgique! ஃபிஜ்னே நேஷனல் ஃபீஸ்ட்டாக்! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С டூன்யோம் ரஸ்ஸி! ரஷ்யா தின வாழ்த்துக்கள்! 🎉","taiwanFoundingDayMessage":"🇹🇼 ஸ்தாபக தின வாழ்த்துக்கள், தைவான்! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 இரட்டை பத்து நாள் வாழ்த்துக்கள், தைவான்! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 ஹாங்காங் SAR நிறுவன தின வாழ்த்துக்கள்! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 மக்காவ் SAR நிறுவன தின வாழ்த்துக்கள்! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ சர்வதேச தொழிலாளர் தின வாழ்த்துக்கள்! தொழிலாளர் மற்றும் தொழிலாளர் உரிமைகளை கொண்டாடுவோம்! 🎊","laborDayUSCAMessage":"⚒️ தொழிலாளர் தின வாழ்த்துக்கள்! தொழிலாளர்களின் பங்களிப்புக்கு மரியாதை! 🎉","temporaryClosureNoticeTitle":"Rhythm Nexus - தற்காலிக மூடல் அறிவிப்பு","temporaryClosureNoticeBody":"அன்புள்ள மதிப்பிற்குரிய வாடிக்கையாளர்களே,\n\nநிறுவன நிகழ்வின் காரணமாக Rhythm Nexus, 21 மார்ச் 2026 முதல் 26 மார்ச் 2026 வரை தற்காலிகமாக மூடப்படும் என்பதை தயவுசெய்து கவனிக்கவும்.\n\nமூடல் முன்னேற்பாடாக, கடை 20 மார்ச் 2026 அன்று மதியம் 3:00 (UTC +8) முதல் விடுமுறை முறையில் மாற்றப்படும். இந்த நேரத்திற்குப் பிறகு இடப்படும் ஆர்டர்கள், நாங்கள் செயல்பாடுகளை மீண்டும் தொடங்கும் வரை செயல்படுத்தப்படாமல் இருக்கலாம்.\n\nசாதாரண வணிக செயல்பாடுகள் 27 மார்ச் 2026 அன்று மீண்டும் தொடங்கும்.\n\nஏற்படும் சிரமங்களுக்கு மன்னிக்கவும். உங்கள் புரிதலுக்கும் தொடர்ந்து வழங்கும் ஆதரவுக்கும் நன்றி.\n\nநன்றி.\n\nRhythm Nexus","temporaryClosureNoticeClose":"நான் புரிந்துகொண்டேன்","parcelTracking":"பார்சல் கண்காணிப்பு","serviceAnnouncement":"சேவை அறிவிப்பு","usaWinterStormTitle":"அவசரம்: கடுமையான குளிர்கால புயல் - சேவை இடையூறு","usaWinterStormSubtitle":"அமெரிக்க இணையிய அஞ்சல் சேவை (USPS) பராக்கிரம நிகழ்வு","usaWinterStormNotice1":"பிப்ரவரி 23, 2026 முதல் நிউயார்க் பகுதியை பாதிக்கும் கடுமையான குளிர்கால புயல் காரணமாக:","usaWinterStormNotice2":"ஜான் எஃப் கென்னடி சர்வதேச விமான நிலையத்தில் சர்வதேश செயல்பாடுகள் திறம்பட நிறுத்தப்பட்டுள்ளன","usaWinterStormNotice3":"விமான பாதைகள் பரவ்யாபக ரத்து மற்றும் விமană நிலைய சேவைகளில் குறிப்பிடத்தக்க இடையூறு பதிவு செய்யப்பட்டுள்ளது","usaWinterStormNotice4":"இந்த நிலைமைகள் USPS கட்டுப்பாட்டிற்கு அப்பாற்பட்ட ஒரு பராக்கிரம நிகழ்வைக் குறிக்கிறது","usaWinterStormNotice5":"சேவை தாக்கம்:","usaWinterStormNotice6":"கனமான பனிப்பொழிவு, உறைந்த மழை, ஸ்லीட் மற்றும் பொறாமை விட பொறாமை கொடூரமான குளிரை ஆபத்தான கலைப்பு","usaWinterStormNotice7":"பெரிய இடையூறு மற்றும் விస்தாரமான மின் வெடிப்பு பதிவு செய்யப்பட்டுள்ளது","usaWinterStormNotice8":"உள்நாட்டு மற்றும் சர்வதேச அஞ்சல் (கடிதம்-பதிப்பு, பார்சல்-தபால் மற்றும் EMS பொருட்கள்) சேகரம் மற்றும் விநியோகம் பாதிக்கப்பட்டுள்ளன","usaWinterStormNotice9":"பாதிக்கப்பட்ட தபால் குறியீட்டு பகுதிகள்:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS ஆனது வாடிக்கையாளர்களுக்கு அசௌகரியங்களைக் குறைக்க ஊழியர்களின் பாதுகாப்பை பராமரிக்கும் அனைத்து தேவையான நடவடிக்கைகளையும் எடுத்துக் கொண்டுள்ளது. இந்த பராக்கிரம நிகழ்வின் போது உங்கள் பொறுமை மற்றும் புரிதலுக்கு நாங்கள் கृतજ్ఞமाய முள்ளோம်।","usaWinterStormNotice12":"கடைசியாக புதுப்பிக்கப்பட்டது: பிப்ரவரி 25, 2026","countryAutoDetected":"உங்கள் இருப்பிடத்தின் அடிப்படையில் இலக்கு முன்னமைவு செய்யப்பட்டது","trackingNumber":"கண்காணிப்பு எண்","destinationCountry":"இலக்கு நாடு","postcode":"அஞ்சல் குறியீடு","orderNumber":"ஆர்டர் எண் (எடுத்துக்காட்டு: RTNX1234567890)","fromDate":"தேதியிலிருந்து (DHL சரிபார்ப்புக்கு தேவை)","toDate":"இன்றுவரை (DHL சரிபார்ப்புக்கு தேவை)","trackParcel":"பார்சலைக் கண்காணிக்கவும்","selectCourier":"-- கூரியர் / நாட்டைத் தேர்ந்தெடுக்கவும் --","singaporeCouriers":"சிங்கப்பூர் கூரியர்கள்","topCountries":"முதல் 5 நாடுகள்","otherCountries":"பிற நாடுகள்","note":"குறிப்பு","disclaimer":"மறுப்பு","importantInformation":"முக்கிய தகவல்:","didNotReceiveEmail":"Etsy, eBay, Shopee அல்லது Payhip இலிருந்து உங்கள் உறுதிப்படுத்தல் மின்னஞ்சலைப் பெறவில்லை என்றால், உங்கள் மின்னஞ்சல் முகவரி அல்லது இந்த ஆர்டருடன் இணைக்கப்பட்ட தொலைபேசி எண் மூலம் உங்கள் ஆர்டரைத் தேட கீழே உருட்டவும்.","searchByEmailOrPhone":"மின்னஞ்சல் அல்லது தொலைபேசி மூலம் தேடவும்","searchOrder":"தேடல் ஆணை","trackingResult":"கண்காணிப்பு முடிவு","noOrdersFound":"இந்த வினவலுக்கு ஆர்டர்கள் எதுவும் கிடைக்கவில்லை.","pleaseEnter":"மின்னஞ்சல், தொலைபேசி அல்லது ஆர்டர் எண்ணை உள்ளிடவும்.","fillAllFields":"தேவையான அனைத்து புலங்களையும் நிரப்பவும்: கண்காணிப்பு எண், சேரும் நாடு, ஆர்டர் எண் மற்றும் அஞ்சல் குறியீடு.","noOrderMatchingFields":"எல்லாப் புலங்களுக்கும் பொருந்தக்கூடிய வரிசை எதுவும் இல்லை.","postcodeRequired":"இந்த இலக்குக்கு அஞ்சல் குறியீடு தேவை.","invalidUSZip":"தவறான US ZIP குறியீடு. 5 இலக்கங்கள் அல்லது ZIP+4 ஐப் பயன்படுத்தவும்.","failedGenerateURL":"கண்காணிப்பு URL ஐ உருவாக்க முடியவில்லை. உள்ளீட்டைச் சரிபார்க்கவும்.","trackingValidationSG":"சிங்கப்பூருக்கான கண்காணிப்பு எண்கள் இருக்க வேண்டும்: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG அல்லது PX123456789SG. DHL ஏற்றுமதிகளுக்கு 10 இலக்க எண்களைப் பயன்படுத்தவும்.","invalidSingPostFormat":"தவறான SingPost கண்காணிப்பு எண் வடிவம்.\nஏற்றுக்கொள்ளப்பட்ட வடிவங்கள்:\n• PP123456789SG → ப்ரீபெய்ட் ட்ராக் செய்யப்பட்ட லேபிள்\n• SPNDD00012345 → ஸ்பீட்போஸ்ட் நிலையான கண்காணிப்பு","welcomeTitle":"Rhythm Nexus இன் இணையதளத்திற்கு வரவேற்கிறோம்!","purchaseInfo":"எங்கள் அதிகாரப்பூர்வ சேனல்கள் மூலம் எங்களிடமிருந்து வாங்கவும் அல்லது எங்களுடன் சேரவும்","purchaseInfoChina":"எங்கள் அதிகாரப்பூர்வ சேனல்கள் மூலம் எங்களிடமிருந்து வாங்கவும்.","purchaseInfoChinaSuffix":"","telegramGroup":"தந்தி குழு","forUpdates":"அதிகாரப்பூர்வ புதுப்பிப்புகளுக்கு.","ourStores":"எங்கள் கடைகள்","etsyStore":"எட்ஸி ஸ்டோர்","ebayStore":"ஈபே ஸ்டோர்","shopeeStore":"ஷாப்பி ஸ்டோர்","payhipStore":"பேஹிப் ஸ்டோர்","internationalShipping":"சர்வதேச கப்பல் போக்குவரத்து","singaporeLocal":"சிங்கப்பூர் உள்ளூர்","asiaOnly":"ஆசியாவில் மட்டும்","deliveryInfo":"டெலிவரி தகவல்","deliveryRates2026":"டெலிவரி கட்டணங்கள் 2026","sgDeliveryRates":"சிங்கப்பூர் டெலிவரி விலைகள்","speedPostRates":"ஸ்பீட்போஸ்ட் எக்ஸ்பிரஸ் சர்வதேச விலைகள்","aboutTitle":"ரிதம் நெக்ஸஸ் பற்றி","aboutP1":"நாங்கள் 2022 இல் எங்கள் கடையைத் தொடங்கினோம், பல ஆண்டுகளாக Etsy, eBay மற்றும் Shopee போன்ற தளங்களில் தவறாமல் விற்பனை செய்துள்ளோம்.","aboutP2":"காலப்போக்கில், நாங்கள் அனுப்பும் ஒவ்வொரு ஆர்டரையும் நம்பகமான நிறைவேற்றம், வெளிப்படையான தொடர்பு மற்றும் துல்லியமான கண்காணிப்பு ஆகியவற்றில் கவனம் செலுத்துவதன் மூலம் வலுவான நற்பெயரைக் கட்டியெழுப்பியுள்ளோம்.","aboutP3":"உள்நாட்டில் அல்லது சர்வதேச அளவில் வாங்கினாலும், வாடிக்கையாளர்களுக்கு மென்மையான மற்றும் நம்பகமான ஷாப்பிங் அனுபவத்தை வழங்குவதே எங்கள் குறிக்கோள். டெலிவரிகள் முடிந்தவரை திறமையாக அவர்களின் இலக்குகளை அடைவதை உறுதி செய்வதற்காக, அஞ்சல், சுங்கம் மற்றும் வரித் தேவைகளை மாற்றியமைக்க நாங்கள் தொடர்ந்து மாற்றியமைக்கிறோம்.","aboutP4":"ரிதம் நெக்ஸஸை ஆதரித்ததற்கு நன்றி.","faqTitle":"அடிக்கடி கேட்கப்படும் கேள்விகள்","faqQ1":"எனது பொருள் பழுதடைந்தால் என்ன செய்வது? ஏதேனும் உத்தரவாதம் உள்ளதா?","faqA1":"ஆம்! பெரும்பாலான ஆர்டர்கள் 1 வருட உத்தரவாதத்துடன் வருகின்றன. உங்கள் விலைப்பட்டியல்/ஆர்டர் எண்ணை வழங்கவும், எனவே நாங்கள் விசாரிக்க முடியும். குறிப்பு: நீங்கள் தவறாக ஆர்டர் செய்திருந்தாலும், பொருள் விளக்கத்துடன் பொருந்தினால் பரிமாற்றங்கள் அனுமதிக்கப்படாது.","faqQ2":"எனது ஆர்டரை நான் திருத்தலாமா, புதுப்பிக்கலாமா அல்லது ரத்துசெய்யலாமா?","faqA2":"ஆம். பாதுகாப்பிற்காக, ஆர்டர் மாற்றங்களை மின்னஞ்சல் மூலமாகவோ அல்லது எங்கள் தொடர்புப் படிவத்திலோ கையாள வேண்டியிருக்கும்.","faqQ3":"நான் சுங்க/இறக்குமதி வரி செலுத்த வேண்டுமா?","faqA3":"அமெரிக்காவிற்கான DDP தவிர, சுங்கம் மற்றும் கடமைகள் பொதுவாக ப்ரீபெய்ட் அல்ல. EU, UK, AU/NZ, Norway, Switzerland மற்றும் Saskatchewan மற்றும் Manitoba போன்ற கனடிய மாகாணங்களுக்கு VAT விண்ணப்பிக்கலாம், இது ஏற்கனவே இயல்புநிலையாக செலுத்தப்படுகிறது. சிங்கப்பூருக்கு ஜிஎஸ்டி கிடையாது. சுங்கக் கட்டணம் குறித்து எங்களால் ஆலோசனை கூற முடியாது - விவரங்களுக்கு உங்கள் உள்ளூர் சுங்கத் துறையைத் தொடர்பு கொள்ளவும்.","faqQ4":"எனது ஆர்டர் எப்போது அனுப்பப்படும்?","faqA4":"ஆர்டர்கள் வழக்கமாக 1-5 வணிக நாட்களுக்குள் அனுப்பப்படும். அதிக அளவு காலங்களில், இது 5-7 நாட்கள் ஆகலாம்.","faqQ5":"நான் தற்செயலாக இரண்டு முறை ஆர்டர் செய்தேன். நான் என்ன செய்ய வேண்டும்?","faqA5":"நாங்கள் நகல் ஷிப்பிங் கட்டணத்தை மட்டும் திருப்பித் தருகிறோம். இரண்டு பொருட்களும் ஒன்றாக அனுப்பப்படும். திருப்பிச் செலுத்துதல் = (முதல் + இரண்டாவது கப்பல் கட்டணம்) - உண்மையான கப்பல் கட்டணம்.","faqQ6":"டெலிவரி எவ்வளவு நேரம் ஆகும்?","faqA6":"செயலாக்கம் பொதுவாக 1-5 வணிக நாட்கள் ஆகும்.\n\nஉள்நாட்டு கப்பல் சேவை:\n• SingPost Prepaid Tracked Label: 2-4 நாட்கள்\n• SpeedPost Standard: 1-3 நாட்கள்\n\nசர்வதேச கப்பல் சேவை:\n• SingPost ePAC: 14-30 நாட்கள்\n• SpeedPost Priority (EMS): 8-15 நாட்கள்\n• SpeedPost Express: 4-8 நாட்கள்\n\nபெரும் பருவங்களில் தாமதம் ஏற்படலாம்.","faqQ7":"எனது உருப்படி அனுப்புநருக்குத் திருப்பி அனுப்பப்படுகிறது. நான் என்ன செய்ய வேண்டும்?","faqA7":"ஒரு மறுபரிசீலனை அனுமதிக்கப்படுகிறது. செல்லாத முகவரிகள், உரிமை கோரப்படாத பார்சல்கள் அல்லது செலுத்தப்படாத சுங்கக் கட்டணங்களுக்கு ரத்து செய்வது சாத்தியமில்லை. மறுபரிசீலனைக்கு உங்கள் அஞ்சல் சேவையைத் தொடர்பு கொள்ளவும் அல்லது உதவிக்கு எங்களுக்கு செய்தி அனுப்பவும்.","faqQ8":"போக்குவரத்தில் எனது பொருள் தொலைந்து விட்டது / திருடப்பட்டது.","faqA8":"நாங்கள் ஒரு மறு ஏற்றுமதியை அனுமதிக்கிறோம். அது மீண்டும் தொலைந்துவிட்டால், கூரியரின் டெலிவரி சாளரத்திற்குப் பிறகு முழுப் பணம் திரும்ப வழங்கப்படும்:\n\n• சிங்கப்பூர் உள்ளூர் சேவைகள்: 7 நாட்கள்\n• SingPost ePAC & SpeedPost முன்னுரிமை சர்வதேசம்: 30 நாட்கள்\n• SpeedPost Intl Express: 14 நாட்கள்","blogTitle":"கப்பல் மற்றும் அஞ்சல் அறிவுத் தளம்","blogSubtitle":"அஞ்சல் சேவைகள், சுங்கம், VAT மற்றும் Rhythm Nexus ஷிப்மென்ட் தொடர்பான கடமைகள் பற்றிய அதிகாரப்பூர்வ விளக்கங்கள்.","readMore":"மேலும் படிக்க","backButton":"மீண்டும்","copyrightText":"அனைத்து உரிமைகளும் பாதுகாக்கப்பட்டவை.","blogPost1Title":"SingPost ePAC என்றால் என்ன?","blogPost1Desc":"SingPost ePAC (ePacket), இலகுரக சர்வதேச இ-காமர்ஸ் ஏற்றுமதிக்கான சிக்கனமான கண்காணிப்பு அஞ்சல் சேவையைப் பற்றி அறிக.","blogPost2Title":"ஸ்பீட்போஸ்ட் முன்னுரிமை சர்வதேசம் (ஈஎம்எஸ்) என்றால் என்ன?","blogPost2Desc":"உலகளாவிய அஞ்சல் ஆபரேட்டர்களால் முன்னுரிமையளிக்கப்பட்ட சர்வதேச பிரீமியம் அஞ்சல் விரைவு சேவையான EMS ஐக் கண்டறியவும்.","blogPost3Title":"ஸ்பீட்போஸ்ட் எக்ஸ்பிரஸ் (கடைசி மைல் டிஹெச்எல் எக்ஸ்பிரஸ்) என்றால் என்ன?","blogPost3Desc":"DHL எக்ஸ்பிரஸ் மூலம் லாஸ்ட் மைல் டெலிவரியுடன் கூடிய கூரியர் தர சேவையான ஸ்பீட்போஸ்ட் எக்ஸ்பிரஸை ஆராயுங்கள்.","blogPost4Title":"USA அஞ்சல் விநியோகக் கட்டணம் செலுத்தப்பட்டது (PDDP)","blogPost4Desc":"டெலிவரிக்கு முன் அமெரிக்க இறக்குமதி வரிகள் மற்றும் வரிகளை ப்ரீபெய்ட் செய்ய அனுமதிக்கும் PDDP ஐப் புரிந்து கொள்ளுங்கள்.","blogPost5Title":"EU VAT & IOSS விளக்கப்பட்டது","blogPost5Desc":"€150 வரையிலான இறக்குமதியில் VAT வசூலிப்பதற்கான EU VAT மற்றும் IOSS அமைப்பு பற்றிய நுண்ணறிவுகளைப் பெறுங்கள்.","blogPost6Title":"UK VAT & HMRCக்கு பணம் அனுப்புதல்","blogPost6Desc":"UK இல் இறக்குமதி செய்யப்பட்ட பொருட்களுக்கான VAT தேவைகள் மற்றும் HMRC க்கு பணம் அனுப்புதல் பற்றி அறியவும்.","blogPost7Title":"நார்வே VOEC விளக்கப்பட்டது","blogPost7Desc":"EU/EEAக்கு வெளியில் இருந்து இறக்குமதி செய்யப்படும் பொருட்களுக்கான நார்வேயின் VOEC (VAT on E-Commerce) முறையைப் புரிந்து கொள்ளுங்கள்.","blogPost8Title":"சுவிஸ் VAT விளக்கப்பட்டது","blogPost8Desc":"இறக்குமதி செய்யப்பட்ட பொருட்களுக்கான சுவிட்சர்லாந்தின் VAT தேவைகள் மற்றும் சேகரிப்பு செயல்முறையை ஆராயுங்கள்.","enterDestinationPostcode":"இலக்கு அஞ்சல் குறியீட்டை உள்ளிடவும்","trackingNumberExample":"எ.கா. LG123456789SG","trackingCaseSensitive":"கண்காணிப்பு கடிதங்கள் கேஸ் சென்சிட்டிவ் மற்றும் பெரிய எழுத்துக்களில் இருக்க வேண்டும்.","usaPostcodeNote":"ஹாங்காங் & மக்காவ் போன்ற அஞ்சல் குறியீடுகள் இல்லாத நாடுகளுக்கு, 999077 (ஹாங்காங்) அல்லது 999078 (மக்காவ்) எனப் போடவும்.","currentTime":"தற்போதைய நேரம்","timezoneNote":"நேரம் 12-மணிநேர வடிவத்தில் காட்டப்பட்டுள்ளது","sameTimeAsSingapore":"அதே நேரம் சிங்கப்பூர்","hourAhead":"சிங்கப்பூரை விட ஒரு மணி நேரம் முன்னால்","hoursAhead":"சிங்கப்பூரை விட மணிநேரம் முன்னால்","hourBehind":"சிங்கப்பூர் பின்னால் ஒரு மணி நேரம்","hoursBehind":"சிங்கப்பூர் பின்னால் மணி","australianDSTTitle":"ஆஸ்திரேலிய பகல் சேமிப்பு நேரம் செயலில் உள்ளது","australianDSTBothMessage":"AEDT (Australian East Daylight Time) மற்றும் ACDT (Australian Central Daylight Time) இரண்டும் தற்போது நடைமுறையில் உள்ளன.","australianAEDTMessage":"AEDT (ஆஸ்திரேலிய கிழக்கு பகல் நேரம்) தற்போது சிட்னி, மெல்போர்ன் மற்றும் சுற்றியுள்ள பகுதிகளில் நடைமுறையில் உள்ளது.","australianACDTMessage":"ACDT (ஆஸ்திரேலிய மத்திய பகல் நேரம்) அடிலெய்டு மற்றும் தெற்கு ஆஸ்திரேலியாவில் தற்போது நடைமுறையில் உள்ளது.","australianDSTNote":"மேலே காட்டப்படும் டெலிவரி நேரங்கள் தற்போதைய பகல் சேமிப்பு நேரத்தை பிரதிபலிக்கின்றன.","epacDeliveryNote":"இலக்கிற்கு அனுப்பப்படும் அனைத்து ePAC பொருட்களும் உங்கள் அஞ்சல் பெட்டி, வீட்டு வாசல், பார்சல் லாக்கர் அல்லது பாதுகாப்பான இடத்தில் வைக்கப்பட்டு வழங்கப்பட வேண்டும் என்பதை கவனிக்கவும்!","countriesNoMailbox":"அஞ்சல் பெட்டி/லெட்டர்பாக்ஸ் டெலிவரி இல்லை என்று அறியப்பட்ட நாடுகள்: புருனே, சீனா, இந்தியா, இஸ்ரேல், மக்காவ் SAR சீனா, பிலிப்பைன்ஸ், போலந்து மற்றும் வியட்நாம்.","rhythmNexusNotResponsible":"டெலிவரிகள் எங்கள் கட்டுப்பாட்டிற்கு வெளியே இருப்பதால் அவற்றை கையாள Rhythm Nexus பொறுப்பல்ல; உங்கள் பொருளின் நிலையை நீங்கள் நேரடியாக கண்காணிக்கவும்.","issuesAfterDelivery":"30/45 நாட்களுக்குப் பிறகு (SpeedPost Express க்கு 14 நாட்கள்) உங்கள் டெலிவரியில் ஏதேனும் சிக்கல்கள் அல்லது ஸ்டேட்டஸ் ஷோ டெலிவரி செய்யப்பட்டது ஆனால் நீங்கள் பெறவில்லை, தயவுசெய்து எங்களைத் தொடர்பு கொள்ளவும்","filteredAllowedDestinations":"(உங்கள் அனுமதிக்கப்பட்ட இடங்களுக்கு வடிகட்டப்பட்டது)","loadingAnnouncements":"அறிவிப்புகளை ஏற்றுகிறது...","unableToLoadAnnouncements":"தற்போது சேவை அறிவிப்புகளை ஏற்ற முடியவில்லை.","viewOnSingPostWebsite":"SingPost இணையதளத்தில் பார்க்கவும் →","cannotUseEmbed":"பெரும்பாலான அஞ்சல் சேவை இணையதளங்கள் அதை ஆதரிக்காததால், கண்காணிப்புக்கு உட்பொதிவைப் பயன்படுத்த முடியவில்லை.","clickLinkAbove":"உங்கள் பார்சலைக் கண்காணிக்க மேலே உள்ள இணைப்பைக் கிளிக் செய்யவும்.","trackingDetailsNote":"கண்காணிப்பு விவரங்கள் தேடல் முடிவுகளில் காட்டப்படாமல் போகலாம், எனவே உருப்படியைக் கண்காணிக்க கண்காணிப்பு எண்ணை கணினியில் ஒட்ட பரிந்துரைக்கப்படுகிறது.","thirdPartyWebsites":"இந்த மூன்றாம் தரப்பு இணையதளங்களிலும் உங்கள் பார்சல்களைக் கண்காணிக்கலாம்:","enterEmailOrPhone":"மின்னஞ்சல் அல்லது தொலைபேசியை உள்ளிடவும்","collectAtPostOffice":"இருப்பினும், உங்கள் நாட்டில் அஞ்சல் பெட்டி தரமானதாக இல்லை என்றால், நீங்கள் அதை அஞ்சல் அலுவலகத்தில் சேகரிக்க வேண்டும்.","russiaServiceSuspended":"⚠️ முக்கிய அறிவிப்பு: 2022 உக்ரைன் மீதான ரஷ்ய படையெடுப்பைக் கருத்தில் கொண்டு, சிங்போஸ்ட் DHL உடன் ரஷ்யாவிற்கு அனைத்து ஏற்றுமதிகளையும் நிறுத்தி வைத்துள்ளது. நாட்டிற்கான சேவைகளை மீண்டும் தொடங்குவதற்கான அறிவிப்பு வரும் வரை நாங்கள் தற்போது ரஷ்யாவிற்கு சேவை செய்ய மாட்டோம்.","reviewShippingRates":"எங்களின் தற்போதைய ஷிப்பிங் கட்டணங்களை மதிப்பாய்வு செய்யவும்","here":"இங்கே","contactUsForm":"இதன் மூலம் எங்களை தொடர்பு கொள்ளவும்","form":"வடிவம்","forEnquiries":"உங்கள் ஆர்டரைப் பற்றி ஏதேனும் விசாரணைகள் இருந்தால்.","anPostNoDirectTracking":"ஒரு இடுகை (அயர்லாந்து) நேரடி கண்காணிப்பு இணைப்புகள் அல்லது உட்பொதிக்கப்பட்ட கண்காணிப்பை ஆதரிக்காது.","anPostPasteManually":"உங்கள் கண்காணிப்பு எண்ணை ஒரு இடுகை இணையதளத்தில் கைமுறையாக ஒட்டவும்.","goToAnPost":"ஒரு இடுகைக்குச் செல்லவும்","postedDate":"இடுகையிடப்பட்ட தேதி:","status":"நிலை:","shippedVia":"இதன் மூலம் அனுப்பப்பட்டது:","destination":"சேருமிடம்:","statusInPreparation":"தயாரிப்பில்","statusInTransit":"போக்குவரத்தில்","statusDelivered":"வழங்கப்பட்டது","statusOutForDelivery":"டெலிவரிக்கு வெளியே","statusArrived":"வந்தடைந்தது","statusProcessing":"செயலாக்கம்","statusDispatched":"அனுப்பப்பட்டது","statusReturned":"திரும்பினார்","statusFailed":"தோல்வியடைந்தது","statusCancelled":"ரத்து செய்யப்பட்டது","statusHeldByCustms":"சுங்கத்தால் நடத்தப்பட்டது","statusAwaitingCollection":"சேகரிப்புக்காக காத்திருக்கிறது","aka":"aka","thisServiceKnownAs":"இந்த சேவை என அழைக்கப்படுகிறது","in":"உள்ளே","viewTrackingDHL":"டிஹெச்எல் எக்ஸ்பிரஸில் இருந்து கண்காணிப்பு தகவலைப் பார்க்கவும்","viewTrackingSingPostSpeedPost":"சிங்கப்பூர் ஸ்பீட்போஸ்டில் இருந்து கண்காணிப்புத் தகவலைப் பார்க்கவும்","viewTrackingDHLLastMile":"டிஹெச்எல் எக்ஸ்பிரஸ் (கடைசி மைல்) இலிருந்து கண்காணிப்பு தகவலைப் பார்க்கவும்","viewTrackingDHLShipperRef":"டிஹெச்எல் எக்ஸ்பிரஸில் இருந்து கண்காணிப்பு தகவலைப் பார்க்கவும் (ஷிப்பர் குறிப்பு)","viewTrackingSingPost":"சிங்கப்பூர் போஸ்டிலிருந்து கண்காணிப்புத் தகவலைப் பார்க்கவும்","viewTrackingDestPost":"இதிலிருந்து கண்காணிப்புத் தகவலைப் பார்க்கவும்","post":"இடுகை","orderNumberExample":"ஆர்டர் எண் (RTNX அல்லது DLTB உடன் தொடங்குகிறது - உதாரணம்: RTNX1234567890):","deliveryRecordNote":"உருப்படி டெலிவரி செய்யப்பட்டவுடன், பதிவு 7 நாட்கள் வரை மட்டுமே சேமிக்கப்படும் மற்றும் நீக்கப்படும் என்பதை நினைவில் கொள்ளவும்.","copyrightAllRights":"அனைத்து உரிமைகளும் பாதுகாக்கப்பட்டவை.","accessRestricted":"அணுகல் தடைசெய்யப்பட்டுள்ளது","vpnDetectedMessage":"VPN பயன்பாடு கண்டறியப்பட்டது. இந்தச் சேவையை அணுக VPNஐ முடக்கவும்.","contactSupportError":"இது பிழை என நீங்கள் நம்பினால், ஆதரவைத் தொடர்பு கொள்ளவும்.","destinationNotAllowed":"இந்த இலக்கு நாட்டிற்கான அணுகல் உங்கள் இருப்பிடத்திலிருந்து கிடைக்கவில்லை. வேறொரு இலக்கைத் தேர்ந்தெடுக்கவும்.","epacUS":"முதல் தர பேக்கேஜ் சர்வதேச சேவை","epacCH":"முன்னுரிமை பிளஸ்","epacGB":"சர்வதேச கண்காணிக்கப்பட்டது","epacMY":"சர்வதேச கண்காணிக்கப்பட்டது/எக்ஸ்பிரஸ்","epacCA":"சர்வதேச உள்வரும் எக்ஸ்பிரஸ்","epacAU":"பேக் அண்ட் டிராக் இன்டர்நேஷனல்","epacNZ":"சர்வதேச பொருளாதாரம் கண்காணிக்கப்பட்டது","epacDE":"வாரன்போஸ்ட் சர்வதேச பிரீமியம்","epacFR":"கண்காணிப்புடன் சர்வதேச கடிதம்","epacNL":"சர்வதேச பாக்கெட் கண்காணிக்கப்பட்டது","epacPL":"குளோபல் எக்ஸ்பிரஸ்","epacBE":"சர்வதேச பிரதம உள்வரும்","epacAT":"சர்வதேச கண்காணிக்கப்பட்ட பாக்கெட்","epacIN":"சர்வதேச கண்காணிக்கப்பட்ட பாக்கெட்","epacFI":"சர்வதேச கண்காணிக்கப்பட்ட கடிதம்","epacSE":"சர்வதேச கண்காணிக்கப்பட்ட கடிதம்","epacNO":"பிரைம் எக்ஸ்பிரஸ்","epacIT":"எக்ஸ்பிரஸ்","epacIL":"எக்ஸ்பிரஸ்","epacES":"சர்வதேச ஒளி தொகுப்பு","epacPT":"சர்வதேச நீல அஞ்சல்","epacCZ":"வெளிநாட்டில் இருந்து ஏற்றுமதி கண்காணிக்கப்படுகிறது","epacBN":"சர்வதேச ePacket","epacCN":"சர்வதேச ePacket","epacHK":"சர்வதேச ePacket","epacID":"சர்வதேச இ-பேக்கெட்","epacMO":"சர்வதேச ePacket","epacPH":"சர்வதேச கண்காணிப்பு அஞ்சல்","epacTW":"சர்வதேச ePacket","epacTH":"சர்வதேச ePacket","epacVN":"சர்வதேச மின் பாக்கெட் (ஆசியான் பேக்)","epacKR":"கே-பேக்கெட்","epacJP":"சர்வதேச இ-பேக்கெட் லைட்","epacIE":"சர்வதேச விரைவு அஞ்சல்","blogSingPostEPACContent1":"SingPost ePAC (ePacket) என்பது இலகுரக சர்வதேச இ-காமர்ஸ் ஏற்றுமதிக்கான பொருளாதார கண்காணிப்பு அஞ்சல் சேவையாகும்.","blogSingPostEPACContent2":"இது இலக்கு நாட்டின் தேசிய அஞ்சல் ஆபரேட்டரால் வழங்கப்படுகிறது மற்றும் பொதுவாக 2 கிலோவிற்கும் குறைவான பார்சல்களுக்குப் பயன்படுத்தப்படுகிறது, நீளம் + அகலம் + உயரம் 90 செமீக்குக் கீழே மற்றும் நீளம் 60 செமீக்கு மிகாமல் இருக்கும்.","blogSingPostEPACContent3":"இந்த விருப்பம் ஆரம்பத்தில் eBay சீனாவுடன் இணைந்து ஹாங்காங் போஸ்ட்டால் மட்டுமே வழங்கப்பட்டது, சீனா மற்றும் ஹாங்காங்கின் பேக்கேஜ்கள் டெலிவரி செய்யும் போது கையொப்பமிடுபவர் தேவையில்லாமல் டெலிவரி டிராக்கிங்குடன் அமெரிக்காவில் சிறிய பாக்கெட்டுகளை வெளியிட அனுமதிக்கிறது. இந்த சேவை யுஎஸ்பிஎஸ் (யுனைடெட் ஸ்டேட்ஸ் போஸ்டல் சர்வீஸ்) ஃபர்ஸ்ட்-கிளாஸ் பேக்கேஜ் இன்டர்நேஷனல் சர்வீஸ் என்று அமெரிக்காவிற்குள் அழைக்கப்படுகிறது.","blogSingPostEPACContent4":"ஜனவரி 1, 2026 நிலவரப்படி, பார்சல்கள் மற்றும் பதிவுசெய்யப்பட்ட பொருட்களை ஆவணங்களுக்கு மட்டுமே கண்காணிப்பதற்கான கட்டாயமான UPU விதிமுறைகளுக்கு இணங்க ePAC இப்போது அனைத்து நாடுகளுக்கும் பயன்படுத்தப்படுகிறது.","blogSingPostEPACContent5":"கண்காணிப்பு முன்னொட்டுகள்: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS என்பது ஒரு சர்வதேச பிரீமியம் அஞ்சல் விரைவு சேவையாகும், இது உலகளாவிய அஞ்சல் ஆபரேட்டர்களால் முன்னுரிமை அளிக்கப்படுகிறது.","blogSpeedPostEMSContent2":"சுங்க அனுமதி பொதுவாக நிலையான அஞ்சலை விட வேகமானது ஆனால் செயல்பாட்டில் கடுமையானது, டெலிவரி வரை முழு கண்காணிப்புடன்.","blogSpeedPostEMSContent3":"சிங்கப்பூரில், இது SingPost ஆல் SpeedPost Priority International என்று அழைக்கப்படுகிறது.","blogSpeedPostEMSContent4":"கண்காணிப்பு முன்னொட்டு: EZ123456789SG","blogSpeedPostExpressContent1":"ஸ்பீட்போஸ்ட் எக்ஸ்பிரஸ் ஒரு கூரியர் தர சேவையாகும்.","blogSpeedPostExpressContent2":"பல இடங்களுக்கு, DHL எக்ஸ்பிரஸ் கடைசி மைல் டெலிவரி செய்கிறது மற்றும் வெளியீட்டிற்கு முன் கடமைகள் அல்லது வரிகளை வசூலிக்கிறது.","blogSpeedPostExpressContent3":"கண்காணிப்பு முன்னொட்டு: PX123456789SG (கடைசி மைல் DHL எக்ஸ்பிரஸ் 10-இலக்க கண்காணிப்பு எண்ணைப் பயன்படுத்துகிறது, இது பொதுமக்களுக்குத் தெரியவில்லை, ஆனால் அதற்கான தகவல் எங்களிடம் உள்ளது","blogSpeedPostExpressContent3Link":"கண்காணிப்பு அமைப்பு.","blogUSPDDPContent1":"PDDP US இறக்குமதி வரிகள் மற்றும் வரிகளை டெலிவரிக்கு முன் ப்ரீபெய்ட் செய்ய அனுமதிக்கிறது, இது பெறுநர்களுக்கு ஆச்சரியமான கட்டணங்களைக் குறைக்கிறது.","blogUSPDDPContent2":"புதிய விதிமுறைகள் (29 ஆகஸ்ட் 2025 முதல்)","blogUSPDDPContent2List1":"கட்டாய HTS குறியீடுகள்","blogUSPDDPContent2List2":"துல்லியமான பொருள் விளக்கங்கள்","blogUSPDDPContent2List3":"கடுமையான கட்டண அமலாக்கம்","blogUSPDDPContent3":"உங்கள் சார்பாக நாங்கள் செலுத்துவதால் அமெரிக்காவிற்கு அனுப்பப்படும் அனைத்து பொருட்களுக்கும் பெறுநரிடம் கூடுதல் கட்டணங்கள் எதுவும் விதிக்கப்படாது. எவ்வாறாயினும், பொருட்களின் விலையானது, விதிமுறைகளுடன் இணங்க அமைக்கப்பட்டுள்ள இயல்புநிலையாக 10% இறக்குமதிக் கட்டணம் என்பதை நினைவில் கொள்ளவும்.","blogUSPDDPContent4":"இது USA, SpeedPost Priority International (EMS) மற்றும் SingPost ePACக்கான எங்களின் ஷிப்பிங் முறைகளுக்கு மட்டுமே பொருந்தும்.","blogEUIOSSContent1":"EU மதிப்பைப் பொருட்படுத்தாமல் அனைத்து வணிக இறக்குமதிகளுக்கும் VAT பொருந்தும்.","blogEUIOSSContent2":"IOSS (இறக்குமதி ஒரு நிறுத்த கடை)","blogEUIOSSContent3":"€150 வரையிலான சரக்குகளுக்கு செக் அவுட்டில் EU VAT வசூலிக்க விற்பனையாளர்களை IOSS அனுமதிக்கிறது.","blogEUIOSSContent4":"VAT பின்னர் IOSS அமைப்பு வழியாக அனுப்பப்படுகிறது, விரைவான சுங்க அனுமதியை செயல்படுத்துகிறது மற்றும் டெலிவரிக்கு VAT வசூல் இல்லை.","blogEUIOSSContent5":"Etsy அல்லது eBay வழியாக அனைத்து ஆர்டர்களுக்கும், IOSS VAT ஏற்கனவே செக் அவுட்டில் சேகரிக்கப்பட்டுள்ளது மற்றும் EDI (எலக்ட்ரானிக் டேட்டா இன்டர்சார்ஜ்) வழியாக இலக்கு அஞ்சல் சேவைக்கு தரவை அனுப்ப வரி குறிப்பு எண்ணில் குறிப்பிடுவோம்.","blogUKVATContent1":"இங்கிலாந்துக்கு இறக்குமதி செய்யப்பட்ட பொருட்களுக்கு VAT கணக்கிடப்பட வேண்டும்.","blogUKVATContent2":"குறைந்த மதிப்புள்ள சரக்குகளுக்கு, VAT வழக்கமாக செக் அவுட்டில் சேகரிக்கப்பட்டு விற்பனையாளர் அல்லது சந்தை மூலம் HMRCக்கு நேரடியாக அனுப்பப்படும்.","blogUKVATContent3":"அதிக மதிப்புள்ள ஏற்றுமதிகளுக்கு, டெலிவரிக்கு முன் கேரியரால் VAT சேகரிக்கப்படலாம்.","blogUKVATContent4":"Etsy அல்லது eBay வழியாக செய்யப்படும் அனைத்து ஆர்டர்களுக்கும், VAT ஏற்கனவே செக் அவுட்டில் சேகரிக்கப்பட்டுள்ளது மற்றும் EDI (எலக்ட்ரானிக் டேட்டா இன்டர்சார்ஜ்) வழியாக இலக்கு அஞ்சல் சேவைக்கு தரவை அனுப்ப வரி குறிப்பு எண்ணில் குறிப்பிடுவோம்.","blogNorwayVOECContent1":"EU/EEA க்கு வெளியில் இருந்து இறக்குமதி செய்யப்படும் பொருட்களுக்கு VOEC (VAT on E-Commerce) முறையை நார்வே அறிமுகப்படுத்தியது. NOK 3,000 வரை மதிப்புள்ள பொருட்களுக்கு இது பொருந்தும்.","blogNorwayVOECContent2":"செக் அவுட்டின் போது நார்வேஜியன் VAT வசூலிக்க VOEC திட்டத்தில் விற்பனையாளர்கள் பதிவு செய்யலாம், இது விரைவான சுங்க அனுமதியை அனுமதிக்கிறது மற்றும் டெலிவரிக்கு பிறகு VAT வசூல் இல்லை.","blogNorwayVOECContent3":"Etsy அல்லது eBay வழியாக அனைத்து ஆர்டர்களுக்கும், VOEC VAT ஏற்கனவே செக் அவுட்டில் சேகரிக்கப்பட்டுள்ளது. கண்காணிப்பு மற்றும் சுங்க ஆவணங்கள் நோர்வே அஞ்சல் சேவைக்கு தரவை அனுப்ப வரி குறிப்பு எண்ணைக் குறிக்கின்றன.","blogSwissVATContent1":"சுவிட்சர்லாந்து இறக்குமதி செய்யப்பட்ட பொருட்களுக்கு மதிப்பு இல்லாமல் VAT வசூலிக்கிறது. சுவிஸ் ஃபெடரல் சுங்க நிர்வாகம் வெளிநாட்டு விற்பனையாளர்கள் CHF 65 வரையிலான பொருட்களுக்கான செக் அவுட்டில் VAT வசூலிக்க வேண்டும்.","blogSwissVATContent2":"சுவிஸ் VAT முறையின் கீழ் பதிவுசெய்யப்பட்ட விற்பனையாளர்கள் சேகரிக்கப்பட்ட VATஐ நேரடியாக அனுப்புகிறார்கள், டெலிவரியின் போது பெறுநர் கூடுதல் VAT கட்டணத்தை அனுபவிப்பதில்லை என்பதை உறுதிசெய்கிறார்.","blogSwissVATContent3":"Etsy அல்லது eBay வழியாக அனைத்து ஆர்டர்களுக்கும், செக் அவுட்டின் போது சுவிஸ் VAT ஏற்கனவே சேகரிக்கப்பட்டுள்ளது, மேலும் சுங்க ஆவணங்களில் EDI சமர்ப்பிப்பிற்கான வரி குறிப்பு எண் உள்ளது.","dhlNoEmbed":"டிஹெச்எல் எக்ஸ்பிரஸ் உட்பொதிவு வழியாக கண்காணிப்பதை ஆதரிக்காது. தயவுசெய்து","speedPostNoEmbed":"SpeedPost சிங்கப்பூர் உட்பொதிவு மூலம் கண்காணிப்பதை ஆதரிக்காது. தயவுசெய்து","operatorNoEmbed":"உட்பொதிவு மூலம் கண்காணிப்பதை ஆதரிக்காது. தயவுசெய்து","clickHere":"இங்கே கிளிக் செய்யவும்","toTrackNewTab":"கண்காணிக்க (புதிய தாவலில் திறக்கும்).","optionSingPost":"🇸🇬 சிங்போஸ்ட் (SPNDD/PP)","countryAU":"🇦🇺 ஆஸ்திரேலியா","countryCA":"🇨🇦 கனடா","countryDE":"🇩🇪 ஜெர்மனி","countryGB":"🇬🇧 ஐக்கிய இராச்சியம்","countryUS":"🇺🇸 அமெரிக்கா","countryAT":"🇦🇹 ஆஸ்திரியா","countryBE":"🇧🇪 பெல்ஜியம்","countryBN":"🇧🇳 புருனே","countryCN":"🇨🇳 சீனா","countryCZ":"🇨🇿 செக்கியா","countryFI":"🇫🇮 பின்லாந்து","countryFR":"🇫🇷 பிரான்ஸ்","countryHK":"🇭🇰 ஹாங்காங் SAR சீனா","countryIN":"🇮🇳 இந்தியா","countryID":"🇮🇩 இந்தோனேசியா","countryIE":"🇮🇪 அயர்லாந்து","countryIL":"🇮🇱 இஸ்ரேல்","countryIT":"🇮🇹 இத்தாலி","countryJP":"🇯🇵 ஜப்பான்","countryMO":"🇲🇴 மக்காவ் SAR சீனா","countryMY":"🇲🇾 மலேசியா","countryNL":"🇳🇱 நெதர்லாந்து","countryNZ":"🇳🇿 நியூசிலாந்து","countryNO":"🇳🇴 நார்வே","countryPH":"🇵🇭 பிலிப்பைன்ஸ்","countryPL":"🇵🇱 போலந்து","countryPT":"🇵🇹 போர்ச்சுகல்","countryRU":"🇷🇺 ரஷ்யா","countryKR":"🇰🇷 தென் கொரியா","countryES":"🇪🇸 ஸ்பெயின்","countrySE":"🇸🇪 ஸ்வீடன்","countryCH":"🇨🇭 சுவிட்சர்லாந்து","countryTW":"🇹🇼 தைவான்","countryTH":"🇹🇭 தாய்லாந்து","countryVN":"🇻🇳 வியட்நாம்","countrySG":"🇸🇬 சிங்கப்பூர்","countryMsgNL":"நிலை 'சுங்கத்தால் நடத்தப்பட்டது' என இருந்தால், உதவிக்கு நெதர்லாந்து சுங்கத் தகவல் வரியைத் தொடர்பு கொள்ளவும்:\n0800 0143 (இலவசம்), திங்கள் முதல் வெள்ளி வரை காலை 7 மணி முதல் இரவு 11 மணி வரை.\nசனி & ஞாயிறு அன்று காலை 8 மணி முதல் மாலை 4:30 மணி வரை.\n\nஉங்கள் தொகுப்புகளின் உடனடி புஷ் அறிவிப்புக்காக, PostNL இல் ஒரு கணக்கைப் பதிவு செய்யும்படி ஊக்குவிக்கப்படுகிறீர்கள்:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nபோஸ்ட்என்எல் பாயிண்ட்டிற்கு டெலிவரி செய்யப்பட்டாலோ அல்லது தபால் நிலையத்தில் சேகரிக்கும்படி நிலை சொன்னாலோ, கவுண்டரில் 7 யூரோ செலுத்த வேண்டும். ஆன்லைனில் செலுத்தினால் அதிகபட்சம் 4 யூரோ.","countryMsgDE":"உங்கள் பேக்கேஜ்களின் நிலையைக் கண்காணிப்பதற்கான புஷ் அறிவிப்புகளைப் பெற, போஸ்ட் & டிஹெச்எல் பயன்பாட்டைப் பதிவிறக்குமாறு உங்களை ஊக்குவிக்கிறோம்:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH வாடிக்கையாளர் சேவை தொடர்பு:\n+49-228-433-3112\nDHL DE தொடர்புக்கு: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"நீங்கள் கூடுதல் இறக்குமதி அறிவிப்பை சுங்கத்திற்கு சமர்ப்பிக்க வேண்டும். அவ்வாறு செய்யத் தவறினால், நுழைவுக் கட்டுப்பாடு மற்றும் தொகுப்பு திரும்பப் பெறப்படும். \nமேலும் தகவல்: https://www.posti.fi/en/receiving/customs-clearance \nமற்ற இணைப்புகள்: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"கையாளுதல் கட்டணம் 4.95 EUR வசூலிக்கப்படுகிறது.\nபயன்பாட்டை இங்கே பதிவிறக்கவும்: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"8.50 PLN கையாளுதல் கட்டணம் வசூலிக்கப்படுகிறது. \nதபால் நிலையத்தில் சேகரிக்கப்பட்டவுடன் நீங்கள் அதை செலுத்த வேண்டும்,\nபார்சல் உங்கள் வீட்டு வாசலில் அல்லது அஞ்சல் பெட்டிக்கு வழங்கப்பட வாய்ப்பில்லை.","countryMsgPH":"பிலிப்பைன்ஸில் PHLPost திறமையற்றதாகவும் நம்பகத்தன்மையற்றதாகவும் கருதப்படுகிறது.\nடெலிவரி நிலைக்கு சில சமயங்களில் உங்கள் பார்சலை எப்போதும் கண்காணிக்கவும் \nசிறிய பார்சல்களுக்கு 1 முதல் 3 வாரங்களுக்கு இடையில் மட்டுமே காண்பிக்கப்படும். பெரிய பார்சல்களுக்கு, \nமணிலா மத்திய அஞ்சல் அலுவலகம் அல்லது அருகிலுள்ள அஞ்சல் அலுவலகம் மூலம் மட்டுமே சேகரிப்பு சாத்தியமாகும் \nஉங்கள் பகுதியில் உள்ள தபால் நிலையம். பார்சல்களுக்கு 112PHP கையாளுதல் கட்டணம் பொருந்தும் என்பதை நினைவில் கொள்ளவும் \nநீங்கள் செலுத்த வேண்டிய எந்த மதிப்பும். பணம் செலுத்தத் தவறினால் பார்சல் கிடைக்கும் \nஎங்களிடம் திரும்பு. PHLPost இன் சேவைகளின் மந்தநிலை காரணமாக டெலிவரி 1-2 மாதங்கள் என மதிப்பிடப்பட்டுள்ளது. \n10000PHP இன் கீழ் உள்ள பொருட்களுக்கு நீங்கள் வரி செலுத்த வேண்டியதில்லை, ஆனால் அது சமமாகவோ அல்லது அதற்கு அதிகமாகவோ இருந்தால் நீங்கள் செலுத்த வேண்டும். \nஅடுத்த முறை எங்களிடம் ஆர்டர் செய்யும் போது வேகமான செயல்முறைக்கு ஸ்பீட்போஸ்ட் எக்ஸ்பிரஸை பரிந்துரைக்கிறோம். இருப்பினும், பெறுநருக்கு டி&டி இயல்புநிலையாக இருப்பதால் கட்டணம் பொருந்தாது.","countryMsgCA":"கனடாவிற்கு அனுப்பப்படும் அனைத்து ஆர்டர்களுக்கும் De minimis 20CAD ஆகும், ஏனெனில் சிங்கப்பூர் CPTPP ஒப்பந்தத்தின் ஒரு பகுதியாக இருப்பதால், கடமைகள் பொருந்தாது, ஆனால் உருப்படியின் HS குறியீட்டைப் பொறுத்து 60CAD மற்றும் அதற்கு மேல் அல்லது 100CAD மற்றும் அதற்கு மேல் வரம்புக்கு மேல் இருந்தால் D&T பொருந்தும். அந்தத் தொகைக்கு மேல் உள்ள எந்த மதிப்புக்கும் அதற்கேற்ப VAT விதிக்கப்படும்.","countryMsgID":"இந்தோனேசியாவிற்கு வந்தவுடன் பொருந்தக்கூடிய வரிகள் மற்றும் வரிகளை நீங்கள் செலுத்த வேண்டும். தயவுசெய்து உங்கள் பார்சலைக் கண்காணித்து, குறிப்பிட்ட தொகையை இந்தோனேசிய சுங்கத்திற்குச் செலுத்தவும்.\nநீங்கள் கூடுதல் அனுமதி ஆவணங்களைச் சமர்ப்பிக்க வேண்டும். அவ்வாறு செய்யத் தவறினால், நுழைவுக் கட்டுப்பாடு அல்லது நாட்டுச் சுங்கத்தால் பொதியைப் பறிமுதல் செய்யலாம். மேலும் விவரங்களை இங்கே பார்க்கவும்:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"இந்தியாவிற்கு வந்தவுடன் பொருந்தக்கூடிய வரிகள் மற்றும் வரிகளை நீங்கள் செலுத்த வேண்டும். தயவுசெய்து உங்கள் பார்சலைக் கண்காணித்து, குறிப்பிட்ட தொகையை இந்திய சுங்கத்திற்குச் செலுத்துங்கள்.\nஇந்தியாவில் சுங்க அனுமதி கண்டிப்பாக உள்ளது என்பதையும், உங்கள் பொருளின் மதிப்பு 1000INR (15 USD)க்கு மேல் இருந்தால், உங்களுக்கு வரி விதிக்கப்படலாம் அல்லது விதிக்கப்படாமல் போகலாம் - HS குறியீட்டைப் பொறுத்து, பெரும்பாலான சமயங்களில் இது வரி விலக்கு, ஆனால் 5000INR (60 USD)க்கு மேல் இருந்தால் அதிக வரி விதிக்கப்படலாம். \nஇந்திய அஞ்சல் அஞ்சல் பெட்டிக்கு தரமாக வழங்காததால், உங்கள் பேக்கேஜைப் பெற அல்லது தபால் அலுவலகத்தில் சேகரிக்க நீங்கள் வீட்டில் அல்லது அங்கீகரிக்கப்பட்ட பிரதிநிதியாக இருக்க வேண்டும்.","countryMsgMY":"De minimis மலேசியாவிற்கு அனுப்பப்படும் அனைத்து ஆர்டர்களுக்கும் 500MYR ஆகும். அதற்கு மேல் உள்ள ஆர்டர்களுக்கு கட்டணம் விதிக்கப்படலாம்.","countryMsgUS":"ஆகஸ்ட் 29, 2025 நிலவரப்படி, அமெரிக்க டாலர் 800 டி மினிமிஸ் அதிகாரப்பூர்வமாக அகற்றப்படும், மேலும் இறக்குமதி கட்டணங்கள் அனுப்பியவருக்கு இயல்பாகவே செலுத்தப்படும்.\nUSA ஷிப்பிங்கிற்கு உங்கள் பார்சலுக்கு மேலும் தாமதங்கள் ஏற்படாமல் இருக்க சரியான தொலைபேசி எண் மற்றும் மின்னஞ்சல் முகவரி தேவைப்படும்.","countryMsgIL":"டி மினிமிஸ் என்பது இஸ்ரேலுக்கு அனுப்பப்படும் அனைத்து ஆர்டர்களுக்கும் 240 ILS (75 USD) ஆகும். அதற்கு மேல் உள்ள ஆர்டர்களுக்கு கட்டணம் விதிக்கப்படலாம். \nஇஸ்ரேலுக்கு அனுப்பப்படும் ஆர்டர்களை கவனத்தில் கொள்ளவும், இஸ்ரேல் போஸ்ட் டெலிவரி செய்யப்பட்டவுடன் இறுதி டெலிவரியை சில சமயங்களில் ஒப்புக்கொள்ளாமல் போகலாம். \nஇஸ்ரேல் போஸ்ட் ஒரு தரமாக அஞ்சல் பெட்டிக்கு வழங்காததால், உங்கள் பேக்கேஜைப் பெற அல்லது தபால் அலுவலகத்தில் சேகரிக்க நீங்கள் வீட்டில் அல்லது அங்கீகரிக்கப்பட்ட பிரதிநிதியாக இருக்க வேண்டும்.","countryMsgGB":"UK க்கு அனுப்பப்படும் ஆர்டர்களை கவனத்தில் கொள்ளவும், ராயல் மெயில் உங்கள் அஞ்சல் பெட்டிக்கு டெலிவரி செய்யப்பட்டவுடன் இறுதி டெலிவரியை சில சமயங்களில் அங்கீகரிக்காது.","countryMsgTH":"டி மினிமிஸ் தாய்லாந்திற்கு அனுப்பப்படும் அனைத்து ஆர்டர்களுக்கும் 1500THB (45 USD) ஆகும். அதற்கு மேல் உள்ள ஆர்டர்களுக்கு கட்டணம் விதிக்கப்படலாம்.","countryMsgTW":"தைவானுக்கு அனுப்பப்படும் அனைத்து ஆர்டர்களுக்கும் De minimis 2000TWD (60 USD) ஆகும். அதற்கு மேல் உள்ள ஆர்டர்களுக்கு கட்டணம் விதிக்கப்படலாம்.","countryMsgMO":"மக்காவுக்கு அனுப்பும்போது டி&டி கட்டணம் வசூலிக்கப்படுவதில்லை. ஆனால், Macau Post ஆனது அஞ்சல் பெட்டிக்கு ஒரு தரநிலையாக வழங்காது என்பதை நினைவில் கொள்ளவும், தபால் அலுவலகத்தில் உங்கள் தொகுப்பை சேகரிக்க நீங்கள் தேவைப்படுவீர்கள்.","countryMsgBN":"புருனேக்கு அனுப்பும்போது டி&டி கட்டணம் வசூலிக்கப்படுவதில்லை. ஆனால் புருனே போஸ்ட் அஞ்சல் பெட்டிக்கு தரமாக வழங்கவில்லை என்பதை நினைவில் கொள்ளவும், தபால் அலுவலகத்தில் உங்கள் தொகுப்பை சேகரிக்க நீங்கள் தேவைப்படுவீர்கள். \nஇந்த நாட்டிற்கான கண்காணிப்பு அமைப்பு மிகவும் நிலையானதாக இல்லை மற்றும் வரையறுக்கப்பட்ட தகவல் மட்டுமே வழங்கப்படலாம், மேலும் இறுதி டெலிவரி முடிவுகள் தோற்றத்திற்கு வழங்கப்படவில்லை.","countryMsgJP":"டி மினிமிஸ் என்பது ஜப்பானுக்கு அனுப்பப்படும் அனைத்து ஆர்டர்களுக்கும் 10000JPY (65 USD) ஆகும். அதற்கு மேல் உள்ள ஆர்டர்களுக்கு கட்டணம் விதிக்கப்படலாம்.","countryMsgKR":"தென் கொரியாவிற்கு அனுப்பப்படும் அனைத்து ஆர்டர்களுக்கும் டி மினிமிஸ் 180000KRW (150 USD) ஆகும். அதற்கு மேல் உள்ள ஆர்டர்களுக்கு கட்டணம் விதிக்கப்படலாம்.","countryMsgVN":"வியட்நாமைப் பொறுத்தவரை, டெலிவரியின் போது தொடர்பு கொள்ளாமல் இருக்கவும், ஏனெனில் உருப்படியை டெலிவரி செய்யும் போது கையாளும் கட்டணம் வசூலிக்கப்படும். \nவியட்நாமுக்கு அனுப்பப்படும் அனைத்து ஆர்டர்களுக்கும் டி மினிமிஸ் 1000000 (35 அமெரிக்க டாலர்) ஆகும். அதற்கு மேல் உள்ள ஆர்டர்களுக்கு கட்டணம் விதிக்கப்படலாம். \nவியட்நாம் போஸ்ட் ஒரு தரநிலையாக அஞ்சல் பெட்டிக்கு வழங்காததால், உங்கள் பேக்கேஜைப் பெற அல்லது தபால் அலுவலகத்தில் சேகரிக்க நீங்கள் வீட்டில் அல்லது அங்கீகரிக்கப்பட்ட பிரதிநிதியாக இருக்க வேண்டும்.","postalContactsTitle":"அஞ்சல் சேவை தொடர்புகள்","postalContactsNote":"குறிப்பு:","postalContactsPolandUKNote":"போலந்து மற்றும் UK-க்கு, SpeedPost Priority (EMS) மூலம் அனுப்பப்படும் அனைத்து பொருட்களும் Pocztex மற்றும் Parcelforce மூலம் கையாளப்படும்.","postalContactsDHLNote":"SpeedPost Express அனுப்புதல்களுக்கு, இந்த இணைப்பு மூலம் DHL-ஐ தொடர்பு கொள்ளவும்:","postalContactsCountry":"நாடு","postalContactsWebsite":"வலைத்தளம்","postalContactsForm":"தொடர்பு படிவம்","postalContactsPhone":"தொடர்பு எண்","postalContactsEmail":"தொடர்பு மின்னஞ்சல்","postalContactsFormLink":"தொடர்பு படிவம்","postalContactsBackButton":"பார்சல் விசாரணை படிவத்திற்கு திரும்பு","countryMsgPP":"கண்காணிக்கப்பட்ட லேபிள் உருப்படிகள் அஞ்சல் அலுவலகத்தில் POPDrop/POPStop இல் இடுகையிடப்படும். ஸ்பீட்போஸ்ட் நிலையான உருப்படிகள் பொதுவாக POPStop அல்லது POPStation இல் இடுகையிடப்படும்.\nகண்காணிக்கப்பட்ட லேபிள் உருப்படிகளின் டெலிவரிகள் ஒவ்வொரு திங்கள் முதல் வெள்ளி வரை காலை 9 மணி முதல் மாலை 6 மணி வரை மட்டுமே செய்யப்படும் என்பதை நினைவில் கொள்ளவும். வார இறுதி நாட்கள் மற்றும் பொது விடுமுறை நாட்கள் தவிர.","contactUsTitle":"எங்களை தொடர்பு கொள்ளுங்கள்","parcelDisagreeCheckbox":"இல்லை","contactDisagreeCheckbox":"இல்லை","contactNameLabel":"பெயர்","contactEmailLabel":"மின்னஞ்சல்","contactEmailNote":"தனிப்பட்ட ரிலே மின்னஞ்சல்கள் (உதாரணமாக, @privaterelay.appleid.com) ஏற்றுக்கொள்ளப்படவில்லை. செல்லுபடியாகும் மின்னஞ்சல் முகவரியைப் பயன்படுத்தவும்.","contactEnquiryTypeLabel":"இது ஒரு தானா?","contactSelectOption":"ஒரு விருப்பத்தைத் தேர்ந்தெடுக்கவும்","contactGeneralEnquiry":"பொது விசாரணை / கருத்து","contactBusinessEnquiry":"வணிக விசாரணை","contactOrderShippingEnquiry":"ஆர்டர்/ஷிப்பிங் விசாரணை","contactExchangeRefundEnquiry":"பரிமாற்றம்/பணம்/திரும்பல் விசாரணை","contactOthers":"மற்றவை","contactParcelWarning":"உங்கள் பார்சல் 18/30/45 நாட்களுக்கு மேல் வழங்கப்படவில்லை என்றால் (FedEx க்கு 14 நாட்கள்), அல்லது நிலை வழங்கப்பட்டதாகக் காட்டுகிறது ஆனால் அது உங்களிடம் இல்லை என்றால், இந்த படிவத்தை நிரப்பவும்.","contactParcelWarningLink":"இந்த படிவத்தை","contactParcelWarningEnd":"மாற்றாக.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"Etsy, eBay & Shopee ஆர்டர் எண் இங்கே இல்லை. இந்த தளங்களிலிருந்து பணத்தைத் திரும்பப் பெறுவதில் எங்களுக்கு எந்த கட்டுப்பாடும் இல்லை. அவர்களின் வாடிக்கையாளர் சேவையை தனித்தனியாக தொடர்பு கொள்ளவும்.","contactPlatformInstructions":"உங்கள் ஆர்டர் எண்ணைப் பார்க்க ஆப்பைப் பயன்படுத்தவும், ஏனெனில் அது ஆப்பில் சேமிக்கப்பட்டுள்ளது:","contactPlatformEtsy":"Etsy - உங்கள் சுயவிவரத்தின் மேல் வலதுபுறம் → வாங்கியவை","contactPlatformEbay":"eBay - என் eBay → வாங்கியவை","contactPlatformShopee":"Shopee - நான் → வாங்கிய வரலாற்றைப் பார்க்கவும் (அல்லது நீங்கள் அனுப்ப/பெற என்பதைக் கிளிக் செய்யலாம்)","contactRefundNote1":"நீங்கள் வாங்கிய தளத்திலிருந்து திரும்ப/பணத்தைத் திரும்பப் பெறுவது பற்றி நீங்கள் கேட்டால், இந்த தளங்களிலிருந்து பணத்தைத் திரும்பப் பெறுவதில் எங்களுக்கு எந்த கட்டுப்பாடும் இல்லை என்பதை நினைவில் கொள்ளவும். அவர்களின் வாடிக்கையாளர் சேவையை தனித்தனியாக தொடர்பு கொள்ளவும்.","contactRefundNote2":"திரும்பப் பெறுதல் அல்லது பரிமாற்றங்களுக்கு, maimai கையுறைகள் திறக்கப்படும்போது ஏற்கனவே பயன்படுத்தப்பட்டிருந்தால் (தெரியும் கறைகள் அல்லது இயந்திரத்தில் கை கழுவுதல்), நாங்கள் அனுமதிக்க மாட்டோம், மேலும் ஆர்கேட் கார்டுகளின் திரும்பப் பெறுதல் அல்லது பரிமாற்றங்கள் அனுமதிக்கப்படவில்லை. நன்றி.","contactRefundNote3":"Payhip மூலம் பணத்தைத் திரும்பப் பெறுவதற்கு, நீங்கள் பணத்தைத் திரும்பப் பெறவில்லை என்றால், உங்கள் வங்கி அல்லது Payhip ஆதரவைத் தொடர்பு கொள்ளவும் (support@payhip.com), ஏனெனில் அந்த செயல்முறையில் எங்களுக்கு கட்டுப்பாடு இல்லை.","contactMessageLabel":"செய்தி","contactCharacterCount":"பாத்திரங்கள்","contactSpamWarningNote":"கவனிக்கவும்:","contactSpamWarning":"SEO, இணைய வடிவமைப்பு, கடன்கள் அல்லது ஒத்த சேவைகளுக்கான தேவையற்ற சலுகைகள் தானாகவே நிராகரிக்கப்படும்.","contactAgreementText1":"\"நான் ஒப்புக்கொள்கிறேன்\" என்பதைக் கிளிக் செய்யவும், உங்களுக்குப் பதிலளிக்க Rhythm Nexus மூலம் உங்கள் மின்னஞ்சல் முகவரியைப் பயன்படுத்த நீங்கள் ஒப்புக்கொண்டால், ஏனெனில் உங்கள் பதிலைப் படிக்கவும் உங்கள் விசாரணைக்கான தீர்வை நாங்கள் வெளியிடும்போது உங்களுக்கு பதிலளிக்கவும் இது எங்களுக்குத் தேவை.","contactAgreementText2":"எங்கள் பதில் 3-5 வேலை நாட்கள் எடுக்கும் என்பதை நினைவில் கொள்ளவும், அல்லது எங்கள் தரப்பில் அதிக எண்ணிக்கையிலான மின்னஞ்சல்களின் போது அதிக நேரம் எடுக்கும்.","contactAgreeCheckbox":"நான் ஒப்புக்கொள்கிறேன்","contactSuccessMessage":"உங்கள் செய்தி சமர்ப்பிக்கப்பட்டது! 3-5 வேலை நாட்களில் நாங்கள் பதிலளிப்போம்.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"பார்சல் விசாரணை","parcelInfoText":"இந்தப் படிவம் 18/30/45 நாட்களுக்கும் மேலாக (FedEx/DHLக்கு 14 நாட்கள்) டெலிவரி செய்யப்படாத பார்சல்களுக்கானது அல்லது டெலிவரி செய்யப்பட்ட நிலையைக் காட்டியது ஆனால் உங்களிடம் இல்லை.","parcelInfoLink":"இங்கே கிளிக் செய்யவும்","parcelInfoEnd":"மற்ற விசாரணைகளுக்கு.","parcelWaitTitle":"உங்கள் பார்சலுக்காகக் காத்திருங்கள்","parcelWaitText1":"உங்கள் பார்சல் டெலிவரிக்காக காத்திருங்கள். சர்வதேச டெலிவரிகள் உள்ளூர் டெலிவரிகளைப் போல் இல்லை என்பதை நினைவில் கொள்ளவும், ஏனெனில் அவற்றுக்கு நேரம் தேவை. நன்றி!","parcelWaitText2":"18 நாட்களுக்குப் பிறகு (சிங்கப்பூருக்கு 7 நாட்கள்) அல்லது அதற்கு மேல் எந்த நிலையும் தோன்றவில்லை என்றால், நீங்கள் எங்களுக்கு நேரடியாகத் தெரிவிக்கலாம்.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"பெயர்","parcelOrderNumberLabel":"ஆர்டர் எண் (எடுத்துக்காட்டு: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"மின்னஞ்சல்","parcelEmailNote":"தனிப்பட்ட ரிலே மின்னஞ்சல்கள் ஏற்றுக்கொள்ளப்படவில்லை. செல்லுபடியாகும் மின்னஞ்சல் முகவரியைப் பயன்படுத்தவும்.","parcelShippingMethodLabel":"ஷிப்பிங் முறை தேர்ந்தெடுக்கப்பட்டதா?","parcelSelectShipping":"ஷிப்பிங் முறையைத் தேர்ந்தெடுக்கவும்","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"கண்காணிப்பு எண்","parcelUndeliveredLabel":"உங்கள் பார்சல் 18/30/45 நாட்களுக்கும் மேலாக டெலிவரி செய்யப்படாமல் உள்ளதா? (சிங்கப்பூர் உள்ளூர் சேவைகள் >7 நாட்கள், >14 நாட்கள் ஸ்பீட்போஸ்ட் எக்ஸ்பிரஸ்/DHL)","parcelSelectOption":"ஒரு விருப்பத்தைத் தேர்ந்தெடுக்கவும்","parcelYes":"ஆம்","parcelNo":"இல்லை","parcelDeliveredButMissingLabel":"உங்கள் பார்சல் ஸ்டேட்டஸ் டெலிவரி செய்யப்பட்டதா, ஆனால் அது உங்கள் அஞ்சல்பெட்டியில்/பாதுகாப்பான இடத்தில்/வாசலில் இல்லையா?","parcelCaseReferenceLabel":"உள்ளூர் தபால் அலுவலகத்திலிருந்து வழக்கு குறிப்பு ஐடி","parcelCaseReferencePlaceholder":"நீங்கள் சிங்கப்பூர் என்றால் NA போடுங்கள்","parcelCaseReferenceNote":"இந்தப் படிவத்தைச் சமர்ப்பிப்பதற்கு முன், உங்கள் உள்ளூர் அஞ்சல் அலுவலகத்தைத் தொலைபேசி அல்லது மின்னஞ்சல் மூலம் தொடர்புகொண்டு அவர்களிடமிருந்து வழக்குக் குறிப்பு ஐடியைப் பெறவும். பின்னர், உங்கள் வழக்கு குறிப்பு ஐடியை இங்கே வைக்கவும்.","parcelCaseReferenceLink":"அஞ்சல் சேவை தொடர்புகளுக்கு இந்த இணைப்பைப் பார்க்கவும்","parcelCaseReferenceMandatory":"நீங்கள் சிங்கப்பூரில் இருந்து இருந்தால் மட்டும் NA போடுங்கள். மற்ற நாடுகளுக்கு வழங்குவது கட்டாயமாகும். DHL இன் கேஸ் ஐடிக்கும் ஸ்பீட்போஸ்ட் எக்ஸ்பிரஸுக்கும் தேவை.","parcelImageEvidenceLabel":"பட ஆதாரம் (டெலிவரி செய்யப்பட்ட ஆனால் காணாமல் போன பார்சல்களுக்கு)","parcelImageWarning":"கூடுதல் சரிபார்ப்புக்கு, பார்சல்கள் வழங்கப்படாமல் இருப்பது குறித்து நீங்கள் தவறான கூற்றுக்களைச் செய்யவில்லை என்பதை நிரூபிக்க எங்களுக்கு படச் சான்று தேவை. (ஏற்கனவே டெலிவரி செய்யப்பட்ட பார்சல்களுக்கு மட்டும், ஆனால் அஞ்சல் பெட்டியில்/கதவுக்கு வெளியே இல்லை. டெலிவரி செய்யப்பட்ட பொருட்களுக்கு புகைப்பட ஆதாரம் வழங்கப்படவில்லை என்றால் நாங்கள் உங்கள் கூற்றை நிராகரிக்கலாம். உங்கள் பொருள் டெலிவரி செய்யப்பட்ட நிலையைக் காட்டவில்லை என்றால் இதைப் புறக்கணிக்கவும்.)","parcelImageNote":"1 ஆதரிக்கப்பட்ட கோப்பைப் பதிவேற்றவும்: படம். அதிகபட்சம் 1 GB.","parcelAgreementText":"உங்கள் பார்சலில் நடந்தது உண்மை என்பதை உறுதிசெய்தால், தயவுசெய்து \"ஏற்கிறேன்\" என்பதைக் கிளிக் செய்யவும்.","parcelAgreeCheckbox":"நான் ஒப்புக்கொள்கிறேன்","parcelSuccessMessage":"உங்கள் பார்சல் விசாரணை சமர்ப்பிக்கப்பட்டது! 3-5 வேலை நாட்களில் நாங்கள் பதிலளிப்போம்.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","lookalikeDomainWarning":"இது கண்காணிப்பு எண் அல்ல, ஒரு பார்சல் நிறுவனம் போல் நடிக்கும் இணையதளத்திற்கான இணைப்பு. அங்கு உங்கள் தனிப்பட்ட அல்லது கட்டண விவரங்களை உள்ளிட வேண்டாம்.","lookalikeDomainOfficial":"அதிகாரப்பூர்வ இணையதளம்:"};
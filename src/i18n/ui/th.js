@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus ใช้เครือข่ายเชิงพาณิชย์ระดับพรีเมียมอย่างไรก็ตามช่วงเวลาที่แน่นอนที่จะมาถึงในประเทศของคุณจะมีการถ่ายโอนการดูแลไปยังผู้ให้บริการในประเทศ (เช่น USPS, Royal Mail, DHL ในประเทศ) การติดตามคำนำหน้าเปลี่ยนระบบการจัดการที่เกณฑ์นี้แต่เครื่องมือติดตามพัสดุสากลของเราจะเย็บสถานะเหล่านี้เข้าด้วยกันเพื่อให้คุณมองเห็นได้อย่างต่อเนื่อง","trackingLastMileTitle":"เครือข่ายการจัดส่ง Last-Mile","trackingCustomsClearanceBody":"รายการข้ามพรมแดนทั้งหมดจะต้องเคลียร์หน่วยงานศุลกากรในท้องถิ่นของคุณเครื่องมือของเราจะตรวจสอบการเปลี่ยนแปลงจากการมาถึงของสถานที่นำเข้าไปจนถึงการส่งมอบศุลกากรตำรวจตระเวนชายแดนจะตรวจสอบรหัส HS และตรวจสอบให้แน่ใจว่ามีการส่งภาษีมูลค่าเพิ่มหรือหน้าที่ที่ถูกต้อง (เช่น IOSS ในสหภาพยุโรป VOEC ในนอร์เวย์) ตรวจสอบการติดตามโดยเฉพาะสำหรับคำเตือน \"ที่จัดขึ้นที่ศุลกากร\"","trackingCustomsClearanceTitle":"ข้อมูลพิธีการศุลกากร","trackingProcessingOriginBody":"เมื่อส่งออกแล้วรายการจะเข้าสู่ศูนย์ประมวลผลต้นทางที่มีการสแกนชั่งน้ำหนักและผ่านการคัดกรองความปลอดภัยในการส่งออกหลักจากนั้นจะถูกส่งไปยังการแลกเปลี่ยนทางไปรษณีย์ระหว่างประเทศตารางเที่ยวบินขึ้นอยู่กับแบนด์วิดท์สินค้าที่มีอยู่ไม่ต้องตกใจหากยังคงอยู่ในสถานะนี้เป็นเวลาหลายวัน","trackingProcessingOriginTitle":"การประมวลผลที่ Origin Hub","trackingInfoReceivedBody":"เมื่อมีการประมวลผลคำสั่งซื้อครั้งแรกบนแพลตฟอร์มอีคอมเมิร์ซของเรา (เช่น Etsy, eBay หรือการขายตรง) หมายเลขติดตามจะถูกสร้างขึ้นทางอิเล็กทรอนิกส์ผู้ให้บริการได้รับข้อมูลการจัดส่งก่อนที่กล่องจะมีไว้ในครอบครองโปรดรอ 1 ถึง 3 วันทำการเพื่อให้พัสดุถูกนำเข้าไปในสถานที่คัดแยกทางกายภาพ","trackingInfoReceivedTitle":"ข้อมูลที่ได้รับ","trackingStatusesIntro":"ขอขอบคุณที่ใช้เครื่องมือติดตามพัสดุระหว่างประเทศแบบครบวงจรของเราเนื่องจากแพคเกจการเดินทางของคุณข้ามพรมแดนโลกหลายแห่งสถานะการติดตามอาจซับซ้อนการทำความเข้าใจวงจรชีวิตโลจิสติกส์ช่วยกำหนดความคาดหวังที่ชัดเจน","trackingStatusesTitle":"ทำความเข้าใจสถานะการติดตาม","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"ก่อนเที่ยง","pmText":"หลังเที่ยง","footerQuickLinks":"ลิงก์ด่วน","footerSupportLegal":"การสนับสนุนและกฎหมาย","copyrightText":"สงวนลิขสิทธิ์","tzAEST":"AEST (ซิดนีย์/เมลเบิร์น)","tzACST":"ACST (แอดิเลด)","tzAWST":"AWST (เพิร์ท)","tzNST":"NST (นิวฟันด์แลนด์)","tzAST":"AST (แอตแลนติก)","tzEST":"EST (ตะวันออก)","tzCST":"CST (ตอนกลาง)","tzMST":"MST (ภูเขา)","tzPST":"PST (แปซิฟิก)","tzAKST":"AKST (อะแลสกา)","tzHST":"HST (ฮาวาย)","tzBeijing":"ปักกิ่ง","tzXinjiang":"ซินเจียง","tzWIB":"WIB (จาการ์ตา)","tzWITA":"WITA (มากัสซาร์)","tzWIT":"WIT (จายาปุระ)","tzKaliningrad":"แคว้นคาลินินกราด (UTC+2)","tzMoscow":"มอสโก/รัสเซียตะวันตก (UTC+3)","tzSamara":"แคว้นซามารา (UTC+4)","tzUral":"ภูมิภาคอูราล (UTC+5)","tzOmsk":"แคว้นออมสก์ (UTC+6)","tzKrasnoyarsk":"ดินแดนครัสโนยาสค์ (UTC+7)","tzIrkutsk":"แคว้นอีร์คุตสค์ (UTC+8)","tzSakha":"ซาฮา สาธารณรัฐ (UTC+9)","tzPrimorsky":"ดินแดนปรีมอร์สกี (UTC+10)","tzMagadan":"แคว้นมากาดาน (UTC+11)","tzKamchatka":"ดินแดนคัมชัตคา (UTC+12)","dstDayStartsLabel":"เวลาออมแสงเริ่มต้น","dstDayEndsLabel":"เวลาออมแสงสิ้นสุด","dstRevertsLabel":"กลับสู่เวลามาตรฐาน","dstEuropeLabel":"ยุโรป","dstNewZealandLabel":"นิวซีแลนด์","englishResponseNotice":"หมายเหตุ: การสอบถามทั้งหมดจะตอบกลับเป็นภาษาอังกฤษ หากคุณส่งเป็นภาษาอื่น ข้อความของคุณอาจถูกแปลเป็นภาษาอังกฤษเพื่อการตรวจสอบ","parcelDisagreeCheckbox":"ฉันไม่เห็นด้วย","contactDisagreeCheckbox":"ฉันไม่เห็นด้วย","contactNamePlaceholder":"ตัวอย่าง: สมชาย ใจดี","systemRequirementsTitle":"เวอร์ชันระบบที่รองรับขั้นต่ำ","systemRequirements":"Windows: Windows 7 (with ESU updates installed) หรือสูงกว่า\nmacOS: macOS 12 หรือสูงกว่า\nAndroid: Android 13 หรือสูงกว่า\niPhone/iOS: iOS 17 หรือสูงกว่า\nLinux: ดิสทริบิวชันที่รองรับในปัจจุบันพร้อมอัปเดตความปลอดภัยที่ใช้งานอยู่","title":"ยืนยันการเข้าถึง","subtitle":"กรุณาทำแบบทดสอบด้านล่างเพื่อดำเนินการต่อ","selectLanguage":"เลือกภาษา","selectLanguagePlaceholder":"-- เลือกภาษา --","loadingChallenge":"กำลังโหลดแบบทดสอบ...","answerLabel":"คำตอบของคุณ:","answerPlaceholder":"ป้อนคำตอบของคุณ","continueButton":"ดำเนินการต่อ","refreshButton":"แบบทดสอบใหม่","verifying":"กำลังตรวจสอบ...","chooseLanguageFirst":"กรุณาเลือกภาษาก่อน","loadFailed":"โหลดแบบทดสอบล้มเหลว กรุณาลองอีกครั้ง","expiredChallenge":"แบบทดสอบหมดอายุ กำลังโหลดแบบทดสอบใหม่...","verifyFailed":"การตรวจสอบล้มเหลว กรุณาลองอีกครั้ง","goodFridayEasterGreeting":"สุขสันต์วันอีสเตอร์! ขอให้มีความสงบสุขและความสุขในวันศุกร์ประเสริฐและวันอีสเตอร์.","christmasGreeting":"สุขสันต์วันคริสต์มาสและปีใหม่! ขอให้มีความสงบสุขและความสุขตั้งแต่วันที่ 25 ธันวาคมถึง 5 มกราคม.","captchaSystemRequirements":"ข้อกำหนดขั้นต่ำ: Windows 7 (with ESU updates installed) หรือ 11, macOS 10.15+, หรือ Android/iOS เวอร์ชันล่าสุด.","home":"หน้าหลัก","blog":"บล็อก","aboutUs":"เกี่ยวกับเรา","faq":"คำถามที่พบบ่อย","contact":"ติดต่อเรา","trackPackage":"ติดตามพัสดุ","cnyYearOfHorseMessage":"🧧 สุขสันต์วันปีใหม่ทางจันทรคติ! ขอให้คุณรุ่งเรืองและมีความสุขในปีมะเมีย! 🐴","vesakMessage":"☸️ สุขสันต์วันวิสาขบูชา! ขอให้คุณได้รับความสงบและปัญญาในวันศักดิ์สิทธิ์นี้! 🙏","vesakTHMessage":"☸️ สุขสันต์วันวิสาขบูชา! ขอให้คุณได้รับความสงบและปัญญาในวันศักดิ์สิทธิ์นี้! 🙏","singaporeNationalDayMessage":"🇸🇬 สุขสันต์วันชาติสิงคโปร์! ฉลอง 61 ปีแห่งเอกราช! 🎉","indonesiaNationalDayMessage":"🇮🇩 สุขสันต์วันเอกราชอินโดนีเซีย! ชัยชนะแก่สาธารณรัฐอินโดนีเซีย! 🎊","malaysiaNationalDayMessage":"🇲🇾 สุขสันต์วันชาติมาเลเซีย! ฉลองเอกราชของประเทศเรา! 🎊","australiaNationalDayMessage":"🇦🇺 สุขสันต์วันออสเตรเลีย! ฉลองชาติของเรา! 🎉","canadaNationalDayMessage":"🇨🇦 สุขสันต์วันแคนาดา! ฉลองชาติอันยิ่งใหญ่ของเรา! 🍁","usaNationalDayMessage":"🇺🇸 สุขสันต์วันเอกราช อเมริกา! ฉลองเสรีภาพและอิสระ! 🎆","franceBastilleDayMessage":"🇫🇷 สุขสันต์วันที่ 14 กรกฎาคม! ไชโยฝรั่งเศส! 🎊","germanyUnityDayMessage":"🇩🇪 สุขสันต์วันรวมชาติเยอรมนี! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 สุขสันต์วันสาธารณรัฐ! 🇮🇹","spainNationalDayMessage":"🇪🇸 สุขสันต์วันชาติสเปน! 🎊","japanFoundationDayMessage":"🇯🇵 สุขสันต์วันสถาปนาชาติ ญี่ปุ่น! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 สุขสันต์วันชาติ จีน! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 สุขสันต์วันปลดปล่อย เกาหลี! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 สุขสันต์วันเอกราช อินเดีย! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 สุขสันต์วันเอกราช ฟิลิปปินส์! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 สุขสันต์วันชาติ เวียดนาม! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 สุขสันต์วันเอกราช โปแลนด์! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 สุขสันต์วันเอกราช สาธารณรัฐเช็ก! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 สุขสันต์วันกษัตริย์! ทรงพระเจริญ! 🧡","norwayConstitutionDayMessage":"🇳🇴 ขอแสดงความยินดี นอร์เวย์! 🇳🇴","swedenNationalDayMessage":"🇸🇪 สุขสันต์วันชาติสวีเดน! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 สุขสันต์วันเอกราช ฟินแลนด์! 🇫🇮","portugalNationalDayMessage":"🇵🇹 สุขสันต์วันโปรตุเกส! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! สุขสันต์วันเอกราช อิสราเอล! 🎉","irelandNationalDayMessage":"🇮🇪 สุขสันต์วันเซนต์แพทริก ไอร์แลนด์! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 สุขสันต์วันชาติบรูไน! 🎊","newZealandWaitangiDayMessage":"🇳🇿 สุขสันต์วันไวแทงจิ นิวซีแลนด์! 🎉","switzerlandNationalDayMessage":"🇨🇭 สุขสันต์วันชาติสวิตเซอร์แลนด์! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 สุขสันต์วันชาติ ออสเตรีย! 🎉","belgiumNatcionalDayMessage":"🇧🇪 สุขสันต์วันชาติ เบลเยียม! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! สุขสันต์วันรัสเซีย! 🎉","taiwanFoundingDayMessage":"🇹🇼 สุขสันต์วันก่อตั้ง, ไต้หวัน! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 สุขสันต์วันดับเบิลเทน, ไต้หวัน! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 สุขสันต์วันก่อตั้งเขตบริหารพิเศษฮ่องกง! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 สุขสันต์วันก่อตั้งเขตบริหารพิเศษมาเก๊า! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ สุขสันต์วันแรงงานสากล! ฉลองแรงงานและสิทธิคนงาน! 🎊","laborDayUSCAMessage":"⚒️ สุขสันต์วันแรงงาน! เทิดเกียรติผลงานของคนงาน! 🎉","orderNumber":"หมายเลขคำสั่งซื้อ (ตัวอย่าง: RTNX1234567890)","fromDate":"จากวันที่ (จำเป็น)","toDate":"ถึงวันที่ (จำเป็น)","trackParcel":"ติดตามพัสดุ","selectCourier":"-- เลือกผู้ขนส่ง / ประเทศ --","optionSingPost":"🇸🇬 สไปรษณีย์สิงคโปร์ (SingPost)","singaporeCouriers":"บริษัทขนส่งสิงคโปร์","topCountries":"5 อันดับแรก","otherCountries":"ประเทศอื่น ๆ","note":"หมายเหตุ","disclaimer":"ข้อจำกัดความรับผิดชอบ","importantInformation":"ข้อมูลสำคัญ:","didNotReceiveEmail":"หากคุณไม่ได้รับอีเมลยืนยันจาก Etsy, eBay, Shopee หรือ Payhip โปรดเลื่อนลงด้านล่างเพื่อค้นหาคำสั่งซื้อของคุณผ่านทีอยู่อีเมลหรือหมายเลขโทรศัพท์ที่เชื่อมโยงกับคำสั่งซื้อนี้","searchByEmailOrPhone":"ค้นหาตามอีเมลหรือโทรศัพท์","searchOrder":"ค้นหาคำสั่งซื้อ","trackingResult":"ผลการติดตาม","noOrdersFound":"ไม่พบคำสั่งซื้อ","pleaseEnter":"โปรดป้อนอีเมล หมายเลขโทรศัพท์ หรือหมายเลขคำสั่งซื้อ","fillAllFields":"โปรดกรอกฟิลด์ที่จำเป็นทั้งหมด: หมายเลขติดตาม, ประเทศปลายทาง, หมายเลขคำสั่งซื้อ และรหัสไปรษณีย์","noOrderMatchingFields":"ไม่พบคำสั่งซื้อที่ตรงกับฟิลด์ทั้งหมด","postcodeRequired":"ต้องการรหัสไปรษณีย์สำหรับปลายทางนี้","invalidUSZip":"รหัสไปรษณีย์สหรัฐอเมริกาไม่ถูกต้อง ใช้ 5 หลักหรือ ZIP+4","failedGenerateURL":"สร้าง URL ติดตามล้มเหลว โปรดตรวจสอบข้อมูลที่ป้อน","trackingValidationSG":"หมายเลขติดตามสำหรับสิงคโปร์ต้องเป็น: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG หรือ PX123456789SG สำหรับ DHL ใช้หมายเลข 10 หลัก","invalidSingPostFormat":"รูปแบบหมายเลขติดตาม SingPost ไม่ถูกต้อง\nรูปแบบที่ยอมรับ:\n• PP123456789SG → ป้ายติดตามแบบเติมเงินล่วงหน้า\n• SPNDD00012345 → การติดตาม SpeedPost มาตรฐาน","welcomeTitle":"ยินดีต้อนรับสู่เว็บไซต์ Rhythm Nexus!","purchaseInfo":"ซื้อจากเราผ่านช่องทางอย่างเป็นทางการ หรือเข้าร่วม","purchaseInfoChina":"สั่งซื้อผ่านช่องทางทางการของเรา","purchaseInfoChinaSuffix":"","telegramGroup":"กลุ่ม Telegram","forUpdates":"ของเราเพื่อรับข้อมูลอัปเดตอย่างเป็นทางการ","ourStores":"ร้านค้าของเรา","etsyStore":"ร้านค้า Etsy","ebayStore":"ร้านค้า eBay","shopeeStore":"ร้านค้า Shopee","payhipStore":"ร้านค้า Payhip","internationalShipping":"การจัดส่งระหว่างประเทศ","singaporeLocal":"สิงคโปร์ในประเทศ","asiaOnly":"เฉพาะเอเชีย","deliveryInfo":"ข้อมูลการจัดส่ง","deliveryRates2026":"อัตราการจัดส่ง 2026","sgDeliveryRates":"อัตราการจัดส่งสิงคโปร์","speedPostRates":"อัตรา SpeedPost Express ระหว่างประเทศ","aboutTitle":"เกี่ยวกับ Rhythm Nexus","aboutP1":"เราเริ่มร้านค้าของเราในปี 2022 และได้ขายบน Etsy, eBay และ Shopee","aboutP2":"เราสร้างชื่อเสียงที่แข็งแกร่งด้วยการมุ่งเน้นไปที่การปฏิบัติตามที่เชื่อถือได้และการติดตามที่แม่นยำ","aboutP3":"เป้าหมายของเราคือการให้ประสบการณ์การช็อปปิ้งที่ราบรื่นและน่าเชื่อถือ","aboutP4":"ขอบคุณที่สนับสนุน Rhythm Nexus","faqTitle":"คำถามที่พบบ่อย","faqQ1":"ถ้าสินค้าของฉันมีข้อบกพร่องล่ะ? มีการรับประกันหรือไม่?","faqA1":"ใช่! คำสั่งซื้อส่วนใหญ่มาพร้อมการรับประกัน 1 ปี โปรดให้หมายเลขใบแจ้งหนี้/คำสั่งซื้อของคุณเพื่อให้เราตรวจสอบ หมายเหตุ: การแลกเปลี่ยนไม่ได้รับอนุญาตหากสินค้าตรงกับคำอธิบาย แม้ว่าคุณจะสั่งซื้อผิดพลาดก็ตาม","faqQ2":"ฉันสามารถแก้ไข อัปเดต หรือยกเลิกคำสั่งซื้อของฉันได้หรือไม่?","faqA2":"ได้ เพื่อความปลอดภัย การเปลี่ยนแปลงคำสั่งซื้ออาจต้องดำเนินการผ่านทางอีเมลหรือในแบบฟอร์มติดต่อของเรา","faqQ3":"ฉันต้องจ่ายภาษีศุลกากร/นำเข้าหรือไม่?","faqA3":"ภาษีศุลกากรและอากรโดยทั่วไปไม่ได้จ่ายล่วงหน้า ยกเว้น DDP ไปยังสหรัฐอเมริกา VAT อาจมีผลบังคับใช้สำหรับ EU, UK, AU/NZ, นอร์เวย์, สวิตเซอร์แลนด์ และจังหวัดแคนาดาเช่น Saskatchewan และ Manitoba ซึ่งชำระเงินโดยค่าเริ่มต้นแล้ว ไม่มี GST สำหรับสิงคโปร์ เราไม่สามารถให้คำแนะนำเกี่ยวกับค่าธรรมเนียมศุลกากร - ติดต่อศุลกากรท้องถิ่นของคุณสำหรับรายละเอียด","faqQ4":"คำสั่งซื้อของฉันจะจัดส่งเมื่อใด?","faqA4":"คำสั่งซื้อมักจะจัดส่งภายใน 1-5 วันทำการ ในช่วงเวลาที่มีปริมาณสูง อาจใช้เวลา 5-7 วัน","faqQ5":"ฉันสั่งซื้อสองครั้งโดยบังเอิญ ฉันควรทำอย่างไร?","faqA5":"เราคืนเงินค่าจัดส่งที่ซ้ำกันเท่านั้น สินค้าทั้งสองจะถูกจัดส่งไปด้วยกัน การคืนเงิน = (ค่าจัดส่งครั้งแรก + ครั้งที่สอง) - ค่าจัดส่งจริง","faqQ6":"การจัดส่งใช้เวลานานแค่ไหน?","faqA6":"การประมวลผลใช้เวลา 1-5 วันทำการ\n\nการจัดส่งในประเทศ:\n• SingPost Prepaid Tracked Label: 2–4 วัน\n• SpeedPost Standard: 1–3 วัน\n\nระหว่างประเทศ:\n• SingPost ePAC: 14-30 วัน\n• SpeedPost Priority (EMS): 8-15 วัน\n• SpeedPost Express: 4-8 วัน\n\nอาจเกิดความล่าช้าในช่วงฤดูกาลเร่งด่วน","faqQ7":"สินค้าของฉันกำลังถูกส่งกลับไปยังผู้ส่ง ฉันควรทำอย่างไร?","faqA7":"อนุญาตให้จัดส่งใหม่หนึ่งครั้ง ไม่สามารถยกเลิกได้สำหรับที่อยู่ไม่ถูกต้อง พัสดุที่ไม่ได้รับ หรือค่าธรรมเนียมศุลกากรที่ยังไม่ได้ชำระ ติดต่อบริการไปรษณีย์ของคุณเพื่อส่งมอบอีกครั้ง หรือส่งข้อความถึงเราเพื่อขอความช่วยเหลือ","faqQ8":"สินค้าของฉันสูญหาย / ถูกขโมยระหว่างการขนส่ง","faqA8":"เราอนุญาตให้จัดส่งใหม่หนึ่งครั้ง หากสูญหายอีกครั้ง จะออกการคืนเงินเต็มจำนวนหลังจากช่วงเวลาจัดส่งของผู้ขนส่ง:\n\n• บริการท้องถิ่นสิงคโปร์: 7 วัน\n• SingPost ePAC และ SpeedPost Priority International: 30 วัน\n• SpeedPost Intl Express: 14 วัน","blogTitle":"ฐานความรู้เกี่ยวกับการจัดส่งและไปรษณีย์","blogSubtitle":"คำอธิบายอย่างเป็นทางการเกี่ยวกับบริการไปรษณีย์","readMore":"อ่านเพิ่มเติม","backButton":"กลับ","blogPost1Title":"SingPost ePAC คืออะไร?","blogPost1Desc":"เรียนรู้เกี่ยวกับ ePAC","blogPost2Title":"SpeedPost Priority International (EMS) คืออะไร?","blogPost2Desc":"ค้นพบ EMS","blogPost3Title":"SpeedPost Express คืออะไร?","blogPost3Desc":"สำรวจ SpeedPost Express","blogPost4Title":"USA PDDP","blogPost4Desc":"ทำความเข้าใจ PDDP","blogPost5Title":"EU VAT & IOSS","blogPost5Desc":"ข้อมูลเชิงลึกเกี่ยวกับ VAT ของสหภาพยุโรป","blogPost6Title":"UK VAT & HMRC","blogPost6Desc":"ข้อกำหนด VAT ของสหราชอาณาจักร","blogPost7Title":"Norway VOEC","blogPost7Desc":"ระบบ VOEC ของนอร์เวย์","blogPost8Title":"Swiss VAT","blogPost8Desc":"ข้อกำหนด VAT ของสวิตเซอร์แลนด์","enterDestinationPostcode":"ป้อนรหัสไปรษณีย์ปลายทาง","trackingNumberExample":"เช่น LG123456789SG","trackingCaseSensitive":"ตัวอักษรการติดตามต้องคำนึงถึงตัวพิมพ์เล็กใหญ่และต้องเป็นตัวพิมพ์ใหญ่","usaPostcodeNote":"สำหรับประเทศที่ไม่มีรหัสไปรษณีย์ เช่น ฮ่องกงและมาเก๊า โปรดใส่ 999077 (ฮ่องกง) หรือ 999078 (มาเก๊า)","epacDeliveryNote":"โปรดทราบว่า รายการ ePAC ทั้งหมดที่ส่งไปยังปลายทางควรได้รับการจัดส่งไปยังกล่องจดหมาย หน้าประตู ตู้พัสดุของคุณ หรือทิ้งไว้ในที่ปลอดภัย!","currentTime":"เวลาปัจจุบัน","timezoneNote":"เวลาแสดงในรูปแบบ 12 ชั่วโมง","sameTimeAsSingapore":"เวลาเดียวกับสิงคโปร์","hourAhead":"ชั่วโมงนำหน้าสิงคโปร์","hoursAhead":"ชั่วโมงนำหน้าสิงคโปร์","hourBehind":"ชั่วโมงล่าช้ากว่าสิงคโปร์","hoursBehind":"ชั่วโมงล่าช้ากว่าสิงคโปร์","countriesNoMailbox":"ประเทศที่ทราบว่าไม่มีบริการจัดส่งผ่านกล่องจดหมาย/ตู้จดหมาย: บรูไน จีน อินเดีย อิสราเอล มาเก๊า SAR จีน ฟิลิปปินส์ โปแลนด์ และเวียดนาม","rhythmNexusNotResponsible":"Rhythm Nexus ไม่รับผิดชอบในการจัดการการจัดส่งเนื่องจากอยู่นอกเหนือการควบคุมของเรา และเราขอให้คุณติดตามสถานะสินค้าของคุณแทน","issuesAfterDelivery":"หากมีปัญหาใดๆ กับการจัดส่งของคุณหลังจาก 30/45 วัน (14 วันสำหรับ SpeedPost Express) หรือสถานะแสดงว่าจัดส่งแล้วแต่คุณไม่ได้รับ โปรดติดต่อเรา","cannotUseEmbed":"เราไม่สามารถใช้การฝังสำหรับการติดตามได้ เนื่องจากเว็บไซต์บริการไปรษณีย์ส่วนใหญ่ไม่รองรับ","clickLinkAbove":"โปรดคลิกที่ลิงก์ด้านบนเพื่อติดตามพัสดุของคุณ","trackingDetailsNote":"โปรดทราบว่ารายละเอียดการติดตามอาจไม่แสดงในผลการค้นหา ดังนั้นจึงแนะนำให้วางหมายเลขติดตามลงในระบบเพื่อติดตามสินค้า","thirdPartyWebsites":"คุณยังสามารถติดตามพัสดุของคุณบนเว็บไซต์บุคคลที่สามเหล่านี้ได้:","enterEmailOrPhone":"ป้อนอีเมลหรือโทรศัพท์","collectAtPostOffice":"อย่างไรก็ตาม หากประเทศของคุณไม่มีกล่องจดหมายเป็นมาตรฐาน คุณจะต้องไปรับที่ที่ทำการไปรษณีย์","reviewShippingRates":"ตรวจสอบอัตราค่าจัดส่งปัจจุบันของเรา","here":"ที่นี่","contactUsForm":"โปรดติดต่อเราผ่าน","form":"แบบฟอร์มนี้","forEnquiries":"สำหรับคำถามใดๆ ที่คุณมีเกี่ยวกับคำสั่งซื้อของคุณ","anPostNoDirectTracking":"An Post (ไอร์แลนด์) ไม่รองรับลิงก์ติดตามโดยตรงหรือการติดตามแบบฝัง","anPostPasteManually":"โปรดวางหมายเลขติดตามของคุณด้วยตนเองบนเว็บไซต์ An Post","goToAnPost":"ไปที่ An Post","countryMsgNL":"หากสถานะแสดง 'Held by Customs' โปรดติดต่อสายข้อมูลศุลกากรเนเธอร์แลนด์เพื่อขอความช่วยเหลือ:\n0800 0143 (ฟรี) จันทร์-ศุกร์ 7:00-23:00\nเสาร์และอาทิตย์ 8:00-16:30\n\nแนะนำให้ลงทะเบียนบัญชีกับ PostNL เพื่อรับการแจ้งเตือนพัสดุของคุณทันที:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nหากส่งไปยังจุด PostNL หรือสถานะบอกให้คุณไปรับที่ไปรษณีย์ คุณจะต้องจ่าย 7 EUR ที่เคาน์เตอร์ สูงสุด 4 EUR หากจ่ายออนไลน์","countryMsgDE":"เราแนะนำให้คุณดาวน์โหลดแอป Post & DHL เพื่อรับการแจ้งเตือนสถานะการติดตามพัสดุของคุณ:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nติดต่อฝ่ายบริการลูกค้า DHL Paket GmbH:\n+49-228-433-3112\nติดต่อ DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"คุณต้องยื่นใบแจ้งการนำเข้าเพิ่มเติมกับศุลกากร หากไม่ทำอาจทำให้มีข้อจำกัดในการเข้าและพัสดุถูกส่งคืน \nข้อมูลเพิ่มเติม: https://www.posti.fi/en/receiving/customs-clearance \nลิงก์อื่นๆ: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"จะมีค่าธรรมเนียมการจัดการ 4.95 EUR\nดาวน์โหลดแอปที่นี่: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"จะมีค่าธรรมเนียมการจัดการ 8.50 PLN \nคุณจะต้องจ่ายเมื่อรับที่ไปรษณีย์\nเนื่องจากพัสดุมีโอกาสน้อยที่จะส่งถึงประตูบ้านหรือกล่องจดหมายของคุณ","countryMsgPH":"PHLPost ในฟิลิปปินส์ถือว่าไม่มีประสิทธิภาพและไม่น่าเชื่อถือ\nโปรดติดตามพัสดุของคุณเสมอเนื่องจากสถานะ 'กำลังจัดส่ง'\nบางครั้งจะแสดงเพียง 1-3 สัปดาห์สำหรับพัสดุขนาดเล็ก สำหรับพัสดุขนาดใหญ่\nการรับจะทำได้เฉพาะที่ Manila Central Post Office หรือ\nไปรษณีย์ใกล้บ้านคุณเท่านั้น โปรดทราบว่ามีค่าธรรมเนียมการจัดการ 112 PHP สำหรับพัสดุ\nทุกมูลค่าที่คุณต้องจ่าย หากไม่จ่ายพัสดุจะถูก\nส่งคืนให้เรา คาดว่าการจัดส่งจะใช้เวลา 1-2 เดือนเนื่องจากบริการที่ช้าของ PHLPost \nคุณไม่ต้องเสียภาษีสำหรับสินค้าต่ำกว่า 10000 PHP แต่คุณจะต้องเสียหากมูลค่าเท่ากับหรือสูงกว่านั้น \nเราแนะนำ SpeedPost Express สำหรับกระบวนการที่เร็วขึ้นในครั้งต่อไปที่คุณสั่งซื้อจากเรา อย่างไรก็ตามค่าธรรมเนียมอาจไม่นำมาใช้เนื่องจาก D&T สำหรับผู้รับเป็นค่าเริ่มต้น","countryMsgCA":"De minimis คือ 20 CAD สำหรับคำสั่งซื้อทั้งหมดที่ส่งไปแคนาดา เนื่องจากสิงคโปร์เป็นส่วนหนึ่งของข้อตกลง CPTPP อากรอาจไม่มีผล แต่ D&T อาจมีผลหากสินค้าเกินเกณฑ์ 60 CAD ขึ้นไปหรือ 100 CAD ขึ้นไป ซึ่งอาจขึ้นอยู่กับรหัส HS ของสินค้า มูลค่าใดๆ ที่เกินจำนวนนั้นจะถูกเรียกเก็บ VAT ตามนั้น","countryMsgID":"คุณต้องชำระภาษีและอากรที่มีผลบังคับใช้เมื่อมาถึงอินโดนีเซีย โปรดติดตามพัสดุของคุณและชำระจำนวนเงินที่ระบุให้กับศุลกากรอินโดนีเซีย\nคุณยังต้องยื่นเอกสารการผ่านพิธีการศุลกากรเพิ่มเติม หากไม่ทำอาจทำให้มีข้อจำกัดในการเข้าหรือพัสดุถูกยึดโดยศุลกากรของประเทศ โปรดตรวจสอบรายละเอียดเพิ่มเติมที่นี่:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"คุณต้องชำระภาษีและอากรที่มีผลบังคับใช้เมื่อมาถึงอินเดีย โปรดติดตามพัสดุของคุณและชำระจำนวนเงินที่ระบุให้กับศุลกากรอินเดีย\nโปรดทราบว่าการผ่านพิธีการศุลกากรในอินเดียมีความเข้มงวด และคุณอาจหรืออาจไม่ถูกเรียกเก็บอากรหากมูลค่าสินค้าของคุณเกิน 1000 INR (15 USD) - ขึ้นอยู่กับรหัส HS ในกรณีส่วนใหญ่เป็นการปลอดอากร แต่คุณอาจถูกเรียกเก็บอากรที่สูงขึ้นหากสินค้าเกิน 5000 INR (60 USD) \nเนื่องจาก India Post ไม่ส่งถึงกล่องจดหมายตามมาตรฐาน คุณอาจต้องอยู่บ้านหรือเป็นตัวแทนที่ได้รับอนุญาตเพื่อรับพัสดุของคุณหรือรับที่ไปรษณีย์","countryMsgMY":"De minimis คือ 500 MYR สำหรับคำสั่งซื้อทั้งหมดที่ส่งไปมาเลเซีย คำสั่งซื้อที่เกินจำนวนนั้นอาจถูกเรียกเก็บ","countryMsgUS":"ตั้งแต่วันที่ 29 สิงหาคม 2025 de minimis 800 USD จะถูกยกเลิกอย่างเป็นทางการ และอากรนำเข้าจะต้องชำระโดยผู้ส่งในประเทศต้นทางตามค่าเริ่มต้น\nการจัดส่งไปยังสหรัฐอเมริกาต้องการหมายเลขโทรศัพท์และที่อยู่อีเมลที่ถูกต้องเพื่อให้พัสดุของคุณหลีกเลี่ยงความล่าช้าเพิ่มเติม","countryMsgIL":"De minimis คือ 240 ILS (75 USD) สำหรับการจัดส่งทั้งหมดไปอิสราเอล คำสั่งซื้อที่เกินจำนวนนั้นอาจถูกเรียกเก็บ \nโปรดทราบว่าสำหรับคำสั่งซื้อที่ส่งไปอิสราเอล Israel Post บางครั้งอาจไม่รับรองการจัดส่งขั้นสุดท้ายเมื่อจัดส่งแล้ว \nเนื่องจาก Israel Post ไม่ส่งถึงกล่องจดหมายตามมาตรฐาน คุณอาจต้องอยู่บ้านหรือเป็นตัวแทนที่ได้รับอนุญาตเพื่อรับพัสดุของคุณหรือรับที่ไปรษณีย์","countryMsgGB":"โปรดทราบว่าสำหรับคำสั่งซื้อที่ส่งไปสหราชอาณาจักร Royal Mail บางครั้งอาจไม่รับรองการจัดส่งขั้นสุดท้ายเมื่อจัดส่งไปยังกล่องจดหมายของคุณแล้ว","countryMsgTH":"De minimis คือ 1500 THB (45 USD) สำหรับการจัดส่งทั้งหมดไปไทย คำสั่งซื้อที่เกินจำนวนนั้นอาจถูกเรียกเก็บ","countryMsgTW":"De minimis คือ 2000 TWD (60 USD) สำหรับการจัดส่งทั้งหมดไปไต้หวัน คำสั่งซื้อที่เกินจำนวนนั้นอาจถูกเรียกเก็บ","countryMsgMO":"ไม่มีการเรียกเก็บ D&T เมื่อส่งไปมาเก๊า อย่างไรก็ตามโปรดทราบว่า Macau Post ไม่ส่งถึงกล่องจดหมายตามมาตรฐาน คุณต้องรับพัสดุของคุณที่ไปรษณีย์","countryMsgBN":"ไม่มีการเรียกเก็บ D&T เมื่อส่งไปบรูไน อย่างไรก็ตามโปรดทราบว่า Brunei Post ไม่ส่งถึงกล่องจดหมายตามมาตรฐาน คุณต้องรับพัสดุของคุณที่ไปรษณีย์ \nระบบติดตามสำหรับประเทศนี้ไม่ค่อยเสถียรและให้ข้อมูลจำกัด และผลการจัดส่งขั้นสุดท้ายจะไม่ให้กับต้นทาง","countryMsgJP":"De minimis คือ 10000 JPY (65 USD) สำหรับการจัดส่งทั้งหมดไปญี่ปุ่น คำสั่งซื้อที่เกินจำนวนนั้นอาจถูกเรียกเก็บ","countryMsgKR":"De minimis คือ 180000 KRW (150 USD) สำหรับการจัดส่งทั้งหมดไปเกาหลีใต้ คำสั่งซื้อที่เกินจำนวนนั้นอาจถูกเรียกเก็บ","countryMsgVN":"สำหรับเวียดนาม โปรดติดต่อได้ระหว่างการจัดส่งเนื่องจากคุณอาจถูกเรียกเก็บค่าธรรมเนียมการจัดการเมื่อจัดส่งสินค้า \nDe minimis คือ 1000000 (35 USD) สำหรับการจัดส่งทั้งหมดไปเวียดนาม คำสั่งซื้อที่เกินจำนวนนั้นอาจถูกเรียกเก็บ \nเนื่องจาก Vietnam Post ไม่ส่งถึงกล่องจดหมายตามมาตรฐาน คุณอาจต้องอยู่บ้านหรือเป็นตัวแทนที่ได้รับอนุญาตเพื่อรับพัสดุของคุณหรือรับที่ไปรษณีย์","countryMsgPP":"สินค้า Tracked Label จะถูกส่งใน POPDrop/POPStop ที่ไปรษณีย์ สินค้า SpeedPost Standard มักจะถูกส่งใน POPStop หรือ POPStation\nโปรดทราบว่าการจัดส่งสินค้า Tracked Label จะทำเฉพาะวันจันทร์-ศุกร์ เวลา 9:00-18:00 ยกเว้นวันหยุดสุดสัปดาห์และวันหยุดนักขัตฤกษ์","postedDate":"วันที่ส่ง:","status":"สถานะ:","shippedVia":"ส่งผ่าน:","destination":"ปลายทาง:","statusInPreparation":"กำลังเตรียม","statusInTransit":"อยู่ระหว่างการขนส่ง","statusDelivered":"จัดส่งแล้ว","statusOutForDelivery":"กำลังจัดส่ง","statusArrived":"มาถึงแล้ว","statusProcessing":"กำลังดำเนินการ","statusDispatched":"ส่งออกแล้ว","statusReturned":"ส่งคืนแล้ว","statusFailed":"จัดส่งไม่สำเร็จ","statusCancelled":"ยกเลิกแล้ว","statusHeldByCustoms":"ถูกศุลกากรยึดไว้","statusAwaitingCollection":"รอการเก็บ","aka":"หรือที่เรียกว่า","thisServiceKnownAs":"บริการนี้เรียกว่า","in":"ใน","viewTrackingDHL":"ดูข้อมูลการติดตามจาก DHL Express","viewTrackingSingPostSpeedPost":"ดูข้อมูลการติดตามจาก Singapore SpeedPost","viewTrackingDHLLastMile":"ดูข้อมูลการติดตามจาก DHL Express (ไมล์สุดท้าย)","viewTrackingDHLShipperRef":"ดูข้อมูลการติดตามจาก DHL Express (หมายเลขอ้างอิงผู้ส่ง)","viewTrackingSingPost":"ดูข้อมูลการติดตามจาก Singapore Post","viewTrackingDestPost":"ดูข้อมูลการติดตามจาก","post":"ไปรษณีย์","orderNumberExample":"หมายเลขคำสั่งซื้อ (เริ่มต้นด้วย RTNX - ตัวอย่าง: RTNX1234567890):","deliveryRecordNote":"โปรดทราบว่าเมื่อสินค้าถูกส่งมอบแล้ว บันทึกจะถูกเก็บไว้เพียง 7 วันเท่านั้นและจะถูกลบ","copyrightAllRights":"สงวนลิขสิทธิ์","countryAF":"อัฟกานิสถาน","countryAL":"แอลเบเนีย","countryDZ":"แอลจีเรีย","countryAS":"อเมริกันซามัว","countryAD":"อันดอร์รา","countryAO":"แองโกลา","countryAI":"แองกวิลลา","countryAQ":"แอนตาร์กติกา","countryAG":"แอนติกาและบาร์บูดา","countryAR":"อาร์เจนตินา","countryAM":"อาร์เมเนีย","countryAW":"อรูบา","countryAU":"🇦🇺 ออสเตรเลีย","countryAT":"🇦🇹 ออสเตรีย","countryAZ":"อาเซอร์ไบจาน","countryBS":"บาฮามาส","countryBH":"บาห์เรน","countryBD":"บังคลาเทศ","countryBB":"บาร์เบโดส","countryBY":"เบลารุส","countryBE":"🇧🇪 เบลเยียม","countryBZ":"เบลีซ","countryBJ":"เบนิน","countryBM":"เบอร์มิวดา","countryBT":"ภูฏาน","countryBO":"โบลิเวีย","countryBA":"บอสเนียและเฮอร์เซโกวีนา","countryBW":"บอตสวานา","countryBV":"เกาะบูเวต","countryBR":"บราซิล","countryIO":"บริติชอินเดียนโอเชียนเทร์ริทอรี","countryBN":"🇧🇳 บรูไน","countryBG":"บัลแกเรีย","countryBF":"บูร์กินาฟาโซ","countryBI":"บุรุนดี","countryKH":"กัมพูชา","countryCM":"แคเมอรูน","countryCA":"🇨🇦 แคนาดา","countryCV":"เคปเวิร์ด","countryKY":"หมู่เกาะเคย์แมน","countryCF":"สาธารณรัฐแอฟริกากลาง","countryTD":"ชาด","countryCL":"ชิลี","countryCN":"🇨🇳 จีน","countryCX":"เกาะคริสต์มาส","countryCC":"หมู่เกาะโคโคส (คีลิง)","countryCO":"โคลอมเบีย","countryKM":"คอโมโรส","countryCG":"คองโก","countryCD":"สาธารณรัฐประชาธิปไตยคองโก","countryCK":"หมู่เกาะคุ้ก","countryCR":"คอสตาริกา","countryCI":"โกตดิวัวร์","countryHR":"โครเอเชีย","countryCU":"คิวบา","countryCY":"ไซปรัส","countryCZ":"🇨🇿 เช็กเกีย","countryDK":"เดนมาร์ก","countryDJ":"จิบูตี","countryDM":"โดมินิกา","countryDO":"สาธารณรัฐโดมินิกัน","countryEC":"เอกวาดอร์","countryEG":"อียิปต์","countrySV":"เอลซัลวาดอร์","countryGQ":"อิเควทอเรียลกินี","countryER":"เอริเทรีย","countryEE":"เอสโตเนีย","countryET":"เอธิโอเปีย","countryFK":"หมู่เกาะฟอล์กแลนด์","countryFO":"หมู่เกาะแฟโร","countryFJ":"ฟิจิ","countryFI":"🇫🇮 ฟินแลนด์","countryFR":"🇫🇷 ฝรั่งเศส","countryGF":"เฟรนช์เกียนา","countryPF":"เฟรนช์โปลินีเซีย","countryTF":"เฟรนช์เซาเทิร์นเทร์ริทอรีส์","countryGA":"กาบอง","countryGM":"แกมเบีย","countryGE":"จอร์เจีย","countryDE":"🇩🇪 เยอรมนี","countryGH":"กานา","countryGI":"ยิบรอลตาร์","countryGR":"กรีซ","countryGL":"กรีนแลนด์","countryGD":"เกรเนดา","countryGP":"กวาเดอลูป","countryGU":"กวม","countryGT":"กัวเตมาลา","countryGN":"กินี","countryGW":"กินี-บิสเซา","countryGY":"กายอานา","countryHT":"เฮติ","countryHM":"เกาะเฮิร์ดและหมู่เกาะแมคโดนัลด์","countryVA":"นครรัฐวาติกัน","countryHN":"ฮอนดูรัส","countryHK":"🇭🇰 ฮ่องกง","countryHU":"ฮังการี","countryIS":"ไอซ์แลนด์","countryIN":"🇮🇳 อินเดีย","countryID":"🇮🇩 อินโดนีเซีย","countryIR":"อิหร่าน","countryIQ":"อิรัก","countryIE":"🇮🇪 ไอร์แลนด์","countryIL":"🇮🇱 อิสราเอล","countryIT":"🇮🇹 อิตาลี","countryJM":"จาเมกา","countryJP":"🇯🇵 ญี่ปุ่น","countryJO":"จอร์แดน","countryKZ":"คาซัคสถาน","countryKE":"เคนยา","countryKI":"คิริบาส","countryKP":"เกาหลีเหนือ","countryKR":"🇰🇷 เกาหลีใต้","countryKW":"คูเวต","countryKG":"คีร์กีซสถาน","countryLA":"ลาว","countryLV":"ลัตเวีย","countryLB":"เลบานอน","countryLS":"เลโซโท","countryLR":"ไลบีเรีย","countryLY":"ลิเบีย","countryLI":"ลิกเตนสไตน์","countryLT":"ลิทัวเนีย","countryLU":"ลักเซมเบิร์ก","countryMO":"🇲🇴 มาเก๊า","countryMK":"นอร์ทมาซิโดเนีย","countryMG":"มาดากัสการ์","countryMW":"มาลาวี","countryMY":"🇲🇾 มาเลเซีย","countryMV":"มัลดีฟส์","countryML":"มาลี","countryMT":"มอลตา","countryMH":"หมู่เกาะมาร์แชลล์","countryMQ":"มาร์ตินีก","countryMR":"มอริเตเนีย","countryMU":"มอริเชียส","countryYT":"มายอต","countryMX":"เม็กซิโก","countryFM":"ไมโครนีเซีย","countryMD":"มอลโดวา","countryMC":"โมนาโก","countryMN":"มองโกเลีย","countryME":"มอนเตเนโกร","countryMS":"มอนต์เซอร์รัต","countryMA":"โมร็อกโก","countryMZ":"โมซัมบิก","countryMM":"เมียนมาร์","countryNA":"นามิเบีย","countryNR":"นาอูรู","countryNP":"เนปาล","countryNL":"🇳🇱 เนเธอร์แลนด์","countryAN":"เนเธอร์แลนด์แอนทิลลิส","countryNC":"นิวแคลิโดเนีย","countryNZ":"🇳🇿 นิวซีแลนด์","countryNI":"นิการากัว","countryNE":"ไนเจอร์","countryNG":"ไนจีเรีย","countryNU":"นีอูเอ","countryNF":"เกาะนอร์ฟอล์ก","countryMP":"หมู่เกาะนอร์เทิร์นมาเรียนา","countryNO":"🇳🇴 นอร์เวย์","countryOM":"โอมาน","countryPK":"ปากีสถาน","countryPW":"ปาเลา","countryPS":"ดินแดนปาเลสไตน์","countryPA":"ปานามา","countryPG":"ปาปัวนิวกินี","countryPY":"ปารากวัย","countryPE":"เปรู","countryPH":"🇵🇭 ฟิลิปปินส์","countryPN":"พิตแคร์น","countryPL":"🇵🇱 โปแลนด์","countryPT":"🇵🇹 โปรตุเกส","countryPR":"เปอร์โตริโก","countryQA":"กาตาร์","countryRE":"เรอูนียง","countryRO":"โรมาเนีย","countryRU":"🇷🇺 รัสเซีย","countryRW":"รวันดา","countrySH":"เซนต์เฮเลนา","countryKN":"เซนต์คิตส์และเนวิส","countryLC":"เซนต์ลูเซีย","countryPM":"เซนต์ปิแอร์และมิเกลอน","countryVC":"เซนต์วินเซนต์และเกรนาดีนส์","countryWS":"ซามัว","countrySM":"ซานมารีโน","countryST":"เซาตูเมและปรินซิปี","countrySA":"ซาอุดีอาระเบีย","countrySN":"เซเนกัล","countryRS":"เซอร์เบีย","countrySC":"เซเชลส์","countrySL":"เซียร์ราลีโอน","countrySG":"🇸🇬 สิงคโปร์","countrySK":"สโลวาเกีย","countrySI":"สโลวีเนีย","countrySB":"หมู่เกาะโซโลมอน","countrySO":"โซมาเลีย","countryZA":"แอฟริกาใต้","countryGS":"เกาะเซาท์จอร์เจียและหมู่เกาะเซาท์แซนด์วิช","countryES":"🇪🇸 สเปน","countryLK":"ศรีลังกา","countrySD":"ซูดาน","countrySR":"ซูรินาม","countrySJ":"สฟาลบาร์และยานไมเอน","countrySZ":"เอสวาตีนี","countrySE":"🇸🇪 สวีเดน","countryCH":"🇨🇭 สวิตเซอร์แลนด์","countrySY":"ซีเรีย","countryTW":"🇹🇼 ไต้หวัน","countryTJ":"ทาจิกิสถาน","countryTZ":"แทนซาเนีย","countryTH":"🇹🇭 ไทย","countryTL":"ติมอร์-เลสเต","countryTG":"โตโก","countryTK":"โตเกลา","countryTO":"ตองกา","countryTT":"ตรินิแดดและโตเบโก","countryTN":"ตูนิเซีย","countryTR":"ตุรกี","countryTM":"เติร์กเมนิสถาน","countryTC":"หมู่เกาะเติกส์และหมู่เกาะแคคอซ","countryTV":"ตูวาลู","countryUG":"ยูกันดา","countryUA":"ยูเครน","countryAE":"สหรัฐอาหรับเอมิเรตส์","countryGB":"🇬🇧 สหราชอาณาจักร","countryUS":"🇺🇸 สหรัฐอเมริกา","countryUM":"หมู่เกาะเล็กรอบนอกของสหรัฐอเมริกา","countryUY":"อุรุกวัย","countryUZ":"อุซเบกิสถาน","countryVU":"วานูวาตู","countryVE":"เวเนซุเอลา","countryVN":"🇻🇳 เวียดนาม","countryVG":"หมู่เกาะเวอร์จินของอังกฤษ","countryVI":"หมู่เกาะเวอร์จินของสหรัฐอเมริกา","countryWF":"วาลลิสและฟุตูนา","countryEH":"เวสเทิร์นสะฮารา","countryYE":"เยเมน","countryZM":"แซมเบีย","countryZW":"ซิมบับเว","epacUS":"บริการพัสดุระดับแรกระหว่างประเทศ","epacCH":"ไพรออริตี้ พลัส","epacGB":"ติดตามระหว่างประเทศ","epacMY":"ติดตาม / ด่วนระหว่างประเทศ","epacCA":"ด่วนขาเข้าระหว่างประเทศ","epacAU":"แพ็คและติดตามระหว่างประเทศ","epacNZ":"ติดตามประหยัดระหว่างประเทศ","epacDE":"วาเรนโพสต์ อินเตอร์เนชั่นแนล พรีเมียม","epacFR":"จดหมายระหว่างประเทศที่มีการติดตาม","epacNL":"ติดตามแพ็คเก็ตระหว่างประเทศ","epacPL":"โกลบอล เอ็กซ์เพรส","epacBE":"ขาเข้าระหว่างประเทศชั้นนำ","epacAT":"พัสดุติดตามระหว่างประเทศ","epacIN":"พัสดุติดตามระหว่างประเทศ","epacFI":"จดหมายติดตามระหว่างประเทศ","epacSE":"จดหมายติดตามระหว่างประเทศ","epacNO":"PRIME Express","epacIT":"ด่วน","epacIL":"ด่วน","epacES":"พัสดุเบาระหว่างประเทศ","epacPT":"ไปรษณีย์สีน้ำเงินระหว่างประเทศ","epacCZ":"การจัดส่งที่ติดตามจากต่างประเทศ","epacBN":"ePacket ระหว่างประเทศ","epacCN":"ePacket ระหว่างประเทศ","epacHK":"ePacket ระหว่างประเทศ","epacID":"e-แพ็คเกจระหว่างประเทศ","epacMO":"ePacket ระหว่างประเทศ","epacPH":"ไปรษณีย์ติดตามระหว่างประเทศ","epacTW":"ePacket ระหว่างประเทศ","epacTH":"ePacket ระหว่างประเทศ","epacVN":"E-แพ็คเกจระหว่างประเทศ (แพ็ค ASEAN)","epacKR":"K-แพ็คเก็ต","epacJP":"e-แพ็คเกจระหว่างประเทศ Light","epacIE":"ไปรษณีย์ด่วนระหว่างประเทศ","blogSingPostEPACContent1":"SingPost ePAC (ePacket) เป็นบริการไปรษณีย์ติดตามที่ประหยัดสำหรับการจัดส่งสินค้าอีคอมเมิร์ซระหว่างประเทศที่มีน้ำหนักเบา","blogSingPostEPACContent2":"จัดส่งโดยผู้ให้บริการไปรษณีย์แห่งชาติของประเทศปลายทาง และใช้กันทั่วไปสำหรับพัสดุที่มีน้ำหนักต่ำกว่า 2 กก. โดยมีขนาดความยาว + ความกว้าง + ความสูงรวมกันต่ำกว่า 90 ซม. และความยาวไม่เกิน 60 ซม.","blogSingPostEPACContent3":"ตัวเลือกนี้เสนอครั้งแรกโดย Hong Kong Post ร่วมกับ eBay China เท่านั้น ช่วยให้สามารถส่งพัสดุจากจีนและฮ่องกงไปยังสหรัฐอเมริกาพร้อมการติดตามการจัดส่งโดยไม่ต้องลงนามรับเมื่อจัดส่ง บริการนี้รู้จักกันในสหรัฐอเมริกาในชื่อ USPS (United States Postal Service) First-Class Package International Service","blogSingPostEPACContent4":"ตั้งแต่วันที่ 1 มกราคม 2026 ePAC ถูกใช้สำหรับทุกประเทศเพื่อปฏิบัติตามกฎระเบียบ UPU ที่บังคับให้มีการติดตามพัสดุ และจำกัดสิ่งของลงทะเบียนให้เฉพาะเอกสารเท่านั้น","blogSingPostEPACContent5":"คำนำหน้าการติดตาม: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS เป็นบริการไปรษณีย์ด่วนระหว่างประเทศระดับพรีเมียม ที่ได้รับความสำคัญจากผู้ให้บริการไปรษณีย์ทั่วโลก","blogSpeedPostEMSContent2":"การผ่านศุลกากรโดยทั่วไปเร็วกว่าไปรษณีย์มาตรฐาน แต่เข้มงวดกว่าในกระบวนการ พร้อมการติดตามเต็มรูปแบบจนถึงการจัดส่ง","blogSpeedPostEMSContent3":"ในสิงคโปร์ บริการนี้เรียกว่า SpeedPost Priority International โดย SingPost","blogSpeedPostEMSContent4":"คำนำหน้าการติดตาม: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express เป็นบริการระดับ courier","blogSpeedPostExpressContent2":"ในหลายปลายทาง DHL Express ทำการจัดส่งไมล์สุดท้ายและเก็บภาษีหรือค่าธรรมเนียมก่อนปล่อยของ","blogSpeedPostExpressContent3":"คำนำหน้าการติดตาม: PX123456789SG (DHL Express ไมล์สุดท้ายใช้หมายเลขติดตาม 10 หลัก ซึ่งไม่เปิดเผยต่อสาธารณะ แต่เรามีข้อมูลสำหรับมันผ่าน","blogSpeedPostExpressContent3Link":"ระบบติดตามของเรา","blogUSPDDPContent1":"PDDP อนุญาตให้จ่ายภาษีและค่าธรรมเนียมนำเข้าของสหรัฐอเมริกาล่วงหน้าก่อนการจัดส่ง ลดค่าธรรมเนียมที่ไม่คาดคิดสำหรับผู้รับ","blogUSPDDPContent2":"กฎระเบียบใหม่ (มีผลวันที่ 29 สิงหาคม 2025)","blogUSPDDPContent2List1":"รหัส HTS บังคับ","blogUSPDDPContent2List2":"คำอธิบายสินค้าที่แม่นยำ","blogUSPDDPContent2List3":"การบังคับใช้ภาษีที่เข้มงวดขึ้น","blogUSPDDPContent3":"สินค้าทั้งหมดที่ส่งไปยังสหรัฐอเมริกาจะไม่มีการเรียกเก็บภาษีเพิ่มเติมจากผู้รับ เนื่องจากเราชำระแทนคุณ อย่างไรก็ตาม โปรดทราบว่าราคาสินค้ามีค่าธรรมเนียมนำเข้า 10% เป็นค่าเริ่มต้นเพื่อให้สอดคล้องกับกฎระเบียบ","blogUSPDDPContent4":"นี่ใช้กับวิธีการจัดส่งของเราไปยังสหรัฐอเมริกา SpeedPost Priority International (EMS) และ SingPost ePAC เท่านั้น","blogEUIOSSContent1":"สหภาพยุโรปใช้ VAT กับการนำเข้าเชิงพาณิชย์ทั้งหมดไม่ว่ามูลค่าจะเป็นเท่าใด","blogEUIOSSContent2":"IOSS (นำเข้าร้านค้าครบวงจร)","blogEUIOSSContent3":"IOSS อนุญาตให้ผู้ขายเก็บ VAT ของสหภาพยุโรปที่ชำระเงินสำหรับสิ่งของส่งสูงสุด €150","blogEUIOSSContent4":"VAT จะถูกส่งผ่านระบบ IOSS ทำให้ผ่านศุลกากรเร็วขึ้นและไม่มีการเก็บ VAT เมื่อจัดส่ง","blogEUIOSSContent5":"สำหรับคำสั่งซื้อทั้งหมดผ่าน Etsy หรือ eBay IOSS VAT ถูกเก็บแล้วที่ชำระเงิน และเราจะระบุในหมายเลขอ้างอิงภาษีเพื่อส่งข้อมูลไปยังบริการไปรษณีย์ปลายทางผ่าน EDI (Electronic Data Interchange)","blogUKVATContent1":"สหราชอาณาจักรต้องการให้คำนึงถึง VAT สำหรับสินค้านำเข้า","blogUKVATContent2":"สำหรับสิ่งของส่งที่มีมูลค่าต่ำ VAT มักจะถูกเก็บที่ชำระเงินและส่งโดยตรงไปยัง HMRC โดยผู้ขายหรือตลาดกลาง","blogUKVATContent3":"สำหรับสิ่งของส่งที่มีมูลค่าสูงขึ้น VAT อาจถูกเก็บโดยผู้ขนส่งก่อนการจัดส่ง","blogUKVATContent4":"สำหรับคำสั่งซื้อทั้งหมดผ่าน Etsy หรือ eBay VAT ถูกเก็บแล้วที่ชำระเงิน และเราจะระบุในหมายเลขอ้างอิงภาษีเพื่อส่งข้อมูลไปยังบริการไปรษณีย์ปลายทางผ่าน EDI (Electronic Data Interchange)","blogNorwayVOECContent1":"นอร์เวย์แนะนำระบบ VOEC (VAT on E-Commerce) สำหรับสินค้าที่นำเข้าจากนอก EU/EEA ใช้กับสินค้าที่มีมูลค่าสูงสุด 3,000 NOK","blogNorwayVOECContent2":"ผู้ขายสามารถลงทะเบียนในโครงการ VOEC เพื่อเก็บ VAT ของนอร์เวย์ที่ชำระเงิน ทำให้ผ่านศุลกากรเร็วขึ้นและไม่มีการเก็บ VAT เมื่อจัดส่ง","blogNorwayVOECContent3":"สำหรับคำสั่งซื้อทั้งหมดผ่าน Etsy หรือ eBay VOEC VAT ถูกเก็บแล้วที่ชำระเงิน การติดตามและเอกสารศุลกากรระบุหมายเลขอ้างอิงภาษีเพื่อส่งข้อมูลไปยังบริการไปรษณีย์นอร์เวย์","blogSwissVATContent1":"สวิตเซอร์แลนด์เรียกเก็บ VAT สำหรับสินค้านำเข้าไม่ว่ามูลค่าจะเป็นเท่าใด สำนักงานศุลกากรกลางของสวิตเซอร์แลนด์ต้องการให้ผู้ขายต่างชาติเก็บ VAT ที่ชำระเงินสำหรับสินค้าสูงสุด 65 CHF","blogSwissVATContent2":"ผู้ขายที่ลงทะเบียนในระบบ VAT ของสวิตเซอร์แลนด์ส่ง VAT ที่เก็บได้โดยตรง ทำให้ผู้รับไม่มีค่า VAT เพิ่มเติมเมื่อจัดส่ง","blogSwissVATContent3":"สำหรับคำสั่งซื้อทั้งหมดผ่าน Etsy หรือ eBay VAT ของสวิตเซอร์แลนด์ถูกเก็บแล้วระหว่างชำระเงิน และเอกสารศุลกากรรวมหมายเลขอ้างอิงภาษีสำหรับการส่ง EDI","dhlNoEmbed":"DHL Express ไม่รองรับการติดตามผ่านการฝังตัว กรุณา","speedPostNoEmbed":"SpeedPost สิงคโปร์ไม่รองรับการติดตามผ่านการฝังตัว กรุณา","operatorNoEmbed":"ไม่รองรับการติดตามผ่านการฝังตัว กรุณา","clickHere":"คลิกที่นี่","toTrackNewTab":"เพื่อติดตาม (เปิดในแท็บใหม่)","russiaServiceSuspended":"⚠️ ประกาศสำคัญ: เนื่องจากการรุกรานยูเครนของรัสเซียในปี 2022 SingPost ได้ระงับการจัดส่งทั้งหมดไปยังรัสเซียพร้อมกับ DHL ขณะนี้เราไม่ให้บริการรัสเซียจนกว่าจะมีการประกาศการกลับมาให้บริการในประเทศดังกล่าว","hariRayaMessage":"🌙 เสลามัต ฮารี รายา ไอดิลฟิตรี! ขออวยพรให้คุณและครอบครัวมีความสงบสุข ความสุข และพร! 🌟","deepavaliMessage":"🪔 สุขสันต์วันดีปาวลี! ขอให้เทศกาลแห่งแสงสว่างนำความสุข ความเจริญรุ่งเรือง และความสำเร็จมาให้คุณ! ✨","diwaliMessage":"🪔 สุขสันต์วันดิวาลี! ขอให้เทศกาลแห่งแสงสว่างนำความสุข ความเจริญรุ่งเรือง และความสำเร็จมาให้คุณ! ✨","belgiumNationalDayMessage":"🇧🇪 Joyeuse Fête Nationale, เบลเยียม! ฟิจน์ เนชันแนล เฟสต้าก! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - ประกาศปิดให้บริการชั่วคราว","temporaryClosureNoticeBody":"เรียนลูกค้าผู้มีอุปการคุณ,\n\nโปรดทราบว่า Rhythm Nexus จะปิดให้บริการชั่วคราวตั้งแต่วันที่ 21 มีนาคม 2026 ถึง 26 มีนาคม 2026 เนื่องจากกิจกรรมของบริษัท\n\nเพื่อเตรียมความพร้อมสำหรับช่วงปิดให้บริการ ร้านค้าจะเข้าสู่โหมดวันหยุดตั้งแต่วันที่ 20 มีนาคม 2026 เวลา 3:00 PM (UTC +8) คำสั่งซื้อที่ทำหลังเวลานี้อาจยังไม่ได้รับการดำเนินการจนกว่าจะกลับมาเปิดให้บริการ\n\nการดำเนินงานตามปกติจะกลับมาในวันที่ 27 มีนาคม 2026\n\nขออภัยในความไม่สะดวกที่เกิดขึ้น และขอขอบคุณสำหรับความเข้าใจและการสนับสนุนอย่างต่อเนื่อง\n\nขอบคุณครับ/ค่ะ\n\nRhythm Nexus","temporaryClosureNoticeClose":"ฉันเข้าใจแล้ว","parcelTracking":"การติดตามพัสดุ","serviceAnnouncement":"ประกาศเกี่ยวกับบริการ","usaWinterStormTitle":"เร่งด่วน: พายุหิมะรุนแรง - สิ่งที่รบกวนบริการ","usaWinterStormSubtitle":"บริการไปรษณีย์สหรัฐอเมริกา (USPS) เหตุการณ์ที่ผ่านการควบคุมไม่ได้","usaWinterStormNotice1":"เนื่องจากพายุหิมะรุนแรงที่ส่งผลกระทบต่อภูมิภาคนิวยอร์กตั้งแต่ 23 กุมภาพันธ์ 2026:","usaWinterStormNotice2":"การดำเนินการระหว่างประเทศที่สนามบินแห่งชาติจอห์น เอฟ เคนเนดี ได้หยุดลงอย่างมีประสิทธิผล","usaWinterStormNotice3":"มีการรายงานการยกเลิกเที่ยวบินอย่างแพร่หลายและการรบกวนบริการสนามบินอย่างมีนัยสำคัญ","usaWinterStormNotice4":"สภาวะเหล่านี้ถือเป็นเหตุการณ์ที่ผ่านการควบคุมไม่ได้เกินกว่าการควบคุมของ USPS","usaWinterStormNotice5":"ผลกระทบต่อบริการ:","usaWinterStormNotice6":"ส่วนผสมที่อันตรายของหิมะหนักน้ำแข็ง สายฝน และอากาศหนาวจัด","usaWinterStormNotice7":"มีการรายงานการรบกวนที่สำคัญและไฟฟ้าดับอย่างแพร่หลาย","usaWinterStormNotice8":"การเก็บและจัดส่งจดหมายในประเทศและต่างประเทศ (ไปรษณีย์จดหมาย ไปรษณีย์พัสดุ และสินค้า EMS) ได้รับผลกระทบ","usaWinterStormNotice9":"พื้นที่รหัสไปรษณีย์ที่ได้รับผลกระทบ:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS กำลังดำเนินการทั้งหมดที่จำเป็นเพื่อลดความไม่สะดวกให้กับลูกค้าขณะเดียวกันก็รักษาความปลอดภัยของพนักงาน เราขอบคุณความอดทนของคุณและความเข้าใจในระหว่างเหตุการณ์ที่ผ่านการควบคุมไม่ได้นี้","usaWinterStormNotice12":"อัปเดตล่าสุด: 25 กุมภาพันธ์ 2026","countryAutoDetected":"ปลายทางถูกตั้งค่าล่วงหน้าตามที่ตั้งของคุณ","countryAutoDetectedFromLink":"ปลายทางถูกตั้งค่าล่วงหน้าจากลิงก์","trackingNumber":"หมายเลขติดตาม","destinationCountry":"ประเทศปลายทาง","postcode":"รหัสไปรษณีย์","australianDSTTitle":"เวลาออมแสงของออสเตรเลียใช้งานอยู่","australianDSTBothMessage":"ขณะนี้ทั้ง AEDT (เวลาออมแสงทางตะวันออกของออสเตรเลีย) และ ACDT (เวลาออมแสงกลางของออสเตรเลีย) มีผลบังคับใช้อยู่ในขณะนี้","australianAEDTMessage":"ขณะนี้ AEDT (เวลาออมแสงทางตะวันออกของออสเตรเลีย) มีผลใช้กับซิดนีย์ เมลเบิร์น และพื้นที่โดยรอบ","australianACDTMessage":"ขณะนี้ ACDT (เวลาออมแสงกลางของออสเตรเลีย) มีผลบังคับใช้สำหรับแอดิเลดและออสเตรเลียใต้","australianDSTNote":"เวลาจัดส่งที่แสดงด้านบนเป็นเวลาออมแสงในปัจจุบัน","filteredAllowedDestinations":"(กรองตามจุดหมายปลายทางที่คุณอนุญาต)","loadingAnnouncements":"กำลังโหลดประกาศ...","unableToLoadAnnouncements":"ไม่สามารถโหลดประกาศเกี่ยวกับบริการได้ในขณะนี้","viewOnSingPostWebsite":"ดูบนเว็บไซต์ SingPost →","statusHeldByCustms":"ถือโดยกรมศุลกากร","accessRestricted":"การเข้าถึงถูกจำกัด","vpnDetectedMessage":"ตรวจพบการใช้งาน VPN โปรดปิดการใช้งาน VPN เพื่อเข้าถึงบริการนี้","contactSupportError":"หากคุณเชื่อว่านี่เป็นข้อผิดพลาด โปรดติดต่อฝ่ายสนับสนุน","postalContactsTitle":"ข้อมูลติดต่อบริการไปรษณีย์","postalContactsNote":"หมายเหตุ:","postalContactsPolandUKNote":"สำหรับโปแลนด์และสหราชอาณาจักร สินค้าทั้งหมดที่ส่งผ่าน SpeedPost Priority (EMS) จะได้รับการจัดการโดย Pocztex และ Parcelforce","postalContactsDHLNote":"สำหรับการจัดส่ง SpeedPost Express โปรดติดต่อ DHL ผ่านลิงก์นี้:","postalContactsCountry":"ประเทศ","postalContactsWebsite":"เว็บไซต์","postalContactsForm":"แบบฟอร์มติดต่อ","postalContactsPhone":"หมายเลขติดต่อ","postalContactsEmail":"อีเมลติดต่อ","postalContactsFormLink":"แบบฟอร์มติดต่อ","postalContactsBackButton":"กลับไปที่แบบฟอร์มสอบถามพัสดุ","destinationNotAllowed":"การเข้าถึงประเทศปลายทางนี้ไม่สามารถทำได้จากที่ตั้งของคุณ โปรดเลือกปลายทางอื่น","contactUsTitle":"ติดต่อเรา","contactNameLabel":"ชื่อ (ไม่อนุญาตให้ใช้ชื่อเล่นหรือหมายเลขโทรศัพท์)","contactEmailLabel":"ที่อยู่อีเมล (เราจะตอบกลับคุณทางนี้)","contactEmailNote":"ไม่ยอมรับอีเมลรีเลย์ส่วนตัว (เช่น @privaterelay.appleid.com) กรุณาใช้ที่อยู่อีเมลที่ถูกต้อง","contactEnquiryTypeLabel":"นี่คืออะไร?","contactSelectOption":"เลือกตัวเลือก","contactGeneralEnquiry":"สอบถามทั่วไป / ข้อเสนอแนะ","contactBusinessEnquiry":"สอบถามเกี่ยวกับธุรกิจ","contactOrderShippingEnquiry":"สอบถามเกี่ยวกับคำสั่งซื้อ/การจัดส่ง","contactExchangeRefundEnquiry":"สอบถามเกี่ยวกับการแลกเปลี่ยน/การคืนเงิน/การคืนสินค้า","contactOthers":"อื่นๆ","contactParcelWarning":"หากพัสดุของคุณไม่ได้จัดส่งมากกว่า 18/30/45 วัน (14 วันสำหรับ FedEx) หรือแสดงสถานะว่าจัดส่งแล้วแต่คุณไม่ได้รับ กรุณากรอก","contactParcelWarningLink":"แบบฟอร์มนี้","contactParcelWarningEnd":"แทน","contactOrderNumberLabel":"หมายเลขคำสั่งซื้อ","contactOrderNumberPlaceholder":"ตัวอย่าง: RTNX1234567890","contactPlatformNote":"หมายเลขคำสั่งซื้อ Etsy, eBay และ Shopee ที่นี่ เราไม่มีอำนาจควบคุมการคืนเงินจากแพลตฟอร์มเหล่านี้เลย กรุณาติดต่อฝ่ายบริการลูกค้าของพวกเขาตามลำดับ","contactPlatformInstructions":"กรุณาใช้แอปเพื่อดูหมายเลขคำสั่งซื้อของคุณ เนื่องจากถูกบันทึกไว้ในแอป:","contactPlatformEtsy":"Etsy - มุมบนขวาในโปรไฟล์ของคุณ → การซื้อ","contactPlatformEbay":"eBay - My eBay → การซื้อ","contactPlatformShopee":"Shopee - ฉัน → ดูประวัติการซื้อ (หรือคุณสามารถคลิกที่ต้องจัดส่ง/ต้องรับ)","contactRefundNote1":"หากคุณสอบถามเกี่ยวกับการคืนสินค้า/คืนเงินสำหรับแพลตฟอร์มที่คุณซื้อ โปรดทราบว่าเราไม่มีอำนาจควบคุมการคืนเงินจากแพลตฟอร์มเหล่านี้เลย กรุณาติดต่อฝ่ายบริการลูกค้าของพวกเขาตามลำดับ","contactRefundNote2":"สำหรับการคืนสินค้าหรือการแลกเปลี่ยน เราไม่อนุญาตให้ถุงมือ maimai ที่มีการใช้งานแล้วเมื่อเปิด (มีคราบที่มองเห็นได้หรือซักในเครื่องซักผ้า/ซักด้วยมือ) และไม่อนุญาตให้คืนหรือแลกเปลี่ยนการ์ดสันทนาการ ขอบคุณค่ะ","contactRefundNote3":"โปรดทราบว่าสำหรับการคืนเงินผ่าน Payhip หากคุณไม่ได้รับเงินคืน กรุณาติดต่อธนาคารของคุณหรือฝ่ายสนับสนุน Payhip ที่ support@payhip.com เนื่องจากเราไม่มีอำนาจควบคุมกระบวนการดังกล่าว","contactMessageLabel":"ข้อความของคุณ (สูงสุด 1000 ตัวอักษร)","contactCharacterCount":"ตัวอักษร","contactSpamWarningNote":"หมายเหตุ:","contactSpamWarning":"ข้อเสนอที่ไม่ได้ร้องขอสำหรับ SEO, การออกแบบเว็บไซต์, สินเชื่อ หรือบริการที่คล้ายกันจะถูกปฏิเสธโดยอัตโนมัติ","contactAgreementText1":"กรุณาคลิก \"ฉันเห็นด้วย\" หากคุณเห็นด้วยให้ Rhythm Nexus ใช้ที่อยู่อีเมลของคุณเพื่อตอบกลับคุณ เนื่องจากเป็นสิ่งจำเป็นสำหรับเราในการอ่านคำตอบของคุณและตอบกลับคุณเมื่อเราพบวิธีแก้ไขสำหรับการสอบถามของคุณ","contactAgreementText2":"โปรดทราบว่าการตอบกลับของเราจะใช้เวลา 3-5 วันทำการ หรือนานกว่านั้นในช่วงที่มีอีเมลจำนวนมากในฝั่งของเรา","contactAgreeCheckbox":"ฉันเห็นด้วย","contactSuccessMessage":"ข้อความของคุณถูกส่งเรียบร้อยแล้ว! เราจะตอบกลับภายใน 3-5 วันทำการ","contactErrorMessage":"ส่งข้อความไม่สำเร็จ กรุณาลองอีกครั้ง","contactGeneralError":"เกิดข้อผิดพลาด กรุณาลองอีกครั้งในภายหลัง","contactSubmitting":"กำลังส่ง...","contactSubmit":"ส่ง","contactAlertAgree":"กรุณายอมรับข้อกำหนดเพื่อส่งแบบฟอร์ม","parcelEnquiryTitle":"สอบถามเกี่ยวกับพัสดุ","parcelInfoText":"แบบฟอร์มนี้สำหรับพัสดุที่ไม่ได้จัดส่งมากกว่า 18/30/45 วัน (14 วันสำหรับ FedEx/DHL) หรือแสดงสถานะว่าจัดส่งแล้วแต่ไม่ได้อยู่กับคุณ","parcelInfoLink":"คลิกที่นี่","parcelInfoEnd":"สำหรับการสอบถามอื่นๆ","parcelWaitTitle":"กรุณารอพัสดุของคุณ","parcelWaitText1":"กรุณารอการจัดส่งพัสดุของคุณ โปรดทราบว่าการจัดส่งระหว่างประเทศไม่เหมือนกับการจัดส่งภายในประเทศเนื่องจากต้องใช้เวลา ขอบคุณค่ะ!","parcelWaitText2":"หากไม่มีสถานะแสดงหลังจาก 18 วัน (7 วันสำหรับสิงคโปร์) หรือมากกว่า คุณสามารถแจ้งให้เราทราบโดยตรง","parcelCannotSubmit":"คุณไม่สามารถส่งแบบฟอร์มนี้หากคุณเลือก \"ไม่ใช่\"","parcelNameLabel":"ชื่อ","parcelOrderNumberLabel":"หมายเลขคำสั่งซื้อ (ตัวอย่าง: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"ที่อยู่อีเมล (เราจะตอบกลับคุณทางนี้)","parcelEmailNote":"ไม่ยอมรับอีเมลรีเลย์ส่วนตัว กรุณาใช้ที่อยู่อีเมลที่ถูกต้อง","parcelShippingMethodLabel":"เลือกวิธีการจัดส่ง?","parcelSelectShipping":"เลือกวิธีการจัดส่ง","parcelSingPostEpac":"SingPost ePacket (หรือ ePAC) - หรือที่เรียกว่า SpeedPost Saver International (การติดตาม: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (การติดตาม: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (การติดตาม: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (การติดตาม: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (การติดตาม: PX123456789SG)","parcelDHL":"DHL Express (เฉพาะประเทศในสหภาพยุโรป) (การติดตาม: 1234567890)","parcelTrackingNumberLabel":"หมายเลขติดตามพัสดุของคุณ?","parcelUndeliveredLabel":"พัสดุของคุณไม่ได้จัดส่งมากกว่า 18/30/45 วันหรือไม่? (บริการภายในสิงคโปร์ >7 วัน, >14 วันสำหรับ SpeedPost Express/DHL)","parcelSelectOption":"เลือกตัวเลือก","parcelYes":"ใช่","parcelNo":"ไม่ใช่","parcelDeliveredButMissingLabel":"พัสดุของคุณแสดงสถานะว่าจัดส่งแล้ว แต่ไม่อยู่ในกล่องจดหมาย/สถานที่ปลอดภัย/หน้าประตูหรือไม่?","parcelCaseReferenceLabel":"ID อ้างอิงเคสจากไปรษณีย์ท้องถิ่น","parcelCaseReferencePlaceholder":"ใส่ NA หากคุณมาจากสิงคโปร์","parcelCaseReferenceNote":"ก่อนส่งแบบฟอร์มนี้ กรุณาติดต่อไปรษณีย์ท้องถิ่นของคุณผ่านทางโทรศัพท์หรืออีเมลและรับ ID อ้างอิงเคสจากพวกเขา จากนั้นใส่ ID อ้างอิงเคสของคุณที่นี่","parcelCaseReferenceLink":"ดูลิงก์นี้สำหรับข้อมูลติดต่อบริการไปรษณีย์","parcelCaseReferenceMandatory":"ใส่ NA เฉพาะในกรณีที่คุณมาจากสิงคโปร์เท่านั้น สำหรับประเทศอื่นๆ เป็นข้อกำหนดบังคับ ต้องใช้สำหรับ SpeedPost Express เช่นกัน สำหรับ ID เคสของ DHL","parcelImageEvidenceLabel":"หลักฐานรูปภาพ (สำหรับพัสดุที่จัดส่งแล้วแต่หาย)","parcelImageWarning":"สำหรับการตรวจสอบเพิ่มเติม เราต้องการหลักฐานรูปภาพเพื่อพิสูจน์ว่าคุณไม่ได้ทำการอ้างสิทธิ์เท็จเกี่ยวกับการไม่จัดส่งพัสดุ (เฉพาะสำหรับพัสดุที่จัดส่งแล้ว แต่ไม่อยู่ในกล่องจดหมาย/นอกหน้าประตู เราอาจปฏิเสธการอ้างสิทธิ์ของคุณหากไม่มีหลักฐานรูปภาพสำหรับสินค้าที่จัดส่งแล้ว ละเว้นสิ่งนี้หากสินค้าของคุณไม่แสดงสถานะที่จัดส่งแล้ว)","parcelImageNote":"อัปโหลด 1 ไฟล์ที่รองรับ: รูปภาพ สูงสุด 1 GB","parcelAgreementText":"กรุณาคลิก \"ฉันเห็นด้วย\" หากคุณมั่นใจว่าสิ่งที่เกิดขึ้นกับพัสดุของคุณเป็นจริง","parcelAgreeCheckbox":"ฉันเห็นด้วย","parcelSuccessMessage":"การสอบถามเกี่ยวกับพัสดุของคุณถูกส่งเรียบร้อยแล้ว! เราจะตอบกลับภายใน 3-5 วันทำการ","parcelErrorMessage":"ส่งการสอบถามไม่สำเร็จ กรุณาลองอีกครั้ง","parcelGeneralError":"เกิดข้อผิดพลาด กรุณาลองอีกครั้งในภายหลัง","parcelAlertWait":"กรุณารอการจัดส่งพัสดุของคุณ คุณสามารถส่งแบบฟอร์มนี้หลังจากระยะเวลารอที่กำหนด","parcelAlertAgree":"กรุณายอมรับข้อกำหนดเพื่อส่งแบบฟอร์ม","parcelAlertCaseReference":"กรุณาให้ ID อ้างอิงเคสจากไปรษณีย์ท้องถิ่นของคุณ หรือใส่ NA หากคุณมาจากสิงคโปร์","parcelSubmitting":"กำลังส่ง...","parcelSubmit":"ส่ง","lookalikeDomainWarning":"นี่ไม่ใช่หมายเลขพัสดุ แต่เป็นลิงก์ไปยังเว็บไซต์ที่แอบอ้างเป็นบริษัทขนส่ง อย่ากรอกข้อมูลส่วนตัวหรือข้อมูลการชำระเงินในเว็บไซต์นั้น","lookalikeDomainOfficial":"เว็บไซต์ทางการ:"};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Gumagamit ang Rhythm Nexus ng premium commercial networks. Gayunpaman, sa eksaktong oras na dumating ito sa iyong bansa, naililipat ang custody sa lokal na domestic carrier (hal., USPS, Royal Mail, DHL locally). Nagbabago ang tracking prefixes ng handling systems sa puntong ito, ngunit pinagdudugtong ng aming universal parcel tracker ang mga status na ito para mabigyan ka ng tuloy-tuloy na visibility.","trackingLastMileTitle":"Last-Mile Delivery Network","trackingCustomsClearanceBody":"Lahat ng cross-border na item ay kailangang dumaan sa customs agency ng iyong lokal na bansa. Mino-monitor ng aming tool ang mga transition mula sa pagdating sa import facility hanggang sa customs handovers. Ive-verify ng border patrol ang HS codes at sisiguraduhin na na-remit ang tamang VAT o duties (hal., IOSS sa EU, VOEC sa Norway). Bantayan lalo ang tracking para sa mga babalang \"Held at Customs\".","trackingCustomsClearanceTitle":"Impormasyon sa Customs Clearance","trackingProcessingOriginBody":"Kapag na-drop off na, pumapasok ang item sa origin processing center kung saan ito ini-scan, tinitimbang, at sumasailalim sa pangunahing export security screenings. Pagkatapos nito, ipinapadala ito sa international mail exchange. Ang flight schedules ay nakadepende sa available na cargo bandwidth. Huwag mabahala kung manatili ito sa status na ito nang ilang araw.","trackingProcessingOriginTitle":"Pinoproseso sa Origin Hub","trackingInfoReceivedBody":"Kapag unang pinoproseso ang order sa aming mga e-commerce platform (gaya ng Etsy, eBay, o direct sales), electronically na nagagawa ang tracking number. Natatanggap ng carrier ang shipment data bago nito pisikal na mahawakan ang kahon. Mangyaring maglaan ng 1 hanggang 3 business days para maipasok ang parcel sa pisikal na sorting facility.","trackingInfoReceivedTitle":"Natanggap ang Impormasyon","trackingStatusesIntro":"Salamat sa paggamit ng aming pinag-isang international parcel tracking tool. Dahil tumatawid ang iyong package sa maraming pandaigdigang hangganan, maaaring maging kumplikado ang mga status nito. Ang pag-unawa sa logistics lifecycle ay tumutulong upang makapaglatag ng malinaw na inaasahan.","trackingStatusesTitle":"Pag-unawa sa Mga Status ng Tracking","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"AM","pmText":"PM","footerQuickLinks":"Mga Mabilisang Link","footerSupportLegal":"Suporta at Legal","copyrightText":"Lahat ng karapatan ay nakalaan.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Atlantic)","tzEST":"EST (Silangan)","tzCST":"CST (Sentral)","tzMST":"MST (Bundok)","tzPST":"PST (Pasipiko)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Beijing","tzXinjiang":"Xinjiang","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Kaliningrad Oblast (UTC+2)","tzMoscow":"Moscow/Kanlurang Russia (UTC+3)","tzSamara":"Samara Oblast (UTC+4)","tzUral":"Rehiyon ng Ural (UTC+5)","tzOmsk":"Omsk Oblast (UTC+6)","tzKrasnoyarsk":"Krasnoyarsk Krai (UTC+7)","tzIrkutsk":"Irkutsk Oblast (UTC+8)","tzSakha":"Republika ng Sakha (UTC+9)","tzPrimorsky":"Primorsky Krai (UTC+10)","tzMagadan":"Magadan Oblast (UTC+11)","tzKamchatka":"Kamchatka Krai (UTC+12)","dstDayStartsLabel":"Nagsisimula ang daylight saving time","dstDayEndsLabel":"Nagtatapos ang daylight saving time","dstRevertsLabel":"bumabalik sa karaniwang oras","dstEuropeLabel":"Europa","dstNewZealandLabel":"New Zealand","englishResponseNotice":"Paunawa: Lahat ng mga katanungan ay sinasagot sa Ingles. Kung nagsumite ka sa ibang wika, ang iyong mensahe ay maaaring isalin sa Ingles para sa pag-verify.","parcelDisagreeCheckbox":"Hindi Ako Sumasang-ayon","contactDisagreeCheckbox":"Hindi Ako Sumasang-ayon","contactNamePlaceholder":"Halimbawa: Juan dela Cruz","systemRequirementsTitle":"Minimum na sinusuportahang bersyon ng sistema","systemRequirements":"Windows: Windows 7 (with ESU updates installed) o mas mataas\nmacOS: macOS 12 o mas mataas\nAndroid: Android 13 o mas mataas\niPhone/iOS: iOS 17 o mas mataas\nLinux: Isang kasalukuyang sinusuportahang distribution na may aktibong security updates","goodFridayEasterGreeting":"Maligayang Pasko ng Pagkabuhay! Kapayapaan at kagalakan sa Biyernes Santo at Pasko ng Pagkabuhay.","christmasGreeting":"Maligayang Pasko at Manigong Bagong Taon! Kapayapaan at kagalakan mula Disyembre 25 hanggang Enero 5.","captchaSystemRequirements":"Minimum na kinakailangan ng sistema: Windows 7 (with ESU updates installed) o 11, macOS 10.15+, o pinakabagong bersyon ng Android/iOS.","title":"I-verify ang Access","subtitle":"Pakiusap tapusin ang challenge sa ibaba upang magpatuloy.","selectLanguage":"Pumili ng Wika","selectLanguagePlaceholder":"-- Pumili ng wika --","loadingChallenge":"Nilo-load ang challenge...","answerLabel":"Iyong sagot:","answerPlaceholder":"Ilagay ang iyong sagot","continueButton":"Magpatuloy","refreshButton":"Bagong Challenge","verifying":"Vina-verify...","chooseLanguageFirst":"Pakiusap pumili muna ng wika.","loadFailed":"Nabigo ang pag-load ng challenge. Pakiusap subukan muli.","expiredChallenge":"Nag-expire na ang challenge. Nilo-load ang bagong challenge...","verifyFailed":"Nabigo ang verification. Pakiusap subukan muli.","home":"Bahay","blog":"Blog","aboutUs":"Tungkol sa Amin","faq":"FAQ","contact":"Makipag-ugnayan","trackPackage":"Track Package","cnyYearOfHorseMessage":"🧧 Maligayang Lunar New Year! Nawa'y sumagana at maging masaya ka sa Taon ng Kabayo! 🐴","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Nawa'y makaranas kayo at ang inyong pamilya ng kapayapaan, kagalakan at pagpapala! 🌟","deepavaliMessage":"🪔 Maligayang Deepavali! Nawa'y dalhin sa iyo ng pista ng mga ilaw ang kagalakan, kasaganaan at tagumpay! ✨","diwaliMessage":"🪔 Maligayang Diwali! Nawa'y dalhin sa iyo ng pista ng mga ilaw ang kagalakan, kasaganaan at tagumpay! ✨","vesakMessage":"☸️ Maligayang Araw ng Vesak! Nawa'y makaranas ka ng kapayapaan, karunungan at pag-liwanag sa banal na araw na ito! 🙏","vesakTHMessage":"☸️ Maligayang Araw ng Visakha Bucha! Nawa'y makaranas ka ng kapayapaan, karunungan at pag-liwanag sa banal na araw na ito! 🙏","singaporeNationalDayMessage":"🇸🇬 Maligayang Araw ng Kalayaan, Singapore! Ipinagdiriwang ang 61 taon ng kalayaan! 🎉","indonesiaNationalDayMessage":"🇮🇩 Maligayang Hari Kemerdekaan Indonesia! Dirgahayu Republik Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Ipinagdiriwang ang kalayaan ng ating bansa! 🎊","australiaNationalDayMessage":"🇦🇺 Maligayang Araw ng Australia! Ipinagdiriwang ang ating bansa! 🎉","canadaNationalDayMessage":"🇨🇦 Maligayang Araw ng Canada! Ipinagdiriwang ang ating dakilang bansa! 🍁","usaNationalDayMessage":"🇺🇸 Maligayang Araw ng Kalayaan, America! Ipinagdiriwang ang kalayaan! 🎆","franceBastilleDayMessage":"🇫🇷 Maligayang ika-14 ng Hulyo! Mabuhay ang France! 🎊","germanyUnityDayMessage":"🇩🇪 Maligayang Araw ng Pagkakaisa ng Germany! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Maligayang Araw ng Pagtatag, Japan! 建国記念の日おめでとうございます！🎌","chinaNationalDayMessage":"🇨🇳 Maligayang Araw ng Bansa, China! 国庆节快乐！🎉","koreaLiberationDayMessage":"🇰🇷 Maligayang Araw ng Kalayaan, Korea! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Maligayang Araw ng Kalayaan, India! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Maligayang Araw ng Bansa, Thailand! สุขสันต์วันชาติไทย! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Maligayang Araw ng Kalayaan, Pilipinas! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Maligayang Araw ng Bansa, Vietnam! Quốc khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Maligayang Araw ng Kalayaan, Poland! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Maligayang Araw ng Kalayaan, Czech Republic! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Mabuhay ang Hari! 🧡","norwayConstitutionDayMessage":"🇳🇴 Gratulerer med dagen, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Masaya Sveriges nationaldag! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Portugal! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Maligayang Araw ng Kalayaan, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Maligayang Araw ni San Patricio, Ireland! Lá Fhéile Pádraig sona duit! 🍀","bruneiNationalDayMessage":"🇧🇳 Maligayang Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Maligayang Araw ng Waitangi, New Zealand! 🎉","switzerlandNationalDayMessage":"🇨🇭 Maligayang Araw ng Switzerland! Fête nationale suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Maligayang Araw ng Bansa, Belgium! Fijne Nationale Feestdag! 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Maligayang Araw ng Russia! 🎉","taiwanFoundingDayMessage":"🇹🇼 Maligayang Araw ng Pagkakatatag, Taiwan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Maligayang Double Ten Day, Taiwan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Maligayang Araw ng Pagkakatatag ng SAR ng Hong Kong! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Maligayang Araw ng Pagkakatatag ng SAR ng Macau! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Maligayang Araw ng mga Manggagawa sa Buong Mundo! Ipinagdiriwang ang paggawa at karapatan ng mga manggagawa! 🎊","laborDayUSCAMessage":"⚒️ Maligayang Araw ng Paggawa! Pinagpapahala ang kontribusyon ng mga manggagawa! 🎉","orderNumber":"Order Number (Halimbawa: RTNX1234567890)","fromDate":"From Date (REQUIRED)","toDate":"To Date (REQUIRED)","trackParcel":"Subaybayan ang Parcel","selectCourier":"-- Pumili ng Courier / Bansa --","singaporeCouriers":"Singapore Couriers","optionSingPost":"🇸🇬 Singapore Post (SingPost)","countryAU":"🇦🇺 Australia","countryCA":"🇨🇦 Canada","countryDE":"🇩🇪 Alemanya","countryGB":"🇬🇧 United Kingdom","countryUS":"🇺🇸 USA","countryAT":"🇦🇹 Austria","countryBE":"🇧🇪 Belgium","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Tsina","countryCZ":"🇨🇿 Czechia","countryFI":"🇫🇮 Finland","countryFR":"🇫🇷 France","countryHK":"🇭🇰 Hong Kong SAR China","countryIN":"🇮🇳 India","countryID":"🇮🇩 Indonesia","countryIE":"🇮🇪 Ireland","countryIL":"🇮🇱 Israel","countryIT":"🇮🇹 Italya","countryJP":"🇯🇵 Japan","countryMO":"🇲🇴 Macau SAR China","countryMY":"🇲🇾 Malaysia","countryNL":"🇳🇱 Netherlands","countryNZ":"🇳🇿 New Zealand","countryNO":"🇳🇴 Norway","countryPH":"🇵🇭 Pilipinas","countryPL":"🇵🇱 Poland","countryPT":"🇵🇹 Portugal","countryKR":"🇰🇷 Timog Korea","countryES":"🇪🇸 Espanya","countrySE":"🇸🇪 Sweden","countryCH":"🇨🇭 Switzerland","countryTW":"🇹🇼 Taiwan","countryTH":"🇹🇭 Thailand","countryVN":"🇻🇳 Vietnam","countrySG":"🇸🇬 Singapore","note":"TANDAAN","disclaimer":"DISCLAIMER","importantInformation":"Mahalagang Impormasyon:","didNotReceiveEmail":"Kung hindi ka nakatanggap ng iyong confirmation email mula sa Etsy, eBay, Shopee o Payhip, mag-scroll pababa upang hanapin ang iyong order sa pamamagitan ng iyong email address o numero ng telepono na konektado sa order na ito.","searchByEmailOrPhone":"Maghanap gamit ang Email o Phone","searchOrder":"Maghanap ng Order","trackingResult":"Resulta ng Pagsubaybay","noOrdersFound":"Walang nahanap na orders.","pleaseEnter":"Pakipasok ang email, phone, o order number.","welcomeTitle":"Maligayang pagdating sa website ng Rhythm Nexus!","purchaseInfo":"Bumili sa amin through official channels, o sumali sa aming","purchaseInfoChina":"Bumili sa amin sa pamamagitan ng aming mga opisyal na channel.","purchaseInfoChinaSuffix":"","telegramGroup":"Grupo ng telegrama","forUpdates":"para sa official updates.","ourStores":"Ang Aming Stores","etsyStore":"Tindahan ng Etsy","ebayStore":"Tindahan ng eBay","shopeeStore":"Shopee Store","payhipStore":"Tindahan ng Payhip","internationalShipping":"Internasyonal na Pagpapadala","singaporeLocal":"Lokal ng Singapore","asiaOnly":"Asia lang","deliveryInfo":"Impormasyon sa Paghahatid","deliveryRates2026":"Mga Rate ng Paghahatid 2026","sgDeliveryRates":"Mga Rate ng Paghahatid sa Singapore","speedPostRates":"Mga Internasyonal na Rate ng SpeedPost Express","aboutTitle":"Tungkol sa Rhythm Nexus","aboutP1":"Nagsimula kami ng store noong 2022 at nag-sell sa platforms tulad ng Etsy, eBay, at Shopee nang walang problema.","aboutP2":"Sa paglipas ng panahon, nakabuo kami ng malakas na reputation dahil sa reliable fulfillment at accurate tracking.","aboutP3":"Layunin namin ay magbigay sa customers ng smooth at trusted shopping experience.","aboutP4":"Salamat sa suporta sa Rhythm Nexus.","faqTitle":"Mga Madalas Itanong","faqQ1":"Paano kung may sira ang item ko? May warranty ba?","faqA1":"Oo! Karamihan ng orders ay may 1-year warranty. Pakibigay ang invoice/order number mo para ma-investigate namin. Note: Hindi pwede ang exchanges kung tugma ang item sa description kahit mali ang order mo.","faqQ2":"Pwede ko bang i-edit, i-update o i-cancel ang order ko?","faqA2":"Oo. Para sa security, kailangan i-handle ang order changes through email o sa contact form namin.","faqQ3":"Kailangan ko bang magbayad ng Customs/Import Taxes?","faqA3":"Ang Customs at duties generally ay hindi prepaid, except sa DDP para sa USA. May VAT para sa EU, UK, AU/NZ, Norway, Switzerland, at Canadian provinces tulad ng Saskatchewan at Manitoba. Walang GST para sa Singapore. Hindi kami pwedeng mag-advise tungkol sa customs fees — makipag-ugnayan sa local customs mo para sa details.","faqQ4":"Kailan ba ma-ship ang order ko?","faqA4":"Ang orders usually dispatched within 1-5 business days. Pag high volume periods, pwedeng 5–7 days.","faqQ5":"Nag-order ako ng twice by accident. Ano gagawin ko?","faqA5":"Ire-refund lang namin ang duplicate shipping fees. Parehong items ay isasama sa shipment. Refund = (first + second shipping fees) – actual shipping fee.","faqQ6":"Gaano katagal ang delivery?","faqA6":"Processing ay tumatagal ng 1-5 business days.\n\nDomestic shipping:\n• SingPost Prepaid Tracked Label: 2-4 days\n• SpeedPost Standard: 1-3 days\n\nInternational:\n• SingPost ePAC: 14-30 days\n• SpeedPost Priority (EMS): 8-15 days\n• SpeedPost Express: 4-8 days\n\nMay delays during peak seasons.","faqQ7":"Yung item ko ay binabalik sa sender. Ano gagawin?","faqA7":"Pwede ang one reshipment. Hindi pwede ang cancellation para sa invalid addresses, unclaimed parcels, o unpaid customs fees. Contact mo ang postal service mo for redelivery, o message kami for assistance.","faqQ8":"Nawala / ninakaw ang item ko habang in transit.","faqA8":"Pwede ang one reshipment. Kung nawala ulit, full refund ang ibibigay after ng courier's delivery window:\n\n• Singapore Local Services: 7 days\n• SingPost ePAC & SpeedPost Priority International: 30 days\n• SpeedPost Intl Express: 14 days","blogTitle":"Base sa Kaalaman sa Pagpapadala at Postal","blogSubtitle":"Official explanations ng postal services, customs, VAT, at duties.","readMore":"Basahin Pa","backButton":"Bumalik","blogPost1Title":"Ano ang SingPost ePAC?","blogPost1Desc":"Alamin ang tungkol sa SingPost ePAC (ePacket), economical tracked postal service.","blogPost2Title":"Ano ang SpeedPost Priority International (EMS)?","blogPost2Desc":"Tuklasin ang EMS, international premium postal express service.","blogPost3Title":"Ano ang SpeedPost Express?","blogPost3Desc":"Tuklasin ang SpeedPost Express with DHL Express delivery.","blogPost4Title":"USA PDDP","blogPost4Desc":"Intindihin ang PDDP para sa USA.","blogPost5Title":"EU VAT & IOSS","blogPost5Desc":"Insights tungkol sa EU VAT at IOSS system.","blogPost6Title":"UK VAT & HMRC","blogPost6Desc":"VAT requirements para sa UK.","blogPost7Title":"Norway VOEC","blogPost7Desc":"Ang VOEC system ng Norway.","blogPost8Title":"Swiss VAT","blogPost8Desc":"Switzerland VAT requirements.","enterDestinationPostcode":"Ilagay ang destination postcode","trackingCaseSensitive":"ANG TRACKING LETTERS AY CASE SENSITIVE AT KAILANGAN NASA CAPITAL LETTERS.","usaPostcodeNote":"Para sa mga bansa na walang postcode, gaya ng Hong Kong at Macau, ilagay ang 999077 (Hong Kong) o 999078 (Macau).","epacDeliveryNote":"Pakitandaan na lahat ng ePAC items na ipinadala sa destination ay dapat i-deliver sa mailbox, doorstep, parcel locker o iwanan sa safe place!","currentTime":"Kasalukuyang Oras","timezoneNote":"Oras ay ipinapakita sa 12-oras na format","sameTimeAsSingapore":"Parehong oras sa Singapore","hourAhead":"oras nang mas maaga kaysa Singapore","hoursAhead":"oras nang mas maaga kaysa Singapore","hourBehind":"oras nang mas huli kaysa Singapore","hoursBehind":"oras nang mas huli kaysa Singapore","collectAtPostOffice":"Pero kung ang country mo ay walang mailbox as standard available, kailangan mong kunin ito sa post office.","countriesNoMailbox":"Mga bansang walang available na mailbox/letterbox delivery: Brunei, China, India, Israel, Macau SAR China, Pilipinas, Poland at Vietnam.","rhythmNexusNotResponsible":"Ang Rhythm Nexus ay HINDI RESPONSIBLE sa pag-handle ng deliveries dahil out of our control at gusto namin na i-track mo na lang ang item status mo.","issuesAfterDelivery":"Kung may issues sa delivery mo after 30/45 days (14 days para sa SpeedPost Express) o ang status ay delivered na pero hindi mo natanggap, please contact us","cannotUseEmbed":"Hindi namin pwedeng gamitin ang embed para sa tracking kasi most postal service websites ay hindi nag-support nito.","clickLinkAbove":"Paki-click ang link sa taas para i-track ang parcel mo.","trackingDetailsNote":"Note na ang tracking details ay baka hindi lumabas sa search results, kaya recommended na i-paste ang tracking number into the system para ma-track ang item.","thirdPartyWebsites":"Pwede mo ring i-track ang parcels mo sa mga 3rd party websites na ito:","enterEmailOrPhone":"Ilagay ang email o phone","reviewShippingRates":"Tingnan ang current shipping rates namin","here":"dito","contactUsForm":"Paki-contact kami through","form":"anyo","forEnquiries":"para sa anumang enquiries mo tungkol sa order mo.","anPostNoDirectTracking":"Hindi sinusuportahan ng An Post (Ireland) ang mga direktang tracking link o naka-embed na tracking.","anPostPasteManually":"Mangyaring kopyahin at i-paste nang manu-mano ang iyong tracking number sa website ng An Post:","goToAnPost":"Pumunta sa An Post","blogSingPostEPACContent1":"Ang SingPost ePAC (ePacket) ay economical tracked postal service para sa lightweight international e-commerce shipments.","blogSingPostEPACContent2":"Ito ay ide-deliver ng destination country's national postal operator at commonly used para sa parcels under 2 kg, within dimension limit na length + width + height below 90 cm at length hindi lalampas sa 60 cm.","blogSingPostEPACContent3":"Ang option na ito ay initially offered lang ng Hong Kong Post kasama ang eBay China, allowing packages from China at Hong Kong na mag-post ng small packets to USA with delivery tracking without requirement for any signatory upon delivery. Ang service na ito ay kilala bilang USPS (United States Postal Service) First-Class Package International Service sa USA.","blogSingPostEPACContent4":"As of 1st January 2026, ang ePAC ay ginagamit na for all countries para sumunod sa mandatory UPU regulations requiring tracking for parcels at Registered items na limited lang for documents.","blogSingPostEPACContent5":"Mga prefix sa pagsubaybay: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"Ang EMS ay International premium postal express service, prioritized ng postal operators worldwide.","blogSpeedPostEMSContent2":"Ang Customs clearance ay generally mas mabilis kaysa standard mail pero mas strict sa process, with full tracking until delivery.","blogSpeedPostEMSContent3":"Sa Singapore, ito ay kilala bilang SpeedPost Priority International by SingPost.","blogSpeedPostEMSContent4":"Prefix sa pagsubaybay: EZ123456789SG","blogSpeedPostExpressContent1":"Ang SpeedPost Express ay courier-grade service.","blogSpeedPostExpressContent2":"Sa maraming destinations, ang DHL Express ay gumagawa ng last-mile delivery at nangongolekta ng duties o taxes before release.","blogSpeedPostExpressContent3":"Tracking prefix: PX123456789SG (Last-mile DHL Express gumagamit ng 10-digit tracking number, na hindi visible sa public, pero meron kaming information for it through our","blogSpeedPostExpressContent3Link":"Sistema ng Pagsubaybay.","blogUSPDDPContent1":"Ang PDDP ay nag-allow ng US import duties at taxes na ma-prepaid before delivery, reducing surprise charges para sa recipients.","blogUSPDDPContent2":"Mga Bagong Regulasyon (Epektibo noong Agosto 29, 2025)","blogUSPDDPContent2List1":"Mga mandatoryong HTS code","blogUSPDDPContent2List2":"Tumpak na paglalarawan ng item","blogUSPDDPContent2List3":"Mas mahigpit na pagpapatupad ng taripa","blogUSPDDPContent3":"Lahat ng items na ipinapadala sa USA ay hindi ma-charge ng any additional tariffs sa recipient kasi kami ang nagbabayad on your behalf. However, note na ang item price ay may 10% import fee by default as set para align sa regulations.","blogUSPDDPContent4":"Ito ay applicable lang for our shipping methods para sa USA, SpeedPost Priority International (EMS) at SingPost ePAC only.","blogEUIOSSContent1":"Ang EU ay nag-apply ng VAT on all commercial imports regardless ng value.","blogEUIOSSContent2":"IOSS (Import One-Stop Shop)","blogEUIOSSContent3":"Ang IOSS ay nag-allow sa sellers na mag-collect ng EU VAT at checkout for consignments up to €150.","blogEUIOSSContent4":"Ang VAT ay ire-remit via IOSS system, enabling faster customs clearance at walang VAT collection on delivery.","blogEUIOSSContent5":"Para sa lahat ng orders via Etsy or eBay, ang IOSS VAT ay collected na on checkout at indi-indicate namin ito sa Tax Reference Number para ma-transmit ang data sa destination postal service via EDI (Electronic Data Interchange).","blogUKVATContent1":"Ang UK ay nag-require ng VAT na i-account for imported goods.","blogUKVATContent2":"Para sa low-value consignments, ang VAT ay usually collected at checkout at ire-remit directly sa HMRC by seller or marketplace.","blogUKVATContent3":"Para sa higher-value shipments, ang VAT ay pwedeng ma-collect ng carrier before delivery.","blogUKVATContent4":"Para sa lahat ng orders via Etsy or eBay, ang VAT ay collected na on checkout at indi-indicate namin ito sa Tax Reference Number para ma-transmit ang data sa destination postal service via EDI (Electronic Data Interchange).","blogNorwayVOECContent1":"Ang Norway ay nag-introduce ng VOEC (VAT on E-Commerce) system for goods imported from outside EU/EEA. Ito ay applicable for goods valued up to NOK 3,000.","blogNorwayVOECContent2":"Ang Sellers ay pwedeng mag-register sa VOEC scheme para mag-collect ng Norwegian VAT at checkout, allowing for faster customs clearance at walang VAT collection upon delivery.","blogNorwayVOECContent3":"Para sa lahat ng orders via Etsy or eBay, ang VOEC VAT ay collected na on checkout. Ang Tracking at customs paperwork ay nag-indicate ng Tax Reference Number para ma-transmit ang data sa Norwegian postal service.","blogSwissVATContent1":"Ang Switzerland ay nag-charge ng VAT on imported goods regardless ng value. Ang Swiss Federal Customs Administration ay nag-require sa foreign sellers na mag-collect ng VAT at checkout for goods up to CHF 65.","blogSwissVATContent2":"Ang Sellers na registered under Swiss VAT system ay nag-remit ng collected VAT directly, ensuring na ang recipient ay walang additional VAT charge upon delivery.","blogSwissVATContent3":"Para sa lahat ng orders via Etsy or eBay, ang Swiss VAT ay collected na during checkout, at ang customs paperwork ay may Tax Reference Number for EDI submission.","countryMsgNL":"Kung ang status ay nag-show ng 'Held by Customs', please contact ang Netherlands Customs Information Line for assistance:\n0800 0143 (free), Mon to Fri from 7 a.m. to 11 p.m.\nOn Sat & Sun from 8 a.m. to 4:30 p.m.\n\nEncouraged ka na mag-register ng account with PostNL para sa instant push notification ng your packages:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nKung ide-deliver ito sa PostNL point o ang status ay nagsasabi na collect at post office, kailangan mong magbayad ng 7 EUR sa counter. At most 4 EUR kung paid online.","countryMsgDE":"Encouraged ka namin na mag-download ng Post & DHL app para makatanggap ng push notifications for tracking status ng your packages:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH Customer Service Contact:\n+49-228-433-3112\nDHL DE Contact: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Kailangan mong mag-submit ng additional import declaration sa customs. Failure to do so ay pwedeng mag-result sa entry restriction at ang package ay ire-return. \nMore information: https://www.posti.fi/en/receiving/customs-clearance \nOther links: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Handling fees of 4.95 EUR ay chargeable.\nI-download ang app dito: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Handling fees of 8.50 PLN ay chargeable. \nKailangan mong bayaran ito upon collection sa post office,\nkasi ang parcel ay unlikely na ide-deliver sa doorstep o mailbox mo.","countryMsgPH":"Ang PHLPost ay considered na inefficient at unreliable sa Pilipinas.\nPalaging i-track ang parcel mo kasi minsan ang out for delivery status \nay mag-show lang between 1 to 3 weeks para sa smaller parcels. Para sa bigger parcels, \ncollection is only possible through Manila Central Post Office, o ang nearest \npost office sa area mo. Note na may 112PHP handling fee para sa parcels ng \nany value na kailangan mong bayaran. Failure to pay ay mag-result sa parcel's \nreturn sa amin. Ang Delivery ay estimated na 1-2 months dahil sa slowness ng PHLPost's services. \nHindi mo kailangan magbayad ng taxes for items under 10000PHP, pero kailangan mo if equal or above sa amount na yan. \nWe would recommend SpeedPost Express para sa mas faster process next time na mag-order ka from us. However, ang fees ay baka hindi applicable kasi D&T for recipient ay by default.","countryMsgCA":"Ang de minimis ay 20CAD for all orders sent to Canada, dahil Singapore is part of CPTPP agreement, duties ay baka hindi applicable, pero D&T ay pwedeng applicable kung ang item ay exceeds 60CAD and above or 100CAD and above threshold depende sa item's HS code. Any value above that amount ay mache-charge ng VAT accordingly.","countryMsgID":"Required ka na magbayad ng any applicable taxes and duties upon arrival sa Indonesia. Please keep track ng parcel mo at bayaran ang specified amount sa Indonesian customs.\nKailangan mo ring mag-submit ng additional clearance paperwork. Failure to do so ay pwedeng mag-result sa entry restriction or seizure ng package by country customs. Please check further details dito:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Required ka na magbayad ng any applicable taxes and duties upon arrival sa India. Please keep track ng parcel mo at bayaran ang specified amount sa Indian customs.\nBe aware na ang customs clearance sa India ay strict at pwede ka o hindi mache-charge ng duties kung ang item value mo ay above 1000INR (15 USD) - depende sa HS code, in most cases duty free, pero baka mache-charge ka ng higher duties kung ang item ay above 5000INR (60 USD). \nDahil India Post DOES NOT deliver sa mailbox as standard, MIGHT be required ka na nandun sa home o may authorized representative para tanggapin ang package mo or collect sa post office.","countryMsgMY":"Ang de minimis ay 500MYR for all orders sent to Malaysia. Orders above that amount ay pwedeng mache-charge.","countryMsgUS":"As of 29th August 2025, ang de minimis of USD800 ay officially ire-remove na at import tariffs ay payable by default for sender sa origin country.\nUSA shipping ay mag-REQUIRE ng valid phone number and email address para ang parcel mo ay makaiwas sa further delays.","countryMsgIL":"Ang de minimis ay 240 ILS (75 USD) for all orders shipped to Israel. Orders above that amount ay pwedeng mache-charge. \nPlease note for orders sent to Israel, Israel Post ay sometimes hindi nag-acknowledge ng final delivery once na na-deliver na. \nDahil Israel Post DOES NOT deliver sa mailbox as standard, MIGHT be required ka na nandun sa home o may authorized representative para tanggapin ang package mo or collect sa post office.","countryMsgGB":"Please note for orders sent to UK, Royal Mail ay sometimes hindi nag-acknowledge ng final delivery once na na-deliver na sa mailbox mo.","countryMsgTH":"Ang de minimis ay 1500THB (45 USD) for all orders shipped to Thailand. Orders above that amount ay pwedeng mache-charge.","countryMsgTW":"Ang de minimis ay 2000TWD (60 USD) for all orders shipped to Taiwan. Orders above that amount ay pwedeng mache-charge.","countryMsgMO":"Walang D&T na charge when sending to Macau. Pero note na Macau Post DOES NOT deliver sa mailbox as standard, kailangan mo talagang COLLECT ang package mo sa post office.","countryMsgBN":"Walang D&T na charge when sending to Brunei. Pero note na Brunei Post DOES NOT deliver sa mailbox as standard, kailangan mo talagang COLLECT ang package mo sa post office. \nAng Tracking system for this country ay hindi very stable at limited information lang ang given, and final delivery results ay NOT given to origin.","countryMsgJP":"Ang de minimis ay 10000JPY (65 USD) for all orders shipped to Japan. Orders above that amount ay pwedeng mache-charge.","countryMsgKR":"Ang de minimis ay 180000KRW (150 USD) for all orders shipped to South Korea. Orders above that amount ay pwedeng mache-charge.","countryMsgVN":"Para sa Vietnam, please remain CONTACTABLE during delivery kasi baka mache-charge ka ng handling fees upon delivery ng item. \nAng de minimis ay 1000000 (35 USD) for all orders shipped to Vietnam. Orders above that amount ay pwedeng mache-charge. \nDahil Vietnam Post DOES NOT deliver sa mailbox as standard, MIGHT be required ka na nandun sa home o may authorized representative para tanggapin ang package mo or collect sa post office.","countryMsgPP":"Ang Tracked Label items ay ipo-post sa POPDrop/POPStop sa post office. SpeedPost Standard items ay usually posted sa POPStop or POPStation.\nNote na ang deliveries ng Tracked Label items ay ONLY every Monday to Friday from 9am to 6pm. Except for Weekends & Public Holidays.","dhlNoEmbed":"Hindi suportado ng DHL Express ang embed tracking. Please","speedPostNoEmbed":"Hindi suportado ng SpeedPost Singapore ang embed tracking. Please","operatorNoEmbed":"ay hindi sumusuporta ng embed tracking. Please","clickHere":"mag-click dito","toTrackNewTab":"para mag-track (bubuksan sa bagong tab).","viewTrackingDHL":"Tingnan ang Tracking Information mula sa DHL Express","viewTrackingSingPostSpeedPost":"Tingnan ang Tracking Information mula sa Singapore SpeedPost","viewTrackingDHLLastMile":"Tingnan ang Tracking Information mula sa DHL Express (Last-mile)","viewTrackingDHLShipperRef":"Tingnan ang Tracking Information mula sa DHL Express (Shipper Reference)","viewTrackingSingPost":"Tingnan ang Tracking Information mula sa Singapore Post","viewTrackingDestPost":"Tingnan ang Tracking Information mula sa","post":"Post","statusInPreparation":"Naghahanda","statusInTransit":"Nasa Daan","statusDelivered":"Naihatid","statusOutForDelivery":"Palabas para sa Paghahatid","statusArrived":"Dumating","statusProcessing":"Pinoproseso","statusDispatched":"Naipadala","statusReturned":"Naibalik","statusFailed":"Nabigo ang Paghahatid","statusCancelled":"Kinansela","statusHeldByCustoms":"Hinawakan ng Customs","statusAwaitingCollection":"Naghihintay ng Pagkolekta","aka":"kilala rin bilang","thisServiceKnownAs":"Ang serbisyong ito ay kilala bilang","in":"sa","countryRU":"🇷🇺 Russia","russiaServiceSuspended":"⚠️ MAHALAGANG ABISO: Dahil sa Russian invasion ng Ukraine noong 2022, ang SingPost kasama ng DHL ay nagsuspinde ng lahat ng shipments sa Russia. Hindi namin sineseserbisyuhan ang Russia sa ngayon hanggang may anunsyo ng pagbabalik ng mga serbisyo sa bansang iyon.","temporaryClosureNoticeTitle":"Rhythm Nexus - Pansamantalang Pabatid ng Pagsasara","temporaryClosureNoticeBody":"Mahal naming mga customer,\n\nPaalala po na pansamantalang sarado ang Rhythm Nexus mula Marso 21, 2026 hanggang Marso 26, 2026 dahil sa isang company event.\n\nBilang paghahanda sa pagsasara, ilalagay ang shop sa vacation mode simula Marso 20, 2026 sa 3:00 PM (UTC +8). Ang mga order na mailalagay pagkatapos ng oras na ito ay maaaring hindi maproseso hanggang sa magbalik kami sa normal na operasyon.\n\nMagpapatuloy ang normal na operasyon sa Marso 27, 2026.\n\nHumihingi kami ng paumanhin sa anumang abala at pinahahalagahan namin ang inyong pag-unawa at patuloy na suporta.\n\nMaraming salamat.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Naiintindihan ko","parcelTracking":"Pagsubaybay sa Parcel","serviceAnnouncement":"Anunsyo ng Serbisyo","usaWinterStormTitle":"MASINGIL: Matinding Winter Storm - Pagkaantala ng Serbisyo","usaWinterStormSubtitle":"United States Postal Service (USPS) Force Majeure Event","usaWinterStormNotice1":"Dahil sa matinding bagyo sa panahon ng taglamig na nakakaapekto sa rehiyong New York mula noong Pebrero 23, 2026:","usaWinterStormNotice2":"Ang mga pandaigdigang operasyon sa John F. Kennedy International Airport ay epektibong titigil","usaWinterStormNotice3":"Malawak na pagkansela ng paglipad at malaking pagkaantala sa serbisyo ng airport na natatala","usaWinterStormNotice4":"Ang mga kundisyong ito ay bumubuo ng force majeure event na lampas sa kontrol ng USPS","usaWinterStormNotice5":"Epekto sa Serbisyo:","usaWinterStormNotice6":"Mapanganib na halo ng mabigat na niyebe, nag-aalab na ulan, sleet at matinding lamig","usaWinterStormNotice7":"Malaking pagkaantala at malawak na pagputol ng kuryente ay natatala","usaWinterStormNotice8":"Ang pagkolekta at paghahatid ng bawas-lokal at pandaigdigang koreo (sulat-post, parcel-post at EMS na mga item) ay naapektuhan","usaWinterStormNotice9":"Apektadong Postcode Areas:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"Ang USPS ay gumagawa ng lahat ng kinakailangang hakbang upang mabawasan ang kaginhawahan sa mga customer habang pinapanatiling ligtas ang mga empleyado. Nagpapasalamat kami sa inyong pasensya at pag-unawa sa panahon ng force majeure event na ito.","usaWinterStormNotice12":"Huling update: 25 Pebrero 2026","countryAutoDetected":"Destinasyon na itinakda batay sa iyong lokasyon","countryAutoDetectedFromLink":"Destinasyon na itinakda mula sa link","trackingNumber":"Numero ng Pagsubaybay","destinationCountry":"Destinasyon na Bansa","postcode":"Postcode","topCountries":"Nangungunang 5 Bansa","otherCountries":"Iba pang mga Bansa","fillAllFields":"Mangyaring punan ang lahat ng kinakailangang field: tracking number, destination country, order number, at postcode.","noOrderMatchingFields":"Walang nakitang order na tumutugma sa lahat ng field.","postcodeRequired":"Kinakailangan ang postcode para sa destinasyong ito.","invalidUSZip":"Di-wastong US ZIP Code. Gumamit ng 5 digit o ZIP+4.","failedGenerateURL":"Nabigong bumuo ng tracking URL. Pakisuri ang input.","trackingValidationSG":"Ang mga tracking number para sa Singapore ay dapat na: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG o PX123456789SG. Para sa DHL Shipments gumamit ng 10-digit na numero.","invalidSingPostFormat":"Di-wastong format ng tracking number ng SingPost.\nMga tinatanggap na format:\n• PP123456789SG → Prepaid Tracked Label\n• SPNDD00012345 → SpeedPost Standard Tracking","trackingNumberExample":"hal. LG123456789SG","australianDSTTitle":"Aktibo ang Australian Daylight Saving Time","australianDSTBothMessage":"Parehong AEDT (Australian Eastern Daylight Time) at ACDT (Australian Central Daylight Time) ay kasalukuyang may bisa.","australianAEDTMessage":"Ang AEDT (Australian Eastern Daylight Time) ay kasalukuyang may bisa para sa Sydney, Melbourne, at mga kalapit na lugar.","australianACDTMessage":"Ang ACDT (Australian Central Daylight Time) ay kasalukuyang may bisa para sa Adelaide at South Australia.","australianDSTNote":"Ang mga oras ng paghahatid na ipinapakita sa itaas ay sumasalamin sa kasalukuyang daylight saving time.","filteredAllowedDestinations":"(Na-filter para sa iyong mga pinapayagang destinasyon)","loadingAnnouncements":"Nilo-load ang mga anunsyo...","unableToLoadAnnouncements":"Hindi ma-load ang mga anunsyo ng serbisyo sa ngayon.","viewOnSingPostWebsite":"Tingnan sa SingPost Website →","postedDate":"Petsa ng Na-post:","status":"Katayuan:","shippedVia":"Ipinadala sa pamamagitan ng:","destination":"Patutunguhan:","statusHeldByCustms":"Hawak ng Customs","orderNumberExample":"Numero ng Order (nagsisimula sa RTNX o DLTB - halimbawa: RTNX1234567890):","deliveryRecordNote":"Pakitandaan na kapag naihatid na ang item, maiimbak lamang ang tala hanggang 7 araw at tatanggalin.","copyrightAllRights":"Lahat ng karapatan ay nakalaan.","accessRestricted":"Pinaghihigpitan ang Access","vpnDetectedMessage":"Natukoy ang paggamit ng VPN. Mangyaring huwag paganahin ang VPN upang ma-access ang serbisyong ito.","contactSupportError":"Kung naniniwala kang isa itong error, mangyaring makipag-ugnayan sa suporta.","destinationNotAllowed":"Ang access sa destinasyong bansang ito ay hindi available mula sa iyong lokasyon. Mangyaring pumili ng ibang destinasyon.","epacUS":"Pang-internasyonal na Serbisyo ng Pang-Unang Klase na Package","epacCH":"Priyoridad Plus","epacGB":"International na sinusubaybayan","epacMY":"International Tracked/Express","epacCA":"International Inbound Express","epacAU":"Pack and Track International","epacNZ":"Sinusubaybayan ang International Economy","epacDE":"Warenpost International Premium","epacFR":"Internasyonal na liham na may pagsubaybay","epacNL":"Sinusubaybayan ang International Packet","epacPL":"GLOBAL Express","epacBE":"International Prime Inbound","epacAT":"International Tracked Packet","epacIN":"International Tracked Packet","epacFI":"Internasyonal na Sinusubaybayang Liham","epacSE":"Internasyonal na Sinusubaybayang Liham","epacNO":"PRIME Exprès","epacIT":"Express","epacIL":"Express","epacES":"International Light Package","epacPT":"International Blue Mail","epacCZ":"Sinusubaybayan ang pagpapadala mula sa ibang bansa","epacBN":"Internasyonal na ePacket","epacCN":"Internasyonal na ePacket","epacHK":"Internasyonal na ePacket","epacID":"Internasyonal na e-Packet","epacMO":"Internasyonal na ePacket","epacPH":"Internasyonal na Sinusubaybayaang Koreo","epacTW":"Internasyonal na ePacket","epacTH":"Internasyonal na ePacket","epacVN":"International E-Packet (ASEAN Pack)","epacKR":"K-Packet","epacJP":"International e-Packet Light","postalContactsTitle":"Mga Contact ng Serbisyong Postal","postalContactsNote":"Paalala:","postalContactsPolandUKNote":"Para sa Poland at UK, lahat ng item na ipinadala sa pamamagitan ng SpeedPost Priority (EMS) ay aasikasuhin ng Pocztex at Parcelforce.","postalContactsDHLNote":"Para sa SpeedPost Express na pagpapadala, mangyaring makipag-ugnayan sa DHL sa pamamagitan ng link na ito:","postalContactsCountry":"Bansa","postalContactsWebsite":"Website","postalContactsForm":"Contact Form","postalContactsPhone":"Contact Number","postalContactsEmail":"Contact Email","postalContactsFormLink":"Contact Form","postalContactsBackButton":"Bumalik sa Parcel Enquiry Form","epacIE":"International Express Post","contactUsTitle":"Makipag-ugnayan sa Amin","contactNameLabel":"Pangalan","contactEmailLabel":"Email","contactEmailNote":"Ang mga private relay email (hal., @privaterelay.appleid.com) ay hindi tinatanggap. Mangyaring gumamit ng wastong email address.","contactEnquiryTypeLabel":"Ito ba ay isang?","contactSelectOption":"Pumili ng opsyon","contactGeneralEnquiry":"Pangkalahatang Pagtatanong / Feedback","contactBusinessEnquiry":"Pagtatanong sa Negosyo","contactOrderShippingEnquiry":"Pagtatanong ng Order/Pagpapadala","contactExchangeRefundEnquiry":"Pagtatanong ng Exchange/Refund/Pagbabalik","contactOthers":"Ang iba","contactParcelWarning":"If your parcel is not delivered for more than 18/30/45 days (14 days for FedEx), or status shows delivered but it is not with you, please fill in","contactParcelWarningLink":"THIS FORM","contactParcelWarningEnd":"instead.","contactOrderNumberLabel":"Order Number","contactOrderNumberPlaceholder":"Example: RTNX1234567890","contactPlatformNote":"Etsy, eBay & Shopee order number dito. Wala kaming kontrol sa mga refund mula sa mga platform na ito. Mangyaring makipag-ugnayan sa kanilang customer service.","contactPlatformInstructions":"Mangyaring gamitin ang app upang tingnan ang iyong numero ng order, dahil ito ay naka-save sa app:","contactPlatformEtsy":"Etsy - Kanan sa itaas sa iyong profile → Mga Pagbili","contactPlatformEbay":"eBay - Aking eBay → Mga Pagbili","contactPlatformShopee":"Shopee - Ako → Tingnan ang Kasaysayan ng Pagbili (o maaari kang mag-click sa Upang Ipadala/Upang Makatanggap)","contactRefundNote1":"Kung nagtatanong ka para sa Return/Refund para sa mga platform na binili mo, pakitandaan na ZERO ang kontrol namin sa mga refund mula sa mga platform na ito. Mangyaring makipag-ugnayan sa kanilang serbisyo sa customer ayon sa pagkakabanggit.","contactRefundNote2":"Para sa Mga Pagbabalik o Pagpapalit, hindi namin pinapayagan ito para sa maimai gloves kung nagamit na ang mga ito noong binuksan (nakikitang mantsa o nahugasan sa washing machine/manual wash), at walang pagbabalik o pagpapalit na pinapayagan para sa mga amusement card. salamat po.","contactRefundNote3":"Pakitandaan na para sa mga refund sa pamamagitan ng Payhip, makipag-ugnayan sa iyong bangko o suporta sa Payhip sa support@payhip.com para sa impormasyon kung hindi mo pa natatanggap ang refund dahil wala kaming kontrol sa proseso.","contactMessageLabel":"Mensahe","contactCharacterCount":"mga karakter","contactSpamWarningNote":"Tandaan:","contactSpamWarning":"Ang mga hindi hiniling na alok para sa SEO, web design, pautang o katulad na serbisyo ay awtomatikong tatanggihan.","contactAgreementText1":"Mangyaring mag-click sa \"Sumasang-ayon ako\", kung sumasang-ayon ka sa iyong email address na ginagamit para sa Rhythm Nexus na tumugon sa iyo, dahil ito ay kinakailangan sa amin na basahin ang iyong tugon at tumugon sa iyo sa sandaling makalabas kami ng solusyon para sa iyong pagtatanong.","contactAgreementText2":"Tandaan na ang aming tugon ay tatagal ng 3-5 araw ng negosyo, o mas matagal sa panahon ng mataas na dami ng mga email sa aming bahagi.","contactAgreeCheckbox":"Sumasang-ayon Ako","contactSuccessMessage":"Naisumite na ang iyong mensahe! Tutugon kami sa loob ng 3-5 araw ng negosyo.","contactErrorMessage":"Failed to send message. Please try again.","contactGeneralError":"An error occurred. Please try again later.","contactSubmitting":"Submitting...","contactSubmit":"Submit","contactAlertAgree":"Please agree to the terms to submit the form.","parcelEnquiryTitle":"Katanungan sa Parcel","parcelInfoText":"Ang form na ito ay para sa mga parsela na hindi naihatid nang higit sa 18/30/45 araw (14 na araw para sa FedEx/DHL), o nagpakita ng katayuang naihatid ngunit wala sa iyo.","parcelInfoLink":"Mag-click dito","parcelInfoEnd":"para sa iba pang katanungan.","parcelWaitTitle":"Maghintay para sa iyong parcel","parcelWaitText1":"Mangyaring maghintay para sa paghahatid ng iyong parcel. Tandaan na ang mga internasyonal na paghahatid ay HINDI pareho sa mga lokal na paghahatid dahil tumatagal ang mga ito ng oras. Salamat!","parcelWaitText2":"Kung walang status na lumalabas pagkatapos ng 18 araw (7 araw para sa Singapore) o higit pa, maaari mong direktang ipaalam sa amin.","parcelCannotSubmit":"You cannot submit this form if you selected \"No\".","parcelNameLabel":"Pangalan","parcelOrderNumberLabel":"Numero ng Order (Halimbawa: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Email","parcelEmailNote":"Ang mga private relay email ay hindi tinatanggap. Mangyaring gumamit ng wastong email address.","parcelShippingMethodLabel":"Napili ang Paraan ng Pagpapadala?","parcelSelectShipping":"Pumili ng paraan ng pagpapadala","parcelSingPostEpac":"SingPost ePacket (or ePAC) - aka SpeedPost Saver International (Tracking: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Tracking: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Tracking: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Tracking: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Tracking: PX123456789SG)","parcelDHL":"DHL Express (EU Countries Only) (Tracking: 1234567890)","parcelTrackingNumberLabel":"Tracking Number","parcelUndeliveredLabel":"Ang iyong parsela ay hindi naihatid nang higit sa 18/30/45 araw? (Singapore Local services >7 araw, >14 araw para sa SpeedPost Express/DHL)","parcelSelectOption":"Pumili ng opsyon","parcelYes":"Oo","parcelNo":"Hindi","parcelDeliveredButMissingLabel":"Nagpakita ba ang iyong parcel ng status na naihatid, ngunit wala ito sa iyong mailbox/ligtas na lugar/pintuan?","parcelCaseReferenceLabel":"Case Reference ID mula sa Local Post Office","parcelCaseReferencePlaceholder":"Lagyan ng NA kung taga Singapore ka","parcelCaseReferenceNote":"Bago isumite ang form na ito, mangyaring makipag-ugnayan sa iyong lokal na post office sa pamamagitan ng telepono o email at kumuha ng case reference ID mula sa kanila. Pagkatapos, ilagay ang iyong case reference ID dito.","parcelCaseReferenceLink":"Sumangguni sa link na ito para sa mga contact sa Serbisyong Postal","parcelCaseReferenceMandatory":"PUT NA LANG KUNG SINGAPORE KA. Para sa ibang bansa ay MANDATORY na magbigay. Kinakailangan din para sa SpeedPost Express, para sa case ID ng DHL.","parcelImageEvidenceLabel":"Katibayan ng Larawan (para sa naihatid ngunit nawawalang mga parsela)","parcelImageWarning":"Para sa karagdagang pag-verify, kailangan namin ng ebidensya ng larawan upang patunayan na hindi ka gumagawa ng mga maling claim tungkol sa hindi paghahatid ng mga parcel. (Para lamang sa mga parcel na naihatid na, ngunit wala sa kahon ng koreo/labas ng pinto. Maaari naming tanggihan ang iyong claim kung walang ibinigay na photographic evidence para sa mga naihatid na item. Huwag pansinin ito kung ang iyong item ay HINDI nagpakita ng naihatid na status.)","parcelImageNote":"Mag-upload ng 1 suportadong file: larawan. Max 1 GB.","parcelAgreementText":"Mangyaring Mag-click sa \"Sumasang-ayon ako\" kung tinitiyak mong totoo ang nangyari sa iyong parsela.","parcelAgreeCheckbox":"Sumasang-ayon Ako","parcelSuccessMessage":"Naisumite na ang iyong katanungan sa parcel! Tutugon kami sa loob ng 3-5 araw ng negosyo.","parcelErrorMessage":"Failed to submit enquiry. Please try again.","parcelGeneralError":"An error occurred. Please try again later.","parcelAlertWait":"Please await for your parcel to deliver. You can submit this form after the specified waiting period.","parcelAlertAgree":"Please agree to the terms to submit the form.","parcelAlertCaseReference":"Please provide a case reference ID from your local post office, or put NA if you are from Singapore.","parcelSubmitting":"Submitting...","parcelSubmit":"Submit","lookalikeDomainWarning":"Hindi ito tracking number kundi link sa website na nagpapanggap na courier. Huwag maglagay doon ng personal o pambayad na impormasyon.","lookalikeDomainOfficial":"Opisyal na website:"};
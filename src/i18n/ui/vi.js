@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus su dung cac mang luoi thuong mai cao cap. Tuy nhien, ngay khi hang den quoc gia cua ban, quyen quan ly se chuyen sang don vi van chuyen noi dia dia phuong (vi du: USPS, Royal Mail, DHL tai dia phuong). Tien to ma theo doi se doi theo he thong xu ly tai nguong nay, nhung cong cu theo doi buu kien toan cau cua chung toi ket noi cac trang thai do de ban luon co tam nhin xuyen suot.","trackingLastMileTitle":"Mang Luoi Giao Hang Chang Cuoi","trackingCustomsClearanceBody":"Tat ca hang hoa xuyen bien gioi deu phai duoc co quan hai quan tai quoc gia cua ban thong quan. Cong cu cua chung toi theo doi cac chuyen trang thai tu luc den co so nhap khau den khi ban giao cho hai quan. Luc luong bien phong se xac minh ma HS va dam bao VAT hoac thue/phi phu hop da duoc nop (vi du: IOSS tai EU, VOEC tai Na Uy). Hay theo doi dac biet cac canh bao \"Held at Customs\".","trackingCustomsClearanceTitle":"Thong Tin Thong Quan Hai Quan","trackingProcessingOriginBody":"Sau khi duoc gui di, mon hang vao trung tam xu ly xuat phat, noi no duoc quet, can va trai qua cac buoc kiem tra an ninh xuat khau ban dau. Sau do, hang duoc chuyen den diem trao doi thu tin quoc te. Lich bay phu thuoc vao bang thong hang hoa con trong. Dung lo neu trang thai nay keo dai vai ngay.","trackingProcessingOriginTitle":"Dang Xu Ly Tai Trung Tam Xuat Phat","trackingInfoReceivedBody":"Khi don hang duoc xu ly lan dau tren cac nen tang thuong mai dien tu cua chung toi (nhu Etsy, eBay hoac ban truc tiep), ma theo doi duoc tao dien tu. Don vi van chuyen nhan du lieu lo hang truoc khi tiep nhan thung hang thuc te. Vui long cho tu 1 den 3 ngay lam viec de buu kien duoc nhap vao co so phan loai vat ly.","trackingInfoReceivedTitle":"Da Nhan Thong Tin","trackingStatusesIntro":"Cam on ban da su dung cong cu theo doi buu kien quoc te hop nhat cua chung toi. Vi kien hang cua ban di qua nhieu bien gioi toan cau, cac trang thai theo doi co the kha phuc tap. Viec hieu vong doi logistics giup thiet lap ky vong ro rang.","trackingStatusesTitle":"Hieu Cac Trang Thai Theo Doi","footerDesc":"Your premier destination for arcade amusement cards, rhythm game gloves, and specialized merch. Enjoy global e-commerce with seamless international parcel tracking and reliable shipping data.","amText":"SA","pmText":"CH","footerQuickLinks":"Liên kết nhanh","footerSupportLegal":"Hỗ trợ & Pháp lý","copyrightText":"Bảo lưu mọi quyền.","tzAEST":"AEST (Sydney/Melbourne)","tzACST":"ACST (Adelaide)","tzAWST":"AWST (Perth)","tzNST":"NST (Newfoundland)","tzAST":"AST (Đại Tây Dương)","tzEST":"EST (Miền Đông)","tzCST":"CST (Miền Trung)","tzMST":"MST (Miền Núi)","tzPST":"PST (Thái Bình Dương)","tzAKST":"AKST (Alaska)","tzHST":"HST (Hawaii)","tzBeijing":"Bắc Kinh","tzXinjiang":"Tân Cương","tzWIB":"WIB (Jakarta)","tzWITA":"WITA (Makassar)","tzWIT":"WIT (Jayapura)","tzKaliningrad":"Tỉnh Kaliningrad (UTC+2)","tzMoscow":"Moscow/Tây Nga (UTC+3)","tzSamara":"Tỉnh Samara (UTC+4)","tzUral":"Vùng Ural (UTC+5)","tzOmsk":"Tỉnh Omsk (UTC+6)","tzKrasnoyarsk":"Vùng Krasnoyarsk (UTC+7)","tzIrkutsk":"Tỉnh Irkutsk (UTC+8)","tzSakha":"Cộng hòa Sakha (UTC+9)","tzPrimorsky":"Vùng Primorsky (UTC+10)","tzMagadan":"Tỉnh Magadan (UTC+11)","tzKamchatka":"Vùng Kamchatka (UTC+12)","dstDayStartsLabel":"Giờ mùa hè bắt đầu","dstDayEndsLabel":"Giờ mùa hè kết thúc","dstRevertsLabel":"trở về giờ chuẩn","dstEuropeLabel":"Châu Âu","dstNewZealandLabel":"New Zealand","englishResponseNotice":"Lưu ý: Mọi thắc mắc đều được trả lời bằng tiếng Anh. Nếu bạn gửi bằng ngôn ngữ khác, tin nhắn của bạn có thể được dịch sang tiếng Anh để xác minh.","parcelDisagreeCheckbox":"Tôi không đồng ý","contactDisagreeCheckbox":"Tôi không đồng ý","contactNamePlaceholder":"Ví dụ: Nguyễn Văn A","systemRequirementsTitle":"Phiên bản hệ thống được hỗ trợ tối thiểu","systemRequirements":"Windows: Windows 7 (with ESU updates installed) trở lên\nmacOS: macOS 12 trở lên\nAndroid: Android 13 trở lên\niPhone/iOS: iOS 17 trở lên\nLinux: Bản phân phối hiện được hỗ trợ với các bản cập nhật bảo mật đang hoạt động","goodFridayEasterGreeting":"Phục Sinh vui vẻ! Bình an và vui vẻ vào Thứ Sáu Tuần Thánh và Lễ Phục Sinh.","christmasGreeting":"Giáng Sinh vui vẻ và Năm Mới hạnh phúc! Bình an và vui vẻ từ ngày 25 tháng 12 đến ngày 5 tháng 1.","captchaSystemRequirements":"Yêu cầu hệ thống tối thiểu: Windows 7 (with ESU updates installed) hoặc 11, macOS 10.15+, hoặc phiên bản Android/iOS mới nhất.","title":"Xác Minh Truy Cập","subtitle":"Vui lòng hoàn thành thử thách bên dưới để tiếp tục.","selectLanguage":"Chọn Ngôn Ngữ","selectLanguagePlaceholder":"-- Chọn một ngôn ngữ --","loadingChallenge":"Đang tải thử thách...","answerLabel":"Câu trả lời của bạn:","answerPlaceholder":"Nhập câu trả lời của bạn","continueButton":"Tiếp Tục","refreshButton":"Thử Thách Mới","verifying":"Đang xác minh...","chooseLanguageFirst":"Vui lòng chọn ngôn ngữ trước.","loadFailed":"Không tải được thử thách. Vui lòng thử lại.","expiredChallenge":"Thử thách đã hết hạn. Đang tải thử thách mới...","verifyFailed":"Xác minh thất bại. Vui lòng thử lại.","home":"Trang Chủ","blog":"Blog","aboutUs":"Về Chúng Tôi","faq":"Câu Hỏi Thường Gặp","contact":"Liên Hệ","trackPackage":"Theo Dõi Kiện Hàng","cnyYearOfHorseMessage":"🧧 Chúc mừng Tết Âm Lịch! Chúc bạn thịnh vượng và vui vẻ trong Năm Ngọ! 🐴","singaporeNationalDayMessage":"🇸🇬 Chúc mừng Ngày Quốc khánh, Singapore! Kỷ niệm 61 năm độc lập! 🎉","indonesiaNationalDayMessage":"🇮🇩 Selamat Hari Kemerdekaan Indonesia! Dirgahayu Cộng hòa Indonesia! 🎊","malaysiaNationalDayMessage":"🇲🇾 Selamat Hari Merdeka, Malaysia! Kỷ niệm ngày độc lập của đất nước chúng ta! 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - Thong bao tam dong cua","temporaryClosureNoticeBody":"Quy khach hang than men,\n\nXin luu y Rhythm Nexus se tam dong cua tu ngay 21 thang 3 nam 2026 den ngay 26 thang 3 nam 2026 do su kien cua cong ty.\n\nDe chuan bi cho thoi gian dong cua, cua hang se chuyen sang che do nghi phep bat dau tu 3:00 PM (UTC +8), ngay 20 thang 3 nam 2026. Don hang dat sau thoi diem nay co the chua duoc xu ly cho den khi chung toi hoat dong tro lai.\n\nHoat dong kinh doanh binh thuong se tro lai vao ngay 27 thang 3 nam 2026.\n\nChung toi xin loi vi bat ky bat tien nao gay ra va cam on su thong cam cung su ung ho lien tuc cua quy khach.\n\nXin cam on.\n\nRhythm Nexus","temporaryClosureNoticeClose":"Toi da hieu","parcelTracking":"Theo Dõi Kiện Hàng","serviceAnnouncement":"Thông Báo Dịch Vụ","usaWinterStormTitle":"CẤP BÁO: Cơn bão mùa đông nghiêm trọng - Gián đoạn dịch vụ","usaWinterStormSubtitle":"Dịch vụ Bưu chính Hoa Kỳ (USPS) Sự kiện Bất khả kháng","usaWinterStormNotice1":"Do cơn bão mùa đông nghiêm trọng ảnh hưởng đến khu vực New York kể từ ngày 23 tháng 2 năm 2026:","usaWinterStormNotice2":"Hoạt động quốc tế tại Sân bay Quốc tế John F. Kennedy đã bị dừng lại hiệu quả","usaWinterStormNotice3":"Báo cáo hủy chuyến bay trên diện rộng và gián đoạn đáng kể dịch vụ sân bay","usaWinterStormNotice4":"Những điều kiện này tạo thành một sự kiện bất khả kháng vượt quá sự kiểm soát của USPS","usaWinterStormNotice5":"Tác động đến dịch vụ:","usaWinterStormNotice6":"Sự kết hợp nguy hiểm của tuyết rơi nặng, mưa đông cứng, mưa tuyết và lạnh giá","usaWinterStormNotice7":"Báo cáo gián đoạn lớn và mất điện trên diện rộng","usaWinterStormNotice8":"Thu thập và gửi thư trong nước và quốc tế (thư, bưu kiện và các mục EMS) bị ảnh hưởng","usaWinterStormNotice9":"Các vùng mã bưu chính bị ảnh hưởng:","usaWinterStormNotice10":"06000–06999, 01000–02799, 03900–04999, 03000–03899, 07000–08999, 10001–14925, 15000–19699, 02800–02999, 05000–05999, 20001–20020, 20100–24699, 04699, 35000–36999","usaWinterStormNotice11":"USPS đang thực hiện tất cả các bước cần thiết để giảm thiểu bất tiện cho khách hàng trong khi đảm bảo an toàn cho nhân viên. Chúng tôi trân trọng sự kiên nhẫn và sự hiểu biết của bạn trong sự kiện bất khả kháng này.","usaWinterStormNotice12":"Cập nhật lần cuối: 25 tháng 2 năm 2026","countryAutoDetected":"Điểm đến được đặt sẵn dựa trên vị trí của bạn","countryAutoDetectedFromLink":"Điểm đến được đặt sẵn từ liên kết","trackingNumber":"Số Theo Dõi","destinationCountry":"Quốc Gia Đích","postcode":"Mã Bưu Chính","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! Chúc mừng Ngày Nga! 🎉","taiwanFoundingDayMessage":"🇹🇼 Chúc mừng Ngày Thành lập, Đài Loan! 中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 Chúc mừng Ngày Quốc khánh Đài Loan! 國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 Chúc mừng Ngày Thành lập Đặc khu Hành chính Hồng Kông! 香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 Chúc mừng Ngày Thành lập Đặc khu Hành chính Ma Cao! 澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ Chúc mừng Ngày Quốc tế Lao động! Kỷ niệm lao động và quyền của người lao động! 🎊","laborDayUSCAMessage":"⚒️ Chúc mừng Ngày Lao động! Tôn vinh những đóng góp của người lao động! 🎉","orderNumber":"Số Đơn Hàng (Ví dụ: RTNX1234567890)","fromDate":"Từ Ngày (BẮT BUỘC)","toDate":"Đến Ngày (BẮT BUỘC)","optionSingPost":"🇸🇬 Singapore Post (SingPost)","countryAU":"🇦🇺 Úc","countryCA":"🇨🇦 Canada","countryDE":"🇩🇪 Đức","countryGB":"🇬🇧 Vương quốc Anh","countryUS":"🇺🇸 Hoa Kỳ","countryAT":"🇦🇹 Áo","countryBE":"🇧🇪 Bỉ","countryBN":"🇧🇳 Brunei","countryCN":"🇨🇳 Trung Quốc","countryCZ":"🇨🇿 Séc","countryFI":"🇫🇮 Phần Lan","countryFR":"🇫🇷 Pháp","countryHK":"🇭🇰 Hồng Kông SAR Trung Quốc","countryIN":"🇮🇳 Ấn Độ","countryID":"🇮🇩 Indonesia","countryIE":"🇮🇪 Ireland","countryIL":"🇮🇱 Israel","countryIT":"🇮🇹 Ý","countryJP":"🇯🇵 Nhật Bản","countryMO":"🇲🇴 Ma Cao SAR Trung Quốc","countryMY":"🇲🇾Malaysia","countryNL":"🇳🇱 Hà Lan","countryNZ":"🇳🇿New Zealand","countryNO":"🇳🇴 Na Uy","countryPH":"🇵🇭 Philippines","countryPL":"🇵🇱 Ba Lan","countryPT":"🇵🇹 Bồ Đào Nha","countryKR":"🇰🇷 Hàn Quốc","countryES":"🇪🇸 Tây Ban Nha","countrySE":"🇸🇪 Thụy Điển","countryCH":"🇨🇭 Thụy Sĩ","filteredAllowedDestinations":"(Được lọc theo quốc gia điểm đến được phép)","loadingAnnouncements":"Đang tải thông báo...","unableToLoadAnnouncements":"Hiện không thể tải thông báo dịch vụ.","viewOnSingPostWebsite":"Xem trên trang web SingPost →","countryTW":"🇹🇼 Đài Loan","countryTH":"🇹🇭 Thái Lan","countryVN":"🇻🇳 Việt Nam","note":"LƯU Ý","disclaimer":"TUYÊN BỐ MIỄN TRỪ TRÁCH NHIỆM","importantInformation":"Thông Tin Quan Trọng:","didNotReceiveEmail":"Nếu bạn không nhận được email xác nhận từ Etsy, eBay, Shopee hoặc Payhip, hãy cuộn xuống bên dưới để tìm kiếm đơn hàng của bạn qua địa chỉ email hoặc số điện thoại được liên kết với đơn hàng này.","searchByEmailOrPhone":"Tìm Kiếm Theo Email hoặc Điện Thoại","searchOrder":"Tìm Đơn Hàng","trackingResult":"Kết Quả Theo Dõi","noOrdersFound":"Không tìm thấy đơn hàng nào.","pleaseEnter":"Vui lòng nhập email, điện thoại hoặc số đơn hàng.","welcomeTitle":"Chào mừng đến với trang web của Rhythm Nexus!","purchaseInfo":"Mua từ chúng tôi qua các kênh chính thức, hoặc tham gia","purchaseInfoChina":"Mua từ chúng tôi qua các kênh chính thức.","purchaseInfoChinaSuffix":"","telegramGroup":"nhóm Telegram","forUpdates":"của chúng tôi để nhận cập nhật chính thức.","ourStores":"Các Cửa Hàng Của Chúng Tôi","etsyStore":"Cửa Hàng Etsy","ebayStore":"Cửa Hàng eBay","shopeeStore":"Cửa Hàng Shopee","payhipStore":"Cửa Hàng Payhip","internationalShipping":"Vận Chuyển Quốc Tế","singaporeLocal":"Địa Phương Singapore","asiaOnly":"Chỉ Châu Á","deliveryInfo":"Thông Tin Giao Hàng","deliveryRates2026":"Giá Giao Hàng 2026","sgDeliveryRates":"Giá Giao Hàng Singapore","speedPostRates":"Giá SpeedPost Express Quốc Tế","aboutTitle":"Về Rhythm Nexus","aboutP1":"Chúng tôi bắt đầu cửa hàng của mình vào năm 2022 và đã bán trên các nền tảng như Etsy, eBay và Shopee mà không gặp sự cố.","aboutP2":"Theo thời gian, chúng tôi đã xây dựng một danh tiếng vững chắc bằng cách tập trung vào việc hoàn thành đáng tin cậy và theo dõi chính xác.","aboutP3":"Mục tiêu của chúng tôi là cung cấp cho khách hàng trải nghiệm mua sắm suôn sẻ và đáng tin cậy.","aboutP4":"Cảm ơn bạn đã hỗ trợ Rhythm Nexus.","faqTitle":"Câu hỏi thường gặp","faqQ1":"Nếu hàng của tôi bị lỗi thì sao? Có bảo hành không?","faqA1":"Có! Hầu hết các đơn đặt hàng đều được bảo hành 1 năm. Vui lòng cung cấp số hóa đơn/đơn hàng của bạn để chúng tôi điều tra. Lưu ý: Không được phép đổi trả nếu mặt hàng khớp với mô tả ngay cả khi bạn đặt hàng sai.","faqQ2":"Tôi có thể chỉnh sửa, cập nhật hoặc hủy đơn hàng của mình không?","faqA2":"Có. Để bảo mật, các thay đổi đơn hàng có thể cần được xử lý qua email hoặc biểu mẫu liên hệ của chúng tôi.","faqQ3":"Tôi có phải trả Thuế Hải quan/Nhập khẩu không?","faqA3":"Hải quan và thuế thường không được trả trước, ngoại trừ DDP đến Hoa Kỳ. Thuế GTGT có thể áp dụng cho EU, Vương quốc Anh, Úc/New Zealand, Na Uy, Thụy Sĩ và các tỉnh của Canada như Saskatchewan và Manitoba đã được thanh toán theo mặc định. Không áp dụng thuế GST cho Singapore. Chúng tôi không thể tư vấn về phí hải quan — hãy liên hệ với hải quan địa phương của bạn để biết chi tiết.","faqQ4":"Khi nào đơn hàng của tôi được chuyển đi?","faqA4":"Đơn hàng thường được gửi đi trong vòng 1-5 ngày làm việc. Trong thời gian cao điểm, có thể mất 5–7 ngày.","faqQ5":"Tôi đã đặt hàng hai lần do nhầm lẫn. Tôi nên làm gì?","faqA5":"Chúng tôi chỉ hoàn lại phí vận chuyển trùng lặp. Cả hai mặt hàng sẽ được chuyển cùng nhau. Tiền hoàn lại = (phí vận chuyển lần 1 + phí vận chuyển lần 2) – phí vận chuyển thực tế.","faqQ6":"Giao hàng mất bao lâu?","faqA6":"Xử lý mất 1-5 ngày làm việc.\n\nVận chuyển trong nước:\n• SingPost Prepaid Tracked Label: 2-4 ngày\n• SpeedPost Standard: 1-3 ngày\n\nQuốc tế:\n• SingPost ePAC: 14-30 ngày\n• SpeedPost Priority (EMS): 8-15 ngày\n• SpeedPost Express: 4-8 ngày\n\nCó thể xảy ra chậm trễ trong các mùa cao điểm.","faqQ7":"Mặt hàng của tôi đang được trả lại cho người gửi. Tôi nên làm gì?","faqA7":"Được phép gửi lại một lần. Không thể hủy đối với địa chỉ không hợp lệ, bưu kiện không có người nhận hoặc phí hải quan chưa thanh toán. Liên hệ với dịch vụ bưu chính của bạn để giao hàng lại hoặc nhắn tin cho chúng tôi để được hỗ trợ.","faqQ8":"Mặt hàng của tôi bị mất / đánh cắp trong quá trình vận chuyển.","faqA8":"Chúng tôi cho phép gửi lại một lần. Nếu bị mất lần nữa, sẽ hoàn tiền đầy đủ sau thời gian giao hàng của nhân viên chuyển phát nhanh:\n\n• Dịch vụ địa phương Singapore: 7 ngày\n• SingPost ePAC & SpeedPost Priority International: 30 ngày\n• SpeedPost Intl Express: 14 ngày","blogTitle":"Cơ Sở Tri Thức Vận Chuyển & Bưu Điện","blogSubtitle":"Giải thích chính thức về dịch vụ bưu điện, hải quan, VAT và thuế.","readMore":"Đọc Thêm","backButton":"Quay Lại","blogPost1Title":"SingPost ePAC là gì?","blogPost1Desc":"Tìm hiểu về SingPost ePAC (ePacket), dịch vụ bưu điện theo dõi tiết kiệm.","blogPost2Title":"SpeedPost Priority International (EMS) là gì?","blogPost2Desc":"Khám phá EMS, dịch vụ chuyển phát nhanh bưu điện cao cấp quốc tế.","blogPost3Title":"SpeedPost Express là gì?","blogPost3Desc":"Khám phá SpeedPost Express với giao hàng DHL Express.","blogPost4Title":"USA PDDP","blogPost4Desc":"Hiểu về PDDP cho Mỹ.","blogPost5Title":"VAT EU & IOSS","blogPost5Desc":"Thông tin chi tiết về VAT EU và hệ thống IOSS.","blogPost6Title":"VAT UK & HMRC","blogPost6Desc":"Yêu cầu VAT cho Vương quốc Anh.","blogPost7Title":"Na Uy VOEC","blogPost7Desc":"Hệ thống VOEC của Na Uy.","blogPost8Title":"VAT Thụy Sĩ","blogPost8Desc":"Yêu cầu VAT của Thụy Sĩ.","enterDestinationPostcode":"Nhập mã bưu chính đích","trackingCaseSensitive":"CÁC CHỮ CÁI THEO DÕI PHÂN BIỆT CHỮ HOA CHỮ THƯỜNG VÀ PHẢI VIẾT HOA.","usaPostcodeNote":"Đối với các quốc gia không có mã bưu chính, ví dụ: Hồng Kông và Ma Cao, hãy nhập 999077 (Hồng Kông) hoặc 999078 (Ma Cao).","epacDeliveryNote":"Vui lòng LƯU Ý rằng tất cả các mặt hàng ePAC được gửi đến điểm đến phải được giao đến Hộp thư, Trước cửa, Tủ khóa bưu kiện hoặc để ở nơi an toàn!","currentTime":"Thời gian hiện tại","timezoneNote":"Thời gian hiển thị ở định dạng 12 giờ","sameTimeAsSingapore":"Cùng giờ với Singapore","hourAhead":"giờ trước Singapore","hoursAhead":"giờ trước Singapore","hourBehind":"giờ sau Singapore","hoursBehind":"giờ sau Singapore","collectAtPostOffice":"Tuy nhiên, nếu quốc gia của bạn không có Hộp thư theo tiêu chuẩn, bạn sẽ phải đến Bưu điện để lấy.","countriesNoMailbox":"Các quốc gia được biết là không có dịch vụ giao hàng Hộp thư/Hộp thư: Brunei, Trung Quốc, Ấn Độ, Israel, Ma Cao SAR Trung Quốc, Philippines, Ba Lan và Việt Nam.","rhythmNexusNotResponsible":"Rhythm Nexus KHÔNG CHỊU TRÁCH NHIỆM xử lý việc giao hàng vì điều này nằm ngoài tầm kiểm soát của chúng tôi và chúng tôi muốn bạn theo dõi trạng thái mặt hàng của mình.","issuesAfterDelivery":"Bất kỳ vấn đề nào với việc giao hàng của bạn sau 30/45 ngày (14 ngày đối với SpeedPost Express) hoặc trạng thái hiển thị đã giao nhưng bạn chưa nhận được, vui lòng liên hệ với chúng tôi","cannotUseEmbed":"Chúng tôi không thể sử dụng nhúng để theo dõi vì hầu hết các trang web dịch vụ bưu chính không hỗ trợ.","clickLinkAbove":"Vui lòng nhấp vào liên kết ở trên để theo dõi bưu kiện của bạn.","trackingDetailsNote":"Lưu ý rằng chi tiết theo dõi có thể không xuất hiện trong kết quả tìm kiếm nên bạn nên dán số theo dõi vào hệ thống để theo dõi mặt hàng.","thirdPartyWebsites":"Bạn cũng có thể theo dõi bưu kiện của mình trên các trang web của bên thứ 3 sau:","enterEmailOrPhone":"Nhập email hoặc điện thoại","reviewShippingRates":"Xem lại Giá cước vận chuyển hiện tại của chúng tôi","here":"tại đây","contactUsForm":"Vui lòng liên hệ với chúng tôi qua","form":"biểu mẫu này","forEnquiries":"để biết bất kỳ Câu hỏi nào bạn có liên quan đến đơn hàng của mình.","anPostNoDirectTracking":"An Post (Ireland) không hỗ trợ liên kết theo dõi trực tiếp hoặc theo dõi nhúng.","anPostPasteManually":"Vui lòng sao chép và dán số theo dõi của bạn thủ công trên trang web của An Post:","goToAnPost":"Đi đến An Post","countryMsgNL":"Nếu trạng thái phản ánh 'Held by Customs', vui lòng liên hệ với Đường dây Thông tin Hải quan Hà Lan để được hỗ trợ:\n0800 0143 (miễn phí), Thứ Hai đến Thứ Sáu từ 7 giờ sáng đến 11 giờ tối.\nThứ Bảy & Chủ Nhật từ 8 giờ sáng đến 4:30 chiều.\n\nBạn nên đăng ký tài khoản với PostNL để nhận thông báo đẩy ngay lập tức về các gói hàng của bạn:\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\nNếu nó được giao đến điểm PostNL hoặc trạng thái yêu cầu bạn nhận tại bưu điện, bạn sẽ phải trả 7 EUR tại quầy. Tối đa 4 EUR nếu thanh toán trực tuyến.","countryMsgDE":"Chúng tôi khuyến khích bạn tải xuống ứng dụng Post & DHL để nhận thông báo đẩy về trạng thái theo dõi các gói hàng của bạn:\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nLiên hệ Dịch vụ Khách hàng DHL Paket GmbH:\n+49-228-433-3112\nLiên hệ DHL DE: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"Bạn sẽ cần nộp tờ khai nhập khẩu bổ sung cho hải quan. Không làm như vậy có thể dẫn đến hạn chế nhập cảnh và gói hàng bị trả lại. \nThông tin thêm: https://www.posti.fi/en/receiving/customs-clearance \nCác liên kết khác: \nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"Phí xử lý là 4,95 EUR.\nTải xuống ứng dụng tại đây: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"Phí xử lý là 8,50 PLN. \nBạn sẽ phải trả khi nhận tại bưu điện,\nvì gói hàng khó có thể được giao đến cửa nhà hoặc hộp thư của bạn.","countryMsgPH":"PHLPost được coi là kém hiệu quả và không đáng tin cậy ở Philippines.\nLuôn theo dõi gói hàng của bạn vì đôi khi trạng thái giao hàng \nchỉ xuất hiện trong khoảng 1 đến 3 tuần đối với các gói nhỏ. Đối với các gói lớn hơn, \nviệc nhận chỉ có thể thông qua Bưu điện Trung tâm Manila, hoặc \nbưu điện gần nhất trong khu vực của bạn. Lưu ý rằng phí xử lý 112PHP áp dụng cho các gói \ncó bất kỳ giá trị nào mà bạn sẽ phải trả. Không trả sẽ dẫn đến việc gói hàng \nđược trả lại cho chúng tôi. Giao hàng ước tính mất 1-2 tháng do sự chậm chạp của dịch vụ PHLPost. \nBạn không cần phải trả thuế cho các mặt hàng dưới 10000PHP, nhưng bạn sẽ cần phải trả nếu nó bằng hoặc cao hơn số tiền đó. \nChúng tôi khuyên dùng SpeedPost Express để quá trình nhanh hơn lần sau bạn đặt hàng từ chúng tôi. Tuy nhiên, phí có thể không áp dụng vì D&T cho người nhận là mặc định.","countryMsgCA":"De minimis là 20CAD cho tất cả các đơn hàng gửi đến Canada, vì Singapore là thành viên của CPTPP, thuế có thể không áp dụng, nhưng D&T có thể áp dụng nếu mặt hàng vượt quá 60CAD trở lên hoặc 100CAD và ngưỡng trên phụ thuộc vào mã HS của mặt hàng. Bất kỳ giá trị nào trên số tiền đó sẽ bị tính VAT tương ứng.","countryMsgID":"Bạn phải trả mọi loại thuế và phí áp dụng khi đến Indonesia. Vui lòng theo dõi gói hàng của bạn và trả số tiền quy định cho hải quan Indonesia.\nBạn cũng sẽ phải nộp các giấy tờ thông quan bổ sung. Không làm như vậy có thể dẫn đến hạn chế nhập cảnh hoặc tịch thu gói hàng bởi hải quan quốc gia. Vui lòng kiểm tra thêm chi tiết tại đây:\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"Bạn phải trả mọi loại thuế và phí áp dụng khi đến Ấn Độ. Vui lòng theo dõi gói hàng của bạn và trả số tiền quy định cho hải quan Ấn Độ.\nLưu ý rằng thông quan hải quan ở Ấn Độ rất nghiêm ngặt và bạn có thể hoặc không bị tính thuế nếu giá trị mặt hàng của bạn trên 1000INR (15 USD) - tùy thuộc vào mã HS, trong hầu hết các trường hợp nó miễn thuế, nhưng bạn có thể bị tính thuế cao hơn nếu mặt hàng trên 5000INR (60 USD). \nVì India Post KHÔNG giao đến hộp thư theo tiêu chuẩn, bạn CÓ THỂ phải ở nhà hoặc có người đại diện được ủy quyền để nhận gói hàng của bạn hoặc nhận tại bưu điện.","countryMsgMY":"De minimis là 500MYR cho tất cả các đơn hàng gửi đến Malaysia. Đơn hàng trên số tiền đó có thể bị tính phí.","countryMsgUS":"Kể từ ngày 29 tháng 8 năm 2025, de minimis USD800 sẽ chính thức bị loại bỏ và thuế nhập khẩu sẽ phải trả mặc định cho người gửi ở quốc gia xuất xứ.\nVận chuyển USA sẽ YÊU CẦU số điện thoại và địa chỉ email hợp lệ để gói hàng của bạn tránh bị chậm trễ thêm.","countryMsgIL":"De minimis là 240 ILS (75 USD) cho tất cả các đơn hàng được vận chuyển đến Israel. Đơn hàng trên số tiền đó có thể bị tính phí. \nVui lòng lưu ý đối với các đơn hàng gửi đến Israel, Israel Post đôi khi có thể không xác nhận giao hàng cuối cùng sau khi đã được giao. \nVì Israel Post KHÔNG giao đến hộp thư theo tiêu chuẩn, bạn CÓ THỂ phải ở nhà hoặc có người đại diện được ủy quyền để nhận gói hàng của bạn hoặc nhận tại bưu điện.","countryMsgGB":"Vui lòng lưu ý đối với các đơn hàng gửi đến Vương quốc Anh, Royal Mail đôi khi có thể không xác nhận giao hàng cuối cùng sau khi đã được giao vào hộp thư của bạn.","countryMsgTH":"De minimis là 1500THB (45 USD) cho tất cả các đơn hàng được vận chuyển đến Thái Lan. Đơn hàng trên số tiền đó có thể bị tính phí.","countryMsgTW":"De minimis là 2000TWD (60 USD) cho tất cả các đơn hàng được vận chuyển đến Đài Loan. Đơn hàng trên số tiền đó có thể bị tính phí.","countryMsgMO":"Không có D&T được tính khi gửi đến Ma Cao. Nhưng lưu ý rằng Ma Cao Post KHÔNG giao đến hộp thư theo tiêu chuẩn, bạn SẼ PHẢI nhận gói hàng của bạn tại bưu điện.","countryMsgBN":"Không có D&T được tính khi gửi đến Brunei. Nhưng lưu ý rằng Brunei Post KHÔNG giao đến hộp thư theo tiêu chuẩn, bạn SẼ PHẢI nhận gói hàng của bạn tại bưu điện. \nHệ thống theo dõi cho quốc gia này không ổn định lắm và chỉ có thể cung cấp thông tin hạn chế, và kết quả giao hàng cuối cùng KHÔNG được cung cấp cho nguồn gốc.","countryMsgJP":"De minimis là 10000JPY (65 USD) cho tất cả các đơn hàng được vận chuyển đến Nhật Bản. Đơn hàng trên số tiền đó có thể bị tính phí.","countryMsgKR":"De minimis là 180000KRW (150 USD) cho tất cả các đơn hàng được vận chuyển đến Hàn Quốc. Đơn hàng trên số tiền đó có thể bị tính phí.","countryMsgVN":"Đối với Việt Nam, vui lòng giữ LIÊN LẠC trong quá trình giao hàng vì bạn có thể bị tính phí xử lý khi giao hàng. \nDe minimis là 1000000 (35 USD) cho tất cả các đơn hàng được vận chuyển đến Việt Nam. Đơn hàng trên số tiền đó có thể bị tính phí. \nVì Vietnam Post KHÔNG giao đến hộp thư theo tiêu chuẩn, bạn CÓ THỂ phải ở nhà hoặc có người đại diện được ủy quyền để nhận gói hàng của bạn hoặc nhận tại bưu điện.","countryMsgPP":"Các mặt hàng Tracked Label sẽ được đăng trong POPDrop/POPStop tại bưu điện. Các mặt hàng SpeedPost Standard thường được đăng trên POPStop hoặc POPStation.\nLưu ý rằng giao hàng các mặt hàng Tracked Label chỉ được thực hiện từ Thứ Hai đến Thứ Sáu từ 9 giờ sáng đến 6 giờ chiều. Ngoại trừ Cuối tuần & Ngày lễ.","dhlNoEmbed":"DHL Express không hỗ trợ theo dõi nhúng. Vui lòng","speedPostNoEmbed":"SpeedPost Singapore không hỗ trợ theo dõi nhúng. Vui lòng","operatorNoEmbed":"không hỗ trợ theo dõi nhúng. Vui lòng","clickHere":"nhấp vào đây","toTrackNewTab":"để theo dõi (mở trong tab mới).","statusInPreparation":"Đang chuẩn bị","statusInTransit":"Đang vận chuyển","statusDelivered":"Đã giao","statusOutForDelivery":"Đang giao hàng","statusArrived":"Đã đến","statusProcessing":"Đang xử lý","statusDispatched":"Đã gửi","statusReturned":"Đã trả lại","statusFailed":"Giao hàng thất bại","statusCancelled":"Đã hủy","statusHeldByCustoms":"Bị hải quan giữ lại","statusAwaitingCollection":"Chờ lấy hàng","aka":"còn được gọi là","thisServiceKnownAs":"Dịch vụ này được biết đến với tên","in":"tại","viewTrackingDHL":"Xem thông tin theo dõi từ DHL Express","viewTrackingSingPostSpeedPost":"Xem thông tin theo dõi từ Singapore SpeedPost","viewTrackingDHLLastMile":"Xem thông tin theo dõi từ DHL Express (Dặm cuối)","viewTrackingDHLShipperRef":"Xem thông tin theo dõi từ DHL Express (Tham chiếu người gửi)","viewTrackingSingPost":"Xem thông tin theo dõi từ Singapore Post","viewTrackingDestPost":"Xem thông tin theo dõi từ","post":"Bưu chính","epacUS":"Dịch vụ gói hàng quốc tế hạng nhất","epacCH":"Ưu tiên cộng","epacGB":"Quốc tế có theo dõi","epacMY":"Quốc tế có theo dõi/Express","epacCA":"Express quốc tế đến","epacAU":"Đóng gói và theo dõi quốc tế","epacNZ":"Quốc tế tiết kiệm có theo dõi","epacDE":"Warenpost quốc tế cao cấp","epacFR":"Lettre internationale suivie","epacNL":"Gói hàng quốc tế có theo dõi","epacPL":"Expres toàn cầu","epacBE":"Quốc tế Prime đến","epacAT":"Gói hàng quốc tế có theo dõi","epacIN":"Gói hàng quốc tế có theo dõi","epacFI":"Thư quốc tế có theo dõi","epacSE":"Thư quốc tế có theo dõi","epacNO":"PRIME Expres","epacIT":"Thể hiện","epacIL":"Thể hiện","epacES":"Gói hàng nhẹ quốc tế","epacPT":"Thư xanh quốc tế","epacCZ":"Lô hàng có theo dõi từ nước ngoài","epacBN":"ePacket quốc tế","epacCN":"ePacket quốc tế","epacHK":"ePacket quốc tế","epacID":"e-Packet quốc tế","epacMO":"ePacket quốc tế","epacPH":"Thư theo dõi quốc tế","epacTW":"ePacket quốc tế","epacTH":"ePacket quốc tế","epacVN":"E-Packet quốc tế (ASEAN Pack)","epacKR":"Gói K","epacJP":"e-Packet Light quốc tế","epacIE":"Bưu phẩm Express quốc tế","countryRU":"🇷🇺 Nga","russiaServiceSuspended":"⚠️ THÔNG BÁO QUAN TRỌNG: Trong bối cảnh cuộc xâm lăng Ukraine của Nga năm 2022, SingPost cùng với DHL đã tạm dừng tất cả các lô hàng đến Nga. Chúng tôi hiện không phục vụ Nga cho đến khi có thông báo về việc khôi phục dịch vụ đến quốc gia này.","hariRayaMessage":"🌙 Selamat Hari Raya Aidilfitri! Chúc bạn và gia đình bình an, vui vẻ và hạnh phúc! 🌟","deepavaliMessage":"🪔 Chúc mừng Deepavali! Cầu mong lễ hội ánh sáng mang đến cho bạn niềm vui, thịnh vượng và thành công! ✨","diwaliMessage":"🪔 Chúc mừng lễ Diwali! Cầu mong lễ hội ánh sáng mang đến cho bạn niềm vui, thịnh vượng và thành công! ✨","vesakMessage":"☸️ Chúc mừng ngày lễ Vesak! Chúc bạn bình an, trí tuệ và giác ngộ trong ngày thiêng liêng này! 🙏","vesakTHMessage":"☸️ Chúc mừng ngày Visakha Bucha! Chúc bạn bình an, trí tuệ và giác ngộ trong ngày thiêng liêng này! 🙏","australiaNationalDayMessage":"🇦🇺 Chúc mừng ngày nước Úc! Kỷ niệm đất nước của chúng ta! 🎉","canadaNationalDayMessage":"🇨🇦 Chúc mừng Ngày Canada! Kỷ niệm đất nước vĩ đại của chúng ta! 🍁","usaNationalDayMessage":"🇺🇸 Chúc mừng ngày quốc khánh nước Mỹ! Tôn vinh tự do và tự do! 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 tháng 7! Vive la France! 🎊","germanyUnityDayMessage":"🇩🇪 Chúc mừng Ngày thống nhất nước Đức! Tag der Deutschen Einheit! 🎉","italyRepublicDayMessage":"🇮🇹 Buona Festa della Repubblica! 🇮🇹","spainNationalDayMessage":"🇪🇸 ¡Feliz Día de la Hispanidad! 🎊","japanFoundationDayMessage":"🇯🇵 Chúc mừng Ngày thành lập Nhật Bản! 建国記念の日おめでとうございます!🎌","chinaNationalDayMessage":"🇨🇳 Chúc mừng ngày Quốc khánh Trung Quốc! 国庆节快乐!🎉","koreaLiberationDayMessage":"🇰🇷 Chúc mừng Ngày Giải phóng Hàn Quốc! 광복절 축하합니다! 🎊","indiaIndependenceDayMessage":"🇮🇳 Chúc mừng ngày quốc khánh Ấn Độ! Jai Hind! 🇮🇳","thailandNationalDayMessage":"🇹🇭 Chúc mừng ngày Quốc khánh Thái Lan! Cảm ơn bạn! 🎉","philippinesIndependenceDayMessage":"🇵🇭 Chúc mừng ngày quốc khánh Philippines! Mabuhay! 🇵🇭","vietnamNationalDayMessage":"🇻🇳 Chúc mừng ngày Quốc khánh Việt Nam! Quốc Khánh Việt Nam! 🎊","polandNationalDayMessage":"🇵🇱 Chúc mừng ngày quốc khánh Ba Lan! Święto Niepodległości! 🎉","czechNationalDayMessage":"🇨🇿 Chúc mừng ngày quốc khánh Cộng hòa Séc! Den nezávislosti! 🎊","netherlandsKingsDayMessage":"🇳🇱 Fijne Koningsdag! Vua muôn năm! 🧡","norwayConstitutionDayMessage":"🇳🇴 Lời chúc mừng tuyệt vời, Norge! 🇳🇴","swedenNationalDayMessage":"🇸🇪 Vui mừng quốc ca Sveriges! 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää, Suomi! 🇫🇮","portugalNationalDayMessage":"🇵🇹 Feliz Dia de Bồ Đào Nha! 🇵🇹","israelIndependenceDayMessage":"🇮🇱 יום עצמאות שמח! Chúc mừng Ngày Độc Lập, Israel! 🎉","irelandNationalDayMessage":"🇮🇪 Chúc mừng Ngày Thánh Patrick, Ireland! Lá Fhéile Pádraig sona duit! ✨","bruneiNationalDayMessage":"🇧🇳 Selamat Hari Kebangsaan Brunei! 🎊","newZealandWaitangiDayMessage":"🇳🇿 Chúc mừng Ngày Waitangi, New Zealand! 🎉","switzerlandNationalDayMessage":"🇨🇭 Chúc mừng ngày Quốc khánh Thụy Sĩ! Lễ hội quốc gia suisse! 🎊","austriaNationalDayMessage":"🇦🇹 Froher Nationalfeiertag, Österreich! 🎉","belgiumNationalDayMessage":"🇧🇪 Joyeuse Lễ hội quốc gia, Bỉ! Lễ hội quốc gia Fijne! 🎊","trackParcel":"Theo dõi bưu kiện","selectCourier":"-- Chọn Chuyển phát nhanh / Quốc gia --","singaporeCouriers":"Chuyển phát nhanh Singapore","topCountries":"5 quốc gia hàng đầu","otherCountries":"Các nước khác","fillAllFields":"Vui lòng điền vào tất cả các trường bắt buộc: số theo dõi, quốc gia đích, số đơn hàng và mã bưu điện.","noOrderMatchingFields":"Không tìm thấy đơn hàng nào khớp với tất cả các trường.","postcodeRequired":"Cần có mã bưu điện cho điểm đến này.","invalidUSZip":"Mã ZIP của Hoa Kỳ không hợp lệ. Sử dụng 5 chữ số hoặc ZIP+4.","failedGenerateURL":"Không tạo được URL theo dõi. Vui lòng kiểm tra đầu vào.","trackingValidationSG":"Số theo dõi cho Singapore phải là: LG123456789SG, LP123456789SG, LT123456789SG, EZ123456789SG hoặc PX123456789SG. Đối với Lô hàng DHL, hãy sử dụng số có 10 chữ số.","invalidSingPostFormat":"Định dạng số theo dõi SingPost không hợp lệ.\nCác định dạng được chấp nhận:\n• PP123456789SG → Nhãn theo dõi trả trước\n• SPNDD00012345 → Theo dõi tiêu chuẩn SpeedPost","trackingNumberExample":"ví dụ. LG123456789SG","australianDSTTitle":"Giờ tiết kiệm ánh sáng ban ngày của Úc đang hoạt động","australianDSTBothMessage":"Cả AEDT (Giờ ban ngày miền Đông nước Úc) và ACDT (Giờ ban ngày miền Trung nước Úc) hiện đang có hiệu lực.","australianAEDTMessage":"AEDT (Giờ ban ngày miền Đông nước Úc) hiện đang áp dụng cho Sydney, Melbourne và các khu vực lân cận.","australianACDTMessage":"ACDT (Giờ ban ngày miền Trung nước Úc) hiện đang có hiệu lực đối với Adelaide và Nam Úc.","australianDSTNote":"Thời gian giao hàng hiển thị ở trên phản ánh thời gian tiết kiệm ánh sáng ban ngày hiện tại.","postedDate":"Ngày đăng:","status":"Trạng thái:","shippedVia":"Vận chuyển qua:","destination":"Điểm đến:","statusHeldByCustms":"Hải quan nắm giữ","orderNumberExample":"Số đơn đặt hàng (bắt đầu bằng RTNX hoặc DLTB - ví dụ: RTNX1234567890):","deliveryRecordNote":"Xin lưu ý rằng sau khi hàng đã được giao, hồ sơ sẽ chỉ được lưu trữ tối đa 7 ngày và sẽ bị xóa.","copyrightAllRights":"Mọi quyền được bảo lưu.","accessRestricted":"Truy cập bị hạn chế","vpnDetectedMessage":"Đã phát hiện việc sử dụng VPN. Vui lòng tắt VPN để truy cập dịch vụ này.","contactSupportError":"Nếu bạn cho rằng đây là lỗi, vui lòng liên hệ với bộ phận hỗ trợ.","destinationNotAllowed":"Không có quyền truy cập vào quốc gia đích này từ vị trí của bạn. Vui lòng chọn một điểm đến khác.","blogSingPostEPACContent1":"SingPost ePAC (ePacket) là dịch vụ bưu chính được theo dõi tiết kiệm dành cho các lô hàng thương mại điện tử quốc tế hạng nhẹ.","blogSingPostEPACContent2":"Nó được chuyển phát bởi nhà khai thác bưu chính quốc gia của quốc gia nơi đến và thường được sử dụng cho các bưu kiện dưới 2 kg, trong giới hạn kích thước dài + rộng + cao dưới 90 cm và chiều dài không quá 60 cm.","blogSingPostEPACContent3":"Tùy chọn này ban đầu chỉ được cung cấp bởi Bưu điện Hồng Kông cùng với eBay Trung Quốc, cho phép các gói hàng từ Trung Quốc và Hồng Kông gửi các gói nhỏ vào Hoa Kỳ với tính năng theo dõi giao hàng mà không yêu cầu bất kỳ người ký nào khi giao hàng. Dịch vụ này được gọi là USPS (Dịch vụ Bưu chính Hoa Kỳ) Dịch vụ Quốc tế Trọn gói Hạng nhất trong Hoa Kỳ.","blogSingPostEPACContent4":"Kể từ ngày 1 tháng 1 năm 2026, ePAC hiện được sử dụng để tất cả các quốc gia tuân thủ các quy định bắt buộc của UPU yêu cầu chỉ giới hạn việc theo dõi bưu kiện và mặt hàng đã đăng ký đối với tài liệu.","blogSingPostEPACContent5":"Tiền tố theo dõi: LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS là dịch vụ chuyển phát nhanh bưu chính quốc tế cao cấp, được các nhà khai thác bưu chính trên toàn thế giới ưu tiên.","blogSpeedPostEMSContent2":"Thông quan thường nhanh hơn thư tiêu chuẩn nhưng quy trình chặt chẽ hơn, được theo dõi đầy đủ cho đến khi giao hàng.","blogSpeedPostEMSContent3":"Tại Singapore, chương trình này được SingPost gọi là SpeedPost Priority International.","blogSpeedPostEMSContent4":"Tiền tố theo dõi: EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express là dịch vụ chuyển phát nhanh.","blogSpeedPostExpressContent2":"Ở nhiều điểm đến, DHL Express thực hiện giao hàng chặng cuối và thu thuế trước khi giải phóng.","blogSpeedPostExpressContent3":"Tiền tố theo dõi: PX123456789SG (DHL Express chặng cuối sử dụng số theo dõi gồm 10 chữ số, số này không hiển thị công khai nhưng chúng tôi có thông tin về số đó thông qua","blogSpeedPostExpressContent3Link":"Hệ thống theo dõi.","blogUSPDDPContent1":"PDDP cho phép trả trước thuế nhập khẩu của Hoa Kỳ trước khi giao hàng, giảm chi phí bất ngờ cho người nhận.","blogUSPDDPContent2":"Quy định mới (Có hiệu lực từ ngày 29 tháng 8 năm 2025)","blogUSPDDPContent2List1":"Mã HTS bắt buộc","blogUSPDDPContent2List2":"Mô tả mặt hàng chính xác","blogUSPDDPContent2List3":"Thực thi thuế quan chặt chẽ hơn","blogUSPDDPContent3":"Tất cả các mặt hàng được gửi đến Hoa Kỳ sẽ không bị tính thêm bất kỳ khoản thuế nào cho người nhận vì chúng tôi đang thanh toán thay mặt bạn. Tuy nhiên, xin lưu ý rằng giá mặt hàng là phí nhập khẩu 10% theo mặc định được đặt để phù hợp với quy định.","blogUSPDDPContent4":"Điều này chỉ áp dụng cho các phương thức vận chuyển của chúng tôi tại Hoa Kỳ, SpeedPost Priority International (EMS) và SingPost ePAC.","blogEUIOSSContent1":"EU áp dụng VAT đối với tất cả hàng nhập khẩu thương mại bất kể giá trị.","blogEUIOSSContent2":"IOSS (Cửa hàng nhập khẩu một cửa)","blogEUIOSSContent3":"IOSS cho phép người bán thu VAT EU khi thanh toán cho các lô hàng lên tới €150.","blogEUIOSSContent4":"Sau đó, thuế VAT sẽ được nộp qua hệ thống IOSS, giúp thông quan nhanh hơn và không bị thu thuế VAT khi giao hàng.","blogEUIOSSContent5":"Đối với tất cả các đơn đặt hàng qua Etsy hoặc eBay, VAT IOSS đã được thu khi thanh toán và chúng tôi sẽ ghi rõ số đó trên Mã số tham chiếu thuế để truyền dữ liệu đến dịch vụ bưu chính đích thông qua EDI (Phụ phí dữ liệu điện tử).","blogUKVATContent1":"Vương quốc Anh yêu cầu phải tính VAT đối với hàng hóa nhập khẩu.","blogUKVATContent2":"Đối với các lô hàng có giá trị thấp, VAT thường được thu khi thanh toán và người bán hoặc thị trường chuyển trực tiếp cho HMRC.","blogUKVATContent3":"Đối với những lô hàng có giá trị cao hơn, nhà vận chuyển có thể thu thuế GTGT trước khi giao hàng.","blogUKVATContent4":"Đối với tất cả các đơn đặt hàng qua Etsy hoặc eBay, VAT đã được thu khi thanh toán và chúng tôi sẽ ghi rõ thuế này trên Mã số tham chiếu thuế để truyền dữ liệu đến dịch vụ bưu chính đích thông qua EDI (Phụ phí dữ liệu điện tử).","blogNorwayVOECContent1":"Na Uy đã giới thiệu hệ thống VOEC (VAT trong Thương mại điện tử) đối với hàng hóa nhập khẩu từ bên ngoài EU/EEA. Điều này áp dụng cho hàng hóa có giá trị lên tới 3.000 NOK.","blogNorwayVOECContent2":"Người bán có thể đăng ký chương trình VOEC để thu VAT của Na Uy khi thanh toán, cho phép thông quan nhanh hơn và không thu VAT khi giao hàng.","blogNorwayVOECContent3":"Đối với tất cả các đơn đặt hàng qua Etsy hoặc eBay, VAT VOEC đã được thu khi thanh toán. Giấy tờ theo dõi và hải quan cho biết Mã số tham chiếu thuế để truyền dữ liệu đến dịch vụ bưu chính Na Uy.","blogSwissVATContent1":"Thụy Sĩ tính thuế VAT đối với hàng hóa nhập khẩu bất kể giá trị. Cơ quan Hải quan Liên bang Thụy Sĩ yêu cầu người bán nước ngoài thu VAT khi thanh toán đối với hàng hóa lên tới 65 CHF.","blogSwissVATContent2":"Người bán đã đăng ký theo hệ thống VAT của Thụy Sĩ sẽ nộp trực tiếp số VAT đã thu, đảm bảo rằng người nhận không phải trả thêm phí VAT khi giao hàng.","blogSwissVATContent3":"Đối với tất cả các đơn đặt hàng qua Etsy hoặc eBay, VAT Thụy Sĩ đã được thu trong quá trình thanh toán và thủ tục giấy tờ hải quan bao gồm Mã số tham chiếu thuế để gửi EDI.","postalContactsTitle":"Liên hệ Dịch vụ Bưu chính","postalContactsNote":"Lưu ý:","postalContactsPolandUKNote":"Đối với Ba Lan và Vương quốc Anh, tất cả các mặt hàng được gửi qua SpeedPost Priority (EMS) sẽ được xử lý bởi Pocztex và Parcelforce.","postalContactsDHLNote":"Đối với lô hàng SpeedPost Express, vui lòng liên hệ DHL qua liên kết này:","postalContactsCountry":"Quốc gia","postalContactsWebsite":"Trang web","postalContactsForm":"Mẫu liên hệ","postalContactsPhone":"Số điện thoại","postalContactsEmail":"Email liên hệ","postalContactsFormLink":"Mẫu liên hệ","postalContactsBackButton":"Quay lại biểu mẫu yêu cầu gói hàng","countrySG":"🇸🇬 Singapore","contactUsTitle":"Liên hệ với chúng tôi","contactNameLabel":"Tên (không cho phép biệt danh hoặc số điện thoại)","contactEmailLabel":"Địa chỉ email (chúng tôi sẽ trả lời bạn)","contactEmailNote":"Email chuyển tiếp riêng tư (ví dụ: @privaterelay.appleid.com) không được chấp nhận. Vui lòng sử dụng địa chỉ email hợp lệ.","contactEnquiryTypeLabel":"Đây là gì?","contactSelectOption":"Chọn một tùy chọn","contactGeneralEnquiry":"Câu hỏi chung / Phản hồi","contactBusinessEnquiry":"Câu hỏi kinh doanh","contactOrderShippingEnquiry":"Câu hỏi đơn hàng/giao hàng","contactExchangeRefundEnquiry":"Câu hỏi đổi/hoàn tiền/trả hàng","contactOthers":"Khác","contactParcelWarning":"Nếu bưu kiện của bạn chưa được giao trong hơn 18/30/45 ngày (FedEx là 14 ngày), hoặc hiển thị trạng thái đã giao nhưng bạn chưa nhận được, vui lòng điền vào","contactParcelWarningLink":"biểu mẫu này","contactParcelWarningEnd":"thay thế.","contactOrderNumberLabel":"Số đơn hàng","contactOrderNumberPlaceholder":"Ví dụ: RTNX1234567890","contactPlatformNote":"Số đơn hàng Etsy, eBay & Shopee ở đây. Chúng tôi KHÔNG có quyền kiểm soát việc hoàn tiền từ các nền tảng này. Vui lòng liên hệ với dịch vụ khách hàng của họ.","contactPlatformInstructions":"Vui lòng sử dụng ứng dụng để xem số đơn hàng của bạn, vì nó được lưu trong ứng dụng:","contactPlatformEtsy":"Etsy - Góc phải trên hồ sơ của bạn → Mua hàng","contactPlatformEbay":"eBay - eBay của tôi → Mua hàng","contactPlatformShopee":"Shopee - Tôi → Xem lịch sử mua hàng (hoặc bạn có thể nhấp vào Sắp giao/Sắp nhận)","contactRefundNote1":"Nếu bạn đang hỏi về Trả hàng/Hoàn tiền cho các nền tảng bạn đã mua, vui lòng lưu ý rằng chúng tôi KHÔNG có quyền kiểm soát việc hoàn tiền từ các nền tảng này. Vui lòng liên hệ với dịch vụ khách hàng của họ.","contactRefundNote2":"Đối với Trả hàng hoặc Đổi hàng, chúng tôi không cho phép đối với găng tay maimai nếu chúng đã được sử dụng khi mở (có vết bẩn nhìn thấy hoặc đã giặt bằng máy giặt/giặt tay), và không cho phép trả hàng hoặc đổi hàng đối với thẻ giải trí. Cảm ơn bạn.","contactRefundNote3":"Xin lưu ý rằng đối với việc hoàn tiền qua Payhip, nếu bạn chưa nhận được tiền hoàn lại, vui lòng liên hệ với ngân hàng của bạn hoặc hỗ trợ Payhip tại support@payhip.com vì chúng tôi không có quyền kiểm soát quy trình này.","contactMessageLabel":"Tin nhắn của bạn (tối đa 1000 ký tự)","contactCharacterCount":"ký tự","contactSpamWarningNote":"Lưu ý:","contactSpamWarning":"Các đề nghị không mong muốn về SEO, thiết kế trang web, cho vay hoặc các dịch vụ tương tự sẽ tự động bị từ chối.","contactAgreementText1":"Vui lòng nhấp vào \"Tôi đồng ý\", nếu bạn đồng ý để Rhythm Nexus sử dụng địa chỉ email của bạn để trả lời bạn, vì điều này là cần thiết để chúng tôi đọc phản hồi của bạn và trả lời bạn khi chúng tôi tìm ra giải pháp cho câu hỏi của bạn.","contactAgreementText2":"Xin lưu ý rằng phản hồi của chúng tôi sẽ mất từ 3-5 ngày làm việc, hoặc lâu hơn trong thời gian có nhiều email.","contactAgreeCheckbox":"Tôi đồng ý","contactSuccessMessage":"Tin nhắn của bạn đã được gửi thành công! Chúng tôi sẽ trả lời trong vòng 3-5 ngày làm việc.","contactErrorMessage":"Gửi tin nhắn không thành công. Vui lòng thử lại.","contactGeneralError":"Đã xảy ra lỗi. Vui lòng thử lại sau.","contactSubmitting":"Đang gửi...","contactSubmit":"Gửi","contactAlertAgree":"Vui lòng đồng ý với các điều khoản để gửi biểu mẫu.","parcelEnquiryTitle":"Câu hỏi về bưu kiện","parcelInfoText":"Biểu mẫu này dành cho các bưu kiện chưa được giao trong hơn 18/30/45 ngày (14 ngày đối với FedEx/DHL), hoặc hiển thị trạng thái đã giao nhưng không có với bạn.","parcelInfoLink":"Nhấp vào đây","parcelInfoEnd":"cho các câu hỏi khác.","parcelWaitTitle":"Vui lòng đợi bưu kiện của bạn","parcelWaitText1":"Vui lòng chờ bưu kiện của bạn được giao. Xin lưu ý rằng giao hàng quốc tế KHÔNG giống như giao hàng nội địa vì chúng cần thời gian. Cảm ơn!","parcelWaitText2":"Nếu không có trạng thái hiển thị sau 18 ngày (7 ngày đối với Singapore) hoặc lâu hơn, bạn có thể cho chúng tôi biết trực tiếp.","parcelCannotSubmit":"Bạn không thể gửi biểu mẫu này nếu bạn chọn \"Không\".","parcelNameLabel":"Tên","parcelOrderNumberLabel":"Số đơn hàng (Ví dụ: RTNX1234567890)","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"Địa chỉ email (Chúng tôi sẽ trả lời bạn qua đây)","parcelEmailNote":"Email chuyển tiếp riêng tư không được chấp nhận. Vui lòng sử dụng địa chỉ email hợp lệ.","parcelShippingMethodLabel":"Phương thức giao hàng đã chọn?","parcelSelectShipping":"Chọn phương thức giao hàng","parcelSingPostEpac":"SingPost ePacket (hoặc ePAC) - hay còn gọi là SpeedPost Saver International (Theo dõi: LG/LP/LT123456789SG)","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label (Theo dõi: PP123456789SG)","parcelSpeedPostStandard":"SpeedPost Standard (Theo dõi: SPNDD00012345)","parcelSpeedPostPriority":"SpeedPost Priority (EMS) (Theo dõi: EZ123456789SG)","parcelSpeedPostExpress":"SpeedPost Express (Theo dõi: PX123456789SG)","parcelDHL":"DHL Express (Chỉ các quốc gia EU) (Theo dõi: 1234567890)","parcelTrackingNumberLabel":"Số theo dõi bưu kiện của bạn?","parcelUndeliveredLabel":"Bưu kiện của bạn chưa được giao trong hơn 18/30/45 ngày? (Dịch vụ nội địa Singapore >7 ngày, >14 ngày đối với SpeedPost Express/DHL)","parcelSelectOption":"Chọn một tùy chọn","parcelYes":"Có","parcelNo":"Không","parcelDeliveredButMissingLabel":"Bưu kiện của bạn hiển thị trạng thái đã giao, nhưng không có trong hộp thư/nơi an toàn/trước cửa của bạn?","parcelCaseReferenceLabel":"ID tham chiếu trường hợp từ Bưu điện địa phương","parcelCaseReferencePlaceholder":"Đặt NA nếu bạn đến từ Singapore","parcelCaseReferenceNote":"Trước khi gửi biểu mẫu này, vui lòng liên hệ với bưu điện địa phương của bạn qua điện thoại hoặc email và nhận ID tham chiếu trường hợp từ họ. Sau đó, đặt ID tham chiếu trường hợp của bạn vào đây.","parcelCaseReferenceLink":"Tham khảo liên kết này để biết thông tin liên hệ Dịch vụ Bưu chính","parcelCaseReferenceMandatory":"CHỈ ĐẶT NA NẾU BẠN ĐẾN TỪ SINGAPORE. Đối với các quốc gia khác, đây là BẮT BUỘC. Cần thiết cho SpeedPost Express, cho ID trường hợp của DHL.","parcelImageEvidenceLabel":"Bằng chứng hình ảnh (cho các bưu kiện đã giao nhưng bị mất)","parcelImageWarning":"Để xác minh thêm, chúng tôi cần bằng chứng hình ảnh để chứng minh rằng bạn không đưa ra tuyên bố sai về việc không giao bưu kiện. (Chỉ dành cho các bưu kiện đã được giao, nhưng không có trong hộp thư/bên ngoài cửa. Chúng tôi có thể từ chối yêu cầu của bạn nếu không có bằng chứng ảnh cho các mặt hàng đã giao. Bỏ qua điều này nếu mặt hàng của bạn CHƯA hiển thị trạng thái đã giao.)","parcelImageNote":"Tải lên 1 tệp được hỗ trợ: hình ảnh. Tối đa 1 GB.","parcelAgreementText":"Vui lòng Nhấp vào \"Tôi đồng ý\" nếu bạn đảm bảo rằng những gì đã xảy ra với bưu kiện của bạn là sự thật.","parcelAgreeCheckbox":"Tôi đồng ý","parcelSuccessMessage":"Câu hỏi về bưu kiện của bạn đã được gửi thành công! Chúng tôi sẽ trả lời trong vòng 3-5 ngày làm việc.","parcelErrorMessage":"Gửi câu hỏi không thành công. Vui lòng thử lại.","parcelGeneralError":"Đã xảy ra lỗi. Vui lòng thử lại sau.","parcelAlertWait":"Vui lòng chờ bưu kiện của bạn được giao. Bạn có thể gửi biểu mẫu này sau thời gian chờ được chỉ định.","parcelAlertAgree":"Vui lòng đồng ý với các điều khoản để gửi biểu mẫu.","parcelAlertCaseReference":"Vui lòng cung cấp ID tham chiếu trường hợp từ bưu điện địa phương của bạn, hoặc đặt NA nếu bạn đến từ Singapore.","parcelSubmitting":"Đang gửi...","parcelSubmit":"Gửi","lookalikeDomainWarning":"Đây không phải mã vận đơn mà là liên kết đến một trang web giả mạo hãng vận chuyển. Đừng nhập thông tin cá nhân hoặc thanh toán tại đó.","lookalikeDomainOfficial":"Trang web chính thức:"};
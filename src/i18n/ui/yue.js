@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus 採用優質商業物流網絡。不過，當貨件一到你所在國家/地區，保管責任就會轉交本地國內承運商（例如 USPS、Royal Mail、當地 DHL）。到咗呢個節點，追蹤前綴會切換到另一套處理系統；但我哋嘅通用包裹追蹤器會將各狀態串連，確保你全程都有連續可視性。","trackingLastMileTitle":"最後一公里派送網絡","trackingCustomsClearanceBody":"所有跨境貨件都必須通過你所在國家/地區嘅海關機構。我哋嘅工具會監察由進口設施到達至移交海關之間嘅狀態轉換。邊境部門會核對 HS 編碼，並確認已繳付正確增值稅或關稅（例如歐盟 IOSS、挪威 VOEC）。請特別留意追蹤中有關 \"Held at Customs\" 嘅警示。","trackingCustomsClearanceTitle":"清關資訊","trackingProcessingOriginBody":"包裹投遞後，貨件會進入起運處理中心，進行掃描、稱重，以及初步出口安全檢查。之後會派送到國際郵件交換中心。航班時間會視乎可用貨運艙位而定。若此狀態維持數日，毋須擔心。","trackingProcessingOriginTitle":"起運樞紐處理中","trackingInfoReceivedBody":"當訂單喺我哋嘅電商平台（例如 Etsy、eBay 或直接銷售）首次處理時，追蹤號碼會以電子方式生成。承運商會先收到貨件資料，之後先實際接收箱件。請預留 1 至 3 個工作天，等包裹正式入庫到實體分揀中心。","trackingInfoReceivedTitle":"已收到資料","trackingStatusesIntro":"多謝你使用我哋一體化嘅國際包裹追蹤工具。由於你嘅包裹會跨越多個國際邊境，追蹤狀態可能會比較複雜。了解物流生命週期，有助你建立清晰期望。","trackingStatusesTitle":"了解追蹤狀態","footerDesc":"你嘅首選平台，專售街機娛樂卡、節奏遊戲手套同專門周邊。透過順暢嘅國際包裹追蹤同可靠運輸數據，輕鬆享受全球電商體驗。","amText":"上午","pmText":"下午","tzAEST":"AEST（悉尼／墨爾本）","tzACST":"ACST（阿德萊德）","tzAWST":"AWST（珀斯）","tzNST":"NST（紐芬蘭）","tzAST":"AST（大西洋）","tzEST":"EST（東部）","tzCST":"CST（中部）","tzMST":"MST（山地）","tzPST":"PST（太平洋）","tzAKST":"AKST（阿拉斯加）","tzHST":"HST（夏威夷）","tzBeijing":"北京","tzXinjiang":"新疆","tzWIB":"WIB（雅加達）","tzWITA":"WITA（望加錫）","tzWIT":"WIT（查亞普拉）","tzKaliningrad":"加里寧格勒（UTC+2）","tzMoscow":"莫斯科／俄羅斯西部（UTC+3）","tzSamara":"薩馬拉（UTC+4）","tzUral":"烏拉爾（UTC+5）","tzOmsk":"鄂木斯克（UTC+6）","tzKrasnoyarsk":"克拉斯諾亞爾斯克（UTC+7）","tzIrkutsk":"伊爾庫茨克（UTC+8）","tzSakha":"薩哈共和國（UTC+9）","tzPrimorsky":"濱海邊疆區（UTC+10）","tzMagadan":"馬加丹（UTC+11）","tzKamchatka":"堪察加（UTC+12）","dstDayStartsLabel":"夏令時間開始","dstDayEndsLabel":"夏令時間結束","dstRevertsLabel":"恢復標準時間","dstEuropeLabel":"歐洲","dstNewZealandLabel":"紐西蘭","englishResponseNotice":"注意：所有查詢均以英語回覆。如果你以其他語言提交，你嘅訊息可能會被翻譯成英文作核實。","systemRequirementsTitle":"最低支援系統版本","systemRequirements":"Windows：Windows 7 (with ESU updates installed) 或以上\nmacOS：macOS 12 或以上\nAndroid：Android 13 或以上\niPhone/iOS：iOS 17 或以上\nLinux：目前支援嘅發行版本，需有主動安全更新","goodFridayEasterGreeting":"復活節快樂！祝你喺耶穌受難日及復活節期間平安喜樂。","christmasGreeting":"聖誕快樂，新年如意！祝你由12月25日至1月5日期間平安喜樂。","captchaSystemRequirements":"最低系統要求：Windows 7 (with ESU updates installed) 或 11、macOS 10.15+，或最新版 Android/iOS。","title":"驗證存取","subtitle":"請完成以下驗證以繼續。","selectLanguage":"選擇語言","selectLanguagePlaceholder":"-- 請選擇語言 --","loadingChallenge":"正在載入驗證...","answerLabel":"你嘅答案：","answerPlaceholder":"輸入答案","continueButton":"繼續","refreshButton":"新驗證","verifying":"正在驗證...","chooseLanguageFirst":"請先選擇語言。","loadFailed":"載入驗證失敗，請重試。","expiredChallenge":"驗證已過期，正在載入新驗證...","verifyFailed":"驗證失敗，請重試。","home":"主頁","blog":"網誌","aboutUs":"關於我們","faq":"常見問題","contact":"聯絡我們","trackPackage":"追蹤包裹","cnyYearOfHorseMessage":"🧧 新年快樂！祝你馬年萬事如意，心想事成！🐴","hariRayaMessage":"🌙 開齋節快樂！祝你同家人平安、喜樂、蒙福！🌟","deepavaliMessage":"🪔 屠妖節快樂！願光明節為你帶嚟歡樂、繁榮同成功！✨","diwaliMessage":"🪔 排燈節快樂！願光明節為你帶嚟歡樂、繁榮同成功！✨","vesakMessage":"☸️ 佛誕快樂！祝你喺呢個神聖嘅日子獲得平安、智慧同覺悟！🙏","vesakTHMessage":"☸️ 佛誕快樂！祝你喺呢個神聖嘅日子獲得平安、智慧同覺悟！🙏","singaporeNationalDayMessage":"🇸🇬 新加坡國慶日快樂！慶祝獨立61週年！🎉","indonesiaNationalDayMessage":"🇮🇩 印尼獨立日快樂！印尼共和國萬歲！🎊","malaysiaNationalDayMessage":"🇲🇾 馬來西亞國慶日快樂！慶祝國家獨立！🎊","australiaNationalDayMessage":"🇦🇺 澳洲國慶日快樂！慶祝我哋嘅國家！🎉","canadaNationalDayMessage":"🇨🇦 加拿大國慶日快樂！慶祝我哋偉大嘅國家！🍁","usaNationalDayMessage":"🇺🇸 美國獨立日快樂！慶祝自由同獨立！🎆","franceBastilleDayMessage":"🇫🇷 法國國慶日快樂！法蘭西萬歲！🎊","germanyUnityDayMessage":"🇩🇪 德國統一日快樂！🎉","italyRepublicDayMessage":"🇮🇹 意大利共和國日快樂！🇮🇹","spainNationalDayMessage":"🇪🇸 西班牙國慶日快樂！🎊","japanFoundationDayMessage":"🇯🇵 日本建國紀念日快樂！🎌","chinaNationalDayMessage":"🇨🇳 中國國慶節快樂！🎉","koreaLiberationDayMessage":"🇰🇷 韓國光復節快樂！🎊","indiaIndependenceDayMessage":"🇮🇳 印度獨立日快樂！🇮🇳","thailandNationalDayMessage":"🇹🇭 泰國國慶日快樂！🎉","philippinesIndependenceDayMessage":"🇵🇭 菲律賓獨立日快樂！🇵🇭","vietnamNationalDayMessage":"🇻🇳 越南國慶日快樂！🎊","polandNationalDayMessage":"🇵🇱 波蘭獨立日快樂！🎉","czechNationalDayMessage":"🇨🇿 捷克獨立日快樂！🎊","netherlandsKingsDayMessage":"🇳🇱 荷蘭國王節快樂！🧡","norwayConstitutionDayMessage":"🇳🇴 挪威憲法日快樂！🇳🇴","swedenNationalDayMessage":"🇸🇪 瑞典國慶日快樂！🇸🇪","finlandIndependenceDayMessage":"🇫🇮 芬蘭獨立日快樂！🇫🇮","portugalNationalDayMessage":"🇵🇹 葡萄牙國慶日快樂！🇵🇹","israelIndependenceDayMessage":"🇮🇱 以色列獨立日快樂！🎉","irelandNationalDayMessage":"🇮🇪 愛爾蘭聖帕特里克節快樂！🍀","bruneiNationalDayMessage":"🇧🇳 文萊國慶日快樂！🎊","newZealandWaitangiDayMessage":"🇳🇿 紐西蘭懷唐伊日快樂！🎉","switzerlandNationalDayMessage":"🇨🇭 瑞士國慶日快樂！🎊","austriaNationalDayMessage":"🇦🇹 奧地利國慶日快樂！🎉","belgiumNationalDayMessage":"🇧🇪 比利時國慶日快樂！🎊","russiaDayOfRussiaMessage":"🇷🇺 俄羅斯日快樂！🎉","taiwanFoundingDayMessage":"🇹🇼 台灣開國紀念日快樂！中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 台灣雙十節快樂！國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 香港特區成立紀念日快樂！香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 澳門特區成立紀念日快樂！澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ 國際勞動節快樂！慶祝勞動同勞工權益！🎊","laborDayUSCAMessage":"⚒️ 勞動節快樂！致敬勞工貢獻！🎉","parcelTracking":"包裹追蹤","serviceAnnouncement":"服務公告","usaWinterStormTitle":"緊急：嚴重冬季風暴 - 服務受阻","usaWinterStormSubtitle":"美國郵政（USPS）不可抗力事件","usaWinterStormNotice1":"由於2026年2月23日起影響紐約地區嘅嚴重冬季風暴：","usaWinterStormNotice2":"約翰·菲茨傑拉德·甘迺迪國際機場嘅國際業務實際上已停擺","usaWinterStormNotice3":"大量航班取消，機場服務嚴重受阻","usaWinterStormNotice4":"呢啲情況構成超出USPS控制範圍嘅不可抗力事件","usaWinterStormNotice5":"服務影響：","usaWinterStormNotice6":"大雪、凍雨、冰雹同嚴寒天氣混合","usaWinterStormNotice7":"大範圍停電同嚴重服務中斷","usaWinterStormNotice8":"國內及國際郵件（信件、包裹及EMS物品）收寄及派送受影響","usaWinterStormNotice9":"受影響郵政編碼地區：","usaWinterStormNotice10":"06000–06999、01000–02799、03900–04999、03000–03899、07000–08999、10001–14925、15000–19699、02800–02999、05000–05999、20001–20020、20100–24699、04699、35000–36999","usaWinterStormNotice11":"USPS正採取一切必要措施盡量減少對客戶嘅不便，同時確保員工安全。感謝你喺呢次不可抗力事件中嘅耐心同諒解。","usaWinterStormNotice12":"最後更新：2026年2月25日","countryAutoDetected":"目的地已根據你嘅位置預設","countryAutoDetectedFromLink":"目的地已透過連結預設","trackingNumber":"追蹤號碼","destinationCountry":"目的地國家","postcode":"郵遞區號","orderNumber":"訂單號（例如：RTNX1234567890）","fromDate":"由日期（必填）","toDate":"至日期（必填）","trackParcel":"追蹤包裹","selectCourier":"-- 選擇快遞／國家 --","optionSingPost":"🇸🇬 新加坡郵政 (SingPost)","singaporeCouriers":"新加坡快遞商","topCountries":"首5個國家","otherCountries":"其他國家","note":"注意","disclaimer":"免責聲明","importantInformation":"重要資訊：","didNotReceiveEmail":"如果你冇收到來自Etsy、eBay、Shopee或Payhip嘅確認電郵，請向下滾動，以與此訂單關聯嘅電郵地址或電話號碼搜尋你嘅訂單。","searchByEmailOrPhone":"以電郵或電話搜尋","searchOrder":"搜尋訂單","trackingResult":"追蹤結果","noOrdersFound":"找不到訂單。","pleaseEnter":"請輸入電郵、電話號碼或訂單號。","fillAllFields":"請填寫所有必填欄位：追蹤號、目的地國家、訂單號及郵遞區號。","noOrderMatchingFields":"找不到符合所有欄位嘅訂單。","postcodeRequired":"此目的地需要郵遞區號。","invalidUSZip":"無效嘅美國郵政編碼。請使用5位數字或ZIP+4。","failedGenerateURL":"生成追蹤URL失敗。請檢查輸入。","trackingValidationSG":"新加坡嘅追蹤號必須係：LG123456789SG、LP123456789SG、LT123456789SG、EZ123456789SG或PX123456789SG。DHL快遞請使用10位數字。","invalidSingPostFormat":"無效嘅SingPost追蹤號格式。\n可接受格式：\n• PP123456789SG → 預付費追蹤標籤\n• SPNDD00012345 → SpeedPost標準追蹤","welcomeTitle":"歡迎來到Rhythm Nexus網站！","purchaseInfo":"請透過我們嘅官方渠道購買，或加入我們嘅","purchaseInfoChina":"請透過我們嘅官方渠道購買。","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram群組","forUpdates":"獲取官方更新。","ourStores":"我們嘅商店","etsyStore":"Etsy商店","ebayStore":"eBay商店","shopeeStore":"Shopee商店","payhipStore":"Payhip商店","internationalShipping":"國際運輸","singaporeLocal":"新加坡本地","asiaOnly":"僅限亞洲","deliveryInfo":"送貨資訊","deliveryRates2026":"2026年送貨費率","sgDeliveryRates":"新加坡送貨費率","speedPostRates":"SpeedPost Express國際費率","aboutTitle":"關於Rhythm Nexus","aboutP1":"我們於2022年開設商店，並喺Etsy、eBay同Shopee上銷售。","aboutP2":"我們專注於可靠嘅履行同準確嘅追蹤，建立咗良好嘅聲譽。","aboutP3":"我們嘅目標係提供流暢可信嘅購物體驗。","aboutP4":"感謝你支持Rhythm Nexus。","faqTitle":"常見問題","faqQ1":"如果我嘅物品有缺陷點算？有冇保養？","faqA1":"有！大多數訂單提供1年保養。請提供你嘅發票／訂單號，以便我們調查。注意：如果物品符合描述，即使你訂錯貨，亦唔允許換貨。","faqQ2":"我可以修改、更新或取消我嘅訂單嗎？","faqA2":"可以。為安全起見，訂單更改可能需要透過電郵或我們嘅聯絡表單處理。","faqQ3":"我需要繳付關稅／進口稅嗎？","faqA3":"關稅一般唔會預付，寄往美國嘅DDP除外。增值稅可能適用於歐盟、英國、澳洲／紐西蘭、挪威、瑞士及加拿大部分省份，呢啲均已預先繳付。香港同澳門唔適用消費稅。我們無法就海關費用提供建議——請聯絡當地海關了解詳情。","faqQ4":"我嘅訂單幾時發貨？","faqA4":"訂單通常喺1-5個工作日內發貨。旺季期間可能需要5-7天。","faqQ5":"我不小心落咗兩次訂單，點算好？","faqA5":"我們只退還重複嘅運費。兩件物品將一齊發貨。退款 =（第一筆運費 + 第二筆運費）– 實際運費。","faqQ6":"送貨需要幾耐？","faqA6":"處理需要1-5個工作日。\n\n本地運輸：\n• SingPost預付費追蹤標籤：2-4天\n• SpeedPost標準：1-3天\n\n國際：\n• SingPost ePAC：14-30天\n• SpeedPost Priority (EMS)：8-15天\n• SpeedPost Express：4-8天\n\n旺季期間可能有延誤。","faqQ7":"我嘅物品正在退回給寄件人，點算好？","faqA7":"允許重新發貨一次。因地址無效、包裹無人認領或未繳付海關費用而導致嘅退回，唔可取消。請聯絡你嘅郵政服務重新投遞，或留言給我們尋求協助。","faqQ8":"我嘅物品喺運輸途中遺失／被盜。","faqA8":"我們允許重新發貨一次。如果再次遺失，將喺快遞員嘅派送視窗後全額退款：\n\n• 新加坡本地服務：7天\n• SingPost ePAC 及 SpeedPost Priority International：30天\n• SpeedPost Intl Express：14天","blogTitle":"運輸與郵政知識庫","blogSubtitle":"關於郵政服務、關稅、增值稅嘅官方說明。","readMore":"閱讀更多","backButton":"返回","copyrightText":"版權所有。","blogPost1Title":"咩係SingPost ePAC？","blogPost1Desc":"了解ePAC。","blogPost2Title":"咩係SpeedPost Priority International (EMS)？","blogPost2Desc":"了解EMS。","blogPost3Title":"咩係SpeedPost Express？","blogPost3Desc":"探索SpeedPost Express。","blogPost4Title":"美國PDDP","blogPost4Desc":"了解PDDP。","blogPost5Title":"歐盟增值稅 & IOSS","blogPost5Desc":"歐盟增值稅資訊。","blogPost6Title":"英國增值稅 & HMRC","blogPost6Desc":"英國增值稅要求。","blogPost7Title":"挪威VOEC","blogPost7Desc":"挪威VOEC系統。","blogPost8Title":"瑞士增值稅","blogPost8Desc":"瑞士增值稅要求。","enterDestinationPostcode":"輸入目的地郵遞區號","trackingNumberExample":"例如：LG123456789SG","trackingCaseSensitive":"追蹤字母區分大小寫，必須大寫。","usaPostcodeNote":"對於冇郵政編碼嘅國家／地區，例如香港同澳門，請輸入 999077（香港）或 999078（澳門）。","epacDeliveryNote":"請注意，所有發往目的地嘅ePAC物品都應送達到你嘅郵箱、家門口、包裹儲物櫃或放喺安全地方！","currentTime":"目前時間","timezoneNote":"時間以12小時制顯示","sameTimeAsSingapore":"與新加坡時間相同","hourAhead":"小時領先新加坡","hoursAhead":"小時領先新加坡","hourBehind":"小時落後新加坡","hoursBehind":"小時落後新加坡","countriesNoMailbox":"已知冇法提供郵箱／信箱投遞嘅國家／地區：文萊、中國、印度、以色列、澳門、菲律賓、波蘭同越南。","rhythmNexusNotResponsible":"Rhythm Nexus 唔負責處理送貨，因為呢啲超出我們嘅控制範圍，我們希望你追蹤你嘅物品狀態。","issuesAfterDelivery":"交貨後30/45天（SpeedPost Express為14天）出現任何問題，或狀態顯示已送達但你冇收到，請聯絡我們","cannotUseEmbed":"我們無法使用嵌入追蹤，因為大多數郵政服務網站唔支援。","clickLinkAbove":"請點擊上面嘅連結追蹤你嘅包裹。","trackingDetailsNote":"請注意，追蹤詳情可能唔會顯示喺搜尋結果中，建議將追蹤號碼貼入系統以追蹤物品。","thirdPartyWebsites":"你亦可以喺以下第三方網站追蹤你嘅包裹：","enterEmailOrPhone":"輸入電郵或電話","collectAtPostOffice":"但係，如果你嘅國家／地區冇標準郵箱，你需要喺郵局領取。","reviewShippingRates":"查看目前運費","here":"呢度","contactUsForm":"請透過呢個聯絡我們","form":"表格","forEnquiries":"如有任何關於訂單嘅疑問。","anPostNoDirectTracking":"An Post（愛爾蘭）唔支援直接追蹤連結或嵌入式追蹤。","anPostPasteManually":"請喺An Post網站上手動貼上你嘅追蹤號碼。","goToAnPost":"前往An Post","countryMsgNL":"如果狀態顯示'Held by Customs'，請聯絡荷蘭海關資訊熱線尋求協助：\n0800 0143（免費），週一至週五 7-23點。\n週六及週日 8-16:30。\n\n建議喺PostNL註冊帳號以接收你包裹嘅即時推送通知：\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\n如果包裹送到PostNL站點或狀態要求你到郵局領取，你需要喺櫃檯支付7歐元。如果網上支付，最多4歐元。","countryMsgDE":"我們建議你下載Post & DHL應用程式以接收你包裹嘅追蹤狀態推送通知：\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH 客戶服務聯絡方式：\n+49-228-433-3112\nDHL DE 聯絡方式：https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"你需要向海關提交額外嘅進口申報。否則可能有入境限制，包裹將被退回。\n更多資訊：https://www.posti.fi/en/receiving/customs-clearance \n其他連結：\nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"將收取4.95歐元嘅處理費。\n喺此下載應用程式：https://www.anpost.com/Post-Parcels/App","countryMsgPL":"將收取8.50茲羅提嘅處理費。\n你需要喺郵局領取時支付此費用，\n因為包裹可能唔會送到你門口或郵箱。","countryMsgPH":"PHLPost喺菲律賓被認為效率低且不可靠。\n請務必追蹤你嘅包裹，因為「正在運送」嘅狀態\n有時只會顯示1至3週（針對較小嘅包裹）。對於較大嘅包裹，\n只能喺馬尼拉中央郵局或你附近最近嘅\n郵局領取。請注意，任何價值嘅包裹都會產生112披索嘅處理費，\n你需要支付。如果唔支付，包裹將被退回俾我們。\n由於PHLPost服務緩慢，預計送貨需要1-2個月。\n你唔需要為10000披索以下嘅物品繳稅，但如果價值等於或超過此金額，則需要繳納。\n我們建議下次訂購時使用SpeedPost Express以加快流程。","countryMsgCA":"加拿大所有訂單嘅最低限額為20加元。由於新加坡係CPTPP協定嘅成員，可能唔會產生關稅，但如果物品超過60加元或以上或100加元或以上（取決於物品HS代碼），則可能會產生D&T。超過此金額嘅任何價值都將相應收取增值稅。","countryMsgID":"你需要喺物品抵達印尼時支付所有產生嘅稅款同關稅。請追蹤你嘅包裹並向印尼海關支付指定金額。\n你亦需要提交額外嘅清關文件。否則可能有入境限制或該國海關扣押包裹。請喺此查看更多詳情：\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"你需要喺物品抵達印度時支付所有產生嘅稅款同關稅。請追蹤你嘅包裹並向印度海關支付指定金額。\n請注意，印度嘅清關非常嚴格，如果你嘅物品價值超過1000印度盧比（15美元），你可能需要支付關稅——取決於HS代碼，大多數情況下係免稅，但如果物品超過5000印度盧比（60美元），你可能需要支付更高嘅關稅。\n由於India Post預設唔送貨到郵箱，你可能需要喺家或成為授權代表才能收取包裹，或喺郵局領取。","countryMsgMY":"馬來西亞所有訂單嘅最低限額為500馬幣。超過此金額嘅訂單可能會被收費。","countryMsgUS":"自2025年8月29日起，800美元嘅最低限額將正式取消，進口關稅必須由原產國嘅寄件人預設支付。\n運送到美國需要有效嘅電話號碼同電郵地址，以免你嘅包裹出現進一步延誤。","countryMsgIL":"以色列所有貨物嘅最低限額為240新謝克爾（75美元）。超過此金額嘅訂單可能會被收費。\n請注意，訂購到以色列時，Israel Post有時唔會喺交貨後確認最終投遞。\n由於Israel Post預設唔送貨到郵箱，你可能需要喺家或成為授權代表才能收取包裹，或喺郵局領取。","countryMsgGB":"請注意，訂購到英國時，Royal Mail有時唔會喺將包裹送到你嘅郵箱後確認最終投遞。","countryMsgTH":"泰國所有貨物嘅最低限額為1500泰銖（45美元）。超過此金額嘅訂單可能會被收費。","countryMsgTW":"台灣所有貨物嘅最低限額為2000新台幣（60美元）。超過此金額嘅訂單可能會被收費。","countryMsgMO":"寄往澳門嘅貨物唔收取D&T費用。但請注意，Macau Post預設唔送貨到郵箱，你需要喺郵局領取你嘅包裹。","countryMsgBN":"寄往文萊嘅貨物唔收取D&T費用。但請注意，Brunei Post預設唔送貨到郵箱，你需要喺郵局領取你嘅包裹。\n該國嘅追蹤系統唔係好穩定，只能提供有限資訊，亦唔會向原產地提供最終投遞結果。","countryMsgJP":"日本所有貨物嘅最低限額為10000日元（65美元）。超過此金額嘅訂單可能會被收費。","countryMsgKR":"韓國所有貨物嘅最低限額為180000韓元（150美元）。超過此金額嘅訂單可能會被收費。","countryMsgVN":"對於越南，請喺送貨期間保持聯繫，因為你可能喺送貨時被收取處理費。\n越南所有貨物嘅最低限額為1000000越南盾（35美元）。超過此金額嘅訂單可能會被收費。\n由於Vietnam Post預設唔送貨到郵箱，你可能需要喺家或成為授權代表才能收取包裹，或喺郵局領取。","countryMsgPP":"Tracked Label物品將放喺郵局嘅POPDrop/POPStop。SpeedPost Standard物品通常放喺POPStop或POPStation。\n請注意，Tracked Label物品嘅派送只喺週一至週五上午9點至下午6點進行，週末及公眾假期除外。","postedDate":"投遞日期：","status":"狀態：","shippedVia":"發貨方式：","destination":"目的地：","statusInPreparation":"準備中","statusInTransit":"運輸中","statusDelivered":"已投遞","statusOutForDelivery":"派送中","statusArrived":"已到達","statusProcessing":"處理中","statusDispatched":"已發出","statusReturned":"已退回","statusFailed":"投遞失敗","statusCancelled":"已取消","statusHeldByCustoms":"海關扣留","statusAwaitingCollection":"等待取件","aka":"又稱","thisServiceKnownAs":"該服務稱為","in":"喺","viewTrackingDHL":"查看DHL Express嘅追蹤資訊","viewTrackingSingPostSpeedPost":"查看Singapore SpeedPost嘅追蹤資訊","viewTrackingDHLLastMile":"查看DHL Express（最後一英里）嘅追蹤資訊","viewTrackingDHLShipperRef":"查看DHL Express（寄件人參考號）嘅追蹤資訊","viewTrackingSingPost":"查看Singapore Post嘅追蹤資訊","viewTrackingDestPost":"查看追蹤資訊：","post":"郵政","orderNumberExample":"訂單號（以RTNX或DLTB開頭 - 例如：RTNX1234567890）：","deliveryRecordNote":"請注意，物品投遞後，記錄只保存7天，之後將被刪除。","copyrightAllRights":"版權所有。","filteredAllowedDestinations":"（依允許目的地篩選）","loadingAnnouncements":"正在載入公告...","unableToLoadAnnouncements":"目前無法載入服務公告。","viewOnSingPostWebsite":"前往 SingPost 網站查看 →","countryAF":"阿富汗","countryAX":"奧蘭群島","countryAL":"阿爾巴尼亞","countryDZ":"阿爾及利亞","countryAS":"美屬薩摩亞","countryAD":"安道爾","countryAO":"安哥拉","countryAI":"安圭拉","countryAQ":"南極洲","countryAG":"安地卡及巴布達","countryAR":"阿根廷","countryAM":"亞美尼亞","countryAW":"阿魯巴","countryAU":"🇦🇺 澳洲","countryAT":"🇦🇹 奧地利","countryAZ":"亞塞拜然","countryBS":"巴哈馬","countryBH":"巴林","countryBD":"孟加拉","countryBB":"巴貝多","countryBY":"白俄羅斯","countryBE":"🇧🇪 比利時","countryBZ":"貝里斯","countryBJ":"貝南","countryBM":"百慕達","countryBT":"不丹","countryBO":"玻利維亞","countryBA":"波斯尼亞與黑塞哥維納","countryBW":"博茨瓦納","countryBV":"布韋島","countryBR":"巴西","countryIO":"英屬印度洋領地","countryBN":"🇧🇳 汶萊","countryBG":"保加利亞","countryBF":"布基納法索","countryBI":"布隆迪","countryKH":"柬埔寨","countryCM":"喀麥隆","countryCA":"🇨🇦 加拿大","countryCV":"佛得角","countryKY":"開曼群島","countryCF":"中非共和國","countryTD":"乍得","countryCL":"智利","countryCN":"🇨🇳 中國","countryCX":"聖誕島","countryCC":"科科斯（基林）群島","countryCO":"哥倫比亞","countryKM":"科摩羅","countryCG":"剛果","countryCD":"剛果民主共和國","countryCK":"庫克群島","countryCR":"哥斯達黎加","countryCI":"象牙海岸","countryHR":"克羅地亞","countryCU":"古巴","countryCY":"賽普勒斯","countryCZ":"🇨🇿 捷克共和國","countryDK":"丹麥","countryDJ":"吉布提","countryDM":"多米尼克","countryDO":"多明尼加共和國","countryEC":"厄瓜多爾","countryEG":"埃及","countrySV":"薩爾瓦多","countryGQ":"赤道幾內亞","countryER":"厄立特里亞","countryEE":"愛沙尼亞","countryET":"埃塞俄比亞","countryFK":"福克蘭群島","countryFO":"法羅群島","countryFJ":"斐濟","countryFI":"🇫🇮 芬蘭","countryFR":"🇫🇷 法國","countryGF":"法屬圭亞那","countryPF":"法屬波利尼西亞","countryTF":"法屬南部領地","countryGA":"加蓬","countryGM":"岡比亞","countryGE":"格魯吉亞","countryDE":"🇩🇪 德國","countryGH":"加納","countryGI":"直布羅陀","countryGR":"希臘","countryGL":"格陵蘭","countryGD":"格林納達","countryGP":"瓜德羅普","countryGU":"關島","countryGT":"危地馬拉","countryGG":"根西","countryGN":"幾內亞","countryGW":"幾內亞比紹","countryGY":"圭亞那","countryHT":"海地","countryHM":"赫德島及麥克唐納群島","countryVA":"梵蒂岡","countryHN":"洪都拉斯","countryHK":"🇭🇰 香港","countryHU":"匈牙利","countryIS":"冰島","countryIN":"🇮🇳 印度","countryID":"🇮🇩 印尼","countryIR":"伊朗","countryIQ":"伊拉克","countryIE":"🇮🇪 愛爾蘭","countryIM":"馬恩島","countryIL":"🇮🇱 以色列","countryIT":"🇮🇹 意大利","countryJM":"牙買加","countryJP":"🇯🇵 日本","countryJE":"澤西","countryJO":"約旦","countryKZ":"哈薩克斯坦","countryKE":"肯尼亞","countryKI":"基里巴斯","countryKP":"北韓","countryKR":"🇰🇷 南韓","countryKW":"科威特","countryKG":"吉爾吉斯斯坦","countryLA":"老撾","countryLV":"拉脫維亞","countryLB":"黎巴嫩","countryLS":"萊索托","countryLR":"利比里亞","countryLY":"利比亞","countryLI":"列支敦士登","countryLT":"立陶宛","countryLU":"盧森堡","countryMO":"🇲🇴 澳門","countryMK":"北馬其頓","countryMG":"馬達加斯加","countryMW":"馬拉維","countryMY":"🇲🇾 馬來西亞","countryMV":"馬爾代夫","countryML":"馬里","countryMT":"馬耳他","countryMH":"馬紹爾群島","countryMQ":"馬提尼克","countryMR":"毛里塔尼亞","countryMU":"毛里求斯","countryYT":"馬約特","countryMX":"墨西哥","countryFM":"密克羅尼西亞","countryMD":"摩爾多瓦","countryMC":"摩納哥","countryMN":"蒙古","countryME":"黑山","countryMS":"蒙特塞拉特","countryMA":"摩洛哥","countryMZ":"莫桑比克","countryMM":"緬甸","countryNA":"納米比亞","countryNR":"瑙魯","countryNP":"尼泊爾","countryNL":"🇳🇱 荷蘭","countryAN":"荷屬安的列斯","countryNC":"新喀里多尼亞","countryNZ":"🇳🇿 紐西蘭","countryNI":"尼加拉瓜","countryNE":"尼日爾","countryNG":"尼日利亞","countryNU":"紐埃","countryNF":"諾福克島","countryMP":"北馬里亞納群島","countryNO":"🇳🇴 挪威","countryOM":"阿曼","countryPK":"巴基斯坦","countryPW":"帛琉","countryPS":"巴勒斯坦","countryPA":"巴拿馬","countryPG":"巴布亞新幾內亞","countryPY":"巴拉圭","countryPE":"秘魯","countryPH":"🇵🇭 菲律賓","countryPN":"皮特凱恩群島","countryPL":"🇵🇱 波蘭","countryPT":"🇵🇹 葡萄牙","countryPR":"波多黎各","countryQA":"卡塔爾","countryRE":"留尼旺","countryRO":"羅馬尼亞","countryRU":"🇷🇺 俄羅斯","countryRW":"盧旺達","countrySH":"聖赫勒拿","countryKN":"聖基茨和尼維斯","countryLC":"聖盧西亞","countryPM":"聖皮埃爾和密克隆","countryVC":"聖文森特和格林納丁斯","countryWS":"薩摩亞","countrySM":"聖馬力諾","countryST":"聖多美和普林西比","countrySA":"沙特阿拉伯","countrySN":"塞內加爾","countryRS":"塞爾維亞","countrySC":"塞舌爾","countrySL":"塞拉利昂","countrySG":"🇸🇬 新加坡","countrySK":"斯洛伐克","countrySI":"斯洛文尼亞","countrySB":"所羅門群島","countrySO":"索馬里","countryZA":"南非","countryGS":"南喬治亞島和南桑威奇群島","countryES":"🇪🇸 西班牙","countryLK":"斯里蘭卡","countrySD":"蘇丹","countrySR":"蘇里南","countrySJ":"斯瓦爾巴和揚馬延","countrySZ":"斯威士蘭","countrySE":"🇸🇪 瑞典","countryCH":"🇨🇭 瑞士","countrySY":"敘利亞","countryTW":"🇹🇼 台灣","countryTJ":"塔吉克斯坦","countryTZ":"坦桑尼亞","countryTH":"🇹🇭 泰國","countryTL":"東帝汶","countryTG":"多哥","countryTK":"托克勞","countryTO":"湯加","countryTT":"特立尼達和多巴哥","countryTN":"突尼斯","countryTR":"土耳其","countryTM":"土庫曼斯坦","countryTC":"特克斯和凱科斯群島","countryTV":"圖瓦盧","countryUG":"烏干達","countryUA":"烏克蘭","countryAE":"阿聯酋","countryGB":"🇬🇧 英國","countryUS":"🇺🇸 美國","countryUM":"美國外本島","countryUY":"烏拉圭","countryUZ":"烏茲別克斯坦","countryVU":"瓦努阿圖","countryVE":"委內瑞拉","countryVN":"🇻🇳 越南","countryVG":"英屬維爾京群島","countryVI":"美屬維爾京群島","countryWF":"瓦利斯和富圖納","countryEH":"西撒哈拉","countryYE":"也門","countryZM":"贊比亞","countryZW":"津巴布韋","epacUS":"頭等國際包裹服務","epacCH":"Priority Plus","epacGB":"International Tracked","epacMY":"International Tracked/Express","epacCA":"國際入境快遞","epacAU":"Pack and Track International","epacNZ":"國際經濟追蹤","epacDE":"Warenpost International Premium","epacFR":"帶追蹤嘅國際信件","epacNL":"International Packet Tracked","epacPL":"GLOBAL Expres","epacBE":"International Prime Inbound","epacAT":"國際追蹤包裹","epacIN":"國際追蹤包裹","epacFI":"國際追蹤信件","epacSE":"國際追蹤信件","epacNO":"PRIME Exprès","epacIT":"Express","epacIL":"Express","epacES":"國際輕型包裹","epacPT":"國際藍色郵件","epacCZ":"來自國外嘅追蹤貨物","epacBN":"國際電子小包","epacCN":"國際電子小包","epacHK":"國際電子小包","epacID":"國際電子包裹","epacMO":"國際電子小包","epacPH":"國際追蹤郵件","epacTW":"國際電子小包","epacTH":"國際電子小包","epacVN":"國際電子包裹（東盟包裹）","epacKR":"K-Packet","epacJP":"國際電子小包輕裝版","epacIE":"國際快遞郵政","blogSingPostEPACContent1":"SingPost ePAC（ePacket）係一種經濟實惠嘅國際電子商務輕型貨物追蹤郵政服務。","blogSingPostEPACContent2":"由目的地國家嘅國家郵政運營商派送，通常用於2公斤以下嘅包裹，尺寸限制為長+寬+高低於90厘米，長度唔超過60厘米。","blogSingPostEPACContent3":"呢個選項最初只由香港郵政與eBay中國共同提供，允許來自中國同香港嘅包裹以帶有派送追蹤嘅方式發送到美國，派送時唔需要任何簽名。該服務喺美國被稱為USPS（美國郵政）First-Class Package International Service。","blogSingPostEPACContent4":"自2026年1月1日起，ePAC現在用於所有國家，以遵守強制性UPU法規，要求對包裹進行追蹤，並將掛號物品限制為僅限文件。","blogSingPostEPACContent5":"追蹤前綴：LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS係國際優質郵政快遞服務，全球郵政運營商均優先處理。","blogSpeedPostEMSContent2":"清關通常比標準郵件更快，但流程更嚴格，可全程追蹤至派送。","blogSpeedPostEMSContent3":"喺新加坡，呢個係SingPost嘅SpeedPost Priority International。","blogSpeedPostEMSContent4":"追蹤前綴：EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express係快遞級別嘅服務。","blogSpeedPostExpressContent2":"喺許多目的地，DHL Express負責最後一公里派送，並喺放行前收取關稅或稅款。","blogSpeedPostExpressContent3":"追蹤前綴：PX123456789SG（最後一公里DHL Express使用10位數追蹤號碼，該號碼唔對外公開，但我們透過","blogSpeedPostExpressContent3Link":"追蹤系統有相關資訊。","blogUSPDDPContent1":"PDDP允許喺派送前預付美國進口關稅同稅款，減少收件人嘅意外費用。","blogUSPDDPContent2":"新規定（2025年8月29日生效）","blogUSPDDPContent2List1":"強制性HTS代碼","blogUSPDDPContent2List2":"準確嘅物品描述","blogUSPDDPContent2List3":"更嚴格嘅關稅執行","blogUSPDDPContent3":"發送到美國嘅所有物品唔會向收件人收取任何額外關稅，因為我們代你支付。但係，請注意，物品價格預設包含10%嘅進口費，以符合規定。","blogUSPDDPContent4":"呢個只適用於我們發往美國嘅送貨方式，SpeedPost Priority International（EMS）同SingPost ePAC。","blogEUIOSSContent1":"歐盟對所有商業進口徵收增值稅，無論價值幾多。","blogEUIOSSContent2":"IOSS（Import One-Stop Shop）","blogEUIOSSContent3":"IOSS允許賣家喺結帳時為最高150歐元嘅貨物收取歐盟增值稅。","blogEUIOSSContent4":"然後透過IOSS系統匯出增值稅，實現更快嘅清關且派送時唔需要收取增值稅。","blogEUIOSSContent5":"對於透過Etsy或eBay嘅所有訂單，IOSS增值稅已喺結帳時收取，我們會喺稅務參考號上標明，以透過EDI（電子資料交換）將數據傳輸到目的地郵政服務。","blogUKVATContent1":"英國要求對進口商品進行增值稅核算。","blogUKVATContent2":"對於低價值貨物，增值稅通常喺結帳時收取，並由賣家或市場直接匯給HMRC。","blogUKVATContent3":"對於較高價值嘅貨物，增值稅可能喺派送前由承運人收取。","blogUKVATContent4":"對於透過Etsy或eBay嘅所有訂單，增值稅已喺結帳時收取，我們會喺稅務參考號上標明，以透過EDI（電子資料交換）將數據傳輸到目的地郵政服務。","blogNorwayVOECContent1":"挪威為從歐盟／歐洲經濟區以外進口嘅商品引入咗VOEC（電子商務增值稅）系統。呢個適用於價值高達3000挪威克朗嘅商品。","blogNorwayVOECContent2":"賣家可以註冊VOEC計劃，喺結帳時收取挪威增值稅，從而實現更快嘅清關且派送時唔需要收取增值稅。","blogNorwayVOECContent3":"對於透過Etsy或eBay嘅所有訂單，VOEC增值稅已喺結帳時收取。追蹤同海關文件標明稅務參考號，以將數據傳輸到挪威郵政服務。","blogSwissVATContent1":"瑞士對進口商品徵收增值稅，無論價值幾多。瑞士聯邦海關管理局要求外國賣家喺結帳時為最高65瑞士法郎嘅商品收取增值稅。","blogSwissVATContent2":"已喺瑞士增值稅系統註冊嘅賣家直接匯出所收取嘅增值稅，確保收件人喺派送時唔會產生額外嘅增值稅費用。","blogSwissVATContent3":"對於透過Etsy或eBay嘅所有訂單，瑞士增值稅已喺結帳時收取，海關文件包含用於EDI提交嘅稅務參考號。","dhlNoEmbed":"DHL Express唔支援透過嵌入方式追蹤。請","speedPostNoEmbed":"SpeedPost新加坡唔支援透過嵌入方式追蹤。請","operatorNoEmbed":"唔支援透過嵌入方式追蹤。請","clickHere":"按此","toTrackNewTab":"進行追蹤（喺新分頁開啟）。","russiaServiceSuspended":"⚠️ 重要通知：鑑於2022年俄羅斯入侵烏克蘭，新加坡郵政已與DHL一起停止所有往俄羅斯嘅貨物。喺宣佈恢復對該國服務之前，我們目前唔為俄羅斯提供服務。","australianDSTTitle":"澳洲夏令時間生效中","australianDSTBothMessage":"AEDT（澳洲東部夏令時間）同ACDT（澳洲中部夏令時間）目前均生效。","australianAEDTMessage":"AEDT（澳洲東部夏令時間）目前對悉尼、墨爾本及周邊地區生效。","australianACDTMessage":"ACDT（澳洲中部夏令時間）目前對阿德萊德同南澳大利亞生效。","australianDSTNote":"上面顯示嘅送貨時間反映嘅係當前夏令時。","statusHeldByCustms":"被海關扣留","accessRestricted":"訪問受限","vpnDetectedMessage":"偵測到VPN使用。請停用VPN先可以訪問此服務。","contactSupportError":"如果你認為呢係一個錯誤，請聯絡支援人員。","destinationNotAllowed":"無法從你所在嘅位置訪問該目的地國家。請選擇其他目的地。","contactUsTitle":"聯絡我們","contactNameLabel":"姓名（唔接受暱稱或電話號碼）","contactEmailLabel":"電郵地址（我們將回覆你嘅地址）","contactEmailNote":"唔接受私人中繼電郵（例如 @privaterelay.appleid.com）。請使用有效電郵地址。","contactEnquiryTypeLabel":"呢係咩嘢？","contactSelectOption":"選擇一個選項","contactGeneralEnquiry":"一般查詢 / 意見","contactBusinessEnquiry":"商業查詢","contactOrderShippingEnquiry":"訂單／運輸查詢","contactExchangeRefundEnquiry":"換貨／退款查詢","contactOthers":"其他","contactParcelWarning":"如果你嘅包裹超過18/30/45天未送達（FedEx為14天），或狀態顯示已送達但你冇收到，請填寫","contactParcelWarningLink":"呢個表格","contactParcelWarningEnd":"代替。","contactOrderNumberLabel":"訂單號","contactOrderNumberPlaceholder":"例如：RTNX1234567890","contactPlatformNote":"Etsy、eBay 同 Shopee 訂單號喺呢度。我們對這些平台嘅退款冇任何控制權。請分別聯絡其客戶服務。","contactPlatformInstructions":"請使用應用程式查看你嘅訂單號，因為它已保存喺應用程式中：","contactPlatformEtsy":"Etsy - 右上角個人資料 → 購買","contactPlatformEbay":"eBay - 我嘅eBay → 購買","contactPlatformShopee":"Shopee - 我 → 查看購買歷史（或你可以點擊待發貨／待收貨）","contactRefundNote1":"如果你係查詢你購買嘅平台嘅退貨／退款，請注意我們對這些平台嘅退款冇任何控制權。請分別聯絡其客戶服務。","contactRefundNote2":"對於退貨或換貨，如果 maimai 手套喺打開時已經使用過（可見污漬或喺洗衣機手洗中洗過），我們唔允許，亦唔允許娛樂卡嘅退貨或換貨。多謝。","contactRefundNote3":"請注意，對於透過 Payhip 嘅退款，如果你冇收到退款，請聯絡你嘅銀行或 Payhip 支援（support@payhip.com），因為我們無法控制該流程。","contactMessageLabel":"你嘅訊息（最多1000個字元）","contactCharacterCount":"字元","contactSpamWarningNote":"注意：","contactSpamWarning":"SEO、網站設計、貸款或類似服務嘅未經請求報價將自動被拒絕。","contactAgreementText1":"如果你同意 Rhythm Nexus 使用你嘅電郵地址回覆你，請點擊「我同意」，因為呢係我們閱讀你嘅回覆並喺找到解決方案後回覆你所必需嘅。","contactAgreementText2":"請注意，我們嘅回覆需要3-5個工作日，或喺我們收到大量電郵時需要更長時間。","contactAgreeCheckbox":"我同意","contactSuccessMessage":"你嘅訊息已成功發送！我們將喺3-5個工作日內回覆。","contactErrorMessage":"發送訊息失敗。請重試。","contactGeneralError":"發生錯誤。請稍後重試。","contactSubmitting":"正在提交...","contactSubmit":"提交","contactAlertAgree":"請同意條款以提交表格。","parcelEnquiryTitle":"包裹查詢","parcelInfoText":"呢個表格適用於超過18/30/45天未送達嘅包裹（FedEx/DHL為14天），或顯示已送達狀態但你冇收到嘅包裹。","parcelInfoLink":"點擊呢度","parcelInfoEnd":"了解其他查詢。","parcelWaitTitle":"請等待你嘅包裹","parcelWaitText1":"請等待你嘅包裹送達。請注意，國際快遞唔同於本地快遞，需要時間。多謝！","parcelWaitText2":"如果18天後（新加坡為7天）或更長時間仍未顯示狀態，你可以直接告訴我們。","parcelCannotSubmit":"如果你選擇咗「否」，則無法提交呢個表格。","parcelNameLabel":"姓名","parcelOrderNumberLabel":"訂單號（例如：RTNX1234567890）","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"電郵地址（我們將透過此處回覆你）","parcelEmailNote":"唔接受私人中繼電郵。請使用有效電郵地址。","parcelShippingMethodLabel":"選擇嘅運輸方式？","parcelSelectShipping":"選擇運輸方式","parcelSingPostEpac":"SingPost ePacket（或 ePAC）- 又稱 SpeedPost Saver International（追蹤：LG/LP/LT123456789SG）","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label（追蹤：PP123456789SG）","parcelSpeedPostStandard":"SpeedPost Standard（追蹤：SPNDD00012345）","parcelSpeedPostPriority":"SpeedPost Priority (EMS)（追蹤：EZ123456789SG）","parcelSpeedPostExpress":"SpeedPost Express（追蹤：PX123456789SG）","parcelDHL":"DHL Express（僅歐盟國家）（追蹤：1234567890）","parcelTrackingNumberLabel":"你嘅包裹追蹤號？","parcelUndeliveredLabel":"你嘅包裹超過18/30/45天未送達嗎？（新加坡本地服務 >7天，SpeedPost Express/DHL >14天）","parcelSelectOption":"選擇一個選項","parcelYes":"係","parcelNo":"唔係","parcelDeliveredButMissingLabel":"你嘅包裹顯示已送達狀態，但唔喺你嘅郵箱／安全地點／門口嗎？","parcelCaseReferenceLabel":"當地郵局嘅案件參考編號","parcelCaseReferencePlaceholder":"如果你係香港或澳門，請輸入NA","parcelCaseReferenceNote":"喺提交呢個表格之前，請透過電話或電郵聯絡你當地嘅郵局並取得案件參考編號。然後，喺此輸入你嘅案件參考編號。","parcelCaseReferenceLink":"請參閱此連結以獲取郵政服務聯絡方式","postalContactsTitle":"郵政服務聯絡方式","parcelCaseReferenceMandatory":"只有你係香港或澳門先輸入NA。其他國家必須提供。SpeedPost Express 同 DHL 嘅案件編號亦需要。","parcelImageEvidenceLabel":"圖像證據（用於已送達但遺失嘅包裹）","parcelImageWarning":"為進行額外核實，我們需要圖像證據證明你冇就包裹未送達提出虛假聲明。（只適用於已送達但唔喺郵箱／門外嘅包裹。如果未提供已送達物品嘅照片證據，我們可能會拒絕你嘅索賠。如果你嘅物品未顯示已送達狀態，請忽略此項。）","parcelImageNote":"上傳1個支援嘅檔案：圖像。最大1 GB。","parcelAgreementText":"如果你確認你嘅包裹所發生嘅事係真實嘅，請點擊「我同意」。","parcelAgreeCheckbox":"我同意","parcelSuccessMessage":"你嘅包裹查詢已成功提交！我們將喺3-5個工作日內回覆。","parcelErrorMessage":"提交查詢失敗。請重試。","parcelGeneralError":"發生錯誤。請稍後重試。","parcelAlertWait":"請等待你嘅包裹送達。你可以喺指定等待期後提交呢個表格。","parcelAlertAgree":"請同意條款以提交表格。","parcelAlertCaseReference":"請提供當地郵局嘅案件參考編號，或如果你係香港或澳門，請輸入NA。","parcelSubmitting":"正在提交...","parcelSubmit":"提交","lookalikeDomainWarning":"呢個唔係追蹤號碼，而係一個冒充速遞公司嘅網站連結。唔好喺嗰度輸入個人資料或者付款資料。","lookalikeDomainOfficial":"官方網站："};
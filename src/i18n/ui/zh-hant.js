@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus 利用優質商業網絡。然而，在貨物到達您所在國家/地區的那一刻，保管權就會轉移到當地的國內承運商（例如當地的 USPS、皇家郵政、DHL）。追蹤前綴會在此閾值更改處理系統，但我們的通用包裹追蹤器將這些狀態縫合在一起，為您提供不間斷的可見性。","trackingLastMileTitle":"最後一哩配送網絡","trackingCustomsClearanceBody":"所有跨境物品必須通過您所在國家/地區的海關機構清關。我們的工具監控從進口設施到達到海關移交的過渡。邊境巡邏人員將驗證 HS 代碼並確保已繳納正確的增值稅或關稅（例如歐盟的 IOSS、挪威的 VOEC）。專門針對「海關扣留」警告進行監控追蹤。","trackingCustomsClearanceTitle":"清關資訊","trackingProcessingOriginBody":"一旦投遞，該物品就會進入原產地處理中心，在那裡進行掃描、稱重並接受初步出口安全檢查。然後將其發送到國際郵件交換中心。航班時刻表取決於可用的貨運頻寬。如果這種狀態持續幾天，請不要驚慌。","trackingProcessingOriginTitle":"在 Origin Hub 處理","trackingInfoReceivedBody":"當訂單首次在我們的電子商務平台（例如 Etsy、eBay 或直銷）上處理時，將以電子方式產生追蹤號碼。承運人在實際擁有箱子之前收到貨運數據。請等待 1 到 3 個工作天才能將包裹送入實體分類設施。","trackingInfoReceivedTitle":"收到的訊息","trackingStatusesIntro":"感謝您使用我們統一的國際包裹追蹤工具。由於您的包裹跨越多個全球邊界，因此其追蹤狀態可能很複雜。了解物流生命週期有助於設定明確的期望。","trackingStatusesTitle":"了解追蹤狀態","footerDesc":"您購買街機遊戲卡、節奏遊戲手套和專業商品的首選目的地。享受全球電子商務的無縫國際包裹追蹤和可靠的運輸數據。","amText":"上午","pmText":"下午","tzAEST":"AEST (雪梨/墨爾本)","tzACST":"ACST (阿德雷德)","tzAWST":"AWST (伯斯)","tzNST":"NST (紐芬蘭)","tzAST":"AST (大西洋)","tzEST":"EST (東部)","tzCST":"CST (中部)","tzMST":"MST (山地)","tzPST":"PST (太平洋)","tzAKST":"AKST (阿拉斯加)","tzHST":"HST (夏威夷)","tzBeijing":"北京","tzXinjiang":"新疆","tzWIB":"WIB (雅加達)","tzWITA":"WITA (望加錫)","tzWIT":"WIT (查亞普拉)","tzKaliningrad":"加里寧格勒州 (UTC+2)","tzMoscow":"莫斯科/俄羅斯西部 (UTC+3)","tzSamara":"薩馬拉州 (UTC+4)","tzUral":"烏拉爾地區 (UTC+5)","tzOmsk":"鄂木斯克州 (UTC+6)","tzKrasnoyarsk":"克拉斯諾亞爾斯克邊疆區 (UTC+7)","tzIrkutsk":"伊爾庫茨克州 (UTC+8)","tzSakha":"薩哈共和國 (UTC+9)","tzPrimorsky":"濱海邊疆區 (UTC+10)","tzMagadan":"馬加丹州 (UTC+11)","tzKamchatka":"堪察加邊疆區 (UTC+12)","dstDayStartsLabel":"夏令時間開始","dstDayEndsLabel":"夏令時間結束","dstRevertsLabel":"恢復標準時間","dstEuropeLabel":"歐洲","dstNewZealandLabel":"紐西蘭","englishResponseNotice":"注意：所有查詢均以英語回覆。如果您以其他語言提交，您的訊息可能會被翻譯成英文以供驗證。","systemRequirementsTitle":"最低支援系統版本","systemRequirements":"Windows：Windows 7 (with ESU updates installed)或以上\nmacOS：macOS 12或以上\nAndroid：Android 13或以上\niPhone/iOS：iOS 17或以上\nLinux：目前支援的發行版本，具有主動安全更新","title":"驗證存取","subtitle":"請完成以下挑戰以繼續。","selectLanguage":"選擇語言","selectLanguagePlaceholder":"-- 選擇一種語言 --","loadingChallenge":"正在載入挑戰...","answerLabel":"您的答案：","answerPlaceholder":"輸入您的答案","continueButton":"繼續","refreshButton":"新挑戰","verifying":"正在驗證...","chooseLanguageFirst":"請先選擇一種語言。","loadFailed":"載入挑戰失敗。請重試。","expiredChallenge":"挑戰已過期。正在載入新挑戰...","verifyFailed":"驗證失敗。請重試。","goodFridayEasterGreeting":"¡Feliz Pascua! Paz y alegría en Viernes Santo y Pascua.","christmasGreeting":"¡Feliz Navidad y próspero Año Nuevo! Paz y alegría del 25 de diciembre al 5 de enero.","captchaSystemRequirements":"Requisitos mínimos: Windows 7 (with ESU updates installed) o 11, macOS 10.15+, o la última versión de Android/iOS.","home":"首頁","blog":"博客","aboutUs":"關於我們","faq":"常見問題","contact":"聯絡我們","trackPackage":"追蹤包裹","cnyYearOfHorseMessage":"🧧 新年快樂！祝您馬年萬事如意，闔家幸福！🐴","hariRayaMessage":"🌙 開齋節快樂！祝您和家人平安、喜樂、蒙福！🌟","deepavaliMessage":"🪔 屠妖節快樂！願光明節為您帶來歡樂、繁榮和成功！✨","diwaliMessage":"🪔 排燈節快樂！願光明節為您帶來歡樂、繁榮和成功！✨","vesakMessage":"☸️ 衛塞節快樂！祝您在這神聖的日子獲得平安、智慧和覺悟！🙏","vesakTHMessage":"☸️ 衛塞節快樂！祝您在這神聖的日子獲得平安、智慧和覺悟！🙏","singaporeNationalDayMessage":"🇸🇬 新加坡國慶日快樂！慶祝獨立61週年！🎉","indonesiaNationalDayMessage":"🇮🇩 印度尼西亞獨立日快樂！印度尼西亞共和國萬歲！🎊","malaysiaNationalDayMessage":"🇲🇾 馬來西亞國慶日快樂！慶祝我們國家的獨立！🎊","australiaNationalDayMessage":"🇦🇺 澳洲國慶日快樂！慶祝我們的國家！🎉","canadaNationalDayMessage":"🇨🇦 加拿大國慶日快樂！慶祝我們偉大的國家！🍁","usaNationalDayMessage":"🇺🇸 美國獨立日快樂！慶祝自由和獨立！🎆","franceBastilleDayMessage":"🇫🇷 法國國慶日快樂！法蘭西萬歲！🎊","germanyUnityDayMessage":"🇩🇪 德國統一日快樂！🎉","italyRepublicDayMessage":"🇮🇹 意大利共和國日快樂！🇮🇹","spainNationalDayMessage":"🇪🇸 西班牙國慶日快樂！🎊","japanFoundationDayMessage":"🇯🇵 日本建國紀念日快樂！🎌","chinaNationalDayMessage":"🇨🇳 中國國慶節快樂！🎉","koreaLiberationDayMessage":"🇰🇷 韓國光復節快樂！🎊","indiaIndependenceDayMessage":"🇮🇳 印度獨立日快樂！🇮🇳","thailandNationalDayMessage":"🇹🇭 泰國國慶日快樂！🎉","philippinesIndependenceDayMessage":"🇵🇭 菲律賓獨立日快樂！🇵🇭","vietnamNationalDayMessage":"🇻🇳 越南國慶日快樂！🎊","polandNationalDayMessage":"🇵🇱 波蘭獨立日快樂！🎉","czechNationalDayMessage":"🇨🇿 捷克獨立日快樂！🎊","netherlandsKingsDayMessage":"🇳🇱 荷蘭國王節快樂！🧡","norwayConstitutionDayMessage":"🇳🇴 挪威憲法日快樂！🇳🇴","swedenNationalDayMessage":"🇸🇪 瑞典國慶日快樂！🇸🇪","finlandIndependenceDayMessage":"🇫🇮 芬蘭獨立日快樂！🇫🇮","portugalNationalDayMessage":"🇵🇹 葡萄牙國慶日快樂！🇵🇹","israelIndependenceDayMessage":"🇮🇱 以色列獨立日快樂！🎉","irelandNationalDayMessage":"🇮🇪 愛爾蘭聖帕特里克節快樂！🍀","bruneiNationalDayMessage":"🇧🇳 文萊國慶日快樂！🎊","newZealandWaitangiDayMessage":"🇳🇿 新西蘭懷唐伊日快樂！🎉","switzerlandNationalDayMessage":"🇨🇭 瑞士國慶日快樂！🎊","austriaNationalDayMessage":"🇦🇹 奧地利國慶日快樂！🎉","belgiumNationalDayMessage":"🇧🇪 比利時國慶日快樂！🎊","russiaDayOfRussiaMessage":"🇷🇺 俄羅斯日快樂！🎉","taiwanFoundingDayMessage":"🇹🇼 台灣開國紀念日快樂！中華民國開國紀念日快樂！🎊","taiwanNationalDayMessage":"🇹🇼 台灣雙十節快樂！國慶日快樂！🎉","hongKongHandoverDayMessage":"🇭🇰 香港特區成立紀念日快樂！香港特別行政區成立紀念日快樂！🎊","macauHandoverDayMessage":"🇲🇴 澳門特區成立紀念日快樂！澳門特別行政區成立紀念日快樂！🎉","laborDayMessage":"⚒️ 國際勞動節快樂！慶祝勞動和勞工權益！🎊","laborDayUSCAMessage":"⚒️ 勞動節快樂！致敬勞工貢獻！🎉","orderNumber":"訂單號（示例：RTNX1234567890）","fromDate":"從日期（必需）","toDate":"至日期（必需）","trackParcel":"追蹤包裹","selectCourier":"-- 選擇快遞/國家 --","optionSingPost":"🇸🇬 新加坡郵政 (SingPost)","singaporeCouriers":"新加坡快遞商","topCountries":"前5個國家","otherCountries":"其他國家","note":"注意","disclaimer":"免責聲明","importantInformation":"重要信息:","didNotReceiveEmail":"如果您沒有收到來自Etsy、eBay、Shopee或Payhip的確認電子郵件，請向下滾動，通過與此訂單關聯的電子郵件地址或電話號碼搜索您的訂單。","searchByEmailOrPhone":"按電子郵件或電話搜索","searchOrder":"搜索訂單","trackingResult":"追蹤結果","noOrdersFound":"未找到訂單。","pleaseEnter":"請輸入電子郵件、電話號碼或訂單號。","fillAllFields":"請填寫所有必填欄位：追蹤號、目的地國家、訂單號和郵政編碼。","noOrderMatchingFields":"未找到與所有欄位匹配的訂單。","postcodeRequired":"此目的地需要郵政編碼。","invalidUSZip":"無效的美國郵政編碼。請使用5位數字或ZIP+4。","failedGenerateURL":"生成追蹤URL失敗。請檢查輸入。","trackingValidationSG":"新加坡的追蹤號必須是：LG123456789SG、LP123456789SG、LT123456789SG、EZ123456789SG或PX123456789SG。DHL快遞請使用10位數字。","invalidSingPostFormat":"無效的SingPost追蹤號格式。\n可接受的格式：\n• PP123456789SG → 預付費追蹤標籤\n• SPNDD00012345 → SpeedPost標準追蹤","welcomeTitle":"歡迎來到Rhythm Nexus網站！","purchaseInfo":"通過我們的官方渠道購買，或加入我們的","purchaseInfoChina":"請透過我們的官方渠道購買。","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram群組","forUpdates":"獲取官方更新。","ourStores":"我們的商店","etsyStore":"Etsy商店","ebayStore":"eBay商店","shopeeStore":"Shopee商店","payhipStore":"Payhip商店","internationalShipping":"國際運輸","singaporeLocal":"新加坡本地","asiaOnly":"僅限亞洲","deliveryInfo":"配送信息","deliveryRates2026":"2026年配送費率","sgDeliveryRates":"新加坡配送費率","speedPostRates":"SpeedPost Express國際費率","aboutTitle":"關於Rhythm Nexus","aboutP1":"我們於2022年開設商店，並在Etsy、eBay和Shopee上銷售。","aboutP2":"我們專注於可靠的履行和準確的追蹤，建立了良好的聲譽。","aboutP3":"我們的目標是提供流暢可信的購物體驗。","aboutP4":"感謝您支持Rhythm Nexus。","faqTitle":"常見問題","faqQ1":"如果我的物品有缺陷怎麼辦？有任何保固嗎？","faqA1":"是的！大多數訂單都提供 1 年保固。請提供您的發票/訂單編號，以便我們調查。注意：如果物品符合描述，即使您訂購錯誤，也不允許換貨。","faqQ2":"我可以編輯、更新或取消我的訂單嗎？","faqA2":"可以。為了安全起見，訂單更改可能需要透過電子郵件或我們的聯絡表單處理。","faqQ3":"我需要支付關稅/進口稅嗎？","faqA3":"關稅和稅款通常不預付，寄往美國的 DDP 除外。增值稅可能適用於歐盟、英國、澳洲/紐西蘭、挪威、瑞士和加拿大省份，如薩斯喀徹溫省和曼尼托巴省，這些皆已預設支付。新加坡不適用消費稅。我們無法提供有關海關費用的建議——請聯絡當地海關以獲取詳細資訊。","faqQ4":"我的訂單什麼時候發貨？","faqA4":"訂單通常在 1-5 個工作日內發貨。在高峰期，可能需要 5-7 天。","faqQ5":"我不小心訂購了兩次。我該怎麼辦？","faqA5":"我們只退還重複的運費。兩件物品將一起發貨。退款 =（第一筆運費 + 第二筆運費） – 實際運費。","faqQ6":"送貨需要多長時間？","faqA6":"處理需要 1-5 個工作日。\n\n國內運輸：\n• SingPost 預付費追蹤標籤：2-4 天\n• SpeedPost 標準：1-3 天\n\n國際：\n• SingPost ePAC：14-30 天\n• SpeedPost Priority (EMS)：8-15 天\n• SpeedPost Express：4-8 天\n\n旺季可能會出現延誤。","faqQ7":"我的物品正在退回給發件人。我該怎麼辦？","faqA7":"允許重新發貨一次。由於地址無效、包裹無人認領或未支付海關費用，無法取消。請聯絡您的郵政服務部門重新投遞，或給我們留言尋求協助。","faqQ8":"我的物品在運輸途中丟失/被盜。","faqA8":"我們允許重新發貨一次。如果再次丟失，將在快遞員的投遞窗口後全額退款：\n\n• 新加坡本地服務：7 天\n• SingPost ePAC 和 SpeedPost Priority International：30 天\n• SpeedPost Intl Express：14 天","blogTitle":"運輸與郵政知識庫","blogSubtitle":"關於郵政服務、關稅、增值稅的官方說明。","readMore":"閱讀更多","backButton":"返回","copyrightText":"版權所有。","blogPost1Title":"什麼是SingPost ePAC？","blogPost1Desc":"了解ePAC。","blogPost2Title":"什麼是SpeedPost Priority International (EMS)？","blogPost2Desc":"了解EMS。","blogPost3Title":"什麼是SpeedPost Express？","blogPost3Desc":"探索SpeedPost Express。","blogPost4Title":"美國PDDP","blogPost4Desc":"了解PDDP。","blogPost5Title":"歐盟增值稅 & IOSS","blogPost5Desc":"歐盟增值稅見解。","blogPost6Title":"英國增值稅 & HMRC","blogPost6Desc":"英國增值稅要求。","blogPost7Title":"挪威VOEC","blogPost7Desc":"挪威VOEC系統。","blogPost8Title":"瑞士增值稅","blogPost8Desc":"瑞士增值稅要求。","enterDestinationPostcode":"輸入目的地郵遞區號","trackingNumberExample":"例如：LG123456789SG","trackingCaseSensitive":"追蹤字母區分大小寫，必須大寫。","usaPostcodeNote":"對於沒有郵政編碼的國家/地區，例如香港和澳門，請輸入 999077（香港）或 999078（澳門）。","epacDeliveryNote":"請注意，所有發送到目的地的 ePAC 物品都應送達到您的郵箱、家門口、包裹儲物櫃或留在安全的地方！","currentTime":"目前時間","timezoneNote":"時間以12小時格式顯示","sameTimeAsSingapore":"與新加坡時間相同","hourAhead":"小時領先新加坡","hoursAhead":"小時領先新加坡","hourBehind":"小時落後新加坡","hoursBehind":"小時落後新加坡","countriesNoMailbox":"已知無法提供郵箱/信箱投遞的國家/地區：汶萊、中國、印度、以色列、中國澳門特別行政區、菲律賓、波蘭和越南。","rhythmNexusNotResponsible":"Rhythm Nexus 不負責處理配送，因為這超出了我們的控制範圍，我們更希望您追蹤您的物品狀態。","issuesAfterDelivery":"交貨後 30/45 天（SpeedPost Express 為 14 天）出現任何問題，或者狀態顯示已送達但您未收到，請聯絡我們","cannotUseEmbed":"我們無法使用嵌入進行追蹤，因為大多數郵政服務網站不支援它。","clickLinkAbove":"請點擊上面的連結追蹤您的包裹。","trackingDetailsNote":"請注意，追蹤詳細資訊可能不會顯示在搜尋結果中，因此建議將追蹤號碼貼到系統中以追蹤該物品。","thirdPartyWebsites":"您也可以在這些第三方網站上追蹤您的包裹：","enterEmailOrPhone":"輸入電子郵件或電話","collectAtPostOffice":"但是，如果您的國家/地區沒有標準的郵箱，您將必須在郵局領取。","reviewShippingRates":"查看目前的運費","here":"這裡","contactUsForm":"請透過此聯絡我們","form":"表格","forEnquiries":"如有任何關於訂單的疑問。","anPostNoDirectTracking":"An Post（愛爾蘭）不支援直接追蹤連結或嵌入式追蹤。","anPostPasteManually":"請在An Post網站上手動貼上您的追蹤號碼。","goToAnPost":"前往An Post","countryMsgNL":"如果狀態顯示'Held by Customs'，請聯絡荷蘭海關資訊熱線尋求協助：\n0800 0143（免費），週一至週五 7-23 點。\n週六和週日 8-16:30。\n\n建議在PostNL註冊帳戶以接收您包裹的即時推送通知：\n\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \n\n如果包裹送到PostNL站點或狀態要求您到郵局領取，您需要在櫃檯支付7歐元。如果線上支付，最多4歐元。","countryMsgDE":"我們建議您下載Post & DHL應用程式以接收您包裹的追蹤狀態推送通知：\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \nDHL Paket GmbH 客戶服務聯絡方式：\n+49-228-433-3112\nDHL DE 聯絡方式：https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"您必須向海關提交額外的進口聲明。否則可能會有入境限制，包裹將被退回。\n更多資訊：https://www.posti.fi/en/receiving/customs-clearance \n其他連結：\nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \nhttps://tulli.fi/en/about-us/contact-information \nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"將收取4.95歐元的處理費。\n在此下載應用程式：https://www.anpost.com/Post-Parcels/App","countryMsgPL":"將收取8.50波蘭茲羅提的處理費。\n您必須在郵局領取時支付此費用，\n因為包裹可能不會送到您的門口或郵箱。","countryMsgPH":"PHLPost在菲律賓被認為效率低下且不可靠。\n請務必追蹤您的包裹，因為'正在運送'的狀態\n有時只會顯示1到3週（針對較小的包裹）。對於較大的包裹，\n只能在馬尼拉中央郵局或您附近最近的\n郵局領取。請注意，任何價值的包裹都會產生112披索的處理費，\n您必須支付。如果不支付，包裹將被退回給我們。\n由於PHLPost的服務緩慢，預計交貨需要1-2個月。\n您無需為10000披索以下的物品繳稅，但如果價值等於或超過此金額，則必須繳納。\n我們建議下次從我們這裡訂購時使用SpeedPost Express以加快流程。然而，由於D&T默認適用於收件人，因此可能不會產生費用。","countryMsgCA":"加拿大所有訂單的最低限額為20加元。由於新加坡是CPTPP協定的一部分，可能不會產生關稅，但如果物品超過60加元及以上或100加元及以上（取決於物品的HS代碼），則可能會產生D&T。超過此金額的任何價值都將相應地收取增值稅。","countryMsgID":"您必須在抵達印尼時支付所有產生的稅款和關稅。請追蹤您的包裹並向印尼海關支付指定金額。\n您還必須提交額外的清關文件。否則可能會有入境限制或該國海關扣押包裹。請在此處查看更多詳細資訊：\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"您必須在抵達印度時支付所有產生的稅款和關稅。請追蹤您的包裹並向印度海關支付指定金額。\n請注意，印度的清關非常嚴格，如果您的物品價值超過1000印度盧比（15美元），您可能需要支付關稅 - 取決於HS代碼，在大多數情況下是免稅的，但如果物品超過5000印度盧比（60美元），您可能需要支付更高的關稅。\n由於India Post預設不送貨到郵箱，您可能需要在家或成為授權代表才能接收您的包裹或在郵局領取。","countryMsgMY":"馬來西亞所有訂單的最低限額為500馬幣。超過此金額的訂單可能會被收費。","countryMsgUS":"自2025年8月29日起，800美元的最低限額將正式取消，進口關稅必須由原產國的寄件人默認支付。\n美國運送需要有效的電話號碼和電子郵件地址，以便您的包裹避免進一步延誤。","countryMsgIL":"以色列所有貨物的最低限額為240新謝克爾（75美元）。超過此金額的訂單可能會被收費。\n請注意，在訂購到以色列時，Israel Post有時不會在交貨後確認最終交貨。\n由於Israel Post預設不送貨到郵箱，您可能需要在家或成為授權代表才能接收您的包裹或在郵局領取。","countryMsgGB":"請注意，在訂購到英國時，Royal Mail有時不會在將包裹送到您的郵箱後確認最終交貨。","countryMsgTH":"泰國所有貨物的最低限額為1500泰銖（45美元）。超過此金額的訂單可能會被收費。","countryMsgTW":"台灣所有貨物的最低限額為2000新台幣（60美元）。超過此金額的訂單可能會被收費。","countryMsgMO":"寄往澳門的貨物不收取D&T費用。但請注意，Macau Post預設不送貨到郵箱，您必須在郵局領取您的包裹。","countryMsgBN":"寄往汶萊的貨物不收取D&T費用。但請注意，Brunei Post預設不送貨到郵箱，您必須在郵局領取您的包裹。\n該國的追蹤系統不是很穩定，只能提供有限的資訊，並且不會向原產地提供最終交貨結果。","countryMsgJP":"日本所有貨物的最低限額為10000日元（65美元）。超過此金額的訂單可能會被收費。","countryMsgKR":"韓國所有貨物的最低限額為180000韓元（150美元）。超過此金額的訂單可能會被收費。","countryMsgVN":"對於越南，請在交貨期間保持聯繫，因為您可能會在交貨時被收取處理費。\n越南所有貨物的最低限額為1000000越南盾（35美元）。超過此金額的訂單可能會被收費。\n由於Vietnam Post預設不送貨到郵箱，您可能需要在家或成為授權代表才能接收您的包裹或在郵局領取。","countryMsgPP":"Tracked Label物品將放置在郵局的POPDrop/POPStop。SpeedPost Standard物品通常放置在POPStop或POPStation。\n請注意，Tracked Label物品的交付僅在週一至週五上午9點至下午6點進行。週末和公共假期除外。","postedDate":"投遞日期:","status":"狀態:","shippedVia":"發貨方式:","destination":"目的地:","statusInPreparation":"準備中","statusInTransit":"運輸中","statusDelivered":"已投遞","statusOutForDelivery":"派送中","statusArrived":"已到達","statusProcessing":"處理中","statusDispatched":"已發出","statusReturned":"已退回","statusFailed":"投遞失敗","statusCancelled":"已取消","statusHeldByCustoms":"海關扣留","statusAwaitingCollection":"等待取件","aka":"又稱","thisServiceKnownAs":"該服務稱為","in":"在","viewTrackingDHL":"查看DHL Express的追蹤信息","viewTrackingSingPostSpeedPost":"查看Singapore SpeedPost的追蹤信息","viewTrackingDHLLastMile":"查看DHL Express（最後一英里）的追蹤信息","viewTrackingDHLShipperRef":"查看DHL Express（寄件人參考號）的追蹤信息","viewTrackingSingPost":"查看Singapore Post的追蹤信息","viewTrackingDestPost":"查看追蹤信息：","post":"郵政","orderNumberExample":"訂單編號（以RTNX或DLTB開頭 - 示例：RTNX1234567890）:","deliveryRecordNote":"請注意，物品投遞後，記錄僅保存 7 天，之後將被刪除。","copyrightAllRights":"版權所有。","filteredAllowedDestinations":"（依允許目的地篩選）","loadingAnnouncements":"正在載入公告...","unableToLoadAnnouncements":"目前無法載入服務公告。","viewOnSingPostWebsite":"前往 SingPost 網站查看 →","countryAF":"阿富汗","countryAX":"奧蘭群島","countryAL":"阿爾巴尼亞","countryDZ":"阿爾及利亞","countryAS":"美屬薩摩亞","countryAD":"安道爾","countryAO":"安哥拉","countryAI":"安圭拉","countryAQ":"南極洲","countryAG":"安地卡及巴布達","countryAR":"阿根廷","countryAM":"亞美尼亞","countryAW":"阿魯巴","countryAU":"🇦🇺 澳洲","countryAT":"🇦🇹 奧地利","countryAZ":"亞塞拜然","countryBS":"巴哈馬","countryBH":"巴林","countryBD":"孟加拉","countryBB":"巴貝多","countryBY":"白俄羅斯","countryBE":"🇧🇪 比利時","countryBZ":"貝里斯","countryBJ":"貝南","countryBM":"百慕達","countryBT":"不丹","countryBO":"玻利維亞","countryBA":"波士尼亞與赫塞哥維納","countryBW":"波札那","countryBV":"布威島","countryBR":"巴西","countryIO":"英屬印度洋領地","countryBN":"🇧🇳 汶萊","countryBG":"保加利亞","countryBF":"布吉納法索","countryBI":"蒲隆地","countryKH":"柬埔寨","countryCM":"喀麥隆","countryCA":"🇨🇦 加拿大","countryCV":"維德角","countryKY":"開曼群島","countryCF":"中非共和國","countryTD":"查德","countryCL":"智利","countryCN":"🇨🇳 中國","countryCX":"聖誕島","countryCC":"科科斯（基林）群島","countryCO":"哥倫比亞","countryKM":"葛摩","countryCG":"剛果","countryCD":"剛果民主共和國","countryCK":"庫克群島","countryCR":"哥斯大黎加","countryCI":"象牙海岸","countryHR":"克羅埃西亞","countryCU":"古巴","countryCY":"賽普勒斯","countryCZ":"🇨🇿 捷克共和國","countryDK":"丹麥","countryDJ":"吉布地","countryDM":"多米尼克","countryDO":"多明尼加共和國","countryEC":"厄瓜多","countryEG":"埃及","countrySV":"薩爾瓦多","countryGQ":"赤道幾內亞","countryER":"厄利垂亞","countryEE":"愛沙尼亞","countryET":"衣索比亞","countryFK":"福克蘭群島","countryFO":"法羅群島","countryFJ":"斐濟","countryFI":"🇫🇮 芬蘭","countryFR":"🇫🇷 法國","countryGF":"法屬圭亞那","countryPF":"法屬玻里尼西亞","countryTF":"法屬南部領地","countryGA":"加彭","countryGM":"甘比亞","countryGE":"喬治亞","countryDE":"🇩🇪 德國","countryGH":"迦納","countryGI":"直布羅陀","countryGR":"希臘","countryGL":"格陵蘭","countryGD":"格瑞那達","countryGP":"瓜地洛普","countryGU":"關島","countryGT":"瓜地馬拉","countryGG":"根西","countryGN":"幾內亞","countryGW":"幾內亞比索","countryGY":"蓋亞那","countryHT":"海地","countryHM":"赫德島和麥克唐納群島","countryVA":"梵蒂岡","countryHN":"宏都拉斯","countryHK":"🇭🇰 香港","countryHU":"匈牙利","countryIS":"冰島","countryIN":"🇮🇳 印度","countryID":"🇮🇩 印尼","countryIR":"伊朗","countryIQ":"伊拉克","countryIE":"🇮🇪 愛爾蘭","countryIM":"曼島","countryIL":"🇮🇱 以色列","countryIT":"🇮🇹 義大利","countryJM":"牙買加","countryJP":"🇯🇵 日本","countryJE":"澤西","countryJO":"約旦","countryKZ":"哈薩克","countryKE":"肯亞","countryKI":"吉里巴斯","countryKP":"北韓","countryKR":"🇰🇷 南韓","countryKW":"科威特","countryKG":"吉爾吉斯","countryLA":"寮國","countryLV":"拉脫維亞","countryLB":"黎巴嫩","countryLS":"賴索托","countryLR":"賴比瑞亞","countryLY":"利比亞","countryLI":"列支敦斯登","countryLT":"立陶宛","countryLU":"盧森堡","countryMO":"🇲🇴 澳門","countryMK":"北馬其頓","countryMG":"馬達加斯加","countryMW":"馬拉威","countryMY":"🇲🇾 馬來西亞","countryMV":"馬爾地夫","countryML":"馬利","countryMT":"馬爾他","countryMH":"馬紹爾群島","countryMQ":"馬丁尼克","countryMR":"茅利塔尼亞","countryMU":"模里西斯","countryYT":"馬約特","countryMX":"墨西哥","countryFM":"密克羅尼西亞","countryMD":"摩爾多瓦","countryMC":"摩納哥","countryMN":"蒙古","countryME":"蒙特內哥羅","countryMS":"蒙哲臘","countryMA":"摩洛哥","countryMZ":"莫三比克","countryMM":"緬甸","countryNA":"納米比亞","countryNR":"諾魯","countryNP":"尼泊爾","countryNL":"🇳🇱 荷蘭","countryAN":"荷屬安地列斯","countryNC":"新喀里多尼亞","countryNZ":"🇳🇿 紐西蘭","countryNI":"尼加拉瓜","countryNE":"尼日","countryNG":"奈及利亞","countryNU":"紐埃","countryNF":"諾福克島","countryMP":"北馬里亞納群島","countryNO":"🇳🇴 挪威","countryOM":"阿曼","countryPK":"巴基斯坦","countryPW":"帛琉","countryPS":"巴勒斯坦","countryPA":"巴拿馬","countryPG":"巴布亞紐幾內亞","countryPY":"巴拉圭","countryPE":"秘魯","countryPH":"🇵🇭 菲律賓","countryPN":"皮特凱恩群島","countryPL":"🇵🇱 波蘭","countryPT":"🇵🇹 葡萄牙","countryPR":"波多黎各","countryQA":"卡達","countryRE":"留尼旺","countryRO":"羅馬尼亞","countryRU":"🇷🇺 俄羅斯","countryRW":"盧安達","countrySH":"聖赫勒拿","countryKN":"聖克里斯多福及尼維斯","countryLC":"聖露西亞","countryPM":"聖皮埃與密克隆群島","countryVC":"聖文森及格瑞那丁","countryWS":"薩摩亞","countrySM":"聖馬利諾","countryST":"聖多美普林西比","countrySA":"沙烏地阿拉伯","countrySN":"塞內加爾","countryRS":"塞爾維亞","countrySC":"塞席爾","countrySL":"獅子山","countrySG":"🇸🇬 新加坡","countrySK":"斯洛伐克","countrySI":"斯洛維尼亞","countrySB":"索羅門群島","countrySO":"索馬利亞","countryZA":"南非","countryGS":"南喬治亞與南桑威奇群島","countryES":"🇪🇸 西班牙","countryLK":"斯里蘭卡","countrySD":"蘇丹","countrySR":"蘇利南","countrySJ":"斯瓦巴和揚馬延","countrySZ":"史瓦帝尼","countrySE":"🇸🇪 瑞典","countryCH":"🇨🇭 瑞士","countrySY":"敘利亞","countryTW":"🇹🇼 台灣","countryTJ":"塔吉克","countryTZ":"坦尚尼亞","countryTH":"🇹🇭 泰國","countryTL":"東帝汶","countryTG":"多哥","countryTK":"托克勞","countryTO":"東加","countryTT":"千里達及托巴哥","countryTN":"突尼西亞","countryTR":"土耳其","countryTM":"土庫曼","countryTC":"特克斯與凱科斯群島","countryTV":"吐瓦魯","countryUG":"烏干達","countryUA":"烏克蘭","countryAE":"阿聯酋","countryGB":"🇬🇧 英國","countryUS":"🇺🇸 美國","countryUM":"美國本土外小島屿","countryUY":"烏拉圭","countryUZ":"烏茲別克","countryVU":"萬那杜","countryVE":"委內瑞拉","countryVN":"🇻🇳 越南","countryVG":"英屬維京群島","countryVI":"美屬維京群島","countryWF":"瓦利斯和富圖納","countryEH":"西撒哈拉","countryYE":"葉門","countryZM":"尚比亞","countryZW":"辛巴威","epacUS":"頭等國際包裹服務","epacCH":"Priority Plus","epacGB":"International Tracked","epacMY":"International Tracked/Express","epacCA":"國際入境快遞","epacAU":"Pack and Track International","epacNZ":"國際經濟追蹤","epacDE":"Warenpost International Premium","epacFR":"帶追蹤的國際信件","epacNL":"International Packet Tracked","epacPL":"GLOBAL Expres","epacBE":"International Prime Inbound","epacAT":"國際追蹤包裹","epacIN":"國際追蹤包裹","epacFI":"國際追蹤信件","epacSE":"國際追蹤信件","epacNO":"PRIME Exprès","epacIT":"Express","epacIL":"Express","epacES":"國際輕型包裹","epacPT":"國際藍色郵件","epacCZ":"來自國外的追蹤貨物","epacBN":"國際電子小包","epacCN":"國際電子小包","epacHK":"國際電子小包","epacID":"國際電子包裹","epacMO":"國際電子小包","epacPH":"國際追蹤郵件","epacTW":"國際電子小包","epacTH":"國際電子小包","epacVN":"國際電子包裹（東盟包裹）","epacKR":"K-Packet","epacJP":"國際電子小包輕裝版","epacIE":"國際快遞郵政","blogSingPostEPACContent1":"SingPost ePAC（ePacket）是一種經濟實惠的國際電子商務輕型貨物追蹤郵政服務。","blogSingPostEPACContent2":"由目的地國家的國家郵政運營商配送，通常用於2公斤以下的包裹，尺寸限制為長+寬+高低於90厘米，長度不超過60厘米。","blogSingPostEPACContent3":"此選項最初僅由香港郵政與eBay中國共同提供，允許來自中國和香港的包裹以帶有配送追蹤的方式發送到美國，配送時無需任何簽名。該服務在美國被稱為USPS（United States Postal Service）First-Class Package International Service。","blogSingPostEPACContent4":"自2026年1月1日起，ePAC現在用於所有國家，以遵守強制性UPU法規，要求對包裹進行追蹤，並將掛號物品限制為僅限文件。","blogSingPostEPACContent5":"追蹤前綴：LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS是國際優質郵政快遞服務，受到全球郵政運營商的優先考慮。","blogSpeedPostEMSContent2":"清關通常比標準郵件更快，但流程更嚴格，可全程追蹤至配送。","blogSpeedPostEMSContent3":"在新加坡，這被稱為SingPost的SpeedPost Priority International。","blogSpeedPostEMSContent4":"追蹤前綴：EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express是快遞級別的服務。","blogSpeedPostExpressContent2":"在許多目的地，DHL Express執行最後一公里配送並在放行前收取關稅或稅款。","blogSpeedPostExpressContent3":"追蹤前綴：PX123456789SG（最後一公里DHL Express使用10位數追蹤號碼，該號碼不對公眾公開，但我們通過","blogSpeedPostExpressContent3Link":"追蹤系統有相關信息。","blogUSPDDPContent1":"PDDP允許在配送前預付美國進口關稅和稅款，減少收件人的意外費用。","blogUSPDDPContent2":"新規定（2025年8月29日生效）","blogUSPDDPContent2List1":"強制性HTS代碼","blogUSPDDPContent2List2":"準確的物品描述","blogUSPDDPContent2List3":"更嚴格的關稅執行","blogUSPDDPContent3":"發送到美國的所有物品不會向收件人收取任何額外關稅，因為我們代表您支付。但是，請注意，物品價格默認包含10%的進口費，以符合規定。","blogUSPDDPContent4":"這僅適用於我們發往美國的配送方式，SpeedPost Priority International（EMS）和SingPost ePAC。","blogEUIOSSContent1":"歐盟對所有商業進口徵收增值稅，無論價值如何。","blogEUIOSSContent2":"IOSS（Import One-Stop Shop）","blogEUIOSSContent3":"IOSS允許賣家在結帳時為最高150歐元的貨物收取歐盟增值稅。","blogEUIOSSContent4":"然後通過IOSS系統匯出增值稅，實現更快的清關且配送時無需收取增值稅。","blogEUIOSSContent5":"對於通過Etsy或eBay的所有訂單，IOSS增值稅已在結帳時收取，我們將在稅務參考號上標明，以通過EDI（Electronic Data Interchange）將數據傳輸到目的地郵政服務。","blogUKVATContent1":"英國要求對進口商品進行增值稅核算。","blogUKVATContent2":"對於低價值貨物，增值稅通常在結帳時收取，並由賣家或市場直接匯給HMRC。","blogUKVATContent3":"對於較高價值的貨物，增值稅可能在配送前由承運人收取。","blogUKVATContent4":"對於通過Etsy或eBay的所有訂單，增值稅已在結帳時收取，我們將在稅務參考號上標明，以通過EDI（Electronic Data Interchange）將數據傳輸到目的地郵政服務。","blogNorwayVOECContent1":"挪威為從歐盟/歐洲經濟區以外進口的商品引入了VOEC（VAT on E-Commerce）系統。這適用於價值高達3 000挪威克朗的商品。","blogNorwayVOECContent2":"賣家可以註冊VOEC計劃，在結帳時收取挪威增值稅，從而實現更快的清關且配送時無需收取增值稅。","blogNorwayVOECContent3":"對於通過Etsy或eBay的所有訂單，VOEC增值稅已在結帳時收取。追蹤和海關文件標明稅務參考號，以將數據傳輸到挪威郵政服務。","blogSwissVATContent1":"瑞士對進口商品徵收增值稅，無論價值如何。瑞士聯邦海關管理局要求外國賣家在結帳時為最高65瑞士法郎的商品收取增值稅。","blogSwissVATContent2":"在瑞士增值稅系統註冊的賣家直接匯出收取的增值稅，確保收件人在配送時不會產生額外的增值稅費用。","blogSwissVATContent3":"對於通過Etsy或eBay的所有訂單，瑞士增值稅已在結帳時收取，海關文件包含用於EDI提交的稅務參考號。","dhlNoEmbed":"DHL Express不支援透過嵌入方式進行追蹤。請","speedPostNoEmbed":"SpeedPost新加坡不支援透過嵌入方式進行追蹤。請","operatorNoEmbed":"不支援透過嵌入方式進行追蹤。請","clickHere":"按此處","toTrackNewTab":"進行追蹤（在新分頁中開啟）。","russiaServiceSuspended":"⚠️ 重要通知：鑑於2022年俄羅斯入侵烏克蘭，新加坡郵政已與DHL一起暫停所有運往俄羅斯的貨物。在宣佈恢復對該國的服務之前，我們目前不為俄羅斯提供服務。","temporaryClosureNoticeTitle":"Rhythm Nexus - 臨時停業通知","temporaryClosureNoticeBody":"親愛的顧客您好：\n\n請注意，因公司活動，Rhythm Nexus 將於 2026年3月21日 至 2026年3月26日 期間暫時停業。\n\n為配合停業安排，商店將自 2026年3月20日 下午3:00（UTC +8）起進入休假模式。此時間後下單的訂單，可能需待我們恢復營運後才會處理。\n\n正常營運將於 2026年3月27日 恢復。\n\n對於造成的不便，我們深感抱歉，並感謝您的理解與持續支持。\n\n謝謝。\n\nRhythm Nexus","temporaryClosureNoticeClose":"我已了解","parcelTracking":"包裹追蹤","serviceAnnouncement":"服務公告","trackingNumber":"追蹤號碼","destinationCountry":"目的地國家","postcode":"郵遞區號","australianDSTTitle":"澳洲夏令時有效","australianDSTBothMessage":"AEDT（澳洲東部夏令時間）和 ACDT（澳洲中部夏令時間）目前均有效。","australianAEDTMessage":"AEDT（澳洲東部夏令時間）目前對雪梨、墨爾本及週邊地區生效。","australianACDTMessage":"ACDT（澳洲中部夏令時間）目前對阿德萊德和南澳大利亞生效。","australianDSTNote":"上面顯示的交貨時間反映的是當前夏令時。","statusHeldByCustms":"被海關扣留","accessRestricted":"訪問受限","vpnDetectedMessage":"偵測到 VPN 使用情況。請停用 VPN 才能存取此服務。","contactSupportError":"如果您認為這是一個錯誤，請聯絡支援人員。","destinationNotAllowed":"無法從您所在的位置造訪該目的地國家。請選擇其他目的地。","countryAutoDetected":"目的地已根據您的位置預先設定","countryAutoDetectedFromLink":"目的地已透過連結預先設定","contactUsTitle":"聯絡我們","contactNameLabel":"姓名（禁止暱稱或電話號碼）","contactEmailLabel":"電子郵件地址（我們將回覆您的地址）","contactEmailNote":"不接受私人中繼電子郵件（例如 @privaterelay.appleid.com）。請使用有效的電子郵件地址。","contactEnquiryTypeLabel":"這是什麼？","contactSelectOption":"選擇一個選項","contactGeneralEnquiry":"一般諮詢 / 反饋","contactBusinessEnquiry":"商業諮詢","contactOrderShippingEnquiry":"訂單/運輸諮詢","contactExchangeRefundEnquiry":"退換貨/退款諮詢","contactOthers":"其他","contactParcelWarning":"如果您的包裹超過18/30/45天未送達（FedEx為14天），或狀態顯示已送達但您未收到，請填寫","contactParcelWarningLink":"此表格","contactParcelWarningEnd":"代替。","contactOrderNumberLabel":"訂單號","contactOrderNumberPlaceholder":"範例：RTNX1234567890","contactPlatformNote":"Etsy、eBay 和 Shopee 訂單號在此處。我們對這些平台的退款沒有任何控制權。請分別聯繫其客戶服務。","contactPlatformInstructions":"請使用應用程式查看您的訂單號，因為它已保存在應用程式中：","contactPlatformEtsy":"Etsy - 您的個人資料右上角 → 購買","contactPlatformEbay":"eBay - 我的 eBay → 購買","contactPlatformShopee":"Shopee - 我 → 查看購買歷史（或您可以點擊待發貨/待收貨）","contactRefundNote1":"如果您正在諮詢您購買的平台的退貨/退款，請注意我們對這些平台的退款沒有任何控制權。請分別聯繫其客戶服務。","contactRefundNote2":"對於退貨或更換，如果 maimai 手套在打開時已經使用（可見污漬或在洗衣機手洗中洗滌），我們不允許，並且不允許娛樂卡的退貨或更換。謝謝。","contactRefundNote3":"請注意，對於通過 Payhip 的退款，如果您未收到退款，請聯繫您的銀行或 Payhip 支持（support@payhip.com），因為我們無法控制該流程。","contactMessageLabel":"您的訊息（最多1000個字元）","contactCharacterCount":"字元","contactSpamWarningNote":"注意：","contactSpamWarning":"SEO、網站設計、貸款或類似服務的未經請求的報價將自動被拒絕。","contactAgreementText1":"如果您同意 Rhythm Nexus 使用您的電子郵件地址回覆您，請點擊「我同意」，因為這是我們閱讀您的回覆並在找到解決方案後回覆您所必需的。","contactAgreementText2":"請注意，我們的回覆將需要3-5個工作日，或在我們收到大量電子郵件時需要更長時間。","contactAgreeCheckbox":"我同意","contactSuccessMessage":"您的訊息已成功發送！我們將在3-5個工作日內回覆。","contactErrorMessage":"發送訊息失敗。請重試。","contactGeneralError":"發生錯誤。請稍後重試。","contactSubmitting":"正在提交...","contactSubmit":"提交","contactAlertAgree":"請同意條款以提交表格。","parcelEnquiryTitle":"包裹諮詢","parcelInfoText":"此表格適用於超過18/30/45天未送達的包裹（FedEx/DHL為14天），或顯示已送達狀態但您未收到的包裹。","parcelInfoLink":"點擊這裡","parcelInfoEnd":"了解其他諮詢。","parcelWaitTitle":"請等待您的包裹","parcelWaitText1":"請等待您的包裹送達。請注意，國際快遞不同於本地快遞，需要時間。謝謝！","parcelWaitText2":"如果18天後（新加坡為7天）或更長時間仍未顯示狀態，您可以直接告訴我們。","parcelCannotSubmit":"如果您選擇了「否」，則無法提交此表格。","parcelNameLabel":"姓名","parcelOrderNumberLabel":"訂單號（範例：RTNX1234567890）","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"電子郵件地址（我們將通過此處回覆您）","parcelEmailNote":"不接受私人中繼電子郵件。請使用有效的電子郵件地址。","parcelShippingMethodLabel":"選擇的運輸方式？","parcelSelectShipping":"選擇運輸方式","parcelSingPostEpac":"SingPost ePacket（或 ePAC）- 也稱為 SpeedPost Saver International（追蹤：LG/LP/LT123456789SG）","parcelSingPostPrepaid":"SingPost Prepaid Tracked Label（追蹤：PP123456789SG）","parcelSpeedPostStandard":"SpeedPost Standard（追蹤：SPNDD00012345）","parcelSpeedPostPriority":"SpeedPost Priority (EMS)（追蹤：EZ123456789SG）","parcelSpeedPostExpress":"SpeedPost Express（追蹤：PX123456789SG）","parcelDHL":"DHL Express（僅歐盟國家）（追蹤：1234567890）","parcelTrackingNumberLabel":"您的包裹追蹤號？","parcelUndeliveredLabel":"您的包裹超過18/30/45天未送達嗎？（新加坡本地服務 >7天，SpeedPost Express/DHL >14天）","parcelSelectOption":"選擇一個選項","parcelYes":"是","parcelNo":"否","parcelDeliveredButMissingLabel":"您的包裹顯示已送達狀態，但不在您的郵箱/安全地點/門口嗎？","parcelCaseReferenceLabel":"當地郵局的案例參考ID","parcelCaseReferencePlaceholder":"如果您來自新加坡，請輸入NA","parcelCaseReferenceNote":"在提交此表格之前，請通過電話或電子郵件聯繫您當地的郵局並從他們那裡獲取案例參考ID。然後，在此處輸入您的案例參考ID。","parcelCaseReferenceLink":"請參閱此連結以獲取郵政服務聯繫方式","postalContactsTitle":"郵政服務聯絡方式","parcelCaseReferenceMandatory":"僅當您來自新加坡時才輸入NA。其他國家必須提供。SpeedPost Express 和 DHL 的案例ID也需要。","parcelImageEvidenceLabel":"圖像證據（用於已送達但丟失的包裹）","parcelImageWarning":"為了進行額外驗證，我們需要圖像證據來證明您沒有對包裹未送達提出虛假聲明。（僅適用於已送達但不在郵箱/門外的包裹。如果未提供已送達物品的照片證據，我們可能會拒絕您的索賠。如果您的物品未顯示已送達狀態，請忽略此項。）","parcelImageNote":"上傳1個支援的檔案：圖像。最大1 GB。","parcelAgreementText":"如果您確保您的包裹發生的事情是真實的，請點擊「我同意」。","parcelAgreeCheckbox":"我同意","parcelSuccessMessage":"您的包裹諮詢已成功提交！我們將在3-5個工作日內回覆。","parcelErrorMessage":"提交諮詢失敗。請重試。","parcelGeneralError":"發生錯誤。請稍後重試。","parcelAlertWait":"請等待您的包裹送達。您可以在指定的等待期後提交此表格。","parcelAlertAgree":"請同意條款以提交表格。","parcelAlertCaseReference":"請提供當地郵局的案例參考ID，或如果您來自新加坡，請輸入NA。","parcelSubmitting":"正在提交...","parcelSubmit":"提交","lookalikeDomainWarning":"這不是追蹤號碼，而是冒充速遞公司的網站連結。請勿在該網站輸入個人資料或付款資料。","lookalikeDomainOfficial":"官方網站："};
@@ -0,0 +1,2 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/locales/ui/*.json. Do not edit by hand.
+export default {"trackingLastMileBody":"Rhythm Nexus 利用优质商业网络。然而，在货物到达您所在国家/地区的那一刻，保管权就会转移到当地的国内承运商（例如当地的 USPS、皇家邮政、DHL）。跟踪前缀会在此阈值更改处理系统，但我们的通用包裹跟踪器将这些状态缝合在一起，为您提供不间断的可见性。","trackingLastMileTitle":"最后一英里配送网络","trackingCustomsClearanceBody":"所有跨境物品必须通过您所在国家/地区的海关机构清关。我们的工具监控从进口设施到达到海关移交的过渡。边境巡逻人员将验证 HS 代码并确保已缴纳正确的增值税或关税（例如欧盟的 IOSS、挪威的 VOEC）。专门针对“海关扣留”警告进行监控跟踪。","trackingCustomsClearanceTitle":"清关信息","trackingProcessingOriginBody":"一旦投递，该物品就会进入原产地处理中心，在那里进行扫描、称重并接受初步出口安全检查。然后将其发送到国际邮件交换中心。航班时刻表取决于可用的货运带宽。如果这种状态持续几天，请不要惊慌。","trackingProcessingOriginTitle":"在 Origin Hub 处理","trackingInfoReceivedBody":"当订单首次在我们的电子商务平台（例如 Etsy、eBay 或直销）上处理时，将以电子方式生成跟踪号码。承运人在实际拥有箱子之前收到货运数据。请等待 1 到 3 个工作日才能将包裹送入物理分拣设施。","trackingInfoReceivedTitle":"收到的信息","trackingStatusesIntro":"感谢您使用我们统一的国际包裹追踪工具。由于您的包裹跨越多个全球边界，因此其跟踪状态可能很复杂。了解物流生命周期有助于设定明确的期望。","trackingStatusesTitle":"了解跟踪状态","footerDesc":"您购买街机游戏卡、节奏游戏手套和专业商品的首选目的地。享受全球电子商务的无缝国际包裹追踪和可靠的运输数据。","amText":"上午","pmText":"下午","tzAEST":"AEST (悉尼/墨尔本)","tzACST":"ACST (阿德莱德)","tzAWST":"AWST (珀斯)","tzNST":"NST (纽芬兰)","tzAST":"AST (大西洋)","tzEST":"EST (东部)","tzCST":"CST (中部)","tzMST":"MST (山地)","tzPST":"PST (太平洋)","tzAKST":"AKST (阿拉斯加)","tzHST":"HST (夏威夷)","tzBeijing":"北京","tzXinjiang":"新疆","tzWIB":"WIB (雅加达)","tzWITA":"WITA (望加锡)","tzWIT":"WIT (查亚普拉)","tzKaliningrad":"加里宁格勒州 (UTC+2)","tzMoscow":"莫斯科/俄罗斯西部 (UTC+3)","tzSamara":"萨马拉州 (UTC+4)","tzUral":"乌拉尔地区 (UTC+5)","tzOmsk":"鄂木斯克州 (UTC+6)","tzKrasnoyarsk":"克拉斯诺亚尔斯克边疆区 (UTC+7)","tzIrkutsk":"伊尔库茨克州 (UTC+8)","tzSakha":"萨哈共和国 (UTC+9)","tzPrimorsky":"滨海边疆区 (UTC+10)","tzMagadan":"马加丹州 (UTC+11)","tzKamchatka":"堪察加边疆区 (UTC+12)","dstDayStartsLabel":"夏令时开始","dstDayEndsLabel":"夏令时结束","dstRevertsLabel":"恢复标准时间","dstEuropeLabel":"欧洲","dstNewZealandLabel":"新西兰","englishResponseNotice":"注意：所有询问均以英语回复。如果您以其他语言提交，您的讯息可能会被翻译成英文以供验证。","contactUsTitle":"联络我们","contactNameLabel":"姓名","contactNamePlaceholder":"例如：张三","contactEmailLabel":"电子邮件","contactEnquiryTypeLabel":"这是一个？","contactSelectOption":"选择一个选项","contactGeneralEnquiry":"一般查询/反馈","contactBusinessEnquiry":"商务查询","contactOrderShippingEnquiry":"订单/运送查询","contactExchangeRefundEnquiry":"换货/退款/退货查询","contactOthers":"其他","contactOrderNumberLabel":"订单编号","contactOrderNumberPlaceholder":"例如：RTNX1234567890","contactMessageLabel":"信息","contactCharacterCount":"字元","contactSpamWarningNote":"注意：","contactSpamWarning":"未经请求的SEO、网页设计、贷款或类似服务的提案将被自动拒绝。","contactAgreementText2":"请注意，我们的回复将需要3-5个工作日，在电子邮件数量较多的时期可能需要更长时间。","contactAgreeCheckbox":"我同意","contactSuccessMessage":"您的讯息已提交！我们将在3-5个工作日内回复。","contactErrorMessage":"发送讯息失败。请重试。","contactGeneralError":"发生错误。请稍后重试。","contactSubmitting":"提交中...","contactSubmit":"提交","contactAlertAgree":"请同意条款以提交表单。","parcelEnquiryTitle":"包裹查询","parcelInfoText":"此表单适用于超过18/30/45天未送达的包裹（FedEx/DHL为14天），或显示已送达状态但您未收到的包裹。","parcelInfoLink":"点击这里","parcelInfoEnd":"进行其他查询。","parcelWaitTitle":"等待您的包裹","parcelWaitText1":"请等待您的包裹送达。请注意，国际配送与本地配送不同，需要时间。谢谢！","parcelWaitText2":"如果18天后（新加坡为7天）仍无任何状态显示，您可以直接通知我们。","parcelCannotSubmit":"如果您选择「否」，则无法提交此表单。","parcelNameLabel":"姓名","parcelOrderNumberLabel":"订单编号（例如：RTNX1234567890）","parcelOrderNumberPlaceholder":"RTNX1234567890","parcelEmailLabel":"电子邮件","parcelShippingMethodLabel":"选择的运送方式？","parcelSelectShipping":"选择运送方式","parcelSingPostEpac":"SingPost ePacket（或ePAC）- 即SpeedPost Saver International（追踪号：LG/LP/LT123456789SG）","parcelSingPostPrepaid":"SingPost预付追踪标签（追踪号：PP123456789SG）","parcelSpeedPostStandard":"SpeedPost标准（追踪号：SPNDD00012345）","parcelSpeedPostPriority":"SpeedPost优先（EMS）（追踪号：EZ123456789SG）","parcelSpeedPostExpress":"SpeedPost快递（追踪号：PX123456789SG）","parcelDHL":"DHL Express（仅限欧盟国家）（追踪号：1234567890）","parcelTrackingNumberLabel":"追踪号码","parcelUndeliveredLabel":"您的包裹是否已超过18/30/45天未送达？ （新加坡本地服务>7天，SpeedPost快递/DHL>14天）","parcelSelectOption":"选择一个选项","parcelYes":"是","parcelNo":"否","parcelDeliveredButMissingLabel":"您的包裹是否显示已送达状态，但实际上不在您的邮箱/安全地点/门口？","parcelCaseReferenceLabel":"来自当地邮局的案件参考编号","parcelCaseReferencePlaceholder":"如果您来自新加坡，请填写NA","parcelCaseReferenceNote":"在提交此表单之前，请通过电话或电子邮件联系您当地的邮局，并从他们那里获取案件参考编号。然后，在此处填写您的案件参考编号。","parcelCaseReferenceLink":"请参考此连结以获取邮政服务联络方式","parcelCaseReferenceMandatory":"仅当您来自新加坡时才填写NA。对于其他国家，这是强制性的。 SpeedPost快递也需要，对于DHL则需要案件编号。","parcelImageEvidenceLabel":"图片证据（用于已送达但遗失的包裹）","parcelImageWarning":"为了额外验证，我们需要照片证据来证明您没有对未送达的包裹做出虚假声明。 （仅适用于已送达但不在邮箱/门口的包裹。如果没有提供已送达物品的照片证据，我们可能会拒绝您的索赔。如果您的物品未显示已送达状态，请忽略此项。）","parcelImageNote":"上传1个支援的档案：图片。最大1 GB。","parcelAgreementText":"如果您确保包裹发生的情况属实，请点击「我同意」。","parcelAgreeCheckbox":"我同意","parcelSuccessMessage":"您的包裹查询已提交！我们将在3-5个工作日内回复。","parcelErrorMessage":"提交查询失败。请重试。","parcelGeneralError":"发生错误。请稍后重试。","parcelAlertWait":"请等待您的包裹送达。您可以在指定的等待期后提交此表单。","parcelAlertAgree":"请同意条款以提交表单。","parcelAlertCaseReference":"请提供来自当地邮局的案件参考编号，如果您来自新加坡，请填写NA。","parcelSubmitting":"提交中...","parcelSubmit":"提交","systemRequirementsTitle":"最低支持系统版本","contactRefundNote3":"请注意，对于通过 Payhip 的退款，如果您未收到退款，请联系您的银行或 Payhip 支持（support@payhip.com），因为我们无法控制该流程。","contactRefundNote2":"对于退货或更换，如果 maimai 手套在打开时已经使用（可见污渍或在洗衣机手洗中洗涤），我们不允许，并且不允许娱乐卡的退货或更换。谢谢。","contactRefundNote1":"如果您正在咨询您购买的平台的退货/退款，请注意我们对这些平台的退款没有任何控制权。请分别联系其客户服务。","parcelDisagreeCheckbox":"不同意","contactDisagreeCheckbox":"不同意","parcelEmailNote":"不接受私人中继电子邮件。请使用有效的电子邮件地址。","contactAgreementText1":"如果您同意 Rhythm Nexus 使用您的电子邮件地址回复您，请点击「我同意」，因为这是我们阅读您的回复并在找到解决方案后回复您所必需的。","contactParcelWarningEnd":"代替。","contactParcelWarningLink":"此表格","contactParcelWarning":"如果您的包裹超过18/30/45天未送达（FedEx为14天），或状态显示已送达但您未收到，请填写此表格。","contactEmailNote":"不接受私人中继电子邮件（例如 @privaterelay.appleid.com）。请使用有效的电子邮件地址。","contactPlatformShopee":"Shopee - 我 → 查看购买历史（或您可以点击待发货/待收货）","contactPlatformEbay":"eBay - 我的 eBay → 购买","contactPlatformEtsy":"Etsy - 您的个人资料右上角 → 购买","contactPlatformInstructions":"请使用应用程式查看您的订单号，因为它已保存在应用程式中：","contactPlatformNote":"Etsy、eBay 和 Shopee 订单号不在此处。我们对这些平台的退款没有任何控制权。请分别联系其客户服务。","systemRequirements":"Windows：Windows 7 (with ESU updates installed)或以上\\nmacOS：macOS 12或以上\\nAndroid：Android 13或以上\\niPhone/iOS：iOS 17或以上\\nLinux：当前受支持的发行版，具有主动安全更新","title":"验证访问","subtitle":"请完成以下挑战以继续。","selectLanguage":"选择语言","selectLanguagePlaceholder":"-- 选择一种语言 --","loadingChallenge":"正在加载挑战...","answerLabel":"您的答案：","answerPlaceholder":"输入您的答案","continueButton":"继续","refreshButton":"新挑战","verifying":"正在验证...","chooseLanguageFirst":"请先选择一种语言。","loadFailed":"加载挑战失败。请重试。","expiredChallenge":"挑战已过期。正在加载新挑战...","verifyFailed":"验证失败。请重试。","goodFridayEasterGreeting":"复活节快乐！祝您在耶稣受难日和复活节期间平安喜乐。","christmasGreeting":"圣诞快乐，新年快乐！祝您在12月25日至1月5日期间平安喜乐。","captchaSystemRequirements":"最低系统要求：Windows 7 (with ESU updates installed)或11，macOS 10.15+，或最新版本的Android/iOS。","home":"首页","blog":"博客","aboutUs":"关于我们","faq":"常见问题","contact":"联系我们","trackPackage":"追踪包裹","cnyYearOfHorseMessage":"🧧 新年快乐！祝您马年万事如意，阖家幸福！ 🐴","diwaliMessage":"🪔 排灯节快乐！愿光明节为您带来欢乐、繁荣和成功！ ✨","vesakMessage":"☸️ 卫塞节快乐！祝您在这神圣的日子获得平安、智慧和觉悟！ 🙏","vesakTHMessage":"☸️ 卫塞节快乐！祝您在这神圣的日子获得平安、智慧和觉悟！ 🙏","singaporeNationalDayMessage":"🇸🇬 新加坡国庆日快乐！庆祝独立61周年！ 🎉","indonesiaNationalDayMessage":"🇮🇩 印度尼西亚独立日快乐！印度尼西亚共和国万岁！ 🎊","malaysiaNationalDayMessage":"🇲🇾 马来西亚国庆日快乐！庆祝我们国家的独立！ 🎊","russiaDayOfRussiaMessage":"🇷🇺 С Днём России! 俄罗斯日快乐！ 🎉","taiwanFoundingDayMessage":"🇹🇼 台湾开国纪念日快乐！中华民国开国纪念日快乐！ 🎊","taiwanNationalDayMessage":"🇹🇼 台湾双十节快乐！国庆日快乐！ 🎉","hongKongHandoverDayMessage":"🇭🇰 香港特区成立纪念日快乐！香港特别行政区成立纪念日快乐！ 🎊","macauHandoverDayMessage":"🇲🇴 澳门特区成立纪念日快乐！澳门特别行政区成立纪念日快乐！ 🎉","laborDayMessage":"⚒️ 国际劳动者日快乐！庆祝劳动和劳工权益！ 🎊","laborDayUSCAMessage":"⚒️ 劳动节快乐！致敬劳工贡献！ 🎉","orderNumber":"订单号（示例：RTNX1234567890）","fromDate":"从日期（必需）","toDate":"至日期（必需）","trackParcel":"追踪包裹","selectCourier":"-- 选择快递/国家 --","optionSingPost":"🇸🇬 新加坡邮政 (SingPost)","singaporeCouriers":"新加坡快递商","topCountries":"前5个国家","otherCountries":"其他国家","note":"注意","disclaimer":"免责声明","importantInformation":"重要信息:","didNotReceiveEmail":"如果您没有收到来自Etsy、eBay、Shopee或Payhip的确认电子邮件，请向下滚动，通过与此订单关联的电子邮件地址或电话号码搜索您的订单。","searchByEmailOrPhone":"按电子邮件或电话搜索","searchOrder":"搜索订单","trackingResult":"追踪结果","noOrdersFound":"未找到订单。","pleaseEnter":"请输入电子邮件、电话号码或订单号。","fillAllFields":"请填写所有必填字段：跟踪号、目的地国家、订单号和邮政编码。","noOrderMatchingFields":"未找到与所有字段匹配的订单。","postcodeRequired":"此目的地需要邮政编码。","invalidUSZip":"无效的美国邮政编码。请使用5位数字或ZIP+4。","failedGenerateURL":"生成跟踪URL失败。请检查输入。","trackingValidationSG":"新加坡的跟踪号必须是：LG123456789SG、LP123456789SG、LT123456789SG、EZ123456789SG或PX123456789SG。 DHL快递请使用10位数字。","invalidSingPostFormat":"无效的SingPost跟踪号格式。 \\n可接受的格式：\\n• PP123456789SG → 预付费跟踪标签\\n• SPNDD00012345 → SpeedPost标准跟踪","welcomeTitle":"欢迎来到Rhythm Nexus网站！","purchaseInfo":"通过我们的官方渠道购买，或加入我们的","purchaseInfoChina":"请通过我们的官方渠道购买。","purchaseInfoChinaSuffix":"","telegramGroup":"Telegram群组","forUpdates":"获取官方更新。","ourStores":"我们的商店","etsyStore":"Etsy商店","ebayStore":"eBay商店","shopeeStore":"Shopee商店","payhipStore":"Payhip商店","internationalShipping":"国际运输","singaporeLocal":"新加坡本地","asiaOnly":"仅限亚洲","deliveryInfo":"配送信息","deliveryRates2026":"2026年配送费率","sgDeliveryRates":"新加坡配送费率","speedPostRates":"SpeedPost Express国际费率","aboutTitle":"关于Rhythm Nexus","aboutP1":"我们于2022年开设商店，并在Etsy、eBay和Shopee上销售。","aboutP2":"我们专注于可靠的履行和准确的追踪，建立了良好的声誉。","aboutP3":"我们的目标是提供流畅可信的购物体验。","aboutP4":"感谢您支持Rhythm Nexus。","faqTitle":"常见问题","faqQ1":"如果我的物品有缺陷怎么办？有什么保修吗？","faqA1":"是的！大多数订单都有一年的保修期。请提供您的发票/订单号，以便我们进行调查。注意：如果物品符合描述，即使您订购错误，也不允许退换货。","faqQ2":"我可以编辑、更新或取消我的订单吗？","faqA2":"可以。为了安全起见，订单更改可能需要通过电子邮件或我们的联系表处理。","faqQ3":"我必须支付海关/进口税吗？","faqA3":"关税和税款通常不预付，除了运往美国的 DDP。增值税可能适用于欧盟、英国、澳大利亚/新西兰、挪威、瑞士和加拿大省份，如萨斯喀彻温省和马尼托巴省，这些已经默认支付。新加坡不适用消费税。我们无法提供有关海关费用的建议——请联系当地海关了解详情。","faqQ4":"我的订单什么时候发货？","faqA4":"订单通常在 1-5 个工作日内发货。在高峰期，可能需要 5-7 天。","faqQ5":"我不小心订购了两次。我该怎么办？","faqA5":"我们只退还重复的运费。两件物品将一起发货。退款 =（第一笔运费 + 第二笔运费） – 实际运费。","faqQ6":"送货需要多长时间？","faqA6":"处理需要 1-5 个工作日。 \\n\\n国内运输：\\n• SingPost 预付费追踪标签：2-4 天\\n• SpeedPost 标准：1-3 天\\n\\n国际：\\n• SingPost ePAC：14-30 天\\n• SpeedPost Priority (EMS)：8-15 天\\n• SpeedPost Express：4-8 天\\n\\n旺季可能会出现延误。","faqQ7":"我的物品正在退回给发件人。我该怎么办？","faqA7":"允许重新发货一次。由于地址无效、包裹无人认领或未支付海关费用，无法取消。请联系您的邮政服务部门重新投递，或给我们留言寻求帮助。","faqQ8":"我的物品在运输途中丢失/被盗。","faqA8":"我们允许重新发货一次。如果再次丢失，将在快递员的投递窗口后全额退款：\\n\\n• 新加坡本地服务：7 天\\n• SingPost ePAC 和 SpeedPost Priority International：30 天\\n• SpeedPost Intl Express：14 天","blogTitle":"运输与邮政知识库","blogSubtitle":"关于邮政服务、关税、增值税的官方说明。","readMore":"阅读更多","backButton":"返回","copyrightText":"版权所有。","blogPost1Title":"什么是SingPost ePAC？","blogPost1Desc":"了解ePAC。","blogPost2Title":"什么是SpeedPost Priority International (EMS)？","blogPost2Desc":"了解EMS。","blogPost3Title":"什么是SpeedPost Express？","blogPost3Desc":"探索SpeedPost Express。","blogPost4Title":"美国PDDP","blogPost4Desc":"了解PDDP。","blogPost5Title":"欧盟增值税 & IOSS","blogPost5Desc":"欧盟增值税见解。","blogPost6Title":"英国增值税 & HMRC","blogPost6Desc":"英国增值税要求。","blogPost7Title":"挪威VOEC","blogPost7Desc":"挪威VOEC系统。","blogPost8Title":"瑞士增值税","blogPost8Desc":"瑞士增值税要求。","enterDestinationPostcode":"输入目的地邮编","trackingNumberExample":"例如：LG123456789SG","trackingCaseSensitive":"跟踪字母区分大小写，必须大写。","usaPostcodeNote":"对于没有邮政编码的国家/地区，例如香港和澳门，请输入 999077（香港）或 999078（澳门）。","epacDeliveryNote":"请注意，所有发送到目的地的 ePAC 物品都应送达到您的邮箱、家门口、包裹储物柜或留在安全的地方！","currentTime":"当前时间","timezoneNote":"时间以12小时格式显示","sameTimeAsSingapore":"与新加坡时间相同","hourAhead":"小时领先新加坡","hoursAhead":"小时领先新加坡","hourBehind":"小时落后新加坡","hoursBehind":"小时落后新加坡","countriesNoMailbox":"已知无法提供邮箱/信箱投递的国家/地区：文莱、中国、印度、以色列、中国澳门特别行政区、菲律宾、波兰和越南。","rhythmNexusNotResponsible":"Rhythm Nexus 不负责处理交付，因为这超出了我们的控制范围，我们更希望您跟踪您的物品状态。","issuesAfterDelivery":"交货后 30/45 天（SpeedPost Express 为 14 天）出现任何问题，或者状态显示已送达但您未收到，请联系我们","cannotUseEmbed":"我们无法使用嵌入进行跟踪，因为大多数邮政服务网站不支持它。","clickLinkAbove":"请点击上面的链接跟踪您的包裹。","trackingDetailsNote":"请注意，跟踪详细信息可能不会显示在搜索结果中，因此建议将跟踪号粘贴到系统中以跟踪该物品。","thirdPartyWebsites":"您也可以在这些第三方网站上跟踪您的包裹：","enterEmailOrPhone":"输入电子邮件或电话","collectAtPostOffice":"但是，如果您的国家/地区没有标准的邮箱，您将必须在邮局领取。","reviewShippingRates":"查看目前的运费","here":"这里","contactUsForm":"请通过此联系我们","form":"表格","forEnquiries":"如有任何关于订单的疑问。","anPostNoDirectTracking":"An Post（爱尔兰）不支持直接追踪链接或嵌入式追踪。","anPostPasteManually":"请在An Post网站上手动粘贴您的追踪号码。","goToAnPost":"前往An Post","countryMsgNL":"如果状态显示\\\"Held by Customs\\\"，请联系荷兰海关信息热线获得帮助：\\n0800 0143（免费），周一至周五上午7点至晚上11点。 \\n周六和周日上午8点至下午4点30分。 \\n\\n鼓励您在PostNL注册账户，以便即时接收包裹的推送通知：\\n\\nhttps://www.postnl.nl/campagnes/online-pakket-volgen/ \\n\\n如果它被递送到PostNL点或状态告诉您到邮局领取，您将必须在柜台支付7 EUR。如果在线支付，最多4 EUR。","countryMsgDE":"我们鼓励您下载Post & DHL应用程序，以接收包裹跟踪状态的推送通知：\\nhttps://www.deutschepost.de/de/p/post-und-dhl-app.html \\nDHL Paket GmbH客户服务联系方式：\\n+49-228-433-3112\\nDHL DE联系方式: https://www.dhl.de/de/geschaeftskunden/express/kontakt-express/telefon.html","countryMsgFI":"您需要向海关提交额外的进口申报。如果不这样做，可能导致入境限制和包裹被退回。 \\n更多信息: https://www.posti.fi/en/receiving/customs-clearance \\n其他链接: \\nhttps://tulli.fi/en/individuals/going-to-order-goods-from-abroad/ioss-number \\nhttps://tulli.fi/en/about-us/contact-information \\nhttps://asiointi.tulli.fi/asiointipalvelu/import/onboarding/1","countryMsgIE":"将收取4.95 EUR的处理费。 \\n在此下载应用程序: https://www.anpost.com/Post-Parcels/App","countryMsgPL":"将收取8.50 PLN的处理费。 \\n您将必须在邮局领取时支付，\\n因为包裹不太可能被送到您的家门口或信箱。","countryMsgPH":"PHLPost在菲律宾被认为是低效且不可靠的。 \\n请始终跟踪您的包裹，因为有时在途状态\\n只会在较小的包裹1至3周之间显示。对于较大的包裹，\\n只能通过马尼拉中央邮局或您所在地区最近的\\n邮局领取。请注意，对于任何价值的包裹，您都需要支付112PHP的处理费。未能支付将导致包裹\\n被退回给我们。由于PHLPost服务的缓慢，预计送达时间为1-2个月。 \\n价值低于10000PHP的物品无需缴税，但如果等于或超过该金额，则需要缴税。 \\n我们建议您下次向我们订购时使用SpeedPost Express以快速处理。但是，费用可能不适用，因为收件人的D&T是默认的。","countryMsgCA":"发往加拿大的所有订单的de minimis为20 CAD。由于新加坡是CPTPP协议的一部分，可能不会应用关税，但如果物品超过60 CAD及以上成00 CAD及以上的阀值，可能会应用D&T，这可能取决于物品的HS代码。超过该金额的任何价值都将相应地收取VAT。","countryMsgID":"您需要在抵达印度尼西亚时支付任何适用的税款和关税。请跟踪您的包裹并向印度尼西亚海关支付指定金额。 \\n您还需要提交额外的清关文件。如果不这样做，可能导致入境限制或包裹被国家海关扣留。请在此处查看进一步详细信息：\\nhttps://old.beacukai.go.id/web-apps/barangkiriman","countryMsgIN":"您需要在抵达印度时支付任何适用的税款和关税。请跟踪您的包裹并向印度海关支付指定金额。 \\n请注意，印度的海关清关很严格，如果您的物品价值超过1000 INR（15 USD），您可能会或可能不会被收取关税 - 这取决于HS代码，在大多数情况下它是免税的，但如果物品超过5000 INR（60 USD），您可能会被收取更高的关税。 \\n由于India Post不会标准地送到邮箱，您可能需要在家或授权代表来接收您的包裹或到邮局领取。","countryMsgMY":"发往马来西亚的所有订单的de minimis为500 MYR。超过该金额的订单可能会被收费。","countryMsgUS":"截至2025年8月29日，800美元的de minimis将正式废除，进口关税将默认由原产国的寄件人支付。 \\n发往美国的货物需要有效的电话号码和电子邮件地址，以避免包裹进一步延误。","countryMsgIL":"发往以色列的所有订单的de minimis为240 ILS（75 USD）。超过该金额的订单可能会被收费。 \\n请注意，对于发往以色列的订单，Israel Post有时可能不会在送达后确认最终送达。 \\n由于Israel Post不会标准地送到邮箱，您可能需要在家或授权代表来接收您的包裹或到邮局领取。","countryMsgGB":"请注意，对于发往英国的订单，Royal Mail有时可能不会在送到您的邮箱后确认最终送达。","countryMsgTH":"发往泰国的所有订单的de minimis为1500 THB（45 USD）。超过该金额的订单可能会被收费。","countryMsgTW":"发往台湾的所有订单的de minimis为2000 TWD（60 USD）。超过该金额的订单可能会被收费。","countryMsgMO":"发送到澳门时不收取D&T。但请注意，Macau Post不会标准地送到邮箱，您必须到邮局领取您的包裹。","countryMsgBN":"发送到文莱时不收取D&T。但请注意，Brunei Post不会标准地送到邮箱，您必须到邮局领取您的包裹。 \\n该国家的追踪系统不太稳定，只能提供有限的信息，并且不会向原产地提供最终送达结果。","countryMsgJP":"发往日本的所有订单的de minimis为10000 JPY（65 USD）。超过该金额的订单可能会被收费。","countryMsgKR":"发往韩国的所有订单的de minimis为180000 KRW（150 USD）。超过该金额的订单可能会被收费。","countryMsgVN":"对于越南，请在送达期间保持联系，因为您可能会在送达物品时被收取处理费。 \\n发往越南的所有订单的de minimis为1000000（35 USD）。超过该金额的订单可能会被收费。 \\n由于Vietnam Post不会标准地送到邮箱，您可能需要在家或授权代表来接收您的包裹或到邮局领取。","countryMsgPP":"Tracked Label物品将在邮局的POPDrop/POPStop投寄。 SpeedPost Standard物品通常在POPStop或POPStation投寄。 \\n请注意，Tracked Label物品的送达仅在周一至周五上午9点至下午6点进行。周末和公共假期除外。","postedDate":"投递日期:","status":"状态:","shippedVia":"发货方式:","destination":"目的地:","statusInPreparation":"准备中","statusInTransit":"运输中","statusDelivered":"已投递","statusOutForDelivery":"派送中","statusArrived":"已到达","statusProcessing":"处理中","statusDispatched":"已发出","statusReturned":"已退回","statusFailed":"投递失败","statusCancelled":"已取消","statusHeldByCustoms":"海关扣留","statusAwaitingCollection":"等待取件","aka":"又称","thisServiceKnownAs":"该服务称为","in":"在","viewTrackingDHL":"查看DHL Express的追踪信息","viewTrackingSingPostSpeedPost":"查看Singapore SpeedPost的追踪信息","viewTrackingDHLLastMile":"查看DHL Express（最后一英里）的追踪信息","viewTrackingDHLShipperRef":"查看DHL Express（发件人参考号）的追踪信息","viewTrackingSingPost":"查看Singapore Post的追踪信息","viewTrackingDestPost":"查看追踪信息：","post":"邮政","orderNumberExample":"订单编号（以RTNX或DLTB开头 - 示例：RTNX1234567890）:","deliveryRecordNote":"请注意，物品投递后，记录仅保存 7 天，之后将被删除。","copyrightAllRights":"版权所有。","countryAF":"阿富汗","countryAX":"奥兰群岛","countryAL":"阿尔巴尼亚","countryDZ":"阿尔及利亚","countryAS":"美属萨摩亚","countryAD":"安道尔","countryAO":"安哥拉","countryAI":"安圭拉","countryAQ":"南极洲","countryAG":"安提瓜和巴布达","countryAR":"阿根廷","countryAM":"亚美尼亚","countryAW":"阿鲁巴","countryAU":"🇦🇺 澳大利亚","countryAT":"🇦🇹 奥地利","countryAZ":"🇦🇿 阿塞拜疆","countryBS":"🇧🇸 巴哈马","countryBH":"🇧🇭 巴林","countryBD":"🇧🇩 孟加拉国","countryBB":"🇧🇧 巴巴多斯","countryBY":"🇧🇾 白俄罗斯","countryBE":"🇧🇪 比利时","countryBZ":"🇧🇿 伯利兹","countryBJ":"🇧🇯 贝宁","countryBM":"🇧🇲 百慕大","countryBT":"🇧🇹 不丹","countryBO":"🇧🇴 玻利维亚","countryBA":"🇧🇦 波斯尼亚和黑塞哥维那","countryBW":"🇧🇼 博茨瓦纳","countryBV":"🇧🇻 布韦岛","countryBR":"🇧🇷 巴西","countryIO":"🇮🇴 英属印度洋领地","countryBN":"🇧🇳 文莱达鲁萨兰国","countryBG":"🇧🇬 保加利亚","countryBF":"🇧🇫 布基纳法索","countryBI":"🇧🇮 布隆迪","countryKH":"🇰🇭 柬埔寨","countryCM":"🇨🇲 喀麦隆","countryCA":"🇨🇦 加拿大","countryCV":"🇨🇻 佛得角","countryKY":"🇰🇾 开曼群岛","countryCF":"🇨🇫 中非共和国","countryTD":"🇹🇩 乍得","countryCL":"🇨🇱 智利","countryCN":"🇨🇳 中国","countryCX":"🇨🇽 圣诞岛","countryCC":"🇨🇨 科科斯（基林）群岛","countryCO":"🇨🇴 哥伦比亚","countryKM":"🇰🇲 科摩罗","countryCG":"🇨🇬 刚果","countryCD":"🇨🇩 刚果民主共和国","countryCK":"🇨🇰 库克群岛","countryCR":"🇨🇷 哥斯达黎加","countryCI":"🇨🇮 科特迪瓦","countryHR":"🇭🇷 克罗地亚","countryCU":"🇨🇺 古巴","countryCY":"🇨🇾 塞浦路斯","countryCZ":"🇨🇿 捷克共和国","countryDK":"🇩🇰 丹麦","countryDJ":"🇩🇯 吉布提","countryDM":"🇩🇲 多米尼克","countryDO":"🇩🇴 多米尼加共和国","countryEC":"🇪🇨 厄瓜多尔","countryEG":"🇪🇬 埃及","countrySV":"🇸🇻 萨尔瓦多","countryGQ":"🇬🇶 赤道几内亚","countryER":"🇪🇷 厄立特里亚","countryEE":"🇪🇪 爱沙尼亚","countryET":"🇪🇹 埃塞俄比亚","countryFK":"🇫🇰 福克兰群岛","countryFO":"🇫🇴 法罗群岛","countryFJ":"🇫🇯 斐济","countryFI":"🇫🇮 芬兰","countryFR":"🇫🇷 法国","countryGF":"🇬🇫 法属圭亚那","countryPF":"🇵🇫 法属波利尼西亚","countryTF":"🇹🇫 法属南部领地","countryGA":"🇬🇦 加蓬","countryGM":"🇬🇲 冈比亚","countryGE":"🇬🇪 格鲁吉亚","countryDE":"🇩🇪 德国","countryGH":"🇬🇭 加纳","countryGI":"🇬🇮 直布罗陀","countryGR":"🇬🇷 希腊","countryGL":"🇬🇱 格陵兰","countryGD":"🇬🇩 格林纳达","countryGP":"🇬🇵 瓜德罗普","countryGU":"🇬🇺 关岛","countryGT":"🇬🇹 危地马拉","countryGG":"🇬🇬 根西","countryGN":"🇬🇳 几内亚","countryGW":"🇬🇼 几内亚比绍","countryGY":"🇬🇾 圭亚那","countryHT":"🇭🇹 海地","countryHM":"🇭🇲 赫德岛和麦克唐纳群岛","countryVA":"🇻🇦 梵蒂冈","countryHN":"🇭🇳 洪都拉斯","countryHK":"🇭🇰 香港","countryHU":"🇭🇺 匈牙利","countryIS":"🇮🇸 冰岛","countryIN":"🇮🇳 印度","countryID":"🇮🇩 印度尼西亚","countryIR":"🇮🇷 伊朗","countryIQ":"🇮🇶 伊拉克","countryIE":"🇮🇪 爱尔兰","countryIM":"🇮🇲 马恩岛","countryIL":"🇮🇱 以色列","countryIT":"🇮🇹 意大利","countryJM":"🇯🇲 牙买加","countryJP":"🇯🇵 日本","countryJE":"🇯🇪 泽西","countryJO":"🇯🇴 约旦","countryKZ":"🇰🇿 哈萨克斯坦","countryKE":"🇰🇪 肯尼亚","countryKI":"🇰🇮 基里巴斯","countryKP":"🇰🇵 朝鲜","countryKR":"🇰🇷 韩国","countryKW":"🇰🇼 科威特","countryKG":"🇰🇬 吉尔吉斯斯坦","countryLA":"🇱🇦 老挝","countryLV":"🇱🇻 拉脱维亚","countryLB":"🇱🇧 黎巴嫩","countryLS":"🇱🇸 莱索托","countryLR":"🇱🇷 利比里亚","countryLY":"🇱🇾 利比亚","countryLI":"🇱🇮 列支敦士登","countryLT":"🇱🇹 立陶宛","countryLU":"🇱🇺 卢森堡","countryMO":"🇲🇴 澳门","countryMK":"🇲🇰 北马其顿","countryMG":"🇲🇬 马达加斯加","countryMW":"🇲🇼 马拉维","countryMY":"🇲🇾 马来西亚","countryMV":"🇲🇻 马尔代夫","countryML":"🇲🇱 马里","countryMT":"🇲🇹 马耳他","countryMH":"🇲🇭 马绍尔群岛","countryMQ":"🇲🇶 马提尼克","countryMR":"🇲🇷 毛里塔尼亚","countryMU":"🇲🇺 毛里求斯","countryYT":"🇾🇹 马约特","countryMX":"🇲🇽 墨西哥","countryFM":"🇫🇲 密克罗尼西亚","countryMD":"🇲🇩 摩尔多瓦","countryMC":"🇲🇨 摩纳哥","countryMN":"🇲🇳 蒙古","countryME":"🇲🇪 黑山","countryMS":"🇲🇸 蒙特塞拉特","countryMA":"🇲🇦 摩洛哥","countryMZ":"🇲🇿 莫桑比克","countryMM":"🇲🇲 缅甸","countryNA":"🇳🇦 纳米比亚","countryNR":"🇳🇷 瑙鲁","countryNP":"🇳🇵 尼泊尔","countryNL":"🇳🇱 荷兰","countryAN":"🇦🇳 荷属安的列斯","countryNC":"🇳🇨 新喀里多尼亚","countryNZ":"🇳🇿 新西兰","countryNI":"🇳🇮 尼加拉瓜","countryNE":"🇳🇪 尼日尔","countryNG":"🇳🇬 尼日利亚","countryNU":"🇳🇺 纽埃","countryNF":"🇳🇫 诺福克岛","countryMP":"🇲🇵 北马里亚纳群岛","countryNO":"🇳🇴 挪威","countryOM":"🇴🇲 阿曼","countryPK":"🇵🇰 巴基斯坦","countryPW":"🇵🇼 帕劳","countryPS":"🇵🇸 巴勒斯坦","countryPA":"🇵🇦 巴拿马","countryPG":"🇵🇬 巴布亚新几内亚","countryPY":"🇵🇾 巴拉圭","countryPE":"🇵🇪 秘鲁","countryPH":"🇵🇭 菲律宾","countryPN":"🇵🇳 皮特凯恩","countryPL":"🇵🇱 波兰","countryPT":"🇵🇹 葡萄牙","countryPR":"波多黎各","countryQA":"卡塔尔","countryRE":"留尼汪","countryRO":"罗马尼亚","countryRU":"🇷🇺 俄罗斯","countryRW":"卢旺达","countrySH":"圣赫勒拿","countryKN":"圣基茨和尼维斯","countryLC":"圣卢西亚","countryPM":"圣皮埃尔和密克隆","countryVC":"圣文森特和格林纳丁斯","countryWS":"萨摩亚","countrySM":"圣马力诺","countryST":"圣多美和普林西比","countrySA":"沙特阿拉伯","countrySN":"塞内加尔","countryRS":"塞尔维亚","countrySC":"塞舌尔","countrySL":"🇸🇱 塞拉利昂","countrySG":"🇸🇬 新加坡","countrySK":"🇸🇰 斯洛伐克","countrySI":"🇸🇮 斯洛文尼亚","countrySB":"🇸🇧 所罗门群岛","countrySO":"🇸🇴 索马里","countryZA":"🇿🇦 南非","countryGS":"🇬🇸 南乔治亚和南桑威奇群岛","countryES":"🇪🇸 西班牙","countryLK":"斯里兰卡","countrySD":"苏丹","countrySR":"苏里南","countrySJ":"斯瓦尔巴和扬马延","countrySZ":"斯威士兰","countrySE":"🇸🇪 瑞典","countryCH":"🇨🇭 瑞士","countrySY":"🇸🇾 叙利亚","countryTW":"🇹🇼 台湾","countryTJ":"🇹🇯 塔吉克斯坦","countryTZ":"🇹🇿 坦桑尼亚","countryTH":"🇹🇭 泰国","countryTL":"🇹🇱 东帝汶","countryTG":"🇹🇬 多哥","countryTK":"🇹🇰 托克劳","countryTO":"🇹🇴 汤加","countryTT":"🇹🇹 特立尼达和多巴哥","countryTN":"🇹🇳 突尼斯","countryTR":"🇹🇷 土耳其","countryTM":"🇹🇲 土库曼斯坦","countryTC":"🇹🇨 特克斯和凯科斯群岛","countryTV":"🇹🇻 图瓦卢","countryUG":"🇺🇬 乌干达","countryUA":"🇺🇦 乌克兰","countryAE":"🇦🇪 阿联酋","countryGB":"🇬🇧 英国","countryUS":"🇺🇸 美国","countryUM":"🇺🇲 美国本土外小岛屿","countryUY":"🇺🇾 乌拉圭","countryUZ":"🇺🇿 乌兹别克斯坦","countryVU":"🇻🇺 瓦努阿图","countryVE":"🇻🇪 委内瑞拉","countryVN":"🇻🇳 越南","countryVG":"英属维尔京群岛","countryVI":"美属维尔京群岛","countryWF":"瓦利斯和富图纳","countryEH":"🇪🇭 西撒哈拉","countryYE":"🇾🇪 也门","countryZM":"🇿🇲 赞比亚","countryZW":"🇿🇼 津巴布韦","accessRestricted":"访问受限","vpnDetectedMessage":"检测到VPN使用。请禁用VPN以访问此服务。","contactSupportError":"如果您认为这是错误，请联系客服。","destinationNotAllowed":"从您的位置无法访问此目的地国家。请选择其他目的地。","epacUS":"头等国际包裹服务","epacCH":"优先优先级","epacGB":"国际履带式","epacMY":"国际跟踪/快递","epacCA":"国际入境快递","epacAU":"包装与追踪国际公司","epacNZ":"国际经济追踪","epacDE":"Warenpost 国际特费","epacFR":"带追踪的国际信件","epacNL":"国际数据包追踪","epacPL":"全球快递","epacBE":"国际优质入境","epacAT":"国际追踪包裹","epacIN":"国际追踪包裹","epacFI":"国际追踪信件","epacSE":"国际追踪信件","epacNO":"PRIME 快递","epacIT":"表达","epacIL":"表达","epacES":"国际轻型包裹","epacPT":"国际蓝色邮件","epacCZ":"来自国外的追踪货物","epacBN":"国际电子小包","epacCN":"国际电子小包","epacHK":"国际电子小包","epacID":"国际电子包裹","epacMO":"国际电子小包","epacPH":"国际追踪邮件","epacTW":"国际电子小包","epacTH":"国际电子小包","epacVN":"国际电子包裹（东盟包裹）","epacKR":"K包","epacJP":"国际电子小包轻装版","epacIE":"国际快递邮政","blogSingPostEPACContent1":"SingPost ePAC（ePacket）是一种经济实惠的国际电子商务轻型货物追踪邮政服务。","blogSingPostEPACContent2":"由目的地国家的国家邮政运营商配送，通常用于2公斤以下的包裹，尺寸限制为长+宽+高低于90厘米，长度不超过60厘米。","blogSingPostEPACContent3":"此选项最初仅由香港邮政与eBay中国共同提供，允许来自中国和香港的包裹以带有配送追踪的方式发送到美国，配送时无需任何签名。该服务在美国被称为USPS（United States Postal Service）First-Class Package International Service。","blogSingPostEPACContent4":"自2026年1月1日起，ePAC现在用于所有国家，以遵守强制性UPU法规，要求对包裹进行追踪，并将挂号物品限制为仅限文件。","blogSingPostEPACContent5":"追踪前缀：LG123456789SG | LP123456789SG | LT123456789SG","blogSpeedPostEMSContent1":"EMS是国际优质邮政快递服务，受到全球邮政运营商的优先考虑。","blogSpeedPostEMSContent2":"清关通常比标准邮件更快，但流程更严格，可全程追踪至配送。","blogSpeedPostEMSContent3":"在新加坡，这被称为SingPost的SpeedPost Priority International。","blogSpeedPostEMSContent4":"追踪前缀：EZ123456789SG","blogSpeedPostExpressContent1":"SpeedPost Express是快递级别的服务。","blogSpeedPostExpressContent2":"在许多目的地，DHL Express执行最后一公里配送并在放行前收取关税或税款。","blogSpeedPostExpressContent3":"追踪前缀：PX123456789SG（最后一公里DHL Express使用10位数追踪号码，该号码不对公众公开，但我们通过","blogSpeedPostExpressContent3Link":"追踪系统有相关信息。","blogUSPDDPContent1":"PDDP允许在配送前预付美国进口关税和税款，减少收件人的意外费用。","blogUSPDDPContent2":"新规定（2025年8月29日生效）","blogUSPDDPContent2List1":"强制性HTS代码","blogUSPDDPContent2List2":"准确的物品描述","blogUSPDDPContent2List3":"更严格的关税执行","blogUSPDDPContent3":"发送到美国的所有物品不会向收件人收取任何额外关税，因为我们代表您支付。但是，请注意，物品价格默认包含10%的进口费，以符合规定。","blogUSPDDPContent4":"这仅适用于我们发往美国的配送方式，SpeedPost Priority International（EMS）和SingPost ePAC。","blogEUIOSSContent1":"欧盟对所有商业进口征收增值税，无论价值如何。","blogEUIOSSContent2":"IOSS（Import One-Stop Shop）","blogEUIOSSContent3":"IOSS允许卖家在结账时为最高150欧元的货物收取欧盟增值税。","blogEUIOSSContent4":"然后通过IOSS系统汇出增值税，实现更快的清关且配送时无需收取增值税。","blogEUIOSSContent5":"对于通过Etsy或eBay的所有订单，IOSS增值税已在结账时收取，我们将在税务参考号上标明，以通过EDI（Electronic Data Interchange）将数据传输到目的地邮政服务。","blogUKVATContent1":"英国要求对进口商品进行增值税核算。","blogUKVATContent2":"对于低价值货物，增值税通常在结账时收取，并由卖家或市场直接汇给HMRC。","blogUKVATContent3":"对于较高价值的货物，增值税可能在配送前由承运人收取。","blogUKVATContent4":"对于通过Etsy或eBay的所有订单，增值税已在结账时收取，我们将在税务参考号上标明，以通过EDI（Electronic Data Interchange）将数据传输到目的地邮政服务。","blogNorwayVOECContent1":"挪威为从欧盟/欧洲经济区以外进口的商品引入了VOEC（VAT on E-Commerce）系统。这适用于价值高达3,000挪威克朗的商品。","blogNorwayVOECContent2":"卖家可以注册VOEC计划，在结账时收取挪威增值税，从而实现更快的清关且配送时无需收取增值税。","blogNorwayVOECContent3":"对于通过Etsy或eBay的所有订单，VOEC增值税已在结账时收取。追踪和海关文件标明税务参考号，以将数据传输到挪威邮政服务。","blogSwissVATContent1":"瑞士对进口商品征收增值税，无论价值如何。瑞士联邦海关管理局要求外国卖家在结账时为最高65瑞士法郎的商品收取增值税。","blogSwissVATContent2":"在瑞士增值税系统注册的卖家直接汇出收取的增值税，确保收件人在配送时不会产生额外的增值税费用。","blogSwissVATContent3":"对于通过Etsy或eBay的所有订单，瑞士增值税已在结账时收取，海关文件包含用于EDI提交的税务参考号。","dhlNoEmbed":"DHL Express不支持通过嵌入方式进行跟踪。请","speedPostNoEmbed":"SpeedPost新加坡不支持通过嵌入方式进行跟踪。请","operatorNoEmbed":"不支持通过嵌入方式进行跟踪。请","clickHere":"点击此处","toTrackNewTab":"进行跟踪（在新标签页中打开）。","russiaServiceSuspended":"⚠️ 重要通知：鉴于2022年俄罗斯入侵乌克兰，新加坡邮政已与DHL一起暂停所有运往俄罗斯的货物。在宣布恢复对该国的服务之前，我们目前不为俄罗斯提供服务。","hariRayaMessage":"🌙开斋节快乐！祝您及家人平安、喜乐、吉祥！ 🌟","deepavaliMessage":"🪔 屠妖节快乐！愿排灯节为您带来欢乐、繁荣、成功！ ✨","australiaNationalDayMessage":"🇦🇺 澳大利亚国庆日快乐！庆祝我们的国家！ 🎉","canadaNationalDayMessage":"🇨🇦 加拿大国庆日快乐！庆祝我们伟大的祖国！ 🍁","usaNationalDayMessage":"🇺🇸 美国，独立日快乐！庆祝自由和自由！ 🎆","franceBastilleDayMessage":"🇫🇷 Joyeux 14 Juillet！法国万岁！ 🎊","germanyUnityDayMessage":"🇩🇪德国统一日快乐！标记德国统一！ 🎉","italyRepublicDayMessage":"🇮🇹 共和节快乐！ 🇮🇹","spainNationalDayMessage":"🇪🇸¡西班牙快乐！ 🎊","japanFoundationDayMessage":"🇯🇵 日本建国纪念日快乐！ 建国记念の日おめでとうございます！ 🎌","chinaNationalDayMessage":"🇨🇳 中国国庆节快乐！ 国庆节快乐！ 🎉","koreaLiberationDayMessage":"🇰🇷韩国，光复节快乐！ 광복절 축하합니다！ 🎊","indiaIndependenceDayMessage":"🇮🇳印度，独立日快乐！贾伊·欣德！ 🇮🇳","thailandNationalDayMessage":"🇹🇭泰国国庆节快乐！ สุขสันต์วันชาติไทย！ 🎉","philippinesIndependenceDayMessage":"🇵🇭 菲律宾，独立日快乐！马布海！ 🇵🇭","vietnamNationalDayMessage":"🇻🇳越南国庆节快乐！越南国庆！ 🎊","polandNationalDayMessage":"🇵🇱 波兰，独立日快乐！ Święto Niepodległości！ 🎉","czechNationalDayMessage":"🇨🇿 捷克共和国，独立日快乐！ Den nezávislosti！ 🎊","netherlandsKingsDayMessage":"🇳🇱Fijne Koningsdag！国王万岁！ 🧡","norwayConstitutionDayMessage":"🇳🇴Gratulerer med dagen，挪威！ 🇳🇴","swedenNationalDayMessage":"🇸🇪 很高兴瑞典国家队！ 🇸🇪","finlandIndependenceDayMessage":"🇫🇮 Hyvää itsenäisyyspäivää，Suomi！ 🇫🇮","portugalNationalDayMessage":"🇵🇹葡萄牙快乐！ 🇵🇹","israelIndependenceDayMessage":"🇮🇱我好极了！以色列，独立日快乐！ 🎉","irelandNationalDayMessage":"🇮🇪爱尔兰圣帕特里克节快乐！ Lá Fhéile Pádraig sona duit！ 🍀","bruneiNationalDayMessage":"🇧🇳 祝文莱一切顺利！ 🎊","newZealandWaitangiDayMessage":"🇳🇿新西兰怀唐伊日快乐！ 🎉","switzerlandNationalDayMessage":"🇨🇭瑞士国庆节快乐！瑞士国家节日！ 🎊","austriaNationalDayMessage":"🇦🇹Froher Nationalfeiertag，奥地利！ 🎉","belgiumNationalDayMessage":"🇧🇪Joyeuse Fête Nationale，比利时！全国狂欢节！ 🎊","temporaryClosureNoticeTitle":"Rhythm Nexus - 临时停业通知","temporaryClosureNoticeBody":"尊敬的客户：\n\n请注意，由于公司活动，Rhythm Nexus 将于 2026年3月21日 至 2026年3月26日 暂时停业。\n\n为准备停业，店铺将于 2026年3月20日 下午3:00（UTC +8）起进入假期模式。该时间之后下的订单，可能要等到我们恢复营业后才会处理。\n\n正常营业将于 2026年3月27日 恢复。\n\n对由此造成的不便，我们深表歉意，并感谢您的理解与持续支持。\n\n谢谢。\n\nRhythm Nexus","temporaryClosureNoticeClose":"我已了解","parcelTracking":"包裹追踪","serviceAnnouncement":"服务公告","usaWinterStormTitle":"紧急：严重冬季风暴 - 服务中断","usaWinterStormSubtitle":"美国邮政服务公司（USPS）不可抗力事件","usaWinterStormNotice1":"由于自2026年2月23日以来影响纽约地区的严重冬季风暴：","usaWinterStormNotice2":"肯尼迪国际机场的国际运营已实际停止","usaWinterStormNotice3":"据报告，大范围航班取消和机场服务重大中断","usaWinterStormNotice4":"这些条件构成超出USPS控制范围的不可抗力事件","usaWinterStormNotice5":"服务影响:","usaWinterStormNotice6":"大雪、冻雨、冰粒和严寒的危险混合","usaWinterStormNotice7":"据报告大规模中断和普遍停电","usaWinterStormNotice8":"国内外邮件（信件、包裹和EMS物品）的收集和递送受到影响","usaWinterStormNotice9":"受影响的邮编区域:","usaWinterStormNotice10":"06000–06999、01000–02799、03900–04999、03000–03899、07000–08999、10001–14925、15000–19699、02800–02999、05000–05999、20001–20020、20100–24699、04699、35000–36999","usaWinterStormNotice11":"USPS正在采取一切必要措施以最大限度地减少对客户的不便，同时确保员工安全。我们感谢您在此不可抗力事件期间的耐心和理解。","usaWinterStormNotice12":"最后更新：2026年2月25日","countryAutoDetected":"目的地已根据您的位置预先设置","countryAutoDetectedFromLink":"目的地已通过链接预先设置","trackingNumber":"追踪号码","destinationCountry":"目的地国家","postcode":"邮政编码","australianDSTTitle":"澳大利亚夏令时有效","australianDSTBothMessage":"AEDT（澳大利亚东部夏令时间）和 ACDT（澳大利亚中部夏令时间）目前均有效。","australianAEDTMessage":"AEDT（澳大利亚东部夏令时间）目前对悉尼、墨尔本及周边地区生效。","australianACDTMessage":"ACDT（澳大利亚中部夏令时间）目前对阿德莱德和南澳大利亚生效。","australianDSTNote":"上面显示的交货时间反映的是当前夏令时。","filteredAllowedDestinations":"（筛选出您允许的目的地）","loadingAnnouncements":"正在加载公告...","unableToLoadAnnouncements":"目前无法加载服务公告。","viewOnSingPostWebsite":"在新加坡邮政网站上查看 →","postalContactsTitle":"邮政服务联系方式","postalContactsNote":"注意：","postalContactsPolandUKNote":"对于波兰和英国，所有通过SpeedPost Priority（EMS）发送的物品将由Pocztex和Parcelforce处理。","postalContactsDHLNote":"对于SpeedPost Express货运，请通过此链接联系DHL：","postalContactsCountry":"国家","postalContactsWebsite":"网站","postalContactsForm":"联系表格","postalContactsPhone":"联系电话","postalContactsEmail":"联系邮箱","postalContactsFormLink":"联系表格","postalContactsBackButton":"返回包裹查询表","statusHeldByCustms":"被海关扣留","lookalikeDomainWarning":"这不是追踪号码，而是冒充快递公司的网站链接。请勿在该网站输入个人信息或付款信息。","lookalikeDomainOfficial":"官方网站："};
@@ -0,0 +1,29 @@
+// Reader for i18n bundles written with `--format interned` by
+// scripts/generate_parcel_scams_i18n.py: `strings` is a shared pool and each
+// locale is an array of pool indices aligned with `keys` (a list of indices
+// for list values, null when the locale lacks the key). Decoded tables point
+// at the pool's strings, so memory grows with unique strings, not locales x keys.
+
+const decodeValue = (strings, ref) => (Array.isArray(ref) ? ref.map((i) => strings[i]) : strings[ref]);
+
+export const decodeLocale = (data, lang) => {
+  const refs = data.locales[lang];
+  if (!refs) return undefined;
+  const table = {};
+  for (let i = 0; i < data.keys.length; i += 1) {
+    if (refs[i] !== null && refs[i] !== undefined) table[data.keys[i]] = decodeValue(data.strings, refs[i]);
+  }
+  return table;
+};
+
+// Decodes each locale on first use and keeps it.
+export const createInternedReader = (data) => {
+  const decoded = {};
+  return {
+    locales: Object.keys(data.locales),
+    get: (lang) => {
+      if (!(lang in decoded)) decoded[lang] = decodeLocale(data, lang);
+      return decoded[lang];
+    },
+  };
+};
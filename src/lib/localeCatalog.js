@@ -0,0 +1,32 @@
+// Code-split catalogs generated by scripts/generate_parcel_scams_i18n.py into
+// src/i18n/<catalog>/: like the ui packs in LanguageContext, English is bundled
+// (first paint and fallback) and every other locale is downloaded on first use.
+import { negotiateLocale } from './negotiateLocale';
+
+export const createLocaleCatalog = (catalog, en, loaders) => {
+  const packs = { en };
+  const pending = {};
+  const resolve = (language) => negotiateLocale(catalog, language);
+  return {
+    // The pack for `language` once loaded, English until then.
+    get: (language) => packs[resolve(language)] || en,
+    // Resolves to the pack for `language`; a failed download gives English and is retried next time.
+    load: (language) => {
+      const lang = resolve(language);
+      if (packs[lang] || !loaders[lang]) return Promise.resolve(packs[lang] || en);
+      if (!pending[lang]) {
+        pending[lang] = loaders[lang]().then(
+          (module) => {
+            packs[lang] = module.default;
+            return module.default;
+          },
+          () => {
+            delete pending[lang];
+            return en;
+          },
+        );
+      }
+      return pending[lang];
+    },
+  };
+};
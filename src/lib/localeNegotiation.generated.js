@@ -0,0 +1,246 @@
+// Generated by scripts/generate_parcel_scams_i18n.py from scripts/data/locale-aliases.json and the catalog locales. Do not edit by hand.
+export const DEFAULT_LOCALE = "en";
+
+// Lowercase BCP-47 tag or alias -> compiled locale, per catalog.
+export const LOCALE_TABLES = {
+  "parcel-scams": {
+    "cs": "cs",
+    "cy": "cy",
+    "de": "de",
+    "en": "en",
+    "es": "es",
+    "fi": "fi",
+    "fr": "fr",
+    "ga": "ga",
+    "he": "he",
+    "hi": "hi",
+    "id": "id",
+    "it": "it",
+    "ja": "ja",
+    "ko": "ko",
+    "mi": "mi",
+    "ms": "ms",
+    "nl": "nl",
+    "no": "no",
+    "pl": "pl",
+    "pt": "pt",
+    "ru": "ru",
+    "sv": "sv",
+    "ta": "ta",
+    "th": "th",
+    "tl": "tl",
+    "vi": "vi",
+    "yue": "yue",
+    "zh": "zh",
+    "zh-hant": "zh-hant",
+    "fil": "tl",
+    "in": "id",
+    "iw": "he",
+    "nb": "no",
+    "nn": "no",
+    "zh-cn": "zh",
+    "zh-hans": "zh",
+    "zh-hans-cn": "zh",
+    "zh-hans-sg": "zh",
+    "zh-hant-hk": "yue",
+    "zh-hant-mo": "yue",
+    "zh-hant-tw": "zh-hant",
+    "zh-hk": "yue",
+    "zh-mo": "yue",
+    "zh-sg": "zh",
+    "zh-tw": "zh-hant",
+    "zh-yue": "yue"
+  },
+  "ui": {
+    "cs": "cs",
+    "cy": "cy",
+    "de": "de",
+    "en": "en",
+    "es": "es",
+    "fi": "fi",
+    "fr": "fr",
+    "ga": "ga",
+    "he": "he",
+    "hi": "hi",
+    "id": "id",
+    "it": "it",
+    "ja": "ja",
+    "ko": "ko",
+    "mi": "mi",
+    "ms": "ms",
+    "nl": "nl",
+    "no": "no",
+    "pl": "pl",
+    "pt": "pt",
+    "ru": "ru",
+    "sv": "sv",
+    "ta": "ta",
+    "th": "th",
+    "tl": "tl",
+    "vi": "vi",
+    "yue": "yue",
+    "zh": "zh",
+    "zh-hant": "zh-hant",
+    "fil": "tl",
+    "in": "id",
+    "iw": "he",
+    "nb": "no",
+    "nn": "no",
+    "zh-cn": "zh",
+    "zh-hans": "zh",
+    "zh-hans-cn": "zh",
+    "zh-hans-sg": "zh",
+    "zh-hant-hk": "yue",
+    "zh-hant-mo": "yue",
+    "zh-hant-tw": "zh-hant",
+    "zh-hk": "yue",
+    "zh-mo": "yue",
+    "zh-sg": "zh",
+    "zh-tw": "zh-hant",
+    "zh-yue": "yue"
+  },
+  "rates": {
+    "cs": "cs",
+    "cy": "cy",
+    "de": "de",
+    "en": "en",
+    "es": "es",
+    "fi": "fi",
+    "fr": "fr",
+    "ga": "ga",
+    "he": "he",
+    "hi": "hi",
+    "id": "id",
+    "it": "it",
+    "ja": "ja",
+    "ko": "ko",
+    "mi": "mi",
+    "ms": "ms",
+    "nl": "nl",
+    "no": "no",
+    "pl": "pl",
+    "pt": "pt",
+    "ru": "ru",
+    "sv": "sv",
+    "ta": "ta",
+    "th": "th",
+    "tl": "tl",
+    "vi": "vi",
+    "zh": "zh",
+    "zh-hant": "zh-hant",
+    "yue": "zh-hant",
+    "fil": "tl",
+    "in": "id",
+    "iw": "he",
+    "nb": "no",
+    "nn": "no",
+    "zh-cn": "zh",
+    "zh-hans": "zh",
+    "zh-hans-cn": "zh",
+    "zh-hans-sg": "zh",
+    "zh-hant-hk": "zh-hant",
+    "zh-hant-mo": "zh-hant",
+    "zh-hant-tw": "zh-hant",
+    "zh-hk": "zh-hant",
+    "zh-mo": "zh-hant",
+    "zh-sg": "zh",
+    "zh-tw": "zh-hant",
+    "zh-yue": "zh-hant"
+  },
+  "policy": {
+    "cs": "cs",
+    "cy": "cy",
+    "de": "de",
+    "en": "en",
+    "es": "es",
+    "fi": "fi",
+    "fr": "fr",
+    "ga": "ga",
+    "he": "he",
+    "hi": "hi",
+    "id": "id",
+    "it": "it",
+    "ja": "ja",
+    "ko": "ko",
+    "mi": "mi",
+    "ms": "ms",
+    "nl": "nl",
+    "no": "no",
+    "pl": "pl",
+    "pt": "pt",
+    "ru": "ru",
+    "sv": "sv",
+    "ta": "ta",
+    "th": "th",
+    "tl": "tl",
+    "vi": "vi",
+    "zh": "zh",
+    "zh-hant": "zh-hant",
+    "yue": "zh-hant",
+    "fil": "tl",
+    "in": "id",
+    "iw": "he",
+    "nb": "no",
+    "nn": "no",
+    "zh-cn": "zh",
+    "zh-hans": "zh",
+    "zh-hans-cn": "zh",
+    "zh-hans-sg": "zh",
+    "zh-hant-hk": "zh-hant",
+    "zh-hant-mo": "zh-hant",
+    "zh-hant-tw": "zh-hant",
+    "zh-hk": "zh-hant",
+    "zh-mo": "zh-hant",
+    "zh-sg": "zh",
+    "zh-tw": "zh-hant",
+    "zh-yue": "zh-hant"
+  },
+  "spam": {
+    "cs": "cs",
+    "cy": "cy",
+    "de": "de",
+    "en": "en",
+    "es": "es",
+    "fi": "fi",
+    "fr": "fr",
+    "ga": "ga",
+    "he": "he",
+    "hi": "hi",
+    "id": "id",
+    "it": "it",
+    "ja": "ja",
+    "ko": "ko",
+    "mi": "mi",
+    "ms": "ms",
+    "nl": "nl",
+    "no": "no",
+    "pl": "pl",
+    "pt": "pt",
+    "ru": "ru",
+    "sv": "sv",
+    "ta": "ta",
+    "th": "th",
+    "tl": "tl",
+    "vi": "vi",
+    "zh": "zh",
+    "zh-hant": "zh-hant",
+    "yue": "zh-hant",
+    "fil": "tl",
+    "in": "id",
+    "iw": "he",
+    "nb": "no",
+    "nn": "no",
+    "zh-cn": "zh",
+    "zh-hans": "zh",
+    "zh-hans-cn": "zh",
+    "zh-hans-sg": "zh",
+    "zh-hant-hk": "zh-hant",
+    "zh-hant-mo": "zh-hant",
+    "zh-hant-tw": "zh-hant",
+    "zh-hk": "zh-hant",
+    "zh-mo": "zh-hant",
+    "zh-sg": "zh",
+    "zh-tw": "zh-hant",
+    "zh-yue": "zh-hant"
+  }
+};
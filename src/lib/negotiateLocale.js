@@ -0,0 +1,16 @@
+import { DEFAULT_LOCALE, LOCALE_TABLES } from './localeNegotiation.generated';
+
+// Resolve a language tag (any case, `-` or `_`) to a locale of `catalog`. Known
+// tags and aliases are a single table lookup; unknown regional tags drop
+// subtags from the end (`de-CH` -> `de`) before giving up with `fallback`.
+export function negotiateLocale(catalog, input, fallback = DEFAULT_LOCALE) {
+  const table = LOCALE_TABLES[catalog];
+  let tag = String(input || '').toLowerCase().replace(/_/g, '-');
+  while (tag) {
+    const locale = table[tag];
+    if (locale) return locale;
+    const cut = tag.lastIndexOf('-');
+    tag = cut > 0 ? tag.slice(0, cut) : '';
+  }
+  return fallback;
+}
@@ -0,0 +1,13 @@
+// Host of a domain or URL as typed: scheme, path, query, user info, port, a
+// trailing dot and `www.` are dropped. normalize_host in
+// scripts/i18n_build/typosquat.py mirrors it for the build-time checks.
+export const normalizeHost = (input) => String(input || '')
+  .trim()
+  .toLowerCase()
+  .replace(/^[a-z][a-z0-9+.-]*:\/\//, '')
+  .split(/[/?#]/)[0]
+  .split('@')
+  .pop()
+  .split(':')[0]
+  .replace(/\.$/, '')
+  .replace(/^www\./, '');
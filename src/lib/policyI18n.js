@@ -1,387 +1,14 @@
+import en from '../i18n/policy/en';
+import { loaders } from '../i18n/policy';
+import { createLocaleCatalog } from './localeCatalog';
+import { useLocaleCatalog } from './useLocaleCatalog';
+
 const COMPANY_NAME = 'Rhythm Nexus';
 const COMPANY_EMAIL = 'rhythmnexusco@gmail.com';
 const COMPANY_PHONE = '+65 8835 2089';
 
-const POLICY_TRANSLATIONS = {
-  "en": {
-    "navTerms": "Terms",
-    "navPrivacy": "Privacy",
-    "termsTitle": "Terms of Service",
-    "privacyTitle": "Privacy Policy",
-    "updated": "Last updated: 24 February 2026",
-    "termsText": "These Terms of Service (\"Terms\") govern your access to and use of the e-commerce services offered through https://rhythmnexus.org (\"Website\") operated by Rhythm Nexus (\"we\", \"us\", or \"our\"). By accessing, browsing, or purchasing from the Website, you agree to be bound by these Terms. If you do not agree, you may not use the Website or place an order. ||| You must be at least 18 years old or the age of majority in your jurisdiction to purchase products from this Website. By placing an order, you represent and warrant that you meet this requirement. ||| You may be asked to create an account to make a purchase. You agree to provide accurate, current, and complete information. You are responsible for safeguarding your account credentials. You must notify us immediately of any unauthorized use. We may terminate or suspend your account at any time for violations of these Terms. ||| We strive to display product information accurately, but we do not warrant that product descriptions or other content are error-free. ||| Prices are shown in United States Dollar (USD) and include applicable taxes where required by law. We may change prices at any time before you place an order. ||| Your order is an offer to buy. Acceptance occurs when we confirm your order by email, or when we ship the products, whichever happens first. We may decline or cancel orders for reasons including incorrect pricing, out-of-stock products, or suspected fraud. ||| We accept the payment methods shown during checkout. By submitting payment details, you authorize us to charge the amount due and confirm you are the rightful account holder. We use third-party payment processors to securely handle payment information. ||| Shipping estimates are provided for convenience and do not guarantee delivery dates. Once products are transferred to a carrier, risk of loss passes to you. You are responsible for customs duties and import taxes, and for delivery errors caused by incorrect address information. ||| If you reside in the EU, EEA, or Switzerland, you have the legal right to return products within 14 days of receipt for a full refund. Products must be returned in original condition. Return shipping may be at your cost as allowed by law. Digital products may be excluded if the download begins with your consent and you acknowledge loss of right of withdrawal. ||| Return eligibility for US customers is outlined in our separate Return & Refund Policy posted on the Website. Some items (e.g., digital downloads, personalized items) may be non-refundable. ||| If you purchase digital items, delivery is electronic, you are granted a personal non-exclusive license to use the content, and you may not redistribute, resell, or share downloads without permission. ||| All Website content (text, designs, software, graphics, images) is owned by or licensed to Rhythm Nexus and protected by copyright and intellectual property laws. You may not reproduce, modify, distribute, or create derivative works without written permission.",
-    "privacyText": "Rhythm Nexus (\"we\", \"us\", or \"our\") respects your privacy and is committed to protecting your personal data. This Privacy Policy explains what personal data we collect, how it is used, who we share it with, and your rights. This policy applies to users from the EU, EEA, Switzerland, and the USA. ||| We collect the personal information you voluntarily provide, including name, email address, billing and shipping address, phone number, and payment information handled by third-party processors. ||| We automatically collect IP address, browser type, device data, usage data, cookies, and tracking technologies. ||| If you are in the EU/EEA/Switzerland, we process your data based on contract performance (order fulfillment), legal obligation, legitimate interests, and consent where required. ||| We use your data to process orders, ship products, communicate with you, provide customer support, comply with legal obligations, improve our Website, and send marketing communications with consent. ||| We may share your data with payment processors, shipping partners, analytics providers, marketing service providers, and legal authorities when required. We do not sell personal data. ||| EU/EEA/Swiss users have GDPR rights to access personal data, correct inaccurate data, erase data, restrict processing, object to processing, port data, and withdraw consent. To exercise these rights, contact us at rhythmnexusco@gmail.com. ||| USA users (CCPA/CPRA, where applicable) may have rights to know what personal data is collected, request deletion, opt-out of data sharing, and non-discrimination for exercising rights. To submit requests, email rhythmnexusco@gmail.com. ||| We retain personal data as long as necessary to fulfill orders, comply with legal requirements, and resolve disputes. ||| We may transfer data outside of your region. When transferring from the EU/EEA/Switzerland, we use Standard Contractual Clauses (SCCs) and other lawful safeguards. ||| We implement reasonable technical and organizational safeguards including SSL encryption, secure payment systems, and access control measures. However, no system is 100% secure."
-  },
-  "de": {
-    "navTerms": "Bedingungen",
-    "navPrivacy": "Privatsphäre",
-    "termsTitle": "Nutzungsbedingungen",
-    "privacyTitle": "Datenschutzrichtlinie",
-    "updated": "Letzte Aktualisierung: 24. Februar 2026",
-    "termsText": "Diese Nutzungsbedingungen („Bedingungen“) regeln Ihren Zugriff auf und Ihre Nutzung der E-Commerce-Dienste, die über https://rhythmnexus.org („Website“) angeboten werden, das von Rhythm Nexus („wir“, „uns“ oder „unser“) betrieben wird. Indem Sie auf die Website zugreifen, sie durchsuchen oder dort einkaufen, erklären Sie sich mit diesen Bedingungen einverstanden. Wenn Sie nicht einverstanden sind, dürfen Sie die Website nicht nutzen oder eine Bestellung aufgeben. ||| Sie müssen mindestens 18 Jahre alt oder in Ihrem Land volljährig sein, um Produkte von dieser Website kaufen zu können. Indem Sie eine Bestellung aufgeben, erklären und garantieren Sie, dass Sie diese Anforderung erfüllen. ||| Möglicherweise werden Sie aufgefordert, ein Konto zu erstellen, um einen Kauf zu tätigen. Sie verpflichten sich, genaue, aktuelle und vollständige Informationen bereitzustellen. Sie sind für den Schutz Ihrer Kontodaten verantwortlich. Sie müssen uns jede unbefugte Nutzung unverzüglich mitteilen. Bei Verstößen gegen diese Bedingungen können wir Ihr Konto jederzeit kündigen oder sperren. ||| Wir sind bestrebt, Produktinformationen korrekt anzuzeigen, übernehmen jedoch keine Garantie dafür, dass Produktbeschreibungen oder andere Inhalte fehlerfrei sind. ||| Die Preise werden in US-Dollar (USD) angezeigt und beinhalten die anfallenden Steuern, sofern gesetzlich vorgeschrieben. Wir können die Preise jederzeit ändern, bevor Sie eine Bestellung aufgeben. ||| Bei Ihrer Bestellung handelt es sich um ein Kaufangebot. Die Annahme erfolgt, wenn wir Ihre Bestellung per E-Mail bestätigen oder wenn wir die Produkte versenden, je nachdem, was zuerst eintritt. Wir können Bestellungen aus Gründen wie falschen Preisen, nicht vorrätigen Produkten oder Verdacht auf Betrug ablehnen oder stornieren. ||| Wir akzeptieren die beim Bezahlvorgang angezeigten Zahlungsmethoden. Durch die Übermittlung Ihrer Zahlungsdaten ermächtigen Sie uns, den fälligen Betrag abzubuchen und bestätigen, dass Sie der rechtmäßige Kontoinhaber sind. Wir nutzen Zahlungsabwickler von Drittanbietern, um Zahlungsinformationen sicher zu verarbeiten. ||| Versandschätzungen werden der Einfachheit halber bereitgestellt und stellen keine Garantie für Liefertermine dar. Sobald die Produkte an einen Spediteur übergeben werden, geht das Verlustrisiko auf Sie über. Sie sind für Zölle und Einfuhrsteuern sowie für Lieferfehler verantwortlich, die durch falsche Adressangaben verursacht werden. ||| Wenn Sie in der EU, im EWR oder in der Schweiz wohnen, haben Sie das gesetzliche Recht, Produkte innerhalb von 14 Tagen nach Erhalt gegen eine vollständige Rückerstattung zurückzugeben. Produkte müssen im Originalzustand zurückgegeben werden. Sofern gesetzlich zulässig, kann der Rückversand auf Ihre Kosten erfolgen. Ein Ausschluss digitaler Produkte ist möglich, wenn der Download mit Ihrer Einwilligung beginnt und Sie den Verlust des Widerrufsrechts anerkennen. ||| Die Rückgabeberechtigung für US-Kunden ist in unserer separaten Rückgabe- und Rückerstattungsrichtlinie beschrieben, die auf der Website veröffentlicht ist. Einige Artikel (z. B. digitale Downloads, personalisierte Artikel) sind möglicherweise nicht erstattungsfähig. ||| Wenn Sie digitale Artikel kaufen, erfolgt die Lieferung elektronisch, Sie erhalten eine persönliche, nicht ausschließliche Lizenz zur Nutzung der Inhalte und dürfen Downloads ohne Genehmigung nicht weiterverbreiten, weiterverkaufen oder teilen. ||| Der gesamte Inhalt der Website (Texte, Designs, Software, Grafiken, Bilder) ist Eigentum von Rhythm Nexus oder an Rhythm Nexus lizenziert und durch Urheberrechte und Gesetze zum Schutz des geistigen Eigentums geschützt. Sie dürfen ohne schriftliche Genehmigung keine reproduzieren, modifizieren, verbreiten oder abgeleitete Werke erstellen.",
-    "privacyText": "Rhythm Nexus („wir“, „uns“ oder „unser“) respektiert Ihre Privatsphäre und verpflichtet sich, Ihre personenbezogenen Daten zu schützen. Diese Datenschutzrichtlinie erläutert, welche personenbezogenen Daten wir erfassen, wie sie verwendet werden, mit wem wir sie teilen und welche Rechte Sie haben. Diese Richtlinie gilt für Benutzer aus der EU, dem EWR, der Schweiz und den USA. ||| Wir erfassen die personenbezogenen Daten, die Sie freiwillig angeben, einschließlich Name, E-Mail-Adresse, Rechnungs- und Lieferadresse, Telefonnummer sowie Zahlungsinformationen, die von Drittanbietern verarbeitet werden. ||| Wir erfassen automatisch IP-Adresse, Browsertyp, Gerätedaten, Nutzungsdaten, Cookies und Tracking-Technologien. ||| Wenn Sie sich in der EU/EWR/Schweiz befinden, verarbeiten wir Ihre Daten auf Grundlage der Vertragserfüllung (Auftragserfüllung), rechtlicher Verpflichtung, berechtigter Interessen und soweit erforderlich einer Einwilligung. ||| Wir verwenden Ihre Daten, um Bestellungen zu bearbeiten, Produkte zu versenden, mit Ihnen zu kommunizieren, Kundensupport zu bieten, gesetzlichen Verpflichtungen nachzukommen, unsere Website zu verbessern und mit Ihrer Einwilligung Marketingmitteilungen zu versenden. ||| Wir können Ihre Daten bei Bedarf an Zahlungsabwickler, Versandpartner, Analyseanbieter, Marketingdienstleister und Justizbehörden weitergeben. Wir verkaufen keine personenbezogenen Daten. ||| EU-/EWR-/Schweiz-Benutzer haben das Recht, auf personenbezogene Daten zuzugreifen, unrichtige Daten zu korrigieren, Daten zu löschen, die Verarbeitung einzuschränken, der Verarbeitung zu widersprechen, Daten zu übertragen und ihre Einwilligung zu widerrufen. Um diese Rechte auszuüben, kontaktieren Sie uns unter rhythmnexusco@gmail.com. ||| Benutzer in den USA (CCPA/CPRA, sofern zutreffend) haben möglicherweise das Recht, zu erfahren, welche personenbezogenen Daten erfasst werden, die Löschung zu beantragen, die Datenweitergabe abzulehnen und bei der Ausübung ihrer Rechte auf Nichtdiskriminierung zu verzichten. Um Anfragen einzureichen, senden Sie eine E-Mail an rhythmnexusco@gmail.com. ||| Wir bewahren personenbezogene Daten so lange auf, wie es zur Erfüllung von Bestellungen, zur Einhaltung gesetzlicher Anforderungen und zur Beilegung von Streitigkeiten erforderlich ist. ||| Wir können Daten außerhalb Ihrer Region übertragen. Bei Übermittlungen aus der EU/dem EWR/der Schweiz verwenden wir Standardvertragsklauseln (SCCs) und andere gesetzliche Schutzmaßnahmen. ||| Wir implementieren angemessene technische und organisatorische Sicherheitsmaßnahmen, einschließlich SSL-Verschlüsselung, sichere Zahlungssysteme und Zugriffskontrollmaßnahmen. Allerdings ist kein System 100 % sicher."
-  },
-  "fr": {
-    "navTerms": "Termes",
-    "navPrivacy": "Confidentialité",
-    "termsTitle": "Conditions d'utilisation",
-    "privacyTitle": "politique de confidentialité",
-    "updated": "Dernière mise à jour: 24 février 2026",
-    "termsText": "Ces conditions d'utilisation (« Conditions ») régissent votre accès et votre utilisation des services de commerce électronique proposés via https://rhythmnexus.org (« Site Web ») exploités par Rhythm Nexus (« nous », « notre » ou « notre »). En accédant, en naviguant ou en achetant sur le site Web, vous acceptez d'être lié par ces conditions. Si vous n’êtes pas d’accord, vous ne pouvez pas utiliser le site Web ni passer de commande. ||| Vous devez avoir au moins 18 ans ou avoir atteint l'âge de la majorité dans votre juridiction pour acheter des produits sur ce site Web. En passant une commande, vous déclarez et garantissez que vous répondez à cette exigence. ||| Il peut vous être demandé de créer un compte pour effectuer un achat. Vous acceptez de fournir des informations exactes, actuelles et complètes. Vous êtes responsable de la protection des informations d’identification de votre compte. Vous devez nous informer immédiatement de toute utilisation non autorisée. Nous pouvons résilier ou suspendre votre compte à tout moment en cas de violation de ces Conditions. ||| Nous nous efforçons d'afficher les informations sur les produits avec précision, mais nous ne garantissons pas que les descriptions de produits ou tout autre contenu sont exempts d'erreurs. ||| Les prix sont indiqués en dollars américains (USD) et incluent les taxes applicables lorsque la loi l'exige. Nous pouvons modifier les prix à tout moment avant que vous passiez une commande. ||| Votre commande est une offre d'achat. L'acceptation a lieu lorsque nous confirmons votre commande par e-mail ou lorsque nous expédions les produits, selon la première éventualité. Nous pouvons refuser ou annuler des commandes pour des raisons telles que des prix incorrects, des produits en rupture de stock ou des soupçons de fraude. ||| Nous acceptons les modes de paiement indiqués lors du paiement. En soumettant les détails du paiement, vous nous autorisez à facturer le montant dû et confirmez que vous êtes le titulaire légitime du compte. Nous utilisons des processeurs de paiement tiers pour traiter en toute sécurité les informations de paiement. ||| Les estimations d’expédition sont fournies pour plus de commodité et ne garantissent pas les dates de livraison. Une fois les produits transférés à un transporteur, le risque de perte vous est transféré. Vous êtes responsable des droits de douane et des taxes d'importation, ainsi que des erreurs de livraison causées par des informations d'adresse incorrectes. ||| Si vous résidez dans l'UE, l'EEE ou la Suisse, vous avez le droit légal de retourner les produits dans les 14 jours suivant leur réception pour un remboursement complet. Les produits doivent être retournés dans leur état d'origine. Les frais de retour peuvent être à vos frais, comme le permet la loi. Les produits numériques peuvent être exclus si le téléchargement commence avec votre consentement et que vous reconnaissez la perte du droit de rétractation. ||| L'éligibilité au retour pour les clients américains est décrite dans notre politique de retour et de remboursement distincte publiée sur le site Web. Certains articles (par exemple, les téléchargements numériques, les articles personnalisés) peuvent ne pas être remboursables. ||| Si vous achetez des articles numériques, la livraison est électronique, vous bénéficiez d'une licence personnelle non exclusive pour utiliser le contenu et vous ne pouvez pas redistribuer, revendre ou partager des téléchargements sans autorisation. ||| Tout le contenu du site Web (textes, conceptions, logiciels, graphiques, images) est la propriété ou sous licence de Rhythm Nexus et est protégé par les lois sur le droit d'auteur et la propriété intellectuelle. Vous ne pouvez pas reproduire, modifier, distribuer ou créer des œuvres dérivées sans autorisation écrite.",
-    "privacyText": "Rhythm Nexus (« nous », « notre » ou « notre ») respecte votre vie privée et s'engage à protéger vos données personnelles. Cette politique de confidentialité explique quelles données personnelles nous collectons, comment elles sont utilisées, avec qui nous les partageons et vos droits. Cette politique s'applique aux utilisateurs de l'UE, de l'EEE, de la Suisse et des États-Unis. ||| Nous collectons les informations personnelles que vous fournissez volontairement, notamment votre nom, votre adresse e-mail, votre adresse de facturation et d'expédition, votre numéro de téléphone et les informations de paiement traitées par des processeurs tiers. ||| Nous collectons automatiquement l'adresse IP, le type de navigateur, les données de l'appareil, les données d'utilisation, les cookies et les technologies de suivi. ||| Si vous résidez dans l'UE/EEE/Suisse, nous traitons vos données sur la base de l'exécution du contrat (exécution de la commande), de l'obligation légale, des intérêts légitimes et du consentement si nécessaire. ||| Nous utilisons vos données pour traiter les commandes, expédier des produits, communiquer avec vous, fournir une assistance client, respecter les obligations légales, améliorer notre site Web et envoyer des communications marketing avec votre consentement. ||| Nous pouvons partager vos données avec des processeurs de paiement, des partenaires d'expédition, des fournisseurs d'analyses, des prestataires de services marketing et des autorités judiciaires lorsque cela est nécessaire. Nous ne vendons pas de données personnelles. ||| Les utilisateurs de l'UE/EEE/Suisse disposent des droits RGPD pour accéder aux données personnelles, corriger les données inexactes, effacer les données, restreindre le traitement, s'opposer au traitement, transférer les données et retirer leur consentement. Pour exercer ces droits, contactez-nous à rythmenexusco@gmail.com. ||| Les utilisateurs américains (CCPA/CPRA, le cas échéant) peuvent avoir le droit de savoir quelles données personnelles sont collectées, de demander la suppression, de refuser le partage de données et de ne pas faire de discrimination dans l'exercice de leurs droits. Pour soumettre des demandes, envoyez un e-mail àrythmnexusco@gmail.com. ||| Nous conservons les données personnelles aussi longtemps que nécessaire pour exécuter les commandes, nous conformer aux exigences légales et résoudre les litiges. ||| Nous pouvons transférer des données en dehors de votre région. Lors d'un transfert depuis l'UE/EEE/Suisse, nous utilisons des clauses contractuelles types (CCS) et d'autres garanties légales. ||| Nous mettons en œuvre des mesures de protection techniques et organisationnelles raisonnables, notamment le cryptage SSL, des systèmes de paiement sécurisés et des mesures de contrôle d'accès. Cependant, aucun système n’est sécurisé à 100 %."
-  },
-  "es": {
-    "navTerms": "Términos",
-    "navPrivacy": "Privacidad",
-    "termsTitle": "Términos de servicio",
-    "privacyTitle": "política de privacidad",
-    "updated": "Última actualización: 24 de febrero de 2026",
-    "termsText": "Estos Términos de servicio (\"Términos\") rigen su acceso y uso de los servicios de comercio electrónico ofrecidos a través de https://rhythmnexus.org (\"Sitio web\") operados por Rhythm Nexus (\"nosotros\", \"nos\" o \"nuestro\"). Al acceder, navegar o comprar en el sitio web, usted acepta estar sujeto a estos Términos. Si no está de acuerdo, no podrá utilizar el sitio web ni realizar un pedido. ||| Debe tener al menos 18 años o la mayoría de edad en su jurisdicción para comprar productos en este sitio web. Al realizar un pedido, usted declara y garantiza que cumple con este requisito. ||| Es posible que se le solicite que cree una cuenta para realizar una compra. Usted acepta proporcionar información precisa, actual y completa. Usted es responsable de salvaguardar las credenciales de su cuenta. Debe notificarnos inmediatamente de cualquier uso no autorizado. Podemos cancelar o suspender su cuenta en cualquier momento por violaciones de estos Términos. ||| Nos esforzamos por mostrar la información del producto con precisión, pero no garantizamos que las descripciones de los productos u otro contenido estén libres de errores. ||| Los precios se muestran en dólares estadounidenses (USD) e incluyen los impuestos aplicables cuando lo exige la ley. Podemos cambiar los precios en cualquier momento antes de realizar un pedido. ||| Su pedido es una oferta de compra. La aceptación se produce cuando confirmamos su pedido por correo electrónico o cuando enviamos los productos, lo que ocurra primero. Podemos rechazar o cancelar pedidos por motivos que incluyen precios incorrectos, productos agotados o sospecha de fraude. ||| Aceptamos los métodos de pago que se muestran durante el proceso de pago. Al enviar los detalles de pago, nos autoriza a cobrar el monto adeudado y confirma que usted es el titular legítimo de la cuenta. Utilizamos procesadores de pagos de terceros para manejar de forma segura la información de pago. ||| Las estimaciones de envío se proporcionan para su comodidad y no garantizan fechas de entrega. Una vez que los productos se transfieren a un transportista, el riesgo de pérdida pasa a usted. Usted es responsable de los derechos de aduana e impuestos de importación, y de los errores de entrega causados ​​por información de dirección incorrecta. ||| Si reside en la UE, el EEE o Suiza, tiene el derecho legal de devolver los productos dentro de los 14 días posteriores a la recepción para obtener un reembolso completo. Los productos deben devolverse en su estado original. El envío de devolución puede correr a su cargo según lo permite la ley. Los productos digitales podrán quedar excluidos si la descarga comienza con su consentimiento y reconoce la pérdida del derecho de desistimiento. ||| La elegibilidad de devolución para clientes de EE. UU. se describe en nuestra Política de devolución y reembolso separada publicada en el sitio web. Es posible que algunos artículos (por ejemplo, descargas digitales, artículos personalizados) no sean reembolsables. ||| Si compra artículos digitales, la entrega es electrónica, se le otorga una licencia personal no exclusiva para usar el contenido y no puede redistribuir, revender ni compartir descargas sin permiso. ||| Todo el contenido del sitio web (texto, diseños, software, gráficos, imágenes) es propiedad de Rhythm Nexus o tiene licencia para ello y está protegido por las leyes de derechos de autor y propiedad intelectual. No puede reproducir, modificar, distribuir ni crear trabajos derivados sin permiso por escrito.",
-    "privacyText": "Rhythm Nexus (\"nosotros\", \"nos\" o \"nuestro\") respeta su privacidad y se compromete a proteger sus datos personales. Esta Política de Privacidad explica qué datos personales recopilamos, cómo se utilizan, con quién los compartimos y sus derechos. Esta política se aplica a usuarios de la UE, el EEE, Suiza y los EE. UU. ||| Recopilamos la información personal que usted proporciona voluntariamente, incluido el nombre, la dirección de correo electrónico, la dirección de facturación y envío, el número de teléfono y la información de pago manejada por procesadores externos. ||| Recopilamos automáticamente la dirección IP, el tipo de navegador, los datos del dispositivo, los datos de uso, las cookies y las tecnologías de seguimiento. ||| Si se encuentra en la UE, el EEE o Suiza, procesamos sus datos en función de la ejecución del contrato (cumplimiento del pedido), la obligación legal, los intereses legítimos y el consentimiento cuando sea necesario. ||| Utilizamos sus datos para procesar pedidos, enviar productos, comunicarnos con usted, brindar atención al cliente, cumplir con obligaciones legales, mejorar nuestro sitio web y enviar comunicaciones de marketing con su consentimiento. ||| Podemos compartir sus datos con procesadores de pagos, socios de envío, proveedores de análisis, proveedores de servicios de marketing y autoridades legales cuando sea necesario. No vendemos datos personales. ||| Los usuarios de la UE/EEE/Suiza tienen derechos GDPR para acceder a datos personales, corregir datos inexactos, borrar datos, restringir el procesamiento, oponerse al procesamiento, transferir datos y retirar el consentimiento. Para ejercer estos derechos, contáctenos en ritmonexusco@gmail.com. ||| Los usuarios de EE. UU. (CCPA/CPRA, cuando corresponda) pueden tener derecho a saber qué datos personales se recopilan, solicitar la eliminación, optar por no compartir datos y no discriminación para ejercer derechos. Para enviar solicitudes, envíe un correo electrónico a ritmonexusco@gmail.com. ||| Conservamos datos personales durante el tiempo necesario para cumplir con los pedidos, cumplir con los requisitos legales y resolver disputas. ||| Podemos transferir datos fuera de su región. Cuando realizamos transferencias desde la UE/EEE/Suiza, utilizamos cláusulas contractuales estándar (SCC) y otras salvaguardias legales. ||| Implementamos salvaguardias técnicas y organizativas razonables que incluyen cifrado SSL, sistemas de pago seguros y medidas de control de acceso. Sin embargo, ningún sistema es 100% seguro."
-  },
-  "ja": {
-    "navTerms": "条項",
-    "navPrivacy": "プライバシー",
-    "termsTitle": "利用規約",
-    "privacyTitle": "プライバシーポリシー",
-    "updated": "最終更新日: 2026 年 2 月 24 日",
-    "termsText": "これらの利用規約 (「規約」) は、Rhythm Nexus (「当社」) が運営する https://rhythmnexus.org (「ウェブサイト」) を通じて提供される電子商取引サービスへのお客様のアクセスおよび使用を規定します。本ウェブサイトにアクセス、閲覧、または購入することにより、お客様は本規約に拘束されることに同意したものとみなされます。同意しない場合は、ウェブサイトを使用したり、注文したりすることはできません。 ||| この Web サイトから製品を購入するには、18 歳以上、または管轄区域における成人年齢に達している必要があります。注文することにより、この要件を満たすことを表明および保証するものとします。 ||| 購入するにはアカウントの作成を求められる場合があります。あなたは、正確、最新、完全な情報を提供することに同意するものとします。あなたには、自分のアカウント資格情報を保護する責任があります。不正使用があった場合は、直ちに当社に通知する必要があります。これらの規約に違反した場合、当社はいつでもお客様のアカウントを終了または一時停止することができます。 ||| 商品情報を正確に表示するよう努めておりますが、商品説明やその他の内容に誤りがないことを保証するものではありません。 ||| 価格は米ドル (USD) で表示されており、法律で義務付けられている場合には適用される税金が含まれています。ご注文前に随時価格を変更させていただく場合がございます。 ||| あなたの注文は購入の申し出です。ご注文はメールで確認した時点、または商品を発送した時点のいずれか早い時点で承認となります。価格設定の誤り、商品の在庫切れ、詐欺の疑いなどの理由により、ご注文をお断りまたはキャンセルさせていただく場合がございます。 ||| チェックアウト時に表示される支払い方法を受け入れます。支払いの詳細を送信することにより、お客様は当社が未払い金額を請求することを承認し、お客様が正当なアカウント所有者であることを確認するものとします。当社は、支払い情報を安全に処理するためにサードパーティの支払い処理業者を使用しています。 ||| 配送見積もりは便宜のために提供されており、配送日を保証するものではありません。製品が運送業者に転送されると、紛失のリスクはお客様に移ります。関税および輸入税、および住所情報の誤りによる配送ミスについてはお客様の責任となります。 ||| EU、EEA、またはスイスにお住まいの場合、商品を受領後 14 日以内に返品し、全額返金を受ける法的権利があります。製品は元の状態で返品する必要があります。法律で認められているとおり、返品の送料はお客様のご負担となる場合があります。お客様の同意を得てダウンロードが開始され、取り消し権の喪失をお客様が認めた場合、デジタル製品は除外される場合があります。 ||| 米国のお客様の返品資格については、ウェブサイトに掲載されている別の返品および返金ポリシーに概説されています。一部の商品 (デジタル ダウンロード、パーソナライズされた商品など) は返金できない場合があります。 ||| デジタル アイテムを購入した場合、配信は電子的に行われ、コンテンツを使用するための個人的非独占的ライセンスが付与され、許可なくダウンロードを再配布、再販、または共有することはできません。 ||| すべての Web サイトのコンテンツ (テキスト、デザイン、ソフトウェア、グラフィック、画像) は Rhythm Nexus が所有するか、Rhythm Nexus にライセンス供与されており、著作権法および知的財産法によって保護されています。書面による許可なく複製、変更、配布、派生作品を作成することはできません。",
-    "privacyText": "Rhythm Nexus (「当社」) はお客様のプライバシーを尊重し、お客様の個人データの保護に努めます。このプライバシー ポリシーでは、当社が収集する個人データ、その使用方法、共有先、およびお客様の権利について説明します。このポリシーは、EU、EEA、スイス、米国のユーザーに適用されます。 ||| 当社は、名前、電子メール アドレス、請求先および配送先住所、電話番号、サードパーティの処理業者が処理する支払い情報など、お客様が自発的に提供した個人情報を収集します。 ||| 当社は、IP アドレス、ブラウザの種類、デバイス データ、使用状況データ、Cookie、および追跡テクノロジーを自動的に収集します。 ||| お客様が EU/EEA/スイスにお住まいの場合、当社は契約履行 (注文履行)、法的義務、正当な利益、および必要に応じて同意に基づいてお客様のデータを処理します。 ||| 当社は、注文の処理、製品の発送、お客様とのコミュニケーション、顧客サポートの提供、法的義務の遵守、当社ウェブサイトの改善、および同意を得たマーケティングコミュニケーションの送信のためにお客様のデータを使用します。 ||| 当社は、必要に応じて、お客様のデータを決済処理業者、配送パートナー、分析プロバイダー、マーケティング サービス プロバイダー、および法的当局と共有する場合があります。当社は個人データを販売しません。 ||| EU/EEA/スイスのユーザーは、個人データへのアクセス、不正確なデータの修正、データの消去、処理の制限、処理への異議、データの移植、および同意の撤回を行うための GDPR 権利を有します。これらの権利を行使するには、rhythmnexusco@gmail.com までご連絡ください。 ||| 米国のユーザー (CCPA/CPRA、該当する場合) は、収集される個人データを知る権利、削除要求、データ共有のオプトアウト、および権利行使に対する無差別の権利を有する場合があります。リクエストを送信するには、rhythmnexusco@gmail.com まで電子メールを送信してください。 ||| 当社は、注文の履行、法的要件の遵守、紛争の解決に必要な限り個人データを保持します。 ||| お住まいの地域外にデータを転送する場合があります。 EU/EEA/スイスから転送する場合、当社は標準契約条項 (SCC) およびその他の法的保護手段を使用します。 ||| 当社は、SSL暗号化、安全な支払いシステム、アクセス制御手段などの合理的な技術的および組織的保護措置を導入しています。ただし、100% 安全なシステムはありません。"
-  },
-  "zh": {
-    "navTerms": "条款",
-    "navPrivacy": "隐私",
-    "termsTitle": "服务条款",
-    "privacyTitle": "隐私政策",
-    "updated": "最后更新日期：2026 年 2 月 24 日",
-    "termsText": "这些服务条款（“条款”）管辖您对由 Rhythm Nexus（“我们”或“我们的”）运营的 https://rhythmnexus.org（“网站”）提供的电子商务服务的访问和使用。通过访问、浏览或从本网站购买，您同意受这些条款的约束。如果您不同意，您不得使用本网站或下订单。 ||| 您必须年满 18 岁或您所在司法管辖区的法定成年年龄才能从本网站购买产品。通过下订单，您声明并保证您满足此要求。 ||| 您可能会被要求创建一个帐户才能进行购买。您同意提供准确、最新且完整的信息。您有责任保护您的帐户凭据。如果有任何未经授权的使用，您必须立即通知我们。如果您违反这些条款，我们可以随时终止或暂停您的帐户。 ||| 我们努力准确地显示产品信息，但我们不保证产品描述或其他内容没有错误。 ||| 价格以美元 (USD) 显示，并包含法律要求的适用税费。在您下订单之前，我们可能随时更改价格。 ||| 您的订单是购买要约。当我们通过电子邮件确认您的订单或我们发货时（以先发生者为准），即表示接受。我们可能会因定价不正确、产品缺货或涉嫌欺诈等原因拒绝或取消订单。 ||| 我们接受结账时显示的付款方式。通过提交付款详细信息，您授权我们收取应付金额并确认您是合法的帐户持有人。我们使用第三方支付处理器来安全地处理支付信息。 ||| 提供运费预估是为了方便起见，并不保证交货日期。一旦产品转移到承运商，损失风险就转移给您。您负责缴纳关税和进口税，以及因地址信息不正确而导致的递送错误。 ||| 如果您居住在欧盟、欧洲经济区或瑞士，您有合法权利在收到产品后 14 天内退货并获得全额退款。产品必须以原始状态退回。根据法律允许，退货运费可能由您承担。如果在您同意的情况下开始下载并且您承认失去撤回权，则数字产品可能会被排除在外。 ||| 我们网站上发布的单独退货和退款政策概述了美国客户的退货资格。某些商品（例如数字下载、个性化商品）可能不可退款。 ||| 如果您购买数字商品，则以电子方式交付，您将被授予使用该内容的个人非独占许可，并且未经许可您不得重新分发、转售或共享下载。 ||| 所有网站内容（文本、设计、软件、图形、图像）均归 Rhythm Nexus 所有或授权给 Rhythm Nexus，并受版权和知识产权法保护。未经书面许可，您不得复制、修改、分发或创建衍生作品。",
-    "privacyText": "Rhythm Nexus（“我们”或“我们的”）尊重您的隐私并致力于保护您的个人数据。本隐私政策解释了我们收集哪些个人数据、如何使用这些数据、我们与谁共享这些数据以及您的权利。本政策适用于来自欧盟、欧洲经济区、瑞士和美国的用户。 ||| 我们收集您自愿提供的个人信息，包括姓名、电子邮件地址、账单和送货地址、电话号码以及由第三方处理商处理的付款信息。 ||| 我们自动收集 IP 地址、浏览器类型、设备数据、使用数据、cookie 和跟踪技术。 ||| 如果您位于欧盟/欧洲经济区/瑞士，我们将根据合同履行（订单履行）、法律义务、合法利益以及必要时的同意来处理您的数据。 ||| 我们使用您的数据来处理订单、运送产品、与您沟通、提供客户支持、遵守法律义务、改进我们的网站以及在征得您同意的情况下发送营销信息。 ||| 必要时，我们可能会与支付处理商、运输合作伙伴、分析提供商、营销服务提供商和法律机构共享您的数据。我们不出售个人数据。 ||| 欧盟/欧洲经济区/瑞士用户拥有 GDPR 权利来访问个人数据、更正不准确的数据、删除数据、限制处理、反对处理、移植数据和撤回同意。要行使这些权利，请通过节奏nexusco@gmail.com联系我们。 ||| 美国用户（CCPA/CPRA，如适用）可能有权了解收集了哪些个人数据、请求删除、选择退出数据共享以及在行使权利时不受歧视。要提交请求，请发送电子邮件至 Rhythnexusco@gmail.com。 ||| 我们会根据履行订单、遵守法律要求和解决争议的需要保留个人数据。 ||| 我们可能会将数据传输到您所在地区之外。从欧盟/欧洲经济区/瑞士转移时，我们使用标准合同条款 (SCC) 和其他合法保障措施。 ||| 我们实施合理的技术和组织保障措施，包括 SSL 加密、安全支付系统和访问控制措施。然而，没有一个系统是 100% 安全的。"
-  },
-  "zh-hant": {
-    "navTerms": "條款",
-    "navPrivacy": "隱私",
-    "termsTitle": "服務條款",
-    "privacyTitle": "隱私權政策",
-    "updated": "最後更新日期：2026 年 2 月 24 日",
-    "termsText": "本服務條款（「條款」）管轄您對由 Rhythm Nexus（「我們」或「我們的」）所經營的 https://rhythmnexus.org（「網站」）提供的電子商務服務的存取和使用。透過造訪、瀏覽或從本網站購買，您同意受這些條款的約束。如果您不同意，您不得使用本網站或下訂單。 ||| 您必須年滿 18 歲或您所在司法管轄區的法定成年年齡才能從本網站購買產品。透過下訂單，您聲明並保證您滿足此要求。 ||| 您可能會被要求建立帳戶才能進行購買。您同意提供準確、最新且完整的資訊。您有責任保護您的帳戶憑證。如果有任何未經授權的使用，您必須立即通知我們。如果您違反這些條款，我們可以隨時終止或暫停您的帳戶。 ||| 我們努力準確地顯示產品訊息，但我們不保證產品描述或其他內容沒有錯誤。 ||| 價格以美元 (USD) 顯示，並包含法律要求的適用稅費。在您下訂單之前，我們可能隨時更改價格。 ||| 您的訂單是購買要約。當我們透過電子郵件確認您的訂單或我們出貨時（以先發生者為準），即表示接受。我們可能會因定價不正確、產品缺貨或涉嫌詐欺等原因而拒絕或取消訂單。 ||| 我們接受結帳時顯示的付款方式。透過提交付款詳細信息，您授權我們收取應付金額並確認您是合法的帳戶持有人。我們使用第三方支付處理器來安全地處理支付資訊。 ||| 提供運費預估是為了方便起見，並不保證交貨日期。一旦產品轉移到承運商，損失風險就會轉移給您。您負責繳納關稅和進口稅，以及因地址資訊不正確而導致的遞送錯誤。 ||| 如果您居住在歐盟、歐洲經濟區或瑞士，您有合法權利在收到產品後 14 天內退貨並獲得全額退款。產品必須以原始狀態退回。根據法律允許，退貨運費可能由您承擔。如果在您同意的情況下開始下載並且您承認失去撤回權，則數位產品可能會被排除在外。 ||| 我們網站上發布的單獨退貨和退款政策概述了美國客戶的退貨資格。某些商品（例如數位下載、個人化商品）可能無法退款。 ||| 如果您購買數位商品，則以電子方式交付，您將被授予使用該內容的個人非獨佔許可，並且未經許可您不得重新散佈、轉售或分享下載。 ||| 所有網站內容（文字、設計、軟體、圖形、圖像）均為 Rhythm Nexus 所有或授權給 Rhythm Nexus，並受版權和智慧財產權法保護。未經書面許可，您不得複製、修改、散佈或創作衍生作品。",
-    "privacyText": "Rhythm Nexus（「我們」或「我們的」）尊重您的隱私並致力於保護您的個人資料。本隱私權政策解釋了我們收集哪些個人資料、如何使用這些資料、我們與誰分享這些資料以及您的權利。本政策適用於來自歐盟、歐洲經濟區、瑞士和美國的使用者。 ||| 我們收集您自願提供的個人信息，包括姓名、電子郵件地址、帳單和送貨地址、電話號碼以及由第三方處理商處理的付款資訊。 ||| 我們自動收集 IP 位址、瀏覽器類型、裝置資料、使用資料、cookie 和追蹤技術。 ||| 如果您位於歐盟/歐洲經濟區/瑞士，我們將根據合約履行（訂單履行）、法律義務、合法利益以及必要時的同意來處理您的資料。 ||| 我們使用您的資料來處理訂單、運送產品、與您溝通、提供客戶支援、遵守法律義務、改進我們的網站以及在您同意的徵得中發送行銷訊息。 ||| 必要時，我們可能會與支付處理商、運輸合作夥伴、分析提供者、行銷服務提供者和法律機構分享您的資料。我們不出售個人資料。 ||| 歐盟/歐洲經濟區/瑞士用戶擁有 GDPR 權利來存取個人資料、更正不準確的資料、刪除資料、限制處理、反對處理、移植資料和撤回同意。要行使這些權利，請透過節奏nexusco@gmail.com聯絡我們。 ||| 美國用戶（CCPA/CPRA，如適用）可能有權了解收集了哪些個人資料、請求刪除、選擇退出資料共享以及在行使權利時不受歧視。若要提交請求，請發送電子郵件至 Rhythnexusco@gmail.com。 ||| 我們會根據履行訂單、遵守法律要求和解決爭議的需要保留個人資料。 ||| 我們可能會將資料傳輸到您所在地區之外。從歐盟/歐洲經濟區/瑞士轉移時，我們使用標準合約條款 (SCC) 和其他合法保障措施。 ||| 我們實施合理的技術和組織保障措施，包括 SSL 加密、安全支付系統和存取控制措施。然而，沒有一個系統是 100% 安全的。"
-  },
-  "pt": {
-    "navTerms": "Termos",
-    "navPrivacy": "Privacidade",
-    "termsTitle": "Termos de Serviço",
-    "privacyTitle": "política de Privacidade",
-    "updated": "Última atualização: 24 de fevereiro de 2026",
-    "termsText": "Estes Termos de Serviço (\"Termos\") regem o seu acesso e uso dos serviços de comércio eletrônico oferecidos através de https://rhythmnexus.org (\"Site\") operado pela Rhythm Nexus (\"nós\", \"nos\" ou \"nosso\"). Ao acessar, navegar ou comprar no Site, você concorda em ficar vinculado a estes Termos. Se você não concordar, não poderá usar o Site ou fazer um pedido. ||| Você deve ter pelo menos 18 anos ou ser maior de idade em sua jurisdição para comprar produtos deste Site. Ao fazer um pedido, você declara e garante que atende a esse requisito. ||| Você pode ser solicitado a criar uma conta para fazer uma compra. Você concorda em fornecer informações precisas, atuais e completas. Você é responsável por proteger as credenciais da sua conta. Você deve nos notificar imediatamente sobre qualquer uso não autorizado. Poderemos encerrar ou suspender sua conta a qualquer momento por violação destes Termos. ||| Nós nos esforçamos para exibir as informações dos produtos com precisão, mas não garantimos que as descrições dos produtos ou outros conteúdos estejam livres de erros. ||| Os preços são mostrados em dólares dos Estados Unidos (USD) e incluem impostos aplicáveis ​​quando exigido por lei. Podemos alterar os preços a qualquer momento antes de você fazer um pedido. ||| Seu pedido é uma oferta de compra. A aceitação ocorre quando confirmamos seu pedido por e-mail, ou quando enviamos os produtos, o que ocorrer primeiro. Podemos recusar ou cancelar pedidos por motivos que incluem preços incorretos, produtos fora de estoque ou suspeita de fraude. ||| Aceitamos os métodos de pagamento apresentados durante a finalização da compra. Ao enviar os dados de pagamento, você nos autoriza a cobrar o valor devido e confirma que é o legítimo titular da conta. Usamos processadores de pagamento terceirizados para lidar com informações de pagamento com segurança. ||| As estimativas de envio são fornecidas por conveniência e não garantem datas de entrega. Depois que os produtos são transferidos para uma transportadora, o risco de perda passa para você. Você é responsável pelas taxas alfandegárias e impostos de importação e por erros de entrega causados ​​por informações de endereço incorretas. ||| Se você reside na UE, no EEE ou na Suíça, você tem o direito legal de devolver os produtos no prazo de 14 dias após o recebimento para obter reembolso total. Os produtos devem ser devolvidos nas condições originais. O frete de devolução pode ser por sua conta, conforme permitido por lei. Os produtos digitais podem ser excluídos se o download começar com o seu consentimento e você reconhecer a perda do direito de retirada. ||| A elegibilidade de devolução para clientes dos EUA está descrita em nossa Política de Devolução e Reembolso separada publicada no Site. Alguns itens (por exemplo, downloads digitais, itens personalizados) podem não ser reembolsáveis. ||| Se você comprar itens digitais, a entrega será eletrônica, você receberá uma licença pessoal não exclusiva para usar o conteúdo e não poderá redistribuir, revender ou compartilhar downloads sem permissão. ||| Todo o conteúdo do site (texto, designs, software, gráficos, imagens) é de propriedade ou licenciado à Rhythm Nexus e protegido por leis de direitos autorais e propriedade intelectual. Você não pode reproduzir, modificar, distribuir ou criar trabalhos derivados sem permissão por escrito.",
-    "privacyText": "A Rhythm Nexus (\"nós\", \"nos\" ou \"nosso\") respeita sua privacidade e está comprometida em proteger seus dados pessoais. Esta Política de Privacidade explica quais dados pessoais coletamos, como são utilizados, com quem os compartilhamos e seus direitos. Esta política se aplica a usuários da UE, EEE, Suíça e EUA. ||| Coletamos as informações pessoais que você fornece voluntariamente, incluindo nome, endereço de e-mail, endereço de cobrança e entrega, número de telefone e informações de pagamento gerenciadas por processadores terceirizados. ||| Coletamos automaticamente endereço IP, tipo de navegador, dados do dispositivo, dados de uso, cookies e tecnologias de rastreamento. ||| Se você estiver na UE/EEE/Suíça, processamos seus dados com base no desempenho do contrato (cumprimento de pedidos), obrigações legais, interesses legítimos e consentimento quando necessário. ||| Utilizamos os seus dados para processar encomendas, enviar produtos, comunicar consigo, fornecer apoio ao cliente, cumprir obrigações legais, melhorar o nosso Website e enviar comunicações de marketing com consentimento. ||| Poderemos partilhar os seus dados com processadores de pagamento, parceiros de envio, fornecedores de análises, prestadores de serviços de marketing e autoridades legais, quando necessário. Não vendemos dados pessoais. ||| Os usuários da UE/EEE/Suíça têm direitos do GDPR para acessar dados pessoais, corrigir dados imprecisos, apagar dados, restringir o processamento, opor-se ao processamento, transferir dados e retirar o consentimento. Para exercer estes direitos, contacte-nos em ritmonexusco@gmail.com. ||| Os usuários dos EUA (CCPA/CPRA, quando aplicável) podem ter direitos de saber quais dados pessoais são coletados, solicitar exclusão, cancelar o compartilhamento de dados e não discriminação no exercício de direitos. Para enviar solicitações, envie um e-mail para ritmonexusco@gmail.com. ||| Conservamos os dados pessoais enquanto for necessário para cumprir encomendas, cumprir requisitos legais e resolver litígios. ||| Podemos transferir dados para fora da sua região. Ao transferir da UE/EEE/Suíça, utilizamos Cláusulas Contratuais Padrão (SCCs) e outras salvaguardas legais. ||| Implementamos salvaguardas técnicas e organizacionais razoáveis, incluindo criptografia SSL, sistemas de pagamento seguros e medidas de controle de acesso. No entanto, nenhum sistema é 100% seguro."
-  },
-  "hi": {
-    "navTerms": "शर्तें",
-    "navPrivacy": "गोपनीयता",
-    "termsTitle": "सेवा की शर्तें",
-    "privacyTitle": "गोपनीयता नीति",
-    "updated": "अंतिम अद्यतन: 24 फरवरी 2026",
-    "termsText": "सेवा की ये शर्तें (\"शर्तें\") रिदम नेक्सस (\"हम\", \"हम\", या \"हमारा\") द्वारा संचालित https://rhythmnexus.org (\"वेबसाइट\") के माध्यम से दी जाने वाली ई-कॉमर्स सेवाओं तक आपकी पहुंच और उपयोग को नियंत्रित करती हैं। वेबसाइट तक पहुंचने, ब्राउज़ करने या खरीदारी करने से, आप इन शर्तों से बंधे होने के लिए सहमत होते हैं। यदि आप सहमत नहीं हैं, तो आप वेबसाइट का उपयोग नहीं कर सकते या ऑर्डर नहीं दे सकते। ||| इस वेबसाइट से उत्पाद खरीदने के लिए आपकी आयु कम से कम 18 वर्ष या आपके अधिकार क्षेत्र में वयस्कता की आयु होनी चाहिए। ऑर्डर देकर, आप प्रतिनिधित्व करते हैं और आश्वासन देते हैं कि आप इस आवश्यकता को पूरा करते हैं। ||| आपको खरीदारी करने के लिए एक खाता बनाने के लिए कहा जा सकता है। आप सटीक, वर्तमान और संपूर्ण जानकारी प्रदान करने के लिए सहमत हैं। आप अपने खाते के क्रेडेंशियल्स की सुरक्षा के लिए जिम्मेदार हैं। आपको किसी भी अनधिकृत उपयोग के बारे में हमें तुरंत सूचित करना चाहिए। इन शर्तों के उल्लंघन के लिए हम किसी भी समय आपका खाता समाप्त या निलंबित कर सकते हैं। ||| हम उत्पाद जानकारी को सटीक रूप से प्रदर्शित करने का प्रयास करते हैं, लेकिन हम यह गारंटी नहीं देते हैं कि उत्पाद विवरण या अन्य सामग्री त्रुटि-मुक्त हैं। ||| कीमतें यूनाइटेड स्टेट्स डॉलर (यूएसडी) में दिखाई जाती हैं और जहां कानून द्वारा आवश्यक हो वहां लागू कर शामिल होते हैं। आपके ऑर्डर देने से पहले हम किसी भी समय कीमतें बदल सकते हैं। ||| आपका ऑर्डर खरीदने का एक प्रस्ताव है. स्वीकृति तब होती है जब हम ईमेल द्वारा आपके ऑर्डर की पुष्टि करते हैं, या जब हम उत्पादों को भेजते हैं, जो भी पहले हो। हम गलत मूल्य निर्धारण, आउट-ऑफ-स्टॉक उत्पाद या संदिग्ध धोखाधड़ी सहित कारणों से ऑर्डर को अस्वीकार या रद्द कर सकते हैं। ||| हम चेकआउट के दौरान दिखाई गई भुगतान विधियों को स्वीकार करते हैं। भुगतान विवरण जमा करके, आप हमें देय राशि वसूलने और पुष्टि करने के लिए अधिकृत करते हैं कि आप सही खाताधारक हैं। भुगतान जानकारी को सुरक्षित रूप से प्रबंधित करने के लिए हम तृतीय-पक्ष भुगतान प्रोसेसर का उपयोग करते हैं। ||| शिपिंग अनुमान सुविधा के लिए प्रदान किए जाते हैं और डिलीवरी की तारीखों की गारंटी नहीं देते हैं। एक बार जब उत्पाद किसी वाहक को स्थानांतरित कर दिए जाते हैं, तो नुकसान का जोखिम आप पर आ जाता है। आप सीमा शुल्क और आयात करों और गलत पते की जानकारी के कारण होने वाली डिलीवरी त्रुटियों के लिए जिम्मेदार हैं। ||| यदि आप ईयू, ईईए या स्विट्जरलैंड में रहते हैं, तो आपके पास पूर्ण धन-वापसी के लिए प्राप्ति के 14 दिनों के भीतर उत्पाद वापस करने का कानूनी अधिकार है। उत्पादों को मूल स्थिति में लौटाया जाना चाहिए। वापसी शिपिंग कानून द्वारा अनुमत आपकी लागत पर हो सकती है। यदि डाउनलोड आपकी सहमति से शुरू होता है और आप वापसी के अधिकार के नुकसान को स्वीकार करते हैं तो डिजिटल उत्पादों को बाहर रखा जा सकता है। ||| अमेरिकी ग्राहकों के लिए रिटर्न पात्रता वेबसाइट पर पोस्ट की गई हमारी अलग रिटर्न और रिफंड नीति में उल्लिखित है। कुछ आइटम (जैसे, डिजिटल डाउनलोड, वैयक्तिकृत आइटम) गैर-वापसी योग्य हो सकते हैं। ||| यदि आप डिजिटल आइटम खरीदते हैं, तो डिलीवरी इलेक्ट्रॉनिक होती है, आपको सामग्री का उपयोग करने के लिए एक व्यक्तिगत गैर-विशिष्ट लाइसेंस दिया जाता है, और आप अनुमति के बिना पुनर्वितरित, पुनर्विक्रय या डाउनलोड साझा नहीं कर सकते हैं। ||| वेबसाइट की सभी सामग्री (पाठ, डिज़ाइन, सॉफ़्टवेयर, ग्राफ़िक्स, चित्र) रिदम नेक्सस के स्वामित्व या लाइसेंस प्राप्त है और कॉपीराइट और बौद्धिक संपदा कानूनों द्वारा संरक्षित है। आप लिखित अनुमति के बिना व्युत्पन्न कार्यों का पुनरुत्पादन, संशोधन, वितरण या निर्माण नहीं कर सकते हैं।",
-    "privacyText": "रिदम नेक्सस (\"हम\", \"हमें\", या \"हमारा\") आपकी गोपनीयता का सम्मान करता है और आपके व्यक्तिगत डेटा की सुरक्षा के लिए प्रतिबद्ध है। यह गोपनीयता नीति बताती है कि हम कौन सा व्यक्तिगत डेटा एकत्र करते हैं, इसका उपयोग कैसे किया जाता है, हम इसे किसके साथ साझा करते हैं और आपके अधिकार। यह नीति ईयू, ईईए, स्विट्जरलैंड और यूएसए के उपयोगकर्ताओं पर लागू होती है। ||| हम आपके द्वारा स्वेच्छा से प्रदान की गई व्यक्तिगत जानकारी एकत्र करते हैं, जिसमें नाम, ईमेल पता, बिलिंग और शिपिंग पता, फोन नंबर और तीसरे पक्ष के प्रोसेसर द्वारा प्रबंधित भुगतान जानकारी शामिल है। ||| हम स्वचालित रूप से आईपी पता, ब्राउज़र प्रकार, डिवाइस डेटा, उपयोग डेटा, कुकीज़ और ट्रैकिंग तकनीकें एकत्र करते हैं। ||| यदि आप ईयू/ईईए/स्विट्जरलैंड में हैं, तो हम आपके डेटा को अनुबंध प्रदर्शन (ऑर्डर पूर्ति), कानूनी दायित्व, वैध हितों और जहां आवश्यक हो, सहमति के आधार पर संसाधित करते हैं। ||| हम आपके डेटा का उपयोग ऑर्डर संसाधित करने, उत्पाद भेजने, आपके साथ संवाद करने, ग्राहक सहायता प्रदान करने, कानूनी दायित्वों का अनुपालन करने, हमारी वेबसाइट को बेहतर बनाने और सहमति के साथ विपणन संचार भेजने के लिए करते हैं। ||| आवश्यकता पड़ने पर हम आपका डेटा भुगतान प्रोसेसर, शिपिंग पार्टनर, एनालिटिक्स प्रदाता, मार्केटिंग सेवा प्रदाता और कानूनी अधिकारियों के साथ साझा कर सकते हैं। हम व्यक्तिगत डेटा नहीं बेचते हैं. ||| ईयू/ईईए/स्विस उपयोगकर्ताओं के पास व्यक्तिगत डेटा तक पहुंचने, गलत डेटा को सही करने, डेटा मिटाने, प्रसंस्करण को प्रतिबंधित करने, प्रसंस्करण पर आपत्ति करने, डेटा पोर्ट करने और सहमति वापस लेने के जीडीपीआर अधिकार हैं। इन अधिकारों का प्रयोग करने के लिए, हमसे Rhythnexusco@gmail.com पर संपर्क करें। ||| यूएसए उपयोगकर्ताओं (सीसीपीए/सीपीआरए, जहां लागू हो) के पास यह जानने का अधिकार हो सकता है कि कौन सा व्यक्तिगत डेटा एकत्र किया गया है, हटाने का अनुरोध करें, डेटा साझा करने से ऑप्ट-आउट करें, और अधिकारों का प्रयोग करने में भेदभाव न करें। अनुरोध सबमिट करने के लिए, Rhythnexusco@gmail.com पर ईमेल करें। ||| आदेशों को पूरा करने, कानूनी आवश्यकताओं का अनुपालन करने और विवादों को हल करने के लिए जब तक आवश्यक हो हम व्यक्तिगत डेटा बनाए रखते हैं। ||| हम आपके क्षेत्र के बाहर डेटा स्थानांतरित कर सकते हैं। ईयू/ईईए/स्विट्जरलैंड से स्थानांतरित करते समय, हम मानक अनुबंध खंड (एससीसी) और अन्य वैध सुरक्षा उपायों का उपयोग करते हैं। ||| हम एसएसएल एन्क्रिप्शन, सुरक्षित भुगतान प्रणाली और पहुंच नियंत्रण उपायों सहित उचित तकनीकी और संगठनात्मक सुरक्षा उपायों को लागू करते हैं। हालाँकि, कोई भी सिस्टम 100% सुरक्षित नहीं है।"
-  },
-  "th": {
-    "navTerms": "เงื่อนไข",
-    "navPrivacy": "ความเป็นส่วนตัว",
-    "termsTitle": "ข้อกำหนดในการให้บริการ",
-    "privacyTitle": "นโยบายความเป็นส่วนตัว",
-    "updated": "อัปเดตล่าสุด: 24 กุมภาพันธ์ 2569",
-    "termsText": "ข้อกำหนดในการให้บริการ (\"ข้อกำหนด\") เหล่านี้ควบคุมการเข้าถึงและการใช้บริการอีคอมเมิร์ซที่นำเสนอผ่าน https://rhythmnexus.org (\"เว็บไซต์\") ที่ดำเนินการโดย Rhythm Nexus (\"เรา\", \"พวกเรา\" หรือ \"ของเรา\") โดยการเข้าถึง เรียกดู หรือซื้อจากเว็บไซต์ แสดงว่าคุณตกลงที่จะผูกพันตามข้อกำหนดเหล่านี้ หากคุณไม่ตกลง คุณจะไม่สามารถใช้เว็บไซต์หรือสั่งซื้อได้ ||| คุณต้องมีอายุอย่างน้อย 18 ปีหรือบรรลุนิติภาวะในเขตอำนาจศาลของคุณจึงจะสามารถซื้อผลิตภัณฑ์จากเว็บไซต์นี้ได้ ในการสั่งซื้อ คุณรับรองและรับประกันว่าคุณปฏิบัติตามข้อกำหนดนี้ ||| คุณอาจถูกขอให้สร้างบัญชีเพื่อซื้อสินค้า คุณตกลงที่จะให้ข้อมูลที่ถูกต้อง เป็นปัจจุบัน และครบถ้วน คุณมีหน้าที่รับผิดชอบในการปกป้องข้อมูลรับรองบัญชีของคุณ คุณต้องแจ้งให้เราทราบทันทีเกี่ยวกับการใช้งานที่ไม่ได้รับอนุญาต เราอาจยกเลิกหรือระงับบัญชีของคุณได้ตลอดเวลาสำหรับการละเมิดข้อกำหนดเหล่านี้ ||| เรามุ่งมั่นที่จะแสดงข้อมูลผลิตภัณฑ์อย่างถูกต้อง แต่เราไม่รับประกันว่าคำอธิบายผลิตภัณฑ์หรือเนื้อหาอื่น ๆ ปราศจากข้อผิดพลาด ||| ราคาจะแสดงเป็นดอลลาร์สหรัฐ (USD) และรวมภาษีที่เกี่ยวข้องตามที่กฎหมายกำหนด เราอาจเปลี่ยนแปลงราคาได้ตลอดเวลาก่อนที่คุณจะสั่งซื้อ ||| คำสั่งซื้อของคุณเป็นข้อเสนอที่จะซื้อ การยอมรับจะเกิดขึ้นเมื่อเรายืนยันคำสั่งซื้อของคุณทางอีเมล หรือเมื่อเราจัดส่งสินค้า แล้วแต่ว่ากรณีใดจะเกิดขึ้นก่อน เราอาจปฏิเสธหรือยกเลิกคำสั่งซื้อด้วยเหตุผลต่างๆ รวมถึงการกำหนดราคาที่ไม่ถูกต้อง สินค้าหมดสต็อก หรือการฉ้อโกงที่น่าสงสัย ||| เรายอมรับวิธีการชำระเงินที่แสดงระหว่างการชำระเงิน โดยการส่งรายละเอียดการชำระเงิน คุณอนุญาตให้เราเรียกเก็บเงินจำนวนที่ต้องชำระและยืนยันว่าคุณเป็นเจ้าของบัญชีโดยชอบธรรม เราใช้ผู้ประมวลผลการชำระเงินบุคคลที่สามเพื่อจัดการข้อมูลการชำระเงินอย่างปลอดภัย ||| การประมาณการการจัดส่งมีไว้เพื่อความสะดวกและไม่รับประกันวันที่จัดส่ง เมื่อผลิตภัณฑ์ถูกโอนไปยังผู้ขนส่งแล้ว ความเสี่ยงในการสูญเสียจะส่งผ่านไปถึงคุณ คุณต้องรับผิดชอบภาษีศุลกากรและภาษีนำเข้า และข้อผิดพลาดในการจัดส่งที่เกิดจากข้อมูลที่อยู่ไม่ถูกต้อง ||| หากคุณอาศัยอยู่ในสหภาพยุโรป EEA หรือสวิตเซอร์แลนด์ คุณมีสิทธิ์ตามกฎหมายในการคืนผลิตภัณฑ์ภายใน 14 วันหลังจากได้รับเงินคืนเต็มจำนวน สินค้าจะต้องส่งคืนในสภาพเดิม การส่งคืนสินค้าอาจเป็นค่าใช้จ่ายของคุณตามที่กฎหมายอนุญาต ผลิตภัณฑ์ดิจิทัลอาจถูกยกเว้นหากการดาวน์โหลดเริ่มต้นด้วยความยินยอมของคุณและคุณรับทราบถึงการสูญเสียสิทธิ์ในการเพิกถอน ||| สิทธิ์การคืนสินค้าสำหรับลูกค้าในสหรัฐอเมริกามีระบุไว้ในนโยบายการคืนสินค้าและการคืนเงินแยกต่างหากของเราที่โพสต์บนเว็บไซต์ สินค้าบางรายการ (เช่น การดาวน์โหลดแบบดิจิทัล สินค้าเฉพาะบุคคล) อาจไม่สามารถขอคืนเงินได้ ||| หากคุณซื้อสินค้าดิจิทัล การจัดส่งเป็นแบบอิเล็กทรอนิกส์ คุณได้รับใบอนุญาตส่วนบุคคลแบบไม่ผูกขาดในการใช้เนื้อหา และคุณไม่สามารถแจกจ่ายต่อ ขายต่อ หรือแบ่งปันการดาวน์โหลดโดยไม่ได้รับอนุญาต ||| เนื้อหาเว็บไซต์ทั้งหมด (ข้อความ การออกแบบ ซอฟต์แวร์ กราฟิก รูปภาพ) เป็นของหรือได้รับอนุญาตจาก Rhythm Nexus และได้รับการคุ้มครองโดยกฎหมายลิขสิทธิ์และทรัพย์สินทางปัญญา คุณไม่สามารถทำซ้ำ ดัดแปลง แจกจ่าย หรือสร้างผลงานลอกเลียนแบบโดยไม่ได้รับอนุญาตเป็นลายลักษณ์อักษร",
-    "privacyText": "Rhythm Nexus (\"เรา\", \"พวกเรา\" หรือ \"ของเรา\") เคารพความเป็นส่วนตัวของคุณและมุ่งมั่นที่จะปกป้องข้อมูลส่วนบุคคลของคุณ นโยบายความเป็นส่วนตัวนี้อธิบายว่าข้อมูลส่วนบุคคลใดบ้างที่เรารวบรวม วิธีการนำไปใช้ ใครที่เราแบ่งปันด้วย และสิทธิ์ของคุณ นโยบายนี้ใช้กับผู้ใช้จาก EU, EEA, สวิตเซอร์แลนด์ และสหรัฐอเมริกา ||| เราเก็บรวบรวมข้อมูลส่วนบุคคลที่คุณให้ไว้โดยสมัครใจ รวมถึงชื่อ ที่อยู่อีเมล ที่อยู่สำหรับการเรียกเก็บเงินและการจัดส่ง หมายเลขโทรศัพท์ และข้อมูลการชำระเงินที่จัดการโดยผู้ประมวลผลบุคคลที่สาม ||| เรารวบรวมที่อยู่ IP ประเภทเบราว์เซอร์ ข้อมูลอุปกรณ์ ข้อมูลการใช้งาน คุกกี้ และเทคโนโลยีการติดตามโดยอัตโนมัติ ||| หากคุณอยู่ใน EU/EEA/สวิตเซอร์แลนด์ เราจะประมวลผลข้อมูลของคุณตามการปฏิบัติตามสัญญา (การปฏิบัติตามคำสั่งซื้อ) ภาระผูกพันทางกฎหมาย ประโยชน์โดยชอบด้วยกฎหมาย และความยินยอมตามที่จำเป็น ||| เราใช้ข้อมูลของคุณเพื่อประมวลผลคำสั่งซื้อ จัดส่งผลิตภัณฑ์ สื่อสารกับคุณ ให้การสนับสนุนลูกค้า ปฏิบัติตามภาระผูกพันทางกฎหมาย ปรับปรุงเว็บไซต์ของเรา และส่งการสื่อสารทางการตลาดโดยได้รับความยินยอม ||| เราอาจแบ่งปันข้อมูลของคุณกับผู้ประมวลผลการชำระเงิน พันธมิตรด้านการขนส่ง ผู้ให้บริการวิเคราะห์ ผู้ให้บริการด้านการตลาด และหน่วยงานทางกฎหมายเมื่อจำเป็น เราไม่ขายข้อมูลส่วนบุคคล ||| ผู้ใช้ EU/EEA/Swiss มีสิทธิ์ GDPR ในการเข้าถึงข้อมูลส่วนบุคคล แก้ไขข้อมูลที่ไม่ถูกต้อง ลบข้อมูล จำกัดการประมวลผล คัดค้านการประมวลผล ย้ายข้อมูล และเพิกถอนความยินยอม หากต้องการใช้สิทธิ์เหล่านี้ โปรดติดต่อเราที่ rhythmnexusco@gmail.com ||| ผู้ใช้ในสหรัฐอเมริกา (CCPA/CPRA หากมี) อาจมีสิทธิ์ทราบว่าข้อมูลส่วนบุคคลใดบ้างที่ถูกรวบรวม ขอลบ ยกเลิกการแบ่งปันข้อมูล และการไม่เลือกปฏิบัติในการใช้สิทธิ์ หากต้องการส่งคำขอส่งอีเมล rhythmnexusco@gmail.com ||| เราเก็บรักษาข้อมูลส่วนบุคคลไว้นานเท่าที่จำเป็นเพื่อปฏิบัติตามคำสั่งซื้อ ปฏิบัติตามข้อกำหนดทางกฎหมาย และแก้ไขข้อพิพาท ||| เราอาจถ่ายโอนข้อมูลนอกภูมิภาคของคุณ เมื่อย้ายจาก EU/EEA/สวิตเซอร์แลนด์ เราจะใช้ Standard Contractual Clauses (SCC) และมาตรการป้องกันทางกฎหมายอื่นๆ ||| เราใช้การป้องกันด้านเทคนิคและองค์กรที่เหมาะสม รวมถึงการเข้ารหัส SSL ระบบการชำระเงินที่ปลอดภัย และมาตรการควบคุมการเข้าถึง อย่างไรก็ตาม ไม่มีระบบใดที่ปลอดภัย 100%"
-  },
-  "ms": {
-    "navTerms": "Syarat",
-    "navPrivacy": "Privasi",
-    "termsTitle": "Syarat Perkhidmatan",
-    "privacyTitle": "Dasar Privasi",
-    "updated": "Kemas kini terakhir: 24 Februari 2026",
-    "termsText": "Syarat Perkhidmatan (\"Syarat\") ini mengawal akses anda kepada dan penggunaan perkhidmatan e-dagang yang ditawarkan melalui https://rhythmnexus.org (\"Laman Web\") yang dikendalikan oleh Rhythm Nexus (\"kami\", \"kami\" atau \"kami\"). Dengan mengakses, menyemak imbas, atau membeli daripada Laman Web, anda bersetuju untuk terikat dengan Terma ini. Jika anda tidak bersetuju, anda tidak boleh menggunakan Laman Web atau membuat pesanan. ||| Anda mesti berumur sekurang-kurangnya 18 tahun atau umur majoriti dalam bidang kuasa anda untuk membeli produk daripada Laman Web ini. Dengan membuat pesanan, anda menyatakan dan menjamin bahawa anda memenuhi keperluan ini. ||| Anda mungkin diminta membuat akaun untuk membuat pembelian. Anda bersetuju untuk memberikan maklumat yang tepat, terkini dan lengkap. Anda bertanggungjawab untuk melindungi kelayakan akaun anda. Anda mesti memberitahu kami dengan segera tentang sebarang penggunaan yang tidak dibenarkan. Kami boleh menamatkan atau menggantung akaun anda pada bila-bila masa kerana melanggar Syarat ini. ||| Kami berusaha untuk memaparkan maklumat produk dengan tepat, tetapi kami tidak menjamin bahawa penerangan produk atau kandungan lain adalah bebas ralat. ||| Harga ditunjukkan dalam Dolar Amerika Syarikat (USD) dan termasuk cukai yang dikenakan jika dikehendaki oleh undang-undang. Kami boleh menukar harga pada bila-bila masa sebelum anda membuat pesanan. ||| Pesanan anda ialah tawaran untuk membeli. Penerimaan berlaku apabila kami mengesahkan pesanan anda melalui e-mel, atau apabila kami menghantar produk, yang mana berlaku dahulu. Kami mungkin menolak atau membatalkan pesanan atas sebab termasuk harga yang salah, produk kehabisan stok atau penipuan yang disyaki. ||| Kami menerima kaedah pembayaran yang ditunjukkan semasa pembayaran. Dengan menyerahkan butiran pembayaran, anda memberi kuasa kepada kami untuk mengenakan amaun yang perlu dibayar dan mengesahkan anda adalah pemegang akaun yang sah. Kami menggunakan pemproses pembayaran pihak ketiga untuk mengendalikan maklumat pembayaran dengan selamat. ||| Anggaran penghantaran disediakan untuk kemudahan dan tidak menjamin tarikh penghantaran. Sebaik sahaja produk dipindahkan kepada pembawa, risiko kerugian berpindah kepada anda. Anda bertanggungjawab untuk duti kastam dan cukai import, dan untuk ralat penghantaran yang disebabkan oleh maklumat alamat yang salah. ||| Jika anda tinggal di EU, EEA atau Switzerland, anda mempunyai hak undang-undang untuk memulangkan produk dalam tempoh 14 hari selepas penerimaan untuk bayaran balik penuh. Produk mesti dikembalikan dalam keadaan asal. Penghantaran balik mungkin atas kos anda seperti yang dibenarkan oleh undang-undang. Produk digital mungkin dikecualikan jika muat turun bermula dengan persetujuan anda dan anda mengakui kehilangan hak penarikan balik. ||| Kelayakan pemulangan untuk pelanggan AS digariskan dalam Polisi Pemulangan & Bayaran Balik kami yang berasingan yang disiarkan di Laman Web. Sesetengah item (mis., muat turun digital, item diperibadikan) mungkin tidak boleh dibayar balik. ||| Jika anda membeli item digital, penghantaran adalah elektronik, anda diberikan lesen bukan eksklusif peribadi untuk menggunakan kandungan tersebut dan anda tidak boleh mengedar semula, menjual semula atau berkongsi muat turun tanpa kebenaran. ||| Semua kandungan Laman Web (teks, reka bentuk, perisian, grafik, imej) dimiliki oleh atau dilesenkan kepada Rhythm Nexus dan dilindungi oleh undang-undang hak cipta dan harta intelek. Anda tidak boleh mengeluarkan semula, mengubah suai, mengedar atau mencipta karya terbitan tanpa kebenaran bertulis.",
-    "privacyText": "Rhythm Nexus (\"kami\", \"kami\" atau \"kami\") menghormati privasi anda dan komited untuk melindungi data peribadi anda. Dasar Privasi ini menerangkan data peribadi yang kami kumpulkan, cara ia digunakan, dengan siapa kami berkongsinya dan hak anda. Dasar ini terpakai kepada pengguna dari EU, EEA, Switzerland dan Amerika Syarikat. ||| Kami mengumpul maklumat peribadi yang anda berikan secara sukarela, termasuk nama, alamat e-mel, alamat pengebilan dan penghantaran, nombor telefon dan maklumat pembayaran yang dikendalikan oleh pemproses pihak ketiga. ||| Kami mengumpul alamat IP, jenis penyemak imbas, data peranti, data penggunaan, kuki dan teknologi penjejakan secara automatik. ||| Jika anda berada di EU/EEA/Switzerland, kami memproses data anda berdasarkan prestasi kontrak (pemenuhan pesanan), kewajipan undang-undang, kepentingan sah dan persetujuan jika diperlukan. ||| Kami menggunakan data anda untuk memproses pesanan, menghantar produk, berkomunikasi dengan anda, menyediakan sokongan pelanggan, mematuhi kewajipan undang-undang, menambah baik Laman Web kami dan menghantar komunikasi pemasaran dengan persetujuan. ||| Kami mungkin berkongsi data anda dengan pemproses pembayaran, rakan kongsi perkapalan, penyedia analitik, penyedia perkhidmatan pemasaran dan pihak berkuasa undang-undang apabila diperlukan. Kami tidak menjual data peribadi. ||| Pengguna EU/EEA/Swiss mempunyai hak GDPR untuk mengakses data peribadi, membetulkan data yang tidak tepat, memadamkan data, menyekat pemprosesan, membantah pemprosesan, data port dan menarik balik kebenaran. Untuk melaksanakan hak ini, hubungi kami di rhythmnexusco@gmail.com. ||| Pengguna USA (CCPA/CPRA, jika berkenaan) mungkin mempunyai hak untuk mengetahui data peribadi yang dikumpul, meminta pemadaman, menarik diri daripada perkongsian data dan tanpa diskriminasi untuk menggunakan hak. Untuk menyerahkan permintaan, e-mel rhythmnexusco@gmail.com. ||| Kami mengekalkan data peribadi selagi perlu untuk memenuhi pesanan, mematuhi keperluan undang-undang dan menyelesaikan pertikaian. ||| Kami mungkin memindahkan data ke luar wilayah anda. Apabila berpindah dari EU/EEA/Switzerland, kami menggunakan Klausa Kontrak Standard (SCC) dan perlindungan sah yang lain. ||| Kami melaksanakan perlindungan teknikal dan organisasi yang munasabah termasuk penyulitan SSL, sistem pembayaran selamat dan langkah kawalan akses. Walau bagaimanapun, tiada sistem yang 100% selamat."
-  },
-  "nl": {
-    "navTerms": "Voorwaarden",
-    "navPrivacy": "Privacy",
-    "termsTitle": "Servicevoorwaarden",
-    "privacyTitle": "Privacybeleid",
-    "updated": "Laatst bijgewerkt: 24 februari 2026",
-    "termsText": "Deze Servicevoorwaarden (\"Voorwaarden\") regelen uw toegang tot en gebruik van de e-commercediensten die worden aangeboden via https://rhythmnexus.org (\"Website\") beheerd door Rhythm Nexus (\"wij\", \"ons\" of \"onze\"). Door de Website te openen, te bekijken of te kopen, gaat u ermee akkoord gebonden te zijn aan deze Voorwaarden. Als u het er niet mee eens bent, mag u de Website niet gebruiken of een bestelling plaatsen. ||| U moet ten minste 18 jaar oud zijn of meerderjarig in uw rechtsgebied om producten via deze website te kunnen kopen. Door een bestelling te plaatsen, verklaart en garandeert u dat u aan deze vereiste voldoet. ||| Mogelijk wordt u gevraagd een account aan te maken om een ​​aankoop te doen. U gaat ermee akkoord nauwkeurige, actuele en volledige informatie te verstrekken. U bent verantwoordelijk voor het beschermen van uw accountgegevens. U moet ons onmiddellijk op de hoogte stellen van elk ongeoorloofd gebruik. We kunnen uw account op elk moment beëindigen of opschorten wegens schending van deze Voorwaarden. ||| We streven ernaar om productinformatie accuraat weer te geven, maar we garanderen niet dat productbeschrijvingen of andere inhoud foutloos zijn. ||| Prijzen worden weergegeven in Amerikaanse dollar (USD) en zijn inclusief toepasselijke belastingen waar dit wettelijk vereist is. Wij kunnen de prijzen op elk moment wijzigen voordat u een bestelling plaatst. ||| Uw bestelling is een aanbod om te kopen. Acceptatie vindt plaats wanneer wij uw bestelling per e-mail bevestigen, of wanneer wij de producten verzenden, afhankelijk van wat zich het eerst voordoet. We kunnen bestellingen weigeren of annuleren om redenen zoals onjuiste prijzen, producten die niet op voorraad zijn of vermoedelijke fraude. ||| Wij accepteren de betaalmethoden die tijdens het afrekenen worden weergegeven. Door betalingsgegevens in te dienen, machtigt u ons om het verschuldigde bedrag in rekening te brengen en bevestigt u dat u de rechtmatige rekeninghouder bent. We gebruiken externe betalingsverwerkers om betalingsinformatie veilig te verwerken. ||| Verzendingsschattingen worden voor het gemak gegeven en garanderen geen leverdata. Zodra producten zijn overgedragen aan een vervoerder, gaat het risico van verlies over op u. U bent verantwoordelijk voor douanerechten en importbelastingen, en voor leveringsfouten veroorzaakt door onjuiste adresgegevens. ||| Als u in de EU, EER of Zwitserland woont, heeft u het wettelijke recht om producten binnen 14 dagen na ontvangst te retourneren voor een volledige terugbetaling. Producten moeten in originele staat geretourneerd worden. Retourzending kan voor uw rekening zijn, zoals toegestaan ​​door de wet. Digitale producten kunnen worden uitgesloten als het downloaden begint met uw toestemming en u erkent dat u uw herroepingsrecht verliest. ||| Het recht op retournering voor Amerikaanse klanten wordt uiteengezet in ons afzonderlijke retour- en restitutiebeleid dat op de website is geplaatst. Voor sommige artikelen (bijvoorbeeld digitale downloads en gepersonaliseerde artikelen) is restitutie mogelijk niet mogelijk. ||| Als u digitale items koopt, vindt de levering elektronisch plaats, krijgt u een persoonlijke, niet-exclusieve licentie om de inhoud te gebruiken en mag u downloads niet zonder toestemming opnieuw distribueren, doorverkopen of delen. ||| Alle inhoud van de website (tekst, ontwerpen, software, afbeeldingen, afbeeldingen) is eigendom van of in licentie gegeven aan Rhythm Nexus en wordt beschermd door auteursrecht en intellectuele eigendomswetten. U mag zonder schriftelijke toestemming geen afgeleide werken reproduceren, wijzigen, distribueren of creëren.",
-    "privacyText": "Rhythm Nexus (\"wij\", \"ons\" of \"onze\") respecteert uw privacy en doet er alles aan om uw persoonlijke gegevens te beschermen. In dit privacybeleid wordt uitgelegd welke persoonlijke gegevens we verzamelen, hoe deze worden gebruikt, met wie we deze delen en wat uw rechten zijn. Dit beleid is van toepassing op gebruikers uit de EU, EER, Zwitserland en de VS. ||| Wij verzamelen de persoonlijke gegevens die u vrijwillig verstrekt, waaronder naam, e-mailadres, factuur- en verzendadres, telefoonnummer en betalingsinformatie die wordt verwerkt door externe verwerkers. ||| We verzamelen automatisch IP-adres, browsertype, apparaatgegevens, gebruiksgegevens, cookies en trackingtechnologieën. ||| Als u zich in de EU/EER/Zwitserland bevindt, verwerken wij uw gegevens op basis van contractuitvoering (orderuitvoering), wettelijke verplichting, legitieme belangen en toestemming waar vereist. ||| We gebruiken uw gegevens om bestellingen te verwerken, producten te verzenden, met u te communiceren, klantenondersteuning te bieden, te voldoen aan wettelijke verplichtingen, onze website te verbeteren en met toestemming marketingcommunicatie te verzenden. ||| We kunnen uw gegevens indien nodig delen met betalingsverwerkers, verzendpartners, analyseproviders, marketingdienstverleners en juridische autoriteiten. Wij verkopen geen persoonlijke gegevens. ||| EU/EER/Zwitserse gebruikers hebben AVG-rechten om toegang te krijgen tot persoonlijke gegevens, onnauwkeurige gegevens te corrigeren, gegevens te wissen, de verwerking te beperken, bezwaar te maken tegen verwerking, gegevens over te dragen en hun toestemming in te trekken. Om deze rechten uit te oefenen, kunt u contact met ons opnemen via ritmenexusco@gmail.com. ||| Gebruikers in de VS (CCPA/CPRA, indien van toepassing) hebben mogelijk het recht om te weten welke persoonlijke gegevens worden verzameld, om verwijdering aan te vragen, om zich af te melden voor het delen van gegevens en om niet te worden gediscrimineerd bij het uitoefenen van rechten. Stuur een e-mail naar ritmenexusco@gmail.com om verzoeken in te dienen. ||| Wij bewaren persoonsgegevens zo lang als nodig is om bestellingen uit te voeren, aan wettelijke eisen te voldoen en geschillen op te lossen. ||| Het is mogelijk dat wij gegevens buiten uw regio overdragen. Bij overdracht vanuit de EU/EER/Zwitserland maken we gebruik van standaardcontractbepalingen (SCC's) en andere wettelijke waarborgen. ||| We implementeren redelijke technische en organisatorische veiligheidsmaatregelen, waaronder SSL-codering, beveiligde betalingssystemen en toegangscontrolemaatregelen. Geen enkel systeem is echter 100% veilig."
-  },
-  "id": {
-    "navTerms": "Ketentuan",
-    "navPrivacy": "Pribadi",
-    "termsTitle": "Ketentuan Layanan",
-    "privacyTitle": "Kebijakan Privasi",
-    "updated": "Terakhir diperbarui: 24 Februari 2026",
-    "termsText": "Ketentuan Layanan ini (\"Ketentuan\") mengatur akses Anda dan penggunaan layanan e-niaga yang ditawarkan melalui https://rhythmnexus.org (\"Situs Web\") yang dioperasikan oleh Rhythm Nexus (\"kami\", atau \"milik kami\"). Dengan mengakses, menelusuri, atau membeli dari Situs Web, Anda setuju untuk terikat oleh Ketentuan ini. Jika Anda tidak setuju, Anda tidak boleh menggunakan Situs Web atau melakukan pemesanan. ||| Anda harus berusia minimal 18 tahun atau usia dewasa di yurisdiksi Anda untuk membeli produk dari Situs Web ini. Dengan melakukan pemesanan, Anda menyatakan dan menjamin bahwa Anda memenuhi persyaratan ini. ||| Anda mungkin diminta membuat akun untuk melakukan pembelian. Anda setuju untuk memberikan informasi yang akurat, terkini, dan lengkap. Anda bertanggung jawab untuk menjaga kredensial akun Anda. Anda harus segera memberi tahu kami jika ada penggunaan yang tidak sah. Kami dapat menghentikan atau menangguhkan akun Anda kapan saja karena pelanggaran terhadap Ketentuan ini. ||| Kami berusaha menampilkan informasi produk secara akurat, namun kami tidak menjamin bahwa deskripsi produk atau konten lainnya bebas dari kesalahan. ||| Harga ditampilkan dalam Dolar Amerika Serikat (USD) dan sudah termasuk pajak yang berlaku jika diwajibkan oleh hukum. Kami dapat mengubah harga kapan saja sebelum Anda melakukan pemesanan. ||| Pesanan Anda adalah tawaran untuk membeli. Penerimaan terjadi ketika kami mengkonfirmasi pesanan Anda melalui email, atau ketika kami mengirimkan produk, mana saja yang lebih dulu. Kami dapat menolak atau membatalkan pesanan karena alasan termasuk harga yang salah, stok produk habis, atau dugaan penipuan. ||| Kami menerima metode pembayaran yang ditunjukkan saat checkout. Dengan mengirimkan rincian pembayaran, Anda memberi wewenang kepada kami untuk membebankan jumlah yang harus dibayar dan mengonfirmasi bahwa Anda adalah pemegang rekening yang sah. Kami menggunakan pemroses pembayaran pihak ketiga untuk menangani informasi pembayaran dengan aman. ||| Perkiraan pengiriman diberikan untuk kenyamanan dan tidak menjamin tanggal pengiriman. Setelah produk ditransfer ke operator, risiko kehilangan berpindah ke Anda. Anda bertanggung jawab atas bea masuk dan pajak impor, dan atas kesalahan pengiriman yang disebabkan oleh informasi alamat yang salah. ||| Jika Anda tinggal di UE, EEA, atau Swiss, Anda memiliki hak hukum untuk mengembalikan produk dalam waktu 14 hari sejak diterimanya untuk mendapatkan pengembalian dana penuh. Produk harus dikembalikan dalam kondisi asli. Pengiriman kembali mungkin menjadi biaya Anda sebagaimana diizinkan oleh hukum. Produk digital dapat dikecualikan jika pengunduhan dimulai dengan persetujuan Anda dan Anda mengakui hilangnya hak penarikan. ||| Kelayakan pengembalian untuk pelanggan AS diuraikan dalam Kebijakan Pengembalian & Pengembalian Dana terpisah yang diposting di Situs Web. Beberapa item (misalnya, unduhan digital, item yang dipersonalisasi) mungkin tidak dapat dikembalikan. ||| Jika Anda membeli barang digital, pengirimannya dilakukan secara elektronik, Anda diberikan lisensi non-eksklusif pribadi untuk menggunakan konten tersebut, dan Anda tidak boleh mendistribusikan ulang, menjual kembali, atau berbagi unduhan tanpa izin. ||| Semua konten Situs Web (teks, desain, perangkat lunak, grafik, gambar) dimiliki oleh atau dilisensikan kepada Rhythm Nexus dan dilindungi oleh undang-undang hak cipta dan kekayaan intelektual. Anda tidak boleh mereproduksi, memodifikasi, mendistribusikan, atau membuat karya turunan tanpa izin tertulis.",
-    "privacyText": "Rhythm Nexus (\"kami\", \"kita\", atau \"milik kami\") menghormati privasi Anda dan berkomitmen untuk melindungi data pribadi Anda. Kebijakan Privasi ini menjelaskan data pribadi apa yang kami kumpulkan, cara penggunaannya, dengan siapa kami membagikannya, dan hak-hak Anda. Kebijakan ini berlaku untuk pengguna dari UE, EEA, Swiss, dan Amerika Serikat. ||| Kami mengumpulkan informasi pribadi yang Anda berikan secara sukarela, termasuk nama, alamat email, alamat penagihan dan pengiriman, nomor telepon, dan informasi pembayaran yang ditangani oleh pemroses pihak ketiga. ||| Kami secara otomatis mengumpulkan alamat IP, jenis browser, data perangkat, data penggunaan, cookie, dan teknologi pelacakan. ||| Jika Anda berada di UE/EEA/Swiss, kami memproses data Anda berdasarkan kinerja kontrak (pemenuhan pesanan), kewajiban hukum, kepentingan sah, dan persetujuan jika diperlukan. ||| Kami menggunakan data Anda untuk memproses pesanan, mengirimkan produk, berkomunikasi dengan Anda, memberikan dukungan pelanggan, mematuhi kewajiban hukum, meningkatkan Situs Web kami, dan mengirimkan komunikasi pemasaran dengan persetujuan. ||| Kami dapat membagikan data Anda dengan pemroses pembayaran, mitra pengiriman, penyedia analisis, penyedia layanan pemasaran, dan otoritas hukum bila diperlukan. Kami tidak menjual data pribadi. ||| Pengguna UE/EEA/Swiss memiliki hak GDPR untuk mengakses data pribadi, memperbaiki data yang tidak akurat, menghapus data, membatasi pemrosesan, menolak pemrosesan, mentransfer data, dan membatalkan persetujuan. Untuk menggunakan hak ini, hubungi kami di rhythmnexusco@gmail.com. ||| Pengguna AS (CCPA/CPRA, jika berlaku) mungkin memiliki hak untuk mengetahui data pribadi apa yang dikumpulkan, meminta penghapusan, tidak ikut serta dalam pembagian data, dan non-diskriminasi dalam melaksanakan haknya. Untuk mengirimkan permintaan, kirim email ke rhythmnexusco@gmail.com. ||| Kami menyimpan data pribadi selama diperlukan untuk memenuhi pesanan, mematuhi persyaratan hukum, dan menyelesaikan perselisihan. ||| Kami mungkin mentransfer data ke luar wilayah Anda. Saat mentransfer dari UE/EEA/Swiss, kami menggunakan Klausul Kontrak Standar (SCC) dan perlindungan hukum lainnya. ||| Kami menerapkan pengamanan teknis dan organisasi yang wajar termasuk enkripsi SSL, sistem pembayaran yang aman, dan tindakan kontrol akses. Namun, tidak ada sistem yang 100% aman."
-  },
-  "cs": {
-    "navTerms": "Podmínky",
-    "navPrivacy": "Soukromí",
-    "termsTitle": "Podmínky služby",
-    "privacyTitle": "Zásady ochrany osobních údajů",
-    "updated": "Poslední aktualizace: 24. února 2026",
-    "termsText": "Tyto smluvní podmínky (dále jen „podmínky“) upravují váš přístup a používání služeb elektronického obchodu nabízených prostřednictvím https://rhythmnexus.org („webové stránky“) provozované společností Rhythm Nexus („my“, „nás“ nebo „náš“). Přístupem, procházením nebo nákupem na webových stránkách souhlasíte s tím, že budete vázáni těmito podmínkami. Pokud nesouhlasíte, nesmíte používat Webové stránky ani zadat objednávku. ||| Abyste mohli nakupovat produkty z této webové stránky, musíte být starší 18 let nebo být plnoletí ve vaší jurisdikci. Odesláním objednávky prohlašujete a zaručujete, že splňujete tento požadavek. ||| Chcete-li provést nákup, můžete být požádáni o vytvoření účtu. Souhlasíte s tím, že poskytnete přesné, aktuální a úplné informace. Jste odpovědní za ochranu přihlašovacích údajů k účtu. O každém neoprávněném použití nás musíte okamžitě informovat. Z důvodu porušení těchto podmínek můžeme váš účet kdykoli ukončit nebo pozastavit. ||| Snažíme se zobrazovat informace o produktech přesně, ale nezaručujeme, že popisy produktů nebo jiný obsah jsou bez chyb. ||| Ceny jsou uvedeny v amerických dolarech (USD) a zahrnují příslušné daně, pokud to vyžaduje zákon. Před zadáním objednávky můžeme ceny kdykoli změnit. ||| Vaše objednávka je nabídkou ke koupi. K přijetí dojde, když potvrdíme vaši objednávku e-mailem, nebo když odešleme produkty, podle toho, co nastane dříve. Můžeme odmítnout nebo zrušit objednávky z důvodů, včetně nesprávných cen, produktů, které nejsou skladem, nebo podezření z podvodu. ||| Přijímáme způsoby platby uvedené při placení. Odesláním platebních údajů nám dáváte oprávnění účtovat dlužnou částku a potvrzujete, že jste oprávněným držitelem účtu. K bezpečnému zpracování platebních údajů používáme externí zpracovatele plateb. ||| Odhady dopravy jsou poskytovány pro pohodlí a nezaručují termíny dodání. Jakmile jsou produkty převedeny na dopravce, přechází na vás riziko ztráty. Jste zodpovědní za cla a dovozní daně a za chyby v doručení způsobené nesprávnými údaji o adrese. ||| Pokud sídlíte v EU, EHP nebo Švýcarsku, máte zákonné právo na vrácení produktů do 14 dnů od obdržení, abyste získali plnou náhradu. Produkty musí být vráceny v původním stavu. Zaslání zpět může být na vaše náklady, jak to umožňuje zákon. Digitální produkty mohou být vyloučeny, pokud stahování začne s vaším souhlasem a uznáváte ztrátu práva na odstoupení od smlouvy. ||| Nárok na vrácení pro zákazníky z USA je popsán v našich samostatných Zásadách vrácení a vrácení peněz zveřejněných na webových stránkách. Některé položky (např. digitální stahování, personalizované položky) mohou být nevratné. ||| Pokud si zakoupíte digitální položky, doručení je elektronické, je vám udělena osobní nevýhradní licence k použití obsahu a stažené soubory nesmíte bez povolení dále distribuovat, přeprodávat ani sdílet. ||| Veškerý obsah webových stránek (text, návrhy, software, grafika, obrázky) je vlastněn nebo licencován Rhythm Nexus a je chráněn autorským právem a zákony o duševním vlastnictví. Bez písemného souhlasu nesmíte reprodukovat, upravovat, distribuovat nebo vytvářet odvozená díla.",
-    "privacyText": "Rhythm Nexus („my“, „nás“ nebo „náš“) respektuje vaše soukromí a zavazuje se chránit vaše osobní údaje. Tyto zásady ochrany osobních údajů vysvětlují, jaké osobní údaje shromažďujeme, jak je používáme, s kým je sdílíme a vaše práva. Tyto zásady se vztahují na uživatele z EU, EHP, Švýcarska a USA. ||| Shromažďujeme osobní údaje, které nám dobrovolně poskytnete, včetně jména, e-mailové adresy, fakturační a dodací adresy, telefonního čísla a platebních údajů, které zpracovávají třetí strany. ||| Automaticky shromažďujeme IP adresu, typ prohlížeče, údaje o zařízení, údaje o používání, soubory cookie a technologie sledování. ||| Pokud se nacházíte v EU/EHP/Švýcarsku, zpracováváme vaše údaje na základě plnění smlouvy (plnění objednávky), zákonné povinnosti, oprávněných zájmů a souhlasu tam, kde je to vyžadováno. ||| Vaše údaje používáme ke zpracování objednávek, zasílání produktů, komunikaci s vámi, poskytování zákaznické podpory, plnění zákonných povinností, zlepšování našich webových stránek a zasílání marketingových sdělení se souhlasem. ||| V případě potřeby můžeme vaše údaje sdílet se zpracovateli plateb, přepravními partnery, poskytovateli analytických služeb, poskytovateli marketingových služeb a právními orgány. Osobní údaje neprodáváme. ||| Uživatelé z EU/EHP/Švýcarska mají práva GDPR na přístup k osobním údajům, opravu nepřesných údajů, vymazání údajů, omezení zpracování, vznesení námitky proti zpracování, přenesení údajů a odvolání souhlasu. Chcete-li tato práva uplatnit, kontaktujte nás na adrese rhythmnexusco@gmail.com. ||| Uživatelé z USA (CCPA/CPRA, kde je to relevantní) mohou mít právo vědět, jaké osobní údaje jsou shromažďovány, požadovat vymazání, odmítnout sdílení údajů a nediskriminovat při výkonu práv. Chcete-li odeslat požadavky, pošlete e-mail na adresu rhythmnexusco@gmail.com. ||| Osobní údaje uchováváme po dobu nezbytně nutnou k plnění objednávek, plnění zákonných požadavků a řešení sporů. ||| Můžeme přenášet data mimo váš region. Při převodu z EU/EHP/Švýcarska používáme standardní smluvní doložky (SCC) a další zákonná ochranná opatření. ||| Zavádíme přiměřená technická a organizační zabezpečení včetně šifrování SSL, bezpečných platebních systémů a opatření pro kontrolu přístupu. Žádný systém však není 100% bezpečný."
-  },
-  "it": {
-    "navTerms": "Termini",
-    "navPrivacy": "Privacy",
-    "termsTitle": "Termini di servizio",
-    "privacyTitle": "politica sulla riservatezza",
-    "updated": "Ultimo aggiornamento: 24 febbraio 2026",
-    "termsText": "I presenti Termini di servizio (\"Termini\") regolano l'accesso e l'utilizzo dei servizi di e-commerce offerti tramite https://rhythmnexus.org (\"Sito Web\") gestito da Rhythm Nexus (\"noi\", \"ci\" o \"nostro\"). Accedendo, navigando o acquistando dal Sito, accetti di essere vincolato dai presenti Termini. Se non sei d'accordo, non potrai utilizzare il sito web o effettuare un ordine. ||| Per acquistare prodotti da questo sito Web è necessario avere almeno 18 anni o la maggiore età nella propria giurisdizione. Effettuando un ordine, dichiari e garantisci di soddisfare questo requisito. ||| Potrebbe esserti chiesto di creare un account per effettuare un acquisto. Accetti di fornire informazioni accurate, aggiornate e complete. Sei responsabile della salvaguardia delle credenziali del tuo account. È necessario avvisarci immediatamente di qualsiasi utilizzo non autorizzato. Possiamo chiudere o sospendere il tuo account in qualsiasi momento per violazioni di questi Termini. ||| Ci sforziamo di visualizzare le informazioni sui prodotti in modo accurato, ma non garantiamo che le descrizioni dei prodotti o altri contenuti siano privi di errori. ||| I prezzi sono indicati in dollari statunitensi (USD) e includono le tasse applicabili ove richiesto dalla legge. Possiamo modificare i prezzi in qualsiasi momento prima di effettuare un ordine. ||| Il tuo ordine è un'offerta di acquisto. L'accettazione avviene quando confermiamo il tuo ordine via e-mail o quando spediamo i prodotti, a seconda di quale evento si verifichi per primo. Potremmo rifiutare o annullare gli ordini per motivi quali prezzi errati, prodotti esauriti o sospetta frode. ||| Accettiamo i metodi di pagamento indicati durante il checkout. Inviando i dettagli di pagamento, ci autorizzi ad addebitare l'importo dovuto e confermi di essere il legittimo titolare del conto. Utilizziamo processori di pagamento di terze parti per gestire in modo sicuro le informazioni di pagamento. ||| Le stime di spedizione sono fornite per comodità e non garantiscono le date di consegna. Una volta che i prodotti vengono trasferiti a un corriere, il rischio di perdita passa a te. Sei responsabile dei dazi doganali e delle tasse di importazione e degli errori di consegna causati da informazioni errate sull'indirizzo. ||| Se risiedi nell'UE, nel SEE o in Svizzera, hai il diritto legale di restituire i prodotti entro 14 giorni dal ricevimento per un rimborso completo. I prodotti devono essere restituiti nello stato originale. La spedizione di restituzione potrebbe essere a tuo carico, come consentito dalla legge. I prodotti digitali possono essere esclusi se il download inizia con il tuo consenso e riconosci la perdita del diritto di recesso. ||| L'idoneità al reso per i clienti statunitensi è delineata nella nostra Politica di restituzione e rimborso separata pubblicata sul sito web. Alcuni articoli (ad esempio download digitali, articoli personalizzati) potrebbero non essere rimborsabili. ||| Se acquisti articoli digitali, la consegna è elettronica, ti viene concessa una licenza personale non esclusiva per utilizzare il contenuto e non puoi ridistribuire, rivendere o condividere i download senza autorizzazione. ||| Tutti i contenuti del sito Web (testo, design, software, grafica, immagini) sono di proprietà o concessi in licenza a Rhythm Nexus e protetti dalle leggi sul copyright e sulla proprietà intellettuale. Non è possibile riprodurre, modificare, distribuire o creare opere derivate senza autorizzazione scritta.",
-    "privacyText": "Rhythm Nexus (\"noi\", \"ci\" o \"nostro\") rispetta la tua privacy e si impegna a proteggere i tuoi dati personali. La presente Informativa sulla privacy spiega quali dati personali raccogliamo, come vengono utilizzati, con chi li condividiamo e i tuoi diritti. Questa politica si applica agli utenti dell'UE, del SEE, della Svizzera e degli Stati Uniti. ||| Raccogliamo le informazioni personali fornite volontariamente, inclusi nome, indirizzo e-mail, indirizzo di fatturazione e spedizione, numero di telefono e informazioni di pagamento gestite da processori di terze parti. ||| Raccogliamo automaticamente indirizzo IP, tipo di browser, dati del dispositivo, dati di utilizzo, cookie e tecnologie di tracciamento. ||| Se ti trovi nell'UE/SEE/Svizzera, trattiamo i tuoi dati in base all'esecuzione del contratto (adempimento degli ordini), agli obblighi legali, agli interessi legittimi e al consenso ove richiesto. ||| Utilizziamo i tuoi dati per elaborare gli ordini, spedire prodotti, comunicare con te, fornire assistenza clienti, rispettare gli obblighi legali, migliorare il nostro sito Web e inviare comunicazioni di marketing con il consenso. ||| Potremmo condividere i tuoi dati con elaboratori di pagamento, partner di spedizione, fornitori di analisi, fornitori di servizi di marketing e autorità legali quando richiesto. Non vendiamo dati personali. ||| Gli utenti UE/SEE/Svizzera hanno i diritti GDPR di accedere ai dati personali, correggere dati inesatti, cancellare dati, limitare il trattamento, opporsi al trattamento, trasferire dati e revocare il consenso. Per esercitare questi diritti, contattaci all'indirizzo rhythmnexusco@gmail.com. ||| Gli utenti statunitensi (CCPA/CPRA, ove applicabile) possono avere il diritto di sapere quali dati personali vengono raccolti, richiedere la cancellazione, rinunciare alla condivisione dei dati e non discriminazione per l'esercizio dei diritti. Per inviare richieste, inviare un'e-mail a rhythmnexusco@gmail.com. ||| Conserviamo i dati personali per il tempo necessario a evadere gli ordini, rispettare i requisiti legali e risolvere le controversie. ||| Potremmo trasferire dati al di fuori della tua regione. Quando ci trasferiamo da UE/SEE/Svizzera, utilizziamo clausole contrattuali standard (SCC) e altre tutele legali. ||| Implementiamo ragionevoli garanzie tecniche e organizzative tra cui crittografia SSL, sistemi di pagamento sicuri e misure di controllo degli accessi. Tuttavia, nessun sistema è sicuro al 100%."
-  },
-  "he": {
-    "navTerms": "תנאים",
-    "navPrivacy": "פְּרָטִיוּת",
-    "termsTitle": "תנאים והגבלות",
-    "privacyTitle": "מדיניות פרטיות",
-    "updated": "עדכון אחרון: 24 בפברואר 2026",
-    "termsText": "תנאים והגבלות אלה (\"תנאים\") מסדירים את הגישה והשימוש שלך בשירותי המסחר האלקטרוני המוצעים דרך https://rhythmnexus.org (\"אתר\") המופעל על ידי Rhythm Nexus (\"אנחנו\", \"אנחנו\" או \"שלנו\"). על ידי גישה, גלישה או רכישה מהאתר, אתה מסכים להיות כפוף לתנאים אלה. אם אינך מסכים, אינך רשאי להשתמש באתר או לבצע הזמנה. ||| עליך להיות בן 18 לפחות או בגיל הבגרות בתחום השיפוט שלך כדי לרכוש מוצרים מאתר זה. על ידי ביצוע הזמנה, אתה מצהיר ומתחייב שאתה עומד בדרישה זו. ||| ייתכן שתתבקש ליצור חשבון כדי לבצע רכישה. אתה מסכים לספק מידע מדויק, עדכני ומלא. אתה אחראי לשמירה על אישורי החשבון שלך. עליך להודיע ​​לנו מיד על כל שימוש לא מורשה. אנו עשויים לסיים או להשעות את חשבונך בכל עת עקב הפרות של תנאים אלה. ||| אנו שואפים להציג מידע מוצר בצורה מדויקת, אך איננו מתחייבים שתיאורי מוצר או תוכן אחר הינם נקיים מטעויות. ||| המחירים מוצגים בדולר ארה\"ב (דולר ארה\"ב) וכוללים מסים החלים כאשר הדבר נדרש על פי חוק. אנו עשויים לשנות מחירים בכל עת לפני שתבצע הזמנה. ||| ההזמנה שלך היא הצעה לקנייה. הקבלה מתרחשת כאשר אנו מאשרים את הזמנתך בדוא\"ל, או כאשר אנו שולחים את המוצרים, המוקדם מביניהם. אנו עשויים לדחות או לבטל הזמנות מסיבות כולל תמחור שגוי, מוצרים שאזלו מהמלאי או חשד להונאה. ||| אנו מקבלים את אמצעי התשלום המוצגים במהלך התשלום. על ידי שליחת פרטי תשלום, אתה מאשר לנו לחייב את הסכום המגיע ומאשר שאתה בעל החשבון החוקי. אנו משתמשים במעבדי תשלומים של צד שלישי כדי לטפל בצורה מאובטחת בפרטי תשלום. ||| הערכות משלוח מסופקות מטעמי נוחות ואינן מבטיחות תאריכי אספקה. לאחר העברת המוצרים למוביל, הסיכון לאובדן עובר אליך. אתה אחראי למכסים ומסי יבוא, ולשגיאות מסירה שנגרמו כתוצאה מפרטי כתובת שגויים. ||| אם אתה מתגורר באיחוד האירופי, EEA או שוויץ, יש לך את הזכות החוקית להחזיר מוצרים תוך 14 ימים מיום הקבלה לקבלת החזר מלא. יש להחזיר מוצרים במצב מקורי. משלוח חזרה עשוי להיות על חשבונך כפי שמותר בחוק. ייתכן שלא ייכללו מוצרים דיגיטליים אם ההורדה מתחילה בהסכמתך ואתה מכיר באובדן זכות הביטול. ||| זכאות החזרה ללקוחות בארה\"ב מתוארת במדיניות ההחזרה וההחזרים הנפרדת שלנו המפורסמת באתר. חלק מהפריטים (לדוגמה, הורדות דיגיטליות, פריטים מותאמים אישית) עשויים להיות שאינם ניתנים להחזר. ||| אם אתה רוכש פריטים דיגיטליים, המשלוח הוא אלקטרוני, אתה מקבל רישיון אישי לא בלעדי להשתמש בתוכן, ואין להפיץ מחדש, למכור מחדש או לשתף הורדות ללא רשות. ||| כל תוכן האתר (טקסט, עיצובים, תוכנות, גרפיקה, תמונות) הוא בבעלות או ברישיון ל-Rhythm Nexus ומוגן על ידי חוקי זכויות יוצרים וקניין רוחני. אינך רשאי לשכפל, לשנות, להפיץ או ליצור יצירות נגזרות ללא אישור בכתב.",
-    "privacyText": "Rhythm Nexus (\"אנחנו\", \"אנחנו\" או \"שלנו\") מכבדת את פרטיותך ומחויבת להגן על הנתונים האישיים שלך. מדיניות פרטיות זו מסבירה אילו נתונים אישיים אנו אוספים, כיצד נעשה בהם שימוש, עם מי אנו חולקים אותם וזכויותיך. מדיניות זו חלה על משתמשים מהאיחוד האירופי, EEA, שוויץ וארה\"ב. ||| אנו אוספים את המידע האישי שאתה מספק מרצון, לרבות שם, כתובת דואר אלקטרוני, כתובת לחיוב ומשלוח, מספר טלפון ופרטי תשלום המטופלים על ידי מעבדי צד שלישי. ||| אנו אוספים באופן אוטומטי כתובת IP, סוג דפדפן, נתוני מכשיר, נתוני שימוש, קובצי Cookie וטכנולוגיות מעקב. ||| אם אתה נמצא באיחוד האירופי/EEA/שוויץ, אנו מעבדים את הנתונים שלך על סמך ביצוע חוזה (מילוי הזמנה), חובה משפטית, אינטרסים לגיטימיים והסכמה במידת הצורך. ||| אנו משתמשים בנתונים שלך כדי לעבד הזמנות, לשלוח מוצרים, לתקשר איתך, לספק תמיכת לקוחות, לעמוד בהתחייבויות משפטיות, לשפר את האתר שלנו ולשלוח תקשורת שיווקית בהסכמה. ||| אנו עשויים לחלוק את הנתונים שלך עם מעבדי תשלומים, שותפי משלוח, ספקי ניתוח, ספקי שירותי שיווק ורשויות משפטיות בעת הצורך. אנחנו לא מוכרים נתונים אישיים. ||| למשתמשי האיחוד האירופי/EEA/שוויץ יש זכויות GDPR לגשת לנתונים אישיים, לתקן נתונים לא מדויקים, למחוק נתונים, להגביל עיבוד, להתנגד לעיבוד, לנתק נתונים ולבטל הסכמה. למימוש זכויות אלו, צור איתנו קשר בכתובת rhythmnexusco@gmail.com. ||| למשתמשים בארה\"ב (CCPA/CPRA, היכן שרלוונטי) עשויות להיות זכויות לדעת אילו נתונים אישיים נאספים, לבקש מחיקה, ביטול הסכמה לשיתוף נתונים ואי-אפליה בגין מימוש זכויות. להגשת בקשות, שלח דוא\"ל לrhythmnexusco@gmail.com. ||| אנו שומרים נתונים אישיים כל עוד נחוץ כדי למלא הזמנות, לציית לדרישות החוק ולפתור מחלוקות. ||| אנו עשויים להעביר נתונים מחוץ לאזור שלך. בעת העברה מהאיחוד האירופי/EEA/שוויץ, אנו משתמשים בסעיפים חוזיים סטנדרטיים (SCCs) ובאמצעי הגנה חוקיים אחרים. ||| אנו מיישמים אמצעי הגנה טכניים וארגוניים סבירים לרבות הצפנת SSL, מערכות תשלום מאובטחות ואמצעי בקרת גישה. עם זאת, אף מערכת לא מאובטחת ב-100%."
-  },
-  "ga": {
-    "navTerms": "Téarmaí",
-    "navPrivacy": "Príobháideacht",
-    "termsTitle": "Téarmaí Seirbhíse",
-    "privacyTitle": "Beartas Príobháideachta",
-    "updated": "Nuashonrú is déanaí: 24 Feabhra 2026",
-    "termsText": "Rialaíonn na Téarmaí Seirbhíse seo (“Téarmaí”) do rochtain ar agus úsáid na seirbhísí ríomhthráchtála a thairgtear trí https://rhythmnexus.org (\"Suíomh Gréasáin\") arna oibriú ag Rhythm Nexus (\"muid\", \"sinn\", nó \"ár\"). Trí rochtain, brabhsáil nó ceannach ón Láithreán Gréasáin, aontaíonn tú a bheith faoi cheangal ag na Téarmaí seo. Mura n-aontaíonn tú, ní fhéadfaidh tú an Láithreán Gréasáin a úsáid ná ordú a dhéanamh. ||| Ní mór duit a bheith 18 mbliana d’aois ar a laghad nó tromlach d’aois i do dhlínse chun táirgí a cheannach ón Láithreán Gréasáin seo. Trí ordú a dhéanamh, déanann tú ionadaíocht agus barántas go gcomhlíonann tú an riachtanas seo. ||| Seans go n-iarrfar ort cuntas a chruthú chun ceannachán a dhéanamh. Aontaíonn tú faisnéis chruinn, reatha agus iomlán a sholáthar. Tá tú freagrach as do dhintiúir chuntais a chosaint. Ní mór duit aon úsáid neamhúdaraithe a chur in iúl dúinn láithreach. Féadfaimid do chuntas a fhoirceannadh nó a chur ar fionraí ag am ar bith mar gheall ar shárú ar na Téarmaí seo. ||| Déanaimid ár ndícheall faisnéis faoi tháirgí a thaispeáint go cruinn, ach ní bharántaímid go bhfuil tuairiscí táirge nó ábhar eile saor ó earráidí. ||| Taispeántar praghsanna i nDollar na Stát Aontaithe (USD) agus áirítear leo cánacha is infheidhme nuair a éilíonn an dlí iad. Féadfaimid praghsanna a athrú ag am ar bith sula ndéanann tú ordú. ||| Is tairiscint le ceannach é d’ordú. Glactar leis nuair a dheimhnímid d'ordú trí ríomhphost, nó nuair a sheolaimid na táirgí, cibé acu is túisce a tharlaíonn. Féadfaimid orduithe a dhiúltú nó a chealú ar chúiseanna lena n-áirítear praghsáil mhícheart, táirgí as stoic, nó calaois amhrasta. ||| Glacaimid leis na modhanna íocaíochta a thaispeántar le linn an tseiceáil amach. Trí shonraí íocaíochta a chur isteach, údaraíonn tú dúinn an méid atá dlite a ghearradh agus deimhníonn tú gur tusa an sealbhóir ceart cuntais. Bainimid úsáid as próiseálaithe íocaíochta tríú páirtí chun faisnéis íocaíochta a láimhseáil go slán. ||| Cuirtear meastacháin loingseoireachta ar fáil mar áis agus ní ráthaítear dátaí seachadta. Nuair a aistrítear táirgí chuig iompróir, téann an riosca caillteanais chugat. Tá tú freagrach as dleachtanna custaim agus cánacha ar allmhairí, agus as earráidí seachadta de bharr faisnéis seolta mícheart. ||| Má tá cónaí ort san AE, LEE, nó san Eilvéis, tá an ceart dlíthiúil agat táirgí a thabhairt ar ais laistigh de 14 lá tar éis aisíocaíocht iomlán a fháil. Ní mór táirgí a thabhairt ar ais sa riocht bunaidh. D’fhéadfadh go mbeadh loingseoireachta fillte ar do chostas mar a cheadaítear de réir an dlí. Féadfar táirgí digiteacha a eisiamh má thosaíonn an t-íoslódáil le do thoiliú agus má admhaíonn tú cailleadh ceart aistarraingthe. ||| Tugtar breac-chuntas ar incháilitheacht do chustaiméirí SAM inár mBeartas um Fhilleadh agus Aisíocaíocht ar leith atá curtha suas ar an Láithreán Gréasáin. Seans go mbeidh roinnt míreanna (m.sh. íoslódálacha digiteacha, míreanna pearsantaithe) neamh-inaisíoctha. ||| Má cheannaíonn tú earraí digiteacha, is seachadadh leictreonach é, bronntar ceadúnas pearsanta neamheisiatach duit chun an t-ábhar a úsáid, agus ní féidir leat íoslódálacha a athdháileadh, a athdhíol nó a roinnt gan chead. ||| Tá gach ábhar ar an Láithreán Gréasáin (téacs, dearaí, bogearraí, grafaicí, íomhánna) faoi úinéireacht Rhythm Nexus nó ceadúnaithe dó agus cosanta ag dlíthe cóipchirt agus maoine intleachtúla. Ní féidir leat saothair díorthaigh a atáirgeadh, a mhodhnú, a dháileadh ná a chruthú gan cead scríofa.",
-    "privacyText": "Tá meas ag Rhythm Nexus (\"muid\", \"sinn\", nó \"ár\") do phríobháideachas agus tá sé tiomanta do shonraí pearsanta a chosaint. Míníonn an Beartas Príobháideachta seo na sonraí pearsanta a bhailímid, conas a úsáidtear iad, cé leis a roinnimid iad, agus do chearta. Baineann an beartas seo le húsáideoirí ón AE, LEE, an Eilvéis agus SAM. ||| Bailímid an fhaisnéis phearsanta a sholáthraíonn tú go deonach, lena n-áirítear ainm, seoladh ríomhphoist, seoladh billeála agus seolta, uimhir theileafóin, agus faisnéis íocaíochta a láimhseálann próiseálaithe tríú páirtí. ||| Bailímid go huathoibríoch seoladh IP, cineál brabhsálaí, sonraí gléis, sonraí úsáide, fianáin, agus teicneolaíochtaí rianaithe. ||| Má tá tú san AE/LEE/an Eilvéis, próiseálaimid do shonraí bunaithe ar fheidhmíocht conartha (comhlíonadh ordaithe), oibleagáid dhlíthiúil, leasanna dlisteanacha, agus toiliú nuair is gá. ||| Bainimid úsáid as do shonraí chun orduithe a phróiseáil, táirgí a sheoladh, cumarsáid a dhéanamh leat, tacaíocht a sholáthar do chustaiméirí, cloí le hoibleagáidí dlíthiúla, feabhas a chur ar ár Láithreán Gréasáin, agus cumarsáid mhargaíochta a sheoladh le toiliú. ||| Féadfaimid do shonraí a chomhroinnt le próiseálaithe íocaíochta, le comhpháirtithe loingseoireachta, le soláthraithe anailíse, le soláthraithe seirbhísí margaíochta, agus le húdaráis dhlíthiúla nuair is gá. Ní dhíolaimid sonraí pearsanta. ||| Tá cearta GDPR ag úsáideoirí an AE/LEE/na hEilvéise rochtain a fháil ar shonraí pearsanta, sonraí míchruinne a cheartú, sonraí a scriosadh, próiseáil a shrianadh, agóid a dhéanamh i gcoinne próiseála, sonraí calafoirt, agus toiliú a tharraingt siar. Chun na cearta seo a fheidhmiú, déan teagmháil linn ag rhythmnexusco@gmail.com. ||| D’fhéadfadh cearta a bheith ag úsáideoirí SAM (CCPA/CPRA, nuair is infheidhme) fios a bheith acu cad iad na sonraí pearsanta a bhailítear, scriosadh a iarraidh, diúltú do chomhroinnt sonraí, agus neamh-idirdhealú maidir le cearta a fheidhmiú. Chun iarratais a chur isteach, seol ríomhphost chuig rhythmnexusco@gmail.com. ||| Coimeádaimid sonraí pearsanta chomh fada agus is gá chun orduithe a chomhlíonadh, ceanglais dhlíthiúla a chomhlíonadh, agus chun díospóidí a réiteach. ||| Féadfaimid sonraí a aistriú lasmuigh de do réigiún. Agus muid ag aistriú ón AE/LEE/an Eilvéis, úsáidimid Clásail Chaighdeánacha Conarthacha (SCCanna) agus cosaintí dleathacha eile. ||| Cuirimid cosaintí teicniúla agus eagraíochtúla réasúnta i bhfeidhm lena n-áirítear criptiú SSL, córais íocaíochta slána, agus bearta rialaithe rochtana. Mar sin féin, níl aon chóras 100% slán."
-  },
-  "pl": {
-    "navTerms": "Warunki",
-    "navPrivacy": "Prywatność",
-    "termsTitle": "Warunki świadczenia usług",
-    "privacyTitle": "Polityka prywatności",
-    "updated": "Ostatnia aktualizacja: 24 lutego 2026 r",
-    "termsText": "Niniejsze Warunki świadczenia usług („Warunki”) regulują dostęp i korzystanie z usług handlu elektronicznego oferowanych za pośrednictwem https://rhythmnexus.org („Witryna internetowa”) obsługiwanych przez Rhythm Nexus („my”, „nas” lub „nasz”). Uzyskując dostęp, przeglądając lub dokonując zakupów w Witrynie, wyrażasz zgodę na przestrzeganie niniejszych Warunków. Jeżeli nie wyrażasz zgody, nie możesz korzystać z Serwisu ani składać zamówień. ||| Aby móc kupować produkty w tej Witrynie, musisz mieć ukończone 18 lat lub być osobą pełnoletnią w swojej jurysdykcji. Składając zamówienie, oświadczasz i gwarantujesz, że spełniasz ten wymóg. ||| Możesz zostać poproszony o utworzenie konta w celu dokonania zakupu. Zgadzasz się na podanie dokładnych, aktualnych i pełnych informacji. Jesteś odpowiedzialny za ochronę danych uwierzytelniających swojego konta. Należy natychmiast powiadomić nas o każdym nieupoważnionym użyciu. Możemy zamknąć lub zawiesić Twoje konto w dowolnym momencie z powodu naruszenia niniejszych Warunków. ||| Staramy się wyświetlać informacje o produktach w sposób dokładny, ale nie gwarantujemy, że opisy produktów lub inne treści są wolne od błędów. ||| Ceny podawane są w dolarach amerykańskich (USD) i zawierają obowiązujące podatki, jeżeli jest to wymagane przez prawo. Ceny możemy zmienić w dowolnym momencie przed złożeniem zamówienia. ||| Twoje zamówienie jest ofertą zakupu. Akceptacja następuje, gdy potwierdzimy Twoje zamówienie e-mailem lub gdy wyślemy produkty, w zależności od tego, co nastąpi wcześniej. Możemy odrzucić lub anulować zamówienia z powodów obejmujących nieprawidłowe ceny, brak produktów w magazynie lub podejrzenie oszustwa. ||| Akceptujemy metody płatności wskazane podczas realizacji transakcji. Podając szczegóły płatności, upoważniasz nas do pobrania należnej kwoty i potwierdzasz, że jesteś prawowitym posiadaczem konta. Korzystamy z zewnętrznych procesorów płatniczych, aby bezpiecznie przetwarzać informacje o płatnościach. ||| Szacunkowe koszty wysyłki podano dla wygody i nie gwarantują daty dostawy. Po przekazaniu produktów przewoźnikowi ryzyko utraty przechodzi na Ciebie. Ponosisz odpowiedzialność za opłaty celne i podatki importowe oraz za błędy w dostawie spowodowane nieprawidłowymi danymi adresowymi. ||| Jeśli mieszkasz na terenie UE, EOG lub Szwajcarii, masz prawo do zwrotu produktów w ciągu 14 dni od otrzymania w celu uzyskania pełnego zwrotu pieniędzy. Produkty muszą być zwrócone w oryginalnym stanie. Wysyłka zwrotna może odbywać się na Twój koszt, zgodnie z prawem. Produkty cyfrowe mogą zostać wykluczone, jeśli pobieranie rozpocznie się za Twoją zgodą i potwierdzisz utratę prawa do odstąpienia od umowy. ||| Uprawnienia do zwrotów dla klientów z USA są opisane w naszej osobnej Polityce zwrotów i zwrotów opublikowanej w Witrynie. Niektóre elementy (np. pliki cyfrowe do pobrania, elementy spersonalizowane) mogą nie podlegać zwrotowi. ||| Jeśli kupujesz produkty cyfrowe, dostawa odbywa się elektronicznie, otrzymujesz osobistą, niewyłączną licencję na korzystanie z treści i nie możesz redystrybuować, odsprzedawać ani udostępniać pobranych plików bez pozwolenia. ||| Cała zawartość Strony internetowej (tekst, projekty, oprogramowanie, grafika, obrazy) stanowi własność Rhythm Nexus lub jest przez nią licencjonowana i jest chroniona prawem autorskim i prawami własności intelektualnej. Nie możesz reprodukować, modyfikować, rozpowszechniać ani tworzyć dzieł pochodnych bez pisemnej zgody.",
-    "privacyText": "Rhythm Nexus („my”, „nas” lub „nasz”) szanuje Twoją prywatność i zobowiązuje się do ochrony Twoich danych osobowych. Niniejsza Polityka prywatności wyjaśnia, jakie dane osobowe gromadzimy, w jaki sposób je wykorzystujemy, komu je udostępniamy oraz jakie są Twoje prawa. Niniejsza polityka dotyczy użytkowników z UE, EOG, Szwajcarii i USA. ||| Gromadzimy dane osobowe, które dobrowolnie podajesz, w tym imię i nazwisko, adres e-mail, adres rozliczeniowy i adres wysyłki, numer telefonu i informacje o płatnościach obsługiwane przez zewnętrzne podmioty przetwarzające. ||| Automatycznie zbieramy adres IP, typ przeglądarki, dane urządzenia, dane o użytkowaniu, pliki cookie i technologie śledzenia. ||| Jeśli przebywasz na terenie UE/EOG/Szwajcarii, przetwarzamy Twoje dane w oparciu o realizację umowy (realizacja zamówienia), obowiązek prawny, uzasadnione interesy i zgodę, jeśli jest to wymagane. ||| Używamy Twoich danych w celu przetwarzania zamówień, wysyłki produktów, komunikacji z Tobą, zapewniania obsługi klienta, wypełniania obowiązków prawnych, ulepszania naszej Strony internetowej i wysyłania komunikacji marketingowej za zgodą. ||| W razie potrzeby możemy udostępniać Twoje dane podmiotom przetwarzającym płatności, partnerom spedycyjnym, dostawcom usług analitycznych, dostawcom usług marketingowych i organom prawnym. Nie sprzedajemy danych osobowych. ||| Użytkownicy z UE/EOG/Szwajcarii mają prawo dostępu do danych osobowych zgodnie z RODO, poprawiania nieprawidłowych danych, usuwania danych, ograniczania przetwarzania, sprzeciwu wobec przetwarzania, przenoszenia danych i cofania zgody. Aby skorzystać z tych praw, skontaktuj się z nami pod adresem rytmnexusco@gmail.com. ||| Użytkownicy z USA (CCPA/CPRA, w stosownych przypadkach) mogą mieć prawo do informacji, jakie dane osobowe są gromadzone, żądania usunięcia, rezygnacji z udostępniania danych i niedyskryminacji w zakresie korzystania z praw. Aby przesłać prośbę, wyślij e-mail na adres rytmnexusco@gmail.com. ||| Dane osobowe przechowujemy tak długo, jak jest to niezbędne do realizacji zamówień, spełnienia wymogów prawnych i rozwiązywania sporów. ||| Możemy przesyłać dane poza Twój region. W przypadku przeniesienia danych z UE/EOG/Szwajcarii stosujemy standardowe klauzule umowne (SCC) i inne zgodne z prawem zabezpieczenia. ||| Wdrażamy rozsądne zabezpieczenia techniczne i organizacyjne, w tym szyfrowanie SSL, bezpieczne systemy płatności i środki kontroli dostępu. Żaden system nie jest jednak w 100% bezpieczny."
-  },
-  "ko": {
-    "navTerms": "자귀",
-    "navPrivacy": "은둔",
-    "termsTitle": "서비스 약관",
-    "privacyTitle": "개인 정보 보호 정책",
-    "updated": "최종 업데이트 날짜: 2026년 2월 24일",
-    "termsText": "본 서비스 약관(\"약관\")은 Rhythm Nexus(\"당사\", \"당사\" 또는 \"당사의\")가 운영하는 https://rhythmnexus.org(\"웹사이트\")를 통해 제공되는 전자 상거래 서비스에 대한 액세스 및 사용에 적용됩니다. 웹사이트에 액세스하거나 검색하거나 구매함으로써 귀하는 본 약관을 준수할 것에 동의하게 됩니다. 동의하지 않으면 웹사이트를 이용하거나 주문할 수 없습니다. ||| 이 웹사이트에서 제품을 구매하려면 최소 18세 이상이거나 해당 관할권에서 성년이어야 합니다. 주문함으로써 귀하는 이 요구 사항을 충족함을 진술하고 보증합니다. ||| 구매를 위해 계정을 생성하라는 메시지가 표시될 수 있습니다. 귀하는 정확하고 최신의 완전한 정보를 제공하는 데 동의합니다. 귀하는 귀하의 계정 자격 증명을 보호할 책임이 있습니다. 무단 사용 시 즉시 당사에 알려주셔야 합니다. 당사는 본 약관을 위반한 경우 언제든지 귀하의 계정을 종료하거나 정지할 수 있습니다. ||| 당사는 제품 정보를 정확하게 표시하기 위해 노력하지만 제품 설명이나 기타 내용에 오류가 없음을 보증하지는 않습니다. ||| 가격은 미국 달러(USD)로 표시되며 법률에서 요구하는 경우 관련 세금이 포함됩니다. 귀하가 주문하기 전에 언제든지 가격이 변경될 수 있습니다. ||| 귀하의 주문은 구매 제안입니다. 승인은 이메일로 주문을 확인하거나 제품을 배송할 때 이루어집니다. 잘못된 가격, 품절 제품, 사기 의심 등의 이유로 주문을 거부하거나 취소할 수 있습니다. ||| 결제 시 표시된 결제 방법을 사용할 수 있습니다. 결제 세부정보를 제출함으로써 귀하는 당사가 미결제 금액을 청구할 수 있는 권한을 부여하고 귀하가 적법한 계정 소유자임을 확인하게 됩니다. 당사는 결제 정보를 안전하게 처리하기 위해 제3자 결제 처리업체를 사용합니다. ||| 배송 견적은 편의를 위해 제공되며 배송 날짜를 보장하지 않습니다. 제품이 운송업체로 이전되면 손실 위험이 귀하에게 전달됩니다. 관세 및 수입세, 잘못된 주소 정보로 인한 배송 오류에 대한 책임은 귀하에게 있습니다. ||| EU, EEA 또는 스위스에 거주하는 경우 제품 수령 후 14일 이내에 제품을 반품하고 전액 환불받을 수 있는 법적 권리가 있습니다. 제품은 원래 상태로 반품되어야 합니다. 반품 배송비는 법률에서 허용하는 바에 따라 귀하가 부담할 수 있습니다. 귀하의 동의 하에 다운로드가 시작되고 철회권 상실을 인정하는 경우 디지털 제품은 제외될 수 있습니다. ||| 미국 고객의 반품 자격은 웹사이트에 게시된 별도의 반품 및 환불 정책에 설명되어 있습니다. 일부 상품(예: 디지털 다운로드, 맞춤 상품)은 환불되지 않을 수 있습니다. ||| 디지털 아이템을 구매하는 경우 전자 배송이 이루어지며 콘텐츠를 사용할 수 있는 개인 비독점 라이센스가 부여되며 허가 없이 다운로드를 재배포, 재판매 또는 공유할 수 없습니다. ||| 모든 웹사이트 콘텐츠(텍스트, 디자인, 소프트웨어, 그래픽, 이미지)는 Rhythm Nexus가 소유하거나 Rhythm Nexus가 라이센스를 보유하고 있으며 저작권 및 지적 재산권법에 의해 보호됩니다. 귀하는 서면 허가 없이 복제, 수정, 배포하거나 파생물을 생성할 수 없습니다.",
-    "privacyText": "Rhythm Nexus(\"당사\", \"당사\" 또는 \"당사의\")는 귀하의 개인정보를 존중하며 귀하의 개인 데이터를 보호하기 위해 최선을 다하고 있습니다. 본 개인정보 보호정책은 당사가 수집하는 개인 데이터의 종류, 사용 방법, 공유 대상 및 귀하의 권리에 대해 설명합니다. 이 정책은 EU, EEA, 스위스, 미국의 사용자에게 적용됩니다. ||| 당사는 이름, 이메일 주소, 청구서 수신 및 배송 주소, 전화번호, 제3자 처리업체가 처리하는 결제 정보 등 귀하가 자발적으로 제공하는 개인정보를 수집합니다. ||| 당사는 IP 주소, 브라우저 유형, 장치 데이터, 사용 데이터, 쿠키 및 추적 기술을 자동으로 수집합니다. ||| 귀하가 EU/EEA/스위스에 거주하는 경우 당사는 계약 이행(주문 이행), 법적 의무, 적법한 이익 및 필요한 경우 동의를 기반으로 귀하의 데이터를 처리합니다. ||| 당사는 귀하의 데이터를 사용하여 주문을 처리하고, 제품을 배송하고, 귀하와 소통하고, 고객 지원을 제공하고, 법적 의무를 준수하고, 웹사이트를 개선하고, 동의 하에 마케팅 커뮤니케이션을 보냅니다. ||| 당사는 필요한 경우 결제 처리업체, 배송 파트너, 분석 제공업체, 마케팅 서비스 제공업체 및 법률 당국과 귀하의 데이터를 공유할 수 있습니다. 우리는 개인 데이터를 판매하지 않습니다. ||| EU/EEA/스위스 사용자는 개인 데이터에 액세스하고, 부정확한 데이터를 수정하고, 데이터를 삭제하고, 처리를 제한하고, 처리에 반대하고, 데이터를 이동하고, 동의를 철회할 수 있는 GDPR 권리를 갖습니다. 이러한 권리를 행사하려면 리듬넥서스코@gmail.com으로 문의하세요. ||| 미국 사용자(해당되는 경우 CCPA/CPRA)는 어떤 개인 데이터가 수집되는지 확인하고, 삭제를 요청하고, 데이터 공유를 거부하고, 권리 행사에 대한 차별을 받지 않을 권리를 가질 수 있습니다. 요청을 제출하려면 리듬넥서스코@gmail.com으로 이메일을 보내주세요. ||| 당사는 주문을 이행하고 법적 요구 사항을 준수하며 분쟁을 해결하는 데 필요한 기간 동안 개인 데이터를 보관합니다. ||| 당사는 귀하의 지역 외부로 데이터를 전송할 수 있습니다. EU/EEA/스위스에서 이전할 때 당사는 표준 계약 조항(SCC) 및 기타 합법적인 보호 조치를 사용합니다. ||| 우리는 SSL 암호화, 안전한 결제 시스템, 액세스 제어 조치를 포함한 합리적인 기술 및 조직적 보호 장치를 구현합니다. 그러나 어떤 시스템도 100% 안전하지는 않습니다."
-  },
-  "no": {
-    "navTerms": "Vilkår",
-    "navPrivacy": "Privatliv",
-    "termsTitle": "Vilkår for bruk",
-    "privacyTitle": "Personvernerklæring",
-    "updated": "Sist oppdatert: 24. februar 2026",
-    "termsText": "Disse vilkårene for bruk (\"vilkårene\") styrer din tilgang til og bruk av e-handelstjenestene som tilbys gjennom https://rhythmnexus.org (\"nettstedet\") som drives av Rhythm Nexus (\"vi\", \"oss\" eller \"vår\"). Ved å gå inn på, surfe på eller kjøpe fra nettstedet godtar du å være bundet av disse vilkårene. Hvis du ikke samtykker, kan du ikke bruke nettstedet eller legge inn en bestilling. ||| Du må være minst 18 år gammel eller myndig i din jurisdiksjon for å kjøpe produkter fra denne nettsiden. Ved å legge inn en bestilling, representerer og garanterer du at du oppfyller dette kravet. ||| Du kan bli bedt om å opprette en konto for å foreta et kjøp. Du samtykker i å gi nøyaktig, oppdatert og fullstendig informasjon. Du er ansvarlig for å beskytte kontoen din. Du må varsle oss umiddelbart om uautorisert bruk. Vi kan avslutte eller suspendere kontoen din når som helst for brudd på disse vilkårene. ||| Vi streber etter å vise produktinformasjon nøyaktig, men vi garanterer ikke at produktbeskrivelser eller annet innhold er feilfritt. ||| Prisene er vist i amerikanske dollar (USD) og inkluderer gjeldende avgifter der det kreves av loven. Vi kan endre prisene når som helst før du legger inn en bestilling. ||| Bestillingen din er et tilbud om å kjøpe. Aksept skjer når vi bekrefter bestillingen din via e-post, eller når vi sender produktene, avhengig av hva som skjer først. Vi kan avslå eller kansellere bestillinger av årsaker, inkludert feil prissetting, utsolgte produkter eller mistanke om svindel. ||| Vi aksepterer betalingsmåtene som vises under kassen. Ved å sende inn betalingsopplysninger gir du oss fullmakt til å belaste det skyldige beløpet og bekrefter at du er den rettmessige kontoinnehaveren. Vi bruker tredjeparts betalingsbehandlere for å håndtere betalingsinformasjon på en sikker måte. ||| Fraktanslag er gitt for enkelhets skyld og garanterer ikke leveringsdatoer. Når produktene er overført til en transportør, går risikoen for tap over til deg. Du er ansvarlig for toll og importavgifter, og for leveringsfeil forårsaket av feil adresseinformasjon. ||| Hvis du er bosatt i EU, EØS eller Sveits, har du juridisk rett til å returnere produkter innen 14 dager etter mottak for full refusjon. Produkter må returneres i original stand. Returfrakt kan være på din egen regning, slik loven tillater det. Digitale produkter kan bli ekskludert hvis nedlastingen begynner med ditt samtykke og du erkjenner tap av angrerett. ||| Returkvalifisering for amerikanske kunder er beskrevet i våre separate retningslinjer for retur og refusjon som er lagt ut på nettstedet. Enkelte varer (f.eks. digitale nedlastinger, personlige varer) kan ikke refunderes. ||| Hvis du kjøper digitale varer, er leveringen elektronisk, du får en personlig ikke-eksklusiv lisens til å bruke innholdet, og du kan ikke videredistribuere, videreselge eller dele nedlastinger uten tillatelse. ||| Alt innhold på nettstedet (tekst, design, programvare, grafikk, bilder) eies av eller lisensieres til Rhythm Nexus og er beskyttet av lover om opphavsrett og immaterielle rettigheter. Du kan ikke reprodusere, modifisere, distribuere eller lage avledede verk uten skriftlig tillatelse.",
-    "privacyText": "Rhythm Nexus (\"vi\", \"oss\" eller \"vår\") respekterer ditt personvern og er forpliktet til å beskytte dine personlige data. Denne personvernerklæringen forklarer hvilke personopplysninger vi samler inn, hvordan de brukes, hvem vi deler dem med og dine rettigheter. Denne policyen gjelder for brukere fra EU, EØS, Sveits og USA. ||| Vi samler inn personopplysningene du frivillig oppgir, inkludert navn, e-postadresse, fakturerings- og leveringsadresse, telefonnummer og betalingsinformasjon som håndteres av tredjepartsbehandlere. ||| Vi samler automatisk inn IP-adresse, nettlesertype, enhetsdata, bruksdata, informasjonskapsler og sporingsteknologier. ||| Hvis du er i EU/EØS/Sveits, behandler vi dataene dine basert på kontraktsutførelse (ordreoppfyllelse), juridiske forpliktelser, legitime interesser og samtykke der det er nødvendig. ||| Vi bruker dataene dine til å behandle bestillinger, sende produkter, kommunisere med deg, gi kundestøtte, overholde juridiske forpliktelser, forbedre nettstedet vårt og sende markedsføringskommunikasjon med samtykke. ||| Vi kan dele dataene dine med betalingsbehandlere, fraktpartnere, analyseleverandører, leverandører av markedsføringstjenester og juridiske myndigheter når det er nødvendig. Vi selger ikke personopplysninger. ||| EU/EØS/Sveits-brukere har GDPR-rettigheter til å få tilgang til personopplysninger, korrigere unøyaktige data, slette data, begrense behandling, protestere mot behandling, overføre data og trekke tilbake samtykke. For å utøve disse rettighetene, kontakt oss på rhythmnexusco@gmail.com. ||| USA-brukere (CCPA/CPRA, der det er aktuelt) kan ha rettigheter til å vite hvilke personopplysninger som samles inn, be om sletting, velge bort datadeling og ikke-diskriminering for å utøve rettigheter. Send e-post til rhythmnexusco@gmail.com for å sende inn forespørsler. ||| Vi beholder personopplysninger så lenge det er nødvendig for å oppfylle bestillinger, overholde juridiske krav og løse tvister. ||| Vi kan overføre data utenfor din region. Når vi overfører fra EU/EØS/Sveits, bruker vi Standard Contractual Clauses (SCCs) og andre lovlige sikkerhetstiltak. ||| Vi implementerer rimelige tekniske og organisatoriske sikkerhetstiltak, inkludert SSL-kryptering, sikre betalingssystemer og tilgangskontrolltiltak. Ingen system er imidlertid 100 % sikre."
-  },
-  "ru": {
-    "navTerms": "Условия",
-    "navPrivacy": "Конфиденциальность",
-    "termsTitle": "Условия использования",
-    "privacyTitle": "политика конфиденциальности",
-    "updated": "Последнее обновление: 24 февраля 2026 г.",
-    "termsText": "Настоящие Условия обслуживания («Условия») регулируют ваш доступ и использование услуг электронной коммерции, предлагаемых через https://rhythmnexus.org («Веб-сайт»), управляемых Rhythm Nexus («мы», «нас» или «наш»). Получая доступ, просматривая или совершая покупки на Веб-сайте, вы соглашаетесь соблюдать настоящие Условия. Если вы не согласны, вы не имеете права использовать Веб-сайт или размещать заказ. ||| Для приобретения продуктов на этом веб-сайте вам должно быть не менее 18 лет или возраст совершеннолетия в соответствии с вашей юрисдикцией. Размещая заказ, вы заявляете и гарантируете, что соответствуете этому требованию. ||| Вам может быть предложено создать учетную запись для совершения покупки. Вы соглашаетесь предоставлять точную, актуальную и полную информацию. Вы несете ответственность за сохранность учетных данных своей учетной записи. Вы должны немедленно уведомить нас о любом несанкционированном использовании. Мы можем прекратить или приостановить действие вашей учетной записи в любое время за нарушение настоящих Условий. ||| Мы стремимся точно отображать информацию о продуктах, но не гарантируем, что описания продуктов или другой контент не содержат ошибок. ||| Цены указаны в долларах США (USD) и включают применимые налоги, если того требует закон. Мы можем изменить цены в любое время до того, как вы разместите заказ. ||| Ваш заказ является предложением о покупке. Принятие происходит, когда мы подтверждаем ваш заказ по электронной почте или когда мы отправляем товары, в зависимости от того, что произойдет раньше. Мы можем отклонить или отменить заказы по таким причинам, как неправильная цена, отсутствие товаров на складе или подозрение в мошенничестве. ||| Мы принимаем способы оплаты, указанные при оформлении заказа. Отправляя платежные реквизиты, вы разрешаете нам списать причитающуюся сумму и подтверждаете, что являетесь законным владельцем счета. Мы используем сторонние платежные системы для безопасной обработки платежной информации. ||| Стоимость доставки указана для удобства и не гарантирует даты доставки. Как только товары передаются перевозчику, риск потери переходит на вас. Вы несете ответственность за уплату таможенных пошлин и налогов на импорт, а также за ошибки доставки, вызванные неправильной информацией об адресе. ||| Если вы проживаете в ЕС, ЕЭЗ или Швейцарии, вы имеете законное право вернуть продукцию в течение 14 дней с момента получения и получить полный возврат средств. Товары должны быть возвращены в первоначальном состоянии. Обратная доставка может осуществляться за ваш счет, как это разрешено законом. Цифровые продукты могут быть исключены, если загрузка начинается с вашего согласия и вы признаете потерю права на отказ. ||| Право на возврат для клиентов из США изложено в нашей отдельной Политике возврата и возмещения, опубликованной на Веб-сайте. Некоторые товары (например, цифровые загрузки, персонализированные товары) могут не подлежать возврату. ||| Если вы приобретаете цифровые товары, доставка осуществляется электронно, вам предоставляется личная неисключительная лицензия на использование контента, и вы не имеете права распространять, перепродавать или делиться загрузками без разрешения. ||| Весь контент веб-сайта (текст, дизайн, программное обеспечение, графика, изображения) принадлежит компании Rhythm Nexus или лицензируется ею и защищен законами об авторском праве и интеллектуальной собственности. Вы не имеете права воспроизводить, изменять, распространять или создавать производные работы без письменного разрешения.",
-    "privacyText": "Rhythm Nexus («мы», «нас» или «наш») уважает вашу конфиденциальность и обязуется защищать ваши личные данные. В настоящей Политике конфиденциальности объясняется, какие персональные данные мы собираем, как они используются, кому мы ими делимся, а также ваши права. Эта политика распространяется на пользователей из ЕС, ЕЭЗ, Швейцарии и США. ||| Мы собираем личную информацию, которую вы добровольно предоставляете, включая имя, адрес электронной почты, адрес для выставления счетов и доставки, номер телефона и платежную информацию, обрабатываемую сторонними процессорами. ||| Мы автоматически собираем IP-адрес, тип браузера, данные об устройстве, данные об использовании, файлы cookie и технологии отслеживания. ||| Если вы находитесь в ЕС/ЕЭЗ/Швейцарии, мы обрабатываем ваши данные на основании выполнения контракта (выполнения заказа), юридических обязательств, законных интересов и согласия, когда это необходимо. ||| Мы используем ваши данные для обработки заказов, отправки продуктов, общения с вами, обеспечения поддержки клиентов, выполнения юридических обязательств, улучшения нашего веб-сайта и отправки маркетинговых сообщений с вашего согласия. ||| При необходимости мы можем передавать ваши данные платежным системам, партнерам по доставке, поставщикам аналитики, поставщикам маркетинговых услуг и юридическим органам. Мы не продаем персональные данные. ||| Пользователи ЕС/ЕЭЗ/Швейцарии имеют права GDPR на доступ к личным данным, исправление неточных данных, удаление данных, ограничение обработки, возражение против обработки, перенос данных и отзыв согласия. Чтобы воспользоваться этими правами, свяжитесь с нами по адресу ритмнексуско@gmail.com. ||| Пользователи из США (CCPA/CPRA, где применимо) могут иметь право знать, какие персональные данные собираются, требовать удаления, отказа от обмена данными и недискриминации при осуществлении прав. Чтобы отправить запросы, отправьте электронное письмо по адресу Rhythnexusco@gmail.com. ||| Мы храним персональные данные до тех пор, пока это необходимо для выполнения заказов, соблюдения требований законодательства и разрешения споров. ||| Мы можем передавать данные за пределы вашего региона. При передаче из ЕС/ЕЭЗ/Швейцарии мы используем Стандартные договорные условия (SCC) и другие законные гарантии. ||| Мы реализуем разумные технические и организационные меры безопасности, включая SSL-шифрование, безопасные платежные системы и меры контроля доступа. Однако ни одна система не является на 100% безопасной."
-  },
-  "sv": {
-    "navTerms": "Villkor",
-    "navPrivacy": "Privatliv",
-    "termsTitle": "Användarvillkor",
-    "privacyTitle": "Sekretesspolicy",
-    "updated": "Senast uppdaterad: 24 februari 2026",
-    "termsText": "Dessa användarvillkor (\"Villkor\") reglerar din åtkomst till och användning av e-handelstjänsterna som erbjuds via https://rhythmnexus.org (\"Webbplatsen\") som drivs av Rhythm Nexus (\"vi\", \"oss\" eller \"vår\"). Genom att komma åt, surfa eller köpa från webbplatsen samtycker du till att vara bunden av dessa villkor. Om du inte samtycker får du inte använda webbplatsen eller göra en beställning. ||| Du måste vara minst 18 år gammal eller myndig ålder i din jurisdiktion för att köpa produkter från denna webbplats. Genom att göra en beställning intygar och garanterar du att du uppfyller detta krav. ||| Du kan bli ombedd att skapa ett konto för att göra ett köp. Du samtycker till att tillhandahålla korrekt, aktuell och fullständig information. Du ansvarar för att skydda dina kontouppgifter. Du måste omedelbart meddela oss om all obehörig användning. Vi kan avsluta eller stänga av ditt konto när som helst för brott mot dessa villkor. ||| Vi strävar efter att visa produktinformation korrekt, men vi garanterar inte att produktbeskrivningar eller annat innehåll är felfritt. ||| Priserna visas i amerikanska dollar (USD) och inkluderar tillämpliga skatter där det krävs enligt lag. Vi kan ändra priser när som helst innan du gör en beställning. ||| Din beställning är ett köperbjudande. Acceptans sker när vi bekräftar din beställning via e-post, eller när vi skickar produkterna, beroende på vad som inträffar först. Vi kan avvisa eller annullera beställningar av anledningar, inklusive felaktig prissättning, slutsålda produkter eller misstänkt bedrägeri. ||| Vi accepterar de betalningsmetoder som visas i kassan. Genom att skicka in betalningsuppgifter godkänner du oss att debitera det förfallna beloppet och bekräftar att du är den rättmätige kontoinnehavaren. Vi använder tredje parts betalningsbehandlare för att säkert hantera betalningsinformation. ||| Leveransuppskattningar tillhandahålls för bekvämlighet och garanterar inte leveransdatum. När produkterna har överförts till en transportör övergår risken för förlust till dig. Du ansvarar för tullar och importskatter samt för leveransfel orsakade av felaktig adressinformation. ||| Om du bor i EU, EES eller Schweiz har du laglig rätt att returnera produkter inom 14 dagar efter mottagandet för full återbetalning. Produkter måste returneras i originalskick. Returfrakt kan ske på din bekostnad enligt lag. Digitala produkter kan uteslutas om nedladdningen börjar med ditt samtycke och du erkänner förlust av ångerrätten. ||| Returberättigande för amerikanska kunder beskrivs i vår separata retur- och återbetalningspolicy som publiceras på webbplatsen. Vissa artiklar (t.ex. digitala nedladdningar, personliga artiklar) kan inte återbetalas. ||| Om du köper digitala föremål är leveransen elektronisk, du beviljas en personlig icke-exklusiv licens att använda innehållet, och du får inte vidaredistribuera, sälja vidare eller dela nedladdningar utan tillstånd. ||| Allt innehåll på webbplatsen (text, design, programvara, grafik, bilder) ägs av eller licensieras till Rhythm Nexus och skyddas av upphovsrätts- och immateriella lagar. Du får inte reproducera, modifiera, distribuera eller skapa härledda verk utan skriftligt tillstånd.",
-    "privacyText": "Rhythm Nexus (\"vi\", \"oss\" eller \"vår\") respekterar din integritet och är engagerad i att skydda dina personuppgifter. Denna integritetspolicy förklarar vilka personuppgifter vi samlar in, hur de används, vem vi delar dem med och dina rättigheter. Denna policy gäller användare från EU, EES, Schweiz och USA. ||| Vi samlar in den personliga information som du frivilligt tillhandahåller, inklusive namn, e-postadress, fakturerings- och leveransadress, telefonnummer och betalningsinformation som hanteras av tredje parts processorer. ||| Vi samlar automatiskt in IP-adress, webbläsartyp, enhetsdata, användningsdata, cookies och spårningstekniker. ||| Om du befinner dig i EU/EES/Schweiz behandlar vi dina uppgifter baserat på kontraktsutförande (orderuppfyllelse), rättslig skyldighet, legitima intressen och samtycke där så krävs. ||| Vi använder dina uppgifter för att behandla beställningar, skicka produkter, kommunicera med dig, tillhandahålla kundsupport, följa rättsliga skyldigheter, förbättra vår webbplats och skicka marknadsföringskommunikation med samtycke. ||| Vi kan komma att dela dina uppgifter med betalningsprocessorer, fraktpartners, analysleverantörer, marknadsföringstjänsteleverantörer och juridiska myndigheter när så krävs. Vi säljer inte personuppgifter. ||| EU/EES/Schweiziska användare har GDPR-rättigheter att få tillgång till personuppgifter, korrigera felaktiga uppgifter, radera data, begränsa behandling, invända mot behandling, porta data och återkalla samtycke. För att utöva dessa rättigheter, kontakta oss på rhythmnexusco@gmail.com. ||| USA-användare (CCPA/CPRA, där tillämpligt) kan ha rätt att veta vilka personuppgifter som samlas in, begära radering, välja bort datadelning och icke-diskriminering för att utöva rättigheter. För att skicka in förfrågningar, e-posta rhythmnexusco@gmail.com. ||| Vi behåller personuppgifter så länge det är nödvändigt för att uppfylla beställningar, följa lagkrav och lösa tvister. ||| Vi kan överföra data utanför din region. Vid överföring från EU/EES/Schweiz använder vi standardavtalsklausuler (SCC) och andra lagliga skyddsåtgärder. ||| Vi implementerar rimliga tekniska och organisatoriska skyddsåtgärder inklusive SSL-kryptering, säkra betalningssystem och åtkomstkontrollåtgärder. Inget system är dock 100% säkert."
-  },
-  "fi": {
-    "navTerms": "Ehdot",
-    "navPrivacy": "Yksityisyys",
-    "termsTitle": "Palveluehdot",
-    "privacyTitle": "Tietosuojakäytäntö",
-    "updated": "Viimeksi päivitetty: 24. helmikuuta 2026",
-    "termsText": "Nämä käyttöehdot (\"Ehdot\") säätelevät pääsyäsi verkkokauppapalveluihin, joita tarjotaan Rhythm Nexuksen (\"me\", \"meitä\" tai \"meidän\") kautta https://rhythmnexus.org (\"verkkosivusto\") tarjoamien verkkokauppapalveluiden kautta. Käyttämällä verkkosivustoa, selaamalla tai ostamalla sivustolta sitoudut noudattamaan näitä ehtoja. Jos et hyväksy, et voi käyttää verkkosivustoa tai tehdä tilausta. ||| Sinun on oltava vähintään 18-vuotias tai täysi-ikäinen lainkäyttöalueellasi ostaaksesi tuotteita tältä verkkosivustolta. Tekemällä tilauksen vakuutat ja takaat, että täytät tämän vaatimuksen. ||| Sinua saatetaan pyytää luomaan tili ostoksen tekemistä varten. Sitoudut antamaan tarkat, ajantasaiset ja täydelliset tiedot. Olet vastuussa tilisi tunnistetietojen turvaamisesta. Sinun tulee ilmoittaa meille välittömästi kaikesta luvattomasta käytöstä. Voimme sulkea tai jäädyttää tilisi milloin tahansa näiden ehtojen rikkomisesta. ||| Pyrimme näyttämään tuotetiedot oikein, mutta emme takaa, että tuotekuvaukset tai muu sisältö ovat virheettömiä. ||| Hinnat on ilmoitettu Yhdysvaltain dollareina (USD) ja sisältävät sovellettavat verot lain edellyttämissä tapauksissa. Voimme muuttaa hintoja milloin tahansa ennen tilauksen tekemistä. ||| Tilauksesi on ostotarjous. Hyväksyminen tapahtuu, kun vahvistamme tilauksesi sähköpostitse tai kun lähetämme tuotteet sen mukaan, kumpi tapahtuu ensin. Saatamme hylätä tai peruuttaa tilaukset syistä, kuten virheellisestä hinnoittelusta, lopputuotteista tai epäillystä petoksesta. ||| Hyväksymme kassalla näkyvät maksutavat. Lähettämällä maksutiedot valtuutat meidät veloittamaan erääntyvän summan ja vahvistamaan, että olet tilin oikeutettu haltija. Käytämme kolmannen osapuolen maksukäsittelijöitä maksutietojen turvalliseen käsittelyyn. ||| Toimitusarviot on annettu mukavuuden vuoksi, eivätkä ne takaa toimituspäiviä. Kun tuotteet on siirretty kuljetusliikkeelle, katoamisriski siirtyy sinulle. Olet vastuussa tulleista ja tuontiveroista sekä virheellisistä osoitetiedoista johtuvista toimitusvirheistä. ||| Jos asut EU:ssa, ETA:ssa tai Sveitsissä, sinulla on laillinen oikeus palauttaa tuotteet 14 päivän kuluessa vastaanottamisesta saadaksesi täyden hyvityksen. Tuotteet tulee palauttaa alkuperäisessä kunnossa. Palautus voi tapahtua omalla kustannuksellasi lain sallimalla tavalla. Digitaaliset tuotteet voidaan sulkea pois, jos lataus alkaa suostumuksellasi ja hyväksyt peruuttamisoikeuden menettämisen. ||| Yhdysvaltalaisten asiakkaiden palautusoikeus on kuvattu verkkosivustollamme julkaistussa erillisessä palautus- ja hyvityskäytännössämme. Jotkut tuotteet (esim. digitaaliset lataukset, henkilökohtaiset tuotteet) eivät välttämättä ole hyvitettäviä. ||| Jos ostat digitaalisia tuotteita, toimitus tapahtuu sähköisesti, sinulle myönnetään henkilökohtainen, ei-yksinomainen lisenssi käyttää sisältöä, etkä saa jakaa, jälleenmyydä tai jakaa latauksia ilman lupaa. ||| Kaikki Web-sivuston sisältö (teksti, mallit, ohjelmistot, grafiikat, kuvat) on Rhythm Nexuksen omistuksessa tai lisensoituna, ja se on suojattu tekijänoikeus- ja immateriaalioikeuksilla. Et saa jäljentää, muokata, jakaa tai luoda johdannaisteoksia ilman kirjallista lupaa.",
-    "privacyText": "Rhythm Nexus (\"me\", \"me\" tai \"meidän\") kunnioittaa yksityisyyttäsi ja on sitoutunut suojaamaan henkilötietojasi. Tämä tietosuojakäytäntö selittää, mitä henkilötietoja keräämme, miten niitä käytetään, kenen kanssa jaamme ne ja oikeutesi. Tämä käytäntö koskee käyttäjiä EU:sta, ETA:sta, Sveitsistä ja Yhdysvalloista. ||| Keräämme vapaaehtoisesti antamiasi henkilötietoja, mukaan lukien nimi, sähköpostiosoite, laskutus- ja toimitusosoite, puhelinnumero ja kolmannen osapuolen käsittelijöiden käsittelemät maksutiedot. ||| Keräämme automaattisesti IP-osoitteen, selaintyypin, laitetiedot, käyttötiedot, evästeet ja seurantateknologiat. ||| Jos olet EU/ETA/Sveitsissä, käsittelemme tietojasi sopimuksen toteuttamisen (tilauksen täyttämisen), lakisääteisen velvoitteen, oikeutetun edun ja tarvittaessa suostumuksen perusteella. ||| Käytämme tietojasi tilausten käsittelyyn, tuotteiden toimittamiseen, yhteydenpitoon kanssasi, asiakastuen tarjoamiseen, lakisääteisten velvoitteiden noudattamiseen, verkkosivustomme parantamiseen ja markkinointiviestien lähettämiseen suostumuksella. ||| Voimme tarvittaessa jakaa tietosi maksujen käsittelijöille, toimituskumppaneille, analytiikkatoimittajille, markkinointipalveluntarjoajille ja lakiviranomaisille. Emme myy henkilötietoja. ||| EU/ETA/Sveitsin käyttäjillä on GDPR-oikeudet päästä käsiksi henkilötietoihin, korjata virheellisiä tietoja, poistaa tietoja, rajoittaa käsittelyä, vastustaa käsittelyä, siirtää tietoja ja peruuttaa suostumus. Voit käyttää näitä oikeuksia ottamalla meihin yhteyttä osoitteeseen rhythmnexusco@gmail.com. ||| USA:n käyttäjillä (CCPA/CPRA, soveltuvin osin) voi olla oikeus tietää, mitä henkilötietoja kerätään, pyytää poistamista, kieltäytyä tietojen jakamisesta ja syrjimättömyyttä oikeuksiensa käyttämisessä. Lähetä pyyntöjä sähköpostitse rhythmnexusco@gmail.com. ||| Säilytämme henkilötietoja niin kauan kuin on tarpeen tilausten täyttämiseksi, lakisääteisten vaatimusten noudattamiseksi ja riitojen ratkaisemiseksi. ||| Saatamme siirtää tietoja alueesi ulkopuolelle. Siirtyessämme EU/ETA/Sveitsistä käytämme vakiosopimuslausekkeita (SCC) ja muita laillisia suojakeinoja. ||| Toteutamme kohtuulliset tekniset ja organisatoriset suojatoimenpiteet, kuten SSL-salauksen, turvalliset maksujärjestelmät ja kulunvalvontatoimenpiteet. Mikään järjestelmä ei kuitenkaan ole 100 % turvallinen."
-  },
-  "tl": {
-    "navTerms": "Mga tuntunin",
-    "navPrivacy": "Pagkapribado",
-    "termsTitle": "Mga Tuntunin ng Serbisyo",
-    "privacyTitle": "Patakaran sa Privacy",
-    "updated": "Huling na-update: 24 Pebrero 2026",
-    "termsText": "Ang Mga Tuntunin ng Serbisyong ito (\"Mga Tuntunin\") ay namamahala sa iyong pag-access at paggamit ng mga serbisyong e-commerce na inaalok sa pamamagitan ng https://rhythmnexus.org (\"Website\") na pinamamahalaan ng Rhythm Nexus (\"kami\", \"kami\", o \"aming\"). Sa pamamagitan ng pag-access, pag-browse, o pagbili mula sa Website, sumasang-ayon ka na sumailalim sa Mga Tuntuning ito. Kung hindi ka sumasang-ayon, hindi mo maaaring gamitin ang Website o mag-order. ||| Ikaw ay dapat na hindi bababa sa 18 taong gulang o ang edad ng mayorya sa iyong hurisdiksyon upang bumili ng mga produkto mula sa Website na ito. Sa pamamagitan ng paglalagay ng order, kinakatawan at ginagarantiyahan mo na natutugunan mo ang kinakailangang ito. ||| Maaaring hilingin sa iyong lumikha ng isang account para makabili. Sumasang-ayon kang magbigay ng tumpak, kasalukuyan, at kumpletong impormasyon. Responsibilidad mong pangalagaan ang mga kredensyal ng iyong account. Dapat mong ipaalam kaagad sa amin ang anumang hindi awtorisadong paggamit. Maaari naming wakasan o suspindihin ang iyong account anumang oras para sa mga paglabag sa Mga Tuntuning ito. ||| Sinisikap naming ipakita ang impormasyon ng produkto nang tumpak, ngunit hindi namin ginagarantiyahan na ang mga paglalarawan ng produkto o iba pang nilalaman ay walang error. ||| Ang mga presyo ay ipinapakita sa United States Dollar (USD) at may kasamang mga naaangkop na buwis kung saan kinakailangan ng batas. Maaari naming baguhin ang mga presyo anumang oras bago ka mag-order. ||| Ang iyong order ay isang alok na bilhin. Nagaganap ang pagtanggap kapag kinumpirma namin ang iyong order sa pamamagitan ng email, o kapag ipinadala namin ang mga produkto, alinman ang mauna. Maaari naming tanggihan o kanselahin ang mga order para sa mga kadahilanang kabilang ang maling pagpepresyo, out-of-stock na mga produkto, o pinaghihinalaang panloloko. ||| Tinatanggap namin ang mga paraan ng pagbabayad na ipinapakita sa pag-checkout. Sa pamamagitan ng pagsusumite ng mga detalye ng pagbabayad, pinahihintulutan mo kaming singilin ang halagang dapat bayaran at kumpirmahin na ikaw ang nararapat na may-ari ng account. Gumagamit kami ng mga third-party na tagaproseso ng pagbabayad upang secure na pangasiwaan ang impormasyon sa pagbabayad. ||| Ang mga pagtatantya sa pagpapadala ay ibinigay para sa kaginhawahan at hindi ginagarantiyahan ang mga petsa ng paghahatid. Kapag nailipat na ang mga produkto sa isang carrier, ang panganib ng pagkawala ay ipapasa sa iyo. Responsable ka para sa mga tungkulin sa customs at mga buwis sa pag-import, at para sa mga error sa paghahatid na dulot ng maling impormasyon ng address. ||| Kung nakatira ka sa EU, EEA, o Switzerland, mayroon kang legal na karapatang magbalik ng mga produkto sa loob ng 14 na araw pagkatapos matanggap para sa buong refund. Dapat ibalik ang mga produkto sa orihinal na kondisyon. Ang pagpapadala sa pagbabalik ay maaaring nasa iyong halaga ayon sa pinapayagan ng batas. Maaaring hindi kasama ang mga digital na produkto kung magsisimula ang pag-download sa iyong pahintulot at kinikilala mo ang pagkawala ng karapatan sa pag-withdraw. ||| Ang pagiging karapat-dapat sa pagbabalik para sa mga customer sa US ay nakabalangkas sa aming hiwalay na Patakaran sa Pagbabalik at Pag-refund na naka-post sa Website. Ang ilang mga item (hal., mga digital na pag-download, mga personalized na item) ay maaaring hindi maibabalik. ||| Kung bibili ka ng mga digital na item, electronic ang delivery, bibigyan ka ng personal na hindi eksklusibong lisensya para gamitin ang content, at hindi ka maaaring muling ipamahagi, ibenta, o ibahagi ang mga download nang walang pahintulot. ||| Ang lahat ng nilalaman ng Website (teksto, disenyo, software, graphics, larawan) ay pagmamay-ari o lisensyado sa Rhythm Nexus at pinoprotektahan ng mga batas sa copyright at intelektwal na ari-arian. Hindi ka maaaring magparami, baguhin, ipamahagi, o lumikha ng mga hinangong gawa nang walang nakasulat na pahintulot.",
-    "privacyText": "Iginagalang ng Rhythm Nexus (\"kami\", \"kami\", o \"aming\") ang iyong privacy at nakatuon sa pagprotekta sa iyong personal na data. Ipinapaliwanag ng Patakaran sa Privacy na ito kung anong personal na data ang kinokolekta namin, kung paano ito ginagamit, kung kanino namin ito ibinabahagi, at ang iyong mga karapatan. Nalalapat ang patakarang ito sa mga user mula sa EU, EEA, Switzerland, at USA. ||| Kinokolekta namin ang personal na impormasyon na boluntaryo mong ibinibigay, kabilang ang pangalan, email address, billing at shipping address, numero ng telepono, at impormasyon sa pagbabayad na pinangangasiwaan ng mga third-party na processor. ||| Awtomatiko naming kinokolekta ang IP address, uri ng browser, data ng device, data ng paggamit, cookies, at mga teknolohiya sa pagsubaybay. ||| Kung ikaw ay nasa EU/EEA/Switzerland, pinoproseso namin ang iyong data batay sa pagganap ng kontrata (pagtupad sa order), legal na obligasyon, mga lehitimong interes, at pahintulot kung kinakailangan. ||| Ginagamit namin ang iyong data upang iproseso ang mga order, ipadala ang mga produkto, makipag-ugnayan sa iyo, magbigay ng suporta sa customer, sumunod sa mga legal na obligasyon, pahusayin ang aming Website, at magpadala ng mga komunikasyon sa marketing nang may pahintulot. ||| Maaari naming ibahagi ang iyong data sa mga tagaproseso ng pagbabayad, mga kasosyo sa pagpapadala, mga provider ng analytics, mga tagapagbigay ng serbisyo sa marketing, at mga legal na awtoridad kapag kinakailangan. Hindi kami nagbebenta ng personal na data. ||| Ang mga user ng EU/EEA/Swiss ay may mga karapatan sa GDPR na i-access ang personal na data, itama ang hindi tumpak na data, burahin ang data, paghigpitan ang pagpoproseso, tumutol sa pagproseso, data ng port, at bawiin ang pahintulot. Upang gamitin ang mga karapatang ito, makipag-ugnayan sa amin sa rhythmnexusco@gmail.com. ||| Ang mga user ng USA (CCPA/CPRA, kung saan naaangkop) ay maaaring may mga karapatan na malaman kung anong personal na data ang kinokolekta, humiling ng pagtanggal, mag-opt out sa pagbabahagi ng data, at walang diskriminasyon para sa paggamit ng mga karapatan. Para magsumite ng mga kahilingan, mag-email sa rhythmnexusco@gmail.com. ||| Pinapanatili namin ang personal na data hangga't kinakailangan upang matupad ang mga order, sumunod sa mga legal na kinakailangan, at malutas ang mga hindi pagkakaunawaan. ||| Maaari kaming maglipat ng data sa labas ng iyong rehiyon. Kapag naglilipat mula sa EU/EEA/Switzerland, gumagamit kami ng Standard Contractual Clauses (SCCs) at iba pang mga legal na pananggalang. ||| Nagpapatupad kami ng mga makatwirang teknikal at pang-organisasyong pag-iingat kabilang ang pag-encrypt ng SSL, mga secure na sistema ng pagbabayad, at mga hakbang sa pagkontrol sa pag-access. Gayunpaman, walang sistema ang 100% na ligtas."
-  },
-  "vi": {
-    "navTerms": "Điều khoản",
-    "navPrivacy": "Sự riêng tư",
-    "termsTitle": "Điều khoản dịch vụ",
-    "privacyTitle": "Chính sách bảo mật",
-    "updated": "Cập nhật lần cuối: ngày 24 tháng 2 năm 2026",
-    "termsText": "Các Điều khoản dịch vụ này (\"Điều khoản\") chi phối việc bạn truy cập và sử dụng các dịch vụ thương mại điện tử được cung cấp thông qua https://beatnexus.org (\"Trang web\") do Rhythm Nexus (\"chúng tôi\" hoặc \"của chúng tôi\"). Bằng cách truy cập, duyệt hoặc mua từ Trang web, bạn đồng ý bị ràng buộc bởi các Điều khoản này. Nếu bạn không đồng ý, bạn không được sử dụng Trang web hoặc đặt hàng. ||| Bạn phải ít nhất 18 tuổi hoặc độ tuổi trưởng thành trong khu vực pháp lý của bạn để mua sản phẩm từ Trang web này. Bằng cách đặt hàng, bạn tuyên bố và đảm bảo rằng bạn đáp ứng yêu cầu này. ||| Bạn có thể được yêu cầu tạo một tài khoản để mua hàng. Bạn đồng ý cung cấp thông tin chính xác, cập nhật và đầy đủ. Bạn có trách nhiệm bảo vệ thông tin đăng nhập tài khoản của mình. Bạn phải thông báo ngay cho chúng tôi về bất kỳ việc sử dụng trái phép nào. Chúng tôi có thể chấm dứt hoặc đình chỉ tài khoản của bạn bất kỳ lúc nào do vi phạm các Điều khoản này. ||| Chúng tôi cố gắng hiển thị thông tin sản phẩm một cách chính xác nhưng chúng tôi không đảm bảo rằng mô tả sản phẩm hoặc nội dung khác không có lỗi. ||| Giá được hiển thị bằng Đô la Mỹ (USD) và bao gồm các loại thuế hiện hành theo yêu cầu của pháp luật. Chúng tôi có thể thay đổi giá bất cứ lúc nào trước khi bạn đặt hàng. ||| Đơn đặt hàng của bạn là một lời đề nghị mua hàng. Việc chấp nhận xảy ra khi chúng tôi xác nhận đơn đặt hàng của bạn qua email hoặc khi chúng tôi vận chuyển sản phẩm, tùy điều kiện nào xảy ra trước. Chúng tôi có thể từ chối hoặc hủy đơn đặt hàng vì các lý do bao gồm định giá không chính xác, hết sản phẩm hoặc nghi ngờ có gian lận. ||| Chúng tôi chấp nhận các phương thức thanh toán được hiển thị trong quá trình thanh toán. Bằng cách gửi chi tiết thanh toán, bạn ủy quyền cho chúng tôi tính số tiền đến hạn và xác nhận bạn là chủ tài khoản hợp pháp. Chúng tôi sử dụng bộ xử lý thanh toán của bên thứ ba để xử lý thông tin thanh toán một cách an toàn. ||| Ước tính vận chuyển được cung cấp để thuận tiện và không đảm bảo ngày giao hàng. Sau khi sản phẩm được chuyển cho nhà vận chuyển, nguy cơ mất mát sẽ chuyển sang bạn. Bạn chịu trách nhiệm về thuế hải quan và thuế nhập khẩu cũng như các lỗi giao hàng do thông tin địa chỉ không chính xác. ||| Nếu bạn cư trú tại EU, EEA hoặc Thụy Sĩ, bạn có quyền hợp pháp trả lại sản phẩm trong vòng 14 ngày kể từ ngày nhận để được hoàn lại tiền đầy đủ. Sản phẩm phải được trả lại trong tình trạng ban đầu. Bạn có thể phải trả chi phí vận chuyển trả lại theo quy định của pháp luật. Các sản phẩm kỹ thuật số có thể bị loại trừ nếu quá trình tải xuống bắt đầu với sự đồng ý của bạn và bạn thừa nhận mất quyền rút lui. ||| Khả năng đủ điều kiện hoàn trả đối với khách hàng Hoa Kỳ được nêu trong Chính sách hoàn trả và hoàn tiền riêng của chúng tôi được đăng trên Trang web. Một số mặt hàng (ví dụ: tải xuống kỹ thuật số, mặt hàng được cá nhân hóa) có thể không được hoàn lại. ||| Nếu bạn mua các mặt hàng kỹ thuật số, việc phân phối được thực hiện dưới hình thức điện tử, bạn sẽ được cấp giấy phép cá nhân không độc quyền để sử dụng nội dung và bạn không được phân phối lại, bán lại hoặc chia sẻ các nội dung tải xuống mà không được phép. ||| Tất cả nội dung Trang web (văn bản, thiết kế, phần mềm, đồ họa, hình ảnh) đều thuộc sở hữu hoặc được cấp phép cho Rhythm Nexus và được bảo vệ bởi luật bản quyền và sở hữu trí tuệ. Bạn không được sao chép, sửa đổi, phân phối hoặc tạo tác phẩm phái sinh mà không có sự cho phép bằng văn bản.",
-    "privacyText": "Rhythm Nexus (\"chúng tôi\", \"của chúng tôi\" hoặc \"của chúng tôi\") tôn trọng quyền riêng tư của bạn và cam kết bảo vệ dữ liệu cá nhân của bạn. Chính sách quyền riêng tư này giải thích dữ liệu cá nhân nào chúng tôi thu thập, cách sử dụng, chúng tôi chia sẻ dữ liệu đó với ai và quyền của bạn. Chính sách này áp dụng cho người dùng từ EU, EEA, Thụy Sĩ và Hoa Kỳ. ||| Chúng tôi thu thập thông tin cá nhân mà bạn tự nguyện cung cấp, bao gồm tên, địa chỉ email, địa chỉ thanh toán và giao hàng, số điện thoại và thông tin thanh toán do bên xử lý bên thứ ba xử lý. ||| Chúng tôi tự động thu thập địa chỉ IP, loại trình duyệt, dữ liệu thiết bị, dữ liệu sử dụng, cookie và công nghệ theo dõi. ||| Nếu bạn ở EU/EEA/Thụy Sĩ, chúng tôi xử lý dữ liệu của bạn dựa trên việc thực hiện hợp đồng (thực hiện đơn hàng), nghĩa vụ pháp lý, lợi ích hợp pháp và sự đồng ý khi cần thiết. ||| Chúng tôi sử dụng dữ liệu của bạn để xử lý đơn đặt hàng, vận chuyển sản phẩm, liên lạc với bạn, cung cấp hỗ trợ khách hàng, tuân thủ nghĩa vụ pháp lý, cải thiện Trang web của chúng tôi và gửi thông tin tiếp thị với sự đồng ý. ||| Chúng tôi có thể chia sẻ dữ liệu của bạn với bộ xử lý thanh toán, đối tác vận chuyển, nhà cung cấp phân tích, nhà cung cấp dịch vụ tiếp thị và cơ quan pháp luật khi được yêu cầu. Chúng tôi không bán dữ liệu cá nhân. ||| Người dùng EU/EEA/Thụy Sĩ có quyền GDPR để truy cập dữ liệu cá nhân, sửa dữ liệu không chính xác, xóa dữ liệu, hạn chế xử lý, phản đối việc xử lý, chuyển dữ liệu và rút lại sự đồng ý. Để thực hiện các quyền này, hãy liên hệ với chúng tôi theo địa chỉ beatnexusco@gmail.com. ||| Người dùng Hoa Kỳ (CCPA/CPRA, nếu có) có thể có quyền biết dữ liệu cá nhân nào được thu thập, yêu cầu xóa, từ chối chia sẻ dữ liệu và không phân biệt đối xử khi thực hiện các quyền. Để gửi yêu cầu, hãy gửi email theo nhịp điệunexusco@gmail.com. ||| Chúng tôi lưu giữ dữ liệu cá nhân trong khoảng thời gian cần thiết để thực hiện đơn đặt hàng, tuân thủ các yêu cầu pháp lý và giải quyết tranh chấp. ||| Chúng tôi có thể chuyển dữ liệu ra ngoài khu vực của bạn. Khi chuyển từ EU/EEA/Thụy Sĩ, chúng tôi sử dụng Điều khoản hợp đồng tiêu chuẩn (SCC) và các biện pháp bảo vệ hợp pháp khác. ||| Chúng tôi thực hiện các biện pháp bảo vệ kỹ thuật và tổ chức hợp lý bao gồm mã hóa SSL, hệ thống thanh toán an toàn và các biện pháp kiểm soát truy cập. Tuy nhiên, không có hệ thống nào an toàn 100%."
-  },
-  "cy": {
-    "navTerms": "Termau",
-    "navPrivacy": "Preifatrwydd",
-    "termsTitle": "Telerau Gwasanaeth",
-    "privacyTitle": "Polisi Preifatrwydd",
-    "updated": "Wedi ei ddiweddaru ddiwetha': 24 Chwefror 2026",
-    "termsText": "Mae'r Telerau Gwasanaeth hyn (\"Telerau\") yn llywodraethu eich mynediad i'r gwasanaethau e-fasnach a gynigir trwy https://rhythmnexus.org (\"Gwefan\") a weithredir gan Rhythm Nexus (\"ni\", \"ni\", neu \"ein\") a'ch defnydd ohonynt. Trwy gyrchu, pori, neu brynu o'r Wefan, rydych chi'n cytuno i gael eich rhwymo gan y Telerau hyn. Os nad ydych yn cytuno, ni chewch ddefnyddio'r Wefan na gosod archeb. ||| Rhaid i chi fod yn 18 oed o leiaf neu'r oedran mwyafrif yn eich awdurdodaeth i brynu cynhyrchion o'r Wefan hon. Trwy osod archeb, rydych yn cynrychioli ac yn gwarantu eich bod yn bodloni'r gofyniad hwn. ||| Efallai y gofynnir i chi greu cyfrif i brynu. Rydych yn cytuno i ddarparu gwybodaeth gywir, gyfredol a chyflawn. Chi sy'n gyfrifol am ddiogelu manylion eich cyfrif. Rhaid i chi roi gwybod i ni ar unwaith am unrhyw ddefnydd anawdurdodedig. Gallwn derfynu neu atal eich cyfrif ar unrhyw adeg am dorri’r Telerau hyn. ||| Rydym yn ymdrechu i arddangos gwybodaeth am gynnyrch yn gywir, ond nid ydym yn gwarantu bod disgrifiadau cynnyrch neu gynnwys arall yn rhydd o wallau. ||| Dangosir prisiau yn Doler yr Unol Daleithiau (USD) ac maent yn cynnwys trethi cymwys lle bo angen yn ôl y gyfraith. Efallai y byddwn yn newid prisiau ar unrhyw adeg cyn i chi osod archeb. ||| Cynnig i brynu yw eich archeb. Mae derbyniad yn digwydd pan fyddwn yn cadarnhau eich archeb trwy e-bost, neu pan fyddwn yn llongio'r cynhyrchion, pa un bynnag sy'n digwydd gyntaf. Mae'n bosibl y byddwn yn gwrthod neu'n canslo archebion am resymau sy'n cynnwys prisio anghywir, cynhyrchion allan o stoc, neu amheuaeth o dwyll. ||| Rydym yn derbyn y dulliau talu a ddangosir yn ystod y ddesg dalu. Trwy gyflwyno manylion talu, rydych yn ein hawdurdodi i godi'r swm sy'n ddyledus ac yn cadarnhau mai chi yw deiliad y cyfrif cywir. Rydym yn defnyddio proseswyr taliadau trydydd parti i drin gwybodaeth am daliadau yn ddiogel. ||| Darperir amcangyfrifon cludo er hwylustod ac nid ydynt yn gwarantu dyddiadau dosbarthu. Unwaith y bydd cynhyrchion yn cael eu trosglwyddo i gludwr, mae'r risg o golled yn mynd i chi. Chi sy'n gyfrifol am dollau tollau a threthi mewnforio, ac am wallau dosbarthu a achosir gan wybodaeth anghywir am gyfeiriadau. ||| Os ydych yn byw yn yr UE, AEE, neu'r Swistir, mae gennych yr hawl gyfreithiol i ddychwelyd cynhyrchion o fewn 14 diwrnod i'w derbyn am ad-daliad llawn. Rhaid dychwelyd cynhyrchion yn y cyflwr gwreiddiol. Gall llongau dychwelyd fod ar eich cost chi fel y caniateir gan y gyfraith. Efallai y bydd cynhyrchion digidol yn cael eu heithrio os bydd y lawrlwythiad yn dechrau gyda'ch caniatâd a'ch bod yn cydnabod colli hawl i dynnu'n ôl. ||| Amlinellir cymhwyster dychwelyd cwsmeriaid UDA yn ein Polisi Dychwelyd ac Ad-daliad ar wahân a bostiwyd ar y Wefan. Mae’n bosibl na fydd modd ad-dalu rhai eitemau (e.e. lawrlwythiadau digidol, eitemau personol). ||| Os ydych chi'n prynu eitemau digidol, mae'r dosbarthiad yn electronig, rhoddir trwydded anghyfyngedig bersonol i chi ddefnyddio'r cynnwys, ac ni chewch ailddosbarthu, ailwerthu na rhannu lawrlwythiadau heb ganiatâd. ||| Mae holl gynnwys y Wefan (testun, dyluniadau, meddalwedd, graffeg, delweddau) yn eiddo i Rhythm Nexus neu wedi'i drwyddedu iddo ac wedi'i ddiogelu gan gyfreithiau hawlfraint ac eiddo deallusol. Ni chewch atgynhyrchu, addasu, dosbarthu na chreu gweithiau deilliadol heb ganiatâd ysgrifenedig.",
-    "privacyText": "Mae Rhythm Nexus (\"ni\", \"ni\", neu \"ein\") yn parchu eich preifatrwydd ac wedi ymrwymo i ddiogelu eich data personol. Mae’r Polisi Preifatrwydd hwn yn esbonio pa ddata personol rydym yn ei gasglu, sut mae’n cael ei ddefnyddio, gyda phwy rydym yn ei rannu, a’ch hawliau. Mae'r polisi hwn yn berthnasol i ddefnyddwyr o'r UE, AEE, y Swistir ac UDA. ||| Rydyn ni'n casglu'r wybodaeth bersonol rydych chi'n ei darparu'n wirfoddol, gan gynnwys enw, cyfeiriad e-bost, cyfeiriad bilio a chludo, rhif ffôn, a gwybodaeth talu sy'n cael ei thrin gan broseswyr trydydd parti. ||| Rydym yn casglu cyfeiriad IP, math o borwr, data dyfais, data defnydd, cwcis a thechnolegau olrhain yn awtomatig. ||| Os ydych yn yr UE/AEE/Swistir, rydym yn prosesu eich data yn seiliedig ar berfformiad contract (cyflawni archeb), rhwymedigaeth gyfreithiol, buddiannau cyfreithlon, a chaniatâd lle bo angen. ||| Rydym yn defnyddio eich data i brosesu archebion, llongio cynhyrchion, cyfathrebu â chi, darparu cymorth i gwsmeriaid, cydymffurfio â rhwymedigaethau cyfreithiol, gwella ein Gwefan, ac anfon cyfathrebiadau marchnata gyda chaniatâd. ||| Mae’n bosibl y byddwn yn rhannu eich data â phroseswyr taliadau, partneriaid cludo, darparwyr dadansoddeg, darparwyr gwasanaethau marchnata, ac awdurdodau cyfreithiol pan fo angen. Nid ydym yn gwerthu data personol. ||| Mae gan ddefnyddwyr yr UE / AEE / Swistir hawliau GDPR i gael mynediad at ddata personol, cywiro data anghywir, dileu data, cyfyngu ar brosesu, gwrthwynebu prosesu, data porthladd, a thynnu caniatâd yn ôl. I arfer yr hawliau hyn, cysylltwch â ni yn rhythmnexusco@gmail.com. ||| Mae’n bosibl y bydd gan ddefnyddwyr UDA (CCPA/CPRA, lle bo’n berthnasol) hawliau i wybod pa ddata personol sy’n cael ei gasglu, gofyn am ddileu, optio allan o rannu data, a pheidio â gwahaniaethu ar gyfer arfer hawliau. I gyflwyno ceisiadau, e-bostiwch rhythmnexusco@gmail.com. ||| Rydym yn cadw data personol cyhyd ag y bo angen i gyflawni gorchmynion, cydymffurfio â gofynion cyfreithiol, a datrys anghydfodau. ||| Mae'n bosibl y byddwn yn trosglwyddo data y tu allan i'ch rhanbarth. Wrth drosglwyddo o’r UE/AEE/Swistir, rydym yn defnyddio Cymalau Cytundebol Safonol (SCCs) a mesurau diogelu cyfreithlon eraill. ||| Rydym yn gweithredu mesurau diogelu technegol a threfniadol rhesymol gan gynnwys amgryptio SSL, systemau talu diogel, a mesurau rheoli mynediad. Fodd bynnag, nid oes unrhyw system 100% yn ddiogel."
-  },
-  "ta": {
-    "navTerms": "விதிமுறைகள்",
-    "navPrivacy": "தனியுரிமை",
-    "termsTitle": "சேவை விதிமுறைகள்",
-    "privacyTitle": "தனியுரிமைக் கொள்கை",
-    "updated": "கடைசியாக புதுப்பிக்கப்பட்டது: 24 பிப்ரவரி 2026",
-    "termsText": "இந்த சேவை விதிமுறைகள் (\"விதிமுறைகள்\") Rhythm Nexus (\"நாங்கள்\", \"எங்கள்\" அல்லது \"எங்கள்\") மூலம் இயக்கப்படும் https://rhythmnexus.org (\"இணையதளம்\") மூலம் வழங்கப்படும் மின் வணிகச் சேவைகளுக்கான உங்கள் அணுகல் மற்றும் பயன்பாட்டை நிர்வகிக்கிறது. இணையதளத்தை அணுகுதல், உலாவுதல் அல்லது வாங்குதல் மூலம், இந்த விதிமுறைகளுக்குக் கட்டுப்படுவதை ஒப்புக்கொள்கிறீர்கள். நீங்கள் ஒப்புக்கொள்ளவில்லை என்றால், நீங்கள் வலைத்தளத்தைப் பயன்படுத்தவோ அல்லது ஆர்டர் செய்யவோ முடியாது. ||| இந்த இணையதளத்தில் தயாரிப்புகளை வாங்குவதற்கு நீங்கள் குறைந்தபட்சம் 18 வயது அல்லது உங்கள் அதிகார வரம்பில் வயது முதிர்ந்தவராக இருக்க வேண்டும். ஒரு ஆர்டரை வைப்பதன் மூலம், நீங்கள் இந்த தேவையை பூர்த்தி செய்வதை பிரதிநிதித்துவப்படுத்தி உத்தரவாதம் அளிக்கிறீர்கள். ||| வாங்குவதற்கு ஒரு கணக்கை உருவாக்கும்படி கேட்கப்படலாம். துல்லியமான, தற்போதைய மற்றும் முழுமையான தகவலை வழங்க ஒப்புக்கொள்கிறீர்கள். உங்கள் கணக்கு நற்சான்றிதழ்களைப் பாதுகாப்பதற்கு நீங்கள் பொறுப்பு. எந்தவொரு அங்கீகரிக்கப்படாத பயன்பாடு குறித்தும் நீங்கள் உடனடியாக எங்களுக்குத் தெரிவிக்க வேண்டும். இந்த விதிமுறைகளை மீறினால் உங்கள் கணக்கை எந்த நேரத்திலும் நாங்கள் நிறுத்தலாம் அல்லது இடைநிறுத்தலாம். ||| தயாரிப்புத் தகவலைத் துல்லியமாகக் காட்ட நாங்கள் முயற்சி செய்கிறோம், ஆனால் தயாரிப்பு விளக்கங்கள் அல்லது பிற உள்ளடக்கம் பிழையற்றது என்று நாங்கள் உத்தரவாதம் அளிக்கவில்லை. ||| விலைகள் யுனைடெட் ஸ்டேட்ஸ் டாலரில் (USD) காட்டப்படும் மற்றும் சட்டத்தின்படி தேவைப்படும் போது பொருந்தக்கூடிய வரிகளும் அடங்கும். நீங்கள் ஆர்டர் செய்வதற்கு முன் நாங்கள் எந்த நேரத்திலும் விலைகளை மாற்றலாம். ||| உங்கள் ஆர்டர் வாங்குவதற்கான வாய்ப்பாகும். உங்கள் ஆர்டரை மின்னஞ்சலில் உறுதிசெய்யும்போது அல்லது தயாரிப்புகளை நாங்கள் அனுப்பும்போது எது முதலில் நடக்கிறதோ அதை ஏற்றுக்கொள்வது ஏற்படுகிறது. தவறான விலை, கையிருப்பில் இல்லாத பொருட்கள் அல்லது சந்தேகத்திற்குரிய மோசடி உள்ளிட்ட காரணங்களுக்காக நாங்கள் ஆர்டர்களை நிராகரிக்கலாம் அல்லது ரத்து செய்யலாம். ||| செக் அவுட்டின் போது காட்டப்படும் கட்டண முறைகளை ஏற்கிறோம். கட்டண விவரங்களைச் சமர்ப்பிப்பதன் மூலம், செலுத்த வேண்டிய தொகையை வசூலிக்க எங்களுக்கு அதிகாரம் வழங்குகிறீர்கள் மற்றும் நீங்கள்தான் சரியான கணக்கு வைத்திருப்பவர் என்பதை உறுதிப்படுத்தவும். கட்டணத் தகவலைப் பாதுகாப்பாகக் கையாள மூன்றாம் தரப்பு கட்டணச் செயலிகளைப் பயன்படுத்துகிறோம். ||| ஷிப்பிங் மதிப்பீடுகள் வசதிக்காக வழங்கப்படுகின்றன மற்றும் விநியோக தேதிகளுக்கு உத்தரவாதம் இல்லை. தயாரிப்புகள் ஒரு கேரியருக்கு மாற்றப்பட்டவுடன், இழப்பு ஏற்படும் அபாயம் உங்களுக்கு செல்கிறது. சுங்க வரிகள் மற்றும் இறக்குமதி வரிகள் மற்றும் தவறான முகவரி தகவலால் ஏற்படும் டெலிவரி பிழைகளுக்கு நீங்கள் பொறுப்பாவீர்கள். ||| நீங்கள் EU, EEA அல்லது சுவிட்சர்லாந்தில் வசிக்கிறீர்கள் என்றால், முழுப் பணத்தைத் திரும்பப் பெறுவதற்கான ரசீது கிடைத்த 14 நாட்களுக்குள் தயாரிப்புகளைத் திருப்பித் தர உங்களுக்கு சட்டப்பூர்வ உரிமை உள்ளது. தயாரிப்புகள் அசல் நிலையில் திரும்பப் பெறப்பட வேண்டும். சட்டத்தால் அனுமதிக்கப்பட்ட உங்கள் செலவில் ரிட்டர்ன் ஷிப்பிங் இருக்கலாம். உங்கள் ஒப்புதலுடன் பதிவிறக்கம் தொடங்கி, திரும்பப் பெறுவதற்கான உரிமையை இழப்பதை நீங்கள் ஒப்புக்கொண்டால் டிஜிட்டல் தயாரிப்புகள் விலக்கப்படலாம். ||| அமெரிக்க வாடிக்கையாளர்களுக்குத் திரும்பப் பெறுவதற்கான தகுதியானது இணையதளத்தில் வெளியிடப்பட்ட எங்களின் தனியான திரும்பப் பெறுதல் & பணத்தைத் திரும்பப்பெறுதல் கொள்கையில் கோடிட்டுக் காட்டப்பட்டுள்ளது. சில உருப்படிகள் (எ.கா., டிஜிட்டல் பதிவிறக்கங்கள், தனிப்பயனாக்கப்பட்ட உருப்படிகள்) திரும்பப் பெறப்படாமல் இருக்கலாம். ||| நீங்கள் டிஜிட்டல் பொருட்களை வாங்கினால், டெலிவரி மின்னணு முறையில் இருந்தால், உள்ளடக்கத்தைப் பயன்படுத்த தனிப்பட்ட பிரத்தியேகமற்ற உரிமம் உங்களுக்கு வழங்கப்படும், மேலும் அனுமதியின்றி பதிவிறக்கங்களை மறுவிநியோகம் செய்யவோ, மறுவிற்பனை செய்யவோ, பகிரவோ கூடாது. ||| அனைத்து இணையதள உள்ளடக்கமும் (உரை, வடிவமைப்புகள், மென்பொருள், கிராபிக்ஸ், படங்கள்) Rhythm Nexus க்கு சொந்தமானது அல்லது உரிமம் பெற்றது மற்றும் பதிப்புரிமை மற்றும் அறிவுசார் சொத்துரிமை சட்டங்களால் பாதுகாக்கப்படுகிறது. எழுத்துப்பூர்வ அனுமதியின்றி நீங்கள் மறுஉருவாக்கம் செய்யவோ, மாற்றவோ, விநியோகிக்கவோ அல்லது வழித்தோன்றல் படைப்புகளை உருவாக்கவோ கூடாது.",
-    "privacyText": "ரிதம் நெக்ஸஸ் (\"நாங்கள்\", \"நாங்கள்\" அல்லது \"எங்கள்\") உங்கள் தனியுரிமையை மதிக்கிறது மற்றும் உங்கள் தனிப்பட்ட தரவைப் பாதுகாப்பதில் உறுதியாக உள்ளது. இந்த தனியுரிமைக் கொள்கையில் நாங்கள் சேகரிக்கும் தனிப்பட்ட தரவு என்ன, அது எவ்வாறு பயன்படுத்தப்படுகிறது, யாருடன் பகிர்கிறோம் மற்றும் உங்கள் உரிமைகளை விளக்குகிறது. இந்தக் கொள்கை EU, EEA, சுவிட்சர்லாந்து மற்றும் அமெரிக்காவைச் சேர்ந்த பயனர்களுக்குப் பொருந்தும். ||| மூன்றாம் தரப்பு செயலிகள் கையாளும் பெயர், மின்னஞ்சல் முகவரி, பில்லிங் மற்றும் ஷிப்பிங் முகவரி, தொலைபேசி எண் மற்றும் கட்டணத் தகவல் உட்பட நீங்கள் தானாக முன்வந்து வழங்கும் தனிப்பட்ட தகவல்களை நாங்கள் சேகரிக்கிறோம். ||| IP முகவரி, உலாவி வகை, சாதனத் தரவு, பயன்பாட்டுத் தரவு, குக்கீகள் மற்றும் கண்காணிப்பு தொழில்நுட்பங்கள் ஆகியவற்றை நாங்கள் தானாகவே சேகரிக்கிறோம். ||| நீங்கள் EU/EEA/Switzerland இல் இருந்தால், ஒப்பந்த செயல்திறன் (ஆர்டர் நிறைவேற்றுதல்), சட்டப்பூர்வ கடமைகள், சட்டபூர்வமான ஆர்வங்கள் மற்றும் தேவைப்படும் இடங்களில் ஒப்புதல் ஆகியவற்றின் அடிப்படையில் உங்கள் தரவைச் செயலாக்குவோம். ||| ஆர்டர்களைச் செயல்படுத்தவும், பொருட்களை அனுப்பவும், உங்களுடன் தொடர்பு கொள்ளவும், வாடிக்கையாளர் ஆதரவை வழங்கவும், சட்டப்பூர்வ கடமைகளுக்கு இணங்கவும், எங்கள் இணையதளத்தை மேம்படுத்தவும், சந்தைப்படுத்தல் தகவல்தொடர்புகளை ஒப்புதலுடன் அனுப்பவும் உங்கள் தரவைப் பயன்படுத்துகிறோம். ||| கட்டணச் செயலிகள், ஷிப்பிங் பார்ட்னர்கள், பகுப்பாய்வு வழங்குநர்கள், சந்தைப்படுத்தல் சேவை வழங்குநர்கள் மற்றும் சட்ட அதிகாரிகளுடன் தேவைப்படும்போது உங்கள் தரவை நாங்கள் பகிரலாம். நாங்கள் தனிப்பட்ட தரவை விற்கவில்லை. ||| EU/EEA/Swiss பயனர்களுக்கு தனிப்பட்ட தரவை அணுகவும், தவறான தரவைச் சரிசெய்யவும், தரவை அழிக்கவும், செயலாக்கத்தை கட்டுப்படுத்தவும், செயலாக்கத்திற்கு ஆட்சேபனை செய்யவும், போர்ட் டேட்டாவும் மற்றும் ஒப்புதலை திரும்பப் பெறவும் GDPR உரிமைகள் உள்ளன. இந்த உரிமைகளைப் பயன்படுத்த, rhythmnexusco@gmail.com இல் எங்களைத் தொடர்பு கொள்ளவும். ||| USA பயனர்கள் (CCPA/CPRA, பொருந்தக்கூடிய இடங்களில்) தனிப்பட்ட தரவு என்ன சேகரிக்கப்படுகிறது, நீக்கக் கோரிக்கை, தரவுப் பகிர்விலிருந்து விலகுதல் மற்றும் உரிமைகளைப் பயன்படுத்துவதில் பாகுபாடு காட்டாதது போன்ற உரிமைகளைக் கொண்டிருக்கலாம். கோரிக்கைகளைச் சமர்ப்பிக்க, மின்னஞ்சல் rhythmnexusco@gmail.com. ||| ஆர்டர்களை நிறைவேற்றவும், சட்டத் தேவைகளுக்கு இணங்கவும், தகராறுகளைத் தீர்க்கவும் தேவைப்படும் வரை தனிப்பட்ட தரவை நாங்கள் வைத்திருக்கிறோம். ||| உங்கள் பிராந்தியத்திற்கு வெளியே நாங்கள் தரவை மாற்றலாம். EU/EEA/Switzerland இலிருந்து மாற்றும் போது, ​​நாங்கள் நிலையான ஒப்பந்த விதிகள் (SCCகள்) மற்றும் பிற சட்டப்பூர்வமான பாதுகாப்புகளைப் பயன்படுத்துகிறோம். ||| SSL குறியாக்கம், பாதுகாப்பான கட்டண முறைகள் மற்றும் அணுகல் கட்டுப்பாட்டு நடவடிக்கைகள் உள்ளிட்ட நியாயமான தொழில்நுட்ப மற்றும் நிறுவனப் பாதுகாப்புகளை நாங்கள் செயல்படுத்துகிறோம். இருப்பினும், எந்த அமைப்பும் 100% பாதுகாப்பாக இல்லை."
-  },
-  "mi": {
-    "navTerms": "Nga tikanga",
-    "navPrivacy": "Tūmataitinga",
-    "termsTitle": "Nga Ture Ratonga",
-    "privacyTitle": "Kaupapahere Tūmataiti",
-    "updated": "Whakahoutanga whakamutunga: 24 Hui-tanguru 2026",
-    "termsText": "Ko enei Ture o te Ratonga (\"Tuhinga\") ka whakahaere i to urunga me te whakamahi i nga ratonga e-tauhokohoko e tukuna ana ma https://rhythmnexus.org (\"Paetukutuku\") e whakahaeretia ana e Rhythm Nexus (\"we\", \"tatou\", \"tatou\" ranei). Ma te whakauru, te tirotiro, te hoko mai ranei i te Paetukutuku, ka whakaae koe kia herea koe e enei Ture. Ki te kore koe e whakaae, kare pea koe e whakamahi i te Paetukutuku me te tuku ota. ||| Me 18 neke atu ranei ou tau, te pakeke ranei o te nuinga o to rohe ki te hoko hua mai i tenei Paetukutuku. Ma te tuku ota, ka tohu koe me te whakamana ka tutuki koe i tenei whakaritenga. ||| Ka tonoa pea koe ki te hanga i tetahi kaute hei hoko. E whakaae ana koe ki te whakarato i nga korero tika, o naianei, me te whakaoti. Kei a koe te kawenga mo te tiaki i o tohu tohu kaute. Me whakamohio wawe koe ki a matou mo nga whakamahinga kore mana. Ka taea e matou te whakamutu, te whakatarewa ranei i to putea i nga wa katoa mo te takahi i enei Ture. ||| Ka whakapau kaha matou ki te whakaatu tika i nga korero hua, engari kaore matou e whakaae ko nga whakaahuatanga hua me etahi atu korero kaore he hapa. ||| Ka whakaatuhia nga utu ki te Taara o Amerika (USD) me te whakauru i nga taake e tika ana ina hiahiatia e te ture. Ka huri pea matou i nga utu i nga wa katoa i mua i to tuku ota. ||| Ko to ota he tuku ki te hoko. Ka puta te whakaaetanga ina whakamanahia e matou to ota ma te imeera, i te wa ranei ka tukuna e matou nga hua, ahakoa ko wai te mea tuatahi. Ka taea e matou te whakakore, te whakakore ranei i nga ota mo nga take tae atu ki te utu he, nga hua kore-kore, me te whakapae he tinihanga. ||| Ka whakaaetia e matou nga tikanga utu e whakaatuhia ana i te wa o te tirotiro. Ma te tuku i nga taipitopito utu, ka whakamana koe i a matou ki te utu i te moni e tika ana me te whakau ko koe te kaipupuri putea tika. Ka whakamahi matou i nga kaiwhakatuka utu-tuatoru hei hapai i nga korero utu. ||| Ka whakaratohia nga whakatau tata mo te waatea me te kore e kii i nga ra tuku. Ina tukuna nga hua ki tetahi kaikawe, ka pahemo te mate ki a koe. Kei a koe te kawenga mo nga taake me nga taake kawemai, me nga hapa tuku na te he o nga korero wahitau. ||| Mena kei te noho koe i te EU, EEA, Switzerland ranei, kei a koe te mana ture ki te whakahoki i nga hua i roto i nga ra 14 i muri i te whiwhinga mo te utu katoa. Me whakahoki nga hua i roto i nga ahuatanga taketake. Ko nga kaipuke whakahoki mai pea kei to utu e whakaaetia ana e te ture. Ka whakakorehia nga hua mamati mena ka timata te tango i runga i to whakaaetanga ka whakaae koe kua ngaro te mana tango. ||| Ko nga tohu mo te whakahoki mai mo nga kaihoko US kei roto i ta maatau kaupapa here Whakahoki me te Whakahoki i tukuna ki te Paetukutuku. Ko etahi o nga mea (hei tauira, nga tangohanga mamati, nga mea kua whakawhaiarohia) kaore pea e whakahokia. ||| Mena ka hoko koe i nga taonga matihiko, he hikohiko te tuku, ka whakawhiwhia koe ki tetahi raihana motuhake-kore ki te whakamahi i nga ihirangi, kaore pea koe e tohatoha, hoko atu, tiritiri ranei i nga tangohanga me te kore whakaaetanga. ||| Ko nga ihirangi Paetukutuku katoa (kuputuhi, hoahoa, rorohiko, whakairoiro, whakaahua) kei te mana, kua raihanatia ranei ki te Rhythm Nexus ka tiakina e nga ture mana pupuri me nga taonga hinengaro. Kaore e taea e koe te whakaputa, te whakarereke, te tohatoha, te hanga ranei i nga mahi whakaputa me te kore whakaaetanga a-tuhi.",
-    "privacyText": "Ko Rhythm Nexus (\"tatou\", \"tatou\", \"tatou\" ranei\") e whakaute ana i to noho muna me te pono ki te tiaki i o raraunga whaiaro. Ko tenei Kaupapahere Whaiaro e whakamarama ana he aha nga raraunga whaiaro ka kohia e matou, me pehea te whakamahi, ko wai ka tohatohahia e matou, me o tika. Ka pa tenei kaupapa here ki nga kaiwhakamahi mai i te EU, EEA, Switzerland, me nga USA. ||| Ka kohia e matou nga korero whaiaro ka tukuna e koe, tae atu ki te ingoa, te wahitau imeera, te nama nama me te wahitau kaipuke, te nama waea, me nga korero utu e whakahaerea ana e nga kaiwhakatikatika tuatoru. ||| Ka kohikohi aunoa matou i te wahitau IP, momo tirotiro, raraunga taputapu, raraunga whakamahinga, pihikete, me nga hangarau aroturuki. ||| Mena kei roto koe i te EU/EEA/Switzerland, ka tukatukahia e matou o raraunga i runga i te mahi kirimana (te whakatutuki ota), te herenga ture, nga paanga tika, me te whakaae ina hiahiatia. ||| Ka whakamahia e matou o raraunga ki te tukatuka i nga ota, ki nga hua kaipuke, ki te korero ki a koe, ki te whakarato i te tautoko a te kaihoko, ki te whakatutuki i nga herenga ture, ki te whakapai ake i to maatau Paetukutuku, me te tuku korero hokohoko me te whakaae. ||| Ka tohatoha pea matou i o raraunga ki nga kaiwhakatika utu, hoa tuku kaipuke, kaiwhakarato tātaritanga, kaiwhakarato ratonga hokohoko, me nga mana ture ina hiahiatia. Kaore matou e hoko raraunga whaiaro. ||| Kei nga kaiwhakamahi EU/EEA/Swiss nga mana GDPR ki te uru ki nga raraunga whaiaro, whakatika i nga raraunga kore tika, te whakakore i nga raraunga, te aukati i te tukatuka, te aukati ki te tukatuka, te raraunga tauranga, me te tango whakaaetanga. Hei whakamahi i enei mana, whakapaa mai ki a matou i rhythmnexusco@gmail.com. ||| Ko nga kaiwhakamahi o USA (CCPA/CPRA, ina e tika ana) ka whai mana ki te mohio he aha nga raraunga whaiaro ka kohia, tono kia mukua, kia puta ki waho o te tiritiri raraunga, me te kore whakakino mo te whakamahi motika. Hei tuku tono, imeera rhythmnexusco@gmail.com. ||| Ka pupuri matou i nga raraunga whaiaro i te wa e tika ana ki te whakatutuki i nga ota, ki te whakatutuki i nga whakaritenga ture, me te whakatau i nga tautohetohe. ||| Ka taea e matou te whakawhiti raraunga ki waho o to rohe. Ina whakawhiti mai i te EU/EEA/Switzerland, ka whakamahia e matou nga Rarangi Whakaaetanga Paerewa (SCCs) me etahi atu whakamarumaru ture. ||| Ka whakatinanahia e matou nga whakamarumaru hangarau me nga whakaritenga whakahaere tae atu ki te whakamunatanga SSL, nga punaha utu haumaru, me nga tikanga whakahaere uru. Engari, kaore he punaha e 100% te haumaru."
-  }
-};
-
-const POLICY_SUPPLEMENTS = {
-  "en": {
-    "termsSupplement": "To the maximum extent permitted by applicable law, we are not liable for indirect, incidental, or consequential damages, loss of data, lost profits, or business interruption. Our total liability shall not exceed the amount you paid for the product(s) purchased. For consumers in the EU/EEA/Switzerland, mandatory statutory rights are unaffected. ||| These Terms are governed by the laws of Singapore without regard to conflict of law principles. EU/EEA/Swiss users may have additional protections under local law that cannot be waived. ||| EU/EEA/Swiss users may access the EU Online Dispute Resolution platform: https://ec.europa.eu/consumers/odr/ ||| USA users may resolve disputes through negotiation, arbitration (if agreed), or court action in their jurisdiction. ||| We may update these Terms. The revised version will be posted at this URL with a new effective date.",
-    "privacySupplement": "We use cookies and similar technologies to operate the Website, analyze usage, and personalize content. EU/EEA/Swiss visitors will be shown a cookie consent banner. You can manage cookie preferences in your browser settings. ||| We do not knowingly collect personal data from children under 13 in the USA or under 16 in the EU/EEA. If we learn that we have collected such data, we will delete it. ||| Our Website may contain links to third-party sites. We are not responsible for their privacy practices. ||| We may update this policy. The new version will be posted at this URL with a revised effective date."
-  },
-  "de": {
-    "termsSupplement": "Soweit gesetzlich zulässig, haften wir nicht für indirekte, zufällige oder Folgeschäden, Datenverlust, entgangenen Gewinn oder Betriebsunterbrechung. Unsere Gesamthaftung übersteigt nicht den Betrag, den Sie für das/die gekaufte(n) Produkt(e) bezahlt haben. Für Verbraucher in der EU/EWR/Schweiz bleiben zwingende gesetzliche Rechte unberührt. ||| Diese Bedingungen unterliegen den Gesetzen [Ihrer Gerichtsbarkeit] ohne Rücksicht auf Kollisionsnormen. Benutzer aus der EU, dem EWR und der Schweiz können aufgrund lokaler Gesetze zusätzlichen Schutz genießen, auf den nicht verzichtet werden kann. ||| Benutzer aus der EU, dem EWR und der Schweiz können auf die Online-Streitbeilegungsplattform der EU zugreifen: https://ec.europa.eu/consumers/odr/ ||| Benutzer in den USA können Streitigkeiten durch Verhandlungen, Schiedsverfahren (sofern vereinbart) oder gerichtliche Schritte in ihrem Zuständigkeitsbereich beilegen. ||| Wir können diese Bedingungen aktualisieren. Die überarbeitete Version wird unter dieser URL mit einem neuen Datum des Inkrafttretens veröffentlicht.",
-    "privacySupplement": "Wir verwenden Cookies und ähnliche Technologien, um die Website zu betreiben, die Nutzung zu analysieren und Inhalte zu personalisieren. Besuchern aus der EU, dem EWR und der Schweiz wird ein Cookie-Zustimmungsbanner angezeigt. Sie können die Cookie-Einstellungen in Ihren Browsereinstellungen verwalten. ||| Wir erfassen wissentlich keine personenbezogenen Daten von Kindern unter 13 Jahren in den USA oder unter 16 Jahren in der EU/EWR. Wenn wir erfahren, dass wir solche Daten erhoben haben, werden wir diese löschen. ||| Unsere Website kann Links zu Websites Dritter enthalten. Wir sind nicht für deren Datenschutzpraktiken verantwortlich. ||| Wir können diese Richtlinie aktualisieren. Die neue Version wird unter dieser URL mit einem geänderten Datum des Inkrafttretens veröffentlicht."
-  },
-  "fr": {
-    "termsSupplement": "Dans la mesure permise par la loi applicable, nous ne sommes pas responsables des dommages indirects, accessoires ou consécutifs, de la perte de données, de la perte de bénéfices ou de l'interruption des activités. Notre responsabilité totale ne dépassera pas le montant que vous avez payé pour le(s) produit(s) acheté(s). Pour les consommateurs de l’UE/EEE/Suisse, les droits légaux obligatoires ne sont pas affectés. ||| Les présentes Conditions sont régies par les lois de [Votre Juridiction] sans égard aux principes de conflit de lois. Les utilisateurs de l’UE/EEE/Suisse peuvent bénéficier de protections supplémentaires en vertu de la législation locale auxquelles il est impossible de renoncer. ||| Les utilisateurs de l'UE/EEE/Suisse peuvent accéder à la plateforme de règlement des litiges en ligne de l'UE: https://ec.europa.eu/consumers/odr/ ||| Les utilisateurs américains peuvent résoudre les litiges par la négociation, l'arbitrage (si convenu) ou une action en justice dans leur juridiction. ||| Nous pouvons mettre à jour ces conditions. La version révisée sera publiée à cette URL avec une nouvelle date d'entrée en vigueur.",
-    "privacySupplement": "Nous utilisons des cookies et des technologies similaires pour exploiter le site Web, analyser l'utilisation et personnaliser le contenu. Les visiteurs de l’UE/EEE/Suisse verront une bannière de consentement aux cookies. Vous pouvez gérer les préférences en matière de cookies dans les paramètres de votre navigateur. ||| Nous ne collectons pas sciemment de données personnelles auprès d'enfants de moins de 13 ans aux États-Unis ou de moins de 16 ans dans l'UE/EEE. Si nous apprenons que nous avons collecté de telles données, nous les supprimerons. ||| Notre site Web peut contenir des liens vers des sites tiers. Nous ne sommes pas responsables de leurs pratiques de confidentialité. ||| Nous pouvons mettre à jour cette politique. La nouvelle version sera publiée à cette URL avec une date d'entrée en vigueur révisée."
-  },
-  "es": {
-    "termsSupplement": "En la medida máxima permitida por la ley aplicable, no somos responsables de daños indirectos, incidentales o consecuentes, pérdida de datos, pérdida de ganancias o interrupción del negocio. Nuestra responsabilidad total no excederá el monto que usted pagó por los productos adquiridos. Para los consumidores de la UE/EEE/Suiza, los derechos legales obligatorios no se ven afectados. ||| Estos Términos se rigen por las leyes de [Su Jurisdicción] sin tener en cuenta los principios de conflicto de leyes. Los usuarios de la UE, el EEE y Suiza pueden tener protecciones adicionales según la legislación local a las que no se puede renunciar. ||| Los usuarios de la UE, el EEE y Suiza pueden acceder a la plataforma de resolución de disputas en línea de la UE: https://ec.europa.eu/consumers/odr/ ||| Los usuarios de EE. UU. pueden resolver disputas mediante negociación, arbitraje (si se acuerda) o acciones judiciales en su jurisdicción. ||| Podemos actualizar estos Términos. La versión revisada se publicará en esta URL con una nueva fecha de vigencia.",
-    "privacySupplement": "Utilizamos cookies y tecnologías similares para operar el sitio web, analizar el uso y personalizar el contenido. A los visitantes de la UE, el EEE y Suiza se les mostrará un banner de consentimiento de cookies. Puede administrar las preferencias de cookies en la configuración de su navegador. ||| No recopilamos intencionadamente datos personales de niños menores de 13 años en los EE. UU. o menores de 16 años en la UE/EEE. Si descubrimos que hemos recopilado dichos datos, los eliminaremos. ||| Nuestro sitio web puede contener enlaces a sitios de terceros. No somos responsables de sus prácticas de privacidad. ||| Es posible que actualicemos esta política. La nueva versión se publicará en esta URL con una fecha de vigencia revisada."
-  },
-  "ja": {
-    "termsSupplement": "適用される法律で認められる最大限の範囲で、当社は間接的、付随的、結果的損害、データの損失、利益の損失、または事業の中断に対して責任を負いません。当社の責任総額は、お客様が購入した製品に対して支払った金額を超えないものとします。 EU/EEA/スイスの消費者にとって、強制的な法的権利は影響を受けません。 ||| これらの規約は、法の抵触の原則に関係なく、[管轄区域] の法律に準拠します。 EU/EEA/スイスのユーザーは、現地法に基づいて放棄できない追加の保護を受ける場合があります。 ||| EU/EEA/スイスのユーザーは、EU オンライン紛争解決プラットフォームにアクセスできます: https://ec.europa.eu/consumers/odr/ ||| 米国のユーザーは、交渉、仲裁 (合意されている場合)、または管轄区域内の訴訟を通じて紛争を解決することができます。 ||| 当社は本規約を更新する場合があります。改訂版は新しい発効日とともにこの URL に掲載されます。",
-    "privacySupplement": "当社は、Web サイトの運営、使用状況の分析、コンテンツのパーソナライズに Cookie および同様のテクノロジーを使用します。 EU/EEA/スイスの訪問者には、Cookie 同意バナーが表示されます。ブラウザの設定で Cookie の設定を管理できます。 ||| 当社は、米国では 13 歳未満、EU/EEA では 16 歳未満の子供から故意に個人データを収集しません。当社がそのようなデータを収集したことが判明した場合、当社はそのデータを削除します。 ||| 当社のウェブサイトには、サードパーティのサイトへのリンクが含まれている場合があります。当社は、彼らのプライバシー慣行については責任を負いません。 ||| このポリシーは更新される場合があります。新しいバージョンは、発効日が変更されてこの URL に掲載されます。"
-  },
-  "zh": {
-    "termsSupplement": "在适用法律允许的最大范围内，我们对间接、偶然或后果性损害、数据丢失、利润损失或业务中断不承担责任。我们的总责任不得超过您购买产品所支付的金额。对于欧盟/欧洲经济区/瑞士的消费者来说，强制性法定权利不受影响。 ||| 这些条款受[您的司法管辖区]的法律管辖，不考虑法律冲突原则。根据当地法律，欧盟/欧洲经济区/瑞士用户可能享有无法豁免的额外保护。 ||| 欧盟/欧洲经济区/瑞士用户可以访问欧盟在线争议解决平台：https://ec.europa.eu/consumers/odr/ ||| 美国用户可以通过谈判、仲裁（如果同意）或在其管辖范围内的法院诉讼来解决争议。 ||| 我们可能会更新这些条款。修订后的版本将在此 URL 上发布，并具有新的生效日期。",
-    "privacySupplement": "我们使用 cookie 和类似技术来运营网站、分析使用情况和个性化内容。欧盟/欧洲经济区/瑞士访客将看到 cookie 同意横幅。您可以在浏览器设置中管理 cookie 首选项。 ||| 我们不会故意收集美国 13 岁以下儿童或欧盟/欧洲经济区 16 岁以下儿童的个人数据。如果我们得知我们收集了此类数据，我们将删除它。 ||| 我们的网站可能包含第三方网站的链接。我们不对他们的隐私做法负责。 ||| 我们可能会更新此政策。新版本将在此 URL 上发布，并更改生效日期。"
-  },
-  "zh-hant": {
-    "termsSupplement": "在適用法律允許的最大範圍內，我們對間接、偶發或後果性損害、資料遺失、利潤損失或業務中斷不承擔責任。我們的總責任不得超過您購買產品所支付的金額。對於歐盟/歐洲經濟區/瑞士的消費者來說，強制性法定權利不受影響。 ||| 這些條款受[您的司法管轄區]的法律管轄，不考慮法律衝突原則。根據當地法律，歐盟/歐洲經濟區/瑞士用戶可能享有無法豁免的額外保護。 ||| 歐盟/歐洲經濟區/瑞士用戶可以訪問歐盟線上爭議解決平台：https://ec.europa.eu/consumers/odr/ ||| 美國用戶可以透過談判、仲裁（如果同意）或在其管轄範圍內的法院訴訟來解決爭議。 ||| 我們可能會更新這些條款。修訂後的版本將在此 URL 上發布，並具有新的生效日期。",
-    "privacySupplement": "我們使用 cookie 和類似技術來經營網站、分析使用情況和個人化內容。歐盟/歐洲經濟區/瑞士訪客將看到 cookie 同意橫幅。您可以在瀏覽器設定中管理 cookie 首選項。 ||| 我們不會故意收集美國 13 歲以下兒童或歐盟/歐洲經濟區 16 歲以下兒童的個人資料。如果我們得知我們收集了此類數據，我們將刪除它。 ||| 我們的網站可能包含第三方網站的連結。我們不對他們的隱私做法負責。 ||| 我們可能會更新此政策。新版本將在此 URL 上發布，並更改生效日期。"
-  },
-  "pt": {
-    "termsSupplement": "Na extensão máxima permitida pela lei aplicável, não somos responsáveis ​​por danos indiretos, incidentais ou consequenciais, perda de dados, lucros cessantes ou interrupção de negócios. Nossa responsabilidade total não excederá o valor que você pagou pelo(s) produto(s) adquirido(s). Para os consumidores na UE/EEE/Suíça, os direitos legais obrigatórios não são afetados. ||| Estes Termos são regidos pelas leis de [Sua Jurisdição], sem levar em conta conflitos de princípios legais. Os usuários da UE/EEE/Suíça podem ter proteções adicionais sob a legislação local que não podem ser dispensadas. ||| Os utilizadores da UE/EEE/Suíça podem aceder à plataforma de resolução de litígios em linha da UE: https://ec.europa.eu/consumers/odr/ ||| Os usuários dos EUA podem resolver disputas por meio de negociação, arbitragem (se acordado) ou ação judicial em sua jurisdição. ||| Poderemos atualizar estes Termos. A versão revisada será publicada neste URL com uma nova data de vigência.",
-    "privacySupplement": "Utilizamos cookies e tecnologias semelhantes para operar o Site, analisar o uso e personalizar o conteúdo. Os visitantes da UE/EEE/Suíça verão um banner de consentimento de cookies. Você pode gerenciar as preferências de cookies nas configurações do seu navegador. ||| Não coletamos intencionalmente dados pessoais de crianças menores de 13 anos nos EUA ou menores de 16 anos na UE/EEE. Se soubermos que coletamos tais dados, iremos excluí-los. ||| Nosso site pode conter links para sites de terceiros. Não somos responsáveis ​​por suas práticas de privacidade. ||| Podemos atualizar esta política. A nova versão será publicada neste URL com uma data de vigência revisada."
-  },
-  "hi": {
-    "termsSupplement": "लागू कानून द्वारा अनुमत अधिकतम सीमा तक, हम अप्रत्यक्ष, आकस्मिक, या परिणामी क्षति, डेटा की हानि, खोए हुए मुनाफे या व्यावसायिक रुकावट के लिए उत्तरदायी नहीं हैं। हमारी कुल देनदारी आपके द्वारा खरीदे गए उत्पाद(उत्पादों) के लिए भुगतान की गई राशि से अधिक नहीं होगी। ईयू/ईईए/स्विट्जरलैंड में उपभोक्ताओं के लिए, अनिवार्य वैधानिक अधिकार अप्रभावित हैं। ||| ये शर्तें कानूनी सिद्धांतों के टकराव की परवाह किए बिना [आपके क्षेत्राधिकार] के कानूनों द्वारा शासित होती हैं। ईयू/ईईए/स्विस उपयोगकर्ताओं को स्थानीय कानून के तहत अतिरिक्त सुरक्षा मिल सकती है जिसे माफ नहीं किया जा सकता है। ||| EU/EEA/स्विस उपयोगकर्ता EU ऑनलाइन विवाद समाधान प्लेटफ़ॉर्म तक पहुंच सकते हैं: https://ec.europa.eu/consumers/odr/ ||| यूएसए उपयोगकर्ता अपने अधिकार क्षेत्र में बातचीत, मध्यस्थता (यदि सहमति हो) या अदालती कार्रवाई के माध्यम से विवादों को हल कर सकते हैं। ||| हम इन शर्तों को अद्यतन कर सकते हैं। संशोधित संस्करण एक नई प्रभावी तिथि के साथ इस यूआरएल पर पोस्ट किया जाएगा।",
-    "privacySupplement": "हम वेबसाइट को संचालित करने, उपयोग का विश्लेषण करने और सामग्री को वैयक्तिकृत करने के लिए कुकीज़ और समान तकनीकों का उपयोग करते हैं। ईयू/ईईए/स्विस आगंतुकों को कुकी सहमति बैनर दिखाया जाएगा। आप अपनी ब्राउज़र सेटिंग में कुकी प्राथमिकताएं प्रबंधित कर सकते हैं. ||| हम जानबूझकर संयुक्त राज्य अमेरिका में 13 वर्ष से कम उम्र के बच्चों या ईयू/ईईए में 16 वर्ष से कम उम्र के बच्चों का व्यक्तिगत डेटा एकत्र नहीं करते हैं। अगर हमें पता चलता है कि हमने ऐसा डेटा एकत्र किया है, तो हम इसे हटा देंगे। ||| हमारी वेबसाइट में तृतीय-पक्ष साइटों के लिंक हो सकते हैं। हम उनकी गोपनीयता प्रथाओं के लिए ज़िम्मेदार नहीं हैं। ||| हम इस नीति को अद्यतन कर सकते हैं. नया संस्करण संशोधित प्रभावी तिथि के साथ इस यूआरएल पर पोस्ट किया जाएगा।"
-  },
-  "th": {
-    "termsSupplement": "ตามขอบเขตสูงสุดที่กฎหมายที่เกี่ยวข้องอนุญาต เราจะไม่รับผิดชอบต่อความเสียหายทางอ้อม ความเสียหายโดยบังเอิญหรือเป็นผลสืบเนื่อง การสูญเสียข้อมูล การสูญเสียผลกำไร หรือการหยุดชะงักทางธุรกิจ ความรับผิดทั้งหมดของเราจะไม่เกินจำนวนเงินที่คุณจ่ายสำหรับผลิตภัณฑ์ที่ซื้อ สำหรับผู้บริโภคใน EU/EEA/สวิตเซอร์แลนด์ สิทธิ์ตามกฎหมายที่บังคับจะไม่ได้รับผลกระทบ ||| ข้อกำหนดเหล่านี้อยู่ภายใต้กฎหมายของ [เขตอำนาจศาลของคุณ] โดยไม่คำนึงถึงหลักความขัดแย้งของกฎหมาย ผู้ใช้ EU/EEA/Swiss อาจมีการคุ้มครองเพิ่มเติมภายใต้กฎหมายท้องถิ่นซึ่งไม่สามารถยกเว้นได้ ||| ผู้ใช้ EU/EEA/Swiss สามารถเข้าถึงแพลตฟอร์มการระงับข้อพิพาทออนไลน์ของ EU: https://ec.europa.eu/consumers/odr/ ||| ผู้ใช้ในสหรัฐอเมริกาอาจแก้ไขข้อพิพาทผ่านการเจรจา การอนุญาโตตุลาการ (หากตกลง) หรือการดำเนินคดีของศาลในเขตอำนาจศาลของตน ||| เราอาจปรับปรุงข้อกำหนดเหล่านี้ เวอร์ชันที่แก้ไขจะถูกโพสต์ที่ URL นี้พร้อมวันที่มีผลบังคับใช้ใหม่",
-    "privacySupplement": "เราใช้คุกกี้และเทคโนโลยีที่คล้ายกันเพื่อดำเนินการเว็บไซต์ วิเคราะห์การใช้งาน และปรับแต่งเนื้อหาให้เป็นส่วนตัว ผู้เยี่ยมชมจาก EU/EEA/Swiss จะเห็นแบนเนอร์ยินยอมการใช้คุกกี้ คุณสามารถจัดการการตั้งค่าคุกกี้ได้ในการตั้งค่าเบราว์เซอร์ของคุณ ||| เราไม่จงใจรวบรวมข้อมูลส่วนบุคคลจากเด็กอายุต่ำกว่า 13 ปีในสหรัฐอเมริกาหรืออายุต่ำกว่า 16 ปีใน EU/EEA หากเราทราบว่าเราได้รวบรวมข้อมูลดังกล่าวแล้ว เราจะลบข้อมูลนั้น ||| เว็บไซต์ของเราอาจมีลิงก์ไปยังเว็บไซต์บุคคลที่สาม เราไม่รับผิดชอบต่อหลักปฏิบัติด้านความเป็นส่วนตัวของพวกเขา ||| เราอาจปรับปรุงนโยบายนี้ เวอร์ชันใหม่จะโพสต์ที่ URL นี้พร้อมวันที่มีผลแก้ไข"
-  },
-  "ms": {
-    "termsSupplement": "Setakat maksimum yang dibenarkan oleh undang-undang yang terpakai, kami tidak bertanggungjawab ke atas kerosakan tidak langsung, sampingan atau berbangkit, kehilangan data, kehilangan keuntungan atau gangguan perniagaan. Jumlah liabiliti kami tidak boleh melebihi jumlah yang anda bayar untuk produk yang dibeli. Bagi pengguna di EU/EEA/Switzerland, hak berkanun mandatori tidak terjejas. ||| Syarat ini dikawal oleh undang-undang [Bidang Kuasa Anda] tanpa mengambil kira percanggahan prinsip undang-undang. Pengguna EU/EEA/Swiss mungkin mempunyai perlindungan tambahan di bawah undang-undang tempatan yang tidak boleh diketepikan. ||| Pengguna EU/EEA/Swiss boleh mengakses platform Penyelesaian Pertikaian Dalam Talian EU: https://ec.europa.eu/consumers/odr/ ||| Pengguna USA boleh menyelesaikan pertikaian melalui rundingan, timbang tara (jika dipersetujui), atau tindakan mahkamah dalam bidang kuasa mereka. ||| Kami mungkin mengemas kini Syarat ini. Versi yang disemak akan disiarkan di URL ini dengan tarikh kuat kuasa baharu.",
-    "privacySupplement": "Kami menggunakan kuki dan teknologi serupa untuk mengendalikan Laman Web, menganalisis penggunaan dan memperibadikan kandungan. Pelawat EU/EEA/Swiss akan ditunjukkan sepanduk kebenaran kuki. Anda boleh mengurus pilihan kuki dalam tetapan penyemak imbas anda. ||| Kami tidak mengumpul data peribadi daripada kanak-kanak bawah 13 tahun di AS atau bawah 16 tahun di EU/EEA secara tidak sengaja. Jika kami mengetahui bahawa kami telah mengumpul data sedemikian, kami akan memadamkannya. ||| Laman Web kami mungkin mengandungi pautan ke tapak pihak ketiga. Kami tidak bertanggungjawab ke atas amalan privasi mereka. ||| Kami mungkin mengemas kini dasar ini. Versi baharu akan disiarkan di URL ini dengan tarikh kuat kuasa yang disemak semula."
-  },
-  "nl": {
-    "termsSupplement": "Voor zover maximaal toegestaan ​​door de toepasselijke wetgeving, zijn wij niet aansprakelijk voor indirecte, incidentele of gevolgschade, verlies van gegevens, gederfde winst of bedrijfsonderbreking. Onze totale aansprakelijkheid zal niet hoger zijn dan het bedrag dat u voor het/de gekochte product(en) heeft betaald. Voor consumenten in de EU/EER/Zwitserland blijven de verplichte wettelijke rechten onaangetast. ||| Op deze Voorwaarden is de wetgeving van [Uw rechtsgebied] van toepassing, zonder rekening te houden met conflicterende wettelijke principes. EU/EER/Zwitserse gebruikers kunnen onder de lokale wetgeving aanvullende bescherming genieten waar geen afstand van kan worden gedaan. ||| EU/EER/Zwitserse gebruikers hebben toegang tot het EU Online Dispute Resolution-platform: https://ec.europa.eu/consumers/odr/ ||| Gebruikers in de VS kunnen geschillen oplossen door middel van onderhandelingen, arbitrage (indien overeengekomen) of gerechtelijke stappen in hun rechtsgebied. ||| Wij kunnen deze Voorwaarden bijwerken. De herziene versie wordt op deze URL geplaatst met een nieuwe ingangsdatum.",
-    "privacySupplement": "We gebruiken cookies en soortgelijke technologieën om de website te beheren, het gebruik te analyseren en de inhoud te personaliseren. Bezoekers uit de EU/EER/Zwitserland krijgen een banner voor toestemming voor cookies te zien. U kunt cookievoorkeuren beheren in uw browserinstellingen. ||| We verzamelen niet bewust persoonlijke gegevens van kinderen jonger dan 13 jaar in de VS of jonger dan 16 jaar in de EU/EER. Als we vernemen dat we dergelijke gegevens hebben verzameld, zullen we deze verwijderen. ||| Onze website kan links naar sites van derden bevatten. Wij zijn niet verantwoordelijk voor hun privacypraktijken. ||| We kunnen dit beleid bijwerken. De nieuwe versie wordt op deze URL geplaatst met een herziene ingangsdatum."
-  },
-  "id": {
-    "termsSupplement": "Sejauh diizinkan oleh hukum yang berlaku, kami tidak bertanggung jawab atas kerusakan tidak langsung, insidental, atau konsekuensial, kehilangan data, hilangnya keuntungan, atau gangguan bisnis. Tanggung jawab total kami tidak melebihi jumlah yang Anda bayarkan untuk produk yang dibeli. Bagi konsumen di UE/EEA/Swiss, hak wajib menurut undang-undang tidak terpengaruh. ||| Ketentuan ini diatur oleh hukum [Yurisdiksi Anda] tanpa memperhatikan pertentangan prinsip hukum. Pengguna UE/EEA/Swiss mungkin memiliki perlindungan tambahan berdasarkan hukum setempat yang tidak dapat diabaikan. ||| Pengguna EU/EEA/Swiss dapat mengakses platform Penyelesaian Sengketa Online UE: https://ec.europa.eu/consumers/odr/ ||| Pengguna AS dapat menyelesaikan perselisihan melalui negosiasi, arbitrase (jika disetujui), atau tindakan pengadilan di yurisdiksi mereka. ||| Kami dapat memperbarui Ketentuan ini. Versi revisi akan diposting di URL ini dengan tanggal efektif baru.",
-    "privacySupplement": "Kami menggunakan cookie dan teknologi serupa untuk mengoperasikan Situs Web, menganalisis penggunaan, dan mempersonalisasi konten. Pengunjung UE/EEA/Swiss akan diperlihatkan spanduk persetujuan cookie. Anda dapat mengelola preferensi cookie di pengaturan browser Anda. ||| Kami tidak dengan sengaja mengumpulkan data pribadi dari anak-anak di bawah 13 tahun di AS atau di bawah 16 tahun di UE/EEA. Jika kami mengetahui bahwa kami telah mengumpulkan data tersebut, kami akan menghapusnya. ||| Situs Web kami mungkin berisi tautan ke situs pihak ketiga. Kami tidak bertanggung jawab atas praktik privasi mereka. ||| Kami mungkin memperbarui kebijakan ini. Versi baru akan diposting di URL ini dengan tanggal efektif yang telah direvisi."
-  },
-  "cs": {
-    "termsSupplement": "V maximální míře povolené příslušnými zákony neneseme odpovědnost za nepřímé, náhodné nebo následné škody, ztrátu dat, ušlý zisk nebo přerušení podnikání. Naše celková odpovědnost nepřesáhne částku, kterou jste zaplatili za zakoupené produkty. Pro spotřebitele v EU/EHP/Švýcarsku nejsou povinná zákonná práva dotčena. ||| Tyto podmínky se řídí zákony [Vaše jurisdikce] bez ohledu na konflikt právních zásad. Uživatelé z EU/EHP/Švýcarska mohou mít podle místních zákonů další ochranu, které se nelze vzdát. ||| Uživatelé EU/EHP/Swiss mají přístup k platformě EU pro řešení sporů online: https://ec.europa.eu/consumers/odr/ ||| Uživatelé z USA mohou řešit spory vyjednáváním, rozhodčím řízením (pokud bylo dohodnuto) nebo soudním řízením v jejich jurisdikci. ||| Tyto Podmínky můžeme aktualizovat. Revidovaná verze bude zveřejněna na této adrese URL s novým datem účinnosti.",
-    "privacySupplement": "K provozování webových stránek, analýze použití a personalizaci obsahu používáme soubory cookie a podobné technologie. Návštěvníkům z EU/EHP/Švýcarska se zobrazí banner souhlasu se soubory cookie. Předvolby souborů cookie můžete spravovat v nastavení prohlížeče. ||| Vědomě neshromažďujeme osobní údaje od dětí mladších 13 let v USA nebo mladších 16 let v EU/EHP. Pokud se dozvíme, že jsme takové údaje shromáždili, vymažeme je. ||| Naše webové stránky mohou obsahovat odkazy na stránky třetích stran. Nejsme zodpovědní za jejich postupy ochrany osobních údajů. ||| Tyto zásady můžeme aktualizovat. Nová verze bude zveřejněna na této adrese URL s upraveným datem účinnosti."
-  },
-  "it": {
-    "termsSupplement": "Nella misura massima consentita dalla legge applicabile, non siamo responsabili per danni indiretti, incidentali o consequenziali, perdita di dati, perdita di profitti o interruzione dell'attività. La nostra responsabilità totale non supererà l'importo pagato per il/i prodotto/i acquistato/i. Per i consumatori nell'UE/SEE/Svizzera, i diritti legali obbligatori rimangono inalterati. ||| Le presenti Condizioni sono regolate dalle leggi di [La tua giurisdizione] indipendentemente dai principi di conflitto di leggi. Gli utenti UE/SEE/Svizzera potrebbero godere di protezioni aggiuntive ai sensi della legge locale a cui non è possibile rinunciare. ||| Gli utenti UE/SEE/svizzeri possono accedere alla piattaforma di risoluzione delle controversie online dell'UE: https://ec.europa.eu/consumers/odr/ ||| Gli utenti statunitensi possono risolvere le controversie tramite negoziazione, arbitrato (se concordato) o azione legale nella loro giurisdizione. ||| Potremmo aggiornare questi Termini. La versione rivista verrà pubblicata a questo URL con una nuova data di entrata in vigore.",
-    "privacySupplement": "Utilizziamo cookie e tecnologie simili per gestire il sito Web, analizzarne l'utilizzo e personalizzare i contenuti. Ai visitatori UE/SEE/Svizzera verrà mostrato un banner di consenso sui cookie. Puoi gestire le preferenze dei cookie nelle impostazioni del tuo browser. ||| Non raccogliamo consapevolmente dati personali di bambini sotto i 13 anni negli Stati Uniti o sotto i 16 anni nell'UE/SEE. Se apprendiamo di aver raccolto tali dati, li cancelleremo. ||| Il nostro sito Web può contenere collegamenti a siti di terze parti. Non siamo responsabili delle loro pratiche sulla privacy. ||| Potremmo aggiornare questa politica. La nuova versione verrà pubblicata a questo URL con una data di entrata in vigore rivista."
-  },
-  "he": {
-    "termsSupplement": "במידה המקסימלית המותרת על פי החוק החל, איננו אחראים לנזקים עקיפים, מקריים או תוצאתיים, אובדן נתונים, אובדן רווחים או הפרעה עסקית. החבות הכוללת שלנו לא תעלה על הסכום ששילמת עבור המוצר/ים שנרכשו. עבור צרכנים באיחוד האירופי/EEA/שוויץ, זכויות חובה בחוק אינן מושפעות. ||| תנאים אלה כפופים לחוקי [תחום השיפוט שלך] ללא התחשבות בעקרונות ניגוד החוק. למשתמשים באיחוד האירופי/EEA/שוויץ עשויות להיות הגנות נוספות במסגרת החוק המקומי שלא ניתן לוותר עליהן. ||| משתמשי EU/EEA/Swiss יכולים לגשת לפלטפורמת יישוב סכסוכים מקוונים של האיחוד האירופי: https://ec.europa.eu/consumers/odr/ ||| משתמשים בארה\"ב עשויים לפתור מחלוקות באמצעות משא ומתן, בוררות (אם הוסכם), או תביעה משפטית בתחום השיפוט שלהם. ||| אנו עשויים לעדכן תנאים אלה. הגרסה המתוקנת תפורסם בכתובת האתר הזו עם תאריך תוקף חדש.",
-    "privacySupplement": "אנו משתמשים בעוגיות ובטכנולוגיות דומות כדי לתפעל את האתר, לנתח את השימוש ולהתאים אישית את התוכן. למבקרים באיחוד האירופי/EEA/שווייץ יוצג באנר הסכמה לקובצי Cookie. אתה יכול לנהל את העדפות העוגיות בהגדרות הדפדפן שלך. ||| איננו אוספים ביודעין מידע אישי מילדים מתחת לגיל 13 בארה\"ב או מתחת לגיל 16 באיחוד האירופי/EEA. אם נודע שאספנו נתונים כאלה, נמחק אותם. ||| האתר שלנו עשוי להכיל קישורים לאתרי צד שלישי. איננו אחראים לנוהלי הפרטיות שלהם. ||| אנו עשויים לעדכן מדיניות זו. הגרסה החדשה תפורסם בכתובת האתר הזו עם תאריך תוקף מתוקן."
-  },
-  "ga": {
-    "termsSupplement": "A mhéid a cheadaítear faoin dlí is infheidhme, nílimid faoi dhliteanas i leith damáistí indíreacha, teagmhasacha nó iarmhartacha, cailleadh sonraí, brabúis chaillte, nó briseadh gnó. Ní sháróidh ár ndliteanas iomlán an méid a d'íoc tú as an táirge/na táirgí a ceannaíodh. I gcás tomhaltóirí san AE/LEE/an Eilvéis, níl aon tionchar ar chearta reachtúla éigeantacha. ||| Tá na Téarmaí seo á rialú ag dlíthe [Do Dhlínse] gan aird ar phrionsabail easaontachta dlí. D’fhéadfadh cosaintí breise a bheith ag úsáideoirí AE/LEE/na hEilvéise faoin dlí áitiúil nach féidir a tharscaoileadh. ||| Féadfaidh úsáideoirí AE/EEA/Eilvéise rochtain a fháil ar an ardán um Réiteach Díospóide Ar Líne an AE: https://ec.europa.eu/consumers/odr/ ||| Féadfaidh úsáideoirí SAM díospóidí a réiteach trí idirbheartaíocht, eadráin (má chomhaontaítear é), nó caingean cúirte ina ndlínse. ||| Is féidir linn na Téarmaí seo a nuashonrú. Déanfar an leagan athbhreithnithe a phostáil ag an URL seo le dáta éifeachtach nua.",
-    "privacySupplement": "Bainimid úsáid as fianáin agus teicneolaíochtaí cosúla chun an Láithreán Gréasáin a oibriú, chun anailís a dhéanamh ar úsáid agus chun ábhar a phearsantú. Taispeánfar bratach toilithe fianán do chuairteoirí AE/LEE/Eilvéise. Is féidir leat sainroghanna fianán a bhainistiú i socruithe do bhrabhsálaí. ||| Ní bhailímid go feasach sonraí pearsanta ó leanaí faoi 13 i SAM nó faoi 16 san AE/LEE. Má fhaigheann muid amach go bhfuil sonraí den sórt sin bailithe againn, scriosfaimid é. ||| Féadfaidh naisc chuig láithreáin tríú páirtí a bheith ar ár Láithreán Gréasáin. Nílimid freagrach as a gcleachtais phríobháideachais. ||| Féadfaimid an polasaí seo a nuashonrú. Déanfar an leagan nua a phostáil ag an URL seo le dáta éifeachtach athbhreithnithe."
-  },
-  "pl": {
-    "termsSupplement": "W maksymalnym zakresie dozwolonym przez obowiązujące prawo nie ponosimy odpowiedzialności za szkody pośrednie, przypadkowe lub następcze, utratę danych, utratę zysków lub przerwę w działalności. Nasza całkowita odpowiedzialność nie może przekroczyć kwoty zapłaconej przez Państwa za zakupiony(e) produkt(y). W przypadku konsumentów w UE/EOG/Szwajcarii nie ma to wpływu na obowiązkowe prawa ustawowe. ||| Niniejsze Warunki podlegają prawu [Twoja jurysdykcja] bez względu na zasady kolizyjne. Użytkownicy z UE/EOG/Szwajcarii mogą korzystać z dodatkowych zabezpieczeń na mocy lokalnego prawa, od których nie można się odstąpić. ||| Użytkownicy z UE/EOG/Szwajcarii mogą uzyskać dostęp do unijnej platformy internetowego rozstrzygania sporów: https://ec.europa.eu/consumers/odr/ ||| Użytkownicy z USA mogą rozstrzygać spory w drodze negocjacji, arbitrażu (jeśli tak uzgodniono) lub działań sądowych w swojej jurysdykcji. ||| Możemy aktualizować niniejsze Warunki. Poprawiona wersja zostanie opublikowana pod tym adresem URL z nową datą wejścia w życie.",
-    "privacySupplement": "Używamy plików cookie i podobnych technologii do obsługi Witryny, analizowania użytkowania i personalizowania treści. Odwiedzającym z UE/EOG/Szwajcarii zostanie wyświetlony baner wyrażający zgodę na użycie plików cookie. Możesz zarządzać preferencjami dotyczącymi plików cookies w ustawieniach swojej przeglądarki. ||| Nie zbieramy świadomie danych osobowych od dzieci poniżej 13 roku życia w USA lub poniżej 16 roku życia w UE/EOG. Jeśli dowiemy się, że zebraliśmy takie dane, usuniemy je. ||| Nasza Witryna internetowa może zawierać łącza do witryn stron trzecich. Nie ponosimy odpowiedzialności za ich praktyki dotyczące prywatności. ||| Możemy zaktualizować tę politykę. Nowa wersja zostanie opublikowana pod tym adresem URL ze zmienioną datą wejścia w życie."
-  },
-  "ko": {
-    "termsSupplement": "해당 법률이 허용하는 최대 한도 내에서 당사는 간접적, 우발적 또는 결과적 손해, 데이터 손실, 이익 손실 또는 비즈니스 중단에 대해 책임을 지지 않습니다. 당사의 총 책임은 귀하가 구매한 제품에 대해 지불한 금액을 초과하지 않습니다. EU/EEA/스위스 소비자의 경우 의무적인 법적 권리는 영향을 받지 않습니다. ||| 본 약관은 국제사법 원칙에 관계없이 [귀하의 관할권] 법률의 적용을 받습니다. EU/EEA/스위스 사용자는 현지 법률에 따라 포기할 수 없는 추가 보호를 받을 수 있습니다. ||| EU/EEA/스위스 사용자는 EU 온라인 분쟁 해결 플랫폼(https://ec.europa.eu/consumers/odr/)에 액세스할 수 있습니다. ||| 미국 사용자는 협상, 중재(합의된 경우) 또는 해당 관할권의 법원 소송을 통해 분쟁을 해결할 수 있습니다. ||| 당사는 본 약관을 업데이트할 수 있습니다. 개정된 버전은 새로운 발효일과 함께 이 URL에 게시됩니다.",
-    "privacySupplement": "당사는 웹사이트를 운영하고, 사용량을 분석하고, 콘텐츠를 개인화하기 위해 쿠키 및 유사 기술을 사용합니다. EU/EEA/스위스 방문자에게는 쿠키 동의 배너가 표시됩니다. 브라우저 설정에서 쿠키 기본 설정을 관리할 수 있습니다. ||| 당사는 미국의 경우 13세 미만, EU/EEA의 경우 16세 미만 어린이로부터 고의로 개인 데이터를 수집하지 않습니다. 당사가 그러한 데이터를 수집했다는 사실을 알게 되면 해당 데이터를 삭제할 것입니다. ||| 당사 웹사이트에는 제3자 사이트에 대한 링크가 포함될 수 있습니다. 우리는 그들의 개인 정보 보호 관행에 대해 책임을 지지 않습니다. ||| 당사는 이 정책을 업데이트할 수 있습니다. 새 버전은 개정된 발효일과 함께 이 URL에 게시됩니다."
-  },
-  "no": {
-    "termsSupplement": "I den grad det er tillatt av gjeldende lov, er vi ikke ansvarlige for indirekte, tilfeldige eller følgeskader, tap av data, tapt fortjeneste eller forretningsavbrudd. Vårt totale ansvar skal ikke overstige beløpet du betalte for produktet/produktene du har kjøpt. For forbrukere i EU/EØS/Sveits er obligatoriske lovfestede rettigheter upåvirket. ||| Disse vilkårene styres av lovene i [din jurisdiksjon] uten hensyn til lovkonfliktprinsipper. EU/EØS/Sveits-brukere kan ha ytterligere beskyttelse i henhold til lokal lov som ikke kan fravikes. ||| EU/EØS/Sveits-brukere kan få tilgang til EUs plattform for onlinetvistløsning: https://ec.europa.eu/consumers/odr/ ||| USA-brukere kan løse tvister gjennom forhandlinger, voldgift (hvis avtalt), eller rettssak i deres jurisdiksjon. ||| Vi kan oppdatere disse vilkårene. Den reviderte versjonen vil bli lagt ut på denne URL-en med en ny ikrafttredelsesdato.",
-    "privacySupplement": "Vi bruker informasjonskapsler og lignende teknologier for å betjene nettstedet, analysere bruk og tilpasse innhold. Besøkende fra EU/EØS/Sveits vil bli vist et samtykkebanner for informasjonskapsler. Du kan administrere informasjonskapselpreferanser i nettleserinnstillingene. ||| Vi samler ikke bevisst inn personopplysninger fra barn under 13 år i USA eller under 16 år i EU/EØS. Hvis vi får vite at vi har samlet inn slike data, vil vi slette dem. ||| Nettstedet vårt kan inneholde lenker til tredjepartssider. Vi er ikke ansvarlige for deres personvernpraksis. ||| Vi kan oppdatere denne policyen. Den nye versjonen vil bli lagt ut på denne URL-en med en revidert ikrafttredelsesdato."
-  },
-  "ru": {
-    "termsSupplement": "В максимальной степени, разрешенной применимым законодательством, мы не несем ответственности за косвенные, случайные или косвенные убытки, потерю данных, упущенную выгоду или перерыв в работе. Наша общая ответственность не должна превышать сумму, которую вы заплатили за приобретенный продукт(ы). Для потребителей в ЕС/ЕЭЗ/Швейцарии обязательные законные права не затрагиваются. ||| Настоящие Условия регулируются законодательством [Вашей юрисдикции] без учета принципов коллизионного права. Пользователи из ЕС/ЕЭЗ/Швейцарии могут иметь дополнительную защиту в соответствии с местным законодательством, от которой нельзя отказаться. ||| Пользователи из ЕС/ЕЭЗ/Швейцарии могут получить доступ к онлайн-платформе разрешения споров ЕС: https://ec.europa.eu/consumers/odr/ ||| Пользователи из США могут разрешать споры путем переговоров, арбитража (при наличии согласия) или суда в своей юрисдикции. ||| Мы можем обновлять настоящие Условия. Пересмотренная версия будет размещена по этому URL-адресу с новой датой вступления в силу.",
-    "privacySupplement": "Мы используем файлы cookie и аналогичные технологии для управления веб-сайтом, анализа использования и персонализации контента. Посетителям ЕС/ЕЭЗ/Швейцарии будет показан баннер согласия на использование файлов cookie. Вы можете управлять настройками файлов cookie в настройках вашего браузера. ||| Мы сознательно не собираем персональные данные детей до 13 лет в США или до 16 лет в ЕС/ЕЭЗ. Если мы узнаем, что собрали такие данные, мы удалим их. ||| Наш Веб-сайт может содержать ссылки на сторонние сайты. Мы не несем ответственности за их политику конфиденциальности. ||| Мы можем обновить эту политику. Новая версия будет размещена по этому URL-адресу с измененной датой вступления в силу."
-  },
-  "sv": {
-    "termsSupplement": "I den maximala utsträckning som tillåts enligt tillämplig lag är vi inte ansvariga för indirekta, tillfälliga skador eller följdskador, förlust av data, förlorad vinst eller affärsavbrott. Vårt totala ansvar ska inte överstiga det belopp som du betalade för produkten/varorna som köpts. För konsumenter i EU/EES/Schweiz påverkas inte obligatoriska lagstadgade rättigheter. ||| Dessa villkor styrs av lagarna i [din jurisdiktion] utan hänsyn till lagkonfliktprinciper. Användare inom EU/EES/Schweiz kan ha ytterligare skydd enligt lokal lag som inte kan frångås. ||| EU/EES/Schweiziska användare kan få tillgång till EU:s plattform för onlinetvistlösning: https://ec.europa.eu/consumers/odr/ ||| USA-användare kan lösa tvister genom förhandlingar, skiljeförfarande (om överenskommet) eller domstolsåtgärder i deras jurisdiktion. ||| Vi kan komma att uppdatera dessa villkor. Den reviderade versionen kommer att publiceras på denna webbadress med ett nytt ikraftträdandedatum.",
-    "privacySupplement": "Vi använder cookies och liknande tekniker för att driva webbplatsen, analysera användningen och anpassa innehållet. Besökare inom EU/EES/Schweiz kommer att se en banner med samtycke för cookies. Du kan hantera cookie-preferenser i din webbläsarinställningar. ||| Vi samlar inte medvetet in personuppgifter från barn under 13 år i USA eller under 16 år inom EU/EES. Om vi ​​får reda på att vi har samlat in sådana uppgifter kommer vi att radera dem. ||| Vår webbplats kan innehålla länkar till tredje parts webbplatser. Vi är inte ansvariga för deras sekretesspraxis. ||| Vi kan komma att uppdatera denna policy. Den nya versionen kommer att publiceras på denna URL med ett reviderat ikraftträdandedatum."
-  },
-  "fi": {
-    "termsSupplement": "Sovellettavan lain sallimissa rajoissa emme ole vastuussa välillisistä, satunnaisista tai välillisistä vahingoista, tietojen menetyksestä, menetetyistä voitoista tai liiketoiminnan keskeytymisestä. Kokonaisvastuumme ei ylitä summaa, jonka maksoit ostetusta tuotteesta/tuotteista. Tämä ei vaikuta EU:n/ETA:n/Sveitsin kuluttajien pakollisiin lakisääteisiin oikeuksiin. ||| Näitä ehtoja säätelevät [Oma lainkäyttöalueesi] lait ottamatta huomioon lainvalintaperiaatteita. EU/ETA/Sveitsin käyttäjillä voi olla paikallisen lain mukaisia ​​lisäsuojauksia, joista ei voida luopua. ||| EU/ETA/Sveitsin käyttäjät voivat käyttää EU:n online-riitojenratkaisualustaa: https://ec.europa.eu/consumers/odr/ ||| Yhdysvaltalaiset käyttäjät voivat ratkaista kiistat neuvottelujen, välimiesmenettelyn (jos niin on sovittu) tai tuomioistuinmenettelyn kautta lainkäyttöalueellaan. ||| Voimme päivittää näitä ehtoja. Tarkistettu versio julkaistaan ​​tässä URL-osoitteessa uudella voimaantulopäivämäärällä.",
-    "privacySupplement": "Käytämme evästeitä ja vastaavia tekniikoita verkkosivuston käyttämiseen, käytön analysointiin ja sisällön personointiin. EU/ETA/Sveitsin vierailijoille näytetään evästeen suostumusbanneri. Voit hallita evästeasetuksia selaimesi asetuksista. ||| Emme tietoisesti kerää henkilötietoja alle 13-vuotiailta lapsilta Yhdysvalloissa tai alle 16-vuotiailta lapsilta EU/ETA:ssa. Jos saamme tietää, että olemme keränneet tällaisia ​​tietoja, poistamme ne. ||| Verkkosivustomme voi sisältää linkkejä kolmansien osapuolien sivustoille. Emme ole vastuussa heidän tietosuojakäytännöistään. ||| Saatamme päivittää tätä käytäntöä. Uusi versio julkaistaan ​​tässä URL-osoitteessa tarkistetulla voimaantulopäivämäärällä."
-  },
-  "tl": {
-    "termsSupplement": "Sa pinakamataas na lawak na pinahihintulutan ng naaangkop na batas, hindi kami mananagot para sa hindi direkta, hindi sinasadya, o kinahinatnang mga pinsala, pagkawala ng data, pagkawala ng kita, o pagkagambala sa negosyo. Ang aming kabuuang pananagutan ay hindi lalampas sa halagang binayaran mo para sa (mga) produktong binili. Para sa mga consumer sa EU/EEA/Switzerland, hindi naaapektuhan ang mga mandatoryong karapatan ayon sa batas. ||| Ang Mga Tuntuning ito ay pinamamahalaan ng mga batas ng [Iyong Hurisdiksiyon] nang walang pagsasaalang-alang sa salungatan ng mga prinsipyo ng batas. Ang mga user ng EU/EEA/Swiss ay maaaring magkaroon ng mga karagdagang proteksyon sa ilalim ng lokal na batas na hindi maaaring iwaksi. ||| Maaaring i-access ng mga user ng EU/EEA/Swiss ang platform ng EU Online Dispute Resolution: https://ec.europa.eu/consumers/odr/ ||| Maaaring lutasin ng mga user ng USA ang mga hindi pagkakaunawaan sa pamamagitan ng negosasyon, arbitrasyon (kung napagkasunduan), o aksyon ng hukuman sa kanilang nasasakupan. ||| Maaari naming i-update ang Mga Tuntuning ito. Ang binagong bersyon ay ipo-post sa URL na ito na may bagong petsa ng bisa.",
-    "privacySupplement": "Gumagamit kami ng cookies at mga katulad na teknolohiya upang patakbuhin ang Website, pag-aralan ang paggamit, at i-personalize ang nilalaman. Ang mga bisita sa EU/EEA/Swiss ay ipapakita sa isang cookie consent banner. Maaari mong pamahalaan ang mga kagustuhan sa cookie sa mga setting ng iyong browser. ||| Hindi namin sinasadyang nangongolekta ng personal na data mula sa mga batang wala pang 13 taong gulang sa USA o wala pang 16 taong gulang sa EU/EEA. Kung malaman namin na nakolekta namin ang naturang data, tatanggalin namin ito. ||| Ang aming Website ay maaaring maglaman ng mga link sa mga third-party na site. Hindi kami mananagot para sa kanilang mga kasanayan sa privacy. ||| Maaari naming i-update ang patakarang ito. Ang bagong bersyon ay ipo-post sa URL na ito na may binagong epektibong petsa."
-  },
-  "vi": {
-    "termsSupplement": "Trong phạm vi tối đa được pháp luật hiện hành cho phép, chúng tôi không chịu trách nhiệm về các thiệt hại gián tiếp, ngẫu nhiên hoặc do hậu quả, mất dữ liệu, mất lợi nhuận hoặc gián đoạn kinh doanh. Tổng trách nhiệm pháp lý của chúng tôi sẽ không vượt quá số tiền bạn đã trả cho (các) sản phẩm đã mua. Đối với người tiêu dùng ở EU/EEA/Thụy Sĩ, các quyền theo luật định bắt buộc không bị ảnh hưởng. ||| Các Điều khoản này được điều chỉnh bởi luật pháp của [Khu vực tài phán của bạn] mà không tính đến xung đột với các nguyên tắc luật pháp. Người dùng ở EU/EEA/Thụy Sĩ có thể được hưởng các biện pháp bảo vệ bổ sung theo luật địa phương và không thể được miễn trừ. ||| Người dùng EU/EEA/Thụy Sĩ có thể truy cập nền tảng Giải quyết tranh chấp trực tuyến của EU: https://ec.europa.eu/consumers/odr/ ||| Người dùng Hoa Kỳ có thể giải quyết tranh chấp thông qua thương lượng, trọng tài (nếu đồng ý) hoặc kiện ra tòa trong khu vực pháp lý của họ. ||| Chúng tôi có thể cập nhật các Điều khoản này. Phiên bản sửa đổi sẽ được đăng tại URL này với ngày có hiệu lực mới.",
-    "privacySupplement": "Chúng tôi sử dụng cookie và các công nghệ tương tự để vận hành Trang web, phân tích việc sử dụng và cá nhân hóa nội dung. Khách truy cập EU/EEA/Thụy Sĩ sẽ được hiển thị biểu ngữ chấp thuận cookie. Bạn có thể quản lý tùy chọn cookie trong cài đặt trình duyệt của mình. ||| Chúng tôi không cố ý thu thập dữ liệu cá nhân từ trẻ em dưới 13 tuổi ở Hoa Kỳ hoặc dưới 16 tuổi ở EU/EEA. Nếu chúng tôi biết rằng chúng tôi đã thu thập dữ liệu đó, chúng tôi sẽ xóa dữ liệu đó. ||| Trang web của chúng tôi có thể chứa các liên kết đến các trang web của bên thứ ba. Chúng tôi không chịu trách nhiệm về thực tiễn bảo mật của họ. ||| Chúng tôi có thể cập nhật chính sách này. Phiên bản mới sẽ được đăng tại URL này với ngày hiệu lực được sửa đổi."
-  },
-  "cy": {
-    "termsSupplement": "I'r graddau mwyaf a ganiateir gan gyfraith berthnasol, nid ydym yn atebol am iawndal anuniongyrchol, damweiniol, neu ganlyniadol, colli data, elw a gollwyd, neu amhariad busnes. Ni fydd cyfanswm ein hatebolrwydd yn fwy na'r swm a daloch am y cynnyrch(au) a brynwyd. Ar gyfer defnyddwyr yn yr UE/AEE/Swistir, nid yw hawliau statudol gorfodol yn cael eu heffeithio. ||| Mae’r Telerau hyn yn cael eu llywodraethu gan gyfreithiau [Eich Awdurdodaeth] heb ystyried egwyddorion gwrthdaro cyfraith. Efallai y bydd gan ddefnyddwyr yr UE/AEE/Swistir amddiffyniadau ychwanegol o dan gyfraith leol na ellir eu hepgor. ||| Gall defnyddwyr UE/EEA/Swistir ddefnyddio platfform Datrys Anghydfod Ar-lein yr UE: https://ec.europa.eu/consumers/odr/ ||| Gall defnyddwyr UDA ddatrys anghydfodau trwy drafod, cyflafareddu (os cytunir arnynt), neu achos llys yn eu hawdurdodaeth. ||| Efallai y byddwn yn diweddaru'r Telerau hyn. Bydd y fersiwn diwygiedig yn cael ei bostio yn yr URL hwn gyda dyddiad dod i rym newydd.",
-    "privacySupplement": "Rydym yn defnyddio cwcis a thechnolegau tebyg i weithredu'r Wefan, dadansoddi defnydd, a phersonoli cynnwys. Dangosir baner caniatâd cwci i ymwelwyr o'r UE/AEE/Swistir. Gallwch reoli dewisiadau cwcis yng ngosodiadau eich porwr. ||| Nid ydym yn casglu data personol yn fwriadol gan blant o dan 13 oed yn UDA neu o dan 16 yn yr UE/AEE. Os byddwn yn dysgu ein bod wedi casglu data o'r fath, byddwn yn ei ddileu. ||| Gall ein Gwefan gynnwys dolenni i wefannau trydydd parti. Nid ydym yn gyfrifol am eu harferion preifatrwydd. ||| Mae’n bosibl y byddwn yn diweddaru’r polisi hwn. Bydd y fersiwn newydd yn cael ei bostio yn yr URL hwn gyda dyddiad effeithiol diwygiedig."
-  },
-  "ta": {
-    "termsSupplement": "பொருந்தக்கூடிய சட்டத்தால் அனுமதிக்கப்படும் அதிகபட்ச அளவிற்கு, மறைமுகமான, தற்செயலான அல்லது அதன் விளைவாக ஏற்படும் சேதங்கள், தரவு இழப்பு, இழந்த இலாபங்கள் அல்லது வணிகத் தடங்கல் ஆகியவற்றிற்கு நாங்கள் பொறுப்பல்ல. எங்களின் மொத்தப் பொறுப்பு நீங்கள் வாங்கிய தயாரிப்பு(களுக்கு) செலுத்திய தொகையை விட அதிகமாக இருக்காது. EU/EEA/சுவிட்சர்லாந்தில் உள்ள நுகர்வோருக்கு, கட்டாய சட்டப்பூர்வ உரிமைகள் பாதிக்கப்படாது. ||| இந்த விதிமுறைகள் சட்டக் கொள்கைகளின் முரண்பாட்டைப் பொருட்படுத்தாமல் [உங்கள் அதிகார வரம்பு] சட்டங்களால் நிர்வகிக்கப்படுகின்றன. EU/EEA/Swiss பயனர்களுக்கு உள்ளூர் சட்டத்தின் கீழ் கூடுதல் பாதுகாப்புகள் இருக்கலாம், அவற்றைத் தள்ளுபடி செய்ய முடியாது. ||| EU/EEA/Swiss பயனர்கள் EU ஆன்லைன் தகராறு தீர்வு தளத்தை அணுகலாம்: https://ec.europa.eu/consumers/odr/ ||| USA பயனர்கள் தங்கள் அதிகார வரம்பில் பேச்சுவார்த்தை, நடுவர் (ஒப்புக்கொண்டால்) அல்லது நீதிமன்ற நடவடிக்கை மூலம் சர்ச்சைகளைத் தீர்க்கலாம். ||| இந்த விதிமுறைகளை நாங்கள் புதுப்பிக்கலாம். திருத்தப்பட்ட பதிப்பு இந்த URL இல் புதிய பயனுள்ள தேதியுடன் வெளியிடப்படும்.",
-    "privacySupplement": "இணையதளத்தை இயக்கவும், பயன்பாட்டை பகுப்பாய்வு செய்யவும், உள்ளடக்கத்தை தனிப்பயனாக்கவும் குக்கீகள் மற்றும் ஒத்த தொழில்நுட்பங்களைப் பயன்படுத்துகிறோம். EU/EEA/சுவிஸ் பார்வையாளர்களுக்கு குக்கீ ஒப்புதல் பேனர் காட்டப்படும். உங்கள் உலாவி அமைப்புகளில் குக்கீ விருப்பங்களை நிர்வகிக்கலாம். ||| அமெரிக்காவில் 13 வயதுக்குட்பட்ட குழந்தைகளிடமிருந்து அல்லது EU/EEAவில் 16 வயதுக்குட்பட்ட குழந்தைகளிடமிருந்து தனிப்பட்ட தரவை நாங்கள் தெரிந்தே சேகரிப்பதில்லை. அத்தகைய தரவுகளை நாங்கள் சேகரித்தோம் என்று தெரிந்தால், அதை நீக்குவோம். ||| எங்கள் இணையதளத்தில் மூன்றாம் தரப்பு தளங்களுக்கான இணைப்புகள் இருக்கலாம். அவர்களின் தனியுரிமை நடைமுறைகளுக்கு நாங்கள் பொறுப்பல்ல. ||| இந்தக் கொள்கையை நாங்கள் புதுப்பிக்கலாம். புதிய பதிப்பு இந்த URL இல் திருத்தப்பட்ட பயனுள்ள தேதியுடன் வெளியிடப்படும்."
-  },
-  "mi": {
-    "termsSupplement": "Ki te nui rawa atu e whakaaetia ana e te ture e tika ana, kaore matou e tika mo nga pakaru autaki, mokowhiti ranei, mo te ngaronga o nga raraunga, mo te ngaro o nga hua, mo te aukati pakihi ranei. Ko ta matou taunahatanga katoa kaua e neke ake i te moni i utua e koe mo nga hua i hokona. Mo nga kaihoko i roto i te EU/EEA/Switzerland, karekau e pa ki nga mana ture. ||| Ko enei Ture e whakahaeretia ana e nga ture o [Tou Mana Whakahaere] me te kore e aro ki nga paheketanga o nga kaupapa ture. Ka taea e nga kaiwhakamahi EU/EEA/Swiss etahi atu whakamarumaru i raro i nga ture a-rohe e kore e taea te whakakore. ||| Ka taea e nga kaiwhakamahi EU/EEA/Swiss te uru atu ki te papaaho Whakatau Amuamu Online EU: https://ec.europa.eu/consumers/odr/ ||| Ka taea e nga kaiwhakamahi USA te whakatau i nga tautohetohe na roto i te whiriwhiringa, te apitireihana (mehemea ka whakaaehia), te kooti ranei i roto i o raatau mana whakahaere. ||| Ka taea e matou te whakahou i enei Ture. Ka whakairihia te putanga whakahou ki tenei URL me te ra whai hua hou.",
-    "privacySupplement": "Ka whakamahi matou i nga pihikete me nga hangarau rite ki te whakahaere i te Paetukutuku, te tātari i te whakamahinga, me te whakawhaiaro i nga ihirangi. Ka whakaatuhia ki nga manuhiri EU/EEA/Swiss he haki whakaaetanga pihikete. Ka taea e koe te whakahaere i nga manakohanga pihikete i o tautuhinga tirotiro. ||| Kaore matou e kohi i nga raraunga whaiaro mai i nga tamariki kei raro iho i te 13 i te USA, i raro ranei i te 16 i te EU/EEA. Mena ka mohio matou kua kohia e matou enei raraunga, ka whakakorehia e matou. ||| Kei roto pea i ta maatau Paetukutuku nga hononga ki nga waahi tuatoru. Karekau he kawenga mo a raatau mahi tūmataitinga. ||| Ka whakahou pea tatou i tenei kaupapa here. Ka whakairihia te putanga hou ki tenei URL me te ra whai hua kua whakahoutia."
-  }
-};
-
-const normalizeLang = (language) => {
-  const code = (language || 'en').toLowerCase();
-  if (code === 'iw') return 'he';
-  if (code === 'fil') return 'tl';
-  if (code === 'zh-cn' || code === 'zh-hans') return 'zh';
-  if (code === 'zh-tw' || code === 'zh-hant') return 'zh-hant';
-  if (code === 'zh-hk' || code === 'yue') return 'zh-hant'; // Cantonese falls back to zh-hant for policy
-  if (code.startsWith('nb') || code.startsWith('nn')) return 'no';
-  return code;
-};
+// Policy texts and their supplements are one table per locale in scripts/locales/policy/.
+const policyCatalog = createLocaleCatalog('policy', en, loaders);
 
 const LEADING_NON_ALNUM_REGEX = (() => {
   try {
@@ -401,21 +28,18 @@ const pickTitle = (primary, fallback, englishFallback) => {
   return englishFallback;
 };
 
-export const policyText = (language) => {
-  const lang = normalizeLang(language);
-  // Cantonese (yue) falls back to zh-hant; any other unknown lang falls back to en
-  const resolvedLang = POLICY_TRANSLATIONS[lang] ? lang : (lang === 'yue' ? 'zh-hant' : 'en');
-  const translation = POLICY_TRANSLATIONS[resolvedLang] || POLICY_TRANSLATIONS.en;
-  const supplement = POLICY_SUPPLEMENTS[resolvedLang] || POLICY_SUPPLEMENTS.en;
-
+const policyText = (translation) => {
   return {
     ...translation,
     termsTitle: pickTitle(translation.termsTitle, translation.navTerms, 'Terms of Service'),
     privacyTitle: pickTitle(translation.privacyTitle, translation.navPrivacy, 'Privacy Policy'),
-    ...supplement,
     companyName: COMPANY_NAME,
     contactEmail: COMPANY_EMAIL,
     contactPhone: COMPANY_PHONE,
     vatStatus: 'Not applicable',
   };
 };
+
+// Policy strings for `language` (negotiated like the other catalogs, so yue
+// reads zh-hant); English until that locale's chunk has loaded.
+export const usePolicyText = (language) => policyText(useLocaleCatalog(policyCatalog, language));
@@ -0,0 +1,30 @@
+/**
+ * Official and known fake carrier domains for the parcel-scams blog post.
+ *
+ * Generated by scripts/generate_parcel_scams_i18n.py from
+ * scripts/data/parcel-scams-domains.json; edit the source data, not the JSON.
+ */
+import { normalizeHost } from './normalizeHost';
+import scamDomains from './scam-domains.generated.json';
+
+export const { sections, others, index: domainIndex } = scamDomains;
+
+// Returns { domain, carrier, section, kind: 'official' | 'fake', pattern? } or null.
+export function lookupDomain(input) {
+  const host = normalizeHost(input);
+  if (!host) return null;
+  const hit = domainIndex[host];
+  if (hit) return { domain: host, ...hit };
+
+  // Subdomains of an official domain (e.g. tools.usps.com) are official too.
+  for (let dot = host.indexOf('.'); dot !== -1; dot = host.indexOf('.', dot + 1)) {
+    const parent = domainIndex[host.slice(dot + 1)];
+    if (parent && parent.kind === 'official') return { domain: host, ...parent };
+  }
+  return null;
+}
+
+export function isSuspiciousDomain(input) {
+  const hit = lookupDomain(input);
+  return Boolean(hit && hit.kind === 'fake');
+}
@@ -0,0 +1,30 @@
+import automaton from './spam-keywords.generated.json';
+
+// Look-alike characters folded before matching (s3o -> seo); shared with the
+// generator, which folded the keywords with the same table.
+export const OBFUSCATION_CHAR_MAP = automaton.obfuscation;
+
+// Case folding beyond toLowerCase (ß -> ss, ς -> σ), as str.casefold() does.
+export const CASEFOLD_CHAR_MAP = automaton.casefold;
+
+// Aho-Corasick walk over the compact form of a message (see
+// scripts/i18n_build/keywords.py): one pass finds every keyword of every
+// category, however many keywords there are. Returns `{ category: [phrase] }`
+// with the phrases in keyword-list order.
+export function findKeywords(compact) {
+  const { next, fail, out } = automaton;
+  const hits = new Set();
+  let state = 0;
+  for (const char of compact) {
+    while (state && next[state][char] === undefined) state = fail[state];
+    state = next[state][char] || 0;
+    const found = out[state];
+    if (found) found.forEach((id) => hits.add(id));
+  }
+  const result = Object.fromEntries(automaton.categories.map((category) => [category, []]));
+  [...hits].sort((a, b) => a - b).forEach((id) => {
+    const [phrase, category] = automaton.keywords[id];
+    result[automaton.categories[category]].push(phrase);
+  });
+  return result;
+}
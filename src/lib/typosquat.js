@@ -0,0 +1,150 @@
+/**
+ * Look-alike (typo-squat) detection for the official carrier domains.
+ *
+ * Generated by scripts/generate_parcel_scams_i18n.py (see
+ * scripts/i18n_build/typosquat.py, whose TyposquatIndex.check this mirrors
+ * step for step); every lookup is a handful of hash probes plus a small
+ * BK-tree walk. `lookalikeCases` in scripts/data/parcel-scams-domains.json
+ * pin the results of both sides (npm run typosquat:check).
+ */
+import { normalizeHost } from './normalizeHost';
+import index from './typosquat-index.generated.json';
+
+const officialSet = new Set([...index.officials, ...index.known]);
+const multiLabelSuffixes = new Set(index.suffixes);
+const swapTlds = new Set(index.swapTlds);
+
+const splitDomain = (domain) => {
+  const labels = domain.split('.');
+  const suffixLength = labels.length > 2 && multiLabelSuffixes.has(labels.slice(-2).join('.')) ? 2 : 1;
+  return {
+    prefix: labels.slice(0, -suffixLength - 1).join('.'),
+    label: labels.length > suffixLength ? labels[labels.length - suffixLength - 1] : '',
+    suffix: labels.slice(-suffixLength).join('.'),
+  };
+};
+
+const joinDomain = (...parts) => parts.filter(Boolean).join('.');
+
+const fold = (input) => {
+  let text = input;
+  for (const [seq, replacement] of index.skeletonSequences) text = text.split(seq).join(replacement);
+  return Array.from(text, (char) => (char in index.skeletonChars ? index.skeletonChars[char] : char)).join('');
+};
+
+const foldedName = (domain) => {
+  const { prefix, label } = splitDomain(domain);
+  return fold(prefix ? `${prefix}.${label}` : label);
+};
+
+// The public suffix is kept as is: dhl.de and dhl.com have different skeletons.
+const skeleton = (domain) => `${foldedName(domain)}.${splitDomain(domain).suffix}`;
+
+// Optimal-string-alignment distance: Levenshtein plus adjacent transpositions.
+const editDistance = (a, b) => {
+  if (a === b) return 0;
+  let before = null;
+  let previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+  for (let i = 1; i <= a.length; i += 1) {
+    const current = [i];
+    for (let j = 1; j <= b.length; j += 1) {
+      let cost = Math.min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] !== b[j - 1] ? 1 : 0));
+      if (before && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) cost = Math.min(cost, before[j - 2] + 1);
+      current.push(cost);
+    }
+    before = previous;
+    previous = current;
+  }
+  return previous[b.length];
+};
+
+// [[distance, officialId], ...] of the BK-tree entries within maxDistance of
+// `word`, nearest first (ties in official-domain order, like the Python side).
+const searchTree = (word, maxDistance) => {
+  const results = [];
+  const stack = index.fuzzy.tree ? [index.fuzzy.tree] : [];
+  while (stack.length) {
+    const [nodeWord, officialIds, children] = stack.pop();
+    const distance = editDistance(word, nodeWord);
+    if (distance <= maxDistance) officialIds.forEach((id) => results.push([distance, id]));
+    for (let edge = distance - maxDistance; edge <= distance + maxDistance; edge += 1) {
+      if (children[edge]) stack.push(children[edge]);
+    }
+  }
+  return results.sort((a, b) => a[0] - b[0] || a[1] - b[1]);
+};
+
+// [officialId, technique] for the carrier name `label` contains: a whole
+// hyphen-separated word, or any part of it for names of at least the fuzzy
+// minimum length (the longest name wins, extraWord). A label that is just the
+// name only counts under a swapped TLD (wrongTld): carriers own their name
+// under many country TLDs.
+const brandInLabel = (label, suffix) => {
+  const words = new Set(label.split('-').map(fold));
+  const joined = fold(label);
+  let best = null;
+  for (const [name, officialId] of Object.entries(index.brands)) {
+    if (name === joined) continue;
+    if (!words.has(name) && !(name.length >= index.fuzzy.minLength && joined.includes(name))) continue;
+    if (!best || name.length > best[0] || (name.length === best[0] && officialId < best[1])) best = [name.length, officialId];
+  }
+  if (best) return [best[1], 'extraWord'];
+  if (joined in index.brands && swapTlds.has(suffix)) return [index.brands[joined], 'wrongTld'];
+  return null;
+};
+
+// Official and known carrier domains and their subdomains.
+const isOfficial = (host) => {
+  for (let domain = host; domain; domain = domain.slice(domain.indexOf('.') + 1)) {
+    if (officialSet.has(domain)) return true;
+    if (!domain.includes('.')) break;
+  }
+  return false;
+};
+
+const match = (domain, officialId, technique, extra) => ({
+  domain,
+  official: index.officials[officialId],
+  technique,
+  ...extra,
+});
+
+// Returns { domain, official, technique, distance? } when `input` (a domain or
+// URL) imitates an official carrier domain, otherwise null (official and known
+// carrier domains and their subdomains too).
+export function checkLookalike(input) {
+  const host = normalizeHost(input);
+  if (!host || isOfficial(host)) return null;
+
+  const candidate = index.candidates[host];
+  if (candidate) return match(host, candidate[0], index.techniques[candidate[1]]);
+
+  // Single inserted characters are not shipped as candidates: deleting one
+  // character of the label must give back an official domain with the same
+  // public suffix (indiapost.giov.in is not an insertion into indiapost.gov.in).
+  const { prefix, label, suffix } = splitDomain(host);
+  let inserted = null;
+  for (let i = 0; i < label.length; i += 1) {
+    if (label[i] === '-') continue;
+    const original = joinDomain(prefix, label.slice(0, i) + label.slice(i + 1), suffix);
+    const officialId = index.officials.indexOf(original);
+    if (officialId === -1 || splitDomain(original).suffix !== suffix) continue;
+    if (inserted === null || officialId < inserted) inserted = officialId;
+  }
+  if (inserted !== null) return match(host, inserted, 'extraLetter');
+
+  const folded = skeleton(host);
+  const officialId = index.skeletons[folded];
+  if (officialId !== undefined) return match(host, officialId, 'lookalike', { distance: 0 });
+  if (foldedName(host).length >= index.fuzzy.minLength) {
+    const [nearest] = searchTree(folded, index.fuzzy.maxDistance);
+    if (nearest) return match(host, nearest[1], 'lookalike', { distance: nearest[0] });
+  }
+
+  const appendedTo = index.officials.findIndex((official) => host.startsWith(`${official}.`) || host.startsWith(`${official}-`));
+  if (appendedTo !== -1) return match(host, appendedTo, 'domainAppendTrick');
+
+  const brand = brandInLabel(label, suffix);
+  if (brand) return match(host, brand[0], brand[1]);
+  return null;
+}
@@ -0,0 +1,17 @@
+import { useEffect, useState } from 'react';
+
+// Pack of a createLocaleCatalog() catalog for `language`: English on the first
+// render, then the component re-renders once the locale's chunk has loaded.
+export const useLocaleCatalog = (catalog, language) => {
+  const [, setLoaded] = useState(null);
+  useEffect(() => {
+    let cancelled = false;
+    catalog.load(language).then((pack) => {
+      if (!cancelled) setLoaded(pack);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [catalog, language]);
+  return catalog.get(language);
+};